@@ -9,9 +9,59 @@
 
 import argparse
 import os
+import shutil
 import subprocess
 import sys
 
+# GN runs this script with python2, which only has lzma through the
+# backports.lzma package.
+try:
+  import lzma
+except ImportError:
+  try:
+    from backports import lzma
+  except ImportError:
+    lzma = None
+
+FUNCTION_SYMBOL_TYPES = ['T', 't', 'D']
+
+
+# Returns the names of the defined symbols of the file, limited to the given
+# symbol types if any. Extra nm arguments, like '-D', come before the file.
+def get_symbols(nm, sofile, nm_args=[], symbol_types=None):
+  nm_cmd = subprocess.Popen(
+      [nm] + nm_args + [sofile, '--format=posix', '--defined-only'],
+      stdout=subprocess.PIPE,
+      universal_newlines=True)
+  symbols = set()
+  for line in nm_cmd.stdout:
+    # posix format: <name> <type> <value> [<size>]
+    columns = line.split()
+    if len(columns) < 2:
+      continue
+    if symbol_types is None or columns[1] in symbol_types:
+      symbols.add(columns[0])
+  if nm_cmd.wait() != 0:
+    raise subprocess.CalledProcessError(nm_cmd.returncode, nm)
+  return symbols
+
+
+# Compresses path to path + '.xz'. The compression is done in-process when the
+# lzma module (python3) or backports.lzma (python2) is available. lzma has no
+# multithreaded encoder, so the xz binary is used when more than one thread is
+# requested or when neither module is available.
+def compress_xz(path, preset, threads):
+  if lzma is None or threads != 1:
+    subprocess.check_call(
+        ['xz', '-%d' % preset, '-T', str(threads), '-f', path])
+    return
+
+  with open(path, 'rb') as in_file:
+    data = in_file.read()
+  with open(path + '.xz', 'wb') as out_file:
+    out_file.write(lzma.compress(data, format=lzma.FORMAT_XZ, preset=preset))
+  os.remove(path)
+
 
 def main():
   parser = argparse.ArgumentParser(description=__doc__)
@@ -37,53 +87,43 @@ def main():
       required=True,
       help='Unstripped shared object file produced by linking command',
       metavar='FILE')
+  parser.add_argument(
+      '--xz-preset',
+      type=int,
+      default=6,
+      choices=range(10),
+      help='xz compression preset of the mini debug info')
+  parser.add_argument(
+      '--xz-threads',
+      type=int,
+      default=1,
+      help='Number of threads used by xz, 0 for one per core')
   args = parser.parse_args()
 
-  copy_cmd = ["cp", args.sofile, args.output]
-  result = subprocess.call(copy_cmd)
-
-  objcopy_cmd = [args.objcopy]
-  objcopy_cmd.append('--only-keep-debug')
-  objcopy_cmd.append(args.unstrippedsofile)
-  objcopy_cmd.append(args.output + '.debug')
-  result = subprocess.call(objcopy_cmd)
-
-  nm_cmd = subprocess.Popen(
-      [args.nm, args.unstrippedsofile, '--format=posix', '--defined-only'],
-      stdout=subprocess.PIPE)
-
-  awk_cmd = subprocess.Popen(['awk', '{ print $1}'],
-                             stdin=nm_cmd.stdout,
-                             stdout=subprocess.PIPE)
-
-  dynsym_out = open(args.output + '.dynsyms', 'w')
-  sort_cmd = subprocess.Popen(['sort'], stdin=awk_cmd.stdout, stdout=dynsym_out)
-  dynsym_out.close()
-
-  nm_cmd = subprocess.Popen(
-      [args.nm, args.unstrippedsofile, '--format=posix', '--defined-only'],
-      stdout=subprocess.PIPE)
-
-  awk_cmd = subprocess.Popen(
-      ['awk', '{ if ($2 == "T" || $2 == "t" ||' + ' $2 == "D") print $1 }'],
-      stdin=nm_cmd.stdout,
-      stdout=subprocess.PIPE)
-
-  funcsyms_out = open(args.output + '.funcsyms', 'w')
-  sort_cmd = subprocess.Popen(['sort'],
-                              stdin=awk_cmd.stdout,
-                              stdout=funcsyms_out)
-  funcsyms_out.close()
-
-  keep_symbols = open(args.output + '.keep_symbols', 'w')
-  sort_cmd = subprocess.Popen(
-      ['comm', '-13', args.output + '.dynsyms', args.output + '.funcsyms'],
-      stdin=awk_cmd.stdout,
-      stdout=keep_symbols)
-
-  # Ensure that the keep_symbols file is not empty.
-  keep_symbols.write("\n")
-  keep_symbols.close()
+  # Extracting the debug info, copying the stripped library and reading the
+  # symbols are independent, so the objcopy runs while the others are done.
+  objcopy_cmd = subprocess.Popen([
+      args.objcopy, '--only-keep-debug', args.unstrippedsofile,
+      args.output + '.debug'
+  ])
+
+  shutil.copy(args.sofile, args.output)
+  # The dynamic symbols of the stripped library are already available to
+  # unwinders, so the mini debug info only needs the other functions and data.
+  dynsyms = get_symbols(args.nm, args.sofile, ['-D'])
+  funcsyms = get_symbols(args.nm, args.unstrippedsofile,
+                         symbol_types=FUNCTION_SYMBOL_TYPES)
+
+  if objcopy_cmd.wait() != 0:
+    raise subprocess.CalledProcessError(objcopy_cmd.returncode, args.objcopy)
+
+  # Equivalent to 'comm -13' of the sorted symbol lists: the function and data
+  # symbols that are not in the dynamic symbols.
+  with open(args.output + '.keep_symbols', 'w') as keep_symbols:
+    for symbol in sorted(funcsyms - dynsyms):
+      keep_symbols.write(symbol + '\n')
+    # Ensure that the keep_symbols file is not empty.
+    keep_symbols.write("\n")
 
   objcopy_cmd = [
       args.objcopy, '--rename-section', '.debug_frame=saved_debug_frame',
@@ -104,8 +144,7 @@ def main():
   ]
   subprocess.check_call(objcopy_cmd)
 
-  xz_cmd = ['xz', args.output + '.mini_debuginfo']
-  subprocess.check_call(xz_cmd)
+  compress_xz(args.output + '.mini_debuginfo', args.xz_preset, args.xz_threads)
 
   objcopy_cmd = [
       args.objcopy, '--add-section',
@@ -114,14 +153,13 @@ def main():
   subprocess.check_call(objcopy_cmd)
 
   # Clean out scratch files
-  rm_cmd = [
-      'rm', '-f', args.output + '.dynsyms', args.output + '.funcsyms',
-      args.output + '.keep_symbols', args.output + '.debug',
-      args.output + '.mini_debuginfo', args.output + '.mini_debuginfo.xz'
-  ]
-  result = subprocess.call(rm_cmd)
+  for suffix in [
+      '.keep_symbols', '.debug', '.mini_debuginfo', '.mini_debuginfo.xz'
+  ]:
+    if os.path.exists(args.output + suffix):
+      os.remove(args.output + suffix)
 
-  return result
+  return 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// binary_event_decoder.cpp:
+//   Prints the binary entry point events written by ANGLE built with angle_enable_binary_events.
+//
+//   Usage: angle_binary_event_decoder <trace file>
+
+#include <stdio.h>
+#include <string.h>
+#include <string>
+#include <vector>
+
+#include "libGLESv2/entry_points_binary_event.h"
+
+int main(int argc, char **argv)
+{
+    if (argc != 2)
+    {
+        fprintf(stderr, "Usage: %s <trace file>\n", argv[0]);
+        return 1;
+    }
+
+    FILE *file = fopen(argv[1], "rb");
+    if (!file)
+    {
+        fprintf(stderr, "Could not open %s\n", argv[1]);
+        return 1;
+    }
+
+    // The file is a sequence of dumps, each a header followed by its events.
+    int result = 0;
+    gl::BinaryEventFileHeader header;
+    while (fread(&header, sizeof(header), 1, file) == 1)
+    {
+        if (memcmp(header.magic, gl::kBinaryEventFileMagic, sizeof(header.magic)) != 0 ||
+            header.version != gl::kBinaryEventFileVersion ||
+            header.eventSize != sizeof(gl::BinaryEvent))
+        {
+            fprintf(stderr, "%s is not a binary event trace of this version of ANGLE\n", argv[1]);
+            result = 1;
+            break;
+        }
+
+        std::vector<gl::BinaryEvent> events(header.eventCount);
+        if (fread(events.data(), sizeof(gl::BinaryEvent), events.size(), file) != events.size())
+        {
+            fprintf(stderr, "%s is truncated\n", argv[1]);
+            result = 1;
+            break;
+        }
+
+        std::string text;
+        for (const gl::BinaryEvent &event : events)
+        {
+            if (!gl::FormatBinaryEvent(event, &text))
+            {
+                text = "<unknown event>";
+            }
+            printf("%llu [%u] %s\n", static_cast<unsigned long long>(event.timestampNs),
+                   event.threadIndex, text.c_str());
+        }
+    }
+
+    fclose(file);
+    return result;
+}
@@ -0,0 +1,122 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// CaptureReplay.cpp:
+//   Replays a capture written by ANGLE built with angle_enable_capture one frame per draw and
+//   prints the frame times. Captured object names are not remapped: the replay relies on the
+//   names being allocated in the same order as during the capture.
+//
+//   Usage: capture_replay [--use-angle=null|vulkan|gl|...] <capture file>
+
+#include "SampleApplication.h"
+
+#include "capture_replay.h"
+
+#include <stdio.h>
+#include <string.h>
+#include <algorithm>
+#include <numeric>
+#include <utility>
+
+namespace
+{
+constexpr size_t kScratchSize = 16 * 1024 * 1024;
+
+class CaptureReplaySample : public SampleApplication
+{
+  public:
+    CaptureReplaySample(int argc, char **argv, std::vector<CapturedFrame> &&frames)
+        : SampleApplication("CaptureReplay", argc, argv, 3, 1),
+          mFrames(std::move(frames)),
+          mFrameIndex(0),
+          mSkippedCalls(0)
+    {
+        mState.scratch.resize(kScratchSize);
+    }
+
+    bool initialize() override { return !mFrames.empty(); }
+
+    void destroy() override
+    {
+        if (mFrameTimes.empty())
+        {
+            return;
+        }
+
+        std::vector<double> sorted = mFrameTimes;
+        std::sort(sorted.begin(), sorted.end());
+        double total = std::accumulate(sorted.begin(), sorted.end(), 0.0);
+        double mean  = total / sorted.size();
+
+        printf("Replayed %zu frames, %zu unsupported calls skipped\n", sorted.size(),
+               mSkippedCalls);
+        printf("Frame time (ms): mean %.3f, median %.3f, min %.3f, max %.3f\n", mean * 1000.0,
+               sorted[sorted.size() / 2] * 1000.0, sorted.front() * 1000.0, sorted.back() * 1000.0);
+        printf("FPS: %.1f\n", 1.0 / mean);
+    }
+
+    void step(float dt, double totalTime) override
+    {
+        // dt is the time taken by the previous frame, including its swap.
+        if (mFrameIndex > 0)
+        {
+            mFrameTimes.push_back(dt);
+        }
+
+        if (mFrameIndex == mFrames.size())
+        {
+            exit();
+        }
+    }
+
+    void draw() override
+    {
+        for (const CapturedCall &call : mFrames[mFrameIndex])
+        {
+            if (!ReplayCall(call, &mState))
+            {
+                mSkippedCalls++;
+            }
+        }
+        mFrameIndex++;
+    }
+
+  private:
+    std::vector<CapturedFrame> mFrames;
+    size_t mFrameIndex;
+    size_t mSkippedCalls;
+    std::vector<double> mFrameTimes;
+    ReplayState mState;
+};
+}  // anonymous namespace
+
+int main(int argc, char **argv)
+{
+    if (argc < 2 || strncmp(argv[argc - 1], "--", 2) == 0)
+    {
+        fprintf(stderr, "Usage: %s [--use-angle=<backend>] <capture file>\n", argv[0]);
+        return 1;
+    }
+
+    const char *path = argv[argc - 1];
+    FILE *file       = fopen(path, "rb");
+    if (!file)
+    {
+        fprintf(stderr, "Could not open %s\n", path);
+        return 1;
+    }
+
+    std::vector<CapturedFrame> frames;
+    bool isCapture = ReadCapture(file, &frames);
+    fclose(file);
+    if (!isCapture)
+    {
+        fprintf(stderr, "%s is not a capture of this version of ANGLE\n", path);
+        return 1;
+    }
+
+    CaptureReplaySample app(argc, argv, std::move(frames));
+    return app.run();
+}
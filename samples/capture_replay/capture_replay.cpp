@@ -0,0 +1,127 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_replay.cpp:
+//   Reads capture files and the parameters of the captured calls.
+
+#include "capture_replay.h"
+
+#include <string.h>
+#include <utility>
+
+namespace
+{
+bool ReadCapturedCall(FILE *file, CapturedCall *call)
+{
+    gl::CaptureCallHeader header;
+    if (fread(&header, sizeof(header), 1, file) != 1)
+    {
+        return false;
+    }
+
+    call->entryPoint = static_cast<gl::EntryPoint>(header.entryPoint);
+    call->params.resize(header.paramCount);
+    if (header.paramCount > 0 &&
+        fread(call->params.data(), sizeof(uint64_t), header.paramCount, file) != header.paramCount)
+    {
+        return false;
+    }
+
+    call->blobs.resize(header.blobCount);
+    for (CapturedBlob &blob : call->blobs)
+    {
+        gl::CaptureBlobHeader blobHeader;
+        if (fread(&blobHeader, sizeof(blobHeader), 1, file) != 1)
+        {
+            return false;
+        }
+
+        // The data is padded to 8 bytes.
+        size_t paddedSize = (blobHeader.size + 7) & ~static_cast<size_t>(7);
+        blob.paramIndex   = blobHeader.paramIndex;
+        blob.data.resize(paddedSize);
+        if (fread(blob.data.data(), 1, paddedSize, file) != paddedSize)
+        {
+            return false;
+        }
+        blob.data.resize(blobHeader.size);
+    }
+    return true;
+}
+}  // anonymous namespace
+
+bool ReadCapture(FILE *file, std::vector<CapturedFrame> *framesOut)
+{
+    gl::CaptureFileHeader header;
+    if (fread(&header, sizeof(header), 1, file) != 1 ||
+        memcmp(header.magic, gl::kCaptureFileMagic, sizeof(header.magic)) != 0 ||
+        header.version != gl::kCaptureFileVersion)
+    {
+        return false;
+    }
+
+    CapturedFrame frame;
+    CapturedCall call;
+    while (ReadCapturedCall(file, &call))
+    {
+        if (call.entryPoint == gl::EntryPoint::Invalid)
+        {
+            framesOut->push_back(std::move(frame));
+            frame.clear();
+        }
+        else
+        {
+            frame.push_back(std::move(call));
+        }
+    }
+
+    // Keep the calls made after the last swap.
+    if (!frame.empty())
+    {
+        framesOut->push_back(std::move(frame));
+    }
+
+    return true;
+}
+
+const void *GetPointerParam(const CapturedCall &call, size_t paramIndex)
+{
+    for (const CapturedBlob &blob : call.blobs)
+    {
+        if (blob.paramIndex == paramIndex)
+        {
+            return blob.data.data();
+        }
+    }
+    return reinterpret_cast<const void *>(static_cast<uintptr_t>(call.params[paramIndex]));
+}
+
+const GLchar *const *GetStringsParam(const CapturedCall &call,
+                                     size_t paramIndex,
+                                     ReplayState *state)
+{
+    state->strings.clear();
+    for (const CapturedBlob &blob : call.blobs)
+    {
+        if (blob.paramIndex == paramIndex)
+        {
+            state->strings.push_back(reinterpret_cast<const GLchar *>(blob.data.data()));
+        }
+    }
+    return state->strings.data();
+}
+
+void *GetScratchParam(ReplayState *state)
+{
+    return state->scratch.data();
+}
+
+GLfloat GetFloatParam(const CapturedCall &call, size_t paramIndex)
+{
+    uint32_t bits = static_cast<uint32_t>(call.params[paramIndex]);
+    GLfloat value;
+    memcpy(&value, &bits, sizeof(value));
+    return value;
+}
@@ -0,0 +1,63 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_replay.h:
+//   Calls read from a capture file written by ANGLE built with angle_enable_capture.
+
+#ifndef SAMPLES_CAPTURE_REPLAY_CAPTURE_REPLAY_H_
+#define SAMPLES_CAPTURE_REPLAY_CAPTURE_REPLAY_H_
+
+#include <stdint.h>
+#include <stdio.h>
+#include <vector>
+
+#include "angle_gl.h"
+#include "libGLESv2/entry_points_capture.h"
+
+struct CapturedBlob
+{
+    uint32_t paramIndex;
+    std::vector<uint8_t> data;
+};
+
+struct CapturedCall
+{
+    gl::EntryPoint entryPoint;
+    std::vector<uint64_t> params;
+    std::vector<CapturedBlob> blobs;
+};
+
+// The calls of a frame, without the call to EntryPoint::Invalid that ends it.
+using CapturedFrame = std::vector<CapturedCall>;
+
+// Reads the frames of a capture file. Returns false if the file is not a capture of this version of
+// ANGLE. A capture that was cut short keeps the calls read until then.
+bool ReadCapture(FILE *file, std::vector<CapturedFrame> *framesOut);
+
+// Memory the replayed calls write to or point at.
+struct ReplayState
+{
+    // Receives the results of the queries. Large enough for any readback of the captured apps.
+    std::vector<uint8_t> scratch;
+    std::vector<const GLchar *> strings;
+};
+
+// Returns the captured client memory of the parameter, or its captured value if no memory was
+// captured, which replays offsets into bound buffers.
+const void *GetPointerParam(const CapturedCall &call, size_t paramIndex);
+
+// Returns the captured strings of the parameter. They stay valid until the next call.
+const GLchar *const *GetStringsParam(const CapturedCall &call,
+                                     size_t paramIndex,
+                                     ReplayState *state);
+
+void *GetScratchParam(ReplayState *state);
+GLfloat GetFloatParam(const CapturedCall &call, size_t paramIndex);
+
+// Replays the call. Returns false if the replay doesn't support its entry point. Implemented by
+// capture_replay_autogen.cpp.
+bool ReplayCall(const CapturedCall &call, ReplayState *state);
+
+#endif  // SAMPLES_CAPTURE_REPLAY_CAPTURE_REPLAY_H_
@@ -0,0 +1,1466 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and entry_point_capture_params.json.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_replay_autogen.cpp:
+//   Replays the captured calls of the OpenGL ES 2.0, 3.0 and 3.1 entry points.
+
+#include "capture_replay.h"
+
+#include "util/gles_loader_autogen.h"
+
+bool ReplayCall(const CapturedCall &call, ReplayState *state)
+{
+    switch (call.entryPoint)
+    {
+        case gl::EntryPoint::ActiveShaderProgram:
+            glActiveShaderProgram(static_cast<GLuint>(call.params[0]),
+                                  static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::ActiveTexture:
+            glActiveTexture(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::AttachShader:
+            glAttachShader(static_cast<GLuint>(call.params[0]),
+                           static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::BeginQuery:
+            glBeginQuery(static_cast<GLenum>(call.params[0]), static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::BeginTransformFeedback:
+            glBeginTransformFeedback(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::BindAttribLocation:
+            glBindAttribLocation(static_cast<GLuint>(call.params[0]),
+                                 static_cast<GLuint>(call.params[1]),
+                                 static_cast<const GLchar *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::BindBuffer:
+            glBindBuffer(static_cast<GLenum>(call.params[0]), static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::BindBufferBase:
+            glBindBufferBase(static_cast<GLenum>(call.params[0]),
+                             static_cast<GLuint>(call.params[1]),
+                             static_cast<GLuint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::BindBufferRange:
+            glBindBufferRange(
+                static_cast<GLenum>(call.params[0]), static_cast<GLuint>(call.params[1]),
+                static_cast<GLuint>(call.params[2]), static_cast<GLintptr>(call.params[3]),
+                static_cast<GLsizeiptr>(call.params[4]));
+            return true;
+        case gl::EntryPoint::BindFramebuffer:
+            glBindFramebuffer(static_cast<GLenum>(call.params[0]),
+                              static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::BindImageTexture:
+            glBindImageTexture(
+                static_cast<GLuint>(call.params[0]), static_cast<GLuint>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLboolean>(call.params[3]),
+                static_cast<GLint>(call.params[4]), static_cast<GLenum>(call.params[5]),
+                static_cast<GLenum>(call.params[6]));
+            return true;
+        case gl::EntryPoint::BindProgramPipeline:
+            glBindProgramPipeline(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::BindRenderbuffer:
+            glBindRenderbuffer(static_cast<GLenum>(call.params[0]),
+                               static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::BindSampler:
+            glBindSampler(static_cast<GLuint>(call.params[0]), static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::BindTexture:
+            glBindTexture(static_cast<GLenum>(call.params[0]), static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::BindTransformFeedback:
+            glBindTransformFeedback(static_cast<GLenum>(call.params[0]),
+                                    static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::BindVertexArray:
+            glBindVertexArray(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::BindVertexBuffer:
+            glBindVertexBuffer(
+                static_cast<GLuint>(call.params[0]), static_cast<GLuint>(call.params[1]),
+                static_cast<GLintptr>(call.params[2]), static_cast<GLsizei>(call.params[3]));
+            return true;
+        case gl::EntryPoint::BlendColor:
+            glBlendColor(GetFloatParam(call, 0), GetFloatParam(call, 1), GetFloatParam(call, 2),
+                         GetFloatParam(call, 3));
+            return true;
+        case gl::EntryPoint::BlendEquation:
+            glBlendEquation(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::BlendEquationSeparate:
+            glBlendEquationSeparate(static_cast<GLenum>(call.params[0]),
+                                    static_cast<GLenum>(call.params[1]));
+            return true;
+        case gl::EntryPoint::BlendFunc:
+            glBlendFunc(static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]));
+            return true;
+        case gl::EntryPoint::BlendFuncSeparate:
+            glBlendFuncSeparate(
+                static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLenum>(call.params[3]));
+            return true;
+        case gl::EntryPoint::BlitFramebuffer:
+            glBlitFramebuffer(
+                static_cast<GLint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]),
+                static_cast<GLint>(call.params[4]), static_cast<GLint>(call.params[5]),
+                static_cast<GLint>(call.params[6]), static_cast<GLint>(call.params[7]),
+                static_cast<GLbitfield>(call.params[8]), static_cast<GLenum>(call.params[9]));
+            return true;
+        case gl::EntryPoint::BufferData:
+            glBufferData(static_cast<GLenum>(call.params[0]),
+                         static_cast<GLsizeiptr>(call.params[1]),
+                         static_cast<const void *>(GetPointerParam(call, 2)),
+                         static_cast<GLenum>(call.params[3]));
+            return true;
+        case gl::EntryPoint::BufferSubData:
+            glBufferSubData(static_cast<GLenum>(call.params[0]),
+                            static_cast<GLintptr>(call.params[1]),
+                            static_cast<GLsizeiptr>(call.params[2]),
+                            static_cast<const void *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::CheckFramebufferStatus:
+            glCheckFramebufferStatus(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::Clear:
+            glClear(static_cast<GLbitfield>(call.params[0]));
+            return true;
+        case gl::EntryPoint::ClearBufferfi:
+            glClearBufferfi(static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                            GetFloatParam(call, 2), static_cast<GLint>(call.params[3]));
+            return true;
+        case gl::EntryPoint::ClearBufferfv:
+            glClearBufferfv(static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                            static_cast<const GLfloat *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::ClearBufferiv:
+            glClearBufferiv(static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                            static_cast<const GLint *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::ClearBufferuiv:
+            glClearBufferuiv(static_cast<GLenum>(call.params[0]),
+                             static_cast<GLint>(call.params[1]),
+                             static_cast<const GLuint *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::ClearColor:
+            glClearColor(GetFloatParam(call, 0), GetFloatParam(call, 1), GetFloatParam(call, 2),
+                         GetFloatParam(call, 3));
+            return true;
+        case gl::EntryPoint::ClearDepthf:
+            glClearDepthf(GetFloatParam(call, 0));
+            return true;
+        case gl::EntryPoint::ClearStencil:
+            glClearStencil(static_cast<GLint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::ColorMask:
+            glColorMask(
+                static_cast<GLboolean>(call.params[0]), static_cast<GLboolean>(call.params[1]),
+                static_cast<GLboolean>(call.params[2]), static_cast<GLboolean>(call.params[3]));
+            return true;
+        case gl::EntryPoint::CompileShader:
+            glCompileShader(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::CompressedTexImage2D:
+            glCompressedTexImage2D(
+                static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                static_cast<GLsizei>(call.params[4]), static_cast<GLint>(call.params[5]),
+                static_cast<GLsizei>(call.params[6]),
+                static_cast<const void *>(GetPointerParam(call, 7)));
+            return true;
+        case gl::EntryPoint::CompressedTexImage3D:
+            glCompressedTexImage3D(
+                static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                static_cast<GLsizei>(call.params[4]), static_cast<GLsizei>(call.params[5]),
+                static_cast<GLint>(call.params[6]), static_cast<GLsizei>(call.params[7]),
+                static_cast<const void *>(GetPointerParam(call, 8)));
+            return true;
+        case gl::EntryPoint::CompressedTexSubImage2D:
+            glCompressedTexSubImage2D(
+                static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]),
+                static_cast<GLsizei>(call.params[4]), static_cast<GLsizei>(call.params[5]),
+                static_cast<GLenum>(call.params[6]), static_cast<GLsizei>(call.params[7]),
+                static_cast<const void *>(GetPointerParam(call, 8)));
+            return true;
+        case gl::EntryPoint::CompressedTexSubImage3D:
+            glCompressedTexSubImage3D(
+                static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]),
+                static_cast<GLint>(call.params[4]), static_cast<GLsizei>(call.params[5]),
+                static_cast<GLsizei>(call.params[6]), static_cast<GLsizei>(call.params[7]),
+                static_cast<GLenum>(call.params[8]), static_cast<GLsizei>(call.params[9]),
+                static_cast<const void *>(GetPointerParam(call, 10)));
+            return true;
+        case gl::EntryPoint::CopyBufferSubData:
+            glCopyBufferSubData(
+                static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLintptr>(call.params[2]), static_cast<GLintptr>(call.params[3]),
+                static_cast<GLsizeiptr>(call.params[4]));
+            return true;
+        case gl::EntryPoint::CopyTexImage2D:
+            glCopyTexImage2D(
+                static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLint>(call.params[3]),
+                static_cast<GLint>(call.params[4]), static_cast<GLsizei>(call.params[5]),
+                static_cast<GLsizei>(call.params[6]), static_cast<GLint>(call.params[7]));
+            return true;
+        case gl::EntryPoint::CopyTexSubImage2D:
+            glCopyTexSubImage2D(
+                static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]),
+                static_cast<GLint>(call.params[4]), static_cast<GLint>(call.params[5]),
+                static_cast<GLsizei>(call.params[6]), static_cast<GLsizei>(call.params[7]));
+            return true;
+        case gl::EntryPoint::CopyTexSubImage3D:
+            glCopyTexSubImage3D(
+                static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]),
+                static_cast<GLint>(call.params[4]), static_cast<GLint>(call.params[5]),
+                static_cast<GLint>(call.params[6]), static_cast<GLsizei>(call.params[7]),
+                static_cast<GLsizei>(call.params[8]));
+            return true;
+        case gl::EntryPoint::CreateProgram:
+            glCreateProgram();
+            return true;
+        case gl::EntryPoint::CreateShader:
+            glCreateShader(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::CreateShaderProgramv:
+            glCreateShaderProgramv(static_cast<GLenum>(call.params[0]),
+                                   static_cast<GLsizei>(call.params[1]),
+                                   GetStringsParam(call, 2, state));
+            return true;
+        case gl::EntryPoint::CullFace:
+            glCullFace(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::DeleteBuffers:
+            glDeleteBuffers(static_cast<GLsizei>(call.params[0]),
+                            static_cast<const GLuint *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::DeleteFramebuffers:
+            glDeleteFramebuffers(static_cast<GLsizei>(call.params[0]),
+                                 static_cast<const GLuint *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::DeleteProgram:
+            glDeleteProgram(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::DeleteProgramPipelines:
+            glDeleteProgramPipelines(static_cast<GLsizei>(call.params[0]),
+                                     static_cast<const GLuint *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::DeleteQueries:
+            glDeleteQueries(static_cast<GLsizei>(call.params[0]),
+                            static_cast<const GLuint *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::DeleteRenderbuffers:
+            glDeleteRenderbuffers(static_cast<GLsizei>(call.params[0]),
+                                  static_cast<const GLuint *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::DeleteSamplers:
+            glDeleteSamplers(static_cast<GLsizei>(call.params[0]),
+                             static_cast<const GLuint *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::DeleteShader:
+            glDeleteShader(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::DeleteTextures:
+            glDeleteTextures(static_cast<GLsizei>(call.params[0]),
+                             static_cast<const GLuint *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::DeleteTransformFeedbacks:
+            glDeleteTransformFeedbacks(static_cast<GLsizei>(call.params[0]),
+                                       static_cast<const GLuint *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::DeleteVertexArrays:
+            glDeleteVertexArrays(static_cast<GLsizei>(call.params[0]),
+                                 static_cast<const GLuint *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::DepthFunc:
+            glDepthFunc(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::DepthMask:
+            glDepthMask(static_cast<GLboolean>(call.params[0]));
+            return true;
+        case gl::EntryPoint::DepthRangef:
+            glDepthRangef(GetFloatParam(call, 0), GetFloatParam(call, 1));
+            return true;
+        case gl::EntryPoint::DetachShader:
+            glDetachShader(static_cast<GLuint>(call.params[0]),
+                           static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::Disable:
+            glDisable(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::DisableVertexAttribArray:
+            glDisableVertexAttribArray(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::DispatchCompute:
+            glDispatchCompute(static_cast<GLuint>(call.params[0]),
+                              static_cast<GLuint>(call.params[1]),
+                              static_cast<GLuint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::DispatchComputeIndirect:
+            glDispatchComputeIndirect(static_cast<GLintptr>(call.params[0]));
+            return true;
+        case gl::EntryPoint::DrawArrays:
+            glDrawArrays(static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                         static_cast<GLsizei>(call.params[2]));
+            return true;
+        case gl::EntryPoint::DrawArraysIndirect:
+            glDrawArraysIndirect(static_cast<GLenum>(call.params[0]),
+                                 static_cast<const void *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::DrawArraysInstanced:
+            glDrawArraysInstanced(
+                static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLsizei>(call.params[2]), static_cast<GLsizei>(call.params[3]));
+            return true;
+        case gl::EntryPoint::DrawBuffers:
+            glDrawBuffers(static_cast<GLsizei>(call.params[0]),
+                          static_cast<const GLenum *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::DrawElements:
+            glDrawElements(static_cast<GLenum>(call.params[0]),
+                           static_cast<GLsizei>(call.params[1]),
+                           static_cast<GLenum>(call.params[2]),
+                           static_cast<const void *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::DrawElementsIndirect:
+            glDrawElementsIndirect(static_cast<GLenum>(call.params[0]),
+                                   static_cast<GLenum>(call.params[1]),
+                                   static_cast<const void *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::DrawElementsInstanced:
+            glDrawElementsInstanced(static_cast<GLenum>(call.params[0]),
+                                    static_cast<GLsizei>(call.params[1]),
+                                    static_cast<GLenum>(call.params[2]),
+                                    static_cast<const void *>(GetPointerParam(call, 3)),
+                                    static_cast<GLsizei>(call.params[4]));
+            return true;
+        case gl::EntryPoint::DrawRangeElements:
+            glDrawRangeElements(
+                static_cast<GLenum>(call.params[0]), static_cast<GLuint>(call.params[1]),
+                static_cast<GLuint>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                static_cast<GLenum>(call.params[4]),
+                static_cast<const void *>(GetPointerParam(call, 5)));
+            return true;
+        case gl::EntryPoint::Enable:
+            glEnable(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::EnableVertexAttribArray:
+            glEnableVertexAttribArray(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::EndQuery:
+            glEndQuery(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::EndTransformFeedback:
+            glEndTransformFeedback();
+            return true;
+        case gl::EntryPoint::Finish:
+            glFinish();
+            return true;
+        case gl::EntryPoint::Flush:
+            glFlush();
+            return true;
+        case gl::EntryPoint::FlushMappedBufferRange:
+            glFlushMappedBufferRange(static_cast<GLenum>(call.params[0]),
+                                     static_cast<GLintptr>(call.params[1]),
+                                     static_cast<GLsizeiptr>(call.params[2]));
+            return true;
+        case gl::EntryPoint::FramebufferParameteri:
+            glFramebufferParameteri(static_cast<GLenum>(call.params[0]),
+                                    static_cast<GLenum>(call.params[1]),
+                                    static_cast<GLint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::FramebufferRenderbuffer:
+            glFramebufferRenderbuffer(
+                static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLuint>(call.params[3]));
+            return true;
+        case gl::EntryPoint::FramebufferTexture2D:
+            glFramebufferTexture2D(
+                static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLuint>(call.params[3]),
+                static_cast<GLint>(call.params[4]));
+            return true;
+        case gl::EntryPoint::FramebufferTextureLayer:
+            glFramebufferTextureLayer(
+                static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLuint>(call.params[2]), static_cast<GLint>(call.params[3]),
+                static_cast<GLint>(call.params[4]));
+            return true;
+        case gl::EntryPoint::FrontFace:
+            glFrontFace(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::GenBuffers:
+            glGenBuffers(static_cast<GLsizei>(call.params[0]),
+                         static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GenFramebuffers:
+            glGenFramebuffers(static_cast<GLsizei>(call.params[0]),
+                              static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GenProgramPipelines:
+            glGenProgramPipelines(static_cast<GLsizei>(call.params[0]),
+                                  static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GenQueries:
+            glGenQueries(static_cast<GLsizei>(call.params[0]),
+                         static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GenRenderbuffers:
+            glGenRenderbuffers(static_cast<GLsizei>(call.params[0]),
+                               static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GenSamplers:
+            glGenSamplers(static_cast<GLsizei>(call.params[0]),
+                          static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GenTextures:
+            glGenTextures(static_cast<GLsizei>(call.params[0]),
+                          static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GenTransformFeedbacks:
+            glGenTransformFeedbacks(static_cast<GLsizei>(call.params[0]),
+                                    static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GenVertexArrays:
+            glGenVertexArrays(static_cast<GLsizei>(call.params[0]),
+                              static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GenerateMipmap:
+            glGenerateMipmap(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::GetActiveAttrib:
+            glGetActiveAttrib(static_cast<GLuint>(call.params[0]),
+                              static_cast<GLuint>(call.params[1]),
+                              static_cast<GLsizei>(call.params[2]),
+                              static_cast<GLsizei *>(GetScratchParam(state)),
+                              static_cast<GLint *>(GetScratchParam(state)),
+                              static_cast<GLenum *>(GetScratchParam(state)),
+                              static_cast<GLchar *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetActiveUniform:
+            glGetActiveUniform(static_cast<GLuint>(call.params[0]),
+                               static_cast<GLuint>(call.params[1]),
+                               static_cast<GLsizei>(call.params[2]),
+                               static_cast<GLsizei *>(GetScratchParam(state)),
+                               static_cast<GLint *>(GetScratchParam(state)),
+                               static_cast<GLenum *>(GetScratchParam(state)),
+                               static_cast<GLchar *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetActiveUniformBlockName:
+            glGetActiveUniformBlockName(static_cast<GLuint>(call.params[0]),
+                                        static_cast<GLuint>(call.params[1]),
+                                        static_cast<GLsizei>(call.params[2]),
+                                        static_cast<GLsizei *>(GetScratchParam(state)),
+                                        static_cast<GLchar *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetActiveUniformBlockiv:
+            glGetActiveUniformBlockiv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLuint>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetActiveUniformsiv:
+            glGetActiveUniformsiv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                static_cast<const GLuint *>(GetPointerParam(call, 2)),
+                static_cast<GLenum>(call.params[3]), static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetAttachedShaders:
+            glGetAttachedShaders(static_cast<GLuint>(call.params[0]),
+                                 static_cast<GLsizei>(call.params[1]),
+                                 static_cast<GLsizei *>(GetScratchParam(state)),
+                                 static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetAttribLocation:
+            glGetAttribLocation(static_cast<GLuint>(call.params[0]),
+                                static_cast<const GLchar *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::GetBooleani_v:
+            glGetBooleani_v(static_cast<GLenum>(call.params[0]),
+                            static_cast<GLuint>(call.params[1]),
+                            static_cast<GLboolean *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetBooleanv:
+            glGetBooleanv(static_cast<GLenum>(call.params[0]),
+                          static_cast<GLboolean *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetBufferParameteri64v:
+            glGetBufferParameteri64v(static_cast<GLenum>(call.params[0]),
+                                     static_cast<GLenum>(call.params[1]),
+                                     static_cast<GLint64 *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetBufferParameteriv:
+            glGetBufferParameteriv(static_cast<GLenum>(call.params[0]),
+                                   static_cast<GLenum>(call.params[1]),
+                                   static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetBufferPointerv:
+            glGetBufferPointerv(static_cast<GLenum>(call.params[0]),
+                                static_cast<GLenum>(call.params[1]),
+                                static_cast<void **>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetError:
+            glGetError();
+            return true;
+        case gl::EntryPoint::GetFloatv:
+            glGetFloatv(static_cast<GLenum>(call.params[0]),
+                        static_cast<GLfloat *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetFragDataLocation:
+            glGetFragDataLocation(static_cast<GLuint>(call.params[0]),
+                                  static_cast<const GLchar *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::GetFramebufferAttachmentParameteriv:
+            glGetFramebufferAttachmentParameteriv(
+                static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetFramebufferParameteriv:
+            glGetFramebufferParameteriv(static_cast<GLenum>(call.params[0]),
+                                        static_cast<GLenum>(call.params[1]),
+                                        static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetInteger64i_v:
+            glGetInteger64i_v(static_cast<GLenum>(call.params[0]),
+                              static_cast<GLuint>(call.params[1]),
+                              static_cast<GLint64 *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetInteger64v:
+            glGetInteger64v(static_cast<GLenum>(call.params[0]),
+                            static_cast<GLint64 *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetIntegeri_v:
+            glGetIntegeri_v(static_cast<GLenum>(call.params[0]),
+                            static_cast<GLuint>(call.params[1]),
+                            static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetIntegerv:
+            glGetIntegerv(static_cast<GLenum>(call.params[0]),
+                          static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetInternalformativ:
+            glGetInternalformativ(
+                static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetMultisamplefv:
+            glGetMultisamplefv(static_cast<GLenum>(call.params[0]),
+                               static_cast<GLuint>(call.params[1]),
+                               static_cast<GLfloat *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetProgramBinary:
+            glGetProgramBinary(static_cast<GLuint>(call.params[0]),
+                               static_cast<GLsizei>(call.params[1]),
+                               static_cast<GLsizei *>(GetScratchParam(state)),
+                               static_cast<GLenum *>(GetScratchParam(state)),
+                               static_cast<void *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetProgramInfoLog:
+            glGetProgramInfoLog(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLsizei>(call.params[1]),
+                                static_cast<GLsizei *>(GetScratchParam(state)),
+                                static_cast<GLchar *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetProgramInterfaceiv:
+            glGetProgramInterfaceiv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetProgramPipelineInfoLog:
+            glGetProgramPipelineInfoLog(static_cast<GLuint>(call.params[0]),
+                                        static_cast<GLsizei>(call.params[1]),
+                                        static_cast<GLsizei *>(GetScratchParam(state)),
+                                        static_cast<GLchar *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetProgramPipelineiv:
+            glGetProgramPipelineiv(static_cast<GLuint>(call.params[0]),
+                                   static_cast<GLenum>(call.params[1]),
+                                   static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetProgramResourceIndex:
+            glGetProgramResourceIndex(static_cast<GLuint>(call.params[0]),
+                                      static_cast<GLenum>(call.params[1]),
+                                      static_cast<const GLchar *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::GetProgramResourceLocation:
+            glGetProgramResourceLocation(static_cast<GLuint>(call.params[0]),
+                                         static_cast<GLenum>(call.params[1]),
+                                         static_cast<const GLchar *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::GetProgramResourceName:
+            glGetProgramResourceName(
+                static_cast<GLuint>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLuint>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                static_cast<GLsizei *>(GetScratchParam(state)),
+                static_cast<GLchar *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetProgramResourceiv:
+            glGetProgramResourceiv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLuint>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                static_cast<const GLenum *>(GetPointerParam(call, 4)),
+                static_cast<GLsizei>(call.params[5]),
+                static_cast<GLsizei *>(GetScratchParam(state)),
+                static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetProgramiv:
+            glGetProgramiv(static_cast<GLuint>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                           static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetQueryObjectuiv:
+            glGetQueryObjectuiv(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLenum>(call.params[1]),
+                                static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetQueryiv:
+            glGetQueryiv(static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                         static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetRenderbufferParameteriv:
+            glGetRenderbufferParameteriv(static_cast<GLenum>(call.params[0]),
+                                         static_cast<GLenum>(call.params[1]),
+                                         static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetSamplerParameterfv:
+            glGetSamplerParameterfv(static_cast<GLuint>(call.params[0]),
+                                    static_cast<GLenum>(call.params[1]),
+                                    static_cast<GLfloat *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetSamplerParameteriv:
+            glGetSamplerParameteriv(static_cast<GLuint>(call.params[0]),
+                                    static_cast<GLenum>(call.params[1]),
+                                    static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetShaderInfoLog:
+            glGetShaderInfoLog(static_cast<GLuint>(call.params[0]),
+                               static_cast<GLsizei>(call.params[1]),
+                               static_cast<GLsizei *>(GetScratchParam(state)),
+                               static_cast<GLchar *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetShaderPrecisionFormat:
+            glGetShaderPrecisionFormat(static_cast<GLenum>(call.params[0]),
+                                       static_cast<GLenum>(call.params[1]),
+                                       static_cast<GLint *>(GetScratchParam(state)),
+                                       static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetShaderSource:
+            glGetShaderSource(static_cast<GLuint>(call.params[0]),
+                              static_cast<GLsizei>(call.params[1]),
+                              static_cast<GLsizei *>(GetScratchParam(state)),
+                              static_cast<GLchar *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetShaderiv:
+            glGetShaderiv(static_cast<GLuint>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                          static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetString:
+            glGetString(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::GetStringi:
+            glGetStringi(static_cast<GLenum>(call.params[0]), static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::GetTexLevelParameterfv:
+            glGetTexLevelParameterfv(static_cast<GLenum>(call.params[0]),
+                                     static_cast<GLint>(call.params[1]),
+                                     static_cast<GLenum>(call.params[2]),
+                                     static_cast<GLfloat *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetTexLevelParameteriv:
+            glGetTexLevelParameteriv(
+                static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetTexParameterfv:
+            glGetTexParameterfv(static_cast<GLenum>(call.params[0]),
+                                static_cast<GLenum>(call.params[1]),
+                                static_cast<GLfloat *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetTexParameteriv:
+            glGetTexParameteriv(static_cast<GLenum>(call.params[0]),
+                                static_cast<GLenum>(call.params[1]),
+                                static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetTransformFeedbackVarying:
+            glGetTransformFeedbackVarying(static_cast<GLuint>(call.params[0]),
+                                          static_cast<GLuint>(call.params[1]),
+                                          static_cast<GLsizei>(call.params[2]),
+                                          static_cast<GLsizei *>(GetScratchParam(state)),
+                                          static_cast<GLsizei *>(GetScratchParam(state)),
+                                          static_cast<GLenum *>(GetScratchParam(state)),
+                                          static_cast<GLchar *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetUniformBlockIndex:
+            glGetUniformBlockIndex(static_cast<GLuint>(call.params[0]),
+                                   static_cast<const GLchar *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::GetUniformIndices:
+            glGetUniformIndices(
+                static_cast<GLuint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                GetStringsParam(call, 2, state), static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetUniformLocation:
+            glGetUniformLocation(static_cast<GLuint>(call.params[0]),
+                                 static_cast<const GLchar *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::GetUniformfv:
+            glGetUniformfv(static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                           static_cast<GLfloat *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetUniformiv:
+            glGetUniformiv(static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                           static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetUniformuiv:
+            glGetUniformuiv(static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                            static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetVertexAttribIiv:
+            glGetVertexAttribIiv(static_cast<GLuint>(call.params[0]),
+                                 static_cast<GLenum>(call.params[1]),
+                                 static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetVertexAttribIuiv:
+            glGetVertexAttribIuiv(static_cast<GLuint>(call.params[0]),
+                                  static_cast<GLenum>(call.params[1]),
+                                  static_cast<GLuint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetVertexAttribPointerv:
+            glGetVertexAttribPointerv(static_cast<GLuint>(call.params[0]),
+                                      static_cast<GLenum>(call.params[1]),
+                                      static_cast<void **>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetVertexAttribfv:
+            glGetVertexAttribfv(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLenum>(call.params[1]),
+                                static_cast<GLfloat *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::GetVertexAttribiv:
+            glGetVertexAttribiv(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLenum>(call.params[1]),
+                                static_cast<GLint *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::Hint:
+            glHint(static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]));
+            return true;
+        case gl::EntryPoint::InvalidateFramebuffer:
+            glInvalidateFramebuffer(static_cast<GLenum>(call.params[0]),
+                                    static_cast<GLsizei>(call.params[1]),
+                                    static_cast<const GLenum *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::InvalidateSubFramebuffer:
+            glInvalidateSubFramebuffer(
+                static_cast<GLenum>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                static_cast<const GLenum *>(GetPointerParam(call, 2)),
+                static_cast<GLint>(call.params[3]), static_cast<GLint>(call.params[4]),
+                static_cast<GLsizei>(call.params[5]), static_cast<GLsizei>(call.params[6]));
+            return true;
+        case gl::EntryPoint::IsBuffer:
+            glIsBuffer(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::IsEnabled:
+            glIsEnabled(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::IsFramebuffer:
+            glIsFramebuffer(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::IsProgram:
+            glIsProgram(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::IsProgramPipeline:
+            glIsProgramPipeline(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::IsQuery:
+            glIsQuery(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::IsRenderbuffer:
+            glIsRenderbuffer(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::IsSampler:
+            glIsSampler(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::IsShader:
+            glIsShader(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::IsTexture:
+            glIsTexture(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::IsTransformFeedback:
+            glIsTransformFeedback(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::IsVertexArray:
+            glIsVertexArray(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::LineWidth:
+            glLineWidth(GetFloatParam(call, 0));
+            return true;
+        case gl::EntryPoint::LinkProgram:
+            glLinkProgram(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::MapBufferRange:
+            glMapBufferRange(
+                static_cast<GLenum>(call.params[0]), static_cast<GLintptr>(call.params[1]),
+                static_cast<GLsizeiptr>(call.params[2]), static_cast<GLbitfield>(call.params[3]));
+            return true;
+        case gl::EntryPoint::MemoryBarrier:
+            glMemoryBarrier(static_cast<GLbitfield>(call.params[0]));
+            return true;
+        case gl::EntryPoint::MemoryBarrierByRegion:
+            glMemoryBarrierByRegion(static_cast<GLbitfield>(call.params[0]));
+            return true;
+        case gl::EntryPoint::PauseTransformFeedback:
+            glPauseTransformFeedback();
+            return true;
+        case gl::EntryPoint::PixelStorei:
+            glPixelStorei(static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::PolygonOffset:
+            glPolygonOffset(GetFloatParam(call, 0), GetFloatParam(call, 1));
+            return true;
+        case gl::EntryPoint::ProgramBinary:
+            glProgramBinary(static_cast<GLuint>(call.params[0]),
+                            static_cast<GLenum>(call.params[1]),
+                            static_cast<const void *>(GetPointerParam(call, 2)),
+                            static_cast<GLsizei>(call.params[3]));
+            return true;
+        case gl::EntryPoint::ProgramParameteri:
+            glProgramParameteri(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLenum>(call.params[1]),
+                                static_cast<GLint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::ProgramUniform1f:
+            glProgramUniform1f(static_cast<GLuint>(call.params[0]),
+                               static_cast<GLint>(call.params[1]), GetFloatParam(call, 2));
+            return true;
+        case gl::EntryPoint::ProgramUniform1fv:
+            glProgramUniform1fv(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLint>(call.params[1]),
+                                static_cast<GLsizei>(call.params[2]),
+                                static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::ProgramUniform1i:
+            glProgramUniform1i(static_cast<GLuint>(call.params[0]),
+                               static_cast<GLint>(call.params[1]),
+                               static_cast<GLint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::ProgramUniform1iv:
+            glProgramUniform1iv(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLint>(call.params[1]),
+                                static_cast<GLsizei>(call.params[2]),
+                                static_cast<const GLint *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::ProgramUniform1ui:
+            glProgramUniform1ui(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLint>(call.params[1]),
+                                static_cast<GLuint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::ProgramUniform1uiv:
+            glProgramUniform1uiv(static_cast<GLuint>(call.params[0]),
+                                 static_cast<GLint>(call.params[1]),
+                                 static_cast<GLsizei>(call.params[2]),
+                                 static_cast<const GLuint *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::ProgramUniform2f:
+            glProgramUniform2f(static_cast<GLuint>(call.params[0]),
+                               static_cast<GLint>(call.params[1]), GetFloatParam(call, 2),
+                               GetFloatParam(call, 3));
+            return true;
+        case gl::EntryPoint::ProgramUniform2fv:
+            glProgramUniform2fv(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLint>(call.params[1]),
+                                static_cast<GLsizei>(call.params[2]),
+                                static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::ProgramUniform2i:
+            glProgramUniform2i(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]));
+            return true;
+        case gl::EntryPoint::ProgramUniform2iv:
+            glProgramUniform2iv(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLint>(call.params[1]),
+                                static_cast<GLsizei>(call.params[2]),
+                                static_cast<const GLint *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::ProgramUniform2ui:
+            glProgramUniform2ui(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLuint>(call.params[2]), static_cast<GLuint>(call.params[3]));
+            return true;
+        case gl::EntryPoint::ProgramUniform2uiv:
+            glProgramUniform2uiv(static_cast<GLuint>(call.params[0]),
+                                 static_cast<GLint>(call.params[1]),
+                                 static_cast<GLsizei>(call.params[2]),
+                                 static_cast<const GLuint *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::ProgramUniform3f:
+            glProgramUniform3f(static_cast<GLuint>(call.params[0]),
+                               static_cast<GLint>(call.params[1]), GetFloatParam(call, 2),
+                               GetFloatParam(call, 3), GetFloatParam(call, 4));
+            return true;
+        case gl::EntryPoint::ProgramUniform3fv:
+            glProgramUniform3fv(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLint>(call.params[1]),
+                                static_cast<GLsizei>(call.params[2]),
+                                static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::ProgramUniform3i:
+            glProgramUniform3i(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]),
+                static_cast<GLint>(call.params[4]));
+            return true;
+        case gl::EntryPoint::ProgramUniform3iv:
+            glProgramUniform3iv(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLint>(call.params[1]),
+                                static_cast<GLsizei>(call.params[2]),
+                                static_cast<const GLint *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::ProgramUniform3ui:
+            glProgramUniform3ui(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLuint>(call.params[2]), static_cast<GLuint>(call.params[3]),
+                static_cast<GLuint>(call.params[4]));
+            return true;
+        case gl::EntryPoint::ProgramUniform3uiv:
+            glProgramUniform3uiv(static_cast<GLuint>(call.params[0]),
+                                 static_cast<GLint>(call.params[1]),
+                                 static_cast<GLsizei>(call.params[2]),
+                                 static_cast<const GLuint *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::ProgramUniform4f:
+            glProgramUniform4f(static_cast<GLuint>(call.params[0]),
+                               static_cast<GLint>(call.params[1]), GetFloatParam(call, 2),
+                               GetFloatParam(call, 3), GetFloatParam(call, 4),
+                               GetFloatParam(call, 5));
+            return true;
+        case gl::EntryPoint::ProgramUniform4fv:
+            glProgramUniform4fv(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLint>(call.params[1]),
+                                static_cast<GLsizei>(call.params[2]),
+                                static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::ProgramUniform4i:
+            glProgramUniform4i(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]),
+                static_cast<GLint>(call.params[4]), static_cast<GLint>(call.params[5]));
+            return true;
+        case gl::EntryPoint::ProgramUniform4iv:
+            glProgramUniform4iv(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLint>(call.params[1]),
+                                static_cast<GLsizei>(call.params[2]),
+                                static_cast<const GLint *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::ProgramUniform4ui:
+            glProgramUniform4ui(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLuint>(call.params[2]), static_cast<GLuint>(call.params[3]),
+                static_cast<GLuint>(call.params[4]), static_cast<GLuint>(call.params[5]));
+            return true;
+        case gl::EntryPoint::ProgramUniform4uiv:
+            glProgramUniform4uiv(static_cast<GLuint>(call.params[0]),
+                                 static_cast<GLint>(call.params[1]),
+                                 static_cast<GLsizei>(call.params[2]),
+                                 static_cast<const GLuint *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::ProgramUniformMatrix2fv:
+            glProgramUniformMatrix2fv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLsizei>(call.params[2]), static_cast<GLboolean>(call.params[3]),
+                static_cast<const GLfloat *>(GetPointerParam(call, 4)));
+            return true;
+        case gl::EntryPoint::ProgramUniformMatrix2x3fv:
+            glProgramUniformMatrix2x3fv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLsizei>(call.params[2]), static_cast<GLboolean>(call.params[3]),
+                static_cast<const GLfloat *>(GetPointerParam(call, 4)));
+            return true;
+        case gl::EntryPoint::ProgramUniformMatrix2x4fv:
+            glProgramUniformMatrix2x4fv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLsizei>(call.params[2]), static_cast<GLboolean>(call.params[3]),
+                static_cast<const GLfloat *>(GetPointerParam(call, 4)));
+            return true;
+        case gl::EntryPoint::ProgramUniformMatrix3fv:
+            glProgramUniformMatrix3fv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLsizei>(call.params[2]), static_cast<GLboolean>(call.params[3]),
+                static_cast<const GLfloat *>(GetPointerParam(call, 4)));
+            return true;
+        case gl::EntryPoint::ProgramUniformMatrix3x2fv:
+            glProgramUniformMatrix3x2fv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLsizei>(call.params[2]), static_cast<GLboolean>(call.params[3]),
+                static_cast<const GLfloat *>(GetPointerParam(call, 4)));
+            return true;
+        case gl::EntryPoint::ProgramUniformMatrix3x4fv:
+            glProgramUniformMatrix3x4fv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLsizei>(call.params[2]), static_cast<GLboolean>(call.params[3]),
+                static_cast<const GLfloat *>(GetPointerParam(call, 4)));
+            return true;
+        case gl::EntryPoint::ProgramUniformMatrix4fv:
+            glProgramUniformMatrix4fv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLsizei>(call.params[2]), static_cast<GLboolean>(call.params[3]),
+                static_cast<const GLfloat *>(GetPointerParam(call, 4)));
+            return true;
+        case gl::EntryPoint::ProgramUniformMatrix4x2fv:
+            glProgramUniformMatrix4x2fv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLsizei>(call.params[2]), static_cast<GLboolean>(call.params[3]),
+                static_cast<const GLfloat *>(GetPointerParam(call, 4)));
+            return true;
+        case gl::EntryPoint::ProgramUniformMatrix4x3fv:
+            glProgramUniformMatrix4x3fv(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLsizei>(call.params[2]), static_cast<GLboolean>(call.params[3]),
+                static_cast<const GLfloat *>(GetPointerParam(call, 4)));
+            return true;
+        case gl::EntryPoint::ReadBuffer:
+            glReadBuffer(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::ReadPixels:
+            glReadPixels(static_cast<GLint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                         static_cast<GLsizei>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                         static_cast<GLenum>(call.params[4]), static_cast<GLenum>(call.params[5]),
+                         static_cast<void *>(GetScratchParam(state)));
+            return true;
+        case gl::EntryPoint::ReleaseShaderCompiler:
+            glReleaseShaderCompiler();
+            return true;
+        case gl::EntryPoint::RenderbufferStorage:
+            glRenderbufferStorage(
+                static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLsizei>(call.params[2]), static_cast<GLsizei>(call.params[3]));
+            return true;
+        case gl::EntryPoint::RenderbufferStorageMultisample:
+            glRenderbufferStorageMultisample(
+                static_cast<GLenum>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                static_cast<GLsizei>(call.params[4]));
+            return true;
+        case gl::EntryPoint::ResumeTransformFeedback:
+            glResumeTransformFeedback();
+            return true;
+        case gl::EntryPoint::SampleCoverage:
+            glSampleCoverage(GetFloatParam(call, 0), static_cast<GLboolean>(call.params[1]));
+            return true;
+        case gl::EntryPoint::SampleMaski:
+            glSampleMaski(static_cast<GLuint>(call.params[0]),
+                          static_cast<GLbitfield>(call.params[1]));
+            return true;
+        case gl::EntryPoint::SamplerParameterf:
+            glSamplerParameterf(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLenum>(call.params[1]), GetFloatParam(call, 2));
+            return true;
+        case gl::EntryPoint::SamplerParameterfv:
+            glSamplerParameterfv(static_cast<GLuint>(call.params[0]),
+                                 static_cast<GLenum>(call.params[1]),
+                                 static_cast<const GLfloat *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::SamplerParameteri:
+            glSamplerParameteri(static_cast<GLuint>(call.params[0]),
+                                static_cast<GLenum>(call.params[1]),
+                                static_cast<GLint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::SamplerParameteriv:
+            glSamplerParameteriv(static_cast<GLuint>(call.params[0]),
+                                 static_cast<GLenum>(call.params[1]),
+                                 static_cast<const GLint *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::Scissor:
+            glScissor(static_cast<GLint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                      static_cast<GLsizei>(call.params[2]), static_cast<GLsizei>(call.params[3]));
+            return true;
+        case gl::EntryPoint::ShaderBinary:
+            glShaderBinary(static_cast<GLsizei>(call.params[0]),
+                           static_cast<const GLuint *>(GetPointerParam(call, 1)),
+                           static_cast<GLenum>(call.params[2]),
+                           static_cast<const void *>(GetPointerParam(call, 3)),
+                           static_cast<GLsizei>(call.params[4]));
+            return true;
+        case gl::EntryPoint::ShaderSource:
+            glShaderSource(static_cast<GLuint>(call.params[0]),
+                           static_cast<GLsizei>(call.params[1]), GetStringsParam(call, 2, state),
+                           nullptr);
+            return true;
+        case gl::EntryPoint::StencilFunc:
+            glStencilFunc(static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                          static_cast<GLuint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::StencilFuncSeparate:
+            glStencilFuncSeparate(
+                static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLuint>(call.params[3]));
+            return true;
+        case gl::EntryPoint::StencilMask:
+            glStencilMask(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::StencilMaskSeparate:
+            glStencilMaskSeparate(static_cast<GLenum>(call.params[0]),
+                                  static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::StencilOp:
+            glStencilOp(static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                        static_cast<GLenum>(call.params[2]));
+            return true;
+        case gl::EntryPoint::StencilOpSeparate:
+            glStencilOpSeparate(
+                static_cast<GLenum>(call.params[0]), static_cast<GLenum>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLenum>(call.params[3]));
+            return true;
+        case gl::EntryPoint::TexImage2D:
+            glTexImage2D(static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                         static_cast<GLint>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                         static_cast<GLsizei>(call.params[4]), static_cast<GLint>(call.params[5]),
+                         static_cast<GLenum>(call.params[6]), static_cast<GLenum>(call.params[7]),
+                         static_cast<const void *>(GetPointerParam(call, 8)));
+            return true;
+        case gl::EntryPoint::TexImage3D:
+            glTexImage3D(static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                         static_cast<GLint>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                         static_cast<GLsizei>(call.params[4]), static_cast<GLsizei>(call.params[5]),
+                         static_cast<GLint>(call.params[6]), static_cast<GLenum>(call.params[7]),
+                         static_cast<GLenum>(call.params[8]),
+                         static_cast<const void *>(GetPointerParam(call, 9)));
+            return true;
+        case gl::EntryPoint::TexParameterf:
+            glTexParameterf(static_cast<GLenum>(call.params[0]),
+                            static_cast<GLenum>(call.params[1]), GetFloatParam(call, 2));
+            return true;
+        case gl::EntryPoint::TexParameterfv:
+            glTexParameterfv(static_cast<GLenum>(call.params[0]),
+                             static_cast<GLenum>(call.params[1]),
+                             static_cast<const GLfloat *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::TexParameteri:
+            glTexParameteri(static_cast<GLenum>(call.params[0]),
+                            static_cast<GLenum>(call.params[1]),
+                            static_cast<GLint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::TexParameteriv:
+            glTexParameteriv(static_cast<GLenum>(call.params[0]),
+                             static_cast<GLenum>(call.params[1]),
+                             static_cast<const GLint *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::TexStorage2D:
+            glTexStorage2D(
+                static_cast<GLenum>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                static_cast<GLsizei>(call.params[4]));
+            return true;
+        case gl::EntryPoint::TexStorage2DMultisample:
+            glTexStorage2DMultisample(
+                static_cast<GLenum>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                static_cast<GLsizei>(call.params[4]), static_cast<GLboolean>(call.params[5]));
+            return true;
+        case gl::EntryPoint::TexStorage3D:
+            glTexStorage3D(
+                static_cast<GLenum>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                static_cast<GLsizei>(call.params[4]), static_cast<GLsizei>(call.params[5]));
+            return true;
+        case gl::EntryPoint::TexSubImage2D:
+            glTexSubImage2D(
+                static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]),
+                static_cast<GLsizei>(call.params[4]), static_cast<GLsizei>(call.params[5]),
+                static_cast<GLenum>(call.params[6]), static_cast<GLenum>(call.params[7]),
+                static_cast<const void *>(GetPointerParam(call, 8)));
+            return true;
+        case gl::EntryPoint::TexSubImage3D:
+            glTexSubImage3D(
+                static_cast<GLenum>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]),
+                static_cast<GLint>(call.params[4]), static_cast<GLsizei>(call.params[5]),
+                static_cast<GLsizei>(call.params[6]), static_cast<GLsizei>(call.params[7]),
+                static_cast<GLenum>(call.params[8]), static_cast<GLenum>(call.params[9]),
+                static_cast<const void *>(GetPointerParam(call, 10)));
+            return true;
+        case gl::EntryPoint::TransformFeedbackVaryings:
+            glTransformFeedbackVaryings(
+                static_cast<GLuint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                GetStringsParam(call, 2, state), static_cast<GLenum>(call.params[3]));
+            return true;
+        case gl::EntryPoint::Uniform1f:
+            glUniform1f(static_cast<GLint>(call.params[0]), GetFloatParam(call, 1));
+            return true;
+        case gl::EntryPoint::Uniform1fv:
+            glUniform1fv(static_cast<GLint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                         static_cast<const GLfloat *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::Uniform1i:
+            glUniform1i(static_cast<GLint>(call.params[0]), static_cast<GLint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::Uniform1iv:
+            glUniform1iv(static_cast<GLint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                         static_cast<const GLint *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::Uniform1ui:
+            glUniform1ui(static_cast<GLint>(call.params[0]), static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::Uniform1uiv:
+            glUniform1uiv(static_cast<GLint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                          static_cast<const GLuint *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::Uniform2f:
+            glUniform2f(static_cast<GLint>(call.params[0]), GetFloatParam(call, 1),
+                        GetFloatParam(call, 2));
+            return true;
+        case gl::EntryPoint::Uniform2fv:
+            glUniform2fv(static_cast<GLint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                         static_cast<const GLfloat *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::Uniform2i:
+            glUniform2i(static_cast<GLint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                        static_cast<GLint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::Uniform2iv:
+            glUniform2iv(static_cast<GLint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                         static_cast<const GLint *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::Uniform2ui:
+            glUniform2ui(static_cast<GLint>(call.params[0]), static_cast<GLuint>(call.params[1]),
+                         static_cast<GLuint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::Uniform2uiv:
+            glUniform2uiv(static_cast<GLint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                          static_cast<const GLuint *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::Uniform3f:
+            glUniform3f(static_cast<GLint>(call.params[0]), GetFloatParam(call, 1),
+                        GetFloatParam(call, 2), GetFloatParam(call, 3));
+            return true;
+        case gl::EntryPoint::Uniform3fv:
+            glUniform3fv(static_cast<GLint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                         static_cast<const GLfloat *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::Uniform3i:
+            glUniform3i(static_cast<GLint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                        static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]));
+            return true;
+        case gl::EntryPoint::Uniform3iv:
+            glUniform3iv(static_cast<GLint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                         static_cast<const GLint *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::Uniform3ui:
+            glUniform3ui(static_cast<GLint>(call.params[0]), static_cast<GLuint>(call.params[1]),
+                         static_cast<GLuint>(call.params[2]), static_cast<GLuint>(call.params[3]));
+            return true;
+        case gl::EntryPoint::Uniform3uiv:
+            glUniform3uiv(static_cast<GLint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                          static_cast<const GLuint *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::Uniform4f:
+            glUniform4f(static_cast<GLint>(call.params[0]), GetFloatParam(call, 1),
+                        GetFloatParam(call, 2), GetFloatParam(call, 3), GetFloatParam(call, 4));
+            return true;
+        case gl::EntryPoint::Uniform4fv:
+            glUniform4fv(static_cast<GLint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                         static_cast<const GLfloat *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::Uniform4i:
+            glUniform4i(static_cast<GLint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                        static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]),
+                        static_cast<GLint>(call.params[4]));
+            return true;
+        case gl::EntryPoint::Uniform4iv:
+            glUniform4iv(static_cast<GLint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                         static_cast<const GLint *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::Uniform4ui:
+            glUniform4ui(static_cast<GLint>(call.params[0]), static_cast<GLuint>(call.params[1]),
+                         static_cast<GLuint>(call.params[2]), static_cast<GLuint>(call.params[3]),
+                         static_cast<GLuint>(call.params[4]));
+            return true;
+        case gl::EntryPoint::Uniform4uiv:
+            glUniform4uiv(static_cast<GLint>(call.params[0]), static_cast<GLsizei>(call.params[1]),
+                          static_cast<const GLuint *>(GetPointerParam(call, 2)));
+            return true;
+        case gl::EntryPoint::UniformBlockBinding:
+            glUniformBlockBinding(static_cast<GLuint>(call.params[0]),
+                                  static_cast<GLuint>(call.params[1]),
+                                  static_cast<GLuint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::UniformMatrix2fv:
+            glUniformMatrix2fv(static_cast<GLint>(call.params[0]),
+                               static_cast<GLsizei>(call.params[1]),
+                               static_cast<GLboolean>(call.params[2]),
+                               static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::UniformMatrix2x3fv:
+            glUniformMatrix2x3fv(static_cast<GLint>(call.params[0]),
+                                 static_cast<GLsizei>(call.params[1]),
+                                 static_cast<GLboolean>(call.params[2]),
+                                 static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::UniformMatrix2x4fv:
+            glUniformMatrix2x4fv(static_cast<GLint>(call.params[0]),
+                                 static_cast<GLsizei>(call.params[1]),
+                                 static_cast<GLboolean>(call.params[2]),
+                                 static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::UniformMatrix3fv:
+            glUniformMatrix3fv(static_cast<GLint>(call.params[0]),
+                               static_cast<GLsizei>(call.params[1]),
+                               static_cast<GLboolean>(call.params[2]),
+                               static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::UniformMatrix3x2fv:
+            glUniformMatrix3x2fv(static_cast<GLint>(call.params[0]),
+                                 static_cast<GLsizei>(call.params[1]),
+                                 static_cast<GLboolean>(call.params[2]),
+                                 static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::UniformMatrix3x4fv:
+            glUniformMatrix3x4fv(static_cast<GLint>(call.params[0]),
+                                 static_cast<GLsizei>(call.params[1]),
+                                 static_cast<GLboolean>(call.params[2]),
+                                 static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::UniformMatrix4fv:
+            glUniformMatrix4fv(static_cast<GLint>(call.params[0]),
+                               static_cast<GLsizei>(call.params[1]),
+                               static_cast<GLboolean>(call.params[2]),
+                               static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::UniformMatrix4x2fv:
+            glUniformMatrix4x2fv(static_cast<GLint>(call.params[0]),
+                                 static_cast<GLsizei>(call.params[1]),
+                                 static_cast<GLboolean>(call.params[2]),
+                                 static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::UniformMatrix4x3fv:
+            glUniformMatrix4x3fv(static_cast<GLint>(call.params[0]),
+                                 static_cast<GLsizei>(call.params[1]),
+                                 static_cast<GLboolean>(call.params[2]),
+                                 static_cast<const GLfloat *>(GetPointerParam(call, 3)));
+            return true;
+        case gl::EntryPoint::UnmapBuffer:
+            glUnmapBuffer(static_cast<GLenum>(call.params[0]));
+            return true;
+        case gl::EntryPoint::UseProgram:
+            glUseProgram(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::UseProgramStages:
+            glUseProgramStages(static_cast<GLuint>(call.params[0]),
+                               static_cast<GLbitfield>(call.params[1]),
+                               static_cast<GLuint>(call.params[2]));
+            return true;
+        case gl::EntryPoint::ValidateProgram:
+            glValidateProgram(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::ValidateProgramPipeline:
+            glValidateProgramPipeline(static_cast<GLuint>(call.params[0]));
+            return true;
+        case gl::EntryPoint::VertexAttrib1f:
+            glVertexAttrib1f(static_cast<GLuint>(call.params[0]), GetFloatParam(call, 1));
+            return true;
+        case gl::EntryPoint::VertexAttrib1fv:
+            glVertexAttrib1fv(static_cast<GLuint>(call.params[0]),
+                              static_cast<const GLfloat *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::VertexAttrib2f:
+            glVertexAttrib2f(static_cast<GLuint>(call.params[0]), GetFloatParam(call, 1),
+                             GetFloatParam(call, 2));
+            return true;
+        case gl::EntryPoint::VertexAttrib2fv:
+            glVertexAttrib2fv(static_cast<GLuint>(call.params[0]),
+                              static_cast<const GLfloat *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::VertexAttrib3f:
+            glVertexAttrib3f(static_cast<GLuint>(call.params[0]), GetFloatParam(call, 1),
+                             GetFloatParam(call, 2), GetFloatParam(call, 3));
+            return true;
+        case gl::EntryPoint::VertexAttrib3fv:
+            glVertexAttrib3fv(static_cast<GLuint>(call.params[0]),
+                              static_cast<const GLfloat *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::VertexAttrib4f:
+            glVertexAttrib4f(static_cast<GLuint>(call.params[0]), GetFloatParam(call, 1),
+                             GetFloatParam(call, 2), GetFloatParam(call, 3),
+                             GetFloatParam(call, 4));
+            return true;
+        case gl::EntryPoint::VertexAttrib4fv:
+            glVertexAttrib4fv(static_cast<GLuint>(call.params[0]),
+                              static_cast<const GLfloat *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::VertexAttribBinding:
+            glVertexAttribBinding(static_cast<GLuint>(call.params[0]),
+                                  static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::VertexAttribDivisor:
+            glVertexAttribDivisor(static_cast<GLuint>(call.params[0]),
+                                  static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::VertexAttribFormat:
+            glVertexAttribFormat(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLboolean>(call.params[3]),
+                static_cast<GLuint>(call.params[4]));
+            return true;
+        case gl::EntryPoint::VertexAttribI4i:
+            glVertexAttribI4i(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLint>(call.params[2]), static_cast<GLint>(call.params[3]),
+                static_cast<GLint>(call.params[4]));
+            return true;
+        case gl::EntryPoint::VertexAttribI4iv:
+            glVertexAttribI4iv(static_cast<GLuint>(call.params[0]),
+                               static_cast<const GLint *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::VertexAttribI4ui:
+            glVertexAttribI4ui(
+                static_cast<GLuint>(call.params[0]), static_cast<GLuint>(call.params[1]),
+                static_cast<GLuint>(call.params[2]), static_cast<GLuint>(call.params[3]),
+                static_cast<GLuint>(call.params[4]));
+            return true;
+        case gl::EntryPoint::VertexAttribI4uiv:
+            glVertexAttribI4uiv(static_cast<GLuint>(call.params[0]),
+                                static_cast<const GLuint *>(GetPointerParam(call, 1)));
+            return true;
+        case gl::EntryPoint::VertexAttribIFormat:
+            glVertexAttribIFormat(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLuint>(call.params[3]));
+            return true;
+        case gl::EntryPoint::VertexAttribIPointer:
+            glVertexAttribIPointer(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLsizei>(call.params[3]),
+                static_cast<const void *>(GetPointerParam(call, 4)));
+            return true;
+        case gl::EntryPoint::VertexAttribPointer:
+            glVertexAttribPointer(
+                static_cast<GLuint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                static_cast<GLenum>(call.params[2]), static_cast<GLboolean>(call.params[3]),
+                static_cast<GLsizei>(call.params[4]),
+                static_cast<const void *>(GetPointerParam(call, 5)));
+            return true;
+        case gl::EntryPoint::VertexBindingDivisor:
+            glVertexBindingDivisor(static_cast<GLuint>(call.params[0]),
+                                   static_cast<GLuint>(call.params[1]));
+            return true;
+        case gl::EntryPoint::Viewport:
+            glViewport(static_cast<GLint>(call.params[0]), static_cast<GLint>(call.params[1]),
+                       static_cast<GLsizei>(call.params[2]), static_cast<GLsizei>(call.params[3]));
+            return true;
+        default:
+            return false;
+    }
+}
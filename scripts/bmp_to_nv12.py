@@ -6,84 +6,192 @@
 #
 # bmp_to_nv12.py:
 #   Script to convert a simple BMP file to an NV12 format. Used to create
-#   test images for the NV12 texture stream end to end tests
+#   test images for the NV12 texture stream end to end tests.
+#
+#   NV21, I420 and P010 layouts are also supported. The output can be a C
+#   header (the default), a raw binary blob with a small header, or a bare
+#   list of hex bytes that can be #included inside an array initializer.
 
-import sys
+import argparse
 import struct
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    print("bmp_to_nv12.py requires numpy")
+    sys.exit(1)
+
+LAYOUTS = ['nv12', 'nv21', 'i420', 'p010']
+OUTPUT_FORMATS = ['header', 'bin', 'hex']
+
+# Header of the binary output: magic, version, width, height, layout fourcc
+# and size of the pixel data that follows, all little endian.
+BIN_HEADER_FORMAT = '<4sIII4sI'
+BIN_MAGIC = b'AYUV'
+BIN_VERSION = 1
+
+FOURCCS = {
+    'nv12': b'NV12',
+    'nv21': b'NV21',
+    'i420': b'I420',
+    'p010': b'P010',
+}
+
+HEX_BYTES_PER_LINE = 16
+
+
+def read_bmp(path):
+    """Returns the pixels of a 24-bit uncompressed BMP as a top-down
+    height x width x 3 array in RGB order."""
+    with open(path, 'rb') as bmp_file:
+        data = bmp_file.read()
+
+    if data[0:2] != b'BM':
+        raise Exception('Invalid BMP magic')
+
+    offset, = struct.unpack_from('<I', data, 10)
+    width, height, planes, bpp, compression = struct.unpack_from('<iiHHI', data, 18)
+
+    if bpp != 24 or compression != 0:
+        raise Exception('Unsupported BMP file')
+
+    # Rows are padded to a multiple of 4 bytes and stored bottom-up unless the
+    # height is negative.
+    top_down = height < 0
+    height = abs(height)
+    stride = (width * 3 + 3) & ~3
+
+    rows = np.frombuffer(data, dtype=np.uint8, count=stride * height, offset=offset)
+    rows = rows.reshape(height, stride)[:, :width * 3].reshape(height, width, 3)
+    if not top_down:
+        rows = rows[::-1]
+
+    # BMP stores pixels as BGR.
+    return rows[:, :, ::-1].astype(np.int32)
+
+
+def rgb_to_yuv(rgb, bits):
+    """BT.601 limited range conversion to Y, U and V planes of the given bit
+    depth."""
+    R = rgb[:, :, 0]
+    G = rgb[:, :, 1]
+    B = rgb[:, :, 2]
+
+    # The coefficients are scaled by 256; keep (bits - 8) more bits of
+    # precision for deeper formats.
+    shift = 8 - (bits - 8)
+    rounding = 1 << (shift - 1)
+    scale = 1 << (bits - 8)
+
+    Y = ((66 * R + 129 * G + 25 * B + rounding) >> shift) + 16 * scale
+    U = ((-38 * R - 74 * G + 112 * B + rounding) >> shift) + 128 * scale
+    V = ((112 * R - 94 * G - 18 * B + rounding) >> shift) + 128 * scale
+    return Y, U, V
+
+
+def subsample(plane):
+    """Averages each 2x2 block of the plane for 4:2:0 chroma."""
+    total = plane[0::2, 0::2] + plane[0::2, 1::2] + plane[1::2, 0::2] + plane[1::2, 1::2]
+    return (total + 2) >> 2
+
+
+def interleave(first, second):
+    result = np.empty((first.shape[0], first.shape[1] * 2), dtype=first.dtype)
+    result[:, 0::2] = first
+    result[:, 1::2] = second
+    return result
+
+
+def convert(rgb, layout):
+    """Returns the image in the requested layout as a flat byte array."""
+    height, width = rgb.shape[0:2]
+    if width % 2 != 0 or height % 2 != 0:
+        raise Exception('Image dimensions must be even for 4:2:0 layouts')
+
+    if layout == 'p010':
+        Y, U, V = rgb_to_yuv(rgb, 10)
+        U = subsample(U)
+        V = subsample(V)
+        # P010 stores 10-bit samples in the high bits of little endian 16-bit
+        # words.
+        planes = [Y, interleave(U, V)]
+        return np.concatenate([(p << 6).astype('<u2').ravel() for p in planes]).view(np.uint8)
+
+    Y, U, V = rgb_to_yuv(rgb, 8)
+    U = subsample(U)
+    V = subsample(V)
+
+    if layout == 'nv12':
+        planes = [Y, interleave(U, V)]
+    elif layout == 'nv21':
+        planes = [Y, interleave(V, U)]
+    else:
+        planes = [Y, U, V]
+
+    return np.concatenate([p.astype(np.uint8).ravel() for p in planes])
+
+
+def format_hex(pixels):
+    """Formats the bytes as comma separated hex literals, 16 per line."""
+    literals = np.char.mod('0x%02x,', pixels)
+    lines = []
+    for start in range(0, len(literals), HEX_BYTES_PER_LINE):
+        lines.append('    ' + ''.join(literals[start:start + HEX_BYTES_PER_LINE]))
+    return '\n'.join(lines) + '\n'
+
+
+def write_header(path, source, prefix, width, height, pixels):
+    with open(path, 'w') as out_file:
+        out_file.write('// Automatically generated from ' + source + '\n')
+        out_file.write('static const size_t ' + prefix + '_width = ' + str(width) + ';\n')
+        out_file.write('static const size_t ' + prefix + '_height = ' + str(height) + ';\n')
+        out_file.write('static const unsigned char ' + prefix + '_data[] = \n{\n')
+        out_file.write(format_hex(pixels))
+        out_file.write('};\n')
+
+
+def write_bin(path, layout, width, height, pixels):
+    with open(path, 'wb') as out_file:
+        out_file.write(
+            struct.pack(BIN_HEADER_FORMAT, BIN_MAGIC, BIN_VERSION, width, height,
+                        FOURCCS[layout], len(pixels)))
+        out_file.write(pixels.tobytes())
+
+
+def write_hex(path, pixels):
+    with open(path, 'w') as out_file:
+        out_file.write(format_hex(pixels))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert a 24-bit BMP file to a YUV image.')
+    parser.add_argument('input', help='Input BMP file')
+    parser.add_argument('output', help='Output file')
+    parser.add_argument(
+        'prefix', nargs='?', default='image', help='Prefix of the variables in header output')
+    parser.add_argument('--layout', choices=LAYOUTS, default='nv12', help='YUV layout')
+    parser.add_argument(
+        '--format', choices=OUTPUT_FORMATS, default='header', help='Output file format')
+    args = parser.parse_args()
+
+    try:
+        rgb = read_bmp(args.input)
+        pixels = convert(rgb, args.layout)
+    except Exception as e:
+        print(str(e))
+        return 1
+
+    height, width = rgb.shape[0:2]
+    if args.format == 'header':
+        write_header(args.output, args.input, args.prefix, width, height, pixels)
+    elif args.format == 'bin':
+        write_bin(args.output, args.layout, width, height, pixels)
+    else:
+        write_hex(args.output, pixels)
+
+    return 0
+
 
-if len(sys.argv) != 4:
-    print("Usage: bmp_to_nv12.py input output prefix")
-    exit(0)
-
-bmp_file = open(sys.argv[1], "rb")
-
-magic = bmp_file.read(2)
-if (magic != "BM"):
-    print("Invalid BMP magic")
-    exit(1)
-
-file_size, = struct.unpack("I", bmp_file.read(4))
-
-# eat reserved bytes
-bmp_file.read(4)
-
-offset, = struct.unpack("I", bmp_file.read(4))
-
-headersize, = struct.unpack("I", bmp_file.read(4))
-width, = struct.unpack("i", bmp_file.read(4))
-height, = struct.unpack("i", bmp_file.read(4))
-planes, = struct.unpack("H", bmp_file.read(2))
-bpp, = struct.unpack("H", bmp_file.read(2))
-compression, = struct.unpack("i", bmp_file.read(4))
-image_size, = struct.unpack("i", bmp_file.read(4))
-
-if (bpp != 24 or compression != 0):
-    print("Unsupported BMP file")
-    bmp_file.close()
-    exit(1)
-
-bmp_file.seek(offset, 0)
-pixels = bmp_file.read(width * height * 3)
-bmp_file.close()
-
-# convert to YUV 4:4:4
-converted_pixels = bytearray(pixels)
-for i in range(0, width * height):
-    R, = struct.unpack("B", pixels[i*3+2])
-    G, = struct.unpack("B", pixels[i*3+1])
-    B, = struct.unpack("B", pixels[i*3])
-    converted_pixels[i*3] = ((66*R + 129*G + 25*B + 128) >> 8) + 16
-    converted_pixels[i*3+1] = ((-38*R - 74*G + 112*B + 128) >> 8) + 128
-    converted_pixels[i*3+2] = ((112*R - 94*G - 18*B + 128) >> 8) + 128
-
-# downsample to packed UV buffer
-uv_buffer = bytearray(width * height / 2)
-for i in range(0, width * height / 2, 2):
-    U1 = converted_pixels[((((i / width) * 2) * width) + (i % width)) * 3 + 1]
-    U2 = converted_pixels[((((i / width) * 2) * width) + width + (i % width)) * 3 + 1]
-    V1 = converted_pixels[((((i / width) * 2) * width) + (i % width)) * 3 + 2]
-    V2 = converted_pixels[((((i / width) * 2) * width) + width + (i % width)) * 3 + 2]
-    uv_buffer[i] = (U1 + U2) / 2
-    uv_buffer[i + 1] = (V1 + V2) / 2
-
-# extract the Y buffer
-y_buffer = bytearray(width * height)
-for i in range(0, width * height):
-    y_buffer[i] = converted_pixels[i * 3]
-
-# write out the file as a C header
-nv12_file = open(sys.argv[2], "w")
-nv12_file.write("// Automatically generated from " + sys.argv[1] + "\n")
-nv12_file.write("static const size_t " + sys.argv[3] + "_width = " + str(width) + ";\n")
-nv12_file.write("static const size_t " + sys.argv[3] + "_height = " + str(height) + ";\n")
-nv12_file.write("static const unsigned char " + sys.argv[3] + "_data[] = \n{")
-for i in range(0, width * height):
-    if (i % 16) == 0:
-        nv12_file.write("\n    ")
-    nv12_file.write(str(y_buffer[i]) + ",")
-for i in range(0, width * height / 2):
-    if (i % 16) == 0:
-        nv12_file.write("\n    ")
-    nv12_file.write(str(uv_buffer[i]) + ",")
-nv12_file.write("\n};")
-nv12_file.close()
+if __name__ == '__main__':
+    sys.exit(main())
@@ -20,64 +20,107 @@
 # Optional arguments:
 #  --gn_out <file>  GN output config to use (e.g., out/Default or out/Debug.)
 #  --output <file>  json file to create, default is angle.json
+#  --ide_json       Use the project.json written by 'gn gen --ide=json'
+#                   instead of 'gn desc'
+#
+# The descriptions of all targets are fetched with a single GN invocation and
+# the dependencies are then resolved in Python, so the build graph is only
+# loaded once. Targets the batch misses are fetched on their own.
 #
 
 import argparse
 import json
 import logging
+import os
 import subprocess
 import sys
 
 
-def get_json_description(gn_out, target_name):
+def run_gn(args):
     try:
-        text_desc = subprocess.check_output(
-            ['gn', 'desc', '--format=json', gn_out, target_name])
+        return subprocess.check_output(['gn'] + args)
     except subprocess.CalledProcessError as e:
         logging.error("e.retcode = %s" % e.returncode)
         logging.error("e.cmd = %s" % e.cmd)
         logging.error("e.output = %s" % e.output)
+        raise
+
+
+def get_json_description(gn_out, target_pattern):
+    """Returns the descriptions of every target matching target_pattern,
+       keyed by label."""
+    cmd = ['desc', '--format=json', gn_out, target_pattern]
+    text_desc = run_gn(cmd)
     try:
         json_out = json.loads(text_desc)
     except ValueError:
         raise ValueError("Unable to decode JSON\ncmd: %s\noutput:\n%s" %
-                         (subprocess.list2cmdline(['gn', 'desc', '--format=json',
-                                                   gn_out, target_name]), text_desc))
+                         (subprocess.list2cmdline(['gn'] + cmd), text_desc))
 
     return json_out
 
-def load_json_deps(desc, gn_out, target_name, all_desc, indent="  "):
-    """Extracts dependencies from the given target json description
-       and recursively extracts json descriptions.
-
-       desc: json description for target_name that includes dependencies
-       gn_out: GN output file with configuration info
-       target_name: name of target in desc to lookup deps
-       all_desc: dependent descriptions added here
-       indent: Print with indent to show recursion depth
+def get_ide_json_description(gn_out):
+    """Returns the descriptions of every target from the project.json file
+       generated by 'gn gen --ide=json', keyed by label."""
+    run_gn(['gen', '--ide=json', gn_out])
+    project_path = os.path.join(gn_out, 'project.json')
+    with open(project_path) as project_file:
+        try:
+            project = json.load(project_file)
+        except ValueError:
+            raise ValueError("Unable to decode JSON in %s" % project_path)
+    return project['targets']
+
+def get_target_description(gn_out, all_targets, target_name):
+    """Returns the description of target_name, or None if GN has none.
+       Targets missing from all_targets are fetched on their own and added
+       to it."""
+    if target_name not in all_targets:
+        logging.debug("fetching: %s" % target_name)
+        try:
+            all_targets.update(get_json_description(gn_out, target_name))
+        except subprocess.CalledProcessError:
+            return None
+    return all_targets.get(target_name)
+
+def collect_deps(gn_out, all_targets, target_name, json_descriptions):
+    """Adds the description of target_name and of all its transitive
+       dependencies to json_descriptions.
+
+       gn_out: GN output config used to fetch targets missing from all_targets
+       all_targets: descriptions of the targets in the build, keyed by label
+       target_name: label of the target to add
+       json_descriptions: dependent descriptions added here
     """
-    target = desc[target_name]
-    text_descriptions = []
-    for dep in target.get('deps', []):
-        if dep not in all_desc:
-            logging.debug("dep: %s%s" % (indent,dep))
-            new_desc = get_json_description(gn_out, dep)
-            all_desc[dep] = new_desc[dep]
-            load_json_deps(new_desc, gn_out, dep, all_desc, indent+"  ")
-        else:
-            logging.debug("dup: %s%s" % (indent,dep))
-
-def create_build_description(gn_out, targets):
+    pending = [target_name]
+    while pending:
+        name = pending.pop()
+        if name in json_descriptions:
+            logging.debug("dup: %s" % name)
+            continue
+        desc = get_target_description(gn_out, all_targets, name)
+        if desc is None:
+            raise ValueError("No GN description for dependency %s" % name)
+        logging.debug("dep: %s" % name)
+        json_descriptions[name] = desc
+        pending.extend(desc.get('deps', []))
+
+def create_build_description(gn_out, targets, use_ide_json=False):
     """Creates the JSON build description by running GN."""
 
     logging.debug("targets = %s" % targets)
+    if use_ide_json:
+        all_targets = get_ide_json_description(gn_out)
+    else:
+        # Include the targets of every toolchain, not only the default one.
+        all_targets = get_json_description(gn_out, '//*(*)')
+    logging.debug("loaded %d target descriptions" % len(all_targets))
+
     json_descriptions = {}
     for target in targets:
         logging.debug("target: %s" % (target))
-        target_desc = get_json_description(gn_out, target)
-        if (target in target_desc and target not in json_descriptions):
-            json_descriptions[target] = target_desc[target]
-            load_json_deps(target_desc, gn_out, target, json_descriptions)
+        if get_target_description(gn_out, all_targets, target) is not None:
+            collect_deps(gn_out, all_targets, target, json_descriptions)
         else:
             logging.debug("Invalid target: %s" % target)
     return json_descriptions
@@ -98,13 +141,18 @@ def main():
         help='json file to create',
         default='angle.json',
     )
+    parser.add_argument(
+        '--ide_json',
+        help='Read the target descriptions from gn gen --ide=json output',
+        action='store_true',
+    )
     parser.add_argument(
         'targets',
         nargs=argparse.REMAINDER,
         help='Targets to include in the json (e.g., "//libEGL")')
     args = parser.parse_args()
 
-    desc = create_build_description(args.gn_out, args.targets)
+    desc = create_build_description(args.gn_out, args.targets, args.ide_json)
     fh = open(args.output,"w")
     fh.write(json.dumps(desc, indent=4, sort_keys=True))
     fh.close()
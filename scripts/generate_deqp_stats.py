@@ -6,12 +6,26 @@
 #
 # generate_deqp_stats.py:
 #   Checks output of deqp testers and generates stats using the GDocs API
+#
+#   Bots and steps are fetched concurrently. Results of finished builds never
+#   change, so step names and step stats are cached on disk per build name and
+#   re-runs only fetch new builds. The cache records how the step logs were
+#   parsed, and entries parsed another way are fetched again. The bb executable
+#   can be replaced with --bb, for example by a stub that serves recorded logs.
+#
+#   Stats are written as JSON or CSV with totals per bot and per suite. With
+#   --diff, the pass rates are compared against a previous JSON stats file.
 
+import argparse
+import csv
+import json
 import re
 import datetime
 import os
 import subprocess
 import sys
+import tempfile
+from multiprocessing.pool import ThreadPool
 
 BOT_NAMES = [
     'Win10 FYI dEQP Release (NVIDIA)',
@@ -32,13 +46,29 @@ BOT_NAME_PREFIX = 'chromium/ci/'
 
 INFO_TAG = '*RESULT'
 
+# gtest prints this line after the dEQP summary of a test binary.
+GTEST_END_TAG = '[==========]'
+
+STAT_KEYS = [
+    'Total', 'Passed', 'Failed', 'Skipped', 'Not Supported', 'Exception',
+    'Crashed', 'Unexpected Passed', 'Unexpected Failed'
+]
+STATS_FORMAT_VERSION = 1
+
+DEFAULT_JOBS = 8
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'angle_deqp_stats')
+
+# Set from the command line in main().
+bb_executable = 'bb'
+stop_after_summary = False
+
 
 # Returns a struct with info about the latest successful build given a bot name
 # Info contains the build_name, time, date, and angle_revision, if available.
 # Uses: bb ls '<botname>' -n 1 -status success -A
 def get_latest_success_build_info(bot_name):
   bb = subprocess.Popen(
-      ['bb', 'ls', bot_name, '-n', '1', '-status', 'success', '-A'],
+      [bb_executable, 'ls', bot_name, '-n', '1', '-status', 'success', '-A'],
       stdout=subprocess.PIPE,
       stderr=subprocess.PIPE)
   out, err = bb.communicate()
@@ -70,7 +100,7 @@ def get_latest_success_build_info(bot_name):
 # Uses: bb get '<build_name>' -steps
 # May raise an exception.
 def get_step_names(build_name):
-  bb = subprocess.Popen(['bb', 'get', build_name, '-steps'],
+  bb = subprocess.Popen([bb_executable, 'get', build_name, '-steps'],
                         stdout=subprocess.PIPE,
                         stderr=subprocess.PIPE)
   out, err = bb.communicate()
@@ -107,25 +137,21 @@ def validate_step_info(step_info, build_name, step_name):
   return True
 
 
-# Returns a struct containing parsed info from a given step log. The info is
-# parsed by looking for lines with the following format in stdout:
-# '[TESTSTATS]: <key>: <value>''
+# Parses the stats of a step from an iterable of log lines. The stats are
+# lines with the following format:
+# '*RESULT: <key>: <value>'
+# Returns the stats and whether parsing stopped before the end of the log,
+# which happens after the first complete summary when stop_after_summary is
+# set.
 # May write to stderr
-# Uses: bb log '<build_name>' '<step_name>'
-def get_step_info(build_name, step_name):
-  bb = subprocess.Popen(['bb', 'log', build_name, step_name],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE)
-  out, err = bb.communicate()
-  if err:
-    sys.stderr.write("WARNING: Unexpected error from bb log '" + build_name +
-                     "' '" + step_name + "': '" + err + "'")
-    return None
+def parse_step_log(lines):
   step_info = {}
-  for line in out.splitlines():
+  summary_seen = False
+  for line in lines:
+    if summary_seen and stop_after_summary and line.startswith(GTEST_END_TAG):
+      return step_info, True
     if INFO_TAG not in line:
       continue
-    found_stat = True
     line_columns = line.split(INFO_TAG, 1)[1].split(':')
     if len(line_columns) is not 3:
       sys.stderr.write("WARNING: Line improperly formatted: '" + line + "'\n")
@@ -138,29 +164,354 @@ def get_step_info(build_name, step_name):
       step_info[key] += val
     else:
       step_info[key] += ', ' + line_columns[2]
+    if key == 'Crashed':
+      summary_seen = True
+  return step_info, False
+
+
+# Returns a struct containing parsed info from a given step log. The log is
+# parsed line by line as bb streams it so the whole log is never held in
+# memory. stderr goes to a temporary file, since bb would block on a full
+# stderr pipe while stdout is being read.
+# May write to stderr
+# Uses: bb log '<build_name>' '<step_name>'
+def get_step_info(build_name, step_name):
+  with tempfile.TemporaryFile() as err_file:
+    bb = subprocess.Popen([bb_executable, 'log', build_name, step_name],
+                          stdout=subprocess.PIPE,
+                          stderr=err_file)
+    step_info, stopped = parse_step_log(iter(bb.stdout.readline, ''))
+    if stopped:
+      # The rest of the log is not needed.
+      bb.kill()
+    bb.wait()
+    err_file.seek(0)
+    err = err_file.read()
+  if err and not stopped:
+    sys.stderr.write("WARNING: Unexpected error from bb log '" + build_name +
+                     "' '" + step_name + "': '" + err + "'")
+    return None
   if validate_step_info(step_info, build_name, step_name):
     return step_info
   return None
 
 
-# Returns the info for each step run on a given bot_name.
-def get_bot_info(bot_name):
-  info = get_latest_success_build_info(bot_name)
-  info['step_names'] = get_step_names(info['build_name'])
-  for step_name in info['step_names']:
-    info[step_name] = get_step_info(info['build_name'], step_name)
+# Returns the path of the cache file of a build, or None if caching is off.
+def get_build_cache_path(cache_dir, build_name):
+  if not cache_dir:
+    return None
+  return os.path.join(cache_dir, re.sub(r'[^A-Za-z0-9_.-]', '_', build_name) +
+                      '.json')
+
+
+# Returns how step logs are parsed, as recorded in the build caches.
+def get_parse_mode():
+  return 'first_summary' if stop_after_summary else 'full'
+
+
+# Returns the cached step names and step info of a build. The step info is
+# dropped if it was parsed in another mode than the current one.
+def load_build_cache(cache_dir, build_name):
+  cache = {'steps': {}}
+  path = get_build_cache_path(cache_dir, build_name)
+  if path and os.path.exists(path):
+    try:
+      with open(path) as cache_file:
+        cache = json.load(cache_file)
+    except ValueError:
+      sys.stderr.write('WARNING: Ignoring corrupt cache ' + path + '\n')
+  if cache.get('parse_mode') != get_parse_mode():
+    cache['steps'] = {}
+    cache['parse_mode'] = get_parse_mode()
+  return cache
+
+
+def save_build_cache(cache_dir, build_name, cache):
+  path = get_build_cache_path(cache_dir, build_name)
+  if not path:
+    return
+  if not os.path.exists(cache_dir):
+    os.makedirs(cache_dir)
+  with open(path, 'w') as cache_file:
+    json.dump(cache, cache_file, indent=2, sort_keys=True)
+
+
+# Calls function with args and returns (result, None), or (None, error) if it
+# raised, so failures of one bot or step do not abort the whole pool.
+def call_catching(function, *args):
+  try:
+    return function(*args), None
+  except Exception as error:
+    return None, error
+
+
+# Returns the info for each step run on every bot in bot_names. Each bb call
+# runs on a pool of jobs threads.
+def get_bots_info(bot_names, jobs, cache_dir):
+  pool = ThreadPool(jobs)
+  try:
+    builds = pool.map(
+        lambda bot_name: call_catching(get_latest_success_build_info,
+                                       BOT_NAME_PREFIX + bot_name), bot_names)
+
+    info = {}
+    caches = {}
+    for bot_name, (build_info, error) in zip(bot_names, builds):
+      if error:
+        sys.stderr.write('ERROR: %s\n' % str(error))
+        continue
+      info[bot_name] = build_info
+      caches[bot_name] = load_build_cache(cache_dir, build_info['build_name'])
+
+    missing_step_names = [
+        bot_name for bot_name in info if 'step_names' not in caches[bot_name]
+    ]
+    step_names = pool.map(
+        lambda bot_name: call_catching(get_step_names, info[bot_name][
+            'build_name']), missing_step_names)
+    for bot_name, (names, error) in zip(missing_step_names, step_names):
+      if error:
+        sys.stderr.write('ERROR: %s\n' % str(error))
+        del info[bot_name]
+        continue
+      caches[bot_name]['step_names'] = names
+
+    missing_steps = []
+    for bot_name in info:
+      info[bot_name]['step_names'] = caches[bot_name]['step_names']
+      for step_name in caches[bot_name]['step_names']:
+        if step_name not in caches[bot_name]['steps']:
+          missing_steps.append((bot_name, step_name))
+    step_infos = pool.map(
+        lambda step: call_catching(get_step_info, info[step[0]]['build_name'],
+                                   step[1]), missing_steps)
+    for (bot_name, step_name), (step_info, error) in zip(missing_steps,
+                                                         step_infos):
+      if error:
+        sys.stderr.write('ERROR: %s\n' % str(error))
+      # Failed steps are not cached so that they are retried next time.
+      if step_info is not None:
+        caches[bot_name]['steps'][step_name] = step_info
+      info[bot_name][step_name] = step_info
+
+    for bot_name in info:
+      for step_name, step_info in caches[bot_name]['steps'].items():
+        info[bot_name][step_name] = step_info
+      save_build_cache(cache_dir, info[bot_name]['build_name'],
+                       caches[bot_name])
+  finally:
+    pool.close()
+    pool.join()
+
   return info
 
 
+# Adds the numeric stats of step_info to totals.
+def accumulate_stats(totals, step_info):
+  for key in STAT_KEYS:
+    if key in step_info and isinstance(step_info[key], int):
+      totals[key] = totals.get(key, 0) + step_info[key]
+
+
+def get_pass_rate(stats):
+  if not stats.get('Total'):
+    return None
+  return float(stats.get('Passed', 0)) / stats['Total']
+
+
+# Returns the totals of every bot, every suite (step name) and of everything.
+def get_totals(info):
+  totals = {'bots': {}, 'suites': {}, 'all': {}}
+  for bot_name, bot_info in info.items():
+    bot_totals = totals['bots'].setdefault(bot_name, {})
+    for step_name in bot_info.get('step_names', []):
+      step_info = bot_info.get(step_name)
+      if not step_info:
+        continue
+      accumulate_stats(bot_totals, step_info)
+      accumulate_stats(totals['suites'].setdefault(step_name, {}), step_info)
+      accumulate_stats(totals['all'], step_info)
+  for group in [totals['bots'].values(), totals['suites'].values(),
+                [totals['all']]]:
+    for stats in group:
+      stats['pass_rate'] = get_pass_rate(stats)
+  return totals
+
+
+def make_stats_document(info):
+  return {
+      'version': STATS_FORMAT_VERSION,
+      'generated': datetime.datetime.now().isoformat(),
+      'bots': info,
+      'totals': get_totals(info),
+  }
+
+
+# Returns the rows of the stats document as lists of columns. Totals use
+# 'TOTAL' in place of the bot or suite name.
+def get_stats_rows(document):
+  header = ['bot', 'build_name', 'angle_revision', 'suite'
+           ] + STAT_KEYS + ['pass_rate']
+  rows = [header]
+
+  def add_row(bot_name, build_name, revision, suite, stats):
+    rows.append([bot_name, build_name, revision, suite] +
+                [stats.get(key, '') for key in STAT_KEYS] +
+                [format_rate(stats.get('pass_rate'))])
+
+  for bot_name in sorted(document['bots']):
+    bot_info = document['bots'][bot_name]
+    for step_name in bot_info.get('step_names', []):
+      step_info = bot_info.get(step_name)
+      if not step_info:
+        continue
+      stats = dict(step_info)
+      stats['pass_rate'] = get_pass_rate(stats)
+      add_row(bot_name, bot_info.get('build_name', ''),
+              bot_info.get('angle_revision', ''), step_name, stats)
+    add_row(bot_name, bot_info.get('build_name', ''),
+            bot_info.get('angle_revision', ''), 'TOTAL',
+            document['totals']['bots'].get(bot_name, {}))
+  for suite in sorted(document['totals']['suites']):
+    add_row('TOTAL', '', '', suite, document['totals']['suites'][suite])
+  add_row('TOTAL', '', '', 'TOTAL', document['totals']['all'])
+  return rows
+
+
+def format_rate(rate):
+  if rate is None:
+    return ''
+  return '%.4f' % rate
+
+
+# Returns one entry per bot, suite and overall total with the pass rate of
+# the previous and the current stats.
+def diff_stats(previous, current):
+  entries = []
+
+  def add_entry(bot_name, suite, old, new):
+    old_rate = old.get('pass_rate') if old else None
+    new_rate = new.get('pass_rate') if new else None
+    delta = None
+    if old_rate is not None and new_rate is not None:
+      delta = new_rate - old_rate
+    entries.append({
+        'bot': bot_name,
+        'suite': suite,
+        'previous_total': old.get('Total') if old else None,
+        'total': new.get('Total') if new else None,
+        'previous_pass_rate': old_rate,
+        'pass_rate': new_rate,
+        'delta': delta,
+    })
+
+  old_totals = previous['totals']
+  new_totals = current['totals']
+  for bot_name in sorted(set(old_totals['bots']) | set(new_totals['bots'])):
+    add_entry(bot_name, 'TOTAL', old_totals['bots'].get(bot_name),
+              new_totals['bots'].get(bot_name))
+  for suite in sorted(set(old_totals['suites']) | set(new_totals['suites'])):
+    add_entry('TOTAL', suite, old_totals['suites'].get(suite),
+              new_totals['suites'].get(suite))
+  add_entry('TOTAL', 'TOTAL', old_totals['all'], new_totals['all'])
+  return entries
+
+
+def get_diff_rows(entries):
+  keys = [
+      'bot', 'suite', 'previous_total', 'total', 'previous_pass_rate',
+      'pass_rate', 'delta'
+  ]
+  rows = [keys]
+  for entry in entries:
+    row = []
+    for key in keys:
+      value = entry[key]
+      if key in ['previous_pass_rate', 'pass_rate', 'delta']:
+        value = format_rate(value)
+      row.append('' if value is None else value)
+    rows.append(row)
+  return rows
+
+
+def write_output(output, output_format, document, rows):
+  out_file = open(output, 'w') if output else sys.stdout
+  try:
+    if output_format == 'json':
+      json.dump(document, out_file, indent=2, sort_keys=True)
+      out_file.write('\n')
+    else:
+      writer = csv.writer(out_file)
+      for row in rows:
+        writer.writerow(row)
+  finally:
+    if output:
+      out_file.close()
+
+
+def load_stats_document(path):
+  with open(path) as stats_file:
+    return json.load(stats_file)
+
+
+def parse_args():
+  parser = argparse.ArgumentParser(
+      description='Generate stats from the dEQP bots.')
+  parser.add_argument(
+      '--bb', default=bb_executable, help='Path of the bb executable to use')
+  parser.add_argument(
+      '--jobs',
+      type=int,
+      default=DEFAULT_JOBS,
+      help='Number of concurrent bb calls')
+  parser.add_argument(
+      '--cache-dir',
+      default=DEFAULT_CACHE_DIR,
+      help='Directory caching the stats of finished builds')
+  parser.add_argument(
+      '--no-cache', action='store_true', help='Fetch every build again')
+  parser.add_argument(
+      '--stop-after-summary',
+      action='store_true',
+      help='Stop reading step logs after the first summary. Faster, but '
+      'undercounts steps that merge the logs of several shards')
+  parser.add_argument(
+      '--format',
+      choices=['json', 'csv'],
+      default='json',
+      help='Output format')
+  parser.add_argument('--output', help='Output file, stdout by default')
+  parser.add_argument(
+      '--input',
+      help='Read the stats from a previous JSON output instead of the bots')
+  parser.add_argument(
+      '--diff',
+      metavar='PREVIOUS',
+      help='Output the pass rate deltas against a previous JSON output')
+  return parser.parse_args()
+
+
 def main():
-  info = {}
-  for bot_name in BOT_NAMES:
-    try:
-      info[bot_name] = get_bot_info(BOT_NAME_PREFIX + bot_name)
-    except Exception as error:
-      sys.stderr.write('ERROR: %s\n' % str(error))
+  global bb_executable, stop_after_summary
+
+  args = parse_args()
+  bb_executable = args.bb
+  stop_after_summary = args.stop_after_summary
+  cache_dir = None if args.no_cache else args.cache_dir
+
+  if args.input:
+    document = load_stats_document(args.input)
+  else:
+    document = make_stats_document(
+        get_bots_info(BOT_NAMES, args.jobs, cache_dir))
 
-  print(str(info))
+  if args.diff:
+    entries = diff_stats(load_stats_document(args.diff), document)
+    write_output(args.output, args.format, {'diff': entries},
+                 get_diff_rows(entries))
+  else:
+    write_output(args.output, args.format, document,
+                 get_stats_rows(document))
 
 
 if __name__ == '__main__':
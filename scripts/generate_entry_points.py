@@ -8,7 +8,7 @@
 #   Generates the OpenGL bindings and entry point layers for ANGLE.
 #   NOTE: don't run this script directly. Run scripts/run_code_generation.py.
 
-import sys, os, pprint, json
+import sys, os, pprint, json, re
 from datetime import date
 import registry_xml
 
@@ -87,16 +87,55 @@ template_entry_points_enum_header = """// GENERATED FILE - DO NOT EDIT.
 #ifndef LIBGLESV2_ENTRYPOINTSENUM_AUTOGEN_H_
 #define LIBGLESV2_ENTRYPOINTSENUM_AUTOGEN_H_
 
+#include <stddef.h>
+
 namespace gl
 {{
+// The largest number of parameters of any entry point.
+constexpr size_t kMaxEntryPointParamCount = {max_param_count};
+
 enum class EntryPoint
 {{
 {entry_points_list}
 }};
+
+// Returns the name of the entry point without the "gl" prefix.
+const char *GetEntryPointName(EntryPoint entryPoint);
 }}  // namespace gl
 #endif  // LIBGLESV2_ENTRY_POINTS_ENUM_AUTOGEN_H_
 """
 
+template_entry_points_enum_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_enum_autogen.cpp:
+//   Defines the names of the GLES entry points.
+
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+#include "common/debug.h"
+
+namespace gl
+{{
+namespace
+{{
+constexpr const char *kEntryPointNames[] = {{
+{entry_point_names_list}
+}};
+}}  // anonymous namespace
+
+const char *GetEntryPointName(EntryPoint entryPoint)
+{{
+    ASSERT(entryPoint < EntryPoint::EnumCount);
+    return kEntryPointNames[static_cast<size_t>(entryPoint)];
+}}
+}}  // namespace gl
+"""
+
 template_libgles_entry_point_source = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
 //
@@ -116,16 +155,13 @@ template_entry_point_decl = """ANGLE_EXPORT {return_type}GL_APIENTRY {name}{expl
 
 template_entry_point_def = """{return_type}GL_APIENTRY {name}{explicit_context_suffix}({explicit_context_param}{explicit_context_comma}{params})
 {{
-    ANGLE_SCOPED_GLOBAL_LOCK();
-    {event_comment}EVENT("({format_params})"{comma_if_needed}{pass_params});
+    {global_lock}{event_comment}EVENT("({format_params})"{comma_if_needed}{pass_params});
+    ANGLE_BINARY_EVENT({name}{comma_if_needed}{binary_event_params});
 
     Context *context = {context_getter};
     if (context)
-    {{{assert_explicit_context}{packed_gl_enum_conversions}
-        if (context->skipValidation() || Validate{name}({validate_params}))
-        {{
-            {return_if_needed}context->{name_lower_no_suffix}({internal_params});
-        }}
+    {{{assert_explicit_context}{share_group_lock}
+        {return_if_needed}context->getDispatchTable()->{name}(context{comma_if_needed}{binary_event_params});
     }}
 {default_return_if_needed}}}
 """
@@ -234,41 +270,1086 @@ format_dict = {
     "GLeglImageOES": "0x%016\" PRIxPTR \"",
 }
 
-template_header_includes = """#include <GLES{major}/gl{major}{minor}.h>
-#include <export.h>"""
+template_header_includes = """#include <GLES{major}/gl{major}{minor}.h>
+#include <export.h>"""
+
+template_sources_includes = """#include "libGLESv2/entry_points_gles_{}_autogen.h"
+
+#include "libANGLE/Context.h"
+#include "libGLESv2/entry_points_binary_event.h"
+#include "libGLESv2/entry_points_dispatch_autogen.h"
+#include "libGLESv2/entry_points_utils.h"
+#include "libGLESv2/global_state.h"
+"""
+
+template_event_comment = """// Don't run an EVENT() macro on the EXT_debug_marker entry points.
+    // It can interfere with the debug events being set by the caller.
+    // """
+
+template_validation_proto = "bool Validate%s(%s);"
+
+template_lock_stress_test_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// EntryPointLockStressTest_autogen.cpp:
+//   Calls the GLES entry points that don't take the global lock from many threads at once.
+
+#include "test_utils/ANGLETest.h"
+
+#include "util/EGLWindow.h"
+
+#include <array>
+#include <thread>
+
+namespace angle
+{{
+namespace
+{{
+constexpr size_t kThreadCount         = 16;
+constexpr size_t kIterationsPerThread = 64;
+
+// The arguments are all zero, so many of the calls only run validation. That is enough to race
+// the entry points of different contexts against each other.
+void CallContextEntryPoints()
+{{
+    std::array<GLuint64, 64> scratch = {{}};
+{context_calls}
+}}
+
+void CallShareGroupEntryPoints()
+{{
+    std::array<GLuint64, 64> scratch = {{}};
+{share_group_calls}
+}}
+}}  // anonymous namespace
+
+class EntryPointLockStressTest : public ANGLETest
+{{
+  protected:
+    EntryPointLockStressTest()
+    {{
+        setWindowWidth(16);
+        setWindowHeight(16);
+        setConfigRedBits(8);
+        setConfigGreenBits(8);
+        setConfigBlueBits(8);
+        setConfigAlphaBits(8);
+        setContextVirtualization(false);
+    }}
+
+    bool platformSupportsMultithreading() const
+    {{
+#if defined(ANGLE_FORCE_THREAD_SAFETY)
+        return true;
+#else
+        return (IsOpenGLES() && IsAndroid());
+#endif  // defined(ANGLE_FORCE_THREAD_SAFETY)
+    }}
+
+    // Runs callEntryPoints on kThreadCount threads, each with its own context. The contexts are in
+    // the share group of the test window's context if shareContexts is set, otherwise each one is
+    // in its own share group.
+    void runOnContexts(void (*callEntryPoints)(), bool shareContexts)
+    {{
+        EGLWindow *window       = getEGLWindow();
+        EGLDisplay dpy          = window->getDisplay();
+        EGLConfig config        = window->getConfig();
+        EGLContext shareContext = shareContexts ? window->getContext() : EGL_NO_CONTEXT;
+
+        std::array<std::thread, kThreadCount> threads;
+        for (std::thread &thread : threads)
+        {{
+            thread = std::thread([&]() {{
+                EGLint pbufferAttributes[] = {{EGL_WIDTH, 1, EGL_HEIGHT, 1, EGL_NONE}};
+                EGLSurface pbuffer = eglCreatePbufferSurface(dpy, config, pbufferAttributes);
+                EXPECT_EGL_SUCCESS();
+
+                EGLContext ctx = window->createContext(shareContext);
+                EXPECT_NE(EGL_NO_CONTEXT, ctx);
+
+                EXPECT_EGL_TRUE(eglMakeCurrent(dpy, pbuffer, pbuffer, ctx));
+                EXPECT_EGL_SUCCESS();
+
+                for (size_t iteration = 0; iteration < kIterationsPerThread; iteration++)
+                {{
+                    callEntryPoints();
+                }}
+
+                // The calls are expected to generate errors; only crashes and races matter.
+                while (glGetError() != GL_NO_ERROR)
+                {{
+                }}
+
+                EXPECT_EGL_TRUE(eglMakeCurrent(dpy, EGL_NO_SURFACE, EGL_NO_SURFACE, EGL_NO_CONTEXT));
+                EXPECT_EGL_SUCCESS();
+
+                eglDestroySurface(dpy, pbuffer);
+                eglDestroyContext(dpy, ctx);
+            }});
+        }}
+
+        for (std::thread &thread : threads)
+        {{
+            thread.join();
+        }}
+    }}
+}};
+
+// Calls the entry points that only touch the current context from many threads.
+TEST_P(EntryPointLockStressTest, ContextEntryPoints)
+{{
+    ANGLE_SKIP_TEST_IF(!platformSupportsMultithreading());
+    runOnContexts(CallContextEntryPoints, true);
+}}
+
+// Calls the entry points that only touch the share group from many threads sharing it.
+TEST_P(EntryPointLockStressTest, ShareGroupEntryPoints)
+{{
+    ANGLE_SKIP_TEST_IF(!platformSupportsMultithreading());
+    runOnContexts(CallShareGroupEntryPoints, true);
+}}
+
+// Calls the entry points that only touch the share group from many threads with a share group
+// each. Backends that can't run these calls concurrently serialize them on the global lock.
+TEST_P(EntryPointLockStressTest, ShareGroupEntryPointsAcrossShareGroups)
+{{
+    ANGLE_SKIP_TEST_IF(!platformSupportsMultithreading());
+    runOnContexts(CallShareGroupEntryPoints, false);
+}}
+
+ANGLE_INSTANTIATE_TEST(EntryPointLockStressTest,
+                       ES3_D3D11(),
+                       ES3_OPENGL(),
+                       ES3_OPENGLES(),
+                       ES3_VULKAN(),
+                       ES3_NULL());
+
+}}  // namespace angle
+"""
+
+template_binary_event_decoder_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_binary_event_decoder_autogen.cpp:
+//   Formats binary entry point events like the EVENT() of their entry point.
+
+#include "libGLESv2/entry_points_binary_event.h"
+
+#include <inttypes.h>
+#include <stdarg.h>
+#include <vector>
+
+#include "angle_gl.h"
+#include "common/angleutils.h"
+#include "common/mathutil.h"
+
+namespace gl
+{{
+namespace
+{{
+GLfloat DecodeFloat(uint64_t param)
+{{
+    return bitCast<GLfloat>(static_cast<uint32_t>(param));
+}}
+
+bool FormatEvent(std::string *textOut, const char *format, ...)
+{{
+    va_list vararg;
+    va_start(vararg, format);
+    std::vector<char> buffer(512);
+    size_t length = FormatStringIntoVector(format, vararg, buffer);
+    va_end(vararg);
+    textOut->assign(buffer.data(), length);
+    return true;
+}}
+}}  // anonymous namespace
+
+bool FormatBinaryEvent(const BinaryEvent &event, std::string *textOut)
+{{
+    switch (static_cast<EntryPoint>(event.entryPoint))
+    {{
+{cases}
+        default:
+            return false;
+    }}
+}}
+}}  // namespace gl
+"""
+
+template_binary_event_decoder_case = """        case EntryPoint::{name}:
+            if (event.paramCount != {param_count})
+            {{
+                return false;
+            }}
+            return FormatEvent(textOut, "gl{name}({format_params})"{comma_if_needed}{decode_params});"""
+
+template_lock_stress_test_call = "    {name}({args});"
+
+template_overhead_perf_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// EntryPointOverheadPerf_autogen.cpp:
+//   Measures the overhead of the GLES entry points by calling cheap commands in a loop on the
+//   null backend, with and without validation. Prints the time per call of every entry point,
+//   most expensive first.
+
+#include "ANGLEPerfTest.h"
+
+#include <algorithm>
+#include <memory>
+#include <sstream>
+#include <vector>
+
+namespace angle
+{{
+namespace
+{{
+constexpr unsigned int kIterationsPerStep = 64;
+
+GLboolean gBooleans[16] = {{}};
+GLfloat gFloats[16]     = {{}};
+GLint gInts[16]         = {{}};
+GLuint gUints[16]       = {{}};
+
+{loops}
+
+struct OverheadEntryPoint
+{{
+    const char *name;
+    void (*loop)(unsigned int iterations);
+}};
+
+constexpr OverheadEntryPoint kEntryPoints[] = {{
+{entry_points}
+}};
+
+constexpr size_t kEntryPointCount = ArraySize(kEntryPoints);
+
+struct EntryPointOverheadParams final : public RenderTestParams
+{{
+    EntryPointOverheadParams()
+    {{
+        majorVersion      = 3;
+        minorVersion      = 0;
+        windowWidth       = 16;
+        windowHeight      = 16;
+        iterationsPerStep = kIterationsPerStep;
+        eglParameters     = EGLPlatformParameters(EGL_PLATFORM_ANGLE_TYPE_NULL_ANGLE);
+    }}
+
+    std::string suffix() const override;
+
+    bool noError = false;
+}};
+
+std::ostream &operator<<(std::ostream &os, const EntryPointOverheadParams &params)
+{{
+    os << params.suffix().substr(1);
+    return os;
+}}
+
+std::string EntryPointOverheadParams::suffix() const
+{{
+    std::stringstream strstr;
+    strstr << RenderTestParams::suffix();
+    strstr << (noError ? "_no_validation" : "_validation");
+    return strstr.str();
+}}
+
+class EntryPointOverheadBenchmark : public ANGLERenderTest,
+                                    public ::testing::WithParamInterface<EntryPointOverheadParams>
+{{
+  public:
+    EntryPointOverheadBenchmark();
+
+    void destroyBenchmark() override;
+    void drawBenchmark() override;
+
+  private:
+    std::unique_ptr<Timer> mEntryPointTimer;
+    std::vector<double> mEntryPointSeconds;
+    size_t mEntryPointLoops;
+}};
+
+EntryPointOverheadBenchmark::EntryPointOverheadBenchmark()
+    : ANGLERenderTest("EntryPointOverhead", GetParam()),
+      mEntryPointTimer(CreateTimer()),
+      mEntryPointSeconds(kEntryPointCount, 0.0),
+      mEntryPointLoops(0)
+{{
+    setNoErrorEnabled(GetParam().noError);
+}}
+
+void EntryPointOverheadBenchmark::destroyBenchmark()
+{{
+    if (mEntryPointLoops == 0)
+    {{
+        return;
+    }}
+
+    std::vector<size_t> ranking(kEntryPointCount);
+    for (size_t index = 0; index < kEntryPointCount; ++index)
+    {{
+        ranking[index] = index;
+    }}
+    std::sort(ranking.begin(), ranking.end(), [this](size_t a, size_t b) {{
+        return mEntryPointSeconds[a] > mEntryPointSeconds[b];
+    }});
+
+    double calls = static_cast<double>(mEntryPointLoops) * GetParam().iterationsPerStep;
+    for (size_t index : ranking)
+    {{
+        printResult(kEntryPoints[index].name, mEntryPointSeconds[index] * 1e9 / calls, "ns",
+                    false);
+    }}
+}}
+
+void EntryPointOverheadBenchmark::drawBenchmark()
+{{
+    const unsigned int iterations = GetParam().iterationsPerStep;
+    for (size_t index = 0; index < kEntryPointCount; ++index)
+    {{
+        double start = mEntryPointTimer->getAbsoluteTime();
+        kEntryPoints[index].loop(iterations);
+        mEntryPointSeconds[index] += mEntryPointTimer->getAbsoluteTime() - start;
+    }}
+    mEntryPointLoops++;
+
+    ASSERT_GL_NO_ERROR();
+}}
+
+EntryPointOverheadParams NullParams(bool noError)
+{{
+    EntryPointOverheadParams params;
+    params.noError = noError;
+    return params;
+}}
+}}  // anonymous namespace
+
+TEST_P(EntryPointOverheadBenchmark, Run)
+{{
+    run();
+}}
+
+ANGLE_INSTANTIATE_TEST(EntryPointOverheadBenchmark, NullParams(false), NullParams(true));
+
+}}  // namespace angle
+"""
+
+template_overhead_perf_loop = """void Loop{name}(unsigned int iterations)
+{{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {{
+        {cmd_name}({args});
+    }}
+}}
+"""
+
+template_capture_header = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_capture_autogen.h:
+//   Captures of the GLES entry points.
+
+#ifndef LIBGLESV2_ENTRY_POINTS_CAPTURE_AUTOGEN_H_
+#define LIBGLESV2_ENTRY_POINTS_CAPTURE_AUTOGEN_H_
+
+#include "angle_gl.h"
+
+namespace gl
+{{
+class Context;
+
+{protos}
+}}  // namespace gl
+
+#endif  // LIBGLESV2_ENTRY_POINTS_CAPTURE_AUTOGEN_H_
+"""
+
+template_capture_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_capture_autogen.cpp:
+//   Captures of the GLES entry points.
+
+#include "libGLESv2/entry_points_capture.h"
+
+#if ANGLE_CAPTURE == ANGLE_ENABLED
+
+namespace gl
+{{
+{captures}
+}}  // namespace gl
+
+#endif  // ANGLE_CAPTURE == ANGLE_ENABLED
+"""
+
+template_capture_proto = "void Capture{name}(const Context *context{comma_if_needed}{params})"
+
+template_capture_def = """{proto}
+{{
+    CallCapture call(EntryPoint::{name});{add_params}{add_blobs}
+    WriteCallCapture(call);
+}}
+"""
+
+template_capture_replay_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_replay_autogen.cpp:
+//   Replays the captured calls of the OpenGL ES 2.0, 3.0 and 3.1 entry points.
+
+#include "capture_replay.h"
+
+#include "util/gles_loader_autogen.h"
+
+bool ReplayCall(const CapturedCall &call, ReplayState *state)
+{{
+    switch (call.entryPoint)
+    {{
+{cases}
+        default:
+            return false;
+    }}
+}}
+"""
+
+template_capture_replay_case = """        case gl::EntryPoint::{name}:
+            {cmd_name}({args});
+            return true;"""
+
+template_deferred_header = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_deferred_autogen.h:
+//   Recording and execution of the deferred GLES commands.
+
+#ifndef LIBGLESV2_ENTRY_POINTS_DEFERRED_AUTOGEN_H_
+#define LIBGLESV2_ENTRY_POINTS_DEFERRED_AUTOGEN_H_
+
+#include "angle_gl.h"
+
+namespace gl
+{{
+class Context;
+struct DeferredCommandHeader;
+
+// Validates and executes a recorded command.
+void ExecuteDeferredCommand(Context *context, const DeferredCommandHeader *header);
+
+// Record the command if the context has a deferred command stream. Return false if the command
+// has to be executed synchronously.
+{protos}
+}}  // namespace gl
+
+#endif  // LIBGLESV2_ENTRY_POINTS_DEFERRED_AUTOGEN_H_
+"""
+
+template_deferred_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_deferred_autogen.cpp:
+//   Recording and execution of the deferred GLES commands.
+
+#include "libGLESv2/entry_points_deferred.h"
+
+#if ANGLE_DEFERRED_COMMANDS == ANGLE_ENABLED
+
+#include "libANGLE/Context.inl.h"
+#include "libANGLE/validationES2.h"
+#include "libANGLE/validationES3.h"
+#include "libANGLE/validationES31.h"
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+namespace gl
+{{
+namespace
+{{
+{structs}
+}}  // anonymous namespace
+
+void ExecuteDeferredCommand(Context *context, const DeferredCommandHeader *header)
+{{
+    // The commands recorded before the context was lost are dropped.
+    if (context->isContextLost())
+    {{
+        return;
+    }}
+
+    switch (static_cast<EntryPoint>(header->commandID))
+    {{
+{cases}
+        default:
+            UNREACHABLE();
+            break;
+    }}
+}}
+
+{defers}
+}}  // namespace gl
+
+#endif  // ANGLE_DEFERRED_COMMANDS == ANGLE_ENABLED
+"""
+
+template_deferred_params_struct = """struct Deferred{name}Params
+{{
+{members}
+}};
+"""
+
+template_deferred_proto = "bool Defer{name}(Context *context{comma_if_needed}{params})"
+
+template_deferred_def = """{proto}
+{{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream{sync_conditions})
+    {{
+        return false;
+    }}
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    {record_command}commandBuffer->recordCommand<Deferred{name}Params>(static_cast<uint16_t>(EntryPoint::{name}));{set_params}
+    stream->onCommandRecorded();
+    return true;
+}}
+"""
+
+template_deferred_case = """        case EntryPoint::{name}:
+        {{{get_params}
+            if (context->skipValidation() || Validate{name}({validate_params}))
+            {{
+                context->{name_lower_no_suffix}({internal_params});
+            }}
+            break;
+        }}"""
+
+template_dispatch_header = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_dispatch_autogen.h:
+//   Tables of the functions the GLES entry points call with the current context. The context
+//   selects its table when it is made current, depending on whether it skips validation, and
+//   switches to the context lost table when it is lost.
+
+#ifndef LIBGLESV2_ENTRY_POINTS_DISPATCH_AUTOGEN_H_
+#define LIBGLESV2_ENTRY_POINTS_DISPATCH_AUTOGEN_H_
+
+#include "angle_gl.h"
+
+namespace gl
+{{
+class Context;
+
+struct DispatchTable
+{{
+{members}
+}};
+
+// Validates the calls before executing them.
+extern const DispatchTable kValidatedDispatchTable;
+
+// Executes the calls without validation, for the contexts created with KHR_no_error.
+extern const DispatchTable kNoErrorDispatchTable;
+
+// Generates an error and returns the default value. glGetError and glGetGraphicsResetStatusEXT
+// are executed.
+extern const DispatchTable kContextLostDispatchTable;
+}}  // namespace gl
+
+#endif  // LIBGLESV2_ENTRY_POINTS_DISPATCH_AUTOGEN_H_
+"""
+
+template_dispatch_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_dispatch_autogen.cpp:
+//   Tables of the functions the GLES entry points call with the current context.
+
+#include "libGLESv2/entry_points_dispatch_autogen.h"
+
+#include "libANGLE/Context.h"
+#include "libANGLE/Context.inl.h"
+#include "libANGLE/validationES1.h"
+#include "libANGLE/validationES2.h"
+#include "libANGLE/validationES3.h"
+#include "libANGLE/validationES31.h"
+#include "libANGLE/validationESEXT.h"
+#include "libGLESv2/entry_points_capture.h"
+#include "libGLESv2/entry_points_deferred.h"
+#include "libGLESv2/entry_points_profiler.h"
+#include "libGLESv2/entry_points_utils.h"
+
+namespace gl
+{{
+namespace
+{{
+void GenerateContextLostError(Context *context)
+{{
+    context->handleError(GL_OUT_OF_MEMORY, "Context has been lost.", __FILE__, ANGLE_FUNCTION,
+                         __LINE__);
+}}
+
+{validated_defs}
+{no_error_defs}
+{context_lost_defs}
+}}  // anonymous namespace
+
+const DispatchTable kValidatedDispatchTable = {{
+{validated_entries}
+}};
+
+const DispatchTable kNoErrorDispatchTable = {{
+{no_error_entries}
+}};
+
+const DispatchTable kContextLostDispatchTable = {{
+{context_lost_entries}
+}};
+}}  // namespace gl
+"""
+
+template_dispatch_member = "    {return_type}(*{name})(Context *context{comma_if_needed}{params});"
+
+template_dispatch_validated_def = """{return_type}Validated{name}(Context *context{comma_if_needed}{params})
+{{{deferred_commands}
+    ANGLE_PROFILE_ENTRY_POINT({name});{packed_gl_enum_conversions}
+    if (Validate{name}({validate_params}))
+    {{
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL({name}, context{comma_if_needed}{param_names});
+        {return_if_needed}context->{name_lower_no_suffix}({internal_params});
+    }}{default_return_if_needed}
+}}
+"""
+
+template_dispatch_no_error_def = """{return_type}NoError{name}(Context *context{comma_if_needed}{params})
+{{{deferred_commands}
+    ANGLE_PROFILE_ENTRY_POINT({name});{packed_gl_enum_conversions}
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL({name}, context{comma_if_needed}{param_names});
+    {return_if_needed}context->{name_lower_no_suffix}({internal_params});
+}}
+"""
+
+template_dispatch_context_lost_def = """{return_type}ContextLost{name}(Context *context{comma_if_needed}{params})
+{{
+    GenerateContextLostError(context);{default_return_if_needed}
+}}
+"""
+
+template_dispatch_table_test_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// DispatchTableTest_autogen.cpp:
+//   Checks that the dispatch tables of the GLES entry points have every entry.
+
+#include <gtest/gtest.h>
+
+#include "libGLESv2/entry_points_dispatch_autogen.h"
+
+namespace
+{{
+void ExpectCompleteDispatchTable(const gl::DispatchTable &table)
+{{
+{expectations}
+}}
+
+// Tests that the table of the contexts that validate the calls has every entry.
+TEST(DispatchTableTest, ValidatedTableIsComplete)
+{{
+    ExpectCompleteDispatchTable(gl::kValidatedDispatchTable);
+}}
+
+// Tests that the table of the KHR_no_error contexts has every entry.
+TEST(DispatchTableTest, NoErrorTableIsComplete)
+{{
+    ExpectCompleteDispatchTable(gl::kNoErrorDispatchTable);
+}}
+
+// Tests that the table of the lost contexts has every entry.
+TEST(DispatchTableTest, ContextLostTableIsComplete)
+{{
+    ExpectCompleteDispatchTable(gl::kContextLostDispatchTable);
+}}
+
+// Tests that the errors and the reset status can be queried from lost contexts.
+TEST(DispatchTableTest, ContextLostTableQueriesErrors)
+{{
+    EXPECT_EQ(gl::kValidatedDispatchTable.GetError, gl::kContextLostDispatchTable.GetError);
+    EXPECT_EQ(gl::kValidatedDispatchTable.GetGraphicsResetStatusEXT,
+              gl::kContextLostDispatchTable.GetGraphicsResetStatusEXT);
+    EXPECT_NE(gl::kValidatedDispatchTable.Clear, gl::kContextLostDispatchTable.Clear);
+}}
+}}  // anonymous namespace
+"""
+
+template_windows_def_file = """; GENERATED FILE - DO NOT EDIT.
+; Generated by {script_name} using data from {data_source_name}.
+;
+; Copyright {year} The ANGLE Project Authors. All rights reserved.
+; Use of this source code is governed by a BSD-style license that can be
+; found in the LICENSE file.
+LIBRARY {lib}
+EXPORTS
+{exports}
+"""
+
+template_multi_draw_perf_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// MultiDrawPerf_autogen.cpp:
+//   Compares kDrawCount separate draws with one GL_ANGLE_multi_draw call issuing the same draws,
+//   for every multi-draw command, on the null backend.
+
+#include "ANGLEPerfTest.h"
+#include "test_utils/draw_call_perf_utils.h"
+
+#include <sstream>
+#include <vector>
+
+namespace angle
+{{
+namespace
+{{
+constexpr unsigned int kIterationsPerStep = 16;
+constexpr GLsizei kDrawCount              = 64;
+
+// The parameters of the multi-draw calls. Every draw covers its own triangle.
+struct MultiDrawData
+{{
+    GLenum mode;
+    GLenum type;
+    GLsizei drawcount;
+    std::vector<GLint> firsts;
+    std::vector<GLsizei> counts;
+    std::vector<const GLvoid *> indices;
+    std::vector<GLsizei> instanceCounts;
+}};
+
+{draw_functions}
+
+struct MultiDrawCommand
+{{
+    const char *name;
+    void (*separate)(const MultiDrawData &data);
+    void (*multi)(const MultiDrawData &data);
+}};
+
+constexpr MultiDrawCommand kCommands[] = {{
+{commands}
+}};
+
+struct MultiDrawParams final : public RenderTestParams
+{{
+    MultiDrawParams()
+    {{
+        majorVersion      = 3;
+        minorVersion      = 0;
+        windowWidth       = 64;
+        windowHeight      = 64;
+        iterationsPerStep = kIterationsPerStep;
+        eglParameters     = EGLPlatformParameters(EGL_PLATFORM_ANGLE_TYPE_NULL_ANGLE);
+    }}
+
+    std::string suffix() const override;
+
+    size_t command = 0;
+    bool multi     = false;
+}};
+
+std::ostream &operator<<(std::ostream &os, const MultiDrawParams &params)
+{{
+    os << params.suffix().substr(1);
+    return os;
+}}
+
+std::string MultiDrawParams::suffix() const
+{{
+    std::stringstream strstr;
+    strstr << RenderTestParams::suffix();
+    strstr << "_" << kCommands[command].name << (multi ? "_multi" : "_separate");
+    return strstr.str();
+}}
+
+class MultiDrawBenchmark : public ANGLERenderTest,
+                           public ::testing::WithParamInterface<MultiDrawParams>
+{{
+  public:
+    MultiDrawBenchmark();
+
+    void initializeBenchmark() override;
+    void destroyBenchmark() override;
+    void drawBenchmark() override;
+
+  private:
+    GLuint mProgram     = 0;
+    GLuint mBuffer      = 0;
+    GLuint mIndexBuffer = 0;
+    MultiDrawData mData;
+}};
+
+MultiDrawBenchmark::MultiDrawBenchmark() : ANGLERenderTest("MultiDraw", GetParam())
+{{
+    addExtensionPrerequisite("GL_ANGLE_multi_draw");
+}}
+
+void MultiDrawBenchmark::initializeBenchmark()
+{{
+    mProgram = SetupSimpleDrawProgram();
+    ASSERT_NE(0u, mProgram);
+
+    mBuffer = Create2DTriangleBuffer(kDrawCount, GL_STATIC_DRAW);
+    glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, 0);
+    glEnableVertexAttribArray(0);
+
+    std::vector<GLushort> indexData(kDrawCount * 3);
+    for (size_t index = 0; index < indexData.size(); ++index)
+    {{
+        indexData[index] = static_cast<GLushort>(index);
+    }}
+    glGenBuffers(1, &mIndexBuffer);
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, mIndexBuffer);
+    glBufferData(GL_ELEMENT_ARRAY_BUFFER, indexData.size() * sizeof(GLushort), indexData.data(),
+                 GL_STATIC_DRAW);
+
+    mData.mode      = GL_TRIANGLES;
+    mData.type      = GL_UNSIGNED_SHORT;
+    mData.drawcount = kDrawCount;
+    for (GLsizei drawID = 0; drawID < kDrawCount; ++drawID)
+    {{
+        mData.firsts.push_back(drawID * 3);
+        mData.counts.push_back(3);
+        mData.indices.push_back(reinterpret_cast<const GLvoid *>(drawID * 3 * sizeof(GLushort)));
+        mData.instanceCounts.push_back(1);
+    }}
+
+    glViewport(0, 0, getWindow()->getWidth(), getWindow()->getHeight());
+
+    ASSERT_GL_NO_ERROR();
+}}
+
+void MultiDrawBenchmark::destroyBenchmark()
+{{
+    glDeleteProgram(mProgram);
+    glDeleteBuffers(1, &mBuffer);
+    glDeleteBuffers(1, &mIndexBuffer);
+}}
+
+void MultiDrawBenchmark::drawBenchmark()
+{{
+    const MultiDrawParams &params   = GetParam();
+    const MultiDrawCommand &command = kCommands[params.command];
+    for (unsigned int iteration = 0; iteration < params.iterationsPerStep; ++iteration)
+    {{
+        if (params.multi)
+        {{
+            command.multi(mData);
+        }}
+        else
+        {{
+            command.separate(mData);
+        }}
+    }}
+
+    ASSERT_GL_NO_ERROR();
+}}
+
+MultiDrawParams NullParams(size_t command, bool multi)
+{{
+    MultiDrawParams params;
+    params.command = command;
+    params.multi   = multi;
+    return params;
+}}
+}}  // anonymous namespace
+
+TEST_P(MultiDrawBenchmark, Run)
+{{
+    run();
+}}
+
+ANGLE_INSTANTIATE_TEST(MultiDrawBenchmark,
+{instances});
+
+}}  // namespace angle
+"""
+
+template_multi_draw_perf_functions = """void Separate{name}(const MultiDrawData &data)
+{{
+    for (GLsizei drawID = 0; drawID < data.drawcount; ++drawID)
+    {{
+        {single_cmd_name}({single_args});
+    }}
+}}
+
+void Batched{name}(const MultiDrawData &data)
+{{
+    {cmd_name}({args});
+}}
+"""
+
+template_packed_enum_caps_header = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// PackedEnumCaps_autogen.h:
+//   Tables of the packed GL enum values a context accepts, computed when its caps change.
+//   FromGLenum converts the unknown GLenums to InvalidEnum, which no table accepts, so a single
+//   lookup of the packed value validates both the GLenum and the client version and extensions
+//   it needs.
+
+#ifndef LIBANGLE_PACKED_ENUM_CAPS_AUTOGEN_H_
+#define LIBANGLE_PACKED_ENUM_CAPS_AUTOGEN_H_
 
-template_sources_includes = """#include "libGLESv2/entry_points_gles_{}_autogen.h"
+#include "common/PackedEnums.h"
+#include "common/angleutils.h"
+#include "libANGLE/ErrorStrings.h"
 
-#include "libANGLE/Context.h"
-#include "libANGLE/Context.inl.h"
-#include "libANGLE/validationES{}{}.h"
-#include "libGLESv2/entry_points_utils.h"
-#include "libGLESv2/global_state.h"
+namespace gl
+{{
+class Context;
+
+class PackedEnumCaps final : angle::NonCopyable
+{{
+  public:
+    PackedEnumCaps();
+    ~PackedEnumCaps();
+
+    void initialize(const Context *context);
+
+{accessors}
+
+  private:
+    // Reserve an extra slot at the end of these maps for invalid enum.
+{members}
+}};
+
+// The message of the GL_INVALID_ENUM error generated for a value the context doesn't accept.
+{errors}
+}}  // namespace gl
+
+#endif  // LIBANGLE_PACKED_ENUM_CAPS_AUTOGEN_H_
 """
 
-template_event_comment = """// Don't run an EVENT() macro on the EXT_debug_marker entry points.
-    // It can interfere with the debug events being set by the caller.
-    // """
+template_packed_enum_caps_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// PackedEnumCaps_autogen.cpp:
+//   Tables of the packed GL enum values a context accepts.
 
-template_validation_proto = "bool Validate%s(%s);"
+#include "libANGLE/PackedEnumCaps_autogen.h"
 
-template_windows_def_file = """; GENERATED FILE - DO NOT EDIT.
-; Generated by {script_name} using data from {data_source_name}.
-;
-; Copyright {year} The ANGLE Project Authors. All rights reserved.
-; Use of this source code is governed by a BSD-style license that can be
-; found in the LICENSE file.
-LIBRARY {lib}
-EXPORTS
-{exports}
+#include "libANGLE/validationES.h"
+
+namespace gl
+{{
+PackedEnumCaps::PackedEnumCaps()
+{{
+{fills}
+}}
+
+PackedEnumCaps::~PackedEnumCaps() = default;
+
+void PackedEnumCaps::initialize(const Context *context)
+{{
+{initializers}
+}}
+}}  // namespace gl
 """
 
+template_packed_enum_caps_initializer = """    for ({type} value : angle::AllEnums<{type}>())
+    {{
+        m{type}[value] = {predicate}(context, value);
+    }}"""
+
 def script_relative(path):
     return os.path.join(os.path.dirname(sys.argv[0]), path)
 
 with open(script_relative('entry_point_packed_gl_enums.json')) as f:
     cmd_packed_gl_enums = json.loads(f.read())
 
+# Maps the packed GL enums whose valid values depend on the context caps to their validation.
+with open(script_relative('entry_point_packed_gl_enum_caps.json')) as f:
+    packed_gl_enum_caps = json.loads(f.read())
+    del packed_gl_enum_caps["description"]
+
+# Maps the entry points that don't need the global lock to "context" or "share_group".
+with open(script_relative('entry_point_lock_classes.json')) as f:
+    lock_classes_json = json.loads(f.read())
+    cmd_lock_classes = {}
+    for lock_class in ["context", "share_group"]:
+        for cmd_name in lock_classes_json[lock_class]:
+            cmd_lock_classes[cmd_name] = lock_class
+
+# Maps the commands called by the overhead perf test to their arguments.
+with open(script_relative('entry_point_overhead_perf_calls.json')) as f:
+    overhead_perf_calls = json.loads(f.read())
+    del overhead_perf_calls["description"]
+
+# Maps the pointer parameters of the commands to the client memory they reference.
+with open(script_relative('entry_point_capture_params.json')) as f:
+    cmd_capture_params = json.loads(f.read())
+    del cmd_capture_params["description"]
+
+# Maps the OpenGL ES 2.0, 3.0 and 3.1 commands to how they run when the context defers its
+# commands. Filled by main() before the entry points are written.
+deferred_cmd_kinds = {}
+
 def format_entry_point_decl(cmd_name, proto, params, is_explicit_context):
     comma_if_needed = ", " if len(params) > 0 else ""
     return template_entry_point_decl.format(
@@ -340,58 +1421,255 @@ def default_return_value(cmd_name, return_type):
         return ""
     return "GetDefaultReturnValue<EntryPoint::" + cmd_name[2:] + ", " + return_type + ">()"
 
+# Lost contexts are handled by their dispatch table, so the entry points only read the cached
+# current context.
 def get_context_getter_function(cmd_name, is_explicit_context):
-    if cmd_name == "glGetError" or cmd_name == "glGetGraphicsResetStatusEXT":
-        return "GetGlobalContext()"
-    elif is_explicit_context:
+    if is_explicit_context:
         return "static_cast<gl::Context *>(ctx)"
     else:
-        return "GetValidGlobalContext()"
+        return "GetGlobalContext()"
 
 def format_entry_point_def(cmd_name, proto, params, is_explicit_context):
-    packed_gl_enums = cmd_packed_gl_enums.get(cmd_name, {})
-    internal_params = [just_the_name_packed(param, packed_gl_enums) for param in params]
-    packed_gl_enum_conversions = []
-    for param in params:
-        name = just_the_name(param)
-        if name in packed_gl_enums:
-            internal_name = name + "Packed"
-            internal_type = packed_gl_enums[name]
-            packed_gl_enum_conversions += ["\n        " + internal_type + " " + internal_name +" = FromGLenum<" +
-                                          internal_type + ">(" + name + ");"]
-
     pass_params = [param_print_argument(param) for param in params]
     format_params = [param_format_string(param) for param in params]
     return_type = proto[:-len(cmd_name)]
     default_return = default_return_value(cmd_name, return_type.strip())
     event_comment = template_event_comment if cmd_name in no_event_marker_exceptions_list else ""
-    name_lower_no_suffix = cmd_name[2:3].lower() + cmd_name[3:]
 
-    for suffix in strip_suffixes:
-        if name_lower_no_suffix.endswith(suffix):
-            name_lower_no_suffix = name_lower_no_suffix[0:-len(suffix)]
+    lock_class = cmd_lock_classes.get(cmd_name, "global")
 
     return template_entry_point_def.format(
         name = cmd_name[2:],
-        name_lower_no_suffix = name_lower_no_suffix,
         return_type = return_type,
         params = ", ".join(params),
-        internal_params = ", ".join(internal_params),
-        packed_gl_enum_conversions = "".join(packed_gl_enum_conversions),
         pass_params = ", ".join(pass_params),
+        binary_event_params = ", ".join([just_the_name(param) for param in params]),
         comma_if_needed = ", " if len(params) > 0 else "",
-        validate_params = ", ".join(["context"] + internal_params),
         format_params = ", ".join(format_params),
         return_if_needed = "" if default_return == "" else "return ",
         default_return_if_needed = "" if default_return == "" else "\n    return " + default_return + ";\n",
         context_getter = get_context_getter_function(cmd_name, is_explicit_context),
+        global_lock = "ANGLE_SCOPED_GLOBAL_LOCK();\n    " if lock_class == "global" else "",
+        share_group_lock = "\n        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);"
+            if lock_class == "share_group" else "",
         event_comment = event_comment,
         explicit_context_suffix = "ContextANGLE" if is_explicit_context else "",
         explicit_context_param = "GLeglContext ctx" if is_explicit_context else "",
         explicit_context_comma = ", " if is_explicit_context and len(params) > 0 else "",
-        assert_explicit_context = "\nASSERT(context == GetValidGlobalContext());"
+        assert_explicit_context = "\nASSERT(context == GetGlobalContext());"
             if is_explicit_context else "")
 
+# The commands that work on lost contexts.
+context_lost_cmd_names = ["glGetError", "glGetGraphicsResetStatusEXT"]
+
+def format_dispatch_defs(cmd_name, proto, params):
+    packed_gl_enums = cmd_packed_gl_enums.get(cmd_name, {})
+    internal_params = [just_the_name_packed(param, packed_gl_enums) for param in params]
+    packed_gl_enum_conversions = []
+    for param in params:
+        name = just_the_name(param)
+        if name in packed_gl_enums:
+            internal_name = name + "Packed"
+            internal_type = packed_gl_enums[name]
+            packed_gl_enum_conversions += ["\n    " + internal_type + " " + internal_name +
+                                           " = FromGLenum<" + internal_type + ">(" + name + ");"]
+
+    return_type = proto[:-len(cmd_name)]
+    default_return = default_return_value(cmd_name, return_type.strip())
+    format_args = {
+        "name": cmd_name[2:],
+        "name_lower_no_suffix": get_context_method_name(cmd_name),
+        "return_type": return_type,
+        "params": ", ".join(params),
+        "param_names": ", ".join([just_the_name(param) for param in params]),
+        "internal_params": ", ".join(internal_params),
+        "packed_gl_enum_conversions": "".join(packed_gl_enum_conversions),
+        "comma_if_needed": ", " if len(params) > 0 else "",
+        "validate_params": ", ".join(["context"] + internal_params),
+        "return_if_needed": "" if default_return == "" else "return ",
+        "default_return_if_needed": "" if default_return == "" else
+            "\n    return " + default_return + ";",
+        "deferred_commands": format_deferred_commands(cmd_name, params),
+    }
+    return (template_dispatch_validated_def.format(**format_args),
+            template_dispatch_no_error_def.format(**format_args),
+            template_dispatch_context_lost_def.format(**format_args))
+
+def write_dispatch_tables(all_commands, cmd_names):
+    members = []
+    defs = []
+    entries = []
+    for command in all_commands:
+        proto = command.find('proto')
+        cmd_name = proto.find('name').text
+        if cmd_name not in cmd_names:
+            continue
+
+        params = ["".join(param.itertext()) for param in command.findall('param')]
+        proto_text = "".join(proto.itertext())
+        name = cmd_name[2:]
+        members.append((cmd_name, template_dispatch_member.format(
+            return_type = proto_text[:-len(cmd_name)],
+            name = name,
+            comma_if_needed = ", " if len(params) > 0 else "",
+            params = ", ".join(params))))
+        defs.append((cmd_name, format_dispatch_defs(cmd_name, proto_text, params)))
+        entries.append((cmd_name, ("    Validated%s," % name, "    NoError%s," % name,
+            "    %s%s," % ("Validated" if cmd_name in context_lost_cmd_names else "ContextLost",
+                           name))))
+
+    members = [member for _, member in sorted(members)]
+    defs = [cmd_defs for _, cmd_defs in sorted(defs)]
+    entries = [cmd_entries for _, cmd_entries in sorted(entries)]
+
+    header = template_dispatch_header.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml and gl_angle_ext.xml",
+        year = date.today().year,
+        members = "\n".join(members))
+
+    source = template_dispatch_source.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml and gl_angle_ext.xml",
+        year = date.today().year,
+        validated_defs = "\n".join([cmd_defs[0] for cmd_defs in defs]),
+        no_error_defs = "\n".join([cmd_defs[1] for cmd_defs in defs]),
+        context_lost_defs = "\n".join([cmd_defs[2] for cmd_defs in defs]),
+        validated_entries = "\n".join([cmd_entries[0] for cmd_entries in entries]),
+        no_error_entries = "\n".join([cmd_entries[1] for cmd_entries in entries]),
+        context_lost_entries = "\n".join([cmd_entries[2] for cmd_entries in entries]))
+
+    test = template_dispatch_table_test_source.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml and gl_angle_ext.xml",
+        year = date.today().year,
+        expectations = "\n".join(["    EXPECT_NE(nullptr, table.%s);" % cmd_name[2:]
+                                   for cmd_name in sorted(cmd_names)]))
+
+    with open(path_to("libGLESv2", "entry_points_dispatch_autogen.h"), "w") as out:
+        out.write(header)
+        out.close()
+
+    with open(path_to("libGLESv2", "entry_points_dispatch_autogen.cpp"), "w") as out:
+        out.write(source)
+        out.close()
+
+    path = os.path.join(script_relative(".."), "src", "tests", "gl_tests",
+                        "DispatchTableTest_autogen.cpp")
+    with open(path, "w") as out:
+        out.write(test)
+        out.close()
+
+# The commands of GL_ANGLE_multi_draw, compared with the draw commands they batch by the multi-draw
+# perf test.
+multi_draw_cmd_names = [
+    "glMultiDrawArraysANGLE",
+    "glMultiDrawArraysInstancedANGLE",
+    "glMultiDrawElementsANGLE",
+    "glMultiDrawElementsInstancedANGLE",
+]
+
+def write_multi_draw_perf(all_commands):
+    commands = {}
+    for command in all_commands:
+        cmd_name = command.find('proto').find('name').text
+        commands[cmd_name] = command.findall('param')
+
+    draw_functions = []
+    entries = []
+    instances = []
+    for index, cmd_name in enumerate(multi_draw_cmd_names):
+        # glMultiDrawArraysANGLE batches glDrawArrays and so on.
+        single_cmd_name = "gl" + cmd_name[len("glMulti"):-len("ANGLE")]
+        params = commands[cmd_name]
+        arrays = [param.find('name').text for param in params if param.get('len')]
+        names = [param.find('name').text for param in params]
+
+        # The array parameters of the multi-draw commands are named after the parameter of the
+        # draw command with an s.
+        single_args = []
+        for param in commands[single_cmd_name]:
+            single_name = param.find('name').text.lower()
+            matches = [name for name in names if name.lower() in [single_name, single_name + "s"]]
+            assert len(matches) == 1, "%s has no parameter for %s" % (cmd_name, single_name)
+            if matches[0] in arrays:
+                single_args.append("data.%s[drawID]" % matches[0])
+            else:
+                single_args.append("data.%s" % matches[0])
+
+        args = ["data.%s.data()" % name if name in arrays else "data.%s" % name for name in names]
+
+        name = single_cmd_name[2:]
+        draw_functions.append(template_multi_draw_perf_functions.format(
+            name = name,
+            single_cmd_name = single_cmd_name,
+            single_args = ", ".join(single_args),
+            cmd_name = cmd_name,
+            args = ", ".join(args)))
+        entries.append("    {\"%s\", Separate%s, Batched%s}," % (
+            re.sub(r"([a-z])([A-Z])", r"\1_\2", name).lower(), name, name))
+        instances.extend(["NullParams(%d, false)" % index, "NullParams(%d, true)" % index])
+
+    content = template_multi_draw_perf_source.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml and gl_angle_ext.xml",
+        year = date.today().year,
+        draw_functions = "\n".join(draw_functions),
+        commands = "\n".join(entries),
+        instances = ",\n".join(["                       " + instance for instance in instances]))
+
+    path = os.path.join(script_relative(".."), "src", "tests", "perf_tests",
+                        "MultiDrawPerf_autogen.cpp")
+    with open(path, "w") as out:
+        out.write(content)
+        out.close()
+
+def write_packed_enum_caps():
+    packed_types = set()
+    for packed_gl_enums in cmd_packed_gl_enums.values():
+        packed_types.update(packed_gl_enums.values())
+
+    accessors = []
+    members = []
+    errors = []
+    fills = []
+    initializers = []
+    for packed_type in sorted(packed_gl_enum_caps.keys()):
+        assert packed_type in packed_types, "%s is not a packed type of the entry points" % packed_type
+        caps = packed_gl_enum_caps[packed_type]
+        accessors.append("    bool isValid(%s value) const { return m%s[value]; }" %
+                         (packed_type, packed_type))
+        members.append("    angle::PackedEnumMap<%s, bool, angle::EnumSize<%s>() + 1> m%s;" %
+                       (packed_type, packed_type, packed_type))
+        errors.append("constexpr const char *GetInvalidPackedEnumError(%s) { return err::%s; }" %
+                      (packed_type, caps["error"]))
+        fills.append("    m%s.fill(false);" % packed_type)
+        initializers.append(template_packed_enum_caps_initializer.format(
+            type = packed_type, predicate = caps["predicate"]))
+
+    header = template_packed_enum_caps_header.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "entry_point_packed_gl_enum_caps.json",
+        year = date.today().year,
+        accessors = "\n".join(accessors),
+        members = "\n".join(members),
+        errors = "\n".join(errors))
+
+    source = template_packed_enum_caps_source.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "entry_point_packed_gl_enum_caps.json",
+        year = date.today().year,
+        fills = "\n".join(fills),
+        initializers = "\n\n".join(initializers))
+
+    with open(path_to("libANGLE", "PackedEnumCaps_autogen.h"), "w") as out:
+        out.write(header)
+        out.close()
+
+    with open(path_to("libANGLE", "PackedEnumCaps_autogen.cpp"), "w") as out:
+        out.write(source)
+        out.close()
+
 def get_internal_params(cmd_name, params):
     packed_gl_enums = cmd_packed_gl_enums.get(cmd_name, {})
     return ", ".join([make_param(just_the_type_packed(param, packed_gl_enums),
@@ -430,6 +1708,383 @@ def format_validation_proto(cmd_name, params):
     internal_params = get_internal_params(cmd_name, ["Context *context"] + params)
     return template_validation_proto % (cmd_name[2:], internal_params)
 
+def binary_event_decode_param(param, index):
+    value = "event.params[%d]" % index
+    type_only = just_the_type(param).strip()
+    if "*" in param or type_only in reinterpret_cast_to_dict:
+        return "static_cast<uintptr_t>(%s)" % value
+    if type_only in static_cast_to_dict:
+        return "static_cast<%s>(%s)" % (static_cast_to_dict[type_only], value)
+    if type_only == "GLfloat":
+        return "DecodeFloat(%s)" % value
+    return "static_cast<%s>(%s)" % (type_only, value)
+
+def format_binary_event_decoder_case(cmd_name, params):
+    return template_binary_event_decoder_case.format(
+        name = cmd_name[2:],
+        param_count = len(params),
+        format_params = ", ".join([param_format_string(param) for param in params]),
+        comma_if_needed = ", " if len(params) > 0 else "",
+        decode_params = ", ".join([binary_event_decode_param(param, index)
+                                   for index, param in enumerate(params)]))
+
+def get_max_param_count(all_commands, cmd_names):
+    return max([len(command.findall('param')) for command in all_commands
+                if command.find('proto').find('name').text in cmd_names])
+
+def write_binary_event_decoder(all_commands, cmd_names):
+    cases = []
+    for command in all_commands:
+        cmd_name = command.find('proto').find('name').text
+        if cmd_name not in cmd_names:
+            continue
+
+        param_text = ["".join(param.itertext()) for param in command.findall('param')]
+        cases.append((cmd_name, format_binary_event_decoder_case(cmd_name, param_text)))
+
+    content = template_binary_event_decoder_source.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml and gl_angle_ext.xml",
+        year = date.today().year,
+        cases = "\n".join([case for _, case in sorted(cases)]))
+
+    path = path_to("libGLESv2", "entry_points_binary_event_decoder_autogen.cpp")
+    with open(path, "w") as out:
+        out.write(content)
+        out.close()
+
+def format_lock_stress_test_call(cmd_name, params):
+    args = []
+    for param in params:
+        param_type = just_the_type(param)
+        if "*" in param_type:
+            args.append("reinterpret_cast<%s>(scratch.data())" % param_type.strip())
+        else:
+            args.append("0")
+    return template_lock_stress_test_call.format(name = cmd_name, args = ", ".join(args))
+
+def write_lock_stress_test(all_commands, gles_commands):
+    calls = {"context": [], "share_group": []}
+    for command in all_commands:
+        proto = command.find('proto')
+        cmd_name = proto.find('name').text
+
+        if cmd_name not in gles_commands or cmd_name not in cmd_lock_classes:
+            continue
+
+        param_text = ["".join(param.itertext()) for param in command.findall('param')]
+        calls[cmd_lock_classes[cmd_name]].append((cmd_name, format_lock_stress_test_call(cmd_name, param_text)))
+
+    content = template_lock_stress_test_source.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml and entry_point_lock_classes.json",
+        year = date.today().year,
+        context_calls = "\n".join([call for _, call in sorted(calls["context"])]),
+        share_group_calls = "\n".join([call for _, call in sorted(calls["share_group"])]))
+
+    path = os.path.join(script_relative(".."), "src", "tests", "gl_tests",
+                        "EntryPointLockStressTest_autogen.cpp")
+    with open(path, "w") as out:
+        out.write(content)
+        out.close()
+
+def write_overhead_perf(all_commands, gles_commands):
+    loops = []
+    entry_points = []
+    for command in all_commands:
+        cmd_name = command.find('proto').find('name').text
+        if cmd_name not in overhead_perf_calls:
+            continue
+
+        params = command.findall('param')
+        args = overhead_perf_calls[cmd_name]
+        if cmd_name not in gles_commands or len(args) != len(params):
+            raise Exception(cmd_name + " in entry_point_overhead_perf_calls.json is not an " +
+                            "OpenGL ES 2.0 or 3.0 command with " + str(len(args)) + " parameters")
+
+        loops.append((cmd_name, template_overhead_perf_loop.format(
+            name = cmd_name[2:], cmd_name = cmd_name, args = ", ".join(args))))
+        entry_points.append((cmd_name, "    {\"%s\", Loop%s}," % (cmd_name, cmd_name[2:])))
+
+    content = template_overhead_perf_source.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml and entry_point_overhead_perf_calls.json",
+        year = date.today().year,
+        loops = "\n".join([loop for _, loop in sorted(loops)]),
+        entry_points = "\n".join([entry_point for _, entry_point in sorted(entry_points)]))
+
+    path = os.path.join(script_relative(".."), "src", "tests", "perf_tests",
+                        "EntryPointOverheadPerf_autogen.cpp")
+    with open(path, "w") as out:
+        out.write(content)
+        out.close()
+
+def format_capture_blob(cmd_name, param_names, param_name, size):
+    if param_name not in param_names:
+        raise Exception(param_name + " in entry_point_capture_params.json is not a parameter of " +
+                        cmd_name)
+    index = param_names.index(param_name)
+    if size is None:
+        return ""
+    if isinstance(size, dict):
+        return "\n    call.addStrings(%d, %s, %s, %s);" % (index, param_name, size["strings"],
+                                                       size.get("lengths") or "nullptr")
+    return "\n    call.addBlob(%d, %s, static_cast<size_t>(%s));" % (index, param_name, size)
+
+def format_capture_proto(cmd_name, params):
+    return template_capture_proto.format(
+        name = cmd_name[2:],
+        comma_if_needed = ", " if len(params) > 0 else "",
+        params = ", ".join(params))
+
+def format_capture_def(cmd_name, params):
+    param_names = [just_the_name(param) for param in params]
+    capture_params = cmd_capture_params.get(cmd_name, {})
+    return template_capture_def.format(
+        proto = format_capture_proto(cmd_name, params),
+        name = cmd_name[2:],
+        add_params = "".join(["\n    call.addParam(%s);" % name for name in param_names]),
+        add_blobs = "".join([format_capture_blob(cmd_name, param_names, name, size)
+                             for name, size in sorted(capture_params.items())]))
+
+def write_capture(all_commands, cmd_names):
+    protos = []
+    captures = []
+    for command in all_commands:
+        cmd_name = command.find('proto').find('name').text
+        if cmd_name not in cmd_names:
+            continue
+
+        param_text = ["".join(param.itertext()) for param in command.findall('param')]
+        protos.append((cmd_name, format_capture_proto(cmd_name, param_text) + ";"))
+        captures.append((cmd_name, format_capture_def(cmd_name, param_text)))
+
+    header = template_capture_header.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml, gl_angle_ext.xml and entry_point_capture_params.json",
+        year = date.today().year,
+        protos = "\n".join([proto for _, proto in sorted(protos)]))
+
+    source = template_capture_source.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml, gl_angle_ext.xml and entry_point_capture_params.json",
+        year = date.today().year,
+        captures = "\n".join([capture for _, capture in sorted(captures)]))
+
+    with open(path_to("libGLESv2", "entry_points_capture_autogen.h"), "w") as out:
+        out.write(header)
+        out.close()
+
+    with open(path_to("libGLESv2", "entry_points_capture_autogen.cpp"), "w") as out:
+        out.write(source)
+        out.close()
+
+# The replay doesn't support sync objects, debug callbacks and EGL images.
+capture_replay_unsupported_types = ["GLsync", "GLDEBUGPROC", "GLeglImageOES"]
+
+def capture_replay_arg(cmd_name, param, index):
+    param_name = just_the_name(param)
+    param_type = just_the_type(param).strip()
+    capture_params = cmd_capture_params.get(cmd_name, {})
+    if param_name in capture_params:
+        if capture_params[param_name] is None:
+            return "nullptr"
+        if isinstance(capture_params[param_name], dict):
+            return "GetStringsParam(call, %d, state)" % index
+    if "*" in param_type:
+        if param_type.startswith("const"):
+            return "static_cast<%s>(GetPointerParam(call, %d))" % (param_type, index)
+        return "static_cast<%s>(GetScratchParam(state))" % param_type
+    if param_type == "GLfloat":
+        return "GetFloatParam(call, %d)" % index
+    return "static_cast<%s>(call.params[%d])" % (param_type, index)
+
+def write_capture_replay(all_commands, cmd_names):
+    cases = []
+    for command in all_commands:
+        proto = command.find('proto')
+        cmd_name = proto.find('name').text
+        if cmd_name not in cmd_names:
+            continue
+
+        param_text = ["".join(param.itertext()) for param in command.findall('param')]
+        signature = "".join(proto.itertext()) + " " + " ".join(param_text)
+        if any([unsupported in signature for unsupported in capture_replay_unsupported_types]):
+            continue
+
+        args = [capture_replay_arg(cmd_name, param, index) for index, param in enumerate(param_text)]
+        cases.append((cmd_name, template_capture_replay_case.format(
+            name = cmd_name[2:], cmd_name = cmd_name, args = ", ".join(args))))
+
+    content = template_capture_replay_source.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml and entry_point_capture_params.json",
+        year = date.today().year,
+        cases = "\n".join([case for _, case in sorted(cases)]))
+
+    path = os.path.join(script_relative(".."), "samples", "capture_replay",
+                        "capture_replay_autogen.cpp")
+    with open(path, "w") as out:
+        out.write(content)
+        out.close()
+
+# The pointer parameters that have to be copied to record the command.
+def get_deferred_copies(cmd_name, params):
+    copies = {}
+    for param in params:
+        param_type = just_the_type(param).strip()
+        if "*" not in param_type:
+            continue
+        param_name = just_the_name(param)
+        capture_params = cmd_capture_params.get(cmd_name, {})
+        copies[param_name] = capture_params.get(param_name, "")
+    return copies
+
+def get_deferred_kind(cmd_name, proto_text, params):
+    # The commands that return data or wait for the GPU.
+    if proto_text[:-len(cmd_name)].strip() != "void" or cmd_name == "glFinish":
+        return "sync"
+    # The pointer of a client vertex array is read by the draws.
+    if cmd_name in ["glVertexAttribPointer", "glVertexAttribIPointer"]:
+        return "client_array"
+    if "GLeglImageOES" in " ".join(params):
+        return "sync"
+    # Only the client memory of known size can be copied. Sizes that depend on the context state,
+    # like the ones of the pixels of the texture uploads, can't be computed when recording.
+    for param in params:
+        if "*" in just_the_type(param) and not param.startswith("const"):
+            return "sync"
+    for size in get_deferred_copies(cmd_name, params).values():
+        if size == "" or (not isinstance(size, dict) and size is not None and
+                          ("context" in size or "GetCapture" in size)):
+            return "sync"
+    if cmd_name.startswith("glDraw") and cmd_name != "glDrawBuffers":
+        return "defer_draw"
+    return "defer"
+
+def format_deferred_commands(cmd_name, params):
+    kind = deferred_cmd_kinds.get(cmd_name, "sync")
+    # The entry points of the context lock class hold no lock, so they take the global mutex to
+    # execute the deferred commands like the worker thread does.
+    unlocked = "_UNLOCKED" if cmd_lock_classes.get(cmd_name, "global") == "context" else ""
+    if kind == "sync":
+        return "\n        ANGLE_SYNC_DEFERRED_COMMANDS%s(context);" % unlocked
+    if kind == "client_array":
+        return "\n        ANGLE_SYNC_DEFERRED_COMMANDS_FOR_CLIENT_ARRAY%s(context, pointer);" % unlocked
+    return "\n        ANGLE_DEFER_COMMAND(%s, context%s);" % (
+        cmd_name[2:], "".join([", " + just_the_name(param) for param in params]))
+
+def get_context_method_name(cmd_name):
+    name_lower_no_suffix = cmd_name[2:3].lower() + cmd_name[3:]
+    for suffix in strip_suffixes:
+        if name_lower_no_suffix.endswith(suffix):
+            name_lower_no_suffix = name_lower_no_suffix[0:-len(suffix)]
+    return name_lower_no_suffix
+
+def format_deferred_set_param(cmd_name, param, copies, packed_gl_enums):
+    name = just_the_name(param)
+    if name in packed_gl_enums:
+        return "\n    command->%s = FromGLenum<%s>(%s);" % (name, packed_gl_enums[name], name)
+    if name not in copies:
+        return "\n    command->%s = %s;" % (name, name)
+    size = copies[name]
+    if size is None:
+        return "\n    command->%s = nullptr;" % name
+    if isinstance(size, dict):
+        return "\n    command->%s = commandBuffer->copyStrings(%s, %s, %s);" % (
+            name, name, size["strings"], size.get("lengths") or "nullptr")
+    return "\n    command->%s = static_cast<%s>(commandBuffer->copyBlob(%s, static_cast<size_t>(%s)));" % (
+        name, just_the_type(param).strip(), name, size)
+
+# The sizes and counts of the copied memory are checked before the copy. The commands with
+# negative ones run synchronously and fail their validation.
+def get_deferred_sync_conditions(cmd_name, params, copies):
+    expressions = []
+    for size in copies.values():
+        if isinstance(size, dict):
+            expressions.append(size["strings"])
+        elif size is not None:
+            expressions.append(size)
+
+    conditions = []
+    for param in params:
+        name = just_the_name(param)
+        if just_the_type(param).strip() not in ["GLint", "GLsizei", "GLintptr", "GLsizeiptr"]:
+            continue
+        if any([re.search(r"\b%s\b" % name, expression) for expression in expressions]):
+            conditions.append(" || %s < 0" % name)
+    if deferred_cmd_kinds[cmd_name] == "defer_draw":
+        conditions.append(" || stream->usesClientVertexArrays()")
+    return "".join(conditions)
+
+def write_deferred(all_commands):
+    structs = []
+    cases = []
+    protos = []
+    defers = []
+    for command in all_commands:
+        cmd_name = command.find('proto').find('name').text
+        if deferred_cmd_kinds.get(cmd_name) not in ["defer", "defer_draw"]:
+            continue
+
+        params = ["".join(param.itertext()) for param in command.findall('param')]
+        packed_gl_enums = cmd_packed_gl_enums.get(cmd_name, {})
+        copies = get_deferred_copies(cmd_name, params)
+        members = [make_param(just_the_type_packed(param, packed_gl_enums), just_the_name(param))
+                   for param in params]
+        param_names = ["params->" + just_the_name(param) for param in params]
+        name = cmd_name[2:]
+
+        structs.append((cmd_name, template_deferred_params_struct.format(
+            name = name,
+            members = "\n".join(["    %s;" % member for member in members]))))
+
+        cases.append((cmd_name, template_deferred_case.format(
+            name = name,
+            get_params = "\nconst Deferred%sParams *params = " % name +
+                "DeferredCommandBuffer::GetParams<Deferred%sParams>(header);" % name
+                if len(params) > 0 else "",
+            validate_params = ", ".join(["context"] + param_names),
+            name_lower_no_suffix = get_context_method_name(cmd_name),
+            internal_params = ", ".join(param_names))))
+
+        proto = template_deferred_proto.format(
+            name = name,
+            comma_if_needed = ", " if len(params) > 0 else "",
+            params = ", ".join(params))
+        protos.append((cmd_name, proto + ";"))
+
+        defers.append((cmd_name, template_deferred_def.format(
+            proto = proto,
+            name = name,
+            sync_conditions = get_deferred_sync_conditions(cmd_name, params, copies),
+            record_command = "Deferred%sParams *command = " % name if len(params) > 0 else "",
+            set_params = "".join([format_deferred_set_param(cmd_name, param, copies,
+                                                            packed_gl_enums)
+                                  for param in params]))))
+
+    header = template_deferred_header.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml and entry_point_capture_params.json",
+        year = date.today().year,
+        protos = "\n".join([proto for _, proto in sorted(protos)]))
+
+    source = template_deferred_source.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml and entry_point_capture_params.json",
+        year = date.today().year,
+        structs = "\n".join([struct for _, struct in sorted(structs)]),
+        cases = "\n".join([case for _, case in sorted(cases)]),
+        defers = "\n".join([defer for _, defer in sorted(defers)]))
+
+    with open(path_to("libGLESv2", "entry_points_deferred_autogen.h"), "w") as out:
+        out.write(header)
+        out.close()
+
+    with open(path_to("libGLESv2", "entry_points_deferred_autogen.cpp"), "w") as out:
+        out.write(source)
+        out.close()
+
 def path_to(folder, file):
     return os.path.join(script_relative(".."), "src", folder, file)
 
@@ -669,18 +2324,33 @@ def main():
         inputs = [
             'egl.xml',
             'egl_angle_ext.xml',
+            'entry_point_capture_params.json',
+            'entry_point_lock_classes.json',
+            'entry_point_overhead_perf_calls.json',
+            'entry_point_packed_gl_enum_caps.json',
             'entry_point_packed_gl_enums.json',
             'gl.xml',
             'gl_angle_ext.xml',
             'registry_xml.py',
         ]
         outputs = [
+            '../samples/capture_replay/capture_replay_autogen.cpp',
             '../src/libANGLE/Context_gles_1_0_autogen.h',
+            '../src/libANGLE/PackedEnumCaps_autogen.cpp',
+            '../src/libANGLE/PackedEnumCaps_autogen.h',
             '../src/libANGLE/validationES1_autogen.h',
             '../src/libANGLE/validationES2_autogen.h',
             '../src/libANGLE/validationES31_autogen.h',
             '../src/libANGLE/validationES3_autogen.h',
             '../src/libANGLE/validationESEXT_autogen.h',
+            '../src/libGLESv2/entry_points_binary_event_decoder_autogen.cpp',
+            '../src/libGLESv2/entry_points_capture_autogen.cpp',
+            '../src/libGLESv2/entry_points_capture_autogen.h',
+            '../src/libGLESv2/entry_points_deferred_autogen.cpp',
+            '../src/libGLESv2/entry_points_deferred_autogen.h',
+            '../src/libGLESv2/entry_points_dispatch_autogen.cpp',
+            '../src/libGLESv2/entry_points_dispatch_autogen.h',
+            '../src/libGLESv2/entry_points_enum_autogen.cpp',
             '../src/libGLESv2/entry_points_enum_autogen.h',
             '../src/libGLESv2/entry_points_gles_1_0_autogen.cpp',
             '../src/libGLESv2/entry_points_gles_1_0_autogen.h',
@@ -694,6 +2364,10 @@ def main():
             '../src/libGLESv2/entry_points_gles_ext_autogen.h',
             '../src/libGLESv2/libGLESv2_autogen.cpp',
             '../src/libGLESv2/libGLESv2_autogen.def',
+            '../src/tests/gl_tests/DispatchTableTest_autogen.cpp',
+            '../src/tests/gl_tests/EntryPointLockStressTest_autogen.cpp',
+            '../src/tests/perf_tests/EntryPointOverheadPerf_autogen.cpp',
+            '../src/tests/perf_tests/MultiDrawPerf_autogen.cpp',
         ]
 
         if sys.argv[1] == 'inputs':
@@ -733,6 +2407,15 @@ def main():
         gles_commands = xml.commands[annotation]
         all_commands = xml.all_commands
 
+        if not is_gles1:
+            for command in all_commands:
+                proto = command.find('proto')
+                cmd_name = proto.find('name').text
+                if cmd_name in gles_commands:
+                    param_text = ["".join(param.itertext()) for param in command.findall('param')]
+                    deferred_cmd_kinds[cmd_name] = get_deferred_kind(
+                        cmd_name, "".join(proto.itertext()), param_text)
+
         decls, defs, libgles_defs, validation_protos = get_entry_points(
             all_commands, gles_commands, False)
 
@@ -753,8 +2436,7 @@ def main():
         if major_version == 3 and minor_version == 1:
             header_includes += "\n#include \"common/platform.h\"\n"
 
-        source_includes = template_sources_includes.format(
-            annotation.lower(), major_version, minor_if_not_zero)
+        source_includes = template_sources_includes.format(annotation.lower())
 
         write_file(annotation, comment, template_entry_point_header,
                    "\n".join(decls), "h", header_includes, "gl.xml")
@@ -866,13 +2548,7 @@ def main():
     #include <GLES2/gl2ext.h>
     """
 
-    source_includes = template_sources_includes.format("ext", "EXT", "")
-    source_includes += """
-    #include "libANGLE/validationES1.h"
-    #include "libANGLE/validationES2.h"
-    #include "libANGLE/validationES3.h"
-    #include "libANGLE/validationES31.h"
-    """
+    source_includes = template_sources_includes.format("ext")
 
     write_file("ext", "extension", template_entry_point_header,
                "\n".join([item for item in extension_decls]), "h", header_includes,
@@ -885,19 +2561,56 @@ def main():
 
     write_context_api_decls("1_0", context_gles_header, gles1decls)
 
+    for cmd_name in cmd_lock_classes:
+        if cmd_name not in xml.all_cmd_names.get_all_commands():
+            raise Exception(cmd_name + " in entry_point_lock_classes.json is not a GLES command")
+
+    es3_commands = xml.all_cmd_names.get_commands("2_0") + xml.all_cmd_names.get_commands("3_0")
+    write_lock_stress_test(xml.all_commands, es3_commands)
+    write_overhead_perf(xml.all_commands, es3_commands)
+
+    all_cmd_names = set(xml.all_cmd_names.get_all_commands())
+    write_binary_event_decoder(xml.all_commands, all_cmd_names)
+
+    for cmd_name in cmd_capture_params:
+        if cmd_name not in all_cmd_names:
+            raise Exception(cmd_name + " in entry_point_capture_params.json is not a GLES command")
+
+    write_capture(xml.all_commands, all_cmd_names)
+
+    es31_commands = es3_commands + xml.all_cmd_names.get_commands("3_1")
+    write_capture_replay(xml.all_commands, es31_commands)
+
+    write_deferred(xml.all_commands)
+    write_dispatch_tables(xml.all_commands, all_cmd_names)
+    write_packed_enum_caps()
+    write_multi_draw_perf(xml.all_commands)
+
     sorted_cmd_names = ["Invalid"] + [cmd[2:] for cmd in sorted(xml.all_cmd_names.get_all_commands())]
 
     entry_points_enum = template_entry_points_enum_header.format(
         script_name = os.path.basename(sys.argv[0]),
         data_source_name = "gl.xml and gl_angle_ext.xml",
         year = date.today().year,
-        entry_points_list = ",\n".join(["    " + cmd for cmd in sorted_cmd_names]))
+        max_param_count = get_max_param_count(xml.all_commands, all_cmd_names),
+        entry_points_list = ",\n".join(["    " + cmd for cmd in sorted_cmd_names + ["EnumCount"]]))
 
     entry_points_enum_header_path = path_to("libGLESv2", "entry_points_enum_autogen.h")
     with open(entry_points_enum_header_path, "w") as out:
         out.write(entry_points_enum)
         out.close()
 
+    entry_points_enum_source = template_entry_points_enum_source.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml and gl_angle_ext.xml",
+        year = date.today().year,
+        entry_point_names_list = "\n".join(["    \"%s\"," % cmd for cmd in sorted_cmd_names]))
+
+    entry_points_enum_source_path = path_to("libGLESv2", "entry_points_enum_autogen.cpp")
+    with open(entry_points_enum_source_path, "w") as out:
+        out.write(entry_points_enum_source)
+        out.close()
+
     source_includes = """
     #include "angle_gl.h"
 
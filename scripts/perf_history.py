@@ -0,0 +1,237 @@
+#!/usr/bin/python2
+#
+# Copyright 2019 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# perf_history.py:
+#   Local store of perf test results and regression detector. Results are
+#   appended as JSON lines keyed by test, backend, commit and host. The report
+#   command runs change-point detection over the history of every test to
+#   find the commit that introduced a slowdown or a speedup.
+#
+#   Usage: perf_history.py report [--history PATH] [--filter REGEX]
+#
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import re
+import sys
+
+base_path = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(base_path, 'src'))
+
+import commit_id
+
+default_history_path = os.path.join(os.path.expanduser('~'), '.angle_perf_history.jsonl')
+history_format_version = 1
+
+change_threshold_percent = 5.0
+min_segment_size = 2
+
+
+def median(data):
+    """Return the median of data."""
+    s = sorted(data)
+    n = len(s)
+    if n % 2 == 1:
+        return float(s[n // 2])
+    return (s[n // 2 - 1] + s[n // 2]) / 2.0
+
+
+def get_backend(test_name):
+    """Perf test names end with the backend parameter, e.g. Run/vulkan_null."""
+    if '/' in test_name:
+        return test_name.rsplit('/', 1)[1]
+    return ''
+
+
+def get_build_commit(binary_path):
+    """Returns the commit the binary was built from. The commit.h generated by
+    commit_id.py in the build directory is preferred; otherwise the current
+    checkout is used."""
+    commit_header = os.path.join(os.path.dirname(binary_path), 'gen', 'angle', 'id', 'commit.h')
+    if os.path.exists(commit_header):
+        with open(commit_header) as header_file:
+            m = re.search(r'ANGLE_COMMIT_HASH "([^"]*)"', header_file.read())
+            if m:
+                return m.group(1)
+
+    commit, _ = commit_id.get_commit_id(base_path)
+    if isinstance(commit, bytes):
+        commit = commit.decode()
+    return commit or 'invalid-hash'
+
+
+def make_record(test_name, metric, binary_path, steps, samples, statistics):
+    return {
+        'version': history_format_version,
+        'time': datetime.datetime.now().isoformat(),
+        'test': test_name,
+        'backend': get_backend(test_name),
+        'commit': get_build_commit(binary_path),
+        'host': platform.node(),
+        'metric': metric,
+        'steps': steps,
+        'samples': samples,
+        'median': statistics.get('median'),
+        'mad': statistics.get('mad'),
+    }
+
+
+def append_records(path, records):
+    """Append records to the history, one JSON object per line."""
+    with open(path, 'a') as history_file:
+        for record in records:
+            if record['median'] is None:
+                continue
+            history_file.write(json.dumps(record, sort_keys=True) + '\n')
+
+
+def load_records(path):
+    records = []
+    if not os.path.exists(path):
+        return records
+    with open(path) as history_file:
+        for line in history_file:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return records
+
+
+def group_series(records, test_filter=None):
+    """Group records by (test, host, metric) in the order they were added and
+    collapse consecutive runs of the same commit to one point."""
+    series = {}
+    for record in records:
+        if test_filter and not re.search(test_filter, record['test']):
+            continue
+        key = (record['test'], record['host'], record['metric'])
+        points = series.setdefault(key, [])
+        if points and points[-1]['commit'] == record['commit']:
+            points[-1]['medians'].append(record['median'])
+        else:
+            points.append({'commit': record['commit'], 'medians': [record['median']]})
+
+    for points in series.values():
+        for point in points:
+            point['value'] = median(point['medians'])
+    return series
+
+
+def segment_cost(values):
+    """Sum of absolute deviations from the median; robust to outliers."""
+    if not values:
+        return 0.0
+    m = median(values)
+    return sum(abs(x - m) for x in values)
+
+
+def noise_level(values):
+    """Robust estimate of the point-to-point noise of a series, from the
+    median absolute successive difference."""
+    if len(values) < 2:
+        return 0.0
+    differences = [abs(b - a) for a, b in zip(values, values[1:])]
+    return median(differences)
+
+
+def detect_change_points(values, threshold_percent=change_threshold_percent,
+                         min_segment=min_segment_size):
+    """Find the indices where the level of the series shifts using binary
+    segmentation. A split is kept when it reduces the L1 cost by more than a
+    penalty based on the noise of the series, and the medians on both sides
+    differ by at least threshold_percent."""
+    penalty = noise_level(values) * math.log(max(len(values), 2))
+    change_points = []
+
+    def split(start, end):
+        segment = values[start:end]
+        if len(segment) < 2 * min_segment:
+            return
+        total = segment_cost(segment)
+        best_index = None
+        best_cost = total
+        for index in range(min_segment, len(segment) - min_segment + 1):
+            cost = segment_cost(segment[:index]) + segment_cost(segment[index:])
+            if cost < best_cost:
+                best_cost = cost
+                best_index = index
+        if best_index is None or total - best_cost <= penalty:
+            return
+
+        before = median(segment[:best_index])
+        after = median(segment[best_index:])
+        if before and abs(after - before) / before * 100.0 >= threshold_percent:
+            change_points.append(start + best_index)
+        split(start, start + best_index)
+        split(start + best_index, end)
+
+    split(0, len(values))
+    return sorted(change_points)
+
+
+def report(args):
+    series = group_series(load_records(args.history), args.filter)
+    if not series:
+        print('No history found in ' + args.history)
+        return 0
+
+    regressions = 0
+    for (test, host, metric), points in sorted(series.items()):
+        values = [point['value'] for point in points]
+        change_points = detect_change_points(values, args.threshold, args.min_segment)
+        if not change_points:
+            continue
+
+        print('%s on %s (%s):' % (test, host, metric))
+        boundaries = [0] + change_points + [len(points)]
+        for index, change in enumerate(change_points):
+            before = median(values[boundaries[index]:change])
+            after = median(values[change:boundaries[index + 2]])
+            delta = (after - before) / before * 100.0
+            # All perf test metrics are costs, so an increase is a slowdown.
+            kind = 'slowdown' if delta > 0 else 'speedup'
+            if delta > 0:
+                regressions += 1
+            print('  %s of %+.2f%% (%.2f -> %.2f) introduced between %s and %s' %
+                  (kind, delta, before, after, points[change - 1]['commit'],
+                   points[change]['commit']))
+
+    if regressions == 0:
+        print('No slowdowns found.')
+    return 0
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Query the local perf test history.')
+    parser.add_argument('command', choices=['report'], help='Command to run')
+    parser.add_argument('--history', default=default_history_path, help='Path of the history')
+    parser.add_argument('--filter', help='Only report tests matching this regular expression')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=change_threshold_percent,
+        help='Minimum change in percent to report')
+    parser.add_argument(
+        '--min-segment',
+        type=int,
+        default=min_segment_size,
+        help='Minimum number of commits on each side of a change')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == 'report':
+        return report(args)
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,28 +6,80 @@
 #
 # perf_test_runner.py:
 #   Helper script for running and analyzing perftest results. Runs the
-#   tests in an infinite batch, printing out the mean and coefficient of
-#   variation of the population continuously.
+#   tests in a batch, printing out robust statistics of the population
+#   continuously, and stops once the confidence interval of the median is
+#   tight enough. The raw samples and statistics are saved to a JSON file.
+#
+#   With --compare, two builds are run alternately and the relative change
+#   of the second build against the first is reported with a confidence
+#   interval and a significance test.
+#
+#   With --sweep, the test name is a gtest filter. Every matching test is
+#   calibrated once, with step counts cached next to the binary, and the
+#   tests are run round-robin before a summary table is printed.
+#
+#   On Linux the test process can be pinned to a set of CPUs and given a
+#   higher priority. With --cpus or --monitor-interference, CPU steal time is
+#   sampled around every experiment, as is the frequency of the pinned CPUs.
+#   Experiments run under interference are flagged or, with
+#   --discard-interfered, left out of the statistics.
+#
+#   With --perf-counters, every experiment runs under Linux `perf stat` and
+#   hardware counters normalized per step are saved next to the timings.
+#
+#   Results are also appended to the local history read by perf_history.py.
 #
 
+import argparse
+import datetime
+import distutils.spawn
 import glob
+import json
+import math
+import multiprocessing
+import platform
+import random
 import subprocess
 import sys
+import tempfile
 import os
 import re
 
+import perf_history
+
 base_path = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
 # Look for a [Rr]elease build.
 perftests_paths = glob.glob('out/*elease*')
 metric = 'wall_time'
 max_experiments = 10
+min_samples = 5
+target_ci_percent = 1.0
+confidence = 0.95
+bootstrap_resamples = 1000
+regression_threshold_percent = 2.0
+significance_level = 0.05
 
 binary_name = 'angle_perftests'
 if sys.platform == 'win32':
     binary_name += '.exe'
 
-scores = []
+results_format_version = 2
+
+steps_cache_name = 'perf_test_steps_cache.json'
+
+max_steal_percent = 2.0
+max_frequency_drop_percent = 10.0
+
+perf_events = ['instructions', 'cycles', 'cache-misses', 'branch-misses']
+
+# Set from the command line in main().
+collect_perf_counters = False
+pinned_cpus = None
+process_niceness = 0
+discard_interfered = False
+interference_monitor = None
+
 
 # Danke to http://stackoverflow.com/a/27758326
 def mean(data):
@@ -67,37 +119,252 @@ def truncated_cov(data, n):
     """Compute a truncated coefficient of variation, n is truncation size"""
     return coefficient_of_variation(truncated_list(data, n))
 
-# Find most recent binary
-newest_binary = None
-newest_mtime = None
+def median(data):
+    """Return the median of data."""
+    n = len(data)
+    if n < 1:
+        raise ValueError('median requires at least one data point')
+    s = sorted(data)
+    if n % 2 == 1:
+        return float(s[n // 2])
+    return (s[n // 2 - 1] + s[n // 2]) / 2.0
+
+def median_absolute_deviation(data):
+    """Return the median absolute deviation from the median of data."""
+    m = median(data)
+    return median([abs(x - m) for x in data])
 
-for path in perftests_paths:
-    binary_path = os.path.join(base_path, path, binary_name)
-    if os.path.exists(binary_path):
-        binary_mtime = os.path.getmtime(binary_path)
-        if (newest_binary is None) or (binary_mtime > newest_mtime):
-            newest_binary = binary_path
-            newest_mtime = binary_mtime
+def percentile(sorted_data, fraction):
+    """Return the linearly interpolated percentile of already sorted data."""
+    position = (len(sorted_data) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_data) - 1)
+    weight = position - lower
+    return sorted_data[lower] * (1.0 - weight) + sorted_data[upper] * weight
 
-perftests_path = newest_binary
+def bootstrap_confidence_interval(data, statistic=median, confidence=0.95, resamples=1000, seed=0):
+    """Compute a percentile bootstrap confidence interval of statistic."""
+    if len(data) < 2:
+        raise ValueError('bootstrap requires at least two data points')
+    rng = random.Random(seed)
+    n = len(data)
+    estimates = sorted(
+        statistic([data[rng.randrange(n)] for _ in range(n)]) for _ in range(resamples))
+    alpha = (1.0 - confidence) / 2.0
+    return percentile(estimates, alpha), percentile(estimates, 1.0 - alpha)
 
-if perftests_path == None or not os.path.exists(perftests_path):
-    print('Cannot find Release %s!' % binary_name)
-    sys.exit(1)
+def mann_whitney_u(a, b):
+    """Two-sided Mann-Whitney U test using the normal approximation with tie
+    correction. Returns the U statistic of a and the p-value."""
+    n1 = len(a)
+    n2 = len(b)
+    if n1 < 1 or n2 < 1:
+        raise ValueError('mann_whitney_u requires data in both samples')
 
-if sys.platform == 'win32':
-    test_name = 'DrawCallPerfBenchmark.Run/d3d11_null'
-else:
-    test_name = 'DrawCallPerfBenchmark.Run/gl'
+    combined = sorted([(x, 0) for x in a] + [(x, 1) for x in b])
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        # Tied values share the average of their ranks.
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2.0 + 1.0
+        ties = j - i + 1
+        tie_term += ties**3 - ties
+        i = j + 1
+
+    rank_sum_a = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum_a - n1 * (n1 + 1) / 2.0
+
+    n = n1 + n2
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0.0
+    if variance <= 0:
+        return u, 1.0
+    # Continuity correction.
+    z = (abs(u - n1 * n2 / 2.0) - 0.5) / math.sqrt(variance)
+    p = math.erfc(max(z, 0.0) / math.sqrt(2.0))
+    return u, min(p, 1.0)
+
+def relative_delta(a, b):
+    """Relative change of the median of b against the median of a, in percent."""
+    baseline = median(a)
+    if baseline == 0:
+        return 0.0
+    return (median(b) - baseline) / baseline * 100.0
+
+def bootstrap_delta_confidence_interval(a, b, confidence=0.95, resamples=1000, seed=0):
+    """Compute a percentile bootstrap confidence interval of relative_delta."""
+    if len(a) < 2 or len(b) < 2:
+        raise ValueError('bootstrap requires at least two data points in each sample')
+    rng = random.Random(seed)
+    estimates = []
+    for _ in range(resamples):
+        resampled_a = [a[rng.randrange(len(a))] for _ in range(len(a))]
+        resampled_b = [b[rng.randrange(len(b))] for _ in range(len(b))]
+        estimates.append(relative_delta(resampled_a, resampled_b))
+    estimates.sort()
+    alpha = (1.0 - confidence) / 2.0
+    return percentile(estimates, alpha), percentile(estimates, 1.0 - alpha)
+
+def compare_statistics(a, b):
+    """Return a dictionary describing the change from sample a to sample b."""
+    comparison = {'delta_percent': relative_delta(a, b)}
+    if len(a) > 1 and len(b) > 1:
+        low, high = bootstrap_delta_confidence_interval(a, b, confidence, bootstrap_resamples)
+        u, p = mann_whitney_u(a, b)
+        comparison['ci_confidence'] = confidence
+        comparison['ci_low_percent'] = low
+        comparison['ci_high_percent'] = high
+        comparison['ci_half_width_percent'] = (high - low) / 2.0
+        comparison['mann_whitney_u'] = u
+        comparison['p_value'] = p
+        comparison['significant'] = p < significance_level
+    return comparison
+
+def format_comparison(comparison):
+    line = "delta: %+.2f%%" % comparison['delta_percent']
+    if 'p_value' in comparison:
+        line += ", ci: [%+.2f%%, %+.2f%%]" % (comparison['ci_low_percent'],
+                                              comparison['ci_high_percent'])
+        line += ", p: %.4f" % comparison['p_value']
+        line += " (significant)" if comparison['significant'] else " (not significant)"
+    return line
+
+def is_regression(comparison, threshold_percent):
+    """Whether the change is a significant increase above the threshold. All
+    perf test metrics are costs, so higher is worse."""
+    return comparison.get('significant', False) and comparison['delta_percent'] > threshold_percent
+
+def truncation_size(data):
+    """Number of samples trimmed from each end for the truncated statistics."""
+    return len(data) >> 3
+
+def compute_statistics(data):
+    """Return a dictionary of summary statistics of data."""
+    stats = {'count': len(data)}
+    if len(data) < 1:
+        return stats
+
+    stats['mean'] = mean(data)
+    stats['median'] = median(data)
+    stats['mad'] = median_absolute_deviation(data)
+    stats['min'] = min(data)
+    stats['max'] = max(data)
+
+    if len(data) > 1:
+        stats['cov'] = coefficient_of_variation(data)
+        low, high = bootstrap_confidence_interval(data, median, confidence, bootstrap_resamples)
+        stats['ci_confidence'] = confidence
+        stats['ci_low'] = low
+        stats['ci_high'] = high
+        stats['ci_half_width_percent'] = (
+            (high - low) / 2.0 / stats['median'] * 100.0 if stats['median'] else 0.0)
+
+    n = truncation_size(data)
+    if n > 0:
+        stats['truncation'] = n
+        stats['truncated_mean'] = truncated_mean(data, n)
+        stats['truncated_cov'] = truncated_cov(data, n)
 
-if len(sys.argv) >= 2:
-    test_name = sys.argv[1]
+    return stats
 
-print('Using test executable: ' + perftests_path)
-print('Test name: ' + test_name)
+def format_statistics(metric, score, stats):
+    """Format the running statistics line printed after every sample."""
+    line = "%s: %.2f" % (metric, score)
+    if 'cov' in stats:
+        line += ", mean: %.2f" % stats['mean']
+        line += ", variation: %.2f%%" % (stats['cov'] * 100.0)
+        line += ", median: %.2f" % stats['median']
+        line += ", mad: %.2f" % stats['mad']
+        line += ", ci: [%.2f, %.2f] (+/-%.2f%%)" % (stats['ci_low'], stats['ci_high'],
+                                                    stats['ci_half_width_percent'])
+    if 'truncation' in stats:
+        line += ", truncated mean: %.2f" % stats['truncated_mean']
+        line += ", variation: %.2f%%" % (stats['truncated_cov'] * 100.0)
+    return line
 
-def get_results(metric, extra_args=[]):
-    process = subprocess.Popen([perftests_path, '--gtest_filter=' + test_name] + extra_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+def find_newest_binary():
+    """Find the most recently built perf test binary."""
+    newest_binary = None
+    newest_mtime = None
+
+    for path in perftests_paths:
+        binary_path = os.path.join(base_path, path, binary_name)
+        if os.path.exists(binary_path):
+            binary_mtime = os.path.getmtime(binary_path)
+            if (newest_binary is None) or (binary_mtime > newest_mtime):
+                newest_binary = binary_path
+                newest_mtime = binary_mtime
+
+    return newest_binary
+
+def find_binary_in(build_dir):
+    """Find the perf test binary in a build directory."""
+    binary_path = os.path.join(os.path.abspath(build_dir), binary_name)
+    if not os.path.exists(binary_path):
+        return None
+    return binary_path
+
+def describe_binary(binary_path):
+    return {
+        'path': binary_path,
+        'mtime': os.path.getmtime(binary_path),
+    }
+
+def get_host_info():
+    """Describe the machine the tests ran on."""
+    return {
+        'hostname': platform.node(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': multiprocessing.cpu_count(),
+        'python': platform.python_version(),
+    }
+
+def parse_cpu_list(spec):
+    """Parse a CPU list such as '2,3' or '0-3,6' into a sorted list."""
+    cpus = set()
+    for part in spec.split(','):
+        if '-' in part:
+            first, last = part.split('-')
+            cpus.update(range(int(first), int(last) + 1))
+        else:
+            cpus.add(int(part))
+    return sorted(cpus)
+
+def setup_test_process():
+    """Runs in the child before exec to apply the affinity and priority."""
+    if pinned_cpus and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, pinned_cpus)
+    if process_niceness:
+        try:
+            os.nice(process_niceness)
+        except OSError:
+            # Raising the priority needs privileges; run at normal priority.
+            pass
+
+def test_command(args):
+    """Wrap the test command line to apply the CPU affinity when the Python
+    version cannot set it directly."""
+    if pinned_cpus and not hasattr(os, 'sched_setaffinity'):
+        return ['taskset', '-c', ','.join(str(cpu) for cpu in pinned_cpus)] + args
+    return args
+
+def get_results(perftests_path, test_name, metric, extra_args=[], command_prefix=[]):
+    preexec_fn = None
+    if sys.platform.startswith('linux') and (pinned_cpus or process_niceness):
+        preexec_fn = setup_test_process
+    process = subprocess.Popen(
+        command_prefix +
+        test_command([perftests_path, '--gtest_filter=' + test_name] + extra_args),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        preexec_fn=preexec_fn)
     output, err = process.communicate()
 
     m = re.search(r'Running (\d+) tests', output)
@@ -108,32 +375,679 @@ def get_results(metric, extra_args=[]):
 
     pattern = metric + r'= ([0-9.]+)'
     m = re.findall(pattern, output)
-    if m is None:
+    if not m:
         print("Did not find the metric '%s' in the test output:" % metric)
         print(output)
         sys.exit(1)
 
     return [float(value) for value in m]
 
-# Calibrate the number of steps
-steps = get_results("steps", ["--calibration"])[0]
-print("running with %d steps." % steps)
+def list_tests(perftests_path, test_filter):
+    """List the tests matching a gtest filter."""
+    process = subprocess.Popen(
+        [perftests_path, '--gtest_list_tests', '--gtest_filter=' + test_filter],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True)
+    output, err = process.communicate()
+
+    tests = []
+    suite = None
+    for line in output.splitlines():
+        # Parameterized tests are followed by a comment with the parameter.
+        line = line.split('#')[0].rstrip()
+        if not line:
+            continue
+        if not line[0].isspace():
+            suite = line.strip() if line.endswith('.') else None
+        elif suite:
+            tests.append(suite + line.strip())
+    return tests
+
+def load_steps_cache(perftests_path):
+    """Load the calibrated step counts cached for this build of the binary."""
+    cache_path = os.path.join(os.path.dirname(perftests_path), steps_cache_name)
+    mtime = os.path.getmtime(perftests_path)
+    try:
+        with open(cache_path) as cache_file:
+            cache = json.load(cache_file)
+    except (IOError, ValueError):
+        cache = {}
+    if cache.get('binary_mtime') != mtime:
+        cache = {'binary_mtime': mtime, 'steps': {}}
+    return cache
+
+def save_steps_cache(perftests_path, cache):
+    cache_path = os.path.join(os.path.dirname(perftests_path), steps_cache_name)
+    with open(cache_path, 'w') as cache_file:
+        json.dump(cache, cache_file, indent=2, sort_keys=True)
+
+def get_steps(perftests_path, test_name, cache=None):
+    """Calibrate the number of steps of a test, reusing cached counts."""
+    if cache is not None and test_name in cache['steps']:
+        return cache['steps'][test_name]
+    steps = get_results(perftests_path, test_name, "steps", ["--calibration"])[0]
+    if cache is not None:
+        cache['steps'][test_name] = steps
+        save_steps_cache(perftests_path, cache)
+    return steps
+
+def read_proc_stat():
+    """Read the per-CPU time counters from /proc/stat."""
+    times = {}
+    try:
+        with open('/proc/stat') as stat_file:
+            for line in stat_file:
+                fields = line.split()
+                if fields and fields[0].startswith('cpu') and fields[0] != 'cpu':
+                    times[int(fields[0][3:])] = [int(value) for value in fields[1:]]
+    except IOError:
+        pass
+    return times
+
+def read_cpu_frequencies():
+    """Read the current frequency of each CPU in MHz."""
+    frequencies = {}
+    cpu_dirs = glob.glob('/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_cur_freq')
+    for path in cpu_dirs:
+        cpu = int(re.search(r'cpu(\d+)/cpufreq', path).group(1))
+        try:
+            with open(path) as freq_file:
+                frequencies[cpu] = int(freq_file.read()) / 1000.0
+        except (IOError, ValueError):
+            pass
+    if frequencies:
+        return frequencies
+
+    # Fall back to /proc/cpuinfo where cpufreq is not exposed, e.g. in VMs.
+    try:
+        with open('/proc/cpuinfo') as cpuinfo_file:
+            cpu = None
+            for line in cpuinfo_file:
+                if line.startswith('processor'):
+                    cpu = int(line.split(':')[1])
+                elif line.startswith('cpu MHz') and cpu is not None:
+                    frequencies[cpu] = float(line.split(':')[1])
+    except IOError:
+        pass
+    return frequencies
+
+class InterferenceMonitor:
+    """Samples CPU steal time and frequency around experiments and decides
+    whether an experiment ran under interference. The frequency is only
+    checked on pinned CPUs: idle CPUs clock down and would flag every
+    experiment."""
+
+    def __init__(self, cpus, max_steal, max_frequency_drop):
+        self.cpus = cpus
+        self.max_steal = max_steal
+        self.max_frequency_drop = max_frequency_drop
+        self.reference_frequency = None
+        self.stat_before = None
+        self.frequencies_before = None
+
+    def monitored_cpus(self, sample):
+        return [cpu for cpu in (self.cpus or sorted(sample)) if cpu in sample]
+
+    def begin(self):
+        self.stat_before = read_proc_stat()
+        self.frequencies_before = read_cpu_frequencies()
+
+    def end(self):
+        stat_after = read_proc_stat()
+        frequencies_after = read_cpu_frequencies()
+        environment = {'interfered': False, 'reasons': []}
+
+        # The eighth field of a cpu line is the time stolen by the hypervisor.
+        total = 0
+        steal = 0
+        for cpu in self.monitored_cpus(stat_after):
+            if cpu not in self.stat_before:
+                continue
+            deltas = [after - before for after, before in zip(stat_after[cpu],
+                                                               self.stat_before[cpu])]
+            total += sum(deltas[0:8])
+            steal += deltas[7] if len(deltas) > 7 else 0
+        if total > 0:
+            environment['steal_percent'] = steal * 100.0 / total
+            if environment['steal_percent'] > self.max_steal:
+                environment['reasons'].append('steal %.2f%%' % environment['steal_percent'])
+
+        samples = []
+        if self.cpus:
+            for frequencies in [self.frequencies_before, frequencies_after]:
+                samples += [frequencies[cpu] for cpu in self.monitored_cpus(frequencies)]
+        if samples:
+            environment['frequency_mhz_min'] = min(samples)
+            environment['frequency_mhz_mean'] = mean(samples)
+            self.reference_frequency = max(self.reference_frequency or 0, max(samples))
+            drop = (1.0 - min(samples) / self.reference_frequency) * 100.0
+            if drop > self.max_frequency_drop:
+                environment['reasons'].append('frequency %.2f%% below peak' % drop)
+
+        environment['interfered'] = len(environment['reasons']) > 0
+        return environment
+
+def describe_test_environment():
+    return {
+        'cpus': pinned_cpus,
+        'niceness': process_niceness,
+        'discard_interfered': discard_interfered,
+        'perf_counters': collect_perf_counters,
+    }
+
+def perf_stat_command(output_path):
+    return ['perf', 'stat', '-x', ',', '-e', ','.join(perf_events), '-o', output_path, '--']
+
+def parse_perf_stat_output(path):
+    """Parse the CSV output of perf stat into a dictionary of event counts.
+    Events the hardware cannot count are left out."""
+    counts = {}
+    with open(path) as perf_file:
+        for line in perf_file:
+            fields = line.strip().split(',')
+            if len(fields) < 3 or line.startswith('#'):
+                continue
+            # Events can carry modifiers such as 'cycles:u'.
+            event = fields[2].split(':')[0]
+            try:
+                counts[event] = int(float(fields[0]))
+            except ValueError:
+                # '<not supported>' or '<not counted>'
+                pass
+    return counts
+
+def normalize_counters(counts, step_count):
+    """Divide the counts of the whole test process by the number of steps it
+    ran. This includes startup and teardown, which is amortized over the
+    calibrated step count."""
+    counters = {}
+    if step_count <= 0:
+        return counters
+    for event, count in counts.items():
+        counters[event + '_per_step'] = float(count) / step_count
+    if counts.get('cycles'):
+        if 'instructions' in counts:
+            counters['ipc'] = float(counts['instructions']) / counts['cycles']
+    return counters
+
+def format_counters(counters):
+    line = ', '.join('%s: %.1f' % (event, counters[event + '_per_step'])
+                     for event in perf_events
+                     if event + '_per_step' in counters)
+    if 'ipc' in counters:
+        line += ', ipc: %.2f' % counters['ipc']
+    return line
+
+def counter_statistics(experiments):
+    """Summarize the normalized counters of a list of experiments."""
+    values = {}
+    for experiment in experiments:
+        for name, value in experiment.get('counters', {}).items():
+            values.setdefault(name, []).append(value)
+    return dict((name, compute_statistics(data)) for name, data in values.items())
+
+def compare_counters(baseline_experiments, candidate_experiments):
+    """Relative change of the median of every counter, in percent."""
+    baseline = counter_statistics(baseline_experiments)
+    candidate = counter_statistics(candidate_experiments)
+    deltas = {}
+    for name in baseline:
+        if name in candidate and baseline[name]['median']:
+            deltas[name] = (candidate[name]['median'] - baseline[name]['median']) / \
+                baseline[name]['median'] * 100.0
+    return deltas
+
+def run_experiment(perftests_path, test_name, metric, steps):
+    """Run one experiment. Returns the record of the experiment and the scores
+    to add to the statistics."""
+    command_prefix = []
+    if collect_perf_counters:
+        perf_fd, perf_output_path = tempfile.mkstemp(suffix='.csv', prefix='perf_stat_')
+        os.close(perf_fd)
+        command_prefix = perf_stat_command(perf_output_path)
+
+    if interference_monitor:
+        interference_monitor.begin()
+    scores = get_results(perftests_path, test_name, metric, ["--steps", str(steps)],
+                         command_prefix)
+    experiment = {'scores': scores}
+
+    if collect_perf_counters:
+        # Every score is one trial of the calibrated number of steps.
+        experiment['counters'] = normalize_counters(
+            parse_perf_stat_output(perf_output_path), steps * len(scores))
+        os.remove(perf_output_path)
+        print(format_counters(experiment['counters']))
+
+    if interference_monitor:
+        experiment['environment'] = interference_monitor.end()
+        if experiment['environment']['interfered']:
+            reasons = ', '.join(experiment['environment']['reasons'])
+            if discard_interfered:
+                print('Discarding experiment run under interference: ' + reasons)
+                return experiment, []
+            print('Warning: experiment ran under interference: ' + reasons)
+
+    return experiment, scores
+
+def ci_converged(stats, target_percent):
+    """Whether the confidence interval is tight enough to stop sampling."""
+    if target_percent <= 0 or stats['count'] < min_samples:
+        return False
+    return stats['ci_half_width_percent'] <= target_percent
+
+def run_experiments(perftests_path, test_name, metric, steps, max_experiments, target_percent):
+    """Run the test until the CI converges or max_experiments is reached."""
+    scores = []
+    experiments = []
+    stats = compute_statistics(scores)
+
+    for experiment in range(max_experiments):
+        experiment_record, experiment_scores = run_experiment(perftests_path, test_name, metric,
+                                                              steps)
+        experiments.append(experiment_record)
+
+        for score in experiment_scores:
+            scores.append(score)
+            stats = compute_statistics(scores)
+            print(format_statistics(metric, score, stats))
+
+        if ci_converged(stats, target_percent):
+            print("Confidence interval within %.2f%% after %d experiments, stopping." %
+                  (target_percent, experiment + 1))
+            return scores, experiments, stats, True
+
+    return scores, experiments, stats, False
+
+def comparison_converged(comparison, target_percent, sample_count):
+    """Whether the CI of the delta is tight enough to stop sampling."""
+    if target_percent <= 0 or sample_count < min_samples or 'ci_half_width_percent' not in comparison:
+        return False
+    return comparison['ci_half_width_percent'] <= target_percent
+
+def run_comparison(binaries, test_name, metric, steps, max_experiments, target_percent):
+    """Run the test alternately on the baseline and the candidate binaries so
+    slow drift such as thermal throttling affects both equally."""
+    scores = [[], []]
+    experiments = [[], []]
+    comparison = {}
+
+    for experiment in range(max_experiments):
+        for index, binary in enumerate(binaries):
+            experiment_record, experiment_scores = run_experiment(binary, test_name, metric, steps)
+            experiments[index].append(experiment_record)
+            scores[index].extend(experiment_scores)
+            print("%s %s: %s" % ('AB'[index], metric,
+                                 ', '.join('%.2f' % score for score in experiment_scores)))
+
+        if not scores[0] or not scores[1]:
+            continue
+        comparison = compare_statistics(scores[0], scores[1])
+        print(format_comparison(comparison))
+
+        if comparison_converged(comparison, target_percent, min(len(scores[0]), len(scores[1]))):
+            print("Delta confidence interval within %.2f%% after %d experiments, stopping." %
+                  (target_percent, experiment + 1))
+            return scores, experiments, comparison, True
+
+    return scores, experiments, comparison, False
+
+def run_compare_mode(args, start_time):
+    binaries = []
+    for build_dir in args.compare:
+        binary = find_binary_in(build_dir)
+        if binary is None:
+            print('Cannot find %s in %s!' % (binary_name, build_dir))
+            return 1
+        binaries.append(binary)
+
+    print('Baseline (A): ' + binaries[0])
+    print('Candidate (B): ' + binaries[1])
+    print('Test name: ' + args.test_name)
+
+    # Both builds run the same amount of work so the samples are comparable.
+    steps = get_results(binaries[0], args.test_name, "steps", ["--calibration"])[0]
+    print("running with %d steps." % steps)
+
+    scores, experiments, comparison, converged = run_comparison(
+        binaries, args.test_name, args.metric, steps, args.max_experiments, args.target_ci)
+
+    regression = is_regression(comparison, args.regression_threshold)
+    results = {
+        'version': results_format_version,
+        'test': args.test_name,
+        'metric': args.metric,
+        'steps': steps,
+        'start_time': start_time.isoformat(),
+        'end_time': datetime.datetime.now().isoformat(),
+        'host': get_host_info(),
+        'test_environment': describe_test_environment(),
+        'target_ci_percent': args.target_ci,
+        'converged': converged,
+        'builds': [],
+        'comparison': comparison,
+        'regression_threshold_percent': args.regression_threshold,
+        'regression': regression,
+    }
+    for index, binary in enumerate(binaries):
+        results['builds'].append({
+            'binary': describe_binary(binary),
+            'samples': scores[index],
+            'experiments': experiments[index],
+            'statistics': compute_statistics(scores[index]),
+        })
+        if collect_perf_counters:
+            results['builds'][index]['counter_statistics'] = counter_statistics(
+                experiments[index])
+    if collect_perf_counters:
+        comparison['counter_delta_percent'] = compare_counters(experiments[0], experiments[1])
+        for name, delta in sorted(comparison['counter_delta_percent'].items()):
+            print('%s delta: %+.2f%%' % (name, delta))
+    write_results(args.output or default_output_path(args.test_name, start_time), results)
+    record_history(args, [
+        perf_history.make_record(args.test_name, args.metric, binary, steps, build['samples'],
+                                 build['statistics'])
+        for binary, build in zip(binaries, results['builds'])
+    ])
+
+    print(format_comparison(comparison))
+    if regression:
+        print('Regression of %.2f%% exceeds the %.2f%% threshold.' %
+              (comparison['delta_percent'], args.regression_threshold))
+        return 2
+    return 0
+
+def run_sweep(perftests_path, tests, metric, steps, max_experiments, target_percent):
+    """Run each test once per round until it converges or max_experiments is
+    reached."""
+    results = {}
+    for test in tests:
+        results[test] = {
+            'steps': steps[test],
+            'samples': [],
+            'experiments': [],
+            'statistics': compute_statistics([]),
+            'converged': False,
+        }
+
+    for experiment in range(max_experiments):
+        pending = [test for test in tests if not results[test]['converged']]
+        if not pending:
+            break
+
+        for test in pending:
+            result = results[test]
+            experiment_record, experiment_scores = run_experiment(perftests_path, test, metric,
+                                                                  steps[test])
+            result['experiments'].append(experiment_record)
+            if not experiment_scores:
+                continue
+            result['samples'].extend(experiment_scores)
+            result['statistics'] = compute_statistics(result['samples'])
+            print("%s %s" % (test, format_statistics(metric, experiment_scores[-1],
+                                                      result['statistics'])))
+
+            if ci_converged(result['statistics'], target_percent):
+                print("%s converged after %d experiments." % (test, experiment + 1))
+                result['converged'] = True
+
+    return results
+
+def format_summary_table(metric, results):
+    """Format a table comparing the medians of the swept tests."""
+    medians = [
+        result['statistics']['median'] for result in results.values()
+        if 'median' in result['statistics']
+    ]
+    fastest = min(medians) if medians else None
+    header = ['test', 'steps', 'samples', 'median ' + metric, 'mad', 'ci +/-%', 'variation %',
+              'vs fastest']
+    rows = []
+    for test in sorted(results, key=lambda test: results[test]['statistics'].get('median', 0)):
+        result = results[test]
+        stats = result['statistics']
+        if 'median' not in stats:
+            rows.append([test, '%d' % result['steps'], '0', '-', '-', '-', '-', '-'])
+            continue
+        rows.append([
+            test,
+            '%d' % result['steps'],
+            '%d' % stats['count'],
+            '%.2f' % stats['median'],
+            '%.2f' % stats['mad'],
+            '%.2f' % stats['ci_half_width_percent'] if 'ci_half_width_percent' in stats else '-',
+            '%.2f' % (stats['cov'] * 100.0) if 'cov' in stats else '-',
+            '%.2fx' % (stats['median'] / fastest) if fastest else '-',
+        ])
+
+    widths = [max(len(row[column]) for row in [header] + rows) for column in range(len(header))]
+    lines = []
+    for row in [header] + rows:
+        lines.append('  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+    lines.insert(1, '  '.join('-' * width for width in widths))
+    return '\n'.join(lines)
+
+def run_sweep_mode(args, start_time):
+    perftests_path = find_newest_binary()
+
+    if perftests_path == None or not os.path.exists(perftests_path):
+        print('Cannot find Release %s!' % binary_name)
+        return 1
+
+    print('Using test executable: ' + perftests_path)
+
+    tests = list_tests(perftests_path, args.test_name)
+    if not tests:
+        print("No tests match the filter '%s'." % args.test_name)
+        return 1
+    print('Sweeping %d tests: %s' % (len(tests), ', '.join(tests)))
+
+    cache = None if args.recalibrate else load_steps_cache(perftests_path)
+    steps = {}
+    for test in tests:
+        steps[test] = get_steps(perftests_path, test, cache)
+        print("%s: running with %d steps." % (test, steps[test]))
+
+    test_results = run_sweep(perftests_path, tests, args.metric, steps, args.max_experiments,
+                             args.target_ci)
+    if collect_perf_counters:
+        for result in test_results.values():
+            result['counter_statistics'] = counter_statistics(result['experiments'])
+
+    print('')
+    print(format_summary_table(args.metric, test_results))
+
+    results = {
+        'version': results_format_version,
+        'filter': args.test_name,
+        'metric': args.metric,
+        'start_time': start_time.isoformat(),
+        'end_time': datetime.datetime.now().isoformat(),
+        'binary': describe_binary(perftests_path),
+        'host': get_host_info(),
+        'test_environment': describe_test_environment(),
+        'target_ci_percent': args.target_ci,
+        'tests': test_results,
+    }
+    write_results(args.output or default_output_path(args.test_name, start_time), results)
+    record_history(args, [
+        perf_history.make_record(test, args.metric, perftests_path, result['steps'],
+                                 result['samples'], result['statistics'])
+        for test, result in sorted(test_results.items())
+    ])
+    return 0
+
+def default_output_path(test_name, start_time):
+    safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', test_name)
+    return 'perf_results_%s_%s.json' % (safe_name, start_time.strftime('%Y%m%d_%H%M%S'))
+
+def write_results(path, results):
+    with open(path, 'w') as out_file:
+        json.dump(results, out_file, indent=2, sort_keys=True)
+    print('Results written to ' + path)
+
+def record_history(args, records):
+    if args.no_history:
+        return
+    perf_history.append_records(args.history, records)
+    print('History appended to ' + args.history)
+
+def parse_args():
+    if sys.platform == 'win32':
+        default_test_name = 'DrawCallPerfBenchmark.Run/d3d11_null'
+    else:
+        default_test_name = 'DrawCallPerfBenchmark.Run/gl'
+
+    parser = argparse.ArgumentParser(description='Run an ANGLE perf test and analyze results.')
+    parser.add_argument('test_name', nargs='?', default=default_test_name, help='Test to run')
+    parser.add_argument('--metric', default=metric, help='Metric to collect')
+    parser.add_argument(
+        '--max-experiments',
+        type=int,
+        default=max_experiments,
+        help='Maximum number of test runs')
+    parser.add_argument(
+        '--target-ci',
+        type=float,
+        default=target_ci_percent,
+        help='Stop once the CI half-width of the median is under this percentage of the median. '
+        '0 runs all experiments')
+    parser.add_argument('--output', help='Path of the JSON results file')
+    parser.add_argument(
+        '--compare',
+        nargs=2,
+        metavar=('BASELINE_DIR', 'CANDIDATE_DIR'),
+        help='Compare the perf tests of two build directories')
+    parser.add_argument(
+        '--regression-threshold',
+        type=float,
+        default=regression_threshold_percent,
+        help='With --compare, exit with status 2 if the candidate is significantly slower than '
+        'the baseline by more than this percentage')
+    parser.add_argument(
+        '--sweep',
+        action='store_true',
+        help='Treat the test name as a gtest filter and run every matching test round-robin')
+    parser.add_argument(
+        '--recalibrate',
+        action='store_true',
+        help='Ignore the cached step counts and calibrate every test again')
+    parser.add_argument(
+        '--cpus', type=parse_cpu_list, help='Pin the test process to a CPU list, e.g. 2,3 or 2-3')
+    parser.add_argument(
+        '--nice',
+        type=int,
+        default=0,
+        help='Niceness increment of the test process; negative values raise its priority')
+    parser.add_argument(
+        '--max-steal',
+        type=float,
+        default=max_steal_percent,
+        help='Flag experiments with more CPU steal time than this percentage')
+    parser.add_argument(
+        '--max-frequency-drop',
+        type=float,
+        default=max_frequency_drop_percent,
+        help='Flag experiments where the CPU frequency drops more than this percentage below '
+        'the highest frequency seen')
+    parser.add_argument(
+        '--monitor-interference',
+        action='store_true',
+        help='Check every experiment for CPU steal time, and for frequency drops of the CPUs '
+        'given with --cpus. Implied by --cpus')
+    parser.add_argument(
+        '--discard-interfered',
+        action='store_true',
+        help='Leave experiments run under interference out of the statistics. Implies '
+        '--monitor-interference')
+    parser.add_argument(
+        '--perf-counters',
+        action='store_true',
+        help='Run every experiment under Linux perf stat and record %s per step' %
+        ', '.join(perf_events))
+    parser.add_argument(
+        '--history',
+        default=perf_history.default_history_path,
+        help='Path of the local perf history, see perf_history.py')
+    parser.add_argument(
+        '--no-history', action='store_true', help='Do not append the results to the history')
+    return parser.parse_args()
+
+def configure_test_environment(args):
+    global collect_perf_counters, pinned_cpus, process_niceness, discard_interfered
+    global interference_monitor
+
+    if args.perf_counters and distutils.spawn.find_executable('perf') is None:
+        print('Cannot find perf, which is needed for --perf-counters.')
+        return False
+    collect_perf_counters = args.perf_counters
+
+    if (args.cpus or args.nice) and not sys.platform.startswith('linux'):
+        print('Warning: --cpus and --nice are only supported on Linux.')
+    pinned_cpus = args.cpus
+    process_niceness = args.nice
+    discard_interfered = args.discard_interfered
+    monitor = args.cpus or args.monitor_interference or args.discard_interfered
+    if monitor and not sys.platform.startswith('linux'):
+        print('Warning: interference monitoring is only supported on Linux.')
+    elif monitor:
+        interference_monitor = InterferenceMonitor(args.cpus, args.max_steal,
+                                                   args.max_frequency_drop)
+    return True
+
+def main():
+    args = parse_args()
+    start_time = datetime.datetime.now()
+    if not configure_test_environment(args):
+        return 1
+
+    if args.compare:
+        return run_compare_mode(args, start_time)
+
+    if args.sweep:
+        return run_sweep_mode(args, start_time)
+
+    perftests_path = find_newest_binary()
+
+    if perftests_path == None or not os.path.exists(perftests_path):
+        print('Cannot find Release %s!' % binary_name)
+        return 1
 
-# Loop 'max_experiments' times, running the tests.
-for experiment in range(max_experiments):
-    experiment_scores = get_results(metric, ["--steps", str(steps)])
+    print('Using test executable: ' + perftests_path)
+    print('Test name: ' + args.test_name)
 
-    for score in experiment_scores:
-        sys.stdout.write("%s: %.2f" % (metric, score))
-        scores.append(score)
+    # Calibrate the number of steps
+    cache = None if args.recalibrate else load_steps_cache(perftests_path)
+    steps = get_steps(perftests_path, args.test_name, cache)
+    print("running with %d steps." % steps)
 
-        if (len(scores) > 1):
-            sys.stdout.write(", mean: %.2f" % mean(scores))
-            sys.stdout.write(", variation: %.2f%%" % (coefficient_of_variation(scores) * 100.0))
+    scores, experiments, stats, converged = run_experiments(
+        perftests_path, args.test_name, args.metric, steps, args.max_experiments, args.target_ci)
 
-        if (len(scores) > 7):
-            truncation_n = len(scores) >> 3
-            sys.stdout.write(", truncated mean: %.2f" % truncated_mean(scores, truncation_n))
-            sys.stdout.write(", variation: %.2f%%" % (truncated_cov(scores, truncation_n) * 100.0))
+    results = {
+        'version': results_format_version,
+        'test': args.test_name,
+        'metric': args.metric,
+        'steps': steps,
+        'start_time': start_time.isoformat(),
+        'end_time': datetime.datetime.now().isoformat(),
+        'binary': describe_binary(perftests_path),
+        'host': get_host_info(),
+        'test_environment': describe_test_environment(),
+        'target_ci_percent': args.target_ci,
+        'converged': converged,
+        'samples': scores,
+        'experiments': experiments,
+        'statistics': stats,
+    }
+    if collect_perf_counters:
+        results['counter_statistics'] = counter_statistics(experiments)
+    write_results(args.output or default_output_path(args.test_name, start_time), results)
+    record_history(args, [
+        perf_history.make_record(args.test_name, args.metric, perftests_path, steps, scores, stats)
+    ])
+    return 0
 
-        print("")
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,6 +8,11 @@
 
 #include "common/mathutil.h"
 
+#if defined(__ARM_NEON) && defined(__aarch64__)
+#    include <arm_neon.h>
+#    define ANGLE_USE_NEON_FLOAT16
+#endif
+
 namespace gl
 {
 
@@ -292,9 +297,138 @@ const static unsigned g_offset[64] = {
     0x00000400, 0x00000400, 0x00000400, 0x00000400, 0x00000400, 0x00000400, 0x00000400, 0x00000400,
 };
 
+const static unsigned g_base[256] = {
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00800000, 0x01000000, 0x01800000, 0x02000000, 0x02800000, 0x03000000,
+    0x03800000, 0x04000000, 0x04800000, 0x05000000, 0x05800000, 0x06000000, 0x06800000, 0x07000000,
+    0x07800000, 0x08000000, 0x08800000, 0x09000000, 0x09800000, 0x0a000000, 0x0a800000, 0x0b000000,
+    0x0b800000, 0x0c000000, 0x0c800000, 0x0d000000, 0x0d800000, 0x0e000000, 0x0e800000, 0x0f000000,
+    0x0f800000, 0x10000000, 0x10800000, 0x11000000, 0x11800000, 0x12000000, 0x12800000, 0x13000000,
+    0x13800000, 0x14000000, 0x14800000, 0x15000000, 0x15800000, 0x16000000, 0x16800000, 0x17000000,
+    0x17800000, 0x18000000, 0x18800000, 0x19000000, 0x19800000, 0x1a000000, 0x1a800000, 0x1b000000,
+    0x1b800000, 0x1c000000, 0x1c800000, 0x1d000000, 0x1d800000, 0x1e000000, 0x1e800000, 0x1f000000,
+    0x1f800000, 0x20000000, 0x20800000, 0x21000000, 0x21800000, 0x22000000, 0x22800000, 0x23000000,
+    0x23800000, 0x24000000, 0x24800000, 0x25000000, 0x25800000, 0x26000000, 0x26800000, 0x27000000,
+    0x27800000, 0x28000000, 0x28800000, 0x29000000, 0x29800000, 0x2a000000, 0x2a800000, 0x2b000000,
+    0x2b800000, 0x2c000000, 0x2c800000, 0x2d000000, 0x2d800000, 0x2e000000, 0x2e800000, 0x2f000000,
+    0x2f800000, 0x30000000, 0x30800000, 0x31000000, 0x31800000, 0x32000000, 0x32800000, 0x33000000,
+    0x33800000, 0x34000000, 0x34800000, 0x35000000, 0x35800000, 0x36000000, 0x36800000, 0x37000000,
+    0x37800000, 0x38000000, 0x38800000, 0x39000000, 0x39800000, 0x3a000000, 0x3a800000, 0x3b000000,
+    0x3b800000, 0x3c000000, 0x3c800000, 0x3d000000, 0x3d800000, 0x3e000000, 0x3e800000, 0x3f000000,
+    0x3f800000, 0x40000000, 0x40800000, 0x41000000, 0x41800000, 0x42000000, 0x42800000, 0x43000000,
+    0x43800000, 0x44000000, 0x44800000, 0x45000000, 0x45800000, 0x46000000, 0x46800000, 0x47000000,
+};
+
+const static unsigned char g_shift[256] = {
+    24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+    24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+    24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+    24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 23, 22, 21, 20, 19, 18,
+    17, 16, 15, 14, 13, 12, 11, 10, 9,  8,  7,  6,  5,  4,  3,  2,  1,  0,  0,  0,  0,  0,  0,  0,
+    0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+};
+
 float float16ToFloat32(unsigned short h)
 {
     unsigned i32 = g_mantissa[g_offset[h >> 10] + (h & 0x3ff)] + g_exponent[h >> 10];
     return bitCast<float>(i32);
 }
+
+namespace
+{
+unsigned short float32ToFloat16Table(float fp32)
+{
+    unsigned int fp32i    = bitCast<unsigned int>(fp32);
+    unsigned int sign     = (fp32i & 0x80000000) >> 16;
+    unsigned int exponent = (fp32i >> 23) & 0xFF;
+    unsigned int mantissa = (fp32i & 0x007FFFFF) | 0x00800000;
+
+    unsigned int bits = (mantissa >> g_shift[exponent]) + g_base[exponent];
+    bits              = (bits + 0x00000FFF + ((bits >> 13) & 1)) >> 13;
+    return static_cast<unsigned short>(sign | std::min(bits, 0x7FFFu));
+}
+
+#if defined(ANGLE_USE_SSE)
+#    if defined(__GNUC__) || defined(__clang__)
+#        define ANGLE_F16C_FUNCTION __attribute__((target("f16c")))
+#    else
+#        define ANGLE_F16C_FUNCTION
+#    endif
+
+ANGLE_F16C_FUNCTION size_t float16ToFloat32ArrayF16C(const unsigned short *input,
+                                                     float *output,
+                                                     size_t count)
+{
+    size_t index = 0;
+    for (; index + 4 <= count; index += 4)
+    {
+        __m128i halves = _mm_loadl_epi64(reinterpret_cast<const __m128i *>(input + index));
+        _mm_storeu_ps(output + index, _mm_cvtph_ps(halves));
+    }
+    return index;
+}
+
+#    undef ANGLE_F16C_FUNCTION
+#endif  // defined(ANGLE_USE_SSE)
+
+#if defined(ANGLE_USE_NEON_FLOAT16)
+size_t float16ToFloat32ArrayNEON(const unsigned short *input, float *output, size_t count)
+{
+    size_t index = 0;
+    for (; index + 4 <= count; index += 4)
+    {
+        float16x4_t halves = vreinterpret_f16_u16(vld1_u16(input + index));
+        vst1q_f32(output + index, vcvt_f32_f16(halves));
+    }
+    return index;
+}
+#endif  // defined(ANGLE_USE_NEON_FLOAT16)
+}  // anonymous namespace
+
+void float16ToFloat32Array(const unsigned short *input, float *output, size_t count)
+{
+    size_t index = 0;
+
+#if defined(ANGLE_USE_SSE)
+    if (supportsF16C())
+    {
+        index = float16ToFloat32ArrayF16C(input, output, count);
+    }
+#elif defined(ANGLE_USE_NEON_FLOAT16)
+    index = float16ToFloat32ArrayNEON(input, output, count);
+#endif
+
+    for (; index < count; ++index)
+    {
+        output[index] = float16ToFloat32(input[index]);
+    }
+}
+
+void float32ToFloat16Array(const float *input, unsigned short *output, size_t count)
+{
+    // The hardware conversions round overflowing values to infinity, which float32ToFloat16 does
+    // not, so this always uses the tables to keep results identical.
+    for (size_t index = 0; index < count; ++index)
+    {
+        output[index] = float32ToFloat16Table(input[index]);
+    }
+}
 }  // namespace gl
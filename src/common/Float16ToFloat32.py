@@ -3,12 +3,10 @@
 # found in the LICENSE file.
 #
 
-# This script generates a function that converts 16-bit precision floating
-# point numbers to 32-bit.
+# This script generates functions that convert between 16-bit and 32-bit
+# precision floating point numbers, as well as bulk array converters.
 # It is based on ftp://ftp.fox-toolkit.org/pub/fasthalffloatconversion.pdf.
 
-#include "common/mathutil.h"
-
 def convertMantissa(i):
     if i == 0:
         return 0
@@ -44,6 +42,22 @@ def convertOffset(i):
     else:
         return 1024
 
+# The float to half tables are indexed by the 8-bit exponent of the float. The
+# mantissa with its implicit bit is shifted right by g_shift and added to
+# g_base. The result is then rounded to nearest even and clamped the same way
+# float32ToFloat16 does, so both produce bit-identical results.
+def convertBase(e):
+    if e < 113:
+        return 0
+    else:
+        return (e - 113) << 23
+
+def convertShift(e):
+    if e < 113:
+        return min(113 - e, 24)
+    else:
+        return 0
+
 print """//
 // Copyright (c) 2012 The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
@@ -52,6 +66,13 @@ print """//
 
 // This file is automatically generated.
 
+#include "common/mathutil.h"
+
+#if defined(__ARM_NEON) && defined(__aarch64__)
+#    include <arm_neon.h>
+#    define ANGLE_USE_NEON_FLOAT16
+#endif
+
 namespace gl
 {
 """
@@ -71,10 +92,100 @@ for i in range(0, 64):
     print "    %#010x," % convertOffset(i)
 print "};\n"
 
+print "const static unsigned g_base[256] = {"
+for i in range(0, 256):
+    print "    %#010x," % convertBase(i)
+print "};\n"
+
+print "const static unsigned char g_shift[256] = {"
+for i in range(0, 256):
+    print "    %d," % convertShift(i)
+print "};\n"
+
 print """float float16ToFloat32(unsigned short h)
 {
     unsigned i32 = g_mantissa[g_offset[h >> 10] + (h & 0x3ff)] + g_exponent[h >> 10];
     return bitCast<float>(i32);
 }
+
+namespace
+{
+unsigned short float32ToFloat16Table(float fp32)
+{
+    unsigned int fp32i    = bitCast<unsigned int>(fp32);
+    unsigned int sign     = (fp32i & 0x80000000) >> 16;
+    unsigned int exponent = (fp32i >> 23) & 0xFF;
+    unsigned int mantissa = (fp32i & 0x007FFFFF) | 0x00800000;
+
+    unsigned int bits = (mantissa >> g_shift[exponent]) + g_base[exponent];
+    bits              = (bits + 0x00000FFF + ((bits >> 13) & 1)) >> 13;
+    return static_cast<unsigned short>(sign | std::min(bits, 0x7FFFu));
+}
+
+#if defined(ANGLE_USE_SSE)
+#    if defined(__GNUC__) || defined(__clang__)
+#        define ANGLE_F16C_FUNCTION __attribute__((target("f16c")))
+#    else
+#        define ANGLE_F16C_FUNCTION
+#    endif
+
+ANGLE_F16C_FUNCTION size_t float16ToFloat32ArrayF16C(const unsigned short *input,
+                                                     float *output,
+                                                     size_t count)
+{
+    size_t index = 0;
+    for (; index + 4 <= count; index += 4)
+    {
+        __m128i halves = _mm_loadl_epi64(reinterpret_cast<const __m128i *>(input + index));
+        _mm_storeu_ps(output + index, _mm_cvtph_ps(halves));
+    }
+    return index;
+}
+
+#    undef ANGLE_F16C_FUNCTION
+#endif  // defined(ANGLE_USE_SSE)
+
+#if defined(ANGLE_USE_NEON_FLOAT16)
+size_t float16ToFloat32ArrayNEON(const unsigned short *input, float *output, size_t count)
+{
+    size_t index = 0;
+    for (; index + 4 <= count; index += 4)
+    {
+        float16x4_t halves = vreinterpret_f16_u16(vld1_u16(input + index));
+        vst1q_f32(output + index, vcvt_f32_f16(halves));
+    }
+    return index;
+}
+#endif  // defined(ANGLE_USE_NEON_FLOAT16)
+}  // anonymous namespace
+
+void float16ToFloat32Array(const unsigned short *input, float *output, size_t count)
+{
+    size_t index = 0;
+
+#if defined(ANGLE_USE_SSE)
+    if (supportsF16C())
+    {
+        index = float16ToFloat32ArrayF16C(input, output, count);
+    }
+#elif defined(ANGLE_USE_NEON_FLOAT16)
+    index = float16ToFloat32ArrayNEON(input, output, count);
+#endif
+
+    for (; index < count; ++index)
+    {
+        output[index] = float16ToFloat32(input[index]);
+    }
+}
+
+void float32ToFloat16Array(const float *input, unsigned short *output, size_t count)
+{
+    // The hardware conversions round overflowing values to infinity, which float32ToFloat16 does
+    // not, so this always uses the tables to keep results identical.
+    for (size_t index = 0; index < count; ++index)
+    {
+        output[index] = float32ToFloat16Table(input[index]);
+    }
+}
 }
 """
@@ -172,6 +172,49 @@ inline bool supportsSSE2()
 #endif
 }
 
+// F16C is only usable when the OS also saves the AVX register state.
+inline bool supportsF16C()
+{
+#if defined(ANGLE_USE_SSE)
+    static bool checked  = false;
+    static bool supports = false;
+
+    if (checked)
+    {
+        return supports;
+    }
+
+#    if defined(ANGLE_PLATFORM_WINDOWS) && !defined(_M_ARM) && !defined(_M_ARM64)
+    {
+        int info[4];
+        __cpuid(info, 0);
+
+        if (info[0] >= 1)
+        {
+            __cpuid(info, 1);
+
+            bool f16c    = (info[2] >> 29) & 1;
+            bool avx     = (info[2] >> 28) & 1;
+            bool osxsave = (info[2] >> 27) & 1;
+            supports     = f16c && avx && osxsave && (_xgetbv(0) & 0x6) == 0x6;
+        }
+    }
+#    elif defined(__GNUC__)
+    {
+        unsigned int eax, ebx, ecx, edx;
+        if (__get_cpuid(1, &eax, &ebx, &ecx, &edx))
+        {
+            supports = ((ecx >> 29) & 1) && __builtin_cpu_supports("avx");
+        }
+    }
+#    endif
+    checked = true;
+    return supports;
+#else  // defined(ANGLE_USE_SSE)
+    return false;
+#endif
+}
+
 template <typename destType, typename sourceType>
 destType bitCast(const sourceType &source)
 {
@@ -216,6 +259,12 @@ inline unsigned short float32ToFloat16(float fp32)
 
 float float16ToFloat32(unsigned short h);
 
+// Bulk conversions between half and single precision floats. The results match calling
+// float16ToFloat32 and float32ToFloat16 on every element, except that float16ToFloat32Array may
+// return a quiet NaN where float16ToFloat32 preserves a signaling NaN.
+void float16ToFloat32Array(const unsigned short *input, float *output, size_t count);
+void float32ToFloat16Array(const float *input, unsigned short *output, size_t count);
+
 unsigned int convertRGBFloatsTo999E5(float red, float green, float blue);
 void convert999E5toRGBFloats(unsigned int input, float *red, float *green, float *blue);
 
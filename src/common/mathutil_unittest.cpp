@@ -11,6 +11,9 @@
 
 #include <gtest/gtest.h>
 
+#include <cmath>
+#include <vector>
+
 using namespace gl;
 
 namespace
@@ -348,4 +351,72 @@ TEST(MathUtilTest, RangeIteration)
     EXPECT_EQ(range.length(), expected);
 }
 
+// Test that the bulk half to float conversion matches float16ToFloat32 for every half value.
+TEST(MathUtilTest, Float16ToFloat32Array)
+{
+    std::vector<unsigned short> halves(0x10000);
+    for (size_t i = 0; i < halves.size(); ++i)
+    {
+        halves[i] = static_cast<unsigned short>(i);
+    }
+
+    // Use an odd count so the scalar tail is exercised after the vector path.
+    const size_t count = halves.size() - 1;
+    std::vector<float> floats(count);
+    float16ToFloat32Array(halves.data(), floats.data(), count);
+
+    for (size_t i = 0; i < count; ++i)
+    {
+        float expected = float16ToFloat32(halves[i]);
+        if (std::isnan(expected))
+        {
+            EXPECT_TRUE(std::isnan(floats[i])) << i;
+        }
+        else
+        {
+            EXPECT_EQ(bitCast<unsigned int>(expected), bitCast<unsigned int>(floats[i])) << i;
+        }
+    }
+}
+
+// Test that the bulk float to half conversion matches float32ToFloat16, including rounding,
+// denormals, overflow and NaN, and that every finite half value survives a round trip.
+TEST(MathUtilTest, Float32ToFloat16Array)
+{
+    std::vector<float> floats;
+    for (unsigned int half = 0; half < 0x10000; ++half)
+    {
+        unsigned int bits =
+            bitCast<unsigned int>(float16ToFloat32(static_cast<unsigned short>(half)));
+        floats.push_back(bitCast<float>(bits));
+        floats.push_back(bitCast<float>(bits + 0x0FFF));
+        floats.push_back(bitCast<float>(bits + 0x1000));
+        floats.push_back(bitCast<float>(bits + 0x1001));
+        floats.push_back(bitCast<float>(bits - 1));
+    }
+    floats.push_back(std::numeric_limits<float>::max());
+    floats.push_back(std::numeric_limits<float>::denorm_min());
+    floats.push_back(bitCast<float>(0x47FFEFFFu));
+    floats.push_back(bitCast<float>(0x47FFF000u));
+
+    std::vector<unsigned short> halves(floats.size());
+    float32ToFloat16Array(floats.data(), halves.data(), floats.size());
+
+    for (size_t i = 0; i < floats.size(); ++i)
+    {
+        EXPECT_EQ(float32ToFloat16(floats[i]), halves[i]) << i;
+    }
+
+    for (unsigned int half = 0; half < 0x10000; ++half)
+    {
+        float value = float16ToFloat32(static_cast<unsigned short>(half));
+        if (std::isfinite(value))
+        {
+            unsigned short roundTrip = 0;
+            float32ToFloat16Array(&value, &roundTrip, 1);
+            EXPECT_EQ(half, roundTrip);
+        }
+    }
+}
+
 }  // anonymous namespace
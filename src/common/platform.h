@@ -84,6 +84,7 @@
 #    include <intrin.h>
 #    define ANGLE_USE_SSE
 #elif defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#    include <cpuid.h>
 #    include <x86intrin.h>
 #    define ANGLE_USE_SSE
 #endif
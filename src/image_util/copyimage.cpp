@@ -8,6 +8,8 @@
 
 #include "image_util/copyimage.h"
 
+#include "common/mathutil.h"
+
 namespace angle
 {
 
@@ -19,4 +21,42 @@ void CopyBGRA8ToRGBA8(const uint8_t *source, uint8_t *dest)
                                           (argb & 0x000000FF) << 16;   // Move blue to red
 }
 
+void CopyRGBA8ToBGRA8(const uint8_t *source, uint8_t *dest)
+{
+    // Swapping red and blue is its own inverse.
+    CopyBGRA8ToRGBA8(source, dest);
+}
+
+void CopyRGBA8ToRGBA16F(const uint8_t *source, uint8_t *dest)
+{
+    uint16_t *dest16 = reinterpret_cast<uint16_t *>(dest);
+    for (size_t channel = 0; channel < 4; ++channel)
+    {
+        dest16[channel] = gl::float32ToFloat16(gl::normalizedToFloat(source[channel]));
+    }
+}
+
+void CopyRGB8ToRGBA8(const uint8_t *source, uint8_t *dest)
+{
+    dest[0] = source[0];
+    dest[1] = source[1];
+    dest[2] = source[2];
+    dest[3] = 0xFF;
+}
+
+void CopyRGB8ToBGRA8(const uint8_t *source, uint8_t *dest)
+{
+    dest[0] = source[2];
+    dest[1] = source[1];
+    dest[2] = source[0];
+    dest[3] = 0xFF;
+}
+
+void CopyD24S8ToD24X8(const uint8_t *source, uint8_t *dest)
+{
+    // Depth is stored in the low 24 bits of both formats. Clear the stencil bits.
+    uint32_t depthStencil               = *reinterpret_cast<const uint32_t *>(source);
+    *reinterpret_cast<uint32_t *>(dest) = depthStencil & 0x00FFFFFF;
+}
+
 }  // namespace angle
@@ -30,7 +30,14 @@ void ReadDepthStencil(const uint8_t *source, uint8_t *dest);
 template <typename DestType>
 void WriteDepthStencil(const uint8_t *source, uint8_t *dest);
 
+// Direct pixel copy functions used by the fast copy tables in Format_table_autogen.cpp. See
+// angle_format_fast_copy.json.
 void CopyBGRA8ToRGBA8(const uint8_t *source, uint8_t *dest);
+void CopyRGBA8ToBGRA8(const uint8_t *source, uint8_t *dest);
+void CopyRGBA8ToRGBA16F(const uint8_t *source, uint8_t *dest);
+void CopyRGB8ToRGBA8(const uint8_t *source, uint8_t *dest);
+void CopyRGB8ToBGRA8(const uint8_t *source, uint8_t *dest);
+void CopyD24S8ToD24X8(const uint8_t *source, uint8_t *dest);
 
 }  // namespace angle
 
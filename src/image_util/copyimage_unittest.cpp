@@ -0,0 +1,100 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// copyimage_unittest:
+//   Tests that the direct pixel copy functions match the generic read/write path.
+//
+
+#include "image_util/copyimage.h"
+
+#include <gtest/gtest.h>
+
+#include <array>
+#include <cstring>
+
+using namespace angle;
+
+namespace
+{
+
+const std::array<uint8_t, 4> kTestValues = {{0x00, 0x3F, 0x80, 0xFF}};
+
+// Runs every combination of kTestValues through both the direct copy function and the generic
+// ReadColor/WriteColor pair and compares the results.
+template <typename SourceType, typename DestType, size_t SourceBytes, size_t DestBytes>
+void CheckFastCopy(void (*copyFunction)(const uint8_t *, uint8_t *))
+{
+    for (uint8_t c0 : kTestValues)
+    {
+        for (uint8_t c1 : kTestValues)
+        {
+            for (uint8_t c2 : kTestValues)
+            {
+                for (uint8_t c3 : kTestValues)
+                {
+                    static_assert(SourceBytes <= 4, "Source pixel too large");
+                    std::array<uint8_t, 4> source = {{c0, c1, c2, c3}};
+
+                    uint8_t fastResult[DestBytes]    = {};
+                    uint8_t genericResult[DestBytes] = {};
+                    uint8_t temp[sizeof(gl::ColorF)];
+
+                    copyFunction(source.data(), fastResult);
+
+                    ReadColor<SourceType, float>(source.data(), temp);
+                    WriteColor<DestType, float>(temp, genericResult);
+
+                    EXPECT_EQ(0, memcmp(fastResult, genericResult, DestBytes));
+                }
+            }
+        }
+    }
+}
+
+// Test BGRA8 to RGBA8 copies.
+TEST(CopyImageTest, BGRA8ToRGBA8)
+{
+    CheckFastCopy<B8G8R8A8, R8G8B8A8, 4, 4>(CopyBGRA8ToRGBA8);
+}
+
+// Test RGBA8 to BGRA8 copies.
+TEST(CopyImageTest, RGBA8ToBGRA8)
+{
+    CheckFastCopy<R8G8B8A8, B8G8R8A8, 4, 4>(CopyRGBA8ToBGRA8);
+}
+
+// Test RGBA8 to RGBA16F copies.
+TEST(CopyImageTest, RGBA8ToRGBA16F)
+{
+    CheckFastCopy<R8G8B8A8, R16G16B16A16F, 4, 8>(CopyRGBA8ToRGBA16F);
+}
+
+// Test RGB8 to RGBA8 copies.
+TEST(CopyImageTest, RGB8ToRGBA8)
+{
+    CheckFastCopy<R8G8B8, R8G8B8A8, 3, 4>(CopyRGB8ToRGBA8);
+}
+
+// Test RGB8 to BGRA8 copies.
+TEST(CopyImageTest, RGB8ToBGRA8)
+{
+    CheckFastCopy<R8G8B8, B8G8R8A8, 3, 4>(CopyRGB8ToBGRA8);
+}
+
+// Test that depth readback from D24S8 keeps the depth bits and clears stencil.
+TEST(CopyImageTest, D24S8ToD24X8)
+{
+    D24S8 source;
+    source.D = 0x123456;
+    source.S = 0xAB;
+
+    uint32_t dest = 0xFFFFFFFF;
+    CopyD24S8ToD24X8(reinterpret_cast<const uint8_t *>(&source),
+                     reinterpret_cast<uint8_t *>(&dest));
+
+    EXPECT_EQ(0x123456u, dest);
+}
+
+}  // anonymous namespace
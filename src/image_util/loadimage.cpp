@@ -1345,12 +1345,7 @@ void LoadRGB32FToRGB16F(size_t width,
                 priv::OffsetDataPointer<float>(input, y, z, inputRowPitch, inputDepthPitch);
             uint16_t *dest =
                 priv::OffsetDataPointer<uint16_t>(output, y, z, outputRowPitch, outputDepthPitch);
-            for (size_t x = 0; x < width; x++)
-            {
-                dest[x * 3 + 0] = gl::float32ToFloat16(source[x * 3 + 0]);
-                dest[x * 3 + 1] = gl::float32ToFloat16(source[x * 3 + 1]);
-                dest[x * 3 + 2] = gl::float32ToFloat16(source[x * 3 + 2]);
-            }
+            gl::float32ToFloat16Array(source, dest, width * 3);
         }
     }
 }
@@ -104,10 +104,7 @@ inline void Load32FTo16F(size_t width, size_t height, size_t depth,
             const float *source = priv::OffsetDataPointer<float>(input, y, z, inputRowPitch, inputDepthPitch);
             uint16_t *dest = priv::OffsetDataPointer<uint16_t>(output, y, z, outputRowPitch, outputDepthPitch);
 
-            for (size_t x = 0; x < elementWidth; x++)
-            {
-                dest[x] = gl::float32ToFloat16(source[x]);
-            }
+            gl::float32ToFloat16Array(source, dest, elementWidth);
         }
     }
 }
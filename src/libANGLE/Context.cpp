@@ -22,6 +22,7 @@
 #include "common/version.h"
 #include "libANGLE/Buffer.h"
 #include "libANGLE/Compiler.h"
+#include "libANGLE/DeferredCommandStream.h"
 #include "libANGLE/Display.h"
 #include "libANGLE/Fence.h"
 #include "libANGLE/Framebuffer.h"
@@ -292,6 +293,8 @@ Context::Context(rx::EGLImplFactory *implFactory,
       mClientType(EGL_OPENGL_ES_API),
       mHasBeenCurrent(false),
       mContextLost(false),
+      mDispatchTable(nullptr),
+      mContextLostDispatchTable(nullptr),
       mResetStatus(GraphicsResetStatus::NoError),
       mContextLostForced(false),
       mResetStrategy(GetResetStrategy(attribs)),
@@ -304,6 +307,7 @@ Context::Context(rx::EGLImplFactory *implFactory,
       mBufferAccessValidationEnabled(false),
       mExtensionsEnabled(GetExtensionsEnabled(attribs, mWebGLContext)),
       mMemoryProgramCache(memoryProgramCache),
+      mConcurrentShareGroupCalls(mImplementation->supportsConcurrentShareGroupCalls()),
       mVertexArrayObserverBinding(this, kVertexArraySubjectIndex),
       mDrawFramebufferObserverBinding(this, kDrawFramebufferSubjectIndex),
       mReadFramebufferObserverBinding(this, kReadFramebufferSubjectIndex),
@@ -487,6 +491,9 @@ void Context::initialize()
 
 egl::Error Context::onDestroy(const egl::Display *display)
 {
+    // Executes the commands that are still pending.
+    mDeferredCommandStream.reset();
+
     if (mGLES1Renderer)
     {
         mGLES1Renderer->onDestroy(this, &mState);
@@ -2624,7 +2631,7 @@ void Context::markContextLost(GraphicsResetStatus status)
         mResetStatus       = status;
         mContextLostForced = true;
     }
-    mContextLost = true;
+    setContextLost();
 }
 
 GLenum Context::getGraphicsResetStatus()
@@ -2635,7 +2642,7 @@ GLenum Context::getGraphicsResetStatus()
     {
         if (!mContextLost && mImplementation->getResetStatus() != GraphicsResetStatus::NoError)
         {
-            mContextLost = true;
+            setContextLost();
         }
 
         // EXT_robustness, section 2.6: If the reset notification behavior is
@@ -2654,7 +2661,7 @@ GLenum Context::getGraphicsResetStatus()
 
         if (mResetStatus != GraphicsResetStatus::NoError)
         {
-            mContextLost = true;
+            setContextLost();
         }
     }
     else if (!mContextLostForced && mResetStatus != GraphicsResetStatus::NoError)
@@ -2668,6 +2675,21 @@ GLenum Context::getGraphicsResetStatus()
     return ToGLenum(mResetStatus);
 }
 
+void Context::setContextLost()
+{
+    mContextLost = true;
+    if (mContextLostDispatchTable)
+    {
+        mDispatchTable = mContextLostDispatchTable;
+    }
+}
+
+void Context::setDispatchTables(const DispatchTable *table, const DispatchTable *contextLostTable)
+{
+    mDispatchTable            = mContextLost ? contextLostTable : table;
+    mContextLostDispatchTable = contextLostTable;
+}
+
 bool Context::isResetNotificationEnabled()
 {
     return (mResetStrategy == GL_LOSE_CONTEXT_ON_RESET_EXT);
@@ -3434,32 +3456,8 @@ void Context::updateCaps()
         mMemoryProgramCache = nullptr;
     }
 
-    // Compute which buffer types are allowed
-    mValidBufferBindings.reset();
-    mValidBufferBindings.set(BufferBinding::ElementArray);
-    mValidBufferBindings.set(BufferBinding::Array);
-
-    if (mState.mExtensions.pixelBufferObject || getClientVersion() >= ES_3_0)
-    {
-        mValidBufferBindings.set(BufferBinding::PixelPack);
-        mValidBufferBindings.set(BufferBinding::PixelUnpack);
-    }
-
-    if (getClientVersion() >= ES_3_0)
-    {
-        mValidBufferBindings.set(BufferBinding::CopyRead);
-        mValidBufferBindings.set(BufferBinding::CopyWrite);
-        mValidBufferBindings.set(BufferBinding::TransformFeedback);
-        mValidBufferBindings.set(BufferBinding::Uniform);
-    }
-
-    if (getClientVersion() >= ES_3_1)
-    {
-        mValidBufferBindings.set(BufferBinding::AtomicCounter);
-        mValidBufferBindings.set(BufferBinding::ShaderStorage);
-        mValidBufferBindings.set(BufferBinding::DrawIndirect);
-        mValidBufferBindings.set(BufferBinding::DispatchIndirect);
-    }
+    // Compute which buffer types, query types and texture types are allowed
+    mPackedEnumCaps.initialize(this);
 
     mThreadPool = angle::WorkerThreadPool::Create(mState.mExtensions.parallelShaderCompile);
 
@@ -3505,6 +3503,33 @@ bool Context::noopDrawInstanced(PrimitiveMode mode, GLsizei count, GLsizei insta
     return (instanceCount == 0) || noopDraw(mode, count);
 }
 
+bool Context::hasNoopDraw(PrimitiveMode mode, const GLsizei *counts, GLsizei drawcount)
+{
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        if (noopDraw(mode, counts[drawID]))
+        {
+            return true;
+        }
+    }
+    return false;
+}
+
+bool Context::hasNoopDrawInstanced(PrimitiveMode mode,
+                                   const GLsizei *counts,
+                                   const GLsizei *instanceCounts,
+                                   GLsizei drawcount)
+{
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        if (noopDrawInstanced(mode, counts[drawID], instanceCounts[drawID]))
+        {
+            return true;
+        }
+    }
+    return false;
+}
+
 angle::Result Context::prepareForClear(GLbitfield mask)
 {
     ANGLE_TRY(syncDirtyObjects(mClearDirtyObjects));
@@ -5318,7 +5343,7 @@ void Context::multiDrawArrays(PrimitiveMode mode,
     ANGLE_CONTEXT_TRY(prepareForDraw(mode));
     Program *programObject = mState.getLinkedProgram(this);
     const bool hasDrawID   = programObject && programObject->hasDrawIDUniform();
-    if (hasDrawID)
+    if (hasDrawID || hasNoopDraw(mode, counts, drawcount))
     {
         for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
         {
@@ -5326,22 +5351,22 @@ void Context::multiDrawArrays(PrimitiveMode mode,
             {
                 continue;
             }
-            programObject->setDrawIDUniform(drawID);
+            if (hasDrawID)
+            {
+                programObject->setDrawIDUniform(drawID);
+            }
             ANGLE_CONTEXT_TRY(
                 mImplementation->drawArrays(this, mode, firsts[drawID], counts[drawID]));
             MarkTransformFeedbackBufferUsage(this, counts[drawID], 1);
         }
+        return;
     }
-    else
+
+    ANGLE_CONTEXT_TRY(mImplementation->multiDrawArrays(this, mode, firsts, counts, drawcount));
+    if (mStateCache.isTransformFeedbackActiveUnpaused())
     {
         for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
         {
-            if (noopDraw(mode, counts[drawID]))
-            {
-                continue;
-            }
-            ANGLE_CONTEXT_TRY(
-                mImplementation->drawArrays(this, mode, firsts[drawID], counts[drawID]));
             MarkTransformFeedbackBufferUsage(this, counts[drawID], 1);
         }
     }
@@ -5356,7 +5381,7 @@ void Context::multiDrawArraysInstanced(PrimitiveMode mode,
     ANGLE_CONTEXT_TRY(prepareForDraw(mode));
     Program *programObject = mState.getLinkedProgram(this);
     const bool hasDrawID   = programObject && programObject->hasDrawIDUniform();
-    if (hasDrawID)
+    if (hasDrawID || hasNoopDrawInstanced(mode, counts, instanceCounts, drawcount))
     {
         for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
         {
@@ -5364,22 +5389,23 @@ void Context::multiDrawArraysInstanced(PrimitiveMode mode,
             {
                 continue;
             }
-            programObject->setDrawIDUniform(drawID);
+            if (hasDrawID)
+            {
+                programObject->setDrawIDUniform(drawID);
+            }
             ANGLE_CONTEXT_TRY(mImplementation->drawArraysInstanced(
                 this, mode, firsts[drawID], counts[drawID], instanceCounts[drawID]));
             MarkTransformFeedbackBufferUsage(this, counts[drawID], instanceCounts[drawID]);
         }
+        return;
     }
-    else
+
+    ANGLE_CONTEXT_TRY(mImplementation->multiDrawArraysInstanced(this, mode, firsts, counts,
+                                                                instanceCounts, drawcount));
+    if (mStateCache.isTransformFeedbackActiveUnpaused())
     {
         for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
         {
-            if (noopDrawInstanced(mode, counts[drawID], instanceCounts[drawID]))
-            {
-                continue;
-            }
-            ANGLE_CONTEXT_TRY(mImplementation->drawArraysInstanced(
-                this, mode, firsts[drawID], counts[drawID], instanceCounts[drawID]));
             MarkTransformFeedbackBufferUsage(this, counts[drawID], instanceCounts[drawID]);
         }
     }
@@ -5394,7 +5420,7 @@ void Context::multiDrawElements(PrimitiveMode mode,
     ANGLE_CONTEXT_TRY(prepareForDraw(mode));
     Program *programObject = mState.getLinkedProgram(this);
     const bool hasDrawID   = programObject && programObject->hasDrawIDUniform();
-    if (hasDrawID)
+    if (hasDrawID || hasNoopDraw(mode, counts, drawcount))
     {
         for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
         {
@@ -5402,23 +5428,18 @@ void Context::multiDrawElements(PrimitiveMode mode,
             {
                 continue;
             }
-            programObject->setDrawIDUniform(drawID);
-            ANGLE_CONTEXT_TRY(
-                mImplementation->drawElements(this, mode, counts[drawID], type, indices[drawID]));
-        }
-    }
-    else
-    {
-        for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
-        {
-            if (noopDraw(mode, counts[drawID]))
+            if (hasDrawID)
             {
-                continue;
+                programObject->setDrawIDUniform(drawID);
             }
             ANGLE_CONTEXT_TRY(
                 mImplementation->drawElements(this, mode, counts[drawID], type, indices[drawID]));
         }
+        return;
     }
+
+    ANGLE_CONTEXT_TRY(
+        mImplementation->multiDrawElements(this, mode, counts, type, indices, drawcount));
 }
 
 void Context::multiDrawElementsInstanced(PrimitiveMode mode,
@@ -5431,7 +5452,7 @@ void Context::multiDrawElementsInstanced(PrimitiveMode mode,
     ANGLE_CONTEXT_TRY(prepareForDraw(mode));
     Program *programObject = mState.getLinkedProgram(this);
     const bool hasDrawID   = programObject && programObject->hasDrawIDUniform();
-    if (hasDrawID)
+    if (hasDrawID || hasNoopDrawInstanced(mode, counts, instanceCounts, drawcount))
     {
         for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
         {
@@ -5439,23 +5460,18 @@ void Context::multiDrawElementsInstanced(PrimitiveMode mode,
             {
                 continue;
             }
-            programObject->setDrawIDUniform(drawID);
-            ANGLE_CONTEXT_TRY(mImplementation->drawElementsInstanced(
-                this, mode, counts[drawID], type, indices[drawID], instanceCounts[drawID]));
-        }
-    }
-    else
-    {
-        for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
-        {
-            if (noopDrawInstanced(mode, counts[drawID], instanceCounts[drawID]))
+            if (hasDrawID)
             {
-                continue;
+                programObject->setDrawIDUniform(drawID);
             }
             ANGLE_CONTEXT_TRY(mImplementation->drawElementsInstanced(
                 this, mode, counts[drawID], type, indices[drawID], instanceCounts[drawID]));
         }
+        return;
     }
+
+    ANGLE_CONTEXT_TRY(mImplementation->multiDrawElementsInstanced(this, mode, counts, type, indices,
+                                                                  instanceCounts, drawcount));
 }
 
 void Context::provokingVertex(ProvokingVertex provokeMode)
@@ -6015,6 +6031,19 @@ void Context::onSamplerUniformChange(size_t textureUnitIndex)
     mStateCache.onActiveTextureChange(this);
 }
 
+void Context::setDeferredCommandStream(std::unique_ptr<DeferredCommandStream> &&stream)
+{
+    mDeferredCommandStream = std::move(stream);
+
+    // The deferred commands, whatever their lock class, execute with the global mutex held
+    // exclusively. The share group entry points execute them when they sync, so they must hold
+    // it too.
+    if (mDeferredCommandStream)
+    {
+        mConcurrentShareGroupCalls = false;
+    }
+}
+
 void Context::uniform1i(GLint location, GLint x)
 {
     setUniform1iImpl(mState.getProgram(), location, 1, &x);
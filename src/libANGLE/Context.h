@@ -22,6 +22,7 @@
 #include "libANGLE/Context_gles_1_0_autogen.h"
 #include "libANGLE/Error.h"
 #include "libANGLE/HandleAllocator.h"
+#include "libANGLE/PackedEnumCaps_autogen.h"
 #include "libANGLE/RefCountObject.h"
 #include "libANGLE/ResourceManager.h"
 #include "libANGLE/ResourceMap.h"
@@ -49,6 +50,8 @@ namespace gl
 {
 class Buffer;
 class Compiler;
+class DeferredCommandStream;
+struct DispatchTable;
 class FenceNV;
 class Framebuffer;
 class GLES1Renderer;
@@ -1782,6 +1785,7 @@ class Context final : public egl::LabeledObject, angle::NonCopyable, public angl
     size_t getRequestableExtensionStringCount() const;
 
     rx::ContextImpl *getImplementation() const { return mImplementation.get(); }
+    bool supportsConcurrentShareGroupCalls() const { return mConcurrentShareGroupCalls; }
     const Workarounds &getWorkarounds() const;
 
     ANGLE_NO_DISCARD bool getScratchBuffer(size_t requestedSizeBytes,
@@ -1858,7 +1862,7 @@ class Context final : public egl::LabeledObject, angle::NonCopyable, public angl
     bool isWebGL() const { return mState.isWebGL(); }
     bool isWebGL1() const { return mState.isWebGL1(); }
 
-    bool isValidBufferBinding(BufferBinding binding) const { return mValidBufferBindings[binding]; }
+    const PackedEnumCaps &getPackedEnumCaps() const { return mPackedEnumCaps; }
 
     // GLES1 emulation: Renderer level (for validation)
     int vertexArrayIndex(ClientVertexArrayType type) const;
@@ -1879,11 +1883,29 @@ class Context final : public egl::LabeledObject, angle::NonCopyable, public angl
 
     bool isBufferAccessValidationEnabled() const { return mBufferAccessValidationEnabled; }
 
+    // Set if the entry points record the commands for a worker thread to execute. See
+    // libGLESv2/entry_points_deferred.h.
+    DeferredCommandStream *getDeferredCommandStream() const { return mDeferredCommandStream.get(); }
+    void setDeferredCommandStream(std::unique_ptr<DeferredCommandStream> &&stream);
+
+    // The functions the entry points call. Set when the context is made current, see
+    // libGLESv2/entry_points_dispatch_autogen.h. Switches to contextLostTable when the context is
+    // lost.
+    const DispatchTable *getDispatchTable() const { return mDispatchTable; }
+    void setDispatchTables(const DispatchTable *table, const DispatchTable *contextLostTable);
+
   private:
     void initialize();
+    void setContextLost();
 
     bool noopDraw(PrimitiveMode mode, GLsizei count);
     bool noopDrawInstanced(PrimitiveMode mode, GLsizei count, GLsizei instanceCount);
+    // Return true if any draw of an ANGLE_multi_draw batch is a no-op.
+    bool hasNoopDraw(PrimitiveMode mode, const GLsizei *counts, GLsizei drawcount);
+    bool hasNoopDrawInstanced(PrimitiveMode mode,
+                              const GLsizei *counts,
+                              const GLsizei *instanceCounts,
+                              GLsizei drawcount);
 
     angle::Result prepareForDraw(PrimitiveMode mode);
     angle::Result prepareForClear(GLbitfield mask);
@@ -1935,8 +1957,9 @@ class Context final : public egl::LabeledObject, angle::NonCopyable, public angl
     // Recorded errors
     ErrorSet mErrors;
 
-    // Stores for each buffer binding type whether is it allowed to be used in this context.
-    angle::PackedEnumBitSet<BufferBinding> mValidBufferBindings;
+    // Stores for the packed GL enums of the entry points whether their values are allowed to be
+    // used in this context.
+    PackedEnumCaps mPackedEnumCaps;
 
     std::unique_ptr<rx::ContextImpl> mImplementation;
 
@@ -1977,9 +2000,13 @@ class Context final : public egl::LabeledObject, angle::NonCopyable, public angl
     // GLES1 renderer state
     std::unique_ptr<GLES1Renderer> mGLES1Renderer;
 
+    std::unique_ptr<DeferredCommandStream> mDeferredCommandStream;
+
     // Current/lost context flags
     bool mHasBeenCurrent;
     bool mContextLost;
+    const DispatchTable *mDispatchTable;
+    const DispatchTable *mContextLostDispatchTable;
     GraphicsResetStatus mResetStatus;
     bool mContextLostForced;
     GLenum mResetStrategy;
@@ -1992,6 +2019,7 @@ class Context final : public egl::LabeledObject, angle::NonCopyable, public angl
     bool mBufferAccessValidationEnabled;
     const bool mExtensionsEnabled;
     MemoryProgramCache *mMemoryProgramCache;
+    bool mConcurrentShareGroupCalls;
 
     State::DirtyObjects mDrawDirtyObjects;
     State::DirtyObjects mPathOperationDirtyObjects;
@@ -0,0 +1,199 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// DeferredCommandStream.cpp:
+//   Implements the per-context stream of deferred GL commands.
+//
+
+#include "libANGLE/DeferredCommandStream.h"
+
+#include <string.h>
+
+#include "common/debug.h"
+
+namespace gl
+{
+DeferredCommandBuffer::DeferredCommandBuffer() : mCommandCount(0) {}
+
+DeferredCommandBuffer::~DeferredCommandBuffer() = default;
+
+const void *DeferredCommandBuffer::copyBlob(const void *data, size_t size)
+{
+    if (data == nullptr || size == 0)
+    {
+        return data;
+    }
+
+    std::unique_ptr<uint8_t[]> blob(new uint8_t[size]);
+    memcpy(blob.get(), data, size);
+    mBlobs.push_back(std::move(blob));
+    return mBlobs.back().get();
+}
+
+const GLchar *const *DeferredCommandBuffer::copyStrings(const GLchar *const *strings,
+                                                        GLsizei count,
+                                                        const GLint *lengths)
+{
+    if (strings == nullptr || count <= 0)
+    {
+        return strings;
+    }
+
+    // The strings are copied null terminated after the array of pointers to them.
+    std::vector<size_t> stringLengths(count);
+    size_t size = sizeof(const GLchar *) * count;
+    for (GLsizei index = 0; index < count; ++index)
+    {
+        stringLengths[index] = (lengths && lengths[index] >= 0)
+                                   ? static_cast<size_t>(lengths[index])
+                                   : strlen(strings[index]);
+        size += stringLengths[index] + 1;
+    }
+
+    std::unique_ptr<uint8_t[]> blob(new uint8_t[size]);
+    const GLchar **copies = reinterpret_cast<const GLchar **>(blob.get());
+    GLchar *chars         = reinterpret_cast<GLchar *>(copies + count);
+    for (GLsizei index = 0; index < count; ++index)
+    {
+        memcpy(chars, strings[index], stringLengths[index]);
+        chars[stringLengths[index]] = '\0';
+        copies[index]               = chars;
+        chars += stringLengths[index] + 1;
+    }
+
+    mBlobs.push_back(std::move(blob));
+    return copies;
+}
+
+void DeferredCommandBuffer::execute(Context *context,
+                                    void (*execute)(Context *context,
+                                                    const DeferredCommandHeader *header)) const
+{
+    const uint8_t *command = mCommands.data();
+    const uint8_t *end     = command + mCommands.size();
+    while (command < end)
+    {
+        const DeferredCommandHeader *header =
+            reinterpret_cast<const DeferredCommandHeader *>(command);
+        execute(context, header);
+        command += header->size;
+    }
+}
+
+void DeferredCommandBuffer::reset()
+{
+    mCommands.clear();
+    mCommandCount = 0;
+    mBlobs.clear();
+}
+
+DeferredCommandStream::DeferredCommandStream(Context *context,
+                                             ExecuteCommandFunc executeCommand,
+                                             WorkerFunc worker)
+    : mContext(context),
+      mExecuteCommand(executeCommand),
+      mWorker(worker),
+      mRecording(new DeferredCommandBuffer()),
+      mUsesClientVertexArrays(false),
+      mSubmittedBufferCount(0),
+      mExiting(false)
+{
+    mWorkerThread = std::thread(&DeferredCommandStream::workerLoop, this);
+}
+
+DeferredCommandStream::~DeferredCommandStream()
+{
+    {
+        std::lock_guard<std::mutex> lock(mQueueMutex);
+        mExiting = true;
+    }
+    mQueueCondition.notify_one();
+    mWorkerThread.join();
+
+    finish();
+}
+
+bool DeferredCommandStream::isExiting()
+{
+    std::lock_guard<std::mutex> lock(mQueueMutex);
+    return mExiting;
+}
+
+void DeferredCommandStream::submit()
+{
+    std::unique_ptr<DeferredCommandBuffer> next;
+    {
+        std::lock_guard<std::mutex> lock(mQueueMutex);
+        mSubmitted.push_back(std::move(mRecording));
+        mSubmittedBufferCount++;
+        if (!mFreeBuffers.empty())
+        {
+            next = std::move(mFreeBuffers.back());
+            mFreeBuffers.pop_back();
+        }
+    }
+    mQueueCondition.notify_one();
+
+    mRecording = next ? std::move(next)
+                      : std::unique_ptr<DeferredCommandBuffer>(new DeferredCommandBuffer());
+}
+
+void DeferredCommandStream::finishImpl()
+{
+    std::lock_guard<std::mutex> executeLock(mExecuteMutex);
+    executeSubmittedCommandsLocked();
+
+    mRecording->execute(mContext, mExecuteCommand);
+    mRecording->reset();
+}
+
+void DeferredCommandStream::executeSubmittedCommands()
+{
+    std::lock_guard<std::mutex> executeLock(mExecuteMutex);
+    executeSubmittedCommandsLocked();
+}
+
+void DeferredCommandStream::executeSubmittedCommandsLocked()
+{
+    while (true)
+    {
+        std::unique_ptr<DeferredCommandBuffer> buffer;
+        {
+            std::lock_guard<std::mutex> lock(mQueueMutex);
+            if (mSubmitted.empty())
+            {
+                return;
+            }
+            buffer = std::move(mSubmitted.front());
+            mSubmitted.pop_front();
+        }
+
+        buffer->execute(mContext, mExecuteCommand);
+        buffer->reset();
+
+        std::lock_guard<std::mutex> lock(mQueueMutex);
+        mFreeBuffers.push_back(std::move(buffer));
+        ASSERT(mSubmittedBufferCount > 0);
+        mSubmittedBufferCount--;
+    }
+}
+
+void DeferredCommandStream::workerLoop()
+{
+    while (true)
+    {
+        {
+            std::unique_lock<std::mutex> lock(mQueueMutex);
+            mQueueCondition.wait(lock, [this] { return mExiting || !mSubmitted.empty(); });
+            if (mExiting)
+            {
+                return;
+            }
+        }
+
+        mWorker(this);
+    }
+}
+}  // namespace gl
@@ -0,0 +1,172 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// DeferredCommandStream.h:
+//   Per-context stream of GL commands recorded by the deferred entry points and executed by a
+//   worker thread. See libGLESv2/entry_points_deferred.h.
+//
+
+#ifndef LIBANGLE_DEFERRED_COMMAND_STREAM_H_
+#define LIBANGLE_DEFERRED_COMMAND_STREAM_H_
+
+#include <stdint.h>
+#include <atomic>
+#include <condition_variable>
+#include <deque>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#include "angle_gl.h"
+#include "common/angleutils.h"
+
+namespace gl
+{
+class Context;
+
+// A command is a DeferredCommandHeader followed by the parameters of its entry point. The client
+// memory the parameters point to is copied to blobs owned by the buffer.
+struct DeferredCommandHeader
+{
+    uint16_t commandID;
+    uint16_t padding;
+    uint32_t size;
+};
+
+class DeferredCommandBuffer final : angle::NonCopyable
+{
+  public:
+    DeferredCommandBuffer();
+    ~DeferredCommandBuffer();
+
+    // The parameters are only valid until the next command is recorded.
+    template <typename ParamsT>
+    ParamsT *recordCommand(uint16_t commandID)
+    {
+        static_assert(alignof(ParamsT) <= kCommandAlignment, "Parameters are over aligned");
+        constexpr uint32_t kSize =
+            (sizeof(DeferredCommandHeader) + sizeof(ParamsT) + kCommandAlignment - 1) &
+            ~(kCommandAlignment - 1);
+
+        size_t offset = mCommands.size();
+        mCommands.resize(offset + kSize);
+
+        DeferredCommandHeader *header =
+            reinterpret_cast<DeferredCommandHeader *>(mCommands.data() + offset);
+        header->commandID = commandID;
+        header->padding   = 0;
+        header->size      = kSize;
+        mCommandCount++;
+        return reinterpret_cast<ParamsT *>(header + 1);
+    }
+
+    const void *copyBlob(const void *data, size_t size);
+    const GLchar *const *copyStrings(const GLchar *const *strings,
+                                     GLsizei count,
+                                     const GLint *lengths);
+
+    template <typename ParamsT>
+    static const ParamsT *GetParams(const DeferredCommandHeader *header)
+    {
+        return reinterpret_cast<const ParamsT *>(header + 1);
+    }
+
+    // Calls execute(context, header) for every command in recording order.
+    void execute(Context *context,
+                 void (*execute)(Context *context, const DeferredCommandHeader *header)) const;
+
+    void reset();
+
+    bool empty() const { return mCommandCount == 0; }
+    size_t getCommandCount() const { return mCommandCount; }
+
+  private:
+    static constexpr uint32_t kCommandAlignment = 8;
+
+    std::vector<uint8_t> mCommands;
+    size_t mCommandCount;
+    std::vector<std::unique_ptr<uint8_t[]>> mBlobs;
+};
+
+class DeferredCommandStream final : angle::NonCopyable
+{
+  public:
+    // Executes one recorded command. Runs with the execution lock held.
+    using ExecuteCommandFunc = void (*)(Context *context, const DeferredCommandHeader *header);
+    // Called by the worker thread when commands were submitted. Must take any lock the entry
+    // points of the context take, then call executeSubmittedCommands().
+    using WorkerFunc = void (*)(DeferredCommandStream *stream);
+
+    DeferredCommandStream(Context *context, ExecuteCommandFunc executeCommand, WorkerFunc worker);
+
+    // Executes the commands that are still pending.
+    ~DeferredCommandStream();
+
+    // Only the thread the context is current on records commands.
+    DeferredCommandBuffer *getRecordingBuffer() { return mRecording.get(); }
+
+    // Hands the recording buffer to the worker thread once it holds enough commands.
+    void onCommandRecorded()
+    {
+        if (mRecording->getCommandCount() >= kCommandsPerSubmission)
+        {
+            submit();
+        }
+    }
+
+    bool hasPendingCommands() const { return !mRecording->empty() || mSubmittedBufferCount > 0; }
+
+    // Executes all the recorded commands on the calling thread. Called before the commands that
+    // return data or can't be recorded, so they see the effects of the commands before them. The
+    // caller must hold the locks the worker takes.
+    void finish()
+    {
+        if (hasPendingCommands())
+        {
+            finishImpl();
+        }
+    }
+
+    // Executes the commands submitted to the worker thread.
+    void executeSubmittedCommands();
+
+    bool isExiting();
+
+    // Draws are executed synchronously once a client vertex array was specified because they read
+    // client memory that could be modified before the worker executes them.
+    bool usesClientVertexArrays() const { return mUsesClientVertexArrays; }
+    void onClientVertexArrayUsed() { mUsesClientVertexArrays = true; }
+
+  private:
+    static constexpr size_t kCommandsPerSubmission = 256;
+
+    void submit();
+    void finishImpl();
+    void workerLoop();
+    void executeSubmittedCommandsLocked();
+
+    Context *mContext;
+    ExecuteCommandFunc mExecuteCommand;
+    WorkerFunc mWorker;
+
+    std::unique_ptr<DeferredCommandBuffer> mRecording;
+    bool mUsesClientVertexArrays;
+
+    // Held while commands execute, by the worker or by finish().
+    std::mutex mExecuteMutex;
+
+    std::mutex mQueueMutex;
+    std::condition_variable mQueueCondition;
+    std::deque<std::unique_ptr<DeferredCommandBuffer>> mSubmitted;
+    std::vector<std::unique_ptr<DeferredCommandBuffer>> mFreeBuffers;
+    std::atomic<size_t> mSubmittedBufferCount;
+    bool mExiting;
+
+    std::thread mWorkerThread;
+};
+}  // namespace gl
+
+#endif  // LIBANGLE_DEFERRED_COMMAND_STREAM_H_
@@ -365,6 +365,7 @@ MSG kNegativeBaseViewIndex = "Negative baseViewIndex.";
 MSG kNegativeBufferSize = "Negative buffer size.";
 MSG kNegativeBufSize = "Invalid bufSize.";
 MSG kNegativeCount = "Negative count.";
+MSG kNegativeDrawcount = "Drawcount must be greater than or equal to zero.";
 MSG kNegativeHeightWidthDepth = "Cannot have negative height = width = or depth.";
 MSG kNegativeLayer = "Negative layer.";
 MSG kNegativeLength = "Negative length.";
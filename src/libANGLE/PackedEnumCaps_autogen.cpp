@@ -0,0 +1,43 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from entry_point_packed_gl_enum_caps.json.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// PackedEnumCaps_autogen.cpp:
+//   Tables of the packed GL enum values a context accepts.
+
+#include "libANGLE/PackedEnumCaps_autogen.h"
+
+#include "libANGLE/validationES.h"
+
+namespace gl
+{
+PackedEnumCaps::PackedEnumCaps()
+{
+    mBufferBinding.fill(false);
+    mQueryType.fill(false);
+    mTextureType.fill(false);
+}
+
+PackedEnumCaps::~PackedEnumCaps() = default;
+
+void PackedEnumCaps::initialize(const Context *context)
+{
+    for (BufferBinding value : angle::AllEnums<BufferBinding>())
+    {
+        mBufferBinding[value] = ValidBufferType(context, value);
+    }
+
+    for (QueryType value : angle::AllEnums<QueryType>())
+    {
+        mQueryType[value] = ValidQueryType(context, value);
+    }
+
+    for (TextureType value : angle::AllEnums<TextureType>())
+    {
+        mTextureType[value] = ValidTextureTarget(context, value);
+    }
+}
+}  // namespace gl
@@ -0,0 +1,59 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from entry_point_packed_gl_enum_caps.json.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// PackedEnumCaps_autogen.h:
+//   Tables of the packed GL enum values a context accepts, computed when its caps change.
+//   FromGLenum converts the unknown GLenums to InvalidEnum, which no table accepts, so a single
+//   lookup of the packed value validates both the GLenum and the client version and extensions
+//   it needs.
+
+#ifndef LIBANGLE_PACKED_ENUM_CAPS_AUTOGEN_H_
+#define LIBANGLE_PACKED_ENUM_CAPS_AUTOGEN_H_
+
+#include "common/PackedEnums.h"
+#include "common/angleutils.h"
+#include "libANGLE/ErrorStrings.h"
+
+namespace gl
+{
+class Context;
+
+class PackedEnumCaps final : angle::NonCopyable
+{
+  public:
+    PackedEnumCaps();
+    ~PackedEnumCaps();
+
+    void initialize(const Context *context);
+
+    bool isValid(BufferBinding value) const { return mBufferBinding[value]; }
+    bool isValid(QueryType value) const { return mQueryType[value]; }
+    bool isValid(TextureType value) const { return mTextureType[value]; }
+
+  private:
+    // Reserve an extra slot at the end of these maps for invalid enum.
+    angle::PackedEnumMap<BufferBinding, bool, angle::EnumSize<BufferBinding>() + 1> mBufferBinding;
+    angle::PackedEnumMap<QueryType, bool, angle::EnumSize<QueryType>() + 1> mQueryType;
+    angle::PackedEnumMap<TextureType, bool, angle::EnumSize<TextureType>() + 1> mTextureType;
+};
+
+// The message of the GL_INVALID_ENUM error generated for a value the context doesn't accept.
+constexpr const char *GetInvalidPackedEnumError(BufferBinding)
+{
+    return err::kInvalidBufferTypes;
+}
+constexpr const char *GetInvalidPackedEnumError(QueryType)
+{
+    return err::kInvalidQueryType;
+}
+constexpr const char *GetInvalidPackedEnumError(TextureType)
+{
+    return err::kInvalidTextureTarget;
+}
+}  // namespace gl
+
+#endif  // LIBANGLE_PACKED_ENUM_CAPS_AUTOGEN_H_
@@ -258,6 +258,8 @@ State::State(ContextID contextIn,
       mProgramPipelineManager(new ProgramPipelineManager()),
       mMemoryObjectManager(
           AllocateOrGetSharedResourceManager(shareContextState, &State::mMemoryObjectManager)),
+      mShareGroupMutex(shareContextState ? shareContextState->mShareGroupMutex
+                                         : std::make_shared<std::mutex>()),
       mMaxDrawBuffers(0),
       mMaxCombinedTextureImageUnits(0),
       mDepthClearValue(0),
@@ -11,6 +11,7 @@
 
 #include <bitset>
 #include <memory>
+#include <mutex>
 
 #include "common/Color.h"
 #include "common/angleutils.h"
@@ -73,6 +74,9 @@ class State : angle::NonCopyable
     GLint getClientMajorVersion() const { return mClientVersion.major; }
     GLint getClientMinorVersion() const { return mClientVersion.minor; }
     const Version &getClientVersion() const { return mClientVersion; }
+
+    // Locked by the entry points that only touch objects owned by the share group.
+    std::mutex &getShareGroupMutex() const { return *mShareGroupMutex; }
     const Caps &getCaps() const { return mCaps; }
     const TextureCapsMap &getTextureCaps() const { return mTextureCaps; }
     const Extensions &getExtensions() const { return mExtensions; }
@@ -715,6 +719,7 @@ class State : angle::NonCopyable
     FramebufferManager *mFramebufferManager;
     ProgramPipelineManager *mProgramPipelineManager;
     MemoryObjectManager *mMemoryObjectManager;
+    std::shared_ptr<std::mutex> mShareGroupMutex;
 
     // Cached values from Context's caps
     GLuint mMaxDrawBuffers;
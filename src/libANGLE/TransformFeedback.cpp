@@ -187,6 +187,19 @@ bool TransformFeedback::checkBufferSpaceForDraw(GLsizei count, GLsizei primcount
     return vertices.IsValid() && vertices.ValueOrDie() <= mState.mVertexCapacity;
 }
 
+bool TransformFeedback::checkBufferSpaceForMultiDraw(const GLsizei *counts,
+                                                     const GLsizei *primcounts,
+                                                     GLsizei drawcount) const
+{
+    angle::CheckedNumeric<GLsizeiptr> vertices = mState.mVerticesDrawn;
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        vertices += GetVerticesNeededForDraw(mState.mPrimitiveMode, counts[drawID],
+                                             primcounts ? primcounts[drawID] : 1);
+    }
+    return vertices.IsValid() && vertices.ValueOrDie() <= mState.mVertexCapacity;
+}
+
 void TransformFeedback::onVerticesDrawn(const Context *context, GLsizei count, GLsizei primcount)
 {
     ASSERT(mState.mActive && !mState.mPaused);
@@ -77,6 +77,10 @@ class TransformFeedback final : public RefCountObject, public LabeledObject
     // Validates that the vertices produced by a draw call will fit in the bound transform feedback
     // buffers.
     bool checkBufferSpaceForDraw(GLsizei count, GLsizei primcount) const;
+    // Same for the draws of a multi-draw call. primcounts is null for non-instanced draws.
+    bool checkBufferSpaceForMultiDraw(const GLsizei *counts,
+                                      const GLsizei *primcounts,
+                                      GLsizei drawcount) const;
     // This must be called after each draw call when transform feedback is enabled to keep track of
     // how many vertices have been written to the buffers. This information is needed by
     // checkBufferSpaceForDraw because each draw call appends vertices to the buffers starting just
@@ -62,4 +62,24 @@
 #    define ANGLE_FORCE_THREAD_SAFETY ANGLE_DISABLED
 #endif  // !defined(ANGLE_FORCE_THREAD_SAFETY)
 
+// Count the calls and time the validation and dispatch of every GLES entry point.
+#if !defined(ANGLE_ENTRY_POINT_PROFILING)
+#    define ANGLE_ENTRY_POINT_PROFILING ANGLE_DISABLED
+#endif  // !defined(ANGLE_ENTRY_POINT_PROFILING)
+
+// Record the parameters of every GLES entry point in binary to be formatted offline.
+#if !defined(ANGLE_ENTRY_POINT_BINARY_EVENTS)
+#    define ANGLE_ENTRY_POINT_BINARY_EVENTS ANGLE_DISABLED
+#endif  // !defined(ANGLE_ENTRY_POINT_BINARY_EVENTS)
+
+// Capture the GLES calls to replay them offline.
+#if !defined(ANGLE_CAPTURE)
+#    define ANGLE_CAPTURE ANGLE_DISABLED
+#endif  // !defined(ANGLE_CAPTURE)
+
+// Record the GLES calls that return no data for a worker thread to execute.
+#if !defined(ANGLE_DEFERRED_COMMANDS)
+#    define ANGLE_DEFERRED_COMMANDS ANGLE_DISABLED
+#endif  // !defined(ANGLE_DEFERRED_COMMANDS)
+
 #endif  // LIBANGLE_FEATURES_H_
@@ -19,6 +19,68 @@ ContextImpl::ContextImpl(const gl::State &state, gl::ErrorSet *errorSet)
 
 ContextImpl::~ContextImpl() {}
 
+angle::Result ContextImpl::multiDrawArrays(const gl::Context *context,
+                                           gl::PrimitiveMode mode,
+                                           const GLint *firsts,
+                                           const GLsizei *counts,
+                                           GLsizei drawcount)
+{
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        ANGLE_TRY(drawArrays(context, mode, firsts[drawID], counts[drawID]));
+    }
+
+    return angle::Result::Continue;
+}
+
+angle::Result ContextImpl::multiDrawArraysInstanced(const gl::Context *context,
+                                                    gl::PrimitiveMode mode,
+                                                    const GLint *firsts,
+                                                    const GLsizei *counts,
+                                                    const GLsizei *instanceCounts,
+                                                    GLsizei drawcount)
+{
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        ANGLE_TRY(drawArraysInstanced(context, mode, firsts[drawID], counts[drawID],
+                                      instanceCounts[drawID]));
+    }
+
+    return angle::Result::Continue;
+}
+
+angle::Result ContextImpl::multiDrawElements(const gl::Context *context,
+                                             gl::PrimitiveMode mode,
+                                             const GLsizei *counts,
+                                             gl::DrawElementsType type,
+                                             const GLvoid *const *indices,
+                                             GLsizei drawcount)
+{
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        ANGLE_TRY(drawElements(context, mode, counts[drawID], type, indices[drawID]));
+    }
+
+    return angle::Result::Continue;
+}
+
+angle::Result ContextImpl::multiDrawElementsInstanced(const gl::Context *context,
+                                                      gl::PrimitiveMode mode,
+                                                      const GLsizei *counts,
+                                                      gl::DrawElementsType type,
+                                                      const GLvoid *const *indices,
+                                                      const GLsizei *instanceCounts,
+                                                      GLsizei drawcount)
+{
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        ANGLE_TRY(drawElementsInstanced(context, mode, counts[drawID], type, indices[drawID],
+                                        instanceCounts[drawID]));
+    }
+
+    return angle::Result::Continue;
+}
+
 void ContextImpl::stencilFillPath(const gl::Path *path, GLenum fillMode, GLuint mask)
 {
     UNREACHABLE();
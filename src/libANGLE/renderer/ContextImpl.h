@@ -78,6 +78,35 @@ class ContextImpl : public GLImplFactory
                                                gl::DrawElementsType type,
                                                const void *indirect) = 0;
 
+    // ANGLE_multi_draw. Only submit the draws: the context keeps the transform feedback and
+    // gl_DrawID bookkeeping and never passes a batch with a no-op draw or a program that reads
+    // gl_DrawID. The default implementations issue the draws one by one. Backends that can submit
+    // a batch at once override them.
+    virtual angle::Result multiDrawArrays(const gl::Context *context,
+                                          gl::PrimitiveMode mode,
+                                          const GLint *firsts,
+                                          const GLsizei *counts,
+                                          GLsizei drawcount);
+    virtual angle::Result multiDrawArraysInstanced(const gl::Context *context,
+                                                   gl::PrimitiveMode mode,
+                                                   const GLint *firsts,
+                                                   const GLsizei *counts,
+                                                   const GLsizei *instanceCounts,
+                                                   GLsizei drawcount);
+    virtual angle::Result multiDrawElements(const gl::Context *context,
+                                            gl::PrimitiveMode mode,
+                                            const GLsizei *counts,
+                                            gl::DrawElementsType type,
+                                            const GLvoid *const *indices,
+                                            GLsizei drawcount);
+    virtual angle::Result multiDrawElementsInstanced(const gl::Context *context,
+                                                     gl::PrimitiveMode mode,
+                                                     const GLsizei *counts,
+                                                     gl::DrawElementsType type,
+                                                     const GLvoid *const *indices,
+                                                     const GLsizei *instanceCounts,
+                                                     GLsizei drawcount);
+
     // CHROMIUM_path_rendering path drawing methods.
     virtual void stencilFillPath(const gl::Path *path, GLenum fillMode, GLuint mask);
     virtual void stencilStrokePath(const gl::Path *path, GLint reference, GLuint mask);
@@ -163,6 +192,16 @@ class ContextImpl : public GLImplFactory
 
     virtual void applyNativeWorkarounds(gl::Workarounds *workarounds) const {}
 
+    // Whether the entry points of the share_group class in scripts/entry_point_lock_classes.json
+    // can run concurrently with those of other share groups. They can't if the backend issues
+    // these calls through an object shared by the whole display.
+    virtual bool supportsConcurrentShareGroupCalls() const { return false; }
+
+    // Whether the calls of the context can run on a thread the context isn't current on, one
+    // thread at a time. Required by the deferred command stream of gl::Context. Backends that
+    // rely on a native context being current on the calling thread can't.
+    virtual bool supportsOffThreadExecution() const { return false; }
+
     virtual angle::Result dispatchCompute(const gl::Context *context,
                                           GLuint numGroupsX,
                                           GLuint numGroupsY,
@@ -143,6 +143,11 @@ class Context11 : public ContextD3D, public MultisampleTextureInitializer
     const gl::Extensions &getNativeExtensions() const override;
     const gl::Limitations &getNativeLimitations() const override;
 
+    // ProgramD3D only uploads its uniforms to the device at draw time.
+    bool supportsConcurrentShareGroupCalls() const override { return true; }
+    // The immediate context only needs its calls to be serialized.
+    bool supportsOffThreadExecution() const override { return true; }
+
     Renderer11 *getRenderer() const { return mRenderer; }
 
     angle::Result dispatchCompute(const gl::Context *context,
@@ -142,6 +142,8 @@ class Context9 : public ContextD3D
     const gl::Extensions &getNativeExtensions() const override;
     const gl::Limitations &getNativeLimitations() const override;
 
+    bool supportsConcurrentShareGroupCalls() const override { return true; }
+
     angle::Result dispatchCompute(const gl::Context *context,
                                   GLuint numGroupsX,
                                   GLuint numGroupsY,
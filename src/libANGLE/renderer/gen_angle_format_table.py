@@ -64,9 +64,9 @@ template_autogen_inl = """// GENERATED FILE - DO NOT EDIT.
 namespace angle
 {{
 
-static constexpr rx::FastCopyFunctionMap::Entry BGRAEntry = {{angle::FormatID::R8G8B8A8_UNORM,
-                                                             CopyBGRA8ToRGBA8}};
-static constexpr rx::FastCopyFunctionMap BGRACopyFunctions = {{&BGRAEntry, 1}};
+// Fast copy functions from {fast_copy_source_name}.
+// clang-format off
+{fast_copy_function_maps}// clang-format on
 static constexpr rx::FastCopyFunctionMap NoCopyFunctions;
 
 const Format gFormatInfoTable[] = {{
@@ -183,6 +183,38 @@ def get_color_write_function(angle_format):
     return 'WriteColor<' + channel_struct + ', '+ write_component_type + '>'
 
 
+fast_copy_map_template = """static constexpr rx::FastCopyFunctionMap::Entry {source}CopyEntries[] = {{
+{entries}
+}};
+static constexpr rx::FastCopyFunctionMap {source}CopyFunctions = {{{source}CopyEntries, {count}}};
+"""
+
+fast_copy_entry_template = "    {{angle::FormatID::{dest}, {function}}},"
+
+
+def get_fast_copy_functions_name(format_id, fast_copy_data):
+    if format_id in fast_copy_data:
+        return format_id + "CopyFunctions"
+    return "NoCopyFunctions"
+
+
+def gen_fast_copy_function_maps(all_angle, fast_copy_data):
+    maps = []
+    for source_id in sorted(fast_copy_data.keys()):
+        if source_id == "description":
+            continue
+        assert source_id in all_angle, "Unknown fast copy source format %s" % source_id
+        entries = []
+        for dest_id, function in sorted(fast_copy_data[source_id].iteritems()):
+            assert dest_id in all_angle, "Unknown fast copy dest format %s" % dest_id
+            entries.append(fast_copy_entry_template.format(dest=dest_id, function=function))
+        maps.append(fast_copy_map_template.format(
+            source=source_id,
+            entries="\n".join(entries),
+            count=len(entries)))
+    return "\n".join(maps)
+
+
 format_entry_template = """    {{ FormatID::{id}, {glInternalFormat}, {fboImplementationInternalFormat}, {mipGenerationFunction}, {fastCopyFunctions}, {colorReadFunction}, {colorWriteFunction}, {namedComponentType}, {R}, {G}, {B}, {A}, {L}, {D}, {S}, {pixelBytes}, {componentAlignmentMask}, {isBlock}, {isFixed} }},
 """
 
@@ -226,13 +258,13 @@ def get_component_alignment_mask(channels, bits):
         return "std::numeric_limits<GLuint>::max()"
 
 
-def json_to_table_data(format_id, json, angle_to_gl):
+def json_to_table_data(format_id, json, angle_to_gl, fast_copy_data):
 
     table_data = ""
 
     parsed = {
         "id": format_id,
-        "fastCopyFunctions": "NoCopyFunctions",
+        "fastCopyFunctions": get_fast_copy_functions_name(format_id, fast_copy_data),
     }
 
     for k, v in json.iteritems():
@@ -266,9 +298,6 @@ def json_to_table_data(format_id, json, angle_to_gl):
 
     parsed["namedComponentType"] = get_named_component_type(parsed["componentType"])
 
-    if format_id == "B8G8R8A8_UNORM":
-        parsed["fastCopyFunctions"] = "BGRACopyFunctions"
-
     is_block = format_id.endswith("_BLOCK")
 
     pixel_bytes = 0
@@ -291,12 +320,12 @@ def json_to_table_data(format_id, json, angle_to_gl):
     return format_entry_template.format(**parsed)
 
 
-def parse_angle_format_table(all_angle, json_data, angle_to_gl):
+def parse_angle_format_table(all_angle, json_data, angle_to_gl, fast_copy_data):
     table_data = ''
     for format_id in sorted(all_angle):
         if format_id != "NONE":
             format_info = json_data[format_id] if format_id in json_data else {}
-            table_data += json_to_table_data(format_id, format_info, angle_to_gl)
+            table_data += json_to_table_data(format_id, format_info, angle_to_gl, fast_copy_data)
 
     return table_data
 
@@ -330,7 +359,8 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['angle_format.py', 'angle_format_data.json', 'angle_format_map.json']
+        inputs = ['angle_format.py', 'angle_format_data.json', 'angle_format_map.json',
+                  'angle_format_fast_copy.json']
         outputs = ['Format_table_autogen.cpp', 'FormatID_autogen.h']
 
         if sys.argv[1] == 'inputs':
@@ -346,17 +376,22 @@ def main():
     angle_to_gl = angle_format.load_inverse_table('angle_format_map.json')
     data_source_name = 'angle_format_data.json'
     json_data = angle_format.load_json(data_source_name)
+    fast_copy_source_name = 'angle_format_fast_copy.json'
+    fast_copy_data = angle_format.load_json(fast_copy_source_name)
     all_angle = angle_to_gl.keys()
 
     angle_format_cases = parse_angle_format_table(
-        all_angle, json_data, angle_to_gl)
+        all_angle, json_data, angle_to_gl, fast_copy_data)
+    fast_copy_function_maps = gen_fast_copy_function_maps(all_angle, fast_copy_data)
     switch_data = gen_map_switch_string(gl_to_angle)
     output_cpp = template_autogen_inl.format(
         script_name = sys.argv[0],
         copyright_year = date.today().year,
         angle_format_info_cases = angle_format_cases,
         angle_format_switch = switch_data,
-        data_source_name = data_source_name)
+        fast_copy_function_maps = fast_copy_function_maps,
+        data_source_name = data_source_name,
+        fast_copy_source_name = fast_copy_source_name)
     with open('Format_table_autogen.cpp', 'wt') as out_file:
         out_file.write(output_cpp)
         out_file.close()
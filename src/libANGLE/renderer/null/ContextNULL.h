@@ -161,6 +161,9 @@ class ContextNULL : public ContextImpl
     const gl::Extensions &getNativeExtensions() const override;
     const gl::Limitations &getNativeLimitations() const override;
 
+    bool supportsConcurrentShareGroupCalls() const override { return true; }
+    bool supportsOffThreadExecution() const override { return true; }
+
     // Shader creation
     CompilerImpl *createCompiler() override;
     ShaderImpl *createShader(const gl::ShaderState &data) override;
@@ -117,6 +117,10 @@ class ContextVk : public ContextImpl, public vk::Context, public vk::CommandBuff
     const gl::Extensions &getNativeExtensions() const override;
     const gl::Limitations &getNativeLimitations() const override;
 
+    // ProgramVk writes uniforms to the default uniform blocks in CPU memory.
+    bool supportsConcurrentShareGroupCalls() const override { return true; }
+    bool supportsOffThreadExecution() const override { return true; }
+
     // Shader creation
     CompilerImpl *createCompiler() override;
     ShaderImpl *createShader(const gl::ShaderState &state) override;
@@ -871,6 +871,7 @@ angle::Result RendererVk::initialize(DisplayVk *displayVk,
     GlslangWrapper::Initialize();
 
     // Initialize the format table.
+    initFormatProperties();
     mFormatTable.initialize(this, &mNativeTextureCaps, &mNativeCaps.compressedTextureFormats);
 
     return angle::Result::Continue;
@@ -2193,6 +2194,31 @@ void RendererVk::flushGpuEvents(double nextSyncGpuTimestampS, double nextSyncCpu
     mGpuEvents.clear();
 }
 
+void RendererVk::initFormatProperties()
+{
+    // Query the formats the format table is known to need from the device in one pass. Fallback
+    // formats are left to getFormatFeatureBits, which queries them the first time a lookup needs
+    // them, so this makes no query that initializing the format table wouldn't make anyway.
+    size_t formatCount      = 0;
+    const VkFormat *formats = vk::GetFormatTableVkFormats(&formatCount);
+
+    for (size_t formatIndex = 0; formatIndex < formatCount; ++formatIndex)
+    {
+        VkFormat format = formats[formatIndex];
+        ASSERT(static_cast<uint32_t>(format) < vk::kNumVkFormats);
+        vkGetPhysicalDeviceFormatProperties(mPhysicalDevice, format, &mFormatProperties[format]);
+    }
+}
+
+void RendererVk::onFormatSupportGuaranteed(VkFormat format)
+{
+    ASSERT(static_cast<uint32_t>(format) < vk::kNumVkFormats);
+    if (mFormatProperties[format].bufferFeatures == kInvalidFormatFeatureFlags)
+    {
+        mFormatsAnsweredByMandatorySupport.set(format);
+    }
+}
+
 template <VkFormatFeatureFlags VkFormatProperties::*features>
 VkFormatFeatureFlags RendererVk::getFormatFeatureBits(VkFormat format,
                                                       const VkFormatFeatureFlags featureBits)
@@ -2207,11 +2233,13 @@ VkFormatFeatureFlags RendererVk::getFormatFeatureBits(VkFormat format,
         const VkFormatProperties &mandatoryProperties = vk::GetMandatoryFormatSupport(format);
         if (IsMaskFlagSet(mandatoryProperties.*features, featureBits))
         {
+            mFormatsAnsweredByMandatorySupport.set(format);
             return featureBits;
         }
 
         // Otherwise query the format features and cache it.
         vkGetPhysicalDeviceFormatProperties(mPhysicalDevice, format, &deviceProperties);
+        mFormatsAnsweredByMandatorySupport.reset(format);
     }
 
     return deviceProperties.*features & featureBits;
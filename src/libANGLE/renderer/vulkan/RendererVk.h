@@ -15,6 +15,7 @@
 
 #include "common/PoolAlloc.h"
 #include "common/angleutils.h"
+#include "common/bitset_utils.h"
 #include "libANGLE/BlobCache.h"
 #include "libANGLE/Caps.h"
 #include "libANGLE/renderer/vulkan/CommandGraph.h"
@@ -208,6 +209,17 @@ class RendererVk : angle::NonCopyable
     bool hasImageFormatFeatureBits(VkFormat format, const VkFormatFeatureFlags featureBits);
     bool hasBufferFormatFeatureBits(VkFormat format, const VkFormatFeatureFlags featureBits);
 
+    // Returns the number of formats that were looked up but never queried from the device because
+    // the mandatory format support table answered every lookup.
+    size_t getAvoidedFormatPropertiesQueryCount() const
+    {
+        return mFormatsAnsweredByMandatorySupport.count();
+    }
+
+    // Counts a format the format table didn't look up because the Vulkan spec guarantees the
+    // support it needs, unless the format was queried already.
+    void onFormatSupportGuaranteed(VkFormat format);
+
     void insertDebugMarker(GLenum source, GLuint id, std::string &&marker);
     void pushDebugMarker(GLenum source, GLuint id, std::string &&marker);
     void popDebugMarker();
@@ -231,6 +243,7 @@ class RendererVk : angle::NonCopyable
     void freeAllInFlightResources();
     angle::Result flushCommandGraph(vk::Context *context, vk::PrimaryCommandBuffer *commandBatch);
     void initFeatures(const ExtensionNameList &extensions);
+    void initFormatProperties();
     void initPipelineCacheVkKey();
     angle::Result initPipelineCache(DisplayVk *display);
 
@@ -388,6 +401,10 @@ class RendererVk : angle::NonCopyable
     // have a value close to zero, to avoid losing 12 bits when converting these 64 bit values to
     // double.
     uint64_t mGpuEventTimestampOrigin;
+
+    // Formats whose feature lookups were all answered by the mandatory format support table, so
+    // vkGetPhysicalDeviceFormatProperties was never called for them.
+    angle::BitSet<vk::kNumVkFormats> mFormatsAnsweredByMandatorySupport;
 };
 
 uint32_t GetUniformBufferDescriptorCount();
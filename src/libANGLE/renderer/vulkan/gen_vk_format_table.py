@@ -54,6 +54,18 @@ void Format::initialize(RendererVk *renderer,
     }}
 }}
 
+const VkFormat *GetFormatTableVkFormats(size_t *countOut)
+{{
+    // The distinct VkFormats the format table looks up first for an image or a buffer, minus those
+    // where the mandatory format support table answers every feature the format table checks.
+    static constexpr VkFormat kVkFormats[] = {{
+{vk_format_list}
+    }};
+
+    *countOut = ArraySize(kVkFormats);
+    return kVkFormats;
+}}
+
 }}  // namespace vk
 
 }}  // namespace rx
@@ -66,6 +78,7 @@ break;
 
 format_entry_template = """case angle::FormatID::{format_id}:
 internalFormat = {internal_format};
+guaranteedSupport = {guaranteed_support};
 {image_template}
 {buffer_template}
 break;
@@ -101,13 +114,104 @@ def is_packed(format_id):
     return "true" if "_PACK" in format_id else "false"
 
 
-def gen_format_case(angle, internal_format, vk_json_data):
+# Feature bits the format table checks while initializing. See FillTextureFormatCaps,
+# HasFullTextureFormatSupport and HasFullBufferFormatSupport in vk_format_utils.cpp.
+color_image_feature_bits = set([
+    "VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT",
+    "VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_LINEAR_BIT",
+    "VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BIT",
+])
+
+depth_stencil_image_feature_bits = set([
+    "VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT",
+    "VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_LINEAR_BIT",
+    "VK_FORMAT_FEATURE_DEPTH_STENCIL_ATTACHMENT_BIT",
+])
+
+vertex_buffer_feature_bit = "VK_FORMAT_FEATURE_VERTEX_BUFFER_BIT"
+storage_texel_buffer_feature_bit = "VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_BIT"
+
+
+def is_depth_stencil(format):
+    channels = angle_format.get_channels(format)
+    return channels is not None and ('d' in channels or 's' in channels)
+
+
+def get_formats(format, type, vk_json_data):
+    vk_map = vk_json_data["map"]
+    format = vk_json_data["overrides"].get(format, {}).get(type, format)
+    if format not in vk_map:
+        return []
+    fallbacks = vk_json_data["fallbacks"].get(format, {}).get(type, [])
+    if not isinstance(fallbacks, list):
+        fallbacks = [fallbacks]
+    return [format] + fallbacks
+
+
+def is_mandatory(vk_format, features, mandatory_support):
+    return set(features).issubset(mandatory_support.get(vk_format, []))
+
+
+def is_image_support_guaranteed(format, vk_json_data, mandatory_support):
+    if is_depth_stencil(format):
+        features = depth_stencil_image_feature_bits
+    else:
+        features = color_image_feature_bits
+    return is_mandatory(vk_json_data["map"][format], features, mandatory_support)
+
+
+def get_guaranteed_support(angle, vk_json_data, mandatory_support):
+    # The support the Vulkan spec guarantees for the first image and buffer format of an ANGLE
+    # format, as the names of the vk::FormatSupportMask bits in vk_format_utils.h.
+    vk_map = vk_json_data["map"]
+    support = []
+
+    images = get_formats(angle, "image", vk_json_data)
+    if images and is_image_support_guaranteed(images[0], vk_json_data, mandatory_support):
+        support.append("kImageSupportGuaranteed")
+
+    buffers = get_formats(angle, "buffer", vk_json_data)
+    if buffers:
+        vk_buffer_format = vk_map[buffers[0]]
+        if is_mandatory(vk_buffer_format, [vertex_buffer_feature_bit], mandatory_support):
+            support.append("kVertexBufferSupportGuaranteed")
+        if is_mandatory(vk_buffer_format, [storage_texel_buffer_feature_bit], mandatory_support):
+            support.append("kStorageTexelBufferSupportGuaranteed")
+
+    return support
+
+
+def gen_vk_format_list(angle_formats, vk_json_data, mandatory_support):
+    # Only the first format of each fallback chain is listed. A fallback is only looked up when
+    # the format before it lacks support, which is rare, so querying it up front would add queries.
+    vk_map = vk_json_data["map"]
+    vk_formats = set()
+    for angle in angle_formats:
+        support = get_guaranteed_support(angle, vk_json_data, mandatory_support)
+
+        images = get_formats(angle, "image", vk_json_data)
+        if images and "kImageSupportGuaranteed" not in support:
+            vk_formats.add(vk_map[images[0]])
+
+        # The vertex buffer bit is only checked to choose between fallbacks.
+        buffers = get_formats(angle, "buffer", vk_json_data)
+        if buffers and ("kStorageTexelBufferSupportGuaranteed" not in support or
+                        (len(buffers) > 1 and "kVertexBufferSupportGuaranteed" not in support)):
+            vk_formats.add(vk_map[buffers[0]])
+
+    vk_formats.discard("VK_FORMAT_UNDEFINED")
+    return "\n".join("        %s," % vk_format for vk_format in sorted(vk_formats))
+
+
+def gen_format_case(angle, internal_format, vk_json_data, mandatory_support):
     vk_map = vk_json_data["map"]
     vk_overrides = vk_json_data["overrides"]
     vk_fallbacks = vk_json_data["fallbacks"]
     args = dict(
         format_id=angle,
         internal_format=internal_format,
+        guaranteed_support=" | ".join(
+            get_guaranteed_support(angle, vk_json_data, mandatory_support)) or "0",
         image_template="",
         buffer_template="")
 
@@ -115,15 +219,6 @@ def gen_format_case(angle, internal_format, vk_json_data):
           (angle not in vk_fallbacks)) or angle == 'NONE':
         return empty_format_entry_template.format(**args)
 
-    def get_formats(format, type):
-        format = vk_overrides.get(format, {}).get(type, format)
-        if format not in vk_map:
-            return []
-        fallbacks = vk_fallbacks.get(format, {}).get(type, [])
-        if not isinstance(fallbacks, list):
-            fallbacks = [fallbacks]
-        return [format] + fallbacks
-
     def image_args(format):
         return dict(
             image="angle::FormatID::" + format,
@@ -141,7 +236,7 @@ def gen_format_case(angle, internal_format, vk_json_data):
             vertex_load_converts='false' if angle == format else 'true',
         )
 
-    images = get_formats(angle, "image")
+    images = get_formats(angle, "image", vk_json_data)
     if len(images) == 1:
         args.update(image_template=image_basic_template)
         args.update(image_args(images[0]))
@@ -152,7 +247,7 @@ def gen_format_case(angle, internal_format, vk_json_data):
                 image_struct_template.format(**image_args(i))
                 for i in images))
 
-    buffers = get_formats(angle, "buffer")
+    buffers = get_formats(angle, "buffer", vk_json_data)
     if len(buffers) == 1:
         args.update(buffer_template=buffer_basic_template)
         args.update(buffer_args(buffers[0]))
@@ -168,6 +263,7 @@ def gen_format_case(angle, internal_format, vk_json_data):
 def main():
 
     input_file_name = 'vk_format_map.json'
+    mandatory_support_file_name = 'vk_mandatory_format_support_data.json'
     out_file_name = 'vk_format_table_autogen.cpp'
 
     # auto_script parameters.
@@ -175,7 +271,8 @@ def main():
         inputs = [
             '../angle_format.py',
             '../angle_format_map.json',
-            input_file_name
+            input_file_name,
+            mandatory_support_file_name
         ]
         outputs = [out_file_name]
 
@@ -190,12 +287,14 @@ def main():
 
     angle_to_gl = angle_format.load_inverse_table(os.path.join('..', 'angle_format_map.json'))
     vk_json_data = angle_format.load_json(input_file_name)
-    vk_cases = [gen_format_case(angle, gl, vk_json_data)
+    mandatory_support = angle_format.load_json(mandatory_support_file_name)
+    vk_cases = [gen_format_case(angle, gl, vk_json_data, mandatory_support)
                for angle, gl in sorted(angle_to_gl.iteritems())]
 
     output_cpp = template_table_autogen_cpp.format(
         copyright_year = date.today().year,
         format_case_data = "\n".join(vk_cases),
+        vk_format_list = gen_vk_format_list(angle_to_gl.keys(), vk_json_data, mandatory_support),
         script_name = __file__,
         out_file_name = out_file_name,
         input_file_name = input_file_name)
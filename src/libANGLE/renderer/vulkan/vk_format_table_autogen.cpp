@@ -28,6 +28,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
     {
         case angle::FormatID::A16_FLOAT:
             internalFormat           = GL_ALPHA16F_EXT;
+            guaranteedSupport        = kImageSupportGuaranteed;
             imageFormatID            = angle::FormatID::R16_FLOAT;
             vkImageFormat            = VK_FORMAT_R16_SFLOAT;
             imageInitializerFunction = nullptr;
@@ -36,6 +37,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::A1R5G5B5_UNORM:
             internalFormat               = GL_A1RGB5_ANGLEX;
+            guaranteedSupport            = kImageSupportGuaranteed;
             imageFormatID                = angle::FormatID::A1R5G5B5_UNORM;
             vkImageFormat                = VK_FORMAT_A1R5G5B5_UNORM_PACK16;
             imageInitializerFunction     = nullptr;
@@ -48,6 +50,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::A32_FLOAT:
             internalFormat           = GL_ALPHA32F_EXT;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R32_FLOAT;
             vkImageFormat            = VK_FORMAT_R32_SFLOAT;
             imageInitializerFunction = nullptr;
@@ -56,6 +59,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::A8_UNORM:
             internalFormat           = GL_ALPHA8_EXT;
+            guaranteedSupport        = kImageSupportGuaranteed;
             imageFormatID            = angle::FormatID::R8_UNORM;
             vkImageFormat            = VK_FORMAT_R8_UNORM;
             imageInitializerFunction = nullptr;
@@ -64,6 +68,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_10x10_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_10x10_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_10x10_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -76,6 +81,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_10x10_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_10x10_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_10x10_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_10x10_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -88,6 +94,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_10x5_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_10x5_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_10x5_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -100,6 +107,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_10x5_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_10x5_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_10x5_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_10x5_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -112,6 +120,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_10x6_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_10x6_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_10x6_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -124,6 +133,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_10x6_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_10x6_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_10x6_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_10x6_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -136,6 +146,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_10x8_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_10x8_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_10x8_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -148,6 +159,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_10x8_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_10x8_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_10x8_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_10x8_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -160,6 +172,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_12x10_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_12x10_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_12x10_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -172,6 +185,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_12x10_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_12x10_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_12x10_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_12x10_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -184,6 +198,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_12x12_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_12x12_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_12x12_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -196,6 +211,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_12x12_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_12x12_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_12x12_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_12x12_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -208,6 +224,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_4x4_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_4x4_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_4x4_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -220,6 +237,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_4x4_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_4x4_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_4x4_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_4x4_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -232,6 +250,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_5x4_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_5x4_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_5x4_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -244,6 +263,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_5x4_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_5x4_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_5x4_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_5x4_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -256,6 +276,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_5x5_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_5x5_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_5x5_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -268,6 +289,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_5x5_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_5x5_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_5x5_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_5x5_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -280,6 +302,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_6x5_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_6x5_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_6x5_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -292,6 +315,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_6x5_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_6x5_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_6x5_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_6x5_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -304,6 +328,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_6x6_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_6x6_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_6x6_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -316,6 +341,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_6x6_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_6x6_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_6x6_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_6x6_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -328,6 +354,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_8x5_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_8x5_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_8x5_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -340,6 +367,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_8x5_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_8x5_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_8x5_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_8x5_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -352,6 +380,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_8x6_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_8x6_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_8x6_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -364,6 +393,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_8x6_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_8x6_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_8x6_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_8x6_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -376,6 +406,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_8x8_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_8x8_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_8x8_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -388,6 +419,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ASTC_8x8_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_ASTC_8x8_KHR;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ASTC_8x8_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ASTC_8x8_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -400,6 +432,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::B4G4R4A4_UNORM:
             internalFormat               = GL_BGRA4_ANGLEX;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::B4G4R4A4_UNORM;
             vkImageFormat                = VK_FORMAT_B4G4R4A4_UNORM_PACK16;
             imageInitializerFunction     = nullptr;
@@ -412,6 +445,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::B5G5R5A1_UNORM:
             internalFormat               = GL_BGR5_A1_ANGLEX;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::B5G5R5A1_UNORM;
             vkImageFormat                = VK_FORMAT_B5G5R5A1_UNORM_PACK16;
             imageInitializerFunction     = nullptr;
@@ -424,6 +458,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::B5G6R5_UNORM:
             internalFormat               = GL_BGR565_ANGLEX;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::B5G6R5_UNORM;
             vkImageFormat                = VK_FORMAT_B5G6R5_UNORM_PACK16;
             imageInitializerFunction     = nullptr;
@@ -444,6 +479,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::B8G8R8A8_UNORM:
             internalFormat               = GL_BGRA8_EXT;
+            guaranteedSupport            = kImageSupportGuaranteed | kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::B8G8R8A8_UNORM;
             vkImageFormat                = VK_FORMAT_B8G8R8A8_UNORM;
             imageInitializerFunction     = nullptr;
@@ -456,6 +492,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::B8G8R8A8_UNORM_SRGB:
             internalFormat               = GL_BGRA8_SRGB_ANGLEX;
+            guaranteedSupport            = kImageSupportGuaranteed;
             imageFormatID                = angle::FormatID::B8G8R8A8_UNORM_SRGB;
             vkImageFormat                = VK_FORMAT_B8G8R8A8_SRGB;
             imageInitializerFunction     = nullptr;
@@ -468,6 +505,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::B8G8R8X8_UNORM:
             internalFormat               = GL_BGRX8_ANGLEX;
+            guaranteedSupport            = kImageSupportGuaranteed;
             imageFormatID                = angle::FormatID::B8G8R8A8_UNORM;
             vkImageFormat                = VK_FORMAT_B8G8R8A8_UNORM;
             imageInitializerFunction     = nullptr;
@@ -480,6 +518,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::BC1_RGBA_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_S3TC_DXT1_EXT;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::BC1_RGBA_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_BC1_RGBA_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -492,6 +531,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::BC1_RGBA_UNORM_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_EXT;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::BC1_RGBA_UNORM_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_BC1_RGBA_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -504,6 +544,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::BC1_RGB_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGB_S3TC_DXT1_EXT;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::BC1_RGB_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_BC1_RGB_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -516,6 +557,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::BC1_RGB_UNORM_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB_S3TC_DXT1_EXT;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::BC1_RGB_UNORM_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_BC1_RGB_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -528,6 +570,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::BC2_RGBA_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_S3TC_DXT3_ANGLE;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::BC2_RGBA_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_BC2_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -540,6 +583,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::BC2_RGBA_UNORM_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_EXT;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::BC2_RGBA_UNORM_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_BC2_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -552,6 +596,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::BC3_RGBA_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_S3TC_DXT5_ANGLE;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::BC3_RGBA_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_BC3_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -564,6 +609,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::BC3_RGBA_UNORM_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_EXT;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::BC3_RGBA_UNORM_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_BC3_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -576,6 +622,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::BPTC_RGBA_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA_BPTC_UNORM_EXT;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::BPTC_RGBA_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_BC7_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -588,6 +635,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::BPTC_RGB_SIGNED_FLOAT_BLOCK:
             internalFormat               = GL_COMPRESSED_RGB_BPTC_SIGNED_FLOAT_EXT;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::BPTC_RGB_SIGNED_FLOAT_BLOCK;
             vkImageFormat                = VK_FORMAT_BC6H_SFLOAT_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -600,6 +648,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::BPTC_RGB_UNSIGNED_FLOAT_BLOCK:
             internalFormat               = GL_COMPRESSED_RGB_BPTC_UNSIGNED_FLOAT_EXT;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::BPTC_RGB_UNSIGNED_FLOAT_BLOCK;
             vkImageFormat                = VK_FORMAT_BC6H_UFLOAT_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -612,6 +661,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::BPTC_SRGB_ALPHA_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM_EXT;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::BPTC_SRGB_ALPHA_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_BC7_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -624,6 +674,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::D16_UNORM:
             internalFormat               = GL_DEPTH_COMPONENT16;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::D16_UNORM;
             vkImageFormat                = VK_FORMAT_D16_UNORM;
             imageInitializerFunction     = nullptr;
@@ -635,7 +686,8 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::D24_UNORM_S8_UINT:
-            internalFormat = GL_DEPTH24_STENCIL8;
+            internalFormat    = GL_DEPTH24_STENCIL8;
+            guaranteedSupport = 0;
             {
                 static constexpr ImageFormatInitInfo kInfo[] = {
                     {angle::FormatID::D24_UNORM_S8_UINT, VK_FORMAT_D24_UNORM_S8_UINT, nullptr},
@@ -651,7 +703,8 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::D24_UNORM_X8_UINT:
-            internalFormat = GL_DEPTH_COMPONENT24;
+            internalFormat    = GL_DEPTH_COMPONENT24;
+            guaranteedSupport = 0;
             {
                 static constexpr ImageFormatInitInfo kInfo[] = {
                     {angle::FormatID::D24_UNORM_S8_UINT, VK_FORMAT_D24_UNORM_S8_UINT, nullptr},
@@ -668,6 +721,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::D32_FLOAT:
             internalFormat               = GL_DEPTH_COMPONENT32F;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::D32_FLOAT;
             vkImageFormat                = VK_FORMAT_D32_SFLOAT;
             imageInitializerFunction     = nullptr;
@@ -679,7 +733,8 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::D32_FLOAT_S8X24_UINT:
-            internalFormat = GL_DEPTH32F_STENCIL8;
+            internalFormat    = GL_DEPTH32F_STENCIL8;
+            guaranteedSupport = 0;
             {
                 static constexpr ImageFormatInitInfo kInfo[] = {
                     {angle::FormatID::D32_FLOAT_S8X24_UINT, VK_FORMAT_D32_SFLOAT_S8_UINT, nullptr},
@@ -700,6 +755,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::EAC_R11G11_SNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_SIGNED_RG11_EAC;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::EAC_R11G11_SNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_EAC_R11G11_SNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -712,6 +768,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::EAC_R11G11_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RG11_EAC;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::EAC_R11G11_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_EAC_R11G11_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -724,6 +781,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::EAC_R11_SNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_SIGNED_R11_EAC;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::EAC_R11_SNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_EAC_R11_SNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -736,6 +794,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::EAC_R11_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_R11_EAC;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::EAC_R11_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_EAC_R11_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -752,6 +811,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ETC1_R8G8B8_UNORM_BLOCK:
             internalFormat               = GL_ETC1_RGB8_OES;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ETC2_R8G8B8_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -764,6 +824,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ETC2_R8G8B8A1_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_PUNCHTHROUGH_ALPHA1_ETC2;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ETC2_R8G8B8A1_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -776,6 +837,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ETC2_R8G8B8A1_UNORM_BLOCK:
             internalFormat           = GL_COMPRESSED_RGB8_PUNCHTHROUGH_ALPHA1_ETC2;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::ETC2_R8G8B8A1_UNORM_BLOCK;
             vkImageFormat            = VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK;
             imageInitializerFunction = Initialize4ComponentData<GLubyte, 0x00, 0x00, 0x00, 0xFF>;
@@ -788,6 +850,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ETC2_R8G8B8A8_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ALPHA8_ETC2_EAC;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ETC2_R8G8B8A8_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -800,6 +863,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ETC2_R8G8B8A8_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGBA8_ETC2_EAC;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ETC2_R8G8B8A8_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -812,6 +876,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ETC2_R8G8B8_SRGB_BLOCK:
             internalFormat               = GL_COMPRESSED_SRGB8_ETC2;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ETC2_R8G8B8_SRGB_BLOCK;
             vkImageFormat                = VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -824,6 +889,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::ETC2_R8G8B8_UNORM_BLOCK:
             internalFormat               = GL_COMPRESSED_RGB8_ETC2;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::ETC2_R8G8B8_UNORM_BLOCK;
             vkImageFormat                = VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK;
             imageInitializerFunction     = nullptr;
@@ -852,6 +918,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::L8A8_UNORM:
             internalFormat           = GL_LUMINANCE8_ALPHA8_EXT;
+            guaranteedSupport        = kImageSupportGuaranteed;
             imageFormatID            = angle::FormatID::R8G8_UNORM;
             vkImageFormat            = VK_FORMAT_R8G8_UNORM;
             imageInitializerFunction = nullptr;
@@ -860,6 +927,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::L8_UNORM:
             internalFormat           = GL_LUMINANCE8_EXT;
+            guaranteedSupport        = kImageSupportGuaranteed;
             imageFormatID            = angle::FormatID::R8_UNORM;
             vkImageFormat            = VK_FORMAT_R8_UNORM;
             imageInitializerFunction = nullptr;
@@ -872,6 +940,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R10G10B10A2_SINT:
             internalFormat               = GL_RGB10_A2_SINT_ANGLEX;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::R10G10B10A2_SINT;
             vkImageFormat                = VK_FORMAT_A2B10G10R10_SINT_PACK32;
             imageInitializerFunction     = nullptr;
@@ -884,6 +953,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R10G10B10A2_SNORM:
             internalFormat               = GL_RGB10_A2_SNORM_ANGLEX;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::R10G10B10A2_SNORM;
             vkImageFormat                = VK_FORMAT_A2B10G10R10_SNORM_PACK32;
             imageInitializerFunction     = nullptr;
@@ -896,6 +966,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R10G10B10A2_SSCALED:
             internalFormat               = GL_RGB10_A2_SSCALED_ANGLEX;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::R10G10B10A2_SSCALED;
             vkImageFormat                = VK_FORMAT_A2B10G10R10_SSCALED_PACK32;
             imageInitializerFunction     = nullptr;
@@ -908,6 +979,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R10G10B10A2_UINT:
             internalFormat               = GL_RGB10_A2UI;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::R10G10B10A2_UINT;
             vkImageFormat                = VK_FORMAT_A2B10G10R10_UINT_PACK32;
             imageInitializerFunction     = nullptr;
@@ -920,6 +992,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R10G10B10A2_UNORM:
             internalFormat               = GL_RGB10_A2;
+            guaranteedSupport            = kImageSupportGuaranteed | kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R10G10B10A2_UNORM;
             vkImageFormat                = VK_FORMAT_A2B10G10R10_UNORM_PACK32;
             imageInitializerFunction     = nullptr;
@@ -932,6 +1005,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R10G10B10A2_USCALED:
             internalFormat               = GL_RGB10_A2_USCALED_ANGLEX;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::R10G10B10A2_USCALED;
             vkImageFormat                = VK_FORMAT_A2B10G10R10_USCALED_PACK32;
             imageInitializerFunction     = nullptr;
@@ -947,7 +1021,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R16G16B16A16_FLOAT:
-            internalFormat               = GL_RGBA16F;
+            internalFormat    = GL_RGBA16F;
+            guaranteedSupport = kImageSupportGuaranteed | kVertexBufferSupportGuaranteed |
+                                kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R16G16B16A16_FLOAT;
             vkImageFormat                = VK_FORMAT_R16G16B16A16_SFLOAT;
             imageInitializerFunction     = nullptr;
@@ -959,7 +1035,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R16G16B16A16_SINT:
-            internalFormat               = GL_RGBA16I;
+            internalFormat = GL_RGBA16I;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R16G16B16A16_SINT;
             vkImageFormat                = VK_FORMAT_R16G16B16A16_SINT;
             imageInitializerFunction     = nullptr;
@@ -972,6 +1050,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16B16A16_SNORM:
             internalFormat           = GL_RGBA16_SNORM_EXT;
+            guaranteedSupport        = kVertexBufferSupportGuaranteed;
             imageFormatID            = angle::FormatID::R16G16B16A16_SNORM;
             vkImageFormat            = VK_FORMAT_R16G16B16A16_SNORM;
             imageInitializerFunction = nullptr;
@@ -987,6 +1066,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16B16A16_SSCALED:
             internalFormat           = GL_RGBA16_SSCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R16G16B16A16_SSCALED;
             vkImageFormat            = VK_FORMAT_R16G16B16A16_SSCALED;
             imageInitializerFunction = nullptr;
@@ -1001,7 +1081,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R16G16B16A16_UINT:
-            internalFormat               = GL_RGBA16UI;
+            internalFormat = GL_RGBA16UI;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R16G16B16A16_UINT;
             vkImageFormat                = VK_FORMAT_R16G16B16A16_UINT;
             imageInitializerFunction     = nullptr;
@@ -1014,6 +1096,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16B16A16_UNORM:
             internalFormat           = GL_RGBA16_EXT;
+            guaranteedSupport        = kVertexBufferSupportGuaranteed;
             imageFormatID            = angle::FormatID::R16G16B16A16_UNORM;
             vkImageFormat            = VK_FORMAT_R16G16B16A16_UNORM;
             imageInitializerFunction = nullptr;
@@ -1029,6 +1112,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16B16A16_USCALED:
             internalFormat           = GL_RGBA16_USCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R16G16B16A16_USCALED;
             vkImageFormat            = VK_FORMAT_R16G16B16A16_USCALED;
             imageInitializerFunction = nullptr;
@@ -1044,6 +1128,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16B16_FLOAT:
             internalFormat               = GL_RGB16F;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::R16G16B16_FLOAT;
             vkImageFormat                = VK_FORMAT_R16G16B16_SFLOAT;
             imageInitializerFunction     = nullptr;
@@ -1056,6 +1141,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16B16_SINT:
             internalFormat               = GL_RGB16I;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::R16G16B16_SINT;
             vkImageFormat                = VK_FORMAT_R16G16B16_SINT;
             imageInitializerFunction     = nullptr;
@@ -1068,6 +1154,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16B16_SNORM:
             internalFormat           = GL_RGB16_SNORM_EXT;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R16G16B16_SNORM;
             vkImageFormat            = VK_FORMAT_R16G16B16_SNORM;
             imageInitializerFunction = nullptr;
@@ -1083,6 +1170,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16B16_SSCALED:
             internalFormat           = GL_RGB16_SSCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R16G16B16_SSCALED;
             vkImageFormat            = VK_FORMAT_R16G16B16_SSCALED;
             imageInitializerFunction = nullptr;
@@ -1098,6 +1186,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16B16_UINT:
             internalFormat               = GL_RGB16UI;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::R16G16B16_UINT;
             vkImageFormat                = VK_FORMAT_R16G16B16_UINT;
             imageInitializerFunction     = nullptr;
@@ -1110,6 +1199,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16B16_UNORM:
             internalFormat           = GL_RGB16_EXT;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R16G16B16_UNORM;
             vkImageFormat            = VK_FORMAT_R16G16B16_UNORM;
             imageInitializerFunction = nullptr;
@@ -1125,6 +1215,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16B16_USCALED:
             internalFormat           = GL_RGB16_USCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R16G16B16_USCALED;
             vkImageFormat            = VK_FORMAT_R16G16B16_USCALED;
             imageInitializerFunction = nullptr;
@@ -1140,6 +1231,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16_FLOAT:
             internalFormat               = GL_RG16F;
+            guaranteedSupport            = kImageSupportGuaranteed | kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R16G16_FLOAT;
             vkImageFormat                = VK_FORMAT_R16G16_SFLOAT;
             imageInitializerFunction     = nullptr;
@@ -1152,6 +1244,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16_SINT:
             internalFormat               = GL_RG16I;
+            guaranteedSupport            = kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R16G16_SINT;
             vkImageFormat                = VK_FORMAT_R16G16_SINT;
             imageInitializerFunction     = nullptr;
@@ -1164,6 +1257,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16_SNORM:
             internalFormat           = GL_RG16_SNORM_EXT;
+            guaranteedSupport        = kVertexBufferSupportGuaranteed;
             imageFormatID            = angle::FormatID::R16G16_SNORM;
             vkImageFormat            = VK_FORMAT_R16G16_SNORM;
             imageInitializerFunction = nullptr;
@@ -1179,6 +1273,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16_SSCALED:
             internalFormat           = GL_RG16_SSCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R16G16_SSCALED;
             vkImageFormat            = VK_FORMAT_R16G16_SSCALED;
             imageInitializerFunction = nullptr;
@@ -1194,6 +1289,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16_UINT:
             internalFormat               = GL_RG16UI;
+            guaranteedSupport            = kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R16G16_UINT;
             vkImageFormat                = VK_FORMAT_R16G16_UINT;
             imageInitializerFunction     = nullptr;
@@ -1206,6 +1302,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16_UNORM:
             internalFormat           = GL_RG16_EXT;
+            guaranteedSupport        = kVertexBufferSupportGuaranteed;
             imageFormatID            = angle::FormatID::R16G16_UNORM;
             vkImageFormat            = VK_FORMAT_R16G16_UNORM;
             imageInitializerFunction = nullptr;
@@ -1221,6 +1318,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16G16_USCALED:
             internalFormat           = GL_RG16_USCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R16G16_USCALED;
             vkImageFormat            = VK_FORMAT_R16G16_USCALED;
             imageInitializerFunction = nullptr;
@@ -1236,6 +1334,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16_FLOAT:
             internalFormat               = GL_R16F;
+            guaranteedSupport            = kImageSupportGuaranteed | kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R16_FLOAT;
             vkImageFormat                = VK_FORMAT_R16_SFLOAT;
             imageInitializerFunction     = nullptr;
@@ -1248,6 +1347,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16_SINT:
             internalFormat               = GL_R16I;
+            guaranteedSupport            = kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R16_SINT;
             vkImageFormat                = VK_FORMAT_R16_SINT;
             imageInitializerFunction     = nullptr;
@@ -1260,6 +1360,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16_SNORM:
             internalFormat           = GL_R16_SNORM_EXT;
+            guaranteedSupport        = kVertexBufferSupportGuaranteed;
             imageFormatID            = angle::FormatID::R16_SNORM;
             vkImageFormat            = VK_FORMAT_R16_SNORM;
             imageInitializerFunction = nullptr;
@@ -1275,6 +1376,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16_SSCALED:
             internalFormat           = GL_R16_SSCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R16_SSCALED;
             vkImageFormat            = VK_FORMAT_R16_SSCALED;
             imageInitializerFunction = nullptr;
@@ -1290,6 +1392,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16_UINT:
             internalFormat               = GL_R16UI;
+            guaranteedSupport            = kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R16_UINT;
             vkImageFormat                = VK_FORMAT_R16_UINT;
             imageInitializerFunction     = nullptr;
@@ -1302,6 +1405,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16_UNORM:
             internalFormat           = GL_R16_EXT;
+            guaranteedSupport        = kVertexBufferSupportGuaranteed;
             imageFormatID            = angle::FormatID::R16_UNORM;
             vkImageFormat            = VK_FORMAT_R16_UNORM;
             imageInitializerFunction = nullptr;
@@ -1317,6 +1421,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R16_USCALED:
             internalFormat           = GL_R16_USCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R16_USCALED;
             vkImageFormat            = VK_FORMAT_R16_USCALED;
             imageInitializerFunction = nullptr;
@@ -1332,6 +1437,8 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R32G32B32A32_FIXED:
             internalFormat = GL_RGBA32_FIXED_ANGLEX;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
 
             bufferFormatID               = angle::FormatID::R32G32B32A32_FLOAT;
             vkBufferFormat               = VK_FORMAT_R32G32B32A32_SFLOAT;
@@ -1341,7 +1448,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R32G32B32A32_FLOAT:
-            internalFormat               = GL_RGBA32F;
+            internalFormat = GL_RGBA32F;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R32G32B32A32_FLOAT;
             vkImageFormat                = VK_FORMAT_R32G32B32A32_SFLOAT;
             imageInitializerFunction     = nullptr;
@@ -1353,7 +1462,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R32G32B32A32_SINT:
-            internalFormat               = GL_RGBA32I;
+            internalFormat = GL_RGBA32I;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R32G32B32A32_SINT;
             vkImageFormat                = VK_FORMAT_R32G32B32A32_SINT;
             imageInitializerFunction     = nullptr;
@@ -1373,7 +1484,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R32G32B32A32_UINT:
-            internalFormat               = GL_RGBA32UI;
+            internalFormat = GL_RGBA32UI;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R32G32B32A32_UINT;
             vkImageFormat                = VK_FORMAT_R32G32B32A32_UINT;
             imageInitializerFunction     = nullptr;
@@ -1393,7 +1506,8 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R32G32B32_FIXED:
-            internalFormat = GL_RGB32_FIXED_ANGLEX;
+            internalFormat    = GL_RGB32_FIXED_ANGLEX;
+            guaranteedSupport = kVertexBufferSupportGuaranteed;
 
             bufferFormatID               = angle::FormatID::R32G32B32_FLOAT;
             vkBufferFormat               = VK_FORMAT_R32G32B32_SFLOAT;
@@ -1404,6 +1518,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R32G32B32_FLOAT:
             internalFormat               = GL_RGB32F;
+            guaranteedSupport            = kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R32G32B32_FLOAT;
             vkImageFormat                = VK_FORMAT_R32G32B32_SFLOAT;
             imageInitializerFunction     = nullptr;
@@ -1416,6 +1531,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R32G32B32_SINT:
             internalFormat               = GL_RGB32I;
+            guaranteedSupport            = kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R32G32B32_SINT;
             vkImageFormat                = VK_FORMAT_R32G32B32_SINT;
             imageInitializerFunction     = nullptr;
@@ -1436,6 +1552,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R32G32B32_UINT:
             internalFormat               = GL_RGB32UI;
+            guaranteedSupport            = kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R32G32B32_UINT;
             vkImageFormat                = VK_FORMAT_R32G32B32_UINT;
             imageInitializerFunction     = nullptr;
@@ -1456,6 +1573,8 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R32G32_FIXED:
             internalFormat = GL_RG32_FIXED_ANGLEX;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
 
             bufferFormatID               = angle::FormatID::R32G32_FLOAT;
             vkBufferFormat               = VK_FORMAT_R32G32_SFLOAT;
@@ -1465,7 +1584,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R32G32_FLOAT:
-            internalFormat               = GL_RG32F;
+            internalFormat = GL_RG32F;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R32G32_FLOAT;
             vkImageFormat                = VK_FORMAT_R32G32_SFLOAT;
             imageInitializerFunction     = nullptr;
@@ -1477,7 +1598,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R32G32_SINT:
-            internalFormat               = GL_RG32I;
+            internalFormat = GL_RG32I;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R32G32_SINT;
             vkImageFormat                = VK_FORMAT_R32G32_SINT;
             imageInitializerFunction     = nullptr;
@@ -1497,7 +1620,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R32G32_UINT:
-            internalFormat               = GL_RG32UI;
+            internalFormat = GL_RG32UI;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R32G32_UINT;
             vkImageFormat                = VK_FORMAT_R32G32_UINT;
             imageInitializerFunction     = nullptr;
@@ -1518,6 +1643,8 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R32_FIXED:
             internalFormat = GL_R32_FIXED_ANGLEX;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
 
             bufferFormatID               = angle::FormatID::R32_FLOAT;
             vkBufferFormat               = VK_FORMAT_R32_SFLOAT;
@@ -1527,7 +1654,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R32_FLOAT:
-            internalFormat               = GL_R32F;
+            internalFormat = GL_R32F;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R32_FLOAT;
             vkImageFormat                = VK_FORMAT_R32_SFLOAT;
             imageInitializerFunction     = nullptr;
@@ -1539,7 +1668,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R32_SINT:
-            internalFormat               = GL_R32I;
+            internalFormat = GL_R32I;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R32_SINT;
             vkImageFormat                = VK_FORMAT_R32_SINT;
             imageInitializerFunction     = nullptr;
@@ -1559,7 +1690,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R32_UINT:
-            internalFormat               = GL_R32UI;
+            internalFormat = GL_R32UI;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R32_UINT;
             vkImageFormat                = VK_FORMAT_R32_UINT;
             imageInitializerFunction     = nullptr;
@@ -1580,6 +1713,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R4G4B4A4_UNORM:
             internalFormat               = GL_RGBA4;
+            guaranteedSupport            = kImageSupportGuaranteed;
             imageFormatID                = angle::FormatID::R8G8B8A8_UNORM;
             vkImageFormat                = VK_FORMAT_R8G8B8A8_UNORM;
             imageInitializerFunction     = nullptr;
@@ -1592,6 +1726,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R5G5B5A1_UNORM:
             internalFormat               = GL_RGB5_A1;
+            guaranteedSupport            = kImageSupportGuaranteed;
             imageFormatID                = angle::FormatID::A1R5G5B5_UNORM;
             vkImageFormat                = VK_FORMAT_A1R5G5B5_UNORM_PACK16;
             imageInitializerFunction     = nullptr;
@@ -1604,6 +1739,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R5G6B5_UNORM:
             internalFormat               = GL_RGB565;
+            guaranteedSupport            = kImageSupportGuaranteed;
             imageFormatID                = angle::FormatID::R5G6B5_UNORM;
             vkImageFormat                = VK_FORMAT_R5G6B5_UNORM_PACK16;
             imageInitializerFunction     = nullptr;
@@ -1615,7 +1751,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R8G8B8A8_SINT:
-            internalFormat               = GL_RGBA8I;
+            internalFormat = GL_RGBA8I;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R8G8B8A8_SINT;
             vkImageFormat                = VK_FORMAT_R8G8B8A8_SINT;
             imageInitializerFunction     = nullptr;
@@ -1627,7 +1765,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R8G8B8A8_SNORM:
-            internalFormat           = GL_RGBA8_SNORM;
+            internalFormat = GL_RGBA8_SNORM;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID            = angle::FormatID::R8G8B8A8_SNORM;
             vkImageFormat            = VK_FORMAT_R8G8B8A8_SNORM;
             imageInitializerFunction = nullptr;
@@ -1643,6 +1783,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8B8A8_SSCALED:
             internalFormat           = GL_RGBA8_SSCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R8G8B8A8_SSCALED;
             vkImageFormat            = VK_FORMAT_R8G8B8A8_SSCALED;
             imageInitializerFunction = nullptr;
@@ -1665,7 +1806,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R8G8B8A8_UINT:
-            internalFormat               = GL_RGBA8UI;
+            internalFormat = GL_RGBA8UI;
+            guaranteedSupport =
+                kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R8G8B8A8_UINT;
             vkImageFormat                = VK_FORMAT_R8G8B8A8_UINT;
             imageInitializerFunction     = nullptr;
@@ -1677,7 +1820,9 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::R8G8B8A8_UNORM:
-            internalFormat           = GL_RGBA8;
+            internalFormat    = GL_RGBA8;
+            guaranteedSupport = kImageSupportGuaranteed | kVertexBufferSupportGuaranteed |
+                                kStorageTexelBufferSupportGuaranteed;
             imageFormatID            = angle::FormatID::R8G8B8A8_UNORM;
             vkImageFormat            = VK_FORMAT_R8G8B8A8_UNORM;
             imageInitializerFunction = nullptr;
@@ -1693,6 +1838,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8B8A8_UNORM_SRGB:
             internalFormat               = GL_SRGB8_ALPHA8;
+            guaranteedSupport            = kImageSupportGuaranteed;
             imageFormatID                = angle::FormatID::R8G8B8A8_UNORM_SRGB;
             vkImageFormat                = VK_FORMAT_R8G8B8A8_SRGB;
             imageInitializerFunction     = nullptr;
@@ -1705,6 +1851,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8B8A8_USCALED:
             internalFormat           = GL_RGBA8_USCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R8G8B8A8_USCALED;
             vkImageFormat            = VK_FORMAT_R8G8B8A8_USCALED;
             imageInitializerFunction = nullptr;
@@ -1720,6 +1867,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8B8_SINT:
             internalFormat               = GL_RGB8I;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::R8G8B8_SINT;
             vkImageFormat                = VK_FORMAT_R8G8B8_SINT;
             imageInitializerFunction     = nullptr;
@@ -1732,6 +1880,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8B8_SNORM:
             internalFormat           = GL_RGB8_SNORM;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R8G8B8_SNORM;
             vkImageFormat            = VK_FORMAT_R8G8B8_SNORM;
             imageInitializerFunction = nullptr;
@@ -1747,6 +1896,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8B8_SSCALED:
             internalFormat           = GL_RGB8_SSCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R8G8B8_SSCALED;
             vkImageFormat            = VK_FORMAT_R8G8B8_SSCALED;
             imageInitializerFunction = nullptr;
@@ -1762,6 +1912,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8B8_UINT:
             internalFormat               = GL_RGB8UI;
+            guaranteedSupport            = 0;
             imageFormatID                = angle::FormatID::R8G8B8_UINT;
             vkImageFormat                = VK_FORMAT_R8G8B8_UINT;
             imageInitializerFunction     = nullptr;
@@ -1774,6 +1925,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8B8_UNORM:
             internalFormat           = GL_RGB8;
+            guaranteedSupport        = kImageSupportGuaranteed;
             imageFormatID            = angle::FormatID::R8G8B8A8_UNORM;
             vkImageFormat            = VK_FORMAT_R8G8B8A8_UNORM;
             imageInitializerFunction = Initialize4ComponentData<GLubyte, 0x00, 0x00, 0x00, 0xFF>;
@@ -1789,6 +1941,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8B8_UNORM_SRGB:
             internalFormat           = GL_SRGB8;
+            guaranteedSupport        = kImageSupportGuaranteed;
             imageFormatID            = angle::FormatID::R8G8B8A8_UNORM_SRGB;
             vkImageFormat            = VK_FORMAT_R8G8B8A8_SRGB;
             imageInitializerFunction = Initialize4ComponentData<GLubyte, 0x00, 0x00, 0x00, 0xFF>;
@@ -1801,6 +1954,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8B8_USCALED:
             internalFormat           = GL_RGB8_USCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R8G8B8_USCALED;
             vkImageFormat            = VK_FORMAT_R8G8B8_USCALED;
             imageInitializerFunction = nullptr;
@@ -1816,6 +1970,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8_SINT:
             internalFormat               = GL_RG8I;
+            guaranteedSupport            = kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R8G8_SINT;
             vkImageFormat                = VK_FORMAT_R8G8_SINT;
             imageInitializerFunction     = nullptr;
@@ -1828,6 +1983,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8_SNORM:
             internalFormat           = GL_RG8_SNORM;
+            guaranteedSupport        = kVertexBufferSupportGuaranteed;
             imageFormatID            = angle::FormatID::R8G8_SNORM;
             vkImageFormat            = VK_FORMAT_R8G8_SNORM;
             imageInitializerFunction = nullptr;
@@ -1843,6 +1999,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8_SSCALED:
             internalFormat           = GL_RG8_SSCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R8G8_SSCALED;
             vkImageFormat            = VK_FORMAT_R8G8_SSCALED;
             imageInitializerFunction = nullptr;
@@ -1858,6 +2015,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8_UINT:
             internalFormat               = GL_RG8UI;
+            guaranteedSupport            = kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R8G8_UINT;
             vkImageFormat                = VK_FORMAT_R8G8_UINT;
             imageInitializerFunction     = nullptr;
@@ -1870,6 +2028,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8_UNORM:
             internalFormat           = GL_RG8;
+            guaranteedSupport        = kImageSupportGuaranteed | kVertexBufferSupportGuaranteed;
             imageFormatID            = angle::FormatID::R8G8_UNORM;
             vkImageFormat            = VK_FORMAT_R8G8_UNORM;
             imageInitializerFunction = nullptr;
@@ -1885,6 +2044,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8G8_USCALED:
             internalFormat           = GL_RG8_USCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R8G8_USCALED;
             vkImageFormat            = VK_FORMAT_R8G8_USCALED;
             imageInitializerFunction = nullptr;
@@ -1900,6 +2060,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8_SINT:
             internalFormat               = GL_R8I;
+            guaranteedSupport            = kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R8_SINT;
             vkImageFormat                = VK_FORMAT_R8_SINT;
             imageInitializerFunction     = nullptr;
@@ -1912,6 +2073,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8_SNORM:
             internalFormat           = GL_R8_SNORM;
+            guaranteedSupport        = kVertexBufferSupportGuaranteed;
             imageFormatID            = angle::FormatID::R8_SNORM;
             vkImageFormat            = VK_FORMAT_R8_SNORM;
             imageInitializerFunction = nullptr;
@@ -1927,6 +2089,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8_SSCALED:
             internalFormat           = GL_R8_SSCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R8_SSCALED;
             vkImageFormat            = VK_FORMAT_R8_SSCALED;
             imageInitializerFunction = nullptr;
@@ -1942,6 +2105,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8_UINT:
             internalFormat               = GL_R8UI;
+            guaranteedSupport            = kVertexBufferSupportGuaranteed;
             imageFormatID                = angle::FormatID::R8_UINT;
             vkImageFormat                = VK_FORMAT_R8_UINT;
             imageInitializerFunction     = nullptr;
@@ -1954,6 +2118,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8_UNORM:
             internalFormat           = GL_R8;
+            guaranteedSupport        = kImageSupportGuaranteed | kVertexBufferSupportGuaranteed;
             imageFormatID            = angle::FormatID::R8_UNORM;
             vkImageFormat            = VK_FORMAT_R8_UNORM;
             imageInitializerFunction = nullptr;
@@ -1969,6 +2134,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
 
         case angle::FormatID::R8_USCALED:
             internalFormat           = GL_R8_USCALED_ANGLEX;
+            guaranteedSupport        = 0;
             imageFormatID            = angle::FormatID::R8_USCALED;
             vkImageFormat            = VK_FORMAT_R8_USCALED;
             imageInitializerFunction = nullptr;
@@ -1987,7 +2153,8 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
             break;
 
         case angle::FormatID::S8_UINT:
-            internalFormat = GL_STENCIL_INDEX8;
+            internalFormat    = GL_STENCIL_INDEX8;
+            guaranteedSupport = 0;
             {
                 static constexpr ImageFormatInitInfo kInfo[] = {
                     {angle::FormatID::S8_UINT, VK_FORMAT_S8_UINT, nullptr},
@@ -2009,6 +2176,151 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
     }
 }
 
+const VkFormat *GetFormatTableVkFormats(size_t *countOut)
+{
+    // The distinct VkFormats the format table looks up first for an image or a buffer, minus those
+    // where the mandatory format support table answers every feature the format table checks.
+    static constexpr VkFormat kVkFormats[] = {
+        VK_FORMAT_A1R5G5B5_UNORM_PACK16,
+        VK_FORMAT_A2B10G10R10_SINT_PACK32,
+        VK_FORMAT_A2B10G10R10_SNORM_PACK32,
+        VK_FORMAT_A2B10G10R10_SSCALED_PACK32,
+        VK_FORMAT_A2B10G10R10_UINT_PACK32,
+        VK_FORMAT_A2B10G10R10_UNORM_PACK32,
+        VK_FORMAT_A2B10G10R10_USCALED_PACK32,
+        VK_FORMAT_ASTC_10x10_SRGB_BLOCK,
+        VK_FORMAT_ASTC_10x10_UNORM_BLOCK,
+        VK_FORMAT_ASTC_10x5_SRGB_BLOCK,
+        VK_FORMAT_ASTC_10x5_UNORM_BLOCK,
+        VK_FORMAT_ASTC_10x6_SRGB_BLOCK,
+        VK_FORMAT_ASTC_10x6_UNORM_BLOCK,
+        VK_FORMAT_ASTC_10x8_SRGB_BLOCK,
+        VK_FORMAT_ASTC_10x8_UNORM_BLOCK,
+        VK_FORMAT_ASTC_12x10_SRGB_BLOCK,
+        VK_FORMAT_ASTC_12x10_UNORM_BLOCK,
+        VK_FORMAT_ASTC_12x12_SRGB_BLOCK,
+        VK_FORMAT_ASTC_12x12_UNORM_BLOCK,
+        VK_FORMAT_ASTC_4x4_SRGB_BLOCK,
+        VK_FORMAT_ASTC_4x4_UNORM_BLOCK,
+        VK_FORMAT_ASTC_5x4_SRGB_BLOCK,
+        VK_FORMAT_ASTC_5x4_UNORM_BLOCK,
+        VK_FORMAT_ASTC_5x5_SRGB_BLOCK,
+        VK_FORMAT_ASTC_5x5_UNORM_BLOCK,
+        VK_FORMAT_ASTC_6x5_SRGB_BLOCK,
+        VK_FORMAT_ASTC_6x5_UNORM_BLOCK,
+        VK_FORMAT_ASTC_6x6_SRGB_BLOCK,
+        VK_FORMAT_ASTC_6x6_UNORM_BLOCK,
+        VK_FORMAT_ASTC_8x5_SRGB_BLOCK,
+        VK_FORMAT_ASTC_8x5_UNORM_BLOCK,
+        VK_FORMAT_ASTC_8x6_SRGB_BLOCK,
+        VK_FORMAT_ASTC_8x6_UNORM_BLOCK,
+        VK_FORMAT_ASTC_8x8_SRGB_BLOCK,
+        VK_FORMAT_ASTC_8x8_UNORM_BLOCK,
+        VK_FORMAT_B4G4R4A4_UNORM_PACK16,
+        VK_FORMAT_B5G5R5A1_UNORM_PACK16,
+        VK_FORMAT_B5G6R5_UNORM_PACK16,
+        VK_FORMAT_B8G8R8A8_SRGB,
+        VK_FORMAT_B8G8R8A8_UNORM,
+        VK_FORMAT_BC1_RGBA_SRGB_BLOCK,
+        VK_FORMAT_BC1_RGBA_UNORM_BLOCK,
+        VK_FORMAT_BC1_RGB_SRGB_BLOCK,
+        VK_FORMAT_BC1_RGB_UNORM_BLOCK,
+        VK_FORMAT_BC2_SRGB_BLOCK,
+        VK_FORMAT_BC2_UNORM_BLOCK,
+        VK_FORMAT_BC3_SRGB_BLOCK,
+        VK_FORMAT_BC3_UNORM_BLOCK,
+        VK_FORMAT_BC6H_SFLOAT_BLOCK,
+        VK_FORMAT_BC6H_UFLOAT_BLOCK,
+        VK_FORMAT_BC7_SRGB_BLOCK,
+        VK_FORMAT_BC7_UNORM_BLOCK,
+        VK_FORMAT_D16_UNORM,
+        VK_FORMAT_D24_UNORM_S8_UINT,
+        VK_FORMAT_D32_SFLOAT,
+        VK_FORMAT_D32_SFLOAT_S8_UINT,
+        VK_FORMAT_EAC_R11G11_SNORM_BLOCK,
+        VK_FORMAT_EAC_R11G11_UNORM_BLOCK,
+        VK_FORMAT_EAC_R11_SNORM_BLOCK,
+        VK_FORMAT_EAC_R11_UNORM_BLOCK,
+        VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK,
+        VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK,
+        VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK,
+        VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK,
+        VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK,
+        VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK,
+        VK_FORMAT_R16G16B16A16_SINT,
+        VK_FORMAT_R16G16B16A16_SNORM,
+        VK_FORMAT_R16G16B16A16_SSCALED,
+        VK_FORMAT_R16G16B16A16_UINT,
+        VK_FORMAT_R16G16B16A16_UNORM,
+        VK_FORMAT_R16G16B16A16_USCALED,
+        VK_FORMAT_R16G16B16_SFLOAT,
+        VK_FORMAT_R16G16B16_SINT,
+        VK_FORMAT_R16G16B16_SNORM,
+        VK_FORMAT_R16G16B16_SSCALED,
+        VK_FORMAT_R16G16B16_UINT,
+        VK_FORMAT_R16G16B16_UNORM,
+        VK_FORMAT_R16G16B16_USCALED,
+        VK_FORMAT_R16G16_SFLOAT,
+        VK_FORMAT_R16G16_SINT,
+        VK_FORMAT_R16G16_SNORM,
+        VK_FORMAT_R16G16_SSCALED,
+        VK_FORMAT_R16G16_UINT,
+        VK_FORMAT_R16G16_UNORM,
+        VK_FORMAT_R16G16_USCALED,
+        VK_FORMAT_R16_SFLOAT,
+        VK_FORMAT_R16_SINT,
+        VK_FORMAT_R16_SNORM,
+        VK_FORMAT_R16_SSCALED,
+        VK_FORMAT_R16_UINT,
+        VK_FORMAT_R16_UNORM,
+        VK_FORMAT_R16_USCALED,
+        VK_FORMAT_R32G32B32A32_SFLOAT,
+        VK_FORMAT_R32G32B32A32_SINT,
+        VK_FORMAT_R32G32B32A32_UINT,
+        VK_FORMAT_R32G32B32_SFLOAT,
+        VK_FORMAT_R32G32B32_SINT,
+        VK_FORMAT_R32G32B32_UINT,
+        VK_FORMAT_R32G32_SFLOAT,
+        VK_FORMAT_R32G32_SINT,
+        VK_FORMAT_R32G32_UINT,
+        VK_FORMAT_R32_SFLOAT,
+        VK_FORMAT_R32_SINT,
+        VK_FORMAT_R32_UINT,
+        VK_FORMAT_R4G4B4A4_UNORM_PACK16,
+        VK_FORMAT_R5G5B5A1_UNORM_PACK16,
+        VK_FORMAT_R5G6B5_UNORM_PACK16,
+        VK_FORMAT_R8G8B8A8_SINT,
+        VK_FORMAT_R8G8B8A8_SNORM,
+        VK_FORMAT_R8G8B8A8_SRGB,
+        VK_FORMAT_R8G8B8A8_SSCALED,
+        VK_FORMAT_R8G8B8A8_UINT,
+        VK_FORMAT_R8G8B8A8_USCALED,
+        VK_FORMAT_R8G8B8_SINT,
+        VK_FORMAT_R8G8B8_SNORM,
+        VK_FORMAT_R8G8B8_SRGB,
+        VK_FORMAT_R8G8B8_SSCALED,
+        VK_FORMAT_R8G8B8_UINT,
+        VK_FORMAT_R8G8B8_UNORM,
+        VK_FORMAT_R8G8B8_USCALED,
+        VK_FORMAT_R8G8_SINT,
+        VK_FORMAT_R8G8_SNORM,
+        VK_FORMAT_R8G8_SSCALED,
+        VK_FORMAT_R8G8_UINT,
+        VK_FORMAT_R8G8_UNORM,
+        VK_FORMAT_R8G8_USCALED,
+        VK_FORMAT_R8_SINT,
+        VK_FORMAT_R8_SNORM,
+        VK_FORMAT_R8_SSCALED,
+        VK_FORMAT_R8_UINT,
+        VK_FORMAT_R8_UNORM,
+        VK_FORMAT_R8_USCALED,
+        VK_FORMAT_S8_UINT,
+    };
+
+    *countOut = ArraySize(kVkFormats);
+    return kVkFormats;
+}
+
 }  // namespace vk
 
 }  // namespace rx
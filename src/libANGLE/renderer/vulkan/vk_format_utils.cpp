@@ -31,19 +31,36 @@ void AddSampleCounts(VkSampleCountFlags sampleCounts, gl::SupportedSampleSet *ou
     }
 }
 
-void FillTextureFormatCaps(RendererVk *renderer, VkFormat format, gl::TextureCaps *outTextureCaps)
+void FillTextureFormatCaps(RendererVk *renderer,
+                           const vk::Format &format,
+                           gl::TextureCaps *outTextureCaps)
 {
     const VkPhysicalDeviceLimits &physicalDeviceLimits =
         renderer->getPhysicalDeviceProperties().limits;
+    const VkFormat vkFormat = format.vkImageFormat;
+
+    // The Vulkan spec guarantees everything checked here for some formats.
+    const bool isSupportGuaranteed = (format.guaranteedSupport & vk::kImageSupportGuaranteed) != 0;
+
+    // Only check the attachment bit that can apply to the format. Color formats never support
+    // depth/stencil attachments and vice versa, so this avoids device queries the mandatory
+    // format support table could never answer.
+    const bool isDepthOrStencilFormat = format.imageFormat().hasDepthOrStencilBits();
     bool hasColorAttachmentFeatureBit =
-        renderer->hasImageFormatFeatureBits(format, VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BIT);
+        !isDepthOrStencilFormat &&
+        (isSupportGuaranteed ||
+         renderer->hasImageFormatFeatureBits(vkFormat, VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BIT));
     bool hasDepthAttachmentFeatureBit =
-        renderer->hasImageFormatFeatureBits(format, VK_FORMAT_FEATURE_DEPTH_STENCIL_ATTACHMENT_BIT);
+        isDepthOrStencilFormat &&
+        (isSupportGuaranteed || renderer->hasImageFormatFeatureBits(
+                                    vkFormat, VK_FORMAT_FEATURE_DEPTH_STENCIL_ATTACHMENT_BIT));
 
     outTextureCaps->texturable =
-        renderer->hasImageFormatFeatureBits(format, VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT);
-    outTextureCaps->filterable = renderer->hasImageFormatFeatureBits(
-        format, VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_LINEAR_BIT);
+        isSupportGuaranteed ||
+        renderer->hasImageFormatFeatureBits(vkFormat, VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT);
+    outTextureCaps->filterable =
+        isSupportGuaranteed || renderer->hasImageFormatFeatureBits(
+                                   vkFormat, VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_LINEAR_BIT);
     outTextureCaps->textureAttachment =
         hasColorAttachmentFeatureBit || hasDepthAttachmentFeatureBit;
     outTextureCaps->renderbuffer = outTextureCaps->textureAttachment;
@@ -103,6 +120,7 @@ namespace vk
 Format::Format()
     : angleFormatID(angle::FormatID::NONE),
       internalFormat(GL_NONE),
+      guaranteedSupport(0),
       imageFormatID(angle::FormatID::NONE),
       vkImageFormat(VK_FORMAT_UNDEFINED),
       bufferFormatID(angle::FormatID::NONE),
@@ -119,8 +137,18 @@ Format::Format()
 void Format::initImageFallback(RendererVk *renderer, const ImageFormatInitInfo *info, int numInfo)
 {
     size_t skip = renderer->getFeatures().forceFallbackFormat ? 1 : 0;
-    int i = FindSupportedFormat(renderer, info + skip, numInfo - skip, HasFullTextureFormatSupport);
-    i += skip;
+    int i       = 0;
+    if (skip > 0 || (guaranteedSupport & kImageSupportGuaranteed) == 0)
+    {
+        i = FindSupportedFormat(renderer, info + skip, numInfo - skip, HasFullTextureFormatSupport);
+        i += skip;
+    }
+
+    // The guaranteed support is that of the first format.
+    if (i != 0)
+    {
+        guaranteedSupport &= ~kImageSupportGuaranteed;
+    }
 
     imageFormatID            = info[i].format;
     vkImageFormat            = info[i].vkFormat;
@@ -130,8 +158,19 @@ void Format::initImageFallback(RendererVk *renderer, const ImageFormatInitInfo *
 void Format::initBufferFallback(RendererVk *renderer, const BufferFormatInitInfo *info, int numInfo)
 {
     size_t skip = renderer->getFeatures().forceFallbackFormat ? 1 : 0;
-    int i = FindSupportedFormat(renderer, info + skip, numInfo - skip, HasFullBufferFormatSupport);
-    i += skip;
+    int i       = 0;
+    if (skip > 0 || (guaranteedSupport & kVertexBufferSupportGuaranteed) == 0)
+    {
+        i = FindSupportedFormat(renderer, info + skip, numInfo - skip, HasFullBufferFormatSupport);
+        i += skip;
+    }
+
+    // The guaranteed support is that of the first format.
+    if (i != 0)
+    {
+        guaranteedSupport &=
+            ~(kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed);
+    }
 
     bufferFormatID               = info[i].format;
     vkBufferFormat               = info[i].vkFormat;
@@ -222,11 +261,26 @@ void FormatTable::initialize(RendererVk *renderer,
             continue;
         }
 
-        format.vkSupportsStorageBuffer = renderer->hasBufferFormatFeatureBits(
-            format.vkBufferFormat, VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_BIT);
+        // Record the formats whose support is guaranteed, as if the lookups below had been
+        // answered by the mandatory format support table.
+        if ((format.guaranteedSupport & kImageSupportGuaranteed) != 0)
+        {
+            renderer->onFormatSupportGuaranteed(format.vkImageFormat);
+        }
+        if ((format.guaranteedSupport &
+             (kVertexBufferSupportGuaranteed | kStorageTexelBufferSupportGuaranteed)) != 0)
+        {
+            renderer->onFormatSupportGuaranteed(format.vkBufferFormat);
+        }
+
+        format.vkSupportsStorageBuffer =
+            (format.guaranteedSupport & kStorageTexelBufferSupportGuaranteed) != 0 ||
+            (format.vkBufferFormat != VK_FORMAT_UNDEFINED &&
+             renderer->hasBufferFormatFeatureBits(format.vkBufferFormat,
+                                                  VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_BIT));
 
         gl::TextureCaps textureCaps;
-        FillTextureFormatCaps(renderer, format.vkImageFormat, &textureCaps);
+        FillTextureFormatCaps(renderer, format, &textureCaps);
         outTextureCapsMap->set(formatID, textureCaps);
 
         if (textureCaps.texturable)
@@ -34,6 +34,15 @@ namespace vk
 // VkFormat values in range [0, kNumVkFormats) are used as indices in various tables.
 constexpr uint32_t kNumVkFormats = 185;
 
+// The support the Vulkan spec guarantees for the first image and buffer VkFormat of an ANGLE
+// format, generated from vk_mandatory_format_support_data.json. The format table uses the first
+// VkFormat without querying the device for the features these bits cover.
+using FormatSupportMask = uint8_t;
+// Sampling, linear filtering and the color or depth/stencil attachment bit.
+constexpr FormatSupportMask kImageSupportGuaranteed              = 0x1;
+constexpr FormatSupportMask kVertexBufferSupportGuaranteed       = 0x2;
+constexpr FormatSupportMask kStorageTexelBufferSupportGuaranteed = 0x4;
+
 struct ImageFormatInitInfo final
 {
     angle::FormatID format;
@@ -86,6 +95,7 @@ struct Format final : private angle::NonCopyable
 
     angle::FormatID angleFormatID;
     GLenum internalFormat;
+    FormatSupportMask guaranteedSupport;
     angle::FormatID imageFormatID;
     VkFormat vkImageFormat;
     angle::FormatID bufferFormatID;
@@ -132,6 +142,10 @@ class FormatTable final : angle::NonCopyable
     std::array<Format, angle::kNumANGLEFormats> mFormatData;
 };
 
+// Returns the distinct VkFormats the format table looks up first and that the mandatory format
+// support table can't answer. This is an auto-generated function in vk_format_table_autogen.cpp.
+const VkFormat *GetFormatTableVkFormats(size_t *countOut);
+
 // This will return a reference to a VkFormatProperties with the feature flags supported
 // if the format is a mandatory format described in section 31.3.3. Required Format Support
 // of the Vulkan spec. If the vkFormat isn't mandatory, it will return a VkFormatProperties
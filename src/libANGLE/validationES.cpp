@@ -475,6 +475,36 @@ bool IsETC2EACFormat(const GLenum format)
     }
 }
 
+bool ValidBufferType(const Context *context, BufferBinding target)
+{
+    switch (target)
+    {
+        case BufferBinding::ElementArray:
+        case BufferBinding::Array:
+            return true;
+
+        case BufferBinding::PixelPack:
+        case BufferBinding::PixelUnpack:
+            return (context->getExtensions().pixelBufferObject ||
+                    context->getClientMajorVersion() >= 3);
+
+        case BufferBinding::CopyRead:
+        case BufferBinding::CopyWrite:
+        case BufferBinding::TransformFeedback:
+        case BufferBinding::Uniform:
+            return (context->getClientMajorVersion() >= 3);
+
+        case BufferBinding::AtomicCounter:
+        case BufferBinding::ShaderStorage:
+        case BufferBinding::DrawIndirect:
+        case BufferBinding::DispatchIndirect:
+            return context->getClientVersion() >= Version(3, 1);
+
+        default:
+            return false;
+    }
+}
+
 bool ValidTextureTarget(const Context *context, TextureType type)
 {
     switch (type)
@@ -683,6 +713,246 @@ bool ValidateDrawInstancedANGLE(Context *context)
     return false;
 }
 
+bool ValidateMultiDrawArraysCommon(Context *context,
+                                   PrimitiveMode mode,
+                                   const GLint *firsts,
+                                   const GLsizei *counts,
+                                   const GLsizei *instanceCounts,
+                                   GLsizei drawcount)
+{
+    if (drawcount <= 0)
+    {
+        if (drawcount < 0)
+        {
+            context->validationError(GL_INVALID_VALUE, kNegativeDrawcount);
+            return false;
+        }
+
+        // Early exit.
+        return true;
+    }
+
+    int64_t maxVertex        = -1;
+    GLsizei maxInstanceCount = 0;
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        GLsizei instanceCount = instanceCounts ? instanceCounts[drawID] : 1;
+        if (instanceCount < 0)
+        {
+            context->validationError(GL_INVALID_VALUE, kNegativePrimcount);
+            return false;
+        }
+
+        if (firsts[drawID] < 0)
+        {
+            context->validationError(GL_INVALID_VALUE, kNegativeStart);
+            return false;
+        }
+
+        if (counts[drawID] <= 0)
+        {
+            if (counts[drawID] < 0)
+            {
+                context->validationError(GL_INVALID_VALUE, kNegativeCount);
+                return false;
+            }
+            continue;
+        }
+
+        int64_t lastVertex =
+            static_cast<int64_t>(firsts[drawID]) + static_cast<int64_t>(counts[drawID]) - 1;
+        maxVertex        = std::max(maxVertex, lastVertex);
+        maxInstanceCount = std::max(maxInstanceCount, instanceCount);
+    }
+
+    if (!ValidateDrawBase(context, mode))
+    {
+        return false;
+    }
+
+    if (maxVertex < 0)
+    {
+        // All the draws are empty.
+        return true;
+    }
+
+    if (context->getStateCache().isTransformFeedbackActiveUnpaused())
+    {
+        // The draws append their vertices to the same buffers, so their space is checked together.
+        const State &state                      = context->getState();
+        TransformFeedback *curTransformFeedback = state.getCurrentTransformFeedback();
+        if (!curTransformFeedback->checkBufferSpaceForMultiDraw(counts, instanceCounts, drawcount))
+        {
+            context->validationError(GL_INVALID_OPERATION, kTransformFeedbackBufferTooSmall);
+            return false;
+        }
+    }
+
+    if (!context->isBufferAccessValidationEnabled())
+    {
+        return true;
+    }
+
+    // The draw reading the furthest vertex decides whether the attributes are large enough.
+    if (maxVertex > static_cast<int64_t>(std::numeric_limits<GLint>::max()))
+    {
+        context->validationError(GL_INVALID_OPERATION, kIntegerOverflow);
+        return false;
+    }
+
+    if (!ValidateDrawAttribs(context, maxVertex))
+    {
+        return false;
+    }
+
+    return (instanceCounts == nullptr || maxInstanceCount == 0 ||
+            ValidateDrawInstancedAttribs(context, maxInstanceCount));
+}
+
+bool ValidateMultiDrawElementsCommon(Context *context,
+                                     PrimitiveMode mode,
+                                     const GLsizei *counts,
+                                     DrawElementsType type,
+                                     const GLvoid *const *indices,
+                                     const GLsizei *instanceCounts,
+                                     GLsizei drawcount)
+{
+    if (drawcount <= 0)
+    {
+        if (drawcount < 0)
+        {
+            context->validationError(GL_INVALID_VALUE, kNegativeDrawcount);
+            return false;
+        }
+
+        // Early exit.
+        return true;
+    }
+
+    if (!ValidateDrawElementsBase(context, mode, type))
+    {
+        return false;
+    }
+
+    const bool webglCompatibility = context->getExtensions().webglCompatibility;
+    const GLuint typeBytes        = GetDrawElementsTypeSize(type);
+    const VertexArray *vao        = context->getState().getVertexArray();
+    Buffer *elementArrayBuffer    = vao->getElementArrayBuffer();
+
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        if (instanceCounts && instanceCounts[drawID] < 0)
+        {
+            context->validationError(GL_INVALID_VALUE, kNegativePrimcount);
+            return false;
+        }
+
+        uintptr_t offset = reinterpret_cast<uintptr_t>(indices[drawID]);
+        if (webglCompatibility)
+        {
+            // [WebGL 1.0] Section 6.4 Buffer Offset and Stride Requirements
+            if ((offset & static_cast<uintptr_t>(typeBytes - 1)) != 0)
+            {
+                context->validationError(GL_INVALID_OPERATION, kOffsetMustBeMultipleOfType);
+                return false;
+            }
+
+            if (static_cast<intptr_t>(offset) < 0)
+            {
+                context->validationError(GL_INVALID_VALUE, kNegativeOffset);
+                return false;
+            }
+        }
+
+        if (counts[drawID] <= 0)
+        {
+            if (counts[drawID] < 0)
+            {
+                context->validationError(GL_INVALID_VALUE, kNegativeCount);
+                return false;
+            }
+            continue;
+        }
+
+        if (!elementArrayBuffer)
+        {
+            if (!indices[drawID])
+            {
+                // This is an application error that would normally result in a crash, but we
+                // catch it and return an error
+                context->validationError(GL_INVALID_OPERATION, kElementArrayNoBufferOrPointer);
+                return false;
+            }
+            continue;
+        }
+
+        // See ValidateDrawElementsCommon, the multiplication can't overflow.
+        uint64_t elementDataSizeNoOffset = static_cast<uint64_t>(counts[drawID])
+                                           << GetDrawElementsTypeShift(type);
+        uint64_t elementDataSizeWithOffset = elementDataSizeNoOffset + offset;
+        if (elementDataSizeWithOffset < elementDataSizeNoOffset)
+        {
+            context->validationError(GL_INVALID_OPERATION, kIntegerOverflow);
+            return false;
+        }
+
+        if (elementDataSizeWithOffset > static_cast<uint64_t>(elementArrayBuffer->getSize()))
+        {
+            context->validationError(GL_INVALID_OPERATION, kInsufficientBufferSize);
+            return false;
+        }
+    }
+
+    if (!ValidateDrawBase(context, mode))
+    {
+        return false;
+    }
+
+    if (!context->isBufferAccessValidationEnabled())
+    {
+        return true;
+    }
+
+    // The draw reading the furthest vertex decides whether the attributes are large enough.
+    bool hasIndexRange       = false;
+    size_t maxIndex          = 0;
+    GLsizei maxInstanceCount = 0;
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        GLsizei instanceCount = instanceCounts ? instanceCounts[drawID] : 1;
+        if (counts[drawID] == 0 || instanceCount == 0)
+        {
+            continue;
+        }
+
+        IndexRange indexRange{IndexRange::Undefined()};
+        ANGLE_VALIDATION_TRY(
+            vao->getIndexRange(context, type, counts[drawID], indices[drawID], &indexRange));
+
+        if (static_cast<GLuint64>(indexRange.end) >= context->getCaps().maxElementIndex)
+        {
+            context->validationError(GL_INVALID_OPERATION, kExceedsMaxElement);
+            return false;
+        }
+
+        hasIndexRange    = true;
+        maxIndex         = std::max(maxIndex, indexRange.end);
+        maxInstanceCount = std::max(maxInstanceCount, instanceCount);
+    }
+
+    if (!hasIndexRange)
+    {
+        return true;
+    }
+
+    if (!ValidateDrawAttribs(context, static_cast<GLint>(maxIndex)))
+    {
+        return false;
+    }
+
+    return (instanceCounts == nullptr || ValidateDrawInstancedAttribs(context, maxInstanceCount));
+}
+
 bool ValidTexture3DDestinationTarget(const Context *context, TextureTarget target)
 {
     switch (target)
@@ -1602,9 +1872,8 @@ bool ValidateIsQueryEXT(Context *context, GLuint id)
 
 bool ValidateBeginQueryBase(Context *context, QueryType target, GLuint id)
 {
-    if (!ValidQueryType(context, target))
+    if (!ValidatePackedEnum(context, target))
     {
-        context->validationError(GL_INVALID_ENUM, kInvalidQueryType);
         return false;
     }
 
@@ -1669,9 +1938,8 @@ bool ValidateBeginQueryEXT(Context *context, QueryType target, GLuint id)
 
 bool ValidateEndQueryBase(Context *context, QueryType target)
 {
-    if (!ValidQueryType(context, target))
+    if (!ValidatePackedEnum(context, target))
     {
-        context->validationError(GL_INVALID_ENUM, kInvalidQueryType);
         return false;
     }
 
@@ -1735,7 +2003,7 @@ bool ValidateGetQueryivBase(Context *context, QueryType target, GLenum pname, GL
         *numParams = 0;
     }
 
-    if (!ValidQueryType(context, target) && target != QueryType::Timestamp)
+    if (!context->getPackedEnumCaps().isValid(target) && target != QueryType::Timestamp)
     {
         context->validationError(GL_INVALID_ENUM, kInvalidQueryType);
         return false;
@@ -3577,9 +3845,8 @@ bool ValidateGetBufferPointervBase(Context *context,
         *length = 0;
     }
 
-    if (!context->isValidBufferBinding(target))
+    if (!ValidatePackedEnum(context, target))
     {
-        context->validationError(GL_INVALID_ENUM, kInvalidBufferTypes);
         return false;
     }
 
@@ -3612,9 +3879,8 @@ bool ValidateGetBufferPointervBase(Context *context,
 
 bool ValidateUnmapBufferBase(Context *context, BufferBinding target)
 {
-    if (!context->isValidBufferBinding(target))
+    if (!ValidatePackedEnum(context, target))
     {
-        context->validationError(GL_INVALID_ENUM, kInvalidBufferTypes);
         return false;
     }
 
@@ -3635,9 +3901,8 @@ bool ValidateMapBufferRangeBase(Context *context,
                                 GLsizeiptr length,
                                 GLbitfield access)
 {
-    if (!context->isValidBufferBinding(target))
+    if (!ValidatePackedEnum(context, target))
     {
-        context->validationError(GL_INVALID_ENUM, kInvalidBufferTypes);
         return false;
     }
 
@@ -3736,9 +4001,8 @@ bool ValidateFlushMappedBufferRangeBase(Context *context,
         return false;
     }
 
-    if (!context->isValidBufferBinding(target))
+    if (!ValidatePackedEnum(context, target))
     {
-        context->validationError(GL_INVALID_ENUM, kInvalidBufferTypes);
         return false;
     }
 
@@ -4877,9 +5141,8 @@ bool ValidateGetBufferParameterBase(Context *context,
         *numParams = 0;
     }
 
-    if (!context->isValidBufferBinding(target))
+    if (!ValidatePackedEnum(context, target))
     {
-        context->validationError(GL_INVALID_ENUM, kInvalidBufferTypes);
         return false;
     }
 
@@ -5080,7 +5343,8 @@ bool ValidateGetTexParameterBase(Context *context,
         *length = 0;
     }
 
-    if (!ValidTextureTarget(context, target) && !ValidTextureExternalTarget(context, target))
+    if (!context->getPackedEnumCaps().isValid(target) &&
+        !ValidTextureExternalTarget(context, target))
     {
         context->validationError(GL_INVALID_ENUM, kInvalidTextureTarget);
         return false;
@@ -5538,7 +5802,8 @@ bool ValidateTexParameterBase(Context *context,
                               bool vectorParams,
                               const ParamType *params)
 {
-    if (!ValidTextureTarget(context, target) && !ValidTextureExternalTarget(context, target))
+    if (!context->getPackedEnumCaps().isValid(target) &&
+        !ValidTextureExternalTarget(context, target))
     {
         context->validationError(GL_INVALID_ENUM, kInvalidTextureTarget);
         return false;
@@ -38,6 +38,7 @@ class Shader;
 
 void SetRobustLengthParam(GLsizei *length, GLsizei value);
 bool IsETC2EACFormat(const GLenum format);
+bool ValidBufferType(const Context *context, BufferBinding target);
 bool ValidTextureTarget(const Context *context, TextureType type);
 bool ValidTexture2DTarget(const Context *context, TextureType type);
 bool ValidTexture3DTarget(const Context *context, TextureType target);
@@ -79,6 +80,20 @@ bool ValidImageDataSize(Context *context,
 
 bool ValidQueryType(const Context *context, QueryType queryType);
 
+// Generates GL_INVALID_ENUM unless the context accepts the packed value. The packed types are
+// listed in scripts/entry_point_packed_gl_enum_caps.json.
+template <typename T>
+ANGLE_INLINE bool ValidatePackedEnum(Context *context, T value)
+{
+    if (!context->getPackedEnumCaps().isValid(value))
+    {
+        context->validationError(GL_INVALID_ENUM, GetInvalidPackedEnumError(value));
+        return false;
+    }
+
+    return true;
+}
+
 bool ValidateWebGLVertexAttribPointer(Context *context,
                                       VertexAttribType type,
                                       GLboolean normalized,
@@ -353,6 +368,23 @@ bool ValidateDrawElementsInstancedEXT(Context *context,
 bool ValidateDrawInstancedANGLE(Context *context);
 bool ValidateDrawInstancedEXT(Context *context);
 
+// Validate the draws of the ANGLE_multi_draw calls together: the parameters of every draw are
+// checked, then the state the draws share only once. instanceCounts is null for the
+// non-instanced calls.
+bool ValidateMultiDrawArraysCommon(Context *context,
+                                   PrimitiveMode mode,
+                                   const GLint *firsts,
+                                   const GLsizei *counts,
+                                   const GLsizei *instanceCounts,
+                                   GLsizei drawcount);
+bool ValidateMultiDrawElementsCommon(Context *context,
+                                     PrimitiveMode mode,
+                                     const GLsizei *counts,
+                                     DrawElementsType type,
+                                     const GLvoid *const *indices,
+                                     const GLsizei *instanceCounts,
+                                     GLsizei drawcount);
+
 bool ValidateFramebufferTextureBase(Context *context,
                                     GLenum target,
                                     GLenum attachment,
@@ -2984,9 +2984,8 @@ bool ValidateMapBufferOES(Context *context, BufferBinding target, GLenum access)
         return false;
     }
 
-    if (!context->isValidBufferBinding(target))
+    if (!ValidatePackedEnum(context, target))
     {
-        context->validationError(GL_INVALID_ENUM, kInvalidBufferTypes);
         return false;
     }
 
@@ -4578,9 +4577,8 @@ bool ValidateBufferData(Context *context,
             return false;
     }
 
-    if (!context->isValidBufferBinding(target))
+    if (!ValidatePackedEnum(context, target))
     {
-        context->validationError(GL_INVALID_ENUM, kInvalidBufferTypes);
         return false;
     }
 
@@ -4620,9 +4618,8 @@ bool ValidateBufferSubData(Context *context,
         return false;
     }
 
-    if (!context->isValidBufferBinding(target))
+    if (!ValidatePackedEnum(context, target))
     {
-        context->validationError(GL_INVALID_ENUM, kInvalidBufferTypes);
         return false;
     }
 
@@ -6237,9 +6234,8 @@ bool ValidateGenTextures(Context *context, GLint n, GLuint *)
 
 bool ValidateGenerateMipmap(Context *context, TextureType target)
 {
-    if (!ValidTextureTarget(context, target))
+    if (!ValidatePackedEnum(context, target))
     {
-        context->validationError(GL_INVALID_ENUM, kInvalidTextureTarget);
         return false;
     }
 
@@ -6888,14 +6884,7 @@ bool ValidateMultiDrawArraysANGLE(Context *context,
         context->validationError(GL_INVALID_OPERATION, kExtensionNotEnabled);
         return false;
     }
-    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
-    {
-        if (!ValidateDrawArrays(context, mode, firsts[drawID], counts[drawID]))
-        {
-            return false;
-        }
-    }
-    return true;
+    return ValidateMultiDrawArraysCommon(context, mode, firsts, counts, nullptr, drawcount);
 }
 
 bool ValidateMultiDrawElementsANGLE(Context *context,
@@ -6910,14 +6899,8 @@ bool ValidateMultiDrawElementsANGLE(Context *context,
         context->validationError(GL_INVALID_OPERATION, kExtensionNotEnabled);
         return false;
     }
-    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
-    {
-        if (!ValidateDrawElements(context, mode, counts[drawID], type, indices[drawID]))
-        {
-            return false;
-        }
-    }
-    return true;
+    return ValidateMultiDrawElementsCommon(context, mode, counts, type, indices, nullptr,
+                                           drawcount);
 }
 
 bool ValidateProvokingVertexANGLE(Context *context, ProvokingVertex modePacked)
@@ -30,9 +30,8 @@ ANGLE_INLINE bool ValidateUniform2f(Context *context, GLint location, GLfloat x,
 
 ANGLE_INLINE bool ValidateBindBuffer(Context *context, BufferBinding target, GLuint buffer)
 {
-    if (!context->isValidBufferBinding(target))
+    if (!ValidatePackedEnum(context, target))
     {
-        context->validationError(GL_INVALID_ENUM, err::kInvalidBufferTypes);
         return false;
     }
 
@@ -1523,9 +1523,8 @@ bool ValidateCompressedTexImage3D(Context *context,
         return false;
     }
 
-    if (!ValidTextureTarget(context, TextureTargetToType(target)))
+    if (!ValidatePackedEnum(context, TextureTargetToType(target)))
     {
-        context->validationError(GL_INVALID_ENUM, kInvalidTextureTarget);
         return false;
     }
 
@@ -2795,7 +2794,8 @@ bool ValidateCopyBufferSubData(Context *context,
         return false;
     }
 
-    if (!context->isValidBufferBinding(readTarget) || !context->isValidBufferBinding(writeTarget))
+    if (!context->getPackedEnumCaps().isValid(readTarget) ||
+        !context->getPackedEnumCaps().isValid(writeTarget))
     {
         context->validationError(GL_INVALID_ENUM, kInvalidBufferTypes);
         return false;
@@ -3110,15 +3110,7 @@ bool ValidateMultiDrawArraysInstancedANGLE(Context *context,
             return false;
         }
     }
-    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
-    {
-        if (!ValidateDrawArraysInstancedBase(context, mode, firsts[drawID], counts[drawID],
-                                             instanceCounts[drawID]))
-        {
-            return false;
-        }
-    }
-    return true;
+    return ValidateMultiDrawArraysCommon(context, mode, firsts, counts, instanceCounts, drawcount);
 }
 
 bool ValidateMultiDrawElementsInstancedANGLE(Context *context,
@@ -3146,15 +3138,8 @@ bool ValidateMultiDrawElementsInstancedANGLE(Context *context,
             return false;
         }
     }
-    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
-    {
-        if (!ValidateDrawElementsInstancedBase(context, mode, counts[drawID], type, indices[drawID],
-                                               instanceCounts[drawID]))
-        {
-            return false;
-        }
-    }
-    return true;
+    return ValidateMultiDrawElementsCommon(context, mode, counts, type, indices, instanceCounts,
+                                           drawcount);
 }
 
 bool ValidateFramebufferTextureMultiviewOVR(Context *context,
@@ -0,0 +1,149 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_binary_event.cpp:
+//   Implements the per-thread rings of binary entry point events.
+
+#include "libGLESv2/entry_points_binary_event.h"
+
+#if ANGLE_ENTRY_POINT_BINARY_EVENTS == ANGLE_ENABLED
+
+#    include <stdio.h>
+#    include <algorithm>
+#    include <mutex>
+
+#    include "common/debug.h"
+#    include "common/system_utils.h"
+#    include "common/tls.h"
+
+namespace gl
+{
+namespace
+{
+TLSIndex gBinaryEventRingTLS = TLS_INVALID_INDEX;
+
+// The rings are never freed so that the events of exited threads are still dumped.
+std::mutex gBinaryEventRingsMutex;
+std::vector<BinaryEventRing *> gBinaryEventRings;
+
+BinaryEventRing *AllocateCurrentThreadBinaryEventRing()
+{
+    std::lock_guard<std::mutex> lock(gBinaryEventRingsMutex);
+
+    if (gBinaryEventRingTLS == TLS_INVALID_INDEX)
+    {
+        gBinaryEventRingTLS = CreateTLSIndex();
+    }
+
+    BinaryEventRing *ring = new BinaryEventRing(static_cast<uint32_t>(gBinaryEventRings.size()));
+    gBinaryEventRings.push_back(ring);
+    SetTLSValue(gBinaryEventRingTLS, ring);
+    return ring;
+}
+}  // anonymous namespace
+
+BinaryEventRing::BinaryEventRing(uint32_t threadIndex)
+    : mThreadIndex(threadIndex), mWriteIndex(0), mReadIndex(0)
+{
+    for (Slot &slot : mSlots)
+    {
+        slot.sequence.store(0, std::memory_order_relaxed);
+    }
+}
+
+BinaryEventRing::~BinaryEventRing() = default;
+
+void BinaryEventRing::collect(std::vector<BinaryEvent> *events)
+{
+    uint64_t writeIndex = mWriteIndex.load(std::memory_order_acquire);
+    uint64_t readIndex  = std::max(
+        mReadIndex, writeIndex > kBinaryEventRingSize ? writeIndex - kBinaryEventRingSize : 0);
+    for (uint64_t index = readIndex; index < writeIndex; ++index)
+    {
+        const Slot &slot  = mSlots[index % kBinaryEventRingSize];
+        uint64_t sequence = slot.sequence.load(std::memory_order_acquire);
+        if (sequence != index * 2 + 2)
+        {
+            // The owning thread already overwrote the event.
+            continue;
+        }
+
+        uint64_t words[kEventWordCount];
+        for (size_t word = 0; word < kEventWordCount; ++word)
+        {
+            words[word] = slot.words[word].load(std::memory_order_relaxed);
+        }
+        std::atomic_thread_fence(std::memory_order_acquire);
+        if (slot.sequence.load(std::memory_order_relaxed) != sequence)
+        {
+            // The event was overwritten during the copy.
+            continue;
+        }
+
+        BinaryEvent event;
+        memcpy(&event, words, sizeof(event));
+        events->push_back(event);
+    }
+    mReadIndex = writeIndex;
+}
+
+BinaryEventRing *GetCurrentThreadBinaryEventRing()
+{
+    if (gBinaryEventRingTLS != TLS_INVALID_INDEX)
+    {
+        void *ring = GetTLSValue(gBinaryEventRingTLS);
+        if (ring)
+        {
+            return static_cast<BinaryEventRing *>(ring);
+        }
+    }
+    return AllocateCurrentThreadBinaryEventRing();
+}
+
+void DumpBinaryEvents()
+{
+    std::string path = angle::GetEnvironmentVar("ANGLE_BINARY_EVENT_TRACE");
+    if (path.empty())
+    {
+        return;
+    }
+
+    std::vector<BinaryEvent> events;
+    {
+        std::lock_guard<std::mutex> lock(gBinaryEventRingsMutex);
+        for (BinaryEventRing *ring : gBinaryEventRings)
+        {
+            ring->collect(&events);
+        }
+    }
+
+    std::stable_sort(events.begin(), events.end(), [](const BinaryEvent &a, const BinaryEvent &b) {
+        return a.timestampNs < b.timestampNs;
+    });
+
+    // Each dump appends a header and the events collected since the previous dump.
+    FILE *file = fopen(path.c_str(), "ab");
+    if (!file)
+    {
+        ERR() << "Could not open " << path << " to write the binary events.";
+        return;
+    }
+
+    BinaryEventFileHeader header = {};
+    memcpy(header.magic, kBinaryEventFileMagic, sizeof(header.magic));
+    header.version    = kBinaryEventFileVersion;
+    header.eventSize  = sizeof(BinaryEvent);
+    header.eventCount = static_cast<uint32_t>(events.size());
+
+    fwrite(&header, sizeof(header), 1, file);
+    if (!events.empty())
+    {
+        fwrite(events.data(), sizeof(BinaryEvent), events.size(), file);
+    }
+    fclose(file);
+}
+}  // namespace gl
+
+#endif  // ANGLE_ENTRY_POINT_BINARY_EVENTS == ANGLE_ENABLED
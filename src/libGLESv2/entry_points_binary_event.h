@@ -0,0 +1,177 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_binary_event.h:
+//   Binary entry point events. Enabled with the angle_enable_binary_events GN arg. Every
+//   generated GLES entry point writes its EntryPoint and its raw parameter values to a per-thread
+//   ring buffer instead of formatting a string. The rings are written to the file named by
+//   ANGLE_BINARY_EVENT_TRACE when a context is destroyed, and angle_binary_event_decoder formats
+//   them to text offline.
+
+#ifndef LIBGLESV2_ENTRY_POINTS_BINARY_EVENT_H_
+#define LIBGLESV2_ENTRY_POINTS_BINARY_EVENT_H_
+
+#include <stdint.h>
+#include <string>
+#include <type_traits>
+
+#include "angle_gl.h"
+#include "common/mathutil.h"
+#include "libANGLE/features.h"
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+namespace gl
+{
+// Every event has the same size so the rings can be indexed directly. Parameters are widened to
+// 64 bits: integers are sign or zero extended, floats keep their bit pattern in the low 32 bits
+// and pointers are stored as addresses.
+struct BinaryEvent
+{
+    uint64_t timestampNs;
+    uint32_t threadIndex;
+    uint16_t entryPoint;
+    uint16_t paramCount;
+    uint64_t params[kMaxEntryPointParamCount];
+};
+
+// Every dump appends a BinaryEventFileHeader followed by eventCount BinaryEvents ordered by
+// timestamp to the trace file.
+struct BinaryEventFileHeader
+{
+    char magic[4];
+    uint32_t version;
+    uint32_t eventSize;
+    uint32_t eventCount;
+};
+
+constexpr char kBinaryEventFileMagic[4]    = {'A', 'B', 'E', 'V'};
+constexpr uint32_t kBinaryEventFileVersion = 1;
+
+// Parameters are widened to 64 bits the same way by the captures of entry_points_capture.h.
+template <typename T>
+ANGLE_INLINE uint64_t EncodeBinaryEventParam(T *value)
+{
+    return static_cast<uint64_t>(reinterpret_cast<uintptr_t>(value));
+}
+
+ANGLE_INLINE uint64_t EncodeBinaryEventParam(GLfloat value)
+{
+    return bitCast<uint32_t>(value);
+}
+
+template <typename T>
+ANGLE_INLINE typename std::enable_if<std::is_integral<T>::value, uint64_t>::type
+EncodeBinaryEventParam(T value)
+{
+    using WideT = typename std::conditional<std::is_signed<T>::value, int64_t, uint64_t>::type;
+    return static_cast<uint64_t>(static_cast<WideT>(value));
+}
+
+// Formats the event like the EVENT() of its entry point. Returns false if the event doesn't match
+// the signature of its entry point. Implemented by the generated decoder.
+bool FormatBinaryEvent(const BinaryEvent &event, std::string *textOut);
+}  // namespace gl
+
+#if ANGLE_ENTRY_POINT_BINARY_EVENTS == ANGLE_ENABLED
+
+#    include <string.h>
+#    include <array>
+#    include <atomic>
+#    include <chrono>
+#    include <vector>
+
+#    include "common/angleutils.h"
+
+namespace gl
+{
+constexpr size_t kBinaryEventRingSize = 4096;
+
+// The events of one thread. Only the owning thread writes; DumpBinaryEvents() reads the events
+// between the last dump and the write index while the owning thread may keep writing.
+class BinaryEventRing final : angle::NonCopyable
+{
+  public:
+    explicit BinaryEventRing(uint32_t threadIndex);
+    ~BinaryEventRing();
+
+    uint32_t getThreadIndex() const { return mThreadIndex; }
+
+    void write(const BinaryEvent &event)
+    {
+        uint64_t index = mWriteIndex.load(std::memory_order_relaxed);
+        Slot &slot     = mSlots[index % kBinaryEventRingSize];
+
+        uint64_t words[kEventWordCount];
+        memcpy(words, &event, sizeof(event));
+
+        slot.sequence.store(index * 2 + 1, std::memory_order_relaxed);
+        std::atomic_thread_fence(std::memory_order_release);
+        for (size_t word = 0; word < kEventWordCount; ++word)
+        {
+            slot.words[word].store(words[word], std::memory_order_relaxed);
+        }
+        slot.sequence.store(index * 2 + 2, std::memory_order_release);
+
+        mWriteIndex.store(index + 1, std::memory_order_release);
+    }
+
+    // Appends the events written since the last call to events. Events that are overwritten
+    // while they are copied are dropped.
+    void collect(std::vector<BinaryEvent> *events);
+
+  private:
+    static_assert(sizeof(BinaryEvent) % sizeof(uint64_t) == 0, "Events are copied in words");
+    static constexpr size_t kEventWordCount = sizeof(BinaryEvent) / sizeof(uint64_t);
+
+    // Every slot is a seqlock. Its sequence is odd while the event at index is written and
+    // index * 2 + 2 once it is complete, so readers can tell a torn or newer event from the one
+    // they expect.
+    struct Slot
+    {
+        std::atomic<uint64_t> sequence;
+        std::array<std::atomic<uint64_t>, kEventWordCount> words;
+    };
+
+    uint32_t mThreadIndex;
+    std::atomic<uint64_t> mWriteIndex;
+    uint64_t mReadIndex;
+    std::array<Slot, kBinaryEventRingSize> mSlots;
+};
+
+BinaryEventRing *GetCurrentThreadBinaryEventRing();
+
+// Appends the events of all threads recorded since the last dump to the file named by
+// ANGLE_BINARY_EVENT_TRACE. Does nothing if the variable is not set. Events that were overwritten
+// in the rings since the last dump are lost.
+void DumpBinaryEvents();
+
+template <typename... ParamsT>
+ANGLE_INLINE void RecordBinaryEvent(EntryPoint entryPoint, ParamsT... params)
+{
+    static_assert(sizeof...(ParamsT) <= kMaxEntryPointParamCount, "Too many parameters");
+
+    // The trailing zero keeps the array valid for entry points without parameters.
+    const uint64_t encoded[] = {EncodeBinaryEventParam(params)..., 0};
+
+    BinaryEventRing *ring = GetCurrentThreadBinaryEventRing();
+    BinaryEvent event;
+    event.timestampNs =
+        static_cast<uint64_t>(std::chrono::duration_cast<std::chrono::nanoseconds>(
+                                  std::chrono::steady_clock::now().time_since_epoch())
+                                  .count());
+    event.threadIndex = ring->getThreadIndex();
+    event.entryPoint  = static_cast<uint16_t>(entryPoint);
+    event.paramCount  = static_cast<uint16_t>(sizeof...(ParamsT));
+    memcpy(event.params, encoded, sizeof...(ParamsT) * sizeof(uint64_t));
+    ring->write(event);
+}
+}  // namespace gl
+
+#    define ANGLE_BINARY_EVENT(EP, ...) gl::RecordBinaryEvent(gl::EntryPoint::EP, ##__VA_ARGS__)
+#else
+#    define ANGLE_BINARY_EVENT(EP, ...)
+#endif  // ANGLE_ENTRY_POINT_BINARY_EVENTS == ANGLE_ENABLED
+
+#endif  // LIBGLESV2_ENTRY_POINTS_BINARY_EVENT_H_
@@ -0,0 +1,6746 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_binary_event_decoder_autogen.cpp:
+//   Formats binary entry point events like the EVENT() of their entry point.
+
+#include "libGLESv2/entry_points_binary_event.h"
+
+#include <inttypes.h>
+#include <stdarg.h>
+#include <vector>
+
+#include "angle_gl.h"
+#include "common/angleutils.h"
+#include "common/mathutil.h"
+
+namespace gl
+{
+namespace
+{
+GLfloat DecodeFloat(uint64_t param)
+{
+    return bitCast<GLfloat>(static_cast<uint32_t>(param));
+}
+
+bool FormatEvent(std::string *textOut, const char *format, ...)
+{
+    va_list vararg;
+    va_start(vararg, format);
+    std::vector<char> buffer(512);
+    size_t length = FormatStringIntoVector(format, vararg, buffer);
+    va_end(vararg);
+    textOut->assign(buffer.data(), length);
+    return true;
+}
+}  // anonymous namespace
+
+bool FormatBinaryEvent(const BinaryEvent &event, std::string *textOut)
+{
+    switch (static_cast<EntryPoint>(event.entryPoint))
+    {
+        case EntryPoint::ActiveShaderProgram:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glActiveShaderProgram(GLuint pipeline = %u, GLuint program = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::ActiveTexture:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glActiveTexture(GLenum texture = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::AlphaFunc:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glAlphaFunc(GLenum func = 0x%X, GLfloat ref = %f)",
+                               static_cast<GLenum>(event.params[0]), DecodeFloat(event.params[1]));
+        case EntryPoint::AlphaFuncx:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glAlphaFuncx(GLenum func = 0x%X, GLfixed ref = 0x%X)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLfixed>(event.params[1]));
+        case EntryPoint::AttachShader:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glAttachShader(GLuint program = %u, GLuint shader = %u)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]));
+        case EntryPoint::BeginQuery:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glBeginQuery(GLenum target = 0x%X, GLuint id = %u)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]));
+        case EntryPoint::BeginQueryEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glBeginQueryEXT(GLenum target = 0x%X, GLuint id = %u)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]));
+        case EntryPoint::BeginTransformFeedback:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glBeginTransformFeedback(GLenum primitiveMode = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::BindAttribLocation:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glBindAttribLocation(GLuint program = %u, GLuint index = %u, const "
+                               "GLchar *name = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::BindBuffer:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glBindBuffer(GLenum target = 0x%X, GLuint buffer = %u)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]));
+        case EntryPoint::BindBufferBase:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glBindBufferBase(GLenum target = 0x%X, GLuint index = %u, GLuint buffer = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]));
+        case EntryPoint::BindBufferRange:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glBindBufferRange(GLenum target = 0x%X, GLuint index = %u, GLuint "
+                               "buffer = %u, GLintptr offset = %llu, GLsizeiptr size = %llu)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]),
+                               static_cast<GLuint>(event.params[2]),
+                               static_cast<unsigned long long>(event.params[3]),
+                               static_cast<unsigned long long>(event.params[4]));
+        case EntryPoint::BindFragDataLocationEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glBindFragDataLocationEXT(GLuint program = %u, GLuint color = %u, "
+                               "const GLchar *name = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::BindFragDataLocationIndexedEXT:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glBindFragDataLocationIndexedEXT(GLuint program = %u, GLuint colorNumber = %u, "
+                "GLuint index = %u, const GLchar *name = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::BindFragmentInputLocationCHROMIUM:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glBindFragmentInputLocationCHROMIUM(GLuint programs = %u, GLint "
+                               "location = %d, const GLchar * name = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::BindFramebuffer:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glBindFramebuffer(GLenum target = 0x%X, GLuint framebuffer = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::BindFramebufferOES:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glBindFramebufferOES(GLenum target = 0x%X, GLuint framebuffer = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::BindImageTexture:
+            if (event.paramCount != 7)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glBindImageTexture(GLuint unit = %u, GLuint texture = %u, GLint level = %d, "
+                "GLboolean layered = %u, GLint layer = %d, GLenum access = 0x%X, GLenum format = "
+                "0x%X)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLboolean>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLenum>(event.params[5]),
+                static_cast<GLenum>(event.params[6]));
+        case EntryPoint::BindProgramPipeline:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glBindProgramPipeline(GLuint pipeline = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::BindRenderbuffer:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glBindRenderbuffer(GLenum target = 0x%X, GLuint renderbuffer = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::BindRenderbufferOES:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glBindRenderbufferOES(GLenum target = 0x%X, GLuint renderbuffer = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::BindSampler:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glBindSampler(GLuint unit = %u, GLuint sampler = %u)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]));
+        case EntryPoint::BindTexture:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glBindTexture(GLenum target = 0x%X, GLuint texture = %u)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]));
+        case EntryPoint::BindTransformFeedback:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glBindTransformFeedback(GLenum target = 0x%X, GLuint id = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::BindUniformLocationCHROMIUM:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glBindUniformLocationCHROMIUM(GLuint program = %u, GLint location "
+                               "= %d, const GLchar* name = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::BindVertexArray:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glBindVertexArray(GLuint array = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::BindVertexArrayOES:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glBindVertexArrayOES(GLuint array = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::BindVertexBuffer:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glBindVertexBuffer(GLuint bindingindex = %u, GLuint buffer = %u, "
+                               "GLintptr offset = %llu, GLsizei stride = %d)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]),
+                               static_cast<unsigned long long>(event.params[2]),
+                               static_cast<GLsizei>(event.params[3]));
+        case EntryPoint::BlendColor:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glBlendColor(GLfloat red = %f, GLfloat green = %f, GLfloat blue = "
+                               "%f, GLfloat alpha = %f)",
+                               DecodeFloat(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]), DecodeFloat(event.params[3]));
+        case EntryPoint::BlendEquation:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glBlendEquation(GLenum mode = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::BlendEquationSeparate:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glBlendEquationSeparate(GLenum modeRGB = 0x%X, GLenum modeAlpha = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]));
+        case EntryPoint::BlendFunc:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glBlendFunc(GLenum sfactor = 0x%X, GLenum dfactor = 0x%X)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]));
+        case EntryPoint::BlendFuncSeparate:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glBlendFuncSeparate(GLenum sfactorRGB = 0x%X, GLenum dfactorRGB = 0x%X, GLenum "
+                "sfactorAlpha = 0x%X, GLenum dfactorAlpha = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLenum>(event.params[3]));
+        case EntryPoint::BlitFramebuffer:
+            if (event.paramCount != 10)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glBlitFramebuffer(GLint srcX0 = %d, GLint srcY0 = %d, GLint srcX1 = %d, GLint "
+                "srcY1 = %d, GLint dstX0 = %d, GLint dstY0 = %d, GLint dstX1 = %d, GLint dstY1 = "
+                "%d, GLbitfield mask = 0x%X, GLenum filter = 0x%X)",
+                static_cast<GLint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLint>(event.params[5]),
+                static_cast<GLint>(event.params[6]), static_cast<GLint>(event.params[7]),
+                static_cast<GLbitfield>(event.params[8]), static_cast<GLenum>(event.params[9]));
+        case EntryPoint::BlitFramebufferANGLE:
+            if (event.paramCount != 10)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glBlitFramebufferANGLE(GLint srcX0 = %d, GLint srcY0 = %d, GLint srcX1 = %d, "
+                "GLint srcY1 = %d, GLint dstX0 = %d, GLint dstY0 = %d, GLint dstX1 = %d, GLint "
+                "dstY1 = %d, GLbitfield mask = 0x%X, GLenum filter = 0x%X)",
+                static_cast<GLint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLint>(event.params[5]),
+                static_cast<GLint>(event.params[6]), static_cast<GLint>(event.params[7]),
+                static_cast<GLbitfield>(event.params[8]), static_cast<GLenum>(event.params[9]));
+        case EntryPoint::BufferData:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glBufferData(GLenum target = 0x%X, GLsizeiptr size = %llu, const "
+                               "void *data = 0x%016" PRIxPTR ", GLenum usage = 0x%X)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<unsigned long long>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]),
+                               static_cast<GLenum>(event.params[3]));
+        case EntryPoint::BufferStorageMemEXT:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glBufferStorageMemEXT(GLenum target = 0x%X, GLsizeiptr size = "
+                               "%llu, GLuint memory = %u, GLuint64 offset = %llu)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<unsigned long long>(event.params[1]),
+                               static_cast<GLuint>(event.params[2]),
+                               static_cast<unsigned long long>(event.params[3]));
+        case EntryPoint::BufferSubData:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glBufferSubData(GLenum target = 0x%X, GLintptr offset = %llu, "
+                               "GLsizeiptr size = %llu, const void *data = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<unsigned long long>(event.params[1]),
+                               static_cast<unsigned long long>(event.params[2]),
+                               static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::CheckFramebufferStatus:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glCheckFramebufferStatus(GLenum target = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::CheckFramebufferStatusOES:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glCheckFramebufferStatusOES(GLenum target = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::Clear:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glClear(GLbitfield mask = 0x%X)",
+                               static_cast<GLbitfield>(event.params[0]));
+        case EntryPoint::ClearBufferfi:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glClearBufferfi(GLenum buffer = 0x%X, GLint drawbuffer = %d, "
+                               "GLfloat depth = %f, GLint stencil = %d)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLint>(event.params[1]), DecodeFloat(event.params[2]),
+                               static_cast<GLint>(event.params[3]));
+        case EntryPoint::ClearBufferfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glClearBufferfv(GLenum buffer = 0x%X, GLint drawbuffer = %d, const "
+                               "GLfloat *value = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::ClearBufferiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glClearBufferiv(GLenum buffer = 0x%X, GLint drawbuffer = %d, const "
+                               "GLint *value = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::ClearBufferuiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glClearBufferuiv(GLenum buffer = 0x%X, GLint drawbuffer = %d, "
+                               "const GLuint *value = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::ClearColor:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glClearColor(GLfloat red = %f, GLfloat green = %f, GLfloat blue = "
+                               "%f, GLfloat alpha = %f)",
+                               DecodeFloat(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]), DecodeFloat(event.params[3]));
+        case EntryPoint::ClearColorx:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glClearColorx(GLfixed red = 0x%X, GLfixed green = 0x%X, GLfixed blue = 0x%X, "
+                "GLfixed alpha = 0x%X)",
+                static_cast<GLfixed>(event.params[0]), static_cast<GLfixed>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]), static_cast<GLfixed>(event.params[3]));
+        case EntryPoint::ClearDepthf:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glClearDepthf(GLfloat d = %f)",
+                               DecodeFloat(event.params[0]));
+        case EntryPoint::ClearDepthx:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glClearDepthx(GLfixed depth = 0x%X)",
+                               static_cast<GLfixed>(event.params[0]));
+        case EntryPoint::ClearStencil:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glClearStencil(GLint s = %d)",
+                               static_cast<GLint>(event.params[0]));
+        case EntryPoint::ClientActiveTexture:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glClientActiveTexture(GLenum texture = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::ClientWaitSync:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glClientWaitSync(GLsync sync = 0x%016" PRIxPTR
+                               ", GLbitfield flags = 0x%X, GLuint64 timeout = %llu)",
+                               static_cast<uintptr_t>(event.params[0]),
+                               static_cast<GLbitfield>(event.params[1]),
+                               static_cast<unsigned long long>(event.params[2]));
+        case EntryPoint::ClipPlanef:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glClipPlanef(GLenum p = 0x%X, const GLfloat *eqn = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::ClipPlanex:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glClipPlanex(GLenum plane = 0x%X, const GLfixed *equation = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::Color4f:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glColor4f(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, "
+                               "GLfloat alpha = %f)",
+                               DecodeFloat(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]), DecodeFloat(event.params[3]));
+        case EntryPoint::Color4ub:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glColor4ub(GLubyte red = %d, GLubyte green = %d, GLubyte blue = %d, GLubyte alpha "
+                "= %d)",
+                static_cast<GLubyte>(event.params[0]), static_cast<GLubyte>(event.params[1]),
+                static_cast<GLubyte>(event.params[2]), static_cast<GLubyte>(event.params[3]));
+        case EntryPoint::Color4x:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glColor4x(GLfixed red = 0x%X, GLfixed green = 0x%X, GLfixed blue = 0x%X, GLfixed "
+                "alpha = 0x%X)",
+                static_cast<GLfixed>(event.params[0]), static_cast<GLfixed>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]), static_cast<GLfixed>(event.params[3]));
+        case EntryPoint::ColorMask:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glColorMask(GLboolean red = %u, GLboolean green = %u, GLboolean blue = %u, "
+                "GLboolean alpha = %u)",
+                static_cast<GLboolean>(event.params[0]), static_cast<GLboolean>(event.params[1]),
+                static_cast<GLboolean>(event.params[2]), static_cast<GLboolean>(event.params[3]));
+        case EntryPoint::ColorPointer:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glColorPointer(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const "
+                "void *pointer = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::CompileShader:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glCompileShader(GLuint shader = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::CompressedCopyTextureCHROMIUM:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCompressedCopyTextureCHROMIUM(GLuint sourceId = %u, GLuint destId = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::CompressedTexImage2D:
+            if (event.paramCount != 8)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCompressedTexImage2D(GLenum target = 0x%X, GLint level = %d, GLenum "
+                "internalformat = 0x%X, GLsizei width = %d, GLsizei height = %d, GLint border = "
+                "%d, GLsizei imageSize = %d, const void *data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLint>(event.params[5]),
+                static_cast<GLsizei>(event.params[6]), static_cast<uintptr_t>(event.params[7]));
+        case EntryPoint::CompressedTexImage2DRobustANGLE:
+            if (event.paramCount != 9)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCompressedTexImage2DRobustANGLE(GLenum target = 0x%X, GLint level = %d, GLenum "
+                "internalformat = 0x%X, GLsizei width = %d, GLsizei height = %d, GLint border = "
+                "%d, GLsizei imageSize = %d, GLsizei dataSize = %d, const GLvoid * data = "
+                "0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLint>(event.params[5]),
+                static_cast<GLsizei>(event.params[6]), static_cast<GLsizei>(event.params[7]),
+                static_cast<uintptr_t>(event.params[8]));
+        case EntryPoint::CompressedTexImage3D:
+            if (event.paramCount != 9)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCompressedTexImage3D(GLenum target = 0x%X, GLint level = %d, GLenum "
+                "internalformat = 0x%X, GLsizei width = %d, GLsizei height = %d, GLsizei depth = "
+                "%d, GLint border = %d, GLsizei imageSize = %d, const void *data = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLint>(event.params[6]), static_cast<GLsizei>(event.params[7]),
+                static_cast<uintptr_t>(event.params[8]));
+        case EntryPoint::CompressedTexImage3DRobustANGLE:
+            if (event.paramCount != 10)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCompressedTexImage3DRobustANGLE(GLenum target = 0x%X, GLint level = %d, GLenum "
+                "internalformat = 0x%X, GLsizei width = %d, GLsizei height = %d, GLsizei depth = "
+                "%d, GLint border = %d, GLsizei imageSize = %d, GLsizei dataSize = %d, const "
+                "GLvoid * data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLint>(event.params[6]), static_cast<GLsizei>(event.params[7]),
+                static_cast<GLsizei>(event.params[8]), static_cast<uintptr_t>(event.params[9]));
+        case EntryPoint::CompressedTexSubImage2D:
+            if (event.paramCount != 9)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCompressedTexSubImage2D(GLenum target = 0x%X, GLint level = %d, GLint xoffset = "
+                "%d, GLint yoffset = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
+                "0x%X, GLsizei imageSize = %d, const void *data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLenum>(event.params[6]), static_cast<GLsizei>(event.params[7]),
+                static_cast<uintptr_t>(event.params[8]));
+        case EntryPoint::CompressedTexSubImage2DRobustANGLE:
+            if (event.paramCount != 10)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCompressedTexSubImage2DRobustANGLE(GLenum target = 0x%X, GLint level = %d, "
+                "GLsizei xoffset = %d, GLsizei yoffset = %d, GLsizei width = %d, GLsizei height = "
+                "%d, GLenum format = 0x%X, GLsizei imageSize = %d, GLsizei dataSize = %d, const "
+                "GLvoid * data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLenum>(event.params[6]), static_cast<GLsizei>(event.params[7]),
+                static_cast<GLsizei>(event.params[8]), static_cast<uintptr_t>(event.params[9]));
+        case EntryPoint::CompressedTexSubImage3D:
+            if (event.paramCount != 11)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCompressedTexSubImage3D(GLenum target = 0x%X, GLint level = %d, GLint xoffset = "
+                "%d, GLint yoffset = %d, GLint zoffset = %d, GLsizei width = %d, GLsizei height = "
+                "%d, GLsizei depth = %d, GLenum format = 0x%X, GLsizei imageSize = %d, const void "
+                "*data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLsizei>(event.params[6]), static_cast<GLsizei>(event.params[7]),
+                static_cast<GLenum>(event.params[8]), static_cast<GLsizei>(event.params[9]),
+                static_cast<uintptr_t>(event.params[10]));
+        case EntryPoint::CompressedTexSubImage3DRobustANGLE:
+            if (event.paramCount != 12)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCompressedTexSubImage3DRobustANGLE(GLenum target = 0x%X, GLint level = %d, "
+                "GLint xoffset = %d, GLint yoffset = %d, GLint zoffset = %d, GLsizei width = %d, "
+                "GLsizei height = %d, GLsizei depth = %d, GLenum format = 0x%X, GLsizei imageSize "
+                "= %d, GLsizei dataSize = %d, const GLvoid * data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLsizei>(event.params[6]), static_cast<GLsizei>(event.params[7]),
+                static_cast<GLenum>(event.params[8]), static_cast<GLsizei>(event.params[9]),
+                static_cast<GLsizei>(event.params[10]), static_cast<uintptr_t>(event.params[11]));
+        case EntryPoint::CopyBufferSubData:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCopyBufferSubData(GLenum readTarget = 0x%X, GLenum writeTarget = 0x%X, GLintptr "
+                "readOffset = %llu, GLintptr writeOffset = %llu, GLsizeiptr size = %llu)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<unsigned long long>(event.params[2]),
+                static_cast<unsigned long long>(event.params[3]),
+                static_cast<unsigned long long>(event.params[4]));
+        case EntryPoint::CopySubTexture3DANGLE:
+            if (event.paramCount != 17)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCopySubTexture3DANGLE(GLuint sourceId = %u, GLint sourceLevel = %d, GLenum "
+                "destTarget = 0x%X, GLuint destId = %u, GLint destLevel = %d, GLint xoffset = %d, "
+                "GLint yoffset = %d, GLint zoffset = %d, GLint x = %d, GLint y = %d, GLint z = %d, "
+                "GLint width = %d, GLint height = %d, GLint depth = %d, GLboolean unpackFlipY = "
+                "%u, GLboolean unpackPremultiplyAlpha = %u, GLboolean unpackUnmultiplyAlpha = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLint>(event.params[5]),
+                static_cast<GLint>(event.params[6]), static_cast<GLint>(event.params[7]),
+                static_cast<GLint>(event.params[8]), static_cast<GLint>(event.params[9]),
+                static_cast<GLint>(event.params[10]), static_cast<GLint>(event.params[11]),
+                static_cast<GLint>(event.params[12]), static_cast<GLint>(event.params[13]),
+                static_cast<GLboolean>(event.params[14]), static_cast<GLboolean>(event.params[15]),
+                static_cast<GLboolean>(event.params[16]));
+        case EntryPoint::CopySubTextureCHROMIUM:
+            if (event.paramCount != 14)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCopySubTextureCHROMIUM(GLuint sourceId = %u, GLint sourceLevel = %d, GLenum "
+                "destTarget = 0x%X, GLuint destId = %u, GLint destLevel = %d, GLint xoffset = %d, "
+                "GLint yoffset = %d, GLint x = %d, GLint y = %d, GLint width = %d, GLint height = "
+                "%d, GLboolean unpackFlipY = %u, GLboolean unpackPremultiplyAlpha = %u, GLboolean "
+                "unpackUnmultiplyAlpha = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLint>(event.params[5]),
+                static_cast<GLint>(event.params[6]), static_cast<GLint>(event.params[7]),
+                static_cast<GLint>(event.params[8]), static_cast<GLint>(event.params[9]),
+                static_cast<GLint>(event.params[10]), static_cast<GLboolean>(event.params[11]),
+                static_cast<GLboolean>(event.params[12]), static_cast<GLboolean>(event.params[13]));
+        case EntryPoint::CopyTexImage2D:
+            if (event.paramCount != 8)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCopyTexImage2D(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = "
+                "0x%X, GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLint "
+                "border = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLsizei>(event.params[6]), static_cast<GLint>(event.params[7]));
+        case EntryPoint::CopyTexSubImage2D:
+            if (event.paramCount != 8)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCopyTexSubImage2D(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, "
+                "GLint yoffset = %d, GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei "
+                "height = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLint>(event.params[5]),
+                static_cast<GLsizei>(event.params[6]), static_cast<GLsizei>(event.params[7]));
+        case EntryPoint::CopyTexSubImage3D:
+            if (event.paramCount != 9)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCopyTexSubImage3D(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, "
+                "GLint yoffset = %d, GLint zoffset = %d, GLint x = %d, GLint y = %d, GLsizei width "
+                "= %d, GLsizei height = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLint>(event.params[5]),
+                static_cast<GLint>(event.params[6]), static_cast<GLsizei>(event.params[7]),
+                static_cast<GLsizei>(event.params[8]));
+        case EntryPoint::CopyTexture3DANGLE:
+            if (event.paramCount != 10)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCopyTexture3DANGLE(GLuint sourceId = %u, GLint sourceLevel = %d, GLenum "
+                "destTarget = 0x%X, GLuint destId = %u, GLint destLevel = %d, GLint internalFormat "
+                "= %d, GLenum destType = 0x%X, GLboolean unpackFlipY = %u, GLboolean "
+                "unpackPremultiplyAlpha = %u, GLboolean unpackUnmultiplyAlpha = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLint>(event.params[5]),
+                static_cast<GLenum>(event.params[6]), static_cast<GLboolean>(event.params[7]),
+                static_cast<GLboolean>(event.params[8]), static_cast<GLboolean>(event.params[9]));
+        case EntryPoint::CopyTextureCHROMIUM:
+            if (event.paramCount != 10)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCopyTextureCHROMIUM(GLuint sourceId = %u, GLint sourceLevel = %d, GLenum "
+                "destTarget = 0x%X, GLuint destId = %u, GLint destLevel = %d, GLint internalFormat "
+                "= %d, GLenum destType = 0x%X, GLboolean unpackFlipY = %u, GLboolean "
+                "unpackPremultiplyAlpha = %u, GLboolean unpackUnmultiplyAlpha = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLint>(event.params[5]),
+                static_cast<GLenum>(event.params[6]), static_cast<GLboolean>(event.params[7]),
+                static_cast<GLboolean>(event.params[8]), static_cast<GLboolean>(event.params[9]));
+        case EntryPoint::CoverFillPathCHROMIUM:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glCoverFillPathCHROMIUM(GLuint path = %u, GLenum coverMode = 0x%X)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]));
+        case EntryPoint::CoverFillPathInstancedCHROMIUM:
+            if (event.paramCount != 7)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCoverFillPathInstancedCHROMIUM(GLsizei numPath = %d, GLenum pathNameType = "
+                "0x%X, const void * paths = 0x%016" PRIxPTR
+                ", GLuint pathBase = %u, GLenum coverMode = 0x%X, GLenum transformType = 0x%X, "
+                "const GLfloat * transformValues = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLenum>(event.params[4]), static_cast<GLenum>(event.params[5]),
+                static_cast<uintptr_t>(event.params[6]));
+        case EntryPoint::CoverStrokePathCHROMIUM:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glCoverStrokePathCHROMIUM(GLuint path = %u, GLenum coverMode = 0x%X)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]));
+        case EntryPoint::CoverStrokePathInstancedCHROMIUM:
+            if (event.paramCount != 7)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCoverStrokePathInstancedCHROMIUM(GLsizei numPath = %d, GLenum pathNameType = "
+                "0x%X, const void * paths = 0x%016" PRIxPTR
+                ", GLuint pathBase = %u, GLenum coverMode = 0x%X, GLenum transformType = 0x%X, "
+                "const GLfloat * transformValues = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLenum>(event.params[4]), static_cast<GLenum>(event.params[5]),
+                static_cast<uintptr_t>(event.params[6]));
+        case EntryPoint::CoverageModulationCHROMIUM:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glCoverageModulationCHROMIUM(GLenum components = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::CreateMemoryObjectsEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glCreateMemoryObjectsEXT(GLsizei n = %d, GLuint *memoryObjects = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::CreateProgram:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glCreateProgram()");
+        case EntryPoint::CreateShader:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glCreateShader(GLenum type = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::CreateShaderProgramv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glCreateShaderProgramv(GLenum type = 0x%X, GLsizei count = %d, "
+                               "const GLchar *const*strings = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::CullFace:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glCullFace(GLenum mode = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::CurrentPaletteMatrixOES:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glCurrentPaletteMatrixOES(GLuint matrixpaletteindex = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::DebugMessageCallbackKHR:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glDebugMessageCallbackKHR(GLDEBUGPROCKHR callback = 0x%016" PRIxPTR
+                               ", const void *userParam = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]),
+                               static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DebugMessageControlKHR:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDebugMessageControlKHR(GLenum source = 0x%X, GLenum type = 0x%X, GLenum "
+                "severity = 0x%X, GLsizei count = %d, const GLuint *ids = 0x%016" PRIxPTR
+                ", GLboolean enabled = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<GLboolean>(event.params[5]));
+        case EntryPoint::DebugMessageInsertKHR:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDebugMessageInsertKHR(GLenum source = 0x%X, GLenum type = 0x%X, GLuint id = %u, "
+                "GLenum severity = 0x%X, GLsizei length = %d, const GLchar *buf = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLenum>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::DeleteBuffers:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDeleteBuffers(GLsizei n = %d, const GLuint *buffers = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteFencesNV:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDeleteFencesNV(GLsizei n = %d, const GLuint *fences = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteFramebuffers:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDeleteFramebuffers(GLsizei n = %d, const GLuint *framebuffers = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteFramebuffersOES:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glDeleteFramebuffersOES(GLsizei n = %d, const GLuint *framebuffers "
+                               "= 0x%016" PRIxPTR ")",
+                               static_cast<GLsizei>(event.params[0]),
+                               static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteMemoryObjectsEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glDeleteMemoryObjectsEXT(GLsizei n = %d, const GLuint "
+                               "*memoryObjects = 0x%016" PRIxPTR ")",
+                               static_cast<GLsizei>(event.params[0]),
+                               static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeletePathsCHROMIUM:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glDeletePathsCHROMIUM(GLuint first = %u, GLsizei range = %d)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]));
+        case EntryPoint::DeleteProgram:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDeleteProgram(GLuint program = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::DeleteProgramPipelines:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDeleteProgramPipelines(GLsizei n = %d, const GLuint *pipelines = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteQueries:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glDeleteQueries(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteQueriesEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDeleteQueriesEXT(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteRenderbuffers:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDeleteRenderbuffers(GLsizei n = %d, const GLuint *renderbuffers = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteRenderbuffersOES:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glDeleteRenderbuffersOES(GLsizei n = %d, const GLuint "
+                               "*renderbuffers = 0x%016" PRIxPTR ")",
+                               static_cast<GLsizei>(event.params[0]),
+                               static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteSamplers:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDeleteSamplers(GLsizei count = %d, const GLuint *samplers = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteSemaphoresEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDeleteSemaphoresEXT(GLsizei n = %d, const GLuint *semaphores = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteShader:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDeleteShader(GLuint shader = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::DeleteSync:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDeleteSync(GLsync sync = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]));
+        case EntryPoint::DeleteTextures:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDeleteTextures(GLsizei n = %d, const GLuint *textures = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteTransformFeedbacks:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDeleteTransformFeedbacks(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteVertexArrays:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDeleteVertexArrays(GLsizei n = %d, const GLuint *arrays = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DeleteVertexArraysOES:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDeleteVertexArraysOES(GLsizei n = %d, const GLuint *arrays = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DepthFunc:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDepthFunc(GLenum func = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::DepthMask:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDepthMask(GLboolean flag = %u)",
+                               static_cast<GLboolean>(event.params[0]));
+        case EntryPoint::DepthRangef:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDepthRangef(GLfloat n = %f, GLfloat f = %f)",
+                               DecodeFloat(event.params[0]), DecodeFloat(event.params[1]));
+        case EntryPoint::DepthRangex:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDepthRangex(GLfixed n = 0x%X, GLfixed f = 0x%X)",
+                               static_cast<GLfixed>(event.params[0]),
+                               static_cast<GLfixed>(event.params[1]));
+        case EntryPoint::DetachShader:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDetachShader(GLuint program = %u, GLuint shader = %u)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]));
+        case EntryPoint::Disable:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDisable(GLenum cap = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::DisableClientState:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDisableClientState(GLenum array = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::DisableVertexAttribArray:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDisableVertexAttribArray(GLuint index = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::DiscardFramebufferEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDiscardFramebufferEXT(GLenum target = 0x%X, GLsizei numAttachments = %d, const "
+                "GLenum *attachments = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::DispatchCompute:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glDispatchCompute(GLuint num_groups_x = %u, GLuint num_groups_y = "
+                               "%u, GLuint num_groups_z = %u)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]),
+                               static_cast<GLuint>(event.params[2]));
+        case EntryPoint::DispatchComputeIndirect:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDispatchComputeIndirect(GLintptr indirect = %llu)",
+                               static_cast<unsigned long long>(event.params[0]));
+        case EntryPoint::DrawArrays:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glDrawArrays(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]));
+        case EntryPoint::DrawArraysIndirect:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDrawArraysIndirect(GLenum mode = 0x%X, const void *indirect = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DrawArraysInstanced:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDrawArraysInstanced(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d, "
+                "GLsizei instancecount = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLsizei>(event.params[3]));
+        case EntryPoint::DrawArraysInstancedANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDrawArraysInstancedANGLE(GLenum mode = 0x%X, GLint first = %d, GLsizei count = "
+                "%d, GLsizei primcount = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLsizei>(event.params[3]));
+        case EntryPoint::DrawArraysInstancedEXT:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDrawArraysInstancedEXT(GLenum mode = 0x%X, GLint start = %d, GLsizei count = "
+                "%d, GLsizei primcount = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLsizei>(event.params[3]));
+        case EntryPoint::DrawBuffers:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glDrawBuffers(GLsizei n = %d, const GLenum *bufs = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DrawBuffersEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glDrawBuffersEXT(GLsizei n = %d, const GLenum *bufs = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::DrawElements:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDrawElements(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const "
+                "void *indices = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::DrawElementsIndirect:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glDrawElementsIndirect(GLenum mode = 0x%X, GLenum type = 0x%X, "
+                               "const void *indirect = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::DrawElementsInstanced:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDrawElementsInstanced(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = "
+                "0x%X, const void *indices = 0x%016" PRIxPTR ", GLsizei instancecount = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]));
+        case EntryPoint::DrawElementsInstancedANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDrawElementsInstancedANGLE(GLenum mode = 0x%X, GLsizei count = %d, GLenum type "
+                "= 0x%X, const void *indices = 0x%016" PRIxPTR ", GLsizei primcount = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]));
+        case EntryPoint::DrawElementsInstancedEXT:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDrawElementsInstancedEXT(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = "
+                "0x%X, const void *indices = 0x%016" PRIxPTR ", GLsizei primcount = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]));
+        case EntryPoint::DrawRangeElements:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDrawRangeElements(GLenum mode = 0x%X, GLuint start = %u, GLuint end = %u, "
+                "GLsizei count = %d, GLenum type = 0x%X, const void *indices = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLenum>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::DrawTexfOES:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glDrawTexfOES(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f, "
+                               "GLfloat width = %f, GLfloat height = %f)",
+                               DecodeFloat(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]), DecodeFloat(event.params[3]),
+                               DecodeFloat(event.params[4]));
+        case EntryPoint::DrawTexfvOES:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDrawTexfvOES(const GLfloat *coords = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]));
+        case EntryPoint::DrawTexiOES:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDrawTexiOES(GLint x = %d, GLint y = %d, GLint z = %d, GLint width = %d, GLint "
+                "height = %d)",
+                static_cast<GLint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]));
+        case EntryPoint::DrawTexivOES:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDrawTexivOES(const GLint *coords = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]));
+        case EntryPoint::DrawTexsOES:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDrawTexsOES(GLshort x = %d, GLshort y = %d, GLshort z = %d, GLshort width = %d, "
+                "GLshort height = %d)",
+                static_cast<GLshort>(event.params[0]), static_cast<GLshort>(event.params[1]),
+                static_cast<GLshort>(event.params[2]), static_cast<GLshort>(event.params[3]),
+                static_cast<GLshort>(event.params[4]));
+        case EntryPoint::DrawTexsvOES:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDrawTexsvOES(const GLshort *coords = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]));
+        case EntryPoint::DrawTexxOES:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glDrawTexxOES(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X, GLfixed width "
+                "= 0x%X, GLfixed height = 0x%X)",
+                static_cast<GLfixed>(event.params[0]), static_cast<GLfixed>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]), static_cast<GLfixed>(event.params[3]),
+                static_cast<GLfixed>(event.params[4]));
+        case EntryPoint::DrawTexxvOES:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glDrawTexxvOES(const GLfixed *coords = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]));
+        case EntryPoint::EGLImageTargetRenderbufferStorageOES:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glEGLImageTargetRenderbufferStorageOES(GLenum target = 0x%X, "
+                               "GLeglImageOES image = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::EGLImageTargetTexture2DOES:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glEGLImageTargetTexture2DOES(GLenum target = 0x%X, GLeglImageOES "
+                               "image = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::Enable:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glEnable(GLenum cap = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::EnableClientState:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glEnableClientState(GLenum array = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::EnableVertexAttribArray:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glEnableVertexAttribArray(GLuint index = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::EndQuery:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glEndQuery(GLenum target = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::EndQueryEXT:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glEndQueryEXT(GLenum target = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::EndTransformFeedback:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glEndTransformFeedback()");
+        case EntryPoint::FenceSync:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glFenceSync(GLenum condition = 0x%X, GLbitfield flags = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLbitfield>(event.params[1]));
+        case EntryPoint::Finish:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glFinish()");
+        case EntryPoint::FinishFenceNV:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glFinishFenceNV(GLuint fence = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::Flush:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glFlush()");
+        case EntryPoint::FlushMappedBufferRange:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glFlushMappedBufferRange(GLenum target = 0x%X, GLintptr offset = "
+                               "%llu, GLsizeiptr length = %llu)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<unsigned long long>(event.params[1]),
+                               static_cast<unsigned long long>(event.params[2]));
+        case EntryPoint::FlushMappedBufferRangeEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glFlushMappedBufferRangeEXT(GLenum target = 0x%X, GLintptr offset "
+                               "= %llu, GLsizeiptr length = %llu)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<unsigned long long>(event.params[1]),
+                               static_cast<unsigned long long>(event.params[2]));
+        case EntryPoint::Fogf:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glFogf(GLenum pname = 0x%X, GLfloat param = %f)",
+                               static_cast<GLenum>(event.params[0]), DecodeFloat(event.params[1]));
+        case EntryPoint::Fogfv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glFogfv(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::Fogx:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glFogx(GLenum pname = 0x%X, GLfixed param = 0x%X)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLfixed>(event.params[1]));
+        case EntryPoint::Fogxv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glFogxv(GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::FramebufferParameteri:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glFramebufferParameteri(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                               "GLint param = %d)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<GLint>(event.params[2]));
+        case EntryPoint::FramebufferRenderbuffer:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glFramebufferRenderbuffer(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum "
+                "renderbuffertarget = 0x%X, GLuint renderbuffer = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLuint>(event.params[3]));
+        case EntryPoint::FramebufferRenderbufferOES:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glFramebufferRenderbufferOES(GLenum target = 0x%X, GLenum attachment = 0x%X, "
+                "GLenum renderbuffertarget = 0x%X, GLuint renderbuffer = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLuint>(event.params[3]));
+        case EntryPoint::FramebufferTexture2D:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glFramebufferTexture2D(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum "
+                "textarget = 0x%X, GLuint texture = %u, GLint level = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLint>(event.params[4]));
+        case EntryPoint::FramebufferTexture2DOES:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glFramebufferTexture2DOES(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum "
+                "textarget = 0x%X, GLuint texture = %u, GLint level = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLint>(event.params[4]));
+        case EntryPoint::FramebufferTextureEXT:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glFramebufferTextureEXT(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint "
+                "texture = %u, GLint level = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLint>(event.params[3]));
+        case EntryPoint::FramebufferTextureLayer:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glFramebufferTextureLayer(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint "
+                "texture = %u, GLint level = %d, GLint layer = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]));
+        case EntryPoint::FramebufferTextureMultiviewOVR:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glFramebufferTextureMultiviewOVR(GLenum target = 0x%X, GLenum attachment = 0x%X, "
+                "GLuint texture = %u, GLint level = %d, GLint baseViewIndex = %d, GLsizei numViews "
+                "= %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLsizei>(event.params[5]));
+        case EntryPoint::FrontFace:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glFrontFace(GLenum mode = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::Frustumf:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glFrustumf(GLfloat l = %f, GLfloat r = %f, GLfloat b = %f, GLfloat "
+                               "t = %f, GLfloat n = %f, GLfloat f = %f)",
+                               DecodeFloat(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]), DecodeFloat(event.params[3]),
+                               DecodeFloat(event.params[4]), DecodeFloat(event.params[5]));
+        case EntryPoint::Frustumx:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glFrustumx(GLfixed l = 0x%X, GLfixed r = 0x%X, GLfixed b = 0x%X, GLfixed t = "
+                "0x%X, GLfixed n = 0x%X, GLfixed f = 0x%X)",
+                static_cast<GLfixed>(event.params[0]), static_cast<GLfixed>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]), static_cast<GLfixed>(event.params[3]),
+                static_cast<GLfixed>(event.params[4]), static_cast<GLfixed>(event.params[5]));
+        case EntryPoint::GenBuffers:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGenBuffers(GLsizei n = %d, GLuint *buffers = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenFencesNV:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGenFencesNV(GLsizei n = %d, GLuint *fences = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenFramebuffers:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGenFramebuffers(GLsizei n = %d, GLuint *framebuffers = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenFramebuffersOES:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGenFramebuffersOES(GLsizei n = %d, GLuint *framebuffers = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenPathsCHROMIUM:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glGenPathsCHROMIUM(GLsizei range = %d)",
+                               static_cast<GLsizei>(event.params[0]));
+        case EntryPoint::GenProgramPipelines:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGenProgramPipelines(GLsizei n = %d, GLuint *pipelines = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenQueries:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGenQueries(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenQueriesEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGenQueriesEXT(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenRenderbuffers:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGenRenderbuffers(GLsizei n = %d, GLuint *renderbuffers = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenRenderbuffersOES:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGenRenderbuffersOES(GLsizei n = %d, GLuint *renderbuffers = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenSamplers:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGenSamplers(GLsizei count = %d, GLuint *samplers = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenSemaphoresEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGenSemaphoresEXT(GLsizei n = %d, GLuint *semaphores = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenTextures:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGenTextures(GLsizei n = %d, GLuint *textures = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenTransformFeedbacks:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGenTransformFeedbacks(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenVertexArrays:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGenVertexArrays(GLsizei n = %d, GLuint *arrays = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenVertexArraysOES:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGenVertexArraysOES(GLsizei n = %d, GLuint *arrays = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GenerateMipmap:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glGenerateMipmap(GLenum target = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::GenerateMipmapOES:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glGenerateMipmapOES(GLenum target = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::GetActiveAttrib:
+            if (event.paramCount != 7)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetActiveAttrib(GLuint program = %u, GLuint index = %u, GLsizei bufSize = %d, "
+                "GLsizei *length = 0x%016" PRIxPTR ", GLint *size = 0x%016" PRIxPTR
+                ", GLenum *type = 0x%016" PRIxPTR ", GLchar *name = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]),
+                static_cast<uintptr_t>(event.params[6]));
+        case EntryPoint::GetActiveUniform:
+            if (event.paramCount != 7)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetActiveUniform(GLuint program = %u, GLuint index = %u, GLsizei bufSize = %d, "
+                "GLsizei *length = 0x%016" PRIxPTR ", GLint *size = 0x%016" PRIxPTR
+                ", GLenum *type = 0x%016" PRIxPTR ", GLchar *name = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]),
+                static_cast<uintptr_t>(event.params[6]));
+        case EntryPoint::GetActiveUniformBlockName:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetActiveUniformBlockName(GLuint program = %u, GLuint uniformBlockIndex = %u, "
+                "GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
+                ", GLchar *uniformBlockName = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetActiveUniformBlockiv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetActiveUniformBlockiv(GLuint program = %u, GLuint uniformBlockIndex = %u, "
+                "GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetActiveUniformBlockivRobustANGLE:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetActiveUniformBlockivRobustANGLE(GLuint program = %u, GLuint "
+                "uniformBlockIndex = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * "
+                "length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::GetActiveUniformsiv:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetActiveUniformsiv(GLuint program = %u, GLsizei uniformCount = %d, const "
+                "GLuint *uniformIndices = 0x%016" PRIxPTR
+                ", GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLenum>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetAttachedShaders:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetAttachedShaders(GLuint program = %u, GLsizei maxCount = %d, GLsizei *count = "
+                "0x%016" PRIxPTR ", GLuint *shaders = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetAttribLocation:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetAttribLocation(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetBooleani_v:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetBooleani_v(GLenum target = 0x%X, GLuint index = %u, GLboolean "
+                               "*data = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetBooleani_vRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetBooleani_vRobustANGLE(GLenum target = 0x%X, GLuint index = %u, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLboolean * data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetBooleanv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGetBooleanv(GLenum pname = 0x%X, GLboolean *data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetBooleanvRobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetBooleanvRobustANGLE(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * "
+                "length = 0x%016" PRIxPTR ", GLboolean * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetBufferParameteri64v:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetBufferParameteri64v(GLenum target = 0x%X, GLenum pname = "
+                               "0x%X, GLint64 *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetBufferParameteri64vRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetBufferParameteri64vRobustANGLE(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                "GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint64 * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetBufferParameteriv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetBufferParameteriv(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                               "GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetBufferParameterivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetBufferParameterivRobustANGLE(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                "GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetBufferPointerv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetBufferPointerv(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                               "void **params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetBufferPointervOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetBufferPointervOES(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                               "void **params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetBufferPointervRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetBufferPointervRobustANGLE(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", void ** params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetClipPlanef:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetClipPlanef(GLenum plane = 0x%X, GLfloat *equation = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetClipPlanex:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetClipPlanex(GLenum plane = 0x%X, GLfixed *equation = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetDebugMessageLogKHR:
+            if (event.paramCount != 8)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetDebugMessageLogKHR(GLuint count = %u, GLsizei bufSize = %d, GLenum *sources "
+                "= 0x%016" PRIxPTR ", GLenum *types = 0x%016" PRIxPTR
+                ", GLuint *ids = 0x%016" PRIxPTR ", GLenum *severities = 0x%016" PRIxPTR
+                ", GLsizei *lengths = 0x%016" PRIxPTR ", GLchar *messageLog = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]),
+                static_cast<uintptr_t>(event.params[6]), static_cast<uintptr_t>(event.params[7]));
+        case EntryPoint::GetError:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glGetError()");
+        case EntryPoint::GetFenceivNV:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetFenceivNV(GLuint fence = %u, GLenum pname = 0x%X, GLint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetFixedv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGetFixedv(GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetFloatv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGetFloatv(GLenum pname = 0x%X, GLfloat *data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetFloatvRobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetFloatvRobustANGLE(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * "
+                "length = 0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetFragDataIndexEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetFragDataIndexEXT(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLuint>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetFragDataLocation:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetFragDataLocation(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLuint>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetFramebufferAttachmentParameteriv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetFramebufferAttachmentParameteriv(GLenum target = 0x%X, GLenum attachment = "
+                "0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetFramebufferAttachmentParameterivOES:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetFramebufferAttachmentParameterivOES(GLenum target = 0x%X, GLenum attachment "
+                "= 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetFramebufferAttachmentParameterivRobustANGLE:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetFramebufferAttachmentParameterivRobustANGLE(GLenum target = 0x%X, GLenum "
+                "attachment = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
+                "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::GetFramebufferParameteriv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetFramebufferParameteriv(GLenum target = 0x%X, GLenum pname = "
+                               "0x%X, GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetFramebufferParameterivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetFramebufferParameterivRobustANGLE(GLuint sampler = %u, GLenum pname = 0x%X, "
+                "GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetGraphicsResetStatusEXT:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glGetGraphicsResetStatusEXT()");
+        case EntryPoint::GetInteger64i_v:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetInteger64i_v(GLenum target = 0x%X, GLuint index = %u, GLint64 "
+                               "*data = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetInteger64i_vRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetInteger64i_vRobustANGLE(GLenum target = 0x%X, GLuint index = %u, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint64 * data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetInteger64v:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGetInteger64v(GLenum pname = 0x%X, GLint64 *data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetInteger64vRobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetInteger64vRobustANGLE(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * "
+                "length = 0x%016" PRIxPTR ", GLint64 * data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetIntegeri_v:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetIntegeri_v(GLenum target = 0x%X, GLuint index = %u, GLint "
+                               "*data = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetIntegeri_vRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetIntegeri_vRobustANGLE(GLenum target = 0x%X, GLuint index = %u, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * data = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetIntegerv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGetIntegerv(GLenum pname = 0x%X, GLint *data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetIntegervRobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetIntegervRobustANGLE(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * "
+                "length = 0x%016" PRIxPTR ", GLint * data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetInternalformativ:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetInternalformativ(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLenum "
+                "pname = 0x%X, GLsizei bufSize = %d, GLint *params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetInternalformativRobustANGLE:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetInternalformativRobustANGLE(GLenum target = 0x%X, GLenum internalformat = "
+                "0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::GetLightfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetLightfv(GLenum light = 0x%X, GLenum pname = 0x%X, GLfloat "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetLightxv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetLightxv(GLenum light = 0x%X, GLenum pname = 0x%X, GLfixed "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetMaterialfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetMaterialfv(GLenum face = 0x%X, GLenum pname = 0x%X, GLfloat "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetMaterialxv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetMaterialxv(GLenum face = 0x%X, GLenum pname = 0x%X, GLfixed "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetMemoryObjectParameterivEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetMemoryObjectParameterivEXT(GLuint memoryObject = %u, GLenum "
+                               "pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetMultisamplefv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetMultisamplefv(GLenum pname = 0x%X, GLuint index = %u, GLfloat "
+                               "*val = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetMultisamplefvANGLE:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetMultisamplefvANGLE(GLenum pname = 0x%X, GLuint index = %u, "
+                               "GLfloat * val = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetMultisamplefvRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetMultisamplefvRobustANGLE(GLenum pname = 0x%X, GLuint index = %u, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR ", GLfloat * val = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetObjectLabelKHR:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetObjectLabelKHR(GLenum identifier = 0x%X, GLuint name = %u, GLsizei bufSize = "
+                "%d, GLsizei *length = 0x%016" PRIxPTR ", GLchar *label = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetObjectPtrLabelKHR:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetObjectPtrLabelKHR(const void *ptr = 0x%016" PRIxPTR
+                ", GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
+                ", GLchar *label = 0x%016" PRIxPTR ")",
+                static_cast<uintptr_t>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetPathParameterfvCHROMIUM:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetPathParameterfvCHROMIUM(GLuint path = %u, GLenum pname = "
+                               "0x%X, GLfloat * value = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetPathParameterivCHROMIUM:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetPathParameterivCHROMIUM(GLuint path = %u, GLenum pname = "
+                               "0x%X, GLint * value = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetPointerv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGetPointerv(GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetPointervKHR:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glGetPointervKHR(GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetPointervRobustANGLERobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetPointervRobustANGLERobustANGLE(GLenum pname = 0x%X, GLsizei bufSize = %d, "
+                "GLsizei * length = 0x%016" PRIxPTR ", void ** params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetProgramBinary:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetProgramBinary(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = "
+                "0x%016" PRIxPTR ", GLenum *binaryFormat = 0x%016" PRIxPTR
+                ", void *binary = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetProgramBinaryOES:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetProgramBinaryOES(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length "
+                "= 0x%016" PRIxPTR ", GLenum *binaryFormat = 0x%016" PRIxPTR
+                ", void *binary = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetProgramInfoLog:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetProgramInfoLog(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = "
+                "0x%016" PRIxPTR ", GLchar *infoLog = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetProgramInterfaceiv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetProgramInterfaceiv(GLuint program = %u, GLenum programInterface = 0x%X, "
+                "GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetProgramInterfaceivRobustANGLE:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetProgramInterfaceivRobustANGLE(GLuint program = %u, GLenum programInterface = "
+                "0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::GetProgramPipelineInfoLog:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetProgramPipelineInfoLog(GLuint pipeline = %u, GLsizei bufSize = %d, GLsizei "
+                "*length = 0x%016" PRIxPTR ", GLchar *infoLog = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetProgramPipelineiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetProgramPipelineiv(GLuint pipeline = %u, GLenum pname = 0x%X, "
+                               "GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetProgramResourceIndex:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetProgramResourceIndex(GLuint program = %u, GLenum "
+                               "programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetProgramResourceLocation:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetProgramResourceLocation(GLuint program = %u, GLenum "
+                               "programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetProgramResourceLocationIndexEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetProgramResourceLocationIndexEXT(GLuint program = %u, GLenum "
+                               "programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetProgramResourceName:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetProgramResourceName(GLuint program = %u, GLenum programInterface = 0x%X, "
+                "GLuint index = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
+                ", GLchar *name = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::GetProgramResourceiv:
+            if (event.paramCount != 8)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetProgramResourceiv(GLuint program = %u, GLenum programInterface = 0x%X, "
+                "GLuint index = %u, GLsizei propCount = %d, const GLenum *props = 0x%016" PRIxPTR
+                ", GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
+                ", GLint *params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<uintptr_t>(event.params[6]), static_cast<uintptr_t>(event.params[7]));
+        case EntryPoint::GetProgramiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetProgramiv(GLuint program = %u, GLenum pname = 0x%X, GLint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetProgramivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetProgramivRobustANGLE(GLuint program = %u, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetQueryObjecti64vEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetQueryObjecti64vEXT(GLuint id = %u, GLenum pname = 0x%X, "
+                               "GLint64 *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetQueryObjecti64vRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetQueryObjecti64vRobustANGLE(GLuint id = %u, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint64 * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetQueryObjectivEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetQueryObjectivEXT(GLuint id = %u, GLenum pname = 0x%X, GLint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetQueryObjectivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetQueryObjectivRobustANGLE(GLuint id = %u, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetQueryObjectui64vEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetQueryObjectui64vEXT(GLuint id = %u, GLenum pname = 0x%X, "
+                               "GLuint64 *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetQueryObjectui64vRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetQueryObjectui64vRobustANGLE(GLuint id = %u, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLuint64 * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetQueryObjectuiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetQueryObjectuiv(GLuint id = %u, GLenum pname = 0x%X, GLuint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetQueryObjectuivEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetQueryObjectuivEXT(GLuint id = %u, GLenum pname = 0x%X, GLuint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetQueryObjectuivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetQueryObjectuivRobustANGLE(GLuint id = %u, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLuint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetQueryiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetQueryiv(GLenum target = 0x%X, GLenum pname = 0x%X, GLint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetQueryivEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetQueryivEXT(GLenum target = 0x%X, GLenum pname = 0x%X, GLint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetQueryivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetQueryivRobustANGLE(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetRenderbufferParameteriv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetRenderbufferParameteriv(GLenum target = 0x%X, GLenum pname = "
+                               "0x%X, GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetRenderbufferParameterivOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetRenderbufferParameterivOES(GLenum target = 0x%X, GLenum pname "
+                               "= 0x%X, GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetRenderbufferParameterivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetRenderbufferParameterivRobustANGLE(GLenum target = 0x%X, GLenum pname = "
+                "0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetSamplerParameterIivOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetSamplerParameterIivOES(GLuint sampler = %u, GLenum pname = "
+                               "0x%X, GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetSamplerParameterIivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetSamplerParameterIivRobustANGLE(GLuint sampler = %u, GLenum pname = 0x%X, "
+                "GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetSamplerParameterIuivOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetSamplerParameterIuivOES(GLuint sampler = %u, GLenum pname = "
+                               "0x%X, GLuint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetSamplerParameterIuivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetSamplerParameterIuivRobustANGLE(GLuint sampler = %u, GLenum pname = 0x%X, "
+                "GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLuint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetSamplerParameterfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetSamplerParameterfv(GLuint sampler = %u, GLenum pname = 0x%X, "
+                               "GLfloat *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetSamplerParameterfvRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetSamplerParameterfvRobustANGLE(GLuint sampler = %u, GLenum pname = 0x%X, "
+                "GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLfloat * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetSamplerParameteriv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetSamplerParameteriv(GLuint sampler = %u, GLenum pname = 0x%X, "
+                               "GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetSamplerParameterivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetSamplerParameterivRobustANGLE(GLuint sampler = %u, GLenum pname = 0x%X, "
+                "GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetSemaphoreParameterui64vEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetSemaphoreParameterui64vEXT(GLuint semaphore = %u, GLenum "
+                               "pname = 0x%X, GLuint64 *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetShaderInfoLog:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetShaderInfoLog(GLuint shader = %u, GLsizei bufSize = %d, GLsizei *length = "
+                "0x%016" PRIxPTR ", GLchar *infoLog = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetShaderPrecisionFormat:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetShaderPrecisionFormat(GLenum shadertype = 0x%X, GLenum precisiontype = 0x%X, "
+                "GLint *range = 0x%016" PRIxPTR ", GLint *precision = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetShaderSource:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetShaderSource(GLuint shader = %u, GLsizei bufSize = %d, GLsizei *length = "
+                "0x%016" PRIxPTR ", GLchar *source = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetShaderiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetShaderiv(GLuint shader = %u, GLenum pname = 0x%X, GLint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetShaderivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetShaderivRobustANGLE(GLuint shader = %u, GLenum pname = 0x%X, GLsizei bufSize "
+                "= %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetString:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glGetString(GLenum name = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::GetStringi:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glGetStringi(GLenum name = 0x%X, GLuint index = %u)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]));
+        case EntryPoint::GetSynciv:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetSynciv(GLsync sync = 0x%016" PRIxPTR
+                ", GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
+                ", GLint *values = 0x%016" PRIxPTR ")",
+                static_cast<uintptr_t>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetTexEnvfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetTexEnvfv(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetTexEnviv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetTexEnviv(GLenum target = 0x%X, GLenum pname = 0x%X, GLint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetTexEnvxv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetTexEnvxv(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetTexGenfvOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetTexGenfvOES(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfloat "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetTexGenivOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetTexGenivOES(GLenum coord = 0x%X, GLenum pname = 0x%X, GLint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetTexGenxvOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetTexGenxvOES(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfixed "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetTexLevelParameterfv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetTexLevelParameterfv(GLenum target = 0x%X, GLint level = %d, GLenum pname = "
+                "0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetTexLevelParameterfvANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetTexLevelParameterfvANGLE(GLenum target = 0x%X, GLint level = %d, GLenum "
+                "pname = 0x%X, GLfloat * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetTexLevelParameterfvRobustANGLE:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetTexLevelParameterfvRobustANGLE(GLenum target = 0x%X, GLint level = %d, "
+                "GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLfloat * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::GetTexLevelParameteriv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetTexLevelParameteriv(GLenum target = 0x%X, GLint level = %d, GLenum pname = "
+                "0x%X, GLint *params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetTexLevelParameterivANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetTexLevelParameterivANGLE(GLenum target = 0x%X, GLint level = %d, GLenum "
+                "pname = 0x%X, GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetTexLevelParameterivRobustANGLE:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetTexLevelParameterivRobustANGLE(GLenum target = 0x%X, GLint level = %d, "
+                "GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::GetTexParameterIivOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetTexParameterIivOES(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                               "GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetTexParameterIivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetTexParameterIivRobustANGLE(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                "GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetTexParameterIuivOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetTexParameterIuivOES(GLenum target = 0x%X, GLenum pname = "
+                               "0x%X, GLuint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetTexParameterIuivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetTexParameterIuivRobustANGLE(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                "GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLuint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetTexParameterfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetTexParameterfv(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                               "GLfloat *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetTexParameterfvRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetTexParameterfvRobustANGLE(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLfloat * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetTexParameteriv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetTexParameteriv(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                               "GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetTexParameterivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetTexParameterivRobustANGLE(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetTexParameterxv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetTexParameterxv(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                               "GLfixed *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetTransformFeedbackVarying:
+            if (event.paramCount != 7)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetTransformFeedbackVarying(GLuint program = %u, GLuint index = %u, GLsizei "
+                "bufSize = %d, GLsizei *length = 0x%016" PRIxPTR ", GLsizei *size = 0x%016" PRIxPTR
+                ", GLenum *type = 0x%016" PRIxPTR ", GLchar *name = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]),
+                static_cast<uintptr_t>(event.params[6]));
+        case EntryPoint::GetTranslatedShaderSourceANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetTranslatedShaderSourceANGLE(GLuint shader = %u, GLsizei bufsize = %d, "
+                "GLsizei *length = 0x%016" PRIxPTR ", GLchar *source = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetUniformBlockIndex:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetUniformBlockIndex(GLuint program = %u, const GLchar "
+                               "*uniformBlockName = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetUniformIndices:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetUniformIndices(GLuint program = %u, GLsizei uniformCount = %d, const GLchar "
+                "*const*uniformNames = 0x%016" PRIxPTR ", GLuint *uniformIndices = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetUniformLocation:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetUniformLocation(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetUniformfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetUniformfv(GLuint program = %u, GLint location = %d, GLfloat "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetUniformfvRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetUniformfvRobustANGLE(GLuint program = %u, GLint location = %d, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLfloat * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetUniformiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetUniformiv(GLuint program = %u, GLint location = %d, GLint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetUniformivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetUniformivRobustANGLE(GLuint program = %u, GLint location = %d, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetUniformuiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetUniformuiv(GLuint program = %u, GLint location = %d, GLuint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetUniformuivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetUniformuivRobustANGLE(GLuint program = %u, GLint location = %d, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLuint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetUnsignedBytei_vEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetUnsignedBytei_vEXT(GLenum target = 0x%X, GLuint index = %u, "
+                               "GLubyte *data = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetUnsignedBytevEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetUnsignedBytevEXT(GLenum pname = 0x%X, GLubyte *data = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::GetVertexAttribIiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetVertexAttribIiv(GLuint index = %u, GLenum pname = 0x%X, GLint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetVertexAttribIivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetVertexAttribIivRobustANGLE(GLuint index = %u, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetVertexAttribIuiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetVertexAttribIuiv(GLuint index = %u, GLenum pname = 0x%X, "
+                               "GLuint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetVertexAttribIuivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetVertexAttribIuivRobustANGLE(GLuint index = %u, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLuint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetVertexAttribPointerv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetVertexAttribPointerv(GLuint index = %u, GLenum pname = 0x%X, "
+                               "void **pointer = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetVertexAttribPointervRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetVertexAttribPointervRobustANGLE(GLuint index = %u, GLenum pname = 0x%X, "
+                "GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", void ** pointer = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetVertexAttribfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetVertexAttribfv(GLuint index = %u, GLenum pname = 0x%X, "
+                               "GLfloat *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetVertexAttribfvRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetVertexAttribfvRobustANGLE(GLuint index = %u, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLfloat * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetVertexAttribiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glGetVertexAttribiv(GLuint index = %u, GLenum pname = 0x%X, GLint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::GetVertexAttribivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetVertexAttribivRobustANGLE(GLuint index = %u, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetnUniformfvEXT:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetnUniformfvEXT(GLuint program = %u, GLint location = %d, GLsizei bufSize = "
+                "%d, GLfloat *params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetnUniformfvRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetnUniformfvRobustANGLE(GLuint program = %u, GLint location = %d, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLfloat * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetnUniformivEXT:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetnUniformivEXT(GLuint program = %u, GLint location = %d, GLsizei bufSize = "
+                "%d, GLint *params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::GetnUniformivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetnUniformivRobustANGLE(GLuint program = %u, GLint location = %d, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::GetnUniformuivRobustANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glGetnUniformuivRobustANGLE(GLuint program = %u, GLint location = %d, GLsizei "
+                "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
+                ", GLuint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::Hint:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glHint(GLenum target = 0x%X, GLenum mode = 0x%X)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]));
+        case EntryPoint::ImportMemoryFdEXT:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glImportMemoryFdEXT(GLuint memory = %u, GLuint64 size = %llu, "
+                               "GLenum handleType = 0x%X, GLint fd = %d)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<unsigned long long>(event.params[1]),
+                               static_cast<GLenum>(event.params[2]),
+                               static_cast<GLint>(event.params[3]));
+        case EntryPoint::ImportSemaphoreFdEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glImportSemaphoreFdEXT(GLuint semaphore = %u, GLenum handleType = "
+                               "0x%X, GLint fd = %d)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<GLint>(event.params[2]));
+        case EntryPoint::InsertEventMarkerEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glInsertEventMarkerEXT(GLsizei length = %d, const GLchar *marker = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::InvalidateFramebuffer:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glInvalidateFramebuffer(GLenum target = 0x%X, GLsizei numAttachments = %d, const "
+                "GLenum *attachments = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::InvalidateSubFramebuffer:
+            if (event.paramCount != 7)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glInvalidateSubFramebuffer(GLenum target = 0x%X, GLsizei numAttachments = %d, "
+                "const GLenum *attachments = 0x%016" PRIxPTR
+                ", GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLsizei>(event.params[6]));
+        case EntryPoint::IsBuffer:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsBuffer(GLuint buffer = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsEnabled:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsEnabled(GLenum cap = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::IsFenceNV:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsFenceNV(GLuint fence = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsFramebuffer:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsFramebuffer(GLuint framebuffer = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsFramebufferOES:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsFramebufferOES(GLuint framebuffer = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsMemoryObjectEXT:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsMemoryObjectEXT(GLuint memoryObject = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsPathCHROMIUM:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsPathCHROMIUM(GLuint path = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsProgram:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsProgram(GLuint program = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsProgramPipeline:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsProgramPipeline(GLuint pipeline = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsQuery:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsQuery(GLuint id = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsQueryEXT:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsQueryEXT(GLuint id = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsRenderbuffer:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsRenderbuffer(GLuint renderbuffer = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsRenderbufferOES:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsRenderbufferOES(GLuint renderbuffer = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsSampler:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsSampler(GLuint sampler = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsSemaphoreEXT:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsSemaphoreEXT(GLuint semaphore = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsShader:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsShader(GLuint shader = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsSync:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsSync(GLsync sync = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]));
+        case EntryPoint::IsTexture:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsTexture(GLuint texture = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsTransformFeedback:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsTransformFeedback(GLuint id = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsVertexArray:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsVertexArray(GLuint array = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::IsVertexArrayOES:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glIsVertexArrayOES(GLuint array = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::LightModelf:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glLightModelf(GLenum pname = 0x%X, GLfloat param = %f)",
+                               static_cast<GLenum>(event.params[0]), DecodeFloat(event.params[1]));
+        case EntryPoint::LightModelfv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glLightModelfv(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::LightModelx:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glLightModelx(GLenum pname = 0x%X, GLfixed param = 0x%X)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLfixed>(event.params[1]));
+        case EntryPoint::LightModelxv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glLightModelxv(GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::Lightf:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glLightf(GLenum light = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                DecodeFloat(event.params[2]));
+        case EntryPoint::Lightfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glLightfv(GLenum light = 0x%X, GLenum pname = 0x%X, const GLfloat "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Lightx:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glLightx(GLenum light = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]));
+        case EntryPoint::Lightxv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glLightxv(GLenum light = 0x%X, GLenum pname = 0x%X, const GLfixed "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::LineWidth:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glLineWidth(GLfloat width = %f)",
+                               DecodeFloat(event.params[0]));
+        case EntryPoint::LineWidthx:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glLineWidthx(GLfixed width = 0x%X)",
+                               static_cast<GLfixed>(event.params[0]));
+        case EntryPoint::LinkProgram:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glLinkProgram(GLuint program = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::LoadIdentity:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glLoadIdentity()");
+        case EntryPoint::LoadMatrixf:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glLoadMatrixf(const GLfloat *m = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]));
+        case EntryPoint::LoadMatrixx:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glLoadMatrixx(const GLfixed *m = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]));
+        case EntryPoint::LoadPaletteFromModelViewMatrixOES:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glLoadPaletteFromModelViewMatrixOES()");
+        case EntryPoint::LogicOp:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glLogicOp(GLenum opcode = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::LoseContextCHROMIUM:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glLoseContextCHROMIUM(GLenum current = 0x%X, GLenum other = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]));
+        case EntryPoint::MapBufferOES:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glMapBufferOES(GLenum target = 0x%X, GLenum access = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]));
+        case EntryPoint::MapBufferRange:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glMapBufferRange(GLenum target = 0x%X, GLintptr offset = %llu, "
+                               "GLsizeiptr length = %llu, GLbitfield access = 0x%X)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<unsigned long long>(event.params[1]),
+                               static_cast<unsigned long long>(event.params[2]),
+                               static_cast<GLbitfield>(event.params[3]));
+        case EntryPoint::MapBufferRangeEXT:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glMapBufferRangeEXT(GLenum target = 0x%X, GLintptr offset = %llu, "
+                               "GLsizeiptr length = %llu, GLbitfield access = 0x%X)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<unsigned long long>(event.params[1]),
+                               static_cast<unsigned long long>(event.params[2]),
+                               static_cast<GLbitfield>(event.params[3]));
+        case EntryPoint::Materialf:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glMaterialf(GLenum face = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                DecodeFloat(event.params[2]));
+        case EntryPoint::Materialfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glMaterialfv(GLenum face = 0x%X, GLenum pname = 0x%X, const "
+                               "GLfloat *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Materialx:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glMaterialx(GLenum face = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]));
+        case EntryPoint::Materialxv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glMaterialxv(GLenum face = 0x%X, GLenum pname = 0x%X, const "
+                               "GLfixed *param = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::MatrixIndexPointerOES:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glMatrixIndexPointerOES(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, "
+                "const void *pointer = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::MatrixLoadIdentityCHROMIUM:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glMatrixLoadIdentityCHROMIUM(GLenum matrixMode = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::MatrixLoadfCHROMIUM:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glMatrixLoadfCHROMIUM(GLenum matrixMode = 0x%X, const GLfloat * "
+                               "matrix = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::MatrixMode:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glMatrixMode(GLenum mode = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::MaxShaderCompilerThreadsKHR:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glMaxShaderCompilerThreadsKHR(GLuint count = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::MemoryBarrier:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glMemoryBarrier(GLbitfield barriers = 0x%X)",
+                               static_cast<GLbitfield>(event.params[0]));
+        case EntryPoint::MemoryBarrierByRegion:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glMemoryBarrierByRegion(GLbitfield barriers = 0x%X)",
+                               static_cast<GLbitfield>(event.params[0]));
+        case EntryPoint::MemoryObjectParameterivEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glMemoryObjectParameterivEXT(GLuint memoryObject = %u, GLenum "
+                               "pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::MultMatrixf:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glMultMatrixf(const GLfloat *m = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]));
+        case EntryPoint::MultMatrixx:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glMultMatrixx(const GLfixed *m = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]));
+        case EntryPoint::MultiDrawArraysANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glMultiDrawArraysANGLE(GLenum mode = 0x%X, const GLint *firsts = 0x%016" PRIxPTR
+                ", const GLsizei *counts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLsizei>(event.params[3]));
+        case EntryPoint::MultiDrawArraysInstancedANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glMultiDrawArraysInstancedANGLE(GLenum mode = 0x%X, const GLint *firsts = "
+                "0x%016" PRIxPTR ", const GLsizei *counts = 0x%016" PRIxPTR
+                ", const GLsizei *instanceCounts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]));
+        case EntryPoint::MultiDrawElementsANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glMultiDrawElementsANGLE(GLenum mode = 0x%X, const GLsizei *counts = "
+                "0x%016" PRIxPTR
+                ", GLenum type = 0x%X, const GLvoid *const*indices = 0x%016" PRIxPTR
+                ", GLsizei drawcount = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]));
+        case EntryPoint::MultiDrawElementsInstancedANGLE:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glMultiDrawElementsInstancedANGLE(GLenum mode = 0x%X, const GLsizei *counts = "
+                "0x%016" PRIxPTR
+                ", GLenum type = 0x%X, const GLvoid *const*indices = 0x%016" PRIxPTR
+                ", const GLsizei*instanceCounts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<GLsizei>(event.params[5]));
+        case EntryPoint::MultiTexCoord4f:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glMultiTexCoord4f(GLenum target = 0x%X, GLfloat s = %f, GLfloat t "
+                               "= %f, GLfloat r = %f, GLfloat q = %f)",
+                               static_cast<GLenum>(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]), DecodeFloat(event.params[3]),
+                               DecodeFloat(event.params[4]));
+        case EntryPoint::MultiTexCoord4x:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glMultiTexCoord4x(GLenum texture = 0x%X, GLfixed s = 0x%X, GLfixed t = 0x%X, "
+                "GLfixed r = 0x%X, GLfixed q = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLfixed>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]), static_cast<GLfixed>(event.params[3]),
+                static_cast<GLfixed>(event.params[4]));
+        case EntryPoint::Normal3f:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glNormal3f(GLfloat nx = %f, GLfloat ny = %f, GLfloat nz = %f)",
+                               DecodeFloat(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]));
+        case EntryPoint::Normal3x:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glNormal3x(GLfixed nx = 0x%X, GLfixed ny = 0x%X, GLfixed nz = 0x%X)",
+                static_cast<GLfixed>(event.params[0]), static_cast<GLfixed>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]));
+        case EntryPoint::NormalPointer:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glNormalPointer(GLenum type = 0x%X, GLsizei stride = %d, const "
+                               "void *pointer = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::ObjectLabelKHR:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glObjectLabelKHR(GLenum identifier = 0x%X, GLuint name = %u, GLsizei length = %d, "
+                "const GLchar *label = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ObjectPtrLabelKHR:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glObjectPtrLabelKHR(const void *ptr = 0x%016" PRIxPTR
+                               ", GLsizei length = %d, const GLchar *label = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Orthof:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glOrthof(GLfloat l = %f, GLfloat r = %f, GLfloat b = %f, GLfloat t "
+                               "= %f, GLfloat n = %f, GLfloat f = %f)",
+                               DecodeFloat(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]), DecodeFloat(event.params[3]),
+                               DecodeFloat(event.params[4]), DecodeFloat(event.params[5]));
+        case EntryPoint::Orthox:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glOrthox(GLfixed l = 0x%X, GLfixed r = 0x%X, GLfixed b = 0x%X, GLfixed t = 0x%X, "
+                "GLfixed n = 0x%X, GLfixed f = 0x%X)",
+                static_cast<GLfixed>(event.params[0]), static_cast<GLfixed>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]), static_cast<GLfixed>(event.params[3]),
+                static_cast<GLfixed>(event.params[4]), static_cast<GLfixed>(event.params[5]));
+        case EntryPoint::PathCommandsCHROMIUM:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glPathCommandsCHROMIUM(GLuint path = %u, GLsizei numCommands = %d, const GLubyte "
+                "* commands = 0x%016" PRIxPTR
+                ", GLsizei numCoords = %d, GLenum coordType = 0x%X, const void* coords = "
+                "0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLenum>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::PathParameterfCHROMIUM:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glPathParameterfCHROMIUM(GLuint path = %u, GLenum pname = 0x%X, "
+                               "GLfloat value = %f)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]), DecodeFloat(event.params[2]));
+        case EntryPoint::PathParameteriCHROMIUM:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glPathParameteriCHROMIUM(GLuint path = %u, GLenum pname = 0x%X, GLint value = %d)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLint>(event.params[2]));
+        case EntryPoint::PathStencilFuncCHROMIUM:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glPathStencilFuncCHROMIUM(GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]));
+        case EntryPoint::PauseTransformFeedback:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glPauseTransformFeedback()");
+        case EntryPoint::PixelStorei:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glPixelStorei(GLenum pname = 0x%X, GLint param = %d)",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLint>(event.params[1]));
+        case EntryPoint::PointParameterf:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glPointParameterf(GLenum pname = 0x%X, GLfloat param = %f)",
+                               static_cast<GLenum>(event.params[0]), DecodeFloat(event.params[1]));
+        case EntryPoint::PointParameterfv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glPointParameterfv(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::PointParameterx:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glPointParameterx(GLenum pname = 0x%X, GLfixed param = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLfixed>(event.params[1]));
+        case EntryPoint::PointParameterxv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glPointParameterxv(GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLenum>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::PointSize:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glPointSize(GLfloat size = %f)",
+                               DecodeFloat(event.params[0]));
+        case EntryPoint::PointSizePointerOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glPointSizePointerOES(GLenum type = 0x%X, GLsizei stride = %d, "
+                               "const void *pointer = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::PointSizex:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glPointSizex(GLfixed size = 0x%X)",
+                               static_cast<GLfixed>(event.params[0]));
+        case EntryPoint::PolygonOffset:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glPolygonOffset(GLfloat factor = %f, GLfloat units = %f)",
+                               DecodeFloat(event.params[0]), DecodeFloat(event.params[1]));
+        case EntryPoint::PolygonOffsetx:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glPolygonOffsetx(GLfixed factor = 0x%X, GLfixed units = 0x%X)",
+                static_cast<GLfixed>(event.params[0]), static_cast<GLfixed>(event.params[1]));
+        case EntryPoint::PopDebugGroupKHR:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glPopDebugGroupKHR()");
+        case EntryPoint::PopGroupMarkerEXT:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glPopGroupMarkerEXT()");
+        case EntryPoint::PopMatrix:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glPopMatrix()");
+        case EntryPoint::ProgramBinary:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramBinary(GLuint program = %u, GLenum binaryFormat = 0x%X, const void "
+                "*binary = 0x%016" PRIxPTR ", GLsizei length = %d)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLsizei>(event.params[3]));
+        case EntryPoint::ProgramBinaryOES:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramBinaryOES(GLuint program = %u, GLenum binaryFormat = 0x%X, const void "
+                "*binary = 0x%016" PRIxPTR ", GLint length = %d)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLint>(event.params[3]));
+        case EntryPoint::ProgramParameteri:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramParameteri(GLuint program = %u, GLenum pname = 0x%X, GLint value = %d)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLint>(event.params[2]));
+        case EntryPoint::ProgramPathFragmentInputGenCHROMIUM:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramPathFragmentInputGenCHROMIUM(GLuint program = %u, GLint location = %d, "
+                "GLenum genMode = 0x%X, GLint components = %d, const GLfloat * coeffs = "
+                "0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::ProgramUniform1f:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform1f(GLuint program = %u, GLint location = %d, GLfloat v0 = %f)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                DecodeFloat(event.params[2]));
+        case EntryPoint::ProgramUniform1fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform1fv(GLuint program = %u, GLint location = %d, GLsizei count = %d, "
+                "const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ProgramUniform1i:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform1i(GLuint program = %u, GLint location = %d, GLint v0 = %d)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]));
+        case EntryPoint::ProgramUniform1iv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform1iv(GLuint program = %u, GLint location = %d, GLsizei count = %d, "
+                "const GLint *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ProgramUniform1ui:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform1ui(GLuint program = %u, GLint location = %d, GLuint v0 = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]));
+        case EntryPoint::ProgramUniform1uiv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform1uiv(GLuint program = %u, GLint location = %d, GLsizei count = "
+                "%d, const GLuint *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ProgramUniform2f:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glProgramUniform2f(GLuint program = %u, GLint location = %d, "
+                               "GLfloat v0 = %f, GLfloat v1 = %f)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLint>(event.params[1]), DecodeFloat(event.params[2]),
+                               DecodeFloat(event.params[3]));
+        case EntryPoint::ProgramUniform2fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform2fv(GLuint program = %u, GLint location = %d, GLsizei count = %d, "
+                "const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ProgramUniform2i:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform2i(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint "
+                "v1 = %d)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]));
+        case EntryPoint::ProgramUniform2iv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform2iv(GLuint program = %u, GLint location = %d, GLsizei count = %d, "
+                "const GLint *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ProgramUniform2ui:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform2ui(GLuint program = %u, GLint location = %d, GLuint v0 = %u, "
+                "GLuint v1 = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLuint>(event.params[3]));
+        case EntryPoint::ProgramUniform2uiv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform2uiv(GLuint program = %u, GLint location = %d, GLsizei count = "
+                "%d, const GLuint *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ProgramUniform3f:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glProgramUniform3f(GLuint program = %u, GLint location = %d, "
+                               "GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = %f)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLint>(event.params[1]), DecodeFloat(event.params[2]),
+                               DecodeFloat(event.params[3]), DecodeFloat(event.params[4]));
+        case EntryPoint::ProgramUniform3fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform3fv(GLuint program = %u, GLint location = %d, GLsizei count = %d, "
+                "const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ProgramUniform3i:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform3i(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint "
+                "v1 = %d, GLint v2 = %d)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]));
+        case EntryPoint::ProgramUniform3iv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform3iv(GLuint program = %u, GLint location = %d, GLsizei count = %d, "
+                "const GLint *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ProgramUniform3ui:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform3ui(GLuint program = %u, GLint location = %d, GLuint v0 = %u, "
+                "GLuint v1 = %u, GLuint v2 = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLuint>(event.params[4]));
+        case EntryPoint::ProgramUniform3uiv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform3uiv(GLuint program = %u, GLint location = %d, GLsizei count = "
+                "%d, const GLuint *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ProgramUniform4f:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform4f(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, "
+                "GLfloat v1 = %f, GLfloat v2 = %f, GLfloat v3 = %f)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                DecodeFloat(event.params[2]), DecodeFloat(event.params[3]),
+                DecodeFloat(event.params[4]), DecodeFloat(event.params[5]));
+        case EntryPoint::ProgramUniform4fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform4fv(GLuint program = %u, GLint location = %d, GLsizei count = %d, "
+                "const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ProgramUniform4i:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform4i(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint "
+                "v1 = %d, GLint v2 = %d, GLint v3 = %d)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLint>(event.params[5]));
+        case EntryPoint::ProgramUniform4iv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform4iv(GLuint program = %u, GLint location = %d, GLsizei count = %d, "
+                "const GLint *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ProgramUniform4ui:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform4ui(GLuint program = %u, GLint location = %d, GLuint v0 = %u, "
+                "GLuint v1 = %u, GLuint v2 = %u, GLuint v3 = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLuint>(event.params[4]), static_cast<GLuint>(event.params[5]));
+        case EntryPoint::ProgramUniform4uiv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniform4uiv(GLuint program = %u, GLint location = %d, GLsizei count = "
+                "%d, const GLuint *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::ProgramUniformMatrix2fv:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniformMatrix2fv(GLuint program = %u, GLint location = %d, GLsizei count "
+                "= %d, GLboolean transpose = %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLboolean>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::ProgramUniformMatrix2x3fv:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniformMatrix2x3fv(GLuint program = %u, GLint location = %d, GLsizei "
+                "count = %d, GLboolean transpose = %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLboolean>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::ProgramUniformMatrix2x4fv:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniformMatrix2x4fv(GLuint program = %u, GLint location = %d, GLsizei "
+                "count = %d, GLboolean transpose = %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLboolean>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::ProgramUniformMatrix3fv:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniformMatrix3fv(GLuint program = %u, GLint location = %d, GLsizei count "
+                "= %d, GLboolean transpose = %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLboolean>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::ProgramUniformMatrix3x2fv:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniformMatrix3x2fv(GLuint program = %u, GLint location = %d, GLsizei "
+                "count = %d, GLboolean transpose = %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLboolean>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::ProgramUniformMatrix3x4fv:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniformMatrix3x4fv(GLuint program = %u, GLint location = %d, GLsizei "
+                "count = %d, GLboolean transpose = %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLboolean>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::ProgramUniformMatrix4fv:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniformMatrix4fv(GLuint program = %u, GLint location = %d, GLsizei count "
+                "= %d, GLboolean transpose = %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLboolean>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::ProgramUniformMatrix4x2fv:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniformMatrix4x2fv(GLuint program = %u, GLint location = %d, GLsizei "
+                "count = %d, GLboolean transpose = %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLboolean>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::ProgramUniformMatrix4x3fv:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glProgramUniformMatrix4x3fv(GLuint program = %u, GLint location = %d, GLsizei "
+                "count = %d, GLboolean transpose = %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLboolean>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::ProvokingVertexANGLE:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glProvokingVertexANGLE(GLenum mode = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::PushDebugGroupKHR:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glPushDebugGroupKHR(GLenum source = 0x%X, GLuint id = %u, GLsizei length = %d, "
+                "const GLchar *message = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::PushGroupMarkerEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glPushGroupMarkerEXT(GLsizei length = %d, const GLchar *marker = 0x%016" PRIxPTR
+                ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::PushMatrix:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glPushMatrix()");
+        case EntryPoint::QueryCounterEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glQueryCounterEXT(GLuint id = %u, GLenum target = 0x%X)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]));
+        case EntryPoint::QueryMatrixxOES:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glQueryMatrixxOES(GLfixed *mantissa = 0x%016" PRIxPTR
+                               ", GLint *exponent = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]),
+                               static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::ReadBuffer:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glReadBuffer(GLenum src = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::ReadPixels:
+            if (event.paramCount != 7)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glReadPixels(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, "
+                "GLenum format = 0x%X, GLenum type = 0x%X, void *pixels = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLenum>(event.params[4]), static_cast<GLenum>(event.params[5]),
+                static_cast<uintptr_t>(event.params[6]));
+        case EntryPoint::ReadPixelsRobustANGLE:
+            if (event.paramCount != 11)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glReadPixelsRobustANGLE(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei "
+                "height = %d, GLenum format = 0x%X, GLenum type = 0x%X, GLsizei bufSize = %d, "
+                "GLsizei * length = 0x%016" PRIxPTR ", GLsizei * columns = 0x%016" PRIxPTR
+                ", GLsizei * rows = 0x%016" PRIxPTR ", void * pixels = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLenum>(event.params[4]), static_cast<GLenum>(event.params[5]),
+                static_cast<GLsizei>(event.params[6]), static_cast<uintptr_t>(event.params[7]),
+                static_cast<uintptr_t>(event.params[8]), static_cast<uintptr_t>(event.params[9]),
+                static_cast<uintptr_t>(event.params[10]));
+        case EntryPoint::ReadnPixelsEXT:
+            if (event.paramCount != 8)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glReadnPixelsEXT(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = "
+                "%d, GLenum format = 0x%X, GLenum type = 0x%X, GLsizei bufSize = %d, void *data = "
+                "0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLenum>(event.params[4]), static_cast<GLenum>(event.params[5]),
+                static_cast<GLsizei>(event.params[6]), static_cast<uintptr_t>(event.params[7]));
+        case EntryPoint::ReadnPixelsRobustANGLE:
+            if (event.paramCount != 11)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glReadnPixelsRobustANGLE(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei "
+                "height = %d, GLenum format = 0x%X, GLenum type = 0x%X, GLsizei bufSize = %d, "
+                "GLsizei * length = 0x%016" PRIxPTR ", GLsizei * columns = 0x%016" PRIxPTR
+                ", GLsizei * rows = 0x%016" PRIxPTR ", void * data = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLenum>(event.params[4]), static_cast<GLenum>(event.params[5]),
+                static_cast<GLsizei>(event.params[6]), static_cast<uintptr_t>(event.params[7]),
+                static_cast<uintptr_t>(event.params[8]), static_cast<uintptr_t>(event.params[9]),
+                static_cast<uintptr_t>(event.params[10]));
+        case EntryPoint::ReleaseShaderCompiler:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glReleaseShaderCompiler()");
+        case EntryPoint::RenderbufferStorage:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glRenderbufferStorage(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLsizei "
+                "width = %d, GLsizei height = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLsizei>(event.params[3]));
+        case EntryPoint::RenderbufferStorageMultisample:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glRenderbufferStorageMultisample(GLenum target = 0x%X, GLsizei samples = %d, "
+                "GLenum internalformat = 0x%X, GLsizei width = %d, GLsizei height = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]));
+        case EntryPoint::RenderbufferStorageMultisampleANGLE:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glRenderbufferStorageMultisampleANGLE(GLenum target = 0x%X, GLsizei samples = %d, "
+                "GLenum internalformat = 0x%X, GLsizei width = %d, GLsizei height = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]));
+        case EntryPoint::RenderbufferStorageOES:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glRenderbufferStorageOES(GLenum target = 0x%X, GLenum internalformat = 0x%X, "
+                "GLsizei width = %d, GLsizei height = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLsizei>(event.params[3]));
+        case EntryPoint::RequestExtensionANGLE:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glRequestExtensionANGLE(const GLchar * name = 0x%016" PRIxPTR ")",
+                               static_cast<uintptr_t>(event.params[0]));
+        case EntryPoint::ResumeTransformFeedback:
+            if (event.paramCount != 0)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glResumeTransformFeedback()");
+        case EntryPoint::Rotatef:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glRotatef(GLfloat angle = %f, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)",
+                DecodeFloat(event.params[0]), DecodeFloat(event.params[1]),
+                DecodeFloat(event.params[2]), DecodeFloat(event.params[3]));
+        case EntryPoint::Rotatex:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glRotatex(GLfixed angle = 0x%X, GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = "
+                "0x%X)",
+                static_cast<GLfixed>(event.params[0]), static_cast<GLfixed>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]), static_cast<GLfixed>(event.params[3]));
+        case EntryPoint::SampleCoverage:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glSampleCoverage(GLfloat value = %f, GLboolean invert = %u)",
+                DecodeFloat(event.params[0]), static_cast<GLboolean>(event.params[1]));
+        case EntryPoint::SampleCoveragex:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glSampleCoveragex(GLclampx value = 0x%X, GLboolean invert = %u)",
+                static_cast<GLclampx>(event.params[0]), static_cast<GLboolean>(event.params[1]));
+        case EntryPoint::SampleMaski:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glSampleMaski(GLuint maskNumber = %u, GLbitfield mask = 0x%X)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLbitfield>(event.params[1]));
+        case EntryPoint::SampleMaskiANGLE:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glSampleMaskiANGLE(GLuint maskNumber = %u, GLbitfield mask = 0x%X)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLbitfield>(event.params[1]));
+        case EntryPoint::SamplerParameterIivOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glSamplerParameterIivOES(GLuint sampler = %u, GLenum pname = 0x%X, "
+                               "const GLint *param = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::SamplerParameterIivRobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glSamplerParameterIivRobustANGLE(GLuint sampler = %u, GLenum pname = 0x%X, "
+                "GLsizei bufSize = %d, const GLint * param = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::SamplerParameterIuivOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glSamplerParameterIuivOES(GLuint sampler = %u, GLenum pname = "
+                               "0x%X, const GLuint *param = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::SamplerParameterIuivRobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glSamplerParameterIuivRobustANGLE(GLuint sampler = %u, GLenum pname = 0x%X, "
+                "GLsizei bufSize = %d, const GLuint * param = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::SamplerParameterf:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glSamplerParameterf(GLuint sampler = %u, GLenum pname = 0x%X, GLfloat param = %f)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                DecodeFloat(event.params[2]));
+        case EntryPoint::SamplerParameterfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glSamplerParameterfv(GLuint sampler = %u, GLenum pname = 0x%X, "
+                               "const GLfloat *param = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::SamplerParameterfvRobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glSamplerParameterfvRobustANGLE(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, const GLfloat * param = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::SamplerParameteri:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glSamplerParameteri(GLuint sampler = %u, GLenum pname = 0x%X, GLint param = %d)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLint>(event.params[2]));
+        case EntryPoint::SamplerParameteriv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glSamplerParameteriv(GLuint sampler = %u, GLenum pname = 0x%X, "
+                               "const GLint *param = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::SamplerParameterivRobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glSamplerParameterivRobustANGLE(GLuint sampler = %u, GLuint pname = %u, GLsizei "
+                "bufSize = %d, const GLint * param = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::Scalef:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glScalef(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)",
+                               DecodeFloat(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]));
+        case EntryPoint::Scalex:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glScalex(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)",
+                static_cast<GLfixed>(event.params[0]), static_cast<GLfixed>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]));
+        case EntryPoint::Scissor:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glScissor(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
+                static_cast<GLint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLsizei>(event.params[3]));
+        case EntryPoint::SemaphoreParameterui64vEXT:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glSemaphoreParameterui64vEXT(GLuint semaphore = %u, GLenum pname = "
+                               "0x%X, const GLuint64 *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::SetFenceNV:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glSetFenceNV(GLuint fence = %u, GLenum condition = 0x%X)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]));
+        case EntryPoint::ShadeModel:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glShadeModel(GLenum mode = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::ShaderBinary:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glShaderBinary(GLsizei count = %d, const GLuint *shaders = 0x%016" PRIxPTR
+                ", GLenum binaryformat = 0x%X, const void *binary = 0x%016" PRIxPTR
+                ", GLsizei length = %d)",
+                static_cast<GLsizei>(event.params[0]), static_cast<uintptr_t>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<uintptr_t>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]));
+        case EntryPoint::ShaderSource:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glShaderSource(GLuint shader = %u, GLsizei count = %d, const GLchar *const*string "
+                "= 0x%016" PRIxPTR ", const GLint *length = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::SignalSemaphoreEXT:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glSignalSemaphoreEXT(GLuint semaphore = %u, GLuint numBufferBarriers = %u, const "
+                "GLuint *buffers = 0x%016" PRIxPTR
+                ", GLuint numTextureBarriers = %u, const GLuint *textures = 0x%016" PRIxPTR
+                ", const GLenum *dstLayouts = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::StencilFillPathCHROMIUM:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glStencilFillPathCHROMIUM(GLuint path = %u, GLenum fillMode = "
+                               "0x%X, GLuint mask = %u)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<GLuint>(event.params[2]));
+        case EntryPoint::StencilFillPathInstancedCHROMIUM:
+            if (event.paramCount != 8)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glStencilFillPathInstancedCHROMIUM(GLsizei numPaths = %d, GLenum pathNameType = "
+                "0x%X, const void * paths = 0x%016" PRIxPTR
+                ", GLuint pathBase = %u, GLenum fillMode = 0x%X, GLuint mask = %u, GLenum "
+                "transformType = 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLenum>(event.params[4]), static_cast<GLuint>(event.params[5]),
+                static_cast<GLenum>(event.params[6]), static_cast<uintptr_t>(event.params[7]));
+        case EntryPoint::StencilFunc:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glStencilFunc(GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]));
+        case EntryPoint::StencilFuncSeparate:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glStencilFuncSeparate(GLenum face = 0x%X, GLenum func = 0x%X, GLint ref = %d, "
+                "GLuint mask = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLuint>(event.params[3]));
+        case EntryPoint::StencilMask:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glStencilMask(GLuint mask = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::StencilMaskSeparate:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glStencilMaskSeparate(GLenum face = 0x%X, GLuint mask = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::StencilOp:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glStencilOp(GLenum fail = 0x%X, GLenum zfail = 0x%X, GLenum zpass = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]));
+        case EntryPoint::StencilOpSeparate:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glStencilOpSeparate(GLenum face = 0x%X, GLenum sfail = 0x%X, GLenum dpfail = "
+                "0x%X, GLenum dppass = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLenum>(event.params[3]));
+        case EntryPoint::StencilStrokePathCHROMIUM:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glStencilStrokePathCHROMIUM(GLuint path = %u, GLint reference = "
+                               "%d, GLuint mask = %u)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLint>(event.params[1]),
+                               static_cast<GLuint>(event.params[2]));
+        case EntryPoint::StencilStrokePathInstancedCHROMIUM:
+            if (event.paramCount != 8)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glStencilStrokePathInstancedCHROMIUM(GLsizei numPath = %d, GLenum pathNameType = "
+                "0x%X, const void * paths = 0x%016" PRIxPTR
+                ", GLuint pathBase = %u, GLint reference = %d, GLuint mask = %u, GLenum "
+                "transformType = 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLuint>(event.params[5]),
+                static_cast<GLenum>(event.params[6]), static_cast<uintptr_t>(event.params[7]));
+        case EntryPoint::StencilThenCoverFillPathCHROMIUM:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glStencilThenCoverFillPathCHROMIUM(GLuint path = %u, GLenum fillMode = 0x%X, "
+                "GLuint mask = %u, GLenum coverMode = 0x%X)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLenum>(event.params[3]));
+        case EntryPoint::StencilThenCoverFillPathInstancedCHROMIUM:
+            if (event.paramCount != 9)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glStencilThenCoverFillPathInstancedCHROMIUM(GLsizei numPaths = %d, GLenum "
+                "pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
+                ", GLuint pathBase = %u, GLenum fillMode = 0x%X, GLuint mask = %u, GLenum "
+                "coverMode = 0x%X, GLenum transformType = 0x%X, const GLfloat * transformValues = "
+                "0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLenum>(event.params[4]), static_cast<GLuint>(event.params[5]),
+                static_cast<GLenum>(event.params[6]), static_cast<GLenum>(event.params[7]),
+                static_cast<uintptr_t>(event.params[8]));
+        case EntryPoint::StencilThenCoverStrokePathCHROMIUM:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glStencilThenCoverStrokePathCHROMIUM(GLuint path = %u, GLint reference = %d, "
+                "GLuint mask = %u, GLenum coverMode = 0x%X)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLenum>(event.params[3]));
+        case EntryPoint::StencilThenCoverStrokePathInstancedCHROMIUM:
+            if (event.paramCount != 9)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glStencilThenCoverStrokePathInstancedCHROMIUM(GLsizei numPaths = %d, GLenum "
+                "pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
+                ", GLuint pathBase = %u, GLint reference = %d, GLuint mask = %u, GLenum coverMode "
+                "= 0x%X, GLenum transformType = 0x%X, const GLfloat * transformValues = "
+                "0x%016" PRIxPTR ")",
+                static_cast<GLsizei>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLuint>(event.params[5]),
+                static_cast<GLenum>(event.params[6]), static_cast<GLenum>(event.params[7]),
+                static_cast<uintptr_t>(event.params[8]));
+        case EntryPoint::TestFenceNV:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glTestFenceNV(GLuint fence = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::TexCoordPointer:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexCoordPointer(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const "
+                "void *pointer = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::TexEnvf:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glTexEnvf(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                DecodeFloat(event.params[2]));
+        case EntryPoint::TexEnvfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glTexEnvfv(GLenum target = 0x%X, GLenum pname = 0x%X, const "
+                               "GLfloat *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::TexEnvi:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glTexEnvi(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLint>(event.params[2]));
+        case EntryPoint::TexEnviv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glTexEnviv(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint "
+                               "*params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::TexEnvx:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexEnvx(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]));
+        case EntryPoint::TexEnvxv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glTexEnvxv(GLenum target = 0x%X, GLenum pname = 0x%X, const "
+                               "GLfixed *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::TexGenfOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexGenfOES(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                DecodeFloat(event.params[2]));
+        case EntryPoint::TexGenfvOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glTexGenfvOES(GLenum coord = 0x%X, GLenum pname = 0x%X, const "
+                               "GLfloat *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::TexGeniOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glTexGeniOES(GLenum coord = 0x%X, GLenum pname = 0x%X, GLint param = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLint>(event.params[2]));
+        case EntryPoint::TexGenivOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glTexGenivOES(GLenum coord = 0x%X, GLenum pname = 0x%X, const "
+                               "GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::TexGenxOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexGenxOES(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]));
+        case EntryPoint::TexGenxvOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glTexGenxvOES(GLenum coord = 0x%X, GLenum pname = 0x%X, const "
+                               "GLfixed *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::TexImage2D:
+            if (event.paramCount != 9)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexImage2D(GLenum target = 0x%X, GLint level = %d, GLint internalformat = %d, "
+                "GLsizei width = %d, GLsizei height = %d, GLint border = %d, GLenum format = 0x%X, "
+                "GLenum type = 0x%X, const void *pixels = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLint>(event.params[5]),
+                static_cast<GLenum>(event.params[6]), static_cast<GLenum>(event.params[7]),
+                static_cast<uintptr_t>(event.params[8]));
+        case EntryPoint::TexImage2DRobustANGLE:
+            if (event.paramCount != 10)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexImage2DRobustANGLE(GLenum target = 0x%X, GLint level = %d, GLint "
+                "internalformat = %d, GLsizei width = %d, GLsizei height = %d, GLint border = %d, "
+                "GLenum format = 0x%X, GLenum type = 0x%X, GLsizei bufSize = %d, const void * "
+                "pixels = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLint>(event.params[5]),
+                static_cast<GLenum>(event.params[6]), static_cast<GLenum>(event.params[7]),
+                static_cast<GLsizei>(event.params[8]), static_cast<uintptr_t>(event.params[9]));
+        case EntryPoint::TexImage3D:
+            if (event.paramCount != 10)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexImage3D(GLenum target = 0x%X, GLint level = %d, GLint internalformat = %d, "
+                "GLsizei width = %d, GLsizei height = %d, GLsizei depth = %d, GLint border = %d, "
+                "GLenum format = 0x%X, GLenum type = 0x%X, const void *pixels = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLint>(event.params[6]), static_cast<GLenum>(event.params[7]),
+                static_cast<GLenum>(event.params[8]), static_cast<uintptr_t>(event.params[9]));
+        case EntryPoint::TexImage3DRobustANGLE:
+            if (event.paramCount != 11)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexImage3DRobustANGLE(GLenum target = 0x%X, GLint level = %d, GLint "
+                "internalformat = %d, GLsizei width = %d, GLsizei height = %d, GLsizei depth = %d, "
+                "GLint border = %d, GLenum format = 0x%X, GLenum type = 0x%X, GLsizei bufSize = "
+                "%d, const void * pixels = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLint>(event.params[6]), static_cast<GLenum>(event.params[7]),
+                static_cast<GLenum>(event.params[8]), static_cast<GLsizei>(event.params[9]),
+                static_cast<uintptr_t>(event.params[10]));
+        case EntryPoint::TexParameterIivOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glTexParameterIivOES(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                               "const GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::TexParameterIivRobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexParameterIivRobustANGLE(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, const GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::TexParameterIuivOES:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glTexParameterIuivOES(GLenum target = 0x%X, GLenum pname = 0x%X, "
+                               "const GLuint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::TexParameterIuivRobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexParameterIuivRobustANGLE(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, const GLuint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::TexParameterf:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexParameterf(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                DecodeFloat(event.params[2]));
+        case EntryPoint::TexParameterfv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glTexParameterfv(GLenum target = 0x%X, GLenum pname = 0x%X, const "
+                               "GLfloat *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::TexParameterfvRobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexParameterfvRobustANGLE(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, const GLfloat * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::TexParameteri:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexParameteri(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLint>(event.params[2]));
+        case EntryPoint::TexParameteriv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glTexParameteriv(GLenum target = 0x%X, GLenum pname = 0x%X, const "
+                               "GLint *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::TexParameterivRobustANGLE:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexParameterivRobustANGLE(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei "
+                "bufSize = %d, const GLint * params = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::TexParameterx:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexParameterx(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]));
+        case EntryPoint::TexParameterxv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glTexParameterxv(GLenum target = 0x%X, GLenum pname = 0x%X, const "
+                               "GLfixed *params = 0x%016" PRIxPTR ")",
+                               static_cast<GLenum>(event.params[0]),
+                               static_cast<GLenum>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::TexStorage1DEXT:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexStorage1DEXT(GLenum target = 0x%X, GLsizei levels = %d, GLenum "
+                "internalformat = 0x%X, GLsizei width = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]));
+        case EntryPoint::TexStorage2D:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexStorage2D(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = "
+                "0x%X, GLsizei width = %d, GLsizei height = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]));
+        case EntryPoint::TexStorage2DEXT:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexStorage2DEXT(GLenum target = 0x%X, GLsizei levels = %d, GLenum "
+                "internalformat = 0x%X, GLsizei width = %d, GLsizei height = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]));
+        case EntryPoint::TexStorage2DMultisample:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexStorage2DMultisample(GLenum target = 0x%X, GLsizei samples = %d, GLenum "
+                "internalformat = 0x%X, GLsizei width = %d, GLsizei height = %d, GLboolean "
+                "fixedsamplelocations = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLboolean>(event.params[5]));
+        case EntryPoint::TexStorage2DMultisampleANGLE:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexStorage2DMultisampleANGLE(GLenum target = 0x%X, GLsizei samples = %d, GLenum "
+                "internalformat = 0x%X, GLsizei width = %d, GLsizei height = %d, GLboolean "
+                "fixedsamplelocations = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLboolean>(event.params[5]));
+        case EntryPoint::TexStorage3D:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexStorage3D(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = "
+                "0x%X, GLsizei width = %d, GLsizei height = %d, GLsizei depth = %d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]));
+        case EntryPoint::TexStorage3DEXT:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexStorage3DEXT(GLenum target = 0x%X, GLsizei levels = %d, GLenum "
+                "internalformat = 0x%X, GLsizei width = %d, GLsizei height = %d, GLsizei depth = "
+                "%d)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]));
+        case EntryPoint::TexStorage3DMultisampleOES:
+            if (event.paramCount != 7)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexStorage3DMultisampleOES(GLenum target = 0x%X, GLsizei samples = %d, GLenum "
+                "internalformat = 0x%X, GLsizei width = %d, GLsizei height = %d, GLsizei depth = "
+                "%d, GLboolean fixedsamplelocations = %u)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLboolean>(event.params[6]));
+        case EntryPoint::TexStorageMem2DEXT:
+            if (event.paramCount != 7)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexStorageMem2DEXT(GLenum target = 0x%X, GLsizei levels = %d, GLenum "
+                "internalFormat = 0x%X, GLsizei width = %d, GLsizei height = %d, GLuint memory = "
+                "%u, GLuint64 offset = %llu)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLuint>(event.params[5]),
+                static_cast<unsigned long long>(event.params[6]));
+        case EntryPoint::TexStorageMem2DMultisampleEXT:
+            if (event.paramCount != 8)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexStorageMem2DMultisampleEXT(GLenum target = 0x%X, GLsizei samples = %d, "
+                "GLenum internalFormat = 0x%X, GLsizei width = %d, GLsizei height = %d, GLboolean "
+                "fixedSampleLocations = %u, GLuint memory = %u, GLuint64 offset = %llu)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLboolean>(event.params[5]),
+                static_cast<GLuint>(event.params[6]),
+                static_cast<unsigned long long>(event.params[7]));
+        case EntryPoint::TexStorageMem3DEXT:
+            if (event.paramCount != 8)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexStorageMem3DEXT(GLenum target = 0x%X, GLsizei levels = %d, GLenum "
+                "internalFormat = 0x%X, GLsizei width = %d, GLsizei height = %d, GLsizei depth = "
+                "%d, GLuint memory = %u, GLuint64 offset = %llu)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLuint>(event.params[6]),
+                static_cast<unsigned long long>(event.params[7]));
+        case EntryPoint::TexStorageMem3DMultisampleEXT:
+            if (event.paramCount != 9)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexStorageMem3DMultisampleEXT(GLenum target = 0x%X, GLsizei samples = %d, "
+                "GLenum internalFormat = 0x%X, GLsizei width = %d, GLsizei height = %d, GLsizei "
+                "depth = %d, GLboolean fixedSampleLocations = %u, GLuint memory = %u, GLuint64 "
+                "offset = %llu)",
+                static_cast<GLenum>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLboolean>(event.params[6]), static_cast<GLuint>(event.params[7]),
+                static_cast<unsigned long long>(event.params[8]));
+        case EntryPoint::TexSubImage2D:
+            if (event.paramCount != 9)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexSubImage2D(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint "
+                "yoffset = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = 0x%X, "
+                "GLenum type = 0x%X, const void *pixels = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLenum>(event.params[6]), static_cast<GLenum>(event.params[7]),
+                static_cast<uintptr_t>(event.params[8]));
+        case EntryPoint::TexSubImage2DRobustANGLE:
+            if (event.paramCount != 10)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexSubImage2DRobustANGLE(GLenum target = 0x%X, GLint level = %d, GLint xoffset "
+                "= %d, GLint yoffset = %d, GLsizei width = %d, GLsizei height = %d, GLenum format "
+                "= 0x%X, GLenum type = 0x%X, GLsizei bufSize = %d, const void * pixels = "
+                "0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLenum>(event.params[6]), static_cast<GLenum>(event.params[7]),
+                static_cast<GLsizei>(event.params[8]), static_cast<uintptr_t>(event.params[9]));
+        case EntryPoint::TexSubImage3D:
+            if (event.paramCount != 11)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexSubImage3D(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint "
+                "yoffset = %d, GLint zoffset = %d, GLsizei width = %d, GLsizei height = %d, "
+                "GLsizei depth = %d, GLenum format = 0x%X, GLenum type = 0x%X, const void *pixels "
+                "= 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLsizei>(event.params[6]), static_cast<GLsizei>(event.params[7]),
+                static_cast<GLenum>(event.params[8]), static_cast<GLenum>(event.params[9]),
+                static_cast<uintptr_t>(event.params[10]));
+        case EntryPoint::TexSubImage3DRobustANGLE:
+            if (event.paramCount != 12)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTexSubImage3DRobustANGLE(GLenum target = 0x%X, GLint level = %d, GLint xoffset "
+                "= %d, GLint yoffset = %d, GLint zoffset = %d, GLsizei width = %d, GLsizei height "
+                "= %d, GLsizei depth = %d, GLenum format = 0x%X, GLenum type = 0x%X, GLsizei "
+                "bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
+                static_cast<GLenum>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]), static_cast<GLsizei>(event.params[5]),
+                static_cast<GLsizei>(event.params[6]), static_cast<GLsizei>(event.params[7]),
+                static_cast<GLenum>(event.params[8]), static_cast<GLenum>(event.params[9]),
+                static_cast<GLsizei>(event.params[10]), static_cast<uintptr_t>(event.params[11]));
+        case EntryPoint::TransformFeedbackVaryings:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glTransformFeedbackVaryings(GLuint program = %u, GLsizei count = %d, const GLchar "
+                "*const*varyings = 0x%016" PRIxPTR ", GLenum bufferMode = 0x%X)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLenum>(event.params[3]));
+        case EntryPoint::Translatef:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glTranslatef(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)",
+                               DecodeFloat(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]));
+        case EntryPoint::Translatex:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glTranslatex(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)",
+                static_cast<GLfixed>(event.params[0]), static_cast<GLfixed>(event.params[1]),
+                static_cast<GLfixed>(event.params[2]));
+        case EntryPoint::Uniform1f:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glUniform1f(GLint location = %d, GLfloat v0 = %f)",
+                               static_cast<GLint>(event.params[0]), DecodeFloat(event.params[1]));
+        case EntryPoint::Uniform1fv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform1fv(GLint location = %d, GLsizei count = %d, const "
+                               "GLfloat *value = 0x%016" PRIxPTR ")",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Uniform1i:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glUniform1i(GLint location = %d, GLint v0 = %d)",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLint>(event.params[1]));
+        case EntryPoint::Uniform1iv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform1iv(GLint location = %d, GLsizei count = %d, const GLint "
+                               "*value = 0x%016" PRIxPTR ")",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Uniform1ui:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glUniform1ui(GLint location = %d, GLuint v0 = %u)",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]));
+        case EntryPoint::Uniform1uiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform1uiv(GLint location = %d, GLsizei count = %d, const "
+                               "GLuint *value = 0x%016" PRIxPTR ")",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Uniform2f:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform2f(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f)",
+                               static_cast<GLint>(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]));
+        case EntryPoint::Uniform2fv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform2fv(GLint location = %d, GLsizei count = %d, const "
+                               "GLfloat *value = 0x%016" PRIxPTR ")",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Uniform2i:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glUniform2i(GLint location = %d, GLint v0 = %d, GLint v1 = %d)",
+                static_cast<GLint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]));
+        case EntryPoint::Uniform2iv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform2iv(GLint location = %d, GLsizei count = %d, const GLint "
+                               "*value = 0x%016" PRIxPTR ")",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Uniform2ui:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glUniform2ui(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u)",
+                static_cast<GLint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]));
+        case EntryPoint::Uniform2uiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform2uiv(GLint location = %d, GLsizei count = %d, const "
+                               "GLuint *value = 0x%016" PRIxPTR ")",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Uniform3f:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform3f(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, "
+                               "GLfloat v2 = %f)",
+                               static_cast<GLint>(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]), DecodeFloat(event.params[3]));
+        case EntryPoint::Uniform3fv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform3fv(GLint location = %d, GLsizei count = %d, const "
+                               "GLfloat *value = 0x%016" PRIxPTR ")",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Uniform3i:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniform3i(GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d)",
+                static_cast<GLint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]));
+        case EntryPoint::Uniform3iv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform3iv(GLint location = %d, GLsizei count = %d, const GLint "
+                               "*value = 0x%016" PRIxPTR ")",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Uniform3ui:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniform3ui(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = %u)",
+                static_cast<GLint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLuint>(event.params[3]));
+        case EntryPoint::Uniform3uiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform3uiv(GLint location = %d, GLsizei count = %d, const "
+                               "GLuint *value = 0x%016" PRIxPTR ")",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Uniform4f:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform4f(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, "
+                               "GLfloat v2 = %f, GLfloat v3 = %f)",
+                               static_cast<GLint>(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]), DecodeFloat(event.params[3]),
+                               DecodeFloat(event.params[4]));
+        case EntryPoint::Uniform4fv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform4fv(GLint location = %d, GLsizei count = %d, const "
+                               "GLfloat *value = 0x%016" PRIxPTR ")",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Uniform4i:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniform4i(GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d, "
+                "GLint v3 = %d)",
+                static_cast<GLint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]));
+        case EntryPoint::Uniform4iv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform4iv(GLint location = %d, GLsizei count = %d, const GLint "
+                               "*value = 0x%016" PRIxPTR ")",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::Uniform4ui:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniform4ui(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = %u, "
+                "GLuint v3 = %u)",
+                static_cast<GLint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLuint>(event.params[4]));
+        case EntryPoint::Uniform4uiv:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniform4uiv(GLint location = %d, GLsizei count = %d, const "
+                               "GLuint *value = 0x%016" PRIxPTR ")",
+                               static_cast<GLint>(event.params[0]),
+                               static_cast<GLsizei>(event.params[1]),
+                               static_cast<uintptr_t>(event.params[2]));
+        case EntryPoint::UniformBlockBinding:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUniformBlockBinding(GLuint program = %u, GLuint "
+                               "uniformBlockIndex = %u, GLuint uniformBlockBinding = %u)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLuint>(event.params[1]),
+                               static_cast<GLuint>(event.params[2]));
+        case EntryPoint::UniformMatrix2fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniformMatrix2fv(GLint location = %d, GLsizei count = %d, GLboolean transpose = "
+                "%u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLboolean>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::UniformMatrix2x3fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniformMatrix2x3fv(GLint location = %d, GLsizei count = %d, GLboolean transpose "
+                "= %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLboolean>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::UniformMatrix2x4fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniformMatrix2x4fv(GLint location = %d, GLsizei count = %d, GLboolean transpose "
+                "= %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLboolean>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::UniformMatrix3fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniformMatrix3fv(GLint location = %d, GLsizei count = %d, GLboolean transpose = "
+                "%u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLboolean>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::UniformMatrix3x2fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniformMatrix3x2fv(GLint location = %d, GLsizei count = %d, GLboolean transpose "
+                "= %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLboolean>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::UniformMatrix3x4fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniformMatrix3x4fv(GLint location = %d, GLsizei count = %d, GLboolean transpose "
+                "= %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLboolean>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::UniformMatrix4fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniformMatrix4fv(GLint location = %d, GLsizei count = %d, GLboolean transpose = "
+                "%u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLboolean>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::UniformMatrix4x2fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniformMatrix4x2fv(GLint location = %d, GLsizei count = %d, GLboolean transpose "
+                "= %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLboolean>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::UniformMatrix4x3fv:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glUniformMatrix4x3fv(GLint location = %d, GLsizei count = %d, GLboolean transpose "
+                "= %u, const GLfloat *value = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLsizei>(event.params[1]),
+                static_cast<GLboolean>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::UnmapBuffer:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glUnmapBuffer(GLenum target = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::UnmapBufferOES:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glUnmapBufferOES(GLenum target = 0x%X)",
+                               static_cast<GLenum>(event.params[0]));
+        case EntryPoint::UseProgram:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glUseProgram(GLuint program = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::UseProgramStages:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glUseProgramStages(GLuint pipeline = %u, GLbitfield stages = 0x%X, "
+                               "GLuint program = %u)",
+                               static_cast<GLuint>(event.params[0]),
+                               static_cast<GLbitfield>(event.params[1]),
+                               static_cast<GLuint>(event.params[2]));
+        case EntryPoint::ValidateProgram:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glValidateProgram(GLuint program = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::ValidateProgramPipeline:
+            if (event.paramCount != 1)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glValidateProgramPipeline(GLuint pipeline = %u)",
+                               static_cast<GLuint>(event.params[0]));
+        case EntryPoint::VertexAttrib1f:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(textOut, "glVertexAttrib1f(GLuint index = %u, GLfloat x = %f)",
+                               static_cast<GLuint>(event.params[0]), DecodeFloat(event.params[1]));
+        case EntryPoint::VertexAttrib1fv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexAttrib1fv(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::VertexAttrib2f:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glVertexAttrib2f(GLuint index = %u, GLfloat x = %f, GLfloat y = %f)",
+                static_cast<GLuint>(event.params[0]), DecodeFloat(event.params[1]),
+                DecodeFloat(event.params[2]));
+        case EntryPoint::VertexAttrib2fv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexAttrib2fv(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::VertexAttrib3f:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glVertexAttrib3f(GLuint index = %u, GLfloat x = %f, GLfloat y = "
+                               "%f, GLfloat z = %f)",
+                               static_cast<GLuint>(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]), DecodeFloat(event.params[3]));
+        case EntryPoint::VertexAttrib3fv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexAttrib3fv(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::VertexAttrib4f:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glVertexAttrib4f(GLuint index = %u, GLfloat x = %f, GLfloat y = "
+                               "%f, GLfloat z = %f, GLfloat w = %f)",
+                               static_cast<GLuint>(event.params[0]), DecodeFloat(event.params[1]),
+                               DecodeFloat(event.params[2]), DecodeFloat(event.params[3]),
+                               DecodeFloat(event.params[4]));
+        case EntryPoint::VertexAttrib4fv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexAttrib4fv(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::VertexAttribBinding:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glVertexAttribBinding(GLuint attribindex = %u, GLuint bindingindex = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::VertexAttribDivisor:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glVertexAttribDivisor(GLuint index = %u, GLuint divisor = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::VertexAttribDivisorANGLE:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glVertexAttribDivisorANGLE(GLuint index = %u, GLuint divisor = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::VertexAttribDivisorEXT:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glVertexAttribDivisorEXT(GLuint index = %u, GLuint divisor = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::VertexAttribFormat:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexAttribFormat(GLuint attribindex = %u, GLint size = %d, GLenum type = "
+                "0x%X, GLboolean normalized = %u, GLuint relativeoffset = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLboolean>(event.params[3]),
+                static_cast<GLuint>(event.params[4]));
+        case EntryPoint::VertexAttribI4i:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexAttribI4i(GLuint index = %u, GLint x = %d, GLint y = %d, GLint z = %d, "
+                "GLint w = %d)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLint>(event.params[2]), static_cast<GLint>(event.params[3]),
+                static_cast<GLint>(event.params[4]));
+        case EntryPoint::VertexAttribI4iv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexAttribI4iv(GLuint index = %u, const GLint *v = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::VertexAttribI4ui:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexAttribI4ui(GLuint index = %u, GLuint x = %u, GLuint y = %u, GLuint z = "
+                "%u, GLuint w = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<GLuint>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<GLuint>(event.params[4]));
+        case EntryPoint::VertexAttribI4uiv:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexAttribI4uiv(GLuint index = %u, const GLuint *v = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<uintptr_t>(event.params[1]));
+        case EntryPoint::VertexAttribIFormat:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexAttribIFormat(GLuint attribindex = %u, GLint size = %d, GLenum type = "
+                "0x%X, GLuint relativeoffset = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLuint>(event.params[3]));
+        case EntryPoint::VertexAttribIPointer:
+            if (event.paramCount != 5)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexAttribIPointer(GLuint index = %u, GLint size = %d, GLenum type = 0x%X, "
+                "GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLsizei>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]));
+        case EntryPoint::VertexAttribPointer:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexAttribPointer(GLuint index = %u, GLint size = %d, GLenum type = 0x%X, "
+                "GLboolean normalized = %u, GLsizei stride = %d, const void *pointer = "
+                "0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLenum>(event.params[2]), static_cast<GLboolean>(event.params[3]),
+                static_cast<GLsizei>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::VertexBindingDivisor:
+            if (event.paramCount != 2)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut, "glVertexBindingDivisor(GLuint bindingindex = %u, GLuint divisor = %u)",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]));
+        case EntryPoint::VertexPointer:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glVertexPointer(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const "
+                "void *pointer = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        case EntryPoint::Viewport:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glViewport(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
+                static_cast<GLint>(event.params[0]), static_cast<GLint>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<GLsizei>(event.params[3]));
+        case EntryPoint::WaitSemaphoreEXT:
+            if (event.paramCount != 6)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glWaitSemaphoreEXT(GLuint semaphore = %u, GLuint numBufferBarriers = %u, const "
+                "GLuint *buffers = 0x%016" PRIxPTR
+                ", GLuint numTextureBarriers = %u, const GLuint *textures = 0x%016" PRIxPTR
+                ", const GLenum *srcLayouts = 0x%016" PRIxPTR ")",
+                static_cast<GLuint>(event.params[0]), static_cast<GLuint>(event.params[1]),
+                static_cast<uintptr_t>(event.params[2]), static_cast<GLuint>(event.params[3]),
+                static_cast<uintptr_t>(event.params[4]), static_cast<uintptr_t>(event.params[5]));
+        case EntryPoint::WaitSync:
+            if (event.paramCount != 3)
+            {
+                return false;
+            }
+            return FormatEvent(textOut,
+                               "glWaitSync(GLsync sync = 0x%016" PRIxPTR
+                               ", GLbitfield flags = 0x%X, GLuint64 timeout = %llu)",
+                               static_cast<uintptr_t>(event.params[0]),
+                               static_cast<GLbitfield>(event.params[1]),
+                               static_cast<unsigned long long>(event.params[2]));
+        case EntryPoint::WeightPointerOES:
+            if (event.paramCount != 4)
+            {
+                return false;
+            }
+            return FormatEvent(
+                textOut,
+                "glWeightPointerOES(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, "
+                "const void *pointer = 0x%016" PRIxPTR ")",
+                static_cast<GLint>(event.params[0]), static_cast<GLenum>(event.params[1]),
+                static_cast<GLsizei>(event.params[2]), static_cast<uintptr_t>(event.params[3]));
+        default:
+            return false;
+    }
+}
+}  // namespace gl
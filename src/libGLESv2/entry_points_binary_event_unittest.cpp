@@ -0,0 +1,71 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_binary_event_unittest.cpp: Unit tests for the formatting of binary entry point
+// events.
+
+#include <gtest/gtest.h>
+
+#include "libGLESv2/entry_points_binary_event.h"
+
+namespace
+{
+using namespace gl;
+
+template <typename... ParamsT>
+BinaryEvent MakeEvent(EntryPoint entryPoint, ParamsT... params)
+{
+    BinaryEvent event        = {};
+    const uint64_t encoded[] = {EncodeBinaryEventParam(params)..., 0};
+    event.entryPoint         = static_cast<uint16_t>(entryPoint);
+    event.paramCount         = static_cast<uint16_t>(sizeof...(ParamsT));
+    for (size_t index = 0; index < sizeof...(ParamsT); ++index)
+    {
+        event.params[index] = encoded[index];
+    }
+    return event;
+}
+
+// Tests that signed integer parameters keep their sign through the encoding.
+TEST(BinaryEventTest, FormatsSignedIntegers)
+{
+    std::string text;
+    ASSERT_TRUE(FormatBinaryEvent(MakeEvent(EntryPoint::Viewport, 0, -1, 64, 32), &text));
+    EXPECT_EQ("glViewport(GLint x = 0, GLint y = -1, GLsizei width = 64, GLsizei height = 32)",
+              text);
+}
+
+// Tests that enums are formatted as hexadecimal and unsigned integers as decimal.
+TEST(BinaryEventTest, FormatsEnumsAndUnsignedIntegers)
+{
+    std::string text;
+    ASSERT_TRUE(FormatBinaryEvent(
+        MakeEvent(EntryPoint::BindTexture, static_cast<GLenum>(GL_TEXTURE_2D), 7u), &text));
+    EXPECT_EQ("glBindTexture(GLenum target = 0xDE1, GLuint texture = 7)", text);
+}
+
+// Tests that float parameters are decoded from their bit pattern.
+TEST(BinaryEventTest, FormatsFloats)
+{
+    std::string text;
+    ASSERT_TRUE(
+        FormatBinaryEvent(MakeEvent(EntryPoint::ClearColor, 0.5f, -1.0f, 0.0f, 1.0f), &text));
+    EXPECT_EQ(
+        "glClearColor(GLfloat red = 0.500000, GLfloat green = -1.000000, GLfloat blue = 0.000000, "
+        "GLfloat alpha = 1.000000)",
+        text);
+}
+
+// Tests that events that don't match the signature of their entry point are rejected.
+TEST(BinaryEventTest, RejectsMismatchedEvents)
+{
+    std::string text;
+    EXPECT_FALSE(FormatBinaryEvent(MakeEvent(EntryPoint::Viewport, 0, 0), &text));
+
+    BinaryEvent invalid = MakeEvent(EntryPoint::Viewport, 0, 0, 1, 1);
+    invalid.entryPoint  = static_cast<uint16_t>(EntryPoint::EnumCount);
+    EXPECT_FALSE(FormatBinaryEvent(invalid, &text));
+}
+}  // anonymous namespace
@@ -0,0 +1,224 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_capture.cpp:
+//   Implements the capture of GLES calls.
+
+#include "libGLESv2/entry_points_capture.h"
+
+#if ANGLE_CAPTURE == ANGLE_ENABLED
+
+#    include <string.h>
+#    include <atomic>
+#    include <mutex>
+#    include <string>
+
+#    include "common/debug.h"
+#    include "common/system_utils.h"
+#    include "libANGLE/Context.h"
+#    include "libANGLE/formatutils.h"
+
+namespace gl
+{
+namespace
+{
+std::mutex gCaptureMutex;
+FILE *gCaptureFile = nullptr;
+
+// -1 until the environment is read, then 1 if ANGLE_CAPTURE_FILE was set and could be opened.
+std::atomic<int> gCaptureActive(-1);
+
+void WriteCaptureFileHeader(FILE *file)
+{
+    CaptureFileHeader header = {};
+    memcpy(header.magic, kCaptureFileMagic, sizeof(header.magic));
+    header.version = kCaptureFileVersion;
+    fwrite(&header, sizeof(header), 1, file);
+}
+
+FILE *GetCaptureFile()
+{
+    if (gCaptureActive == -1)
+    {
+        std::string path = angle::GetEnvironmentVar("ANGLE_CAPTURE_FILE");
+        if (!path.empty())
+        {
+            gCaptureFile = fopen(path.c_str(), "wb");
+            if (gCaptureFile)
+            {
+                WriteCaptureFileHeader(gCaptureFile);
+            }
+            else
+            {
+                ERR() << "Could not open " << path << " to write the capture.";
+            }
+        }
+        gCaptureActive = gCaptureFile ? 1 : 0;
+    }
+    return gCaptureFile;
+}
+}  // anonymous namespace
+
+CallCapture::CallCapture(EntryPoint entryPoint) : mEntryPoint(entryPoint) {}
+
+CallCapture::~CallCapture() = default;
+
+void CallCapture::addBlob(size_t paramIndex, const void *data, size_t size)
+{
+    if (data == nullptr || size == 0)
+    {
+        return;
+    }
+
+    Blob blob;
+    blob.paramIndex = static_cast<uint32_t>(paramIndex);
+    blob.data.resize(size);
+    memcpy(blob.data.data(), data, size);
+    mBlobs.push_back(std::move(blob));
+}
+
+void CallCapture::addStrings(size_t paramIndex,
+                             const GLchar *const *strings,
+                             GLsizei count,
+                             const GLint *lengths)
+{
+    if (strings == nullptr)
+    {
+        return;
+    }
+
+    for (GLsizei index = 0; index < count; ++index)
+    {
+        size_t length = (lengths && lengths[index] >= 0) ? static_cast<size_t>(lengths[index])
+                                                         : strlen(strings[index]);
+        Blob blob;
+        blob.paramIndex = static_cast<uint32_t>(paramIndex);
+        blob.data.resize(length + 1, 0);
+        memcpy(blob.data.data(), strings[index], length);
+        mBlobs.push_back(std::move(blob));
+    }
+}
+
+void CallCapture::write(FILE *file) const
+{
+    CaptureCallHeader header;
+    header.entryPoint = static_cast<uint16_t>(mEntryPoint);
+    header.paramCount = static_cast<uint16_t>(mParams.size());
+    header.blobCount  = static_cast<uint32_t>(mBlobs.size());
+    fwrite(&header, sizeof(header), 1, file);
+    if (!mParams.empty())
+    {
+        fwrite(mParams.data(), sizeof(uint64_t), mParams.size(), file);
+    }
+
+    static const uint8_t kPadding[8] = {};
+    for (const Blob &blob : mBlobs)
+    {
+        CaptureBlobHeader blobHeader;
+        blobHeader.paramIndex = blob.paramIndex;
+        blobHeader.size       = static_cast<uint32_t>(blob.data.size());
+        fwrite(&blobHeader, sizeof(blobHeader), 1, file);
+        fwrite(blob.data.data(), 1, blob.data.size(), file);
+        fwrite(kPadding, 1, rx::roundUp<size_t>(blob.data.size(), 8) - blob.data.size(), file);
+    }
+}
+
+bool IsCaptureActive()
+{
+    if (gCaptureActive == -1)
+    {
+        std::lock_guard<std::mutex> lock(gCaptureMutex);
+        GetCaptureFile();
+    }
+    return gCaptureActive == 1;
+}
+
+void WriteCallCapture(const CallCapture &call)
+{
+    std::lock_guard<std::mutex> lock(gCaptureMutex);
+    FILE *file = GetCaptureFile();
+    if (file)
+    {
+        call.write(file);
+    }
+}
+
+void CaptureFrameEnd()
+{
+    if (!IsCaptureActive())
+    {
+        return;
+    }
+
+    std::lock_guard<std::mutex> lock(gCaptureMutex);
+    CallCapture(EntryPoint::Invalid).write(gCaptureFile);
+    fflush(gCaptureFile);
+}
+
+void SetCaptureFile(FILE *file)
+{
+    std::lock_guard<std::mutex> lock(gCaptureMutex);
+    if (gCaptureFile)
+    {
+        fflush(gCaptureFile);
+    }
+
+    gCaptureFile = file;
+    if (gCaptureFile)
+    {
+        WriteCaptureFileHeader(gCaptureFile);
+    }
+    gCaptureActive = gCaptureFile ? 1 : 0;
+}
+
+size_t GetCaptureTexImageSize(const Context *context,
+                              GLenum format,
+                              GLenum type,
+                              GLsizei width,
+                              GLsizei height,
+                              GLsizei depth,
+                              bool is3D)
+{
+    const State &state = context->getState();
+    if (state.getTargetBuffer(BufferBinding::PixelUnpack) != nullptr)
+    {
+        return 0;
+    }
+
+    const InternalFormat &formatInfo = GetInternalFormatInfo(format, type);
+    GLuint endByte                   = 0;
+    if (!formatInfo.computePackUnpackEndByte(type, Extents(width, height, depth),
+                                             state.getUnpackState(), is3D, &endByte))
+    {
+        return 0;
+    }
+    return endByte;
+}
+
+size_t GetCaptureCompressedTexImageSize(const Context *context, GLsizei imageSize)
+{
+    if (context->getState().getTargetBuffer(BufferBinding::PixelUnpack) != nullptr)
+    {
+        return 0;
+    }
+    return static_cast<size_t>(imageSize);
+}
+
+size_t GetCaptureIndicesSize(const Context *context, GLsizei count, GLenum type)
+{
+    if (context->getState().getTargetBuffer(BufferBinding::ElementArray) != nullptr)
+    {
+        return 0;
+    }
+    return static_cast<size_t>(count) * GetTypeInfo(type).bytes;
+}
+
+size_t GetCaptureStringSize(const GLchar *string)
+{
+    return string ? strlen(string) + 1 : 0;
+}
+}  // namespace gl
+
+#endif  // ANGLE_CAPTURE == ANGLE_ENABLED
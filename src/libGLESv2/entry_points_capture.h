@@ -0,0 +1,129 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_capture.h:
+//   Capture of GLES calls for offline replay. Enabled with the angle_enable_capture GN arg. When
+//   ANGLE_CAPTURE_FILE is set in the environment, every generated GLES entry point that passes
+//   validation writes its parameters and the client memory they reference to that file.
+//   angle_capture_replay re-issues the calls and reports frame times.
+
+#ifndef LIBGLESV2_ENTRY_POINTS_CAPTURE_H_
+#define LIBGLESV2_ENTRY_POINTS_CAPTURE_H_
+
+#include <stdint.h>
+
+#include "libANGLE/features.h"
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+namespace gl
+{
+// A capture file is a CaptureFileHeader followed by calls. A call is a CaptureCallHeader,
+// paramCount parameters widened to 64 bits like binary events, and blobCount blobs. A blob is a
+// CaptureBlobHeader followed by its data padded to 8 bytes. Parameters that are arrays of strings
+// have one blob per string. A call to EntryPoint::Invalid marks the end of a frame.
+struct CaptureFileHeader
+{
+    char magic[4];
+    uint32_t version;
+};
+
+struct CaptureCallHeader
+{
+    uint16_t entryPoint;
+    uint16_t paramCount;
+    uint32_t blobCount;
+};
+
+struct CaptureBlobHeader
+{
+    uint32_t paramIndex;
+    uint32_t size;
+};
+
+constexpr char kCaptureFileMagic[4]    = {'A', 'C', 'A', 'P'};
+constexpr uint32_t kCaptureFileVersion = 1;
+}  // namespace gl
+
+#if ANGLE_CAPTURE == ANGLE_ENABLED
+
+#    include <stdio.h>
+#    include <vector>
+
+#    include "angle_gl.h"
+#    include "common/angleutils.h"
+#    include "libGLESv2/entry_points_binary_event.h"
+
+namespace gl
+{
+class Context;
+
+class CallCapture final : angle::NonCopyable
+{
+  public:
+    explicit CallCapture(EntryPoint entryPoint);
+    ~CallCapture();
+
+    template <typename T>
+    void addParam(T value)
+    {
+        mParams.push_back(EncodeBinaryEventParam(value));
+    }
+
+    // Copies size bytes of client memory referenced by the parameter. Does nothing if data is null
+    // or size is zero, for example when the pointer is an offset into a bound buffer.
+    void addBlob(size_t paramIndex, const void *data, size_t size);
+
+    // Copies count strings as null terminated blobs. lengths may be null, and negative lengths
+    // mean null terminated strings, like in glShaderSource.
+    void addStrings(size_t paramIndex,
+                    const GLchar *const *strings,
+                    GLsizei count,
+                    const GLint *lengths);
+
+    void write(FILE *file) const;
+
+  private:
+    struct Blob
+    {
+        uint32_t paramIndex;
+        std::vector<uint8_t> data;
+    };
+
+    EntryPoint mEntryPoint;
+    std::vector<uint64_t> mParams;
+    std::vector<Blob> mBlobs;
+};
+
+bool IsCaptureActive();
+void WriteCallCapture(const CallCapture &call);
+void CaptureFrameEnd();
+
+// Writes the capture to file instead of the file named by ANGLE_CAPTURE_FILE, or stops capturing if
+// file is null. The caller keeps ownership of the file. Used by the tests.
+void SetCaptureFile(FILE *file);
+
+// Sizes of the client memory referenced by the entry points, used by the generated captures. They
+// return zero when the pointer is an offset into a bound buffer.
+size_t GetCaptureTexImageSize(const Context *context,
+                              GLenum format,
+                              GLenum type,
+                              GLsizei width,
+                              GLsizei height,
+                              GLsizei depth,
+                              bool is3D);
+size_t GetCaptureCompressedTexImageSize(const Context *context, GLsizei imageSize);
+size_t GetCaptureIndicesSize(const Context *context, GLsizei count, GLenum type);
+size_t GetCaptureStringSize(const GLchar *string);
+}  // namespace gl
+
+#    include "libGLESv2/entry_points_capture_autogen.h"
+
+#    define ANGLE_CAPTURE_CALL(EP, ...) \
+        (gl::IsCaptureActive() ? gl::Capture##EP(__VA_ARGS__) : static_cast<void>(0))
+#else
+#    define ANGLE_CAPTURE_CALL(EP, ...)
+#endif  // ANGLE_CAPTURE == ANGLE_ENABLED
+
+#endif  // LIBGLESV2_ENTRY_POINTS_CAPTURE_H_
@@ -0,0 +1,7834 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml, gl_angle_ext.xml and
+// entry_point_capture_params.json.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_capture_autogen.cpp:
+//   Captures of the GLES entry points.
+
+#include "libGLESv2/entry_points_capture.h"
+
+#if ANGLE_CAPTURE == ANGLE_ENABLED
+
+namespace gl
+{
+void CaptureActiveShaderProgram(const Context *context, GLuint pipeline, GLuint program)
+{
+    CallCapture call(EntryPoint::ActiveShaderProgram);
+    call.addParam(pipeline);
+    call.addParam(program);
+    WriteCallCapture(call);
+}
+
+void CaptureActiveTexture(const Context *context, GLenum texture)
+{
+    CallCapture call(EntryPoint::ActiveTexture);
+    call.addParam(texture);
+    WriteCallCapture(call);
+}
+
+void CaptureAlphaFunc(const Context *context, GLenum func, GLfloat ref)
+{
+    CallCapture call(EntryPoint::AlphaFunc);
+    call.addParam(func);
+    call.addParam(ref);
+    WriteCallCapture(call);
+}
+
+void CaptureAlphaFuncx(const Context *context, GLenum func, GLfixed ref)
+{
+    CallCapture call(EntryPoint::AlphaFuncx);
+    call.addParam(func);
+    call.addParam(ref);
+    WriteCallCapture(call);
+}
+
+void CaptureAttachShader(const Context *context, GLuint program, GLuint shader)
+{
+    CallCapture call(EntryPoint::AttachShader);
+    call.addParam(program);
+    call.addParam(shader);
+    WriteCallCapture(call);
+}
+
+void CaptureBeginQuery(const Context *context, GLenum target, GLuint id)
+{
+    CallCapture call(EntryPoint::BeginQuery);
+    call.addParam(target);
+    call.addParam(id);
+    WriteCallCapture(call);
+}
+
+void CaptureBeginQueryEXT(const Context *context, GLenum target, GLuint id)
+{
+    CallCapture call(EntryPoint::BeginQueryEXT);
+    call.addParam(target);
+    call.addParam(id);
+    WriteCallCapture(call);
+}
+
+void CaptureBeginTransformFeedback(const Context *context, GLenum primitiveMode)
+{
+    CallCapture call(EntryPoint::BeginTransformFeedback);
+    call.addParam(primitiveMode);
+    WriteCallCapture(call);
+}
+
+void CaptureBindAttribLocation(const Context *context,
+                               GLuint program,
+                               GLuint index,
+                               const GLchar *name)
+{
+    CallCapture call(EntryPoint::BindAttribLocation);
+    call.addParam(program);
+    call.addParam(index);
+    call.addParam(name);
+    call.addBlob(2, name, static_cast<size_t>(GetCaptureStringSize(name)));
+    WriteCallCapture(call);
+}
+
+void CaptureBindBuffer(const Context *context, GLenum target, GLuint buffer)
+{
+    CallCapture call(EntryPoint::BindBuffer);
+    call.addParam(target);
+    call.addParam(buffer);
+    WriteCallCapture(call);
+}
+
+void CaptureBindBufferBase(const Context *context, GLenum target, GLuint index, GLuint buffer)
+{
+    CallCapture call(EntryPoint::BindBufferBase);
+    call.addParam(target);
+    call.addParam(index);
+    call.addParam(buffer);
+    WriteCallCapture(call);
+}
+
+void CaptureBindBufferRange(const Context *context,
+                            GLenum target,
+                            GLuint index,
+                            GLuint buffer,
+                            GLintptr offset,
+                            GLsizeiptr size)
+{
+    CallCapture call(EntryPoint::BindBufferRange);
+    call.addParam(target);
+    call.addParam(index);
+    call.addParam(buffer);
+    call.addParam(offset);
+    call.addParam(size);
+    WriteCallCapture(call);
+}
+
+void CaptureBindFragDataLocationEXT(const Context *context,
+                                    GLuint program,
+                                    GLuint color,
+                                    const GLchar *name)
+{
+    CallCapture call(EntryPoint::BindFragDataLocationEXT);
+    call.addParam(program);
+    call.addParam(color);
+    call.addParam(name);
+    WriteCallCapture(call);
+}
+
+void CaptureBindFragDataLocationIndexedEXT(const Context *context,
+                                           GLuint program,
+                                           GLuint colorNumber,
+                                           GLuint index,
+                                           const GLchar *name)
+{
+    CallCapture call(EntryPoint::BindFragDataLocationIndexedEXT);
+    call.addParam(program);
+    call.addParam(colorNumber);
+    call.addParam(index);
+    call.addParam(name);
+    WriteCallCapture(call);
+}
+
+void CaptureBindFragmentInputLocationCHROMIUM(const Context *context,
+                                              GLuint programs,
+                                              GLint location,
+                                              const GLchar *name)
+{
+    CallCapture call(EntryPoint::BindFragmentInputLocationCHROMIUM);
+    call.addParam(programs);
+    call.addParam(location);
+    call.addParam(name);
+    WriteCallCapture(call);
+}
+
+void CaptureBindFramebuffer(const Context *context, GLenum target, GLuint framebuffer)
+{
+    CallCapture call(EntryPoint::BindFramebuffer);
+    call.addParam(target);
+    call.addParam(framebuffer);
+    WriteCallCapture(call);
+}
+
+void CaptureBindFramebufferOES(const Context *context, GLenum target, GLuint framebuffer)
+{
+    CallCapture call(EntryPoint::BindFramebufferOES);
+    call.addParam(target);
+    call.addParam(framebuffer);
+    WriteCallCapture(call);
+}
+
+void CaptureBindImageTexture(const Context *context,
+                             GLuint unit,
+                             GLuint texture,
+                             GLint level,
+                             GLboolean layered,
+                             GLint layer,
+                             GLenum access,
+                             GLenum format)
+{
+    CallCapture call(EntryPoint::BindImageTexture);
+    call.addParam(unit);
+    call.addParam(texture);
+    call.addParam(level);
+    call.addParam(layered);
+    call.addParam(layer);
+    call.addParam(access);
+    call.addParam(format);
+    WriteCallCapture(call);
+}
+
+void CaptureBindProgramPipeline(const Context *context, GLuint pipeline)
+{
+    CallCapture call(EntryPoint::BindProgramPipeline);
+    call.addParam(pipeline);
+    WriteCallCapture(call);
+}
+
+void CaptureBindRenderbuffer(const Context *context, GLenum target, GLuint renderbuffer)
+{
+    CallCapture call(EntryPoint::BindRenderbuffer);
+    call.addParam(target);
+    call.addParam(renderbuffer);
+    WriteCallCapture(call);
+}
+
+void CaptureBindRenderbufferOES(const Context *context, GLenum target, GLuint renderbuffer)
+{
+    CallCapture call(EntryPoint::BindRenderbufferOES);
+    call.addParam(target);
+    call.addParam(renderbuffer);
+    WriteCallCapture(call);
+}
+
+void CaptureBindSampler(const Context *context, GLuint unit, GLuint sampler)
+{
+    CallCapture call(EntryPoint::BindSampler);
+    call.addParam(unit);
+    call.addParam(sampler);
+    WriteCallCapture(call);
+}
+
+void CaptureBindTexture(const Context *context, GLenum target, GLuint texture)
+{
+    CallCapture call(EntryPoint::BindTexture);
+    call.addParam(target);
+    call.addParam(texture);
+    WriteCallCapture(call);
+}
+
+void CaptureBindTransformFeedback(const Context *context, GLenum target, GLuint id)
+{
+    CallCapture call(EntryPoint::BindTransformFeedback);
+    call.addParam(target);
+    call.addParam(id);
+    WriteCallCapture(call);
+}
+
+void CaptureBindUniformLocationCHROMIUM(const Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        const GLchar *name)
+{
+    CallCapture call(EntryPoint::BindUniformLocationCHROMIUM);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(name);
+    WriteCallCapture(call);
+}
+
+void CaptureBindVertexArray(const Context *context, GLuint array)
+{
+    CallCapture call(EntryPoint::BindVertexArray);
+    call.addParam(array);
+    WriteCallCapture(call);
+}
+
+void CaptureBindVertexArrayOES(const Context *context, GLuint array)
+{
+    CallCapture call(EntryPoint::BindVertexArrayOES);
+    call.addParam(array);
+    WriteCallCapture(call);
+}
+
+void CaptureBindVertexBuffer(const Context *context,
+                             GLuint bindingindex,
+                             GLuint buffer,
+                             GLintptr offset,
+                             GLsizei stride)
+{
+    CallCapture call(EntryPoint::BindVertexBuffer);
+    call.addParam(bindingindex);
+    call.addParam(buffer);
+    call.addParam(offset);
+    call.addParam(stride);
+    WriteCallCapture(call);
+}
+
+void CaptureBlendColor(const Context *context,
+                       GLfloat red,
+                       GLfloat green,
+                       GLfloat blue,
+                       GLfloat alpha)
+{
+    CallCapture call(EntryPoint::BlendColor);
+    call.addParam(red);
+    call.addParam(green);
+    call.addParam(blue);
+    call.addParam(alpha);
+    WriteCallCapture(call);
+}
+
+void CaptureBlendEquation(const Context *context, GLenum mode)
+{
+    CallCapture call(EntryPoint::BlendEquation);
+    call.addParam(mode);
+    WriteCallCapture(call);
+}
+
+void CaptureBlendEquationSeparate(const Context *context, GLenum modeRGB, GLenum modeAlpha)
+{
+    CallCapture call(EntryPoint::BlendEquationSeparate);
+    call.addParam(modeRGB);
+    call.addParam(modeAlpha);
+    WriteCallCapture(call);
+}
+
+void CaptureBlendFunc(const Context *context, GLenum sfactor, GLenum dfactor)
+{
+    CallCapture call(EntryPoint::BlendFunc);
+    call.addParam(sfactor);
+    call.addParam(dfactor);
+    WriteCallCapture(call);
+}
+
+void CaptureBlendFuncSeparate(const Context *context,
+                              GLenum sfactorRGB,
+                              GLenum dfactorRGB,
+                              GLenum sfactorAlpha,
+                              GLenum dfactorAlpha)
+{
+    CallCapture call(EntryPoint::BlendFuncSeparate);
+    call.addParam(sfactorRGB);
+    call.addParam(dfactorRGB);
+    call.addParam(sfactorAlpha);
+    call.addParam(dfactorAlpha);
+    WriteCallCapture(call);
+}
+
+void CaptureBlitFramebuffer(const Context *context,
+                            GLint srcX0,
+                            GLint srcY0,
+                            GLint srcX1,
+                            GLint srcY1,
+                            GLint dstX0,
+                            GLint dstY0,
+                            GLint dstX1,
+                            GLint dstY1,
+                            GLbitfield mask,
+                            GLenum filter)
+{
+    CallCapture call(EntryPoint::BlitFramebuffer);
+    call.addParam(srcX0);
+    call.addParam(srcY0);
+    call.addParam(srcX1);
+    call.addParam(srcY1);
+    call.addParam(dstX0);
+    call.addParam(dstY0);
+    call.addParam(dstX1);
+    call.addParam(dstY1);
+    call.addParam(mask);
+    call.addParam(filter);
+    WriteCallCapture(call);
+}
+
+void CaptureBlitFramebufferANGLE(const Context *context,
+                                 GLint srcX0,
+                                 GLint srcY0,
+                                 GLint srcX1,
+                                 GLint srcY1,
+                                 GLint dstX0,
+                                 GLint dstY0,
+                                 GLint dstX1,
+                                 GLint dstY1,
+                                 GLbitfield mask,
+                                 GLenum filter)
+{
+    CallCapture call(EntryPoint::BlitFramebufferANGLE);
+    call.addParam(srcX0);
+    call.addParam(srcY0);
+    call.addParam(srcX1);
+    call.addParam(srcY1);
+    call.addParam(dstX0);
+    call.addParam(dstY0);
+    call.addParam(dstX1);
+    call.addParam(dstY1);
+    call.addParam(mask);
+    call.addParam(filter);
+    WriteCallCapture(call);
+}
+
+void CaptureBufferData(const Context *context,
+                       GLenum target,
+                       GLsizeiptr size,
+                       const void *data,
+                       GLenum usage)
+{
+    CallCapture call(EntryPoint::BufferData);
+    call.addParam(target);
+    call.addParam(size);
+    call.addParam(data);
+    call.addParam(usage);
+    call.addBlob(2, data, static_cast<size_t>(size));
+    WriteCallCapture(call);
+}
+
+void CaptureBufferStorageMemEXT(const Context *context,
+                                GLenum target,
+                                GLsizeiptr size,
+                                GLuint memory,
+                                GLuint64 offset)
+{
+    CallCapture call(EntryPoint::BufferStorageMemEXT);
+    call.addParam(target);
+    call.addParam(size);
+    call.addParam(memory);
+    call.addParam(offset);
+    WriteCallCapture(call);
+}
+
+void CaptureBufferSubData(const Context *context,
+                          GLenum target,
+                          GLintptr offset,
+                          GLsizeiptr size,
+                          const void *data)
+{
+    CallCapture call(EntryPoint::BufferSubData);
+    call.addParam(target);
+    call.addParam(offset);
+    call.addParam(size);
+    call.addParam(data);
+    call.addBlob(3, data, static_cast<size_t>(size));
+    WriteCallCapture(call);
+}
+
+void CaptureCheckFramebufferStatus(const Context *context, GLenum target)
+{
+    CallCapture call(EntryPoint::CheckFramebufferStatus);
+    call.addParam(target);
+    WriteCallCapture(call);
+}
+
+void CaptureCheckFramebufferStatusOES(const Context *context, GLenum target)
+{
+    CallCapture call(EntryPoint::CheckFramebufferStatusOES);
+    call.addParam(target);
+    WriteCallCapture(call);
+}
+
+void CaptureClear(const Context *context, GLbitfield mask)
+{
+    CallCapture call(EntryPoint::Clear);
+    call.addParam(mask);
+    WriteCallCapture(call);
+}
+
+void CaptureClearBufferfi(const Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          GLfloat depth,
+                          GLint stencil)
+{
+    CallCapture call(EntryPoint::ClearBufferfi);
+    call.addParam(buffer);
+    call.addParam(drawbuffer);
+    call.addParam(depth);
+    call.addParam(stencil);
+    WriteCallCapture(call);
+}
+
+void CaptureClearBufferfv(const Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ClearBufferfv);
+    call.addParam(buffer);
+    call.addParam(drawbuffer);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>((buffer == GL_COLOR ? 4 : 1) * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureClearBufferiv(const Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          const GLint *value)
+{
+    CallCapture call(EntryPoint::ClearBufferiv);
+    call.addParam(buffer);
+    call.addParam(drawbuffer);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>((buffer == GL_COLOR ? 4 : 1) * sizeof(GLint)));
+    WriteCallCapture(call);
+}
+
+void CaptureClearBufferuiv(const Context *context,
+                           GLenum buffer,
+                           GLint drawbuffer,
+                           const GLuint *value)
+{
+    CallCapture call(EntryPoint::ClearBufferuiv);
+    call.addParam(buffer);
+    call.addParam(drawbuffer);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>((buffer == GL_COLOR ? 4 : 1) * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureClearColor(const Context *context,
+                       GLfloat red,
+                       GLfloat green,
+                       GLfloat blue,
+                       GLfloat alpha)
+{
+    CallCapture call(EntryPoint::ClearColor);
+    call.addParam(red);
+    call.addParam(green);
+    call.addParam(blue);
+    call.addParam(alpha);
+    WriteCallCapture(call);
+}
+
+void CaptureClearColorx(const Context *context,
+                        GLfixed red,
+                        GLfixed green,
+                        GLfixed blue,
+                        GLfixed alpha)
+{
+    CallCapture call(EntryPoint::ClearColorx);
+    call.addParam(red);
+    call.addParam(green);
+    call.addParam(blue);
+    call.addParam(alpha);
+    WriteCallCapture(call);
+}
+
+void CaptureClearDepthf(const Context *context, GLfloat d)
+{
+    CallCapture call(EntryPoint::ClearDepthf);
+    call.addParam(d);
+    WriteCallCapture(call);
+}
+
+void CaptureClearDepthx(const Context *context, GLfixed depth)
+{
+    CallCapture call(EntryPoint::ClearDepthx);
+    call.addParam(depth);
+    WriteCallCapture(call);
+}
+
+void CaptureClearStencil(const Context *context, GLint s)
+{
+    CallCapture call(EntryPoint::ClearStencil);
+    call.addParam(s);
+    WriteCallCapture(call);
+}
+
+void CaptureClientActiveTexture(const Context *context, GLenum texture)
+{
+    CallCapture call(EntryPoint::ClientActiveTexture);
+    call.addParam(texture);
+    WriteCallCapture(call);
+}
+
+void CaptureClientWaitSync(const Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout)
+{
+    CallCapture call(EntryPoint::ClientWaitSync);
+    call.addParam(sync);
+    call.addParam(flags);
+    call.addParam(timeout);
+    WriteCallCapture(call);
+}
+
+void CaptureClipPlanef(const Context *context, GLenum p, const GLfloat *eqn)
+{
+    CallCapture call(EntryPoint::ClipPlanef);
+    call.addParam(p);
+    call.addParam(eqn);
+    WriteCallCapture(call);
+}
+
+void CaptureClipPlanex(const Context *context, GLenum plane, const GLfixed *equation)
+{
+    CallCapture call(EntryPoint::ClipPlanex);
+    call.addParam(plane);
+    call.addParam(equation);
+    WriteCallCapture(call);
+}
+
+void CaptureColor4f(const Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+{
+    CallCapture call(EntryPoint::Color4f);
+    call.addParam(red);
+    call.addParam(green);
+    call.addParam(blue);
+    call.addParam(alpha);
+    WriteCallCapture(call);
+}
+
+void CaptureColor4ub(const Context *context,
+                     GLubyte red,
+                     GLubyte green,
+                     GLubyte blue,
+                     GLubyte alpha)
+{
+    CallCapture call(EntryPoint::Color4ub);
+    call.addParam(red);
+    call.addParam(green);
+    call.addParam(blue);
+    call.addParam(alpha);
+    WriteCallCapture(call);
+}
+
+void CaptureColor4x(const Context *context, GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha)
+{
+    CallCapture call(EntryPoint::Color4x);
+    call.addParam(red);
+    call.addParam(green);
+    call.addParam(blue);
+    call.addParam(alpha);
+    WriteCallCapture(call);
+}
+
+void CaptureColorMask(const Context *context,
+                      GLboolean red,
+                      GLboolean green,
+                      GLboolean blue,
+                      GLboolean alpha)
+{
+    CallCapture call(EntryPoint::ColorMask);
+    call.addParam(red);
+    call.addParam(green);
+    call.addParam(blue);
+    call.addParam(alpha);
+    WriteCallCapture(call);
+}
+
+void CaptureColorPointer(const Context *context,
+                         GLint size,
+                         GLenum type,
+                         GLsizei stride,
+                         const void *pointer)
+{
+    CallCapture call(EntryPoint::ColorPointer);
+    call.addParam(size);
+    call.addParam(type);
+    call.addParam(stride);
+    call.addParam(pointer);
+    WriteCallCapture(call);
+}
+
+void CaptureCompileShader(const Context *context, GLuint shader)
+{
+    CallCapture call(EntryPoint::CompileShader);
+    call.addParam(shader);
+    WriteCallCapture(call);
+}
+
+void CaptureCompressedCopyTextureCHROMIUM(const Context *context, GLuint sourceId, GLuint destId)
+{
+    CallCapture call(EntryPoint::CompressedCopyTextureCHROMIUM);
+    call.addParam(sourceId);
+    call.addParam(destId);
+    WriteCallCapture(call);
+}
+
+void CaptureCompressedTexImage2D(const Context *context,
+                                 GLenum target,
+                                 GLint level,
+                                 GLenum internalformat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLint border,
+                                 GLsizei imageSize,
+                                 const void *data)
+{
+    CallCapture call(EntryPoint::CompressedTexImage2D);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(border);
+    call.addParam(imageSize);
+    call.addParam(data);
+    call.addBlob(7, data,
+                 static_cast<size_t>(GetCaptureCompressedTexImageSize(context, imageSize)));
+    WriteCallCapture(call);
+}
+
+void CaptureCompressedTexImage2DRobustANGLE(const Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum internalformat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLint border,
+                                            GLsizei imageSize,
+                                            GLsizei dataSize,
+                                            const GLvoid *data)
+{
+    CallCapture call(EntryPoint::CompressedTexImage2DRobustANGLE);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(border);
+    call.addParam(imageSize);
+    call.addParam(dataSize);
+    call.addParam(data);
+    call.addBlob(8, data, static_cast<size_t>(GetCaptureCompressedTexImageSize(context, dataSize)));
+    WriteCallCapture(call);
+}
+
+void CaptureCompressedTexImage3D(const Context *context,
+                                 GLenum target,
+                                 GLint level,
+                                 GLenum internalformat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLsizei depth,
+                                 GLint border,
+                                 GLsizei imageSize,
+                                 const void *data)
+{
+    CallCapture call(EntryPoint::CompressedTexImage3D);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    call.addParam(border);
+    call.addParam(imageSize);
+    call.addParam(data);
+    call.addBlob(8, data,
+                 static_cast<size_t>(GetCaptureCompressedTexImageSize(context, imageSize)));
+    WriteCallCapture(call);
+}
+
+void CaptureCompressedTexImage3DRobustANGLE(const Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum internalformat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLsizei depth,
+                                            GLint border,
+                                            GLsizei imageSize,
+                                            GLsizei dataSize,
+                                            const GLvoid *data)
+{
+    CallCapture call(EntryPoint::CompressedTexImage3DRobustANGLE);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    call.addParam(border);
+    call.addParam(imageSize);
+    call.addParam(dataSize);
+    call.addParam(data);
+    call.addBlob(9, data, static_cast<size_t>(GetCaptureCompressedTexImageSize(context, dataSize)));
+    WriteCallCapture(call);
+}
+
+void CaptureCompressedTexSubImage2D(const Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLenum format,
+                                    GLsizei imageSize,
+                                    const void *data)
+{
+    CallCapture call(EntryPoint::CompressedTexSubImage2D);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(xoffset);
+    call.addParam(yoffset);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(format);
+    call.addParam(imageSize);
+    call.addParam(data);
+    call.addBlob(8, data,
+                 static_cast<size_t>(GetCaptureCompressedTexImageSize(context, imageSize)));
+    WriteCallCapture(call);
+}
+
+void CaptureCompressedTexSubImage2DRobustANGLE(const Context *context,
+                                               GLenum target,
+                                               GLint level,
+                                               GLsizei xoffset,
+                                               GLsizei yoffset,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLenum format,
+                                               GLsizei imageSize,
+                                               GLsizei dataSize,
+                                               const GLvoid *data)
+{
+    CallCapture call(EntryPoint::CompressedTexSubImage2DRobustANGLE);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(xoffset);
+    call.addParam(yoffset);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(format);
+    call.addParam(imageSize);
+    call.addParam(dataSize);
+    call.addParam(data);
+    call.addBlob(9, data, static_cast<size_t>(GetCaptureCompressedTexImageSize(context, dataSize)));
+    WriteCallCapture(call);
+}
+
+void CaptureCompressedTexSubImage3D(const Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLint zoffset,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLsizei depth,
+                                    GLenum format,
+                                    GLsizei imageSize,
+                                    const void *data)
+{
+    CallCapture call(EntryPoint::CompressedTexSubImage3D);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(xoffset);
+    call.addParam(yoffset);
+    call.addParam(zoffset);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    call.addParam(format);
+    call.addParam(imageSize);
+    call.addParam(data);
+    call.addBlob(10, data,
+                 static_cast<size_t>(GetCaptureCompressedTexImageSize(context, imageSize)));
+    WriteCallCapture(call);
+}
+
+void CaptureCompressedTexSubImage3DRobustANGLE(const Context *context,
+                                               GLenum target,
+                                               GLint level,
+                                               GLint xoffset,
+                                               GLint yoffset,
+                                               GLint zoffset,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLsizei depth,
+                                               GLenum format,
+                                               GLsizei imageSize,
+                                               GLsizei dataSize,
+                                               const GLvoid *data)
+{
+    CallCapture call(EntryPoint::CompressedTexSubImage3DRobustANGLE);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(xoffset);
+    call.addParam(yoffset);
+    call.addParam(zoffset);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    call.addParam(format);
+    call.addParam(imageSize);
+    call.addParam(dataSize);
+    call.addParam(data);
+    call.addBlob(11, data,
+                 static_cast<size_t>(GetCaptureCompressedTexImageSize(context, dataSize)));
+    WriteCallCapture(call);
+}
+
+void CaptureCopyBufferSubData(const Context *context,
+                              GLenum readTarget,
+                              GLenum writeTarget,
+                              GLintptr readOffset,
+                              GLintptr writeOffset,
+                              GLsizeiptr size)
+{
+    CallCapture call(EntryPoint::CopyBufferSubData);
+    call.addParam(readTarget);
+    call.addParam(writeTarget);
+    call.addParam(readOffset);
+    call.addParam(writeOffset);
+    call.addParam(size);
+    WriteCallCapture(call);
+}
+
+void CaptureCopySubTexture3DANGLE(const Context *context,
+                                  GLuint sourceId,
+                                  GLint sourceLevel,
+                                  GLenum destTarget,
+                                  GLuint destId,
+                                  GLint destLevel,
+                                  GLint xoffset,
+                                  GLint yoffset,
+                                  GLint zoffset,
+                                  GLint x,
+                                  GLint y,
+                                  GLint z,
+                                  GLint width,
+                                  GLint height,
+                                  GLint depth,
+                                  GLboolean unpackFlipY,
+                                  GLboolean unpackPremultiplyAlpha,
+                                  GLboolean unpackUnmultiplyAlpha)
+{
+    CallCapture call(EntryPoint::CopySubTexture3DANGLE);
+    call.addParam(sourceId);
+    call.addParam(sourceLevel);
+    call.addParam(destTarget);
+    call.addParam(destId);
+    call.addParam(destLevel);
+    call.addParam(xoffset);
+    call.addParam(yoffset);
+    call.addParam(zoffset);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    call.addParam(unpackFlipY);
+    call.addParam(unpackPremultiplyAlpha);
+    call.addParam(unpackUnmultiplyAlpha);
+    WriteCallCapture(call);
+}
+
+void CaptureCopySubTextureCHROMIUM(const Context *context,
+                                   GLuint sourceId,
+                                   GLint sourceLevel,
+                                   GLenum destTarget,
+                                   GLuint destId,
+                                   GLint destLevel,
+                                   GLint xoffset,
+                                   GLint yoffset,
+                                   GLint x,
+                                   GLint y,
+                                   GLint width,
+                                   GLint height,
+                                   GLboolean unpackFlipY,
+                                   GLboolean unpackPremultiplyAlpha,
+                                   GLboolean unpackUnmultiplyAlpha)
+{
+    CallCapture call(EntryPoint::CopySubTextureCHROMIUM);
+    call.addParam(sourceId);
+    call.addParam(sourceLevel);
+    call.addParam(destTarget);
+    call.addParam(destId);
+    call.addParam(destLevel);
+    call.addParam(xoffset);
+    call.addParam(yoffset);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(unpackFlipY);
+    call.addParam(unpackPremultiplyAlpha);
+    call.addParam(unpackUnmultiplyAlpha);
+    WriteCallCapture(call);
+}
+
+void CaptureCopyTexImage2D(const Context *context,
+                           GLenum target,
+                           GLint level,
+                           GLenum internalformat,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLint border)
+{
+    CallCapture call(EntryPoint::CopyTexImage2D);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(internalformat);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(border);
+    WriteCallCapture(call);
+}
+
+void CaptureCopyTexSubImage2D(const Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint x,
+                              GLint y,
+                              GLsizei width,
+                              GLsizei height)
+{
+    CallCapture call(EntryPoint::CopyTexSubImage2D);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(xoffset);
+    call.addParam(yoffset);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureCopyTexSubImage3D(const Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint zoffset,
+                              GLint x,
+                              GLint y,
+                              GLsizei width,
+                              GLsizei height)
+{
+    CallCapture call(EntryPoint::CopyTexSubImage3D);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(xoffset);
+    call.addParam(yoffset);
+    call.addParam(zoffset);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureCopyTexture3DANGLE(const Context *context,
+                               GLuint sourceId,
+                               GLint sourceLevel,
+                               GLenum destTarget,
+                               GLuint destId,
+                               GLint destLevel,
+                               GLint internalFormat,
+                               GLenum destType,
+                               GLboolean unpackFlipY,
+                               GLboolean unpackPremultiplyAlpha,
+                               GLboolean unpackUnmultiplyAlpha)
+{
+    CallCapture call(EntryPoint::CopyTexture3DANGLE);
+    call.addParam(sourceId);
+    call.addParam(sourceLevel);
+    call.addParam(destTarget);
+    call.addParam(destId);
+    call.addParam(destLevel);
+    call.addParam(internalFormat);
+    call.addParam(destType);
+    call.addParam(unpackFlipY);
+    call.addParam(unpackPremultiplyAlpha);
+    call.addParam(unpackUnmultiplyAlpha);
+    WriteCallCapture(call);
+}
+
+void CaptureCopyTextureCHROMIUM(const Context *context,
+                                GLuint sourceId,
+                                GLint sourceLevel,
+                                GLenum destTarget,
+                                GLuint destId,
+                                GLint destLevel,
+                                GLint internalFormat,
+                                GLenum destType,
+                                GLboolean unpackFlipY,
+                                GLboolean unpackPremultiplyAlpha,
+                                GLboolean unpackUnmultiplyAlpha)
+{
+    CallCapture call(EntryPoint::CopyTextureCHROMIUM);
+    call.addParam(sourceId);
+    call.addParam(sourceLevel);
+    call.addParam(destTarget);
+    call.addParam(destId);
+    call.addParam(destLevel);
+    call.addParam(internalFormat);
+    call.addParam(destType);
+    call.addParam(unpackFlipY);
+    call.addParam(unpackPremultiplyAlpha);
+    call.addParam(unpackUnmultiplyAlpha);
+    WriteCallCapture(call);
+}
+
+void CaptureCoverFillPathCHROMIUM(const Context *context, GLuint path, GLenum coverMode)
+{
+    CallCapture call(EntryPoint::CoverFillPathCHROMIUM);
+    call.addParam(path);
+    call.addParam(coverMode);
+    WriteCallCapture(call);
+}
+
+void CaptureCoverFillPathInstancedCHROMIUM(const Context *context,
+                                           GLsizei numPath,
+                                           GLenum pathNameType,
+                                           const void *paths,
+                                           GLuint pathBase,
+                                           GLenum coverMode,
+                                           GLenum transformType,
+                                           const GLfloat *transformValues)
+{
+    CallCapture call(EntryPoint::CoverFillPathInstancedCHROMIUM);
+    call.addParam(numPath);
+    call.addParam(pathNameType);
+    call.addParam(paths);
+    call.addParam(pathBase);
+    call.addParam(coverMode);
+    call.addParam(transformType);
+    call.addParam(transformValues);
+    WriteCallCapture(call);
+}
+
+void CaptureCoverStrokePathCHROMIUM(const Context *context, GLuint path, GLenum coverMode)
+{
+    CallCapture call(EntryPoint::CoverStrokePathCHROMIUM);
+    call.addParam(path);
+    call.addParam(coverMode);
+    WriteCallCapture(call);
+}
+
+void CaptureCoverStrokePathInstancedCHROMIUM(const Context *context,
+                                             GLsizei numPath,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum coverMode,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues)
+{
+    CallCapture call(EntryPoint::CoverStrokePathInstancedCHROMIUM);
+    call.addParam(numPath);
+    call.addParam(pathNameType);
+    call.addParam(paths);
+    call.addParam(pathBase);
+    call.addParam(coverMode);
+    call.addParam(transformType);
+    call.addParam(transformValues);
+    WriteCallCapture(call);
+}
+
+void CaptureCoverageModulationCHROMIUM(const Context *context, GLenum components)
+{
+    CallCapture call(EntryPoint::CoverageModulationCHROMIUM);
+    call.addParam(components);
+    WriteCallCapture(call);
+}
+
+void CaptureCreateMemoryObjectsEXT(const Context *context, GLsizei n, GLuint *memoryObjects)
+{
+    CallCapture call(EntryPoint::CreateMemoryObjectsEXT);
+    call.addParam(n);
+    call.addParam(memoryObjects);
+    WriteCallCapture(call);
+}
+
+void CaptureCreateProgram(const Context *context)
+{
+    CallCapture call(EntryPoint::CreateProgram);
+    WriteCallCapture(call);
+}
+
+void CaptureCreateShader(const Context *context, GLenum type)
+{
+    CallCapture call(EntryPoint::CreateShader);
+    call.addParam(type);
+    WriteCallCapture(call);
+}
+
+void CaptureCreateShaderProgramv(const Context *context,
+                                 GLenum type,
+                                 GLsizei count,
+                                 const GLchar *const *strings)
+{
+    CallCapture call(EntryPoint::CreateShaderProgramv);
+    call.addParam(type);
+    call.addParam(count);
+    call.addParam(strings);
+    call.addStrings(2, strings, count, nullptr);
+    WriteCallCapture(call);
+}
+
+void CaptureCullFace(const Context *context, GLenum mode)
+{
+    CallCapture call(EntryPoint::CullFace);
+    call.addParam(mode);
+    WriteCallCapture(call);
+}
+
+void CaptureCurrentPaletteMatrixOES(const Context *context, GLuint matrixpaletteindex)
+{
+    CallCapture call(EntryPoint::CurrentPaletteMatrixOES);
+    call.addParam(matrixpaletteindex);
+    WriteCallCapture(call);
+}
+
+void CaptureDebugMessageCallbackKHR(const Context *context,
+                                    GLDEBUGPROCKHR callback,
+                                    const void *userParam)
+{
+    CallCapture call(EntryPoint::DebugMessageCallbackKHR);
+    call.addParam(callback);
+    call.addParam(userParam);
+    WriteCallCapture(call);
+}
+
+void CaptureDebugMessageControlKHR(const Context *context,
+                                   GLenum source,
+                                   GLenum type,
+                                   GLenum severity,
+                                   GLsizei count,
+                                   const GLuint *ids,
+                                   GLboolean enabled)
+{
+    CallCapture call(EntryPoint::DebugMessageControlKHR);
+    call.addParam(source);
+    call.addParam(type);
+    call.addParam(severity);
+    call.addParam(count);
+    call.addParam(ids);
+    call.addParam(enabled);
+    WriteCallCapture(call);
+}
+
+void CaptureDebugMessageInsertKHR(const Context *context,
+                                  GLenum source,
+                                  GLenum type,
+                                  GLuint id,
+                                  GLenum severity,
+                                  GLsizei length,
+                                  const GLchar *buf)
+{
+    CallCapture call(EntryPoint::DebugMessageInsertKHR);
+    call.addParam(source);
+    call.addParam(type);
+    call.addParam(id);
+    call.addParam(severity);
+    call.addParam(length);
+    call.addParam(buf);
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteBuffers(const Context *context, GLsizei n, const GLuint *buffers)
+{
+    CallCapture call(EntryPoint::DeleteBuffers);
+    call.addParam(n);
+    call.addParam(buffers);
+    call.addBlob(1, buffers, static_cast<size_t>(n * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteFencesNV(const Context *context, GLsizei n, const GLuint *fences)
+{
+    CallCapture call(EntryPoint::DeleteFencesNV);
+    call.addParam(n);
+    call.addParam(fences);
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteFramebuffers(const Context *context, GLsizei n, const GLuint *framebuffers)
+{
+    CallCapture call(EntryPoint::DeleteFramebuffers);
+    call.addParam(n);
+    call.addParam(framebuffers);
+    call.addBlob(1, framebuffers, static_cast<size_t>(n * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteFramebuffersOES(const Context *context, GLsizei n, const GLuint *framebuffers)
+{
+    CallCapture call(EntryPoint::DeleteFramebuffersOES);
+    call.addParam(n);
+    call.addParam(framebuffers);
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteMemoryObjectsEXT(const Context *context, GLsizei n, const GLuint *memoryObjects)
+{
+    CallCapture call(EntryPoint::DeleteMemoryObjectsEXT);
+    call.addParam(n);
+    call.addParam(memoryObjects);
+    WriteCallCapture(call);
+}
+
+void CaptureDeletePathsCHROMIUM(const Context *context, GLuint first, GLsizei range)
+{
+    CallCapture call(EntryPoint::DeletePathsCHROMIUM);
+    call.addParam(first);
+    call.addParam(range);
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteProgram(const Context *context, GLuint program)
+{
+    CallCapture call(EntryPoint::DeleteProgram);
+    call.addParam(program);
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteProgramPipelines(const Context *context, GLsizei n, const GLuint *pipelines)
+{
+    CallCapture call(EntryPoint::DeleteProgramPipelines);
+    call.addParam(n);
+    call.addParam(pipelines);
+    call.addBlob(1, pipelines, static_cast<size_t>(n * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteQueries(const Context *context, GLsizei n, const GLuint *ids)
+{
+    CallCapture call(EntryPoint::DeleteQueries);
+    call.addParam(n);
+    call.addParam(ids);
+    call.addBlob(1, ids, static_cast<size_t>(n * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteQueriesEXT(const Context *context, GLsizei n, const GLuint *ids)
+{
+    CallCapture call(EntryPoint::DeleteQueriesEXT);
+    call.addParam(n);
+    call.addParam(ids);
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteRenderbuffers(const Context *context, GLsizei n, const GLuint *renderbuffers)
+{
+    CallCapture call(EntryPoint::DeleteRenderbuffers);
+    call.addParam(n);
+    call.addParam(renderbuffers);
+    call.addBlob(1, renderbuffers, static_cast<size_t>(n * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteRenderbuffersOES(const Context *context, GLsizei n, const GLuint *renderbuffers)
+{
+    CallCapture call(EntryPoint::DeleteRenderbuffersOES);
+    call.addParam(n);
+    call.addParam(renderbuffers);
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteSamplers(const Context *context, GLsizei count, const GLuint *samplers)
+{
+    CallCapture call(EntryPoint::DeleteSamplers);
+    call.addParam(count);
+    call.addParam(samplers);
+    call.addBlob(1, samplers, static_cast<size_t>(count * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteSemaphoresEXT(const Context *context, GLsizei n, const GLuint *semaphores)
+{
+    CallCapture call(EntryPoint::DeleteSemaphoresEXT);
+    call.addParam(n);
+    call.addParam(semaphores);
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteShader(const Context *context, GLuint shader)
+{
+    CallCapture call(EntryPoint::DeleteShader);
+    call.addParam(shader);
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteSync(const Context *context, GLsync sync)
+{
+    CallCapture call(EntryPoint::DeleteSync);
+    call.addParam(sync);
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteTextures(const Context *context, GLsizei n, const GLuint *textures)
+{
+    CallCapture call(EntryPoint::DeleteTextures);
+    call.addParam(n);
+    call.addParam(textures);
+    call.addBlob(1, textures, static_cast<size_t>(n * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteTransformFeedbacks(const Context *context, GLsizei n, const GLuint *ids)
+{
+    CallCapture call(EntryPoint::DeleteTransformFeedbacks);
+    call.addParam(n);
+    call.addParam(ids);
+    call.addBlob(1, ids, static_cast<size_t>(n * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteVertexArrays(const Context *context, GLsizei n, const GLuint *arrays)
+{
+    CallCapture call(EntryPoint::DeleteVertexArrays);
+    call.addParam(n);
+    call.addParam(arrays);
+    call.addBlob(1, arrays, static_cast<size_t>(n * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureDeleteVertexArraysOES(const Context *context, GLsizei n, const GLuint *arrays)
+{
+    CallCapture call(EntryPoint::DeleteVertexArraysOES);
+    call.addParam(n);
+    call.addParam(arrays);
+    WriteCallCapture(call);
+}
+
+void CaptureDepthFunc(const Context *context, GLenum func)
+{
+    CallCapture call(EntryPoint::DepthFunc);
+    call.addParam(func);
+    WriteCallCapture(call);
+}
+
+void CaptureDepthMask(const Context *context, GLboolean flag)
+{
+    CallCapture call(EntryPoint::DepthMask);
+    call.addParam(flag);
+    WriteCallCapture(call);
+}
+
+void CaptureDepthRangef(const Context *context, GLfloat n, GLfloat f)
+{
+    CallCapture call(EntryPoint::DepthRangef);
+    call.addParam(n);
+    call.addParam(f);
+    WriteCallCapture(call);
+}
+
+void CaptureDepthRangex(const Context *context, GLfixed n, GLfixed f)
+{
+    CallCapture call(EntryPoint::DepthRangex);
+    call.addParam(n);
+    call.addParam(f);
+    WriteCallCapture(call);
+}
+
+void CaptureDetachShader(const Context *context, GLuint program, GLuint shader)
+{
+    CallCapture call(EntryPoint::DetachShader);
+    call.addParam(program);
+    call.addParam(shader);
+    WriteCallCapture(call);
+}
+
+void CaptureDisable(const Context *context, GLenum cap)
+{
+    CallCapture call(EntryPoint::Disable);
+    call.addParam(cap);
+    WriteCallCapture(call);
+}
+
+void CaptureDisableClientState(const Context *context, GLenum array)
+{
+    CallCapture call(EntryPoint::DisableClientState);
+    call.addParam(array);
+    WriteCallCapture(call);
+}
+
+void CaptureDisableVertexAttribArray(const Context *context, GLuint index)
+{
+    CallCapture call(EntryPoint::DisableVertexAttribArray);
+    call.addParam(index);
+    WriteCallCapture(call);
+}
+
+void CaptureDiscardFramebufferEXT(const Context *context,
+                                  GLenum target,
+                                  GLsizei numAttachments,
+                                  const GLenum *attachments)
+{
+    CallCapture call(EntryPoint::DiscardFramebufferEXT);
+    call.addParam(target);
+    call.addParam(numAttachments);
+    call.addParam(attachments);
+    WriteCallCapture(call);
+}
+
+void CaptureDispatchCompute(const Context *context,
+                            GLuint num_groups_x,
+                            GLuint num_groups_y,
+                            GLuint num_groups_z)
+{
+    CallCapture call(EntryPoint::DispatchCompute);
+    call.addParam(num_groups_x);
+    call.addParam(num_groups_y);
+    call.addParam(num_groups_z);
+    WriteCallCapture(call);
+}
+
+void CaptureDispatchComputeIndirect(const Context *context, GLintptr indirect)
+{
+    CallCapture call(EntryPoint::DispatchComputeIndirect);
+    call.addParam(indirect);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawArrays(const Context *context, GLenum mode, GLint first, GLsizei count)
+{
+    CallCapture call(EntryPoint::DrawArrays);
+    call.addParam(mode);
+    call.addParam(first);
+    call.addParam(count);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawArraysIndirect(const Context *context, GLenum mode, const void *indirect)
+{
+    CallCapture call(EntryPoint::DrawArraysIndirect);
+    call.addParam(mode);
+    call.addParam(indirect);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawArraysInstanced(const Context *context,
+                                GLenum mode,
+                                GLint first,
+                                GLsizei count,
+                                GLsizei instancecount)
+{
+    CallCapture call(EntryPoint::DrawArraysInstanced);
+    call.addParam(mode);
+    call.addParam(first);
+    call.addParam(count);
+    call.addParam(instancecount);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawArraysInstancedANGLE(const Context *context,
+                                     GLenum mode,
+                                     GLint first,
+                                     GLsizei count,
+                                     GLsizei primcount)
+{
+    CallCapture call(EntryPoint::DrawArraysInstancedANGLE);
+    call.addParam(mode);
+    call.addParam(first);
+    call.addParam(count);
+    call.addParam(primcount);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawArraysInstancedEXT(const Context *context,
+                                   GLenum mode,
+                                   GLint start,
+                                   GLsizei count,
+                                   GLsizei primcount)
+{
+    CallCapture call(EntryPoint::DrawArraysInstancedEXT);
+    call.addParam(mode);
+    call.addParam(start);
+    call.addParam(count);
+    call.addParam(primcount);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawBuffers(const Context *context, GLsizei n, const GLenum *bufs)
+{
+    CallCapture call(EntryPoint::DrawBuffers);
+    call.addParam(n);
+    call.addParam(bufs);
+    call.addBlob(1, bufs, static_cast<size_t>(n * sizeof(GLenum)));
+    WriteCallCapture(call);
+}
+
+void CaptureDrawBuffersEXT(const Context *context, GLsizei n, const GLenum *bufs)
+{
+    CallCapture call(EntryPoint::DrawBuffersEXT);
+    call.addParam(n);
+    call.addParam(bufs);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawElements(const Context *context,
+                         GLenum mode,
+                         GLsizei count,
+                         GLenum type,
+                         const void *indices)
+{
+    CallCapture call(EntryPoint::DrawElements);
+    call.addParam(mode);
+    call.addParam(count);
+    call.addParam(type);
+    call.addParam(indices);
+    call.addBlob(3, indices, static_cast<size_t>(GetCaptureIndicesSize(context, count, type)));
+    WriteCallCapture(call);
+}
+
+void CaptureDrawElementsIndirect(const Context *context,
+                                 GLenum mode,
+                                 GLenum type,
+                                 const void *indirect)
+{
+    CallCapture call(EntryPoint::DrawElementsIndirect);
+    call.addParam(mode);
+    call.addParam(type);
+    call.addParam(indirect);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawElementsInstanced(const Context *context,
+                                  GLenum mode,
+                                  GLsizei count,
+                                  GLenum type,
+                                  const void *indices,
+                                  GLsizei instancecount)
+{
+    CallCapture call(EntryPoint::DrawElementsInstanced);
+    call.addParam(mode);
+    call.addParam(count);
+    call.addParam(type);
+    call.addParam(indices);
+    call.addParam(instancecount);
+    call.addBlob(3, indices, static_cast<size_t>(GetCaptureIndicesSize(context, count, type)));
+    WriteCallCapture(call);
+}
+
+void CaptureDrawElementsInstancedANGLE(const Context *context,
+                                       GLenum mode,
+                                       GLsizei count,
+                                       GLenum type,
+                                       const void *indices,
+                                       GLsizei primcount)
+{
+    CallCapture call(EntryPoint::DrawElementsInstancedANGLE);
+    call.addParam(mode);
+    call.addParam(count);
+    call.addParam(type);
+    call.addParam(indices);
+    call.addParam(primcount);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawElementsInstancedEXT(const Context *context,
+                                     GLenum mode,
+                                     GLsizei count,
+                                     GLenum type,
+                                     const void *indices,
+                                     GLsizei primcount)
+{
+    CallCapture call(EntryPoint::DrawElementsInstancedEXT);
+    call.addParam(mode);
+    call.addParam(count);
+    call.addParam(type);
+    call.addParam(indices);
+    call.addParam(primcount);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawRangeElements(const Context *context,
+                              GLenum mode,
+                              GLuint start,
+                              GLuint end,
+                              GLsizei count,
+                              GLenum type,
+                              const void *indices)
+{
+    CallCapture call(EntryPoint::DrawRangeElements);
+    call.addParam(mode);
+    call.addParam(start);
+    call.addParam(end);
+    call.addParam(count);
+    call.addParam(type);
+    call.addParam(indices);
+    call.addBlob(5, indices, static_cast<size_t>(GetCaptureIndicesSize(context, count, type)));
+    WriteCallCapture(call);
+}
+
+void CaptureDrawTexfOES(const Context *context,
+                        GLfloat x,
+                        GLfloat y,
+                        GLfloat z,
+                        GLfloat width,
+                        GLfloat height)
+{
+    CallCapture call(EntryPoint::DrawTexfOES);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawTexfvOES(const Context *context, const GLfloat *coords)
+{
+    CallCapture call(EntryPoint::DrawTexfvOES);
+    call.addParam(coords);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawTexiOES(const Context *context,
+                        GLint x,
+                        GLint y,
+                        GLint z,
+                        GLint width,
+                        GLint height)
+{
+    CallCapture call(EntryPoint::DrawTexiOES);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawTexivOES(const Context *context, const GLint *coords)
+{
+    CallCapture call(EntryPoint::DrawTexivOES);
+    call.addParam(coords);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawTexsOES(const Context *context,
+                        GLshort x,
+                        GLshort y,
+                        GLshort z,
+                        GLshort width,
+                        GLshort height)
+{
+    CallCapture call(EntryPoint::DrawTexsOES);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawTexsvOES(const Context *context, const GLshort *coords)
+{
+    CallCapture call(EntryPoint::DrawTexsvOES);
+    call.addParam(coords);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawTexxOES(const Context *context,
+                        GLfixed x,
+                        GLfixed y,
+                        GLfixed z,
+                        GLfixed width,
+                        GLfixed height)
+{
+    CallCapture call(EntryPoint::DrawTexxOES);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureDrawTexxvOES(const Context *context, const GLfixed *coords)
+{
+    CallCapture call(EntryPoint::DrawTexxvOES);
+    call.addParam(coords);
+    WriteCallCapture(call);
+}
+
+void CaptureEGLImageTargetRenderbufferStorageOES(const Context *context,
+                                                 GLenum target,
+                                                 GLeglImageOES image)
+{
+    CallCapture call(EntryPoint::EGLImageTargetRenderbufferStorageOES);
+    call.addParam(target);
+    call.addParam(image);
+    WriteCallCapture(call);
+}
+
+void CaptureEGLImageTargetTexture2DOES(const Context *context, GLenum target, GLeglImageOES image)
+{
+    CallCapture call(EntryPoint::EGLImageTargetTexture2DOES);
+    call.addParam(target);
+    call.addParam(image);
+    WriteCallCapture(call);
+}
+
+void CaptureEnable(const Context *context, GLenum cap)
+{
+    CallCapture call(EntryPoint::Enable);
+    call.addParam(cap);
+    WriteCallCapture(call);
+}
+
+void CaptureEnableClientState(const Context *context, GLenum array)
+{
+    CallCapture call(EntryPoint::EnableClientState);
+    call.addParam(array);
+    WriteCallCapture(call);
+}
+
+void CaptureEnableVertexAttribArray(const Context *context, GLuint index)
+{
+    CallCapture call(EntryPoint::EnableVertexAttribArray);
+    call.addParam(index);
+    WriteCallCapture(call);
+}
+
+void CaptureEndQuery(const Context *context, GLenum target)
+{
+    CallCapture call(EntryPoint::EndQuery);
+    call.addParam(target);
+    WriteCallCapture(call);
+}
+
+void CaptureEndQueryEXT(const Context *context, GLenum target)
+{
+    CallCapture call(EntryPoint::EndQueryEXT);
+    call.addParam(target);
+    WriteCallCapture(call);
+}
+
+void CaptureEndTransformFeedback(const Context *context)
+{
+    CallCapture call(EntryPoint::EndTransformFeedback);
+    WriteCallCapture(call);
+}
+
+void CaptureFenceSync(const Context *context, GLenum condition, GLbitfield flags)
+{
+    CallCapture call(EntryPoint::FenceSync);
+    call.addParam(condition);
+    call.addParam(flags);
+    WriteCallCapture(call);
+}
+
+void CaptureFinish(const Context *context)
+{
+    CallCapture call(EntryPoint::Finish);
+    WriteCallCapture(call);
+}
+
+void CaptureFinishFenceNV(const Context *context, GLuint fence)
+{
+    CallCapture call(EntryPoint::FinishFenceNV);
+    call.addParam(fence);
+    WriteCallCapture(call);
+}
+
+void CaptureFlush(const Context *context)
+{
+    CallCapture call(EntryPoint::Flush);
+    WriteCallCapture(call);
+}
+
+void CaptureFlushMappedBufferRange(const Context *context,
+                                   GLenum target,
+                                   GLintptr offset,
+                                   GLsizeiptr length)
+{
+    CallCapture call(EntryPoint::FlushMappedBufferRange);
+    call.addParam(target);
+    call.addParam(offset);
+    call.addParam(length);
+    WriteCallCapture(call);
+}
+
+void CaptureFlushMappedBufferRangeEXT(const Context *context,
+                                      GLenum target,
+                                      GLintptr offset,
+                                      GLsizeiptr length)
+{
+    CallCapture call(EntryPoint::FlushMappedBufferRangeEXT);
+    call.addParam(target);
+    call.addParam(offset);
+    call.addParam(length);
+    WriteCallCapture(call);
+}
+
+void CaptureFogf(const Context *context, GLenum pname, GLfloat param)
+{
+    CallCapture call(EntryPoint::Fogf);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureFogfv(const Context *context, GLenum pname, const GLfloat *params)
+{
+    CallCapture call(EntryPoint::Fogfv);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureFogx(const Context *context, GLenum pname, GLfixed param)
+{
+    CallCapture call(EntryPoint::Fogx);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureFogxv(const Context *context, GLenum pname, const GLfixed *param)
+{
+    CallCapture call(EntryPoint::Fogxv);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureFramebufferParameteri(const Context *context, GLenum target, GLenum pname, GLint param)
+{
+    CallCapture call(EntryPoint::FramebufferParameteri);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureFramebufferRenderbuffer(const Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLenum renderbuffertarget,
+                                    GLuint renderbuffer)
+{
+    CallCapture call(EntryPoint::FramebufferRenderbuffer);
+    call.addParam(target);
+    call.addParam(attachment);
+    call.addParam(renderbuffertarget);
+    call.addParam(renderbuffer);
+    WriteCallCapture(call);
+}
+
+void CaptureFramebufferRenderbufferOES(const Context *context,
+                                       GLenum target,
+                                       GLenum attachment,
+                                       GLenum renderbuffertarget,
+                                       GLuint renderbuffer)
+{
+    CallCapture call(EntryPoint::FramebufferRenderbufferOES);
+    call.addParam(target);
+    call.addParam(attachment);
+    call.addParam(renderbuffertarget);
+    call.addParam(renderbuffer);
+    WriteCallCapture(call);
+}
+
+void CaptureFramebufferTexture2D(const Context *context,
+                                 GLenum target,
+                                 GLenum attachment,
+                                 GLenum textarget,
+                                 GLuint texture,
+                                 GLint level)
+{
+    CallCapture call(EntryPoint::FramebufferTexture2D);
+    call.addParam(target);
+    call.addParam(attachment);
+    call.addParam(textarget);
+    call.addParam(texture);
+    call.addParam(level);
+    WriteCallCapture(call);
+}
+
+void CaptureFramebufferTexture2DOES(const Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLenum textarget,
+                                    GLuint texture,
+                                    GLint level)
+{
+    CallCapture call(EntryPoint::FramebufferTexture2DOES);
+    call.addParam(target);
+    call.addParam(attachment);
+    call.addParam(textarget);
+    call.addParam(texture);
+    call.addParam(level);
+    WriteCallCapture(call);
+}
+
+void CaptureFramebufferTextureEXT(const Context *context,
+                                  GLenum target,
+                                  GLenum attachment,
+                                  GLuint texture,
+                                  GLint level)
+{
+    CallCapture call(EntryPoint::FramebufferTextureEXT);
+    call.addParam(target);
+    call.addParam(attachment);
+    call.addParam(texture);
+    call.addParam(level);
+    WriteCallCapture(call);
+}
+
+void CaptureFramebufferTextureLayer(const Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLuint texture,
+                                    GLint level,
+                                    GLint layer)
+{
+    CallCapture call(EntryPoint::FramebufferTextureLayer);
+    call.addParam(target);
+    call.addParam(attachment);
+    call.addParam(texture);
+    call.addParam(level);
+    call.addParam(layer);
+    WriteCallCapture(call);
+}
+
+void CaptureFramebufferTextureMultiviewOVR(const Context *context,
+                                           GLenum target,
+                                           GLenum attachment,
+                                           GLuint texture,
+                                           GLint level,
+                                           GLint baseViewIndex,
+                                           GLsizei numViews)
+{
+    CallCapture call(EntryPoint::FramebufferTextureMultiviewOVR);
+    call.addParam(target);
+    call.addParam(attachment);
+    call.addParam(texture);
+    call.addParam(level);
+    call.addParam(baseViewIndex);
+    call.addParam(numViews);
+    WriteCallCapture(call);
+}
+
+void CaptureFrontFace(const Context *context, GLenum mode)
+{
+    CallCapture call(EntryPoint::FrontFace);
+    call.addParam(mode);
+    WriteCallCapture(call);
+}
+
+void CaptureFrustumf(const Context *context,
+                     GLfloat l,
+                     GLfloat r,
+                     GLfloat b,
+                     GLfloat t,
+                     GLfloat n,
+                     GLfloat f)
+{
+    CallCapture call(EntryPoint::Frustumf);
+    call.addParam(l);
+    call.addParam(r);
+    call.addParam(b);
+    call.addParam(t);
+    call.addParam(n);
+    call.addParam(f);
+    WriteCallCapture(call);
+}
+
+void CaptureFrustumx(const Context *context,
+                     GLfixed l,
+                     GLfixed r,
+                     GLfixed b,
+                     GLfixed t,
+                     GLfixed n,
+                     GLfixed f)
+{
+    CallCapture call(EntryPoint::Frustumx);
+    call.addParam(l);
+    call.addParam(r);
+    call.addParam(b);
+    call.addParam(t);
+    call.addParam(n);
+    call.addParam(f);
+    WriteCallCapture(call);
+}
+
+void CaptureGenBuffers(const Context *context, GLsizei n, GLuint *buffers)
+{
+    CallCapture call(EntryPoint::GenBuffers);
+    call.addParam(n);
+    call.addParam(buffers);
+    WriteCallCapture(call);
+}
+
+void CaptureGenFencesNV(const Context *context, GLsizei n, GLuint *fences)
+{
+    CallCapture call(EntryPoint::GenFencesNV);
+    call.addParam(n);
+    call.addParam(fences);
+    WriteCallCapture(call);
+}
+
+void CaptureGenFramebuffers(const Context *context, GLsizei n, GLuint *framebuffers)
+{
+    CallCapture call(EntryPoint::GenFramebuffers);
+    call.addParam(n);
+    call.addParam(framebuffers);
+    WriteCallCapture(call);
+}
+
+void CaptureGenFramebuffersOES(const Context *context, GLsizei n, GLuint *framebuffers)
+{
+    CallCapture call(EntryPoint::GenFramebuffersOES);
+    call.addParam(n);
+    call.addParam(framebuffers);
+    WriteCallCapture(call);
+}
+
+void CaptureGenPathsCHROMIUM(const Context *context, GLsizei range)
+{
+    CallCapture call(EntryPoint::GenPathsCHROMIUM);
+    call.addParam(range);
+    WriteCallCapture(call);
+}
+
+void CaptureGenProgramPipelines(const Context *context, GLsizei n, GLuint *pipelines)
+{
+    CallCapture call(EntryPoint::GenProgramPipelines);
+    call.addParam(n);
+    call.addParam(pipelines);
+    WriteCallCapture(call);
+}
+
+void CaptureGenQueries(const Context *context, GLsizei n, GLuint *ids)
+{
+    CallCapture call(EntryPoint::GenQueries);
+    call.addParam(n);
+    call.addParam(ids);
+    WriteCallCapture(call);
+}
+
+void CaptureGenQueriesEXT(const Context *context, GLsizei n, GLuint *ids)
+{
+    CallCapture call(EntryPoint::GenQueriesEXT);
+    call.addParam(n);
+    call.addParam(ids);
+    WriteCallCapture(call);
+}
+
+void CaptureGenRenderbuffers(const Context *context, GLsizei n, GLuint *renderbuffers)
+{
+    CallCapture call(EntryPoint::GenRenderbuffers);
+    call.addParam(n);
+    call.addParam(renderbuffers);
+    WriteCallCapture(call);
+}
+
+void CaptureGenRenderbuffersOES(const Context *context, GLsizei n, GLuint *renderbuffers)
+{
+    CallCapture call(EntryPoint::GenRenderbuffersOES);
+    call.addParam(n);
+    call.addParam(renderbuffers);
+    WriteCallCapture(call);
+}
+
+void CaptureGenSamplers(const Context *context, GLsizei count, GLuint *samplers)
+{
+    CallCapture call(EntryPoint::GenSamplers);
+    call.addParam(count);
+    call.addParam(samplers);
+    WriteCallCapture(call);
+}
+
+void CaptureGenSemaphoresEXT(const Context *context, GLsizei n, GLuint *semaphores)
+{
+    CallCapture call(EntryPoint::GenSemaphoresEXT);
+    call.addParam(n);
+    call.addParam(semaphores);
+    WriteCallCapture(call);
+}
+
+void CaptureGenTextures(const Context *context, GLsizei n, GLuint *textures)
+{
+    CallCapture call(EntryPoint::GenTextures);
+    call.addParam(n);
+    call.addParam(textures);
+    WriteCallCapture(call);
+}
+
+void CaptureGenTransformFeedbacks(const Context *context, GLsizei n, GLuint *ids)
+{
+    CallCapture call(EntryPoint::GenTransformFeedbacks);
+    call.addParam(n);
+    call.addParam(ids);
+    WriteCallCapture(call);
+}
+
+void CaptureGenVertexArrays(const Context *context, GLsizei n, GLuint *arrays)
+{
+    CallCapture call(EntryPoint::GenVertexArrays);
+    call.addParam(n);
+    call.addParam(arrays);
+    WriteCallCapture(call);
+}
+
+void CaptureGenVertexArraysOES(const Context *context, GLsizei n, GLuint *arrays)
+{
+    CallCapture call(EntryPoint::GenVertexArraysOES);
+    call.addParam(n);
+    call.addParam(arrays);
+    WriteCallCapture(call);
+}
+
+void CaptureGenerateMipmap(const Context *context, GLenum target)
+{
+    CallCapture call(EntryPoint::GenerateMipmap);
+    call.addParam(target);
+    WriteCallCapture(call);
+}
+
+void CaptureGenerateMipmapOES(const Context *context, GLenum target)
+{
+    CallCapture call(EntryPoint::GenerateMipmapOES);
+    call.addParam(target);
+    WriteCallCapture(call);
+}
+
+void CaptureGetActiveAttrib(const Context *context,
+                            GLuint program,
+                            GLuint index,
+                            GLsizei bufSize,
+                            GLsizei *length,
+                            GLint *size,
+                            GLenum *type,
+                            GLchar *name)
+{
+    CallCapture call(EntryPoint::GetActiveAttrib);
+    call.addParam(program);
+    call.addParam(index);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(size);
+    call.addParam(type);
+    call.addParam(name);
+    WriteCallCapture(call);
+}
+
+void CaptureGetActiveUniform(const Context *context,
+                             GLuint program,
+                             GLuint index,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLint *size,
+                             GLenum *type,
+                             GLchar *name)
+{
+    CallCapture call(EntryPoint::GetActiveUniform);
+    call.addParam(program);
+    call.addParam(index);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(size);
+    call.addParam(type);
+    call.addParam(name);
+    WriteCallCapture(call);
+}
+
+void CaptureGetActiveUniformBlockName(const Context *context,
+                                      GLuint program,
+                                      GLuint uniformBlockIndex,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLchar *uniformBlockName)
+{
+    CallCapture call(EntryPoint::GetActiveUniformBlockName);
+    call.addParam(program);
+    call.addParam(uniformBlockIndex);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(uniformBlockName);
+    WriteCallCapture(call);
+}
+
+void CaptureGetActiveUniformBlockiv(const Context *context,
+                                    GLuint program,
+                                    GLuint uniformBlockIndex,
+                                    GLenum pname,
+                                    GLint *params)
+{
+    CallCapture call(EntryPoint::GetActiveUniformBlockiv);
+    call.addParam(program);
+    call.addParam(uniformBlockIndex);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetActiveUniformBlockivRobustANGLE(const Context *context,
+                                               GLuint program,
+                                               GLuint uniformBlockIndex,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLint *params)
+{
+    CallCapture call(EntryPoint::GetActiveUniformBlockivRobustANGLE);
+    call.addParam(program);
+    call.addParam(uniformBlockIndex);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetActiveUniformsiv(const Context *context,
+                                GLuint program,
+                                GLsizei uniformCount,
+                                const GLuint *uniformIndices,
+                                GLenum pname,
+                                GLint *params)
+{
+    CallCapture call(EntryPoint::GetActiveUniformsiv);
+    call.addParam(program);
+    call.addParam(uniformCount);
+    call.addParam(uniformIndices);
+    call.addParam(pname);
+    call.addParam(params);
+    call.addBlob(2, uniformIndices, static_cast<size_t>(uniformCount * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureGetAttachedShaders(const Context *context,
+                               GLuint program,
+                               GLsizei maxCount,
+                               GLsizei *count,
+                               GLuint *shaders)
+{
+    CallCapture call(EntryPoint::GetAttachedShaders);
+    call.addParam(program);
+    call.addParam(maxCount);
+    call.addParam(count);
+    call.addParam(shaders);
+    WriteCallCapture(call);
+}
+
+void CaptureGetAttribLocation(const Context *context, GLuint program, const GLchar *name)
+{
+    CallCapture call(EntryPoint::GetAttribLocation);
+    call.addParam(program);
+    call.addParam(name);
+    call.addBlob(1, name, static_cast<size_t>(GetCaptureStringSize(name)));
+    WriteCallCapture(call);
+}
+
+void CaptureGetBooleani_v(const Context *context, GLenum target, GLuint index, GLboolean *data)
+{
+    CallCapture call(EntryPoint::GetBooleani_v);
+    call.addParam(target);
+    call.addParam(index);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetBooleani_vRobustANGLE(const Context *context,
+                                     GLenum target,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLboolean *data)
+{
+    CallCapture call(EntryPoint::GetBooleani_vRobustANGLE);
+    call.addParam(target);
+    call.addParam(index);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetBooleanv(const Context *context, GLenum pname, GLboolean *data)
+{
+    CallCapture call(EntryPoint::GetBooleanv);
+    call.addParam(pname);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetBooleanvRobustANGLE(const Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLboolean *params)
+{
+    CallCapture call(EntryPoint::GetBooleanvRobustANGLE);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetBufferParameteri64v(const Context *context,
+                                   GLenum target,
+                                   GLenum pname,
+                                   GLint64 *params)
+{
+    CallCapture call(EntryPoint::GetBufferParameteri64v);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetBufferParameteri64vRobustANGLE(const Context *context,
+                                              GLenum target,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint64 *params)
+{
+    CallCapture call(EntryPoint::GetBufferParameteri64vRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetBufferParameteriv(const Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    CallCapture call(EntryPoint::GetBufferParameteriv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetBufferParameterivRobustANGLE(const Context *context,
+                                            GLenum target,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            GLsizei *length,
+                                            GLint *params)
+{
+    CallCapture call(EntryPoint::GetBufferParameterivRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetBufferPointerv(const Context *context, GLenum target, GLenum pname, void **params)
+{
+    CallCapture call(EntryPoint::GetBufferPointerv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetBufferPointervOES(const Context *context, GLenum target, GLenum pname, void **params)
+{
+    CallCapture call(EntryPoint::GetBufferPointervOES);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetBufferPointervRobustANGLE(const Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         void **params)
+{
+    CallCapture call(EntryPoint::GetBufferPointervRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetClipPlanef(const Context *context, GLenum plane, GLfloat *equation)
+{
+    CallCapture call(EntryPoint::GetClipPlanef);
+    call.addParam(plane);
+    call.addParam(equation);
+    WriteCallCapture(call);
+}
+
+void CaptureGetClipPlanex(const Context *context, GLenum plane, GLfixed *equation)
+{
+    CallCapture call(EntryPoint::GetClipPlanex);
+    call.addParam(plane);
+    call.addParam(equation);
+    WriteCallCapture(call);
+}
+
+void CaptureGetDebugMessageLogKHR(const Context *context,
+                                  GLuint count,
+                                  GLsizei bufSize,
+                                  GLenum *sources,
+                                  GLenum *types,
+                                  GLuint *ids,
+                                  GLenum *severities,
+                                  GLsizei *lengths,
+                                  GLchar *messageLog)
+{
+    CallCapture call(EntryPoint::GetDebugMessageLogKHR);
+    call.addParam(count);
+    call.addParam(bufSize);
+    call.addParam(sources);
+    call.addParam(types);
+    call.addParam(ids);
+    call.addParam(severities);
+    call.addParam(lengths);
+    call.addParam(messageLog);
+    WriteCallCapture(call);
+}
+
+void CaptureGetError(const Context *context)
+{
+    CallCapture call(EntryPoint::GetError);
+    WriteCallCapture(call);
+}
+
+void CaptureGetFenceivNV(const Context *context, GLuint fence, GLenum pname, GLint *params)
+{
+    CallCapture call(EntryPoint::GetFenceivNV);
+    call.addParam(fence);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetFixedv(const Context *context, GLenum pname, GLfixed *params)
+{
+    CallCapture call(EntryPoint::GetFixedv);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetFloatv(const Context *context, GLenum pname, GLfloat *data)
+{
+    CallCapture call(EntryPoint::GetFloatv);
+    call.addParam(pname);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetFloatvRobustANGLE(const Context *context,
+                                 GLenum pname,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetFloatvRobustANGLE);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetFragDataIndexEXT(const Context *context, GLuint program, const GLchar *name)
+{
+    CallCapture call(EntryPoint::GetFragDataIndexEXT);
+    call.addParam(program);
+    call.addParam(name);
+    WriteCallCapture(call);
+}
+
+void CaptureGetFragDataLocation(const Context *context, GLuint program, const GLchar *name)
+{
+    CallCapture call(EntryPoint::GetFragDataLocation);
+    call.addParam(program);
+    call.addParam(name);
+    call.addBlob(1, name, static_cast<size_t>(GetCaptureStringSize(name)));
+    WriteCallCapture(call);
+}
+
+void CaptureGetFramebufferAttachmentParameteriv(const Context *context,
+                                                GLenum target,
+                                                GLenum attachment,
+                                                GLenum pname,
+                                                GLint *params)
+{
+    CallCapture call(EntryPoint::GetFramebufferAttachmentParameteriv);
+    call.addParam(target);
+    call.addParam(attachment);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetFramebufferAttachmentParameterivOES(const Context *context,
+                                                   GLenum target,
+                                                   GLenum attachment,
+                                                   GLenum pname,
+                                                   GLint *params)
+{
+    CallCapture call(EntryPoint::GetFramebufferAttachmentParameterivOES);
+    call.addParam(target);
+    call.addParam(attachment);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetFramebufferAttachmentParameterivRobustANGLE(const Context *context,
+                                                           GLenum target,
+                                                           GLenum attachment,
+                                                           GLenum pname,
+                                                           GLsizei bufSize,
+                                                           GLsizei *length,
+                                                           GLint *params)
+{
+    CallCapture call(EntryPoint::GetFramebufferAttachmentParameterivRobustANGLE);
+    call.addParam(target);
+    call.addParam(attachment);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetFramebufferParameteriv(const Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLint *params)
+{
+    CallCapture call(EntryPoint::GetFramebufferParameteriv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetFramebufferParameterivRobustANGLE(const Context *context,
+                                                 GLuint sampler,
+                                                 GLenum pname,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLint *params)
+{
+    CallCapture call(EntryPoint::GetFramebufferParameterivRobustANGLE);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetGraphicsResetStatusEXT(const Context *context)
+{
+    CallCapture call(EntryPoint::GetGraphicsResetStatusEXT);
+    WriteCallCapture(call);
+}
+
+void CaptureGetInteger64i_v(const Context *context, GLenum target, GLuint index, GLint64 *data)
+{
+    CallCapture call(EntryPoint::GetInteger64i_v);
+    call.addParam(target);
+    call.addParam(index);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetInteger64i_vRobustANGLE(const Context *context,
+                                       GLenum target,
+                                       GLuint index,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLint64 *data)
+{
+    CallCapture call(EntryPoint::GetInteger64i_vRobustANGLE);
+    call.addParam(target);
+    call.addParam(index);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetInteger64v(const Context *context, GLenum pname, GLint64 *data)
+{
+    CallCapture call(EntryPoint::GetInteger64v);
+    call.addParam(pname);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetInteger64vRobustANGLE(const Context *context,
+                                     GLenum pname,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint64 *data)
+{
+    CallCapture call(EntryPoint::GetInteger64vRobustANGLE);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetIntegeri_v(const Context *context, GLenum target, GLuint index, GLint *data)
+{
+    CallCapture call(EntryPoint::GetIntegeri_v);
+    call.addParam(target);
+    call.addParam(index);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetIntegeri_vRobustANGLE(const Context *context,
+                                     GLenum target,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *data)
+{
+    CallCapture call(EntryPoint::GetIntegeri_vRobustANGLE);
+    call.addParam(target);
+    call.addParam(index);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetIntegerv(const Context *context, GLenum pname, GLint *data)
+{
+    CallCapture call(EntryPoint::GetIntegerv);
+    call.addParam(pname);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetIntegervRobustANGLE(const Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *data)
+{
+    CallCapture call(EntryPoint::GetIntegervRobustANGLE);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetInternalformativ(const Context *context,
+                                GLenum target,
+                                GLenum internalformat,
+                                GLenum pname,
+                                GLsizei bufSize,
+                                GLint *params)
+{
+    CallCapture call(EntryPoint::GetInternalformativ);
+    call.addParam(target);
+    call.addParam(internalformat);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetInternalformativRobustANGLE(const Context *context,
+                                           GLenum target,
+                                           GLenum internalformat,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLint *params)
+{
+    CallCapture call(EntryPoint::GetInternalformativRobustANGLE);
+    call.addParam(target);
+    call.addParam(internalformat);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetLightfv(const Context *context, GLenum light, GLenum pname, GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetLightfv);
+    call.addParam(light);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetLightxv(const Context *context, GLenum light, GLenum pname, GLfixed *params)
+{
+    CallCapture call(EntryPoint::GetLightxv);
+    call.addParam(light);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetMaterialfv(const Context *context, GLenum face, GLenum pname, GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetMaterialfv);
+    call.addParam(face);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetMaterialxv(const Context *context, GLenum face, GLenum pname, GLfixed *params)
+{
+    CallCapture call(EntryPoint::GetMaterialxv);
+    call.addParam(face);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetMemoryObjectParameterivEXT(const Context *context,
+                                          GLuint memoryObject,
+                                          GLenum pname,
+                                          GLint *params)
+{
+    CallCapture call(EntryPoint::GetMemoryObjectParameterivEXT);
+    call.addParam(memoryObject);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetMultisamplefv(const Context *context, GLenum pname, GLuint index, GLfloat *val)
+{
+    CallCapture call(EntryPoint::GetMultisamplefv);
+    call.addParam(pname);
+    call.addParam(index);
+    call.addParam(val);
+    WriteCallCapture(call);
+}
+
+void CaptureGetMultisamplefvANGLE(const Context *context, GLenum pname, GLuint index, GLfloat *val)
+{
+    CallCapture call(EntryPoint::GetMultisamplefvANGLE);
+    call.addParam(pname);
+    call.addParam(index);
+    call.addParam(val);
+    WriteCallCapture(call);
+}
+
+void CaptureGetMultisamplefvRobustANGLE(const Context *context,
+                                        GLenum pname,
+                                        GLuint index,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLfloat *val)
+{
+    CallCapture call(EntryPoint::GetMultisamplefvRobustANGLE);
+    call.addParam(pname);
+    call.addParam(index);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(val);
+    WriteCallCapture(call);
+}
+
+void CaptureGetObjectLabelKHR(const Context *context,
+                              GLenum identifier,
+                              GLuint name,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *label)
+{
+    CallCapture call(EntryPoint::GetObjectLabelKHR);
+    call.addParam(identifier);
+    call.addParam(name);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(label);
+    WriteCallCapture(call);
+}
+
+void CaptureGetObjectPtrLabelKHR(const Context *context,
+                                 const void *ptr,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLchar *label)
+{
+    CallCapture call(EntryPoint::GetObjectPtrLabelKHR);
+    call.addParam(ptr);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(label);
+    WriteCallCapture(call);
+}
+
+void CaptureGetPathParameterfvCHROMIUM(const Context *context,
+                                       GLuint path,
+                                       GLenum pname,
+                                       GLfloat *value)
+{
+    CallCapture call(EntryPoint::GetPathParameterfvCHROMIUM);
+    call.addParam(path);
+    call.addParam(pname);
+    call.addParam(value);
+    WriteCallCapture(call);
+}
+
+void CaptureGetPathParameterivCHROMIUM(const Context *context,
+                                       GLuint path,
+                                       GLenum pname,
+                                       GLint *value)
+{
+    CallCapture call(EntryPoint::GetPathParameterivCHROMIUM);
+    call.addParam(path);
+    call.addParam(pname);
+    call.addParam(value);
+    WriteCallCapture(call);
+}
+
+void CaptureGetPointerv(const Context *context, GLenum pname, void **params)
+{
+    CallCapture call(EntryPoint::GetPointerv);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetPointervKHR(const Context *context, GLenum pname, void **params)
+{
+    CallCapture call(EntryPoint::GetPointervKHR);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetPointervRobustANGLERobustANGLE(const Context *context,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              void **params)
+{
+    CallCapture call(EntryPoint::GetPointervRobustANGLERobustANGLE);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramBinary(const Context *context,
+                             GLuint program,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLenum *binaryFormat,
+                             void *binary)
+{
+    CallCapture call(EntryPoint::GetProgramBinary);
+    call.addParam(program);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(binaryFormat);
+    call.addParam(binary);
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramBinaryOES(const Context *context,
+                                GLuint program,
+                                GLsizei bufSize,
+                                GLsizei *length,
+                                GLenum *binaryFormat,
+                                void *binary)
+{
+    CallCapture call(EntryPoint::GetProgramBinaryOES);
+    call.addParam(program);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(binaryFormat);
+    call.addParam(binary);
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramInfoLog(const Context *context,
+                              GLuint program,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *infoLog)
+{
+    CallCapture call(EntryPoint::GetProgramInfoLog);
+    call.addParam(program);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(infoLog);
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramInterfaceiv(const Context *context,
+                                  GLuint program,
+                                  GLenum programInterface,
+                                  GLenum pname,
+                                  GLint *params)
+{
+    CallCapture call(EntryPoint::GetProgramInterfaceiv);
+    call.addParam(program);
+    call.addParam(programInterface);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramInterfaceivRobustANGLE(const Context *context,
+                                             GLuint program,
+                                             GLenum programInterface,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params)
+{
+    CallCapture call(EntryPoint::GetProgramInterfaceivRobustANGLE);
+    call.addParam(program);
+    call.addParam(programInterface);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramPipelineInfoLog(const Context *context,
+                                      GLuint pipeline,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLchar *infoLog)
+{
+    CallCapture call(EntryPoint::GetProgramPipelineInfoLog);
+    call.addParam(pipeline);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(infoLog);
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramPipelineiv(const Context *context,
+                                 GLuint pipeline,
+                                 GLenum pname,
+                                 GLint *params)
+{
+    CallCapture call(EntryPoint::GetProgramPipelineiv);
+    call.addParam(pipeline);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramResourceIndex(const Context *context,
+                                    GLuint program,
+                                    GLenum programInterface,
+                                    const GLchar *name)
+{
+    CallCapture call(EntryPoint::GetProgramResourceIndex);
+    call.addParam(program);
+    call.addParam(programInterface);
+    call.addParam(name);
+    call.addBlob(2, name, static_cast<size_t>(GetCaptureStringSize(name)));
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramResourceLocation(const Context *context,
+                                       GLuint program,
+                                       GLenum programInterface,
+                                       const GLchar *name)
+{
+    CallCapture call(EntryPoint::GetProgramResourceLocation);
+    call.addParam(program);
+    call.addParam(programInterface);
+    call.addParam(name);
+    call.addBlob(2, name, static_cast<size_t>(GetCaptureStringSize(name)));
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramResourceLocationIndexEXT(const Context *context,
+                                               GLuint program,
+                                               GLenum programInterface,
+                                               const GLchar *name)
+{
+    CallCapture call(EntryPoint::GetProgramResourceLocationIndexEXT);
+    call.addParam(program);
+    call.addParam(programInterface);
+    call.addParam(name);
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramResourceName(const Context *context,
+                                   GLuint program,
+                                   GLenum programInterface,
+                                   GLuint index,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLchar *name)
+{
+    CallCapture call(EntryPoint::GetProgramResourceName);
+    call.addParam(program);
+    call.addParam(programInterface);
+    call.addParam(index);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(name);
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramResourceiv(const Context *context,
+                                 GLuint program,
+                                 GLenum programInterface,
+                                 GLuint index,
+                                 GLsizei propCount,
+                                 const GLenum *props,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLint *params)
+{
+    CallCapture call(EntryPoint::GetProgramResourceiv);
+    call.addParam(program);
+    call.addParam(programInterface);
+    call.addParam(index);
+    call.addParam(propCount);
+    call.addParam(props);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    call.addBlob(4, props, static_cast<size_t>(propCount * sizeof(GLenum)));
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramiv(const Context *context, GLuint program, GLenum pname, GLint *params)
+{
+    CallCapture call(EntryPoint::GetProgramiv);
+    call.addParam(program);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetProgramivRobustANGLE(const Context *context,
+                                    GLuint program,
+                                    GLenum pname,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params)
+{
+    CallCapture call(EntryPoint::GetProgramivRobustANGLE);
+    call.addParam(program);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetQueryObjecti64vEXT(const Context *context, GLuint id, GLenum pname, GLint64 *params)
+{
+    CallCapture call(EntryPoint::GetQueryObjecti64vEXT);
+    call.addParam(id);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetQueryObjecti64vRobustANGLE(const Context *context,
+                                          GLuint id,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint64 *params)
+{
+    CallCapture call(EntryPoint::GetQueryObjecti64vRobustANGLE);
+    call.addParam(id);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetQueryObjectivEXT(const Context *context, GLuint id, GLenum pname, GLint *params)
+{
+    CallCapture call(EntryPoint::GetQueryObjectivEXT);
+    call.addParam(id);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetQueryObjectivRobustANGLE(const Context *context,
+                                        GLuint id,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLint *params)
+{
+    CallCapture call(EntryPoint::GetQueryObjectivRobustANGLE);
+    call.addParam(id);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetQueryObjectui64vEXT(const Context *context,
+                                   GLuint id,
+                                   GLenum pname,
+                                   GLuint64 *params)
+{
+    CallCapture call(EntryPoint::GetQueryObjectui64vEXT);
+    call.addParam(id);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetQueryObjectui64vRobustANGLE(const Context *context,
+                                           GLuint id,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint64 *params)
+{
+    CallCapture call(EntryPoint::GetQueryObjectui64vRobustANGLE);
+    call.addParam(id);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetQueryObjectuiv(const Context *context, GLuint id, GLenum pname, GLuint *params)
+{
+    CallCapture call(EntryPoint::GetQueryObjectuiv);
+    call.addParam(id);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetQueryObjectuivEXT(const Context *context, GLuint id, GLenum pname, GLuint *params)
+{
+    CallCapture call(EntryPoint::GetQueryObjectuivEXT);
+    call.addParam(id);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetQueryObjectuivRobustANGLE(const Context *context,
+                                         GLuint id,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLuint *params)
+{
+    CallCapture call(EntryPoint::GetQueryObjectuivRobustANGLE);
+    call.addParam(id);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetQueryiv(const Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    CallCapture call(EntryPoint::GetQueryiv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetQueryivEXT(const Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    CallCapture call(EntryPoint::GetQueryivEXT);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetQueryivRobustANGLE(const Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLint *params)
+{
+    CallCapture call(EntryPoint::GetQueryivRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetRenderbufferParameteriv(const Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLint *params)
+{
+    CallCapture call(EntryPoint::GetRenderbufferParameteriv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetRenderbufferParameterivOES(const Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLint *params)
+{
+    CallCapture call(EntryPoint::GetRenderbufferParameterivOES);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetRenderbufferParameterivRobustANGLE(const Context *context,
+                                                  GLenum target,
+                                                  GLenum pname,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  GLint *params)
+{
+    CallCapture call(EntryPoint::GetRenderbufferParameterivRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetSamplerParameterIivOES(const Context *context,
+                                      GLuint sampler,
+                                      GLenum pname,
+                                      GLint *params)
+{
+    CallCapture call(EntryPoint::GetSamplerParameterIivOES);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetSamplerParameterIivRobustANGLE(const Context *context,
+                                              GLuint sampler,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params)
+{
+    CallCapture call(EntryPoint::GetSamplerParameterIivRobustANGLE);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetSamplerParameterIuivOES(const Context *context,
+                                       GLuint sampler,
+                                       GLenum pname,
+                                       GLuint *params)
+{
+    CallCapture call(EntryPoint::GetSamplerParameterIuivOES);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetSamplerParameterIuivRobustANGLE(const Context *context,
+                                               GLuint sampler,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLuint *params)
+{
+    CallCapture call(EntryPoint::GetSamplerParameterIuivRobustANGLE);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetSamplerParameterfv(const Context *context,
+                                  GLuint sampler,
+                                  GLenum pname,
+                                  GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetSamplerParameterfv);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetSamplerParameterfvRobustANGLE(const Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetSamplerParameterfvRobustANGLE);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetSamplerParameteriv(const Context *context,
+                                  GLuint sampler,
+                                  GLenum pname,
+                                  GLint *params)
+{
+    CallCapture call(EntryPoint::GetSamplerParameteriv);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetSamplerParameterivRobustANGLE(const Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params)
+{
+    CallCapture call(EntryPoint::GetSamplerParameterivRobustANGLE);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetSemaphoreParameterui64vEXT(const Context *context,
+                                          GLuint semaphore,
+                                          GLenum pname,
+                                          GLuint64 *params)
+{
+    CallCapture call(EntryPoint::GetSemaphoreParameterui64vEXT);
+    call.addParam(semaphore);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetShaderInfoLog(const Context *context,
+                             GLuint shader,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLchar *infoLog)
+{
+    CallCapture call(EntryPoint::GetShaderInfoLog);
+    call.addParam(shader);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(infoLog);
+    WriteCallCapture(call);
+}
+
+void CaptureGetShaderPrecisionFormat(const Context *context,
+                                     GLenum shadertype,
+                                     GLenum precisiontype,
+                                     GLint *range,
+                                     GLint *precision)
+{
+    CallCapture call(EntryPoint::GetShaderPrecisionFormat);
+    call.addParam(shadertype);
+    call.addParam(precisiontype);
+    call.addParam(range);
+    call.addParam(precision);
+    WriteCallCapture(call);
+}
+
+void CaptureGetShaderSource(const Context *context,
+                            GLuint shader,
+                            GLsizei bufSize,
+                            GLsizei *length,
+                            GLchar *source)
+{
+    CallCapture call(EntryPoint::GetShaderSource);
+    call.addParam(shader);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(source);
+    WriteCallCapture(call);
+}
+
+void CaptureGetShaderiv(const Context *context, GLuint shader, GLenum pname, GLint *params)
+{
+    CallCapture call(EntryPoint::GetShaderiv);
+    call.addParam(shader);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetShaderivRobustANGLE(const Context *context,
+                                   GLuint shader,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *params)
+{
+    CallCapture call(EntryPoint::GetShaderivRobustANGLE);
+    call.addParam(shader);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetString(const Context *context, GLenum name)
+{
+    CallCapture call(EntryPoint::GetString);
+    call.addParam(name);
+    WriteCallCapture(call);
+}
+
+void CaptureGetStringi(const Context *context, GLenum name, GLuint index)
+{
+    CallCapture call(EntryPoint::GetStringi);
+    call.addParam(name);
+    call.addParam(index);
+    WriteCallCapture(call);
+}
+
+void CaptureGetSynciv(const Context *context,
+                      GLsync sync,
+                      GLenum pname,
+                      GLsizei bufSize,
+                      GLsizei *length,
+                      GLint *values)
+{
+    CallCapture call(EntryPoint::GetSynciv);
+    call.addParam(sync);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(values);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexEnvfv(const Context *context, GLenum target, GLenum pname, GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetTexEnvfv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexEnviv(const Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    CallCapture call(EntryPoint::GetTexEnviv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexEnvxv(const Context *context, GLenum target, GLenum pname, GLfixed *params)
+{
+    CallCapture call(EntryPoint::GetTexEnvxv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexGenfvOES(const Context *context, GLenum coord, GLenum pname, GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetTexGenfvOES);
+    call.addParam(coord);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexGenivOES(const Context *context, GLenum coord, GLenum pname, GLint *params)
+{
+    CallCapture call(EntryPoint::GetTexGenivOES);
+    call.addParam(coord);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexGenxvOES(const Context *context, GLenum coord, GLenum pname, GLfixed *params)
+{
+    CallCapture call(EntryPoint::GetTexGenxvOES);
+    call.addParam(coord);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexLevelParameterfv(const Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum pname,
+                                   GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetTexLevelParameterfv);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexLevelParameterfvANGLE(const Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLenum pname,
+                                        GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetTexLevelParameterfvANGLE);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexLevelParameterfvRobustANGLE(const Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetTexLevelParameterfvRobustANGLE);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexLevelParameteriv(const Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum pname,
+                                   GLint *params)
+{
+    CallCapture call(EntryPoint::GetTexLevelParameteriv);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexLevelParameterivANGLE(const Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLenum pname,
+                                        GLint *params)
+{
+    CallCapture call(EntryPoint::GetTexLevelParameterivANGLE);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexLevelParameterivRobustANGLE(const Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params)
+{
+    CallCapture call(EntryPoint::GetTexLevelParameterivRobustANGLE);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexParameterIivOES(const Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  GLint *params)
+{
+    CallCapture call(EntryPoint::GetTexParameterIivOES);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexParameterIivRobustANGLE(const Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params)
+{
+    CallCapture call(EntryPoint::GetTexParameterIivRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexParameterIuivOES(const Context *context,
+                                   GLenum target,
+                                   GLenum pname,
+                                   GLuint *params)
+{
+    CallCapture call(EntryPoint::GetTexParameterIuivOES);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexParameterIuivRobustANGLE(const Context *context,
+                                           GLenum target,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params)
+{
+    CallCapture call(EntryPoint::GetTexParameterIuivRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexParameterfv(const Context *context, GLenum target, GLenum pname, GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetTexParameterfv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexParameterfvRobustANGLE(const Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetTexParameterfvRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexParameteriv(const Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    CallCapture call(EntryPoint::GetTexParameteriv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexParameterivRobustANGLE(const Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params)
+{
+    CallCapture call(EntryPoint::GetTexParameterivRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTexParameterxv(const Context *context, GLenum target, GLenum pname, GLfixed *params)
+{
+    CallCapture call(EntryPoint::GetTexParameterxv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTransformFeedbackVarying(const Context *context,
+                                        GLuint program,
+                                        GLuint index,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLsizei *size,
+                                        GLenum *type,
+                                        GLchar *name)
+{
+    CallCapture call(EntryPoint::GetTransformFeedbackVarying);
+    call.addParam(program);
+    call.addParam(index);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(size);
+    call.addParam(type);
+    call.addParam(name);
+    WriteCallCapture(call);
+}
+
+void CaptureGetTranslatedShaderSourceANGLE(const Context *context,
+                                           GLuint shader,
+                                           GLsizei bufsize,
+                                           GLsizei *length,
+                                           GLchar *source)
+{
+    CallCapture call(EntryPoint::GetTranslatedShaderSourceANGLE);
+    call.addParam(shader);
+    call.addParam(bufsize);
+    call.addParam(length);
+    call.addParam(source);
+    WriteCallCapture(call);
+}
+
+void CaptureGetUniformBlockIndex(const Context *context,
+                                 GLuint program,
+                                 const GLchar *uniformBlockName)
+{
+    CallCapture call(EntryPoint::GetUniformBlockIndex);
+    call.addParam(program);
+    call.addParam(uniformBlockName);
+    call.addBlob(1, uniformBlockName, static_cast<size_t>(GetCaptureStringSize(uniformBlockName)));
+    WriteCallCapture(call);
+}
+
+void CaptureGetUniformIndices(const Context *context,
+                              GLuint program,
+                              GLsizei uniformCount,
+                              const GLchar *const *uniformNames,
+                              GLuint *uniformIndices)
+{
+    CallCapture call(EntryPoint::GetUniformIndices);
+    call.addParam(program);
+    call.addParam(uniformCount);
+    call.addParam(uniformNames);
+    call.addParam(uniformIndices);
+    call.addStrings(2, uniformNames, uniformCount, nullptr);
+    WriteCallCapture(call);
+}
+
+void CaptureGetUniformLocation(const Context *context, GLuint program, const GLchar *name)
+{
+    CallCapture call(EntryPoint::GetUniformLocation);
+    call.addParam(program);
+    call.addParam(name);
+    call.addBlob(1, name, static_cast<size_t>(GetCaptureStringSize(name)));
+    WriteCallCapture(call);
+}
+
+void CaptureGetUniformfv(const Context *context, GLuint program, GLint location, GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetUniformfv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetUniformfvRobustANGLE(const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetUniformfvRobustANGLE);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetUniformiv(const Context *context, GLuint program, GLint location, GLint *params)
+{
+    CallCapture call(EntryPoint::GetUniformiv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetUniformivRobustANGLE(const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params)
+{
+    CallCapture call(EntryPoint::GetUniformivRobustANGLE);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetUniformuiv(const Context *context, GLuint program, GLint location, GLuint *params)
+{
+    CallCapture call(EntryPoint::GetUniformuiv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetUniformuivRobustANGLE(const Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLuint *params)
+{
+    CallCapture call(EntryPoint::GetUniformuivRobustANGLE);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetUnsignedBytei_vEXT(const Context *context,
+                                  GLenum target,
+                                  GLuint index,
+                                  GLubyte *data)
+{
+    CallCapture call(EntryPoint::GetUnsignedBytei_vEXT);
+    call.addParam(target);
+    call.addParam(index);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetUnsignedBytevEXT(const Context *context, GLenum pname, GLubyte *data)
+{
+    CallCapture call(EntryPoint::GetUnsignedBytevEXT);
+    call.addParam(pname);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureGetVertexAttribIiv(const Context *context, GLuint index, GLenum pname, GLint *params)
+{
+    CallCapture call(EntryPoint::GetVertexAttribIiv);
+    call.addParam(index);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetVertexAttribIivRobustANGLE(const Context *context,
+                                          GLuint index,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params)
+{
+    CallCapture call(EntryPoint::GetVertexAttribIivRobustANGLE);
+    call.addParam(index);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetVertexAttribIuiv(const Context *context, GLuint index, GLenum pname, GLuint *params)
+{
+    CallCapture call(EntryPoint::GetVertexAttribIuiv);
+    call.addParam(index);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetVertexAttribIuivRobustANGLE(const Context *context,
+                                           GLuint index,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params)
+{
+    CallCapture call(EntryPoint::GetVertexAttribIuivRobustANGLE);
+    call.addParam(index);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetVertexAttribPointerv(const Context *context,
+                                    GLuint index,
+                                    GLenum pname,
+                                    void **pointer)
+{
+    CallCapture call(EntryPoint::GetVertexAttribPointerv);
+    call.addParam(index);
+    call.addParam(pname);
+    call.addParam(pointer);
+    WriteCallCapture(call);
+}
+
+void CaptureGetVertexAttribPointervRobustANGLE(const Context *context,
+                                               GLuint index,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               void **pointer)
+{
+    CallCapture call(EntryPoint::GetVertexAttribPointervRobustANGLE);
+    call.addParam(index);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(pointer);
+    WriteCallCapture(call);
+}
+
+void CaptureGetVertexAttribfv(const Context *context, GLuint index, GLenum pname, GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetVertexAttribfv);
+    call.addParam(index);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetVertexAttribfvRobustANGLE(const Context *context,
+                                         GLuint index,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetVertexAttribfvRobustANGLE);
+    call.addParam(index);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetVertexAttribiv(const Context *context, GLuint index, GLenum pname, GLint *params)
+{
+    CallCapture call(EntryPoint::GetVertexAttribiv);
+    call.addParam(index);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetVertexAttribivRobustANGLE(const Context *context,
+                                         GLuint index,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params)
+{
+    CallCapture call(EntryPoint::GetVertexAttribivRobustANGLE);
+    call.addParam(index);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetnUniformfvEXT(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei bufSize,
+                             GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetnUniformfvEXT);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(bufSize);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetnUniformfvRobustANGLE(const Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLfloat *params)
+{
+    CallCapture call(EntryPoint::GetnUniformfvRobustANGLE);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetnUniformivEXT(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei bufSize,
+                             GLint *params)
+{
+    CallCapture call(EntryPoint::GetnUniformivEXT);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(bufSize);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetnUniformivRobustANGLE(const Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *params)
+{
+    CallCapture call(EntryPoint::GetnUniformivRobustANGLE);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureGetnUniformuivRobustANGLE(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLuint *params)
+{
+    CallCapture call(EntryPoint::GetnUniformuivRobustANGLE);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureHint(const Context *context, GLenum target, GLenum mode)
+{
+    CallCapture call(EntryPoint::Hint);
+    call.addParam(target);
+    call.addParam(mode);
+    WriteCallCapture(call);
+}
+
+void CaptureImportMemoryFdEXT(const Context *context,
+                              GLuint memory,
+                              GLuint64 size,
+                              GLenum handleType,
+                              GLint fd)
+{
+    CallCapture call(EntryPoint::ImportMemoryFdEXT);
+    call.addParam(memory);
+    call.addParam(size);
+    call.addParam(handleType);
+    call.addParam(fd);
+    WriteCallCapture(call);
+}
+
+void CaptureImportSemaphoreFdEXT(const Context *context,
+                                 GLuint semaphore,
+                                 GLenum handleType,
+                                 GLint fd)
+{
+    CallCapture call(EntryPoint::ImportSemaphoreFdEXT);
+    call.addParam(semaphore);
+    call.addParam(handleType);
+    call.addParam(fd);
+    WriteCallCapture(call);
+}
+
+void CaptureInsertEventMarkerEXT(const Context *context, GLsizei length, const GLchar *marker)
+{
+    CallCapture call(EntryPoint::InsertEventMarkerEXT);
+    call.addParam(length);
+    call.addParam(marker);
+    WriteCallCapture(call);
+}
+
+void CaptureInvalidateFramebuffer(const Context *context,
+                                  GLenum target,
+                                  GLsizei numAttachments,
+                                  const GLenum *attachments)
+{
+    CallCapture call(EntryPoint::InvalidateFramebuffer);
+    call.addParam(target);
+    call.addParam(numAttachments);
+    call.addParam(attachments);
+    call.addBlob(2, attachments, static_cast<size_t>(numAttachments * sizeof(GLenum)));
+    WriteCallCapture(call);
+}
+
+void CaptureInvalidateSubFramebuffer(const Context *context,
+                                     GLenum target,
+                                     GLsizei numAttachments,
+                                     const GLenum *attachments,
+                                     GLint x,
+                                     GLint y,
+                                     GLsizei width,
+                                     GLsizei height)
+{
+    CallCapture call(EntryPoint::InvalidateSubFramebuffer);
+    call.addParam(target);
+    call.addParam(numAttachments);
+    call.addParam(attachments);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(width);
+    call.addParam(height);
+    call.addBlob(2, attachments, static_cast<size_t>(numAttachments * sizeof(GLenum)));
+    WriteCallCapture(call);
+}
+
+void CaptureIsBuffer(const Context *context, GLuint buffer)
+{
+    CallCapture call(EntryPoint::IsBuffer);
+    call.addParam(buffer);
+    WriteCallCapture(call);
+}
+
+void CaptureIsEnabled(const Context *context, GLenum cap)
+{
+    CallCapture call(EntryPoint::IsEnabled);
+    call.addParam(cap);
+    WriteCallCapture(call);
+}
+
+void CaptureIsFenceNV(const Context *context, GLuint fence)
+{
+    CallCapture call(EntryPoint::IsFenceNV);
+    call.addParam(fence);
+    WriteCallCapture(call);
+}
+
+void CaptureIsFramebuffer(const Context *context, GLuint framebuffer)
+{
+    CallCapture call(EntryPoint::IsFramebuffer);
+    call.addParam(framebuffer);
+    WriteCallCapture(call);
+}
+
+void CaptureIsFramebufferOES(const Context *context, GLuint framebuffer)
+{
+    CallCapture call(EntryPoint::IsFramebufferOES);
+    call.addParam(framebuffer);
+    WriteCallCapture(call);
+}
+
+void CaptureIsMemoryObjectEXT(const Context *context, GLuint memoryObject)
+{
+    CallCapture call(EntryPoint::IsMemoryObjectEXT);
+    call.addParam(memoryObject);
+    WriteCallCapture(call);
+}
+
+void CaptureIsPathCHROMIUM(const Context *context, GLuint path)
+{
+    CallCapture call(EntryPoint::IsPathCHROMIUM);
+    call.addParam(path);
+    WriteCallCapture(call);
+}
+
+void CaptureIsProgram(const Context *context, GLuint program)
+{
+    CallCapture call(EntryPoint::IsProgram);
+    call.addParam(program);
+    WriteCallCapture(call);
+}
+
+void CaptureIsProgramPipeline(const Context *context, GLuint pipeline)
+{
+    CallCapture call(EntryPoint::IsProgramPipeline);
+    call.addParam(pipeline);
+    WriteCallCapture(call);
+}
+
+void CaptureIsQuery(const Context *context, GLuint id)
+{
+    CallCapture call(EntryPoint::IsQuery);
+    call.addParam(id);
+    WriteCallCapture(call);
+}
+
+void CaptureIsQueryEXT(const Context *context, GLuint id)
+{
+    CallCapture call(EntryPoint::IsQueryEXT);
+    call.addParam(id);
+    WriteCallCapture(call);
+}
+
+void CaptureIsRenderbuffer(const Context *context, GLuint renderbuffer)
+{
+    CallCapture call(EntryPoint::IsRenderbuffer);
+    call.addParam(renderbuffer);
+    WriteCallCapture(call);
+}
+
+void CaptureIsRenderbufferOES(const Context *context, GLuint renderbuffer)
+{
+    CallCapture call(EntryPoint::IsRenderbufferOES);
+    call.addParam(renderbuffer);
+    WriteCallCapture(call);
+}
+
+void CaptureIsSampler(const Context *context, GLuint sampler)
+{
+    CallCapture call(EntryPoint::IsSampler);
+    call.addParam(sampler);
+    WriteCallCapture(call);
+}
+
+void CaptureIsSemaphoreEXT(const Context *context, GLuint semaphore)
+{
+    CallCapture call(EntryPoint::IsSemaphoreEXT);
+    call.addParam(semaphore);
+    WriteCallCapture(call);
+}
+
+void CaptureIsShader(const Context *context, GLuint shader)
+{
+    CallCapture call(EntryPoint::IsShader);
+    call.addParam(shader);
+    WriteCallCapture(call);
+}
+
+void CaptureIsSync(const Context *context, GLsync sync)
+{
+    CallCapture call(EntryPoint::IsSync);
+    call.addParam(sync);
+    WriteCallCapture(call);
+}
+
+void CaptureIsTexture(const Context *context, GLuint texture)
+{
+    CallCapture call(EntryPoint::IsTexture);
+    call.addParam(texture);
+    WriteCallCapture(call);
+}
+
+void CaptureIsTransformFeedback(const Context *context, GLuint id)
+{
+    CallCapture call(EntryPoint::IsTransformFeedback);
+    call.addParam(id);
+    WriteCallCapture(call);
+}
+
+void CaptureIsVertexArray(const Context *context, GLuint array)
+{
+    CallCapture call(EntryPoint::IsVertexArray);
+    call.addParam(array);
+    WriteCallCapture(call);
+}
+
+void CaptureIsVertexArrayOES(const Context *context, GLuint array)
+{
+    CallCapture call(EntryPoint::IsVertexArrayOES);
+    call.addParam(array);
+    WriteCallCapture(call);
+}
+
+void CaptureLightModelf(const Context *context, GLenum pname, GLfloat param)
+{
+    CallCapture call(EntryPoint::LightModelf);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureLightModelfv(const Context *context, GLenum pname, const GLfloat *params)
+{
+    CallCapture call(EntryPoint::LightModelfv);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureLightModelx(const Context *context, GLenum pname, GLfixed param)
+{
+    CallCapture call(EntryPoint::LightModelx);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureLightModelxv(const Context *context, GLenum pname, const GLfixed *param)
+{
+    CallCapture call(EntryPoint::LightModelxv);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureLightf(const Context *context, GLenum light, GLenum pname, GLfloat param)
+{
+    CallCapture call(EntryPoint::Lightf);
+    call.addParam(light);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureLightfv(const Context *context, GLenum light, GLenum pname, const GLfloat *params)
+{
+    CallCapture call(EntryPoint::Lightfv);
+    call.addParam(light);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureLightx(const Context *context, GLenum light, GLenum pname, GLfixed param)
+{
+    CallCapture call(EntryPoint::Lightx);
+    call.addParam(light);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureLightxv(const Context *context, GLenum light, GLenum pname, const GLfixed *params)
+{
+    CallCapture call(EntryPoint::Lightxv);
+    call.addParam(light);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureLineWidth(const Context *context, GLfloat width)
+{
+    CallCapture call(EntryPoint::LineWidth);
+    call.addParam(width);
+    WriteCallCapture(call);
+}
+
+void CaptureLineWidthx(const Context *context, GLfixed width)
+{
+    CallCapture call(EntryPoint::LineWidthx);
+    call.addParam(width);
+    WriteCallCapture(call);
+}
+
+void CaptureLinkProgram(const Context *context, GLuint program)
+{
+    CallCapture call(EntryPoint::LinkProgram);
+    call.addParam(program);
+    WriteCallCapture(call);
+}
+
+void CaptureLoadIdentity(const Context *context)
+{
+    CallCapture call(EntryPoint::LoadIdentity);
+    WriteCallCapture(call);
+}
+
+void CaptureLoadMatrixf(const Context *context, const GLfloat *m)
+{
+    CallCapture call(EntryPoint::LoadMatrixf);
+    call.addParam(m);
+    WriteCallCapture(call);
+}
+
+void CaptureLoadMatrixx(const Context *context, const GLfixed *m)
+{
+    CallCapture call(EntryPoint::LoadMatrixx);
+    call.addParam(m);
+    WriteCallCapture(call);
+}
+
+void CaptureLoadPaletteFromModelViewMatrixOES(const Context *context)
+{
+    CallCapture call(EntryPoint::LoadPaletteFromModelViewMatrixOES);
+    WriteCallCapture(call);
+}
+
+void CaptureLogicOp(const Context *context, GLenum opcode)
+{
+    CallCapture call(EntryPoint::LogicOp);
+    call.addParam(opcode);
+    WriteCallCapture(call);
+}
+
+void CaptureLoseContextCHROMIUM(const Context *context, GLenum current, GLenum other)
+{
+    CallCapture call(EntryPoint::LoseContextCHROMIUM);
+    call.addParam(current);
+    call.addParam(other);
+    WriteCallCapture(call);
+}
+
+void CaptureMapBufferOES(const Context *context, GLenum target, GLenum access)
+{
+    CallCapture call(EntryPoint::MapBufferOES);
+    call.addParam(target);
+    call.addParam(access);
+    WriteCallCapture(call);
+}
+
+void CaptureMapBufferRange(const Context *context,
+                           GLenum target,
+                           GLintptr offset,
+                           GLsizeiptr length,
+                           GLbitfield access)
+{
+    CallCapture call(EntryPoint::MapBufferRange);
+    call.addParam(target);
+    call.addParam(offset);
+    call.addParam(length);
+    call.addParam(access);
+    WriteCallCapture(call);
+}
+
+void CaptureMapBufferRangeEXT(const Context *context,
+                              GLenum target,
+                              GLintptr offset,
+                              GLsizeiptr length,
+                              GLbitfield access)
+{
+    CallCapture call(EntryPoint::MapBufferRangeEXT);
+    call.addParam(target);
+    call.addParam(offset);
+    call.addParam(length);
+    call.addParam(access);
+    WriteCallCapture(call);
+}
+
+void CaptureMaterialf(const Context *context, GLenum face, GLenum pname, GLfloat param)
+{
+    CallCapture call(EntryPoint::Materialf);
+    call.addParam(face);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureMaterialfv(const Context *context, GLenum face, GLenum pname, const GLfloat *params)
+{
+    CallCapture call(EntryPoint::Materialfv);
+    call.addParam(face);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureMaterialx(const Context *context, GLenum face, GLenum pname, GLfixed param)
+{
+    CallCapture call(EntryPoint::Materialx);
+    call.addParam(face);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureMaterialxv(const Context *context, GLenum face, GLenum pname, const GLfixed *param)
+{
+    CallCapture call(EntryPoint::Materialxv);
+    call.addParam(face);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureMatrixIndexPointerOES(const Context *context,
+                                  GLint size,
+                                  GLenum type,
+                                  GLsizei stride,
+                                  const void *pointer)
+{
+    CallCapture call(EntryPoint::MatrixIndexPointerOES);
+    call.addParam(size);
+    call.addParam(type);
+    call.addParam(stride);
+    call.addParam(pointer);
+    WriteCallCapture(call);
+}
+
+void CaptureMatrixLoadIdentityCHROMIUM(const Context *context, GLenum matrixMode)
+{
+    CallCapture call(EntryPoint::MatrixLoadIdentityCHROMIUM);
+    call.addParam(matrixMode);
+    WriteCallCapture(call);
+}
+
+void CaptureMatrixLoadfCHROMIUM(const Context *context, GLenum matrixMode, const GLfloat *matrix)
+{
+    CallCapture call(EntryPoint::MatrixLoadfCHROMIUM);
+    call.addParam(matrixMode);
+    call.addParam(matrix);
+    WriteCallCapture(call);
+}
+
+void CaptureMatrixMode(const Context *context, GLenum mode)
+{
+    CallCapture call(EntryPoint::MatrixMode);
+    call.addParam(mode);
+    WriteCallCapture(call);
+}
+
+void CaptureMaxShaderCompilerThreadsKHR(const Context *context, GLuint count)
+{
+    CallCapture call(EntryPoint::MaxShaderCompilerThreadsKHR);
+    call.addParam(count);
+    WriteCallCapture(call);
+}
+
+void CaptureMemoryBarrier(const Context *context, GLbitfield barriers)
+{
+    CallCapture call(EntryPoint::MemoryBarrier);
+    call.addParam(barriers);
+    WriteCallCapture(call);
+}
+
+void CaptureMemoryBarrierByRegion(const Context *context, GLbitfield barriers)
+{
+    CallCapture call(EntryPoint::MemoryBarrierByRegion);
+    call.addParam(barriers);
+    WriteCallCapture(call);
+}
+
+void CaptureMemoryObjectParameterivEXT(const Context *context,
+                                       GLuint memoryObject,
+                                       GLenum pname,
+                                       const GLint *params)
+{
+    CallCapture call(EntryPoint::MemoryObjectParameterivEXT);
+    call.addParam(memoryObject);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureMultMatrixf(const Context *context, const GLfloat *m)
+{
+    CallCapture call(EntryPoint::MultMatrixf);
+    call.addParam(m);
+    WriteCallCapture(call);
+}
+
+void CaptureMultMatrixx(const Context *context, const GLfixed *m)
+{
+    CallCapture call(EntryPoint::MultMatrixx);
+    call.addParam(m);
+    WriteCallCapture(call);
+}
+
+void CaptureMultiDrawArraysANGLE(const Context *context,
+                                 GLenum mode,
+                                 const GLint *firsts,
+                                 const GLsizei *counts,
+                                 GLsizei drawcount)
+{
+    CallCapture call(EntryPoint::MultiDrawArraysANGLE);
+    call.addParam(mode);
+    call.addParam(firsts);
+    call.addParam(counts);
+    call.addParam(drawcount);
+    WriteCallCapture(call);
+}
+
+void CaptureMultiDrawArraysInstancedANGLE(const Context *context,
+                                          GLenum mode,
+                                          const GLint *firsts,
+                                          const GLsizei *counts,
+                                          const GLsizei *instanceCounts,
+                                          GLsizei drawcount)
+{
+    CallCapture call(EntryPoint::MultiDrawArraysInstancedANGLE);
+    call.addParam(mode);
+    call.addParam(firsts);
+    call.addParam(counts);
+    call.addParam(instanceCounts);
+    call.addParam(drawcount);
+    WriteCallCapture(call);
+}
+
+void CaptureMultiDrawElementsANGLE(const Context *context,
+                                   GLenum mode,
+                                   const GLsizei *counts,
+                                   GLenum type,
+                                   const GLvoid *const *indices,
+                                   GLsizei drawcount)
+{
+    CallCapture call(EntryPoint::MultiDrawElementsANGLE);
+    call.addParam(mode);
+    call.addParam(counts);
+    call.addParam(type);
+    call.addParam(indices);
+    call.addParam(drawcount);
+    WriteCallCapture(call);
+}
+
+void CaptureMultiDrawElementsInstancedANGLE(const Context *context,
+                                            GLenum mode,
+                                            const GLsizei *counts,
+                                            GLenum type,
+                                            const GLvoid *const *indices,
+                                            const GLsizei *instanceCounts,
+                                            GLsizei drawcount)
+{
+    CallCapture call(EntryPoint::MultiDrawElementsInstancedANGLE);
+    call.addParam(mode);
+    call.addParam(counts);
+    call.addParam(type);
+    call.addParam(indices);
+    call.addParam(instanceCounts);
+    call.addParam(drawcount);
+    WriteCallCapture(call);
+}
+
+void CaptureMultiTexCoord4f(const Context *context,
+                            GLenum target,
+                            GLfloat s,
+                            GLfloat t,
+                            GLfloat r,
+                            GLfloat q)
+{
+    CallCapture call(EntryPoint::MultiTexCoord4f);
+    call.addParam(target);
+    call.addParam(s);
+    call.addParam(t);
+    call.addParam(r);
+    call.addParam(q);
+    WriteCallCapture(call);
+}
+
+void CaptureMultiTexCoord4x(const Context *context,
+                            GLenum texture,
+                            GLfixed s,
+                            GLfixed t,
+                            GLfixed r,
+                            GLfixed q)
+{
+    CallCapture call(EntryPoint::MultiTexCoord4x);
+    call.addParam(texture);
+    call.addParam(s);
+    call.addParam(t);
+    call.addParam(r);
+    call.addParam(q);
+    WriteCallCapture(call);
+}
+
+void CaptureNormal3f(const Context *context, GLfloat nx, GLfloat ny, GLfloat nz)
+{
+    CallCapture call(EntryPoint::Normal3f);
+    call.addParam(nx);
+    call.addParam(ny);
+    call.addParam(nz);
+    WriteCallCapture(call);
+}
+
+void CaptureNormal3x(const Context *context, GLfixed nx, GLfixed ny, GLfixed nz)
+{
+    CallCapture call(EntryPoint::Normal3x);
+    call.addParam(nx);
+    call.addParam(ny);
+    call.addParam(nz);
+    WriteCallCapture(call);
+}
+
+void CaptureNormalPointer(const Context *context, GLenum type, GLsizei stride, const void *pointer)
+{
+    CallCapture call(EntryPoint::NormalPointer);
+    call.addParam(type);
+    call.addParam(stride);
+    call.addParam(pointer);
+    WriteCallCapture(call);
+}
+
+void CaptureObjectLabelKHR(const Context *context,
+                           GLenum identifier,
+                           GLuint name,
+                           GLsizei length,
+                           const GLchar *label)
+{
+    CallCapture call(EntryPoint::ObjectLabelKHR);
+    call.addParam(identifier);
+    call.addParam(name);
+    call.addParam(length);
+    call.addParam(label);
+    WriteCallCapture(call);
+}
+
+void CaptureObjectPtrLabelKHR(const Context *context,
+                              const void *ptr,
+                              GLsizei length,
+                              const GLchar *label)
+{
+    CallCapture call(EntryPoint::ObjectPtrLabelKHR);
+    call.addParam(ptr);
+    call.addParam(length);
+    call.addParam(label);
+    WriteCallCapture(call);
+}
+
+void CaptureOrthof(const Context *context,
+                   GLfloat l,
+                   GLfloat r,
+                   GLfloat b,
+                   GLfloat t,
+                   GLfloat n,
+                   GLfloat f)
+{
+    CallCapture call(EntryPoint::Orthof);
+    call.addParam(l);
+    call.addParam(r);
+    call.addParam(b);
+    call.addParam(t);
+    call.addParam(n);
+    call.addParam(f);
+    WriteCallCapture(call);
+}
+
+void CaptureOrthox(const Context *context,
+                   GLfixed l,
+                   GLfixed r,
+                   GLfixed b,
+                   GLfixed t,
+                   GLfixed n,
+                   GLfixed f)
+{
+    CallCapture call(EntryPoint::Orthox);
+    call.addParam(l);
+    call.addParam(r);
+    call.addParam(b);
+    call.addParam(t);
+    call.addParam(n);
+    call.addParam(f);
+    WriteCallCapture(call);
+}
+
+void CapturePathCommandsCHROMIUM(const Context *context,
+                                 GLuint path,
+                                 GLsizei numCommands,
+                                 const GLubyte *commands,
+                                 GLsizei numCoords,
+                                 GLenum coordType,
+                                 const void *coords)
+{
+    CallCapture call(EntryPoint::PathCommandsCHROMIUM);
+    call.addParam(path);
+    call.addParam(numCommands);
+    call.addParam(commands);
+    call.addParam(numCoords);
+    call.addParam(coordType);
+    call.addParam(coords);
+    WriteCallCapture(call);
+}
+
+void CapturePathParameterfCHROMIUM(const Context *context, GLuint path, GLenum pname, GLfloat value)
+{
+    CallCapture call(EntryPoint::PathParameterfCHROMIUM);
+    call.addParam(path);
+    call.addParam(pname);
+    call.addParam(value);
+    WriteCallCapture(call);
+}
+
+void CapturePathParameteriCHROMIUM(const Context *context, GLuint path, GLenum pname, GLint value)
+{
+    CallCapture call(EntryPoint::PathParameteriCHROMIUM);
+    call.addParam(path);
+    call.addParam(pname);
+    call.addParam(value);
+    WriteCallCapture(call);
+}
+
+void CapturePathStencilFuncCHROMIUM(const Context *context, GLenum func, GLint ref, GLuint mask)
+{
+    CallCapture call(EntryPoint::PathStencilFuncCHROMIUM);
+    call.addParam(func);
+    call.addParam(ref);
+    call.addParam(mask);
+    WriteCallCapture(call);
+}
+
+void CapturePauseTransformFeedback(const Context *context)
+{
+    CallCapture call(EntryPoint::PauseTransformFeedback);
+    WriteCallCapture(call);
+}
+
+void CapturePixelStorei(const Context *context, GLenum pname, GLint param)
+{
+    CallCapture call(EntryPoint::PixelStorei);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CapturePointParameterf(const Context *context, GLenum pname, GLfloat param)
+{
+    CallCapture call(EntryPoint::PointParameterf);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CapturePointParameterfv(const Context *context, GLenum pname, const GLfloat *params)
+{
+    CallCapture call(EntryPoint::PointParameterfv);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CapturePointParameterx(const Context *context, GLenum pname, GLfixed param)
+{
+    CallCapture call(EntryPoint::PointParameterx);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CapturePointParameterxv(const Context *context, GLenum pname, const GLfixed *params)
+{
+    CallCapture call(EntryPoint::PointParameterxv);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CapturePointSize(const Context *context, GLfloat size)
+{
+    CallCapture call(EntryPoint::PointSize);
+    call.addParam(size);
+    WriteCallCapture(call);
+}
+
+void CapturePointSizePointerOES(const Context *context,
+                                GLenum type,
+                                GLsizei stride,
+                                const void *pointer)
+{
+    CallCapture call(EntryPoint::PointSizePointerOES);
+    call.addParam(type);
+    call.addParam(stride);
+    call.addParam(pointer);
+    WriteCallCapture(call);
+}
+
+void CapturePointSizex(const Context *context, GLfixed size)
+{
+    CallCapture call(EntryPoint::PointSizex);
+    call.addParam(size);
+    WriteCallCapture(call);
+}
+
+void CapturePolygonOffset(const Context *context, GLfloat factor, GLfloat units)
+{
+    CallCapture call(EntryPoint::PolygonOffset);
+    call.addParam(factor);
+    call.addParam(units);
+    WriteCallCapture(call);
+}
+
+void CapturePolygonOffsetx(const Context *context, GLfixed factor, GLfixed units)
+{
+    CallCapture call(EntryPoint::PolygonOffsetx);
+    call.addParam(factor);
+    call.addParam(units);
+    WriteCallCapture(call);
+}
+
+void CapturePopDebugGroupKHR(const Context *context)
+{
+    CallCapture call(EntryPoint::PopDebugGroupKHR);
+    WriteCallCapture(call);
+}
+
+void CapturePopGroupMarkerEXT(const Context *context)
+{
+    CallCapture call(EntryPoint::PopGroupMarkerEXT);
+    WriteCallCapture(call);
+}
+
+void CapturePopMatrix(const Context *context)
+{
+    CallCapture call(EntryPoint::PopMatrix);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramBinary(const Context *context,
+                          GLuint program,
+                          GLenum binaryFormat,
+                          const void *binary,
+                          GLsizei length)
+{
+    CallCapture call(EntryPoint::ProgramBinary);
+    call.addParam(program);
+    call.addParam(binaryFormat);
+    call.addParam(binary);
+    call.addParam(length);
+    call.addBlob(2, binary, static_cast<size_t>(length));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramBinaryOES(const Context *context,
+                             GLuint program,
+                             GLenum binaryFormat,
+                             const void *binary,
+                             GLint length)
+{
+    CallCapture call(EntryPoint::ProgramBinaryOES);
+    call.addParam(program);
+    call.addParam(binaryFormat);
+    call.addParam(binary);
+    call.addParam(length);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramParameteri(const Context *context, GLuint program, GLenum pname, GLint value)
+{
+    CallCapture call(EntryPoint::ProgramParameteri);
+    call.addParam(program);
+    call.addParam(pname);
+    call.addParam(value);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramPathFragmentInputGenCHROMIUM(const Context *context,
+                                                GLuint program,
+                                                GLint location,
+                                                GLenum genMode,
+                                                GLint components,
+                                                const GLfloat *coeffs)
+{
+    CallCapture call(EntryPoint::ProgramPathFragmentInputGenCHROMIUM);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(genMode);
+    call.addParam(components);
+    call.addParam(coeffs);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform1f(const Context *context, GLuint program, GLint location, GLfloat v0)
+{
+    CallCapture call(EntryPoint::ProgramUniform1f);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(v0);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform1fv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniform1fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 1 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform1i(const Context *context, GLuint program, GLint location, GLint v0)
+{
+    CallCapture call(EntryPoint::ProgramUniform1i);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(v0);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform1iv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value)
+{
+    CallCapture call(EntryPoint::ProgramUniform1iv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 1 * sizeof(GLint)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform1ui(const Context *context, GLuint program, GLint location, GLuint v0)
+{
+    CallCapture call(EntryPoint::ProgramUniform1ui);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(v0);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform1uiv(const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value)
+{
+    CallCapture call(EntryPoint::ProgramUniform1uiv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 1 * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform2f(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1)
+{
+    CallCapture call(EntryPoint::ProgramUniform2f);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform2fv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniform2fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 2 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform2i(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1)
+{
+    CallCapture call(EntryPoint::ProgramUniform2i);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform2iv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value)
+{
+    CallCapture call(EntryPoint::ProgramUniform2iv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 2 * sizeof(GLint)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform2ui(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1)
+{
+    CallCapture call(EntryPoint::ProgramUniform2ui);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform2uiv(const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value)
+{
+    CallCapture call(EntryPoint::ProgramUniform2uiv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 2 * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform3f(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1,
+                             GLfloat v2)
+{
+    CallCapture call(EntryPoint::ProgramUniform3f);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    call.addParam(v2);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform3fv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniform3fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 3 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform3i(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1,
+                             GLint v2)
+{
+    CallCapture call(EntryPoint::ProgramUniform3i);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    call.addParam(v2);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform3iv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value)
+{
+    CallCapture call(EntryPoint::ProgramUniform3iv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 3 * sizeof(GLint)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform3ui(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1,
+                              GLuint v2)
+{
+    CallCapture call(EntryPoint::ProgramUniform3ui);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    call.addParam(v2);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform3uiv(const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value)
+{
+    CallCapture call(EntryPoint::ProgramUniform3uiv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 3 * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform4f(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1,
+                             GLfloat v2,
+                             GLfloat v3)
+{
+    CallCapture call(EntryPoint::ProgramUniform4f);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    call.addParam(v2);
+    call.addParam(v3);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform4fv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniform4fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 4 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform4i(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1,
+                             GLint v2,
+                             GLint v3)
+{
+    CallCapture call(EntryPoint::ProgramUniform4i);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    call.addParam(v2);
+    call.addParam(v3);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform4iv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value)
+{
+    CallCapture call(EntryPoint::ProgramUniform4iv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 4 * sizeof(GLint)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform4ui(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1,
+                              GLuint v2,
+                              GLuint v3)
+{
+    CallCapture call(EntryPoint::ProgramUniform4ui);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    call.addParam(v2);
+    call.addParam(v3);
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniform4uiv(const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value)
+{
+    CallCapture call(EntryPoint::ProgramUniform4uiv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 4 * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniformMatrix2fv(const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniformMatrix2fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(4, value, static_cast<size_t>(count * 4 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniformMatrix2x3fv(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniformMatrix2x3fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(4, value, static_cast<size_t>(count * 6 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniformMatrix2x4fv(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniformMatrix2x4fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(4, value, static_cast<size_t>(count * 8 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniformMatrix3fv(const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniformMatrix3fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(4, value, static_cast<size_t>(count * 9 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniformMatrix3x2fv(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniformMatrix3x2fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(4, value, static_cast<size_t>(count * 6 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniformMatrix3x4fv(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniformMatrix3x4fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(4, value, static_cast<size_t>(count * 12 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniformMatrix4fv(const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniformMatrix4fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(4, value, static_cast<size_t>(count * 16 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniformMatrix4x2fv(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniformMatrix4x2fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(4, value, static_cast<size_t>(count * 8 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProgramUniformMatrix4x3fv(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    CallCapture call(EntryPoint::ProgramUniformMatrix4x3fv);
+    call.addParam(program);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(4, value, static_cast<size_t>(count * 12 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureProvokingVertexANGLE(const Context *context, GLenum mode)
+{
+    CallCapture call(EntryPoint::ProvokingVertexANGLE);
+    call.addParam(mode);
+    WriteCallCapture(call);
+}
+
+void CapturePushDebugGroupKHR(const Context *context,
+                              GLenum source,
+                              GLuint id,
+                              GLsizei length,
+                              const GLchar *message)
+{
+    CallCapture call(EntryPoint::PushDebugGroupKHR);
+    call.addParam(source);
+    call.addParam(id);
+    call.addParam(length);
+    call.addParam(message);
+    WriteCallCapture(call);
+}
+
+void CapturePushGroupMarkerEXT(const Context *context, GLsizei length, const GLchar *marker)
+{
+    CallCapture call(EntryPoint::PushGroupMarkerEXT);
+    call.addParam(length);
+    call.addParam(marker);
+    WriteCallCapture(call);
+}
+
+void CapturePushMatrix(const Context *context)
+{
+    CallCapture call(EntryPoint::PushMatrix);
+    WriteCallCapture(call);
+}
+
+void CaptureQueryCounterEXT(const Context *context, GLuint id, GLenum target)
+{
+    CallCapture call(EntryPoint::QueryCounterEXT);
+    call.addParam(id);
+    call.addParam(target);
+    WriteCallCapture(call);
+}
+
+void CaptureQueryMatrixxOES(const Context *context, GLfixed *mantissa, GLint *exponent)
+{
+    CallCapture call(EntryPoint::QueryMatrixxOES);
+    call.addParam(mantissa);
+    call.addParam(exponent);
+    WriteCallCapture(call);
+}
+
+void CaptureReadBuffer(const Context *context, GLenum src)
+{
+    CallCapture call(EntryPoint::ReadBuffer);
+    call.addParam(src);
+    WriteCallCapture(call);
+}
+
+void CaptureReadPixels(const Context *context,
+                       GLint x,
+                       GLint y,
+                       GLsizei width,
+                       GLsizei height,
+                       GLenum format,
+                       GLenum type,
+                       void *pixels)
+{
+    CallCapture call(EntryPoint::ReadPixels);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(format);
+    call.addParam(type);
+    call.addParam(pixels);
+    WriteCallCapture(call);
+}
+
+void CaptureReadPixelsRobustANGLE(const Context *context,
+                                  GLint x,
+                                  GLint y,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLsizei *columns,
+                                  GLsizei *rows,
+                                  void *pixels)
+{
+    CallCapture call(EntryPoint::ReadPixelsRobustANGLE);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(format);
+    call.addParam(type);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(columns);
+    call.addParam(rows);
+    call.addParam(pixels);
+    WriteCallCapture(call);
+}
+
+void CaptureReadnPixelsEXT(const Context *context,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLenum format,
+                           GLenum type,
+                           GLsizei bufSize,
+                           void *data)
+{
+    CallCapture call(EntryPoint::ReadnPixelsEXT);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(format);
+    call.addParam(type);
+    call.addParam(bufSize);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureReadnPixelsRobustANGLE(const Context *context,
+                                   GLint x,
+                                   GLint y,
+                                   GLsizei width,
+                                   GLsizei height,
+                                   GLenum format,
+                                   GLenum type,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLsizei *columns,
+                                   GLsizei *rows,
+                                   void *data)
+{
+    CallCapture call(EntryPoint::ReadnPixelsRobustANGLE);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(format);
+    call.addParam(type);
+    call.addParam(bufSize);
+    call.addParam(length);
+    call.addParam(columns);
+    call.addParam(rows);
+    call.addParam(data);
+    WriteCallCapture(call);
+}
+
+void CaptureReleaseShaderCompiler(const Context *context)
+{
+    CallCapture call(EntryPoint::ReleaseShaderCompiler);
+    WriteCallCapture(call);
+}
+
+void CaptureRenderbufferStorage(const Context *context,
+                                GLenum target,
+                                GLenum internalformat,
+                                GLsizei width,
+                                GLsizei height)
+{
+    CallCapture call(EntryPoint::RenderbufferStorage);
+    call.addParam(target);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureRenderbufferStorageMultisample(const Context *context,
+                                           GLenum target,
+                                           GLsizei samples,
+                                           GLenum internalformat,
+                                           GLsizei width,
+                                           GLsizei height)
+{
+    CallCapture call(EntryPoint::RenderbufferStorageMultisample);
+    call.addParam(target);
+    call.addParam(samples);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureRenderbufferStorageMultisampleANGLE(const Context *context,
+                                                GLenum target,
+                                                GLsizei samples,
+                                                GLenum internalformat,
+                                                GLsizei width,
+                                                GLsizei height)
+{
+    CallCapture call(EntryPoint::RenderbufferStorageMultisampleANGLE);
+    call.addParam(target);
+    call.addParam(samples);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureRenderbufferStorageOES(const Context *context,
+                                   GLenum target,
+                                   GLenum internalformat,
+                                   GLsizei width,
+                                   GLsizei height)
+{
+    CallCapture call(EntryPoint::RenderbufferStorageOES);
+    call.addParam(target);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureRequestExtensionANGLE(const Context *context, const GLchar *name)
+{
+    CallCapture call(EntryPoint::RequestExtensionANGLE);
+    call.addParam(name);
+    WriteCallCapture(call);
+}
+
+void CaptureResumeTransformFeedback(const Context *context)
+{
+    CallCapture call(EntryPoint::ResumeTransformFeedback);
+    WriteCallCapture(call);
+}
+
+void CaptureRotatef(const Context *context, GLfloat angle, GLfloat x, GLfloat y, GLfloat z)
+{
+    CallCapture call(EntryPoint::Rotatef);
+    call.addParam(angle);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    WriteCallCapture(call);
+}
+
+void CaptureRotatex(const Context *context, GLfixed angle, GLfixed x, GLfixed y, GLfixed z)
+{
+    CallCapture call(EntryPoint::Rotatex);
+    call.addParam(angle);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    WriteCallCapture(call);
+}
+
+void CaptureSampleCoverage(const Context *context, GLfloat value, GLboolean invert)
+{
+    CallCapture call(EntryPoint::SampleCoverage);
+    call.addParam(value);
+    call.addParam(invert);
+    WriteCallCapture(call);
+}
+
+void CaptureSampleCoveragex(const Context *context, GLclampx value, GLboolean invert)
+{
+    CallCapture call(EntryPoint::SampleCoveragex);
+    call.addParam(value);
+    call.addParam(invert);
+    WriteCallCapture(call);
+}
+
+void CaptureSampleMaski(const Context *context, GLuint maskNumber, GLbitfield mask)
+{
+    CallCapture call(EntryPoint::SampleMaski);
+    call.addParam(maskNumber);
+    call.addParam(mask);
+    WriteCallCapture(call);
+}
+
+void CaptureSampleMaskiANGLE(const Context *context, GLuint maskNumber, GLbitfield mask)
+{
+    CallCapture call(EntryPoint::SampleMaskiANGLE);
+    call.addParam(maskNumber);
+    call.addParam(mask);
+    WriteCallCapture(call);
+}
+
+void CaptureSamplerParameterIivOES(const Context *context,
+                                   GLuint sampler,
+                                   GLenum pname,
+                                   const GLint *param)
+{
+    CallCapture call(EntryPoint::SamplerParameterIivOES);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureSamplerParameterIivRobustANGLE(const Context *context,
+                                           GLuint sampler,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           const GLint *param)
+{
+    CallCapture call(EntryPoint::SamplerParameterIivRobustANGLE);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureSamplerParameterIuivOES(const Context *context,
+                                    GLuint sampler,
+                                    GLenum pname,
+                                    const GLuint *param)
+{
+    CallCapture call(EntryPoint::SamplerParameterIuivOES);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureSamplerParameterIuivRobustANGLE(const Context *context,
+                                            GLuint sampler,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            const GLuint *param)
+{
+    CallCapture call(EntryPoint::SamplerParameterIuivRobustANGLE);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureSamplerParameterf(const Context *context, GLuint sampler, GLenum pname, GLfloat param)
+{
+    CallCapture call(EntryPoint::SamplerParameterf);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureSamplerParameterfv(const Context *context,
+                               GLuint sampler,
+                               GLenum pname,
+                               const GLfloat *param)
+{
+    CallCapture call(EntryPoint::SamplerParameterfv);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(param);
+    call.addBlob(
+        2, param,
+        static_cast<size_t>((pname == GL_TEXTURE_BORDER_COLOR_EXT ? 4 : 1) * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureSamplerParameterfvRobustANGLE(const Context *context,
+                                          GLuint sampler,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          const GLfloat *param)
+{
+    CallCapture call(EntryPoint::SamplerParameterfvRobustANGLE);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureSamplerParameteri(const Context *context, GLuint sampler, GLenum pname, GLint param)
+{
+    CallCapture call(EntryPoint::SamplerParameteri);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureSamplerParameteriv(const Context *context,
+                               GLuint sampler,
+                               GLenum pname,
+                               const GLint *param)
+{
+    CallCapture call(EntryPoint::SamplerParameteriv);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(param);
+    call.addBlob(
+        2, param,
+        static_cast<size_t>((pname == GL_TEXTURE_BORDER_COLOR_EXT ? 4 : 1) * sizeof(GLint)));
+    WriteCallCapture(call);
+}
+
+void CaptureSamplerParameterivRobustANGLE(const Context *context,
+                                          GLuint sampler,
+                                          GLuint pname,
+                                          GLsizei bufSize,
+                                          const GLint *param)
+{
+    CallCapture call(EntryPoint::SamplerParameterivRobustANGLE);
+    call.addParam(sampler);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureScalef(const Context *context, GLfloat x, GLfloat y, GLfloat z)
+{
+    CallCapture call(EntryPoint::Scalef);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    WriteCallCapture(call);
+}
+
+void CaptureScalex(const Context *context, GLfixed x, GLfixed y, GLfixed z)
+{
+    CallCapture call(EntryPoint::Scalex);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    WriteCallCapture(call);
+}
+
+void CaptureScissor(const Context *context, GLint x, GLint y, GLsizei width, GLsizei height)
+{
+    CallCapture call(EntryPoint::Scissor);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureSemaphoreParameterui64vEXT(const Context *context,
+                                       GLuint semaphore,
+                                       GLenum pname,
+                                       const GLuint64 *params)
+{
+    CallCapture call(EntryPoint::SemaphoreParameterui64vEXT);
+    call.addParam(semaphore);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureSetFenceNV(const Context *context, GLuint fence, GLenum condition)
+{
+    CallCapture call(EntryPoint::SetFenceNV);
+    call.addParam(fence);
+    call.addParam(condition);
+    WriteCallCapture(call);
+}
+
+void CaptureShadeModel(const Context *context, GLenum mode)
+{
+    CallCapture call(EntryPoint::ShadeModel);
+    call.addParam(mode);
+    WriteCallCapture(call);
+}
+
+void CaptureShaderBinary(const Context *context,
+                         GLsizei count,
+                         const GLuint *shaders,
+                         GLenum binaryformat,
+                         const void *binary,
+                         GLsizei length)
+{
+    CallCapture call(EntryPoint::ShaderBinary);
+    call.addParam(count);
+    call.addParam(shaders);
+    call.addParam(binaryformat);
+    call.addParam(binary);
+    call.addParam(length);
+    call.addBlob(3, binary, static_cast<size_t>(length));
+    call.addBlob(1, shaders, static_cast<size_t>(count * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureShaderSource(const Context *context,
+                         GLuint shader,
+                         GLsizei count,
+                         const GLchar *const *string,
+                         const GLint *length)
+{
+    CallCapture call(EntryPoint::ShaderSource);
+    call.addParam(shader);
+    call.addParam(count);
+    call.addParam(string);
+    call.addParam(length);
+    call.addStrings(2, string, count, length);
+    WriteCallCapture(call);
+}
+
+void CaptureSignalSemaphoreEXT(const Context *context,
+                               GLuint semaphore,
+                               GLuint numBufferBarriers,
+                               const GLuint *buffers,
+                               GLuint numTextureBarriers,
+                               const GLuint *textures,
+                               const GLenum *dstLayouts)
+{
+    CallCapture call(EntryPoint::SignalSemaphoreEXT);
+    call.addParam(semaphore);
+    call.addParam(numBufferBarriers);
+    call.addParam(buffers);
+    call.addParam(numTextureBarriers);
+    call.addParam(textures);
+    call.addParam(dstLayouts);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilFillPathCHROMIUM(const Context *context,
+                                    GLuint path,
+                                    GLenum fillMode,
+                                    GLuint mask)
+{
+    CallCapture call(EntryPoint::StencilFillPathCHROMIUM);
+    call.addParam(path);
+    call.addParam(fillMode);
+    call.addParam(mask);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilFillPathInstancedCHROMIUM(const Context *context,
+                                             GLsizei numPaths,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum fillMode,
+                                             GLuint mask,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues)
+{
+    CallCapture call(EntryPoint::StencilFillPathInstancedCHROMIUM);
+    call.addParam(numPaths);
+    call.addParam(pathNameType);
+    call.addParam(paths);
+    call.addParam(pathBase);
+    call.addParam(fillMode);
+    call.addParam(mask);
+    call.addParam(transformType);
+    call.addParam(transformValues);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilFunc(const Context *context, GLenum func, GLint ref, GLuint mask)
+{
+    CallCapture call(EntryPoint::StencilFunc);
+    call.addParam(func);
+    call.addParam(ref);
+    call.addParam(mask);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilFuncSeparate(const Context *context,
+                                GLenum face,
+                                GLenum func,
+                                GLint ref,
+                                GLuint mask)
+{
+    CallCapture call(EntryPoint::StencilFuncSeparate);
+    call.addParam(face);
+    call.addParam(func);
+    call.addParam(ref);
+    call.addParam(mask);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilMask(const Context *context, GLuint mask)
+{
+    CallCapture call(EntryPoint::StencilMask);
+    call.addParam(mask);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilMaskSeparate(const Context *context, GLenum face, GLuint mask)
+{
+    CallCapture call(EntryPoint::StencilMaskSeparate);
+    call.addParam(face);
+    call.addParam(mask);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilOp(const Context *context, GLenum fail, GLenum zfail, GLenum zpass)
+{
+    CallCapture call(EntryPoint::StencilOp);
+    call.addParam(fail);
+    call.addParam(zfail);
+    call.addParam(zpass);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilOpSeparate(const Context *context,
+                              GLenum face,
+                              GLenum sfail,
+                              GLenum dpfail,
+                              GLenum dppass)
+{
+    CallCapture call(EntryPoint::StencilOpSeparate);
+    call.addParam(face);
+    call.addParam(sfail);
+    call.addParam(dpfail);
+    call.addParam(dppass);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilStrokePathCHROMIUM(const Context *context,
+                                      GLuint path,
+                                      GLint reference,
+                                      GLuint mask)
+{
+    CallCapture call(EntryPoint::StencilStrokePathCHROMIUM);
+    call.addParam(path);
+    call.addParam(reference);
+    call.addParam(mask);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilStrokePathInstancedCHROMIUM(const Context *context,
+                                               GLsizei numPath,
+                                               GLenum pathNameType,
+                                               const void *paths,
+                                               GLuint pathBase,
+                                               GLint reference,
+                                               GLuint mask,
+                                               GLenum transformType,
+                                               const GLfloat *transformValues)
+{
+    CallCapture call(EntryPoint::StencilStrokePathInstancedCHROMIUM);
+    call.addParam(numPath);
+    call.addParam(pathNameType);
+    call.addParam(paths);
+    call.addParam(pathBase);
+    call.addParam(reference);
+    call.addParam(mask);
+    call.addParam(transformType);
+    call.addParam(transformValues);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilThenCoverFillPathCHROMIUM(const Context *context,
+                                             GLuint path,
+                                             GLenum fillMode,
+                                             GLuint mask,
+                                             GLenum coverMode)
+{
+    CallCapture call(EntryPoint::StencilThenCoverFillPathCHROMIUM);
+    call.addParam(path);
+    call.addParam(fillMode);
+    call.addParam(mask);
+    call.addParam(coverMode);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilThenCoverFillPathInstancedCHROMIUM(const Context *context,
+                                                      GLsizei numPaths,
+                                                      GLenum pathNameType,
+                                                      const void *paths,
+                                                      GLuint pathBase,
+                                                      GLenum fillMode,
+                                                      GLuint mask,
+                                                      GLenum coverMode,
+                                                      GLenum transformType,
+                                                      const GLfloat *transformValues)
+{
+    CallCapture call(EntryPoint::StencilThenCoverFillPathInstancedCHROMIUM);
+    call.addParam(numPaths);
+    call.addParam(pathNameType);
+    call.addParam(paths);
+    call.addParam(pathBase);
+    call.addParam(fillMode);
+    call.addParam(mask);
+    call.addParam(coverMode);
+    call.addParam(transformType);
+    call.addParam(transformValues);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilThenCoverStrokePathCHROMIUM(const Context *context,
+                                               GLuint path,
+                                               GLint reference,
+                                               GLuint mask,
+                                               GLenum coverMode)
+{
+    CallCapture call(EntryPoint::StencilThenCoverStrokePathCHROMIUM);
+    call.addParam(path);
+    call.addParam(reference);
+    call.addParam(mask);
+    call.addParam(coverMode);
+    WriteCallCapture(call);
+}
+
+void CaptureStencilThenCoverStrokePathInstancedCHROMIUM(const Context *context,
+                                                        GLsizei numPaths,
+                                                        GLenum pathNameType,
+                                                        const void *paths,
+                                                        GLuint pathBase,
+                                                        GLint reference,
+                                                        GLuint mask,
+                                                        GLenum coverMode,
+                                                        GLenum transformType,
+                                                        const GLfloat *transformValues)
+{
+    CallCapture call(EntryPoint::StencilThenCoverStrokePathInstancedCHROMIUM);
+    call.addParam(numPaths);
+    call.addParam(pathNameType);
+    call.addParam(paths);
+    call.addParam(pathBase);
+    call.addParam(reference);
+    call.addParam(mask);
+    call.addParam(coverMode);
+    call.addParam(transformType);
+    call.addParam(transformValues);
+    WriteCallCapture(call);
+}
+
+void CaptureTestFenceNV(const Context *context, GLuint fence)
+{
+    CallCapture call(EntryPoint::TestFenceNV);
+    call.addParam(fence);
+    WriteCallCapture(call);
+}
+
+void CaptureTexCoordPointer(const Context *context,
+                            GLint size,
+                            GLenum type,
+                            GLsizei stride,
+                            const void *pointer)
+{
+    CallCapture call(EntryPoint::TexCoordPointer);
+    call.addParam(size);
+    call.addParam(type);
+    call.addParam(stride);
+    call.addParam(pointer);
+    WriteCallCapture(call);
+}
+
+void CaptureTexEnvf(const Context *context, GLenum target, GLenum pname, GLfloat param)
+{
+    CallCapture call(EntryPoint::TexEnvf);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureTexEnvfv(const Context *context, GLenum target, GLenum pname, const GLfloat *params)
+{
+    CallCapture call(EntryPoint::TexEnvfv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexEnvi(const Context *context, GLenum target, GLenum pname, GLint param)
+{
+    CallCapture call(EntryPoint::TexEnvi);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureTexEnviv(const Context *context, GLenum target, GLenum pname, const GLint *params)
+{
+    CallCapture call(EntryPoint::TexEnviv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexEnvx(const Context *context, GLenum target, GLenum pname, GLfixed param)
+{
+    CallCapture call(EntryPoint::TexEnvx);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureTexEnvxv(const Context *context, GLenum target, GLenum pname, const GLfixed *params)
+{
+    CallCapture call(EntryPoint::TexEnvxv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexGenfOES(const Context *context, GLenum coord, GLenum pname, GLfloat param)
+{
+    CallCapture call(EntryPoint::TexGenfOES);
+    call.addParam(coord);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureTexGenfvOES(const Context *context, GLenum coord, GLenum pname, const GLfloat *params)
+{
+    CallCapture call(EntryPoint::TexGenfvOES);
+    call.addParam(coord);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexGeniOES(const Context *context, GLenum coord, GLenum pname, GLint param)
+{
+    CallCapture call(EntryPoint::TexGeniOES);
+    call.addParam(coord);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureTexGenivOES(const Context *context, GLenum coord, GLenum pname, const GLint *params)
+{
+    CallCapture call(EntryPoint::TexGenivOES);
+    call.addParam(coord);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexGenxOES(const Context *context, GLenum coord, GLenum pname, GLfixed param)
+{
+    CallCapture call(EntryPoint::TexGenxOES);
+    call.addParam(coord);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureTexGenxvOES(const Context *context, GLenum coord, GLenum pname, const GLfixed *params)
+{
+    CallCapture call(EntryPoint::TexGenxvOES);
+    call.addParam(coord);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexImage2D(const Context *context,
+                       GLenum target,
+                       GLint level,
+                       GLint internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLint border,
+                       GLenum format,
+                       GLenum type,
+                       const void *pixels)
+{
+    CallCapture call(EntryPoint::TexImage2D);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(border);
+    call.addParam(format);
+    call.addParam(type);
+    call.addParam(pixels);
+    call.addBlob(8, pixels,
+                 static_cast<size_t>(
+                     GetCaptureTexImageSize(context, format, type, width, height, 1, false)));
+    WriteCallCapture(call);
+}
+
+void CaptureTexImage2DRobustANGLE(const Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLint border,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  const void *pixels)
+{
+    CallCapture call(EntryPoint::TexImage2DRobustANGLE);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(border);
+    call.addParam(format);
+    call.addParam(type);
+    call.addParam(bufSize);
+    call.addParam(pixels);
+    call.addBlob(9, pixels,
+                 static_cast<size_t>(
+                     GetCaptureTexImageSize(context, format, type, width, height, 1, false)));
+    WriteCallCapture(call);
+}
+
+void CaptureTexImage3D(const Context *context,
+                       GLenum target,
+                       GLint level,
+                       GLint internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLsizei depth,
+                       GLint border,
+                       GLenum format,
+                       GLenum type,
+                       const void *pixels)
+{
+    CallCapture call(EntryPoint::TexImage3D);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    call.addParam(border);
+    call.addParam(format);
+    call.addParam(type);
+    call.addParam(pixels);
+    call.addBlob(9, pixels,
+                 static_cast<size_t>(
+                     GetCaptureTexImageSize(context, format, type, width, height, depth, true)));
+    WriteCallCapture(call);
+}
+
+void CaptureTexImage3DRobustANGLE(const Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLsizei depth,
+                                  GLint border,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  const void *pixels)
+{
+    CallCapture call(EntryPoint::TexImage3DRobustANGLE);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    call.addParam(border);
+    call.addParam(format);
+    call.addParam(type);
+    call.addParam(bufSize);
+    call.addParam(pixels);
+    call.addBlob(10, pixels,
+                 static_cast<size_t>(
+                     GetCaptureTexImageSize(context, format, type, width, height, depth, true)));
+    WriteCallCapture(call);
+}
+
+void CaptureTexParameterIivOES(const Context *context,
+                               GLenum target,
+                               GLenum pname,
+                               const GLint *params)
+{
+    CallCapture call(EntryPoint::TexParameterIivOES);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexParameterIivRobustANGLE(const Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLsizei bufSize,
+                                       const GLint *params)
+{
+    CallCapture call(EntryPoint::TexParameterIivRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexParameterIuivOES(const Context *context,
+                                GLenum target,
+                                GLenum pname,
+                                const GLuint *params)
+{
+    CallCapture call(EntryPoint::TexParameterIuivOES);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexParameterIuivRobustANGLE(const Context *context,
+                                        GLenum target,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        const GLuint *params)
+{
+    CallCapture call(EntryPoint::TexParameterIuivRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexParameterf(const Context *context, GLenum target, GLenum pname, GLfloat param)
+{
+    CallCapture call(EntryPoint::TexParameterf);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureTexParameterfv(const Context *context,
+                           GLenum target,
+                           GLenum pname,
+                           const GLfloat *params)
+{
+    CallCapture call(EntryPoint::TexParameterfv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    call.addBlob(
+        2, params,
+        static_cast<size_t>((pname == GL_TEXTURE_BORDER_COLOR_EXT ? 4 : 1) * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureTexParameterfvRobustANGLE(const Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      const GLfloat *params)
+{
+    CallCapture call(EntryPoint::TexParameterfvRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexParameteri(const Context *context, GLenum target, GLenum pname, GLint param)
+{
+    CallCapture call(EntryPoint::TexParameteri);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureTexParameteriv(const Context *context, GLenum target, GLenum pname, const GLint *params)
+{
+    CallCapture call(EntryPoint::TexParameteriv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    call.addBlob(
+        2, params,
+        static_cast<size_t>((pname == GL_TEXTURE_BORDER_COLOR_EXT ? 4 : 1) * sizeof(GLint)));
+    WriteCallCapture(call);
+}
+
+void CaptureTexParameterivRobustANGLE(const Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      const GLint *params)
+{
+    CallCapture call(EntryPoint::TexParameterivRobustANGLE);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(bufSize);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexParameterx(const Context *context, GLenum target, GLenum pname, GLfixed param)
+{
+    CallCapture call(EntryPoint::TexParameterx);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(param);
+    WriteCallCapture(call);
+}
+
+void CaptureTexParameterxv(const Context *context,
+                           GLenum target,
+                           GLenum pname,
+                           const GLfixed *params)
+{
+    CallCapture call(EntryPoint::TexParameterxv);
+    call.addParam(target);
+    call.addParam(pname);
+    call.addParam(params);
+    WriteCallCapture(call);
+}
+
+void CaptureTexStorage1DEXT(const Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width)
+{
+    CallCapture call(EntryPoint::TexStorage1DEXT);
+    call.addParam(target);
+    call.addParam(levels);
+    call.addParam(internalformat);
+    call.addParam(width);
+    WriteCallCapture(call);
+}
+
+void CaptureTexStorage2D(const Context *context,
+                         GLenum target,
+                         GLsizei levels,
+                         GLenum internalformat,
+                         GLsizei width,
+                         GLsizei height)
+{
+    CallCapture call(EntryPoint::TexStorage2D);
+    call.addParam(target);
+    call.addParam(levels);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureTexStorage2DEXT(const Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width,
+                            GLsizei height)
+{
+    CallCapture call(EntryPoint::TexStorage2DEXT);
+    call.addParam(target);
+    call.addParam(levels);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureTexStorage2DMultisample(const Context *context,
+                                    GLenum target,
+                                    GLsizei samples,
+                                    GLenum internalformat,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLboolean fixedsamplelocations)
+{
+    CallCapture call(EntryPoint::TexStorage2DMultisample);
+    call.addParam(target);
+    call.addParam(samples);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(fixedsamplelocations);
+    WriteCallCapture(call);
+}
+
+void CaptureTexStorage2DMultisampleANGLE(const Context *context,
+                                         GLenum target,
+                                         GLsizei samples,
+                                         GLenum internalformat,
+                                         GLsizei width,
+                                         GLsizei height,
+                                         GLboolean fixedsamplelocations)
+{
+    CallCapture call(EntryPoint::TexStorage2DMultisampleANGLE);
+    call.addParam(target);
+    call.addParam(samples);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(fixedsamplelocations);
+    WriteCallCapture(call);
+}
+
+void CaptureTexStorage3D(const Context *context,
+                         GLenum target,
+                         GLsizei levels,
+                         GLenum internalformat,
+                         GLsizei width,
+                         GLsizei height,
+                         GLsizei depth)
+{
+    CallCapture call(EntryPoint::TexStorage3D);
+    call.addParam(target);
+    call.addParam(levels);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    WriteCallCapture(call);
+}
+
+void CaptureTexStorage3DEXT(const Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width,
+                            GLsizei height,
+                            GLsizei depth)
+{
+    CallCapture call(EntryPoint::TexStorage3DEXT);
+    call.addParam(target);
+    call.addParam(levels);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    WriteCallCapture(call);
+}
+
+void CaptureTexStorage3DMultisampleOES(const Context *context,
+                                       GLenum target,
+                                       GLsizei samples,
+                                       GLenum internalformat,
+                                       GLsizei width,
+                                       GLsizei height,
+                                       GLsizei depth,
+                                       GLboolean fixedsamplelocations)
+{
+    CallCapture call(EntryPoint::TexStorage3DMultisampleOES);
+    call.addParam(target);
+    call.addParam(samples);
+    call.addParam(internalformat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    call.addParam(fixedsamplelocations);
+    WriteCallCapture(call);
+}
+
+void CaptureTexStorageMem2DEXT(const Context *context,
+                               GLenum target,
+                               GLsizei levels,
+                               GLenum internalFormat,
+                               GLsizei width,
+                               GLsizei height,
+                               GLuint memory,
+                               GLuint64 offset)
+{
+    CallCapture call(EntryPoint::TexStorageMem2DEXT);
+    call.addParam(target);
+    call.addParam(levels);
+    call.addParam(internalFormat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(memory);
+    call.addParam(offset);
+    WriteCallCapture(call);
+}
+
+void CaptureTexStorageMem2DMultisampleEXT(const Context *context,
+                                          GLenum target,
+                                          GLsizei samples,
+                                          GLenum internalFormat,
+                                          GLsizei width,
+                                          GLsizei height,
+                                          GLboolean fixedSampleLocations,
+                                          GLuint memory,
+                                          GLuint64 offset)
+{
+    CallCapture call(EntryPoint::TexStorageMem2DMultisampleEXT);
+    call.addParam(target);
+    call.addParam(samples);
+    call.addParam(internalFormat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(fixedSampleLocations);
+    call.addParam(memory);
+    call.addParam(offset);
+    WriteCallCapture(call);
+}
+
+void CaptureTexStorageMem3DEXT(const Context *context,
+                               GLenum target,
+                               GLsizei levels,
+                               GLenum internalFormat,
+                               GLsizei width,
+                               GLsizei height,
+                               GLsizei depth,
+                               GLuint memory,
+                               GLuint64 offset)
+{
+    CallCapture call(EntryPoint::TexStorageMem3DEXT);
+    call.addParam(target);
+    call.addParam(levels);
+    call.addParam(internalFormat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    call.addParam(memory);
+    call.addParam(offset);
+    WriteCallCapture(call);
+}
+
+void CaptureTexStorageMem3DMultisampleEXT(const Context *context,
+                                          GLenum target,
+                                          GLsizei samples,
+                                          GLenum internalFormat,
+                                          GLsizei width,
+                                          GLsizei height,
+                                          GLsizei depth,
+                                          GLboolean fixedSampleLocations,
+                                          GLuint memory,
+                                          GLuint64 offset)
+{
+    CallCapture call(EntryPoint::TexStorageMem3DMultisampleEXT);
+    call.addParam(target);
+    call.addParam(samples);
+    call.addParam(internalFormat);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    call.addParam(fixedSampleLocations);
+    call.addParam(memory);
+    call.addParam(offset);
+    WriteCallCapture(call);
+}
+
+void CaptureTexSubImage2D(const Context *context,
+                          GLenum target,
+                          GLint level,
+                          GLint xoffset,
+                          GLint yoffset,
+                          GLsizei width,
+                          GLsizei height,
+                          GLenum format,
+                          GLenum type,
+                          const void *pixels)
+{
+    CallCapture call(EntryPoint::TexSubImage2D);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(xoffset);
+    call.addParam(yoffset);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(format);
+    call.addParam(type);
+    call.addParam(pixels);
+    call.addBlob(8, pixels,
+                 static_cast<size_t>(
+                     GetCaptureTexImageSize(context, format, type, width, height, 1, false)));
+    WriteCallCapture(call);
+}
+
+void CaptureTexSubImage2DRobustANGLE(const Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     const void *pixels)
+{
+    CallCapture call(EntryPoint::TexSubImage2DRobustANGLE);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(xoffset);
+    call.addParam(yoffset);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(format);
+    call.addParam(type);
+    call.addParam(bufSize);
+    call.addParam(pixels);
+    call.addBlob(9, pixels,
+                 static_cast<size_t>(
+                     GetCaptureTexImageSize(context, format, type, width, height, 1, false)));
+    WriteCallCapture(call);
+}
+
+void CaptureTexSubImage3D(const Context *context,
+                          GLenum target,
+                          GLint level,
+                          GLint xoffset,
+                          GLint yoffset,
+                          GLint zoffset,
+                          GLsizei width,
+                          GLsizei height,
+                          GLsizei depth,
+                          GLenum format,
+                          GLenum type,
+                          const void *pixels)
+{
+    CallCapture call(EntryPoint::TexSubImage3D);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(xoffset);
+    call.addParam(yoffset);
+    call.addParam(zoffset);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    call.addParam(format);
+    call.addParam(type);
+    call.addParam(pixels);
+    call.addBlob(10, pixels,
+                 static_cast<size_t>(
+                     GetCaptureTexImageSize(context, format, type, width, height, depth, true)));
+    WriteCallCapture(call);
+}
+
+void CaptureTexSubImage3DRobustANGLE(const Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLint zoffset,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLsizei depth,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     const void *pixels)
+{
+    CallCapture call(EntryPoint::TexSubImage3DRobustANGLE);
+    call.addParam(target);
+    call.addParam(level);
+    call.addParam(xoffset);
+    call.addParam(yoffset);
+    call.addParam(zoffset);
+    call.addParam(width);
+    call.addParam(height);
+    call.addParam(depth);
+    call.addParam(format);
+    call.addParam(type);
+    call.addParam(bufSize);
+    call.addParam(pixels);
+    call.addBlob(11, pixels,
+                 static_cast<size_t>(
+                     GetCaptureTexImageSize(context, format, type, width, height, depth, true)));
+    WriteCallCapture(call);
+}
+
+void CaptureTransformFeedbackVaryings(const Context *context,
+                                      GLuint program,
+                                      GLsizei count,
+                                      const GLchar *const *varyings,
+                                      GLenum bufferMode)
+{
+    CallCapture call(EntryPoint::TransformFeedbackVaryings);
+    call.addParam(program);
+    call.addParam(count);
+    call.addParam(varyings);
+    call.addParam(bufferMode);
+    call.addStrings(2, varyings, count, nullptr);
+    WriteCallCapture(call);
+}
+
+void CaptureTranslatef(const Context *context, GLfloat x, GLfloat y, GLfloat z)
+{
+    CallCapture call(EntryPoint::Translatef);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    WriteCallCapture(call);
+}
+
+void CaptureTranslatex(const Context *context, GLfixed x, GLfixed y, GLfixed z)
+{
+    CallCapture call(EntryPoint::Translatex);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform1f(const Context *context, GLint location, GLfloat v0)
+{
+    CallCapture call(EntryPoint::Uniform1f);
+    call.addParam(location);
+    call.addParam(v0);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform1fv(const Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    CallCapture call(EntryPoint::Uniform1fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>(count * 1 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniform1i(const Context *context, GLint location, GLint v0)
+{
+    CallCapture call(EntryPoint::Uniform1i);
+    call.addParam(location);
+    call.addParam(v0);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform1iv(const Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    CallCapture call(EntryPoint::Uniform1iv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>(count * 1 * sizeof(GLint)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniform1ui(const Context *context, GLint location, GLuint v0)
+{
+    CallCapture call(EntryPoint::Uniform1ui);
+    call.addParam(location);
+    call.addParam(v0);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform1uiv(const Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    CallCapture call(EntryPoint::Uniform1uiv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>(count * 1 * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniform2f(const Context *context, GLint location, GLfloat v0, GLfloat v1)
+{
+    CallCapture call(EntryPoint::Uniform2f);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform2fv(const Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    CallCapture call(EntryPoint::Uniform2fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>(count * 2 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniform2i(const Context *context, GLint location, GLint v0, GLint v1)
+{
+    CallCapture call(EntryPoint::Uniform2i);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform2iv(const Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    CallCapture call(EntryPoint::Uniform2iv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>(count * 2 * sizeof(GLint)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniform2ui(const Context *context, GLint location, GLuint v0, GLuint v1)
+{
+    CallCapture call(EntryPoint::Uniform2ui);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform2uiv(const Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    CallCapture call(EntryPoint::Uniform2uiv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>(count * 2 * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniform3f(const Context *context, GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
+{
+    CallCapture call(EntryPoint::Uniform3f);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    call.addParam(v2);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform3fv(const Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    CallCapture call(EntryPoint::Uniform3fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>(count * 3 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniform3i(const Context *context, GLint location, GLint v0, GLint v1, GLint v2)
+{
+    CallCapture call(EntryPoint::Uniform3i);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    call.addParam(v2);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform3iv(const Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    CallCapture call(EntryPoint::Uniform3iv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>(count * 3 * sizeof(GLint)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniform3ui(const Context *context, GLint location, GLuint v0, GLuint v1, GLuint v2)
+{
+    CallCapture call(EntryPoint::Uniform3ui);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    call.addParam(v2);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform3uiv(const Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    CallCapture call(EntryPoint::Uniform3uiv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>(count * 3 * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniform4f(const Context *context,
+                      GLint location,
+                      GLfloat v0,
+                      GLfloat v1,
+                      GLfloat v2,
+                      GLfloat v3)
+{
+    CallCapture call(EntryPoint::Uniform4f);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    call.addParam(v2);
+    call.addParam(v3);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform4fv(const Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    CallCapture call(EntryPoint::Uniform4fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>(count * 4 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniform4i(const Context *context,
+                      GLint location,
+                      GLint v0,
+                      GLint v1,
+                      GLint v2,
+                      GLint v3)
+{
+    CallCapture call(EntryPoint::Uniform4i);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    call.addParam(v2);
+    call.addParam(v3);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform4iv(const Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    CallCapture call(EntryPoint::Uniform4iv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>(count * 4 * sizeof(GLint)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniform4ui(const Context *context,
+                       GLint location,
+                       GLuint v0,
+                       GLuint v1,
+                       GLuint v2,
+                       GLuint v3)
+{
+    CallCapture call(EntryPoint::Uniform4ui);
+    call.addParam(location);
+    call.addParam(v0);
+    call.addParam(v1);
+    call.addParam(v2);
+    call.addParam(v3);
+    WriteCallCapture(call);
+}
+
+void CaptureUniform4uiv(const Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    CallCapture call(EntryPoint::Uniform4uiv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(value);
+    call.addBlob(2, value, static_cast<size_t>(count * 4 * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniformBlockBinding(const Context *context,
+                                GLuint program,
+                                GLuint uniformBlockIndex,
+                                GLuint uniformBlockBinding)
+{
+    CallCapture call(EntryPoint::UniformBlockBinding);
+    call.addParam(program);
+    call.addParam(uniformBlockIndex);
+    call.addParam(uniformBlockBinding);
+    WriteCallCapture(call);
+}
+
+void CaptureUniformMatrix2fv(const Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    CallCapture call(EntryPoint::UniformMatrix2fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 4 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniformMatrix2x3fv(const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    CallCapture call(EntryPoint::UniformMatrix2x3fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 6 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniformMatrix2x4fv(const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    CallCapture call(EntryPoint::UniformMatrix2x4fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 8 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniformMatrix3fv(const Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    CallCapture call(EntryPoint::UniformMatrix3fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 9 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniformMatrix3x2fv(const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    CallCapture call(EntryPoint::UniformMatrix3x2fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 6 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniformMatrix3x4fv(const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    CallCapture call(EntryPoint::UniformMatrix3x4fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 12 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniformMatrix4fv(const Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    CallCapture call(EntryPoint::UniformMatrix4fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 16 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniformMatrix4x2fv(const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    CallCapture call(EntryPoint::UniformMatrix4x2fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 8 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUniformMatrix4x3fv(const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    CallCapture call(EntryPoint::UniformMatrix4x3fv);
+    call.addParam(location);
+    call.addParam(count);
+    call.addParam(transpose);
+    call.addParam(value);
+    call.addBlob(3, value, static_cast<size_t>(count * 12 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureUnmapBuffer(const Context *context, GLenum target)
+{
+    CallCapture call(EntryPoint::UnmapBuffer);
+    call.addParam(target);
+    WriteCallCapture(call);
+}
+
+void CaptureUnmapBufferOES(const Context *context, GLenum target)
+{
+    CallCapture call(EntryPoint::UnmapBufferOES);
+    call.addParam(target);
+    WriteCallCapture(call);
+}
+
+void CaptureUseProgram(const Context *context, GLuint program)
+{
+    CallCapture call(EntryPoint::UseProgram);
+    call.addParam(program);
+    WriteCallCapture(call);
+}
+
+void CaptureUseProgramStages(const Context *context,
+                             GLuint pipeline,
+                             GLbitfield stages,
+                             GLuint program)
+{
+    CallCapture call(EntryPoint::UseProgramStages);
+    call.addParam(pipeline);
+    call.addParam(stages);
+    call.addParam(program);
+    WriteCallCapture(call);
+}
+
+void CaptureValidateProgram(const Context *context, GLuint program)
+{
+    CallCapture call(EntryPoint::ValidateProgram);
+    call.addParam(program);
+    WriteCallCapture(call);
+}
+
+void CaptureValidateProgramPipeline(const Context *context, GLuint pipeline)
+{
+    CallCapture call(EntryPoint::ValidateProgramPipeline);
+    call.addParam(pipeline);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttrib1f(const Context *context, GLuint index, GLfloat x)
+{
+    CallCapture call(EntryPoint::VertexAttrib1f);
+    call.addParam(index);
+    call.addParam(x);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttrib1fv(const Context *context, GLuint index, const GLfloat *v)
+{
+    CallCapture call(EntryPoint::VertexAttrib1fv);
+    call.addParam(index);
+    call.addParam(v);
+    call.addBlob(1, v, static_cast<size_t>(1 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttrib2f(const Context *context, GLuint index, GLfloat x, GLfloat y)
+{
+    CallCapture call(EntryPoint::VertexAttrib2f);
+    call.addParam(index);
+    call.addParam(x);
+    call.addParam(y);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttrib2fv(const Context *context, GLuint index, const GLfloat *v)
+{
+    CallCapture call(EntryPoint::VertexAttrib2fv);
+    call.addParam(index);
+    call.addParam(v);
+    call.addBlob(1, v, static_cast<size_t>(2 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttrib3f(const Context *context, GLuint index, GLfloat x, GLfloat y, GLfloat z)
+{
+    CallCapture call(EntryPoint::VertexAttrib3f);
+    call.addParam(index);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttrib3fv(const Context *context, GLuint index, const GLfloat *v)
+{
+    CallCapture call(EntryPoint::VertexAttrib3fv);
+    call.addParam(index);
+    call.addParam(v);
+    call.addBlob(1, v, static_cast<size_t>(3 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttrib4f(const Context *context,
+                           GLuint index,
+                           GLfloat x,
+                           GLfloat y,
+                           GLfloat z,
+                           GLfloat w)
+{
+    CallCapture call(EntryPoint::VertexAttrib4f);
+    call.addParam(index);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    call.addParam(w);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttrib4fv(const Context *context, GLuint index, const GLfloat *v)
+{
+    CallCapture call(EntryPoint::VertexAttrib4fv);
+    call.addParam(index);
+    call.addParam(v);
+    call.addBlob(1, v, static_cast<size_t>(4 * sizeof(GLfloat)));
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttribBinding(const Context *context, GLuint attribindex, GLuint bindingindex)
+{
+    CallCapture call(EntryPoint::VertexAttribBinding);
+    call.addParam(attribindex);
+    call.addParam(bindingindex);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttribDivisor(const Context *context, GLuint index, GLuint divisor)
+{
+    CallCapture call(EntryPoint::VertexAttribDivisor);
+    call.addParam(index);
+    call.addParam(divisor);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttribDivisorANGLE(const Context *context, GLuint index, GLuint divisor)
+{
+    CallCapture call(EntryPoint::VertexAttribDivisorANGLE);
+    call.addParam(index);
+    call.addParam(divisor);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttribDivisorEXT(const Context *context, GLuint index, GLuint divisor)
+{
+    CallCapture call(EntryPoint::VertexAttribDivisorEXT);
+    call.addParam(index);
+    call.addParam(divisor);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttribFormat(const Context *context,
+                               GLuint attribindex,
+                               GLint size,
+                               GLenum type,
+                               GLboolean normalized,
+                               GLuint relativeoffset)
+{
+    CallCapture call(EntryPoint::VertexAttribFormat);
+    call.addParam(attribindex);
+    call.addParam(size);
+    call.addParam(type);
+    call.addParam(normalized);
+    call.addParam(relativeoffset);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttribI4i(const Context *context,
+                            GLuint index,
+                            GLint x,
+                            GLint y,
+                            GLint z,
+                            GLint w)
+{
+    CallCapture call(EntryPoint::VertexAttribI4i);
+    call.addParam(index);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    call.addParam(w);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttribI4iv(const Context *context, GLuint index, const GLint *v)
+{
+    CallCapture call(EntryPoint::VertexAttribI4iv);
+    call.addParam(index);
+    call.addParam(v);
+    call.addBlob(1, v, static_cast<size_t>(4 * sizeof(GLint)));
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttribI4ui(const Context *context,
+                             GLuint index,
+                             GLuint x,
+                             GLuint y,
+                             GLuint z,
+                             GLuint w)
+{
+    CallCapture call(EntryPoint::VertexAttribI4ui);
+    call.addParam(index);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(z);
+    call.addParam(w);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttribI4uiv(const Context *context, GLuint index, const GLuint *v)
+{
+    CallCapture call(EntryPoint::VertexAttribI4uiv);
+    call.addParam(index);
+    call.addParam(v);
+    call.addBlob(1, v, static_cast<size_t>(4 * sizeof(GLuint)));
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttribIFormat(const Context *context,
+                                GLuint attribindex,
+                                GLint size,
+                                GLenum type,
+                                GLuint relativeoffset)
+{
+    CallCapture call(EntryPoint::VertexAttribIFormat);
+    call.addParam(attribindex);
+    call.addParam(size);
+    call.addParam(type);
+    call.addParam(relativeoffset);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttribIPointer(const Context *context,
+                                 GLuint index,
+                                 GLint size,
+                                 GLenum type,
+                                 GLsizei stride,
+                                 const void *pointer)
+{
+    CallCapture call(EntryPoint::VertexAttribIPointer);
+    call.addParam(index);
+    call.addParam(size);
+    call.addParam(type);
+    call.addParam(stride);
+    call.addParam(pointer);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexAttribPointer(const Context *context,
+                                GLuint index,
+                                GLint size,
+                                GLenum type,
+                                GLboolean normalized,
+                                GLsizei stride,
+                                const void *pointer)
+{
+    CallCapture call(EntryPoint::VertexAttribPointer);
+    call.addParam(index);
+    call.addParam(size);
+    call.addParam(type);
+    call.addParam(normalized);
+    call.addParam(stride);
+    call.addParam(pointer);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexBindingDivisor(const Context *context, GLuint bindingindex, GLuint divisor)
+{
+    CallCapture call(EntryPoint::VertexBindingDivisor);
+    call.addParam(bindingindex);
+    call.addParam(divisor);
+    WriteCallCapture(call);
+}
+
+void CaptureVertexPointer(const Context *context,
+                          GLint size,
+                          GLenum type,
+                          GLsizei stride,
+                          const void *pointer)
+{
+    CallCapture call(EntryPoint::VertexPointer);
+    call.addParam(size);
+    call.addParam(type);
+    call.addParam(stride);
+    call.addParam(pointer);
+    WriteCallCapture(call);
+}
+
+void CaptureViewport(const Context *context, GLint x, GLint y, GLsizei width, GLsizei height)
+{
+    CallCapture call(EntryPoint::Viewport);
+    call.addParam(x);
+    call.addParam(y);
+    call.addParam(width);
+    call.addParam(height);
+    WriteCallCapture(call);
+}
+
+void CaptureWaitSemaphoreEXT(const Context *context,
+                             GLuint semaphore,
+                             GLuint numBufferBarriers,
+                             const GLuint *buffers,
+                             GLuint numTextureBarriers,
+                             const GLuint *textures,
+                             const GLenum *srcLayouts)
+{
+    CallCapture call(EntryPoint::WaitSemaphoreEXT);
+    call.addParam(semaphore);
+    call.addParam(numBufferBarriers);
+    call.addParam(buffers);
+    call.addParam(numTextureBarriers);
+    call.addParam(textures);
+    call.addParam(srcLayouts);
+    WriteCallCapture(call);
+}
+
+void CaptureWaitSync(const Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout)
+{
+    CallCapture call(EntryPoint::WaitSync);
+    call.addParam(sync);
+    call.addParam(flags);
+    call.addParam(timeout);
+    WriteCallCapture(call);
+}
+
+void CaptureWeightPointerOES(const Context *context,
+                             GLint size,
+                             GLenum type,
+                             GLsizei stride,
+                             const void *pointer)
+{
+    CallCapture call(EntryPoint::WeightPointerOES);
+    call.addParam(size);
+    call.addParam(type);
+    call.addParam(stride);
+    call.addParam(pointer);
+    WriteCallCapture(call);
+}
+
+}  // namespace gl
+
+#endif  // ANGLE_CAPTURE == ANGLE_ENABLED
@@ -0,0 +1,2256 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml, gl_angle_ext.xml and
+// entry_point_capture_params.json.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_capture_autogen.h:
+//   Captures of the GLES entry points.
+
+#ifndef LIBGLESV2_ENTRY_POINTS_CAPTURE_AUTOGEN_H_
+#define LIBGLESV2_ENTRY_POINTS_CAPTURE_AUTOGEN_H_
+
+#include "angle_gl.h"
+
+namespace gl
+{
+class Context;
+
+void CaptureActiveShaderProgram(const Context *context, GLuint pipeline, GLuint program);
+void CaptureActiveTexture(const Context *context, GLenum texture);
+void CaptureAlphaFunc(const Context *context, GLenum func, GLfloat ref);
+void CaptureAlphaFuncx(const Context *context, GLenum func, GLfixed ref);
+void CaptureAttachShader(const Context *context, GLuint program, GLuint shader);
+void CaptureBeginQuery(const Context *context, GLenum target, GLuint id);
+void CaptureBeginQueryEXT(const Context *context, GLenum target, GLuint id);
+void CaptureBeginTransformFeedback(const Context *context, GLenum primitiveMode);
+void CaptureBindAttribLocation(const Context *context,
+                               GLuint program,
+                               GLuint index,
+                               const GLchar *name);
+void CaptureBindBuffer(const Context *context, GLenum target, GLuint buffer);
+void CaptureBindBufferBase(const Context *context, GLenum target, GLuint index, GLuint buffer);
+void CaptureBindBufferRange(const Context *context,
+                            GLenum target,
+                            GLuint index,
+                            GLuint buffer,
+                            GLintptr offset,
+                            GLsizeiptr size);
+void CaptureBindFragDataLocationEXT(const Context *context,
+                                    GLuint program,
+                                    GLuint color,
+                                    const GLchar *name);
+void CaptureBindFragDataLocationIndexedEXT(const Context *context,
+                                           GLuint program,
+                                           GLuint colorNumber,
+                                           GLuint index,
+                                           const GLchar *name);
+void CaptureBindFragmentInputLocationCHROMIUM(const Context *context,
+                                              GLuint programs,
+                                              GLint location,
+                                              const GLchar *name);
+void CaptureBindFramebuffer(const Context *context, GLenum target, GLuint framebuffer);
+void CaptureBindFramebufferOES(const Context *context, GLenum target, GLuint framebuffer);
+void CaptureBindImageTexture(const Context *context,
+                             GLuint unit,
+                             GLuint texture,
+                             GLint level,
+                             GLboolean layered,
+                             GLint layer,
+                             GLenum access,
+                             GLenum format);
+void CaptureBindProgramPipeline(const Context *context, GLuint pipeline);
+void CaptureBindRenderbuffer(const Context *context, GLenum target, GLuint renderbuffer);
+void CaptureBindRenderbufferOES(const Context *context, GLenum target, GLuint renderbuffer);
+void CaptureBindSampler(const Context *context, GLuint unit, GLuint sampler);
+void CaptureBindTexture(const Context *context, GLenum target, GLuint texture);
+void CaptureBindTransformFeedback(const Context *context, GLenum target, GLuint id);
+void CaptureBindUniformLocationCHROMIUM(const Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        const GLchar *name);
+void CaptureBindVertexArray(const Context *context, GLuint array);
+void CaptureBindVertexArrayOES(const Context *context, GLuint array);
+void CaptureBindVertexBuffer(const Context *context,
+                             GLuint bindingindex,
+                             GLuint buffer,
+                             GLintptr offset,
+                             GLsizei stride);
+void CaptureBlendColor(const Context *context,
+                       GLfloat red,
+                       GLfloat green,
+                       GLfloat blue,
+                       GLfloat alpha);
+void CaptureBlendEquation(const Context *context, GLenum mode);
+void CaptureBlendEquationSeparate(const Context *context, GLenum modeRGB, GLenum modeAlpha);
+void CaptureBlendFunc(const Context *context, GLenum sfactor, GLenum dfactor);
+void CaptureBlendFuncSeparate(const Context *context,
+                              GLenum sfactorRGB,
+                              GLenum dfactorRGB,
+                              GLenum sfactorAlpha,
+                              GLenum dfactorAlpha);
+void CaptureBlitFramebuffer(const Context *context,
+                            GLint srcX0,
+                            GLint srcY0,
+                            GLint srcX1,
+                            GLint srcY1,
+                            GLint dstX0,
+                            GLint dstY0,
+                            GLint dstX1,
+                            GLint dstY1,
+                            GLbitfield mask,
+                            GLenum filter);
+void CaptureBlitFramebufferANGLE(const Context *context,
+                                 GLint srcX0,
+                                 GLint srcY0,
+                                 GLint srcX1,
+                                 GLint srcY1,
+                                 GLint dstX0,
+                                 GLint dstY0,
+                                 GLint dstX1,
+                                 GLint dstY1,
+                                 GLbitfield mask,
+                                 GLenum filter);
+void CaptureBufferData(const Context *context,
+                       GLenum target,
+                       GLsizeiptr size,
+                       const void *data,
+                       GLenum usage);
+void CaptureBufferStorageMemEXT(const Context *context,
+                                GLenum target,
+                                GLsizeiptr size,
+                                GLuint memory,
+                                GLuint64 offset);
+void CaptureBufferSubData(const Context *context,
+                          GLenum target,
+                          GLintptr offset,
+                          GLsizeiptr size,
+                          const void *data);
+void CaptureCheckFramebufferStatus(const Context *context, GLenum target);
+void CaptureCheckFramebufferStatusOES(const Context *context, GLenum target);
+void CaptureClear(const Context *context, GLbitfield mask);
+void CaptureClearBufferfi(const Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          GLfloat depth,
+                          GLint stencil);
+void CaptureClearBufferfv(const Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          const GLfloat *value);
+void CaptureClearBufferiv(const Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          const GLint *value);
+void CaptureClearBufferuiv(const Context *context,
+                           GLenum buffer,
+                           GLint drawbuffer,
+                           const GLuint *value);
+void CaptureClearColor(const Context *context,
+                       GLfloat red,
+                       GLfloat green,
+                       GLfloat blue,
+                       GLfloat alpha);
+void CaptureClearColorx(const Context *context,
+                        GLfixed red,
+                        GLfixed green,
+                        GLfixed blue,
+                        GLfixed alpha);
+void CaptureClearDepthf(const Context *context, GLfloat d);
+void CaptureClearDepthx(const Context *context, GLfixed depth);
+void CaptureClearStencil(const Context *context, GLint s);
+void CaptureClientActiveTexture(const Context *context, GLenum texture);
+void CaptureClientWaitSync(const Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout);
+void CaptureClipPlanef(const Context *context, GLenum p, const GLfloat *eqn);
+void CaptureClipPlanex(const Context *context, GLenum plane, const GLfixed *equation);
+void CaptureColor4f(const Context *context,
+                    GLfloat red,
+                    GLfloat green,
+                    GLfloat blue,
+                    GLfloat alpha);
+void CaptureColor4ub(const Context *context,
+                     GLubyte red,
+                     GLubyte green,
+                     GLubyte blue,
+                     GLubyte alpha);
+void CaptureColor4x(const Context *context,
+                    GLfixed red,
+                    GLfixed green,
+                    GLfixed blue,
+                    GLfixed alpha);
+void CaptureColorMask(const Context *context,
+                      GLboolean red,
+                      GLboolean green,
+                      GLboolean blue,
+                      GLboolean alpha);
+void CaptureColorPointer(const Context *context,
+                         GLint size,
+                         GLenum type,
+                         GLsizei stride,
+                         const void *pointer);
+void CaptureCompileShader(const Context *context, GLuint shader);
+void CaptureCompressedCopyTextureCHROMIUM(const Context *context, GLuint sourceId, GLuint destId);
+void CaptureCompressedTexImage2D(const Context *context,
+                                 GLenum target,
+                                 GLint level,
+                                 GLenum internalformat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLint border,
+                                 GLsizei imageSize,
+                                 const void *data);
+void CaptureCompressedTexImage2DRobustANGLE(const Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum internalformat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLint border,
+                                            GLsizei imageSize,
+                                            GLsizei dataSize,
+                                            const GLvoid *data);
+void CaptureCompressedTexImage3D(const Context *context,
+                                 GLenum target,
+                                 GLint level,
+                                 GLenum internalformat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLsizei depth,
+                                 GLint border,
+                                 GLsizei imageSize,
+                                 const void *data);
+void CaptureCompressedTexImage3DRobustANGLE(const Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum internalformat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLsizei depth,
+                                            GLint border,
+                                            GLsizei imageSize,
+                                            GLsizei dataSize,
+                                            const GLvoid *data);
+void CaptureCompressedTexSubImage2D(const Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLenum format,
+                                    GLsizei imageSize,
+                                    const void *data);
+void CaptureCompressedTexSubImage2DRobustANGLE(const Context *context,
+                                               GLenum target,
+                                               GLint level,
+                                               GLsizei xoffset,
+                                               GLsizei yoffset,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLenum format,
+                                               GLsizei imageSize,
+                                               GLsizei dataSize,
+                                               const GLvoid *data);
+void CaptureCompressedTexSubImage3D(const Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLint zoffset,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLsizei depth,
+                                    GLenum format,
+                                    GLsizei imageSize,
+                                    const void *data);
+void CaptureCompressedTexSubImage3DRobustANGLE(const Context *context,
+                                               GLenum target,
+                                               GLint level,
+                                               GLint xoffset,
+                                               GLint yoffset,
+                                               GLint zoffset,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLsizei depth,
+                                               GLenum format,
+                                               GLsizei imageSize,
+                                               GLsizei dataSize,
+                                               const GLvoid *data);
+void CaptureCopyBufferSubData(const Context *context,
+                              GLenum readTarget,
+                              GLenum writeTarget,
+                              GLintptr readOffset,
+                              GLintptr writeOffset,
+                              GLsizeiptr size);
+void CaptureCopySubTexture3DANGLE(const Context *context,
+                                  GLuint sourceId,
+                                  GLint sourceLevel,
+                                  GLenum destTarget,
+                                  GLuint destId,
+                                  GLint destLevel,
+                                  GLint xoffset,
+                                  GLint yoffset,
+                                  GLint zoffset,
+                                  GLint x,
+                                  GLint y,
+                                  GLint z,
+                                  GLint width,
+                                  GLint height,
+                                  GLint depth,
+                                  GLboolean unpackFlipY,
+                                  GLboolean unpackPremultiplyAlpha,
+                                  GLboolean unpackUnmultiplyAlpha);
+void CaptureCopySubTextureCHROMIUM(const Context *context,
+                                   GLuint sourceId,
+                                   GLint sourceLevel,
+                                   GLenum destTarget,
+                                   GLuint destId,
+                                   GLint destLevel,
+                                   GLint xoffset,
+                                   GLint yoffset,
+                                   GLint x,
+                                   GLint y,
+                                   GLint width,
+                                   GLint height,
+                                   GLboolean unpackFlipY,
+                                   GLboolean unpackPremultiplyAlpha,
+                                   GLboolean unpackUnmultiplyAlpha);
+void CaptureCopyTexImage2D(const Context *context,
+                           GLenum target,
+                           GLint level,
+                           GLenum internalformat,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLint border);
+void CaptureCopyTexSubImage2D(const Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint x,
+                              GLint y,
+                              GLsizei width,
+                              GLsizei height);
+void CaptureCopyTexSubImage3D(const Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint zoffset,
+                              GLint x,
+                              GLint y,
+                              GLsizei width,
+                              GLsizei height);
+void CaptureCopyTexture3DANGLE(const Context *context,
+                               GLuint sourceId,
+                               GLint sourceLevel,
+                               GLenum destTarget,
+                               GLuint destId,
+                               GLint destLevel,
+                               GLint internalFormat,
+                               GLenum destType,
+                               GLboolean unpackFlipY,
+                               GLboolean unpackPremultiplyAlpha,
+                               GLboolean unpackUnmultiplyAlpha);
+void CaptureCopyTextureCHROMIUM(const Context *context,
+                                GLuint sourceId,
+                                GLint sourceLevel,
+                                GLenum destTarget,
+                                GLuint destId,
+                                GLint destLevel,
+                                GLint internalFormat,
+                                GLenum destType,
+                                GLboolean unpackFlipY,
+                                GLboolean unpackPremultiplyAlpha,
+                                GLboolean unpackUnmultiplyAlpha);
+void CaptureCoverFillPathCHROMIUM(const Context *context, GLuint path, GLenum coverMode);
+void CaptureCoverFillPathInstancedCHROMIUM(const Context *context,
+                                           GLsizei numPath,
+                                           GLenum pathNameType,
+                                           const void *paths,
+                                           GLuint pathBase,
+                                           GLenum coverMode,
+                                           GLenum transformType,
+                                           const GLfloat *transformValues);
+void CaptureCoverStrokePathCHROMIUM(const Context *context, GLuint path, GLenum coverMode);
+void CaptureCoverStrokePathInstancedCHROMIUM(const Context *context,
+                                             GLsizei numPath,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum coverMode,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues);
+void CaptureCoverageModulationCHROMIUM(const Context *context, GLenum components);
+void CaptureCreateMemoryObjectsEXT(const Context *context, GLsizei n, GLuint *memoryObjects);
+void CaptureCreateProgram(const Context *context);
+void CaptureCreateShader(const Context *context, GLenum type);
+void CaptureCreateShaderProgramv(const Context *context,
+                                 GLenum type,
+                                 GLsizei count,
+                                 const GLchar *const *strings);
+void CaptureCullFace(const Context *context, GLenum mode);
+void CaptureCurrentPaletteMatrixOES(const Context *context, GLuint matrixpaletteindex);
+void CaptureDebugMessageCallbackKHR(const Context *context,
+                                    GLDEBUGPROCKHR callback,
+                                    const void *userParam);
+void CaptureDebugMessageControlKHR(const Context *context,
+                                   GLenum source,
+                                   GLenum type,
+                                   GLenum severity,
+                                   GLsizei count,
+                                   const GLuint *ids,
+                                   GLboolean enabled);
+void CaptureDebugMessageInsertKHR(const Context *context,
+                                  GLenum source,
+                                  GLenum type,
+                                  GLuint id,
+                                  GLenum severity,
+                                  GLsizei length,
+                                  const GLchar *buf);
+void CaptureDeleteBuffers(const Context *context, GLsizei n, const GLuint *buffers);
+void CaptureDeleteFencesNV(const Context *context, GLsizei n, const GLuint *fences);
+void CaptureDeleteFramebuffers(const Context *context, GLsizei n, const GLuint *framebuffers);
+void CaptureDeleteFramebuffersOES(const Context *context, GLsizei n, const GLuint *framebuffers);
+void CaptureDeleteMemoryObjectsEXT(const Context *context, GLsizei n, const GLuint *memoryObjects);
+void CaptureDeletePathsCHROMIUM(const Context *context, GLuint first, GLsizei range);
+void CaptureDeleteProgram(const Context *context, GLuint program);
+void CaptureDeleteProgramPipelines(const Context *context, GLsizei n, const GLuint *pipelines);
+void CaptureDeleteQueries(const Context *context, GLsizei n, const GLuint *ids);
+void CaptureDeleteQueriesEXT(const Context *context, GLsizei n, const GLuint *ids);
+void CaptureDeleteRenderbuffers(const Context *context, GLsizei n, const GLuint *renderbuffers);
+void CaptureDeleteRenderbuffersOES(const Context *context, GLsizei n, const GLuint *renderbuffers);
+void CaptureDeleteSamplers(const Context *context, GLsizei count, const GLuint *samplers);
+void CaptureDeleteSemaphoresEXT(const Context *context, GLsizei n, const GLuint *semaphores);
+void CaptureDeleteShader(const Context *context, GLuint shader);
+void CaptureDeleteSync(const Context *context, GLsync sync);
+void CaptureDeleteTextures(const Context *context, GLsizei n, const GLuint *textures);
+void CaptureDeleteTransformFeedbacks(const Context *context, GLsizei n, const GLuint *ids);
+void CaptureDeleteVertexArrays(const Context *context, GLsizei n, const GLuint *arrays);
+void CaptureDeleteVertexArraysOES(const Context *context, GLsizei n, const GLuint *arrays);
+void CaptureDepthFunc(const Context *context, GLenum func);
+void CaptureDepthMask(const Context *context, GLboolean flag);
+void CaptureDepthRangef(const Context *context, GLfloat n, GLfloat f);
+void CaptureDepthRangex(const Context *context, GLfixed n, GLfixed f);
+void CaptureDetachShader(const Context *context, GLuint program, GLuint shader);
+void CaptureDisable(const Context *context, GLenum cap);
+void CaptureDisableClientState(const Context *context, GLenum array);
+void CaptureDisableVertexAttribArray(const Context *context, GLuint index);
+void CaptureDiscardFramebufferEXT(const Context *context,
+                                  GLenum target,
+                                  GLsizei numAttachments,
+                                  const GLenum *attachments);
+void CaptureDispatchCompute(const Context *context,
+                            GLuint num_groups_x,
+                            GLuint num_groups_y,
+                            GLuint num_groups_z);
+void CaptureDispatchComputeIndirect(const Context *context, GLintptr indirect);
+void CaptureDrawArrays(const Context *context, GLenum mode, GLint first, GLsizei count);
+void CaptureDrawArraysIndirect(const Context *context, GLenum mode, const void *indirect);
+void CaptureDrawArraysInstanced(const Context *context,
+                                GLenum mode,
+                                GLint first,
+                                GLsizei count,
+                                GLsizei instancecount);
+void CaptureDrawArraysInstancedANGLE(const Context *context,
+                                     GLenum mode,
+                                     GLint first,
+                                     GLsizei count,
+                                     GLsizei primcount);
+void CaptureDrawArraysInstancedEXT(const Context *context,
+                                   GLenum mode,
+                                   GLint start,
+                                   GLsizei count,
+                                   GLsizei primcount);
+void CaptureDrawBuffers(const Context *context, GLsizei n, const GLenum *bufs);
+void CaptureDrawBuffersEXT(const Context *context, GLsizei n, const GLenum *bufs);
+void CaptureDrawElements(const Context *context,
+                         GLenum mode,
+                         GLsizei count,
+                         GLenum type,
+                         const void *indices);
+void CaptureDrawElementsIndirect(const Context *context,
+                                 GLenum mode,
+                                 GLenum type,
+                                 const void *indirect);
+void CaptureDrawElementsInstanced(const Context *context,
+                                  GLenum mode,
+                                  GLsizei count,
+                                  GLenum type,
+                                  const void *indices,
+                                  GLsizei instancecount);
+void CaptureDrawElementsInstancedANGLE(const Context *context,
+                                       GLenum mode,
+                                       GLsizei count,
+                                       GLenum type,
+                                       const void *indices,
+                                       GLsizei primcount);
+void CaptureDrawElementsInstancedEXT(const Context *context,
+                                     GLenum mode,
+                                     GLsizei count,
+                                     GLenum type,
+                                     const void *indices,
+                                     GLsizei primcount);
+void CaptureDrawRangeElements(const Context *context,
+                              GLenum mode,
+                              GLuint start,
+                              GLuint end,
+                              GLsizei count,
+                              GLenum type,
+                              const void *indices);
+void CaptureDrawTexfOES(const Context *context,
+                        GLfloat x,
+                        GLfloat y,
+                        GLfloat z,
+                        GLfloat width,
+                        GLfloat height);
+void CaptureDrawTexfvOES(const Context *context, const GLfloat *coords);
+void CaptureDrawTexiOES(const Context *context,
+                        GLint x,
+                        GLint y,
+                        GLint z,
+                        GLint width,
+                        GLint height);
+void CaptureDrawTexivOES(const Context *context, const GLint *coords);
+void CaptureDrawTexsOES(const Context *context,
+                        GLshort x,
+                        GLshort y,
+                        GLshort z,
+                        GLshort width,
+                        GLshort height);
+void CaptureDrawTexsvOES(const Context *context, const GLshort *coords);
+void CaptureDrawTexxOES(const Context *context,
+                        GLfixed x,
+                        GLfixed y,
+                        GLfixed z,
+                        GLfixed width,
+                        GLfixed height);
+void CaptureDrawTexxvOES(const Context *context, const GLfixed *coords);
+void CaptureEGLImageTargetRenderbufferStorageOES(const Context *context,
+                                                 GLenum target,
+                                                 GLeglImageOES image);
+void CaptureEGLImageTargetTexture2DOES(const Context *context, GLenum target, GLeglImageOES image);
+void CaptureEnable(const Context *context, GLenum cap);
+void CaptureEnableClientState(const Context *context, GLenum array);
+void CaptureEnableVertexAttribArray(const Context *context, GLuint index);
+void CaptureEndQuery(const Context *context, GLenum target);
+void CaptureEndQueryEXT(const Context *context, GLenum target);
+void CaptureEndTransformFeedback(const Context *context);
+void CaptureFenceSync(const Context *context, GLenum condition, GLbitfield flags);
+void CaptureFinish(const Context *context);
+void CaptureFinishFenceNV(const Context *context, GLuint fence);
+void CaptureFlush(const Context *context);
+void CaptureFlushMappedBufferRange(const Context *context,
+                                   GLenum target,
+                                   GLintptr offset,
+                                   GLsizeiptr length);
+void CaptureFlushMappedBufferRangeEXT(const Context *context,
+                                      GLenum target,
+                                      GLintptr offset,
+                                      GLsizeiptr length);
+void CaptureFogf(const Context *context, GLenum pname, GLfloat param);
+void CaptureFogfv(const Context *context, GLenum pname, const GLfloat *params);
+void CaptureFogx(const Context *context, GLenum pname, GLfixed param);
+void CaptureFogxv(const Context *context, GLenum pname, const GLfixed *param);
+void CaptureFramebufferParameteri(const Context *context, GLenum target, GLenum pname, GLint param);
+void CaptureFramebufferRenderbuffer(const Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLenum renderbuffertarget,
+                                    GLuint renderbuffer);
+void CaptureFramebufferRenderbufferOES(const Context *context,
+                                       GLenum target,
+                                       GLenum attachment,
+                                       GLenum renderbuffertarget,
+                                       GLuint renderbuffer);
+void CaptureFramebufferTexture2D(const Context *context,
+                                 GLenum target,
+                                 GLenum attachment,
+                                 GLenum textarget,
+                                 GLuint texture,
+                                 GLint level);
+void CaptureFramebufferTexture2DOES(const Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLenum textarget,
+                                    GLuint texture,
+                                    GLint level);
+void CaptureFramebufferTextureEXT(const Context *context,
+                                  GLenum target,
+                                  GLenum attachment,
+                                  GLuint texture,
+                                  GLint level);
+void CaptureFramebufferTextureLayer(const Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLuint texture,
+                                    GLint level,
+                                    GLint layer);
+void CaptureFramebufferTextureMultiviewOVR(const Context *context,
+                                           GLenum target,
+                                           GLenum attachment,
+                                           GLuint texture,
+                                           GLint level,
+                                           GLint baseViewIndex,
+                                           GLsizei numViews);
+void CaptureFrontFace(const Context *context, GLenum mode);
+void CaptureFrustumf(const Context *context,
+                     GLfloat l,
+                     GLfloat r,
+                     GLfloat b,
+                     GLfloat t,
+                     GLfloat n,
+                     GLfloat f);
+void CaptureFrustumx(const Context *context,
+                     GLfixed l,
+                     GLfixed r,
+                     GLfixed b,
+                     GLfixed t,
+                     GLfixed n,
+                     GLfixed f);
+void CaptureGenBuffers(const Context *context, GLsizei n, GLuint *buffers);
+void CaptureGenFencesNV(const Context *context, GLsizei n, GLuint *fences);
+void CaptureGenFramebuffers(const Context *context, GLsizei n, GLuint *framebuffers);
+void CaptureGenFramebuffersOES(const Context *context, GLsizei n, GLuint *framebuffers);
+void CaptureGenPathsCHROMIUM(const Context *context, GLsizei range);
+void CaptureGenProgramPipelines(const Context *context, GLsizei n, GLuint *pipelines);
+void CaptureGenQueries(const Context *context, GLsizei n, GLuint *ids);
+void CaptureGenQueriesEXT(const Context *context, GLsizei n, GLuint *ids);
+void CaptureGenRenderbuffers(const Context *context, GLsizei n, GLuint *renderbuffers);
+void CaptureGenRenderbuffersOES(const Context *context, GLsizei n, GLuint *renderbuffers);
+void CaptureGenSamplers(const Context *context, GLsizei count, GLuint *samplers);
+void CaptureGenSemaphoresEXT(const Context *context, GLsizei n, GLuint *semaphores);
+void CaptureGenTextures(const Context *context, GLsizei n, GLuint *textures);
+void CaptureGenTransformFeedbacks(const Context *context, GLsizei n, GLuint *ids);
+void CaptureGenVertexArrays(const Context *context, GLsizei n, GLuint *arrays);
+void CaptureGenVertexArraysOES(const Context *context, GLsizei n, GLuint *arrays);
+void CaptureGenerateMipmap(const Context *context, GLenum target);
+void CaptureGenerateMipmapOES(const Context *context, GLenum target);
+void CaptureGetActiveAttrib(const Context *context,
+                            GLuint program,
+                            GLuint index,
+                            GLsizei bufSize,
+                            GLsizei *length,
+                            GLint *size,
+                            GLenum *type,
+                            GLchar *name);
+void CaptureGetActiveUniform(const Context *context,
+                             GLuint program,
+                             GLuint index,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLint *size,
+                             GLenum *type,
+                             GLchar *name);
+void CaptureGetActiveUniformBlockName(const Context *context,
+                                      GLuint program,
+                                      GLuint uniformBlockIndex,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLchar *uniformBlockName);
+void CaptureGetActiveUniformBlockiv(const Context *context,
+                                    GLuint program,
+                                    GLuint uniformBlockIndex,
+                                    GLenum pname,
+                                    GLint *params);
+void CaptureGetActiveUniformBlockivRobustANGLE(const Context *context,
+                                               GLuint program,
+                                               GLuint uniformBlockIndex,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLint *params);
+void CaptureGetActiveUniformsiv(const Context *context,
+                                GLuint program,
+                                GLsizei uniformCount,
+                                const GLuint *uniformIndices,
+                                GLenum pname,
+                                GLint *params);
+void CaptureGetAttachedShaders(const Context *context,
+                               GLuint program,
+                               GLsizei maxCount,
+                               GLsizei *count,
+                               GLuint *shaders);
+void CaptureGetAttribLocation(const Context *context, GLuint program, const GLchar *name);
+void CaptureGetBooleani_v(const Context *context, GLenum target, GLuint index, GLboolean *data);
+void CaptureGetBooleani_vRobustANGLE(const Context *context,
+                                     GLenum target,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLboolean *data);
+void CaptureGetBooleanv(const Context *context, GLenum pname, GLboolean *data);
+void CaptureGetBooleanvRobustANGLE(const Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLboolean *params);
+void CaptureGetBufferParameteri64v(const Context *context,
+                                   GLenum target,
+                                   GLenum pname,
+                                   GLint64 *params);
+void CaptureGetBufferParameteri64vRobustANGLE(const Context *context,
+                                              GLenum target,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint64 *params);
+void CaptureGetBufferParameteriv(const Context *context,
+                                 GLenum target,
+                                 GLenum pname,
+                                 GLint *params);
+void CaptureGetBufferParameterivRobustANGLE(const Context *context,
+                                            GLenum target,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            GLsizei *length,
+                                            GLint *params);
+void CaptureGetBufferPointerv(const Context *context, GLenum target, GLenum pname, void **params);
+void CaptureGetBufferPointervOES(const Context *context,
+                                 GLenum target,
+                                 GLenum pname,
+                                 void **params);
+void CaptureGetBufferPointervRobustANGLE(const Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         void **params);
+void CaptureGetClipPlanef(const Context *context, GLenum plane, GLfloat *equation);
+void CaptureGetClipPlanex(const Context *context, GLenum plane, GLfixed *equation);
+void CaptureGetDebugMessageLogKHR(const Context *context,
+                                  GLuint count,
+                                  GLsizei bufSize,
+                                  GLenum *sources,
+                                  GLenum *types,
+                                  GLuint *ids,
+                                  GLenum *severities,
+                                  GLsizei *lengths,
+                                  GLchar *messageLog);
+void CaptureGetError(const Context *context);
+void CaptureGetFenceivNV(const Context *context, GLuint fence, GLenum pname, GLint *params);
+void CaptureGetFixedv(const Context *context, GLenum pname, GLfixed *params);
+void CaptureGetFloatv(const Context *context, GLenum pname, GLfloat *data);
+void CaptureGetFloatvRobustANGLE(const Context *context,
+                                 GLenum pname,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLfloat *params);
+void CaptureGetFragDataIndexEXT(const Context *context, GLuint program, const GLchar *name);
+void CaptureGetFragDataLocation(const Context *context, GLuint program, const GLchar *name);
+void CaptureGetFramebufferAttachmentParameteriv(const Context *context,
+                                                GLenum target,
+                                                GLenum attachment,
+                                                GLenum pname,
+                                                GLint *params);
+void CaptureGetFramebufferAttachmentParameterivOES(const Context *context,
+                                                   GLenum target,
+                                                   GLenum attachment,
+                                                   GLenum pname,
+                                                   GLint *params);
+void CaptureGetFramebufferAttachmentParameterivRobustANGLE(const Context *context,
+                                                           GLenum target,
+                                                           GLenum attachment,
+                                                           GLenum pname,
+                                                           GLsizei bufSize,
+                                                           GLsizei *length,
+                                                           GLint *params);
+void CaptureGetFramebufferParameteriv(const Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLint *params);
+void CaptureGetFramebufferParameterivRobustANGLE(const Context *context,
+                                                 GLuint sampler,
+                                                 GLenum pname,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLint *params);
+void CaptureGetGraphicsResetStatusEXT(const Context *context);
+void CaptureGetInteger64i_v(const Context *context, GLenum target, GLuint index, GLint64 *data);
+void CaptureGetInteger64i_vRobustANGLE(const Context *context,
+                                       GLenum target,
+                                       GLuint index,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLint64 *data);
+void CaptureGetInteger64v(const Context *context, GLenum pname, GLint64 *data);
+void CaptureGetInteger64vRobustANGLE(const Context *context,
+                                     GLenum pname,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint64 *data);
+void CaptureGetIntegeri_v(const Context *context, GLenum target, GLuint index, GLint *data);
+void CaptureGetIntegeri_vRobustANGLE(const Context *context,
+                                     GLenum target,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *data);
+void CaptureGetIntegerv(const Context *context, GLenum pname, GLint *data);
+void CaptureGetIntegervRobustANGLE(const Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *data);
+void CaptureGetInternalformativ(const Context *context,
+                                GLenum target,
+                                GLenum internalformat,
+                                GLenum pname,
+                                GLsizei bufSize,
+                                GLint *params);
+void CaptureGetInternalformativRobustANGLE(const Context *context,
+                                           GLenum target,
+                                           GLenum internalformat,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLint *params);
+void CaptureGetLightfv(const Context *context, GLenum light, GLenum pname, GLfloat *params);
+void CaptureGetLightxv(const Context *context, GLenum light, GLenum pname, GLfixed *params);
+void CaptureGetMaterialfv(const Context *context, GLenum face, GLenum pname, GLfloat *params);
+void CaptureGetMaterialxv(const Context *context, GLenum face, GLenum pname, GLfixed *params);
+void CaptureGetMemoryObjectParameterivEXT(const Context *context,
+                                          GLuint memoryObject,
+                                          GLenum pname,
+                                          GLint *params);
+void CaptureGetMultisamplefv(const Context *context, GLenum pname, GLuint index, GLfloat *val);
+void CaptureGetMultisamplefvANGLE(const Context *context, GLenum pname, GLuint index, GLfloat *val);
+void CaptureGetMultisamplefvRobustANGLE(const Context *context,
+                                        GLenum pname,
+                                        GLuint index,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLfloat *val);
+void CaptureGetObjectLabelKHR(const Context *context,
+                              GLenum identifier,
+                              GLuint name,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *label);
+void CaptureGetObjectPtrLabelKHR(const Context *context,
+                                 const void *ptr,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLchar *label);
+void CaptureGetPathParameterfvCHROMIUM(const Context *context,
+                                       GLuint path,
+                                       GLenum pname,
+                                       GLfloat *value);
+void CaptureGetPathParameterivCHROMIUM(const Context *context,
+                                       GLuint path,
+                                       GLenum pname,
+                                       GLint *value);
+void CaptureGetPointerv(const Context *context, GLenum pname, void **params);
+void CaptureGetPointervKHR(const Context *context, GLenum pname, void **params);
+void CaptureGetPointervRobustANGLERobustANGLE(const Context *context,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              void **params);
+void CaptureGetProgramBinary(const Context *context,
+                             GLuint program,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLenum *binaryFormat,
+                             void *binary);
+void CaptureGetProgramBinaryOES(const Context *context,
+                                GLuint program,
+                                GLsizei bufSize,
+                                GLsizei *length,
+                                GLenum *binaryFormat,
+                                void *binary);
+void CaptureGetProgramInfoLog(const Context *context,
+                              GLuint program,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *infoLog);
+void CaptureGetProgramInterfaceiv(const Context *context,
+                                  GLuint program,
+                                  GLenum programInterface,
+                                  GLenum pname,
+                                  GLint *params);
+void CaptureGetProgramInterfaceivRobustANGLE(const Context *context,
+                                             GLuint program,
+                                             GLenum programInterface,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params);
+void CaptureGetProgramPipelineInfoLog(const Context *context,
+                                      GLuint pipeline,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLchar *infoLog);
+void CaptureGetProgramPipelineiv(const Context *context,
+                                 GLuint pipeline,
+                                 GLenum pname,
+                                 GLint *params);
+void CaptureGetProgramResourceIndex(const Context *context,
+                                    GLuint program,
+                                    GLenum programInterface,
+                                    const GLchar *name);
+void CaptureGetProgramResourceLocation(const Context *context,
+                                       GLuint program,
+                                       GLenum programInterface,
+                                       const GLchar *name);
+void CaptureGetProgramResourceLocationIndexEXT(const Context *context,
+                                               GLuint program,
+                                               GLenum programInterface,
+                                               const GLchar *name);
+void CaptureGetProgramResourceName(const Context *context,
+                                   GLuint program,
+                                   GLenum programInterface,
+                                   GLuint index,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLchar *name);
+void CaptureGetProgramResourceiv(const Context *context,
+                                 GLuint program,
+                                 GLenum programInterface,
+                                 GLuint index,
+                                 GLsizei propCount,
+                                 const GLenum *props,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLint *params);
+void CaptureGetProgramiv(const Context *context, GLuint program, GLenum pname, GLint *params);
+void CaptureGetProgramivRobustANGLE(const Context *context,
+                                    GLuint program,
+                                    GLenum pname,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params);
+void CaptureGetQueryObjecti64vEXT(const Context *context, GLuint id, GLenum pname, GLint64 *params);
+void CaptureGetQueryObjecti64vRobustANGLE(const Context *context,
+                                          GLuint id,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint64 *params);
+void CaptureGetQueryObjectivEXT(const Context *context, GLuint id, GLenum pname, GLint *params);
+void CaptureGetQueryObjectivRobustANGLE(const Context *context,
+                                        GLuint id,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLint *params);
+void CaptureGetQueryObjectui64vEXT(const Context *context,
+                                   GLuint id,
+                                   GLenum pname,
+                                   GLuint64 *params);
+void CaptureGetQueryObjectui64vRobustANGLE(const Context *context,
+                                           GLuint id,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint64 *params);
+void CaptureGetQueryObjectuiv(const Context *context, GLuint id, GLenum pname, GLuint *params);
+void CaptureGetQueryObjectuivEXT(const Context *context, GLuint id, GLenum pname, GLuint *params);
+void CaptureGetQueryObjectuivRobustANGLE(const Context *context,
+                                         GLuint id,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLuint *params);
+void CaptureGetQueryiv(const Context *context, GLenum target, GLenum pname, GLint *params);
+void CaptureGetQueryivEXT(const Context *context, GLenum target, GLenum pname, GLint *params);
+void CaptureGetQueryivRobustANGLE(const Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLint *params);
+void CaptureGetRenderbufferParameteriv(const Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLint *params);
+void CaptureGetRenderbufferParameterivOES(const Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLint *params);
+void CaptureGetRenderbufferParameterivRobustANGLE(const Context *context,
+                                                  GLenum target,
+                                                  GLenum pname,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  GLint *params);
+void CaptureGetSamplerParameterIivOES(const Context *context,
+                                      GLuint sampler,
+                                      GLenum pname,
+                                      GLint *params);
+void CaptureGetSamplerParameterIivRobustANGLE(const Context *context,
+                                              GLuint sampler,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params);
+void CaptureGetSamplerParameterIuivOES(const Context *context,
+                                       GLuint sampler,
+                                       GLenum pname,
+                                       GLuint *params);
+void CaptureGetSamplerParameterIuivRobustANGLE(const Context *context,
+                                               GLuint sampler,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLuint *params);
+void CaptureGetSamplerParameterfv(const Context *context,
+                                  GLuint sampler,
+                                  GLenum pname,
+                                  GLfloat *params);
+void CaptureGetSamplerParameterfvRobustANGLE(const Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLfloat *params);
+void CaptureGetSamplerParameteriv(const Context *context,
+                                  GLuint sampler,
+                                  GLenum pname,
+                                  GLint *params);
+void CaptureGetSamplerParameterivRobustANGLE(const Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params);
+void CaptureGetSemaphoreParameterui64vEXT(const Context *context,
+                                          GLuint semaphore,
+                                          GLenum pname,
+                                          GLuint64 *params);
+void CaptureGetShaderInfoLog(const Context *context,
+                             GLuint shader,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLchar *infoLog);
+void CaptureGetShaderPrecisionFormat(const Context *context,
+                                     GLenum shadertype,
+                                     GLenum precisiontype,
+                                     GLint *range,
+                                     GLint *precision);
+void CaptureGetShaderSource(const Context *context,
+                            GLuint shader,
+                            GLsizei bufSize,
+                            GLsizei *length,
+                            GLchar *source);
+void CaptureGetShaderiv(const Context *context, GLuint shader, GLenum pname, GLint *params);
+void CaptureGetShaderivRobustANGLE(const Context *context,
+                                   GLuint shader,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *params);
+void CaptureGetString(const Context *context, GLenum name);
+void CaptureGetStringi(const Context *context, GLenum name, GLuint index);
+void CaptureGetSynciv(const Context *context,
+                      GLsync sync,
+                      GLenum pname,
+                      GLsizei bufSize,
+                      GLsizei *length,
+                      GLint *values);
+void CaptureGetTexEnvfv(const Context *context, GLenum target, GLenum pname, GLfloat *params);
+void CaptureGetTexEnviv(const Context *context, GLenum target, GLenum pname, GLint *params);
+void CaptureGetTexEnvxv(const Context *context, GLenum target, GLenum pname, GLfixed *params);
+void CaptureGetTexGenfvOES(const Context *context, GLenum coord, GLenum pname, GLfloat *params);
+void CaptureGetTexGenivOES(const Context *context, GLenum coord, GLenum pname, GLint *params);
+void CaptureGetTexGenxvOES(const Context *context, GLenum coord, GLenum pname, GLfixed *params);
+void CaptureGetTexLevelParameterfv(const Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum pname,
+                                   GLfloat *params);
+void CaptureGetTexLevelParameterfvANGLE(const Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLenum pname,
+                                        GLfloat *params);
+void CaptureGetTexLevelParameterfvRobustANGLE(const Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLfloat *params);
+void CaptureGetTexLevelParameteriv(const Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum pname,
+                                   GLint *params);
+void CaptureGetTexLevelParameterivANGLE(const Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLenum pname,
+                                        GLint *params);
+void CaptureGetTexLevelParameterivRobustANGLE(const Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params);
+void CaptureGetTexParameterIivOES(const Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  GLint *params);
+void CaptureGetTexParameterIivRobustANGLE(const Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params);
+void CaptureGetTexParameterIuivOES(const Context *context,
+                                   GLenum target,
+                                   GLenum pname,
+                                   GLuint *params);
+void CaptureGetTexParameterIuivRobustANGLE(const Context *context,
+                                           GLenum target,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params);
+void CaptureGetTexParameterfv(const Context *context, GLenum target, GLenum pname, GLfloat *params);
+void CaptureGetTexParameterfvRobustANGLE(const Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params);
+void CaptureGetTexParameteriv(const Context *context, GLenum target, GLenum pname, GLint *params);
+void CaptureGetTexParameterivRobustANGLE(const Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params);
+void CaptureGetTexParameterxv(const Context *context, GLenum target, GLenum pname, GLfixed *params);
+void CaptureGetTransformFeedbackVarying(const Context *context,
+                                        GLuint program,
+                                        GLuint index,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLsizei *size,
+                                        GLenum *type,
+                                        GLchar *name);
+void CaptureGetTranslatedShaderSourceANGLE(const Context *context,
+                                           GLuint shader,
+                                           GLsizei bufsize,
+                                           GLsizei *length,
+                                           GLchar *source);
+void CaptureGetUniformBlockIndex(const Context *context,
+                                 GLuint program,
+                                 const GLchar *uniformBlockName);
+void CaptureGetUniformIndices(const Context *context,
+                              GLuint program,
+                              GLsizei uniformCount,
+                              const GLchar *const *uniformNames,
+                              GLuint *uniformIndices);
+void CaptureGetUniformLocation(const Context *context, GLuint program, const GLchar *name);
+void CaptureGetUniformfv(const Context *context, GLuint program, GLint location, GLfloat *params);
+void CaptureGetUniformfvRobustANGLE(const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLfloat *params);
+void CaptureGetUniformiv(const Context *context, GLuint program, GLint location, GLint *params);
+void CaptureGetUniformivRobustANGLE(const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params);
+void CaptureGetUniformuiv(const Context *context, GLuint program, GLint location, GLuint *params);
+void CaptureGetUniformuivRobustANGLE(const Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLuint *params);
+void CaptureGetUnsignedBytei_vEXT(const Context *context,
+                                  GLenum target,
+                                  GLuint index,
+                                  GLubyte *data);
+void CaptureGetUnsignedBytevEXT(const Context *context, GLenum pname, GLubyte *data);
+void CaptureGetVertexAttribIiv(const Context *context, GLuint index, GLenum pname, GLint *params);
+void CaptureGetVertexAttribIivRobustANGLE(const Context *context,
+                                          GLuint index,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params);
+void CaptureGetVertexAttribIuiv(const Context *context, GLuint index, GLenum pname, GLuint *params);
+void CaptureGetVertexAttribIuivRobustANGLE(const Context *context,
+                                           GLuint index,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params);
+void CaptureGetVertexAttribPointerv(const Context *context,
+                                    GLuint index,
+                                    GLenum pname,
+                                    void **pointer);
+void CaptureGetVertexAttribPointervRobustANGLE(const Context *context,
+                                               GLuint index,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               void **pointer);
+void CaptureGetVertexAttribfv(const Context *context, GLuint index, GLenum pname, GLfloat *params);
+void CaptureGetVertexAttribfvRobustANGLE(const Context *context,
+                                         GLuint index,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params);
+void CaptureGetVertexAttribiv(const Context *context, GLuint index, GLenum pname, GLint *params);
+void CaptureGetVertexAttribivRobustANGLE(const Context *context,
+                                         GLuint index,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params);
+void CaptureGetnUniformfvEXT(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei bufSize,
+                             GLfloat *params);
+void CaptureGetnUniformfvRobustANGLE(const Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLfloat *params);
+void CaptureGetnUniformivEXT(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei bufSize,
+                             GLint *params);
+void CaptureGetnUniformivRobustANGLE(const Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *params);
+void CaptureGetnUniformuivRobustANGLE(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLuint *params);
+void CaptureHint(const Context *context, GLenum target, GLenum mode);
+void CaptureImportMemoryFdEXT(const Context *context,
+                              GLuint memory,
+                              GLuint64 size,
+                              GLenum handleType,
+                              GLint fd);
+void CaptureImportSemaphoreFdEXT(const Context *context,
+                                 GLuint semaphore,
+                                 GLenum handleType,
+                                 GLint fd);
+void CaptureInsertEventMarkerEXT(const Context *context, GLsizei length, const GLchar *marker);
+void CaptureInvalidateFramebuffer(const Context *context,
+                                  GLenum target,
+                                  GLsizei numAttachments,
+                                  const GLenum *attachments);
+void CaptureInvalidateSubFramebuffer(const Context *context,
+                                     GLenum target,
+                                     GLsizei numAttachments,
+                                     const GLenum *attachments,
+                                     GLint x,
+                                     GLint y,
+                                     GLsizei width,
+                                     GLsizei height);
+void CaptureIsBuffer(const Context *context, GLuint buffer);
+void CaptureIsEnabled(const Context *context, GLenum cap);
+void CaptureIsFenceNV(const Context *context, GLuint fence);
+void CaptureIsFramebuffer(const Context *context, GLuint framebuffer);
+void CaptureIsFramebufferOES(const Context *context, GLuint framebuffer);
+void CaptureIsMemoryObjectEXT(const Context *context, GLuint memoryObject);
+void CaptureIsPathCHROMIUM(const Context *context, GLuint path);
+void CaptureIsProgram(const Context *context, GLuint program);
+void CaptureIsProgramPipeline(const Context *context, GLuint pipeline);
+void CaptureIsQuery(const Context *context, GLuint id);
+void CaptureIsQueryEXT(const Context *context, GLuint id);
+void CaptureIsRenderbuffer(const Context *context, GLuint renderbuffer);
+void CaptureIsRenderbufferOES(const Context *context, GLuint renderbuffer);
+void CaptureIsSampler(const Context *context, GLuint sampler);
+void CaptureIsSemaphoreEXT(const Context *context, GLuint semaphore);
+void CaptureIsShader(const Context *context, GLuint shader);
+void CaptureIsSync(const Context *context, GLsync sync);
+void CaptureIsTexture(const Context *context, GLuint texture);
+void CaptureIsTransformFeedback(const Context *context, GLuint id);
+void CaptureIsVertexArray(const Context *context, GLuint array);
+void CaptureIsVertexArrayOES(const Context *context, GLuint array);
+void CaptureLightModelf(const Context *context, GLenum pname, GLfloat param);
+void CaptureLightModelfv(const Context *context, GLenum pname, const GLfloat *params);
+void CaptureLightModelx(const Context *context, GLenum pname, GLfixed param);
+void CaptureLightModelxv(const Context *context, GLenum pname, const GLfixed *param);
+void CaptureLightf(const Context *context, GLenum light, GLenum pname, GLfloat param);
+void CaptureLightfv(const Context *context, GLenum light, GLenum pname, const GLfloat *params);
+void CaptureLightx(const Context *context, GLenum light, GLenum pname, GLfixed param);
+void CaptureLightxv(const Context *context, GLenum light, GLenum pname, const GLfixed *params);
+void CaptureLineWidth(const Context *context, GLfloat width);
+void CaptureLineWidthx(const Context *context, GLfixed width);
+void CaptureLinkProgram(const Context *context, GLuint program);
+void CaptureLoadIdentity(const Context *context);
+void CaptureLoadMatrixf(const Context *context, const GLfloat *m);
+void CaptureLoadMatrixx(const Context *context, const GLfixed *m);
+void CaptureLoadPaletteFromModelViewMatrixOES(const Context *context);
+void CaptureLogicOp(const Context *context, GLenum opcode);
+void CaptureLoseContextCHROMIUM(const Context *context, GLenum current, GLenum other);
+void CaptureMapBufferOES(const Context *context, GLenum target, GLenum access);
+void CaptureMapBufferRange(const Context *context,
+                           GLenum target,
+                           GLintptr offset,
+                           GLsizeiptr length,
+                           GLbitfield access);
+void CaptureMapBufferRangeEXT(const Context *context,
+                              GLenum target,
+                              GLintptr offset,
+                              GLsizeiptr length,
+                              GLbitfield access);
+void CaptureMaterialf(const Context *context, GLenum face, GLenum pname, GLfloat param);
+void CaptureMaterialfv(const Context *context, GLenum face, GLenum pname, const GLfloat *params);
+void CaptureMaterialx(const Context *context, GLenum face, GLenum pname, GLfixed param);
+void CaptureMaterialxv(const Context *context, GLenum face, GLenum pname, const GLfixed *param);
+void CaptureMatrixIndexPointerOES(const Context *context,
+                                  GLint size,
+                                  GLenum type,
+                                  GLsizei stride,
+                                  const void *pointer);
+void CaptureMatrixLoadIdentityCHROMIUM(const Context *context, GLenum matrixMode);
+void CaptureMatrixLoadfCHROMIUM(const Context *context, GLenum matrixMode, const GLfloat *matrix);
+void CaptureMatrixMode(const Context *context, GLenum mode);
+void CaptureMaxShaderCompilerThreadsKHR(const Context *context, GLuint count);
+void CaptureMemoryBarrier(const Context *context, GLbitfield barriers);
+void CaptureMemoryBarrierByRegion(const Context *context, GLbitfield barriers);
+void CaptureMemoryObjectParameterivEXT(const Context *context,
+                                       GLuint memoryObject,
+                                       GLenum pname,
+                                       const GLint *params);
+void CaptureMultMatrixf(const Context *context, const GLfloat *m);
+void CaptureMultMatrixx(const Context *context, const GLfixed *m);
+void CaptureMultiDrawArraysANGLE(const Context *context,
+                                 GLenum mode,
+                                 const GLint *firsts,
+                                 const GLsizei *counts,
+                                 GLsizei drawcount);
+void CaptureMultiDrawArraysInstancedANGLE(const Context *context,
+                                          GLenum mode,
+                                          const GLint *firsts,
+                                          const GLsizei *counts,
+                                          const GLsizei *instanceCounts,
+                                          GLsizei drawcount);
+void CaptureMultiDrawElementsANGLE(const Context *context,
+                                   GLenum mode,
+                                   const GLsizei *counts,
+                                   GLenum type,
+                                   const GLvoid *const *indices,
+                                   GLsizei drawcount);
+void CaptureMultiDrawElementsInstancedANGLE(const Context *context,
+                                            GLenum mode,
+                                            const GLsizei *counts,
+                                            GLenum type,
+                                            const GLvoid *const *indices,
+                                            const GLsizei *instanceCounts,
+                                            GLsizei drawcount);
+void CaptureMultiTexCoord4f(const Context *context,
+                            GLenum target,
+                            GLfloat s,
+                            GLfloat t,
+                            GLfloat r,
+                            GLfloat q);
+void CaptureMultiTexCoord4x(const Context *context,
+                            GLenum texture,
+                            GLfixed s,
+                            GLfixed t,
+                            GLfixed r,
+                            GLfixed q);
+void CaptureNormal3f(const Context *context, GLfloat nx, GLfloat ny, GLfloat nz);
+void CaptureNormal3x(const Context *context, GLfixed nx, GLfixed ny, GLfixed nz);
+void CaptureNormalPointer(const Context *context, GLenum type, GLsizei stride, const void *pointer);
+void CaptureObjectLabelKHR(const Context *context,
+                           GLenum identifier,
+                           GLuint name,
+                           GLsizei length,
+                           const GLchar *label);
+void CaptureObjectPtrLabelKHR(const Context *context,
+                              const void *ptr,
+                              GLsizei length,
+                              const GLchar *label);
+void CaptureOrthof(const Context *context,
+                   GLfloat l,
+                   GLfloat r,
+                   GLfloat b,
+                   GLfloat t,
+                   GLfloat n,
+                   GLfloat f);
+void CaptureOrthox(const Context *context,
+                   GLfixed l,
+                   GLfixed r,
+                   GLfixed b,
+                   GLfixed t,
+                   GLfixed n,
+                   GLfixed f);
+void CapturePathCommandsCHROMIUM(const Context *context,
+                                 GLuint path,
+                                 GLsizei numCommands,
+                                 const GLubyte *commands,
+                                 GLsizei numCoords,
+                                 GLenum coordType,
+                                 const void *coords);
+void CapturePathParameterfCHROMIUM(const Context *context,
+                                   GLuint path,
+                                   GLenum pname,
+                                   GLfloat value);
+void CapturePathParameteriCHROMIUM(const Context *context, GLuint path, GLenum pname, GLint value);
+void CapturePathStencilFuncCHROMIUM(const Context *context, GLenum func, GLint ref, GLuint mask);
+void CapturePauseTransformFeedback(const Context *context);
+void CapturePixelStorei(const Context *context, GLenum pname, GLint param);
+void CapturePointParameterf(const Context *context, GLenum pname, GLfloat param);
+void CapturePointParameterfv(const Context *context, GLenum pname, const GLfloat *params);
+void CapturePointParameterx(const Context *context, GLenum pname, GLfixed param);
+void CapturePointParameterxv(const Context *context, GLenum pname, const GLfixed *params);
+void CapturePointSize(const Context *context, GLfloat size);
+void CapturePointSizePointerOES(const Context *context,
+                                GLenum type,
+                                GLsizei stride,
+                                const void *pointer);
+void CapturePointSizex(const Context *context, GLfixed size);
+void CapturePolygonOffset(const Context *context, GLfloat factor, GLfloat units);
+void CapturePolygonOffsetx(const Context *context, GLfixed factor, GLfixed units);
+void CapturePopDebugGroupKHR(const Context *context);
+void CapturePopGroupMarkerEXT(const Context *context);
+void CapturePopMatrix(const Context *context);
+void CaptureProgramBinary(const Context *context,
+                          GLuint program,
+                          GLenum binaryFormat,
+                          const void *binary,
+                          GLsizei length);
+void CaptureProgramBinaryOES(const Context *context,
+                             GLuint program,
+                             GLenum binaryFormat,
+                             const void *binary,
+                             GLint length);
+void CaptureProgramParameteri(const Context *context, GLuint program, GLenum pname, GLint value);
+void CaptureProgramPathFragmentInputGenCHROMIUM(const Context *context,
+                                                GLuint program,
+                                                GLint location,
+                                                GLenum genMode,
+                                                GLint components,
+                                                const GLfloat *coeffs);
+void CaptureProgramUniform1f(const Context *context, GLuint program, GLint location, GLfloat v0);
+void CaptureProgramUniform1fv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value);
+void CaptureProgramUniform1i(const Context *context, GLuint program, GLint location, GLint v0);
+void CaptureProgramUniform1iv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value);
+void CaptureProgramUniform1ui(const Context *context, GLuint program, GLint location, GLuint v0);
+void CaptureProgramUniform1uiv(const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value);
+void CaptureProgramUniform2f(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1);
+void CaptureProgramUniform2fv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value);
+void CaptureProgramUniform2i(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1);
+void CaptureProgramUniform2iv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value);
+void CaptureProgramUniform2ui(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1);
+void CaptureProgramUniform2uiv(const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value);
+void CaptureProgramUniform3f(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1,
+                             GLfloat v2);
+void CaptureProgramUniform3fv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value);
+void CaptureProgramUniform3i(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1,
+                             GLint v2);
+void CaptureProgramUniform3iv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value);
+void CaptureProgramUniform3ui(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1,
+                              GLuint v2);
+void CaptureProgramUniform3uiv(const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value);
+void CaptureProgramUniform4f(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1,
+                             GLfloat v2,
+                             GLfloat v3);
+void CaptureProgramUniform4fv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value);
+void CaptureProgramUniform4i(const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1,
+                             GLint v2,
+                             GLint v3);
+void CaptureProgramUniform4iv(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value);
+void CaptureProgramUniform4ui(const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1,
+                              GLuint v2,
+                              GLuint v3);
+void CaptureProgramUniform4uiv(const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value);
+void CaptureProgramUniformMatrix2fv(const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+void CaptureProgramUniformMatrix2x3fv(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+void CaptureProgramUniformMatrix2x4fv(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+void CaptureProgramUniformMatrix3fv(const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+void CaptureProgramUniformMatrix3x2fv(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+void CaptureProgramUniformMatrix3x4fv(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+void CaptureProgramUniformMatrix4fv(const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+void CaptureProgramUniformMatrix4x2fv(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+void CaptureProgramUniformMatrix4x3fv(const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+void CaptureProvokingVertexANGLE(const Context *context, GLenum mode);
+void CapturePushDebugGroupKHR(const Context *context,
+                              GLenum source,
+                              GLuint id,
+                              GLsizei length,
+                              const GLchar *message);
+void CapturePushGroupMarkerEXT(const Context *context, GLsizei length, const GLchar *marker);
+void CapturePushMatrix(const Context *context);
+void CaptureQueryCounterEXT(const Context *context, GLuint id, GLenum target);
+void CaptureQueryMatrixxOES(const Context *context, GLfixed *mantissa, GLint *exponent);
+void CaptureReadBuffer(const Context *context, GLenum src);
+void CaptureReadPixels(const Context *context,
+                       GLint x,
+                       GLint y,
+                       GLsizei width,
+                       GLsizei height,
+                       GLenum format,
+                       GLenum type,
+                       void *pixels);
+void CaptureReadPixelsRobustANGLE(const Context *context,
+                                  GLint x,
+                                  GLint y,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLsizei *columns,
+                                  GLsizei *rows,
+                                  void *pixels);
+void CaptureReadnPixelsEXT(const Context *context,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLenum format,
+                           GLenum type,
+                           GLsizei bufSize,
+                           void *data);
+void CaptureReadnPixelsRobustANGLE(const Context *context,
+                                   GLint x,
+                                   GLint y,
+                                   GLsizei width,
+                                   GLsizei height,
+                                   GLenum format,
+                                   GLenum type,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLsizei *columns,
+                                   GLsizei *rows,
+                                   void *data);
+void CaptureReleaseShaderCompiler(const Context *context);
+void CaptureRenderbufferStorage(const Context *context,
+                                GLenum target,
+                                GLenum internalformat,
+                                GLsizei width,
+                                GLsizei height);
+void CaptureRenderbufferStorageMultisample(const Context *context,
+                                           GLenum target,
+                                           GLsizei samples,
+                                           GLenum internalformat,
+                                           GLsizei width,
+                                           GLsizei height);
+void CaptureRenderbufferStorageMultisampleANGLE(const Context *context,
+                                                GLenum target,
+                                                GLsizei samples,
+                                                GLenum internalformat,
+                                                GLsizei width,
+                                                GLsizei height);
+void CaptureRenderbufferStorageOES(const Context *context,
+                                   GLenum target,
+                                   GLenum internalformat,
+                                   GLsizei width,
+                                   GLsizei height);
+void CaptureRequestExtensionANGLE(const Context *context, const GLchar *name);
+void CaptureResumeTransformFeedback(const Context *context);
+void CaptureRotatef(const Context *context, GLfloat angle, GLfloat x, GLfloat y, GLfloat z);
+void CaptureRotatex(const Context *context, GLfixed angle, GLfixed x, GLfixed y, GLfixed z);
+void CaptureSampleCoverage(const Context *context, GLfloat value, GLboolean invert);
+void CaptureSampleCoveragex(const Context *context, GLclampx value, GLboolean invert);
+void CaptureSampleMaski(const Context *context, GLuint maskNumber, GLbitfield mask);
+void CaptureSampleMaskiANGLE(const Context *context, GLuint maskNumber, GLbitfield mask);
+void CaptureSamplerParameterIivOES(const Context *context,
+                                   GLuint sampler,
+                                   GLenum pname,
+                                   const GLint *param);
+void CaptureSamplerParameterIivRobustANGLE(const Context *context,
+                                           GLuint sampler,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           const GLint *param);
+void CaptureSamplerParameterIuivOES(const Context *context,
+                                    GLuint sampler,
+                                    GLenum pname,
+                                    const GLuint *param);
+void CaptureSamplerParameterIuivRobustANGLE(const Context *context,
+                                            GLuint sampler,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            const GLuint *param);
+void CaptureSamplerParameterf(const Context *context, GLuint sampler, GLenum pname, GLfloat param);
+void CaptureSamplerParameterfv(const Context *context,
+                               GLuint sampler,
+                               GLenum pname,
+                               const GLfloat *param);
+void CaptureSamplerParameterfvRobustANGLE(const Context *context,
+                                          GLuint sampler,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          const GLfloat *param);
+void CaptureSamplerParameteri(const Context *context, GLuint sampler, GLenum pname, GLint param);
+void CaptureSamplerParameteriv(const Context *context,
+                               GLuint sampler,
+                               GLenum pname,
+                               const GLint *param);
+void CaptureSamplerParameterivRobustANGLE(const Context *context,
+                                          GLuint sampler,
+                                          GLuint pname,
+                                          GLsizei bufSize,
+                                          const GLint *param);
+void CaptureScalef(const Context *context, GLfloat x, GLfloat y, GLfloat z);
+void CaptureScalex(const Context *context, GLfixed x, GLfixed y, GLfixed z);
+void CaptureScissor(const Context *context, GLint x, GLint y, GLsizei width, GLsizei height);
+void CaptureSemaphoreParameterui64vEXT(const Context *context,
+                                       GLuint semaphore,
+                                       GLenum pname,
+                                       const GLuint64 *params);
+void CaptureSetFenceNV(const Context *context, GLuint fence, GLenum condition);
+void CaptureShadeModel(const Context *context, GLenum mode);
+void CaptureShaderBinary(const Context *context,
+                         GLsizei count,
+                         const GLuint *shaders,
+                         GLenum binaryformat,
+                         const void *binary,
+                         GLsizei length);
+void CaptureShaderSource(const Context *context,
+                         GLuint shader,
+                         GLsizei count,
+                         const GLchar *const *string,
+                         const GLint *length);
+void CaptureSignalSemaphoreEXT(const Context *context,
+                               GLuint semaphore,
+                               GLuint numBufferBarriers,
+                               const GLuint *buffers,
+                               GLuint numTextureBarriers,
+                               const GLuint *textures,
+                               const GLenum *dstLayouts);
+void CaptureStencilFillPathCHROMIUM(const Context *context,
+                                    GLuint path,
+                                    GLenum fillMode,
+                                    GLuint mask);
+void CaptureStencilFillPathInstancedCHROMIUM(const Context *context,
+                                             GLsizei numPaths,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum fillMode,
+                                             GLuint mask,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues);
+void CaptureStencilFunc(const Context *context, GLenum func, GLint ref, GLuint mask);
+void CaptureStencilFuncSeparate(const Context *context,
+                                GLenum face,
+                                GLenum func,
+                                GLint ref,
+                                GLuint mask);
+void CaptureStencilMask(const Context *context, GLuint mask);
+void CaptureStencilMaskSeparate(const Context *context, GLenum face, GLuint mask);
+void CaptureStencilOp(const Context *context, GLenum fail, GLenum zfail, GLenum zpass);
+void CaptureStencilOpSeparate(const Context *context,
+                              GLenum face,
+                              GLenum sfail,
+                              GLenum dpfail,
+                              GLenum dppass);
+void CaptureStencilStrokePathCHROMIUM(const Context *context,
+                                      GLuint path,
+                                      GLint reference,
+                                      GLuint mask);
+void CaptureStencilStrokePathInstancedCHROMIUM(const Context *context,
+                                               GLsizei numPath,
+                                               GLenum pathNameType,
+                                               const void *paths,
+                                               GLuint pathBase,
+                                               GLint reference,
+                                               GLuint mask,
+                                               GLenum transformType,
+                                               const GLfloat *transformValues);
+void CaptureStencilThenCoverFillPathCHROMIUM(const Context *context,
+                                             GLuint path,
+                                             GLenum fillMode,
+                                             GLuint mask,
+                                             GLenum coverMode);
+void CaptureStencilThenCoverFillPathInstancedCHROMIUM(const Context *context,
+                                                      GLsizei numPaths,
+                                                      GLenum pathNameType,
+                                                      const void *paths,
+                                                      GLuint pathBase,
+                                                      GLenum fillMode,
+                                                      GLuint mask,
+                                                      GLenum coverMode,
+                                                      GLenum transformType,
+                                                      const GLfloat *transformValues);
+void CaptureStencilThenCoverStrokePathCHROMIUM(const Context *context,
+                                               GLuint path,
+                                               GLint reference,
+                                               GLuint mask,
+                                               GLenum coverMode);
+void CaptureStencilThenCoverStrokePathInstancedCHROMIUM(const Context *context,
+                                                        GLsizei numPaths,
+                                                        GLenum pathNameType,
+                                                        const void *paths,
+                                                        GLuint pathBase,
+                                                        GLint reference,
+                                                        GLuint mask,
+                                                        GLenum coverMode,
+                                                        GLenum transformType,
+                                                        const GLfloat *transformValues);
+void CaptureTestFenceNV(const Context *context, GLuint fence);
+void CaptureTexCoordPointer(const Context *context,
+                            GLint size,
+                            GLenum type,
+                            GLsizei stride,
+                            const void *pointer);
+void CaptureTexEnvf(const Context *context, GLenum target, GLenum pname, GLfloat param);
+void CaptureTexEnvfv(const Context *context, GLenum target, GLenum pname, const GLfloat *params);
+void CaptureTexEnvi(const Context *context, GLenum target, GLenum pname, GLint param);
+void CaptureTexEnviv(const Context *context, GLenum target, GLenum pname, const GLint *params);
+void CaptureTexEnvx(const Context *context, GLenum target, GLenum pname, GLfixed param);
+void CaptureTexEnvxv(const Context *context, GLenum target, GLenum pname, const GLfixed *params);
+void CaptureTexGenfOES(const Context *context, GLenum coord, GLenum pname, GLfloat param);
+void CaptureTexGenfvOES(const Context *context, GLenum coord, GLenum pname, const GLfloat *params);
+void CaptureTexGeniOES(const Context *context, GLenum coord, GLenum pname, GLint param);
+void CaptureTexGenivOES(const Context *context, GLenum coord, GLenum pname, const GLint *params);
+void CaptureTexGenxOES(const Context *context, GLenum coord, GLenum pname, GLfixed param);
+void CaptureTexGenxvOES(const Context *context, GLenum coord, GLenum pname, const GLfixed *params);
+void CaptureTexImage2D(const Context *context,
+                       GLenum target,
+                       GLint level,
+                       GLint internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLint border,
+                       GLenum format,
+                       GLenum type,
+                       const void *pixels);
+void CaptureTexImage2DRobustANGLE(const Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLint border,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  const void *pixels);
+void CaptureTexImage3D(const Context *context,
+                       GLenum target,
+                       GLint level,
+                       GLint internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLsizei depth,
+                       GLint border,
+                       GLenum format,
+                       GLenum type,
+                       const void *pixels);
+void CaptureTexImage3DRobustANGLE(const Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLsizei depth,
+                                  GLint border,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  const void *pixels);
+void CaptureTexParameterIivOES(const Context *context,
+                               GLenum target,
+                               GLenum pname,
+                               const GLint *params);
+void CaptureTexParameterIivRobustANGLE(const Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLsizei bufSize,
+                                       const GLint *params);
+void CaptureTexParameterIuivOES(const Context *context,
+                                GLenum target,
+                                GLenum pname,
+                                const GLuint *params);
+void CaptureTexParameterIuivRobustANGLE(const Context *context,
+                                        GLenum target,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        const GLuint *params);
+void CaptureTexParameterf(const Context *context, GLenum target, GLenum pname, GLfloat param);
+void CaptureTexParameterfv(const Context *context,
+                           GLenum target,
+                           GLenum pname,
+                           const GLfloat *params);
+void CaptureTexParameterfvRobustANGLE(const Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      const GLfloat *params);
+void CaptureTexParameteri(const Context *context, GLenum target, GLenum pname, GLint param);
+void CaptureTexParameteriv(const Context *context,
+                           GLenum target,
+                           GLenum pname,
+                           const GLint *params);
+void CaptureTexParameterivRobustANGLE(const Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      const GLint *params);
+void CaptureTexParameterx(const Context *context, GLenum target, GLenum pname, GLfixed param);
+void CaptureTexParameterxv(const Context *context,
+                           GLenum target,
+                           GLenum pname,
+                           const GLfixed *params);
+void CaptureTexStorage1DEXT(const Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width);
+void CaptureTexStorage2D(const Context *context,
+                         GLenum target,
+                         GLsizei levels,
+                         GLenum internalformat,
+                         GLsizei width,
+                         GLsizei height);
+void CaptureTexStorage2DEXT(const Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width,
+                            GLsizei height);
+void CaptureTexStorage2DMultisample(const Context *context,
+                                    GLenum target,
+                                    GLsizei samples,
+                                    GLenum internalformat,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLboolean fixedsamplelocations);
+void CaptureTexStorage2DMultisampleANGLE(const Context *context,
+                                         GLenum target,
+                                         GLsizei samples,
+                                         GLenum internalformat,
+                                         GLsizei width,
+                                         GLsizei height,
+                                         GLboolean fixedsamplelocations);
+void CaptureTexStorage3D(const Context *context,
+                         GLenum target,
+                         GLsizei levels,
+                         GLenum internalformat,
+                         GLsizei width,
+                         GLsizei height,
+                         GLsizei depth);
+void CaptureTexStorage3DEXT(const Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width,
+                            GLsizei height,
+                            GLsizei depth);
+void CaptureTexStorage3DMultisampleOES(const Context *context,
+                                       GLenum target,
+                                       GLsizei samples,
+                                       GLenum internalformat,
+                                       GLsizei width,
+                                       GLsizei height,
+                                       GLsizei depth,
+                                       GLboolean fixedsamplelocations);
+void CaptureTexStorageMem2DEXT(const Context *context,
+                               GLenum target,
+                               GLsizei levels,
+                               GLenum internalFormat,
+                               GLsizei width,
+                               GLsizei height,
+                               GLuint memory,
+                               GLuint64 offset);
+void CaptureTexStorageMem2DMultisampleEXT(const Context *context,
+                                          GLenum target,
+                                          GLsizei samples,
+                                          GLenum internalFormat,
+                                          GLsizei width,
+                                          GLsizei height,
+                                          GLboolean fixedSampleLocations,
+                                          GLuint memory,
+                                          GLuint64 offset);
+void CaptureTexStorageMem3DEXT(const Context *context,
+                               GLenum target,
+                               GLsizei levels,
+                               GLenum internalFormat,
+                               GLsizei width,
+                               GLsizei height,
+                               GLsizei depth,
+                               GLuint memory,
+                               GLuint64 offset);
+void CaptureTexStorageMem3DMultisampleEXT(const Context *context,
+                                          GLenum target,
+                                          GLsizei samples,
+                                          GLenum internalFormat,
+                                          GLsizei width,
+                                          GLsizei height,
+                                          GLsizei depth,
+                                          GLboolean fixedSampleLocations,
+                                          GLuint memory,
+                                          GLuint64 offset);
+void CaptureTexSubImage2D(const Context *context,
+                          GLenum target,
+                          GLint level,
+                          GLint xoffset,
+                          GLint yoffset,
+                          GLsizei width,
+                          GLsizei height,
+                          GLenum format,
+                          GLenum type,
+                          const void *pixels);
+void CaptureTexSubImage2DRobustANGLE(const Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     const void *pixels);
+void CaptureTexSubImage3D(const Context *context,
+                          GLenum target,
+                          GLint level,
+                          GLint xoffset,
+                          GLint yoffset,
+                          GLint zoffset,
+                          GLsizei width,
+                          GLsizei height,
+                          GLsizei depth,
+                          GLenum format,
+                          GLenum type,
+                          const void *pixels);
+void CaptureTexSubImage3DRobustANGLE(const Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLint zoffset,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLsizei depth,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     const void *pixels);
+void CaptureTransformFeedbackVaryings(const Context *context,
+                                      GLuint program,
+                                      GLsizei count,
+                                      const GLchar *const *varyings,
+                                      GLenum bufferMode);
+void CaptureTranslatef(const Context *context, GLfloat x, GLfloat y, GLfloat z);
+void CaptureTranslatex(const Context *context, GLfixed x, GLfixed y, GLfixed z);
+void CaptureUniform1f(const Context *context, GLint location, GLfloat v0);
+void CaptureUniform1fv(const Context *context, GLint location, GLsizei count, const GLfloat *value);
+void CaptureUniform1i(const Context *context, GLint location, GLint v0);
+void CaptureUniform1iv(const Context *context, GLint location, GLsizei count, const GLint *value);
+void CaptureUniform1ui(const Context *context, GLint location, GLuint v0);
+void CaptureUniform1uiv(const Context *context, GLint location, GLsizei count, const GLuint *value);
+void CaptureUniform2f(const Context *context, GLint location, GLfloat v0, GLfloat v1);
+void CaptureUniform2fv(const Context *context, GLint location, GLsizei count, const GLfloat *value);
+void CaptureUniform2i(const Context *context, GLint location, GLint v0, GLint v1);
+void CaptureUniform2iv(const Context *context, GLint location, GLsizei count, const GLint *value);
+void CaptureUniform2ui(const Context *context, GLint location, GLuint v0, GLuint v1);
+void CaptureUniform2uiv(const Context *context, GLint location, GLsizei count, const GLuint *value);
+void CaptureUniform3f(const Context *context, GLint location, GLfloat v0, GLfloat v1, GLfloat v2);
+void CaptureUniform3fv(const Context *context, GLint location, GLsizei count, const GLfloat *value);
+void CaptureUniform3i(const Context *context, GLint location, GLint v0, GLint v1, GLint v2);
+void CaptureUniform3iv(const Context *context, GLint location, GLsizei count, const GLint *value);
+void CaptureUniform3ui(const Context *context, GLint location, GLuint v0, GLuint v1, GLuint v2);
+void CaptureUniform3uiv(const Context *context, GLint location, GLsizei count, const GLuint *value);
+void CaptureUniform4f(const Context *context,
+                      GLint location,
+                      GLfloat v0,
+                      GLfloat v1,
+                      GLfloat v2,
+                      GLfloat v3);
+void CaptureUniform4fv(const Context *context, GLint location, GLsizei count, const GLfloat *value);
+void CaptureUniform4i(const Context *context,
+                      GLint location,
+                      GLint v0,
+                      GLint v1,
+                      GLint v2,
+                      GLint v3);
+void CaptureUniform4iv(const Context *context, GLint location, GLsizei count, const GLint *value);
+void CaptureUniform4ui(const Context *context,
+                       GLint location,
+                       GLuint v0,
+                       GLuint v1,
+                       GLuint v2,
+                       GLuint v3);
+void CaptureUniform4uiv(const Context *context, GLint location, GLsizei count, const GLuint *value);
+void CaptureUniformBlockBinding(const Context *context,
+                                GLuint program,
+                                GLuint uniformBlockIndex,
+                                GLuint uniformBlockBinding);
+void CaptureUniformMatrix2fv(const Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+void CaptureUniformMatrix2x3fv(const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+void CaptureUniformMatrix2x4fv(const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+void CaptureUniformMatrix3fv(const Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+void CaptureUniformMatrix3x2fv(const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+void CaptureUniformMatrix3x4fv(const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+void CaptureUniformMatrix4fv(const Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+void CaptureUniformMatrix4x2fv(const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+void CaptureUniformMatrix4x3fv(const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+void CaptureUnmapBuffer(const Context *context, GLenum target);
+void CaptureUnmapBufferOES(const Context *context, GLenum target);
+void CaptureUseProgram(const Context *context, GLuint program);
+void CaptureUseProgramStages(const Context *context,
+                             GLuint pipeline,
+                             GLbitfield stages,
+                             GLuint program);
+void CaptureValidateProgram(const Context *context, GLuint program);
+void CaptureValidateProgramPipeline(const Context *context, GLuint pipeline);
+void CaptureVertexAttrib1f(const Context *context, GLuint index, GLfloat x);
+void CaptureVertexAttrib1fv(const Context *context, GLuint index, const GLfloat *v);
+void CaptureVertexAttrib2f(const Context *context, GLuint index, GLfloat x, GLfloat y);
+void CaptureVertexAttrib2fv(const Context *context, GLuint index, const GLfloat *v);
+void CaptureVertexAttrib3f(const Context *context, GLuint index, GLfloat x, GLfloat y, GLfloat z);
+void CaptureVertexAttrib3fv(const Context *context, GLuint index, const GLfloat *v);
+void CaptureVertexAttrib4f(const Context *context,
+                           GLuint index,
+                           GLfloat x,
+                           GLfloat y,
+                           GLfloat z,
+                           GLfloat w);
+void CaptureVertexAttrib4fv(const Context *context, GLuint index, const GLfloat *v);
+void CaptureVertexAttribBinding(const Context *context, GLuint attribindex, GLuint bindingindex);
+void CaptureVertexAttribDivisor(const Context *context, GLuint index, GLuint divisor);
+void CaptureVertexAttribDivisorANGLE(const Context *context, GLuint index, GLuint divisor);
+void CaptureVertexAttribDivisorEXT(const Context *context, GLuint index, GLuint divisor);
+void CaptureVertexAttribFormat(const Context *context,
+                               GLuint attribindex,
+                               GLint size,
+                               GLenum type,
+                               GLboolean normalized,
+                               GLuint relativeoffset);
+void CaptureVertexAttribI4i(const Context *context,
+                            GLuint index,
+                            GLint x,
+                            GLint y,
+                            GLint z,
+                            GLint w);
+void CaptureVertexAttribI4iv(const Context *context, GLuint index, const GLint *v);
+void CaptureVertexAttribI4ui(const Context *context,
+                             GLuint index,
+                             GLuint x,
+                             GLuint y,
+                             GLuint z,
+                             GLuint w);
+void CaptureVertexAttribI4uiv(const Context *context, GLuint index, const GLuint *v);
+void CaptureVertexAttribIFormat(const Context *context,
+                                GLuint attribindex,
+                                GLint size,
+                                GLenum type,
+                                GLuint relativeoffset);
+void CaptureVertexAttribIPointer(const Context *context,
+                                 GLuint index,
+                                 GLint size,
+                                 GLenum type,
+                                 GLsizei stride,
+                                 const void *pointer);
+void CaptureVertexAttribPointer(const Context *context,
+                                GLuint index,
+                                GLint size,
+                                GLenum type,
+                                GLboolean normalized,
+                                GLsizei stride,
+                                const void *pointer);
+void CaptureVertexBindingDivisor(const Context *context, GLuint bindingindex, GLuint divisor);
+void CaptureVertexPointer(const Context *context,
+                          GLint size,
+                          GLenum type,
+                          GLsizei stride,
+                          const void *pointer);
+void CaptureViewport(const Context *context, GLint x, GLint y, GLsizei width, GLsizei height);
+void CaptureWaitSemaphoreEXT(const Context *context,
+                             GLuint semaphore,
+                             GLuint numBufferBarriers,
+                             const GLuint *buffers,
+                             GLuint numTextureBarriers,
+                             const GLuint *textures,
+                             const GLenum *srcLayouts);
+void CaptureWaitSync(const Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout);
+void CaptureWeightPointerOES(const Context *context,
+                             GLint size,
+                             GLenum type,
+                             GLsizei stride,
+                             const void *pointer);
+}  // namespace gl
+
+#endif  // LIBGLESV2_ENTRY_POINTS_CAPTURE_AUTOGEN_H_
@@ -0,0 +1,109 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_deferred.cpp:
+//   Creates the deferred command streams of the contexts.
+
+#include "libGLESv2/entry_points_deferred.h"
+
+#if ANGLE_DEFERRED_COMMANDS == ANGLE_ENABLED
+
+#    include <chrono>
+#    include <thread>
+
+#    include "common/system_utils.h"
+#    include "libANGLE/renderer/ContextImpl.h"
+#    include "libGLESv2/global_state.h"
+
+namespace gl
+{
+namespace
+{
+void ExecuteSubmittedDeferredCommands(DeferredCommandStream *stream)
+{
+#    if ANGLE_FORCE_THREAD_SAFETY == ANGLE_ENABLED
+    // The thread destroying the context holds the global mutex while it waits for this thread to
+    // exit, so the mutex is polled.
+    std::unique_lock<angle::GlobalMutex> lock(angle::GetGlobalMutex(), std::defer_lock);
+    while (!lock.try_lock())
+    {
+        if (stream->isExiting())
+        {
+            return;
+        }
+        std::this_thread::sleep_for(std::chrono::milliseconds(1));
+    }
+#    endif  // ANGLE_FORCE_THREAD_SAFETY == ANGLE_ENABLED
+
+    stream->executeSubmittedCommands();
+}
+
+// Read whenever a context without a stream is made current, so the tests can enable the deferral
+// for the contexts they create.
+bool IsDeferringCommands()
+{
+    return angle::GetEnvironmentVar("ANGLE_DEFERRED_COMMANDS") == "1";
+}
+}  // anonymous namespace
+
+void OnDeferredCommandsContextCurrent(Context *context)
+{
+    if (context == nullptr || context->getDeferredCommandStream() != nullptr ||
+        !IsDeferringCommands())
+    {
+        return;
+    }
+
+    // The worker thread has no native context current, which backends like GL rely on.
+    if (!context->getImplementation()->supportsOffThreadExecution())
+    {
+        return;
+    }
+
+    context->setDeferredCommandStream(
+        std::unique_ptr<DeferredCommandStream>(new DeferredCommandStream(
+            context, ExecuteDeferredCommand, ExecuteSubmittedDeferredCommands)));
+}
+
+void SyncDeferredCommandsForClientArray(Context *context, const void *pointer)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (stream == nullptr)
+    {
+        return;
+    }
+
+    stream->finish();
+    if (pointer != nullptr && context->getState().getTargetBuffer(BufferBinding::Array) == nullptr)
+    {
+        stream->onClientVertexArrayUsed();
+    }
+}
+
+void SyncDeferredCommandsUnlocked(Context *context)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (stream == nullptr || !stream->hasPendingCommands())
+    {
+        return;
+    }
+
+    ANGLE_SCOPED_GLOBAL_LOCK();
+    stream->finish();
+}
+
+void SyncDeferredCommandsForClientArrayUnlocked(Context *context, const void *pointer)
+{
+    if (context->getDeferredCommandStream() == nullptr)
+    {
+        return;
+    }
+
+    ANGLE_SCOPED_GLOBAL_LOCK();
+    SyncDeferredCommandsForClientArray(context, pointer);
+}
+}  // namespace gl
+
+#endif  // ANGLE_DEFERRED_COMMANDS == ANGLE_ENABLED
@@ -0,0 +1,85 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_deferred.h:
+//   Off-thread execution of GLES calls. Enabled with the angle_enable_deferred_commands GN arg.
+//   When ANGLE_DEFERRED_COMMANDS=1 is set in the environment, the OpenGL ES 2.0, 3.0 and 3.1
+//   entry points that return no data record their call and the client memory it references in a
+//   DeferredCommandStream of the context instead of executing it. A worker thread validates and
+//   executes the recorded calls. The other entry points execute the recorded calls on the calling
+//   thread before they run, so their results see the effects of the calls before them.
+//
+//   The errors of the recorded calls are generated when they are executed, so glGetError reports
+//   them. The calls that reference client memory whose size depends on the context state, like
+//   the pixels of the texture uploads and the indices of the draws, are not recorded. Neither are
+//   the draws once a client vertex array was specified. Contexts whose backend doesn't support
+//   off-thread execution, like GL, never defer their calls.
+
+#ifndef LIBGLESV2_ENTRY_POINTS_DEFERRED_H_
+#define LIBGLESV2_ENTRY_POINTS_DEFERRED_H_
+
+#include "libANGLE/features.h"
+
+#if ANGLE_DEFERRED_COMMANDS == ANGLE_ENABLED
+
+#    include "libANGLE/Context.h"
+#    include "libANGLE/DeferredCommandStream.h"
+#    include "libGLESv2/entry_points_deferred_autogen.h"
+
+namespace gl
+{
+// Creates the deferred command stream of a context made current if ANGLE_DEFERRED_COMMANDS=1 is
+// set in the environment.
+void OnDeferredCommandsContextCurrent(Context *context);
+
+ANGLE_INLINE void SyncDeferredCommands(Context *context)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (stream)
+    {
+        stream->finish();
+    }
+}
+
+void SyncDeferredCommandsForClientArray(Context *context, const void *pointer);
+
+// Called by the entry points that take no lock. The worker thread executes the commands with the
+// global mutex held, so these take it before they execute the pending commands.
+void SyncDeferredCommandsUnlocked(Context *context);
+void SyncDeferredCommandsForClientArrayUnlocked(Context *context, const void *pointer);
+
+// Called by the EGL entry points that change the surfaces or textures the calls could use, with the
+// context current on the calling thread, if any.
+ANGLE_INLINE void SyncDeferredCommandsForEGL(Context *context)
+{
+    if (context)
+    {
+        SyncDeferredCommands(context);
+    }
+}
+}  // namespace gl
+
+#    define ANGLE_DEFER_COMMAND(EP, ...) \
+        if (gl::Defer##EP(__VA_ARGS__))  \
+        {                                \
+            return;                      \
+        }
+#    define ANGLE_SYNC_DEFERRED_COMMANDS(context) gl::SyncDeferredCommands(context)
+#    define ANGLE_SYNC_DEFERRED_COMMANDS_FOR_CLIENT_ARRAY(context, pointer) \
+        gl::SyncDeferredCommandsForClientArray(context, pointer)
+#    define ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context) gl::SyncDeferredCommandsUnlocked(context)
+#    define ANGLE_SYNC_DEFERRED_COMMANDS_FOR_CLIENT_ARRAY_UNLOCKED(context, pointer) \
+        gl::SyncDeferredCommandsForClientArrayUnlocked(context, pointer)
+#    define ANGLE_SYNC_DEFERRED_COMMANDS_FOR_EGL(context) gl::SyncDeferredCommandsForEGL(context)
+#else
+#    define ANGLE_DEFER_COMMAND(EP, ...)
+#    define ANGLE_SYNC_DEFERRED_COMMANDS(context)
+#    define ANGLE_SYNC_DEFERRED_COMMANDS_FOR_CLIENT_ARRAY(context, pointer)
+#    define ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context)
+#    define ANGLE_SYNC_DEFERRED_COMMANDS_FOR_CLIENT_ARRAY_UNLOCKED(context, pointer)
+#    define ANGLE_SYNC_DEFERRED_COMMANDS_FOR_EGL(context)
+#endif  // ANGLE_DEFERRED_COMMANDS == ANGLE_ENABLED
+
+#endif  // LIBGLESV2_ENTRY_POINTS_DEFERRED_H_
@@ -0,0 +1,8139 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and entry_point_capture_params.json.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_deferred_autogen.cpp:
+//   Recording and execution of the deferred GLES commands.
+
+#include "libGLESv2/entry_points_deferred.h"
+
+#if ANGLE_DEFERRED_COMMANDS == ANGLE_ENABLED
+
+#    include "libANGLE/Context.inl.h"
+#    include "libANGLE/validationES2.h"
+#    include "libANGLE/validationES3.h"
+#    include "libANGLE/validationES31.h"
+#    include "libGLESv2/entry_points_enum_autogen.h"
+
+namespace gl
+{
+namespace
+{
+struct DeferredActiveShaderProgramParams
+{
+    GLuint pipeline;
+    GLuint program;
+};
+
+struct DeferredActiveTextureParams
+{
+    GLenum texture;
+};
+
+struct DeferredAttachShaderParams
+{
+    GLuint program;
+    GLuint shader;
+};
+
+struct DeferredBeginQueryParams
+{
+    QueryType target;
+    GLuint id;
+};
+
+struct DeferredBeginTransformFeedbackParams
+{
+    PrimitiveMode primitiveMode;
+};
+
+struct DeferredBindBufferParams
+{
+    BufferBinding target;
+    GLuint buffer;
+};
+
+struct DeferredBindBufferBaseParams
+{
+    BufferBinding target;
+    GLuint index;
+    GLuint buffer;
+};
+
+struct DeferredBindBufferRangeParams
+{
+    BufferBinding target;
+    GLuint index;
+    GLuint buffer;
+    GLintptr offset;
+    GLsizeiptr size;
+};
+
+struct DeferredBindFramebufferParams
+{
+    GLenum target;
+    GLuint framebuffer;
+};
+
+struct DeferredBindImageTextureParams
+{
+    GLuint unit;
+    GLuint texture;
+    GLint level;
+    GLboolean layered;
+    GLint layer;
+    GLenum access;
+    GLenum format;
+};
+
+struct DeferredBindProgramPipelineParams
+{
+    GLuint pipeline;
+};
+
+struct DeferredBindRenderbufferParams
+{
+    GLenum target;
+    GLuint renderbuffer;
+};
+
+struct DeferredBindSamplerParams
+{
+    GLuint unit;
+    GLuint sampler;
+};
+
+struct DeferredBindTextureParams
+{
+    TextureType target;
+    GLuint texture;
+};
+
+struct DeferredBindTransformFeedbackParams
+{
+    GLenum target;
+    GLuint id;
+};
+
+struct DeferredBindVertexArrayParams
+{
+    GLuint array;
+};
+
+struct DeferredBindVertexBufferParams
+{
+    GLuint bindingindex;
+    GLuint buffer;
+    GLintptr offset;
+    GLsizei stride;
+};
+
+struct DeferredBlendColorParams
+{
+    GLfloat red;
+    GLfloat green;
+    GLfloat blue;
+    GLfloat alpha;
+};
+
+struct DeferredBlendEquationParams
+{
+    GLenum mode;
+};
+
+struct DeferredBlendEquationSeparateParams
+{
+    GLenum modeRGB;
+    GLenum modeAlpha;
+};
+
+struct DeferredBlendFuncParams
+{
+    GLenum sfactor;
+    GLenum dfactor;
+};
+
+struct DeferredBlendFuncSeparateParams
+{
+    GLenum sfactorRGB;
+    GLenum dfactorRGB;
+    GLenum sfactorAlpha;
+    GLenum dfactorAlpha;
+};
+
+struct DeferredBlitFramebufferParams
+{
+    GLint srcX0;
+    GLint srcY0;
+    GLint srcX1;
+    GLint srcY1;
+    GLint dstX0;
+    GLint dstY0;
+    GLint dstX1;
+    GLint dstY1;
+    GLbitfield mask;
+    GLenum filter;
+};
+
+struct DeferredBufferDataParams
+{
+    BufferBinding target;
+    GLsizeiptr size;
+    const void *data;
+    BufferUsage usage;
+};
+
+struct DeferredBufferSubDataParams
+{
+    BufferBinding target;
+    GLintptr offset;
+    GLsizeiptr size;
+    const void *data;
+};
+
+struct DeferredClearParams
+{
+    GLbitfield mask;
+};
+
+struct DeferredClearBufferfiParams
+{
+    GLenum buffer;
+    GLint drawbuffer;
+    GLfloat depth;
+    GLint stencil;
+};
+
+struct DeferredClearBufferfvParams
+{
+    GLenum buffer;
+    GLint drawbuffer;
+    const GLfloat *value;
+};
+
+struct DeferredClearBufferivParams
+{
+    GLenum buffer;
+    GLint drawbuffer;
+    const GLint *value;
+};
+
+struct DeferredClearBufferuivParams
+{
+    GLenum buffer;
+    GLint drawbuffer;
+    const GLuint *value;
+};
+
+struct DeferredClearColorParams
+{
+    GLfloat red;
+    GLfloat green;
+    GLfloat blue;
+    GLfloat alpha;
+};
+
+struct DeferredClearDepthfParams
+{
+    GLfloat d;
+};
+
+struct DeferredClearStencilParams
+{
+    GLint s;
+};
+
+struct DeferredColorMaskParams
+{
+    GLboolean red;
+    GLboolean green;
+    GLboolean blue;
+    GLboolean alpha;
+};
+
+struct DeferredCompileShaderParams
+{
+    GLuint shader;
+};
+
+struct DeferredCopyBufferSubDataParams
+{
+    BufferBinding readTarget;
+    BufferBinding writeTarget;
+    GLintptr readOffset;
+    GLintptr writeOffset;
+    GLsizeiptr size;
+};
+
+struct DeferredCopyTexImage2DParams
+{
+    TextureTarget target;
+    GLint level;
+    GLenum internalformat;
+    GLint x;
+    GLint y;
+    GLsizei width;
+    GLsizei height;
+    GLint border;
+};
+
+struct DeferredCopyTexSubImage2DParams
+{
+    TextureTarget target;
+    GLint level;
+    GLint xoffset;
+    GLint yoffset;
+    GLint x;
+    GLint y;
+    GLsizei width;
+    GLsizei height;
+};
+
+struct DeferredCopyTexSubImage3DParams
+{
+    TextureTarget target;
+    GLint level;
+    GLint xoffset;
+    GLint yoffset;
+    GLint zoffset;
+    GLint x;
+    GLint y;
+    GLsizei width;
+    GLsizei height;
+};
+
+struct DeferredCullFaceParams
+{
+    CullFaceMode mode;
+};
+
+struct DeferredDeleteBuffersParams
+{
+    GLsizei n;
+    const GLuint *buffers;
+};
+
+struct DeferredDeleteFramebuffersParams
+{
+    GLsizei n;
+    const GLuint *framebuffers;
+};
+
+struct DeferredDeleteProgramParams
+{
+    GLuint program;
+};
+
+struct DeferredDeleteProgramPipelinesParams
+{
+    GLsizei n;
+    const GLuint *pipelines;
+};
+
+struct DeferredDeleteQueriesParams
+{
+    GLsizei n;
+    const GLuint *ids;
+};
+
+struct DeferredDeleteRenderbuffersParams
+{
+    GLsizei n;
+    const GLuint *renderbuffers;
+};
+
+struct DeferredDeleteSamplersParams
+{
+    GLsizei count;
+    const GLuint *samplers;
+};
+
+struct DeferredDeleteShaderParams
+{
+    GLuint shader;
+};
+
+struct DeferredDeleteSyncParams
+{
+    GLsync sync;
+};
+
+struct DeferredDeleteTexturesParams
+{
+    GLsizei n;
+    const GLuint *textures;
+};
+
+struct DeferredDeleteTransformFeedbacksParams
+{
+    GLsizei n;
+    const GLuint *ids;
+};
+
+struct DeferredDeleteVertexArraysParams
+{
+    GLsizei n;
+    const GLuint *arrays;
+};
+
+struct DeferredDepthFuncParams
+{
+    GLenum func;
+};
+
+struct DeferredDepthMaskParams
+{
+    GLboolean flag;
+};
+
+struct DeferredDepthRangefParams
+{
+    GLfloat n;
+    GLfloat f;
+};
+
+struct DeferredDetachShaderParams
+{
+    GLuint program;
+    GLuint shader;
+};
+
+struct DeferredDisableParams
+{
+    GLenum cap;
+};
+
+struct DeferredDisableVertexAttribArrayParams
+{
+    GLuint index;
+};
+
+struct DeferredDispatchComputeParams
+{
+    GLuint num_groups_x;
+    GLuint num_groups_y;
+    GLuint num_groups_z;
+};
+
+struct DeferredDispatchComputeIndirectParams
+{
+    GLintptr indirect;
+};
+
+struct DeferredDrawArraysParams
+{
+    PrimitiveMode mode;
+    GLint first;
+    GLsizei count;
+};
+
+struct DeferredDrawArraysInstancedParams
+{
+    PrimitiveMode mode;
+    GLint first;
+    GLsizei count;
+    GLsizei instancecount;
+};
+
+struct DeferredDrawBuffersParams
+{
+    GLsizei n;
+    const GLenum *bufs;
+};
+
+struct DeferredEnableParams
+{
+    GLenum cap;
+};
+
+struct DeferredEnableVertexAttribArrayParams
+{
+    GLuint index;
+};
+
+struct DeferredEndQueryParams
+{
+    QueryType target;
+};
+
+struct DeferredEndTransformFeedbackParams
+{};
+
+struct DeferredFlushParams
+{};
+
+struct DeferredFlushMappedBufferRangeParams
+{
+    BufferBinding target;
+    GLintptr offset;
+    GLsizeiptr length;
+};
+
+struct DeferredFramebufferParameteriParams
+{
+    GLenum target;
+    GLenum pname;
+    GLint param;
+};
+
+struct DeferredFramebufferRenderbufferParams
+{
+    GLenum target;
+    GLenum attachment;
+    GLenum renderbuffertarget;
+    GLuint renderbuffer;
+};
+
+struct DeferredFramebufferTexture2DParams
+{
+    GLenum target;
+    GLenum attachment;
+    TextureTarget textarget;
+    GLuint texture;
+    GLint level;
+};
+
+struct DeferredFramebufferTextureLayerParams
+{
+    GLenum target;
+    GLenum attachment;
+    GLuint texture;
+    GLint level;
+    GLint layer;
+};
+
+struct DeferredFrontFaceParams
+{
+    GLenum mode;
+};
+
+struct DeferredGenerateMipmapParams
+{
+    TextureType target;
+};
+
+struct DeferredHintParams
+{
+    GLenum target;
+    GLenum mode;
+};
+
+struct DeferredInvalidateFramebufferParams
+{
+    GLenum target;
+    GLsizei numAttachments;
+    const GLenum *attachments;
+};
+
+struct DeferredInvalidateSubFramebufferParams
+{
+    GLenum target;
+    GLsizei numAttachments;
+    const GLenum *attachments;
+    GLint x;
+    GLint y;
+    GLsizei width;
+    GLsizei height;
+};
+
+struct DeferredLineWidthParams
+{
+    GLfloat width;
+};
+
+struct DeferredLinkProgramParams
+{
+    GLuint program;
+};
+
+struct DeferredMemoryBarrierParams
+{
+    GLbitfield barriers;
+};
+
+struct DeferredMemoryBarrierByRegionParams
+{
+    GLbitfield barriers;
+};
+
+struct DeferredPauseTransformFeedbackParams
+{};
+
+struct DeferredPixelStoreiParams
+{
+    GLenum pname;
+    GLint param;
+};
+
+struct DeferredPolygonOffsetParams
+{
+    GLfloat factor;
+    GLfloat units;
+};
+
+struct DeferredProgramBinaryParams
+{
+    GLuint program;
+    GLenum binaryFormat;
+    const void *binary;
+    GLsizei length;
+};
+
+struct DeferredProgramParameteriParams
+{
+    GLuint program;
+    GLenum pname;
+    GLint value;
+};
+
+struct DeferredProgramUniform1fParams
+{
+    GLuint program;
+    GLint location;
+    GLfloat v0;
+};
+
+struct DeferredProgramUniform1fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    const GLfloat *value;
+};
+
+struct DeferredProgramUniform1iParams
+{
+    GLuint program;
+    GLint location;
+    GLint v0;
+};
+
+struct DeferredProgramUniform1ivParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    const GLint *value;
+};
+
+struct DeferredProgramUniform1uiParams
+{
+    GLuint program;
+    GLint location;
+    GLuint v0;
+};
+
+struct DeferredProgramUniform1uivParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    const GLuint *value;
+};
+
+struct DeferredProgramUniform2fParams
+{
+    GLuint program;
+    GLint location;
+    GLfloat v0;
+    GLfloat v1;
+};
+
+struct DeferredProgramUniform2fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    const GLfloat *value;
+};
+
+struct DeferredProgramUniform2iParams
+{
+    GLuint program;
+    GLint location;
+    GLint v0;
+    GLint v1;
+};
+
+struct DeferredProgramUniform2ivParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    const GLint *value;
+};
+
+struct DeferredProgramUniform2uiParams
+{
+    GLuint program;
+    GLint location;
+    GLuint v0;
+    GLuint v1;
+};
+
+struct DeferredProgramUniform2uivParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    const GLuint *value;
+};
+
+struct DeferredProgramUniform3fParams
+{
+    GLuint program;
+    GLint location;
+    GLfloat v0;
+    GLfloat v1;
+    GLfloat v2;
+};
+
+struct DeferredProgramUniform3fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    const GLfloat *value;
+};
+
+struct DeferredProgramUniform3iParams
+{
+    GLuint program;
+    GLint location;
+    GLint v0;
+    GLint v1;
+    GLint v2;
+};
+
+struct DeferredProgramUniform3ivParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    const GLint *value;
+};
+
+struct DeferredProgramUniform3uiParams
+{
+    GLuint program;
+    GLint location;
+    GLuint v0;
+    GLuint v1;
+    GLuint v2;
+};
+
+struct DeferredProgramUniform3uivParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    const GLuint *value;
+};
+
+struct DeferredProgramUniform4fParams
+{
+    GLuint program;
+    GLint location;
+    GLfloat v0;
+    GLfloat v1;
+    GLfloat v2;
+    GLfloat v3;
+};
+
+struct DeferredProgramUniform4fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    const GLfloat *value;
+};
+
+struct DeferredProgramUniform4iParams
+{
+    GLuint program;
+    GLint location;
+    GLint v0;
+    GLint v1;
+    GLint v2;
+    GLint v3;
+};
+
+struct DeferredProgramUniform4ivParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    const GLint *value;
+};
+
+struct DeferredProgramUniform4uiParams
+{
+    GLuint program;
+    GLint location;
+    GLuint v0;
+    GLuint v1;
+    GLuint v2;
+    GLuint v3;
+};
+
+struct DeferredProgramUniform4uivParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    const GLuint *value;
+};
+
+struct DeferredProgramUniformMatrix2fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredProgramUniformMatrix2x3fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredProgramUniformMatrix2x4fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredProgramUniformMatrix3fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredProgramUniformMatrix3x2fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredProgramUniformMatrix3x4fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredProgramUniformMatrix4fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredProgramUniformMatrix4x2fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredProgramUniformMatrix4x3fvParams
+{
+    GLuint program;
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredReadBufferParams
+{
+    GLenum src;
+};
+
+struct DeferredReleaseShaderCompilerParams
+{};
+
+struct DeferredRenderbufferStorageParams
+{
+    GLenum target;
+    GLenum internalformat;
+    GLsizei width;
+    GLsizei height;
+};
+
+struct DeferredRenderbufferStorageMultisampleParams
+{
+    GLenum target;
+    GLsizei samples;
+    GLenum internalformat;
+    GLsizei width;
+    GLsizei height;
+};
+
+struct DeferredResumeTransformFeedbackParams
+{};
+
+struct DeferredSampleCoverageParams
+{
+    GLfloat value;
+    GLboolean invert;
+};
+
+struct DeferredSampleMaskiParams
+{
+    GLuint maskNumber;
+    GLbitfield mask;
+};
+
+struct DeferredSamplerParameterfParams
+{
+    GLuint sampler;
+    GLenum pname;
+    GLfloat param;
+};
+
+struct DeferredSamplerParameterfvParams
+{
+    GLuint sampler;
+    GLenum pname;
+    const GLfloat *param;
+};
+
+struct DeferredSamplerParameteriParams
+{
+    GLuint sampler;
+    GLenum pname;
+    GLint param;
+};
+
+struct DeferredSamplerParameterivParams
+{
+    GLuint sampler;
+    GLenum pname;
+    const GLint *param;
+};
+
+struct DeferredScissorParams
+{
+    GLint x;
+    GLint y;
+    GLsizei width;
+    GLsizei height;
+};
+
+struct DeferredShaderBinaryParams
+{
+    GLsizei count;
+    const GLuint *shaders;
+    GLenum binaryformat;
+    const void *binary;
+    GLsizei length;
+};
+
+struct DeferredShaderSourceParams
+{
+    GLuint shader;
+    GLsizei count;
+    const GLchar *const *string;
+    const GLint *length;
+};
+
+struct DeferredStencilFuncParams
+{
+    GLenum func;
+    GLint ref;
+    GLuint mask;
+};
+
+struct DeferredStencilFuncSeparateParams
+{
+    GLenum face;
+    GLenum func;
+    GLint ref;
+    GLuint mask;
+};
+
+struct DeferredStencilMaskParams
+{
+    GLuint mask;
+};
+
+struct DeferredStencilMaskSeparateParams
+{
+    GLenum face;
+    GLuint mask;
+};
+
+struct DeferredStencilOpParams
+{
+    GLenum fail;
+    GLenum zfail;
+    GLenum zpass;
+};
+
+struct DeferredStencilOpSeparateParams
+{
+    GLenum face;
+    GLenum sfail;
+    GLenum dpfail;
+    GLenum dppass;
+};
+
+struct DeferredTexParameterfParams
+{
+    TextureType target;
+    GLenum pname;
+    GLfloat param;
+};
+
+struct DeferredTexParameterfvParams
+{
+    TextureType target;
+    GLenum pname;
+    const GLfloat *params;
+};
+
+struct DeferredTexParameteriParams
+{
+    TextureType target;
+    GLenum pname;
+    GLint param;
+};
+
+struct DeferredTexParameterivParams
+{
+    TextureType target;
+    GLenum pname;
+    const GLint *params;
+};
+
+struct DeferredTexStorage2DParams
+{
+    TextureType target;
+    GLsizei levels;
+    GLenum internalformat;
+    GLsizei width;
+    GLsizei height;
+};
+
+struct DeferredTexStorage2DMultisampleParams
+{
+    TextureType target;
+    GLsizei samples;
+    GLenum internalformat;
+    GLsizei width;
+    GLsizei height;
+    GLboolean fixedsamplelocations;
+};
+
+struct DeferredTexStorage3DParams
+{
+    TextureType target;
+    GLsizei levels;
+    GLenum internalformat;
+    GLsizei width;
+    GLsizei height;
+    GLsizei depth;
+};
+
+struct DeferredTransformFeedbackVaryingsParams
+{
+    GLuint program;
+    GLsizei count;
+    const GLchar *const *varyings;
+    GLenum bufferMode;
+};
+
+struct DeferredUniform1fParams
+{
+    GLint location;
+    GLfloat v0;
+};
+
+struct DeferredUniform1fvParams
+{
+    GLint location;
+    GLsizei count;
+    const GLfloat *value;
+};
+
+struct DeferredUniform1iParams
+{
+    GLint location;
+    GLint v0;
+};
+
+struct DeferredUniform1ivParams
+{
+    GLint location;
+    GLsizei count;
+    const GLint *value;
+};
+
+struct DeferredUniform1uiParams
+{
+    GLint location;
+    GLuint v0;
+};
+
+struct DeferredUniform1uivParams
+{
+    GLint location;
+    GLsizei count;
+    const GLuint *value;
+};
+
+struct DeferredUniform2fParams
+{
+    GLint location;
+    GLfloat v0;
+    GLfloat v1;
+};
+
+struct DeferredUniform2fvParams
+{
+    GLint location;
+    GLsizei count;
+    const GLfloat *value;
+};
+
+struct DeferredUniform2iParams
+{
+    GLint location;
+    GLint v0;
+    GLint v1;
+};
+
+struct DeferredUniform2ivParams
+{
+    GLint location;
+    GLsizei count;
+    const GLint *value;
+};
+
+struct DeferredUniform2uiParams
+{
+    GLint location;
+    GLuint v0;
+    GLuint v1;
+};
+
+struct DeferredUniform2uivParams
+{
+    GLint location;
+    GLsizei count;
+    const GLuint *value;
+};
+
+struct DeferredUniform3fParams
+{
+    GLint location;
+    GLfloat v0;
+    GLfloat v1;
+    GLfloat v2;
+};
+
+struct DeferredUniform3fvParams
+{
+    GLint location;
+    GLsizei count;
+    const GLfloat *value;
+};
+
+struct DeferredUniform3iParams
+{
+    GLint location;
+    GLint v0;
+    GLint v1;
+    GLint v2;
+};
+
+struct DeferredUniform3ivParams
+{
+    GLint location;
+    GLsizei count;
+    const GLint *value;
+};
+
+struct DeferredUniform3uiParams
+{
+    GLint location;
+    GLuint v0;
+    GLuint v1;
+    GLuint v2;
+};
+
+struct DeferredUniform3uivParams
+{
+    GLint location;
+    GLsizei count;
+    const GLuint *value;
+};
+
+struct DeferredUniform4fParams
+{
+    GLint location;
+    GLfloat v0;
+    GLfloat v1;
+    GLfloat v2;
+    GLfloat v3;
+};
+
+struct DeferredUniform4fvParams
+{
+    GLint location;
+    GLsizei count;
+    const GLfloat *value;
+};
+
+struct DeferredUniform4iParams
+{
+    GLint location;
+    GLint v0;
+    GLint v1;
+    GLint v2;
+    GLint v3;
+};
+
+struct DeferredUniform4ivParams
+{
+    GLint location;
+    GLsizei count;
+    const GLint *value;
+};
+
+struct DeferredUniform4uiParams
+{
+    GLint location;
+    GLuint v0;
+    GLuint v1;
+    GLuint v2;
+    GLuint v3;
+};
+
+struct DeferredUniform4uivParams
+{
+    GLint location;
+    GLsizei count;
+    const GLuint *value;
+};
+
+struct DeferredUniformBlockBindingParams
+{
+    GLuint program;
+    GLuint uniformBlockIndex;
+    GLuint uniformBlockBinding;
+};
+
+struct DeferredUniformMatrix2fvParams
+{
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredUniformMatrix2x3fvParams
+{
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredUniformMatrix2x4fvParams
+{
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredUniformMatrix3fvParams
+{
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredUniformMatrix3x2fvParams
+{
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredUniformMatrix3x4fvParams
+{
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredUniformMatrix4fvParams
+{
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredUniformMatrix4x2fvParams
+{
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredUniformMatrix4x3fvParams
+{
+    GLint location;
+    GLsizei count;
+    GLboolean transpose;
+    const GLfloat *value;
+};
+
+struct DeferredUseProgramParams
+{
+    GLuint program;
+};
+
+struct DeferredUseProgramStagesParams
+{
+    GLuint pipeline;
+    GLbitfield stages;
+    GLuint program;
+};
+
+struct DeferredValidateProgramParams
+{
+    GLuint program;
+};
+
+struct DeferredValidateProgramPipelineParams
+{
+    GLuint pipeline;
+};
+
+struct DeferredVertexAttrib1fParams
+{
+    GLuint index;
+    GLfloat x;
+};
+
+struct DeferredVertexAttrib1fvParams
+{
+    GLuint index;
+    const GLfloat *v;
+};
+
+struct DeferredVertexAttrib2fParams
+{
+    GLuint index;
+    GLfloat x;
+    GLfloat y;
+};
+
+struct DeferredVertexAttrib2fvParams
+{
+    GLuint index;
+    const GLfloat *v;
+};
+
+struct DeferredVertexAttrib3fParams
+{
+    GLuint index;
+    GLfloat x;
+    GLfloat y;
+    GLfloat z;
+};
+
+struct DeferredVertexAttrib3fvParams
+{
+    GLuint index;
+    const GLfloat *v;
+};
+
+struct DeferredVertexAttrib4fParams
+{
+    GLuint index;
+    GLfloat x;
+    GLfloat y;
+    GLfloat z;
+    GLfloat w;
+};
+
+struct DeferredVertexAttrib4fvParams
+{
+    GLuint index;
+    const GLfloat *v;
+};
+
+struct DeferredVertexAttribBindingParams
+{
+    GLuint attribindex;
+    GLuint bindingindex;
+};
+
+struct DeferredVertexAttribDivisorParams
+{
+    GLuint index;
+    GLuint divisor;
+};
+
+struct DeferredVertexAttribFormatParams
+{
+    GLuint attribindex;
+    GLint size;
+    VertexAttribType type;
+    GLboolean normalized;
+    GLuint relativeoffset;
+};
+
+struct DeferredVertexAttribI4iParams
+{
+    GLuint index;
+    GLint x;
+    GLint y;
+    GLint z;
+    GLint w;
+};
+
+struct DeferredVertexAttribI4ivParams
+{
+    GLuint index;
+    const GLint *v;
+};
+
+struct DeferredVertexAttribI4uiParams
+{
+    GLuint index;
+    GLuint x;
+    GLuint y;
+    GLuint z;
+    GLuint w;
+};
+
+struct DeferredVertexAttribI4uivParams
+{
+    GLuint index;
+    const GLuint *v;
+};
+
+struct DeferredVertexAttribIFormatParams
+{
+    GLuint attribindex;
+    GLint size;
+    VertexAttribType type;
+    GLuint relativeoffset;
+};
+
+struct DeferredVertexBindingDivisorParams
+{
+    GLuint bindingindex;
+    GLuint divisor;
+};
+
+struct DeferredViewportParams
+{
+    GLint x;
+    GLint y;
+    GLsizei width;
+    GLsizei height;
+};
+
+struct DeferredWaitSyncParams
+{
+    GLsync sync;
+    GLbitfield flags;
+    GLuint64 timeout;
+};
+
+}  // anonymous namespace
+
+void ExecuteDeferredCommand(Context *context, const DeferredCommandHeader *header)
+{
+    // The commands recorded before the context was lost are dropped.
+    if (context->isContextLost())
+    {
+        return;
+    }
+
+    switch (static_cast<EntryPoint>(header->commandID))
+    {
+        case EntryPoint::ActiveShaderProgram:
+        {
+            const DeferredActiveShaderProgramParams *params =
+                DeferredCommandBuffer::GetParams<DeferredActiveShaderProgramParams>(header);
+            if (context->skipValidation() ||
+                ValidateActiveShaderProgram(context, params->pipeline, params->program))
+            {
+                context->activeShaderProgram(params->pipeline, params->program);
+            }
+            break;
+        }
+        case EntryPoint::ActiveTexture:
+        {
+            const DeferredActiveTextureParams *params =
+                DeferredCommandBuffer::GetParams<DeferredActiveTextureParams>(header);
+            if (context->skipValidation() || ValidateActiveTexture(context, params->texture))
+            {
+                context->activeTexture(params->texture);
+            }
+            break;
+        }
+        case EntryPoint::AttachShader:
+        {
+            const DeferredAttachShaderParams *params =
+                DeferredCommandBuffer::GetParams<DeferredAttachShaderParams>(header);
+            if (context->skipValidation() ||
+                ValidateAttachShader(context, params->program, params->shader))
+            {
+                context->attachShader(params->program, params->shader);
+            }
+            break;
+        }
+        case EntryPoint::BeginQuery:
+        {
+            const DeferredBeginQueryParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBeginQueryParams>(header);
+            if (context->skipValidation() ||
+                ValidateBeginQuery(context, params->target, params->id))
+            {
+                context->beginQuery(params->target, params->id);
+            }
+            break;
+        }
+        case EntryPoint::BeginTransformFeedback:
+        {
+            const DeferredBeginTransformFeedbackParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBeginTransformFeedbackParams>(header);
+            if (context->skipValidation() ||
+                ValidateBeginTransformFeedback(context, params->primitiveMode))
+            {
+                context->beginTransformFeedback(params->primitiveMode);
+            }
+            break;
+        }
+        case EntryPoint::BindBuffer:
+        {
+            const DeferredBindBufferParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBindBufferParams>(header);
+            if (context->skipValidation() ||
+                ValidateBindBuffer(context, params->target, params->buffer))
+            {
+                context->bindBuffer(params->target, params->buffer);
+            }
+            break;
+        }
+        case EntryPoint::BindBufferBase:
+        {
+            const DeferredBindBufferBaseParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBindBufferBaseParams>(header);
+            if (context->skipValidation() ||
+                ValidateBindBufferBase(context, params->target, params->index, params->buffer))
+            {
+                context->bindBufferBase(params->target, params->index, params->buffer);
+            }
+            break;
+        }
+        case EntryPoint::BindBufferRange:
+        {
+            const DeferredBindBufferRangeParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBindBufferRangeParams>(header);
+            if (context->skipValidation() ||
+                ValidateBindBufferRange(context, params->target, params->index, params->buffer,
+                                        params->offset, params->size))
+            {
+                context->bindBufferRange(params->target, params->index, params->buffer,
+                                         params->offset, params->size);
+            }
+            break;
+        }
+        case EntryPoint::BindFramebuffer:
+        {
+            const DeferredBindFramebufferParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBindFramebufferParams>(header);
+            if (context->skipValidation() ||
+                ValidateBindFramebuffer(context, params->target, params->framebuffer))
+            {
+                context->bindFramebuffer(params->target, params->framebuffer);
+            }
+            break;
+        }
+        case EntryPoint::BindImageTexture:
+        {
+            const DeferredBindImageTextureParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBindImageTextureParams>(header);
+            if (context->skipValidation() ||
+                ValidateBindImageTexture(context, params->unit, params->texture, params->level,
+                                         params->layered, params->layer, params->access,
+                                         params->format))
+            {
+                context->bindImageTexture(params->unit, params->texture, params->level,
+                                          params->layered, params->layer, params->access,
+                                          params->format);
+            }
+            break;
+        }
+        case EntryPoint::BindProgramPipeline:
+        {
+            const DeferredBindProgramPipelineParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBindProgramPipelineParams>(header);
+            if (context->skipValidation() || ValidateBindProgramPipeline(context, params->pipeline))
+            {
+                context->bindProgramPipeline(params->pipeline);
+            }
+            break;
+        }
+        case EntryPoint::BindRenderbuffer:
+        {
+            const DeferredBindRenderbufferParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBindRenderbufferParams>(header);
+            if (context->skipValidation() ||
+                ValidateBindRenderbuffer(context, params->target, params->renderbuffer))
+            {
+                context->bindRenderbuffer(params->target, params->renderbuffer);
+            }
+            break;
+        }
+        case EntryPoint::BindSampler:
+        {
+            const DeferredBindSamplerParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBindSamplerParams>(header);
+            if (context->skipValidation() ||
+                ValidateBindSampler(context, params->unit, params->sampler))
+            {
+                context->bindSampler(params->unit, params->sampler);
+            }
+            break;
+        }
+        case EntryPoint::BindTexture:
+        {
+            const DeferredBindTextureParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBindTextureParams>(header);
+            if (context->skipValidation() ||
+                ValidateBindTexture(context, params->target, params->texture))
+            {
+                context->bindTexture(params->target, params->texture);
+            }
+            break;
+        }
+        case EntryPoint::BindTransformFeedback:
+        {
+            const DeferredBindTransformFeedbackParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBindTransformFeedbackParams>(header);
+            if (context->skipValidation() ||
+                ValidateBindTransformFeedback(context, params->target, params->id))
+            {
+                context->bindTransformFeedback(params->target, params->id);
+            }
+            break;
+        }
+        case EntryPoint::BindVertexArray:
+        {
+            const DeferredBindVertexArrayParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBindVertexArrayParams>(header);
+            if (context->skipValidation() || ValidateBindVertexArray(context, params->array))
+            {
+                context->bindVertexArray(params->array);
+            }
+            break;
+        }
+        case EntryPoint::BindVertexBuffer:
+        {
+            const DeferredBindVertexBufferParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBindVertexBufferParams>(header);
+            if (context->skipValidation() ||
+                ValidateBindVertexBuffer(context, params->bindingindex, params->buffer,
+                                         params->offset, params->stride))
+            {
+                context->bindVertexBuffer(params->bindingindex, params->buffer, params->offset,
+                                          params->stride);
+            }
+            break;
+        }
+        case EntryPoint::BlendColor:
+        {
+            const DeferredBlendColorParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBlendColorParams>(header);
+            if (context->skipValidation() || ValidateBlendColor(context, params->red, params->green,
+                                                                params->blue, params->alpha))
+            {
+                context->blendColor(params->red, params->green, params->blue, params->alpha);
+            }
+            break;
+        }
+        case EntryPoint::BlendEquation:
+        {
+            const DeferredBlendEquationParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBlendEquationParams>(header);
+            if (context->skipValidation() || ValidateBlendEquation(context, params->mode))
+            {
+                context->blendEquation(params->mode);
+            }
+            break;
+        }
+        case EntryPoint::BlendEquationSeparate:
+        {
+            const DeferredBlendEquationSeparateParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBlendEquationSeparateParams>(header);
+            if (context->skipValidation() ||
+                ValidateBlendEquationSeparate(context, params->modeRGB, params->modeAlpha))
+            {
+                context->blendEquationSeparate(params->modeRGB, params->modeAlpha);
+            }
+            break;
+        }
+        case EntryPoint::BlendFunc:
+        {
+            const DeferredBlendFuncParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBlendFuncParams>(header);
+            if (context->skipValidation() ||
+                ValidateBlendFunc(context, params->sfactor, params->dfactor))
+            {
+                context->blendFunc(params->sfactor, params->dfactor);
+            }
+            break;
+        }
+        case EntryPoint::BlendFuncSeparate:
+        {
+            const DeferredBlendFuncSeparateParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBlendFuncSeparateParams>(header);
+            if (context->skipValidation() ||
+                ValidateBlendFuncSeparate(context, params->sfactorRGB, params->dfactorRGB,
+                                          params->sfactorAlpha, params->dfactorAlpha))
+            {
+                context->blendFuncSeparate(params->sfactorRGB, params->dfactorRGB,
+                                           params->sfactorAlpha, params->dfactorAlpha);
+            }
+            break;
+        }
+        case EntryPoint::BlitFramebuffer:
+        {
+            const DeferredBlitFramebufferParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBlitFramebufferParams>(header);
+            if (context->skipValidation() ||
+                ValidateBlitFramebuffer(context, params->srcX0, params->srcY0, params->srcX1,
+                                        params->srcY1, params->dstX0, params->dstY0, params->dstX1,
+                                        params->dstY1, params->mask, params->filter))
+            {
+                context->blitFramebuffer(params->srcX0, params->srcY0, params->srcX1, params->srcY1,
+                                         params->dstX0, params->dstY0, params->dstX1, params->dstY1,
+                                         params->mask, params->filter);
+            }
+            break;
+        }
+        case EntryPoint::BufferData:
+        {
+            const DeferredBufferDataParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBufferDataParams>(header);
+            if (context->skipValidation() ||
+                ValidateBufferData(context, params->target, params->size, params->data,
+                                   params->usage))
+            {
+                context->bufferData(params->target, params->size, params->data, params->usage);
+            }
+            break;
+        }
+        case EntryPoint::BufferSubData:
+        {
+            const DeferredBufferSubDataParams *params =
+                DeferredCommandBuffer::GetParams<DeferredBufferSubDataParams>(header);
+            if (context->skipValidation() ||
+                ValidateBufferSubData(context, params->target, params->offset, params->size,
+                                      params->data))
+            {
+                context->bufferSubData(params->target, params->offset, params->size, params->data);
+            }
+            break;
+        }
+        case EntryPoint::Clear:
+        {
+            const DeferredClearParams *params =
+                DeferredCommandBuffer::GetParams<DeferredClearParams>(header);
+            if (context->skipValidation() || ValidateClear(context, params->mask))
+            {
+                context->clear(params->mask);
+            }
+            break;
+        }
+        case EntryPoint::ClearBufferfi:
+        {
+            const DeferredClearBufferfiParams *params =
+                DeferredCommandBuffer::GetParams<DeferredClearBufferfiParams>(header);
+            if (context->skipValidation() ||
+                ValidateClearBufferfi(context, params->buffer, params->drawbuffer, params->depth,
+                                      params->stencil))
+            {
+                context->clearBufferfi(params->buffer, params->drawbuffer, params->depth,
+                                       params->stencil);
+            }
+            break;
+        }
+        case EntryPoint::ClearBufferfv:
+        {
+            const DeferredClearBufferfvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredClearBufferfvParams>(header);
+            if (context->skipValidation() ||
+                ValidateClearBufferfv(context, params->buffer, params->drawbuffer, params->value))
+            {
+                context->clearBufferfv(params->buffer, params->drawbuffer, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ClearBufferiv:
+        {
+            const DeferredClearBufferivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredClearBufferivParams>(header);
+            if (context->skipValidation() ||
+                ValidateClearBufferiv(context, params->buffer, params->drawbuffer, params->value))
+            {
+                context->clearBufferiv(params->buffer, params->drawbuffer, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ClearBufferuiv:
+        {
+            const DeferredClearBufferuivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredClearBufferuivParams>(header);
+            if (context->skipValidation() ||
+                ValidateClearBufferuiv(context, params->buffer, params->drawbuffer, params->value))
+            {
+                context->clearBufferuiv(params->buffer, params->drawbuffer, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ClearColor:
+        {
+            const DeferredClearColorParams *params =
+                DeferredCommandBuffer::GetParams<DeferredClearColorParams>(header);
+            if (context->skipValidation() || ValidateClearColor(context, params->red, params->green,
+                                                                params->blue, params->alpha))
+            {
+                context->clearColor(params->red, params->green, params->blue, params->alpha);
+            }
+            break;
+        }
+        case EntryPoint::ClearDepthf:
+        {
+            const DeferredClearDepthfParams *params =
+                DeferredCommandBuffer::GetParams<DeferredClearDepthfParams>(header);
+            if (context->skipValidation() || ValidateClearDepthf(context, params->d))
+            {
+                context->clearDepthf(params->d);
+            }
+            break;
+        }
+        case EntryPoint::ClearStencil:
+        {
+            const DeferredClearStencilParams *params =
+                DeferredCommandBuffer::GetParams<DeferredClearStencilParams>(header);
+            if (context->skipValidation() || ValidateClearStencil(context, params->s))
+            {
+                context->clearStencil(params->s);
+            }
+            break;
+        }
+        case EntryPoint::ColorMask:
+        {
+            const DeferredColorMaskParams *params =
+                DeferredCommandBuffer::GetParams<DeferredColorMaskParams>(header);
+            if (context->skipValidation() ||
+                ValidateColorMask(context, params->red, params->green, params->blue, params->alpha))
+            {
+                context->colorMask(params->red, params->green, params->blue, params->alpha);
+            }
+            break;
+        }
+        case EntryPoint::CompileShader:
+        {
+            const DeferredCompileShaderParams *params =
+                DeferredCommandBuffer::GetParams<DeferredCompileShaderParams>(header);
+            if (context->skipValidation() || ValidateCompileShader(context, params->shader))
+            {
+                context->compileShader(params->shader);
+            }
+            break;
+        }
+        case EntryPoint::CopyBufferSubData:
+        {
+            const DeferredCopyBufferSubDataParams *params =
+                DeferredCommandBuffer::GetParams<DeferredCopyBufferSubDataParams>(header);
+            if (context->skipValidation() ||
+                ValidateCopyBufferSubData(context, params->readTarget, params->writeTarget,
+                                          params->readOffset, params->writeOffset, params->size))
+            {
+                context->copyBufferSubData(params->readTarget, params->writeTarget,
+                                           params->readOffset, params->writeOffset, params->size);
+            }
+            break;
+        }
+        case EntryPoint::CopyTexImage2D:
+        {
+            const DeferredCopyTexImage2DParams *params =
+                DeferredCommandBuffer::GetParams<DeferredCopyTexImage2DParams>(header);
+            if (context->skipValidation() ||
+                ValidateCopyTexImage2D(context, params->target, params->level,
+                                       params->internalformat, params->x, params->y, params->width,
+                                       params->height, params->border))
+            {
+                context->copyTexImage2D(params->target, params->level, params->internalformat,
+                                        params->x, params->y, params->width, params->height,
+                                        params->border);
+            }
+            break;
+        }
+        case EntryPoint::CopyTexSubImage2D:
+        {
+            const DeferredCopyTexSubImage2DParams *params =
+                DeferredCommandBuffer::GetParams<DeferredCopyTexSubImage2DParams>(header);
+            if (context->skipValidation() ||
+                ValidateCopyTexSubImage2D(context, params->target, params->level, params->xoffset,
+                                          params->yoffset, params->x, params->y, params->width,
+                                          params->height))
+            {
+                context->copyTexSubImage2D(params->target, params->level, params->xoffset,
+                                           params->yoffset, params->x, params->y, params->width,
+                                           params->height);
+            }
+            break;
+        }
+        case EntryPoint::CopyTexSubImage3D:
+        {
+            const DeferredCopyTexSubImage3DParams *params =
+                DeferredCommandBuffer::GetParams<DeferredCopyTexSubImage3DParams>(header);
+            if (context->skipValidation() ||
+                ValidateCopyTexSubImage3D(context, params->target, params->level, params->xoffset,
+                                          params->yoffset, params->zoffset, params->x, params->y,
+                                          params->width, params->height))
+            {
+                context->copyTexSubImage3D(params->target, params->level, params->xoffset,
+                                           params->yoffset, params->zoffset, params->x, params->y,
+                                           params->width, params->height);
+            }
+            break;
+        }
+        case EntryPoint::CullFace:
+        {
+            const DeferredCullFaceParams *params =
+                DeferredCommandBuffer::GetParams<DeferredCullFaceParams>(header);
+            if (context->skipValidation() || ValidateCullFace(context, params->mode))
+            {
+                context->cullFace(params->mode);
+            }
+            break;
+        }
+        case EntryPoint::DeleteBuffers:
+        {
+            const DeferredDeleteBuffersParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDeleteBuffersParams>(header);
+            if (context->skipValidation() ||
+                ValidateDeleteBuffers(context, params->n, params->buffers))
+            {
+                context->deleteBuffers(params->n, params->buffers);
+            }
+            break;
+        }
+        case EntryPoint::DeleteFramebuffers:
+        {
+            const DeferredDeleteFramebuffersParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDeleteFramebuffersParams>(header);
+            if (context->skipValidation() ||
+                ValidateDeleteFramebuffers(context, params->n, params->framebuffers))
+            {
+                context->deleteFramebuffers(params->n, params->framebuffers);
+            }
+            break;
+        }
+        case EntryPoint::DeleteProgram:
+        {
+            const DeferredDeleteProgramParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDeleteProgramParams>(header);
+            if (context->skipValidation() || ValidateDeleteProgram(context, params->program))
+            {
+                context->deleteProgram(params->program);
+            }
+            break;
+        }
+        case EntryPoint::DeleteProgramPipelines:
+        {
+            const DeferredDeleteProgramPipelinesParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDeleteProgramPipelinesParams>(header);
+            if (context->skipValidation() ||
+                ValidateDeleteProgramPipelines(context, params->n, params->pipelines))
+            {
+                context->deleteProgramPipelines(params->n, params->pipelines);
+            }
+            break;
+        }
+        case EntryPoint::DeleteQueries:
+        {
+            const DeferredDeleteQueriesParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDeleteQueriesParams>(header);
+            if (context->skipValidation() || ValidateDeleteQueries(context, params->n, params->ids))
+            {
+                context->deleteQueries(params->n, params->ids);
+            }
+            break;
+        }
+        case EntryPoint::DeleteRenderbuffers:
+        {
+            const DeferredDeleteRenderbuffersParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDeleteRenderbuffersParams>(header);
+            if (context->skipValidation() ||
+                ValidateDeleteRenderbuffers(context, params->n, params->renderbuffers))
+            {
+                context->deleteRenderbuffers(params->n, params->renderbuffers);
+            }
+            break;
+        }
+        case EntryPoint::DeleteSamplers:
+        {
+            const DeferredDeleteSamplersParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDeleteSamplersParams>(header);
+            if (context->skipValidation() ||
+                ValidateDeleteSamplers(context, params->count, params->samplers))
+            {
+                context->deleteSamplers(params->count, params->samplers);
+            }
+            break;
+        }
+        case EntryPoint::DeleteShader:
+        {
+            const DeferredDeleteShaderParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDeleteShaderParams>(header);
+            if (context->skipValidation() || ValidateDeleteShader(context, params->shader))
+            {
+                context->deleteShader(params->shader);
+            }
+            break;
+        }
+        case EntryPoint::DeleteSync:
+        {
+            const DeferredDeleteSyncParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDeleteSyncParams>(header);
+            if (context->skipValidation() || ValidateDeleteSync(context, params->sync))
+            {
+                context->deleteSync(params->sync);
+            }
+            break;
+        }
+        case EntryPoint::DeleteTextures:
+        {
+            const DeferredDeleteTexturesParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDeleteTexturesParams>(header);
+            if (context->skipValidation() ||
+                ValidateDeleteTextures(context, params->n, params->textures))
+            {
+                context->deleteTextures(params->n, params->textures);
+            }
+            break;
+        }
+        case EntryPoint::DeleteTransformFeedbacks:
+        {
+            const DeferredDeleteTransformFeedbacksParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDeleteTransformFeedbacksParams>(header);
+            if (context->skipValidation() ||
+                ValidateDeleteTransformFeedbacks(context, params->n, params->ids))
+            {
+                context->deleteTransformFeedbacks(params->n, params->ids);
+            }
+            break;
+        }
+        case EntryPoint::DeleteVertexArrays:
+        {
+            const DeferredDeleteVertexArraysParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDeleteVertexArraysParams>(header);
+            if (context->skipValidation() ||
+                ValidateDeleteVertexArrays(context, params->n, params->arrays))
+            {
+                context->deleteVertexArrays(params->n, params->arrays);
+            }
+            break;
+        }
+        case EntryPoint::DepthFunc:
+        {
+            const DeferredDepthFuncParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDepthFuncParams>(header);
+            if (context->skipValidation() || ValidateDepthFunc(context, params->func))
+            {
+                context->depthFunc(params->func);
+            }
+            break;
+        }
+        case EntryPoint::DepthMask:
+        {
+            const DeferredDepthMaskParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDepthMaskParams>(header);
+            if (context->skipValidation() || ValidateDepthMask(context, params->flag))
+            {
+                context->depthMask(params->flag);
+            }
+            break;
+        }
+        case EntryPoint::DepthRangef:
+        {
+            const DeferredDepthRangefParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDepthRangefParams>(header);
+            if (context->skipValidation() || ValidateDepthRangef(context, params->n, params->f))
+            {
+                context->depthRangef(params->n, params->f);
+            }
+            break;
+        }
+        case EntryPoint::DetachShader:
+        {
+            const DeferredDetachShaderParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDetachShaderParams>(header);
+            if (context->skipValidation() ||
+                ValidateDetachShader(context, params->program, params->shader))
+            {
+                context->detachShader(params->program, params->shader);
+            }
+            break;
+        }
+        case EntryPoint::Disable:
+        {
+            const DeferredDisableParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDisableParams>(header);
+            if (context->skipValidation() || ValidateDisable(context, params->cap))
+            {
+                context->disable(params->cap);
+            }
+            break;
+        }
+        case EntryPoint::DisableVertexAttribArray:
+        {
+            const DeferredDisableVertexAttribArrayParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDisableVertexAttribArrayParams>(header);
+            if (context->skipValidation() ||
+                ValidateDisableVertexAttribArray(context, params->index))
+            {
+                context->disableVertexAttribArray(params->index);
+            }
+            break;
+        }
+        case EntryPoint::DispatchCompute:
+        {
+            const DeferredDispatchComputeParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDispatchComputeParams>(header);
+            if (context->skipValidation() ||
+                ValidateDispatchCompute(context, params->num_groups_x, params->num_groups_y,
+                                        params->num_groups_z))
+            {
+                context->dispatchCompute(params->num_groups_x, params->num_groups_y,
+                                         params->num_groups_z);
+            }
+            break;
+        }
+        case EntryPoint::DispatchComputeIndirect:
+        {
+            const DeferredDispatchComputeIndirectParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDispatchComputeIndirectParams>(header);
+            if (context->skipValidation() ||
+                ValidateDispatchComputeIndirect(context, params->indirect))
+            {
+                context->dispatchComputeIndirect(params->indirect);
+            }
+            break;
+        }
+        case EntryPoint::DrawArrays:
+        {
+            const DeferredDrawArraysParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDrawArraysParams>(header);
+            if (context->skipValidation() ||
+                ValidateDrawArrays(context, params->mode, params->first, params->count))
+            {
+                context->drawArrays(params->mode, params->first, params->count);
+            }
+            break;
+        }
+        case EntryPoint::DrawArraysInstanced:
+        {
+            const DeferredDrawArraysInstancedParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDrawArraysInstancedParams>(header);
+            if (context->skipValidation() ||
+                ValidateDrawArraysInstanced(context, params->mode, params->first, params->count,
+                                            params->instancecount))
+            {
+                context->drawArraysInstanced(params->mode, params->first, params->count,
+                                             params->instancecount);
+            }
+            break;
+        }
+        case EntryPoint::DrawBuffers:
+        {
+            const DeferredDrawBuffersParams *params =
+                DeferredCommandBuffer::GetParams<DeferredDrawBuffersParams>(header);
+            if (context->skipValidation() || ValidateDrawBuffers(context, params->n, params->bufs))
+            {
+                context->drawBuffers(params->n, params->bufs);
+            }
+            break;
+        }
+        case EntryPoint::Enable:
+        {
+            const DeferredEnableParams *params =
+                DeferredCommandBuffer::GetParams<DeferredEnableParams>(header);
+            if (context->skipValidation() || ValidateEnable(context, params->cap))
+            {
+                context->enable(params->cap);
+            }
+            break;
+        }
+        case EntryPoint::EnableVertexAttribArray:
+        {
+            const DeferredEnableVertexAttribArrayParams *params =
+                DeferredCommandBuffer::GetParams<DeferredEnableVertexAttribArrayParams>(header);
+            if (context->skipValidation() ||
+                ValidateEnableVertexAttribArray(context, params->index))
+            {
+                context->enableVertexAttribArray(params->index);
+            }
+            break;
+        }
+        case EntryPoint::EndQuery:
+        {
+            const DeferredEndQueryParams *params =
+                DeferredCommandBuffer::GetParams<DeferredEndQueryParams>(header);
+            if (context->skipValidation() || ValidateEndQuery(context, params->target))
+            {
+                context->endQuery(params->target);
+            }
+            break;
+        }
+        case EntryPoint::EndTransformFeedback:
+        {
+            if (context->skipValidation() || ValidateEndTransformFeedback(context))
+            {
+                context->endTransformFeedback();
+            }
+            break;
+        }
+        case EntryPoint::Flush:
+        {
+            if (context->skipValidation() || ValidateFlush(context))
+            {
+                context->flush();
+            }
+            break;
+        }
+        case EntryPoint::FlushMappedBufferRange:
+        {
+            const DeferredFlushMappedBufferRangeParams *params =
+                DeferredCommandBuffer::GetParams<DeferredFlushMappedBufferRangeParams>(header);
+            if (context->skipValidation() ||
+                ValidateFlushMappedBufferRange(context, params->target, params->offset,
+                                               params->length))
+            {
+                context->flushMappedBufferRange(params->target, params->offset, params->length);
+            }
+            break;
+        }
+        case EntryPoint::FramebufferParameteri:
+        {
+            const DeferredFramebufferParameteriParams *params =
+                DeferredCommandBuffer::GetParams<DeferredFramebufferParameteriParams>(header);
+            if (context->skipValidation() ||
+                ValidateFramebufferParameteri(context, params->target, params->pname,
+                                              params->param))
+            {
+                context->framebufferParameteri(params->target, params->pname, params->param);
+            }
+            break;
+        }
+        case EntryPoint::FramebufferRenderbuffer:
+        {
+            const DeferredFramebufferRenderbufferParams *params =
+                DeferredCommandBuffer::GetParams<DeferredFramebufferRenderbufferParams>(header);
+            if (context->skipValidation() ||
+                ValidateFramebufferRenderbuffer(context, params->target, params->attachment,
+                                                params->renderbuffertarget, params->renderbuffer))
+            {
+                context->framebufferRenderbuffer(params->target, params->attachment,
+                                                 params->renderbuffertarget, params->renderbuffer);
+            }
+            break;
+        }
+        case EntryPoint::FramebufferTexture2D:
+        {
+            const DeferredFramebufferTexture2DParams *params =
+                DeferredCommandBuffer::GetParams<DeferredFramebufferTexture2DParams>(header);
+            if (context->skipValidation() ||
+                ValidateFramebufferTexture2D(context, params->target, params->attachment,
+                                             params->textarget, params->texture, params->level))
+            {
+                context->framebufferTexture2D(params->target, params->attachment, params->textarget,
+                                              params->texture, params->level);
+            }
+            break;
+        }
+        case EntryPoint::FramebufferTextureLayer:
+        {
+            const DeferredFramebufferTextureLayerParams *params =
+                DeferredCommandBuffer::GetParams<DeferredFramebufferTextureLayerParams>(header);
+            if (context->skipValidation() ||
+                ValidateFramebufferTextureLayer(context, params->target, params->attachment,
+                                                params->texture, params->level, params->layer))
+            {
+                context->framebufferTextureLayer(params->target, params->attachment,
+                                                 params->texture, params->level, params->layer);
+            }
+            break;
+        }
+        case EntryPoint::FrontFace:
+        {
+            const DeferredFrontFaceParams *params =
+                DeferredCommandBuffer::GetParams<DeferredFrontFaceParams>(header);
+            if (context->skipValidation() || ValidateFrontFace(context, params->mode))
+            {
+                context->frontFace(params->mode);
+            }
+            break;
+        }
+        case EntryPoint::GenerateMipmap:
+        {
+            const DeferredGenerateMipmapParams *params =
+                DeferredCommandBuffer::GetParams<DeferredGenerateMipmapParams>(header);
+            if (context->skipValidation() || ValidateGenerateMipmap(context, params->target))
+            {
+                context->generateMipmap(params->target);
+            }
+            break;
+        }
+        case EntryPoint::Hint:
+        {
+            const DeferredHintParams *params =
+                DeferredCommandBuffer::GetParams<DeferredHintParams>(header);
+            if (context->skipValidation() || ValidateHint(context, params->target, params->mode))
+            {
+                context->hint(params->target, params->mode);
+            }
+            break;
+        }
+        case EntryPoint::InvalidateFramebuffer:
+        {
+            const DeferredInvalidateFramebufferParams *params =
+                DeferredCommandBuffer::GetParams<DeferredInvalidateFramebufferParams>(header);
+            if (context->skipValidation() ||
+                ValidateInvalidateFramebuffer(context, params->target, params->numAttachments,
+                                              params->attachments))
+            {
+                context->invalidateFramebuffer(params->target, params->numAttachments,
+                                               params->attachments);
+            }
+            break;
+        }
+        case EntryPoint::InvalidateSubFramebuffer:
+        {
+            const DeferredInvalidateSubFramebufferParams *params =
+                DeferredCommandBuffer::GetParams<DeferredInvalidateSubFramebufferParams>(header);
+            if (context->skipValidation() ||
+                ValidateInvalidateSubFramebuffer(context, params->target, params->numAttachments,
+                                                 params->attachments, params->x, params->y,
+                                                 params->width, params->height))
+            {
+                context->invalidateSubFramebuffer(params->target, params->numAttachments,
+                                                  params->attachments, params->x, params->y,
+                                                  params->width, params->height);
+            }
+            break;
+        }
+        case EntryPoint::LineWidth:
+        {
+            const DeferredLineWidthParams *params =
+                DeferredCommandBuffer::GetParams<DeferredLineWidthParams>(header);
+            if (context->skipValidation() || ValidateLineWidth(context, params->width))
+            {
+                context->lineWidth(params->width);
+            }
+            break;
+        }
+        case EntryPoint::LinkProgram:
+        {
+            const DeferredLinkProgramParams *params =
+                DeferredCommandBuffer::GetParams<DeferredLinkProgramParams>(header);
+            if (context->skipValidation() || ValidateLinkProgram(context, params->program))
+            {
+                context->linkProgram(params->program);
+            }
+            break;
+        }
+        case EntryPoint::MemoryBarrier:
+        {
+            const DeferredMemoryBarrierParams *params =
+                DeferredCommandBuffer::GetParams<DeferredMemoryBarrierParams>(header);
+            if (context->skipValidation() || ValidateMemoryBarrier(context, params->barriers))
+            {
+                context->memoryBarrier(params->barriers);
+            }
+            break;
+        }
+        case EntryPoint::MemoryBarrierByRegion:
+        {
+            const DeferredMemoryBarrierByRegionParams *params =
+                DeferredCommandBuffer::GetParams<DeferredMemoryBarrierByRegionParams>(header);
+            if (context->skipValidation() ||
+                ValidateMemoryBarrierByRegion(context, params->barriers))
+            {
+                context->memoryBarrierByRegion(params->barriers);
+            }
+            break;
+        }
+        case EntryPoint::PauseTransformFeedback:
+        {
+            if (context->skipValidation() || ValidatePauseTransformFeedback(context))
+            {
+                context->pauseTransformFeedback();
+            }
+            break;
+        }
+        case EntryPoint::PixelStorei:
+        {
+            const DeferredPixelStoreiParams *params =
+                DeferredCommandBuffer::GetParams<DeferredPixelStoreiParams>(header);
+            if (context->skipValidation() ||
+                ValidatePixelStorei(context, params->pname, params->param))
+            {
+                context->pixelStorei(params->pname, params->param);
+            }
+            break;
+        }
+        case EntryPoint::PolygonOffset:
+        {
+            const DeferredPolygonOffsetParams *params =
+                DeferredCommandBuffer::GetParams<DeferredPolygonOffsetParams>(header);
+            if (context->skipValidation() ||
+                ValidatePolygonOffset(context, params->factor, params->units))
+            {
+                context->polygonOffset(params->factor, params->units);
+            }
+            break;
+        }
+        case EntryPoint::ProgramBinary:
+        {
+            const DeferredProgramBinaryParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramBinaryParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramBinary(context, params->program, params->binaryFormat,
+                                      params->binary, params->length))
+            {
+                context->programBinary(params->program, params->binaryFormat, params->binary,
+                                       params->length);
+            }
+            break;
+        }
+        case EntryPoint::ProgramParameteri:
+        {
+            const DeferredProgramParameteriParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramParameteriParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramParameteri(context, params->program, params->pname, params->value))
+            {
+                context->programParameteri(params->program, params->pname, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform1f:
+        {
+            const DeferredProgramUniform1fParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform1fParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform1f(context, params->program, params->location, params->v0))
+            {
+                context->programUniform1f(params->program, params->location, params->v0);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform1fv:
+        {
+            const DeferredProgramUniform1fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform1fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform1fv(context, params->program, params->location, params->count,
+                                          params->value))
+            {
+                context->programUniform1fv(params->program, params->location, params->count,
+                                           params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform1i:
+        {
+            const DeferredProgramUniform1iParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform1iParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform1i(context, params->program, params->location, params->v0))
+            {
+                context->programUniform1i(params->program, params->location, params->v0);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform1iv:
+        {
+            const DeferredProgramUniform1ivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform1ivParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform1iv(context, params->program, params->location, params->count,
+                                          params->value))
+            {
+                context->programUniform1iv(params->program, params->location, params->count,
+                                           params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform1ui:
+        {
+            const DeferredProgramUniform1uiParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform1uiParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform1ui(context, params->program, params->location, params->v0))
+            {
+                context->programUniform1ui(params->program, params->location, params->v0);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform1uiv:
+        {
+            const DeferredProgramUniform1uivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform1uivParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform1uiv(context, params->program, params->location,
+                                           params->count, params->value))
+            {
+                context->programUniform1uiv(params->program, params->location, params->count,
+                                            params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform2f:
+        {
+            const DeferredProgramUniform2fParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform2fParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform2f(context, params->program, params->location, params->v0,
+                                         params->v1))
+            {
+                context->programUniform2f(params->program, params->location, params->v0,
+                                          params->v1);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform2fv:
+        {
+            const DeferredProgramUniform2fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform2fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform2fv(context, params->program, params->location, params->count,
+                                          params->value))
+            {
+                context->programUniform2fv(params->program, params->location, params->count,
+                                           params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform2i:
+        {
+            const DeferredProgramUniform2iParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform2iParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform2i(context, params->program, params->location, params->v0,
+                                         params->v1))
+            {
+                context->programUniform2i(params->program, params->location, params->v0,
+                                          params->v1);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform2iv:
+        {
+            const DeferredProgramUniform2ivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform2ivParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform2iv(context, params->program, params->location, params->count,
+                                          params->value))
+            {
+                context->programUniform2iv(params->program, params->location, params->count,
+                                           params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform2ui:
+        {
+            const DeferredProgramUniform2uiParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform2uiParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform2ui(context, params->program, params->location, params->v0,
+                                          params->v1))
+            {
+                context->programUniform2ui(params->program, params->location, params->v0,
+                                           params->v1);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform2uiv:
+        {
+            const DeferredProgramUniform2uivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform2uivParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform2uiv(context, params->program, params->location,
+                                           params->count, params->value))
+            {
+                context->programUniform2uiv(params->program, params->location, params->count,
+                                            params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform3f:
+        {
+            const DeferredProgramUniform3fParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform3fParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform3f(context, params->program, params->location, params->v0,
+                                         params->v1, params->v2))
+            {
+                context->programUniform3f(params->program, params->location, params->v0, params->v1,
+                                          params->v2);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform3fv:
+        {
+            const DeferredProgramUniform3fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform3fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform3fv(context, params->program, params->location, params->count,
+                                          params->value))
+            {
+                context->programUniform3fv(params->program, params->location, params->count,
+                                           params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform3i:
+        {
+            const DeferredProgramUniform3iParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform3iParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform3i(context, params->program, params->location, params->v0,
+                                         params->v1, params->v2))
+            {
+                context->programUniform3i(params->program, params->location, params->v0, params->v1,
+                                          params->v2);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform3iv:
+        {
+            const DeferredProgramUniform3ivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform3ivParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform3iv(context, params->program, params->location, params->count,
+                                          params->value))
+            {
+                context->programUniform3iv(params->program, params->location, params->count,
+                                           params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform3ui:
+        {
+            const DeferredProgramUniform3uiParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform3uiParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform3ui(context, params->program, params->location, params->v0,
+                                          params->v1, params->v2))
+            {
+                context->programUniform3ui(params->program, params->location, params->v0,
+                                           params->v1, params->v2);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform3uiv:
+        {
+            const DeferredProgramUniform3uivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform3uivParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform3uiv(context, params->program, params->location,
+                                           params->count, params->value))
+            {
+                context->programUniform3uiv(params->program, params->location, params->count,
+                                            params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform4f:
+        {
+            const DeferredProgramUniform4fParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform4fParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform4f(context, params->program, params->location, params->v0,
+                                         params->v1, params->v2, params->v3))
+            {
+                context->programUniform4f(params->program, params->location, params->v0, params->v1,
+                                          params->v2, params->v3);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform4fv:
+        {
+            const DeferredProgramUniform4fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform4fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform4fv(context, params->program, params->location, params->count,
+                                          params->value))
+            {
+                context->programUniform4fv(params->program, params->location, params->count,
+                                           params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform4i:
+        {
+            const DeferredProgramUniform4iParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform4iParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform4i(context, params->program, params->location, params->v0,
+                                         params->v1, params->v2, params->v3))
+            {
+                context->programUniform4i(params->program, params->location, params->v0, params->v1,
+                                          params->v2, params->v3);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform4iv:
+        {
+            const DeferredProgramUniform4ivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform4ivParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform4iv(context, params->program, params->location, params->count,
+                                          params->value))
+            {
+                context->programUniform4iv(params->program, params->location, params->count,
+                                           params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform4ui:
+        {
+            const DeferredProgramUniform4uiParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform4uiParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform4ui(context, params->program, params->location, params->v0,
+                                          params->v1, params->v2, params->v3))
+            {
+                context->programUniform4ui(params->program, params->location, params->v0,
+                                           params->v1, params->v2, params->v3);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform4uiv:
+        {
+            const DeferredProgramUniform4uivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniform4uivParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniform4uiv(context, params->program, params->location,
+                                           params->count, params->value))
+            {
+                context->programUniform4uiv(params->program, params->location, params->count,
+                                            params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix2fv:
+        {
+            const DeferredProgramUniformMatrix2fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniformMatrix2fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix2fv(context, params->program, params->location,
+                                                params->count, params->transpose, params->value))
+            {
+                context->programUniformMatrix2fv(params->program, params->location, params->count,
+                                                 params->transpose, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix2x3fv:
+        {
+            const DeferredProgramUniformMatrix2x3fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniformMatrix2x3fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix2x3fv(context, params->program, params->location,
+                                                  params->count, params->transpose, params->value))
+            {
+                context->programUniformMatrix2x3fv(params->program, params->location, params->count,
+                                                   params->transpose, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix2x4fv:
+        {
+            const DeferredProgramUniformMatrix2x4fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniformMatrix2x4fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix2x4fv(context, params->program, params->location,
+                                                  params->count, params->transpose, params->value))
+            {
+                context->programUniformMatrix2x4fv(params->program, params->location, params->count,
+                                                   params->transpose, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix3fv:
+        {
+            const DeferredProgramUniformMatrix3fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniformMatrix3fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix3fv(context, params->program, params->location,
+                                                params->count, params->transpose, params->value))
+            {
+                context->programUniformMatrix3fv(params->program, params->location, params->count,
+                                                 params->transpose, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix3x2fv:
+        {
+            const DeferredProgramUniformMatrix3x2fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniformMatrix3x2fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix3x2fv(context, params->program, params->location,
+                                                  params->count, params->transpose, params->value))
+            {
+                context->programUniformMatrix3x2fv(params->program, params->location, params->count,
+                                                   params->transpose, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix3x4fv:
+        {
+            const DeferredProgramUniformMatrix3x4fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniformMatrix3x4fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix3x4fv(context, params->program, params->location,
+                                                  params->count, params->transpose, params->value))
+            {
+                context->programUniformMatrix3x4fv(params->program, params->location, params->count,
+                                                   params->transpose, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix4fv:
+        {
+            const DeferredProgramUniformMatrix4fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniformMatrix4fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix4fv(context, params->program, params->location,
+                                                params->count, params->transpose, params->value))
+            {
+                context->programUniformMatrix4fv(params->program, params->location, params->count,
+                                                 params->transpose, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix4x2fv:
+        {
+            const DeferredProgramUniformMatrix4x2fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniformMatrix4x2fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix4x2fv(context, params->program, params->location,
+                                                  params->count, params->transpose, params->value))
+            {
+                context->programUniformMatrix4x2fv(params->program, params->location, params->count,
+                                                   params->transpose, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix4x3fv:
+        {
+            const DeferredProgramUniformMatrix4x3fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredProgramUniformMatrix4x3fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix4x3fv(context, params->program, params->location,
+                                                  params->count, params->transpose, params->value))
+            {
+                context->programUniformMatrix4x3fv(params->program, params->location, params->count,
+                                                   params->transpose, params->value);
+            }
+            break;
+        }
+        case EntryPoint::ReadBuffer:
+        {
+            const DeferredReadBufferParams *params =
+                DeferredCommandBuffer::GetParams<DeferredReadBufferParams>(header);
+            if (context->skipValidation() || ValidateReadBuffer(context, params->src))
+            {
+                context->readBuffer(params->src);
+            }
+            break;
+        }
+        case EntryPoint::ReleaseShaderCompiler:
+        {
+            if (context->skipValidation() || ValidateReleaseShaderCompiler(context))
+            {
+                context->releaseShaderCompiler();
+            }
+            break;
+        }
+        case EntryPoint::RenderbufferStorage:
+        {
+            const DeferredRenderbufferStorageParams *params =
+                DeferredCommandBuffer::GetParams<DeferredRenderbufferStorageParams>(header);
+            if (context->skipValidation() ||
+                ValidateRenderbufferStorage(context, params->target, params->internalformat,
+                                            params->width, params->height))
+            {
+                context->renderbufferStorage(params->target, params->internalformat, params->width,
+                                             params->height);
+            }
+            break;
+        }
+        case EntryPoint::RenderbufferStorageMultisample:
+        {
+            const DeferredRenderbufferStorageMultisampleParams *params =
+                DeferredCommandBuffer::GetParams<DeferredRenderbufferStorageMultisampleParams>(
+                    header);
+            if (context->skipValidation() ||
+                ValidateRenderbufferStorageMultisample(context, params->target, params->samples,
+                                                       params->internalformat, params->width,
+                                                       params->height))
+            {
+                context->renderbufferStorageMultisample(params->target, params->samples,
+                                                        params->internalformat, params->width,
+                                                        params->height);
+            }
+            break;
+        }
+        case EntryPoint::ResumeTransformFeedback:
+        {
+            if (context->skipValidation() || ValidateResumeTransformFeedback(context))
+            {
+                context->resumeTransformFeedback();
+            }
+            break;
+        }
+        case EntryPoint::SampleCoverage:
+        {
+            const DeferredSampleCoverageParams *params =
+                DeferredCommandBuffer::GetParams<DeferredSampleCoverageParams>(header);
+            if (context->skipValidation() ||
+                ValidateSampleCoverage(context, params->value, params->invert))
+            {
+                context->sampleCoverage(params->value, params->invert);
+            }
+            break;
+        }
+        case EntryPoint::SampleMaski:
+        {
+            const DeferredSampleMaskiParams *params =
+                DeferredCommandBuffer::GetParams<DeferredSampleMaskiParams>(header);
+            if (context->skipValidation() ||
+                ValidateSampleMaski(context, params->maskNumber, params->mask))
+            {
+                context->sampleMaski(params->maskNumber, params->mask);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameterf:
+        {
+            const DeferredSamplerParameterfParams *params =
+                DeferredCommandBuffer::GetParams<DeferredSamplerParameterfParams>(header);
+            if (context->skipValidation() ||
+                ValidateSamplerParameterf(context, params->sampler, params->pname, params->param))
+            {
+                context->samplerParameterf(params->sampler, params->pname, params->param);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameterfv:
+        {
+            const DeferredSamplerParameterfvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredSamplerParameterfvParams>(header);
+            if (context->skipValidation() ||
+                ValidateSamplerParameterfv(context, params->sampler, params->pname, params->param))
+            {
+                context->samplerParameterfv(params->sampler, params->pname, params->param);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameteri:
+        {
+            const DeferredSamplerParameteriParams *params =
+                DeferredCommandBuffer::GetParams<DeferredSamplerParameteriParams>(header);
+            if (context->skipValidation() ||
+                ValidateSamplerParameteri(context, params->sampler, params->pname, params->param))
+            {
+                context->samplerParameteri(params->sampler, params->pname, params->param);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameteriv:
+        {
+            const DeferredSamplerParameterivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredSamplerParameterivParams>(header);
+            if (context->skipValidation() ||
+                ValidateSamplerParameteriv(context, params->sampler, params->pname, params->param))
+            {
+                context->samplerParameteriv(params->sampler, params->pname, params->param);
+            }
+            break;
+        }
+        case EntryPoint::Scissor:
+        {
+            const DeferredScissorParams *params =
+                DeferredCommandBuffer::GetParams<DeferredScissorParams>(header);
+            if (context->skipValidation() ||
+                ValidateScissor(context, params->x, params->y, params->width, params->height))
+            {
+                context->scissor(params->x, params->y, params->width, params->height);
+            }
+            break;
+        }
+        case EntryPoint::ShaderBinary:
+        {
+            const DeferredShaderBinaryParams *params =
+                DeferredCommandBuffer::GetParams<DeferredShaderBinaryParams>(header);
+            if (context->skipValidation() ||
+                ValidateShaderBinary(context, params->count, params->shaders, params->binaryformat,
+                                     params->binary, params->length))
+            {
+                context->shaderBinary(params->count, params->shaders, params->binaryformat,
+                                      params->binary, params->length);
+            }
+            break;
+        }
+        case EntryPoint::ShaderSource:
+        {
+            const DeferredShaderSourceParams *params =
+                DeferredCommandBuffer::GetParams<DeferredShaderSourceParams>(header);
+            if (context->skipValidation() ||
+                ValidateShaderSource(context, params->shader, params->count, params->string,
+                                     params->length))
+            {
+                context->shaderSource(params->shader, params->count, params->string,
+                                      params->length);
+            }
+            break;
+        }
+        case EntryPoint::StencilFunc:
+        {
+            const DeferredStencilFuncParams *params =
+                DeferredCommandBuffer::GetParams<DeferredStencilFuncParams>(header);
+            if (context->skipValidation() ||
+                ValidateStencilFunc(context, params->func, params->ref, params->mask))
+            {
+                context->stencilFunc(params->func, params->ref, params->mask);
+            }
+            break;
+        }
+        case EntryPoint::StencilFuncSeparate:
+        {
+            const DeferredStencilFuncSeparateParams *params =
+                DeferredCommandBuffer::GetParams<DeferredStencilFuncSeparateParams>(header);
+            if (context->skipValidation() ||
+                ValidateStencilFuncSeparate(context, params->face, params->func, params->ref,
+                                            params->mask))
+            {
+                context->stencilFuncSeparate(params->face, params->func, params->ref, params->mask);
+            }
+            break;
+        }
+        case EntryPoint::StencilMask:
+        {
+            const DeferredStencilMaskParams *params =
+                DeferredCommandBuffer::GetParams<DeferredStencilMaskParams>(header);
+            if (context->skipValidation() || ValidateStencilMask(context, params->mask))
+            {
+                context->stencilMask(params->mask);
+            }
+            break;
+        }
+        case EntryPoint::StencilMaskSeparate:
+        {
+            const DeferredStencilMaskSeparateParams *params =
+                DeferredCommandBuffer::GetParams<DeferredStencilMaskSeparateParams>(header);
+            if (context->skipValidation() ||
+                ValidateStencilMaskSeparate(context, params->face, params->mask))
+            {
+                context->stencilMaskSeparate(params->face, params->mask);
+            }
+            break;
+        }
+        case EntryPoint::StencilOp:
+        {
+            const DeferredStencilOpParams *params =
+                DeferredCommandBuffer::GetParams<DeferredStencilOpParams>(header);
+            if (context->skipValidation() ||
+                ValidateStencilOp(context, params->fail, params->zfail, params->zpass))
+            {
+                context->stencilOp(params->fail, params->zfail, params->zpass);
+            }
+            break;
+        }
+        case EntryPoint::StencilOpSeparate:
+        {
+            const DeferredStencilOpSeparateParams *params =
+                DeferredCommandBuffer::GetParams<DeferredStencilOpSeparateParams>(header);
+            if (context->skipValidation() ||
+                ValidateStencilOpSeparate(context, params->face, params->sfail, params->dpfail,
+                                          params->dppass))
+            {
+                context->stencilOpSeparate(params->face, params->sfail, params->dpfail,
+                                           params->dppass);
+            }
+            break;
+        }
+        case EntryPoint::TexParameterf:
+        {
+            const DeferredTexParameterfParams *params =
+                DeferredCommandBuffer::GetParams<DeferredTexParameterfParams>(header);
+            if (context->skipValidation() ||
+                ValidateTexParameterf(context, params->target, params->pname, params->param))
+            {
+                context->texParameterf(params->target, params->pname, params->param);
+            }
+            break;
+        }
+        case EntryPoint::TexParameterfv:
+        {
+            const DeferredTexParameterfvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredTexParameterfvParams>(header);
+            if (context->skipValidation() ||
+                ValidateTexParameterfv(context, params->target, params->pname, params->params))
+            {
+                context->texParameterfv(params->target, params->pname, params->params);
+            }
+            break;
+        }
+        case EntryPoint::TexParameteri:
+        {
+            const DeferredTexParameteriParams *params =
+                DeferredCommandBuffer::GetParams<DeferredTexParameteriParams>(header);
+            if (context->skipValidation() ||
+                ValidateTexParameteri(context, params->target, params->pname, params->param))
+            {
+                context->texParameteri(params->target, params->pname, params->param);
+            }
+            break;
+        }
+        case EntryPoint::TexParameteriv:
+        {
+            const DeferredTexParameterivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredTexParameterivParams>(header);
+            if (context->skipValidation() ||
+                ValidateTexParameteriv(context, params->target, params->pname, params->params))
+            {
+                context->texParameteriv(params->target, params->pname, params->params);
+            }
+            break;
+        }
+        case EntryPoint::TexStorage2D:
+        {
+            const DeferredTexStorage2DParams *params =
+                DeferredCommandBuffer::GetParams<DeferredTexStorage2DParams>(header);
+            if (context->skipValidation() ||
+                ValidateTexStorage2D(context, params->target, params->levels,
+                                     params->internalformat, params->width, params->height))
+            {
+                context->texStorage2D(params->target, params->levels, params->internalformat,
+                                      params->width, params->height);
+            }
+            break;
+        }
+        case EntryPoint::TexStorage2DMultisample:
+        {
+            const DeferredTexStorage2DMultisampleParams *params =
+                DeferredCommandBuffer::GetParams<DeferredTexStorage2DMultisampleParams>(header);
+            if (context->skipValidation() ||
+                ValidateTexStorage2DMultisample(context, params->target, params->samples,
+                                                params->internalformat, params->width,
+                                                params->height, params->fixedsamplelocations))
+            {
+                context->texStorage2DMultisample(params->target, params->samples,
+                                                 params->internalformat, params->width,
+                                                 params->height, params->fixedsamplelocations);
+            }
+            break;
+        }
+        case EntryPoint::TexStorage3D:
+        {
+            const DeferredTexStorage3DParams *params =
+                DeferredCommandBuffer::GetParams<DeferredTexStorage3DParams>(header);
+            if (context->skipValidation() ||
+                ValidateTexStorage3D(context, params->target, params->levels,
+                                     params->internalformat, params->width, params->height,
+                                     params->depth))
+            {
+                context->texStorage3D(params->target, params->levels, params->internalformat,
+                                      params->width, params->height, params->depth);
+            }
+            break;
+        }
+        case EntryPoint::TransformFeedbackVaryings:
+        {
+            const DeferredTransformFeedbackVaryingsParams *params =
+                DeferredCommandBuffer::GetParams<DeferredTransformFeedbackVaryingsParams>(header);
+            if (context->skipValidation() ||
+                ValidateTransformFeedbackVaryings(context, params->program, params->count,
+                                                  params->varyings, params->bufferMode))
+            {
+                context->transformFeedbackVaryings(params->program, params->count, params->varyings,
+                                                   params->bufferMode);
+            }
+            break;
+        }
+        case EntryPoint::Uniform1f:
+        {
+            const DeferredUniform1fParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform1fParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform1f(context, params->location, params->v0))
+            {
+                context->uniform1f(params->location, params->v0);
+            }
+            break;
+        }
+        case EntryPoint::Uniform1fv:
+        {
+            const DeferredUniform1fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform1fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform1fv(context, params->location, params->count, params->value))
+            {
+                context->uniform1fv(params->location, params->count, params->value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform1i:
+        {
+            const DeferredUniform1iParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform1iParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform1i(context, params->location, params->v0))
+            {
+                context->uniform1i(params->location, params->v0);
+            }
+            break;
+        }
+        case EntryPoint::Uniform1iv:
+        {
+            const DeferredUniform1ivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform1ivParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform1iv(context, params->location, params->count, params->value))
+            {
+                context->uniform1iv(params->location, params->count, params->value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform1ui:
+        {
+            const DeferredUniform1uiParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform1uiParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform1ui(context, params->location, params->v0))
+            {
+                context->uniform1ui(params->location, params->v0);
+            }
+            break;
+        }
+        case EntryPoint::Uniform1uiv:
+        {
+            const DeferredUniform1uivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform1uivParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform1uiv(context, params->location, params->count, params->value))
+            {
+                context->uniform1uiv(params->location, params->count, params->value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform2f:
+        {
+            const DeferredUniform2fParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform2fParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform2f(context, params->location, params->v0, params->v1))
+            {
+                context->uniform2f(params->location, params->v0, params->v1);
+            }
+            break;
+        }
+        case EntryPoint::Uniform2fv:
+        {
+            const DeferredUniform2fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform2fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform2fv(context, params->location, params->count, params->value))
+            {
+                context->uniform2fv(params->location, params->count, params->value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform2i:
+        {
+            const DeferredUniform2iParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform2iParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform2i(context, params->location, params->v0, params->v1))
+            {
+                context->uniform2i(params->location, params->v0, params->v1);
+            }
+            break;
+        }
+        case EntryPoint::Uniform2iv:
+        {
+            const DeferredUniform2ivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform2ivParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform2iv(context, params->location, params->count, params->value))
+            {
+                context->uniform2iv(params->location, params->count, params->value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform2ui:
+        {
+            const DeferredUniform2uiParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform2uiParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform2ui(context, params->location, params->v0, params->v1))
+            {
+                context->uniform2ui(params->location, params->v0, params->v1);
+            }
+            break;
+        }
+        case EntryPoint::Uniform2uiv:
+        {
+            const DeferredUniform2uivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform2uivParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform2uiv(context, params->location, params->count, params->value))
+            {
+                context->uniform2uiv(params->location, params->count, params->value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform3f:
+        {
+            const DeferredUniform3fParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform3fParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform3f(context, params->location, params->v0, params->v1, params->v2))
+            {
+                context->uniform3f(params->location, params->v0, params->v1, params->v2);
+            }
+            break;
+        }
+        case EntryPoint::Uniform3fv:
+        {
+            const DeferredUniform3fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform3fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform3fv(context, params->location, params->count, params->value))
+            {
+                context->uniform3fv(params->location, params->count, params->value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform3i:
+        {
+            const DeferredUniform3iParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform3iParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform3i(context, params->location, params->v0, params->v1, params->v2))
+            {
+                context->uniform3i(params->location, params->v0, params->v1, params->v2);
+            }
+            break;
+        }
+        case EntryPoint::Uniform3iv:
+        {
+            const DeferredUniform3ivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform3ivParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform3iv(context, params->location, params->count, params->value))
+            {
+                context->uniform3iv(params->location, params->count, params->value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform3ui:
+        {
+            const DeferredUniform3uiParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform3uiParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform3ui(context, params->location, params->v0, params->v1, params->v2))
+            {
+                context->uniform3ui(params->location, params->v0, params->v1, params->v2);
+            }
+            break;
+        }
+        case EntryPoint::Uniform3uiv:
+        {
+            const DeferredUniform3uivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform3uivParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform3uiv(context, params->location, params->count, params->value))
+            {
+                context->uniform3uiv(params->location, params->count, params->value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform4f:
+        {
+            const DeferredUniform4fParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform4fParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform4f(context, params->location, params->v0, params->v1, params->v2,
+                                  params->v3))
+            {
+                context->uniform4f(params->location, params->v0, params->v1, params->v2,
+                                   params->v3);
+            }
+            break;
+        }
+        case EntryPoint::Uniform4fv:
+        {
+            const DeferredUniform4fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform4fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform4fv(context, params->location, params->count, params->value))
+            {
+                context->uniform4fv(params->location, params->count, params->value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform4i:
+        {
+            const DeferredUniform4iParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform4iParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform4i(context, params->location, params->v0, params->v1, params->v2,
+                                  params->v3))
+            {
+                context->uniform4i(params->location, params->v0, params->v1, params->v2,
+                                   params->v3);
+            }
+            break;
+        }
+        case EntryPoint::Uniform4iv:
+        {
+            const DeferredUniform4ivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform4ivParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform4iv(context, params->location, params->count, params->value))
+            {
+                context->uniform4iv(params->location, params->count, params->value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform4ui:
+        {
+            const DeferredUniform4uiParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform4uiParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform4ui(context, params->location, params->v0, params->v1, params->v2,
+                                   params->v3))
+            {
+                context->uniform4ui(params->location, params->v0, params->v1, params->v2,
+                                    params->v3);
+            }
+            break;
+        }
+        case EntryPoint::Uniform4uiv:
+        {
+            const DeferredUniform4uivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniform4uivParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniform4uiv(context, params->location, params->count, params->value))
+            {
+                context->uniform4uiv(params->location, params->count, params->value);
+            }
+            break;
+        }
+        case EntryPoint::UniformBlockBinding:
+        {
+            const DeferredUniformBlockBindingParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniformBlockBindingParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniformBlockBinding(context, params->program, params->uniformBlockIndex,
+                                            params->uniformBlockBinding))
+            {
+                context->uniformBlockBinding(params->program, params->uniformBlockIndex,
+                                             params->uniformBlockBinding);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix2fv:
+        {
+            const DeferredUniformMatrix2fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniformMatrix2fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix2fv(context, params->location, params->count,
+                                         params->transpose, params->value))
+            {
+                context->uniformMatrix2fv(params->location, params->count, params->transpose,
+                                          params->value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix2x3fv:
+        {
+            const DeferredUniformMatrix2x3fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniformMatrix2x3fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix2x3fv(context, params->location, params->count,
+                                           params->transpose, params->value))
+            {
+                context->uniformMatrix2x3fv(params->location, params->count, params->transpose,
+                                            params->value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix2x4fv:
+        {
+            const DeferredUniformMatrix2x4fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniformMatrix2x4fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix2x4fv(context, params->location, params->count,
+                                           params->transpose, params->value))
+            {
+                context->uniformMatrix2x4fv(params->location, params->count, params->transpose,
+                                            params->value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix3fv:
+        {
+            const DeferredUniformMatrix3fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniformMatrix3fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix3fv(context, params->location, params->count,
+                                         params->transpose, params->value))
+            {
+                context->uniformMatrix3fv(params->location, params->count, params->transpose,
+                                          params->value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix3x2fv:
+        {
+            const DeferredUniformMatrix3x2fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniformMatrix3x2fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix3x2fv(context, params->location, params->count,
+                                           params->transpose, params->value))
+            {
+                context->uniformMatrix3x2fv(params->location, params->count, params->transpose,
+                                            params->value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix3x4fv:
+        {
+            const DeferredUniformMatrix3x4fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniformMatrix3x4fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix3x4fv(context, params->location, params->count,
+                                           params->transpose, params->value))
+            {
+                context->uniformMatrix3x4fv(params->location, params->count, params->transpose,
+                                            params->value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix4fv:
+        {
+            const DeferredUniformMatrix4fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniformMatrix4fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix4fv(context, params->location, params->count,
+                                         params->transpose, params->value))
+            {
+                context->uniformMatrix4fv(params->location, params->count, params->transpose,
+                                          params->value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix4x2fv:
+        {
+            const DeferredUniformMatrix4x2fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniformMatrix4x2fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix4x2fv(context, params->location, params->count,
+                                           params->transpose, params->value))
+            {
+                context->uniformMatrix4x2fv(params->location, params->count, params->transpose,
+                                            params->value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix4x3fv:
+        {
+            const DeferredUniformMatrix4x3fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUniformMatrix4x3fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix4x3fv(context, params->location, params->count,
+                                           params->transpose, params->value))
+            {
+                context->uniformMatrix4x3fv(params->location, params->count, params->transpose,
+                                            params->value);
+            }
+            break;
+        }
+        case EntryPoint::UseProgram:
+        {
+            const DeferredUseProgramParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUseProgramParams>(header);
+            if (context->skipValidation() || ValidateUseProgram(context, params->program))
+            {
+                context->useProgram(params->program);
+            }
+            break;
+        }
+        case EntryPoint::UseProgramStages:
+        {
+            const DeferredUseProgramStagesParams *params =
+                DeferredCommandBuffer::GetParams<DeferredUseProgramStagesParams>(header);
+            if (context->skipValidation() ||
+                ValidateUseProgramStages(context, params->pipeline, params->stages,
+                                         params->program))
+            {
+                context->useProgramStages(params->pipeline, params->stages, params->program);
+            }
+            break;
+        }
+        case EntryPoint::ValidateProgram:
+        {
+            const DeferredValidateProgramParams *params =
+                DeferredCommandBuffer::GetParams<DeferredValidateProgramParams>(header);
+            if (context->skipValidation() || ValidateValidateProgram(context, params->program))
+            {
+                context->validateProgram(params->program);
+            }
+            break;
+        }
+        case EntryPoint::ValidateProgramPipeline:
+        {
+            const DeferredValidateProgramPipelineParams *params =
+                DeferredCommandBuffer::GetParams<DeferredValidateProgramPipelineParams>(header);
+            if (context->skipValidation() ||
+                ValidateValidateProgramPipeline(context, params->pipeline))
+            {
+                context->validateProgramPipeline(params->pipeline);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib1f:
+        {
+            const DeferredVertexAttrib1fParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttrib1fParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttrib1f(context, params->index, params->x))
+            {
+                context->vertexAttrib1f(params->index, params->x);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib1fv:
+        {
+            const DeferredVertexAttrib1fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttrib1fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttrib1fv(context, params->index, params->v))
+            {
+                context->vertexAttrib1fv(params->index, params->v);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib2f:
+        {
+            const DeferredVertexAttrib2fParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttrib2fParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttrib2f(context, params->index, params->x, params->y))
+            {
+                context->vertexAttrib2f(params->index, params->x, params->y);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib2fv:
+        {
+            const DeferredVertexAttrib2fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttrib2fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttrib2fv(context, params->index, params->v))
+            {
+                context->vertexAttrib2fv(params->index, params->v);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib3f:
+        {
+            const DeferredVertexAttrib3fParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttrib3fParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttrib3f(context, params->index, params->x, params->y, params->z))
+            {
+                context->vertexAttrib3f(params->index, params->x, params->y, params->z);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib3fv:
+        {
+            const DeferredVertexAttrib3fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttrib3fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttrib3fv(context, params->index, params->v))
+            {
+                context->vertexAttrib3fv(params->index, params->v);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib4f:
+        {
+            const DeferredVertexAttrib4fParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttrib4fParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttrib4f(context, params->index, params->x, params->y, params->z,
+                                       params->w))
+            {
+                context->vertexAttrib4f(params->index, params->x, params->y, params->z, params->w);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib4fv:
+        {
+            const DeferredVertexAttrib4fvParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttrib4fvParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttrib4fv(context, params->index, params->v))
+            {
+                context->vertexAttrib4fv(params->index, params->v);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribBinding:
+        {
+            const DeferredVertexAttribBindingParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttribBindingParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttribBinding(context, params->attribindex, params->bindingindex))
+            {
+                context->vertexAttribBinding(params->attribindex, params->bindingindex);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribDivisor:
+        {
+            const DeferredVertexAttribDivisorParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttribDivisorParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttribDivisor(context, params->index, params->divisor))
+            {
+                context->vertexAttribDivisor(params->index, params->divisor);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribFormat:
+        {
+            const DeferredVertexAttribFormatParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttribFormatParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttribFormat(context, params->attribindex, params->size, params->type,
+                                           params->normalized, params->relativeoffset))
+            {
+                context->vertexAttribFormat(params->attribindex, params->size, params->type,
+                                            params->normalized, params->relativeoffset);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribI4i:
+        {
+            const DeferredVertexAttribI4iParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttribI4iParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttribI4i(context, params->index, params->x, params->y, params->z,
+                                        params->w))
+            {
+                context->vertexAttribI4i(params->index, params->x, params->y, params->z, params->w);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribI4iv:
+        {
+            const DeferredVertexAttribI4ivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttribI4ivParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttribI4iv(context, params->index, params->v))
+            {
+                context->vertexAttribI4iv(params->index, params->v);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribI4ui:
+        {
+            const DeferredVertexAttribI4uiParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttribI4uiParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttribI4ui(context, params->index, params->x, params->y, params->z,
+                                         params->w))
+            {
+                context->vertexAttribI4ui(params->index, params->x, params->y, params->z,
+                                          params->w);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribI4uiv:
+        {
+            const DeferredVertexAttribI4uivParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttribI4uivParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttribI4uiv(context, params->index, params->v))
+            {
+                context->vertexAttribI4uiv(params->index, params->v);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribIFormat:
+        {
+            const DeferredVertexAttribIFormatParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexAttribIFormatParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexAttribIFormat(context, params->attribindex, params->size,
+                                            params->type, params->relativeoffset))
+            {
+                context->vertexAttribIFormat(params->attribindex, params->size, params->type,
+                                             params->relativeoffset);
+            }
+            break;
+        }
+        case EntryPoint::VertexBindingDivisor:
+        {
+            const DeferredVertexBindingDivisorParams *params =
+                DeferredCommandBuffer::GetParams<DeferredVertexBindingDivisorParams>(header);
+            if (context->skipValidation() ||
+                ValidateVertexBindingDivisor(context, params->bindingindex, params->divisor))
+            {
+                context->vertexBindingDivisor(params->bindingindex, params->divisor);
+            }
+            break;
+        }
+        case EntryPoint::Viewport:
+        {
+            const DeferredViewportParams *params =
+                DeferredCommandBuffer::GetParams<DeferredViewportParams>(header);
+            if (context->skipValidation() ||
+                ValidateViewport(context, params->x, params->y, params->width, params->height))
+            {
+                context->viewport(params->x, params->y, params->width, params->height);
+            }
+            break;
+        }
+        case EntryPoint::WaitSync:
+        {
+            const DeferredWaitSyncParams *params =
+                DeferredCommandBuffer::GetParams<DeferredWaitSyncParams>(header);
+            if (context->skipValidation() ||
+                ValidateWaitSync(context, params->sync, params->flags, params->timeout))
+            {
+                context->waitSync(params->sync, params->flags, params->timeout);
+            }
+            break;
+        }
+        default:
+            UNREACHABLE();
+            break;
+    }
+}
+
+bool DeferActiveShaderProgram(Context *context, GLuint pipeline, GLuint program)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredActiveShaderProgramParams *command =
+        commandBuffer->recordCommand<DeferredActiveShaderProgramParams>(
+            static_cast<uint16_t>(EntryPoint::ActiveShaderProgram));
+    command->pipeline = pipeline;
+    command->program  = program;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferActiveTexture(Context *context, GLenum texture)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredActiveTextureParams *command =
+        commandBuffer->recordCommand<DeferredActiveTextureParams>(
+            static_cast<uint16_t>(EntryPoint::ActiveTexture));
+    command->texture = texture;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferAttachShader(Context *context, GLuint program, GLuint shader)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredAttachShaderParams *command  = commandBuffer->recordCommand<DeferredAttachShaderParams>(
+        static_cast<uint16_t>(EntryPoint::AttachShader));
+    command->program = program;
+    command->shader  = shader;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBeginQuery(Context *context, GLenum target, GLuint id)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBeginQueryParams *command    = commandBuffer->recordCommand<DeferredBeginQueryParams>(
+        static_cast<uint16_t>(EntryPoint::BeginQuery));
+    command->target = FromGLenum<QueryType>(target);
+    command->id     = id;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBeginTransformFeedback(Context *context, GLenum primitiveMode)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBeginTransformFeedbackParams *command =
+        commandBuffer->recordCommand<DeferredBeginTransformFeedbackParams>(
+            static_cast<uint16_t>(EntryPoint::BeginTransformFeedback));
+    command->primitiveMode = FromGLenum<PrimitiveMode>(primitiveMode);
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBindBuffer(Context *context, GLenum target, GLuint buffer)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBindBufferParams *command    = commandBuffer->recordCommand<DeferredBindBufferParams>(
+        static_cast<uint16_t>(EntryPoint::BindBuffer));
+    command->target = FromGLenum<BufferBinding>(target);
+    command->buffer = buffer;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBindBufferBase(Context *context, GLenum target, GLuint index, GLuint buffer)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBindBufferBaseParams *command =
+        commandBuffer->recordCommand<DeferredBindBufferBaseParams>(
+            static_cast<uint16_t>(EntryPoint::BindBufferBase));
+    command->target = FromGLenum<BufferBinding>(target);
+    command->index  = index;
+    command->buffer = buffer;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBindBufferRange(Context *context,
+                          GLenum target,
+                          GLuint index,
+                          GLuint buffer,
+                          GLintptr offset,
+                          GLsizeiptr size)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBindBufferRangeParams *command =
+        commandBuffer->recordCommand<DeferredBindBufferRangeParams>(
+            static_cast<uint16_t>(EntryPoint::BindBufferRange));
+    command->target = FromGLenum<BufferBinding>(target);
+    command->index  = index;
+    command->buffer = buffer;
+    command->offset = offset;
+    command->size   = size;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBindFramebuffer(Context *context, GLenum target, GLuint framebuffer)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBindFramebufferParams *command =
+        commandBuffer->recordCommand<DeferredBindFramebufferParams>(
+            static_cast<uint16_t>(EntryPoint::BindFramebuffer));
+    command->target      = target;
+    command->framebuffer = framebuffer;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBindImageTexture(Context *context,
+                           GLuint unit,
+                           GLuint texture,
+                           GLint level,
+                           GLboolean layered,
+                           GLint layer,
+                           GLenum access,
+                           GLenum format)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBindImageTextureParams *command =
+        commandBuffer->recordCommand<DeferredBindImageTextureParams>(
+            static_cast<uint16_t>(EntryPoint::BindImageTexture));
+    command->unit    = unit;
+    command->texture = texture;
+    command->level   = level;
+    command->layered = layered;
+    command->layer   = layer;
+    command->access  = access;
+    command->format  = format;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBindProgramPipeline(Context *context, GLuint pipeline)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBindProgramPipelineParams *command =
+        commandBuffer->recordCommand<DeferredBindProgramPipelineParams>(
+            static_cast<uint16_t>(EntryPoint::BindProgramPipeline));
+    command->pipeline = pipeline;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBindRenderbuffer(Context *context, GLenum target, GLuint renderbuffer)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBindRenderbufferParams *command =
+        commandBuffer->recordCommand<DeferredBindRenderbufferParams>(
+            static_cast<uint16_t>(EntryPoint::BindRenderbuffer));
+    command->target       = target;
+    command->renderbuffer = renderbuffer;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBindSampler(Context *context, GLuint unit, GLuint sampler)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBindSamplerParams *command   = commandBuffer->recordCommand<DeferredBindSamplerParams>(
+        static_cast<uint16_t>(EntryPoint::BindSampler));
+    command->unit    = unit;
+    command->sampler = sampler;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBindTexture(Context *context, GLenum target, GLuint texture)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBindTextureParams *command   = commandBuffer->recordCommand<DeferredBindTextureParams>(
+        static_cast<uint16_t>(EntryPoint::BindTexture));
+    command->target  = FromGLenum<TextureType>(target);
+    command->texture = texture;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBindTransformFeedback(Context *context, GLenum target, GLuint id)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBindTransformFeedbackParams *command =
+        commandBuffer->recordCommand<DeferredBindTransformFeedbackParams>(
+            static_cast<uint16_t>(EntryPoint::BindTransformFeedback));
+    command->target = target;
+    command->id     = id;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBindVertexArray(Context *context, GLuint array)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBindVertexArrayParams *command =
+        commandBuffer->recordCommand<DeferredBindVertexArrayParams>(
+            static_cast<uint16_t>(EntryPoint::BindVertexArray));
+    command->array = array;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBindVertexBuffer(Context *context,
+                           GLuint bindingindex,
+                           GLuint buffer,
+                           GLintptr offset,
+                           GLsizei stride)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBindVertexBufferParams *command =
+        commandBuffer->recordCommand<DeferredBindVertexBufferParams>(
+            static_cast<uint16_t>(EntryPoint::BindVertexBuffer));
+    command->bindingindex = bindingindex;
+    command->buffer       = buffer;
+    command->offset       = offset;
+    command->stride       = stride;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBlendColor(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBlendColorParams *command    = commandBuffer->recordCommand<DeferredBlendColorParams>(
+        static_cast<uint16_t>(EntryPoint::BlendColor));
+    command->red   = red;
+    command->green = green;
+    command->blue  = blue;
+    command->alpha = alpha;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBlendEquation(Context *context, GLenum mode)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBlendEquationParams *command =
+        commandBuffer->recordCommand<DeferredBlendEquationParams>(
+            static_cast<uint16_t>(EntryPoint::BlendEquation));
+    command->mode = mode;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBlendEquationSeparate(Context *context, GLenum modeRGB, GLenum modeAlpha)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBlendEquationSeparateParams *command =
+        commandBuffer->recordCommand<DeferredBlendEquationSeparateParams>(
+            static_cast<uint16_t>(EntryPoint::BlendEquationSeparate));
+    command->modeRGB   = modeRGB;
+    command->modeAlpha = modeAlpha;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBlendFunc(Context *context, GLenum sfactor, GLenum dfactor)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBlendFuncParams *command     = commandBuffer->recordCommand<DeferredBlendFuncParams>(
+        static_cast<uint16_t>(EntryPoint::BlendFunc));
+    command->sfactor = sfactor;
+    command->dfactor = dfactor;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBlendFuncSeparate(Context *context,
+                            GLenum sfactorRGB,
+                            GLenum dfactorRGB,
+                            GLenum sfactorAlpha,
+                            GLenum dfactorAlpha)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBlendFuncSeparateParams *command =
+        commandBuffer->recordCommand<DeferredBlendFuncSeparateParams>(
+            static_cast<uint16_t>(EntryPoint::BlendFuncSeparate));
+    command->sfactorRGB   = sfactorRGB;
+    command->dfactorRGB   = dfactorRGB;
+    command->sfactorAlpha = sfactorAlpha;
+    command->dfactorAlpha = dfactorAlpha;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBlitFramebuffer(Context *context,
+                          GLint srcX0,
+                          GLint srcY0,
+                          GLint srcX1,
+                          GLint srcY1,
+                          GLint dstX0,
+                          GLint dstY0,
+                          GLint dstX1,
+                          GLint dstY1,
+                          GLbitfield mask,
+                          GLenum filter)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBlitFramebufferParams *command =
+        commandBuffer->recordCommand<DeferredBlitFramebufferParams>(
+            static_cast<uint16_t>(EntryPoint::BlitFramebuffer));
+    command->srcX0  = srcX0;
+    command->srcY0  = srcY0;
+    command->srcX1  = srcX1;
+    command->srcY1  = srcY1;
+    command->dstX0  = dstX0;
+    command->dstY0  = dstY0;
+    command->dstX1  = dstX1;
+    command->dstY1  = dstY1;
+    command->mask   = mask;
+    command->filter = filter;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBufferData(Context *context,
+                     GLenum target,
+                     GLsizeiptr size,
+                     const void *data,
+                     GLenum usage)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || size < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBufferDataParams *command    = commandBuffer->recordCommand<DeferredBufferDataParams>(
+        static_cast<uint16_t>(EntryPoint::BufferData));
+    command->target = FromGLenum<BufferBinding>(target);
+    command->size   = size;
+    command->data =
+        static_cast<const void *>(commandBuffer->copyBlob(data, static_cast<size_t>(size)));
+    command->usage = FromGLenum<BufferUsage>(usage);
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferBufferSubData(Context *context,
+                        GLenum target,
+                        GLintptr offset,
+                        GLsizeiptr size,
+                        const void *data)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || size < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredBufferSubDataParams *command =
+        commandBuffer->recordCommand<DeferredBufferSubDataParams>(
+            static_cast<uint16_t>(EntryPoint::BufferSubData));
+    command->target = FromGLenum<BufferBinding>(target);
+    command->offset = offset;
+    command->size   = size;
+    command->data =
+        static_cast<const void *>(commandBuffer->copyBlob(data, static_cast<size_t>(size)));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferClear(Context *context, GLbitfield mask)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredClearParams *command =
+        commandBuffer->recordCommand<DeferredClearParams>(static_cast<uint16_t>(EntryPoint::Clear));
+    command->mask = mask;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferClearBufferfi(Context *context,
+                        GLenum buffer,
+                        GLint drawbuffer,
+                        GLfloat depth,
+                        GLint stencil)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredClearBufferfiParams *command =
+        commandBuffer->recordCommand<DeferredClearBufferfiParams>(
+            static_cast<uint16_t>(EntryPoint::ClearBufferfi));
+    command->buffer     = buffer;
+    command->drawbuffer = drawbuffer;
+    command->depth      = depth;
+    command->stencil    = stencil;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferClearBufferfv(Context *context, GLenum buffer, GLint drawbuffer, const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredClearBufferfvParams *command =
+        commandBuffer->recordCommand<DeferredClearBufferfvParams>(
+            static_cast<uint16_t>(EntryPoint::ClearBufferfv));
+    command->buffer     = buffer;
+    command->drawbuffer = drawbuffer;
+    command->value      = static_cast<const GLfloat *>(commandBuffer->copyBlob(
+        value, static_cast<size_t>((buffer == GL_COLOR ? 4 : 1) * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferClearBufferiv(Context *context, GLenum buffer, GLint drawbuffer, const GLint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredClearBufferivParams *command =
+        commandBuffer->recordCommand<DeferredClearBufferivParams>(
+            static_cast<uint16_t>(EntryPoint::ClearBufferiv));
+    command->buffer     = buffer;
+    command->drawbuffer = drawbuffer;
+    command->value      = static_cast<const GLint *>(commandBuffer->copyBlob(
+        value, static_cast<size_t>((buffer == GL_COLOR ? 4 : 1) * sizeof(GLint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferClearBufferuiv(Context *context, GLenum buffer, GLint drawbuffer, const GLuint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredClearBufferuivParams *command =
+        commandBuffer->recordCommand<DeferredClearBufferuivParams>(
+            static_cast<uint16_t>(EntryPoint::ClearBufferuiv));
+    command->buffer     = buffer;
+    command->drawbuffer = drawbuffer;
+    command->value      = static_cast<const GLuint *>(commandBuffer->copyBlob(
+        value, static_cast<size_t>((buffer == GL_COLOR ? 4 : 1) * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferClearColor(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredClearColorParams *command    = commandBuffer->recordCommand<DeferredClearColorParams>(
+        static_cast<uint16_t>(EntryPoint::ClearColor));
+    command->red   = red;
+    command->green = green;
+    command->blue  = blue;
+    command->alpha = alpha;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferClearDepthf(Context *context, GLfloat d)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredClearDepthfParams *command   = commandBuffer->recordCommand<DeferredClearDepthfParams>(
+        static_cast<uint16_t>(EntryPoint::ClearDepthf));
+    command->d = d;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferClearStencil(Context *context, GLint s)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredClearStencilParams *command  = commandBuffer->recordCommand<DeferredClearStencilParams>(
+        static_cast<uint16_t>(EntryPoint::ClearStencil));
+    command->s = s;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferColorMask(Context *context,
+                    GLboolean red,
+                    GLboolean green,
+                    GLboolean blue,
+                    GLboolean alpha)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredColorMaskParams *command     = commandBuffer->recordCommand<DeferredColorMaskParams>(
+        static_cast<uint16_t>(EntryPoint::ColorMask));
+    command->red   = red;
+    command->green = green;
+    command->blue  = blue;
+    command->alpha = alpha;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferCompileShader(Context *context, GLuint shader)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredCompileShaderParams *command =
+        commandBuffer->recordCommand<DeferredCompileShaderParams>(
+            static_cast<uint16_t>(EntryPoint::CompileShader));
+    command->shader = shader;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferCopyBufferSubData(Context *context,
+                            GLenum readTarget,
+                            GLenum writeTarget,
+                            GLintptr readOffset,
+                            GLintptr writeOffset,
+                            GLsizeiptr size)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredCopyBufferSubDataParams *command =
+        commandBuffer->recordCommand<DeferredCopyBufferSubDataParams>(
+            static_cast<uint16_t>(EntryPoint::CopyBufferSubData));
+    command->readTarget  = FromGLenum<BufferBinding>(readTarget);
+    command->writeTarget = FromGLenum<BufferBinding>(writeTarget);
+    command->readOffset  = readOffset;
+    command->writeOffset = writeOffset;
+    command->size        = size;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferCopyTexImage2D(Context *context,
+                         GLenum target,
+                         GLint level,
+                         GLenum internalformat,
+                         GLint x,
+                         GLint y,
+                         GLsizei width,
+                         GLsizei height,
+                         GLint border)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredCopyTexImage2DParams *command =
+        commandBuffer->recordCommand<DeferredCopyTexImage2DParams>(
+            static_cast<uint16_t>(EntryPoint::CopyTexImage2D));
+    command->target         = FromGLenum<TextureTarget>(target);
+    command->level          = level;
+    command->internalformat = internalformat;
+    command->x              = x;
+    command->y              = y;
+    command->width          = width;
+    command->height         = height;
+    command->border         = border;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferCopyTexSubImage2D(Context *context,
+                            GLenum target,
+                            GLint level,
+                            GLint xoffset,
+                            GLint yoffset,
+                            GLint x,
+                            GLint y,
+                            GLsizei width,
+                            GLsizei height)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredCopyTexSubImage2DParams *command =
+        commandBuffer->recordCommand<DeferredCopyTexSubImage2DParams>(
+            static_cast<uint16_t>(EntryPoint::CopyTexSubImage2D));
+    command->target  = FromGLenum<TextureTarget>(target);
+    command->level   = level;
+    command->xoffset = xoffset;
+    command->yoffset = yoffset;
+    command->x       = x;
+    command->y       = y;
+    command->width   = width;
+    command->height  = height;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferCopyTexSubImage3D(Context *context,
+                            GLenum target,
+                            GLint level,
+                            GLint xoffset,
+                            GLint yoffset,
+                            GLint zoffset,
+                            GLint x,
+                            GLint y,
+                            GLsizei width,
+                            GLsizei height)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredCopyTexSubImage3DParams *command =
+        commandBuffer->recordCommand<DeferredCopyTexSubImage3DParams>(
+            static_cast<uint16_t>(EntryPoint::CopyTexSubImage3D));
+    command->target  = FromGLenum<TextureTarget>(target);
+    command->level   = level;
+    command->xoffset = xoffset;
+    command->yoffset = yoffset;
+    command->zoffset = zoffset;
+    command->x       = x;
+    command->y       = y;
+    command->width   = width;
+    command->height  = height;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferCullFace(Context *context, GLenum mode)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredCullFaceParams *command      = commandBuffer->recordCommand<DeferredCullFaceParams>(
+        static_cast<uint16_t>(EntryPoint::CullFace));
+    command->mode = FromGLenum<CullFaceMode>(mode);
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDeleteBuffers(Context *context, GLsizei n, const GLuint *buffers)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || n < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDeleteBuffersParams *command =
+        commandBuffer->recordCommand<DeferredDeleteBuffersParams>(
+            static_cast<uint16_t>(EntryPoint::DeleteBuffers));
+    command->n       = n;
+    command->buffers = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(buffers, static_cast<size_t>(n * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDeleteFramebuffers(Context *context, GLsizei n, const GLuint *framebuffers)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || n < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDeleteFramebuffersParams *command =
+        commandBuffer->recordCommand<DeferredDeleteFramebuffersParams>(
+            static_cast<uint16_t>(EntryPoint::DeleteFramebuffers));
+    command->n            = n;
+    command->framebuffers = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(framebuffers, static_cast<size_t>(n * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDeleteProgram(Context *context, GLuint program)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDeleteProgramParams *command =
+        commandBuffer->recordCommand<DeferredDeleteProgramParams>(
+            static_cast<uint16_t>(EntryPoint::DeleteProgram));
+    command->program = program;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDeleteProgramPipelines(Context *context, GLsizei n, const GLuint *pipelines)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || n < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDeleteProgramPipelinesParams *command =
+        commandBuffer->recordCommand<DeferredDeleteProgramPipelinesParams>(
+            static_cast<uint16_t>(EntryPoint::DeleteProgramPipelines));
+    command->n         = n;
+    command->pipelines = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(pipelines, static_cast<size_t>(n * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDeleteQueries(Context *context, GLsizei n, const GLuint *ids)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || n < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDeleteQueriesParams *command =
+        commandBuffer->recordCommand<DeferredDeleteQueriesParams>(
+            static_cast<uint16_t>(EntryPoint::DeleteQueries));
+    command->n   = n;
+    command->ids = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(ids, static_cast<size_t>(n * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDeleteRenderbuffers(Context *context, GLsizei n, const GLuint *renderbuffers)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || n < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDeleteRenderbuffersParams *command =
+        commandBuffer->recordCommand<DeferredDeleteRenderbuffersParams>(
+            static_cast<uint16_t>(EntryPoint::DeleteRenderbuffers));
+    command->n             = n;
+    command->renderbuffers = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(renderbuffers, static_cast<size_t>(n * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDeleteSamplers(Context *context, GLsizei count, const GLuint *samplers)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDeleteSamplersParams *command =
+        commandBuffer->recordCommand<DeferredDeleteSamplersParams>(
+            static_cast<uint16_t>(EntryPoint::DeleteSamplers));
+    command->count    = count;
+    command->samplers = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(samplers, static_cast<size_t>(count * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDeleteShader(Context *context, GLuint shader)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDeleteShaderParams *command  = commandBuffer->recordCommand<DeferredDeleteShaderParams>(
+        static_cast<uint16_t>(EntryPoint::DeleteShader));
+    command->shader = shader;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDeleteSync(Context *context, GLsync sync)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDeleteSyncParams *command    = commandBuffer->recordCommand<DeferredDeleteSyncParams>(
+        static_cast<uint16_t>(EntryPoint::DeleteSync));
+    command->sync = sync;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDeleteTextures(Context *context, GLsizei n, const GLuint *textures)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || n < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDeleteTexturesParams *command =
+        commandBuffer->recordCommand<DeferredDeleteTexturesParams>(
+            static_cast<uint16_t>(EntryPoint::DeleteTextures));
+    command->n        = n;
+    command->textures = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(textures, static_cast<size_t>(n * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDeleteTransformFeedbacks(Context *context, GLsizei n, const GLuint *ids)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || n < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDeleteTransformFeedbacksParams *command =
+        commandBuffer->recordCommand<DeferredDeleteTransformFeedbacksParams>(
+            static_cast<uint16_t>(EntryPoint::DeleteTransformFeedbacks));
+    command->n   = n;
+    command->ids = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(ids, static_cast<size_t>(n * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDeleteVertexArrays(Context *context, GLsizei n, const GLuint *arrays)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || n < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDeleteVertexArraysParams *command =
+        commandBuffer->recordCommand<DeferredDeleteVertexArraysParams>(
+            static_cast<uint16_t>(EntryPoint::DeleteVertexArrays));
+    command->n      = n;
+    command->arrays = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(arrays, static_cast<size_t>(n * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDepthFunc(Context *context, GLenum func)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDepthFuncParams *command     = commandBuffer->recordCommand<DeferredDepthFuncParams>(
+        static_cast<uint16_t>(EntryPoint::DepthFunc));
+    command->func = func;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDepthMask(Context *context, GLboolean flag)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDepthMaskParams *command     = commandBuffer->recordCommand<DeferredDepthMaskParams>(
+        static_cast<uint16_t>(EntryPoint::DepthMask));
+    command->flag = flag;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDepthRangef(Context *context, GLfloat n, GLfloat f)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDepthRangefParams *command   = commandBuffer->recordCommand<DeferredDepthRangefParams>(
+        static_cast<uint16_t>(EntryPoint::DepthRangef));
+    command->n = n;
+    command->f = f;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDetachShader(Context *context, GLuint program, GLuint shader)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDetachShaderParams *command  = commandBuffer->recordCommand<DeferredDetachShaderParams>(
+        static_cast<uint16_t>(EntryPoint::DetachShader));
+    command->program = program;
+    command->shader  = shader;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDisable(Context *context, GLenum cap)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDisableParams *command       = commandBuffer->recordCommand<DeferredDisableParams>(
+        static_cast<uint16_t>(EntryPoint::Disable));
+    command->cap = cap;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDisableVertexAttribArray(Context *context, GLuint index)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDisableVertexAttribArrayParams *command =
+        commandBuffer->recordCommand<DeferredDisableVertexAttribArrayParams>(
+            static_cast<uint16_t>(EntryPoint::DisableVertexAttribArray));
+    command->index = index;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDispatchCompute(Context *context,
+                          GLuint num_groups_x,
+                          GLuint num_groups_y,
+                          GLuint num_groups_z)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDispatchComputeParams *command =
+        commandBuffer->recordCommand<DeferredDispatchComputeParams>(
+            static_cast<uint16_t>(EntryPoint::DispatchCompute));
+    command->num_groups_x = num_groups_x;
+    command->num_groups_y = num_groups_y;
+    command->num_groups_z = num_groups_z;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDispatchComputeIndirect(Context *context, GLintptr indirect)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDispatchComputeIndirectParams *command =
+        commandBuffer->recordCommand<DeferredDispatchComputeIndirectParams>(
+            static_cast<uint16_t>(EntryPoint::DispatchComputeIndirect));
+    command->indirect = indirect;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDrawArrays(Context *context, GLenum mode, GLint first, GLsizei count)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || stream->usesClientVertexArrays())
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDrawArraysParams *command    = commandBuffer->recordCommand<DeferredDrawArraysParams>(
+        static_cast<uint16_t>(EntryPoint::DrawArrays));
+    command->mode  = FromGLenum<PrimitiveMode>(mode);
+    command->first = first;
+    command->count = count;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDrawArraysInstanced(Context *context,
+                              GLenum mode,
+                              GLint first,
+                              GLsizei count,
+                              GLsizei instancecount)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || stream->usesClientVertexArrays())
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDrawArraysInstancedParams *command =
+        commandBuffer->recordCommand<DeferredDrawArraysInstancedParams>(
+            static_cast<uint16_t>(EntryPoint::DrawArraysInstanced));
+    command->mode          = FromGLenum<PrimitiveMode>(mode);
+    command->first         = first;
+    command->count         = count;
+    command->instancecount = instancecount;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferDrawBuffers(Context *context, GLsizei n, const GLenum *bufs)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || n < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredDrawBuffersParams *command   = commandBuffer->recordCommand<DeferredDrawBuffersParams>(
+        static_cast<uint16_t>(EntryPoint::DrawBuffers));
+    command->n    = n;
+    command->bufs = static_cast<const GLenum *>(
+        commandBuffer->copyBlob(bufs, static_cast<size_t>(n * sizeof(GLenum))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferEnable(Context *context, GLenum cap)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredEnableParams *command        = commandBuffer->recordCommand<DeferredEnableParams>(
+        static_cast<uint16_t>(EntryPoint::Enable));
+    command->cap = cap;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferEnableVertexAttribArray(Context *context, GLuint index)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredEnableVertexAttribArrayParams *command =
+        commandBuffer->recordCommand<DeferredEnableVertexAttribArrayParams>(
+            static_cast<uint16_t>(EntryPoint::EnableVertexAttribArray));
+    command->index = index;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferEndQuery(Context *context, GLenum target)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredEndQueryParams *command      = commandBuffer->recordCommand<DeferredEndQueryParams>(
+        static_cast<uint16_t>(EntryPoint::EndQuery));
+    command->target = FromGLenum<QueryType>(target);
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferEndTransformFeedback(Context *context)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    commandBuffer->recordCommand<DeferredEndTransformFeedbackParams>(
+        static_cast<uint16_t>(EntryPoint::EndTransformFeedback));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferFlush(Context *context)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    commandBuffer->recordCommand<DeferredFlushParams>(static_cast<uint16_t>(EntryPoint::Flush));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferFlushMappedBufferRange(Context *context,
+                                 GLenum target,
+                                 GLintptr offset,
+                                 GLsizeiptr length)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredFlushMappedBufferRangeParams *command =
+        commandBuffer->recordCommand<DeferredFlushMappedBufferRangeParams>(
+            static_cast<uint16_t>(EntryPoint::FlushMappedBufferRange));
+    command->target = FromGLenum<BufferBinding>(target);
+    command->offset = offset;
+    command->length = length;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferFramebufferParameteri(Context *context, GLenum target, GLenum pname, GLint param)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredFramebufferParameteriParams *command =
+        commandBuffer->recordCommand<DeferredFramebufferParameteriParams>(
+            static_cast<uint16_t>(EntryPoint::FramebufferParameteri));
+    command->target = target;
+    command->pname  = pname;
+    command->param  = param;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferFramebufferRenderbuffer(Context *context,
+                                  GLenum target,
+                                  GLenum attachment,
+                                  GLenum renderbuffertarget,
+                                  GLuint renderbuffer)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredFramebufferRenderbufferParams *command =
+        commandBuffer->recordCommand<DeferredFramebufferRenderbufferParams>(
+            static_cast<uint16_t>(EntryPoint::FramebufferRenderbuffer));
+    command->target             = target;
+    command->attachment         = attachment;
+    command->renderbuffertarget = renderbuffertarget;
+    command->renderbuffer       = renderbuffer;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferFramebufferTexture2D(Context *context,
+                               GLenum target,
+                               GLenum attachment,
+                               GLenum textarget,
+                               GLuint texture,
+                               GLint level)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredFramebufferTexture2DParams *command =
+        commandBuffer->recordCommand<DeferredFramebufferTexture2DParams>(
+            static_cast<uint16_t>(EntryPoint::FramebufferTexture2D));
+    command->target     = target;
+    command->attachment = attachment;
+    command->textarget  = FromGLenum<TextureTarget>(textarget);
+    command->texture    = texture;
+    command->level      = level;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferFramebufferTextureLayer(Context *context,
+                                  GLenum target,
+                                  GLenum attachment,
+                                  GLuint texture,
+                                  GLint level,
+                                  GLint layer)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredFramebufferTextureLayerParams *command =
+        commandBuffer->recordCommand<DeferredFramebufferTextureLayerParams>(
+            static_cast<uint16_t>(EntryPoint::FramebufferTextureLayer));
+    command->target     = target;
+    command->attachment = attachment;
+    command->texture    = texture;
+    command->level      = level;
+    command->layer      = layer;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferFrontFace(Context *context, GLenum mode)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredFrontFaceParams *command     = commandBuffer->recordCommand<DeferredFrontFaceParams>(
+        static_cast<uint16_t>(EntryPoint::FrontFace));
+    command->mode = mode;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferGenerateMipmap(Context *context, GLenum target)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredGenerateMipmapParams *command =
+        commandBuffer->recordCommand<DeferredGenerateMipmapParams>(
+            static_cast<uint16_t>(EntryPoint::GenerateMipmap));
+    command->target = FromGLenum<TextureType>(target);
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferHint(Context *context, GLenum target, GLenum mode)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredHintParams *command =
+        commandBuffer->recordCommand<DeferredHintParams>(static_cast<uint16_t>(EntryPoint::Hint));
+    command->target = target;
+    command->mode   = mode;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferInvalidateFramebuffer(Context *context,
+                                GLenum target,
+                                GLsizei numAttachments,
+                                const GLenum *attachments)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || numAttachments < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredInvalidateFramebufferParams *command =
+        commandBuffer->recordCommand<DeferredInvalidateFramebufferParams>(
+            static_cast<uint16_t>(EntryPoint::InvalidateFramebuffer));
+    command->target         = target;
+    command->numAttachments = numAttachments;
+    command->attachments    = static_cast<const GLenum *>(
+        commandBuffer->copyBlob(attachments, static_cast<size_t>(numAttachments * sizeof(GLenum))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferInvalidateSubFramebuffer(Context *context,
+                                   GLenum target,
+                                   GLsizei numAttachments,
+                                   const GLenum *attachments,
+                                   GLint x,
+                                   GLint y,
+                                   GLsizei width,
+                                   GLsizei height)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || numAttachments < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredInvalidateSubFramebufferParams *command =
+        commandBuffer->recordCommand<DeferredInvalidateSubFramebufferParams>(
+            static_cast<uint16_t>(EntryPoint::InvalidateSubFramebuffer));
+    command->target         = target;
+    command->numAttachments = numAttachments;
+    command->attachments    = static_cast<const GLenum *>(
+        commandBuffer->copyBlob(attachments, static_cast<size_t>(numAttachments * sizeof(GLenum))));
+    command->x      = x;
+    command->y      = y;
+    command->width  = width;
+    command->height = height;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferLineWidth(Context *context, GLfloat width)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredLineWidthParams *command     = commandBuffer->recordCommand<DeferredLineWidthParams>(
+        static_cast<uint16_t>(EntryPoint::LineWidth));
+    command->width = width;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferLinkProgram(Context *context, GLuint program)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredLinkProgramParams *command   = commandBuffer->recordCommand<DeferredLinkProgramParams>(
+        static_cast<uint16_t>(EntryPoint::LinkProgram));
+    command->program = program;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferMemoryBarrier(Context *context, GLbitfield barriers)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredMemoryBarrierParams *command =
+        commandBuffer->recordCommand<DeferredMemoryBarrierParams>(
+            static_cast<uint16_t>(EntryPoint::MemoryBarrier));
+    command->barriers = barriers;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferMemoryBarrierByRegion(Context *context, GLbitfield barriers)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredMemoryBarrierByRegionParams *command =
+        commandBuffer->recordCommand<DeferredMemoryBarrierByRegionParams>(
+            static_cast<uint16_t>(EntryPoint::MemoryBarrierByRegion));
+    command->barriers = barriers;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferPauseTransformFeedback(Context *context)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    commandBuffer->recordCommand<DeferredPauseTransformFeedbackParams>(
+        static_cast<uint16_t>(EntryPoint::PauseTransformFeedback));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferPixelStorei(Context *context, GLenum pname, GLint param)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredPixelStoreiParams *command   = commandBuffer->recordCommand<DeferredPixelStoreiParams>(
+        static_cast<uint16_t>(EntryPoint::PixelStorei));
+    command->pname = pname;
+    command->param = param;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferPolygonOffset(Context *context, GLfloat factor, GLfloat units)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredPolygonOffsetParams *command =
+        commandBuffer->recordCommand<DeferredPolygonOffsetParams>(
+            static_cast<uint16_t>(EntryPoint::PolygonOffset));
+    command->factor = factor;
+    command->units  = units;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramBinary(Context *context,
+                        GLuint program,
+                        GLenum binaryFormat,
+                        const void *binary,
+                        GLsizei length)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || length < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramBinaryParams *command =
+        commandBuffer->recordCommand<DeferredProgramBinaryParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramBinary));
+    command->program      = program;
+    command->binaryFormat = binaryFormat;
+    command->binary =
+        static_cast<const void *>(commandBuffer->copyBlob(binary, static_cast<size_t>(length)));
+    command->length = length;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramParameteri(Context *context, GLuint program, GLenum pname, GLint value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramParameteriParams *command =
+        commandBuffer->recordCommand<DeferredProgramParameteriParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramParameteri));
+    command->program = program;
+    command->pname   = pname;
+    command->value   = value;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform1f(Context *context, GLuint program, GLint location, GLfloat v0)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform1fParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform1fParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform1f));
+    command->program  = program;
+    command->location = location;
+    command->v0       = v0;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform1fv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform1fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform1fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform1fv));
+    command->program  = program;
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 1 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform1i(Context *context, GLuint program, GLint location, GLint v0)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform1iParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform1iParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform1i));
+    command->program  = program;
+    command->location = location;
+    command->v0       = v0;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform1iv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform1ivParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform1ivParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform1iv));
+    command->program  = program;
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 1 * sizeof(GLint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform1ui(Context *context, GLuint program, GLint location, GLuint v0)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform1uiParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform1uiParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform1ui));
+    command->program  = program;
+    command->location = location;
+    command->v0       = v0;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform1uiv(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei count,
+                             const GLuint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform1uivParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform1uivParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform1uiv));
+    command->program  = program;
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 1 * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform2f(Context *context, GLuint program, GLint location, GLfloat v0, GLfloat v1)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform2fParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform2fParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform2f));
+    command->program  = program;
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform2fv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform2fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform2fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform2fv));
+    command->program  = program;
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 2 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform2i(Context *context, GLuint program, GLint location, GLint v0, GLint v1)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform2iParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform2iParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform2i));
+    command->program  = program;
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform2iv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform2ivParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform2ivParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform2iv));
+    command->program  = program;
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 2 * sizeof(GLint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform2ui(Context *context, GLuint program, GLint location, GLuint v0, GLuint v1)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform2uiParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform2uiParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform2ui));
+    command->program  = program;
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform2uiv(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei count,
+                             const GLuint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform2uivParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform2uivParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform2uiv));
+    command->program  = program;
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 2 * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform3f(Context *context,
+                           GLuint program,
+                           GLint location,
+                           GLfloat v0,
+                           GLfloat v1,
+                           GLfloat v2)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform3fParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform3fParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform3f));
+    command->program  = program;
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    command->v2       = v2;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform3fv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform3fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform3fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform3fv));
+    command->program  = program;
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 3 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform3i(Context *context,
+                           GLuint program,
+                           GLint location,
+                           GLint v0,
+                           GLint v1,
+                           GLint v2)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform3iParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform3iParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform3i));
+    command->program  = program;
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    command->v2       = v2;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform3iv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform3ivParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform3ivParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform3iv));
+    command->program  = program;
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 3 * sizeof(GLint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform3ui(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLuint v0,
+                            GLuint v1,
+                            GLuint v2)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform3uiParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform3uiParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform3ui));
+    command->program  = program;
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    command->v2       = v2;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform3uiv(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei count,
+                             const GLuint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform3uivParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform3uivParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform3uiv));
+    command->program  = program;
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 3 * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform4f(Context *context,
+                           GLuint program,
+                           GLint location,
+                           GLfloat v0,
+                           GLfloat v1,
+                           GLfloat v2,
+                           GLfloat v3)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform4fParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform4fParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform4f));
+    command->program  = program;
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    command->v2       = v2;
+    command->v3       = v3;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform4fv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform4fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform4fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform4fv));
+    command->program  = program;
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 4 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform4i(Context *context,
+                           GLuint program,
+                           GLint location,
+                           GLint v0,
+                           GLint v1,
+                           GLint v2,
+                           GLint v3)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform4iParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform4iParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform4i));
+    command->program  = program;
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    command->v2       = v2;
+    command->v3       = v3;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform4iv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform4ivParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform4ivParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform4iv));
+    command->program  = program;
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 4 * sizeof(GLint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform4ui(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLuint v0,
+                            GLuint v1,
+                            GLuint v2,
+                            GLuint v3)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform4uiParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform4uiParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform4ui));
+    command->program  = program;
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    command->v2       = v2;
+    command->v3       = v3;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniform4uiv(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei count,
+                             const GLuint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniform4uivParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniform4uivParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniform4uiv));
+    command->program  = program;
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 4 * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniformMatrix2fv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  GLboolean transpose,
+                                  const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniformMatrix2fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniformMatrix2fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniformMatrix2fv));
+    command->program   = program;
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 4 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniformMatrix2x3fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniformMatrix2x3fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniformMatrix2x3fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniformMatrix2x3fv));
+    command->program   = program;
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 6 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniformMatrix2x4fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniformMatrix2x4fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniformMatrix2x4fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniformMatrix2x4fv));
+    command->program   = program;
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 8 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniformMatrix3fv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  GLboolean transpose,
+                                  const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniformMatrix3fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniformMatrix3fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniformMatrix3fv));
+    command->program   = program;
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 9 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniformMatrix3x2fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniformMatrix3x2fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniformMatrix3x2fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniformMatrix3x2fv));
+    command->program   = program;
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 6 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniformMatrix3x4fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniformMatrix3x4fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniformMatrix3x4fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniformMatrix3x4fv));
+    command->program   = program;
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 12 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniformMatrix4fv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  GLboolean transpose,
+                                  const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniformMatrix4fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniformMatrix4fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniformMatrix4fv));
+    command->program   = program;
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 16 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniformMatrix4x2fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniformMatrix4x2fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniformMatrix4x2fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniformMatrix4x2fv));
+    command->program   = program;
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 8 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferProgramUniformMatrix4x3fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredProgramUniformMatrix4x3fvParams *command =
+        commandBuffer->recordCommand<DeferredProgramUniformMatrix4x3fvParams>(
+            static_cast<uint16_t>(EntryPoint::ProgramUniformMatrix4x3fv));
+    command->program   = program;
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 12 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferReadBuffer(Context *context, GLenum src)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredReadBufferParams *command    = commandBuffer->recordCommand<DeferredReadBufferParams>(
+        static_cast<uint16_t>(EntryPoint::ReadBuffer));
+    command->src = src;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferReleaseShaderCompiler(Context *context)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    commandBuffer->recordCommand<DeferredReleaseShaderCompilerParams>(
+        static_cast<uint16_t>(EntryPoint::ReleaseShaderCompiler));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferRenderbufferStorage(Context *context,
+                              GLenum target,
+                              GLenum internalformat,
+                              GLsizei width,
+                              GLsizei height)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredRenderbufferStorageParams *command =
+        commandBuffer->recordCommand<DeferredRenderbufferStorageParams>(
+            static_cast<uint16_t>(EntryPoint::RenderbufferStorage));
+    command->target         = target;
+    command->internalformat = internalformat;
+    command->width          = width;
+    command->height         = height;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferRenderbufferStorageMultisample(Context *context,
+                                         GLenum target,
+                                         GLsizei samples,
+                                         GLenum internalformat,
+                                         GLsizei width,
+                                         GLsizei height)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredRenderbufferStorageMultisampleParams *command =
+        commandBuffer->recordCommand<DeferredRenderbufferStorageMultisampleParams>(
+            static_cast<uint16_t>(EntryPoint::RenderbufferStorageMultisample));
+    command->target         = target;
+    command->samples        = samples;
+    command->internalformat = internalformat;
+    command->width          = width;
+    command->height         = height;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferResumeTransformFeedback(Context *context)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    commandBuffer->recordCommand<DeferredResumeTransformFeedbackParams>(
+        static_cast<uint16_t>(EntryPoint::ResumeTransformFeedback));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferSampleCoverage(Context *context, GLfloat value, GLboolean invert)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredSampleCoverageParams *command =
+        commandBuffer->recordCommand<DeferredSampleCoverageParams>(
+            static_cast<uint16_t>(EntryPoint::SampleCoverage));
+    command->value  = value;
+    command->invert = invert;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferSampleMaski(Context *context, GLuint maskNumber, GLbitfield mask)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredSampleMaskiParams *command   = commandBuffer->recordCommand<DeferredSampleMaskiParams>(
+        static_cast<uint16_t>(EntryPoint::SampleMaski));
+    command->maskNumber = maskNumber;
+    command->mask       = mask;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferSamplerParameterf(Context *context, GLuint sampler, GLenum pname, GLfloat param)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredSamplerParameterfParams *command =
+        commandBuffer->recordCommand<DeferredSamplerParameterfParams>(
+            static_cast<uint16_t>(EntryPoint::SamplerParameterf));
+    command->sampler = sampler;
+    command->pname   = pname;
+    command->param   = param;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferSamplerParameterfv(Context *context, GLuint sampler, GLenum pname, const GLfloat *param)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredSamplerParameterfvParams *command =
+        commandBuffer->recordCommand<DeferredSamplerParameterfvParams>(
+            static_cast<uint16_t>(EntryPoint::SamplerParameterfv));
+    command->sampler = sampler;
+    command->pname   = pname;
+    command->param   = static_cast<const GLfloat *>(commandBuffer->copyBlob(
+        param,
+        static_cast<size_t>((pname == GL_TEXTURE_BORDER_COLOR_EXT ? 4 : 1) * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferSamplerParameteri(Context *context, GLuint sampler, GLenum pname, GLint param)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredSamplerParameteriParams *command =
+        commandBuffer->recordCommand<DeferredSamplerParameteriParams>(
+            static_cast<uint16_t>(EntryPoint::SamplerParameteri));
+    command->sampler = sampler;
+    command->pname   = pname;
+    command->param   = param;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferSamplerParameteriv(Context *context, GLuint sampler, GLenum pname, const GLint *param)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredSamplerParameterivParams *command =
+        commandBuffer->recordCommand<DeferredSamplerParameterivParams>(
+            static_cast<uint16_t>(EntryPoint::SamplerParameteriv));
+    command->sampler = sampler;
+    command->pname   = pname;
+    command->param   = static_cast<const GLint *>(commandBuffer->copyBlob(
+        param,
+        static_cast<size_t>((pname == GL_TEXTURE_BORDER_COLOR_EXT ? 4 : 1) * sizeof(GLint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferScissor(Context *context, GLint x, GLint y, GLsizei width, GLsizei height)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredScissorParams *command       = commandBuffer->recordCommand<DeferredScissorParams>(
+        static_cast<uint16_t>(EntryPoint::Scissor));
+    command->x      = x;
+    command->y      = y;
+    command->width  = width;
+    command->height = height;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferShaderBinary(Context *context,
+                       GLsizei count,
+                       const GLuint *shaders,
+                       GLenum binaryformat,
+                       const void *binary,
+                       GLsizei length)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0 || length < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredShaderBinaryParams *command  = commandBuffer->recordCommand<DeferredShaderBinaryParams>(
+        static_cast<uint16_t>(EntryPoint::ShaderBinary));
+    command->count   = count;
+    command->shaders = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(shaders, static_cast<size_t>(count * sizeof(GLuint))));
+    command->binaryformat = binaryformat;
+    command->binary =
+        static_cast<const void *>(commandBuffer->copyBlob(binary, static_cast<size_t>(length)));
+    command->length = length;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferShaderSource(Context *context,
+                       GLuint shader,
+                       GLsizei count,
+                       const GLchar *const *string,
+                       const GLint *length)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredShaderSourceParams *command  = commandBuffer->recordCommand<DeferredShaderSourceParams>(
+        static_cast<uint16_t>(EntryPoint::ShaderSource));
+    command->shader = shader;
+    command->count  = count;
+    command->string = commandBuffer->copyStrings(string, count, length);
+    command->length = nullptr;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferStencilFunc(Context *context, GLenum func, GLint ref, GLuint mask)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredStencilFuncParams *command   = commandBuffer->recordCommand<DeferredStencilFuncParams>(
+        static_cast<uint16_t>(EntryPoint::StencilFunc));
+    command->func = func;
+    command->ref  = ref;
+    command->mask = mask;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferStencilFuncSeparate(Context *context, GLenum face, GLenum func, GLint ref, GLuint mask)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredStencilFuncSeparateParams *command =
+        commandBuffer->recordCommand<DeferredStencilFuncSeparateParams>(
+            static_cast<uint16_t>(EntryPoint::StencilFuncSeparate));
+    command->face = face;
+    command->func = func;
+    command->ref  = ref;
+    command->mask = mask;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferStencilMask(Context *context, GLuint mask)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredStencilMaskParams *command   = commandBuffer->recordCommand<DeferredStencilMaskParams>(
+        static_cast<uint16_t>(EntryPoint::StencilMask));
+    command->mask = mask;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferStencilMaskSeparate(Context *context, GLenum face, GLuint mask)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredStencilMaskSeparateParams *command =
+        commandBuffer->recordCommand<DeferredStencilMaskSeparateParams>(
+            static_cast<uint16_t>(EntryPoint::StencilMaskSeparate));
+    command->face = face;
+    command->mask = mask;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferStencilOp(Context *context, GLenum fail, GLenum zfail, GLenum zpass)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredStencilOpParams *command     = commandBuffer->recordCommand<DeferredStencilOpParams>(
+        static_cast<uint16_t>(EntryPoint::StencilOp));
+    command->fail  = fail;
+    command->zfail = zfail;
+    command->zpass = zpass;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferStencilOpSeparate(Context *context,
+                            GLenum face,
+                            GLenum sfail,
+                            GLenum dpfail,
+                            GLenum dppass)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredStencilOpSeparateParams *command =
+        commandBuffer->recordCommand<DeferredStencilOpSeparateParams>(
+            static_cast<uint16_t>(EntryPoint::StencilOpSeparate));
+    command->face   = face;
+    command->sfail  = sfail;
+    command->dpfail = dpfail;
+    command->dppass = dppass;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferTexParameterf(Context *context, GLenum target, GLenum pname, GLfloat param)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredTexParameterfParams *command =
+        commandBuffer->recordCommand<DeferredTexParameterfParams>(
+            static_cast<uint16_t>(EntryPoint::TexParameterf));
+    command->target = FromGLenum<TextureType>(target);
+    command->pname  = pname;
+    command->param  = param;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferTexParameterfv(Context *context, GLenum target, GLenum pname, const GLfloat *params)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredTexParameterfvParams *command =
+        commandBuffer->recordCommand<DeferredTexParameterfvParams>(
+            static_cast<uint16_t>(EntryPoint::TexParameterfv));
+    command->target = FromGLenum<TextureType>(target);
+    command->pname  = pname;
+    command->params = static_cast<const GLfloat *>(commandBuffer->copyBlob(
+        params,
+        static_cast<size_t>((pname == GL_TEXTURE_BORDER_COLOR_EXT ? 4 : 1) * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferTexParameteri(Context *context, GLenum target, GLenum pname, GLint param)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredTexParameteriParams *command =
+        commandBuffer->recordCommand<DeferredTexParameteriParams>(
+            static_cast<uint16_t>(EntryPoint::TexParameteri));
+    command->target = FromGLenum<TextureType>(target);
+    command->pname  = pname;
+    command->param  = param;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferTexParameteriv(Context *context, GLenum target, GLenum pname, const GLint *params)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredTexParameterivParams *command =
+        commandBuffer->recordCommand<DeferredTexParameterivParams>(
+            static_cast<uint16_t>(EntryPoint::TexParameteriv));
+    command->target = FromGLenum<TextureType>(target);
+    command->pname  = pname;
+    command->params = static_cast<const GLint *>(commandBuffer->copyBlob(
+        params,
+        static_cast<size_t>((pname == GL_TEXTURE_BORDER_COLOR_EXT ? 4 : 1) * sizeof(GLint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferTexStorage2D(Context *context,
+                       GLenum target,
+                       GLsizei levels,
+                       GLenum internalformat,
+                       GLsizei width,
+                       GLsizei height)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredTexStorage2DParams *command  = commandBuffer->recordCommand<DeferredTexStorage2DParams>(
+        static_cast<uint16_t>(EntryPoint::TexStorage2D));
+    command->target         = FromGLenum<TextureType>(target);
+    command->levels         = levels;
+    command->internalformat = internalformat;
+    command->width          = width;
+    command->height         = height;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferTexStorage2DMultisample(Context *context,
+                                  GLenum target,
+                                  GLsizei samples,
+                                  GLenum internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLboolean fixedsamplelocations)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredTexStorage2DMultisampleParams *command =
+        commandBuffer->recordCommand<DeferredTexStorage2DMultisampleParams>(
+            static_cast<uint16_t>(EntryPoint::TexStorage2DMultisample));
+    command->target               = FromGLenum<TextureType>(target);
+    command->samples              = samples;
+    command->internalformat       = internalformat;
+    command->width                = width;
+    command->height               = height;
+    command->fixedsamplelocations = fixedsamplelocations;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferTexStorage3D(Context *context,
+                       GLenum target,
+                       GLsizei levels,
+                       GLenum internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLsizei depth)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredTexStorage3DParams *command  = commandBuffer->recordCommand<DeferredTexStorage3DParams>(
+        static_cast<uint16_t>(EntryPoint::TexStorage3D));
+    command->target         = FromGLenum<TextureType>(target);
+    command->levels         = levels;
+    command->internalformat = internalformat;
+    command->width          = width;
+    command->height         = height;
+    command->depth          = depth;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferTransformFeedbackVaryings(Context *context,
+                                    GLuint program,
+                                    GLsizei count,
+                                    const GLchar *const *varyings,
+                                    GLenum bufferMode)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredTransformFeedbackVaryingsParams *command =
+        commandBuffer->recordCommand<DeferredTransformFeedbackVaryingsParams>(
+            static_cast<uint16_t>(EntryPoint::TransformFeedbackVaryings));
+    command->program    = program;
+    command->count      = count;
+    command->varyings   = commandBuffer->copyStrings(varyings, count, nullptr);
+    command->bufferMode = bufferMode;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform1f(Context *context, GLint location, GLfloat v0)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform1fParams *command     = commandBuffer->recordCommand<DeferredUniform1fParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform1f));
+    command->location = location;
+    command->v0       = v0;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform1fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform1fvParams *command    = commandBuffer->recordCommand<DeferredUniform1fvParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform1fv));
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 1 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform1i(Context *context, GLint location, GLint v0)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform1iParams *command     = commandBuffer->recordCommand<DeferredUniform1iParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform1i));
+    command->location = location;
+    command->v0       = v0;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform1iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform1ivParams *command    = commandBuffer->recordCommand<DeferredUniform1ivParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform1iv));
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 1 * sizeof(GLint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform1ui(Context *context, GLint location, GLuint v0)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform1uiParams *command    = commandBuffer->recordCommand<DeferredUniform1uiParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform1ui));
+    command->location = location;
+    command->v0       = v0;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform1uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform1uivParams *command   = commandBuffer->recordCommand<DeferredUniform1uivParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform1uiv));
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 1 * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform2f(Context *context, GLint location, GLfloat v0, GLfloat v1)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform2fParams *command     = commandBuffer->recordCommand<DeferredUniform2fParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform2f));
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform2fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform2fvParams *command    = commandBuffer->recordCommand<DeferredUniform2fvParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform2fv));
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 2 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform2i(Context *context, GLint location, GLint v0, GLint v1)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform2iParams *command     = commandBuffer->recordCommand<DeferredUniform2iParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform2i));
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform2iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform2ivParams *command    = commandBuffer->recordCommand<DeferredUniform2ivParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform2iv));
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 2 * sizeof(GLint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform2ui(Context *context, GLint location, GLuint v0, GLuint v1)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform2uiParams *command    = commandBuffer->recordCommand<DeferredUniform2uiParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform2ui));
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform2uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform2uivParams *command   = commandBuffer->recordCommand<DeferredUniform2uivParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform2uiv));
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 2 * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform3f(Context *context, GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform3fParams *command     = commandBuffer->recordCommand<DeferredUniform3fParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform3f));
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    command->v2       = v2;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform3fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform3fvParams *command    = commandBuffer->recordCommand<DeferredUniform3fvParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform3fv));
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 3 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform3i(Context *context, GLint location, GLint v0, GLint v1, GLint v2)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform3iParams *command     = commandBuffer->recordCommand<DeferredUniform3iParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform3i));
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    command->v2       = v2;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform3iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform3ivParams *command    = commandBuffer->recordCommand<DeferredUniform3ivParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform3iv));
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 3 * sizeof(GLint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform3ui(Context *context, GLint location, GLuint v0, GLuint v1, GLuint v2)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform3uiParams *command    = commandBuffer->recordCommand<DeferredUniform3uiParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform3ui));
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    command->v2       = v2;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform3uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform3uivParams *command   = commandBuffer->recordCommand<DeferredUniform3uivParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform3uiv));
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 3 * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform4f(Context *context,
+                    GLint location,
+                    GLfloat v0,
+                    GLfloat v1,
+                    GLfloat v2,
+                    GLfloat v3)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform4fParams *command     = commandBuffer->recordCommand<DeferredUniform4fParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform4f));
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    command->v2       = v2;
+    command->v3       = v3;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform4fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform4fvParams *command    = commandBuffer->recordCommand<DeferredUniform4fvParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform4fv));
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 4 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform4i(Context *context, GLint location, GLint v0, GLint v1, GLint v2, GLint v3)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform4iParams *command     = commandBuffer->recordCommand<DeferredUniform4iParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform4i));
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    command->v2       = v2;
+    command->v3       = v3;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform4iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform4ivParams *command    = commandBuffer->recordCommand<DeferredUniform4ivParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform4iv));
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 4 * sizeof(GLint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform4ui(Context *context, GLint location, GLuint v0, GLuint v1, GLuint v2, GLuint v3)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform4uiParams *command    = commandBuffer->recordCommand<DeferredUniform4uiParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform4ui));
+    command->location = location;
+    command->v0       = v0;
+    command->v1       = v1;
+    command->v2       = v2;
+    command->v3       = v3;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniform4uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniform4uivParams *command   = commandBuffer->recordCommand<DeferredUniform4uivParams>(
+        static_cast<uint16_t>(EntryPoint::Uniform4uiv));
+    command->location = location;
+    command->count    = count;
+    command->value    = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 4 * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniformBlockBinding(Context *context,
+                              GLuint program,
+                              GLuint uniformBlockIndex,
+                              GLuint uniformBlockBinding)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniformBlockBindingParams *command =
+        commandBuffer->recordCommand<DeferredUniformBlockBindingParams>(
+            static_cast<uint16_t>(EntryPoint::UniformBlockBinding));
+    command->program             = program;
+    command->uniformBlockIndex   = uniformBlockIndex;
+    command->uniformBlockBinding = uniformBlockBinding;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniformMatrix2fv(Context *context,
+                           GLint location,
+                           GLsizei count,
+                           GLboolean transpose,
+                           const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniformMatrix2fvParams *command =
+        commandBuffer->recordCommand<DeferredUniformMatrix2fvParams>(
+            static_cast<uint16_t>(EntryPoint::UniformMatrix2fv));
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 4 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniformMatrix2x3fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniformMatrix2x3fvParams *command =
+        commandBuffer->recordCommand<DeferredUniformMatrix2x3fvParams>(
+            static_cast<uint16_t>(EntryPoint::UniformMatrix2x3fv));
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 6 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniformMatrix2x4fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniformMatrix2x4fvParams *command =
+        commandBuffer->recordCommand<DeferredUniformMatrix2x4fvParams>(
+            static_cast<uint16_t>(EntryPoint::UniformMatrix2x4fv));
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 8 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniformMatrix3fv(Context *context,
+                           GLint location,
+                           GLsizei count,
+                           GLboolean transpose,
+                           const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniformMatrix3fvParams *command =
+        commandBuffer->recordCommand<DeferredUniformMatrix3fvParams>(
+            static_cast<uint16_t>(EntryPoint::UniformMatrix3fv));
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 9 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniformMatrix3x2fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniformMatrix3x2fvParams *command =
+        commandBuffer->recordCommand<DeferredUniformMatrix3x2fvParams>(
+            static_cast<uint16_t>(EntryPoint::UniformMatrix3x2fv));
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 6 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniformMatrix3x4fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniformMatrix3x4fvParams *command =
+        commandBuffer->recordCommand<DeferredUniformMatrix3x4fvParams>(
+            static_cast<uint16_t>(EntryPoint::UniformMatrix3x4fv));
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 12 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniformMatrix4fv(Context *context,
+                           GLint location,
+                           GLsizei count,
+                           GLboolean transpose,
+                           const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniformMatrix4fvParams *command =
+        commandBuffer->recordCommand<DeferredUniformMatrix4fvParams>(
+            static_cast<uint16_t>(EntryPoint::UniformMatrix4fv));
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 16 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniformMatrix4x2fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniformMatrix4x2fvParams *command =
+        commandBuffer->recordCommand<DeferredUniformMatrix4x2fvParams>(
+            static_cast<uint16_t>(EntryPoint::UniformMatrix4x2fv));
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 8 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUniformMatrix4x3fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream || count < 0)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUniformMatrix4x3fvParams *command =
+        commandBuffer->recordCommand<DeferredUniformMatrix4x3fvParams>(
+            static_cast<uint16_t>(EntryPoint::UniformMatrix4x3fv));
+    command->location  = location;
+    command->count     = count;
+    command->transpose = transpose;
+    command->value     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(value, static_cast<size_t>(count * 12 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUseProgram(Context *context, GLuint program)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUseProgramParams *command    = commandBuffer->recordCommand<DeferredUseProgramParams>(
+        static_cast<uint16_t>(EntryPoint::UseProgram));
+    command->program = program;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferUseProgramStages(Context *context, GLuint pipeline, GLbitfield stages, GLuint program)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredUseProgramStagesParams *command =
+        commandBuffer->recordCommand<DeferredUseProgramStagesParams>(
+            static_cast<uint16_t>(EntryPoint::UseProgramStages));
+    command->pipeline = pipeline;
+    command->stages   = stages;
+    command->program  = program;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferValidateProgram(Context *context, GLuint program)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredValidateProgramParams *command =
+        commandBuffer->recordCommand<DeferredValidateProgramParams>(
+            static_cast<uint16_t>(EntryPoint::ValidateProgram));
+    command->program = program;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferValidateProgramPipeline(Context *context, GLuint pipeline)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredValidateProgramPipelineParams *command =
+        commandBuffer->recordCommand<DeferredValidateProgramPipelineParams>(
+            static_cast<uint16_t>(EntryPoint::ValidateProgramPipeline));
+    command->pipeline = pipeline;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttrib1f(Context *context, GLuint index, GLfloat x)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttrib1fParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttrib1fParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttrib1f));
+    command->index = index;
+    command->x     = x;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttrib1fv(Context *context, GLuint index, const GLfloat *v)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttrib1fvParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttrib1fvParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttrib1fv));
+    command->index = index;
+    command->v     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(v, static_cast<size_t>(1 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttrib2f(Context *context, GLuint index, GLfloat x, GLfloat y)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttrib2fParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttrib2fParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttrib2f));
+    command->index = index;
+    command->x     = x;
+    command->y     = y;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttrib2fv(Context *context, GLuint index, const GLfloat *v)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttrib2fvParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttrib2fvParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttrib2fv));
+    command->index = index;
+    command->v     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(v, static_cast<size_t>(2 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttrib3f(Context *context, GLuint index, GLfloat x, GLfloat y, GLfloat z)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttrib3fParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttrib3fParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttrib3f));
+    command->index = index;
+    command->x     = x;
+    command->y     = y;
+    command->z     = z;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttrib3fv(Context *context, GLuint index, const GLfloat *v)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttrib3fvParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttrib3fvParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttrib3fv));
+    command->index = index;
+    command->v     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(v, static_cast<size_t>(3 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttrib4f(Context *context, GLuint index, GLfloat x, GLfloat y, GLfloat z, GLfloat w)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttrib4fParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttrib4fParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttrib4f));
+    command->index = index;
+    command->x     = x;
+    command->y     = y;
+    command->z     = z;
+    command->w     = w;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttrib4fv(Context *context, GLuint index, const GLfloat *v)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttrib4fvParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttrib4fvParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttrib4fv));
+    command->index = index;
+    command->v     = static_cast<const GLfloat *>(
+        commandBuffer->copyBlob(v, static_cast<size_t>(4 * sizeof(GLfloat))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttribBinding(Context *context, GLuint attribindex, GLuint bindingindex)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttribBindingParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttribBindingParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttribBinding));
+    command->attribindex  = attribindex;
+    command->bindingindex = bindingindex;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttribDivisor(Context *context, GLuint index, GLuint divisor)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttribDivisorParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttribDivisorParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttribDivisor));
+    command->index   = index;
+    command->divisor = divisor;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttribFormat(Context *context,
+                             GLuint attribindex,
+                             GLint size,
+                             GLenum type,
+                             GLboolean normalized,
+                             GLuint relativeoffset)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttribFormatParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttribFormatParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttribFormat));
+    command->attribindex    = attribindex;
+    command->size           = size;
+    command->type           = FromGLenum<VertexAttribType>(type);
+    command->normalized     = normalized;
+    command->relativeoffset = relativeoffset;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttribI4i(Context *context, GLuint index, GLint x, GLint y, GLint z, GLint w)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttribI4iParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttribI4iParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttribI4i));
+    command->index = index;
+    command->x     = x;
+    command->y     = y;
+    command->z     = z;
+    command->w     = w;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttribI4iv(Context *context, GLuint index, const GLint *v)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttribI4ivParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttribI4ivParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttribI4iv));
+    command->index = index;
+    command->v     = static_cast<const GLint *>(
+        commandBuffer->copyBlob(v, static_cast<size_t>(4 * sizeof(GLint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttribI4ui(Context *context, GLuint index, GLuint x, GLuint y, GLuint z, GLuint w)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttribI4uiParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttribI4uiParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttribI4ui));
+    command->index = index;
+    command->x     = x;
+    command->y     = y;
+    command->z     = z;
+    command->w     = w;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttribI4uiv(Context *context, GLuint index, const GLuint *v)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttribI4uivParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttribI4uivParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttribI4uiv));
+    command->index = index;
+    command->v     = static_cast<const GLuint *>(
+        commandBuffer->copyBlob(v, static_cast<size_t>(4 * sizeof(GLuint))));
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexAttribIFormat(Context *context,
+                              GLuint attribindex,
+                              GLint size,
+                              GLenum type,
+                              GLuint relativeoffset)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexAttribIFormatParams *command =
+        commandBuffer->recordCommand<DeferredVertexAttribIFormatParams>(
+            static_cast<uint16_t>(EntryPoint::VertexAttribIFormat));
+    command->attribindex    = attribindex;
+    command->size           = size;
+    command->type           = FromGLenum<VertexAttribType>(type);
+    command->relativeoffset = relativeoffset;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferVertexBindingDivisor(Context *context, GLuint bindingindex, GLuint divisor)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredVertexBindingDivisorParams *command =
+        commandBuffer->recordCommand<DeferredVertexBindingDivisorParams>(
+            static_cast<uint16_t>(EntryPoint::VertexBindingDivisor));
+    command->bindingindex = bindingindex;
+    command->divisor      = divisor;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferViewport(Context *context, GLint x, GLint y, GLsizei width, GLsizei height)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredViewportParams *command      = commandBuffer->recordCommand<DeferredViewportParams>(
+        static_cast<uint16_t>(EntryPoint::Viewport));
+    command->x      = x;
+    command->y      = y;
+    command->width  = width;
+    command->height = height;
+    stream->onCommandRecorded();
+    return true;
+}
+
+bool DeferWaitSync(Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout)
+{
+    DeferredCommandStream *stream = context->getDeferredCommandStream();
+    if (!stream)
+    {
+        return false;
+    }
+
+    DeferredCommandBuffer *commandBuffer = stream->getRecordingBuffer();
+    DeferredWaitSyncParams *command      = commandBuffer->recordCommand<DeferredWaitSyncParams>(
+        static_cast<uint16_t>(EntryPoint::WaitSync));
+    command->sync    = sync;
+    command->flags   = flags;
+    command->timeout = timeout;
+    stream->onCommandRecorded();
+    return true;
+}
+
+}  // namespace gl
+
+#endif  // ANGLE_DEFERRED_COMMANDS == ANGLE_ENABLED
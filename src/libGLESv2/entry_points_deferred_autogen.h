@@ -0,0 +1,578 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and entry_point_capture_params.json.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_deferred_autogen.h:
+//   Recording and execution of the deferred GLES commands.
+
+#ifndef LIBGLESV2_ENTRY_POINTS_DEFERRED_AUTOGEN_H_
+#define LIBGLESV2_ENTRY_POINTS_DEFERRED_AUTOGEN_H_
+
+#include "angle_gl.h"
+
+namespace gl
+{
+class Context;
+struct DeferredCommandHeader;
+
+// Validates and executes a recorded command.
+void ExecuteDeferredCommand(Context *context, const DeferredCommandHeader *header);
+
+// Record the command if the context has a deferred command stream. Return false if the command
+// has to be executed synchronously.
+bool DeferActiveShaderProgram(Context *context, GLuint pipeline, GLuint program);
+bool DeferActiveTexture(Context *context, GLenum texture);
+bool DeferAttachShader(Context *context, GLuint program, GLuint shader);
+bool DeferBeginQuery(Context *context, GLenum target, GLuint id);
+bool DeferBeginTransformFeedback(Context *context, GLenum primitiveMode);
+bool DeferBindBuffer(Context *context, GLenum target, GLuint buffer);
+bool DeferBindBufferBase(Context *context, GLenum target, GLuint index, GLuint buffer);
+bool DeferBindBufferRange(Context *context,
+                          GLenum target,
+                          GLuint index,
+                          GLuint buffer,
+                          GLintptr offset,
+                          GLsizeiptr size);
+bool DeferBindFramebuffer(Context *context, GLenum target, GLuint framebuffer);
+bool DeferBindImageTexture(Context *context,
+                           GLuint unit,
+                           GLuint texture,
+                           GLint level,
+                           GLboolean layered,
+                           GLint layer,
+                           GLenum access,
+                           GLenum format);
+bool DeferBindProgramPipeline(Context *context, GLuint pipeline);
+bool DeferBindRenderbuffer(Context *context, GLenum target, GLuint renderbuffer);
+bool DeferBindSampler(Context *context, GLuint unit, GLuint sampler);
+bool DeferBindTexture(Context *context, GLenum target, GLuint texture);
+bool DeferBindTransformFeedback(Context *context, GLenum target, GLuint id);
+bool DeferBindVertexArray(Context *context, GLuint array);
+bool DeferBindVertexBuffer(Context *context,
+                           GLuint bindingindex,
+                           GLuint buffer,
+                           GLintptr offset,
+                           GLsizei stride);
+bool DeferBlendColor(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha);
+bool DeferBlendEquation(Context *context, GLenum mode);
+bool DeferBlendEquationSeparate(Context *context, GLenum modeRGB, GLenum modeAlpha);
+bool DeferBlendFunc(Context *context, GLenum sfactor, GLenum dfactor);
+bool DeferBlendFuncSeparate(Context *context,
+                            GLenum sfactorRGB,
+                            GLenum dfactorRGB,
+                            GLenum sfactorAlpha,
+                            GLenum dfactorAlpha);
+bool DeferBlitFramebuffer(Context *context,
+                          GLint srcX0,
+                          GLint srcY0,
+                          GLint srcX1,
+                          GLint srcY1,
+                          GLint dstX0,
+                          GLint dstY0,
+                          GLint dstX1,
+                          GLint dstY1,
+                          GLbitfield mask,
+                          GLenum filter);
+bool DeferBufferData(Context *context,
+                     GLenum target,
+                     GLsizeiptr size,
+                     const void *data,
+                     GLenum usage);
+bool DeferBufferSubData(Context *context,
+                        GLenum target,
+                        GLintptr offset,
+                        GLsizeiptr size,
+                        const void *data);
+bool DeferClear(Context *context, GLbitfield mask);
+bool DeferClearBufferfi(Context *context,
+                        GLenum buffer,
+                        GLint drawbuffer,
+                        GLfloat depth,
+                        GLint stencil);
+bool DeferClearBufferfv(Context *context, GLenum buffer, GLint drawbuffer, const GLfloat *value);
+bool DeferClearBufferiv(Context *context, GLenum buffer, GLint drawbuffer, const GLint *value);
+bool DeferClearBufferuiv(Context *context, GLenum buffer, GLint drawbuffer, const GLuint *value);
+bool DeferClearColor(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha);
+bool DeferClearDepthf(Context *context, GLfloat d);
+bool DeferClearStencil(Context *context, GLint s);
+bool DeferColorMask(Context *context,
+                    GLboolean red,
+                    GLboolean green,
+                    GLboolean blue,
+                    GLboolean alpha);
+bool DeferCompileShader(Context *context, GLuint shader);
+bool DeferCopyBufferSubData(Context *context,
+                            GLenum readTarget,
+                            GLenum writeTarget,
+                            GLintptr readOffset,
+                            GLintptr writeOffset,
+                            GLsizeiptr size);
+bool DeferCopyTexImage2D(Context *context,
+                         GLenum target,
+                         GLint level,
+                         GLenum internalformat,
+                         GLint x,
+                         GLint y,
+                         GLsizei width,
+                         GLsizei height,
+                         GLint border);
+bool DeferCopyTexSubImage2D(Context *context,
+                            GLenum target,
+                            GLint level,
+                            GLint xoffset,
+                            GLint yoffset,
+                            GLint x,
+                            GLint y,
+                            GLsizei width,
+                            GLsizei height);
+bool DeferCopyTexSubImage3D(Context *context,
+                            GLenum target,
+                            GLint level,
+                            GLint xoffset,
+                            GLint yoffset,
+                            GLint zoffset,
+                            GLint x,
+                            GLint y,
+                            GLsizei width,
+                            GLsizei height);
+bool DeferCullFace(Context *context, GLenum mode);
+bool DeferDeleteBuffers(Context *context, GLsizei n, const GLuint *buffers);
+bool DeferDeleteFramebuffers(Context *context, GLsizei n, const GLuint *framebuffers);
+bool DeferDeleteProgram(Context *context, GLuint program);
+bool DeferDeleteProgramPipelines(Context *context, GLsizei n, const GLuint *pipelines);
+bool DeferDeleteQueries(Context *context, GLsizei n, const GLuint *ids);
+bool DeferDeleteRenderbuffers(Context *context, GLsizei n, const GLuint *renderbuffers);
+bool DeferDeleteSamplers(Context *context, GLsizei count, const GLuint *samplers);
+bool DeferDeleteShader(Context *context, GLuint shader);
+bool DeferDeleteSync(Context *context, GLsync sync);
+bool DeferDeleteTextures(Context *context, GLsizei n, const GLuint *textures);
+bool DeferDeleteTransformFeedbacks(Context *context, GLsizei n, const GLuint *ids);
+bool DeferDeleteVertexArrays(Context *context, GLsizei n, const GLuint *arrays);
+bool DeferDepthFunc(Context *context, GLenum func);
+bool DeferDepthMask(Context *context, GLboolean flag);
+bool DeferDepthRangef(Context *context, GLfloat n, GLfloat f);
+bool DeferDetachShader(Context *context, GLuint program, GLuint shader);
+bool DeferDisable(Context *context, GLenum cap);
+bool DeferDisableVertexAttribArray(Context *context, GLuint index);
+bool DeferDispatchCompute(Context *context,
+                          GLuint num_groups_x,
+                          GLuint num_groups_y,
+                          GLuint num_groups_z);
+bool DeferDispatchComputeIndirect(Context *context, GLintptr indirect);
+bool DeferDrawArrays(Context *context, GLenum mode, GLint first, GLsizei count);
+bool DeferDrawArraysInstanced(Context *context,
+                              GLenum mode,
+                              GLint first,
+                              GLsizei count,
+                              GLsizei instancecount);
+bool DeferDrawBuffers(Context *context, GLsizei n, const GLenum *bufs);
+bool DeferEnable(Context *context, GLenum cap);
+bool DeferEnableVertexAttribArray(Context *context, GLuint index);
+bool DeferEndQuery(Context *context, GLenum target);
+bool DeferEndTransformFeedback(Context *context);
+bool DeferFlush(Context *context);
+bool DeferFlushMappedBufferRange(Context *context,
+                                 GLenum target,
+                                 GLintptr offset,
+                                 GLsizeiptr length);
+bool DeferFramebufferParameteri(Context *context, GLenum target, GLenum pname, GLint param);
+bool DeferFramebufferRenderbuffer(Context *context,
+                                  GLenum target,
+                                  GLenum attachment,
+                                  GLenum renderbuffertarget,
+                                  GLuint renderbuffer);
+bool DeferFramebufferTexture2D(Context *context,
+                               GLenum target,
+                               GLenum attachment,
+                               GLenum textarget,
+                               GLuint texture,
+                               GLint level);
+bool DeferFramebufferTextureLayer(Context *context,
+                                  GLenum target,
+                                  GLenum attachment,
+                                  GLuint texture,
+                                  GLint level,
+                                  GLint layer);
+bool DeferFrontFace(Context *context, GLenum mode);
+bool DeferGenerateMipmap(Context *context, GLenum target);
+bool DeferHint(Context *context, GLenum target, GLenum mode);
+bool DeferInvalidateFramebuffer(Context *context,
+                                GLenum target,
+                                GLsizei numAttachments,
+                                const GLenum *attachments);
+bool DeferInvalidateSubFramebuffer(Context *context,
+                                   GLenum target,
+                                   GLsizei numAttachments,
+                                   const GLenum *attachments,
+                                   GLint x,
+                                   GLint y,
+                                   GLsizei width,
+                                   GLsizei height);
+bool DeferLineWidth(Context *context, GLfloat width);
+bool DeferLinkProgram(Context *context, GLuint program);
+bool DeferMemoryBarrier(Context *context, GLbitfield barriers);
+bool DeferMemoryBarrierByRegion(Context *context, GLbitfield barriers);
+bool DeferPauseTransformFeedback(Context *context);
+bool DeferPixelStorei(Context *context, GLenum pname, GLint param);
+bool DeferPolygonOffset(Context *context, GLfloat factor, GLfloat units);
+bool DeferProgramBinary(Context *context,
+                        GLuint program,
+                        GLenum binaryFormat,
+                        const void *binary,
+                        GLsizei length);
+bool DeferProgramParameteri(Context *context, GLuint program, GLenum pname, GLint value);
+bool DeferProgramUniform1f(Context *context, GLuint program, GLint location, GLfloat v0);
+bool DeferProgramUniform1fv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLfloat *value);
+bool DeferProgramUniform1i(Context *context, GLuint program, GLint location, GLint v0);
+bool DeferProgramUniform1iv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLint *value);
+bool DeferProgramUniform1ui(Context *context, GLuint program, GLint location, GLuint v0);
+bool DeferProgramUniform1uiv(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei count,
+                             const GLuint *value);
+bool DeferProgramUniform2f(Context *context,
+                           GLuint program,
+                           GLint location,
+                           GLfloat v0,
+                           GLfloat v1);
+bool DeferProgramUniform2fv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLfloat *value);
+bool DeferProgramUniform2i(Context *context, GLuint program, GLint location, GLint v0, GLint v1);
+bool DeferProgramUniform2iv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLint *value);
+bool DeferProgramUniform2ui(Context *context, GLuint program, GLint location, GLuint v0, GLuint v1);
+bool DeferProgramUniform2uiv(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei count,
+                             const GLuint *value);
+bool DeferProgramUniform3f(Context *context,
+                           GLuint program,
+                           GLint location,
+                           GLfloat v0,
+                           GLfloat v1,
+                           GLfloat v2);
+bool DeferProgramUniform3fv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLfloat *value);
+bool DeferProgramUniform3i(Context *context,
+                           GLuint program,
+                           GLint location,
+                           GLint v0,
+                           GLint v1,
+                           GLint v2);
+bool DeferProgramUniform3iv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLint *value);
+bool DeferProgramUniform3ui(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLuint v0,
+                            GLuint v1,
+                            GLuint v2);
+bool DeferProgramUniform3uiv(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei count,
+                             const GLuint *value);
+bool DeferProgramUniform4f(Context *context,
+                           GLuint program,
+                           GLint location,
+                           GLfloat v0,
+                           GLfloat v1,
+                           GLfloat v2,
+                           GLfloat v3);
+bool DeferProgramUniform4fv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLfloat *value);
+bool DeferProgramUniform4i(Context *context,
+                           GLuint program,
+                           GLint location,
+                           GLint v0,
+                           GLint v1,
+                           GLint v2,
+                           GLint v3);
+bool DeferProgramUniform4iv(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLsizei count,
+                            const GLint *value);
+bool DeferProgramUniform4ui(Context *context,
+                            GLuint program,
+                            GLint location,
+                            GLuint v0,
+                            GLuint v1,
+                            GLuint v2,
+                            GLuint v3);
+bool DeferProgramUniform4uiv(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei count,
+                             const GLuint *value);
+bool DeferProgramUniformMatrix2fv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  GLboolean transpose,
+                                  const GLfloat *value);
+bool DeferProgramUniformMatrix2x3fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+bool DeferProgramUniformMatrix2x4fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+bool DeferProgramUniformMatrix3fv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  GLboolean transpose,
+                                  const GLfloat *value);
+bool DeferProgramUniformMatrix3x2fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+bool DeferProgramUniformMatrix3x4fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+bool DeferProgramUniformMatrix4fv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  GLboolean transpose,
+                                  const GLfloat *value);
+bool DeferProgramUniformMatrix4x2fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+bool DeferProgramUniformMatrix4x3fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+bool DeferReadBuffer(Context *context, GLenum src);
+bool DeferReleaseShaderCompiler(Context *context);
+bool DeferRenderbufferStorage(Context *context,
+                              GLenum target,
+                              GLenum internalformat,
+                              GLsizei width,
+                              GLsizei height);
+bool DeferRenderbufferStorageMultisample(Context *context,
+                                         GLenum target,
+                                         GLsizei samples,
+                                         GLenum internalformat,
+                                         GLsizei width,
+                                         GLsizei height);
+bool DeferResumeTransformFeedback(Context *context);
+bool DeferSampleCoverage(Context *context, GLfloat value, GLboolean invert);
+bool DeferSampleMaski(Context *context, GLuint maskNumber, GLbitfield mask);
+bool DeferSamplerParameterf(Context *context, GLuint sampler, GLenum pname, GLfloat param);
+bool DeferSamplerParameterfv(Context *context, GLuint sampler, GLenum pname, const GLfloat *param);
+bool DeferSamplerParameteri(Context *context, GLuint sampler, GLenum pname, GLint param);
+bool DeferSamplerParameteriv(Context *context, GLuint sampler, GLenum pname, const GLint *param);
+bool DeferScissor(Context *context, GLint x, GLint y, GLsizei width, GLsizei height);
+bool DeferShaderBinary(Context *context,
+                       GLsizei count,
+                       const GLuint *shaders,
+                       GLenum binaryformat,
+                       const void *binary,
+                       GLsizei length);
+bool DeferShaderSource(Context *context,
+                       GLuint shader,
+                       GLsizei count,
+                       const GLchar *const *string,
+                       const GLint *length);
+bool DeferStencilFunc(Context *context, GLenum func, GLint ref, GLuint mask);
+bool DeferStencilFuncSeparate(Context *context, GLenum face, GLenum func, GLint ref, GLuint mask);
+bool DeferStencilMask(Context *context, GLuint mask);
+bool DeferStencilMaskSeparate(Context *context, GLenum face, GLuint mask);
+bool DeferStencilOp(Context *context, GLenum fail, GLenum zfail, GLenum zpass);
+bool DeferStencilOpSeparate(Context *context,
+                            GLenum face,
+                            GLenum sfail,
+                            GLenum dpfail,
+                            GLenum dppass);
+bool DeferTexParameterf(Context *context, GLenum target, GLenum pname, GLfloat param);
+bool DeferTexParameterfv(Context *context, GLenum target, GLenum pname, const GLfloat *params);
+bool DeferTexParameteri(Context *context, GLenum target, GLenum pname, GLint param);
+bool DeferTexParameteriv(Context *context, GLenum target, GLenum pname, const GLint *params);
+bool DeferTexStorage2D(Context *context,
+                       GLenum target,
+                       GLsizei levels,
+                       GLenum internalformat,
+                       GLsizei width,
+                       GLsizei height);
+bool DeferTexStorage2DMultisample(Context *context,
+                                  GLenum target,
+                                  GLsizei samples,
+                                  GLenum internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLboolean fixedsamplelocations);
+bool DeferTexStorage3D(Context *context,
+                       GLenum target,
+                       GLsizei levels,
+                       GLenum internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLsizei depth);
+bool DeferTransformFeedbackVaryings(Context *context,
+                                    GLuint program,
+                                    GLsizei count,
+                                    const GLchar *const *varyings,
+                                    GLenum bufferMode);
+bool DeferUniform1f(Context *context, GLint location, GLfloat v0);
+bool DeferUniform1fv(Context *context, GLint location, GLsizei count, const GLfloat *value);
+bool DeferUniform1i(Context *context, GLint location, GLint v0);
+bool DeferUniform1iv(Context *context, GLint location, GLsizei count, const GLint *value);
+bool DeferUniform1ui(Context *context, GLint location, GLuint v0);
+bool DeferUniform1uiv(Context *context, GLint location, GLsizei count, const GLuint *value);
+bool DeferUniform2f(Context *context, GLint location, GLfloat v0, GLfloat v1);
+bool DeferUniform2fv(Context *context, GLint location, GLsizei count, const GLfloat *value);
+bool DeferUniform2i(Context *context, GLint location, GLint v0, GLint v1);
+bool DeferUniform2iv(Context *context, GLint location, GLsizei count, const GLint *value);
+bool DeferUniform2ui(Context *context, GLint location, GLuint v0, GLuint v1);
+bool DeferUniform2uiv(Context *context, GLint location, GLsizei count, const GLuint *value);
+bool DeferUniform3f(Context *context, GLint location, GLfloat v0, GLfloat v1, GLfloat v2);
+bool DeferUniform3fv(Context *context, GLint location, GLsizei count, const GLfloat *value);
+bool DeferUniform3i(Context *context, GLint location, GLint v0, GLint v1, GLint v2);
+bool DeferUniform3iv(Context *context, GLint location, GLsizei count, const GLint *value);
+bool DeferUniform3ui(Context *context, GLint location, GLuint v0, GLuint v1, GLuint v2);
+bool DeferUniform3uiv(Context *context, GLint location, GLsizei count, const GLuint *value);
+bool DeferUniform4f(Context *context,
+                    GLint location,
+                    GLfloat v0,
+                    GLfloat v1,
+                    GLfloat v2,
+                    GLfloat v3);
+bool DeferUniform4fv(Context *context, GLint location, GLsizei count, const GLfloat *value);
+bool DeferUniform4i(Context *context, GLint location, GLint v0, GLint v1, GLint v2, GLint v3);
+bool DeferUniform4iv(Context *context, GLint location, GLsizei count, const GLint *value);
+bool DeferUniform4ui(Context *context, GLint location, GLuint v0, GLuint v1, GLuint v2, GLuint v3);
+bool DeferUniform4uiv(Context *context, GLint location, GLsizei count, const GLuint *value);
+bool DeferUniformBlockBinding(Context *context,
+                              GLuint program,
+                              GLuint uniformBlockIndex,
+                              GLuint uniformBlockBinding);
+bool DeferUniformMatrix2fv(Context *context,
+                           GLint location,
+                           GLsizei count,
+                           GLboolean transpose,
+                           const GLfloat *value);
+bool DeferUniformMatrix2x3fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+bool DeferUniformMatrix2x4fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+bool DeferUniformMatrix3fv(Context *context,
+                           GLint location,
+                           GLsizei count,
+                           GLboolean transpose,
+                           const GLfloat *value);
+bool DeferUniformMatrix3x2fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+bool DeferUniformMatrix3x4fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+bool DeferUniformMatrix4fv(Context *context,
+                           GLint location,
+                           GLsizei count,
+                           GLboolean transpose,
+                           const GLfloat *value);
+bool DeferUniformMatrix4x2fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+bool DeferUniformMatrix4x3fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+bool DeferUseProgram(Context *context, GLuint program);
+bool DeferUseProgramStages(Context *context, GLuint pipeline, GLbitfield stages, GLuint program);
+bool DeferValidateProgram(Context *context, GLuint program);
+bool DeferValidateProgramPipeline(Context *context, GLuint pipeline);
+bool DeferVertexAttrib1f(Context *context, GLuint index, GLfloat x);
+bool DeferVertexAttrib1fv(Context *context, GLuint index, const GLfloat *v);
+bool DeferVertexAttrib2f(Context *context, GLuint index, GLfloat x, GLfloat y);
+bool DeferVertexAttrib2fv(Context *context, GLuint index, const GLfloat *v);
+bool DeferVertexAttrib3f(Context *context, GLuint index, GLfloat x, GLfloat y, GLfloat z);
+bool DeferVertexAttrib3fv(Context *context, GLuint index, const GLfloat *v);
+bool DeferVertexAttrib4f(Context *context,
+                         GLuint index,
+                         GLfloat x,
+                         GLfloat y,
+                         GLfloat z,
+                         GLfloat w);
+bool DeferVertexAttrib4fv(Context *context, GLuint index, const GLfloat *v);
+bool DeferVertexAttribBinding(Context *context, GLuint attribindex, GLuint bindingindex);
+bool DeferVertexAttribDivisor(Context *context, GLuint index, GLuint divisor);
+bool DeferVertexAttribFormat(Context *context,
+                             GLuint attribindex,
+                             GLint size,
+                             GLenum type,
+                             GLboolean normalized,
+                             GLuint relativeoffset);
+bool DeferVertexAttribI4i(Context *context, GLuint index, GLint x, GLint y, GLint z, GLint w);
+bool DeferVertexAttribI4iv(Context *context, GLuint index, const GLint *v);
+bool DeferVertexAttribI4ui(Context *context, GLuint index, GLuint x, GLuint y, GLuint z, GLuint w);
+bool DeferVertexAttribI4uiv(Context *context, GLuint index, const GLuint *v);
+bool DeferVertexAttribIFormat(Context *context,
+                              GLuint attribindex,
+                              GLint size,
+                              GLenum type,
+                              GLuint relativeoffset);
+bool DeferVertexBindingDivisor(Context *context, GLuint bindingindex, GLuint divisor);
+bool DeferViewport(Context *context, GLint x, GLint y, GLsizei width, GLsizei height);
+bool DeferWaitSync(Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout);
+}  // namespace gl
+
+#endif  // LIBGLESV2_ENTRY_POINTS_DEFERRED_AUTOGEN_H_
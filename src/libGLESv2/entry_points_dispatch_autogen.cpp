@@ -0,0 +1,24151 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_dispatch_autogen.cpp:
+//   Tables of the functions the GLES entry points call with the current context.
+
+#include "libGLESv2/entry_points_dispatch_autogen.h"
+
+#include "libANGLE/Context.h"
+#include "libANGLE/Context.inl.h"
+#include "libANGLE/validationES1.h"
+#include "libANGLE/validationES2.h"
+#include "libANGLE/validationES3.h"
+#include "libANGLE/validationES31.h"
+#include "libANGLE/validationESEXT.h"
+#include "libGLESv2/entry_points_capture.h"
+#include "libGLESv2/entry_points_deferred.h"
+#include "libGLESv2/entry_points_profiler.h"
+#include "libGLESv2/entry_points_utils.h"
+
+namespace gl
+{
+namespace
+{
+void GenerateContextLostError(Context *context)
+{
+    context->handleError(GL_OUT_OF_MEMORY, "Context has been lost.", __FILE__, ANGLE_FUNCTION,
+                         __LINE__);
+}
+
+void ValidatedActiveShaderProgram(Context *context, GLuint pipeline, GLuint program)
+{
+    ANGLE_DEFER_COMMAND(ActiveShaderProgram, context, pipeline, program);
+    ANGLE_PROFILE_ENTRY_POINT(ActiveShaderProgram);
+    if (ValidateActiveShaderProgram(context, pipeline, program))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ActiveShaderProgram, context, pipeline, program);
+        context->activeShaderProgram(pipeline, program);
+    }
+}
+
+void ValidatedActiveTexture(Context *context, GLenum texture)
+{
+    ANGLE_DEFER_COMMAND(ActiveTexture, context, texture);
+    ANGLE_PROFILE_ENTRY_POINT(ActiveTexture);
+    if (ValidateActiveTexture(context, texture))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ActiveTexture, context, texture);
+        context->activeTexture(texture);
+    }
+}
+
+void ValidatedAlphaFunc(Context *context, GLenum func, GLfloat ref)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(AlphaFunc);
+    AlphaTestFunc funcPacked = FromGLenum<AlphaTestFunc>(func);
+    if (ValidateAlphaFunc(context, funcPacked, ref))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(AlphaFunc, context, func, ref);
+        context->alphaFunc(funcPacked, ref);
+    }
+}
+
+void ValidatedAlphaFuncx(Context *context, GLenum func, GLfixed ref)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(AlphaFuncx);
+    AlphaTestFunc funcPacked = FromGLenum<AlphaTestFunc>(func);
+    if (ValidateAlphaFuncx(context, funcPacked, ref))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(AlphaFuncx, context, func, ref);
+        context->alphaFuncx(funcPacked, ref);
+    }
+}
+
+void ValidatedAttachShader(Context *context, GLuint program, GLuint shader)
+{
+    ANGLE_DEFER_COMMAND(AttachShader, context, program, shader);
+    ANGLE_PROFILE_ENTRY_POINT(AttachShader);
+    if (ValidateAttachShader(context, program, shader))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(AttachShader, context, program, shader);
+        context->attachShader(program, shader);
+    }
+}
+
+void ValidatedBeginQuery(Context *context, GLenum target, GLuint id)
+{
+    ANGLE_DEFER_COMMAND(BeginQuery, context, target, id);
+    ANGLE_PROFILE_ENTRY_POINT(BeginQuery);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    if (ValidateBeginQuery(context, targetPacked, id))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BeginQuery, context, target, id);
+        context->beginQuery(targetPacked, id);
+    }
+}
+
+void ValidatedBeginQueryEXT(Context *context, GLenum target, GLuint id)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BeginQueryEXT);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    if (ValidateBeginQueryEXT(context, targetPacked, id))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BeginQueryEXT, context, target, id);
+        context->beginQuery(targetPacked, id);
+    }
+}
+
+void ValidatedBeginTransformFeedback(Context *context, GLenum primitiveMode)
+{
+    ANGLE_DEFER_COMMAND(BeginTransformFeedback, context, primitiveMode);
+    ANGLE_PROFILE_ENTRY_POINT(BeginTransformFeedback);
+    PrimitiveMode primitiveModePacked = FromGLenum<PrimitiveMode>(primitiveMode);
+    if (ValidateBeginTransformFeedback(context, primitiveModePacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BeginTransformFeedback, context, primitiveMode);
+        context->beginTransformFeedback(primitiveModePacked);
+    }
+}
+
+void ValidatedBindAttribLocation(Context *context, GLuint program, GLuint index, const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindAttribLocation);
+    if (ValidateBindAttribLocation(context, program, index, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindAttribLocation, context, program, index, name);
+        context->bindAttribLocation(program, index, name);
+    }
+}
+
+void ValidatedBindBuffer(Context *context, GLenum target, GLuint buffer)
+{
+    ANGLE_DEFER_COMMAND(BindBuffer, context, target, buffer);
+    ANGLE_PROFILE_ENTRY_POINT(BindBuffer);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateBindBuffer(context, targetPacked, buffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindBuffer, context, target, buffer);
+        context->bindBuffer(targetPacked, buffer);
+    }
+}
+
+void ValidatedBindBufferBase(Context *context, GLenum target, GLuint index, GLuint buffer)
+{
+    ANGLE_DEFER_COMMAND(BindBufferBase, context, target, index, buffer);
+    ANGLE_PROFILE_ENTRY_POINT(BindBufferBase);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateBindBufferBase(context, targetPacked, index, buffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindBufferBase, context, target, index, buffer);
+        context->bindBufferBase(targetPacked, index, buffer);
+    }
+}
+
+void ValidatedBindBufferRange(Context *context,
+                              GLenum target,
+                              GLuint index,
+                              GLuint buffer,
+                              GLintptr offset,
+                              GLsizeiptr size)
+{
+    ANGLE_DEFER_COMMAND(BindBufferRange, context, target, index, buffer, offset, size);
+    ANGLE_PROFILE_ENTRY_POINT(BindBufferRange);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateBindBufferRange(context, targetPacked, index, buffer, offset, size))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindBufferRange, context, target, index, buffer, offset, size);
+        context->bindBufferRange(targetPacked, index, buffer, offset, size);
+    }
+}
+
+void ValidatedBindFragDataLocationEXT(Context *context,
+                                      GLuint program,
+                                      GLuint color,
+                                      const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindFragDataLocationEXT);
+    if (ValidateBindFragDataLocationEXT(context, program, color, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindFragDataLocationEXT, context, program, color, name);
+        context->bindFragDataLocation(program, color, name);
+    }
+}
+
+void ValidatedBindFragDataLocationIndexedEXT(Context *context,
+                                             GLuint program,
+                                             GLuint colorNumber,
+                                             GLuint index,
+                                             const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindFragDataLocationIndexedEXT);
+    if (ValidateBindFragDataLocationIndexedEXT(context, program, colorNumber, index, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindFragDataLocationIndexedEXT, context, program, colorNumber, index,
+                           name);
+        context->bindFragDataLocationIndexed(program, colorNumber, index, name);
+    }
+}
+
+void ValidatedBindFragmentInputLocationCHROMIUM(Context *context,
+                                                GLuint programs,
+                                                GLint location,
+                                                const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindFragmentInputLocationCHROMIUM);
+    if (ValidateBindFragmentInputLocationCHROMIUM(context, programs, location, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindFragmentInputLocationCHROMIUM, context, programs, location, name);
+        context->bindFragmentInputLocation(programs, location, name);
+    }
+}
+
+void ValidatedBindFramebuffer(Context *context, GLenum target, GLuint framebuffer)
+{
+    ANGLE_DEFER_COMMAND(BindFramebuffer, context, target, framebuffer);
+    ANGLE_PROFILE_ENTRY_POINT(BindFramebuffer);
+    if (ValidateBindFramebuffer(context, target, framebuffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindFramebuffer, context, target, framebuffer);
+        context->bindFramebuffer(target, framebuffer);
+    }
+}
+
+void ValidatedBindFramebufferOES(Context *context, GLenum target, GLuint framebuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindFramebufferOES);
+    if (ValidateBindFramebufferOES(context, target, framebuffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindFramebufferOES, context, target, framebuffer);
+        context->bindFramebuffer(target, framebuffer);
+    }
+}
+
+void ValidatedBindImageTexture(Context *context,
+                               GLuint unit,
+                               GLuint texture,
+                               GLint level,
+                               GLboolean layered,
+                               GLint layer,
+                               GLenum access,
+                               GLenum format)
+{
+    ANGLE_DEFER_COMMAND(BindImageTexture, context, unit, texture, level, layered, layer, access,
+                        format);
+    ANGLE_PROFILE_ENTRY_POINT(BindImageTexture);
+    if (ValidateBindImageTexture(context, unit, texture, level, layered, layer, access, format))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindImageTexture, context, unit, texture, level, layered, layer, access,
+                           format);
+        context->bindImageTexture(unit, texture, level, layered, layer, access, format);
+    }
+}
+
+void ValidatedBindProgramPipeline(Context *context, GLuint pipeline)
+{
+    ANGLE_DEFER_COMMAND(BindProgramPipeline, context, pipeline);
+    ANGLE_PROFILE_ENTRY_POINT(BindProgramPipeline);
+    if (ValidateBindProgramPipeline(context, pipeline))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindProgramPipeline, context, pipeline);
+        context->bindProgramPipeline(pipeline);
+    }
+}
+
+void ValidatedBindRenderbuffer(Context *context, GLenum target, GLuint renderbuffer)
+{
+    ANGLE_DEFER_COMMAND(BindRenderbuffer, context, target, renderbuffer);
+    ANGLE_PROFILE_ENTRY_POINT(BindRenderbuffer);
+    if (ValidateBindRenderbuffer(context, target, renderbuffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindRenderbuffer, context, target, renderbuffer);
+        context->bindRenderbuffer(target, renderbuffer);
+    }
+}
+
+void ValidatedBindRenderbufferOES(Context *context, GLenum target, GLuint renderbuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindRenderbufferOES);
+    if (ValidateBindRenderbufferOES(context, target, renderbuffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindRenderbufferOES, context, target, renderbuffer);
+        context->bindRenderbuffer(target, renderbuffer);
+    }
+}
+
+void ValidatedBindSampler(Context *context, GLuint unit, GLuint sampler)
+{
+    ANGLE_DEFER_COMMAND(BindSampler, context, unit, sampler);
+    ANGLE_PROFILE_ENTRY_POINT(BindSampler);
+    if (ValidateBindSampler(context, unit, sampler))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindSampler, context, unit, sampler);
+        context->bindSampler(unit, sampler);
+    }
+}
+
+void ValidatedBindTexture(Context *context, GLenum target, GLuint texture)
+{
+    ANGLE_DEFER_COMMAND(BindTexture, context, target, texture);
+    ANGLE_PROFILE_ENTRY_POINT(BindTexture);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateBindTexture(context, targetPacked, texture))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindTexture, context, target, texture);
+        context->bindTexture(targetPacked, texture);
+    }
+}
+
+void ValidatedBindTransformFeedback(Context *context, GLenum target, GLuint id)
+{
+    ANGLE_DEFER_COMMAND(BindTransformFeedback, context, target, id);
+    ANGLE_PROFILE_ENTRY_POINT(BindTransformFeedback);
+    if (ValidateBindTransformFeedback(context, target, id))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindTransformFeedback, context, target, id);
+        context->bindTransformFeedback(target, id);
+    }
+}
+
+void ValidatedBindUniformLocationCHROMIUM(Context *context,
+                                          GLuint program,
+                                          GLint location,
+                                          const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindUniformLocationCHROMIUM);
+    if (ValidateBindUniformLocationCHROMIUM(context, program, location, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindUniformLocationCHROMIUM, context, program, location, name);
+        context->bindUniformLocation(program, location, name);
+    }
+}
+
+void ValidatedBindVertexArray(Context *context, GLuint array)
+{
+    ANGLE_DEFER_COMMAND(BindVertexArray, context, array);
+    ANGLE_PROFILE_ENTRY_POINT(BindVertexArray);
+    if (ValidateBindVertexArray(context, array))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindVertexArray, context, array);
+        context->bindVertexArray(array);
+    }
+}
+
+void ValidatedBindVertexArrayOES(Context *context, GLuint array)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindVertexArrayOES);
+    if (ValidateBindVertexArrayOES(context, array))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindVertexArrayOES, context, array);
+        context->bindVertexArray(array);
+    }
+}
+
+void ValidatedBindVertexBuffer(Context *context,
+                               GLuint bindingindex,
+                               GLuint buffer,
+                               GLintptr offset,
+                               GLsizei stride)
+{
+    ANGLE_DEFER_COMMAND(BindVertexBuffer, context, bindingindex, buffer, offset, stride);
+    ANGLE_PROFILE_ENTRY_POINT(BindVertexBuffer);
+    if (ValidateBindVertexBuffer(context, bindingindex, buffer, offset, stride))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BindVertexBuffer, context, bindingindex, buffer, offset, stride);
+        context->bindVertexBuffer(bindingindex, buffer, offset, stride);
+    }
+}
+
+void ValidatedBlendColor(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+{
+    ANGLE_DEFER_COMMAND(BlendColor, context, red, green, blue, alpha);
+    ANGLE_PROFILE_ENTRY_POINT(BlendColor);
+    if (ValidateBlendColor(context, red, green, blue, alpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BlendColor, context, red, green, blue, alpha);
+        context->blendColor(red, green, blue, alpha);
+    }
+}
+
+void ValidatedBlendEquation(Context *context, GLenum mode)
+{
+    ANGLE_DEFER_COMMAND(BlendEquation, context, mode);
+    ANGLE_PROFILE_ENTRY_POINT(BlendEquation);
+    if (ValidateBlendEquation(context, mode))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BlendEquation, context, mode);
+        context->blendEquation(mode);
+    }
+}
+
+void ValidatedBlendEquationSeparate(Context *context, GLenum modeRGB, GLenum modeAlpha)
+{
+    ANGLE_DEFER_COMMAND(BlendEquationSeparate, context, modeRGB, modeAlpha);
+    ANGLE_PROFILE_ENTRY_POINT(BlendEquationSeparate);
+    if (ValidateBlendEquationSeparate(context, modeRGB, modeAlpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BlendEquationSeparate, context, modeRGB, modeAlpha);
+        context->blendEquationSeparate(modeRGB, modeAlpha);
+    }
+}
+
+void ValidatedBlendFunc(Context *context, GLenum sfactor, GLenum dfactor)
+{
+    ANGLE_DEFER_COMMAND(BlendFunc, context, sfactor, dfactor);
+    ANGLE_PROFILE_ENTRY_POINT(BlendFunc);
+    if (ValidateBlendFunc(context, sfactor, dfactor))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BlendFunc, context, sfactor, dfactor);
+        context->blendFunc(sfactor, dfactor);
+    }
+}
+
+void ValidatedBlendFuncSeparate(Context *context,
+                                GLenum sfactorRGB,
+                                GLenum dfactorRGB,
+                                GLenum sfactorAlpha,
+                                GLenum dfactorAlpha)
+{
+    ANGLE_DEFER_COMMAND(BlendFuncSeparate, context, sfactorRGB, dfactorRGB, sfactorAlpha,
+                        dfactorAlpha);
+    ANGLE_PROFILE_ENTRY_POINT(BlendFuncSeparate);
+    if (ValidateBlendFuncSeparate(context, sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BlendFuncSeparate, context, sfactorRGB, dfactorRGB, sfactorAlpha,
+                           dfactorAlpha);
+        context->blendFuncSeparate(sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
+    }
+}
+
+void ValidatedBlitFramebuffer(Context *context,
+                              GLint srcX0,
+                              GLint srcY0,
+                              GLint srcX1,
+                              GLint srcY1,
+                              GLint dstX0,
+                              GLint dstY0,
+                              GLint dstX1,
+                              GLint dstY1,
+                              GLbitfield mask,
+                              GLenum filter)
+{
+    ANGLE_DEFER_COMMAND(BlitFramebuffer, context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
+                        dstY1, mask, filter);
+    ANGLE_PROFILE_ENTRY_POINT(BlitFramebuffer);
+    if (ValidateBlitFramebuffer(context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1,
+                                mask, filter))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BlitFramebuffer, context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0,
+                           dstX1, dstY1, mask, filter);
+        context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask,
+                                 filter);
+    }
+}
+
+void ValidatedBlitFramebufferANGLE(Context *context,
+                                   GLint srcX0,
+                                   GLint srcY0,
+                                   GLint srcX1,
+                                   GLint srcY1,
+                                   GLint dstX0,
+                                   GLint dstY0,
+                                   GLint dstX1,
+                                   GLint dstY1,
+                                   GLbitfield mask,
+                                   GLenum filter)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BlitFramebufferANGLE);
+    if (ValidateBlitFramebufferANGLE(context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
+                                     dstY1, mask, filter))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BlitFramebufferANGLE, context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0,
+                           dstX1, dstY1, mask, filter);
+        context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask,
+                                 filter);
+    }
+}
+
+void ValidatedBufferData(Context *context,
+                         GLenum target,
+                         GLsizeiptr size,
+                         const void *data,
+                         GLenum usage)
+{
+    ANGLE_DEFER_COMMAND(BufferData, context, target, size, data, usage);
+    ANGLE_PROFILE_ENTRY_POINT(BufferData);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    BufferUsage usagePacked    = FromGLenum<BufferUsage>(usage);
+    if (ValidateBufferData(context, targetPacked, size, data, usagePacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BufferData, context, target, size, data, usage);
+        context->bufferData(targetPacked, size, data, usagePacked);
+    }
+}
+
+void ValidatedBufferStorageMemEXT(Context *context,
+                                  GLenum target,
+                                  GLsizeiptr size,
+                                  GLuint memory,
+                                  GLuint64 offset)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BufferStorageMemEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateBufferStorageMemEXT(context, targetPacked, size, memory, offset))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BufferStorageMemEXT, context, target, size, memory, offset);
+        context->bufferStorageMem(targetPacked, size, memory, offset);
+    }
+}
+
+void ValidatedBufferSubData(Context *context,
+                            GLenum target,
+                            GLintptr offset,
+                            GLsizeiptr size,
+                            const void *data)
+{
+    ANGLE_DEFER_COMMAND(BufferSubData, context, target, offset, size, data);
+    ANGLE_PROFILE_ENTRY_POINT(BufferSubData);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateBufferSubData(context, targetPacked, offset, size, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(BufferSubData, context, target, offset, size, data);
+        context->bufferSubData(targetPacked, offset, size, data);
+    }
+}
+
+GLenum ValidatedCheckFramebufferStatus(Context *context, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CheckFramebufferStatus);
+    if (ValidateCheckFramebufferStatus(context, target))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CheckFramebufferStatus, context, target);
+        return context->checkFramebufferStatus(target);
+    }
+    return GetDefaultReturnValue<EntryPoint::CheckFramebufferStatus, GLenum>();
+}
+
+GLenum ValidatedCheckFramebufferStatusOES(Context *context, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CheckFramebufferStatusOES);
+    if (ValidateCheckFramebufferStatusOES(context, target))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CheckFramebufferStatusOES, context, target);
+        return context->checkFramebufferStatus(target);
+    }
+    return GetDefaultReturnValue<EntryPoint::CheckFramebufferStatusOES, GLenum>();
+}
+
+void ValidatedClear(Context *context, GLbitfield mask)
+{
+    ANGLE_DEFER_COMMAND(Clear, context, mask);
+    ANGLE_PROFILE_ENTRY_POINT(Clear);
+    if (ValidateClear(context, mask))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Clear, context, mask);
+        context->clear(mask);
+    }
+}
+
+void ValidatedClearBufferfi(Context *context,
+                            GLenum buffer,
+                            GLint drawbuffer,
+                            GLfloat depth,
+                            GLint stencil)
+{
+    ANGLE_DEFER_COMMAND(ClearBufferfi, context, buffer, drawbuffer, depth, stencil);
+    ANGLE_PROFILE_ENTRY_POINT(ClearBufferfi);
+    if (ValidateClearBufferfi(context, buffer, drawbuffer, depth, stencil))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClearBufferfi, context, buffer, drawbuffer, depth, stencil);
+        context->clearBufferfi(buffer, drawbuffer, depth, stencil);
+    }
+}
+
+void ValidatedClearBufferfv(Context *context, GLenum buffer, GLint drawbuffer, const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ClearBufferfv, context, buffer, drawbuffer, value);
+    ANGLE_PROFILE_ENTRY_POINT(ClearBufferfv);
+    if (ValidateClearBufferfv(context, buffer, drawbuffer, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClearBufferfv, context, buffer, drawbuffer, value);
+        context->clearBufferfv(buffer, drawbuffer, value);
+    }
+}
+
+void ValidatedClearBufferiv(Context *context, GLenum buffer, GLint drawbuffer, const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(ClearBufferiv, context, buffer, drawbuffer, value);
+    ANGLE_PROFILE_ENTRY_POINT(ClearBufferiv);
+    if (ValidateClearBufferiv(context, buffer, drawbuffer, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClearBufferiv, context, buffer, drawbuffer, value);
+        context->clearBufferiv(buffer, drawbuffer, value);
+    }
+}
+
+void ValidatedClearBufferuiv(Context *context, GLenum buffer, GLint drawbuffer, const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(ClearBufferuiv, context, buffer, drawbuffer, value);
+    ANGLE_PROFILE_ENTRY_POINT(ClearBufferuiv);
+    if (ValidateClearBufferuiv(context, buffer, drawbuffer, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClearBufferuiv, context, buffer, drawbuffer, value);
+        context->clearBufferuiv(buffer, drawbuffer, value);
+    }
+}
+
+void ValidatedClearColor(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+{
+    ANGLE_DEFER_COMMAND(ClearColor, context, red, green, blue, alpha);
+    ANGLE_PROFILE_ENTRY_POINT(ClearColor);
+    if (ValidateClearColor(context, red, green, blue, alpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClearColor, context, red, green, blue, alpha);
+        context->clearColor(red, green, blue, alpha);
+    }
+}
+
+void ValidatedClearColorx(Context *context, GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ClearColorx);
+    if (ValidateClearColorx(context, red, green, blue, alpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClearColorx, context, red, green, blue, alpha);
+        context->clearColorx(red, green, blue, alpha);
+    }
+}
+
+void ValidatedClearDepthf(Context *context, GLfloat d)
+{
+    ANGLE_DEFER_COMMAND(ClearDepthf, context, d);
+    ANGLE_PROFILE_ENTRY_POINT(ClearDepthf);
+    if (ValidateClearDepthf(context, d))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClearDepthf, context, d);
+        context->clearDepthf(d);
+    }
+}
+
+void ValidatedClearDepthx(Context *context, GLfixed depth)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ClearDepthx);
+    if (ValidateClearDepthx(context, depth))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClearDepthx, context, depth);
+        context->clearDepthx(depth);
+    }
+}
+
+void ValidatedClearStencil(Context *context, GLint s)
+{
+    ANGLE_DEFER_COMMAND(ClearStencil, context, s);
+    ANGLE_PROFILE_ENTRY_POINT(ClearStencil);
+    if (ValidateClearStencil(context, s))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClearStencil, context, s);
+        context->clearStencil(s);
+    }
+}
+
+void ValidatedClientActiveTexture(Context *context, GLenum texture)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(ClientActiveTexture);
+    if (ValidateClientActiveTexture(context, texture))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClientActiveTexture, context, texture);
+        context->clientActiveTexture(texture);
+    }
+}
+
+GLenum ValidatedClientWaitSync(Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ClientWaitSync);
+    if (ValidateClientWaitSync(context, sync, flags, timeout))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClientWaitSync, context, sync, flags, timeout);
+        return context->clientWaitSync(sync, flags, timeout);
+    }
+    return GetDefaultReturnValue<EntryPoint::ClientWaitSync, GLenum>();
+}
+
+void ValidatedClipPlanef(Context *context, GLenum p, const GLfloat *eqn)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ClipPlanef);
+    if (ValidateClipPlanef(context, p, eqn))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClipPlanef, context, p, eqn);
+        context->clipPlanef(p, eqn);
+    }
+}
+
+void ValidatedClipPlanex(Context *context, GLenum plane, const GLfixed *equation)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ClipPlanex);
+    if (ValidateClipPlanex(context, plane, equation))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ClipPlanex, context, plane, equation);
+        context->clipPlanex(plane, equation);
+    }
+}
+
+void ValidatedColor4f(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(Color4f);
+    if (ValidateColor4f(context, red, green, blue, alpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Color4f, context, red, green, blue, alpha);
+        context->color4f(red, green, blue, alpha);
+    }
+}
+
+void ValidatedColor4ub(Context *context, GLubyte red, GLubyte green, GLubyte blue, GLubyte alpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(Color4ub);
+    if (ValidateColor4ub(context, red, green, blue, alpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Color4ub, context, red, green, blue, alpha);
+        context->color4ub(red, green, blue, alpha);
+    }
+}
+
+void ValidatedColor4x(Context *context, GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Color4x);
+    if (ValidateColor4x(context, red, green, blue, alpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Color4x, context, red, green, blue, alpha);
+        context->color4x(red, green, blue, alpha);
+    }
+}
+
+void ValidatedColorMask(Context *context,
+                        GLboolean red,
+                        GLboolean green,
+                        GLboolean blue,
+                        GLboolean alpha)
+{
+    ANGLE_DEFER_COMMAND(ColorMask, context, red, green, blue, alpha);
+    ANGLE_PROFILE_ENTRY_POINT(ColorMask);
+    if (ValidateColorMask(context, red, green, blue, alpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ColorMask, context, red, green, blue, alpha);
+        context->colorMask(red, green, blue, alpha);
+    }
+}
+
+void ValidatedColorPointer(Context *context,
+                           GLint size,
+                           GLenum type,
+                           GLsizei stride,
+                           const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ColorPointer);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    if (ValidateColorPointer(context, size, typePacked, stride, pointer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ColorPointer, context, size, type, stride, pointer);
+        context->colorPointer(size, typePacked, stride, pointer);
+    }
+}
+
+void ValidatedCompileShader(Context *context, GLuint shader)
+{
+    ANGLE_DEFER_COMMAND(CompileShader, context, shader);
+    ANGLE_PROFILE_ENTRY_POINT(CompileShader);
+    if (ValidateCompileShader(context, shader))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CompileShader, context, shader);
+        context->compileShader(shader);
+    }
+}
+
+void ValidatedCompressedCopyTextureCHROMIUM(Context *context, GLuint sourceId, GLuint destId)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedCopyTextureCHROMIUM);
+    if (ValidateCompressedCopyTextureCHROMIUM(context, sourceId, destId))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CompressedCopyTextureCHROMIUM, context, sourceId, destId);
+        context->compressedCopyTexture(sourceId, destId);
+    }
+}
+
+void ValidatedCompressedTexImage2D(Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum internalformat,
+                                   GLsizei width,
+                                   GLsizei height,
+                                   GLint border,
+                                   GLsizei imageSize,
+                                   const void *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexImage2D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateCompressedTexImage2D(context, targetPacked, level, internalformat, width, height,
+                                     border, imageSize, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CompressedTexImage2D, context, target, level, internalformat, width,
+                           height, border, imageSize, data);
+        context->compressedTexImage2D(targetPacked, level, internalformat, width, height, border,
+                                      imageSize, data);
+    }
+}
+
+void ValidatedCompressedTexImage2DRobustANGLE(Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum internalformat,
+                                              GLsizei width,
+                                              GLsizei height,
+                                              GLint border,
+                                              GLsizei imageSize,
+                                              GLsizei dataSize,
+                                              const GLvoid *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexImage2DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateCompressedTexImage2DRobustANGLE(context, targetPacked, level, internalformat, width,
+                                                height, border, imageSize, dataSize, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CompressedTexImage2DRobustANGLE, context, target, level, internalformat,
+                           width, height, border, imageSize, dataSize, data);
+        context->compressedTexImage2DRobust(targetPacked, level, internalformat, width, height,
+                                            border, imageSize, dataSize, data);
+    }
+}
+
+void ValidatedCompressedTexImage3D(Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum internalformat,
+                                   GLsizei width,
+                                   GLsizei height,
+                                   GLsizei depth,
+                                   GLint border,
+                                   GLsizei imageSize,
+                                   const void *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexImage3D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateCompressedTexImage3D(context, targetPacked, level, internalformat, width, height,
+                                     depth, border, imageSize, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CompressedTexImage3D, context, target, level, internalformat, width,
+                           height, depth, border, imageSize, data);
+        context->compressedTexImage3D(targetPacked, level, internalformat, width, height, depth,
+                                      border, imageSize, data);
+    }
+}
+
+void ValidatedCompressedTexImage3DRobustANGLE(Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum internalformat,
+                                              GLsizei width,
+                                              GLsizei height,
+                                              GLsizei depth,
+                                              GLint border,
+                                              GLsizei imageSize,
+                                              GLsizei dataSize,
+                                              const GLvoid *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexImage3DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateCompressedTexImage3DRobustANGLE(context, targetPacked, level, internalformat, width,
+                                                height, depth, border, imageSize, dataSize, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CompressedTexImage3DRobustANGLE, context, target, level, internalformat,
+                           width, height, depth, border, imageSize, dataSize, data);
+        context->compressedTexImage3DRobust(targetPacked, level, internalformat, width, height,
+                                            depth, border, imageSize, dataSize, data);
+    }
+}
+
+void ValidatedCompressedTexSubImage2D(Context *context,
+                                      GLenum target,
+                                      GLint level,
+                                      GLint xoffset,
+                                      GLint yoffset,
+                                      GLsizei width,
+                                      GLsizei height,
+                                      GLenum format,
+                                      GLsizei imageSize,
+                                      const void *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexSubImage2D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateCompressedTexSubImage2D(context, targetPacked, level, xoffset, yoffset, width,
+                                        height, format, imageSize, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CompressedTexSubImage2D, context, target, level, xoffset, yoffset, width,
+                           height, format, imageSize, data);
+        context->compressedTexSubImage2D(targetPacked, level, xoffset, yoffset, width, height,
+                                         format, imageSize, data);
+    }
+}
+
+void ValidatedCompressedTexSubImage2DRobustANGLE(Context *context,
+                                                 GLenum target,
+                                                 GLint level,
+                                                 GLsizei xoffset,
+                                                 GLsizei yoffset,
+                                                 GLsizei width,
+                                                 GLsizei height,
+                                                 GLenum format,
+                                                 GLsizei imageSize,
+                                                 GLsizei dataSize,
+                                                 const GLvoid *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexSubImage2DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateCompressedTexSubImage2DRobustANGLE(context, targetPacked, level, xoffset, yoffset,
+                                                   width, height, format, imageSize, dataSize,
+                                                   data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CompressedTexSubImage2DRobustANGLE, context, target, level, xoffset,
+                           yoffset, width, height, format, imageSize, dataSize, data);
+        context->compressedTexSubImage2DRobust(targetPacked, level, xoffset, yoffset, width, height,
+                                               format, imageSize, dataSize, data);
+    }
+}
+
+void ValidatedCompressedTexSubImage3D(Context *context,
+                                      GLenum target,
+                                      GLint level,
+                                      GLint xoffset,
+                                      GLint yoffset,
+                                      GLint zoffset,
+                                      GLsizei width,
+                                      GLsizei height,
+                                      GLsizei depth,
+                                      GLenum format,
+                                      GLsizei imageSize,
+                                      const void *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexSubImage3D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateCompressedTexSubImage3D(context, targetPacked, level, xoffset, yoffset, zoffset,
+                                        width, height, depth, format, imageSize, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CompressedTexSubImage3D, context, target, level, xoffset, yoffset,
+                           zoffset, width, height, depth, format, imageSize, data);
+        context->compressedTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width,
+                                         height, depth, format, imageSize, data);
+    }
+}
+
+void ValidatedCompressedTexSubImage3DRobustANGLE(Context *context,
+                                                 GLenum target,
+                                                 GLint level,
+                                                 GLint xoffset,
+                                                 GLint yoffset,
+                                                 GLint zoffset,
+                                                 GLsizei width,
+                                                 GLsizei height,
+                                                 GLsizei depth,
+                                                 GLenum format,
+                                                 GLsizei imageSize,
+                                                 GLsizei dataSize,
+                                                 const GLvoid *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexSubImage3DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateCompressedTexSubImage3DRobustANGLE(context, targetPacked, level, xoffset, yoffset,
+                                                   zoffset, width, height, depth, format, imageSize,
+                                                   dataSize, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CompressedTexSubImage3DRobustANGLE, context, target, level, xoffset,
+                           yoffset, zoffset, width, height, depth, format, imageSize, dataSize,
+                           data);
+        context->compressedTexSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset,
+                                               width, height, depth, format, imageSize, dataSize,
+                                               data);
+    }
+}
+
+void ValidatedCopyBufferSubData(Context *context,
+                                GLenum readTarget,
+                                GLenum writeTarget,
+                                GLintptr readOffset,
+                                GLintptr writeOffset,
+                                GLsizeiptr size)
+{
+    ANGLE_DEFER_COMMAND(CopyBufferSubData, context, readTarget, writeTarget, readOffset,
+                        writeOffset, size);
+    ANGLE_PROFILE_ENTRY_POINT(CopyBufferSubData);
+    BufferBinding readTargetPacked  = FromGLenum<BufferBinding>(readTarget);
+    BufferBinding writeTargetPacked = FromGLenum<BufferBinding>(writeTarget);
+    if (ValidateCopyBufferSubData(context, readTargetPacked, writeTargetPacked, readOffset,
+                                  writeOffset, size))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CopyBufferSubData, context, readTarget, writeTarget, readOffset,
+                           writeOffset, size);
+        context->copyBufferSubData(readTargetPacked, writeTargetPacked, readOffset, writeOffset,
+                                   size);
+    }
+}
+
+void ValidatedCopySubTexture3DANGLE(Context *context,
+                                    GLuint sourceId,
+                                    GLint sourceLevel,
+                                    GLenum destTarget,
+                                    GLuint destId,
+                                    GLint destLevel,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLint zoffset,
+                                    GLint x,
+                                    GLint y,
+                                    GLint z,
+                                    GLint width,
+                                    GLint height,
+                                    GLint depth,
+                                    GLboolean unpackFlipY,
+                                    GLboolean unpackPremultiplyAlpha,
+                                    GLboolean unpackUnmultiplyAlpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CopySubTexture3DANGLE);
+    TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
+    if (ValidateCopySubTexture3DANGLE(context, sourceId, sourceLevel, destTargetPacked, destId,
+                                      destLevel, xoffset, yoffset, zoffset, x, y, z, width, height,
+                                      depth, unpackFlipY, unpackPremultiplyAlpha,
+                                      unpackUnmultiplyAlpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CopySubTexture3DANGLE, context, sourceId, sourceLevel, destTarget,
+                           destId, destLevel, xoffset, yoffset, zoffset, x, y, z, width, height,
+                           depth, unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+        context->copySubTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
+                                  xoffset, yoffset, zoffset, x, y, z, width, height, depth,
+                                  unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    }
+}
+
+void ValidatedCopySubTextureCHROMIUM(Context *context,
+                                     GLuint sourceId,
+                                     GLint sourceLevel,
+                                     GLenum destTarget,
+                                     GLuint destId,
+                                     GLint destLevel,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLint x,
+                                     GLint y,
+                                     GLint width,
+                                     GLint height,
+                                     GLboolean unpackFlipY,
+                                     GLboolean unpackPremultiplyAlpha,
+                                     GLboolean unpackUnmultiplyAlpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CopySubTextureCHROMIUM);
+    TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
+    if (ValidateCopySubTextureCHROMIUM(context, sourceId, sourceLevel, destTargetPacked, destId,
+                                       destLevel, xoffset, yoffset, x, y, width, height,
+                                       unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CopySubTextureCHROMIUM, context, sourceId, sourceLevel, destTarget,
+                           destId, destLevel, xoffset, yoffset, x, y, width, height, unpackFlipY,
+                           unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+        context->copySubTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel, xoffset,
+                                yoffset, x, y, width, height, unpackFlipY, unpackPremultiplyAlpha,
+                                unpackUnmultiplyAlpha);
+    }
+}
+
+void ValidatedCopyTexImage2D(Context *context,
+                             GLenum target,
+                             GLint level,
+                             GLenum internalformat,
+                             GLint x,
+                             GLint y,
+                             GLsizei width,
+                             GLsizei height,
+                             GLint border)
+{
+    ANGLE_DEFER_COMMAND(CopyTexImage2D, context, target, level, internalformat, x, y, width, height,
+                        border);
+    ANGLE_PROFILE_ENTRY_POINT(CopyTexImage2D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateCopyTexImage2D(context, targetPacked, level, internalformat, x, y, width, height,
+                               border))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CopyTexImage2D, context, target, level, internalformat, x, y, width,
+                           height, border);
+        context->copyTexImage2D(targetPacked, level, internalformat, x, y, width, height, border);
+    }
+}
+
+void ValidatedCopyTexSubImage2D(Context *context,
+                                GLenum target,
+                                GLint level,
+                                GLint xoffset,
+                                GLint yoffset,
+                                GLint x,
+                                GLint y,
+                                GLsizei width,
+                                GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(CopyTexSubImage2D, context, target, level, xoffset, yoffset, x, y, width,
+                        height);
+    ANGLE_PROFILE_ENTRY_POINT(CopyTexSubImage2D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateCopyTexSubImage2D(context, targetPacked, level, xoffset, yoffset, x, y, width,
+                                  height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CopyTexSubImage2D, context, target, level, xoffset, yoffset, x, y, width,
+                           height);
+        context->copyTexSubImage2D(targetPacked, level, xoffset, yoffset, x, y, width, height);
+    }
+}
+
+void ValidatedCopyTexSubImage3D(Context *context,
+                                GLenum target,
+                                GLint level,
+                                GLint xoffset,
+                                GLint yoffset,
+                                GLint zoffset,
+                                GLint x,
+                                GLint y,
+                                GLsizei width,
+                                GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(CopyTexSubImage3D, context, target, level, xoffset, yoffset, zoffset, x, y,
+                        width, height);
+    ANGLE_PROFILE_ENTRY_POINT(CopyTexSubImage3D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateCopyTexSubImage3D(context, targetPacked, level, xoffset, yoffset, zoffset, x, y,
+                                  width, height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CopyTexSubImage3D, context, target, level, xoffset, yoffset, zoffset, x,
+                           y, width, height);
+        context->copyTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, x, y, width,
+                                   height);
+    }
+}
+
+void ValidatedCopyTexture3DANGLE(Context *context,
+                                 GLuint sourceId,
+                                 GLint sourceLevel,
+                                 GLenum destTarget,
+                                 GLuint destId,
+                                 GLint destLevel,
+                                 GLint internalFormat,
+                                 GLenum destType,
+                                 GLboolean unpackFlipY,
+                                 GLboolean unpackPremultiplyAlpha,
+                                 GLboolean unpackUnmultiplyAlpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CopyTexture3DANGLE);
+    TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
+    if (ValidateCopyTexture3DANGLE(context, sourceId, sourceLevel, destTargetPacked, destId,
+                                   destLevel, internalFormat, destType, unpackFlipY,
+                                   unpackPremultiplyAlpha, unpackUnmultiplyAlpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CopyTexture3DANGLE, context, sourceId, sourceLevel, destTarget, destId,
+                           destLevel, internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                           unpackUnmultiplyAlpha);
+        context->copyTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
+                               internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                               unpackUnmultiplyAlpha);
+    }
+}
+
+void ValidatedCopyTextureCHROMIUM(Context *context,
+                                  GLuint sourceId,
+                                  GLint sourceLevel,
+                                  GLenum destTarget,
+                                  GLuint destId,
+                                  GLint destLevel,
+                                  GLint internalFormat,
+                                  GLenum destType,
+                                  GLboolean unpackFlipY,
+                                  GLboolean unpackPremultiplyAlpha,
+                                  GLboolean unpackUnmultiplyAlpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CopyTextureCHROMIUM);
+    TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
+    if (ValidateCopyTextureCHROMIUM(context, sourceId, sourceLevel, destTargetPacked, destId,
+                                    destLevel, internalFormat, destType, unpackFlipY,
+                                    unpackPremultiplyAlpha, unpackUnmultiplyAlpha))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CopyTextureCHROMIUM, context, sourceId, sourceLevel, destTarget, destId,
+                           destLevel, internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                           unpackUnmultiplyAlpha);
+        context->copyTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
+                             internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                             unpackUnmultiplyAlpha);
+    }
+}
+
+void ValidatedCoverFillPathCHROMIUM(Context *context, GLuint path, GLenum coverMode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CoverFillPathCHROMIUM);
+    if (ValidateCoverFillPathCHROMIUM(context, path, coverMode))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CoverFillPathCHROMIUM, context, path, coverMode);
+        context->coverFillPath(path, coverMode);
+    }
+}
+
+void ValidatedCoverFillPathInstancedCHROMIUM(Context *context,
+                                             GLsizei numPath,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum coverMode,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CoverFillPathInstancedCHROMIUM);
+    if (ValidateCoverFillPathInstancedCHROMIUM(context, numPath, pathNameType, paths, pathBase,
+                                               coverMode, transformType, transformValues))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CoverFillPathInstancedCHROMIUM, context, numPath, pathNameType, paths,
+                           pathBase, coverMode, transformType, transformValues);
+        context->coverFillPathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
+                                        transformType, transformValues);
+    }
+}
+
+void ValidatedCoverStrokePathCHROMIUM(Context *context, GLuint path, GLenum coverMode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CoverStrokePathCHROMIUM);
+    if (ValidateCoverStrokePathCHROMIUM(context, path, coverMode))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CoverStrokePathCHROMIUM, context, path, coverMode);
+        context->coverStrokePath(path, coverMode);
+    }
+}
+
+void ValidatedCoverStrokePathInstancedCHROMIUM(Context *context,
+                                               GLsizei numPath,
+                                               GLenum pathNameType,
+                                               const void *paths,
+                                               GLuint pathBase,
+                                               GLenum coverMode,
+                                               GLenum transformType,
+                                               const GLfloat *transformValues)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CoverStrokePathInstancedCHROMIUM);
+    if (ValidateCoverStrokePathInstancedCHROMIUM(context, numPath, pathNameType, paths, pathBase,
+                                                 coverMode, transformType, transformValues))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CoverStrokePathInstancedCHROMIUM, context, numPath, pathNameType, paths,
+                           pathBase, coverMode, transformType, transformValues);
+        context->coverStrokePathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
+                                          transformType, transformValues);
+    }
+}
+
+void ValidatedCoverageModulationCHROMIUM(Context *context, GLenum components)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CoverageModulationCHROMIUM);
+    if (ValidateCoverageModulationCHROMIUM(context, components))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CoverageModulationCHROMIUM, context, components);
+        context->coverageModulation(components);
+    }
+}
+
+void ValidatedCreateMemoryObjectsEXT(Context *context, GLsizei n, GLuint *memoryObjects)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CreateMemoryObjectsEXT);
+    if (ValidateCreateMemoryObjectsEXT(context, n, memoryObjects))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CreateMemoryObjectsEXT, context, n, memoryObjects);
+        context->createMemoryObjects(n, memoryObjects);
+    }
+}
+
+GLuint ValidatedCreateProgram(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CreateProgram);
+    if (ValidateCreateProgram(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CreateProgram, context);
+        return context->createProgram();
+    }
+    return GetDefaultReturnValue<EntryPoint::CreateProgram, GLuint>();
+}
+
+GLuint ValidatedCreateShader(Context *context, GLenum type)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CreateShader);
+    ShaderType typePacked = FromGLenum<ShaderType>(type);
+    if (ValidateCreateShader(context, typePacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CreateShader, context, type);
+        return context->createShader(typePacked);
+    }
+    return GetDefaultReturnValue<EntryPoint::CreateShader, GLuint>();
+}
+
+GLuint ValidatedCreateShaderProgramv(Context *context,
+                                     GLenum type,
+                                     GLsizei count,
+                                     const GLchar *const *strings)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CreateShaderProgramv);
+    ShaderType typePacked = FromGLenum<ShaderType>(type);
+    if (ValidateCreateShaderProgramv(context, typePacked, count, strings))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CreateShaderProgramv, context, type, count, strings);
+        return context->createShaderProgramv(typePacked, count, strings);
+    }
+    return GetDefaultReturnValue<EntryPoint::CreateShaderProgramv, GLuint>();
+}
+
+void ValidatedCullFace(Context *context, GLenum mode)
+{
+    ANGLE_DEFER_COMMAND(CullFace, context, mode);
+    ANGLE_PROFILE_ENTRY_POINT(CullFace);
+    CullFaceMode modePacked = FromGLenum<CullFaceMode>(mode);
+    if (ValidateCullFace(context, modePacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CullFace, context, mode);
+        context->cullFace(modePacked);
+    }
+}
+
+void ValidatedCurrentPaletteMatrixOES(Context *context, GLuint matrixpaletteindex)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CurrentPaletteMatrixOES);
+    if (ValidateCurrentPaletteMatrixOES(context, matrixpaletteindex))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(CurrentPaletteMatrixOES, context, matrixpaletteindex);
+        context->currentPaletteMatrix(matrixpaletteindex);
+    }
+}
+
+void ValidatedDebugMessageCallbackKHR(Context *context,
+                                      GLDEBUGPROCKHR callback,
+                                      const void *userParam)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DebugMessageCallbackKHR);
+    if (ValidateDebugMessageCallbackKHR(context, callback, userParam))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DebugMessageCallbackKHR, context, callback, userParam);
+        context->debugMessageCallback(callback, userParam);
+    }
+}
+
+void ValidatedDebugMessageControlKHR(Context *context,
+                                     GLenum source,
+                                     GLenum type,
+                                     GLenum severity,
+                                     GLsizei count,
+                                     const GLuint *ids,
+                                     GLboolean enabled)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DebugMessageControlKHR);
+    if (ValidateDebugMessageControlKHR(context, source, type, severity, count, ids, enabled))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DebugMessageControlKHR, context, source, type, severity, count, ids,
+                           enabled);
+        context->debugMessageControl(source, type, severity, count, ids, enabled);
+    }
+}
+
+void ValidatedDebugMessageInsertKHR(Context *context,
+                                    GLenum source,
+                                    GLenum type,
+                                    GLuint id,
+                                    GLenum severity,
+                                    GLsizei length,
+                                    const GLchar *buf)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DebugMessageInsertKHR);
+    if (ValidateDebugMessageInsertKHR(context, source, type, id, severity, length, buf))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DebugMessageInsertKHR, context, source, type, id, severity, length, buf);
+        context->debugMessageInsert(source, type, id, severity, length, buf);
+    }
+}
+
+void ValidatedDeleteBuffers(Context *context, GLsizei n, const GLuint *buffers)
+{
+    ANGLE_DEFER_COMMAND(DeleteBuffers, context, n, buffers);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteBuffers);
+    if (ValidateDeleteBuffers(context, n, buffers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteBuffers, context, n, buffers);
+        context->deleteBuffers(n, buffers);
+    }
+}
+
+void ValidatedDeleteFencesNV(Context *context, GLsizei n, const GLuint *fences)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteFencesNV);
+    if (ValidateDeleteFencesNV(context, n, fences))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteFencesNV, context, n, fences);
+        context->deleteFencesNV(n, fences);
+    }
+}
+
+void ValidatedDeleteFramebuffers(Context *context, GLsizei n, const GLuint *framebuffers)
+{
+    ANGLE_DEFER_COMMAND(DeleteFramebuffers, context, n, framebuffers);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteFramebuffers);
+    if (ValidateDeleteFramebuffers(context, n, framebuffers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteFramebuffers, context, n, framebuffers);
+        context->deleteFramebuffers(n, framebuffers);
+    }
+}
+
+void ValidatedDeleteFramebuffersOES(Context *context, GLsizei n, const GLuint *framebuffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteFramebuffersOES);
+    if (ValidateDeleteFramebuffersOES(context, n, framebuffers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteFramebuffersOES, context, n, framebuffers);
+        context->deleteFramebuffers(n, framebuffers);
+    }
+}
+
+void ValidatedDeleteMemoryObjectsEXT(Context *context, GLsizei n, const GLuint *memoryObjects)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteMemoryObjectsEXT);
+    if (ValidateDeleteMemoryObjectsEXT(context, n, memoryObjects))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteMemoryObjectsEXT, context, n, memoryObjects);
+        context->deleteMemoryObjects(n, memoryObjects);
+    }
+}
+
+void ValidatedDeletePathsCHROMIUM(Context *context, GLuint first, GLsizei range)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeletePathsCHROMIUM);
+    if (ValidateDeletePathsCHROMIUM(context, first, range))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeletePathsCHROMIUM, context, first, range);
+        context->deletePaths(first, range);
+    }
+}
+
+void ValidatedDeleteProgram(Context *context, GLuint program)
+{
+    ANGLE_DEFER_COMMAND(DeleteProgram, context, program);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteProgram);
+    if (ValidateDeleteProgram(context, program))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteProgram, context, program);
+        context->deleteProgram(program);
+    }
+}
+
+void ValidatedDeleteProgramPipelines(Context *context, GLsizei n, const GLuint *pipelines)
+{
+    ANGLE_DEFER_COMMAND(DeleteProgramPipelines, context, n, pipelines);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteProgramPipelines);
+    if (ValidateDeleteProgramPipelines(context, n, pipelines))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteProgramPipelines, context, n, pipelines);
+        context->deleteProgramPipelines(n, pipelines);
+    }
+}
+
+void ValidatedDeleteQueries(Context *context, GLsizei n, const GLuint *ids)
+{
+    ANGLE_DEFER_COMMAND(DeleteQueries, context, n, ids);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteQueries);
+    if (ValidateDeleteQueries(context, n, ids))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteQueries, context, n, ids);
+        context->deleteQueries(n, ids);
+    }
+}
+
+void ValidatedDeleteQueriesEXT(Context *context, GLsizei n, const GLuint *ids)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteQueriesEXT);
+    if (ValidateDeleteQueriesEXT(context, n, ids))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteQueriesEXT, context, n, ids);
+        context->deleteQueries(n, ids);
+    }
+}
+
+void ValidatedDeleteRenderbuffers(Context *context, GLsizei n, const GLuint *renderbuffers)
+{
+    ANGLE_DEFER_COMMAND(DeleteRenderbuffers, context, n, renderbuffers);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteRenderbuffers);
+    if (ValidateDeleteRenderbuffers(context, n, renderbuffers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteRenderbuffers, context, n, renderbuffers);
+        context->deleteRenderbuffers(n, renderbuffers);
+    }
+}
+
+void ValidatedDeleteRenderbuffersOES(Context *context, GLsizei n, const GLuint *renderbuffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteRenderbuffersOES);
+    if (ValidateDeleteRenderbuffersOES(context, n, renderbuffers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteRenderbuffersOES, context, n, renderbuffers);
+        context->deleteRenderbuffers(n, renderbuffers);
+    }
+}
+
+void ValidatedDeleteSamplers(Context *context, GLsizei count, const GLuint *samplers)
+{
+    ANGLE_DEFER_COMMAND(DeleteSamplers, context, count, samplers);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteSamplers);
+    if (ValidateDeleteSamplers(context, count, samplers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteSamplers, context, count, samplers);
+        context->deleteSamplers(count, samplers);
+    }
+}
+
+void ValidatedDeleteSemaphoresEXT(Context *context, GLsizei n, const GLuint *semaphores)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteSemaphoresEXT);
+    if (ValidateDeleteSemaphoresEXT(context, n, semaphores))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteSemaphoresEXT, context, n, semaphores);
+        context->deleteSemaphores(n, semaphores);
+    }
+}
+
+void ValidatedDeleteShader(Context *context, GLuint shader)
+{
+    ANGLE_DEFER_COMMAND(DeleteShader, context, shader);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteShader);
+    if (ValidateDeleteShader(context, shader))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteShader, context, shader);
+        context->deleteShader(shader);
+    }
+}
+
+void ValidatedDeleteSync(Context *context, GLsync sync)
+{
+    ANGLE_DEFER_COMMAND(DeleteSync, context, sync);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteSync);
+    if (ValidateDeleteSync(context, sync))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteSync, context, sync);
+        context->deleteSync(sync);
+    }
+}
+
+void ValidatedDeleteTextures(Context *context, GLsizei n, const GLuint *textures)
+{
+    ANGLE_DEFER_COMMAND(DeleteTextures, context, n, textures);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteTextures);
+    if (ValidateDeleteTextures(context, n, textures))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteTextures, context, n, textures);
+        context->deleteTextures(n, textures);
+    }
+}
+
+void ValidatedDeleteTransformFeedbacks(Context *context, GLsizei n, const GLuint *ids)
+{
+    ANGLE_DEFER_COMMAND(DeleteTransformFeedbacks, context, n, ids);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteTransformFeedbacks);
+    if (ValidateDeleteTransformFeedbacks(context, n, ids))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteTransformFeedbacks, context, n, ids);
+        context->deleteTransformFeedbacks(n, ids);
+    }
+}
+
+void ValidatedDeleteVertexArrays(Context *context, GLsizei n, const GLuint *arrays)
+{
+    ANGLE_DEFER_COMMAND(DeleteVertexArrays, context, n, arrays);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteVertexArrays);
+    if (ValidateDeleteVertexArrays(context, n, arrays))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteVertexArrays, context, n, arrays);
+        context->deleteVertexArrays(n, arrays);
+    }
+}
+
+void ValidatedDeleteVertexArraysOES(Context *context, GLsizei n, const GLuint *arrays)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteVertexArraysOES);
+    if (ValidateDeleteVertexArraysOES(context, n, arrays))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DeleteVertexArraysOES, context, n, arrays);
+        context->deleteVertexArrays(n, arrays);
+    }
+}
+
+void ValidatedDepthFunc(Context *context, GLenum func)
+{
+    ANGLE_DEFER_COMMAND(DepthFunc, context, func);
+    ANGLE_PROFILE_ENTRY_POINT(DepthFunc);
+    if (ValidateDepthFunc(context, func))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DepthFunc, context, func);
+        context->depthFunc(func);
+    }
+}
+
+void ValidatedDepthMask(Context *context, GLboolean flag)
+{
+    ANGLE_DEFER_COMMAND(DepthMask, context, flag);
+    ANGLE_PROFILE_ENTRY_POINT(DepthMask);
+    if (ValidateDepthMask(context, flag))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DepthMask, context, flag);
+        context->depthMask(flag);
+    }
+}
+
+void ValidatedDepthRangef(Context *context, GLfloat n, GLfloat f)
+{
+    ANGLE_DEFER_COMMAND(DepthRangef, context, n, f);
+    ANGLE_PROFILE_ENTRY_POINT(DepthRangef);
+    if (ValidateDepthRangef(context, n, f))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DepthRangef, context, n, f);
+        context->depthRangef(n, f);
+    }
+}
+
+void ValidatedDepthRangex(Context *context, GLfixed n, GLfixed f)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DepthRangex);
+    if (ValidateDepthRangex(context, n, f))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DepthRangex, context, n, f);
+        context->depthRangex(n, f);
+    }
+}
+
+void ValidatedDetachShader(Context *context, GLuint program, GLuint shader)
+{
+    ANGLE_DEFER_COMMAND(DetachShader, context, program, shader);
+    ANGLE_PROFILE_ENTRY_POINT(DetachShader);
+    if (ValidateDetachShader(context, program, shader))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DetachShader, context, program, shader);
+        context->detachShader(program, shader);
+    }
+}
+
+void ValidatedDisable(Context *context, GLenum cap)
+{
+    ANGLE_DEFER_COMMAND(Disable, context, cap);
+    ANGLE_PROFILE_ENTRY_POINT(Disable);
+    if (ValidateDisable(context, cap))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Disable, context, cap);
+        context->disable(cap);
+    }
+}
+
+void ValidatedDisableClientState(Context *context, GLenum array)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DisableClientState);
+    ClientVertexArrayType arrayPacked = FromGLenum<ClientVertexArrayType>(array);
+    if (ValidateDisableClientState(context, arrayPacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DisableClientState, context, array);
+        context->disableClientState(arrayPacked);
+    }
+}
+
+void ValidatedDisableVertexAttribArray(Context *context, GLuint index)
+{
+    ANGLE_DEFER_COMMAND(DisableVertexAttribArray, context, index);
+    ANGLE_PROFILE_ENTRY_POINT(DisableVertexAttribArray);
+    if (ValidateDisableVertexAttribArray(context, index))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DisableVertexAttribArray, context, index);
+        context->disableVertexAttribArray(index);
+    }
+}
+
+void ValidatedDiscardFramebufferEXT(Context *context,
+                                    GLenum target,
+                                    GLsizei numAttachments,
+                                    const GLenum *attachments)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DiscardFramebufferEXT);
+    if (ValidateDiscardFramebufferEXT(context, target, numAttachments, attachments))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DiscardFramebufferEXT, context, target, numAttachments, attachments);
+        context->discardFramebuffer(target, numAttachments, attachments);
+    }
+}
+
+void ValidatedDispatchCompute(Context *context,
+                              GLuint num_groups_x,
+                              GLuint num_groups_y,
+                              GLuint num_groups_z)
+{
+    ANGLE_DEFER_COMMAND(DispatchCompute, context, num_groups_x, num_groups_y, num_groups_z);
+    ANGLE_PROFILE_ENTRY_POINT(DispatchCompute);
+    if (ValidateDispatchCompute(context, num_groups_x, num_groups_y, num_groups_z))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DispatchCompute, context, num_groups_x, num_groups_y, num_groups_z);
+        context->dispatchCompute(num_groups_x, num_groups_y, num_groups_z);
+    }
+}
+
+void ValidatedDispatchComputeIndirect(Context *context, GLintptr indirect)
+{
+    ANGLE_DEFER_COMMAND(DispatchComputeIndirect, context, indirect);
+    ANGLE_PROFILE_ENTRY_POINT(DispatchComputeIndirect);
+    if (ValidateDispatchComputeIndirect(context, indirect))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DispatchComputeIndirect, context, indirect);
+        context->dispatchComputeIndirect(indirect);
+    }
+}
+
+void ValidatedDrawArrays(Context *context, GLenum mode, GLint first, GLsizei count)
+{
+    ANGLE_DEFER_COMMAND(DrawArrays, context, mode, first, count);
+    ANGLE_PROFILE_ENTRY_POINT(DrawArrays);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    if (ValidateDrawArrays(context, modePacked, first, count))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawArrays, context, mode, first, count);
+        context->drawArrays(modePacked, first, count);
+    }
+}
+
+void ValidatedDrawArraysIndirect(Context *context, GLenum mode, const void *indirect)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawArraysIndirect);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    if (ValidateDrawArraysIndirect(context, modePacked, indirect))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawArraysIndirect, context, mode, indirect);
+        context->drawArraysIndirect(modePacked, indirect);
+    }
+}
+
+void ValidatedDrawArraysInstanced(Context *context,
+                                  GLenum mode,
+                                  GLint first,
+                                  GLsizei count,
+                                  GLsizei instancecount)
+{
+    ANGLE_DEFER_COMMAND(DrawArraysInstanced, context, mode, first, count, instancecount);
+    ANGLE_PROFILE_ENTRY_POINT(DrawArraysInstanced);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    if (ValidateDrawArraysInstanced(context, modePacked, first, count, instancecount))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawArraysInstanced, context, mode, first, count, instancecount);
+        context->drawArraysInstanced(modePacked, first, count, instancecount);
+    }
+}
+
+void ValidatedDrawArraysInstancedANGLE(Context *context,
+                                       GLenum mode,
+                                       GLint first,
+                                       GLsizei count,
+                                       GLsizei primcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawArraysInstancedANGLE);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    if (ValidateDrawArraysInstancedANGLE(context, modePacked, first, count, primcount))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawArraysInstancedANGLE, context, mode, first, count, primcount);
+        context->drawArraysInstanced(modePacked, first, count, primcount);
+    }
+}
+
+void ValidatedDrawArraysInstancedEXT(Context *context,
+                                     GLenum mode,
+                                     GLint start,
+                                     GLsizei count,
+                                     GLsizei primcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawArraysInstancedEXT);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    if (ValidateDrawArraysInstancedEXT(context, modePacked, start, count, primcount))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawArraysInstancedEXT, context, mode, start, count, primcount);
+        context->drawArraysInstanced(modePacked, start, count, primcount);
+    }
+}
+
+void ValidatedDrawBuffers(Context *context, GLsizei n, const GLenum *bufs)
+{
+    ANGLE_DEFER_COMMAND(DrawBuffers, context, n, bufs);
+    ANGLE_PROFILE_ENTRY_POINT(DrawBuffers);
+    if (ValidateDrawBuffers(context, n, bufs))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawBuffers, context, n, bufs);
+        context->drawBuffers(n, bufs);
+    }
+}
+
+void ValidatedDrawBuffersEXT(Context *context, GLsizei n, const GLenum *bufs)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawBuffersEXT);
+    if (ValidateDrawBuffersEXT(context, n, bufs))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawBuffersEXT, context, n, bufs);
+        context->drawBuffers(n, bufs);
+    }
+}
+
+void ValidatedDrawElements(Context *context,
+                           GLenum mode,
+                           GLsizei count,
+                           GLenum type,
+                           const void *indices)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawElements);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    if (ValidateDrawElements(context, modePacked, count, typePacked, indices))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawElements, context, mode, count, type, indices);
+        context->drawElements(modePacked, count, typePacked, indices);
+    }
+}
+
+void ValidatedDrawElementsIndirect(Context *context, GLenum mode, GLenum type, const void *indirect)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawElementsIndirect);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    if (ValidateDrawElementsIndirect(context, modePacked, typePacked, indirect))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawElementsIndirect, context, mode, type, indirect);
+        context->drawElementsIndirect(modePacked, typePacked, indirect);
+    }
+}
+
+void ValidatedDrawElementsInstanced(Context *context,
+                                    GLenum mode,
+                                    GLsizei count,
+                                    GLenum type,
+                                    const void *indices,
+                                    GLsizei instancecount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawElementsInstanced);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    if (ValidateDrawElementsInstanced(context, modePacked, count, typePacked, indices,
+                                      instancecount))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawElementsInstanced, context, mode, count, type, indices,
+                           instancecount);
+        context->drawElementsInstanced(modePacked, count, typePacked, indices, instancecount);
+    }
+}
+
+void ValidatedDrawElementsInstancedANGLE(Context *context,
+                                         GLenum mode,
+                                         GLsizei count,
+                                         GLenum type,
+                                         const void *indices,
+                                         GLsizei primcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawElementsInstancedANGLE);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    if (ValidateDrawElementsInstancedANGLE(context, modePacked, count, typePacked, indices,
+                                           primcount))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawElementsInstancedANGLE, context, mode, count, type, indices,
+                           primcount);
+        context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
+    }
+}
+
+void ValidatedDrawElementsInstancedEXT(Context *context,
+                                       GLenum mode,
+                                       GLsizei count,
+                                       GLenum type,
+                                       const void *indices,
+                                       GLsizei primcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawElementsInstancedEXT);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    if (ValidateDrawElementsInstancedEXT(context, modePacked, count, typePacked, indices,
+                                         primcount))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawElementsInstancedEXT, context, mode, count, type, indices,
+                           primcount);
+        context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
+    }
+}
+
+void ValidatedDrawRangeElements(Context *context,
+                                GLenum mode,
+                                GLuint start,
+                                GLuint end,
+                                GLsizei count,
+                                GLenum type,
+                                const void *indices)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawRangeElements);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    if (ValidateDrawRangeElements(context, modePacked, start, end, count, typePacked, indices))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawRangeElements, context, mode, start, end, count, type, indices);
+        context->drawRangeElements(modePacked, start, end, count, typePacked, indices);
+    }
+}
+
+void ValidatedDrawTexfOES(Context *context,
+                          GLfloat x,
+                          GLfloat y,
+                          GLfloat z,
+                          GLfloat width,
+                          GLfloat height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexfOES);
+    if (ValidateDrawTexfOES(context, x, y, z, width, height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawTexfOES, context, x, y, z, width, height);
+        context->drawTexf(x, y, z, width, height);
+    }
+}
+
+void ValidatedDrawTexfvOES(Context *context, const GLfloat *coords)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexfvOES);
+    if (ValidateDrawTexfvOES(context, coords))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawTexfvOES, context, coords);
+        context->drawTexfv(coords);
+    }
+}
+
+void ValidatedDrawTexiOES(Context *context, GLint x, GLint y, GLint z, GLint width, GLint height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexiOES);
+    if (ValidateDrawTexiOES(context, x, y, z, width, height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawTexiOES, context, x, y, z, width, height);
+        context->drawTexi(x, y, z, width, height);
+    }
+}
+
+void ValidatedDrawTexivOES(Context *context, const GLint *coords)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexivOES);
+    if (ValidateDrawTexivOES(context, coords))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawTexivOES, context, coords);
+        context->drawTexiv(coords);
+    }
+}
+
+void ValidatedDrawTexsOES(Context *context,
+                          GLshort x,
+                          GLshort y,
+                          GLshort z,
+                          GLshort width,
+                          GLshort height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexsOES);
+    if (ValidateDrawTexsOES(context, x, y, z, width, height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawTexsOES, context, x, y, z, width, height);
+        context->drawTexs(x, y, z, width, height);
+    }
+}
+
+void ValidatedDrawTexsvOES(Context *context, const GLshort *coords)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexsvOES);
+    if (ValidateDrawTexsvOES(context, coords))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawTexsvOES, context, coords);
+        context->drawTexsv(coords);
+    }
+}
+
+void ValidatedDrawTexxOES(Context *context,
+                          GLfixed x,
+                          GLfixed y,
+                          GLfixed z,
+                          GLfixed width,
+                          GLfixed height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexxOES);
+    if (ValidateDrawTexxOES(context, x, y, z, width, height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawTexxOES, context, x, y, z, width, height);
+        context->drawTexx(x, y, z, width, height);
+    }
+}
+
+void ValidatedDrawTexxvOES(Context *context, const GLfixed *coords)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexxvOES);
+    if (ValidateDrawTexxvOES(context, coords))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(DrawTexxvOES, context, coords);
+        context->drawTexxv(coords);
+    }
+}
+
+void ValidatedEGLImageTargetRenderbufferStorageOES(Context *context,
+                                                   GLenum target,
+                                                   GLeglImageOES image)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(EGLImageTargetRenderbufferStorageOES);
+    if (ValidateEGLImageTargetRenderbufferStorageOES(context, target, image))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(EGLImageTargetRenderbufferStorageOES, context, target, image);
+        context->eGLImageTargetRenderbufferStorage(target, image);
+    }
+}
+
+void ValidatedEGLImageTargetTexture2DOES(Context *context, GLenum target, GLeglImageOES image)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(EGLImageTargetTexture2DOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateEGLImageTargetTexture2DOES(context, targetPacked, image))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(EGLImageTargetTexture2DOES, context, target, image);
+        context->eGLImageTargetTexture2D(targetPacked, image);
+    }
+}
+
+void ValidatedEnable(Context *context, GLenum cap)
+{
+    ANGLE_DEFER_COMMAND(Enable, context, cap);
+    ANGLE_PROFILE_ENTRY_POINT(Enable);
+    if (ValidateEnable(context, cap))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Enable, context, cap);
+        context->enable(cap);
+    }
+}
+
+void ValidatedEnableClientState(Context *context, GLenum array)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(EnableClientState);
+    ClientVertexArrayType arrayPacked = FromGLenum<ClientVertexArrayType>(array);
+    if (ValidateEnableClientState(context, arrayPacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(EnableClientState, context, array);
+        context->enableClientState(arrayPacked);
+    }
+}
+
+void ValidatedEnableVertexAttribArray(Context *context, GLuint index)
+{
+    ANGLE_DEFER_COMMAND(EnableVertexAttribArray, context, index);
+    ANGLE_PROFILE_ENTRY_POINT(EnableVertexAttribArray);
+    if (ValidateEnableVertexAttribArray(context, index))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(EnableVertexAttribArray, context, index);
+        context->enableVertexAttribArray(index);
+    }
+}
+
+void ValidatedEndQuery(Context *context, GLenum target)
+{
+    ANGLE_DEFER_COMMAND(EndQuery, context, target);
+    ANGLE_PROFILE_ENTRY_POINT(EndQuery);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    if (ValidateEndQuery(context, targetPacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(EndQuery, context, target);
+        context->endQuery(targetPacked);
+    }
+}
+
+void ValidatedEndQueryEXT(Context *context, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(EndQueryEXT);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    if (ValidateEndQueryEXT(context, targetPacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(EndQueryEXT, context, target);
+        context->endQuery(targetPacked);
+    }
+}
+
+void ValidatedEndTransformFeedback(Context *context)
+{
+    ANGLE_DEFER_COMMAND(EndTransformFeedback, context);
+    ANGLE_PROFILE_ENTRY_POINT(EndTransformFeedback);
+    if (ValidateEndTransformFeedback(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(EndTransformFeedback, context);
+        context->endTransformFeedback();
+    }
+}
+
+GLsync ValidatedFenceSync(Context *context, GLenum condition, GLbitfield flags)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FenceSync);
+    if (ValidateFenceSync(context, condition, flags))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FenceSync, context, condition, flags);
+        return context->fenceSync(condition, flags);
+    }
+    return GetDefaultReturnValue<EntryPoint::FenceSync, GLsync>();
+}
+
+void ValidatedFinish(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Finish);
+    if (ValidateFinish(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Finish, context);
+        context->finish();
+    }
+}
+
+void ValidatedFinishFenceNV(Context *context, GLuint fence)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FinishFenceNV);
+    if (ValidateFinishFenceNV(context, fence))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FinishFenceNV, context, fence);
+        context->finishFenceNV(fence);
+    }
+}
+
+void ValidatedFlush(Context *context)
+{
+    ANGLE_DEFER_COMMAND(Flush, context);
+    ANGLE_PROFILE_ENTRY_POINT(Flush);
+    if (ValidateFlush(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Flush, context);
+        context->flush();
+    }
+}
+
+void ValidatedFlushMappedBufferRange(Context *context,
+                                     GLenum target,
+                                     GLintptr offset,
+                                     GLsizeiptr length)
+{
+    ANGLE_DEFER_COMMAND(FlushMappedBufferRange, context, target, offset, length);
+    ANGLE_PROFILE_ENTRY_POINT(FlushMappedBufferRange);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateFlushMappedBufferRange(context, targetPacked, offset, length))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FlushMappedBufferRange, context, target, offset, length);
+        context->flushMappedBufferRange(targetPacked, offset, length);
+    }
+}
+
+void ValidatedFlushMappedBufferRangeEXT(Context *context,
+                                        GLenum target,
+                                        GLintptr offset,
+                                        GLsizeiptr length)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FlushMappedBufferRangeEXT);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateFlushMappedBufferRangeEXT(context, targetPacked, offset, length))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FlushMappedBufferRangeEXT, context, target, offset, length);
+        context->flushMappedBufferRange(targetPacked, offset, length);
+    }
+}
+
+void ValidatedFogf(Context *context, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Fogf);
+    if (ValidateFogf(context, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Fogf, context, pname, param);
+        context->fogf(pname, param);
+    }
+}
+
+void ValidatedFogfv(Context *context, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Fogfv);
+    if (ValidateFogfv(context, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Fogfv, context, pname, params);
+        context->fogfv(pname, params);
+    }
+}
+
+void ValidatedFogx(Context *context, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Fogx);
+    if (ValidateFogx(context, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Fogx, context, pname, param);
+        context->fogx(pname, param);
+    }
+}
+
+void ValidatedFogxv(Context *context, GLenum pname, const GLfixed *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Fogxv);
+    if (ValidateFogxv(context, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Fogxv, context, pname, param);
+        context->fogxv(pname, param);
+    }
+}
+
+void ValidatedFramebufferParameteri(Context *context, GLenum target, GLenum pname, GLint param)
+{
+    ANGLE_DEFER_COMMAND(FramebufferParameteri, context, target, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferParameteri);
+    if (ValidateFramebufferParameteri(context, target, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FramebufferParameteri, context, target, pname, param);
+        context->framebufferParameteri(target, pname, param);
+    }
+}
+
+void ValidatedFramebufferRenderbuffer(Context *context,
+                                      GLenum target,
+                                      GLenum attachment,
+                                      GLenum renderbuffertarget,
+                                      GLuint renderbuffer)
+{
+    ANGLE_DEFER_COMMAND(FramebufferRenderbuffer, context, target, attachment, renderbuffertarget,
+                        renderbuffer);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferRenderbuffer);
+    if (ValidateFramebufferRenderbuffer(context, target, attachment, renderbuffertarget,
+                                        renderbuffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FramebufferRenderbuffer, context, target, attachment, renderbuffertarget,
+                           renderbuffer);
+        context->framebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
+    }
+}
+
+void ValidatedFramebufferRenderbufferOES(Context *context,
+                                         GLenum target,
+                                         GLenum attachment,
+                                         GLenum renderbuffertarget,
+                                         GLuint renderbuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferRenderbufferOES);
+    if (ValidateFramebufferRenderbufferOES(context, target, attachment, renderbuffertarget,
+                                           renderbuffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FramebufferRenderbufferOES, context, target, attachment,
+                           renderbuffertarget, renderbuffer);
+        context->framebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
+    }
+}
+
+void ValidatedFramebufferTexture2D(Context *context,
+                                   GLenum target,
+                                   GLenum attachment,
+                                   GLenum textarget,
+                                   GLuint texture,
+                                   GLint level)
+{
+    ANGLE_DEFER_COMMAND(FramebufferTexture2D, context, target, attachment, textarget, texture,
+                        level);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferTexture2D);
+    TextureTarget textargetPacked = FromGLenum<TextureTarget>(textarget);
+    if (ValidateFramebufferTexture2D(context, target, attachment, textargetPacked, texture, level))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FramebufferTexture2D, context, target, attachment, textarget, texture,
+                           level);
+        context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
+    }
+}
+
+void ValidatedFramebufferTexture2DOES(Context *context,
+                                      GLenum target,
+                                      GLenum attachment,
+                                      GLenum textarget,
+                                      GLuint texture,
+                                      GLint level)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferTexture2DOES);
+    TextureTarget textargetPacked = FromGLenum<TextureTarget>(textarget);
+    if (ValidateFramebufferTexture2DOES(context, target, attachment, textargetPacked, texture,
+                                        level))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FramebufferTexture2DOES, context, target, attachment, textarget, texture,
+                           level);
+        context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
+    }
+}
+
+void ValidatedFramebufferTextureEXT(Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLuint texture,
+                                    GLint level)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferTextureEXT);
+    if (ValidateFramebufferTextureEXT(context, target, attachment, texture, level))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FramebufferTextureEXT, context, target, attachment, texture, level);
+        context->framebufferTexture(target, attachment, texture, level);
+    }
+}
+
+void ValidatedFramebufferTextureLayer(Context *context,
+                                      GLenum target,
+                                      GLenum attachment,
+                                      GLuint texture,
+                                      GLint level,
+                                      GLint layer)
+{
+    ANGLE_DEFER_COMMAND(FramebufferTextureLayer, context, target, attachment, texture, level,
+                        layer);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferTextureLayer);
+    if (ValidateFramebufferTextureLayer(context, target, attachment, texture, level, layer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FramebufferTextureLayer, context, target, attachment, texture, level,
+                           layer);
+        context->framebufferTextureLayer(target, attachment, texture, level, layer);
+    }
+}
+
+void ValidatedFramebufferTextureMultiviewOVR(Context *context,
+                                             GLenum target,
+                                             GLenum attachment,
+                                             GLuint texture,
+                                             GLint level,
+                                             GLint baseViewIndex,
+                                             GLsizei numViews)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferTextureMultiviewOVR);
+    if (ValidateFramebufferTextureMultiviewOVR(context, target, attachment, texture, level,
+                                               baseViewIndex, numViews))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FramebufferTextureMultiviewOVR, context, target, attachment, texture,
+                           level, baseViewIndex, numViews);
+        context->framebufferTextureMultiview(target, attachment, texture, level, baseViewIndex,
+                                             numViews);
+    }
+}
+
+void ValidatedFrontFace(Context *context, GLenum mode)
+{
+    ANGLE_DEFER_COMMAND(FrontFace, context, mode);
+    ANGLE_PROFILE_ENTRY_POINT(FrontFace);
+    if (ValidateFrontFace(context, mode))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(FrontFace, context, mode);
+        context->frontFace(mode);
+    }
+}
+
+void ValidatedFrustumf(Context *context,
+                       GLfloat l,
+                       GLfloat r,
+                       GLfloat b,
+                       GLfloat t,
+                       GLfloat n,
+                       GLfloat f)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Frustumf);
+    if (ValidateFrustumf(context, l, r, b, t, n, f))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Frustumf, context, l, r, b, t, n, f);
+        context->frustumf(l, r, b, t, n, f);
+    }
+}
+
+void ValidatedFrustumx(Context *context,
+                       GLfixed l,
+                       GLfixed r,
+                       GLfixed b,
+                       GLfixed t,
+                       GLfixed n,
+                       GLfixed f)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Frustumx);
+    if (ValidateFrustumx(context, l, r, b, t, n, f))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Frustumx, context, l, r, b, t, n, f);
+        context->frustumx(l, r, b, t, n, f);
+    }
+}
+
+void ValidatedGenBuffers(Context *context, GLsizei n, GLuint *buffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenBuffers);
+    if (ValidateGenBuffers(context, n, buffers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenBuffers, context, n, buffers);
+        context->genBuffers(n, buffers);
+    }
+}
+
+void ValidatedGenFencesNV(Context *context, GLsizei n, GLuint *fences)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenFencesNV);
+    if (ValidateGenFencesNV(context, n, fences))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenFencesNV, context, n, fences);
+        context->genFencesNV(n, fences);
+    }
+}
+
+void ValidatedGenFramebuffers(Context *context, GLsizei n, GLuint *framebuffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenFramebuffers);
+    if (ValidateGenFramebuffers(context, n, framebuffers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenFramebuffers, context, n, framebuffers);
+        context->genFramebuffers(n, framebuffers);
+    }
+}
+
+void ValidatedGenFramebuffersOES(Context *context, GLsizei n, GLuint *framebuffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenFramebuffersOES);
+    if (ValidateGenFramebuffersOES(context, n, framebuffers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenFramebuffersOES, context, n, framebuffers);
+        context->genFramebuffers(n, framebuffers);
+    }
+}
+
+GLuint ValidatedGenPathsCHROMIUM(Context *context, GLsizei range)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenPathsCHROMIUM);
+    if (ValidateGenPathsCHROMIUM(context, range))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenPathsCHROMIUM, context, range);
+        return context->genPaths(range);
+    }
+    return GetDefaultReturnValue<EntryPoint::GenPathsCHROMIUM, GLuint>();
+}
+
+void ValidatedGenProgramPipelines(Context *context, GLsizei n, GLuint *pipelines)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenProgramPipelines);
+    if (ValidateGenProgramPipelines(context, n, pipelines))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenProgramPipelines, context, n, pipelines);
+        context->genProgramPipelines(n, pipelines);
+    }
+}
+
+void ValidatedGenQueries(Context *context, GLsizei n, GLuint *ids)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenQueries);
+    if (ValidateGenQueries(context, n, ids))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenQueries, context, n, ids);
+        context->genQueries(n, ids);
+    }
+}
+
+void ValidatedGenQueriesEXT(Context *context, GLsizei n, GLuint *ids)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenQueriesEXT);
+    if (ValidateGenQueriesEXT(context, n, ids))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenQueriesEXT, context, n, ids);
+        context->genQueries(n, ids);
+    }
+}
+
+void ValidatedGenRenderbuffers(Context *context, GLsizei n, GLuint *renderbuffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenRenderbuffers);
+    if (ValidateGenRenderbuffers(context, n, renderbuffers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenRenderbuffers, context, n, renderbuffers);
+        context->genRenderbuffers(n, renderbuffers);
+    }
+}
+
+void ValidatedGenRenderbuffersOES(Context *context, GLsizei n, GLuint *renderbuffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenRenderbuffersOES);
+    if (ValidateGenRenderbuffersOES(context, n, renderbuffers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenRenderbuffersOES, context, n, renderbuffers);
+        context->genRenderbuffers(n, renderbuffers);
+    }
+}
+
+void ValidatedGenSamplers(Context *context, GLsizei count, GLuint *samplers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenSamplers);
+    if (ValidateGenSamplers(context, count, samplers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenSamplers, context, count, samplers);
+        context->genSamplers(count, samplers);
+    }
+}
+
+void ValidatedGenSemaphoresEXT(Context *context, GLsizei n, GLuint *semaphores)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenSemaphoresEXT);
+    if (ValidateGenSemaphoresEXT(context, n, semaphores))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenSemaphoresEXT, context, n, semaphores);
+        context->genSemaphores(n, semaphores);
+    }
+}
+
+void ValidatedGenTextures(Context *context, GLsizei n, GLuint *textures)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenTextures);
+    if (ValidateGenTextures(context, n, textures))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenTextures, context, n, textures);
+        context->genTextures(n, textures);
+    }
+}
+
+void ValidatedGenTransformFeedbacks(Context *context, GLsizei n, GLuint *ids)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenTransformFeedbacks);
+    if (ValidateGenTransformFeedbacks(context, n, ids))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenTransformFeedbacks, context, n, ids);
+        context->genTransformFeedbacks(n, ids);
+    }
+}
+
+void ValidatedGenVertexArrays(Context *context, GLsizei n, GLuint *arrays)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenVertexArrays);
+    if (ValidateGenVertexArrays(context, n, arrays))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenVertexArrays, context, n, arrays);
+        context->genVertexArrays(n, arrays);
+    }
+}
+
+void ValidatedGenVertexArraysOES(Context *context, GLsizei n, GLuint *arrays)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenVertexArraysOES);
+    if (ValidateGenVertexArraysOES(context, n, arrays))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenVertexArraysOES, context, n, arrays);
+        context->genVertexArrays(n, arrays);
+    }
+}
+
+void ValidatedGenerateMipmap(Context *context, GLenum target)
+{
+    ANGLE_DEFER_COMMAND(GenerateMipmap, context, target);
+    ANGLE_PROFILE_ENTRY_POINT(GenerateMipmap);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateGenerateMipmap(context, targetPacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenerateMipmap, context, target);
+        context->generateMipmap(targetPacked);
+    }
+}
+
+void ValidatedGenerateMipmapOES(Context *context, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenerateMipmapOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateGenerateMipmapOES(context, targetPacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GenerateMipmapOES, context, target);
+        context->generateMipmap(targetPacked);
+    }
+}
+
+void ValidatedGetActiveAttrib(Context *context,
+                              GLuint program,
+                              GLuint index,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLint *size,
+                              GLenum *type,
+                              GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetActiveAttrib);
+    if (ValidateGetActiveAttrib(context, program, index, bufSize, length, size, type, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetActiveAttrib, context, program, index, bufSize, length, size, type,
+                           name);
+        context->getActiveAttrib(program, index, bufSize, length, size, type, name);
+    }
+}
+
+void ValidatedGetActiveUniform(Context *context,
+                               GLuint program,
+                               GLuint index,
+                               GLsizei bufSize,
+                               GLsizei *length,
+                               GLint *size,
+                               GLenum *type,
+                               GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetActiveUniform);
+    if (ValidateGetActiveUniform(context, program, index, bufSize, length, size, type, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetActiveUniform, context, program, index, bufSize, length, size, type,
+                           name);
+        context->getActiveUniform(program, index, bufSize, length, size, type, name);
+    }
+}
+
+void ValidatedGetActiveUniformBlockName(Context *context,
+                                        GLuint program,
+                                        GLuint uniformBlockIndex,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLchar *uniformBlockName)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetActiveUniformBlockName);
+    if (ValidateGetActiveUniformBlockName(context, program, uniformBlockIndex, bufSize, length,
+                                          uniformBlockName))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetActiveUniformBlockName, context, program, uniformBlockIndex, bufSize,
+                           length, uniformBlockName);
+        context->getActiveUniformBlockName(program, uniformBlockIndex, bufSize, length,
+                                           uniformBlockName);
+    }
+}
+
+void ValidatedGetActiveUniformBlockiv(Context *context,
+                                      GLuint program,
+                                      GLuint uniformBlockIndex,
+                                      GLenum pname,
+                                      GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetActiveUniformBlockiv);
+    if (ValidateGetActiveUniformBlockiv(context, program, uniformBlockIndex, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetActiveUniformBlockiv, context, program, uniformBlockIndex, pname,
+                           params);
+        context->getActiveUniformBlockiv(program, uniformBlockIndex, pname, params);
+    }
+}
+
+void ValidatedGetActiveUniformBlockivRobustANGLE(Context *context,
+                                                 GLuint program,
+                                                 GLuint uniformBlockIndex,
+                                                 GLenum pname,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetActiveUniformBlockivRobustANGLE);
+    if (ValidateGetActiveUniformBlockivRobustANGLE(context, program, uniformBlockIndex, pname,
+                                                   bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetActiveUniformBlockivRobustANGLE, context, program, uniformBlockIndex,
+                           pname, bufSize, length, params);
+        context->getActiveUniformBlockivRobust(program, uniformBlockIndex, pname, bufSize, length,
+                                               params);
+    }
+}
+
+void ValidatedGetActiveUniformsiv(Context *context,
+                                  GLuint program,
+                                  GLsizei uniformCount,
+                                  const GLuint *uniformIndices,
+                                  GLenum pname,
+                                  GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetActiveUniformsiv);
+    if (ValidateGetActiveUniformsiv(context, program, uniformCount, uniformIndices, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetActiveUniformsiv, context, program, uniformCount, uniformIndices,
+                           pname, params);
+        context->getActiveUniformsiv(program, uniformCount, uniformIndices, pname, params);
+    }
+}
+
+void ValidatedGetAttachedShaders(Context *context,
+                                 GLuint program,
+                                 GLsizei maxCount,
+                                 GLsizei *count,
+                                 GLuint *shaders)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetAttachedShaders);
+    if (ValidateGetAttachedShaders(context, program, maxCount, count, shaders))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetAttachedShaders, context, program, maxCount, count, shaders);
+        context->getAttachedShaders(program, maxCount, count, shaders);
+    }
+}
+
+GLint ValidatedGetAttribLocation(Context *context, GLuint program, const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetAttribLocation);
+    if (ValidateGetAttribLocation(context, program, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetAttribLocation, context, program, name);
+        return context->getAttribLocation(program, name);
+    }
+    return GetDefaultReturnValue<EntryPoint::GetAttribLocation, GLint>();
+}
+
+void ValidatedGetBooleani_v(Context *context, GLenum target, GLuint index, GLboolean *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBooleani_v);
+    if (ValidateGetBooleani_v(context, target, index, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetBooleani_v, context, target, index, data);
+        context->getBooleani_v(target, index, data);
+    }
+}
+
+void ValidatedGetBooleani_vRobustANGLE(Context *context,
+                                       GLenum target,
+                                       GLuint index,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLboolean *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBooleani_vRobustANGLE);
+    if (ValidateGetBooleani_vRobustANGLE(context, target, index, bufSize, length, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetBooleani_vRobustANGLE, context, target, index, bufSize, length, data);
+        context->getBooleani_vRobust(target, index, bufSize, length, data);
+    }
+}
+
+void ValidatedGetBooleanv(Context *context, GLenum pname, GLboolean *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBooleanv);
+    if (ValidateGetBooleanv(context, pname, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetBooleanv, context, pname, data);
+        context->getBooleanv(pname, data);
+    }
+}
+
+void ValidatedGetBooleanvRobustANGLE(Context *context,
+                                     GLenum pname,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLboolean *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBooleanvRobustANGLE);
+    if (ValidateGetBooleanvRobustANGLE(context, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetBooleanvRobustANGLE, context, pname, bufSize, length, params);
+        context->getBooleanvRobust(pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetBufferParameteri64v(Context *context, GLenum target, GLenum pname, GLint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferParameteri64v);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateGetBufferParameteri64v(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetBufferParameteri64v, context, target, pname, params);
+        context->getBufferParameteri64v(targetPacked, pname, params);
+    }
+}
+
+void ValidatedGetBufferParameteri64vRobustANGLE(Context *context,
+                                                GLenum target,
+                                                GLenum pname,
+                                                GLsizei bufSize,
+                                                GLsizei *length,
+                                                GLint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferParameteri64vRobustANGLE);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateGetBufferParameteri64vRobustANGLE(context, targetPacked, pname, bufSize, length,
+                                                  params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetBufferParameteri64vRobustANGLE, context, target, pname, bufSize,
+                           length, params);
+        context->getBufferParameteri64vRobust(targetPacked, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetBufferParameteriv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferParameteriv);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateGetBufferParameteriv(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetBufferParameteriv, context, target, pname, params);
+        context->getBufferParameteriv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedGetBufferParameterivRobustANGLE(Context *context,
+                                              GLenum target,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferParameterivRobustANGLE);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateGetBufferParameterivRobustANGLE(context, targetPacked, pname, bufSize, length,
+                                                params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetBufferParameterivRobustANGLE, context, target, pname, bufSize, length,
+                           params);
+        context->getBufferParameterivRobust(targetPacked, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetBufferPointerv(Context *context, GLenum target, GLenum pname, void **params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferPointerv);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateGetBufferPointerv(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetBufferPointerv, context, target, pname, params);
+        context->getBufferPointerv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedGetBufferPointervOES(Context *context, GLenum target, GLenum pname, void **params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferPointervOES);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateGetBufferPointervOES(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetBufferPointervOES, context, target, pname, params);
+        context->getBufferPointerv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedGetBufferPointervRobustANGLE(Context *context,
+                                           GLenum target,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           void **params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferPointervRobustANGLE);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateGetBufferPointervRobustANGLE(context, targetPacked, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetBufferPointervRobustANGLE, context, target, pname, bufSize, length,
+                           params);
+        context->getBufferPointervRobust(targetPacked, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetClipPlanef(Context *context, GLenum plane, GLfloat *equation)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetClipPlanef);
+    if (ValidateGetClipPlanef(context, plane, equation))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetClipPlanef, context, plane, equation);
+        context->getClipPlanef(plane, equation);
+    }
+}
+
+void ValidatedGetClipPlanex(Context *context, GLenum plane, GLfixed *equation)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetClipPlanex);
+    if (ValidateGetClipPlanex(context, plane, equation))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetClipPlanex, context, plane, equation);
+        context->getClipPlanex(plane, equation);
+    }
+}
+
+GLuint ValidatedGetDebugMessageLogKHR(Context *context,
+                                      GLuint count,
+                                      GLsizei bufSize,
+                                      GLenum *sources,
+                                      GLenum *types,
+                                      GLuint *ids,
+                                      GLenum *severities,
+                                      GLsizei *lengths,
+                                      GLchar *messageLog)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetDebugMessageLogKHR);
+    if (ValidateGetDebugMessageLogKHR(context, count, bufSize, sources, types, ids, severities,
+                                      lengths, messageLog))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetDebugMessageLogKHR, context, count, bufSize, sources, types, ids,
+                           severities, lengths, messageLog);
+        return context->getDebugMessageLog(count, bufSize, sources, types, ids, severities, lengths,
+                                           messageLog);
+    }
+    return GetDefaultReturnValue<EntryPoint::GetDebugMessageLogKHR, GLuint>();
+}
+
+GLenum ValidatedGetError(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetError);
+    if (ValidateGetError(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetError, context);
+        return context->getError();
+    }
+    return GetDefaultReturnValue<EntryPoint::GetError, GLenum>();
+}
+
+void ValidatedGetFenceivNV(Context *context, GLuint fence, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFenceivNV);
+    if (ValidateGetFenceivNV(context, fence, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetFenceivNV, context, fence, pname, params);
+        context->getFenceivNV(fence, pname, params);
+    }
+}
+
+void ValidatedGetFixedv(Context *context, GLenum pname, GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFixedv);
+    if (ValidateGetFixedv(context, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetFixedv, context, pname, params);
+        context->getFixedv(pname, params);
+    }
+}
+
+void ValidatedGetFloatv(Context *context, GLenum pname, GLfloat *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFloatv);
+    if (ValidateGetFloatv(context, pname, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetFloatv, context, pname, data);
+        context->getFloatv(pname, data);
+    }
+}
+
+void ValidatedGetFloatvRobustANGLE(Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFloatvRobustANGLE);
+    if (ValidateGetFloatvRobustANGLE(context, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetFloatvRobustANGLE, context, pname, bufSize, length, params);
+        context->getFloatvRobust(pname, bufSize, length, params);
+    }
+}
+
+GLint ValidatedGetFragDataIndexEXT(Context *context, GLuint program, const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFragDataIndexEXT);
+    if (ValidateGetFragDataIndexEXT(context, program, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetFragDataIndexEXT, context, program, name);
+        return context->getFragDataIndex(program, name);
+    }
+    return GetDefaultReturnValue<EntryPoint::GetFragDataIndexEXT, GLint>();
+}
+
+GLint ValidatedGetFragDataLocation(Context *context, GLuint program, const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFragDataLocation);
+    if (ValidateGetFragDataLocation(context, program, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetFragDataLocation, context, program, name);
+        return context->getFragDataLocation(program, name);
+    }
+    return GetDefaultReturnValue<EntryPoint::GetFragDataLocation, GLint>();
+}
+
+void ValidatedGetFramebufferAttachmentParameteriv(Context *context,
+                                                  GLenum target,
+                                                  GLenum attachment,
+                                                  GLenum pname,
+                                                  GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFramebufferAttachmentParameteriv);
+    if (ValidateGetFramebufferAttachmentParameteriv(context, target, attachment, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetFramebufferAttachmentParameteriv, context, target, attachment, pname,
+                           params);
+        context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
+    }
+}
+
+void ValidatedGetFramebufferAttachmentParameterivOES(Context *context,
+                                                     GLenum target,
+                                                     GLenum attachment,
+                                                     GLenum pname,
+                                                     GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFramebufferAttachmentParameterivOES);
+    if (ValidateGetFramebufferAttachmentParameterivOES(context, target, attachment, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetFramebufferAttachmentParameterivOES, context, target, attachment,
+                           pname, params);
+        context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
+    }
+}
+
+void ValidatedGetFramebufferAttachmentParameterivRobustANGLE(Context *context,
+                                                             GLenum target,
+                                                             GLenum attachment,
+                                                             GLenum pname,
+                                                             GLsizei bufSize,
+                                                             GLsizei *length,
+                                                             GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFramebufferAttachmentParameterivRobustANGLE);
+    if (ValidateGetFramebufferAttachmentParameterivRobustANGLE(context, target, attachment, pname,
+                                                               bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetFramebufferAttachmentParameterivRobustANGLE, context, target,
+                           attachment, pname, bufSize, length, params);
+        context->getFramebufferAttachmentParameterivRobust(target, attachment, pname, bufSize,
+                                                           length, params);
+    }
+}
+
+void ValidatedGetFramebufferParameteriv(Context *context,
+                                        GLenum target,
+                                        GLenum pname,
+                                        GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFramebufferParameteriv);
+    if (ValidateGetFramebufferParameteriv(context, target, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetFramebufferParameteriv, context, target, pname, params);
+        context->getFramebufferParameteriv(target, pname, params);
+    }
+}
+
+void ValidatedGetFramebufferParameterivRobustANGLE(Context *context,
+                                                   GLuint sampler,
+                                                   GLenum pname,
+                                                   GLsizei bufSize,
+                                                   GLsizei *length,
+                                                   GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFramebufferParameterivRobustANGLE);
+    if (ValidateGetFramebufferParameterivRobustANGLE(context, sampler, pname, bufSize, length,
+                                                     params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetFramebufferParameterivRobustANGLE, context, sampler, pname, bufSize,
+                           length, params);
+        context->getFramebufferParameterivRobust(sampler, pname, bufSize, length, params);
+    }
+}
+
+GLenum ValidatedGetGraphicsResetStatusEXT(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetGraphicsResetStatusEXT);
+    if (ValidateGetGraphicsResetStatusEXT(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetGraphicsResetStatusEXT, context);
+        return context->getGraphicsResetStatus();
+    }
+    return GetDefaultReturnValue<EntryPoint::GetGraphicsResetStatusEXT, GLenum>();
+}
+
+void ValidatedGetInteger64i_v(Context *context, GLenum target, GLuint index, GLint64 *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetInteger64i_v);
+    if (ValidateGetInteger64i_v(context, target, index, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetInteger64i_v, context, target, index, data);
+        context->getInteger64i_v(target, index, data);
+    }
+}
+
+void ValidatedGetInteger64i_vRobustANGLE(Context *context,
+                                         GLenum target,
+                                         GLuint index,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint64 *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetInteger64i_vRobustANGLE);
+    if (ValidateGetInteger64i_vRobustANGLE(context, target, index, bufSize, length, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetInteger64i_vRobustANGLE, context, target, index, bufSize, length,
+                           data);
+        context->getInteger64i_vRobust(target, index, bufSize, length, data);
+    }
+}
+
+void ValidatedGetInteger64v(Context *context, GLenum pname, GLint64 *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetInteger64v);
+    if (ValidateGetInteger64v(context, pname, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetInteger64v, context, pname, data);
+        context->getInteger64v(pname, data);
+    }
+}
+
+void ValidatedGetInteger64vRobustANGLE(Context *context,
+                                       GLenum pname,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLint64 *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetInteger64vRobustANGLE);
+    if (ValidateGetInteger64vRobustANGLE(context, pname, bufSize, length, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetInteger64vRobustANGLE, context, pname, bufSize, length, data);
+        context->getInteger64vRobust(pname, bufSize, length, data);
+    }
+}
+
+void ValidatedGetIntegeri_v(Context *context, GLenum target, GLuint index, GLint *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetIntegeri_v);
+    if (ValidateGetIntegeri_v(context, target, index, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetIntegeri_v, context, target, index, data);
+        context->getIntegeri_v(target, index, data);
+    }
+}
+
+void ValidatedGetIntegeri_vRobustANGLE(Context *context,
+                                       GLenum target,
+                                       GLuint index,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLint *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetIntegeri_vRobustANGLE);
+    if (ValidateGetIntegeri_vRobustANGLE(context, target, index, bufSize, length, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetIntegeri_vRobustANGLE, context, target, index, bufSize, length, data);
+        context->getIntegeri_vRobust(target, index, bufSize, length, data);
+    }
+}
+
+void ValidatedGetIntegerv(Context *context, GLenum pname, GLint *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetIntegerv);
+    if (ValidateGetIntegerv(context, pname, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetIntegerv, context, pname, data);
+        context->getIntegerv(pname, data);
+    }
+}
+
+void ValidatedGetIntegervRobustANGLE(Context *context,
+                                     GLenum pname,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetIntegervRobustANGLE);
+    if (ValidateGetIntegervRobustANGLE(context, pname, bufSize, length, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetIntegervRobustANGLE, context, pname, bufSize, length, data);
+        context->getIntegervRobust(pname, bufSize, length, data);
+    }
+}
+
+void ValidatedGetInternalformativ(Context *context,
+                                  GLenum target,
+                                  GLenum internalformat,
+                                  GLenum pname,
+                                  GLsizei bufSize,
+                                  GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetInternalformativ);
+    if (ValidateGetInternalformativ(context, target, internalformat, pname, bufSize, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetInternalformativ, context, target, internalformat, pname, bufSize,
+                           params);
+        context->getInternalformativ(target, internalformat, pname, bufSize, params);
+    }
+}
+
+void ValidatedGetInternalformativRobustANGLE(Context *context,
+                                             GLenum target,
+                                             GLenum internalformat,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetInternalformativRobustANGLE);
+    if (ValidateGetInternalformativRobustANGLE(context, target, internalformat, pname, bufSize,
+                                               length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetInternalformativRobustANGLE, context, target, internalformat, pname,
+                           bufSize, length, params);
+        context->getInternalformativRobust(target, internalformat, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetLightfv(Context *context, GLenum light, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetLightfv);
+    LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+    if (ValidateGetLightfv(context, light, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetLightfv, context, light, pname, params);
+        context->getLightfv(light, pnamePacked, params);
+    }
+}
+
+void ValidatedGetLightxv(Context *context, GLenum light, GLenum pname, GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetLightxv);
+    LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+    if (ValidateGetLightxv(context, light, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetLightxv, context, light, pname, params);
+        context->getLightxv(light, pnamePacked, params);
+    }
+}
+
+void ValidatedGetMaterialfv(Context *context, GLenum face, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetMaterialfv);
+    MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+    if (ValidateGetMaterialfv(context, face, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetMaterialfv, context, face, pname, params);
+        context->getMaterialfv(face, pnamePacked, params);
+    }
+}
+
+void ValidatedGetMaterialxv(Context *context, GLenum face, GLenum pname, GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetMaterialxv);
+    MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+    if (ValidateGetMaterialxv(context, face, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetMaterialxv, context, face, pname, params);
+        context->getMaterialxv(face, pnamePacked, params);
+    }
+}
+
+void ValidatedGetMemoryObjectParameterivEXT(Context *context,
+                                            GLuint memoryObject,
+                                            GLenum pname,
+                                            GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetMemoryObjectParameterivEXT);
+    if (ValidateGetMemoryObjectParameterivEXT(context, memoryObject, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetMemoryObjectParameterivEXT, context, memoryObject, pname, params);
+        context->getMemoryObjectParameteriv(memoryObject, pname, params);
+    }
+}
+
+void ValidatedGetMultisamplefv(Context *context, GLenum pname, GLuint index, GLfloat *val)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetMultisamplefv);
+    if (ValidateGetMultisamplefv(context, pname, index, val))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetMultisamplefv, context, pname, index, val);
+        context->getMultisamplefv(pname, index, val);
+    }
+}
+
+void ValidatedGetMultisamplefvANGLE(Context *context, GLenum pname, GLuint index, GLfloat *val)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetMultisamplefvANGLE);
+    if (ValidateGetMultisamplefvANGLE(context, pname, index, val))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetMultisamplefvANGLE, context, pname, index, val);
+        context->getMultisamplefv(pname, index, val);
+    }
+}
+
+void ValidatedGetMultisamplefvRobustANGLE(Context *context,
+                                          GLenum pname,
+                                          GLuint index,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLfloat *val)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetMultisamplefvRobustANGLE);
+    if (ValidateGetMultisamplefvRobustANGLE(context, pname, index, bufSize, length, val))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetMultisamplefvRobustANGLE, context, pname, index, bufSize, length,
+                           val);
+        context->getMultisamplefvRobust(pname, index, bufSize, length, val);
+    }
+}
+
+void ValidatedGetObjectLabelKHR(Context *context,
+                                GLenum identifier,
+                                GLuint name,
+                                GLsizei bufSize,
+                                GLsizei *length,
+                                GLchar *label)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetObjectLabelKHR);
+    if (ValidateGetObjectLabelKHR(context, identifier, name, bufSize, length, label))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetObjectLabelKHR, context, identifier, name, bufSize, length, label);
+        context->getObjectLabel(identifier, name, bufSize, length, label);
+    }
+}
+
+void ValidatedGetObjectPtrLabelKHR(Context *context,
+                                   const void *ptr,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLchar *label)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetObjectPtrLabelKHR);
+    if (ValidateGetObjectPtrLabelKHR(context, ptr, bufSize, length, label))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetObjectPtrLabelKHR, context, ptr, bufSize, length, label);
+        context->getObjectPtrLabel(ptr, bufSize, length, label);
+    }
+}
+
+void ValidatedGetPathParameterfvCHROMIUM(Context *context,
+                                         GLuint path,
+                                         GLenum pname,
+                                         GLfloat *value)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetPathParameterfvCHROMIUM);
+    if (ValidateGetPathParameterfvCHROMIUM(context, path, pname, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetPathParameterfvCHROMIUM, context, path, pname, value);
+        context->getPathParameterfv(path, pname, value);
+    }
+}
+
+void ValidatedGetPathParameterivCHROMIUM(Context *context, GLuint path, GLenum pname, GLint *value)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetPathParameterivCHROMIUM);
+    if (ValidateGetPathParameterivCHROMIUM(context, path, pname, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetPathParameterivCHROMIUM, context, path, pname, value);
+        context->getPathParameteriv(path, pname, value);
+    }
+}
+
+void ValidatedGetPointerv(Context *context, GLenum pname, void **params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetPointerv);
+    if (ValidateGetPointerv(context, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetPointerv, context, pname, params);
+        context->getPointerv(pname, params);
+    }
+}
+
+void ValidatedGetPointervKHR(Context *context, GLenum pname, void **params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetPointervKHR);
+    if (ValidateGetPointervKHR(context, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetPointervKHR, context, pname, params);
+        context->getPointerv(pname, params);
+    }
+}
+
+void ValidatedGetPointervRobustANGLERobustANGLE(Context *context,
+                                                GLenum pname,
+                                                GLsizei bufSize,
+                                                GLsizei *length,
+                                                void **params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetPointervRobustANGLERobustANGLE);
+    if (ValidateGetPointervRobustANGLERobustANGLE(context, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetPointervRobustANGLERobustANGLE, context, pname, bufSize, length,
+                           params);
+        context->getPointervRobustANGLERobust(pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetProgramBinary(Context *context,
+                               GLuint program,
+                               GLsizei bufSize,
+                               GLsizei *length,
+                               GLenum *binaryFormat,
+                               void *binary)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramBinary);
+    if (ValidateGetProgramBinary(context, program, bufSize, length, binaryFormat, binary))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramBinary, context, program, bufSize, length, binaryFormat,
+                           binary);
+        context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
+    }
+}
+
+void ValidatedGetProgramBinaryOES(Context *context,
+                                  GLuint program,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLenum *binaryFormat,
+                                  void *binary)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramBinaryOES);
+    if (ValidateGetProgramBinaryOES(context, program, bufSize, length, binaryFormat, binary))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramBinaryOES, context, program, bufSize, length, binaryFormat,
+                           binary);
+        context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
+    }
+}
+
+void ValidatedGetProgramInfoLog(Context *context,
+                                GLuint program,
+                                GLsizei bufSize,
+                                GLsizei *length,
+                                GLchar *infoLog)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramInfoLog);
+    if (ValidateGetProgramInfoLog(context, program, bufSize, length, infoLog))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramInfoLog, context, program, bufSize, length, infoLog);
+        context->getProgramInfoLog(program, bufSize, length, infoLog);
+    }
+}
+
+void ValidatedGetProgramInterfaceiv(Context *context,
+                                    GLuint program,
+                                    GLenum programInterface,
+                                    GLenum pname,
+                                    GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramInterfaceiv);
+    if (ValidateGetProgramInterfaceiv(context, program, programInterface, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramInterfaceiv, context, program, programInterface, pname,
+                           params);
+        context->getProgramInterfaceiv(program, programInterface, pname, params);
+    }
+}
+
+void ValidatedGetProgramInterfaceivRobustANGLE(Context *context,
+                                               GLuint program,
+                                               GLenum programInterface,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramInterfaceivRobustANGLE);
+    if (ValidateGetProgramInterfaceivRobustANGLE(context, program, programInterface, pname, bufSize,
+                                                 length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramInterfaceivRobustANGLE, context, program, programInterface,
+                           pname, bufSize, length, params);
+        context->getProgramInterfaceivRobust(program, programInterface, pname, bufSize, length,
+                                             params);
+    }
+}
+
+void ValidatedGetProgramPipelineInfoLog(Context *context,
+                                        GLuint pipeline,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLchar *infoLog)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramPipelineInfoLog);
+    if (ValidateGetProgramPipelineInfoLog(context, pipeline, bufSize, length, infoLog))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramPipelineInfoLog, context, pipeline, bufSize, length, infoLog);
+        context->getProgramPipelineInfoLog(pipeline, bufSize, length, infoLog);
+    }
+}
+
+void ValidatedGetProgramPipelineiv(Context *context, GLuint pipeline, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramPipelineiv);
+    if (ValidateGetProgramPipelineiv(context, pipeline, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramPipelineiv, context, pipeline, pname, params);
+        context->getProgramPipelineiv(pipeline, pname, params);
+    }
+}
+
+GLuint ValidatedGetProgramResourceIndex(Context *context,
+                                        GLuint program,
+                                        GLenum programInterface,
+                                        const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramResourceIndex);
+    if (ValidateGetProgramResourceIndex(context, program, programInterface, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramResourceIndex, context, program, programInterface, name);
+        return context->getProgramResourceIndex(program, programInterface, name);
+    }
+    return GetDefaultReturnValue<EntryPoint::GetProgramResourceIndex, GLuint>();
+}
+
+GLint ValidatedGetProgramResourceLocation(Context *context,
+                                          GLuint program,
+                                          GLenum programInterface,
+                                          const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramResourceLocation);
+    if (ValidateGetProgramResourceLocation(context, program, programInterface, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramResourceLocation, context, program, programInterface, name);
+        return context->getProgramResourceLocation(program, programInterface, name);
+    }
+    return GetDefaultReturnValue<EntryPoint::GetProgramResourceLocation, GLint>();
+}
+
+GLint ValidatedGetProgramResourceLocationIndexEXT(Context *context,
+                                                  GLuint program,
+                                                  GLenum programInterface,
+                                                  const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramResourceLocationIndexEXT);
+    if (ValidateGetProgramResourceLocationIndexEXT(context, program, programInterface, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramResourceLocationIndexEXT, context, program, programInterface,
+                           name);
+        return context->getProgramResourceLocationIndex(program, programInterface, name);
+    }
+    return GetDefaultReturnValue<EntryPoint::GetProgramResourceLocationIndexEXT, GLint>();
+}
+
+void ValidatedGetProgramResourceName(Context *context,
+                                     GLuint program,
+                                     GLenum programInterface,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramResourceName);
+    if (ValidateGetProgramResourceName(context, program, programInterface, index, bufSize, length,
+                                       name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramResourceName, context, program, programInterface, index,
+                           bufSize, length, name);
+        context->getProgramResourceName(program, programInterface, index, bufSize, length, name);
+    }
+}
+
+void ValidatedGetProgramResourceiv(Context *context,
+                                   GLuint program,
+                                   GLenum programInterface,
+                                   GLuint index,
+                                   GLsizei propCount,
+                                   const GLenum *props,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramResourceiv);
+    if (ValidateGetProgramResourceiv(context, program, programInterface, index, propCount, props,
+                                     bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramResourceiv, context, program, programInterface, index,
+                           propCount, props, bufSize, length, params);
+        context->getProgramResourceiv(program, programInterface, index, propCount, props, bufSize,
+                                      length, params);
+    }
+}
+
+void ValidatedGetProgramiv(Context *context, GLuint program, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramiv);
+    if (ValidateGetProgramiv(context, program, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramiv, context, program, pname, params);
+        context->getProgramiv(program, pname, params);
+    }
+}
+
+void ValidatedGetProgramivRobustANGLE(Context *context,
+                                      GLuint program,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramivRobustANGLE);
+    if (ValidateGetProgramivRobustANGLE(context, program, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetProgramivRobustANGLE, context, program, pname, bufSize, length,
+                           params);
+        context->getProgramivRobust(program, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetQueryObjecti64vEXT(Context *context, GLuint id, GLenum pname, GLint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjecti64vEXT);
+    if (ValidateGetQueryObjecti64vEXT(context, id, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetQueryObjecti64vEXT, context, id, pname, params);
+        context->getQueryObjecti64v(id, pname, params);
+    }
+}
+
+void ValidatedGetQueryObjecti64vRobustANGLE(Context *context,
+                                            GLuint id,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            GLsizei *length,
+                                            GLint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjecti64vRobustANGLE);
+    if (ValidateGetQueryObjecti64vRobustANGLE(context, id, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetQueryObjecti64vRobustANGLE, context, id, pname, bufSize, length,
+                           params);
+        context->getQueryObjecti64vRobust(id, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetQueryObjectivEXT(Context *context, GLuint id, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectivEXT);
+    if (ValidateGetQueryObjectivEXT(context, id, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetQueryObjectivEXT, context, id, pname, params);
+        context->getQueryObjectiv(id, pname, params);
+    }
+}
+
+void ValidatedGetQueryObjectivRobustANGLE(Context *context,
+                                          GLuint id,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectivRobustANGLE);
+    if (ValidateGetQueryObjectivRobustANGLE(context, id, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetQueryObjectivRobustANGLE, context, id, pname, bufSize, length,
+                           params);
+        context->getQueryObjectivRobust(id, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetQueryObjectui64vEXT(Context *context, GLuint id, GLenum pname, GLuint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectui64vEXT);
+    if (ValidateGetQueryObjectui64vEXT(context, id, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetQueryObjectui64vEXT, context, id, pname, params);
+        context->getQueryObjectui64v(id, pname, params);
+    }
+}
+
+void ValidatedGetQueryObjectui64vRobustANGLE(Context *context,
+                                             GLuint id,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLuint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectui64vRobustANGLE);
+    if (ValidateGetQueryObjectui64vRobustANGLE(context, id, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetQueryObjectui64vRobustANGLE, context, id, pname, bufSize, length,
+                           params);
+        context->getQueryObjectui64vRobust(id, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetQueryObjectuiv(Context *context, GLuint id, GLenum pname, GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectuiv);
+    if (ValidateGetQueryObjectuiv(context, id, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetQueryObjectuiv, context, id, pname, params);
+        context->getQueryObjectuiv(id, pname, params);
+    }
+}
+
+void ValidatedGetQueryObjectuivEXT(Context *context, GLuint id, GLenum pname, GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectuivEXT);
+    if (ValidateGetQueryObjectuivEXT(context, id, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetQueryObjectuivEXT, context, id, pname, params);
+        context->getQueryObjectuiv(id, pname, params);
+    }
+}
+
+void ValidatedGetQueryObjectuivRobustANGLE(Context *context,
+                                           GLuint id,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectuivRobustANGLE);
+    if (ValidateGetQueryObjectuivRobustANGLE(context, id, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetQueryObjectuivRobustANGLE, context, id, pname, bufSize, length,
+                           params);
+        context->getQueryObjectuivRobust(id, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetQueryiv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryiv);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    if (ValidateGetQueryiv(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetQueryiv, context, target, pname, params);
+        context->getQueryiv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedGetQueryivEXT(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryivEXT);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    if (ValidateGetQueryivEXT(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetQueryivEXT, context, target, pname, params);
+        context->getQueryiv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedGetQueryivRobustANGLE(Context *context,
+                                    GLenum target,
+                                    GLenum pname,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryivRobustANGLE);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    if (ValidateGetQueryivRobustANGLE(context, targetPacked, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetQueryivRobustANGLE, context, target, pname, bufSize, length, params);
+        context->getQueryivRobust(targetPacked, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetRenderbufferParameteriv(Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetRenderbufferParameteriv);
+    if (ValidateGetRenderbufferParameteriv(context, target, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetRenderbufferParameteriv, context, target, pname, params);
+        context->getRenderbufferParameteriv(target, pname, params);
+    }
+}
+
+void ValidatedGetRenderbufferParameterivOES(Context *context,
+                                            GLenum target,
+                                            GLenum pname,
+                                            GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetRenderbufferParameterivOES);
+    if (ValidateGetRenderbufferParameterivOES(context, target, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetRenderbufferParameterivOES, context, target, pname, params);
+        context->getRenderbufferParameteriv(target, pname, params);
+    }
+}
+
+void ValidatedGetRenderbufferParameterivRobustANGLE(Context *context,
+                                                    GLenum target,
+                                                    GLenum pname,
+                                                    GLsizei bufSize,
+                                                    GLsizei *length,
+                                                    GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetRenderbufferParameterivRobustANGLE);
+    if (ValidateGetRenderbufferParameterivRobustANGLE(context, target, pname, bufSize, length,
+                                                      params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetRenderbufferParameterivRobustANGLE, context, target, pname, bufSize,
+                           length, params);
+        context->getRenderbufferParameterivRobust(target, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetSamplerParameterIivOES(Context *context,
+                                        GLuint sampler,
+                                        GLenum pname,
+                                        GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterIivOES);
+    if (ValidateGetSamplerParameterIivOES(context, sampler, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetSamplerParameterIivOES, context, sampler, pname, params);
+        context->getSamplerParameterIiv(sampler, pname, params);
+    }
+}
+
+void ValidatedGetSamplerParameterIivRobustANGLE(Context *context,
+                                                GLuint sampler,
+                                                GLenum pname,
+                                                GLsizei bufSize,
+                                                GLsizei *length,
+                                                GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterIivRobustANGLE);
+    if (ValidateGetSamplerParameterIivRobustANGLE(context, sampler, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetSamplerParameterIivRobustANGLE, context, sampler, pname, bufSize,
+                           length, params);
+        context->getSamplerParameterIivRobust(sampler, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetSamplerParameterIuivOES(Context *context,
+                                         GLuint sampler,
+                                         GLenum pname,
+                                         GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterIuivOES);
+    if (ValidateGetSamplerParameterIuivOES(context, sampler, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetSamplerParameterIuivOES, context, sampler, pname, params);
+        context->getSamplerParameterIuiv(sampler, pname, params);
+    }
+}
+
+void ValidatedGetSamplerParameterIuivRobustANGLE(Context *context,
+                                                 GLuint sampler,
+                                                 GLenum pname,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterIuivRobustANGLE);
+    if (ValidateGetSamplerParameterIuivRobustANGLE(context, sampler, pname, bufSize, length,
+                                                   params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetSamplerParameterIuivRobustANGLE, context, sampler, pname, bufSize,
+                           length, params);
+        context->getSamplerParameterIuivRobust(sampler, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetSamplerParameterfv(Context *context, GLuint sampler, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterfv);
+    if (ValidateGetSamplerParameterfv(context, sampler, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetSamplerParameterfv, context, sampler, pname, params);
+        context->getSamplerParameterfv(sampler, pname, params);
+    }
+}
+
+void ValidatedGetSamplerParameterfvRobustANGLE(Context *context,
+                                               GLuint sampler,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterfvRobustANGLE);
+    if (ValidateGetSamplerParameterfvRobustANGLE(context, sampler, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetSamplerParameterfvRobustANGLE, context, sampler, pname, bufSize,
+                           length, params);
+        context->getSamplerParameterfvRobust(sampler, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetSamplerParameteriv(Context *context, GLuint sampler, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameteriv);
+    if (ValidateGetSamplerParameteriv(context, sampler, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetSamplerParameteriv, context, sampler, pname, params);
+        context->getSamplerParameteriv(sampler, pname, params);
+    }
+}
+
+void ValidatedGetSamplerParameterivRobustANGLE(Context *context,
+                                               GLuint sampler,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterivRobustANGLE);
+    if (ValidateGetSamplerParameterivRobustANGLE(context, sampler, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetSamplerParameterivRobustANGLE, context, sampler, pname, bufSize,
+                           length, params);
+        context->getSamplerParameterivRobust(sampler, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetSemaphoreParameterui64vEXT(Context *context,
+                                            GLuint semaphore,
+                                            GLenum pname,
+                                            GLuint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSemaphoreParameterui64vEXT);
+    if (ValidateGetSemaphoreParameterui64vEXT(context, semaphore, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetSemaphoreParameterui64vEXT, context, semaphore, pname, params);
+        context->getSemaphoreParameterui64v(semaphore, pname, params);
+    }
+}
+
+void ValidatedGetShaderInfoLog(Context *context,
+                               GLuint shader,
+                               GLsizei bufSize,
+                               GLsizei *length,
+                               GLchar *infoLog)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetShaderInfoLog);
+    if (ValidateGetShaderInfoLog(context, shader, bufSize, length, infoLog))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetShaderInfoLog, context, shader, bufSize, length, infoLog);
+        context->getShaderInfoLog(shader, bufSize, length, infoLog);
+    }
+}
+
+void ValidatedGetShaderPrecisionFormat(Context *context,
+                                       GLenum shadertype,
+                                       GLenum precisiontype,
+                                       GLint *range,
+                                       GLint *precision)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetShaderPrecisionFormat);
+    if (ValidateGetShaderPrecisionFormat(context, shadertype, precisiontype, range, precision))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetShaderPrecisionFormat, context, shadertype, precisiontype, range,
+                           precision);
+        context->getShaderPrecisionFormat(shadertype, precisiontype, range, precision);
+    }
+}
+
+void ValidatedGetShaderSource(Context *context,
+                              GLuint shader,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *source)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetShaderSource);
+    if (ValidateGetShaderSource(context, shader, bufSize, length, source))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetShaderSource, context, shader, bufSize, length, source);
+        context->getShaderSource(shader, bufSize, length, source);
+    }
+}
+
+void ValidatedGetShaderiv(Context *context, GLuint shader, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetShaderiv);
+    if (ValidateGetShaderiv(context, shader, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetShaderiv, context, shader, pname, params);
+        context->getShaderiv(shader, pname, params);
+    }
+}
+
+void ValidatedGetShaderivRobustANGLE(Context *context,
+                                     GLuint shader,
+                                     GLenum pname,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetShaderivRobustANGLE);
+    if (ValidateGetShaderivRobustANGLE(context, shader, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetShaderivRobustANGLE, context, shader, pname, bufSize, length, params);
+        context->getShaderivRobust(shader, pname, bufSize, length, params);
+    }
+}
+
+const GLubyte *ValidatedGetString(Context *context, GLenum name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetString);
+    if (ValidateGetString(context, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetString, context, name);
+        return context->getString(name);
+    }
+    return GetDefaultReturnValue<EntryPoint::GetString, const GLubyte *>();
+}
+
+const GLubyte *ValidatedGetStringi(Context *context, GLenum name, GLuint index)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetStringi);
+    if (ValidateGetStringi(context, name, index))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetStringi, context, name, index);
+        return context->getStringi(name, index);
+    }
+    return GetDefaultReturnValue<EntryPoint::GetStringi, const GLubyte *>();
+}
+
+void ValidatedGetSynciv(Context *context,
+                        GLsync sync,
+                        GLenum pname,
+                        GLsizei bufSize,
+                        GLsizei *length,
+                        GLint *values)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSynciv);
+    if (ValidateGetSynciv(context, sync, pname, bufSize, length, values))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetSynciv, context, sync, pname, bufSize, length, values);
+        context->getSynciv(sync, pname, bufSize, length, values);
+    }
+}
+
+void ValidatedGetTexEnvfv(Context *context, GLenum target, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexEnvfv);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    if (ValidateGetTexEnvfv(context, targetPacked, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexEnvfv, context, target, pname, params);
+        context->getTexEnvfv(targetPacked, pnamePacked, params);
+    }
+}
+
+void ValidatedGetTexEnviv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexEnviv);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    if (ValidateGetTexEnviv(context, targetPacked, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexEnviv, context, target, pname, params);
+        context->getTexEnviv(targetPacked, pnamePacked, params);
+    }
+}
+
+void ValidatedGetTexEnvxv(Context *context, GLenum target, GLenum pname, GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexEnvxv);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    if (ValidateGetTexEnvxv(context, targetPacked, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexEnvxv, context, target, pname, params);
+        context->getTexEnvxv(targetPacked, pnamePacked, params);
+    }
+}
+
+void ValidatedGetTexGenfvOES(Context *context, GLenum coord, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexGenfvOES);
+    if (ValidateGetTexGenfvOES(context, coord, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexGenfvOES, context, coord, pname, params);
+        context->getTexGenfv(coord, pname, params);
+    }
+}
+
+void ValidatedGetTexGenivOES(Context *context, GLenum coord, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexGenivOES);
+    if (ValidateGetTexGenivOES(context, coord, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexGenivOES, context, coord, pname, params);
+        context->getTexGeniv(coord, pname, params);
+    }
+}
+
+void ValidatedGetTexGenxvOES(Context *context, GLenum coord, GLenum pname, GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexGenxvOES);
+    if (ValidateGetTexGenxvOES(context, coord, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexGenxvOES, context, coord, pname, params);
+        context->getTexGenxv(coord, pname, params);
+    }
+}
+
+void ValidatedGetTexLevelParameterfv(Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLenum pname,
+                                     GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexLevelParameterfv);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateGetTexLevelParameterfv(context, targetPacked, level, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexLevelParameterfv, context, target, level, pname, params);
+        context->getTexLevelParameterfv(targetPacked, level, pname, params);
+    }
+}
+
+void ValidatedGetTexLevelParameterfvANGLE(Context *context,
+                                          GLenum target,
+                                          GLint level,
+                                          GLenum pname,
+                                          GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexLevelParameterfvANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateGetTexLevelParameterfvANGLE(context, targetPacked, level, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexLevelParameterfvANGLE, context, target, level, pname, params);
+        context->getTexLevelParameterfv(targetPacked, level, pname, params);
+    }
+}
+
+void ValidatedGetTexLevelParameterfvRobustANGLE(Context *context,
+                                                GLenum target,
+                                                GLint level,
+                                                GLenum pname,
+                                                GLsizei bufSize,
+                                                GLsizei *length,
+                                                GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexLevelParameterfvRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateGetTexLevelParameterfvRobustANGLE(context, targetPacked, level, pname, bufSize,
+                                                  length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexLevelParameterfvRobustANGLE, context, target, level, pname,
+                           bufSize, length, params);
+        context->getTexLevelParameterfvRobust(targetPacked, level, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetTexLevelParameteriv(Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLenum pname,
+                                     GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexLevelParameteriv);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateGetTexLevelParameteriv(context, targetPacked, level, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexLevelParameteriv, context, target, level, pname, params);
+        context->getTexLevelParameteriv(targetPacked, level, pname, params);
+    }
+}
+
+void ValidatedGetTexLevelParameterivANGLE(Context *context,
+                                          GLenum target,
+                                          GLint level,
+                                          GLenum pname,
+                                          GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexLevelParameterivANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateGetTexLevelParameterivANGLE(context, targetPacked, level, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexLevelParameterivANGLE, context, target, level, pname, params);
+        context->getTexLevelParameteriv(targetPacked, level, pname, params);
+    }
+}
+
+void ValidatedGetTexLevelParameterivRobustANGLE(Context *context,
+                                                GLenum target,
+                                                GLint level,
+                                                GLenum pname,
+                                                GLsizei bufSize,
+                                                GLsizei *length,
+                                                GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexLevelParameterivRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateGetTexLevelParameterivRobustANGLE(context, targetPacked, level, pname, bufSize,
+                                                  length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexLevelParameterivRobustANGLE, context, target, level, pname,
+                           bufSize, length, params);
+        context->getTexLevelParameterivRobust(targetPacked, level, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetTexParameterIivOES(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterIivOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateGetTexParameterIivOES(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexParameterIivOES, context, target, pname, params);
+        context->getTexParameterIiv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedGetTexParameterIivRobustANGLE(Context *context,
+                                            GLenum target,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            GLsizei *length,
+                                            GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterIivRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateGetTexParameterIivRobustANGLE(context, targetPacked, pname, bufSize, length,
+                                              params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexParameterIivRobustANGLE, context, target, pname, bufSize, length,
+                           params);
+        context->getTexParameterIivRobust(targetPacked, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetTexParameterIuivOES(Context *context, GLenum target, GLenum pname, GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterIuivOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateGetTexParameterIuivOES(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexParameterIuivOES, context, target, pname, params);
+        context->getTexParameterIuiv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedGetTexParameterIuivRobustANGLE(Context *context,
+                                             GLenum target,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterIuivRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateGetTexParameterIuivRobustANGLE(context, targetPacked, pname, bufSize, length,
+                                               params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexParameterIuivRobustANGLE, context, target, pname, bufSize, length,
+                           params);
+        context->getTexParameterIuivRobust(targetPacked, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetTexParameterfv(Context *context, GLenum target, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterfv);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateGetTexParameterfv(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexParameterfv, context, target, pname, params);
+        context->getTexParameterfv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedGetTexParameterfvRobustANGLE(Context *context,
+                                           GLenum target,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterfvRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateGetTexParameterfvRobustANGLE(context, targetPacked, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexParameterfvRobustANGLE, context, target, pname, bufSize, length,
+                           params);
+        context->getTexParameterfvRobust(targetPacked, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetTexParameteriv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameteriv);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateGetTexParameteriv(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexParameteriv, context, target, pname, params);
+        context->getTexParameteriv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedGetTexParameterivRobustANGLE(Context *context,
+                                           GLenum target,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterivRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateGetTexParameterivRobustANGLE(context, targetPacked, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexParameterivRobustANGLE, context, target, pname, bufSize, length,
+                           params);
+        context->getTexParameterivRobust(targetPacked, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetTexParameterxv(Context *context, GLenum target, GLenum pname, GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterxv);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateGetTexParameterxv(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTexParameterxv, context, target, pname, params);
+        context->getTexParameterxv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedGetTransformFeedbackVarying(Context *context,
+                                          GLuint program,
+                                          GLuint index,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLsizei *size,
+                                          GLenum *type,
+                                          GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTransformFeedbackVarying);
+    if (ValidateGetTransformFeedbackVarying(context, program, index, bufSize, length, size, type,
+                                            name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTransformFeedbackVarying, context, program, index, bufSize, length,
+                           size, type, name);
+        context->getTransformFeedbackVarying(program, index, bufSize, length, size, type, name);
+    }
+}
+
+void ValidatedGetTranslatedShaderSourceANGLE(Context *context,
+                                             GLuint shader,
+                                             GLsizei bufsize,
+                                             GLsizei *length,
+                                             GLchar *source)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTranslatedShaderSourceANGLE);
+    if (ValidateGetTranslatedShaderSourceANGLE(context, shader, bufsize, length, source))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetTranslatedShaderSourceANGLE, context, shader, bufsize, length,
+                           source);
+        context->getTranslatedShaderSource(shader, bufsize, length, source);
+    }
+}
+
+GLuint ValidatedGetUniformBlockIndex(Context *context,
+                                     GLuint program,
+                                     const GLchar *uniformBlockName)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformBlockIndex);
+    if (ValidateGetUniformBlockIndex(context, program, uniformBlockName))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetUniformBlockIndex, context, program, uniformBlockName);
+        return context->getUniformBlockIndex(program, uniformBlockName);
+    }
+    return GetDefaultReturnValue<EntryPoint::GetUniformBlockIndex, GLuint>();
+}
+
+void ValidatedGetUniformIndices(Context *context,
+                                GLuint program,
+                                GLsizei uniformCount,
+                                const GLchar *const *uniformNames,
+                                GLuint *uniformIndices)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformIndices);
+    if (ValidateGetUniformIndices(context, program, uniformCount, uniformNames, uniformIndices))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetUniformIndices, context, program, uniformCount, uniformNames,
+                           uniformIndices);
+        context->getUniformIndices(program, uniformCount, uniformNames, uniformIndices);
+    }
+}
+
+GLint ValidatedGetUniformLocation(Context *context, GLuint program, const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformLocation);
+    if (ValidateGetUniformLocation(context, program, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetUniformLocation, context, program, name);
+        return context->getUniformLocation(program, name);
+    }
+    return GetDefaultReturnValue<EntryPoint::GetUniformLocation, GLint>();
+}
+
+void ValidatedGetUniformfv(Context *context, GLuint program, GLint location, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformfv);
+    if (ValidateGetUniformfv(context, program, location, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetUniformfv, context, program, location, params);
+        context->getUniformfv(program, location, params);
+    }
+}
+
+void ValidatedGetUniformfvRobustANGLE(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformfvRobustANGLE);
+    if (ValidateGetUniformfvRobustANGLE(context, program, location, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetUniformfvRobustANGLE, context, program, location, bufSize, length,
+                           params);
+        context->getUniformfvRobust(program, location, bufSize, length, params);
+    }
+}
+
+void ValidatedGetUniformiv(Context *context, GLuint program, GLint location, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformiv);
+    if (ValidateGetUniformiv(context, program, location, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetUniformiv, context, program, location, params);
+        context->getUniformiv(program, location, params);
+    }
+}
+
+void ValidatedGetUniformivRobustANGLE(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformivRobustANGLE);
+    if (ValidateGetUniformivRobustANGLE(context, program, location, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetUniformivRobustANGLE, context, program, location, bufSize, length,
+                           params);
+        context->getUniformivRobust(program, location, bufSize, length, params);
+    }
+}
+
+void ValidatedGetUniformuiv(Context *context, GLuint program, GLint location, GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformuiv);
+    if (ValidateGetUniformuiv(context, program, location, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetUniformuiv, context, program, location, params);
+        context->getUniformuiv(program, location, params);
+    }
+}
+
+void ValidatedGetUniformuivRobustANGLE(Context *context,
+                                       GLuint program,
+                                       GLint location,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformuivRobustANGLE);
+    if (ValidateGetUniformuivRobustANGLE(context, program, location, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetUniformuivRobustANGLE, context, program, location, bufSize, length,
+                           params);
+        context->getUniformuivRobust(program, location, bufSize, length, params);
+    }
+}
+
+void ValidatedGetUnsignedBytei_vEXT(Context *context, GLenum target, GLuint index, GLubyte *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUnsignedBytei_vEXT);
+    if (ValidateGetUnsignedBytei_vEXT(context, target, index, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetUnsignedBytei_vEXT, context, target, index, data);
+        context->getUnsignedBytei_v(target, index, data);
+    }
+}
+
+void ValidatedGetUnsignedBytevEXT(Context *context, GLenum pname, GLubyte *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUnsignedBytevEXT);
+    if (ValidateGetUnsignedBytevEXT(context, pname, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetUnsignedBytevEXT, context, pname, data);
+        context->getUnsignedBytev(pname, data);
+    }
+}
+
+void ValidatedGetVertexAttribIiv(Context *context, GLuint index, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribIiv);
+    if (ValidateGetVertexAttribIiv(context, index, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetVertexAttribIiv, context, index, pname, params);
+        context->getVertexAttribIiv(index, pname, params);
+    }
+}
+
+void ValidatedGetVertexAttribIivRobustANGLE(Context *context,
+                                            GLuint index,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            GLsizei *length,
+                                            GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribIivRobustANGLE);
+    if (ValidateGetVertexAttribIivRobustANGLE(context, index, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetVertexAttribIivRobustANGLE, context, index, pname, bufSize, length,
+                           params);
+        context->getVertexAttribIivRobust(index, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetVertexAttribIuiv(Context *context, GLuint index, GLenum pname, GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribIuiv);
+    if (ValidateGetVertexAttribIuiv(context, index, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetVertexAttribIuiv, context, index, pname, params);
+        context->getVertexAttribIuiv(index, pname, params);
+    }
+}
+
+void ValidatedGetVertexAttribIuivRobustANGLE(Context *context,
+                                             GLuint index,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribIuivRobustANGLE);
+    if (ValidateGetVertexAttribIuivRobustANGLE(context, index, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetVertexAttribIuivRobustANGLE, context, index, pname, bufSize, length,
+                           params);
+        context->getVertexAttribIuivRobust(index, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetVertexAttribPointerv(Context *context, GLuint index, GLenum pname, void **pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribPointerv);
+    if (ValidateGetVertexAttribPointerv(context, index, pname, pointer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetVertexAttribPointerv, context, index, pname, pointer);
+        context->getVertexAttribPointerv(index, pname, pointer);
+    }
+}
+
+void ValidatedGetVertexAttribPointervRobustANGLE(Context *context,
+                                                 GLuint index,
+                                                 GLenum pname,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 void **pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribPointervRobustANGLE);
+    if (ValidateGetVertexAttribPointervRobustANGLE(context, index, pname, bufSize, length, pointer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetVertexAttribPointervRobustANGLE, context, index, pname, bufSize,
+                           length, pointer);
+        context->getVertexAttribPointervRobust(index, pname, bufSize, length, pointer);
+    }
+}
+
+void ValidatedGetVertexAttribfv(Context *context, GLuint index, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribfv);
+    if (ValidateGetVertexAttribfv(context, index, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetVertexAttribfv, context, index, pname, params);
+        context->getVertexAttribfv(index, pname, params);
+    }
+}
+
+void ValidatedGetVertexAttribfvRobustANGLE(Context *context,
+                                           GLuint index,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribfvRobustANGLE);
+    if (ValidateGetVertexAttribfvRobustANGLE(context, index, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetVertexAttribfvRobustANGLE, context, index, pname, bufSize, length,
+                           params);
+        context->getVertexAttribfvRobust(index, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetVertexAttribiv(Context *context, GLuint index, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribiv);
+    if (ValidateGetVertexAttribiv(context, index, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetVertexAttribiv, context, index, pname, params);
+        context->getVertexAttribiv(index, pname, params);
+    }
+}
+
+void ValidatedGetVertexAttribivRobustANGLE(Context *context,
+                                           GLuint index,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribivRobustANGLE);
+    if (ValidateGetVertexAttribivRobustANGLE(context, index, pname, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetVertexAttribivRobustANGLE, context, index, pname, bufSize, length,
+                           params);
+        context->getVertexAttribivRobust(index, pname, bufSize, length, params);
+    }
+}
+
+void ValidatedGetnUniformfvEXT(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei bufSize,
+                               GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetnUniformfvEXT);
+    if (ValidateGetnUniformfvEXT(context, program, location, bufSize, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetnUniformfvEXT, context, program, location, bufSize, params);
+        context->getnUniformfv(program, location, bufSize, params);
+    }
+}
+
+void ValidatedGetnUniformfvRobustANGLE(Context *context,
+                                       GLuint program,
+                                       GLint location,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetnUniformfvRobustANGLE);
+    if (ValidateGetnUniformfvRobustANGLE(context, program, location, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetnUniformfvRobustANGLE, context, program, location, bufSize, length,
+                           params);
+        context->getnUniformfvRobust(program, location, bufSize, length, params);
+    }
+}
+
+void ValidatedGetnUniformivEXT(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei bufSize,
+                               GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetnUniformivEXT);
+    if (ValidateGetnUniformivEXT(context, program, location, bufSize, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetnUniformivEXT, context, program, location, bufSize, params);
+        context->getnUniformiv(program, location, bufSize, params);
+    }
+}
+
+void ValidatedGetnUniformivRobustANGLE(Context *context,
+                                       GLuint program,
+                                       GLint location,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetnUniformivRobustANGLE);
+    if (ValidateGetnUniformivRobustANGLE(context, program, location, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetnUniformivRobustANGLE, context, program, location, bufSize, length,
+                           params);
+        context->getnUniformivRobust(program, location, bufSize, length, params);
+    }
+}
+
+void ValidatedGetnUniformuivRobustANGLE(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetnUniformuivRobustANGLE);
+    if (ValidateGetnUniformuivRobustANGLE(context, program, location, bufSize, length, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(GetnUniformuivRobustANGLE, context, program, location, bufSize, length,
+                           params);
+        context->getnUniformuivRobust(program, location, bufSize, length, params);
+    }
+}
+
+void ValidatedHint(Context *context, GLenum target, GLenum mode)
+{
+    ANGLE_DEFER_COMMAND(Hint, context, target, mode);
+    ANGLE_PROFILE_ENTRY_POINT(Hint);
+    if (ValidateHint(context, target, mode))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Hint, context, target, mode);
+        context->hint(target, mode);
+    }
+}
+
+void ValidatedImportMemoryFdEXT(Context *context,
+                                GLuint memory,
+                                GLuint64 size,
+                                GLenum handleType,
+                                GLint fd)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ImportMemoryFdEXT);
+    HandleType handleTypePacked = FromGLenum<HandleType>(handleType);
+    if (ValidateImportMemoryFdEXT(context, memory, size, handleTypePacked, fd))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ImportMemoryFdEXT, context, memory, size, handleType, fd);
+        context->importMemoryFd(memory, size, handleTypePacked, fd);
+    }
+}
+
+void ValidatedImportSemaphoreFdEXT(Context *context, GLuint semaphore, GLenum handleType, GLint fd)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ImportSemaphoreFdEXT);
+    HandleType handleTypePacked = FromGLenum<HandleType>(handleType);
+    if (ValidateImportSemaphoreFdEXT(context, semaphore, handleTypePacked, fd))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ImportSemaphoreFdEXT, context, semaphore, handleType, fd);
+        context->importSemaphoreFd(semaphore, handleTypePacked, fd);
+    }
+}
+
+void ValidatedInsertEventMarkerEXT(Context *context, GLsizei length, const GLchar *marker)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(InsertEventMarkerEXT);
+    if (ValidateInsertEventMarkerEXT(context, length, marker))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(InsertEventMarkerEXT, context, length, marker);
+        context->insertEventMarker(length, marker);
+    }
+}
+
+void ValidatedInvalidateFramebuffer(Context *context,
+                                    GLenum target,
+                                    GLsizei numAttachments,
+                                    const GLenum *attachments)
+{
+    ANGLE_DEFER_COMMAND(InvalidateFramebuffer, context, target, numAttachments, attachments);
+    ANGLE_PROFILE_ENTRY_POINT(InvalidateFramebuffer);
+    if (ValidateInvalidateFramebuffer(context, target, numAttachments, attachments))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(InvalidateFramebuffer, context, target, numAttachments, attachments);
+        context->invalidateFramebuffer(target, numAttachments, attachments);
+    }
+}
+
+void ValidatedInvalidateSubFramebuffer(Context *context,
+                                       GLenum target,
+                                       GLsizei numAttachments,
+                                       const GLenum *attachments,
+                                       GLint x,
+                                       GLint y,
+                                       GLsizei width,
+                                       GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(InvalidateSubFramebuffer, context, target, numAttachments, attachments, x,
+                        y, width, height);
+    ANGLE_PROFILE_ENTRY_POINT(InvalidateSubFramebuffer);
+    if (ValidateInvalidateSubFramebuffer(context, target, numAttachments, attachments, x, y, width,
+                                         height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(InvalidateSubFramebuffer, context, target, numAttachments, attachments,
+                           x, y, width, height);
+        context->invalidateSubFramebuffer(target, numAttachments, attachments, x, y, width, height);
+    }
+}
+
+GLboolean ValidatedIsBuffer(Context *context, GLuint buffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsBuffer);
+    if (ValidateIsBuffer(context, buffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsBuffer, context, buffer);
+        return context->isBuffer(buffer);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsBuffer, GLboolean>();
+}
+
+GLboolean ValidatedIsEnabled(Context *context, GLenum cap)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsEnabled);
+    if (ValidateIsEnabled(context, cap))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsEnabled, context, cap);
+        return context->isEnabled(cap);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsEnabled, GLboolean>();
+}
+
+GLboolean ValidatedIsFenceNV(Context *context, GLuint fence)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsFenceNV);
+    if (ValidateIsFenceNV(context, fence))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsFenceNV, context, fence);
+        return context->isFenceNV(fence);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsFenceNV, GLboolean>();
+}
+
+GLboolean ValidatedIsFramebuffer(Context *context, GLuint framebuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsFramebuffer);
+    if (ValidateIsFramebuffer(context, framebuffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsFramebuffer, context, framebuffer);
+        return context->isFramebuffer(framebuffer);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsFramebuffer, GLboolean>();
+}
+
+GLboolean ValidatedIsFramebufferOES(Context *context, GLuint framebuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsFramebufferOES);
+    if (ValidateIsFramebufferOES(context, framebuffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsFramebufferOES, context, framebuffer);
+        return context->isFramebuffer(framebuffer);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsFramebufferOES, GLboolean>();
+}
+
+GLboolean ValidatedIsMemoryObjectEXT(Context *context, GLuint memoryObject)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsMemoryObjectEXT);
+    if (ValidateIsMemoryObjectEXT(context, memoryObject))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsMemoryObjectEXT, context, memoryObject);
+        return context->isMemoryObject(memoryObject);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsMemoryObjectEXT, GLboolean>();
+}
+
+GLboolean ValidatedIsPathCHROMIUM(Context *context, GLuint path)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsPathCHROMIUM);
+    if (ValidateIsPathCHROMIUM(context, path))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsPathCHROMIUM, context, path);
+        return context->isPath(path);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsPathCHROMIUM, GLboolean>();
+}
+
+GLboolean ValidatedIsProgram(Context *context, GLuint program)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsProgram);
+    if (ValidateIsProgram(context, program))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsProgram, context, program);
+        return context->isProgram(program);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsProgram, GLboolean>();
+}
+
+GLboolean ValidatedIsProgramPipeline(Context *context, GLuint pipeline)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsProgramPipeline);
+    if (ValidateIsProgramPipeline(context, pipeline))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsProgramPipeline, context, pipeline);
+        return context->isProgramPipeline(pipeline);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsProgramPipeline, GLboolean>();
+}
+
+GLboolean ValidatedIsQuery(Context *context, GLuint id)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsQuery);
+    if (ValidateIsQuery(context, id))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsQuery, context, id);
+        return context->isQuery(id);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsQuery, GLboolean>();
+}
+
+GLboolean ValidatedIsQueryEXT(Context *context, GLuint id)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsQueryEXT);
+    if (ValidateIsQueryEXT(context, id))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsQueryEXT, context, id);
+        return context->isQuery(id);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsQueryEXT, GLboolean>();
+}
+
+GLboolean ValidatedIsRenderbuffer(Context *context, GLuint renderbuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsRenderbuffer);
+    if (ValidateIsRenderbuffer(context, renderbuffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsRenderbuffer, context, renderbuffer);
+        return context->isRenderbuffer(renderbuffer);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsRenderbuffer, GLboolean>();
+}
+
+GLboolean ValidatedIsRenderbufferOES(Context *context, GLuint renderbuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsRenderbufferOES);
+    if (ValidateIsRenderbufferOES(context, renderbuffer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsRenderbufferOES, context, renderbuffer);
+        return context->isRenderbuffer(renderbuffer);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsRenderbufferOES, GLboolean>();
+}
+
+GLboolean ValidatedIsSampler(Context *context, GLuint sampler)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsSampler);
+    if (ValidateIsSampler(context, sampler))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsSampler, context, sampler);
+        return context->isSampler(sampler);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsSampler, GLboolean>();
+}
+
+GLboolean ValidatedIsSemaphoreEXT(Context *context, GLuint semaphore)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsSemaphoreEXT);
+    if (ValidateIsSemaphoreEXT(context, semaphore))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsSemaphoreEXT, context, semaphore);
+        return context->isSemaphore(semaphore);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsSemaphoreEXT, GLboolean>();
+}
+
+GLboolean ValidatedIsShader(Context *context, GLuint shader)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsShader);
+    if (ValidateIsShader(context, shader))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsShader, context, shader);
+        return context->isShader(shader);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsShader, GLboolean>();
+}
+
+GLboolean ValidatedIsSync(Context *context, GLsync sync)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsSync);
+    if (ValidateIsSync(context, sync))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsSync, context, sync);
+        return context->isSync(sync);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsSync, GLboolean>();
+}
+
+GLboolean ValidatedIsTexture(Context *context, GLuint texture)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsTexture);
+    if (ValidateIsTexture(context, texture))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsTexture, context, texture);
+        return context->isTexture(texture);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsTexture, GLboolean>();
+}
+
+GLboolean ValidatedIsTransformFeedback(Context *context, GLuint id)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsTransformFeedback);
+    if (ValidateIsTransformFeedback(context, id))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsTransformFeedback, context, id);
+        return context->isTransformFeedback(id);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsTransformFeedback, GLboolean>();
+}
+
+GLboolean ValidatedIsVertexArray(Context *context, GLuint array)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsVertexArray);
+    if (ValidateIsVertexArray(context, array))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsVertexArray, context, array);
+        return context->isVertexArray(array);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsVertexArray, GLboolean>();
+}
+
+GLboolean ValidatedIsVertexArrayOES(Context *context, GLuint array)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsVertexArrayOES);
+    if (ValidateIsVertexArrayOES(context, array))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(IsVertexArrayOES, context, array);
+        return context->isVertexArray(array);
+    }
+    return GetDefaultReturnValue<EntryPoint::IsVertexArrayOES, GLboolean>();
+}
+
+void ValidatedLightModelf(Context *context, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LightModelf);
+    if (ValidateLightModelf(context, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LightModelf, context, pname, param);
+        context->lightModelf(pname, param);
+    }
+}
+
+void ValidatedLightModelfv(Context *context, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LightModelfv);
+    if (ValidateLightModelfv(context, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LightModelfv, context, pname, params);
+        context->lightModelfv(pname, params);
+    }
+}
+
+void ValidatedLightModelx(Context *context, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LightModelx);
+    if (ValidateLightModelx(context, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LightModelx, context, pname, param);
+        context->lightModelx(pname, param);
+    }
+}
+
+void ValidatedLightModelxv(Context *context, GLenum pname, const GLfixed *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LightModelxv);
+    if (ValidateLightModelxv(context, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LightModelxv, context, pname, param);
+        context->lightModelxv(pname, param);
+    }
+}
+
+void ValidatedLightf(Context *context, GLenum light, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Lightf);
+    LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+    if (ValidateLightf(context, light, pnamePacked, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Lightf, context, light, pname, param);
+        context->lightf(light, pnamePacked, param);
+    }
+}
+
+void ValidatedLightfv(Context *context, GLenum light, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Lightfv);
+    LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+    if (ValidateLightfv(context, light, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Lightfv, context, light, pname, params);
+        context->lightfv(light, pnamePacked, params);
+    }
+}
+
+void ValidatedLightx(Context *context, GLenum light, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Lightx);
+    LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+    if (ValidateLightx(context, light, pnamePacked, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Lightx, context, light, pname, param);
+        context->lightx(light, pnamePacked, param);
+    }
+}
+
+void ValidatedLightxv(Context *context, GLenum light, GLenum pname, const GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Lightxv);
+    LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+    if (ValidateLightxv(context, light, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Lightxv, context, light, pname, params);
+        context->lightxv(light, pnamePacked, params);
+    }
+}
+
+void ValidatedLineWidth(Context *context, GLfloat width)
+{
+    ANGLE_DEFER_COMMAND(LineWidth, context, width);
+    ANGLE_PROFILE_ENTRY_POINT(LineWidth);
+    if (ValidateLineWidth(context, width))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LineWidth, context, width);
+        context->lineWidth(width);
+    }
+}
+
+void ValidatedLineWidthx(Context *context, GLfixed width)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LineWidthx);
+    if (ValidateLineWidthx(context, width))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LineWidthx, context, width);
+        context->lineWidthx(width);
+    }
+}
+
+void ValidatedLinkProgram(Context *context, GLuint program)
+{
+    ANGLE_DEFER_COMMAND(LinkProgram, context, program);
+    ANGLE_PROFILE_ENTRY_POINT(LinkProgram);
+    if (ValidateLinkProgram(context, program))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LinkProgram, context, program);
+        context->linkProgram(program);
+    }
+}
+
+void ValidatedLoadIdentity(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(LoadIdentity);
+    if (ValidateLoadIdentity(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LoadIdentity, context);
+        context->loadIdentity();
+    }
+}
+
+void ValidatedLoadMatrixf(Context *context, const GLfloat *m)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(LoadMatrixf);
+    if (ValidateLoadMatrixf(context, m))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LoadMatrixf, context, m);
+        context->loadMatrixf(m);
+    }
+}
+
+void ValidatedLoadMatrixx(Context *context, const GLfixed *m)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LoadMatrixx);
+    if (ValidateLoadMatrixx(context, m))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LoadMatrixx, context, m);
+        context->loadMatrixx(m);
+    }
+}
+
+void ValidatedLoadPaletteFromModelViewMatrixOES(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LoadPaletteFromModelViewMatrixOES);
+    if (ValidateLoadPaletteFromModelViewMatrixOES(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LoadPaletteFromModelViewMatrixOES, context);
+        context->loadPaletteFromModelViewMatrix();
+    }
+}
+
+void ValidatedLogicOp(Context *context, GLenum opcode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LogicOp);
+    LogicalOperation opcodePacked = FromGLenum<LogicalOperation>(opcode);
+    if (ValidateLogicOp(context, opcodePacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LogicOp, context, opcode);
+        context->logicOp(opcodePacked);
+    }
+}
+
+void ValidatedLoseContextCHROMIUM(Context *context, GLenum current, GLenum other)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LoseContextCHROMIUM);
+    GraphicsResetStatus currentPacked = FromGLenum<GraphicsResetStatus>(current);
+    GraphicsResetStatus otherPacked   = FromGLenum<GraphicsResetStatus>(other);
+    if (ValidateLoseContextCHROMIUM(context, currentPacked, otherPacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(LoseContextCHROMIUM, context, current, other);
+        context->loseContext(currentPacked, otherPacked);
+    }
+}
+
+void *ValidatedMapBufferOES(Context *context, GLenum target, GLenum access)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MapBufferOES);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateMapBufferOES(context, targetPacked, access))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MapBufferOES, context, target, access);
+        return context->mapBuffer(targetPacked, access);
+    }
+    return GetDefaultReturnValue<EntryPoint::MapBufferOES, void *>();
+}
+
+void *ValidatedMapBufferRange(Context *context,
+                              GLenum target,
+                              GLintptr offset,
+                              GLsizeiptr length,
+                              GLbitfield access)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MapBufferRange);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateMapBufferRange(context, targetPacked, offset, length, access))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MapBufferRange, context, target, offset, length, access);
+        return context->mapBufferRange(targetPacked, offset, length, access);
+    }
+    return GetDefaultReturnValue<EntryPoint::MapBufferRange, void *>();
+}
+
+void *ValidatedMapBufferRangeEXT(Context *context,
+                                 GLenum target,
+                                 GLintptr offset,
+                                 GLsizeiptr length,
+                                 GLbitfield access)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MapBufferRangeEXT);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateMapBufferRangeEXT(context, targetPacked, offset, length, access))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MapBufferRangeEXT, context, target, offset, length, access);
+        return context->mapBufferRange(targetPacked, offset, length, access);
+    }
+    return GetDefaultReturnValue<EntryPoint::MapBufferRangeEXT, void *>();
+}
+
+void ValidatedMaterialf(Context *context, GLenum face, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Materialf);
+    MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+    if (ValidateMaterialf(context, face, pnamePacked, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Materialf, context, face, pname, param);
+        context->materialf(face, pnamePacked, param);
+    }
+}
+
+void ValidatedMaterialfv(Context *context, GLenum face, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Materialfv);
+    MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+    if (ValidateMaterialfv(context, face, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Materialfv, context, face, pname, params);
+        context->materialfv(face, pnamePacked, params);
+    }
+}
+
+void ValidatedMaterialx(Context *context, GLenum face, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Materialx);
+    MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+    if (ValidateMaterialx(context, face, pnamePacked, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Materialx, context, face, pname, param);
+        context->materialx(face, pnamePacked, param);
+    }
+}
+
+void ValidatedMaterialxv(Context *context, GLenum face, GLenum pname, const GLfixed *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Materialxv);
+    MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+    if (ValidateMaterialxv(context, face, pnamePacked, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Materialxv, context, face, pname, param);
+        context->materialxv(face, pnamePacked, param);
+    }
+}
+
+void ValidatedMatrixIndexPointerOES(Context *context,
+                                    GLint size,
+                                    GLenum type,
+                                    GLsizei stride,
+                                    const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MatrixIndexPointerOES);
+    if (ValidateMatrixIndexPointerOES(context, size, type, stride, pointer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MatrixIndexPointerOES, context, size, type, stride, pointer);
+        context->matrixIndexPointer(size, type, stride, pointer);
+    }
+}
+
+void ValidatedMatrixLoadIdentityCHROMIUM(Context *context, GLenum matrixMode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MatrixLoadIdentityCHROMIUM);
+    if (ValidateMatrixLoadIdentityCHROMIUM(context, matrixMode))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MatrixLoadIdentityCHROMIUM, context, matrixMode);
+        context->matrixLoadIdentity(matrixMode);
+    }
+}
+
+void ValidatedMatrixLoadfCHROMIUM(Context *context, GLenum matrixMode, const GLfloat *matrix)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MatrixLoadfCHROMIUM);
+    if (ValidateMatrixLoadfCHROMIUM(context, matrixMode, matrix))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MatrixLoadfCHROMIUM, context, matrixMode, matrix);
+        context->matrixLoadf(matrixMode, matrix);
+    }
+}
+
+void ValidatedMatrixMode(Context *context, GLenum mode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(MatrixMode);
+    MatrixType modePacked = FromGLenum<MatrixType>(mode);
+    if (ValidateMatrixMode(context, modePacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MatrixMode, context, mode);
+        context->matrixMode(modePacked);
+    }
+}
+
+void ValidatedMaxShaderCompilerThreadsKHR(Context *context, GLuint count)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MaxShaderCompilerThreadsKHR);
+    if (ValidateMaxShaderCompilerThreadsKHR(context, count))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MaxShaderCompilerThreadsKHR, context, count);
+        context->maxShaderCompilerThreads(count);
+    }
+}
+
+void ValidatedMemoryBarrier(Context *context, GLbitfield barriers)
+{
+    ANGLE_DEFER_COMMAND(MemoryBarrier, context, barriers);
+    ANGLE_PROFILE_ENTRY_POINT(MemoryBarrier);
+    if (ValidateMemoryBarrier(context, barriers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MemoryBarrier, context, barriers);
+        context->memoryBarrier(barriers);
+    }
+}
+
+void ValidatedMemoryBarrierByRegion(Context *context, GLbitfield barriers)
+{
+    ANGLE_DEFER_COMMAND(MemoryBarrierByRegion, context, barriers);
+    ANGLE_PROFILE_ENTRY_POINT(MemoryBarrierByRegion);
+    if (ValidateMemoryBarrierByRegion(context, barriers))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MemoryBarrierByRegion, context, barriers);
+        context->memoryBarrierByRegion(barriers);
+    }
+}
+
+void ValidatedMemoryObjectParameterivEXT(Context *context,
+                                         GLuint memoryObject,
+                                         GLenum pname,
+                                         const GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MemoryObjectParameterivEXT);
+    if (ValidateMemoryObjectParameterivEXT(context, memoryObject, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MemoryObjectParameterivEXT, context, memoryObject, pname, params);
+        context->memoryObjectParameteriv(memoryObject, pname, params);
+    }
+}
+
+void ValidatedMultMatrixf(Context *context, const GLfloat *m)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultMatrixf);
+    if (ValidateMultMatrixf(context, m))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MultMatrixf, context, m);
+        context->multMatrixf(m);
+    }
+}
+
+void ValidatedMultMatrixx(Context *context, const GLfixed *m)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultMatrixx);
+    if (ValidateMultMatrixx(context, m))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MultMatrixx, context, m);
+        context->multMatrixx(m);
+    }
+}
+
+void ValidatedMultiDrawArraysANGLE(Context *context,
+                                   GLenum mode,
+                                   const GLint *firsts,
+                                   const GLsizei *counts,
+                                   GLsizei drawcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultiDrawArraysANGLE);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    if (ValidateMultiDrawArraysANGLE(context, modePacked, firsts, counts, drawcount))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MultiDrawArraysANGLE, context, mode, firsts, counts, drawcount);
+        context->multiDrawArrays(modePacked, firsts, counts, drawcount);
+    }
+}
+
+void ValidatedMultiDrawArraysInstancedANGLE(Context *context,
+                                            GLenum mode,
+                                            const GLint *firsts,
+                                            const GLsizei *counts,
+                                            const GLsizei *instanceCounts,
+                                            GLsizei drawcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultiDrawArraysInstancedANGLE);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    if (ValidateMultiDrawArraysInstancedANGLE(context, modePacked, firsts, counts, instanceCounts,
+                                              drawcount))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MultiDrawArraysInstancedANGLE, context, mode, firsts, counts,
+                           instanceCounts, drawcount);
+        context->multiDrawArraysInstanced(modePacked, firsts, counts, instanceCounts, drawcount);
+    }
+}
+
+void ValidatedMultiDrawElementsANGLE(Context *context,
+                                     GLenum mode,
+                                     const GLsizei *counts,
+                                     GLenum type,
+                                     const GLvoid *const *indices,
+                                     GLsizei drawcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultiDrawElementsANGLE);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    if (ValidateMultiDrawElementsANGLE(context, modePacked, counts, typePacked, indices, drawcount))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MultiDrawElementsANGLE, context, mode, counts, type, indices, drawcount);
+        context->multiDrawElements(modePacked, counts, typePacked, indices, drawcount);
+    }
+}
+
+void ValidatedMultiDrawElementsInstancedANGLE(Context *context,
+                                              GLenum mode,
+                                              const GLsizei *counts,
+                                              GLenum type,
+                                              const GLvoid *const *indices,
+                                              const GLsizei *instanceCounts,
+                                              GLsizei drawcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultiDrawElementsInstancedANGLE);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    if (ValidateMultiDrawElementsInstancedANGLE(context, modePacked, counts, typePacked, indices,
+                                                instanceCounts, drawcount))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MultiDrawElementsInstancedANGLE, context, mode, counts, type, indices,
+                           instanceCounts, drawcount);
+        context->multiDrawElementsInstanced(modePacked, counts, typePacked, indices, instanceCounts,
+                                            drawcount);
+    }
+}
+
+void ValidatedMultiTexCoord4f(Context *context,
+                              GLenum target,
+                              GLfloat s,
+                              GLfloat t,
+                              GLfloat r,
+                              GLfloat q)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultiTexCoord4f);
+    if (ValidateMultiTexCoord4f(context, target, s, t, r, q))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MultiTexCoord4f, context, target, s, t, r, q);
+        context->multiTexCoord4f(target, s, t, r, q);
+    }
+}
+
+void ValidatedMultiTexCoord4x(Context *context,
+                              GLenum texture,
+                              GLfixed s,
+                              GLfixed t,
+                              GLfixed r,
+                              GLfixed q)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultiTexCoord4x);
+    if (ValidateMultiTexCoord4x(context, texture, s, t, r, q))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(MultiTexCoord4x, context, texture, s, t, r, q);
+        context->multiTexCoord4x(texture, s, t, r, q);
+    }
+}
+
+void ValidatedNormal3f(Context *context, GLfloat nx, GLfloat ny, GLfloat nz)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(Normal3f);
+    if (ValidateNormal3f(context, nx, ny, nz))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Normal3f, context, nx, ny, nz);
+        context->normal3f(nx, ny, nz);
+    }
+}
+
+void ValidatedNormal3x(Context *context, GLfixed nx, GLfixed ny, GLfixed nz)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Normal3x);
+    if (ValidateNormal3x(context, nx, ny, nz))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Normal3x, context, nx, ny, nz);
+        context->normal3x(nx, ny, nz);
+    }
+}
+
+void ValidatedNormalPointer(Context *context, GLenum type, GLsizei stride, const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(NormalPointer);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    if (ValidateNormalPointer(context, typePacked, stride, pointer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(NormalPointer, context, type, stride, pointer);
+        context->normalPointer(typePacked, stride, pointer);
+    }
+}
+
+void ValidatedObjectLabelKHR(Context *context,
+                             GLenum identifier,
+                             GLuint name,
+                             GLsizei length,
+                             const GLchar *label)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ObjectLabelKHR);
+    if (ValidateObjectLabelKHR(context, identifier, name, length, label))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ObjectLabelKHR, context, identifier, name, length, label);
+        context->objectLabel(identifier, name, length, label);
+    }
+}
+
+void ValidatedObjectPtrLabelKHR(Context *context,
+                                const void *ptr,
+                                GLsizei length,
+                                const GLchar *label)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ObjectPtrLabelKHR);
+    if (ValidateObjectPtrLabelKHR(context, ptr, length, label))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ObjectPtrLabelKHR, context, ptr, length, label);
+        context->objectPtrLabel(ptr, length, label);
+    }
+}
+
+void ValidatedOrthof(Context *context,
+                     GLfloat l,
+                     GLfloat r,
+                     GLfloat b,
+                     GLfloat t,
+                     GLfloat n,
+                     GLfloat f)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Orthof);
+    if (ValidateOrthof(context, l, r, b, t, n, f))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Orthof, context, l, r, b, t, n, f);
+        context->orthof(l, r, b, t, n, f);
+    }
+}
+
+void ValidatedOrthox(Context *context,
+                     GLfixed l,
+                     GLfixed r,
+                     GLfixed b,
+                     GLfixed t,
+                     GLfixed n,
+                     GLfixed f)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Orthox);
+    if (ValidateOrthox(context, l, r, b, t, n, f))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Orthox, context, l, r, b, t, n, f);
+        context->orthox(l, r, b, t, n, f);
+    }
+}
+
+void ValidatedPathCommandsCHROMIUM(Context *context,
+                                   GLuint path,
+                                   GLsizei numCommands,
+                                   const GLubyte *commands,
+                                   GLsizei numCoords,
+                                   GLenum coordType,
+                                   const void *coords)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PathCommandsCHROMIUM);
+    if (ValidatePathCommandsCHROMIUM(context, path, numCommands, commands, numCoords, coordType,
+                                     coords))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PathCommandsCHROMIUM, context, path, numCommands, commands, numCoords,
+                           coordType, coords);
+        context->pathCommands(path, numCommands, commands, numCoords, coordType, coords);
+    }
+}
+
+void ValidatedPathParameterfCHROMIUM(Context *context, GLuint path, GLenum pname, GLfloat value)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PathParameterfCHROMIUM);
+    if (ValidatePathParameterfCHROMIUM(context, path, pname, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PathParameterfCHROMIUM, context, path, pname, value);
+        context->pathParameterf(path, pname, value);
+    }
+}
+
+void ValidatedPathParameteriCHROMIUM(Context *context, GLuint path, GLenum pname, GLint value)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PathParameteriCHROMIUM);
+    if (ValidatePathParameteriCHROMIUM(context, path, pname, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PathParameteriCHROMIUM, context, path, pname, value);
+        context->pathParameteri(path, pname, value);
+    }
+}
+
+void ValidatedPathStencilFuncCHROMIUM(Context *context, GLenum func, GLint ref, GLuint mask)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PathStencilFuncCHROMIUM);
+    if (ValidatePathStencilFuncCHROMIUM(context, func, ref, mask))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PathStencilFuncCHROMIUM, context, func, ref, mask);
+        context->pathStencilFunc(func, ref, mask);
+    }
+}
+
+void ValidatedPauseTransformFeedback(Context *context)
+{
+    ANGLE_DEFER_COMMAND(PauseTransformFeedback, context);
+    ANGLE_PROFILE_ENTRY_POINT(PauseTransformFeedback);
+    if (ValidatePauseTransformFeedback(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PauseTransformFeedback, context);
+        context->pauseTransformFeedback();
+    }
+}
+
+void ValidatedPixelStorei(Context *context, GLenum pname, GLint param)
+{
+    ANGLE_DEFER_COMMAND(PixelStorei, context, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(PixelStorei);
+    if (ValidatePixelStorei(context, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PixelStorei, context, pname, param);
+        context->pixelStorei(pname, param);
+    }
+}
+
+void ValidatedPointParameterf(Context *context, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointParameterf);
+    PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
+    if (ValidatePointParameterf(context, pnamePacked, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PointParameterf, context, pname, param);
+        context->pointParameterf(pnamePacked, param);
+    }
+}
+
+void ValidatedPointParameterfv(Context *context, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointParameterfv);
+    PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
+    if (ValidatePointParameterfv(context, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PointParameterfv, context, pname, params);
+        context->pointParameterfv(pnamePacked, params);
+    }
+}
+
+void ValidatedPointParameterx(Context *context, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointParameterx);
+    PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
+    if (ValidatePointParameterx(context, pnamePacked, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PointParameterx, context, pname, param);
+        context->pointParameterx(pnamePacked, param);
+    }
+}
+
+void ValidatedPointParameterxv(Context *context, GLenum pname, const GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointParameterxv);
+    PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
+    if (ValidatePointParameterxv(context, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PointParameterxv, context, pname, params);
+        context->pointParameterxv(pnamePacked, params);
+    }
+}
+
+void ValidatedPointSize(Context *context, GLfloat size)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointSize);
+    if (ValidatePointSize(context, size))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PointSize, context, size);
+        context->pointSize(size);
+    }
+}
+
+void ValidatedPointSizePointerOES(Context *context,
+                                  GLenum type,
+                                  GLsizei stride,
+                                  const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointSizePointerOES);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    if (ValidatePointSizePointerOES(context, typePacked, stride, pointer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PointSizePointerOES, context, type, stride, pointer);
+        context->pointSizePointer(typePacked, stride, pointer);
+    }
+}
+
+void ValidatedPointSizex(Context *context, GLfixed size)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointSizex);
+    if (ValidatePointSizex(context, size))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PointSizex, context, size);
+        context->pointSizex(size);
+    }
+}
+
+void ValidatedPolygonOffset(Context *context, GLfloat factor, GLfloat units)
+{
+    ANGLE_DEFER_COMMAND(PolygonOffset, context, factor, units);
+    ANGLE_PROFILE_ENTRY_POINT(PolygonOffset);
+    if (ValidatePolygonOffset(context, factor, units))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PolygonOffset, context, factor, units);
+        context->polygonOffset(factor, units);
+    }
+}
+
+void ValidatedPolygonOffsetx(Context *context, GLfixed factor, GLfixed units)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PolygonOffsetx);
+    if (ValidatePolygonOffsetx(context, factor, units))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PolygonOffsetx, context, factor, units);
+        context->polygonOffsetx(factor, units);
+    }
+}
+
+void ValidatedPopDebugGroupKHR(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PopDebugGroupKHR);
+    if (ValidatePopDebugGroupKHR(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PopDebugGroupKHR, context);
+        context->popDebugGroup();
+    }
+}
+
+void ValidatedPopGroupMarkerEXT(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PopGroupMarkerEXT);
+    if (ValidatePopGroupMarkerEXT(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PopGroupMarkerEXT, context);
+        context->popGroupMarker();
+    }
+}
+
+void ValidatedPopMatrix(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(PopMatrix);
+    if (ValidatePopMatrix(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PopMatrix, context);
+        context->popMatrix();
+    }
+}
+
+void ValidatedProgramBinary(Context *context,
+                            GLuint program,
+                            GLenum binaryFormat,
+                            const void *binary,
+                            GLsizei length)
+{
+    ANGLE_DEFER_COMMAND(ProgramBinary, context, program, binaryFormat, binary, length);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramBinary);
+    if (ValidateProgramBinary(context, program, binaryFormat, binary, length))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramBinary, context, program, binaryFormat, binary, length);
+        context->programBinary(program, binaryFormat, binary, length);
+    }
+}
+
+void ValidatedProgramBinaryOES(Context *context,
+                               GLuint program,
+                               GLenum binaryFormat,
+                               const void *binary,
+                               GLint length)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramBinaryOES);
+    if (ValidateProgramBinaryOES(context, program, binaryFormat, binary, length))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramBinaryOES, context, program, binaryFormat, binary, length);
+        context->programBinary(program, binaryFormat, binary, length);
+    }
+}
+
+void ValidatedProgramParameteri(Context *context, GLuint program, GLenum pname, GLint value)
+{
+    ANGLE_DEFER_COMMAND(ProgramParameteri, context, program, pname, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramParameteri);
+    if (ValidateProgramParameteri(context, program, pname, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramParameteri, context, program, pname, value);
+        context->programParameteri(program, pname, value);
+    }
+}
+
+void ValidatedProgramPathFragmentInputGenCHROMIUM(Context *context,
+                                                  GLuint program,
+                                                  GLint location,
+                                                  GLenum genMode,
+                                                  GLint components,
+                                                  const GLfloat *coeffs)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramPathFragmentInputGenCHROMIUM);
+    if (ValidateProgramPathFragmentInputGenCHROMIUM(context, program, location, genMode, components,
+                                                    coeffs))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramPathFragmentInputGenCHROMIUM, context, program, location, genMode,
+                           components, coeffs);
+        context->programPathFragmentInputGen(program, location, genMode, components, coeffs);
+    }
+}
+
+void ValidatedProgramUniform1f(Context *context, GLuint program, GLint location, GLfloat v0)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform1f, context, program, location, v0);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform1f);
+    if (ValidateProgramUniform1f(context, program, location, v0))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform1f, context, program, location, v0);
+        context->programUniform1f(program, location, v0);
+    }
+}
+
+void ValidatedProgramUniform1fv(Context *context,
+                                GLuint program,
+                                GLint location,
+                                GLsizei count,
+                                const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform1fv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform1fv);
+    if (ValidateProgramUniform1fv(context, program, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform1fv, context, program, location, count, value);
+        context->programUniform1fv(program, location, count, value);
+    }
+}
+
+void ValidatedProgramUniform1i(Context *context, GLuint program, GLint location, GLint v0)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform1i, context, program, location, v0);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform1i);
+    if (ValidateProgramUniform1i(context, program, location, v0))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform1i, context, program, location, v0);
+        context->programUniform1i(program, location, v0);
+    }
+}
+
+void ValidatedProgramUniform1iv(Context *context,
+                                GLuint program,
+                                GLint location,
+                                GLsizei count,
+                                const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform1iv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform1iv);
+    if (ValidateProgramUniform1iv(context, program, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform1iv, context, program, location, count, value);
+        context->programUniform1iv(program, location, count, value);
+    }
+}
+
+void ValidatedProgramUniform1ui(Context *context, GLuint program, GLint location, GLuint v0)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform1ui, context, program, location, v0);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform1ui);
+    if (ValidateProgramUniform1ui(context, program, location, v0))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform1ui, context, program, location, v0);
+        context->programUniform1ui(program, location, v0);
+    }
+}
+
+void ValidatedProgramUniform1uiv(Context *context,
+                                 GLuint program,
+                                 GLint location,
+                                 GLsizei count,
+                                 const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform1uiv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform1uiv);
+    if (ValidateProgramUniform1uiv(context, program, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform1uiv, context, program, location, count, value);
+        context->programUniform1uiv(program, location, count, value);
+    }
+}
+
+void ValidatedProgramUniform2f(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLfloat v0,
+                               GLfloat v1)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform2f, context, program, location, v0, v1);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform2f);
+    if (ValidateProgramUniform2f(context, program, location, v0, v1))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform2f, context, program, location, v0, v1);
+        context->programUniform2f(program, location, v0, v1);
+    }
+}
+
+void ValidatedProgramUniform2fv(Context *context,
+                                GLuint program,
+                                GLint location,
+                                GLsizei count,
+                                const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform2fv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform2fv);
+    if (ValidateProgramUniform2fv(context, program, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform2fv, context, program, location, count, value);
+        context->programUniform2fv(program, location, count, value);
+    }
+}
+
+void ValidatedProgramUniform2i(Context *context, GLuint program, GLint location, GLint v0, GLint v1)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform2i, context, program, location, v0, v1);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform2i);
+    if (ValidateProgramUniform2i(context, program, location, v0, v1))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform2i, context, program, location, v0, v1);
+        context->programUniform2i(program, location, v0, v1);
+    }
+}
+
+void ValidatedProgramUniform2iv(Context *context,
+                                GLuint program,
+                                GLint location,
+                                GLsizei count,
+                                const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform2iv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform2iv);
+    if (ValidateProgramUniform2iv(context, program, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform2iv, context, program, location, count, value);
+        context->programUniform2iv(program, location, count, value);
+    }
+}
+
+void ValidatedProgramUniform2ui(Context *context,
+                                GLuint program,
+                                GLint location,
+                                GLuint v0,
+                                GLuint v1)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform2ui, context, program, location, v0, v1);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform2ui);
+    if (ValidateProgramUniform2ui(context, program, location, v0, v1))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform2ui, context, program, location, v0, v1);
+        context->programUniform2ui(program, location, v0, v1);
+    }
+}
+
+void ValidatedProgramUniform2uiv(Context *context,
+                                 GLuint program,
+                                 GLint location,
+                                 GLsizei count,
+                                 const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform2uiv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform2uiv);
+    if (ValidateProgramUniform2uiv(context, program, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform2uiv, context, program, location, count, value);
+        context->programUniform2uiv(program, location, count, value);
+    }
+}
+
+void ValidatedProgramUniform3f(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLfloat v0,
+                               GLfloat v1,
+                               GLfloat v2)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform3f, context, program, location, v0, v1, v2);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform3f);
+    if (ValidateProgramUniform3f(context, program, location, v0, v1, v2))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform3f, context, program, location, v0, v1, v2);
+        context->programUniform3f(program, location, v0, v1, v2);
+    }
+}
+
+void ValidatedProgramUniform3fv(Context *context,
+                                GLuint program,
+                                GLint location,
+                                GLsizei count,
+                                const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform3fv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform3fv);
+    if (ValidateProgramUniform3fv(context, program, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform3fv, context, program, location, count, value);
+        context->programUniform3fv(program, location, count, value);
+    }
+}
+
+void ValidatedProgramUniform3i(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLint v0,
+                               GLint v1,
+                               GLint v2)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform3i, context, program, location, v0, v1, v2);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform3i);
+    if (ValidateProgramUniform3i(context, program, location, v0, v1, v2))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform3i, context, program, location, v0, v1, v2);
+        context->programUniform3i(program, location, v0, v1, v2);
+    }
+}
+
+void ValidatedProgramUniform3iv(Context *context,
+                                GLuint program,
+                                GLint location,
+                                GLsizei count,
+                                const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform3iv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform3iv);
+    if (ValidateProgramUniform3iv(context, program, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform3iv, context, program, location, count, value);
+        context->programUniform3iv(program, location, count, value);
+    }
+}
+
+void ValidatedProgramUniform3ui(Context *context,
+                                GLuint program,
+                                GLint location,
+                                GLuint v0,
+                                GLuint v1,
+                                GLuint v2)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform3ui, context, program, location, v0, v1, v2);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform3ui);
+    if (ValidateProgramUniform3ui(context, program, location, v0, v1, v2))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform3ui, context, program, location, v0, v1, v2);
+        context->programUniform3ui(program, location, v0, v1, v2);
+    }
+}
+
+void ValidatedProgramUniform3uiv(Context *context,
+                                 GLuint program,
+                                 GLint location,
+                                 GLsizei count,
+                                 const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform3uiv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform3uiv);
+    if (ValidateProgramUniform3uiv(context, program, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform3uiv, context, program, location, count, value);
+        context->programUniform3uiv(program, location, count, value);
+    }
+}
+
+void ValidatedProgramUniform4f(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLfloat v0,
+                               GLfloat v1,
+                               GLfloat v2,
+                               GLfloat v3)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform4f, context, program, location, v0, v1, v2, v3);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform4f);
+    if (ValidateProgramUniform4f(context, program, location, v0, v1, v2, v3))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform4f, context, program, location, v0, v1, v2, v3);
+        context->programUniform4f(program, location, v0, v1, v2, v3);
+    }
+}
+
+void ValidatedProgramUniform4fv(Context *context,
+                                GLuint program,
+                                GLint location,
+                                GLsizei count,
+                                const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform4fv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform4fv);
+    if (ValidateProgramUniform4fv(context, program, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform4fv, context, program, location, count, value);
+        context->programUniform4fv(program, location, count, value);
+    }
+}
+
+void ValidatedProgramUniform4i(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLint v0,
+                               GLint v1,
+                               GLint v2,
+                               GLint v3)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform4i, context, program, location, v0, v1, v2, v3);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform4i);
+    if (ValidateProgramUniform4i(context, program, location, v0, v1, v2, v3))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform4i, context, program, location, v0, v1, v2, v3);
+        context->programUniform4i(program, location, v0, v1, v2, v3);
+    }
+}
+
+void ValidatedProgramUniform4iv(Context *context,
+                                GLuint program,
+                                GLint location,
+                                GLsizei count,
+                                const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform4iv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform4iv);
+    if (ValidateProgramUniform4iv(context, program, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform4iv, context, program, location, count, value);
+        context->programUniform4iv(program, location, count, value);
+    }
+}
+
+void ValidatedProgramUniform4ui(Context *context,
+                                GLuint program,
+                                GLint location,
+                                GLuint v0,
+                                GLuint v1,
+                                GLuint v2,
+                                GLuint v3)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform4ui, context, program, location, v0, v1, v2, v3);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform4ui);
+    if (ValidateProgramUniform4ui(context, program, location, v0, v1, v2, v3))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform4ui, context, program, location, v0, v1, v2, v3);
+        context->programUniform4ui(program, location, v0, v1, v2, v3);
+    }
+}
+
+void ValidatedProgramUniform4uiv(Context *context,
+                                 GLuint program,
+                                 GLint location,
+                                 GLsizei count,
+                                 const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform4uiv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform4uiv);
+    if (ValidateProgramUniform4uiv(context, program, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniform4uiv, context, program, location, count, value);
+        context->programUniform4uiv(program, location, count, value);
+    }
+}
+
+void ValidatedProgramUniformMatrix2fv(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix2fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix2fv);
+    if (ValidateProgramUniformMatrix2fv(context, program, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniformMatrix2fv, context, program, location, count, transpose,
+                           value);
+        context->programUniformMatrix2fv(program, location, count, transpose, value);
+    }
+}
+
+void ValidatedProgramUniformMatrix2x3fv(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        GLsizei count,
+                                        GLboolean transpose,
+                                        const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix2x3fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix2x3fv);
+    if (ValidateProgramUniformMatrix2x3fv(context, program, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniformMatrix2x3fv, context, program, location, count, transpose,
+                           value);
+        context->programUniformMatrix2x3fv(program, location, count, transpose, value);
+    }
+}
+
+void ValidatedProgramUniformMatrix2x4fv(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        GLsizei count,
+                                        GLboolean transpose,
+                                        const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix2x4fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix2x4fv);
+    if (ValidateProgramUniformMatrix2x4fv(context, program, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniformMatrix2x4fv, context, program, location, count, transpose,
+                           value);
+        context->programUniformMatrix2x4fv(program, location, count, transpose, value);
+    }
+}
+
+void ValidatedProgramUniformMatrix3fv(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix3fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix3fv);
+    if (ValidateProgramUniformMatrix3fv(context, program, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniformMatrix3fv, context, program, location, count, transpose,
+                           value);
+        context->programUniformMatrix3fv(program, location, count, transpose, value);
+    }
+}
+
+void ValidatedProgramUniformMatrix3x2fv(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        GLsizei count,
+                                        GLboolean transpose,
+                                        const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix3x2fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix3x2fv);
+    if (ValidateProgramUniformMatrix3x2fv(context, program, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniformMatrix3x2fv, context, program, location, count, transpose,
+                           value);
+        context->programUniformMatrix3x2fv(program, location, count, transpose, value);
+    }
+}
+
+void ValidatedProgramUniformMatrix3x4fv(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        GLsizei count,
+                                        GLboolean transpose,
+                                        const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix3x4fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix3x4fv);
+    if (ValidateProgramUniformMatrix3x4fv(context, program, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniformMatrix3x4fv, context, program, location, count, transpose,
+                           value);
+        context->programUniformMatrix3x4fv(program, location, count, transpose, value);
+    }
+}
+
+void ValidatedProgramUniformMatrix4fv(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix4fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix4fv);
+    if (ValidateProgramUniformMatrix4fv(context, program, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniformMatrix4fv, context, program, location, count, transpose,
+                           value);
+        context->programUniformMatrix4fv(program, location, count, transpose, value);
+    }
+}
+
+void ValidatedProgramUniformMatrix4x2fv(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        GLsizei count,
+                                        GLboolean transpose,
+                                        const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix4x2fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix4x2fv);
+    if (ValidateProgramUniformMatrix4x2fv(context, program, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniformMatrix4x2fv, context, program, location, count, transpose,
+                           value);
+        context->programUniformMatrix4x2fv(program, location, count, transpose, value);
+    }
+}
+
+void ValidatedProgramUniformMatrix4x3fv(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        GLsizei count,
+                                        GLboolean transpose,
+                                        const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix4x3fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix4x3fv);
+    if (ValidateProgramUniformMatrix4x3fv(context, program, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProgramUniformMatrix4x3fv, context, program, location, count, transpose,
+                           value);
+        context->programUniformMatrix4x3fv(program, location, count, transpose, value);
+    }
+}
+
+void ValidatedProvokingVertexANGLE(Context *context, GLenum mode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ProvokingVertexANGLE);
+    ProvokingVertex modePacked = FromGLenum<ProvokingVertex>(mode);
+    if (ValidateProvokingVertexANGLE(context, modePacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ProvokingVertexANGLE, context, mode);
+        context->provokingVertex(modePacked);
+    }
+}
+
+void ValidatedPushDebugGroupKHR(Context *context,
+                                GLenum source,
+                                GLuint id,
+                                GLsizei length,
+                                const GLchar *message)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PushDebugGroupKHR);
+    if (ValidatePushDebugGroupKHR(context, source, id, length, message))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PushDebugGroupKHR, context, source, id, length, message);
+        context->pushDebugGroup(source, id, length, message);
+    }
+}
+
+void ValidatedPushGroupMarkerEXT(Context *context, GLsizei length, const GLchar *marker)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PushGroupMarkerEXT);
+    if (ValidatePushGroupMarkerEXT(context, length, marker))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PushGroupMarkerEXT, context, length, marker);
+        context->pushGroupMarker(length, marker);
+    }
+}
+
+void ValidatedPushMatrix(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(PushMatrix);
+    if (ValidatePushMatrix(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(PushMatrix, context);
+        context->pushMatrix();
+    }
+}
+
+void ValidatedQueryCounterEXT(Context *context, GLuint id, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(QueryCounterEXT);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    if (ValidateQueryCounterEXT(context, id, targetPacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(QueryCounterEXT, context, id, target);
+        context->queryCounter(id, targetPacked);
+    }
+}
+
+GLbitfield ValidatedQueryMatrixxOES(Context *context, GLfixed *mantissa, GLint *exponent)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(QueryMatrixxOES);
+    if (ValidateQueryMatrixxOES(context, mantissa, exponent))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(QueryMatrixxOES, context, mantissa, exponent);
+        return context->queryMatrixx(mantissa, exponent);
+    }
+    return GetDefaultReturnValue<EntryPoint::QueryMatrixxOES, GLbitfield>();
+}
+
+void ValidatedReadBuffer(Context *context, GLenum src)
+{
+    ANGLE_DEFER_COMMAND(ReadBuffer, context, src);
+    ANGLE_PROFILE_ENTRY_POINT(ReadBuffer);
+    if (ValidateReadBuffer(context, src))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ReadBuffer, context, src);
+        context->readBuffer(src);
+    }
+}
+
+void ValidatedReadPixels(Context *context,
+                         GLint x,
+                         GLint y,
+                         GLsizei width,
+                         GLsizei height,
+                         GLenum format,
+                         GLenum type,
+                         void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ReadPixels);
+    if (ValidateReadPixels(context, x, y, width, height, format, type, pixels))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ReadPixels, context, x, y, width, height, format, type, pixels);
+        context->readPixels(x, y, width, height, format, type, pixels);
+    }
+}
+
+void ValidatedReadPixelsRobustANGLE(Context *context,
+                                    GLint x,
+                                    GLint y,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLenum format,
+                                    GLenum type,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLsizei *columns,
+                                    GLsizei *rows,
+                                    void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ReadPixelsRobustANGLE);
+    if (ValidateReadPixelsRobustANGLE(context, x, y, width, height, format, type, bufSize, length,
+                                      columns, rows, pixels))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ReadPixelsRobustANGLE, context, x, y, width, height, format, type,
+                           bufSize, length, columns, rows, pixels);
+        context->readPixelsRobust(x, y, width, height, format, type, bufSize, length, columns, rows,
+                                  pixels);
+    }
+}
+
+void ValidatedReadnPixelsEXT(Context *context,
+                             GLint x,
+                             GLint y,
+                             GLsizei width,
+                             GLsizei height,
+                             GLenum format,
+                             GLenum type,
+                             GLsizei bufSize,
+                             void *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ReadnPixelsEXT);
+    if (ValidateReadnPixelsEXT(context, x, y, width, height, format, type, bufSize, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ReadnPixelsEXT, context, x, y, width, height, format, type, bufSize,
+                           data);
+        context->readnPixels(x, y, width, height, format, type, bufSize, data);
+    }
+}
+
+void ValidatedReadnPixelsRobustANGLE(Context *context,
+                                     GLint x,
+                                     GLint y,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLsizei *columns,
+                                     GLsizei *rows,
+                                     void *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ReadnPixelsRobustANGLE);
+    if (ValidateReadnPixelsRobustANGLE(context, x, y, width, height, format, type, bufSize, length,
+                                       columns, rows, data))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ReadnPixelsRobustANGLE, context, x, y, width, height, format, type,
+                           bufSize, length, columns, rows, data);
+        context->readnPixelsRobust(x, y, width, height, format, type, bufSize, length, columns,
+                                   rows, data);
+    }
+}
+
+void ValidatedReleaseShaderCompiler(Context *context)
+{
+    ANGLE_DEFER_COMMAND(ReleaseShaderCompiler, context);
+    ANGLE_PROFILE_ENTRY_POINT(ReleaseShaderCompiler);
+    if (ValidateReleaseShaderCompiler(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ReleaseShaderCompiler, context);
+        context->releaseShaderCompiler();
+    }
+}
+
+void ValidatedRenderbufferStorage(Context *context,
+                                  GLenum target,
+                                  GLenum internalformat,
+                                  GLsizei width,
+                                  GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(RenderbufferStorage, context, target, internalformat, width, height);
+    ANGLE_PROFILE_ENTRY_POINT(RenderbufferStorage);
+    if (ValidateRenderbufferStorage(context, target, internalformat, width, height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(RenderbufferStorage, context, target, internalformat, width, height);
+        context->renderbufferStorage(target, internalformat, width, height);
+    }
+}
+
+void ValidatedRenderbufferStorageMultisample(Context *context,
+                                             GLenum target,
+                                             GLsizei samples,
+                                             GLenum internalformat,
+                                             GLsizei width,
+                                             GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(RenderbufferStorageMultisample, context, target, samples, internalformat,
+                        width, height);
+    ANGLE_PROFILE_ENTRY_POINT(RenderbufferStorageMultisample);
+    if (ValidateRenderbufferStorageMultisample(context, target, samples, internalformat, width,
+                                               height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(RenderbufferStorageMultisample, context, target, samples, internalformat,
+                           width, height);
+        context->renderbufferStorageMultisample(target, samples, internalformat, width, height);
+    }
+}
+
+void ValidatedRenderbufferStorageMultisampleANGLE(Context *context,
+                                                  GLenum target,
+                                                  GLsizei samples,
+                                                  GLenum internalformat,
+                                                  GLsizei width,
+                                                  GLsizei height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(RenderbufferStorageMultisampleANGLE);
+    if (ValidateRenderbufferStorageMultisampleANGLE(context, target, samples, internalformat, width,
+                                                    height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(RenderbufferStorageMultisampleANGLE, context, target, samples,
+                           internalformat, width, height);
+        context->renderbufferStorageMultisample(target, samples, internalformat, width, height);
+    }
+}
+
+void ValidatedRenderbufferStorageOES(Context *context,
+                                     GLenum target,
+                                     GLenum internalformat,
+                                     GLsizei width,
+                                     GLsizei height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(RenderbufferStorageOES);
+    if (ValidateRenderbufferStorageOES(context, target, internalformat, width, height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(RenderbufferStorageOES, context, target, internalformat, width, height);
+        context->renderbufferStorage(target, internalformat, width, height);
+    }
+}
+
+void ValidatedRequestExtensionANGLE(Context *context, const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(RequestExtensionANGLE);
+    if (ValidateRequestExtensionANGLE(context, name))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(RequestExtensionANGLE, context, name);
+        context->requestExtension(name);
+    }
+}
+
+void ValidatedResumeTransformFeedback(Context *context)
+{
+    ANGLE_DEFER_COMMAND(ResumeTransformFeedback, context);
+    ANGLE_PROFILE_ENTRY_POINT(ResumeTransformFeedback);
+    if (ValidateResumeTransformFeedback(context))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ResumeTransformFeedback, context);
+        context->resumeTransformFeedback();
+    }
+}
+
+void ValidatedRotatef(Context *context, GLfloat angle, GLfloat x, GLfloat y, GLfloat z)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(Rotatef);
+    if (ValidateRotatef(context, angle, x, y, z))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Rotatef, context, angle, x, y, z);
+        context->rotatef(angle, x, y, z);
+    }
+}
+
+void ValidatedRotatex(Context *context, GLfixed angle, GLfixed x, GLfixed y, GLfixed z)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Rotatex);
+    if (ValidateRotatex(context, angle, x, y, z))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Rotatex, context, angle, x, y, z);
+        context->rotatex(angle, x, y, z);
+    }
+}
+
+void ValidatedSampleCoverage(Context *context, GLfloat value, GLboolean invert)
+{
+    ANGLE_DEFER_COMMAND(SampleCoverage, context, value, invert);
+    ANGLE_PROFILE_ENTRY_POINT(SampleCoverage);
+    if (ValidateSampleCoverage(context, value, invert))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SampleCoverage, context, value, invert);
+        context->sampleCoverage(value, invert);
+    }
+}
+
+void ValidatedSampleCoveragex(Context *context, GLclampx value, GLboolean invert)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SampleCoveragex);
+    if (ValidateSampleCoveragex(context, value, invert))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SampleCoveragex, context, value, invert);
+        context->sampleCoveragex(value, invert);
+    }
+}
+
+void ValidatedSampleMaski(Context *context, GLuint maskNumber, GLbitfield mask)
+{
+    ANGLE_DEFER_COMMAND(SampleMaski, context, maskNumber, mask);
+    ANGLE_PROFILE_ENTRY_POINT(SampleMaski);
+    if (ValidateSampleMaski(context, maskNumber, mask))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SampleMaski, context, maskNumber, mask);
+        context->sampleMaski(maskNumber, mask);
+    }
+}
+
+void ValidatedSampleMaskiANGLE(Context *context, GLuint maskNumber, GLbitfield mask)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SampleMaskiANGLE);
+    if (ValidateSampleMaskiANGLE(context, maskNumber, mask))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SampleMaskiANGLE, context, maskNumber, mask);
+        context->sampleMaski(maskNumber, mask);
+    }
+}
+
+void ValidatedSamplerParameterIivOES(Context *context,
+                                     GLuint sampler,
+                                     GLenum pname,
+                                     const GLint *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterIivOES);
+    if (ValidateSamplerParameterIivOES(context, sampler, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SamplerParameterIivOES, context, sampler, pname, param);
+        context->samplerParameterIiv(sampler, pname, param);
+    }
+}
+
+void ValidatedSamplerParameterIivRobustANGLE(Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             const GLint *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterIivRobustANGLE);
+    if (ValidateSamplerParameterIivRobustANGLE(context, sampler, pname, bufSize, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SamplerParameterIivRobustANGLE, context, sampler, pname, bufSize, param);
+        context->samplerParameterIivRobust(sampler, pname, bufSize, param);
+    }
+}
+
+void ValidatedSamplerParameterIuivOES(Context *context,
+                                      GLuint sampler,
+                                      GLenum pname,
+                                      const GLuint *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterIuivOES);
+    if (ValidateSamplerParameterIuivOES(context, sampler, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SamplerParameterIuivOES, context, sampler, pname, param);
+        context->samplerParameterIuiv(sampler, pname, param);
+    }
+}
+
+void ValidatedSamplerParameterIuivRobustANGLE(Context *context,
+                                              GLuint sampler,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              const GLuint *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterIuivRobustANGLE);
+    if (ValidateSamplerParameterIuivRobustANGLE(context, sampler, pname, bufSize, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SamplerParameterIuivRobustANGLE, context, sampler, pname, bufSize,
+                           param);
+        context->samplerParameterIuivRobust(sampler, pname, bufSize, param);
+    }
+}
+
+void ValidatedSamplerParameterf(Context *context, GLuint sampler, GLenum pname, GLfloat param)
+{
+    ANGLE_DEFER_COMMAND(SamplerParameterf, context, sampler, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterf);
+    if (ValidateSamplerParameterf(context, sampler, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SamplerParameterf, context, sampler, pname, param);
+        context->samplerParameterf(sampler, pname, param);
+    }
+}
+
+void ValidatedSamplerParameterfv(Context *context,
+                                 GLuint sampler,
+                                 GLenum pname,
+                                 const GLfloat *param)
+{
+    ANGLE_DEFER_COMMAND(SamplerParameterfv, context, sampler, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterfv);
+    if (ValidateSamplerParameterfv(context, sampler, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SamplerParameterfv, context, sampler, pname, param);
+        context->samplerParameterfv(sampler, pname, param);
+    }
+}
+
+void ValidatedSamplerParameterfvRobustANGLE(Context *context,
+                                            GLuint sampler,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            const GLfloat *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterfvRobustANGLE);
+    if (ValidateSamplerParameterfvRobustANGLE(context, sampler, pname, bufSize, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SamplerParameterfvRobustANGLE, context, sampler, pname, bufSize, param);
+        context->samplerParameterfvRobust(sampler, pname, bufSize, param);
+    }
+}
+
+void ValidatedSamplerParameteri(Context *context, GLuint sampler, GLenum pname, GLint param)
+{
+    ANGLE_DEFER_COMMAND(SamplerParameteri, context, sampler, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameteri);
+    if (ValidateSamplerParameteri(context, sampler, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SamplerParameteri, context, sampler, pname, param);
+        context->samplerParameteri(sampler, pname, param);
+    }
+}
+
+void ValidatedSamplerParameteriv(Context *context, GLuint sampler, GLenum pname, const GLint *param)
+{
+    ANGLE_DEFER_COMMAND(SamplerParameteriv, context, sampler, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameteriv);
+    if (ValidateSamplerParameteriv(context, sampler, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SamplerParameteriv, context, sampler, pname, param);
+        context->samplerParameteriv(sampler, pname, param);
+    }
+}
+
+void ValidatedSamplerParameterivRobustANGLE(Context *context,
+                                            GLuint sampler,
+                                            GLuint pname,
+                                            GLsizei bufSize,
+                                            const GLint *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterivRobustANGLE);
+    if (ValidateSamplerParameterivRobustANGLE(context, sampler, pname, bufSize, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SamplerParameterivRobustANGLE, context, sampler, pname, bufSize, param);
+        context->samplerParameterivRobust(sampler, pname, bufSize, param);
+    }
+}
+
+void ValidatedScalef(Context *context, GLfloat x, GLfloat y, GLfloat z)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(Scalef);
+    if (ValidateScalef(context, x, y, z))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Scalef, context, x, y, z);
+        context->scalef(x, y, z);
+    }
+}
+
+void ValidatedScalex(Context *context, GLfixed x, GLfixed y, GLfixed z)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Scalex);
+    if (ValidateScalex(context, x, y, z))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Scalex, context, x, y, z);
+        context->scalex(x, y, z);
+    }
+}
+
+void ValidatedScissor(Context *context, GLint x, GLint y, GLsizei width, GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(Scissor, context, x, y, width, height);
+    ANGLE_PROFILE_ENTRY_POINT(Scissor);
+    if (ValidateScissor(context, x, y, width, height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Scissor, context, x, y, width, height);
+        context->scissor(x, y, width, height);
+    }
+}
+
+void ValidatedSemaphoreParameterui64vEXT(Context *context,
+                                         GLuint semaphore,
+                                         GLenum pname,
+                                         const GLuint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SemaphoreParameterui64vEXT);
+    if (ValidateSemaphoreParameterui64vEXT(context, semaphore, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SemaphoreParameterui64vEXT, context, semaphore, pname, params);
+        context->semaphoreParameterui64v(semaphore, pname, params);
+    }
+}
+
+void ValidatedSetFenceNV(Context *context, GLuint fence, GLenum condition)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SetFenceNV);
+    if (ValidateSetFenceNV(context, fence, condition))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SetFenceNV, context, fence, condition);
+        context->setFenceNV(fence, condition);
+    }
+}
+
+void ValidatedShadeModel(Context *context, GLenum mode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(ShadeModel);
+    ShadingModel modePacked = FromGLenum<ShadingModel>(mode);
+    if (ValidateShadeModel(context, modePacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ShadeModel, context, mode);
+        context->shadeModel(modePacked);
+    }
+}
+
+void ValidatedShaderBinary(Context *context,
+                           GLsizei count,
+                           const GLuint *shaders,
+                           GLenum binaryformat,
+                           const void *binary,
+                           GLsizei length)
+{
+    ANGLE_DEFER_COMMAND(ShaderBinary, context, count, shaders, binaryformat, binary, length);
+    ANGLE_PROFILE_ENTRY_POINT(ShaderBinary);
+    if (ValidateShaderBinary(context, count, shaders, binaryformat, binary, length))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ShaderBinary, context, count, shaders, binaryformat, binary, length);
+        context->shaderBinary(count, shaders, binaryformat, binary, length);
+    }
+}
+
+void ValidatedShaderSource(Context *context,
+                           GLuint shader,
+                           GLsizei count,
+                           const GLchar *const *string,
+                           const GLint *length)
+{
+    ANGLE_DEFER_COMMAND(ShaderSource, context, shader, count, string, length);
+    ANGLE_PROFILE_ENTRY_POINT(ShaderSource);
+    if (ValidateShaderSource(context, shader, count, string, length))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ShaderSource, context, shader, count, string, length);
+        context->shaderSource(shader, count, string, length);
+    }
+}
+
+void ValidatedSignalSemaphoreEXT(Context *context,
+                                 GLuint semaphore,
+                                 GLuint numBufferBarriers,
+                                 const GLuint *buffers,
+                                 GLuint numTextureBarriers,
+                                 const GLuint *textures,
+                                 const GLenum *dstLayouts)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SignalSemaphoreEXT);
+    if (ValidateSignalSemaphoreEXT(context, semaphore, numBufferBarriers, buffers,
+                                   numTextureBarriers, textures, dstLayouts))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(SignalSemaphoreEXT, context, semaphore, numBufferBarriers, buffers,
+                           numTextureBarriers, textures, dstLayouts);
+        context->signalSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers,
+                                 textures, dstLayouts);
+    }
+}
+
+void ValidatedStencilFillPathCHROMIUM(Context *context, GLuint path, GLenum fillMode, GLuint mask)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilFillPathCHROMIUM);
+    if (ValidateStencilFillPathCHROMIUM(context, path, fillMode, mask))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilFillPathCHROMIUM, context, path, fillMode, mask);
+        context->stencilFillPath(path, fillMode, mask);
+    }
+}
+
+void ValidatedStencilFillPathInstancedCHROMIUM(Context *context,
+                                               GLsizei numPaths,
+                                               GLenum pathNameType,
+                                               const void *paths,
+                                               GLuint pathBase,
+                                               GLenum fillMode,
+                                               GLuint mask,
+                                               GLenum transformType,
+                                               const GLfloat *transformValues)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilFillPathInstancedCHROMIUM);
+    if (ValidateStencilFillPathInstancedCHROMIUM(context, numPaths, pathNameType, paths, pathBase,
+                                                 fillMode, mask, transformType, transformValues))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilFillPathInstancedCHROMIUM, context, numPaths, pathNameType, paths,
+                           pathBase, fillMode, mask, transformType, transformValues);
+        context->stencilFillPathInstanced(numPaths, pathNameType, paths, pathBase, fillMode, mask,
+                                          transformType, transformValues);
+    }
+}
+
+void ValidatedStencilFunc(Context *context, GLenum func, GLint ref, GLuint mask)
+{
+    ANGLE_DEFER_COMMAND(StencilFunc, context, func, ref, mask);
+    ANGLE_PROFILE_ENTRY_POINT(StencilFunc);
+    if (ValidateStencilFunc(context, func, ref, mask))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilFunc, context, func, ref, mask);
+        context->stencilFunc(func, ref, mask);
+    }
+}
+
+void ValidatedStencilFuncSeparate(Context *context,
+                                  GLenum face,
+                                  GLenum func,
+                                  GLint ref,
+                                  GLuint mask)
+{
+    ANGLE_DEFER_COMMAND(StencilFuncSeparate, context, face, func, ref, mask);
+    ANGLE_PROFILE_ENTRY_POINT(StencilFuncSeparate);
+    if (ValidateStencilFuncSeparate(context, face, func, ref, mask))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilFuncSeparate, context, face, func, ref, mask);
+        context->stencilFuncSeparate(face, func, ref, mask);
+    }
+}
+
+void ValidatedStencilMask(Context *context, GLuint mask)
+{
+    ANGLE_DEFER_COMMAND(StencilMask, context, mask);
+    ANGLE_PROFILE_ENTRY_POINT(StencilMask);
+    if (ValidateStencilMask(context, mask))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilMask, context, mask);
+        context->stencilMask(mask);
+    }
+}
+
+void ValidatedStencilMaskSeparate(Context *context, GLenum face, GLuint mask)
+{
+    ANGLE_DEFER_COMMAND(StencilMaskSeparate, context, face, mask);
+    ANGLE_PROFILE_ENTRY_POINT(StencilMaskSeparate);
+    if (ValidateStencilMaskSeparate(context, face, mask))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilMaskSeparate, context, face, mask);
+        context->stencilMaskSeparate(face, mask);
+    }
+}
+
+void ValidatedStencilOp(Context *context, GLenum fail, GLenum zfail, GLenum zpass)
+{
+    ANGLE_DEFER_COMMAND(StencilOp, context, fail, zfail, zpass);
+    ANGLE_PROFILE_ENTRY_POINT(StencilOp);
+    if (ValidateStencilOp(context, fail, zfail, zpass))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilOp, context, fail, zfail, zpass);
+        context->stencilOp(fail, zfail, zpass);
+    }
+}
+
+void ValidatedStencilOpSeparate(Context *context,
+                                GLenum face,
+                                GLenum sfail,
+                                GLenum dpfail,
+                                GLenum dppass)
+{
+    ANGLE_DEFER_COMMAND(StencilOpSeparate, context, face, sfail, dpfail, dppass);
+    ANGLE_PROFILE_ENTRY_POINT(StencilOpSeparate);
+    if (ValidateStencilOpSeparate(context, face, sfail, dpfail, dppass))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilOpSeparate, context, face, sfail, dpfail, dppass);
+        context->stencilOpSeparate(face, sfail, dpfail, dppass);
+    }
+}
+
+void ValidatedStencilStrokePathCHROMIUM(Context *context, GLuint path, GLint reference, GLuint mask)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilStrokePathCHROMIUM);
+    if (ValidateStencilStrokePathCHROMIUM(context, path, reference, mask))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilStrokePathCHROMIUM, context, path, reference, mask);
+        context->stencilStrokePath(path, reference, mask);
+    }
+}
+
+void ValidatedStencilStrokePathInstancedCHROMIUM(Context *context,
+                                                 GLsizei numPath,
+                                                 GLenum pathNameType,
+                                                 const void *paths,
+                                                 GLuint pathBase,
+                                                 GLint reference,
+                                                 GLuint mask,
+                                                 GLenum transformType,
+                                                 const GLfloat *transformValues)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilStrokePathInstancedCHROMIUM);
+    if (ValidateStencilStrokePathInstancedCHROMIUM(context, numPath, pathNameType, paths, pathBase,
+                                                   reference, mask, transformType, transformValues))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilStrokePathInstancedCHROMIUM, context, numPath, pathNameType,
+                           paths, pathBase, reference, mask, transformType, transformValues);
+        context->stencilStrokePathInstanced(numPath, pathNameType, paths, pathBase, reference, mask,
+                                            transformType, transformValues);
+    }
+}
+
+void ValidatedStencilThenCoverFillPathCHROMIUM(Context *context,
+                                               GLuint path,
+                                               GLenum fillMode,
+                                               GLuint mask,
+                                               GLenum coverMode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilThenCoverFillPathCHROMIUM);
+    if (ValidateStencilThenCoverFillPathCHROMIUM(context, path, fillMode, mask, coverMode))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilThenCoverFillPathCHROMIUM, context, path, fillMode, mask,
+                           coverMode);
+        context->stencilThenCoverFillPath(path, fillMode, mask, coverMode);
+    }
+}
+
+void ValidatedStencilThenCoverFillPathInstancedCHROMIUM(Context *context,
+                                                        GLsizei numPaths,
+                                                        GLenum pathNameType,
+                                                        const void *paths,
+                                                        GLuint pathBase,
+                                                        GLenum fillMode,
+                                                        GLuint mask,
+                                                        GLenum coverMode,
+                                                        GLenum transformType,
+                                                        const GLfloat *transformValues)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilThenCoverFillPathInstancedCHROMIUM);
+    if (ValidateStencilThenCoverFillPathInstancedCHROMIUM(context, numPaths, pathNameType, paths,
+                                                          pathBase, fillMode, mask, coverMode,
+                                                          transformType, transformValues))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilThenCoverFillPathInstancedCHROMIUM, context, numPaths,
+                           pathNameType, paths, pathBase, fillMode, mask, coverMode, transformType,
+                           transformValues);
+        context->stencilThenCoverFillPathInstanced(numPaths, pathNameType, paths, pathBase,
+                                                   fillMode, mask, coverMode, transformType,
+                                                   transformValues);
+    }
+}
+
+void ValidatedStencilThenCoverStrokePathCHROMIUM(Context *context,
+                                                 GLuint path,
+                                                 GLint reference,
+                                                 GLuint mask,
+                                                 GLenum coverMode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilThenCoverStrokePathCHROMIUM);
+    if (ValidateStencilThenCoverStrokePathCHROMIUM(context, path, reference, mask, coverMode))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilThenCoverStrokePathCHROMIUM, context, path, reference, mask,
+                           coverMode);
+        context->stencilThenCoverStrokePath(path, reference, mask, coverMode);
+    }
+}
+
+void ValidatedStencilThenCoverStrokePathInstancedCHROMIUM(Context *context,
+                                                          GLsizei numPaths,
+                                                          GLenum pathNameType,
+                                                          const void *paths,
+                                                          GLuint pathBase,
+                                                          GLint reference,
+                                                          GLuint mask,
+                                                          GLenum coverMode,
+                                                          GLenum transformType,
+                                                          const GLfloat *transformValues)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilThenCoverStrokePathInstancedCHROMIUM);
+    if (ValidateStencilThenCoverStrokePathInstancedCHROMIUM(context, numPaths, pathNameType, paths,
+                                                            pathBase, reference, mask, coverMode,
+                                                            transformType, transformValues))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(StencilThenCoverStrokePathInstancedCHROMIUM, context, numPaths,
+                           pathNameType, paths, pathBase, reference, mask, coverMode, transformType,
+                           transformValues);
+        context->stencilThenCoverStrokePathInstanced(numPaths, pathNameType, paths, pathBase,
+                                                     reference, mask, coverMode, transformType,
+                                                     transformValues);
+    }
+}
+
+GLboolean ValidatedTestFenceNV(Context *context, GLuint fence)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TestFenceNV);
+    if (ValidateTestFenceNV(context, fence))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TestFenceNV, context, fence);
+        return context->testFenceNV(fence);
+    }
+    return GetDefaultReturnValue<EntryPoint::TestFenceNV, GLboolean>();
+}
+
+void ValidatedTexCoordPointer(Context *context,
+                              GLint size,
+                              GLenum type,
+                              GLsizei stride,
+                              const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexCoordPointer);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    if (ValidateTexCoordPointer(context, size, typePacked, stride, pointer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexCoordPointer, context, size, type, stride, pointer);
+        context->texCoordPointer(size, typePacked, stride, pointer);
+    }
+}
+
+void ValidatedTexEnvf(Context *context, GLenum target, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexEnvf);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    if (ValidateTexEnvf(context, targetPacked, pnamePacked, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexEnvf, context, target, pname, param);
+        context->texEnvf(targetPacked, pnamePacked, param);
+    }
+}
+
+void ValidatedTexEnvfv(Context *context, GLenum target, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexEnvfv);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    if (ValidateTexEnvfv(context, targetPacked, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexEnvfv, context, target, pname, params);
+        context->texEnvfv(targetPacked, pnamePacked, params);
+    }
+}
+
+void ValidatedTexEnvi(Context *context, GLenum target, GLenum pname, GLint param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexEnvi);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    if (ValidateTexEnvi(context, targetPacked, pnamePacked, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexEnvi, context, target, pname, param);
+        context->texEnvi(targetPacked, pnamePacked, param);
+    }
+}
+
+void ValidatedTexEnviv(Context *context, GLenum target, GLenum pname, const GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexEnviv);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    if (ValidateTexEnviv(context, targetPacked, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexEnviv, context, target, pname, params);
+        context->texEnviv(targetPacked, pnamePacked, params);
+    }
+}
+
+void ValidatedTexEnvx(Context *context, GLenum target, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexEnvx);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    if (ValidateTexEnvx(context, targetPacked, pnamePacked, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexEnvx, context, target, pname, param);
+        context->texEnvx(targetPacked, pnamePacked, param);
+    }
+}
+
+void ValidatedTexEnvxv(Context *context, GLenum target, GLenum pname, const GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexEnvxv);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    if (ValidateTexEnvxv(context, targetPacked, pnamePacked, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexEnvxv, context, target, pname, params);
+        context->texEnvxv(targetPacked, pnamePacked, params);
+    }
+}
+
+void ValidatedTexGenfOES(Context *context, GLenum coord, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexGenfOES);
+    if (ValidateTexGenfOES(context, coord, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexGenfOES, context, coord, pname, param);
+        context->texGenf(coord, pname, param);
+    }
+}
+
+void ValidatedTexGenfvOES(Context *context, GLenum coord, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexGenfvOES);
+    if (ValidateTexGenfvOES(context, coord, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexGenfvOES, context, coord, pname, params);
+        context->texGenfv(coord, pname, params);
+    }
+}
+
+void ValidatedTexGeniOES(Context *context, GLenum coord, GLenum pname, GLint param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexGeniOES);
+    if (ValidateTexGeniOES(context, coord, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexGeniOES, context, coord, pname, param);
+        context->texGeni(coord, pname, param);
+    }
+}
+
+void ValidatedTexGenivOES(Context *context, GLenum coord, GLenum pname, const GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexGenivOES);
+    if (ValidateTexGenivOES(context, coord, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexGenivOES, context, coord, pname, params);
+        context->texGeniv(coord, pname, params);
+    }
+}
+
+void ValidatedTexGenxOES(Context *context, GLenum coord, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexGenxOES);
+    if (ValidateTexGenxOES(context, coord, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexGenxOES, context, coord, pname, param);
+        context->texGenx(coord, pname, param);
+    }
+}
+
+void ValidatedTexGenxvOES(Context *context, GLenum coord, GLenum pname, const GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexGenxvOES);
+    if (ValidateTexGenxvOES(context, coord, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexGenxvOES, context, coord, pname, params);
+        context->texGenxv(coord, pname, params);
+    }
+}
+
+void ValidatedTexImage2D(Context *context,
+                         GLenum target,
+                         GLint level,
+                         GLint internalformat,
+                         GLsizei width,
+                         GLsizei height,
+                         GLint border,
+                         GLenum format,
+                         GLenum type,
+                         const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexImage2D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateTexImage2D(context, targetPacked, level, internalformat, width, height, border,
+                           format, type, pixels))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexImage2D, context, target, level, internalformat, width, height,
+                           border, format, type, pixels);
+        context->texImage2D(targetPacked, level, internalformat, width, height, border, format,
+                            type, pixels);
+    }
+}
+
+void ValidatedTexImage2DRobustANGLE(Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint internalformat,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLint border,
+                                    GLenum format,
+                                    GLenum type,
+                                    GLsizei bufSize,
+                                    const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexImage2DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateTexImage2DRobustANGLE(context, targetPacked, level, internalformat, width, height,
+                                      border, format, type, bufSize, pixels))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexImage2DRobustANGLE, context, target, level, internalformat, width,
+                           height, border, format, type, bufSize, pixels);
+        context->texImage2DRobust(targetPacked, level, internalformat, width, height, border,
+                                  format, type, bufSize, pixels);
+    }
+}
+
+void ValidatedTexImage3D(Context *context,
+                         GLenum target,
+                         GLint level,
+                         GLint internalformat,
+                         GLsizei width,
+                         GLsizei height,
+                         GLsizei depth,
+                         GLint border,
+                         GLenum format,
+                         GLenum type,
+                         const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexImage3D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateTexImage3D(context, targetPacked, level, internalformat, width, height, depth,
+                           border, format, type, pixels))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexImage3D, context, target, level, internalformat, width, height, depth,
+                           border, format, type, pixels);
+        context->texImage3D(targetPacked, level, internalformat, width, height, depth, border,
+                            format, type, pixels);
+    }
+}
+
+void ValidatedTexImage3DRobustANGLE(Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint internalformat,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLsizei depth,
+                                    GLint border,
+                                    GLenum format,
+                                    GLenum type,
+                                    GLsizei bufSize,
+                                    const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexImage3DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateTexImage3DRobustANGLE(context, targetPacked, level, internalformat, width, height,
+                                      depth, border, format, type, bufSize, pixels))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexImage3DRobustANGLE, context, target, level, internalformat, width,
+                           height, depth, border, format, type, bufSize, pixels);
+        context->texImage3DRobust(targetPacked, level, internalformat, width, height, depth, border,
+                                  format, type, bufSize, pixels);
+    }
+}
+
+void ValidatedTexParameterIivOES(Context *context, GLenum target, GLenum pname, const GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterIivOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexParameterIivOES(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexParameterIivOES, context, target, pname, params);
+        context->texParameterIiv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedTexParameterIivRobustANGLE(Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         const GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterIivRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexParameterIivRobustANGLE(context, targetPacked, pname, bufSize, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexParameterIivRobustANGLE, context, target, pname, bufSize, params);
+        context->texParameterIivRobust(targetPacked, pname, bufSize, params);
+    }
+}
+
+void ValidatedTexParameterIuivOES(Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  const GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterIuivOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexParameterIuivOES(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexParameterIuivOES, context, target, pname, params);
+        context->texParameterIuiv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedTexParameterIuivRobustANGLE(Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          const GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterIuivRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexParameterIuivRobustANGLE(context, targetPacked, pname, bufSize, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexParameterIuivRobustANGLE, context, target, pname, bufSize, params);
+        context->texParameterIuivRobust(targetPacked, pname, bufSize, params);
+    }
+}
+
+void ValidatedTexParameterf(Context *context, GLenum target, GLenum pname, GLfloat param)
+{
+    ANGLE_DEFER_COMMAND(TexParameterf, context, target, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterf);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexParameterf(context, targetPacked, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexParameterf, context, target, pname, param);
+        context->texParameterf(targetPacked, pname, param);
+    }
+}
+
+void ValidatedTexParameterfv(Context *context, GLenum target, GLenum pname, const GLfloat *params)
+{
+    ANGLE_DEFER_COMMAND(TexParameterfv, context, target, pname, params);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterfv);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexParameterfv(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexParameterfv, context, target, pname, params);
+        context->texParameterfv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedTexParameterfvRobustANGLE(Context *context,
+                                        GLenum target,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterfvRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexParameterfvRobustANGLE(context, targetPacked, pname, bufSize, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexParameterfvRobustANGLE, context, target, pname, bufSize, params);
+        context->texParameterfvRobust(targetPacked, pname, bufSize, params);
+    }
+}
+
+void ValidatedTexParameteri(Context *context, GLenum target, GLenum pname, GLint param)
+{
+    ANGLE_DEFER_COMMAND(TexParameteri, context, target, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameteri);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexParameteri(context, targetPacked, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexParameteri, context, target, pname, param);
+        context->texParameteri(targetPacked, pname, param);
+    }
+}
+
+void ValidatedTexParameteriv(Context *context, GLenum target, GLenum pname, const GLint *params)
+{
+    ANGLE_DEFER_COMMAND(TexParameteriv, context, target, pname, params);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameteriv);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexParameteriv(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexParameteriv, context, target, pname, params);
+        context->texParameteriv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedTexParameterivRobustANGLE(Context *context,
+                                        GLenum target,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        const GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterivRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexParameterivRobustANGLE(context, targetPacked, pname, bufSize, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexParameterivRobustANGLE, context, target, pname, bufSize, params);
+        context->texParameterivRobust(targetPacked, pname, bufSize, params);
+    }
+}
+
+void ValidatedTexParameterx(Context *context, GLenum target, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterx);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexParameterx(context, targetPacked, pname, param))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexParameterx, context, target, pname, param);
+        context->texParameterx(targetPacked, pname, param);
+    }
+}
+
+void ValidatedTexParameterxv(Context *context, GLenum target, GLenum pname, const GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterxv);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexParameterxv(context, targetPacked, pname, params))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexParameterxv, context, target, pname, params);
+        context->texParameterxv(targetPacked, pname, params);
+    }
+}
+
+void ValidatedTexStorage1DEXT(Context *context,
+                              GLenum target,
+                              GLsizei levels,
+                              GLenum internalformat,
+                              GLsizei width)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage1DEXT);
+    if (ValidateTexStorage1DEXT(context, target, levels, internalformat, width))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexStorage1DEXT, context, target, levels, internalformat, width);
+        context->texStorage1D(target, levels, internalformat, width);
+    }
+}
+
+void ValidatedTexStorage2D(Context *context,
+                           GLenum target,
+                           GLsizei levels,
+                           GLenum internalformat,
+                           GLsizei width,
+                           GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(TexStorage2D, context, target, levels, internalformat, width, height);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage2D);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexStorage2D(context, targetPacked, levels, internalformat, width, height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexStorage2D, context, target, levels, internalformat, width, height);
+        context->texStorage2D(targetPacked, levels, internalformat, width, height);
+    }
+}
+
+void ValidatedTexStorage2DEXT(Context *context,
+                              GLenum target,
+                              GLsizei levels,
+                              GLenum internalformat,
+                              GLsizei width,
+                              GLsizei height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage2DEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexStorage2DEXT(context, targetPacked, levels, internalformat, width, height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexStorage2DEXT, context, target, levels, internalformat, width, height);
+        context->texStorage2D(targetPacked, levels, internalformat, width, height);
+    }
+}
+
+void ValidatedTexStorage2DMultisample(Context *context,
+                                      GLenum target,
+                                      GLsizei samples,
+                                      GLenum internalformat,
+                                      GLsizei width,
+                                      GLsizei height,
+                                      GLboolean fixedsamplelocations)
+{
+    ANGLE_DEFER_COMMAND(TexStorage2DMultisample, context, target, samples, internalformat, width,
+                        height, fixedsamplelocations);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage2DMultisample);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexStorage2DMultisample(context, targetPacked, samples, internalformat, width,
+                                        height, fixedsamplelocations))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexStorage2DMultisample, context, target, samples, internalformat, width,
+                           height, fixedsamplelocations);
+        context->texStorage2DMultisample(targetPacked, samples, internalformat, width, height,
+                                         fixedsamplelocations);
+    }
+}
+
+void ValidatedTexStorage2DMultisampleANGLE(Context *context,
+                                           GLenum target,
+                                           GLsizei samples,
+                                           GLenum internalformat,
+                                           GLsizei width,
+                                           GLsizei height,
+                                           GLboolean fixedsamplelocations)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage2DMultisampleANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexStorage2DMultisampleANGLE(context, targetPacked, samples, internalformat, width,
+                                             height, fixedsamplelocations))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexStorage2DMultisampleANGLE, context, target, samples, internalformat,
+                           width, height, fixedsamplelocations);
+        context->texStorage2DMultisample(targetPacked, samples, internalformat, width, height,
+                                         fixedsamplelocations);
+    }
+}
+
+void ValidatedTexStorage3D(Context *context,
+                           GLenum target,
+                           GLsizei levels,
+                           GLenum internalformat,
+                           GLsizei width,
+                           GLsizei height,
+                           GLsizei depth)
+{
+    ANGLE_DEFER_COMMAND(TexStorage3D, context, target, levels, internalformat, width, height,
+                        depth);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage3D);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexStorage3D(context, targetPacked, levels, internalformat, width, height, depth))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexStorage3D, context, target, levels, internalformat, width, height,
+                           depth);
+        context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
+    }
+}
+
+void ValidatedTexStorage3DEXT(Context *context,
+                              GLenum target,
+                              GLsizei levels,
+                              GLenum internalformat,
+                              GLsizei width,
+                              GLsizei height,
+                              GLsizei depth)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage3DEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexStorage3DEXT(context, targetPacked, levels, internalformat, width, height,
+                                depth))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexStorage3DEXT, context, target, levels, internalformat, width, height,
+                           depth);
+        context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
+    }
+}
+
+void ValidatedTexStorage3DMultisampleOES(Context *context,
+                                         GLenum target,
+                                         GLsizei samples,
+                                         GLenum internalformat,
+                                         GLsizei width,
+                                         GLsizei height,
+                                         GLsizei depth,
+                                         GLboolean fixedsamplelocations)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage3DMultisampleOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexStorage3DMultisampleOES(context, targetPacked, samples, internalformat, width,
+                                           height, depth, fixedsamplelocations))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexStorage3DMultisampleOES, context, target, samples, internalformat,
+                           width, height, depth, fixedsamplelocations);
+        context->texStorage3DMultisample(targetPacked, samples, internalformat, width, height,
+                                         depth, fixedsamplelocations);
+    }
+}
+
+void ValidatedTexStorageMem2DEXT(Context *context,
+                                 GLenum target,
+                                 GLsizei levels,
+                                 GLenum internalFormat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLuint memory,
+                                 GLuint64 offset)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorageMem2DEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexStorageMem2DEXT(context, targetPacked, levels, internalFormat, width, height,
+                                   memory, offset))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexStorageMem2DEXT, context, target, levels, internalFormat, width,
+                           height, memory, offset);
+        context->texStorageMem2D(targetPacked, levels, internalFormat, width, height, memory,
+                                 offset);
+    }
+}
+
+void ValidatedTexStorageMem2DMultisampleEXT(Context *context,
+                                            GLenum target,
+                                            GLsizei samples,
+                                            GLenum internalFormat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLboolean fixedSampleLocations,
+                                            GLuint memory,
+                                            GLuint64 offset)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorageMem2DMultisampleEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexStorageMem2DMultisampleEXT(context, targetPacked, samples, internalFormat, width,
+                                              height, fixedSampleLocations, memory, offset))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexStorageMem2DMultisampleEXT, context, target, samples, internalFormat,
+                           width, height, fixedSampleLocations, memory, offset);
+        context->texStorageMem2DMultisample(targetPacked, samples, internalFormat, width, height,
+                                            fixedSampleLocations, memory, offset);
+    }
+}
+
+void ValidatedTexStorageMem3DEXT(Context *context,
+                                 GLenum target,
+                                 GLsizei levels,
+                                 GLenum internalFormat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLsizei depth,
+                                 GLuint memory,
+                                 GLuint64 offset)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorageMem3DEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexStorageMem3DEXT(context, targetPacked, levels, internalFormat, width, height,
+                                   depth, memory, offset))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexStorageMem3DEXT, context, target, levels, internalFormat, width,
+                           height, depth, memory, offset);
+        context->texStorageMem3D(targetPacked, levels, internalFormat, width, height, depth, memory,
+                                 offset);
+    }
+}
+
+void ValidatedTexStorageMem3DMultisampleEXT(Context *context,
+                                            GLenum target,
+                                            GLsizei samples,
+                                            GLenum internalFormat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLsizei depth,
+                                            GLboolean fixedSampleLocations,
+                                            GLuint memory,
+                                            GLuint64 offset)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorageMem3DMultisampleEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    if (ValidateTexStorageMem3DMultisampleEXT(context, targetPacked, samples, internalFormat, width,
+                                              height, depth, fixedSampleLocations, memory, offset))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexStorageMem3DMultisampleEXT, context, target, samples, internalFormat,
+                           width, height, depth, fixedSampleLocations, memory, offset);
+        context->texStorageMem3DMultisample(targetPacked, samples, internalFormat, width, height,
+                                            depth, fixedSampleLocations, memory, offset);
+    }
+}
+
+void ValidatedTexSubImage2D(Context *context,
+                            GLenum target,
+                            GLint level,
+                            GLint xoffset,
+                            GLint yoffset,
+                            GLsizei width,
+                            GLsizei height,
+                            GLenum format,
+                            GLenum type,
+                            const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexSubImage2D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateTexSubImage2D(context, targetPacked, level, xoffset, yoffset, width, height, format,
+                              type, pixels))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexSubImage2D, context, target, level, xoffset, yoffset, width, height,
+                           format, type, pixels);
+        context->texSubImage2D(targetPacked, level, xoffset, yoffset, width, height, format, type,
+                               pixels);
+    }
+}
+
+void ValidatedTexSubImage2DRobustANGLE(Context *context,
+                                       GLenum target,
+                                       GLint level,
+                                       GLint xoffset,
+                                       GLint yoffset,
+                                       GLsizei width,
+                                       GLsizei height,
+                                       GLenum format,
+                                       GLenum type,
+                                       GLsizei bufSize,
+                                       const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexSubImage2DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateTexSubImage2DRobustANGLE(context, targetPacked, level, xoffset, yoffset, width,
+                                         height, format, type, bufSize, pixels))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexSubImage2DRobustANGLE, context, target, level, xoffset, yoffset,
+                           width, height, format, type, bufSize, pixels);
+        context->texSubImage2DRobust(targetPacked, level, xoffset, yoffset, width, height, format,
+                                     type, bufSize, pixels);
+    }
+}
+
+void ValidatedTexSubImage3D(Context *context,
+                            GLenum target,
+                            GLint level,
+                            GLint xoffset,
+                            GLint yoffset,
+                            GLint zoffset,
+                            GLsizei width,
+                            GLsizei height,
+                            GLsizei depth,
+                            GLenum format,
+                            GLenum type,
+                            const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexSubImage3D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateTexSubImage3D(context, targetPacked, level, xoffset, yoffset, zoffset, width,
+                              height, depth, format, type, pixels))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexSubImage3D, context, target, level, xoffset, yoffset, zoffset, width,
+                           height, depth, format, type, pixels);
+        context->texSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width, height, depth,
+                               format, type, pixels);
+    }
+}
+
+void ValidatedTexSubImage3DRobustANGLE(Context *context,
+                                       GLenum target,
+                                       GLint level,
+                                       GLint xoffset,
+                                       GLint yoffset,
+                                       GLint zoffset,
+                                       GLsizei width,
+                                       GLsizei height,
+                                       GLsizei depth,
+                                       GLenum format,
+                                       GLenum type,
+                                       GLsizei bufSize,
+                                       const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexSubImage3DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    if (ValidateTexSubImage3DRobustANGLE(context, targetPacked, level, xoffset, yoffset, zoffset,
+                                         width, height, depth, format, type, bufSize, pixels))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TexSubImage3DRobustANGLE, context, target, level, xoffset, yoffset,
+                           zoffset, width, height, depth, format, type, bufSize, pixels);
+        context->texSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset, width, height,
+                                     depth, format, type, bufSize, pixels);
+    }
+}
+
+void ValidatedTransformFeedbackVaryings(Context *context,
+                                        GLuint program,
+                                        GLsizei count,
+                                        const GLchar *const *varyings,
+                                        GLenum bufferMode)
+{
+    ANGLE_DEFER_COMMAND(TransformFeedbackVaryings, context, program, count, varyings, bufferMode);
+    ANGLE_PROFILE_ENTRY_POINT(TransformFeedbackVaryings);
+    if (ValidateTransformFeedbackVaryings(context, program, count, varyings, bufferMode))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(TransformFeedbackVaryings, context, program, count, varyings,
+                           bufferMode);
+        context->transformFeedbackVaryings(program, count, varyings, bufferMode);
+    }
+}
+
+void ValidatedTranslatef(Context *context, GLfloat x, GLfloat y, GLfloat z)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(Translatef);
+    if (ValidateTranslatef(context, x, y, z))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Translatef, context, x, y, z);
+        context->translatef(x, y, z);
+    }
+}
+
+void ValidatedTranslatex(Context *context, GLfixed x, GLfixed y, GLfixed z)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Translatex);
+    if (ValidateTranslatex(context, x, y, z))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Translatex, context, x, y, z);
+        context->translatex(x, y, z);
+    }
+}
+
+void ValidatedUniform1f(Context *context, GLint location, GLfloat v0)
+{
+    ANGLE_DEFER_COMMAND(Uniform1f, context, location, v0);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform1f);
+    if (ValidateUniform1f(context, location, v0))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform1f, context, location, v0);
+        context->uniform1f(location, v0);
+    }
+}
+
+void ValidatedUniform1fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform1fv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform1fv);
+    if (ValidateUniform1fv(context, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform1fv, context, location, count, value);
+        context->uniform1fv(location, count, value);
+    }
+}
+
+void ValidatedUniform1i(Context *context, GLint location, GLint v0)
+{
+    ANGLE_DEFER_COMMAND(Uniform1i, context, location, v0);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform1i);
+    if (ValidateUniform1i(context, location, v0))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform1i, context, location, v0);
+        context->uniform1i(location, v0);
+    }
+}
+
+void ValidatedUniform1iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform1iv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform1iv);
+    if (ValidateUniform1iv(context, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform1iv, context, location, count, value);
+        context->uniform1iv(location, count, value);
+    }
+}
+
+void ValidatedUniform1ui(Context *context, GLint location, GLuint v0)
+{
+    ANGLE_DEFER_COMMAND(Uniform1ui, context, location, v0);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform1ui);
+    if (ValidateUniform1ui(context, location, v0))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform1ui, context, location, v0);
+        context->uniform1ui(location, v0);
+    }
+}
+
+void ValidatedUniform1uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform1uiv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform1uiv);
+    if (ValidateUniform1uiv(context, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform1uiv, context, location, count, value);
+        context->uniform1uiv(location, count, value);
+    }
+}
+
+void ValidatedUniform2f(Context *context, GLint location, GLfloat v0, GLfloat v1)
+{
+    ANGLE_DEFER_COMMAND(Uniform2f, context, location, v0, v1);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform2f);
+    if (ValidateUniform2f(context, location, v0, v1))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform2f, context, location, v0, v1);
+        context->uniform2f(location, v0, v1);
+    }
+}
+
+void ValidatedUniform2fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform2fv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform2fv);
+    if (ValidateUniform2fv(context, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform2fv, context, location, count, value);
+        context->uniform2fv(location, count, value);
+    }
+}
+
+void ValidatedUniform2i(Context *context, GLint location, GLint v0, GLint v1)
+{
+    ANGLE_DEFER_COMMAND(Uniform2i, context, location, v0, v1);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform2i);
+    if (ValidateUniform2i(context, location, v0, v1))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform2i, context, location, v0, v1);
+        context->uniform2i(location, v0, v1);
+    }
+}
+
+void ValidatedUniform2iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform2iv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform2iv);
+    if (ValidateUniform2iv(context, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform2iv, context, location, count, value);
+        context->uniform2iv(location, count, value);
+    }
+}
+
+void ValidatedUniform2ui(Context *context, GLint location, GLuint v0, GLuint v1)
+{
+    ANGLE_DEFER_COMMAND(Uniform2ui, context, location, v0, v1);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform2ui);
+    if (ValidateUniform2ui(context, location, v0, v1))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform2ui, context, location, v0, v1);
+        context->uniform2ui(location, v0, v1);
+    }
+}
+
+void ValidatedUniform2uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform2uiv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform2uiv);
+    if (ValidateUniform2uiv(context, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform2uiv, context, location, count, value);
+        context->uniform2uiv(location, count, value);
+    }
+}
+
+void ValidatedUniform3f(Context *context, GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
+{
+    ANGLE_DEFER_COMMAND(Uniform3f, context, location, v0, v1, v2);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform3f);
+    if (ValidateUniform3f(context, location, v0, v1, v2))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform3f, context, location, v0, v1, v2);
+        context->uniform3f(location, v0, v1, v2);
+    }
+}
+
+void ValidatedUniform3fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform3fv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform3fv);
+    if (ValidateUniform3fv(context, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform3fv, context, location, count, value);
+        context->uniform3fv(location, count, value);
+    }
+}
+
+void ValidatedUniform3i(Context *context, GLint location, GLint v0, GLint v1, GLint v2)
+{
+    ANGLE_DEFER_COMMAND(Uniform3i, context, location, v0, v1, v2);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform3i);
+    if (ValidateUniform3i(context, location, v0, v1, v2))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform3i, context, location, v0, v1, v2);
+        context->uniform3i(location, v0, v1, v2);
+    }
+}
+
+void ValidatedUniform3iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform3iv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform3iv);
+    if (ValidateUniform3iv(context, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform3iv, context, location, count, value);
+        context->uniform3iv(location, count, value);
+    }
+}
+
+void ValidatedUniform3ui(Context *context, GLint location, GLuint v0, GLuint v1, GLuint v2)
+{
+    ANGLE_DEFER_COMMAND(Uniform3ui, context, location, v0, v1, v2);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform3ui);
+    if (ValidateUniform3ui(context, location, v0, v1, v2))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform3ui, context, location, v0, v1, v2);
+        context->uniform3ui(location, v0, v1, v2);
+    }
+}
+
+void ValidatedUniform3uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform3uiv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform3uiv);
+    if (ValidateUniform3uiv(context, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform3uiv, context, location, count, value);
+        context->uniform3uiv(location, count, value);
+    }
+}
+
+void ValidatedUniform4f(Context *context,
+                        GLint location,
+                        GLfloat v0,
+                        GLfloat v1,
+                        GLfloat v2,
+                        GLfloat v3)
+{
+    ANGLE_DEFER_COMMAND(Uniform4f, context, location, v0, v1, v2, v3);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform4f);
+    if (ValidateUniform4f(context, location, v0, v1, v2, v3))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform4f, context, location, v0, v1, v2, v3);
+        context->uniform4f(location, v0, v1, v2, v3);
+    }
+}
+
+void ValidatedUniform4fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform4fv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform4fv);
+    if (ValidateUniform4fv(context, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform4fv, context, location, count, value);
+        context->uniform4fv(location, count, value);
+    }
+}
+
+void ValidatedUniform4i(Context *context, GLint location, GLint v0, GLint v1, GLint v2, GLint v3)
+{
+    ANGLE_DEFER_COMMAND(Uniform4i, context, location, v0, v1, v2, v3);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform4i);
+    if (ValidateUniform4i(context, location, v0, v1, v2, v3))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform4i, context, location, v0, v1, v2, v3);
+        context->uniform4i(location, v0, v1, v2, v3);
+    }
+}
+
+void ValidatedUniform4iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform4iv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform4iv);
+    if (ValidateUniform4iv(context, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform4iv, context, location, count, value);
+        context->uniform4iv(location, count, value);
+    }
+}
+
+void ValidatedUniform4ui(Context *context,
+                         GLint location,
+                         GLuint v0,
+                         GLuint v1,
+                         GLuint v2,
+                         GLuint v3)
+{
+    ANGLE_DEFER_COMMAND(Uniform4ui, context, location, v0, v1, v2, v3);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform4ui);
+    if (ValidateUniform4ui(context, location, v0, v1, v2, v3))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform4ui, context, location, v0, v1, v2, v3);
+        context->uniform4ui(location, v0, v1, v2, v3);
+    }
+}
+
+void ValidatedUniform4uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform4uiv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform4uiv);
+    if (ValidateUniform4uiv(context, location, count, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Uniform4uiv, context, location, count, value);
+        context->uniform4uiv(location, count, value);
+    }
+}
+
+void ValidatedUniformBlockBinding(Context *context,
+                                  GLuint program,
+                                  GLuint uniformBlockIndex,
+                                  GLuint uniformBlockBinding)
+{
+    ANGLE_DEFER_COMMAND(UniformBlockBinding, context, program, uniformBlockIndex,
+                        uniformBlockBinding);
+    ANGLE_PROFILE_ENTRY_POINT(UniformBlockBinding);
+    if (ValidateUniformBlockBinding(context, program, uniformBlockIndex, uniformBlockBinding))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UniformBlockBinding, context, program, uniformBlockIndex,
+                           uniformBlockBinding);
+        context->uniformBlockBinding(program, uniformBlockIndex, uniformBlockBinding);
+    }
+}
+
+void ValidatedUniformMatrix2fv(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix2fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix2fv);
+    if (ValidateUniformMatrix2fv(context, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UniformMatrix2fv, context, location, count, transpose, value);
+        context->uniformMatrix2fv(location, count, transpose, value);
+    }
+}
+
+void ValidatedUniformMatrix2x3fv(Context *context,
+                                 GLint location,
+                                 GLsizei count,
+                                 GLboolean transpose,
+                                 const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix2x3fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix2x3fv);
+    if (ValidateUniformMatrix2x3fv(context, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UniformMatrix2x3fv, context, location, count, transpose, value);
+        context->uniformMatrix2x3fv(location, count, transpose, value);
+    }
+}
+
+void ValidatedUniformMatrix2x4fv(Context *context,
+                                 GLint location,
+                                 GLsizei count,
+                                 GLboolean transpose,
+                                 const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix2x4fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix2x4fv);
+    if (ValidateUniformMatrix2x4fv(context, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UniformMatrix2x4fv, context, location, count, transpose, value);
+        context->uniformMatrix2x4fv(location, count, transpose, value);
+    }
+}
+
+void ValidatedUniformMatrix3fv(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix3fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix3fv);
+    if (ValidateUniformMatrix3fv(context, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UniformMatrix3fv, context, location, count, transpose, value);
+        context->uniformMatrix3fv(location, count, transpose, value);
+    }
+}
+
+void ValidatedUniformMatrix3x2fv(Context *context,
+                                 GLint location,
+                                 GLsizei count,
+                                 GLboolean transpose,
+                                 const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix3x2fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix3x2fv);
+    if (ValidateUniformMatrix3x2fv(context, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UniformMatrix3x2fv, context, location, count, transpose, value);
+        context->uniformMatrix3x2fv(location, count, transpose, value);
+    }
+}
+
+void ValidatedUniformMatrix3x4fv(Context *context,
+                                 GLint location,
+                                 GLsizei count,
+                                 GLboolean transpose,
+                                 const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix3x4fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix3x4fv);
+    if (ValidateUniformMatrix3x4fv(context, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UniformMatrix3x4fv, context, location, count, transpose, value);
+        context->uniformMatrix3x4fv(location, count, transpose, value);
+    }
+}
+
+void ValidatedUniformMatrix4fv(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix4fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix4fv);
+    if (ValidateUniformMatrix4fv(context, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UniformMatrix4fv, context, location, count, transpose, value);
+        context->uniformMatrix4fv(location, count, transpose, value);
+    }
+}
+
+void ValidatedUniformMatrix4x2fv(Context *context,
+                                 GLint location,
+                                 GLsizei count,
+                                 GLboolean transpose,
+                                 const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix4x2fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix4x2fv);
+    if (ValidateUniformMatrix4x2fv(context, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UniformMatrix4x2fv, context, location, count, transpose, value);
+        context->uniformMatrix4x2fv(location, count, transpose, value);
+    }
+}
+
+void ValidatedUniformMatrix4x3fv(Context *context,
+                                 GLint location,
+                                 GLsizei count,
+                                 GLboolean transpose,
+                                 const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix4x3fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix4x3fv);
+    if (ValidateUniformMatrix4x3fv(context, location, count, transpose, value))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UniformMatrix4x3fv, context, location, count, transpose, value);
+        context->uniformMatrix4x3fv(location, count, transpose, value);
+    }
+}
+
+GLboolean ValidatedUnmapBuffer(Context *context, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(UnmapBuffer);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateUnmapBuffer(context, targetPacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UnmapBuffer, context, target);
+        return context->unmapBuffer(targetPacked);
+    }
+    return GetDefaultReturnValue<EntryPoint::UnmapBuffer, GLboolean>();
+}
+
+GLboolean ValidatedUnmapBufferOES(Context *context, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(UnmapBufferOES);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    if (ValidateUnmapBufferOES(context, targetPacked))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UnmapBufferOES, context, target);
+        return context->unmapBuffer(targetPacked);
+    }
+    return GetDefaultReturnValue<EntryPoint::UnmapBufferOES, GLboolean>();
+}
+
+void ValidatedUseProgram(Context *context, GLuint program)
+{
+    ANGLE_DEFER_COMMAND(UseProgram, context, program);
+    ANGLE_PROFILE_ENTRY_POINT(UseProgram);
+    if (ValidateUseProgram(context, program))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UseProgram, context, program);
+        context->useProgram(program);
+    }
+}
+
+void ValidatedUseProgramStages(Context *context, GLuint pipeline, GLbitfield stages, GLuint program)
+{
+    ANGLE_DEFER_COMMAND(UseProgramStages, context, pipeline, stages, program);
+    ANGLE_PROFILE_ENTRY_POINT(UseProgramStages);
+    if (ValidateUseProgramStages(context, pipeline, stages, program))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(UseProgramStages, context, pipeline, stages, program);
+        context->useProgramStages(pipeline, stages, program);
+    }
+}
+
+void ValidatedValidateProgram(Context *context, GLuint program)
+{
+    ANGLE_DEFER_COMMAND(ValidateProgram, context, program);
+    ANGLE_PROFILE_ENTRY_POINT(ValidateProgram);
+    if (ValidateValidateProgram(context, program))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ValidateProgram, context, program);
+        context->validateProgram(program);
+    }
+}
+
+void ValidatedValidateProgramPipeline(Context *context, GLuint pipeline)
+{
+    ANGLE_DEFER_COMMAND(ValidateProgramPipeline, context, pipeline);
+    ANGLE_PROFILE_ENTRY_POINT(ValidateProgramPipeline);
+    if (ValidateValidateProgramPipeline(context, pipeline))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(ValidateProgramPipeline, context, pipeline);
+        context->validateProgramPipeline(pipeline);
+    }
+}
+
+void ValidatedVertexAttrib1f(Context *context, GLuint index, GLfloat x)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib1f, context, index, x);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib1f);
+    if (ValidateVertexAttrib1f(context, index, x))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttrib1f, context, index, x);
+        context->vertexAttrib1f(index, x);
+    }
+}
+
+void ValidatedVertexAttrib1fv(Context *context, GLuint index, const GLfloat *v)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib1fv, context, index, v);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib1fv);
+    if (ValidateVertexAttrib1fv(context, index, v))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttrib1fv, context, index, v);
+        context->vertexAttrib1fv(index, v);
+    }
+}
+
+void ValidatedVertexAttrib2f(Context *context, GLuint index, GLfloat x, GLfloat y)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib2f, context, index, x, y);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib2f);
+    if (ValidateVertexAttrib2f(context, index, x, y))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttrib2f, context, index, x, y);
+        context->vertexAttrib2f(index, x, y);
+    }
+}
+
+void ValidatedVertexAttrib2fv(Context *context, GLuint index, const GLfloat *v)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib2fv, context, index, v);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib2fv);
+    if (ValidateVertexAttrib2fv(context, index, v))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttrib2fv, context, index, v);
+        context->vertexAttrib2fv(index, v);
+    }
+}
+
+void ValidatedVertexAttrib3f(Context *context, GLuint index, GLfloat x, GLfloat y, GLfloat z)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib3f, context, index, x, y, z);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib3f);
+    if (ValidateVertexAttrib3f(context, index, x, y, z))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttrib3f, context, index, x, y, z);
+        context->vertexAttrib3f(index, x, y, z);
+    }
+}
+
+void ValidatedVertexAttrib3fv(Context *context, GLuint index, const GLfloat *v)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib3fv, context, index, v);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib3fv);
+    if (ValidateVertexAttrib3fv(context, index, v))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttrib3fv, context, index, v);
+        context->vertexAttrib3fv(index, v);
+    }
+}
+
+void ValidatedVertexAttrib4f(Context *context,
+                             GLuint index,
+                             GLfloat x,
+                             GLfloat y,
+                             GLfloat z,
+                             GLfloat w)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib4f, context, index, x, y, z, w);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib4f);
+    if (ValidateVertexAttrib4f(context, index, x, y, z, w))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttrib4f, context, index, x, y, z, w);
+        context->vertexAttrib4f(index, x, y, z, w);
+    }
+}
+
+void ValidatedVertexAttrib4fv(Context *context, GLuint index, const GLfloat *v)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib4fv, context, index, v);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib4fv);
+    if (ValidateVertexAttrib4fv(context, index, v))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttrib4fv, context, index, v);
+        context->vertexAttrib4fv(index, v);
+    }
+}
+
+void ValidatedVertexAttribBinding(Context *context, GLuint attribindex, GLuint bindingindex)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribBinding, context, attribindex, bindingindex);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribBinding);
+    if (ValidateVertexAttribBinding(context, attribindex, bindingindex))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttribBinding, context, attribindex, bindingindex);
+        context->vertexAttribBinding(attribindex, bindingindex);
+    }
+}
+
+void ValidatedVertexAttribDivisor(Context *context, GLuint index, GLuint divisor)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribDivisor, context, index, divisor);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribDivisor);
+    if (ValidateVertexAttribDivisor(context, index, divisor))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttribDivisor, context, index, divisor);
+        context->vertexAttribDivisor(index, divisor);
+    }
+}
+
+void ValidatedVertexAttribDivisorANGLE(Context *context, GLuint index, GLuint divisor)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribDivisorANGLE);
+    if (ValidateVertexAttribDivisorANGLE(context, index, divisor))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttribDivisorANGLE, context, index, divisor);
+        context->vertexAttribDivisor(index, divisor);
+    }
+}
+
+void ValidatedVertexAttribDivisorEXT(Context *context, GLuint index, GLuint divisor)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribDivisorEXT);
+    if (ValidateVertexAttribDivisorEXT(context, index, divisor))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttribDivisorEXT, context, index, divisor);
+        context->vertexAttribDivisor(index, divisor);
+    }
+}
+
+void ValidatedVertexAttribFormat(Context *context,
+                                 GLuint attribindex,
+                                 GLint size,
+                                 GLenum type,
+                                 GLboolean normalized,
+                                 GLuint relativeoffset)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribFormat, context, attribindex, size, type, normalized,
+                        relativeoffset);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribFormat);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    if (ValidateVertexAttribFormat(context, attribindex, size, typePacked, normalized,
+                                   relativeoffset))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttribFormat, context, attribindex, size, type, normalized,
+                           relativeoffset);
+        context->vertexAttribFormat(attribindex, size, typePacked, normalized, relativeoffset);
+    }
+}
+
+void ValidatedVertexAttribI4i(Context *context, GLuint index, GLint x, GLint y, GLint z, GLint w)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribI4i, context, index, x, y, z, w);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribI4i);
+    if (ValidateVertexAttribI4i(context, index, x, y, z, w))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttribI4i, context, index, x, y, z, w);
+        context->vertexAttribI4i(index, x, y, z, w);
+    }
+}
+
+void ValidatedVertexAttribI4iv(Context *context, GLuint index, const GLint *v)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribI4iv, context, index, v);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribI4iv);
+    if (ValidateVertexAttribI4iv(context, index, v))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttribI4iv, context, index, v);
+        context->vertexAttribI4iv(index, v);
+    }
+}
+
+void ValidatedVertexAttribI4ui(Context *context,
+                               GLuint index,
+                               GLuint x,
+                               GLuint y,
+                               GLuint z,
+                               GLuint w)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribI4ui, context, index, x, y, z, w);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribI4ui);
+    if (ValidateVertexAttribI4ui(context, index, x, y, z, w))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttribI4ui, context, index, x, y, z, w);
+        context->vertexAttribI4ui(index, x, y, z, w);
+    }
+}
+
+void ValidatedVertexAttribI4uiv(Context *context, GLuint index, const GLuint *v)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribI4uiv, context, index, v);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribI4uiv);
+    if (ValidateVertexAttribI4uiv(context, index, v))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttribI4uiv, context, index, v);
+        context->vertexAttribI4uiv(index, v);
+    }
+}
+
+void ValidatedVertexAttribIFormat(Context *context,
+                                  GLuint attribindex,
+                                  GLint size,
+                                  GLenum type,
+                                  GLuint relativeoffset)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribIFormat, context, attribindex, size, type, relativeoffset);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribIFormat);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    if (ValidateVertexAttribIFormat(context, attribindex, size, typePacked, relativeoffset))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttribIFormat, context, attribindex, size, type, relativeoffset);
+        context->vertexAttribIFormat(attribindex, size, typePacked, relativeoffset);
+    }
+}
+
+void ValidatedVertexAttribIPointer(Context *context,
+                                   GLuint index,
+                                   GLint size,
+                                   GLenum type,
+                                   GLsizei stride,
+                                   const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_FOR_CLIENT_ARRAY(context, pointer);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribIPointer);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    if (ValidateVertexAttribIPointer(context, index, size, typePacked, stride, pointer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttribIPointer, context, index, size, type, stride, pointer);
+        context->vertexAttribIPointer(index, size, typePacked, stride, pointer);
+    }
+}
+
+void ValidatedVertexAttribPointer(Context *context,
+                                  GLuint index,
+                                  GLint size,
+                                  GLenum type,
+                                  GLboolean normalized,
+                                  GLsizei stride,
+                                  const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_FOR_CLIENT_ARRAY(context, pointer);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribPointer);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    if (ValidateVertexAttribPointer(context, index, size, typePacked, normalized, stride, pointer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexAttribPointer, context, index, size, type, normalized, stride,
+                           pointer);
+        context->vertexAttribPointer(index, size, typePacked, normalized, stride, pointer);
+    }
+}
+
+void ValidatedVertexBindingDivisor(Context *context, GLuint bindingindex, GLuint divisor)
+{
+    ANGLE_DEFER_COMMAND(VertexBindingDivisor, context, bindingindex, divisor);
+    ANGLE_PROFILE_ENTRY_POINT(VertexBindingDivisor);
+    if (ValidateVertexBindingDivisor(context, bindingindex, divisor))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexBindingDivisor, context, bindingindex, divisor);
+        context->vertexBindingDivisor(bindingindex, divisor);
+    }
+}
+
+void ValidatedVertexPointer(Context *context,
+                            GLint size,
+                            GLenum type,
+                            GLsizei stride,
+                            const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(VertexPointer);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    if (ValidateVertexPointer(context, size, typePacked, stride, pointer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(VertexPointer, context, size, type, stride, pointer);
+        context->vertexPointer(size, typePacked, stride, pointer);
+    }
+}
+
+void ValidatedViewport(Context *context, GLint x, GLint y, GLsizei width, GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(Viewport, context, x, y, width, height);
+    ANGLE_PROFILE_ENTRY_POINT(Viewport);
+    if (ValidateViewport(context, x, y, width, height))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(Viewport, context, x, y, width, height);
+        context->viewport(x, y, width, height);
+    }
+}
+
+void ValidatedWaitSemaphoreEXT(Context *context,
+                               GLuint semaphore,
+                               GLuint numBufferBarriers,
+                               const GLuint *buffers,
+                               GLuint numTextureBarriers,
+                               const GLuint *textures,
+                               const GLenum *srcLayouts)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(WaitSemaphoreEXT);
+    if (ValidateWaitSemaphoreEXT(context, semaphore, numBufferBarriers, buffers, numTextureBarriers,
+                                 textures, srcLayouts))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(WaitSemaphoreEXT, context, semaphore, numBufferBarriers, buffers,
+                           numTextureBarriers, textures, srcLayouts);
+        context->waitSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers, textures,
+                               srcLayouts);
+    }
+}
+
+void ValidatedWaitSync(Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout)
+{
+    ANGLE_DEFER_COMMAND(WaitSync, context, sync, flags, timeout);
+    ANGLE_PROFILE_ENTRY_POINT(WaitSync);
+    if (ValidateWaitSync(context, sync, flags, timeout))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(WaitSync, context, sync, flags, timeout);
+        context->waitSync(sync, flags, timeout);
+    }
+}
+
+void ValidatedWeightPointerOES(Context *context,
+                               GLint size,
+                               GLenum type,
+                               GLsizei stride,
+                               const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(WeightPointerOES);
+    if (ValidateWeightPointerOES(context, size, type, stride, pointer))
+    {
+        ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+        ANGLE_CAPTURE_CALL(WeightPointerOES, context, size, type, stride, pointer);
+        context->weightPointer(size, type, stride, pointer);
+    }
+}
+
+void NoErrorActiveShaderProgram(Context *context, GLuint pipeline, GLuint program)
+{
+    ANGLE_DEFER_COMMAND(ActiveShaderProgram, context, pipeline, program);
+    ANGLE_PROFILE_ENTRY_POINT(ActiveShaderProgram);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ActiveShaderProgram, context, pipeline, program);
+    context->activeShaderProgram(pipeline, program);
+}
+
+void NoErrorActiveTexture(Context *context, GLenum texture)
+{
+    ANGLE_DEFER_COMMAND(ActiveTexture, context, texture);
+    ANGLE_PROFILE_ENTRY_POINT(ActiveTexture);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ActiveTexture, context, texture);
+    context->activeTexture(texture);
+}
+
+void NoErrorAlphaFunc(Context *context, GLenum func, GLfloat ref)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(AlphaFunc);
+    AlphaTestFunc funcPacked = FromGLenum<AlphaTestFunc>(func);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(AlphaFunc, context, func, ref);
+    context->alphaFunc(funcPacked, ref);
+}
+
+void NoErrorAlphaFuncx(Context *context, GLenum func, GLfixed ref)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(AlphaFuncx);
+    AlphaTestFunc funcPacked = FromGLenum<AlphaTestFunc>(func);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(AlphaFuncx, context, func, ref);
+    context->alphaFuncx(funcPacked, ref);
+}
+
+void NoErrorAttachShader(Context *context, GLuint program, GLuint shader)
+{
+    ANGLE_DEFER_COMMAND(AttachShader, context, program, shader);
+    ANGLE_PROFILE_ENTRY_POINT(AttachShader);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(AttachShader, context, program, shader);
+    context->attachShader(program, shader);
+}
+
+void NoErrorBeginQuery(Context *context, GLenum target, GLuint id)
+{
+    ANGLE_DEFER_COMMAND(BeginQuery, context, target, id);
+    ANGLE_PROFILE_ENTRY_POINT(BeginQuery);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BeginQuery, context, target, id);
+    context->beginQuery(targetPacked, id);
+}
+
+void NoErrorBeginQueryEXT(Context *context, GLenum target, GLuint id)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BeginQueryEXT);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BeginQueryEXT, context, target, id);
+    context->beginQuery(targetPacked, id);
+}
+
+void NoErrorBeginTransformFeedback(Context *context, GLenum primitiveMode)
+{
+    ANGLE_DEFER_COMMAND(BeginTransformFeedback, context, primitiveMode);
+    ANGLE_PROFILE_ENTRY_POINT(BeginTransformFeedback);
+    PrimitiveMode primitiveModePacked = FromGLenum<PrimitiveMode>(primitiveMode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BeginTransformFeedback, context, primitiveMode);
+    context->beginTransformFeedback(primitiveModePacked);
+}
+
+void NoErrorBindAttribLocation(Context *context, GLuint program, GLuint index, const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindAttribLocation);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindAttribLocation, context, program, index, name);
+    context->bindAttribLocation(program, index, name);
+}
+
+void NoErrorBindBuffer(Context *context, GLenum target, GLuint buffer)
+{
+    ANGLE_DEFER_COMMAND(BindBuffer, context, target, buffer);
+    ANGLE_PROFILE_ENTRY_POINT(BindBuffer);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindBuffer, context, target, buffer);
+    context->bindBuffer(targetPacked, buffer);
+}
+
+void NoErrorBindBufferBase(Context *context, GLenum target, GLuint index, GLuint buffer)
+{
+    ANGLE_DEFER_COMMAND(BindBufferBase, context, target, index, buffer);
+    ANGLE_PROFILE_ENTRY_POINT(BindBufferBase);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindBufferBase, context, target, index, buffer);
+    context->bindBufferBase(targetPacked, index, buffer);
+}
+
+void NoErrorBindBufferRange(Context *context,
+                            GLenum target,
+                            GLuint index,
+                            GLuint buffer,
+                            GLintptr offset,
+                            GLsizeiptr size)
+{
+    ANGLE_DEFER_COMMAND(BindBufferRange, context, target, index, buffer, offset, size);
+    ANGLE_PROFILE_ENTRY_POINT(BindBufferRange);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindBufferRange, context, target, index, buffer, offset, size);
+    context->bindBufferRange(targetPacked, index, buffer, offset, size);
+}
+
+void NoErrorBindFragDataLocationEXT(Context *context,
+                                    GLuint program,
+                                    GLuint color,
+                                    const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindFragDataLocationEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindFragDataLocationEXT, context, program, color, name);
+    context->bindFragDataLocation(program, color, name);
+}
+
+void NoErrorBindFragDataLocationIndexedEXT(Context *context,
+                                           GLuint program,
+                                           GLuint colorNumber,
+                                           GLuint index,
+                                           const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindFragDataLocationIndexedEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindFragDataLocationIndexedEXT, context, program, colorNumber, index, name);
+    context->bindFragDataLocationIndexed(program, colorNumber, index, name);
+}
+
+void NoErrorBindFragmentInputLocationCHROMIUM(Context *context,
+                                              GLuint programs,
+                                              GLint location,
+                                              const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindFragmentInputLocationCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindFragmentInputLocationCHROMIUM, context, programs, location, name);
+    context->bindFragmentInputLocation(programs, location, name);
+}
+
+void NoErrorBindFramebuffer(Context *context, GLenum target, GLuint framebuffer)
+{
+    ANGLE_DEFER_COMMAND(BindFramebuffer, context, target, framebuffer);
+    ANGLE_PROFILE_ENTRY_POINT(BindFramebuffer);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindFramebuffer, context, target, framebuffer);
+    context->bindFramebuffer(target, framebuffer);
+}
+
+void NoErrorBindFramebufferOES(Context *context, GLenum target, GLuint framebuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindFramebufferOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindFramebufferOES, context, target, framebuffer);
+    context->bindFramebuffer(target, framebuffer);
+}
+
+void NoErrorBindImageTexture(Context *context,
+                             GLuint unit,
+                             GLuint texture,
+                             GLint level,
+                             GLboolean layered,
+                             GLint layer,
+                             GLenum access,
+                             GLenum format)
+{
+    ANGLE_DEFER_COMMAND(BindImageTexture, context, unit, texture, level, layered, layer, access,
+                        format);
+    ANGLE_PROFILE_ENTRY_POINT(BindImageTexture);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindImageTexture, context, unit, texture, level, layered, layer, access,
+                       format);
+    context->bindImageTexture(unit, texture, level, layered, layer, access, format);
+}
+
+void NoErrorBindProgramPipeline(Context *context, GLuint pipeline)
+{
+    ANGLE_DEFER_COMMAND(BindProgramPipeline, context, pipeline);
+    ANGLE_PROFILE_ENTRY_POINT(BindProgramPipeline);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindProgramPipeline, context, pipeline);
+    context->bindProgramPipeline(pipeline);
+}
+
+void NoErrorBindRenderbuffer(Context *context, GLenum target, GLuint renderbuffer)
+{
+    ANGLE_DEFER_COMMAND(BindRenderbuffer, context, target, renderbuffer);
+    ANGLE_PROFILE_ENTRY_POINT(BindRenderbuffer);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindRenderbuffer, context, target, renderbuffer);
+    context->bindRenderbuffer(target, renderbuffer);
+}
+
+void NoErrorBindRenderbufferOES(Context *context, GLenum target, GLuint renderbuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindRenderbufferOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindRenderbufferOES, context, target, renderbuffer);
+    context->bindRenderbuffer(target, renderbuffer);
+}
+
+void NoErrorBindSampler(Context *context, GLuint unit, GLuint sampler)
+{
+    ANGLE_DEFER_COMMAND(BindSampler, context, unit, sampler);
+    ANGLE_PROFILE_ENTRY_POINT(BindSampler);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindSampler, context, unit, sampler);
+    context->bindSampler(unit, sampler);
+}
+
+void NoErrorBindTexture(Context *context, GLenum target, GLuint texture)
+{
+    ANGLE_DEFER_COMMAND(BindTexture, context, target, texture);
+    ANGLE_PROFILE_ENTRY_POINT(BindTexture);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindTexture, context, target, texture);
+    context->bindTexture(targetPacked, texture);
+}
+
+void NoErrorBindTransformFeedback(Context *context, GLenum target, GLuint id)
+{
+    ANGLE_DEFER_COMMAND(BindTransformFeedback, context, target, id);
+    ANGLE_PROFILE_ENTRY_POINT(BindTransformFeedback);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindTransformFeedback, context, target, id);
+    context->bindTransformFeedback(target, id);
+}
+
+void NoErrorBindUniformLocationCHROMIUM(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindUniformLocationCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindUniformLocationCHROMIUM, context, program, location, name);
+    context->bindUniformLocation(program, location, name);
+}
+
+void NoErrorBindVertexArray(Context *context, GLuint array)
+{
+    ANGLE_DEFER_COMMAND(BindVertexArray, context, array);
+    ANGLE_PROFILE_ENTRY_POINT(BindVertexArray);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindVertexArray, context, array);
+    context->bindVertexArray(array);
+}
+
+void NoErrorBindVertexArrayOES(Context *context, GLuint array)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BindVertexArrayOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindVertexArrayOES, context, array);
+    context->bindVertexArray(array);
+}
+
+void NoErrorBindVertexBuffer(Context *context,
+                             GLuint bindingindex,
+                             GLuint buffer,
+                             GLintptr offset,
+                             GLsizei stride)
+{
+    ANGLE_DEFER_COMMAND(BindVertexBuffer, context, bindingindex, buffer, offset, stride);
+    ANGLE_PROFILE_ENTRY_POINT(BindVertexBuffer);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BindVertexBuffer, context, bindingindex, buffer, offset, stride);
+    context->bindVertexBuffer(bindingindex, buffer, offset, stride);
+}
+
+void NoErrorBlendColor(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+{
+    ANGLE_DEFER_COMMAND(BlendColor, context, red, green, blue, alpha);
+    ANGLE_PROFILE_ENTRY_POINT(BlendColor);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BlendColor, context, red, green, blue, alpha);
+    context->blendColor(red, green, blue, alpha);
+}
+
+void NoErrorBlendEquation(Context *context, GLenum mode)
+{
+    ANGLE_DEFER_COMMAND(BlendEquation, context, mode);
+    ANGLE_PROFILE_ENTRY_POINT(BlendEquation);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BlendEquation, context, mode);
+    context->blendEquation(mode);
+}
+
+void NoErrorBlendEquationSeparate(Context *context, GLenum modeRGB, GLenum modeAlpha)
+{
+    ANGLE_DEFER_COMMAND(BlendEquationSeparate, context, modeRGB, modeAlpha);
+    ANGLE_PROFILE_ENTRY_POINT(BlendEquationSeparate);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BlendEquationSeparate, context, modeRGB, modeAlpha);
+    context->blendEquationSeparate(modeRGB, modeAlpha);
+}
+
+void NoErrorBlendFunc(Context *context, GLenum sfactor, GLenum dfactor)
+{
+    ANGLE_DEFER_COMMAND(BlendFunc, context, sfactor, dfactor);
+    ANGLE_PROFILE_ENTRY_POINT(BlendFunc);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BlendFunc, context, sfactor, dfactor);
+    context->blendFunc(sfactor, dfactor);
+}
+
+void NoErrorBlendFuncSeparate(Context *context,
+                              GLenum sfactorRGB,
+                              GLenum dfactorRGB,
+                              GLenum sfactorAlpha,
+                              GLenum dfactorAlpha)
+{
+    ANGLE_DEFER_COMMAND(BlendFuncSeparate, context, sfactorRGB, dfactorRGB, sfactorAlpha,
+                        dfactorAlpha);
+    ANGLE_PROFILE_ENTRY_POINT(BlendFuncSeparate);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BlendFuncSeparate, context, sfactorRGB, dfactorRGB, sfactorAlpha,
+                       dfactorAlpha);
+    context->blendFuncSeparate(sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
+}
+
+void NoErrorBlitFramebuffer(Context *context,
+                            GLint srcX0,
+                            GLint srcY0,
+                            GLint srcX1,
+                            GLint srcY1,
+                            GLint dstX0,
+                            GLint dstY0,
+                            GLint dstX1,
+                            GLint dstY1,
+                            GLbitfield mask,
+                            GLenum filter)
+{
+    ANGLE_DEFER_COMMAND(BlitFramebuffer, context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
+                        dstY1, mask, filter);
+    ANGLE_PROFILE_ENTRY_POINT(BlitFramebuffer);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BlitFramebuffer, context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
+                       dstY1, mask, filter);
+    context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask, filter);
+}
+
+void NoErrorBlitFramebufferANGLE(Context *context,
+                                 GLint srcX0,
+                                 GLint srcY0,
+                                 GLint srcX1,
+                                 GLint srcY1,
+                                 GLint dstX0,
+                                 GLint dstY0,
+                                 GLint dstX1,
+                                 GLint dstY1,
+                                 GLbitfield mask,
+                                 GLenum filter)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BlitFramebufferANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BlitFramebufferANGLE, context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0,
+                       dstX1, dstY1, mask, filter);
+    context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask, filter);
+}
+
+void NoErrorBufferData(Context *context,
+                       GLenum target,
+                       GLsizeiptr size,
+                       const void *data,
+                       GLenum usage)
+{
+    ANGLE_DEFER_COMMAND(BufferData, context, target, size, data, usage);
+    ANGLE_PROFILE_ENTRY_POINT(BufferData);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    BufferUsage usagePacked    = FromGLenum<BufferUsage>(usage);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BufferData, context, target, size, data, usage);
+    context->bufferData(targetPacked, size, data, usagePacked);
+}
+
+void NoErrorBufferStorageMemEXT(Context *context,
+                                GLenum target,
+                                GLsizeiptr size,
+                                GLuint memory,
+                                GLuint64 offset)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(BufferStorageMemEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BufferStorageMemEXT, context, target, size, memory, offset);
+    context->bufferStorageMem(targetPacked, size, memory, offset);
+}
+
+void NoErrorBufferSubData(Context *context,
+                          GLenum target,
+                          GLintptr offset,
+                          GLsizeiptr size,
+                          const void *data)
+{
+    ANGLE_DEFER_COMMAND(BufferSubData, context, target, offset, size, data);
+    ANGLE_PROFILE_ENTRY_POINT(BufferSubData);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(BufferSubData, context, target, offset, size, data);
+    context->bufferSubData(targetPacked, offset, size, data);
+}
+
+GLenum NoErrorCheckFramebufferStatus(Context *context, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CheckFramebufferStatus);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CheckFramebufferStatus, context, target);
+    return context->checkFramebufferStatus(target);
+}
+
+GLenum NoErrorCheckFramebufferStatusOES(Context *context, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CheckFramebufferStatusOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CheckFramebufferStatusOES, context, target);
+    return context->checkFramebufferStatus(target);
+}
+
+void NoErrorClear(Context *context, GLbitfield mask)
+{
+    ANGLE_DEFER_COMMAND(Clear, context, mask);
+    ANGLE_PROFILE_ENTRY_POINT(Clear);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Clear, context, mask);
+    context->clear(mask);
+}
+
+void NoErrorClearBufferfi(Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          GLfloat depth,
+                          GLint stencil)
+{
+    ANGLE_DEFER_COMMAND(ClearBufferfi, context, buffer, drawbuffer, depth, stencil);
+    ANGLE_PROFILE_ENTRY_POINT(ClearBufferfi);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClearBufferfi, context, buffer, drawbuffer, depth, stencil);
+    context->clearBufferfi(buffer, drawbuffer, depth, stencil);
+}
+
+void NoErrorClearBufferfv(Context *context, GLenum buffer, GLint drawbuffer, const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ClearBufferfv, context, buffer, drawbuffer, value);
+    ANGLE_PROFILE_ENTRY_POINT(ClearBufferfv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClearBufferfv, context, buffer, drawbuffer, value);
+    context->clearBufferfv(buffer, drawbuffer, value);
+}
+
+void NoErrorClearBufferiv(Context *context, GLenum buffer, GLint drawbuffer, const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(ClearBufferiv, context, buffer, drawbuffer, value);
+    ANGLE_PROFILE_ENTRY_POINT(ClearBufferiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClearBufferiv, context, buffer, drawbuffer, value);
+    context->clearBufferiv(buffer, drawbuffer, value);
+}
+
+void NoErrorClearBufferuiv(Context *context, GLenum buffer, GLint drawbuffer, const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(ClearBufferuiv, context, buffer, drawbuffer, value);
+    ANGLE_PROFILE_ENTRY_POINT(ClearBufferuiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClearBufferuiv, context, buffer, drawbuffer, value);
+    context->clearBufferuiv(buffer, drawbuffer, value);
+}
+
+void NoErrorClearColor(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+{
+    ANGLE_DEFER_COMMAND(ClearColor, context, red, green, blue, alpha);
+    ANGLE_PROFILE_ENTRY_POINT(ClearColor);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClearColor, context, red, green, blue, alpha);
+    context->clearColor(red, green, blue, alpha);
+}
+
+void NoErrorClearColorx(Context *context, GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ClearColorx);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClearColorx, context, red, green, blue, alpha);
+    context->clearColorx(red, green, blue, alpha);
+}
+
+void NoErrorClearDepthf(Context *context, GLfloat d)
+{
+    ANGLE_DEFER_COMMAND(ClearDepthf, context, d);
+    ANGLE_PROFILE_ENTRY_POINT(ClearDepthf);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClearDepthf, context, d);
+    context->clearDepthf(d);
+}
+
+void NoErrorClearDepthx(Context *context, GLfixed depth)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ClearDepthx);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClearDepthx, context, depth);
+    context->clearDepthx(depth);
+}
+
+void NoErrorClearStencil(Context *context, GLint s)
+{
+    ANGLE_DEFER_COMMAND(ClearStencil, context, s);
+    ANGLE_PROFILE_ENTRY_POINT(ClearStencil);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClearStencil, context, s);
+    context->clearStencil(s);
+}
+
+void NoErrorClientActiveTexture(Context *context, GLenum texture)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(ClientActiveTexture);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClientActiveTexture, context, texture);
+    context->clientActiveTexture(texture);
+}
+
+GLenum NoErrorClientWaitSync(Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ClientWaitSync);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClientWaitSync, context, sync, flags, timeout);
+    return context->clientWaitSync(sync, flags, timeout);
+}
+
+void NoErrorClipPlanef(Context *context, GLenum p, const GLfloat *eqn)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ClipPlanef);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClipPlanef, context, p, eqn);
+    context->clipPlanef(p, eqn);
+}
+
+void NoErrorClipPlanex(Context *context, GLenum plane, const GLfixed *equation)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ClipPlanex);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ClipPlanex, context, plane, equation);
+    context->clipPlanex(plane, equation);
+}
+
+void NoErrorColor4f(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(Color4f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Color4f, context, red, green, blue, alpha);
+    context->color4f(red, green, blue, alpha);
+}
+
+void NoErrorColor4ub(Context *context, GLubyte red, GLubyte green, GLubyte blue, GLubyte alpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(Color4ub);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Color4ub, context, red, green, blue, alpha);
+    context->color4ub(red, green, blue, alpha);
+}
+
+void NoErrorColor4x(Context *context, GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Color4x);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Color4x, context, red, green, blue, alpha);
+    context->color4x(red, green, blue, alpha);
+}
+
+void NoErrorColorMask(Context *context,
+                      GLboolean red,
+                      GLboolean green,
+                      GLboolean blue,
+                      GLboolean alpha)
+{
+    ANGLE_DEFER_COMMAND(ColorMask, context, red, green, blue, alpha);
+    ANGLE_PROFILE_ENTRY_POINT(ColorMask);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ColorMask, context, red, green, blue, alpha);
+    context->colorMask(red, green, blue, alpha);
+}
+
+void NoErrorColorPointer(Context *context,
+                         GLint size,
+                         GLenum type,
+                         GLsizei stride,
+                         const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ColorPointer);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ColorPointer, context, size, type, stride, pointer);
+    context->colorPointer(size, typePacked, stride, pointer);
+}
+
+void NoErrorCompileShader(Context *context, GLuint shader)
+{
+    ANGLE_DEFER_COMMAND(CompileShader, context, shader);
+    ANGLE_PROFILE_ENTRY_POINT(CompileShader);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CompileShader, context, shader);
+    context->compileShader(shader);
+}
+
+void NoErrorCompressedCopyTextureCHROMIUM(Context *context, GLuint sourceId, GLuint destId)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedCopyTextureCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CompressedCopyTextureCHROMIUM, context, sourceId, destId);
+    context->compressedCopyTexture(sourceId, destId);
+}
+
+void NoErrorCompressedTexImage2D(Context *context,
+                                 GLenum target,
+                                 GLint level,
+                                 GLenum internalformat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLint border,
+                                 GLsizei imageSize,
+                                 const void *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexImage2D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CompressedTexImage2D, context, target, level, internalformat, width, height,
+                       border, imageSize, data);
+    context->compressedTexImage2D(targetPacked, level, internalformat, width, height, border,
+                                  imageSize, data);
+}
+
+void NoErrorCompressedTexImage2DRobustANGLE(Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum internalformat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLint border,
+                                            GLsizei imageSize,
+                                            GLsizei dataSize,
+                                            const GLvoid *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexImage2DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CompressedTexImage2DRobustANGLE, context, target, level, internalformat,
+                       width, height, border, imageSize, dataSize, data);
+    context->compressedTexImage2DRobust(targetPacked, level, internalformat, width, height, border,
+                                        imageSize, dataSize, data);
+}
+
+void NoErrorCompressedTexImage3D(Context *context,
+                                 GLenum target,
+                                 GLint level,
+                                 GLenum internalformat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLsizei depth,
+                                 GLint border,
+                                 GLsizei imageSize,
+                                 const void *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexImage3D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CompressedTexImage3D, context, target, level, internalformat, width, height,
+                       depth, border, imageSize, data);
+    context->compressedTexImage3D(targetPacked, level, internalformat, width, height, depth, border,
+                                  imageSize, data);
+}
+
+void NoErrorCompressedTexImage3DRobustANGLE(Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum internalformat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLsizei depth,
+                                            GLint border,
+                                            GLsizei imageSize,
+                                            GLsizei dataSize,
+                                            const GLvoid *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexImage3DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CompressedTexImage3DRobustANGLE, context, target, level, internalformat,
+                       width, height, depth, border, imageSize, dataSize, data);
+    context->compressedTexImage3DRobust(targetPacked, level, internalformat, width, height, depth,
+                                        border, imageSize, dataSize, data);
+}
+
+void NoErrorCompressedTexSubImage2D(Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLenum format,
+                                    GLsizei imageSize,
+                                    const void *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexSubImage2D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CompressedTexSubImage2D, context, target, level, xoffset, yoffset, width,
+                       height, format, imageSize, data);
+    context->compressedTexSubImage2D(targetPacked, level, xoffset, yoffset, width, height, format,
+                                     imageSize, data);
+}
+
+void NoErrorCompressedTexSubImage2DRobustANGLE(Context *context,
+                                               GLenum target,
+                                               GLint level,
+                                               GLsizei xoffset,
+                                               GLsizei yoffset,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLenum format,
+                                               GLsizei imageSize,
+                                               GLsizei dataSize,
+                                               const GLvoid *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexSubImage2DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CompressedTexSubImage2DRobustANGLE, context, target, level, xoffset, yoffset,
+                       width, height, format, imageSize, dataSize, data);
+    context->compressedTexSubImage2DRobust(targetPacked, level, xoffset, yoffset, width, height,
+                                           format, imageSize, dataSize, data);
+}
+
+void NoErrorCompressedTexSubImage3D(Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLint zoffset,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLsizei depth,
+                                    GLenum format,
+                                    GLsizei imageSize,
+                                    const void *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexSubImage3D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CompressedTexSubImage3D, context, target, level, xoffset, yoffset, zoffset,
+                       width, height, depth, format, imageSize, data);
+    context->compressedTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width, height,
+                                     depth, format, imageSize, data);
+}
+
+void NoErrorCompressedTexSubImage3DRobustANGLE(Context *context,
+                                               GLenum target,
+                                               GLint level,
+                                               GLint xoffset,
+                                               GLint yoffset,
+                                               GLint zoffset,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLsizei depth,
+                                               GLenum format,
+                                               GLsizei imageSize,
+                                               GLsizei dataSize,
+                                               const GLvoid *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CompressedTexSubImage3DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CompressedTexSubImage3DRobustANGLE, context, target, level, xoffset, yoffset,
+                       zoffset, width, height, depth, format, imageSize, dataSize, data);
+    context->compressedTexSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset, width,
+                                           height, depth, format, imageSize, dataSize, data);
+}
+
+void NoErrorCopyBufferSubData(Context *context,
+                              GLenum readTarget,
+                              GLenum writeTarget,
+                              GLintptr readOffset,
+                              GLintptr writeOffset,
+                              GLsizeiptr size)
+{
+    ANGLE_DEFER_COMMAND(CopyBufferSubData, context, readTarget, writeTarget, readOffset,
+                        writeOffset, size);
+    ANGLE_PROFILE_ENTRY_POINT(CopyBufferSubData);
+    BufferBinding readTargetPacked  = FromGLenum<BufferBinding>(readTarget);
+    BufferBinding writeTargetPacked = FromGLenum<BufferBinding>(writeTarget);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CopyBufferSubData, context, readTarget, writeTarget, readOffset, writeOffset,
+                       size);
+    context->copyBufferSubData(readTargetPacked, writeTargetPacked, readOffset, writeOffset, size);
+}
+
+void NoErrorCopySubTexture3DANGLE(Context *context,
+                                  GLuint sourceId,
+                                  GLint sourceLevel,
+                                  GLenum destTarget,
+                                  GLuint destId,
+                                  GLint destLevel,
+                                  GLint xoffset,
+                                  GLint yoffset,
+                                  GLint zoffset,
+                                  GLint x,
+                                  GLint y,
+                                  GLint z,
+                                  GLint width,
+                                  GLint height,
+                                  GLint depth,
+                                  GLboolean unpackFlipY,
+                                  GLboolean unpackPremultiplyAlpha,
+                                  GLboolean unpackUnmultiplyAlpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CopySubTexture3DANGLE);
+    TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CopySubTexture3DANGLE, context, sourceId, sourceLevel, destTarget, destId,
+                       destLevel, xoffset, yoffset, zoffset, x, y, z, width, height, depth,
+                       unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    context->copySubTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel, xoffset,
+                              yoffset, zoffset, x, y, z, width, height, depth, unpackFlipY,
+                              unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+}
+
+void NoErrorCopySubTextureCHROMIUM(Context *context,
+                                   GLuint sourceId,
+                                   GLint sourceLevel,
+                                   GLenum destTarget,
+                                   GLuint destId,
+                                   GLint destLevel,
+                                   GLint xoffset,
+                                   GLint yoffset,
+                                   GLint x,
+                                   GLint y,
+                                   GLint width,
+                                   GLint height,
+                                   GLboolean unpackFlipY,
+                                   GLboolean unpackPremultiplyAlpha,
+                                   GLboolean unpackUnmultiplyAlpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CopySubTextureCHROMIUM);
+    TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CopySubTextureCHROMIUM, context, sourceId, sourceLevel, destTarget, destId,
+                       destLevel, xoffset, yoffset, x, y, width, height, unpackFlipY,
+                       unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    context->copySubTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel, xoffset,
+                            yoffset, x, y, width, height, unpackFlipY, unpackPremultiplyAlpha,
+                            unpackUnmultiplyAlpha);
+}
+
+void NoErrorCopyTexImage2D(Context *context,
+                           GLenum target,
+                           GLint level,
+                           GLenum internalformat,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLint border)
+{
+    ANGLE_DEFER_COMMAND(CopyTexImage2D, context, target, level, internalformat, x, y, width, height,
+                        border);
+    ANGLE_PROFILE_ENTRY_POINT(CopyTexImage2D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CopyTexImage2D, context, target, level, internalformat, x, y, width, height,
+                       border);
+    context->copyTexImage2D(targetPacked, level, internalformat, x, y, width, height, border);
+}
+
+void NoErrorCopyTexSubImage2D(Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint x,
+                              GLint y,
+                              GLsizei width,
+                              GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(CopyTexSubImage2D, context, target, level, xoffset, yoffset, x, y, width,
+                        height);
+    ANGLE_PROFILE_ENTRY_POINT(CopyTexSubImage2D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CopyTexSubImage2D, context, target, level, xoffset, yoffset, x, y, width,
+                       height);
+    context->copyTexSubImage2D(targetPacked, level, xoffset, yoffset, x, y, width, height);
+}
+
+void NoErrorCopyTexSubImage3D(Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint zoffset,
+                              GLint x,
+                              GLint y,
+                              GLsizei width,
+                              GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(CopyTexSubImage3D, context, target, level, xoffset, yoffset, zoffset, x, y,
+                        width, height);
+    ANGLE_PROFILE_ENTRY_POINT(CopyTexSubImage3D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CopyTexSubImage3D, context, target, level, xoffset, yoffset, zoffset, x, y,
+                       width, height);
+    context->copyTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, x, y, width, height);
+}
+
+void NoErrorCopyTexture3DANGLE(Context *context,
+                               GLuint sourceId,
+                               GLint sourceLevel,
+                               GLenum destTarget,
+                               GLuint destId,
+                               GLint destLevel,
+                               GLint internalFormat,
+                               GLenum destType,
+                               GLboolean unpackFlipY,
+                               GLboolean unpackPremultiplyAlpha,
+                               GLboolean unpackUnmultiplyAlpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CopyTexture3DANGLE);
+    TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CopyTexture3DANGLE, context, sourceId, sourceLevel, destTarget, destId,
+                       destLevel, internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                       unpackUnmultiplyAlpha);
+    context->copyTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
+                           internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                           unpackUnmultiplyAlpha);
+}
+
+void NoErrorCopyTextureCHROMIUM(Context *context,
+                                GLuint sourceId,
+                                GLint sourceLevel,
+                                GLenum destTarget,
+                                GLuint destId,
+                                GLint destLevel,
+                                GLint internalFormat,
+                                GLenum destType,
+                                GLboolean unpackFlipY,
+                                GLboolean unpackPremultiplyAlpha,
+                                GLboolean unpackUnmultiplyAlpha)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CopyTextureCHROMIUM);
+    TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CopyTextureCHROMIUM, context, sourceId, sourceLevel, destTarget, destId,
+                       destLevel, internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                       unpackUnmultiplyAlpha);
+    context->copyTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel, internalFormat,
+                         destType, unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+}
+
+void NoErrorCoverFillPathCHROMIUM(Context *context, GLuint path, GLenum coverMode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CoverFillPathCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CoverFillPathCHROMIUM, context, path, coverMode);
+    context->coverFillPath(path, coverMode);
+}
+
+void NoErrorCoverFillPathInstancedCHROMIUM(Context *context,
+                                           GLsizei numPath,
+                                           GLenum pathNameType,
+                                           const void *paths,
+                                           GLuint pathBase,
+                                           GLenum coverMode,
+                                           GLenum transformType,
+                                           const GLfloat *transformValues)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CoverFillPathInstancedCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CoverFillPathInstancedCHROMIUM, context, numPath, pathNameType, paths,
+                       pathBase, coverMode, transformType, transformValues);
+    context->coverFillPathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
+                                    transformType, transformValues);
+}
+
+void NoErrorCoverStrokePathCHROMIUM(Context *context, GLuint path, GLenum coverMode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CoverStrokePathCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CoverStrokePathCHROMIUM, context, path, coverMode);
+    context->coverStrokePath(path, coverMode);
+}
+
+void NoErrorCoverStrokePathInstancedCHROMIUM(Context *context,
+                                             GLsizei numPath,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum coverMode,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CoverStrokePathInstancedCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CoverStrokePathInstancedCHROMIUM, context, numPath, pathNameType, paths,
+                       pathBase, coverMode, transformType, transformValues);
+    context->coverStrokePathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
+                                      transformType, transformValues);
+}
+
+void NoErrorCoverageModulationCHROMIUM(Context *context, GLenum components)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CoverageModulationCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CoverageModulationCHROMIUM, context, components);
+    context->coverageModulation(components);
+}
+
+void NoErrorCreateMemoryObjectsEXT(Context *context, GLsizei n, GLuint *memoryObjects)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CreateMemoryObjectsEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CreateMemoryObjectsEXT, context, n, memoryObjects);
+    context->createMemoryObjects(n, memoryObjects);
+}
+
+GLuint NoErrorCreateProgram(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CreateProgram);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CreateProgram, context);
+    return context->createProgram();
+}
+
+GLuint NoErrorCreateShader(Context *context, GLenum type)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CreateShader);
+    ShaderType typePacked = FromGLenum<ShaderType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CreateShader, context, type);
+    return context->createShader(typePacked);
+}
+
+GLuint NoErrorCreateShaderProgramv(Context *context,
+                                   GLenum type,
+                                   GLsizei count,
+                                   const GLchar *const *strings)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CreateShaderProgramv);
+    ShaderType typePacked = FromGLenum<ShaderType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CreateShaderProgramv, context, type, count, strings);
+    return context->createShaderProgramv(typePacked, count, strings);
+}
+
+void NoErrorCullFace(Context *context, GLenum mode)
+{
+    ANGLE_DEFER_COMMAND(CullFace, context, mode);
+    ANGLE_PROFILE_ENTRY_POINT(CullFace);
+    CullFaceMode modePacked = FromGLenum<CullFaceMode>(mode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CullFace, context, mode);
+    context->cullFace(modePacked);
+}
+
+void NoErrorCurrentPaletteMatrixOES(Context *context, GLuint matrixpaletteindex)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(CurrentPaletteMatrixOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(CurrentPaletteMatrixOES, context, matrixpaletteindex);
+    context->currentPaletteMatrix(matrixpaletteindex);
+}
+
+void NoErrorDebugMessageCallbackKHR(Context *context,
+                                    GLDEBUGPROCKHR callback,
+                                    const void *userParam)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DebugMessageCallbackKHR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DebugMessageCallbackKHR, context, callback, userParam);
+    context->debugMessageCallback(callback, userParam);
+}
+
+void NoErrorDebugMessageControlKHR(Context *context,
+                                   GLenum source,
+                                   GLenum type,
+                                   GLenum severity,
+                                   GLsizei count,
+                                   const GLuint *ids,
+                                   GLboolean enabled)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DebugMessageControlKHR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DebugMessageControlKHR, context, source, type, severity, count, ids,
+                       enabled);
+    context->debugMessageControl(source, type, severity, count, ids, enabled);
+}
+
+void NoErrorDebugMessageInsertKHR(Context *context,
+                                  GLenum source,
+                                  GLenum type,
+                                  GLuint id,
+                                  GLenum severity,
+                                  GLsizei length,
+                                  const GLchar *buf)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DebugMessageInsertKHR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DebugMessageInsertKHR, context, source, type, id, severity, length, buf);
+    context->debugMessageInsert(source, type, id, severity, length, buf);
+}
+
+void NoErrorDeleteBuffers(Context *context, GLsizei n, const GLuint *buffers)
+{
+    ANGLE_DEFER_COMMAND(DeleteBuffers, context, n, buffers);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteBuffers);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteBuffers, context, n, buffers);
+    context->deleteBuffers(n, buffers);
+}
+
+void NoErrorDeleteFencesNV(Context *context, GLsizei n, const GLuint *fences)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteFencesNV);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteFencesNV, context, n, fences);
+    context->deleteFencesNV(n, fences);
+}
+
+void NoErrorDeleteFramebuffers(Context *context, GLsizei n, const GLuint *framebuffers)
+{
+    ANGLE_DEFER_COMMAND(DeleteFramebuffers, context, n, framebuffers);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteFramebuffers);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteFramebuffers, context, n, framebuffers);
+    context->deleteFramebuffers(n, framebuffers);
+}
+
+void NoErrorDeleteFramebuffersOES(Context *context, GLsizei n, const GLuint *framebuffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteFramebuffersOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteFramebuffersOES, context, n, framebuffers);
+    context->deleteFramebuffers(n, framebuffers);
+}
+
+void NoErrorDeleteMemoryObjectsEXT(Context *context, GLsizei n, const GLuint *memoryObjects)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteMemoryObjectsEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteMemoryObjectsEXT, context, n, memoryObjects);
+    context->deleteMemoryObjects(n, memoryObjects);
+}
+
+void NoErrorDeletePathsCHROMIUM(Context *context, GLuint first, GLsizei range)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeletePathsCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeletePathsCHROMIUM, context, first, range);
+    context->deletePaths(first, range);
+}
+
+void NoErrorDeleteProgram(Context *context, GLuint program)
+{
+    ANGLE_DEFER_COMMAND(DeleteProgram, context, program);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteProgram);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteProgram, context, program);
+    context->deleteProgram(program);
+}
+
+void NoErrorDeleteProgramPipelines(Context *context, GLsizei n, const GLuint *pipelines)
+{
+    ANGLE_DEFER_COMMAND(DeleteProgramPipelines, context, n, pipelines);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteProgramPipelines);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteProgramPipelines, context, n, pipelines);
+    context->deleteProgramPipelines(n, pipelines);
+}
+
+void NoErrorDeleteQueries(Context *context, GLsizei n, const GLuint *ids)
+{
+    ANGLE_DEFER_COMMAND(DeleteQueries, context, n, ids);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteQueries);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteQueries, context, n, ids);
+    context->deleteQueries(n, ids);
+}
+
+void NoErrorDeleteQueriesEXT(Context *context, GLsizei n, const GLuint *ids)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteQueriesEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteQueriesEXT, context, n, ids);
+    context->deleteQueries(n, ids);
+}
+
+void NoErrorDeleteRenderbuffers(Context *context, GLsizei n, const GLuint *renderbuffers)
+{
+    ANGLE_DEFER_COMMAND(DeleteRenderbuffers, context, n, renderbuffers);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteRenderbuffers);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteRenderbuffers, context, n, renderbuffers);
+    context->deleteRenderbuffers(n, renderbuffers);
+}
+
+void NoErrorDeleteRenderbuffersOES(Context *context, GLsizei n, const GLuint *renderbuffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteRenderbuffersOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteRenderbuffersOES, context, n, renderbuffers);
+    context->deleteRenderbuffers(n, renderbuffers);
+}
+
+void NoErrorDeleteSamplers(Context *context, GLsizei count, const GLuint *samplers)
+{
+    ANGLE_DEFER_COMMAND(DeleteSamplers, context, count, samplers);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteSamplers);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteSamplers, context, count, samplers);
+    context->deleteSamplers(count, samplers);
+}
+
+void NoErrorDeleteSemaphoresEXT(Context *context, GLsizei n, const GLuint *semaphores)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteSemaphoresEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteSemaphoresEXT, context, n, semaphores);
+    context->deleteSemaphores(n, semaphores);
+}
+
+void NoErrorDeleteShader(Context *context, GLuint shader)
+{
+    ANGLE_DEFER_COMMAND(DeleteShader, context, shader);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteShader);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteShader, context, shader);
+    context->deleteShader(shader);
+}
+
+void NoErrorDeleteSync(Context *context, GLsync sync)
+{
+    ANGLE_DEFER_COMMAND(DeleteSync, context, sync);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteSync);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteSync, context, sync);
+    context->deleteSync(sync);
+}
+
+void NoErrorDeleteTextures(Context *context, GLsizei n, const GLuint *textures)
+{
+    ANGLE_DEFER_COMMAND(DeleteTextures, context, n, textures);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteTextures);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteTextures, context, n, textures);
+    context->deleteTextures(n, textures);
+}
+
+void NoErrorDeleteTransformFeedbacks(Context *context, GLsizei n, const GLuint *ids)
+{
+    ANGLE_DEFER_COMMAND(DeleteTransformFeedbacks, context, n, ids);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteTransformFeedbacks);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteTransformFeedbacks, context, n, ids);
+    context->deleteTransformFeedbacks(n, ids);
+}
+
+void NoErrorDeleteVertexArrays(Context *context, GLsizei n, const GLuint *arrays)
+{
+    ANGLE_DEFER_COMMAND(DeleteVertexArrays, context, n, arrays);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteVertexArrays);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteVertexArrays, context, n, arrays);
+    context->deleteVertexArrays(n, arrays);
+}
+
+void NoErrorDeleteVertexArraysOES(Context *context, GLsizei n, const GLuint *arrays)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DeleteVertexArraysOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DeleteVertexArraysOES, context, n, arrays);
+    context->deleteVertexArrays(n, arrays);
+}
+
+void NoErrorDepthFunc(Context *context, GLenum func)
+{
+    ANGLE_DEFER_COMMAND(DepthFunc, context, func);
+    ANGLE_PROFILE_ENTRY_POINT(DepthFunc);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DepthFunc, context, func);
+    context->depthFunc(func);
+}
+
+void NoErrorDepthMask(Context *context, GLboolean flag)
+{
+    ANGLE_DEFER_COMMAND(DepthMask, context, flag);
+    ANGLE_PROFILE_ENTRY_POINT(DepthMask);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DepthMask, context, flag);
+    context->depthMask(flag);
+}
+
+void NoErrorDepthRangef(Context *context, GLfloat n, GLfloat f)
+{
+    ANGLE_DEFER_COMMAND(DepthRangef, context, n, f);
+    ANGLE_PROFILE_ENTRY_POINT(DepthRangef);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DepthRangef, context, n, f);
+    context->depthRangef(n, f);
+}
+
+void NoErrorDepthRangex(Context *context, GLfixed n, GLfixed f)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DepthRangex);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DepthRangex, context, n, f);
+    context->depthRangex(n, f);
+}
+
+void NoErrorDetachShader(Context *context, GLuint program, GLuint shader)
+{
+    ANGLE_DEFER_COMMAND(DetachShader, context, program, shader);
+    ANGLE_PROFILE_ENTRY_POINT(DetachShader);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DetachShader, context, program, shader);
+    context->detachShader(program, shader);
+}
+
+void NoErrorDisable(Context *context, GLenum cap)
+{
+    ANGLE_DEFER_COMMAND(Disable, context, cap);
+    ANGLE_PROFILE_ENTRY_POINT(Disable);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Disable, context, cap);
+    context->disable(cap);
+}
+
+void NoErrorDisableClientState(Context *context, GLenum array)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DisableClientState);
+    ClientVertexArrayType arrayPacked = FromGLenum<ClientVertexArrayType>(array);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DisableClientState, context, array);
+    context->disableClientState(arrayPacked);
+}
+
+void NoErrorDisableVertexAttribArray(Context *context, GLuint index)
+{
+    ANGLE_DEFER_COMMAND(DisableVertexAttribArray, context, index);
+    ANGLE_PROFILE_ENTRY_POINT(DisableVertexAttribArray);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DisableVertexAttribArray, context, index);
+    context->disableVertexAttribArray(index);
+}
+
+void NoErrorDiscardFramebufferEXT(Context *context,
+                                  GLenum target,
+                                  GLsizei numAttachments,
+                                  const GLenum *attachments)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DiscardFramebufferEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DiscardFramebufferEXT, context, target, numAttachments, attachments);
+    context->discardFramebuffer(target, numAttachments, attachments);
+}
+
+void NoErrorDispatchCompute(Context *context,
+                            GLuint num_groups_x,
+                            GLuint num_groups_y,
+                            GLuint num_groups_z)
+{
+    ANGLE_DEFER_COMMAND(DispatchCompute, context, num_groups_x, num_groups_y, num_groups_z);
+    ANGLE_PROFILE_ENTRY_POINT(DispatchCompute);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DispatchCompute, context, num_groups_x, num_groups_y, num_groups_z);
+    context->dispatchCompute(num_groups_x, num_groups_y, num_groups_z);
+}
+
+void NoErrorDispatchComputeIndirect(Context *context, GLintptr indirect)
+{
+    ANGLE_DEFER_COMMAND(DispatchComputeIndirect, context, indirect);
+    ANGLE_PROFILE_ENTRY_POINT(DispatchComputeIndirect);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DispatchComputeIndirect, context, indirect);
+    context->dispatchComputeIndirect(indirect);
+}
+
+void NoErrorDrawArrays(Context *context, GLenum mode, GLint first, GLsizei count)
+{
+    ANGLE_DEFER_COMMAND(DrawArrays, context, mode, first, count);
+    ANGLE_PROFILE_ENTRY_POINT(DrawArrays);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawArrays, context, mode, first, count);
+    context->drawArrays(modePacked, first, count);
+}
+
+void NoErrorDrawArraysIndirect(Context *context, GLenum mode, const void *indirect)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawArraysIndirect);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawArraysIndirect, context, mode, indirect);
+    context->drawArraysIndirect(modePacked, indirect);
+}
+
+void NoErrorDrawArraysInstanced(Context *context,
+                                GLenum mode,
+                                GLint first,
+                                GLsizei count,
+                                GLsizei instancecount)
+{
+    ANGLE_DEFER_COMMAND(DrawArraysInstanced, context, mode, first, count, instancecount);
+    ANGLE_PROFILE_ENTRY_POINT(DrawArraysInstanced);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawArraysInstanced, context, mode, first, count, instancecount);
+    context->drawArraysInstanced(modePacked, first, count, instancecount);
+}
+
+void NoErrorDrawArraysInstancedANGLE(Context *context,
+                                     GLenum mode,
+                                     GLint first,
+                                     GLsizei count,
+                                     GLsizei primcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawArraysInstancedANGLE);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawArraysInstancedANGLE, context, mode, first, count, primcount);
+    context->drawArraysInstanced(modePacked, first, count, primcount);
+}
+
+void NoErrorDrawArraysInstancedEXT(Context *context,
+                                   GLenum mode,
+                                   GLint start,
+                                   GLsizei count,
+                                   GLsizei primcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawArraysInstancedEXT);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawArraysInstancedEXT, context, mode, start, count, primcount);
+    context->drawArraysInstanced(modePacked, start, count, primcount);
+}
+
+void NoErrorDrawBuffers(Context *context, GLsizei n, const GLenum *bufs)
+{
+    ANGLE_DEFER_COMMAND(DrawBuffers, context, n, bufs);
+    ANGLE_PROFILE_ENTRY_POINT(DrawBuffers);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawBuffers, context, n, bufs);
+    context->drawBuffers(n, bufs);
+}
+
+void NoErrorDrawBuffersEXT(Context *context, GLsizei n, const GLenum *bufs)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawBuffersEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawBuffersEXT, context, n, bufs);
+    context->drawBuffers(n, bufs);
+}
+
+void NoErrorDrawElements(Context *context,
+                         GLenum mode,
+                         GLsizei count,
+                         GLenum type,
+                         const void *indices)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawElements);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawElements, context, mode, count, type, indices);
+    context->drawElements(modePacked, count, typePacked, indices);
+}
+
+void NoErrorDrawElementsIndirect(Context *context, GLenum mode, GLenum type, const void *indirect)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawElementsIndirect);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawElementsIndirect, context, mode, type, indirect);
+    context->drawElementsIndirect(modePacked, typePacked, indirect);
+}
+
+void NoErrorDrawElementsInstanced(Context *context,
+                                  GLenum mode,
+                                  GLsizei count,
+                                  GLenum type,
+                                  const void *indices,
+                                  GLsizei instancecount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawElementsInstanced);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawElementsInstanced, context, mode, count, type, indices, instancecount);
+    context->drawElementsInstanced(modePacked, count, typePacked, indices, instancecount);
+}
+
+void NoErrorDrawElementsInstancedANGLE(Context *context,
+                                       GLenum mode,
+                                       GLsizei count,
+                                       GLenum type,
+                                       const void *indices,
+                                       GLsizei primcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawElementsInstancedANGLE);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawElementsInstancedANGLE, context, mode, count, type, indices, primcount);
+    context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
+}
+
+void NoErrorDrawElementsInstancedEXT(Context *context,
+                                     GLenum mode,
+                                     GLsizei count,
+                                     GLenum type,
+                                     const void *indices,
+                                     GLsizei primcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawElementsInstancedEXT);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawElementsInstancedEXT, context, mode, count, type, indices, primcount);
+    context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
+}
+
+void NoErrorDrawRangeElements(Context *context,
+                              GLenum mode,
+                              GLuint start,
+                              GLuint end,
+                              GLsizei count,
+                              GLenum type,
+                              const void *indices)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawRangeElements);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawRangeElements, context, mode, start, end, count, type, indices);
+    context->drawRangeElements(modePacked, start, end, count, typePacked, indices);
+}
+
+void NoErrorDrawTexfOES(Context *context,
+                        GLfloat x,
+                        GLfloat y,
+                        GLfloat z,
+                        GLfloat width,
+                        GLfloat height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexfOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawTexfOES, context, x, y, z, width, height);
+    context->drawTexf(x, y, z, width, height);
+}
+
+void NoErrorDrawTexfvOES(Context *context, const GLfloat *coords)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexfvOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawTexfvOES, context, coords);
+    context->drawTexfv(coords);
+}
+
+void NoErrorDrawTexiOES(Context *context, GLint x, GLint y, GLint z, GLint width, GLint height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexiOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawTexiOES, context, x, y, z, width, height);
+    context->drawTexi(x, y, z, width, height);
+}
+
+void NoErrorDrawTexivOES(Context *context, const GLint *coords)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexivOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawTexivOES, context, coords);
+    context->drawTexiv(coords);
+}
+
+void NoErrorDrawTexsOES(Context *context,
+                        GLshort x,
+                        GLshort y,
+                        GLshort z,
+                        GLshort width,
+                        GLshort height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexsOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawTexsOES, context, x, y, z, width, height);
+    context->drawTexs(x, y, z, width, height);
+}
+
+void NoErrorDrawTexsvOES(Context *context, const GLshort *coords)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexsvOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawTexsvOES, context, coords);
+    context->drawTexsv(coords);
+}
+
+void NoErrorDrawTexxOES(Context *context,
+                        GLfixed x,
+                        GLfixed y,
+                        GLfixed z,
+                        GLfixed width,
+                        GLfixed height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexxOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawTexxOES, context, x, y, z, width, height);
+    context->drawTexx(x, y, z, width, height);
+}
+
+void NoErrorDrawTexxvOES(Context *context, const GLfixed *coords)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(DrawTexxvOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(DrawTexxvOES, context, coords);
+    context->drawTexxv(coords);
+}
+
+void NoErrorEGLImageTargetRenderbufferStorageOES(Context *context,
+                                                 GLenum target,
+                                                 GLeglImageOES image)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(EGLImageTargetRenderbufferStorageOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(EGLImageTargetRenderbufferStorageOES, context, target, image);
+    context->eGLImageTargetRenderbufferStorage(target, image);
+}
+
+void NoErrorEGLImageTargetTexture2DOES(Context *context, GLenum target, GLeglImageOES image)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(EGLImageTargetTexture2DOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(EGLImageTargetTexture2DOES, context, target, image);
+    context->eGLImageTargetTexture2D(targetPacked, image);
+}
+
+void NoErrorEnable(Context *context, GLenum cap)
+{
+    ANGLE_DEFER_COMMAND(Enable, context, cap);
+    ANGLE_PROFILE_ENTRY_POINT(Enable);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Enable, context, cap);
+    context->enable(cap);
+}
+
+void NoErrorEnableClientState(Context *context, GLenum array)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(EnableClientState);
+    ClientVertexArrayType arrayPacked = FromGLenum<ClientVertexArrayType>(array);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(EnableClientState, context, array);
+    context->enableClientState(arrayPacked);
+}
+
+void NoErrorEnableVertexAttribArray(Context *context, GLuint index)
+{
+    ANGLE_DEFER_COMMAND(EnableVertexAttribArray, context, index);
+    ANGLE_PROFILE_ENTRY_POINT(EnableVertexAttribArray);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(EnableVertexAttribArray, context, index);
+    context->enableVertexAttribArray(index);
+}
+
+void NoErrorEndQuery(Context *context, GLenum target)
+{
+    ANGLE_DEFER_COMMAND(EndQuery, context, target);
+    ANGLE_PROFILE_ENTRY_POINT(EndQuery);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(EndQuery, context, target);
+    context->endQuery(targetPacked);
+}
+
+void NoErrorEndQueryEXT(Context *context, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(EndQueryEXT);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(EndQueryEXT, context, target);
+    context->endQuery(targetPacked);
+}
+
+void NoErrorEndTransformFeedback(Context *context)
+{
+    ANGLE_DEFER_COMMAND(EndTransformFeedback, context);
+    ANGLE_PROFILE_ENTRY_POINT(EndTransformFeedback);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(EndTransformFeedback, context);
+    context->endTransformFeedback();
+}
+
+GLsync NoErrorFenceSync(Context *context, GLenum condition, GLbitfield flags)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FenceSync);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FenceSync, context, condition, flags);
+    return context->fenceSync(condition, flags);
+}
+
+void NoErrorFinish(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Finish);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Finish, context);
+    context->finish();
+}
+
+void NoErrorFinishFenceNV(Context *context, GLuint fence)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FinishFenceNV);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FinishFenceNV, context, fence);
+    context->finishFenceNV(fence);
+}
+
+void NoErrorFlush(Context *context)
+{
+    ANGLE_DEFER_COMMAND(Flush, context);
+    ANGLE_PROFILE_ENTRY_POINT(Flush);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Flush, context);
+    context->flush();
+}
+
+void NoErrorFlushMappedBufferRange(Context *context,
+                                   GLenum target,
+                                   GLintptr offset,
+                                   GLsizeiptr length)
+{
+    ANGLE_DEFER_COMMAND(FlushMappedBufferRange, context, target, offset, length);
+    ANGLE_PROFILE_ENTRY_POINT(FlushMappedBufferRange);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FlushMappedBufferRange, context, target, offset, length);
+    context->flushMappedBufferRange(targetPacked, offset, length);
+}
+
+void NoErrorFlushMappedBufferRangeEXT(Context *context,
+                                      GLenum target,
+                                      GLintptr offset,
+                                      GLsizeiptr length)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FlushMappedBufferRangeEXT);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FlushMappedBufferRangeEXT, context, target, offset, length);
+    context->flushMappedBufferRange(targetPacked, offset, length);
+}
+
+void NoErrorFogf(Context *context, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Fogf);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Fogf, context, pname, param);
+    context->fogf(pname, param);
+}
+
+void NoErrorFogfv(Context *context, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Fogfv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Fogfv, context, pname, params);
+    context->fogfv(pname, params);
+}
+
+void NoErrorFogx(Context *context, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Fogx);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Fogx, context, pname, param);
+    context->fogx(pname, param);
+}
+
+void NoErrorFogxv(Context *context, GLenum pname, const GLfixed *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Fogxv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Fogxv, context, pname, param);
+    context->fogxv(pname, param);
+}
+
+void NoErrorFramebufferParameteri(Context *context, GLenum target, GLenum pname, GLint param)
+{
+    ANGLE_DEFER_COMMAND(FramebufferParameteri, context, target, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferParameteri);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FramebufferParameteri, context, target, pname, param);
+    context->framebufferParameteri(target, pname, param);
+}
+
+void NoErrorFramebufferRenderbuffer(Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLenum renderbuffertarget,
+                                    GLuint renderbuffer)
+{
+    ANGLE_DEFER_COMMAND(FramebufferRenderbuffer, context, target, attachment, renderbuffertarget,
+                        renderbuffer);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferRenderbuffer);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FramebufferRenderbuffer, context, target, attachment, renderbuffertarget,
+                       renderbuffer);
+    context->framebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
+}
+
+void NoErrorFramebufferRenderbufferOES(Context *context,
+                                       GLenum target,
+                                       GLenum attachment,
+                                       GLenum renderbuffertarget,
+                                       GLuint renderbuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferRenderbufferOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FramebufferRenderbufferOES, context, target, attachment, renderbuffertarget,
+                       renderbuffer);
+    context->framebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
+}
+
+void NoErrorFramebufferTexture2D(Context *context,
+                                 GLenum target,
+                                 GLenum attachment,
+                                 GLenum textarget,
+                                 GLuint texture,
+                                 GLint level)
+{
+    ANGLE_DEFER_COMMAND(FramebufferTexture2D, context, target, attachment, textarget, texture,
+                        level);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferTexture2D);
+    TextureTarget textargetPacked = FromGLenum<TextureTarget>(textarget);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FramebufferTexture2D, context, target, attachment, textarget, texture,
+                       level);
+    context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
+}
+
+void NoErrorFramebufferTexture2DOES(Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLenum textarget,
+                                    GLuint texture,
+                                    GLint level)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferTexture2DOES);
+    TextureTarget textargetPacked = FromGLenum<TextureTarget>(textarget);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FramebufferTexture2DOES, context, target, attachment, textarget, texture,
+                       level);
+    context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
+}
+
+void NoErrorFramebufferTextureEXT(Context *context,
+                                  GLenum target,
+                                  GLenum attachment,
+                                  GLuint texture,
+                                  GLint level)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferTextureEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FramebufferTextureEXT, context, target, attachment, texture, level);
+    context->framebufferTexture(target, attachment, texture, level);
+}
+
+void NoErrorFramebufferTextureLayer(Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLuint texture,
+                                    GLint level,
+                                    GLint layer)
+{
+    ANGLE_DEFER_COMMAND(FramebufferTextureLayer, context, target, attachment, texture, level,
+                        layer);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferTextureLayer);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FramebufferTextureLayer, context, target, attachment, texture, level, layer);
+    context->framebufferTextureLayer(target, attachment, texture, level, layer);
+}
+
+void NoErrorFramebufferTextureMultiviewOVR(Context *context,
+                                           GLenum target,
+                                           GLenum attachment,
+                                           GLuint texture,
+                                           GLint level,
+                                           GLint baseViewIndex,
+                                           GLsizei numViews)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(FramebufferTextureMultiviewOVR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FramebufferTextureMultiviewOVR, context, target, attachment, texture, level,
+                       baseViewIndex, numViews);
+    context->framebufferTextureMultiview(target, attachment, texture, level, baseViewIndex,
+                                         numViews);
+}
+
+void NoErrorFrontFace(Context *context, GLenum mode)
+{
+    ANGLE_DEFER_COMMAND(FrontFace, context, mode);
+    ANGLE_PROFILE_ENTRY_POINT(FrontFace);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(FrontFace, context, mode);
+    context->frontFace(mode);
+}
+
+void NoErrorFrustumf(Context *context,
+                     GLfloat l,
+                     GLfloat r,
+                     GLfloat b,
+                     GLfloat t,
+                     GLfloat n,
+                     GLfloat f)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Frustumf);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Frustumf, context, l, r, b, t, n, f);
+    context->frustumf(l, r, b, t, n, f);
+}
+
+void NoErrorFrustumx(Context *context,
+                     GLfixed l,
+                     GLfixed r,
+                     GLfixed b,
+                     GLfixed t,
+                     GLfixed n,
+                     GLfixed f)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Frustumx);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Frustumx, context, l, r, b, t, n, f);
+    context->frustumx(l, r, b, t, n, f);
+}
+
+void NoErrorGenBuffers(Context *context, GLsizei n, GLuint *buffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenBuffers);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenBuffers, context, n, buffers);
+    context->genBuffers(n, buffers);
+}
+
+void NoErrorGenFencesNV(Context *context, GLsizei n, GLuint *fences)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenFencesNV);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenFencesNV, context, n, fences);
+    context->genFencesNV(n, fences);
+}
+
+void NoErrorGenFramebuffers(Context *context, GLsizei n, GLuint *framebuffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenFramebuffers);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenFramebuffers, context, n, framebuffers);
+    context->genFramebuffers(n, framebuffers);
+}
+
+void NoErrorGenFramebuffersOES(Context *context, GLsizei n, GLuint *framebuffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenFramebuffersOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenFramebuffersOES, context, n, framebuffers);
+    context->genFramebuffers(n, framebuffers);
+}
+
+GLuint NoErrorGenPathsCHROMIUM(Context *context, GLsizei range)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenPathsCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenPathsCHROMIUM, context, range);
+    return context->genPaths(range);
+}
+
+void NoErrorGenProgramPipelines(Context *context, GLsizei n, GLuint *pipelines)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenProgramPipelines);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenProgramPipelines, context, n, pipelines);
+    context->genProgramPipelines(n, pipelines);
+}
+
+void NoErrorGenQueries(Context *context, GLsizei n, GLuint *ids)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenQueries);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenQueries, context, n, ids);
+    context->genQueries(n, ids);
+}
+
+void NoErrorGenQueriesEXT(Context *context, GLsizei n, GLuint *ids)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenQueriesEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenQueriesEXT, context, n, ids);
+    context->genQueries(n, ids);
+}
+
+void NoErrorGenRenderbuffers(Context *context, GLsizei n, GLuint *renderbuffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenRenderbuffers);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenRenderbuffers, context, n, renderbuffers);
+    context->genRenderbuffers(n, renderbuffers);
+}
+
+void NoErrorGenRenderbuffersOES(Context *context, GLsizei n, GLuint *renderbuffers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenRenderbuffersOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenRenderbuffersOES, context, n, renderbuffers);
+    context->genRenderbuffers(n, renderbuffers);
+}
+
+void NoErrorGenSamplers(Context *context, GLsizei count, GLuint *samplers)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenSamplers);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenSamplers, context, count, samplers);
+    context->genSamplers(count, samplers);
+}
+
+void NoErrorGenSemaphoresEXT(Context *context, GLsizei n, GLuint *semaphores)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenSemaphoresEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenSemaphoresEXT, context, n, semaphores);
+    context->genSemaphores(n, semaphores);
+}
+
+void NoErrorGenTextures(Context *context, GLsizei n, GLuint *textures)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenTextures);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenTextures, context, n, textures);
+    context->genTextures(n, textures);
+}
+
+void NoErrorGenTransformFeedbacks(Context *context, GLsizei n, GLuint *ids)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenTransformFeedbacks);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenTransformFeedbacks, context, n, ids);
+    context->genTransformFeedbacks(n, ids);
+}
+
+void NoErrorGenVertexArrays(Context *context, GLsizei n, GLuint *arrays)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenVertexArrays);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenVertexArrays, context, n, arrays);
+    context->genVertexArrays(n, arrays);
+}
+
+void NoErrorGenVertexArraysOES(Context *context, GLsizei n, GLuint *arrays)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenVertexArraysOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenVertexArraysOES, context, n, arrays);
+    context->genVertexArrays(n, arrays);
+}
+
+void NoErrorGenerateMipmap(Context *context, GLenum target)
+{
+    ANGLE_DEFER_COMMAND(GenerateMipmap, context, target);
+    ANGLE_PROFILE_ENTRY_POINT(GenerateMipmap);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenerateMipmap, context, target);
+    context->generateMipmap(targetPacked);
+}
+
+void NoErrorGenerateMipmapOES(Context *context, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GenerateMipmapOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GenerateMipmapOES, context, target);
+    context->generateMipmap(targetPacked);
+}
+
+void NoErrorGetActiveAttrib(Context *context,
+                            GLuint program,
+                            GLuint index,
+                            GLsizei bufSize,
+                            GLsizei *length,
+                            GLint *size,
+                            GLenum *type,
+                            GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetActiveAttrib);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetActiveAttrib, context, program, index, bufSize, length, size, type, name);
+    context->getActiveAttrib(program, index, bufSize, length, size, type, name);
+}
+
+void NoErrorGetActiveUniform(Context *context,
+                             GLuint program,
+                             GLuint index,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLint *size,
+                             GLenum *type,
+                             GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetActiveUniform);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetActiveUniform, context, program, index, bufSize, length, size, type,
+                       name);
+    context->getActiveUniform(program, index, bufSize, length, size, type, name);
+}
+
+void NoErrorGetActiveUniformBlockName(Context *context,
+                                      GLuint program,
+                                      GLuint uniformBlockIndex,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLchar *uniformBlockName)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetActiveUniformBlockName);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetActiveUniformBlockName, context, program, uniformBlockIndex, bufSize,
+                       length, uniformBlockName);
+    context->getActiveUniformBlockName(program, uniformBlockIndex, bufSize, length,
+                                       uniformBlockName);
+}
+
+void NoErrorGetActiveUniformBlockiv(Context *context,
+                                    GLuint program,
+                                    GLuint uniformBlockIndex,
+                                    GLenum pname,
+                                    GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetActiveUniformBlockiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetActiveUniformBlockiv, context, program, uniformBlockIndex, pname, params);
+    context->getActiveUniformBlockiv(program, uniformBlockIndex, pname, params);
+}
+
+void NoErrorGetActiveUniformBlockivRobustANGLE(Context *context,
+                                               GLuint program,
+                                               GLuint uniformBlockIndex,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetActiveUniformBlockivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetActiveUniformBlockivRobustANGLE, context, program, uniformBlockIndex,
+                       pname, bufSize, length, params);
+    context->getActiveUniformBlockivRobust(program, uniformBlockIndex, pname, bufSize, length,
+                                           params);
+}
+
+void NoErrorGetActiveUniformsiv(Context *context,
+                                GLuint program,
+                                GLsizei uniformCount,
+                                const GLuint *uniformIndices,
+                                GLenum pname,
+                                GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetActiveUniformsiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetActiveUniformsiv, context, program, uniformCount, uniformIndices, pname,
+                       params);
+    context->getActiveUniformsiv(program, uniformCount, uniformIndices, pname, params);
+}
+
+void NoErrorGetAttachedShaders(Context *context,
+                               GLuint program,
+                               GLsizei maxCount,
+                               GLsizei *count,
+                               GLuint *shaders)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetAttachedShaders);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetAttachedShaders, context, program, maxCount, count, shaders);
+    context->getAttachedShaders(program, maxCount, count, shaders);
+}
+
+GLint NoErrorGetAttribLocation(Context *context, GLuint program, const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetAttribLocation);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetAttribLocation, context, program, name);
+    return context->getAttribLocation(program, name);
+}
+
+void NoErrorGetBooleani_v(Context *context, GLenum target, GLuint index, GLboolean *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBooleani_v);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetBooleani_v, context, target, index, data);
+    context->getBooleani_v(target, index, data);
+}
+
+void NoErrorGetBooleani_vRobustANGLE(Context *context,
+                                     GLenum target,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLboolean *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBooleani_vRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetBooleani_vRobustANGLE, context, target, index, bufSize, length, data);
+    context->getBooleani_vRobust(target, index, bufSize, length, data);
+}
+
+void NoErrorGetBooleanv(Context *context, GLenum pname, GLboolean *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBooleanv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetBooleanv, context, pname, data);
+    context->getBooleanv(pname, data);
+}
+
+void NoErrorGetBooleanvRobustANGLE(Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLboolean *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBooleanvRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetBooleanvRobustANGLE, context, pname, bufSize, length, params);
+    context->getBooleanvRobust(pname, bufSize, length, params);
+}
+
+void NoErrorGetBufferParameteri64v(Context *context, GLenum target, GLenum pname, GLint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferParameteri64v);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetBufferParameteri64v, context, target, pname, params);
+    context->getBufferParameteri64v(targetPacked, pname, params);
+}
+
+void NoErrorGetBufferParameteri64vRobustANGLE(Context *context,
+                                              GLenum target,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferParameteri64vRobustANGLE);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetBufferParameteri64vRobustANGLE, context, target, pname, bufSize, length,
+                       params);
+    context->getBufferParameteri64vRobust(targetPacked, pname, bufSize, length, params);
+}
+
+void NoErrorGetBufferParameteriv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferParameteriv);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetBufferParameteriv, context, target, pname, params);
+    context->getBufferParameteriv(targetPacked, pname, params);
+}
+
+void NoErrorGetBufferParameterivRobustANGLE(Context *context,
+                                            GLenum target,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            GLsizei *length,
+                                            GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferParameterivRobustANGLE);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetBufferParameterivRobustANGLE, context, target, pname, bufSize, length,
+                       params);
+    context->getBufferParameterivRobust(targetPacked, pname, bufSize, length, params);
+}
+
+void NoErrorGetBufferPointerv(Context *context, GLenum target, GLenum pname, void **params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferPointerv);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetBufferPointerv, context, target, pname, params);
+    context->getBufferPointerv(targetPacked, pname, params);
+}
+
+void NoErrorGetBufferPointervOES(Context *context, GLenum target, GLenum pname, void **params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferPointervOES);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetBufferPointervOES, context, target, pname, params);
+    context->getBufferPointerv(targetPacked, pname, params);
+}
+
+void NoErrorGetBufferPointervRobustANGLE(Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         void **params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetBufferPointervRobustANGLE);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetBufferPointervRobustANGLE, context, target, pname, bufSize, length,
+                       params);
+    context->getBufferPointervRobust(targetPacked, pname, bufSize, length, params);
+}
+
+void NoErrorGetClipPlanef(Context *context, GLenum plane, GLfloat *equation)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetClipPlanef);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetClipPlanef, context, plane, equation);
+    context->getClipPlanef(plane, equation);
+}
+
+void NoErrorGetClipPlanex(Context *context, GLenum plane, GLfixed *equation)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetClipPlanex);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetClipPlanex, context, plane, equation);
+    context->getClipPlanex(plane, equation);
+}
+
+GLuint NoErrorGetDebugMessageLogKHR(Context *context,
+                                    GLuint count,
+                                    GLsizei bufSize,
+                                    GLenum *sources,
+                                    GLenum *types,
+                                    GLuint *ids,
+                                    GLenum *severities,
+                                    GLsizei *lengths,
+                                    GLchar *messageLog)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetDebugMessageLogKHR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetDebugMessageLogKHR, context, count, bufSize, sources, types, ids,
+                       severities, lengths, messageLog);
+    return context->getDebugMessageLog(count, bufSize, sources, types, ids, severities, lengths,
+                                       messageLog);
+}
+
+GLenum NoErrorGetError(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetError);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetError, context);
+    return context->getError();
+}
+
+void NoErrorGetFenceivNV(Context *context, GLuint fence, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFenceivNV);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetFenceivNV, context, fence, pname, params);
+    context->getFenceivNV(fence, pname, params);
+}
+
+void NoErrorGetFixedv(Context *context, GLenum pname, GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFixedv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetFixedv, context, pname, params);
+    context->getFixedv(pname, params);
+}
+
+void NoErrorGetFloatv(Context *context, GLenum pname, GLfloat *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFloatv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetFloatv, context, pname, data);
+    context->getFloatv(pname, data);
+}
+
+void NoErrorGetFloatvRobustANGLE(Context *context,
+                                 GLenum pname,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFloatvRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetFloatvRobustANGLE, context, pname, bufSize, length, params);
+    context->getFloatvRobust(pname, bufSize, length, params);
+}
+
+GLint NoErrorGetFragDataIndexEXT(Context *context, GLuint program, const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFragDataIndexEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetFragDataIndexEXT, context, program, name);
+    return context->getFragDataIndex(program, name);
+}
+
+GLint NoErrorGetFragDataLocation(Context *context, GLuint program, const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFragDataLocation);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetFragDataLocation, context, program, name);
+    return context->getFragDataLocation(program, name);
+}
+
+void NoErrorGetFramebufferAttachmentParameteriv(Context *context,
+                                                GLenum target,
+                                                GLenum attachment,
+                                                GLenum pname,
+                                                GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFramebufferAttachmentParameteriv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetFramebufferAttachmentParameteriv, context, target, attachment, pname,
+                       params);
+    context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
+}
+
+void NoErrorGetFramebufferAttachmentParameterivOES(Context *context,
+                                                   GLenum target,
+                                                   GLenum attachment,
+                                                   GLenum pname,
+                                                   GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFramebufferAttachmentParameterivOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetFramebufferAttachmentParameterivOES, context, target, attachment, pname,
+                       params);
+    context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
+}
+
+void NoErrorGetFramebufferAttachmentParameterivRobustANGLE(Context *context,
+                                                           GLenum target,
+                                                           GLenum attachment,
+                                                           GLenum pname,
+                                                           GLsizei bufSize,
+                                                           GLsizei *length,
+                                                           GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFramebufferAttachmentParameterivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetFramebufferAttachmentParameterivRobustANGLE, context, target, attachment,
+                       pname, bufSize, length, params);
+    context->getFramebufferAttachmentParameterivRobust(target, attachment, pname, bufSize, length,
+                                                       params);
+}
+
+void NoErrorGetFramebufferParameteriv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFramebufferParameteriv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetFramebufferParameteriv, context, target, pname, params);
+    context->getFramebufferParameteriv(target, pname, params);
+}
+
+void NoErrorGetFramebufferParameterivRobustANGLE(Context *context,
+                                                 GLuint sampler,
+                                                 GLenum pname,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetFramebufferParameterivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetFramebufferParameterivRobustANGLE, context, sampler, pname, bufSize,
+                       length, params);
+    context->getFramebufferParameterivRobust(sampler, pname, bufSize, length, params);
+}
+
+GLenum NoErrorGetGraphicsResetStatusEXT(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetGraphicsResetStatusEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetGraphicsResetStatusEXT, context);
+    return context->getGraphicsResetStatus();
+}
+
+void NoErrorGetInteger64i_v(Context *context, GLenum target, GLuint index, GLint64 *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetInteger64i_v);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetInteger64i_v, context, target, index, data);
+    context->getInteger64i_v(target, index, data);
+}
+
+void NoErrorGetInteger64i_vRobustANGLE(Context *context,
+                                       GLenum target,
+                                       GLuint index,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLint64 *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetInteger64i_vRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetInteger64i_vRobustANGLE, context, target, index, bufSize, length, data);
+    context->getInteger64i_vRobust(target, index, bufSize, length, data);
+}
+
+void NoErrorGetInteger64v(Context *context, GLenum pname, GLint64 *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetInteger64v);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetInteger64v, context, pname, data);
+    context->getInteger64v(pname, data);
+}
+
+void NoErrorGetInteger64vRobustANGLE(Context *context,
+                                     GLenum pname,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint64 *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetInteger64vRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetInteger64vRobustANGLE, context, pname, bufSize, length, data);
+    context->getInteger64vRobust(pname, bufSize, length, data);
+}
+
+void NoErrorGetIntegeri_v(Context *context, GLenum target, GLuint index, GLint *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetIntegeri_v);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetIntegeri_v, context, target, index, data);
+    context->getIntegeri_v(target, index, data);
+}
+
+void NoErrorGetIntegeri_vRobustANGLE(Context *context,
+                                     GLenum target,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetIntegeri_vRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetIntegeri_vRobustANGLE, context, target, index, bufSize, length, data);
+    context->getIntegeri_vRobust(target, index, bufSize, length, data);
+}
+
+void NoErrorGetIntegerv(Context *context, GLenum pname, GLint *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetIntegerv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetIntegerv, context, pname, data);
+    context->getIntegerv(pname, data);
+}
+
+void NoErrorGetIntegervRobustANGLE(Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetIntegervRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetIntegervRobustANGLE, context, pname, bufSize, length, data);
+    context->getIntegervRobust(pname, bufSize, length, data);
+}
+
+void NoErrorGetInternalformativ(Context *context,
+                                GLenum target,
+                                GLenum internalformat,
+                                GLenum pname,
+                                GLsizei bufSize,
+                                GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetInternalformativ);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetInternalformativ, context, target, internalformat, pname, bufSize,
+                       params);
+    context->getInternalformativ(target, internalformat, pname, bufSize, params);
+}
+
+void NoErrorGetInternalformativRobustANGLE(Context *context,
+                                           GLenum target,
+                                           GLenum internalformat,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetInternalformativRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetInternalformativRobustANGLE, context, target, internalformat, pname,
+                       bufSize, length, params);
+    context->getInternalformativRobust(target, internalformat, pname, bufSize, length, params);
+}
+
+void NoErrorGetLightfv(Context *context, GLenum light, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetLightfv);
+    LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetLightfv, context, light, pname, params);
+    context->getLightfv(light, pnamePacked, params);
+}
+
+void NoErrorGetLightxv(Context *context, GLenum light, GLenum pname, GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetLightxv);
+    LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetLightxv, context, light, pname, params);
+    context->getLightxv(light, pnamePacked, params);
+}
+
+void NoErrorGetMaterialfv(Context *context, GLenum face, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetMaterialfv);
+    MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetMaterialfv, context, face, pname, params);
+    context->getMaterialfv(face, pnamePacked, params);
+}
+
+void NoErrorGetMaterialxv(Context *context, GLenum face, GLenum pname, GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetMaterialxv);
+    MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetMaterialxv, context, face, pname, params);
+    context->getMaterialxv(face, pnamePacked, params);
+}
+
+void NoErrorGetMemoryObjectParameterivEXT(Context *context,
+                                          GLuint memoryObject,
+                                          GLenum pname,
+                                          GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetMemoryObjectParameterivEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetMemoryObjectParameterivEXT, context, memoryObject, pname, params);
+    context->getMemoryObjectParameteriv(memoryObject, pname, params);
+}
+
+void NoErrorGetMultisamplefv(Context *context, GLenum pname, GLuint index, GLfloat *val)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetMultisamplefv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetMultisamplefv, context, pname, index, val);
+    context->getMultisamplefv(pname, index, val);
+}
+
+void NoErrorGetMultisamplefvANGLE(Context *context, GLenum pname, GLuint index, GLfloat *val)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetMultisamplefvANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetMultisamplefvANGLE, context, pname, index, val);
+    context->getMultisamplefv(pname, index, val);
+}
+
+void NoErrorGetMultisamplefvRobustANGLE(Context *context,
+                                        GLenum pname,
+                                        GLuint index,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLfloat *val)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetMultisamplefvRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetMultisamplefvRobustANGLE, context, pname, index, bufSize, length, val);
+    context->getMultisamplefvRobust(pname, index, bufSize, length, val);
+}
+
+void NoErrorGetObjectLabelKHR(Context *context,
+                              GLenum identifier,
+                              GLuint name,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *label)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetObjectLabelKHR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetObjectLabelKHR, context, identifier, name, bufSize, length, label);
+    context->getObjectLabel(identifier, name, bufSize, length, label);
+}
+
+void NoErrorGetObjectPtrLabelKHR(Context *context,
+                                 const void *ptr,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLchar *label)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetObjectPtrLabelKHR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetObjectPtrLabelKHR, context, ptr, bufSize, length, label);
+    context->getObjectPtrLabel(ptr, bufSize, length, label);
+}
+
+void NoErrorGetPathParameterfvCHROMIUM(Context *context, GLuint path, GLenum pname, GLfloat *value)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetPathParameterfvCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetPathParameterfvCHROMIUM, context, path, pname, value);
+    context->getPathParameterfv(path, pname, value);
+}
+
+void NoErrorGetPathParameterivCHROMIUM(Context *context, GLuint path, GLenum pname, GLint *value)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetPathParameterivCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetPathParameterivCHROMIUM, context, path, pname, value);
+    context->getPathParameteriv(path, pname, value);
+}
+
+void NoErrorGetPointerv(Context *context, GLenum pname, void **params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetPointerv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetPointerv, context, pname, params);
+    context->getPointerv(pname, params);
+}
+
+void NoErrorGetPointervKHR(Context *context, GLenum pname, void **params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetPointervKHR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetPointervKHR, context, pname, params);
+    context->getPointerv(pname, params);
+}
+
+void NoErrorGetPointervRobustANGLERobustANGLE(Context *context,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              void **params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetPointervRobustANGLERobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetPointervRobustANGLERobustANGLE, context, pname, bufSize, length, params);
+    context->getPointervRobustANGLERobust(pname, bufSize, length, params);
+}
+
+void NoErrorGetProgramBinary(Context *context,
+                             GLuint program,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLenum *binaryFormat,
+                             void *binary)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramBinary);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramBinary, context, program, bufSize, length, binaryFormat, binary);
+    context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
+}
+
+void NoErrorGetProgramBinaryOES(Context *context,
+                                GLuint program,
+                                GLsizei bufSize,
+                                GLsizei *length,
+                                GLenum *binaryFormat,
+                                void *binary)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramBinaryOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramBinaryOES, context, program, bufSize, length, binaryFormat,
+                       binary);
+    context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
+}
+
+void NoErrorGetProgramInfoLog(Context *context,
+                              GLuint program,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *infoLog)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramInfoLog);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramInfoLog, context, program, bufSize, length, infoLog);
+    context->getProgramInfoLog(program, bufSize, length, infoLog);
+}
+
+void NoErrorGetProgramInterfaceiv(Context *context,
+                                  GLuint program,
+                                  GLenum programInterface,
+                                  GLenum pname,
+                                  GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramInterfaceiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramInterfaceiv, context, program, programInterface, pname, params);
+    context->getProgramInterfaceiv(program, programInterface, pname, params);
+}
+
+void NoErrorGetProgramInterfaceivRobustANGLE(Context *context,
+                                             GLuint program,
+                                             GLenum programInterface,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramInterfaceivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramInterfaceivRobustANGLE, context, program, programInterface, pname,
+                       bufSize, length, params);
+    context->getProgramInterfaceivRobust(program, programInterface, pname, bufSize, length, params);
+}
+
+void NoErrorGetProgramPipelineInfoLog(Context *context,
+                                      GLuint pipeline,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLchar *infoLog)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramPipelineInfoLog);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramPipelineInfoLog, context, pipeline, bufSize, length, infoLog);
+    context->getProgramPipelineInfoLog(pipeline, bufSize, length, infoLog);
+}
+
+void NoErrorGetProgramPipelineiv(Context *context, GLuint pipeline, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramPipelineiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramPipelineiv, context, pipeline, pname, params);
+    context->getProgramPipelineiv(pipeline, pname, params);
+}
+
+GLuint NoErrorGetProgramResourceIndex(Context *context,
+                                      GLuint program,
+                                      GLenum programInterface,
+                                      const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramResourceIndex);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramResourceIndex, context, program, programInterface, name);
+    return context->getProgramResourceIndex(program, programInterface, name);
+}
+
+GLint NoErrorGetProgramResourceLocation(Context *context,
+                                        GLuint program,
+                                        GLenum programInterface,
+                                        const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramResourceLocation);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramResourceLocation, context, program, programInterface, name);
+    return context->getProgramResourceLocation(program, programInterface, name);
+}
+
+GLint NoErrorGetProgramResourceLocationIndexEXT(Context *context,
+                                                GLuint program,
+                                                GLenum programInterface,
+                                                const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramResourceLocationIndexEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramResourceLocationIndexEXT, context, program, programInterface,
+                       name);
+    return context->getProgramResourceLocationIndex(program, programInterface, name);
+}
+
+void NoErrorGetProgramResourceName(Context *context,
+                                   GLuint program,
+                                   GLenum programInterface,
+                                   GLuint index,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramResourceName);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramResourceName, context, program, programInterface, index, bufSize,
+                       length, name);
+    context->getProgramResourceName(program, programInterface, index, bufSize, length, name);
+}
+
+void NoErrorGetProgramResourceiv(Context *context,
+                                 GLuint program,
+                                 GLenum programInterface,
+                                 GLuint index,
+                                 GLsizei propCount,
+                                 const GLenum *props,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramResourceiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramResourceiv, context, program, programInterface, index, propCount,
+                       props, bufSize, length, params);
+    context->getProgramResourceiv(program, programInterface, index, propCount, props, bufSize,
+                                  length, params);
+}
+
+void NoErrorGetProgramiv(Context *context, GLuint program, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramiv, context, program, pname, params);
+    context->getProgramiv(program, pname, params);
+}
+
+void NoErrorGetProgramivRobustANGLE(Context *context,
+                                    GLuint program,
+                                    GLenum pname,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetProgramivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetProgramivRobustANGLE, context, program, pname, bufSize, length, params);
+    context->getProgramivRobust(program, pname, bufSize, length, params);
+}
+
+void NoErrorGetQueryObjecti64vEXT(Context *context, GLuint id, GLenum pname, GLint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjecti64vEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetQueryObjecti64vEXT, context, id, pname, params);
+    context->getQueryObjecti64v(id, pname, params);
+}
+
+void NoErrorGetQueryObjecti64vRobustANGLE(Context *context,
+                                          GLuint id,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjecti64vRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetQueryObjecti64vRobustANGLE, context, id, pname, bufSize, length, params);
+    context->getQueryObjecti64vRobust(id, pname, bufSize, length, params);
+}
+
+void NoErrorGetQueryObjectivEXT(Context *context, GLuint id, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectivEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetQueryObjectivEXT, context, id, pname, params);
+    context->getQueryObjectiv(id, pname, params);
+}
+
+void NoErrorGetQueryObjectivRobustANGLE(Context *context,
+                                        GLuint id,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetQueryObjectivRobustANGLE, context, id, pname, bufSize, length, params);
+    context->getQueryObjectivRobust(id, pname, bufSize, length, params);
+}
+
+void NoErrorGetQueryObjectui64vEXT(Context *context, GLuint id, GLenum pname, GLuint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectui64vEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetQueryObjectui64vEXT, context, id, pname, params);
+    context->getQueryObjectui64v(id, pname, params);
+}
+
+void NoErrorGetQueryObjectui64vRobustANGLE(Context *context,
+                                           GLuint id,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectui64vRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetQueryObjectui64vRobustANGLE, context, id, pname, bufSize, length, params);
+    context->getQueryObjectui64vRobust(id, pname, bufSize, length, params);
+}
+
+void NoErrorGetQueryObjectuiv(Context *context, GLuint id, GLenum pname, GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectuiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetQueryObjectuiv, context, id, pname, params);
+    context->getQueryObjectuiv(id, pname, params);
+}
+
+void NoErrorGetQueryObjectuivEXT(Context *context, GLuint id, GLenum pname, GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectuivEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetQueryObjectuivEXT, context, id, pname, params);
+    context->getQueryObjectuiv(id, pname, params);
+}
+
+void NoErrorGetQueryObjectuivRobustANGLE(Context *context,
+                                         GLuint id,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryObjectuivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetQueryObjectuivRobustANGLE, context, id, pname, bufSize, length, params);
+    context->getQueryObjectuivRobust(id, pname, bufSize, length, params);
+}
+
+void NoErrorGetQueryiv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryiv);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetQueryiv, context, target, pname, params);
+    context->getQueryiv(targetPacked, pname, params);
+}
+
+void NoErrorGetQueryivEXT(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryivEXT);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetQueryivEXT, context, target, pname, params);
+    context->getQueryiv(targetPacked, pname, params);
+}
+
+void NoErrorGetQueryivRobustANGLE(Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetQueryivRobustANGLE);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetQueryivRobustANGLE, context, target, pname, bufSize, length, params);
+    context->getQueryivRobust(targetPacked, pname, bufSize, length, params);
+}
+
+void NoErrorGetRenderbufferParameteriv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetRenderbufferParameteriv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetRenderbufferParameteriv, context, target, pname, params);
+    context->getRenderbufferParameteriv(target, pname, params);
+}
+
+void NoErrorGetRenderbufferParameterivOES(Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetRenderbufferParameterivOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetRenderbufferParameterivOES, context, target, pname, params);
+    context->getRenderbufferParameteriv(target, pname, params);
+}
+
+void NoErrorGetRenderbufferParameterivRobustANGLE(Context *context,
+                                                  GLenum target,
+                                                  GLenum pname,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetRenderbufferParameterivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetRenderbufferParameterivRobustANGLE, context, target, pname, bufSize,
+                       length, params);
+    context->getRenderbufferParameterivRobust(target, pname, bufSize, length, params);
+}
+
+void NoErrorGetSamplerParameterIivOES(Context *context, GLuint sampler, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterIivOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetSamplerParameterIivOES, context, sampler, pname, params);
+    context->getSamplerParameterIiv(sampler, pname, params);
+}
+
+void NoErrorGetSamplerParameterIivRobustANGLE(Context *context,
+                                              GLuint sampler,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterIivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetSamplerParameterIivRobustANGLE, context, sampler, pname, bufSize, length,
+                       params);
+    context->getSamplerParameterIivRobust(sampler, pname, bufSize, length, params);
+}
+
+void NoErrorGetSamplerParameterIuivOES(Context *context,
+                                       GLuint sampler,
+                                       GLenum pname,
+                                       GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterIuivOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetSamplerParameterIuivOES, context, sampler, pname, params);
+    context->getSamplerParameterIuiv(sampler, pname, params);
+}
+
+void NoErrorGetSamplerParameterIuivRobustANGLE(Context *context,
+                                               GLuint sampler,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterIuivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetSamplerParameterIuivRobustANGLE, context, sampler, pname, bufSize, length,
+                       params);
+    context->getSamplerParameterIuivRobust(sampler, pname, bufSize, length, params);
+}
+
+void NoErrorGetSamplerParameterfv(Context *context, GLuint sampler, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterfv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetSamplerParameterfv, context, sampler, pname, params);
+    context->getSamplerParameterfv(sampler, pname, params);
+}
+
+void NoErrorGetSamplerParameterfvRobustANGLE(Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterfvRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetSamplerParameterfvRobustANGLE, context, sampler, pname, bufSize, length,
+                       params);
+    context->getSamplerParameterfvRobust(sampler, pname, bufSize, length, params);
+}
+
+void NoErrorGetSamplerParameteriv(Context *context, GLuint sampler, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameteriv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetSamplerParameteriv, context, sampler, pname, params);
+    context->getSamplerParameteriv(sampler, pname, params);
+}
+
+void NoErrorGetSamplerParameterivRobustANGLE(Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSamplerParameterivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetSamplerParameterivRobustANGLE, context, sampler, pname, bufSize, length,
+                       params);
+    context->getSamplerParameterivRobust(sampler, pname, bufSize, length, params);
+}
+
+void NoErrorGetSemaphoreParameterui64vEXT(Context *context,
+                                          GLuint semaphore,
+                                          GLenum pname,
+                                          GLuint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSemaphoreParameterui64vEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetSemaphoreParameterui64vEXT, context, semaphore, pname, params);
+    context->getSemaphoreParameterui64v(semaphore, pname, params);
+}
+
+void NoErrorGetShaderInfoLog(Context *context,
+                             GLuint shader,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLchar *infoLog)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetShaderInfoLog);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetShaderInfoLog, context, shader, bufSize, length, infoLog);
+    context->getShaderInfoLog(shader, bufSize, length, infoLog);
+}
+
+void NoErrorGetShaderPrecisionFormat(Context *context,
+                                     GLenum shadertype,
+                                     GLenum precisiontype,
+                                     GLint *range,
+                                     GLint *precision)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetShaderPrecisionFormat);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetShaderPrecisionFormat, context, shadertype, precisiontype, range,
+                       precision);
+    context->getShaderPrecisionFormat(shadertype, precisiontype, range, precision);
+}
+
+void NoErrorGetShaderSource(Context *context,
+                            GLuint shader,
+                            GLsizei bufSize,
+                            GLsizei *length,
+                            GLchar *source)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetShaderSource);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetShaderSource, context, shader, bufSize, length, source);
+    context->getShaderSource(shader, bufSize, length, source);
+}
+
+void NoErrorGetShaderiv(Context *context, GLuint shader, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetShaderiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetShaderiv, context, shader, pname, params);
+    context->getShaderiv(shader, pname, params);
+}
+
+void NoErrorGetShaderivRobustANGLE(Context *context,
+                                   GLuint shader,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetShaderivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetShaderivRobustANGLE, context, shader, pname, bufSize, length, params);
+    context->getShaderivRobust(shader, pname, bufSize, length, params);
+}
+
+const GLubyte *NoErrorGetString(Context *context, GLenum name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetString);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetString, context, name);
+    return context->getString(name);
+}
+
+const GLubyte *NoErrorGetStringi(Context *context, GLenum name, GLuint index)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetStringi);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetStringi, context, name, index);
+    return context->getStringi(name, index);
+}
+
+void NoErrorGetSynciv(Context *context,
+                      GLsync sync,
+                      GLenum pname,
+                      GLsizei bufSize,
+                      GLsizei *length,
+                      GLint *values)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetSynciv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetSynciv, context, sync, pname, bufSize, length, values);
+    context->getSynciv(sync, pname, bufSize, length, values);
+}
+
+void NoErrorGetTexEnvfv(Context *context, GLenum target, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexEnvfv);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexEnvfv, context, target, pname, params);
+    context->getTexEnvfv(targetPacked, pnamePacked, params);
+}
+
+void NoErrorGetTexEnviv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexEnviv);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexEnviv, context, target, pname, params);
+    context->getTexEnviv(targetPacked, pnamePacked, params);
+}
+
+void NoErrorGetTexEnvxv(Context *context, GLenum target, GLenum pname, GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexEnvxv);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexEnvxv, context, target, pname, params);
+    context->getTexEnvxv(targetPacked, pnamePacked, params);
+}
+
+void NoErrorGetTexGenfvOES(Context *context, GLenum coord, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexGenfvOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexGenfvOES, context, coord, pname, params);
+    context->getTexGenfv(coord, pname, params);
+}
+
+void NoErrorGetTexGenivOES(Context *context, GLenum coord, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexGenivOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexGenivOES, context, coord, pname, params);
+    context->getTexGeniv(coord, pname, params);
+}
+
+void NoErrorGetTexGenxvOES(Context *context, GLenum coord, GLenum pname, GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexGenxvOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexGenxvOES, context, coord, pname, params);
+    context->getTexGenxv(coord, pname, params);
+}
+
+void NoErrorGetTexLevelParameterfv(Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum pname,
+                                   GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexLevelParameterfv);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexLevelParameterfv, context, target, level, pname, params);
+    context->getTexLevelParameterfv(targetPacked, level, pname, params);
+}
+
+void NoErrorGetTexLevelParameterfvANGLE(Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLenum pname,
+                                        GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexLevelParameterfvANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexLevelParameterfvANGLE, context, target, level, pname, params);
+    context->getTexLevelParameterfv(targetPacked, level, pname, params);
+}
+
+void NoErrorGetTexLevelParameterfvRobustANGLE(Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexLevelParameterfvRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexLevelParameterfvRobustANGLE, context, target, level, pname, bufSize,
+                       length, params);
+    context->getTexLevelParameterfvRobust(targetPacked, level, pname, bufSize, length, params);
+}
+
+void NoErrorGetTexLevelParameteriv(Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum pname,
+                                   GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexLevelParameteriv);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexLevelParameteriv, context, target, level, pname, params);
+    context->getTexLevelParameteriv(targetPacked, level, pname, params);
+}
+
+void NoErrorGetTexLevelParameterivANGLE(Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLenum pname,
+                                        GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexLevelParameterivANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexLevelParameterivANGLE, context, target, level, pname, params);
+    context->getTexLevelParameteriv(targetPacked, level, pname, params);
+}
+
+void NoErrorGetTexLevelParameterivRobustANGLE(Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexLevelParameterivRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexLevelParameterivRobustANGLE, context, target, level, pname, bufSize,
+                       length, params);
+    context->getTexLevelParameterivRobust(targetPacked, level, pname, bufSize, length, params);
+}
+
+void NoErrorGetTexParameterIivOES(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterIivOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexParameterIivOES, context, target, pname, params);
+    context->getTexParameterIiv(targetPacked, pname, params);
+}
+
+void NoErrorGetTexParameterIivRobustANGLE(Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterIivRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexParameterIivRobustANGLE, context, target, pname, bufSize, length,
+                       params);
+    context->getTexParameterIivRobust(targetPacked, pname, bufSize, length, params);
+}
+
+void NoErrorGetTexParameterIuivOES(Context *context, GLenum target, GLenum pname, GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterIuivOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexParameterIuivOES, context, target, pname, params);
+    context->getTexParameterIuiv(targetPacked, pname, params);
+}
+
+void NoErrorGetTexParameterIuivRobustANGLE(Context *context,
+                                           GLenum target,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterIuivRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexParameterIuivRobustANGLE, context, target, pname, bufSize, length,
+                       params);
+    context->getTexParameterIuivRobust(targetPacked, pname, bufSize, length, params);
+}
+
+void NoErrorGetTexParameterfv(Context *context, GLenum target, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterfv);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexParameterfv, context, target, pname, params);
+    context->getTexParameterfv(targetPacked, pname, params);
+}
+
+void NoErrorGetTexParameterfvRobustANGLE(Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterfvRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexParameterfvRobustANGLE, context, target, pname, bufSize, length,
+                       params);
+    context->getTexParameterfvRobust(targetPacked, pname, bufSize, length, params);
+}
+
+void NoErrorGetTexParameteriv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameteriv);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexParameteriv, context, target, pname, params);
+    context->getTexParameteriv(targetPacked, pname, params);
+}
+
+void NoErrorGetTexParameterivRobustANGLE(Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterivRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexParameterivRobustANGLE, context, target, pname, bufSize, length,
+                       params);
+    context->getTexParameterivRobust(targetPacked, pname, bufSize, length, params);
+}
+
+void NoErrorGetTexParameterxv(Context *context, GLenum target, GLenum pname, GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTexParameterxv);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTexParameterxv, context, target, pname, params);
+    context->getTexParameterxv(targetPacked, pname, params);
+}
+
+void NoErrorGetTransformFeedbackVarying(Context *context,
+                                        GLuint program,
+                                        GLuint index,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLsizei *size,
+                                        GLenum *type,
+                                        GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTransformFeedbackVarying);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTransformFeedbackVarying, context, program, index, bufSize, length, size,
+                       type, name);
+    context->getTransformFeedbackVarying(program, index, bufSize, length, size, type, name);
+}
+
+void NoErrorGetTranslatedShaderSourceANGLE(Context *context,
+                                           GLuint shader,
+                                           GLsizei bufsize,
+                                           GLsizei *length,
+                                           GLchar *source)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetTranslatedShaderSourceANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetTranslatedShaderSourceANGLE, context, shader, bufsize, length, source);
+    context->getTranslatedShaderSource(shader, bufsize, length, source);
+}
+
+GLuint NoErrorGetUniformBlockIndex(Context *context, GLuint program, const GLchar *uniformBlockName)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformBlockIndex);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetUniformBlockIndex, context, program, uniformBlockName);
+    return context->getUniformBlockIndex(program, uniformBlockName);
+}
+
+void NoErrorGetUniformIndices(Context *context,
+                              GLuint program,
+                              GLsizei uniformCount,
+                              const GLchar *const *uniformNames,
+                              GLuint *uniformIndices)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformIndices);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetUniformIndices, context, program, uniformCount, uniformNames,
+                       uniformIndices);
+    context->getUniformIndices(program, uniformCount, uniformNames, uniformIndices);
+}
+
+GLint NoErrorGetUniformLocation(Context *context, GLuint program, const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformLocation);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetUniformLocation, context, program, name);
+    return context->getUniformLocation(program, name);
+}
+
+void NoErrorGetUniformfv(Context *context, GLuint program, GLint location, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformfv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetUniformfv, context, program, location, params);
+    context->getUniformfv(program, location, params);
+}
+
+void NoErrorGetUniformfvRobustANGLE(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformfvRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetUniformfvRobustANGLE, context, program, location, bufSize, length,
+                       params);
+    context->getUniformfvRobust(program, location, bufSize, length, params);
+}
+
+void NoErrorGetUniformiv(Context *context, GLuint program, GLint location, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetUniformiv, context, program, location, params);
+    context->getUniformiv(program, location, params);
+}
+
+void NoErrorGetUniformivRobustANGLE(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetUniformivRobustANGLE, context, program, location, bufSize, length,
+                       params);
+    context->getUniformivRobust(program, location, bufSize, length, params);
+}
+
+void NoErrorGetUniformuiv(Context *context, GLuint program, GLint location, GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformuiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetUniformuiv, context, program, location, params);
+    context->getUniformuiv(program, location, params);
+}
+
+void NoErrorGetUniformuivRobustANGLE(Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUniformuivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetUniformuivRobustANGLE, context, program, location, bufSize, length,
+                       params);
+    context->getUniformuivRobust(program, location, bufSize, length, params);
+}
+
+void NoErrorGetUnsignedBytei_vEXT(Context *context, GLenum target, GLuint index, GLubyte *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUnsignedBytei_vEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetUnsignedBytei_vEXT, context, target, index, data);
+    context->getUnsignedBytei_v(target, index, data);
+}
+
+void NoErrorGetUnsignedBytevEXT(Context *context, GLenum pname, GLubyte *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetUnsignedBytevEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetUnsignedBytevEXT, context, pname, data);
+    context->getUnsignedBytev(pname, data);
+}
+
+void NoErrorGetVertexAttribIiv(Context *context, GLuint index, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribIiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetVertexAttribIiv, context, index, pname, params);
+    context->getVertexAttribIiv(index, pname, params);
+}
+
+void NoErrorGetVertexAttribIivRobustANGLE(Context *context,
+                                          GLuint index,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribIivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetVertexAttribIivRobustANGLE, context, index, pname, bufSize, length,
+                       params);
+    context->getVertexAttribIivRobust(index, pname, bufSize, length, params);
+}
+
+void NoErrorGetVertexAttribIuiv(Context *context, GLuint index, GLenum pname, GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribIuiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetVertexAttribIuiv, context, index, pname, params);
+    context->getVertexAttribIuiv(index, pname, params);
+}
+
+void NoErrorGetVertexAttribIuivRobustANGLE(Context *context,
+                                           GLuint index,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribIuivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetVertexAttribIuivRobustANGLE, context, index, pname, bufSize, length,
+                       params);
+    context->getVertexAttribIuivRobust(index, pname, bufSize, length, params);
+}
+
+void NoErrorGetVertexAttribPointerv(Context *context, GLuint index, GLenum pname, void **pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribPointerv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetVertexAttribPointerv, context, index, pname, pointer);
+    context->getVertexAttribPointerv(index, pname, pointer);
+}
+
+void NoErrorGetVertexAttribPointervRobustANGLE(Context *context,
+                                               GLuint index,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               void **pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribPointervRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetVertexAttribPointervRobustANGLE, context, index, pname, bufSize, length,
+                       pointer);
+    context->getVertexAttribPointervRobust(index, pname, bufSize, length, pointer);
+}
+
+void NoErrorGetVertexAttribfv(Context *context, GLuint index, GLenum pname, GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribfv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetVertexAttribfv, context, index, pname, params);
+    context->getVertexAttribfv(index, pname, params);
+}
+
+void NoErrorGetVertexAttribfvRobustANGLE(Context *context,
+                                         GLuint index,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribfvRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetVertexAttribfvRobustANGLE, context, index, pname, bufSize, length,
+                       params);
+    context->getVertexAttribfvRobust(index, pname, bufSize, length, params);
+}
+
+void NoErrorGetVertexAttribiv(Context *context, GLuint index, GLenum pname, GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetVertexAttribiv, context, index, pname, params);
+    context->getVertexAttribiv(index, pname, params);
+}
+
+void NoErrorGetVertexAttribivRobustANGLE(Context *context,
+                                         GLuint index,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetVertexAttribivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetVertexAttribivRobustANGLE, context, index, pname, bufSize, length,
+                       params);
+    context->getVertexAttribivRobust(index, pname, bufSize, length, params);
+}
+
+void NoErrorGetnUniformfvEXT(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei bufSize,
+                             GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetnUniformfvEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetnUniformfvEXT, context, program, location, bufSize, params);
+    context->getnUniformfv(program, location, bufSize, params);
+}
+
+void NoErrorGetnUniformfvRobustANGLE(Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetnUniformfvRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetnUniformfvRobustANGLE, context, program, location, bufSize, length,
+                       params);
+    context->getnUniformfvRobust(program, location, bufSize, length, params);
+}
+
+void NoErrorGetnUniformivEXT(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei bufSize,
+                             GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetnUniformivEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetnUniformivEXT, context, program, location, bufSize, params);
+    context->getnUniformiv(program, location, bufSize, params);
+}
+
+void NoErrorGetnUniformivRobustANGLE(Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetnUniformivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetnUniformivRobustANGLE, context, program, location, bufSize, length,
+                       params);
+    context->getnUniformivRobust(program, location, bufSize, length, params);
+}
+
+void NoErrorGetnUniformuivRobustANGLE(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(GetnUniformuivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(GetnUniformuivRobustANGLE, context, program, location, bufSize, length,
+                       params);
+    context->getnUniformuivRobust(program, location, bufSize, length, params);
+}
+
+void NoErrorHint(Context *context, GLenum target, GLenum mode)
+{
+    ANGLE_DEFER_COMMAND(Hint, context, target, mode);
+    ANGLE_PROFILE_ENTRY_POINT(Hint);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Hint, context, target, mode);
+    context->hint(target, mode);
+}
+
+void NoErrorImportMemoryFdEXT(Context *context,
+                              GLuint memory,
+                              GLuint64 size,
+                              GLenum handleType,
+                              GLint fd)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ImportMemoryFdEXT);
+    HandleType handleTypePacked = FromGLenum<HandleType>(handleType);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ImportMemoryFdEXT, context, memory, size, handleType, fd);
+    context->importMemoryFd(memory, size, handleTypePacked, fd);
+}
+
+void NoErrorImportSemaphoreFdEXT(Context *context, GLuint semaphore, GLenum handleType, GLint fd)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ImportSemaphoreFdEXT);
+    HandleType handleTypePacked = FromGLenum<HandleType>(handleType);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ImportSemaphoreFdEXT, context, semaphore, handleType, fd);
+    context->importSemaphoreFd(semaphore, handleTypePacked, fd);
+}
+
+void NoErrorInsertEventMarkerEXT(Context *context, GLsizei length, const GLchar *marker)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(InsertEventMarkerEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(InsertEventMarkerEXT, context, length, marker);
+    context->insertEventMarker(length, marker);
+}
+
+void NoErrorInvalidateFramebuffer(Context *context,
+                                  GLenum target,
+                                  GLsizei numAttachments,
+                                  const GLenum *attachments)
+{
+    ANGLE_DEFER_COMMAND(InvalidateFramebuffer, context, target, numAttachments, attachments);
+    ANGLE_PROFILE_ENTRY_POINT(InvalidateFramebuffer);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(InvalidateFramebuffer, context, target, numAttachments, attachments);
+    context->invalidateFramebuffer(target, numAttachments, attachments);
+}
+
+void NoErrorInvalidateSubFramebuffer(Context *context,
+                                     GLenum target,
+                                     GLsizei numAttachments,
+                                     const GLenum *attachments,
+                                     GLint x,
+                                     GLint y,
+                                     GLsizei width,
+                                     GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(InvalidateSubFramebuffer, context, target, numAttachments, attachments, x,
+                        y, width, height);
+    ANGLE_PROFILE_ENTRY_POINT(InvalidateSubFramebuffer);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(InvalidateSubFramebuffer, context, target, numAttachments, attachments, x, y,
+                       width, height);
+    context->invalidateSubFramebuffer(target, numAttachments, attachments, x, y, width, height);
+}
+
+GLboolean NoErrorIsBuffer(Context *context, GLuint buffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsBuffer);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsBuffer, context, buffer);
+    return context->isBuffer(buffer);
+}
+
+GLboolean NoErrorIsEnabled(Context *context, GLenum cap)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsEnabled);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsEnabled, context, cap);
+    return context->isEnabled(cap);
+}
+
+GLboolean NoErrorIsFenceNV(Context *context, GLuint fence)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsFenceNV);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsFenceNV, context, fence);
+    return context->isFenceNV(fence);
+}
+
+GLboolean NoErrorIsFramebuffer(Context *context, GLuint framebuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsFramebuffer);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsFramebuffer, context, framebuffer);
+    return context->isFramebuffer(framebuffer);
+}
+
+GLboolean NoErrorIsFramebufferOES(Context *context, GLuint framebuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsFramebufferOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsFramebufferOES, context, framebuffer);
+    return context->isFramebuffer(framebuffer);
+}
+
+GLboolean NoErrorIsMemoryObjectEXT(Context *context, GLuint memoryObject)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsMemoryObjectEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsMemoryObjectEXT, context, memoryObject);
+    return context->isMemoryObject(memoryObject);
+}
+
+GLboolean NoErrorIsPathCHROMIUM(Context *context, GLuint path)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsPathCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsPathCHROMIUM, context, path);
+    return context->isPath(path);
+}
+
+GLboolean NoErrorIsProgram(Context *context, GLuint program)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsProgram);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsProgram, context, program);
+    return context->isProgram(program);
+}
+
+GLboolean NoErrorIsProgramPipeline(Context *context, GLuint pipeline)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsProgramPipeline);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsProgramPipeline, context, pipeline);
+    return context->isProgramPipeline(pipeline);
+}
+
+GLboolean NoErrorIsQuery(Context *context, GLuint id)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsQuery);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsQuery, context, id);
+    return context->isQuery(id);
+}
+
+GLboolean NoErrorIsQueryEXT(Context *context, GLuint id)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsQueryEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsQueryEXT, context, id);
+    return context->isQuery(id);
+}
+
+GLboolean NoErrorIsRenderbuffer(Context *context, GLuint renderbuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsRenderbuffer);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsRenderbuffer, context, renderbuffer);
+    return context->isRenderbuffer(renderbuffer);
+}
+
+GLboolean NoErrorIsRenderbufferOES(Context *context, GLuint renderbuffer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsRenderbufferOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsRenderbufferOES, context, renderbuffer);
+    return context->isRenderbuffer(renderbuffer);
+}
+
+GLboolean NoErrorIsSampler(Context *context, GLuint sampler)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsSampler);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsSampler, context, sampler);
+    return context->isSampler(sampler);
+}
+
+GLboolean NoErrorIsSemaphoreEXT(Context *context, GLuint semaphore)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsSemaphoreEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsSemaphoreEXT, context, semaphore);
+    return context->isSemaphore(semaphore);
+}
+
+GLboolean NoErrorIsShader(Context *context, GLuint shader)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsShader);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsShader, context, shader);
+    return context->isShader(shader);
+}
+
+GLboolean NoErrorIsSync(Context *context, GLsync sync)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsSync);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsSync, context, sync);
+    return context->isSync(sync);
+}
+
+GLboolean NoErrorIsTexture(Context *context, GLuint texture)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsTexture);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsTexture, context, texture);
+    return context->isTexture(texture);
+}
+
+GLboolean NoErrorIsTransformFeedback(Context *context, GLuint id)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsTransformFeedback);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsTransformFeedback, context, id);
+    return context->isTransformFeedback(id);
+}
+
+GLboolean NoErrorIsVertexArray(Context *context, GLuint array)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsVertexArray);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsVertexArray, context, array);
+    return context->isVertexArray(array);
+}
+
+GLboolean NoErrorIsVertexArrayOES(Context *context, GLuint array)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(IsVertexArrayOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(IsVertexArrayOES, context, array);
+    return context->isVertexArray(array);
+}
+
+void NoErrorLightModelf(Context *context, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LightModelf);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LightModelf, context, pname, param);
+    context->lightModelf(pname, param);
+}
+
+void NoErrorLightModelfv(Context *context, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LightModelfv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LightModelfv, context, pname, params);
+    context->lightModelfv(pname, params);
+}
+
+void NoErrorLightModelx(Context *context, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LightModelx);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LightModelx, context, pname, param);
+    context->lightModelx(pname, param);
+}
+
+void NoErrorLightModelxv(Context *context, GLenum pname, const GLfixed *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LightModelxv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LightModelxv, context, pname, param);
+    context->lightModelxv(pname, param);
+}
+
+void NoErrorLightf(Context *context, GLenum light, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Lightf);
+    LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Lightf, context, light, pname, param);
+    context->lightf(light, pnamePacked, param);
+}
+
+void NoErrorLightfv(Context *context, GLenum light, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Lightfv);
+    LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Lightfv, context, light, pname, params);
+    context->lightfv(light, pnamePacked, params);
+}
+
+void NoErrorLightx(Context *context, GLenum light, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Lightx);
+    LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Lightx, context, light, pname, param);
+    context->lightx(light, pnamePacked, param);
+}
+
+void NoErrorLightxv(Context *context, GLenum light, GLenum pname, const GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Lightxv);
+    LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Lightxv, context, light, pname, params);
+    context->lightxv(light, pnamePacked, params);
+}
+
+void NoErrorLineWidth(Context *context, GLfloat width)
+{
+    ANGLE_DEFER_COMMAND(LineWidth, context, width);
+    ANGLE_PROFILE_ENTRY_POINT(LineWidth);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LineWidth, context, width);
+    context->lineWidth(width);
+}
+
+void NoErrorLineWidthx(Context *context, GLfixed width)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LineWidthx);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LineWidthx, context, width);
+    context->lineWidthx(width);
+}
+
+void NoErrorLinkProgram(Context *context, GLuint program)
+{
+    ANGLE_DEFER_COMMAND(LinkProgram, context, program);
+    ANGLE_PROFILE_ENTRY_POINT(LinkProgram);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LinkProgram, context, program);
+    context->linkProgram(program);
+}
+
+void NoErrorLoadIdentity(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(LoadIdentity);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LoadIdentity, context);
+    context->loadIdentity();
+}
+
+void NoErrorLoadMatrixf(Context *context, const GLfloat *m)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(LoadMatrixf);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LoadMatrixf, context, m);
+    context->loadMatrixf(m);
+}
+
+void NoErrorLoadMatrixx(Context *context, const GLfixed *m)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LoadMatrixx);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LoadMatrixx, context, m);
+    context->loadMatrixx(m);
+}
+
+void NoErrorLoadPaletteFromModelViewMatrixOES(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LoadPaletteFromModelViewMatrixOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LoadPaletteFromModelViewMatrixOES, context);
+    context->loadPaletteFromModelViewMatrix();
+}
+
+void NoErrorLogicOp(Context *context, GLenum opcode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LogicOp);
+    LogicalOperation opcodePacked = FromGLenum<LogicalOperation>(opcode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LogicOp, context, opcode);
+    context->logicOp(opcodePacked);
+}
+
+void NoErrorLoseContextCHROMIUM(Context *context, GLenum current, GLenum other)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(LoseContextCHROMIUM);
+    GraphicsResetStatus currentPacked = FromGLenum<GraphicsResetStatus>(current);
+    GraphicsResetStatus otherPacked   = FromGLenum<GraphicsResetStatus>(other);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(LoseContextCHROMIUM, context, current, other);
+    context->loseContext(currentPacked, otherPacked);
+}
+
+void *NoErrorMapBufferOES(Context *context, GLenum target, GLenum access)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MapBufferOES);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MapBufferOES, context, target, access);
+    return context->mapBuffer(targetPacked, access);
+}
+
+void *NoErrorMapBufferRange(Context *context,
+                            GLenum target,
+                            GLintptr offset,
+                            GLsizeiptr length,
+                            GLbitfield access)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MapBufferRange);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MapBufferRange, context, target, offset, length, access);
+    return context->mapBufferRange(targetPacked, offset, length, access);
+}
+
+void *NoErrorMapBufferRangeEXT(Context *context,
+                               GLenum target,
+                               GLintptr offset,
+                               GLsizeiptr length,
+                               GLbitfield access)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MapBufferRangeEXT);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MapBufferRangeEXT, context, target, offset, length, access);
+    return context->mapBufferRange(targetPacked, offset, length, access);
+}
+
+void NoErrorMaterialf(Context *context, GLenum face, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Materialf);
+    MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Materialf, context, face, pname, param);
+    context->materialf(face, pnamePacked, param);
+}
+
+void NoErrorMaterialfv(Context *context, GLenum face, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Materialfv);
+    MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Materialfv, context, face, pname, params);
+    context->materialfv(face, pnamePacked, params);
+}
+
+void NoErrorMaterialx(Context *context, GLenum face, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Materialx);
+    MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Materialx, context, face, pname, param);
+    context->materialx(face, pnamePacked, param);
+}
+
+void NoErrorMaterialxv(Context *context, GLenum face, GLenum pname, const GLfixed *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Materialxv);
+    MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Materialxv, context, face, pname, param);
+    context->materialxv(face, pnamePacked, param);
+}
+
+void NoErrorMatrixIndexPointerOES(Context *context,
+                                  GLint size,
+                                  GLenum type,
+                                  GLsizei stride,
+                                  const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MatrixIndexPointerOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MatrixIndexPointerOES, context, size, type, stride, pointer);
+    context->matrixIndexPointer(size, type, stride, pointer);
+}
+
+void NoErrorMatrixLoadIdentityCHROMIUM(Context *context, GLenum matrixMode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MatrixLoadIdentityCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MatrixLoadIdentityCHROMIUM, context, matrixMode);
+    context->matrixLoadIdentity(matrixMode);
+}
+
+void NoErrorMatrixLoadfCHROMIUM(Context *context, GLenum matrixMode, const GLfloat *matrix)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MatrixLoadfCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MatrixLoadfCHROMIUM, context, matrixMode, matrix);
+    context->matrixLoadf(matrixMode, matrix);
+}
+
+void NoErrorMatrixMode(Context *context, GLenum mode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(MatrixMode);
+    MatrixType modePacked = FromGLenum<MatrixType>(mode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MatrixMode, context, mode);
+    context->matrixMode(modePacked);
+}
+
+void NoErrorMaxShaderCompilerThreadsKHR(Context *context, GLuint count)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MaxShaderCompilerThreadsKHR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MaxShaderCompilerThreadsKHR, context, count);
+    context->maxShaderCompilerThreads(count);
+}
+
+void NoErrorMemoryBarrier(Context *context, GLbitfield barriers)
+{
+    ANGLE_DEFER_COMMAND(MemoryBarrier, context, barriers);
+    ANGLE_PROFILE_ENTRY_POINT(MemoryBarrier);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MemoryBarrier, context, barriers);
+    context->memoryBarrier(barriers);
+}
+
+void NoErrorMemoryBarrierByRegion(Context *context, GLbitfield barriers)
+{
+    ANGLE_DEFER_COMMAND(MemoryBarrierByRegion, context, barriers);
+    ANGLE_PROFILE_ENTRY_POINT(MemoryBarrierByRegion);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MemoryBarrierByRegion, context, barriers);
+    context->memoryBarrierByRegion(barriers);
+}
+
+void NoErrorMemoryObjectParameterivEXT(Context *context,
+                                       GLuint memoryObject,
+                                       GLenum pname,
+                                       const GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MemoryObjectParameterivEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MemoryObjectParameterivEXT, context, memoryObject, pname, params);
+    context->memoryObjectParameteriv(memoryObject, pname, params);
+}
+
+void NoErrorMultMatrixf(Context *context, const GLfloat *m)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultMatrixf);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MultMatrixf, context, m);
+    context->multMatrixf(m);
+}
+
+void NoErrorMultMatrixx(Context *context, const GLfixed *m)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultMatrixx);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MultMatrixx, context, m);
+    context->multMatrixx(m);
+}
+
+void NoErrorMultiDrawArraysANGLE(Context *context,
+                                 GLenum mode,
+                                 const GLint *firsts,
+                                 const GLsizei *counts,
+                                 GLsizei drawcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultiDrawArraysANGLE);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MultiDrawArraysANGLE, context, mode, firsts, counts, drawcount);
+    context->multiDrawArrays(modePacked, firsts, counts, drawcount);
+}
+
+void NoErrorMultiDrawArraysInstancedANGLE(Context *context,
+                                          GLenum mode,
+                                          const GLint *firsts,
+                                          const GLsizei *counts,
+                                          const GLsizei *instanceCounts,
+                                          GLsizei drawcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultiDrawArraysInstancedANGLE);
+    PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MultiDrawArraysInstancedANGLE, context, mode, firsts, counts, instanceCounts,
+                       drawcount);
+    context->multiDrawArraysInstanced(modePacked, firsts, counts, instanceCounts, drawcount);
+}
+
+void NoErrorMultiDrawElementsANGLE(Context *context,
+                                   GLenum mode,
+                                   const GLsizei *counts,
+                                   GLenum type,
+                                   const GLvoid *const *indices,
+                                   GLsizei drawcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultiDrawElementsANGLE);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MultiDrawElementsANGLE, context, mode, counts, type, indices, drawcount);
+    context->multiDrawElements(modePacked, counts, typePacked, indices, drawcount);
+}
+
+void NoErrorMultiDrawElementsInstancedANGLE(Context *context,
+                                            GLenum mode,
+                                            const GLsizei *counts,
+                                            GLenum type,
+                                            const GLvoid *const *indices,
+                                            const GLsizei *instanceCounts,
+                                            GLsizei drawcount)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultiDrawElementsInstancedANGLE);
+    PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+    DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MultiDrawElementsInstancedANGLE, context, mode, counts, type, indices,
+                       instanceCounts, drawcount);
+    context->multiDrawElementsInstanced(modePacked, counts, typePacked, indices, instanceCounts,
+                                        drawcount);
+}
+
+void NoErrorMultiTexCoord4f(Context *context,
+                            GLenum target,
+                            GLfloat s,
+                            GLfloat t,
+                            GLfloat r,
+                            GLfloat q)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultiTexCoord4f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MultiTexCoord4f, context, target, s, t, r, q);
+    context->multiTexCoord4f(target, s, t, r, q);
+}
+
+void NoErrorMultiTexCoord4x(Context *context,
+                            GLenum texture,
+                            GLfixed s,
+                            GLfixed t,
+                            GLfixed r,
+                            GLfixed q)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(MultiTexCoord4x);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(MultiTexCoord4x, context, texture, s, t, r, q);
+    context->multiTexCoord4x(texture, s, t, r, q);
+}
+
+void NoErrorNormal3f(Context *context, GLfloat nx, GLfloat ny, GLfloat nz)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(Normal3f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Normal3f, context, nx, ny, nz);
+    context->normal3f(nx, ny, nz);
+}
+
+void NoErrorNormal3x(Context *context, GLfixed nx, GLfixed ny, GLfixed nz)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Normal3x);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Normal3x, context, nx, ny, nz);
+    context->normal3x(nx, ny, nz);
+}
+
+void NoErrorNormalPointer(Context *context, GLenum type, GLsizei stride, const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(NormalPointer);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(NormalPointer, context, type, stride, pointer);
+    context->normalPointer(typePacked, stride, pointer);
+}
+
+void NoErrorObjectLabelKHR(Context *context,
+                           GLenum identifier,
+                           GLuint name,
+                           GLsizei length,
+                           const GLchar *label)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ObjectLabelKHR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ObjectLabelKHR, context, identifier, name, length, label);
+    context->objectLabel(identifier, name, length, label);
+}
+
+void NoErrorObjectPtrLabelKHR(Context *context,
+                              const void *ptr,
+                              GLsizei length,
+                              const GLchar *label)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ObjectPtrLabelKHR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ObjectPtrLabelKHR, context, ptr, length, label);
+    context->objectPtrLabel(ptr, length, label);
+}
+
+void NoErrorOrthof(Context *context,
+                   GLfloat l,
+                   GLfloat r,
+                   GLfloat b,
+                   GLfloat t,
+                   GLfloat n,
+                   GLfloat f)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Orthof);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Orthof, context, l, r, b, t, n, f);
+    context->orthof(l, r, b, t, n, f);
+}
+
+void NoErrorOrthox(Context *context,
+                   GLfixed l,
+                   GLfixed r,
+                   GLfixed b,
+                   GLfixed t,
+                   GLfixed n,
+                   GLfixed f)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Orthox);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Orthox, context, l, r, b, t, n, f);
+    context->orthox(l, r, b, t, n, f);
+}
+
+void NoErrorPathCommandsCHROMIUM(Context *context,
+                                 GLuint path,
+                                 GLsizei numCommands,
+                                 const GLubyte *commands,
+                                 GLsizei numCoords,
+                                 GLenum coordType,
+                                 const void *coords)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PathCommandsCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PathCommandsCHROMIUM, context, path, numCommands, commands, numCoords,
+                       coordType, coords);
+    context->pathCommands(path, numCommands, commands, numCoords, coordType, coords);
+}
+
+void NoErrorPathParameterfCHROMIUM(Context *context, GLuint path, GLenum pname, GLfloat value)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PathParameterfCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PathParameterfCHROMIUM, context, path, pname, value);
+    context->pathParameterf(path, pname, value);
+}
+
+void NoErrorPathParameteriCHROMIUM(Context *context, GLuint path, GLenum pname, GLint value)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PathParameteriCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PathParameteriCHROMIUM, context, path, pname, value);
+    context->pathParameteri(path, pname, value);
+}
+
+void NoErrorPathStencilFuncCHROMIUM(Context *context, GLenum func, GLint ref, GLuint mask)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PathStencilFuncCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PathStencilFuncCHROMIUM, context, func, ref, mask);
+    context->pathStencilFunc(func, ref, mask);
+}
+
+void NoErrorPauseTransformFeedback(Context *context)
+{
+    ANGLE_DEFER_COMMAND(PauseTransformFeedback, context);
+    ANGLE_PROFILE_ENTRY_POINT(PauseTransformFeedback);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PauseTransformFeedback, context);
+    context->pauseTransformFeedback();
+}
+
+void NoErrorPixelStorei(Context *context, GLenum pname, GLint param)
+{
+    ANGLE_DEFER_COMMAND(PixelStorei, context, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(PixelStorei);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PixelStorei, context, pname, param);
+    context->pixelStorei(pname, param);
+}
+
+void NoErrorPointParameterf(Context *context, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointParameterf);
+    PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PointParameterf, context, pname, param);
+    context->pointParameterf(pnamePacked, param);
+}
+
+void NoErrorPointParameterfv(Context *context, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointParameterfv);
+    PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PointParameterfv, context, pname, params);
+    context->pointParameterfv(pnamePacked, params);
+}
+
+void NoErrorPointParameterx(Context *context, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointParameterx);
+    PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PointParameterx, context, pname, param);
+    context->pointParameterx(pnamePacked, param);
+}
+
+void NoErrorPointParameterxv(Context *context, GLenum pname, const GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointParameterxv);
+    PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PointParameterxv, context, pname, params);
+    context->pointParameterxv(pnamePacked, params);
+}
+
+void NoErrorPointSize(Context *context, GLfloat size)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointSize);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PointSize, context, size);
+    context->pointSize(size);
+}
+
+void NoErrorPointSizePointerOES(Context *context, GLenum type, GLsizei stride, const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointSizePointerOES);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PointSizePointerOES, context, type, stride, pointer);
+    context->pointSizePointer(typePacked, stride, pointer);
+}
+
+void NoErrorPointSizex(Context *context, GLfixed size)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PointSizex);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PointSizex, context, size);
+    context->pointSizex(size);
+}
+
+void NoErrorPolygonOffset(Context *context, GLfloat factor, GLfloat units)
+{
+    ANGLE_DEFER_COMMAND(PolygonOffset, context, factor, units);
+    ANGLE_PROFILE_ENTRY_POINT(PolygonOffset);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PolygonOffset, context, factor, units);
+    context->polygonOffset(factor, units);
+}
+
+void NoErrorPolygonOffsetx(Context *context, GLfixed factor, GLfixed units)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PolygonOffsetx);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PolygonOffsetx, context, factor, units);
+    context->polygonOffsetx(factor, units);
+}
+
+void NoErrorPopDebugGroupKHR(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PopDebugGroupKHR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PopDebugGroupKHR, context);
+    context->popDebugGroup();
+}
+
+void NoErrorPopGroupMarkerEXT(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PopGroupMarkerEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PopGroupMarkerEXT, context);
+    context->popGroupMarker();
+}
+
+void NoErrorPopMatrix(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(PopMatrix);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PopMatrix, context);
+    context->popMatrix();
+}
+
+void NoErrorProgramBinary(Context *context,
+                          GLuint program,
+                          GLenum binaryFormat,
+                          const void *binary,
+                          GLsizei length)
+{
+    ANGLE_DEFER_COMMAND(ProgramBinary, context, program, binaryFormat, binary, length);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramBinary);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramBinary, context, program, binaryFormat, binary, length);
+    context->programBinary(program, binaryFormat, binary, length);
+}
+
+void NoErrorProgramBinaryOES(Context *context,
+                             GLuint program,
+                             GLenum binaryFormat,
+                             const void *binary,
+                             GLint length)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramBinaryOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramBinaryOES, context, program, binaryFormat, binary, length);
+    context->programBinary(program, binaryFormat, binary, length);
+}
+
+void NoErrorProgramParameteri(Context *context, GLuint program, GLenum pname, GLint value)
+{
+    ANGLE_DEFER_COMMAND(ProgramParameteri, context, program, pname, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramParameteri);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramParameteri, context, program, pname, value);
+    context->programParameteri(program, pname, value);
+}
+
+void NoErrorProgramPathFragmentInputGenCHROMIUM(Context *context,
+                                                GLuint program,
+                                                GLint location,
+                                                GLenum genMode,
+                                                GLint components,
+                                                const GLfloat *coeffs)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramPathFragmentInputGenCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramPathFragmentInputGenCHROMIUM, context, program, location, genMode,
+                       components, coeffs);
+    context->programPathFragmentInputGen(program, location, genMode, components, coeffs);
+}
+
+void NoErrorProgramUniform1f(Context *context, GLuint program, GLint location, GLfloat v0)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform1f, context, program, location, v0);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform1f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform1f, context, program, location, v0);
+    context->programUniform1f(program, location, v0);
+}
+
+void NoErrorProgramUniform1fv(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform1fv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform1fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform1fv, context, program, location, count, value);
+    context->programUniform1fv(program, location, count, value);
+}
+
+void NoErrorProgramUniform1i(Context *context, GLuint program, GLint location, GLint v0)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform1i, context, program, location, v0);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform1i);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform1i, context, program, location, v0);
+    context->programUniform1i(program, location, v0);
+}
+
+void NoErrorProgramUniform1iv(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform1iv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform1iv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform1iv, context, program, location, count, value);
+    context->programUniform1iv(program, location, count, value);
+}
+
+void NoErrorProgramUniform1ui(Context *context, GLuint program, GLint location, GLuint v0)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform1ui, context, program, location, v0);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform1ui);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform1ui, context, program, location, v0);
+    context->programUniform1ui(program, location, v0);
+}
+
+void NoErrorProgramUniform1uiv(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform1uiv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform1uiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform1uiv, context, program, location, count, value);
+    context->programUniform1uiv(program, location, count, value);
+}
+
+void NoErrorProgramUniform2f(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform2f, context, program, location, v0, v1);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform2f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform2f, context, program, location, v0, v1);
+    context->programUniform2f(program, location, v0, v1);
+}
+
+void NoErrorProgramUniform2fv(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform2fv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform2fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform2fv, context, program, location, count, value);
+    context->programUniform2fv(program, location, count, value);
+}
+
+void NoErrorProgramUniform2i(Context *context, GLuint program, GLint location, GLint v0, GLint v1)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform2i, context, program, location, v0, v1);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform2i);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform2i, context, program, location, v0, v1);
+    context->programUniform2i(program, location, v0, v1);
+}
+
+void NoErrorProgramUniform2iv(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform2iv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform2iv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform2iv, context, program, location, count, value);
+    context->programUniform2iv(program, location, count, value);
+}
+
+void NoErrorProgramUniform2ui(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform2ui, context, program, location, v0, v1);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform2ui);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform2ui, context, program, location, v0, v1);
+    context->programUniform2ui(program, location, v0, v1);
+}
+
+void NoErrorProgramUniform2uiv(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform2uiv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform2uiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform2uiv, context, program, location, count, value);
+    context->programUniform2uiv(program, location, count, value);
+}
+
+void NoErrorProgramUniform3f(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1,
+                             GLfloat v2)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform3f, context, program, location, v0, v1, v2);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform3f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform3f, context, program, location, v0, v1, v2);
+    context->programUniform3f(program, location, v0, v1, v2);
+}
+
+void NoErrorProgramUniform3fv(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform3fv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform3fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform3fv, context, program, location, count, value);
+    context->programUniform3fv(program, location, count, value);
+}
+
+void NoErrorProgramUniform3i(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1,
+                             GLint v2)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform3i, context, program, location, v0, v1, v2);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform3i);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform3i, context, program, location, v0, v1, v2);
+    context->programUniform3i(program, location, v0, v1, v2);
+}
+
+void NoErrorProgramUniform3iv(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform3iv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform3iv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform3iv, context, program, location, count, value);
+    context->programUniform3iv(program, location, count, value);
+}
+
+void NoErrorProgramUniform3ui(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1,
+                              GLuint v2)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform3ui, context, program, location, v0, v1, v2);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform3ui);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform3ui, context, program, location, v0, v1, v2);
+    context->programUniform3ui(program, location, v0, v1, v2);
+}
+
+void NoErrorProgramUniform3uiv(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform3uiv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform3uiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform3uiv, context, program, location, count, value);
+    context->programUniform3uiv(program, location, count, value);
+}
+
+void NoErrorProgramUniform4f(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1,
+                             GLfloat v2,
+                             GLfloat v3)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform4f, context, program, location, v0, v1, v2, v3);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform4f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform4f, context, program, location, v0, v1, v2, v3);
+    context->programUniform4f(program, location, v0, v1, v2, v3);
+}
+
+void NoErrorProgramUniform4fv(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform4fv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform4fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform4fv, context, program, location, count, value);
+    context->programUniform4fv(program, location, count, value);
+}
+
+void NoErrorProgramUniform4i(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1,
+                             GLint v2,
+                             GLint v3)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform4i, context, program, location, v0, v1, v2, v3);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform4i);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform4i, context, program, location, v0, v1, v2, v3);
+    context->programUniform4i(program, location, v0, v1, v2, v3);
+}
+
+void NoErrorProgramUniform4iv(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform4iv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform4iv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform4iv, context, program, location, count, value);
+    context->programUniform4iv(program, location, count, value);
+}
+
+void NoErrorProgramUniform4ui(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1,
+                              GLuint v2,
+                              GLuint v3)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform4ui, context, program, location, v0, v1, v2, v3);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform4ui);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform4ui, context, program, location, v0, v1, v2, v3);
+    context->programUniform4ui(program, location, v0, v1, v2, v3);
+}
+
+void NoErrorProgramUniform4uiv(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniform4uiv, context, program, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniform4uiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniform4uiv, context, program, location, count, value);
+    context->programUniform4uiv(program, location, count, value);
+}
+
+void NoErrorProgramUniformMatrix2fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix2fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix2fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniformMatrix2fv, context, program, location, count, transpose,
+                       value);
+    context->programUniformMatrix2fv(program, location, count, transpose, value);
+}
+
+void NoErrorProgramUniformMatrix2x3fv(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix2x3fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix2x3fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniformMatrix2x3fv, context, program, location, count, transpose,
+                       value);
+    context->programUniformMatrix2x3fv(program, location, count, transpose, value);
+}
+
+void NoErrorProgramUniformMatrix2x4fv(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix2x4fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix2x4fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniformMatrix2x4fv, context, program, location, count, transpose,
+                       value);
+    context->programUniformMatrix2x4fv(program, location, count, transpose, value);
+}
+
+void NoErrorProgramUniformMatrix3fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix3fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix3fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniformMatrix3fv, context, program, location, count, transpose,
+                       value);
+    context->programUniformMatrix3fv(program, location, count, transpose, value);
+}
+
+void NoErrorProgramUniformMatrix3x2fv(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix3x2fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix3x2fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniformMatrix3x2fv, context, program, location, count, transpose,
+                       value);
+    context->programUniformMatrix3x2fv(program, location, count, transpose, value);
+}
+
+void NoErrorProgramUniformMatrix3x4fv(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix3x4fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix3x4fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniformMatrix3x4fv, context, program, location, count, transpose,
+                       value);
+    context->programUniformMatrix3x4fv(program, location, count, transpose, value);
+}
+
+void NoErrorProgramUniformMatrix4fv(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix4fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix4fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniformMatrix4fv, context, program, location, count, transpose,
+                       value);
+    context->programUniformMatrix4fv(program, location, count, transpose, value);
+}
+
+void NoErrorProgramUniformMatrix4x2fv(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix4x2fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix4x2fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniformMatrix4x2fv, context, program, location, count, transpose,
+                       value);
+    context->programUniformMatrix4x2fv(program, location, count, transpose, value);
+}
+
+void NoErrorProgramUniformMatrix4x3fv(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(ProgramUniformMatrix4x3fv, context, program, location, count, transpose,
+                        value);
+    ANGLE_PROFILE_ENTRY_POINT(ProgramUniformMatrix4x3fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProgramUniformMatrix4x3fv, context, program, location, count, transpose,
+                       value);
+    context->programUniformMatrix4x3fv(program, location, count, transpose, value);
+}
+
+void NoErrorProvokingVertexANGLE(Context *context, GLenum mode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ProvokingVertexANGLE);
+    ProvokingVertex modePacked = FromGLenum<ProvokingVertex>(mode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ProvokingVertexANGLE, context, mode);
+    context->provokingVertex(modePacked);
+}
+
+void NoErrorPushDebugGroupKHR(Context *context,
+                              GLenum source,
+                              GLuint id,
+                              GLsizei length,
+                              const GLchar *message)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PushDebugGroupKHR);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PushDebugGroupKHR, context, source, id, length, message);
+    context->pushDebugGroup(source, id, length, message);
+}
+
+void NoErrorPushGroupMarkerEXT(Context *context, GLsizei length, const GLchar *marker)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(PushGroupMarkerEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PushGroupMarkerEXT, context, length, marker);
+    context->pushGroupMarker(length, marker);
+}
+
+void NoErrorPushMatrix(Context *context)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(PushMatrix);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(PushMatrix, context);
+    context->pushMatrix();
+}
+
+void NoErrorQueryCounterEXT(Context *context, GLuint id, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(QueryCounterEXT);
+    QueryType targetPacked = FromGLenum<QueryType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(QueryCounterEXT, context, id, target);
+    context->queryCounter(id, targetPacked);
+}
+
+GLbitfield NoErrorQueryMatrixxOES(Context *context, GLfixed *mantissa, GLint *exponent)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(QueryMatrixxOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(QueryMatrixxOES, context, mantissa, exponent);
+    return context->queryMatrixx(mantissa, exponent);
+}
+
+void NoErrorReadBuffer(Context *context, GLenum src)
+{
+    ANGLE_DEFER_COMMAND(ReadBuffer, context, src);
+    ANGLE_PROFILE_ENTRY_POINT(ReadBuffer);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ReadBuffer, context, src);
+    context->readBuffer(src);
+}
+
+void NoErrorReadPixels(Context *context,
+                       GLint x,
+                       GLint y,
+                       GLsizei width,
+                       GLsizei height,
+                       GLenum format,
+                       GLenum type,
+                       void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ReadPixels);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ReadPixels, context, x, y, width, height, format, type, pixels);
+    context->readPixels(x, y, width, height, format, type, pixels);
+}
+
+void NoErrorReadPixelsRobustANGLE(Context *context,
+                                  GLint x,
+                                  GLint y,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLsizei *columns,
+                                  GLsizei *rows,
+                                  void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ReadPixelsRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ReadPixelsRobustANGLE, context, x, y, width, height, format, type, bufSize,
+                       length, columns, rows, pixels);
+    context->readPixelsRobust(x, y, width, height, format, type, bufSize, length, columns, rows,
+                              pixels);
+}
+
+void NoErrorReadnPixelsEXT(Context *context,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLenum format,
+                           GLenum type,
+                           GLsizei bufSize,
+                           void *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ReadnPixelsEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ReadnPixelsEXT, context, x, y, width, height, format, type, bufSize, data);
+    context->readnPixels(x, y, width, height, format, type, bufSize, data);
+}
+
+void NoErrorReadnPixelsRobustANGLE(Context *context,
+                                   GLint x,
+                                   GLint y,
+                                   GLsizei width,
+                                   GLsizei height,
+                                   GLenum format,
+                                   GLenum type,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLsizei *columns,
+                                   GLsizei *rows,
+                                   void *data)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(ReadnPixelsRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ReadnPixelsRobustANGLE, context, x, y, width, height, format, type, bufSize,
+                       length, columns, rows, data);
+    context->readnPixelsRobust(x, y, width, height, format, type, bufSize, length, columns, rows,
+                               data);
+}
+
+void NoErrorReleaseShaderCompiler(Context *context)
+{
+    ANGLE_DEFER_COMMAND(ReleaseShaderCompiler, context);
+    ANGLE_PROFILE_ENTRY_POINT(ReleaseShaderCompiler);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ReleaseShaderCompiler, context);
+    context->releaseShaderCompiler();
+}
+
+void NoErrorRenderbufferStorage(Context *context,
+                                GLenum target,
+                                GLenum internalformat,
+                                GLsizei width,
+                                GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(RenderbufferStorage, context, target, internalformat, width, height);
+    ANGLE_PROFILE_ENTRY_POINT(RenderbufferStorage);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(RenderbufferStorage, context, target, internalformat, width, height);
+    context->renderbufferStorage(target, internalformat, width, height);
+}
+
+void NoErrorRenderbufferStorageMultisample(Context *context,
+                                           GLenum target,
+                                           GLsizei samples,
+                                           GLenum internalformat,
+                                           GLsizei width,
+                                           GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(RenderbufferStorageMultisample, context, target, samples, internalformat,
+                        width, height);
+    ANGLE_PROFILE_ENTRY_POINT(RenderbufferStorageMultisample);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(RenderbufferStorageMultisample, context, target, samples, internalformat,
+                       width, height);
+    context->renderbufferStorageMultisample(target, samples, internalformat, width, height);
+}
+
+void NoErrorRenderbufferStorageMultisampleANGLE(Context *context,
+                                                GLenum target,
+                                                GLsizei samples,
+                                                GLenum internalformat,
+                                                GLsizei width,
+                                                GLsizei height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(RenderbufferStorageMultisampleANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(RenderbufferStorageMultisampleANGLE, context, target, samples,
+                       internalformat, width, height);
+    context->renderbufferStorageMultisample(target, samples, internalformat, width, height);
+}
+
+void NoErrorRenderbufferStorageOES(Context *context,
+                                   GLenum target,
+                                   GLenum internalformat,
+                                   GLsizei width,
+                                   GLsizei height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(RenderbufferStorageOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(RenderbufferStorageOES, context, target, internalformat, width, height);
+    context->renderbufferStorage(target, internalformat, width, height);
+}
+
+void NoErrorRequestExtensionANGLE(Context *context, const GLchar *name)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(RequestExtensionANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(RequestExtensionANGLE, context, name);
+    context->requestExtension(name);
+}
+
+void NoErrorResumeTransformFeedback(Context *context)
+{
+    ANGLE_DEFER_COMMAND(ResumeTransformFeedback, context);
+    ANGLE_PROFILE_ENTRY_POINT(ResumeTransformFeedback);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ResumeTransformFeedback, context);
+    context->resumeTransformFeedback();
+}
+
+void NoErrorRotatef(Context *context, GLfloat angle, GLfloat x, GLfloat y, GLfloat z)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(Rotatef);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Rotatef, context, angle, x, y, z);
+    context->rotatef(angle, x, y, z);
+}
+
+void NoErrorRotatex(Context *context, GLfixed angle, GLfixed x, GLfixed y, GLfixed z)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Rotatex);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Rotatex, context, angle, x, y, z);
+    context->rotatex(angle, x, y, z);
+}
+
+void NoErrorSampleCoverage(Context *context, GLfloat value, GLboolean invert)
+{
+    ANGLE_DEFER_COMMAND(SampleCoverage, context, value, invert);
+    ANGLE_PROFILE_ENTRY_POINT(SampleCoverage);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SampleCoverage, context, value, invert);
+    context->sampleCoverage(value, invert);
+}
+
+void NoErrorSampleCoveragex(Context *context, GLclampx value, GLboolean invert)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SampleCoveragex);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SampleCoveragex, context, value, invert);
+    context->sampleCoveragex(value, invert);
+}
+
+void NoErrorSampleMaski(Context *context, GLuint maskNumber, GLbitfield mask)
+{
+    ANGLE_DEFER_COMMAND(SampleMaski, context, maskNumber, mask);
+    ANGLE_PROFILE_ENTRY_POINT(SampleMaski);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SampleMaski, context, maskNumber, mask);
+    context->sampleMaski(maskNumber, mask);
+}
+
+void NoErrorSampleMaskiANGLE(Context *context, GLuint maskNumber, GLbitfield mask)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SampleMaskiANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SampleMaskiANGLE, context, maskNumber, mask);
+    context->sampleMaski(maskNumber, mask);
+}
+
+void NoErrorSamplerParameterIivOES(Context *context,
+                                   GLuint sampler,
+                                   GLenum pname,
+                                   const GLint *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterIivOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SamplerParameterIivOES, context, sampler, pname, param);
+    context->samplerParameterIiv(sampler, pname, param);
+}
+
+void NoErrorSamplerParameterIivRobustANGLE(Context *context,
+                                           GLuint sampler,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           const GLint *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterIivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SamplerParameterIivRobustANGLE, context, sampler, pname, bufSize, param);
+    context->samplerParameterIivRobust(sampler, pname, bufSize, param);
+}
+
+void NoErrorSamplerParameterIuivOES(Context *context,
+                                    GLuint sampler,
+                                    GLenum pname,
+                                    const GLuint *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterIuivOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SamplerParameterIuivOES, context, sampler, pname, param);
+    context->samplerParameterIuiv(sampler, pname, param);
+}
+
+void NoErrorSamplerParameterIuivRobustANGLE(Context *context,
+                                            GLuint sampler,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            const GLuint *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterIuivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SamplerParameterIuivRobustANGLE, context, sampler, pname, bufSize, param);
+    context->samplerParameterIuivRobust(sampler, pname, bufSize, param);
+}
+
+void NoErrorSamplerParameterf(Context *context, GLuint sampler, GLenum pname, GLfloat param)
+{
+    ANGLE_DEFER_COMMAND(SamplerParameterf, context, sampler, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterf);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SamplerParameterf, context, sampler, pname, param);
+    context->samplerParameterf(sampler, pname, param);
+}
+
+void NoErrorSamplerParameterfv(Context *context, GLuint sampler, GLenum pname, const GLfloat *param)
+{
+    ANGLE_DEFER_COMMAND(SamplerParameterfv, context, sampler, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterfv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SamplerParameterfv, context, sampler, pname, param);
+    context->samplerParameterfv(sampler, pname, param);
+}
+
+void NoErrorSamplerParameterfvRobustANGLE(Context *context,
+                                          GLuint sampler,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          const GLfloat *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterfvRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SamplerParameterfvRobustANGLE, context, sampler, pname, bufSize, param);
+    context->samplerParameterfvRobust(sampler, pname, bufSize, param);
+}
+
+void NoErrorSamplerParameteri(Context *context, GLuint sampler, GLenum pname, GLint param)
+{
+    ANGLE_DEFER_COMMAND(SamplerParameteri, context, sampler, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameteri);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SamplerParameteri, context, sampler, pname, param);
+    context->samplerParameteri(sampler, pname, param);
+}
+
+void NoErrorSamplerParameteriv(Context *context, GLuint sampler, GLenum pname, const GLint *param)
+{
+    ANGLE_DEFER_COMMAND(SamplerParameteriv, context, sampler, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameteriv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SamplerParameteriv, context, sampler, pname, param);
+    context->samplerParameteriv(sampler, pname, param);
+}
+
+void NoErrorSamplerParameterivRobustANGLE(Context *context,
+                                          GLuint sampler,
+                                          GLuint pname,
+                                          GLsizei bufSize,
+                                          const GLint *param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SamplerParameterivRobustANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SamplerParameterivRobustANGLE, context, sampler, pname, bufSize, param);
+    context->samplerParameterivRobust(sampler, pname, bufSize, param);
+}
+
+void NoErrorScalef(Context *context, GLfloat x, GLfloat y, GLfloat z)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(Scalef);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Scalef, context, x, y, z);
+    context->scalef(x, y, z);
+}
+
+void NoErrorScalex(Context *context, GLfixed x, GLfixed y, GLfixed z)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Scalex);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Scalex, context, x, y, z);
+    context->scalex(x, y, z);
+}
+
+void NoErrorScissor(Context *context, GLint x, GLint y, GLsizei width, GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(Scissor, context, x, y, width, height);
+    ANGLE_PROFILE_ENTRY_POINT(Scissor);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Scissor, context, x, y, width, height);
+    context->scissor(x, y, width, height);
+}
+
+void NoErrorSemaphoreParameterui64vEXT(Context *context,
+                                       GLuint semaphore,
+                                       GLenum pname,
+                                       const GLuint64 *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SemaphoreParameterui64vEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SemaphoreParameterui64vEXT, context, semaphore, pname, params);
+    context->semaphoreParameterui64v(semaphore, pname, params);
+}
+
+void NoErrorSetFenceNV(Context *context, GLuint fence, GLenum condition)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SetFenceNV);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SetFenceNV, context, fence, condition);
+    context->setFenceNV(fence, condition);
+}
+
+void NoErrorShadeModel(Context *context, GLenum mode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(ShadeModel);
+    ShadingModel modePacked = FromGLenum<ShadingModel>(mode);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ShadeModel, context, mode);
+    context->shadeModel(modePacked);
+}
+
+void NoErrorShaderBinary(Context *context,
+                         GLsizei count,
+                         const GLuint *shaders,
+                         GLenum binaryformat,
+                         const void *binary,
+                         GLsizei length)
+{
+    ANGLE_DEFER_COMMAND(ShaderBinary, context, count, shaders, binaryformat, binary, length);
+    ANGLE_PROFILE_ENTRY_POINT(ShaderBinary);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ShaderBinary, context, count, shaders, binaryformat, binary, length);
+    context->shaderBinary(count, shaders, binaryformat, binary, length);
+}
+
+void NoErrorShaderSource(Context *context,
+                         GLuint shader,
+                         GLsizei count,
+                         const GLchar *const *string,
+                         const GLint *length)
+{
+    ANGLE_DEFER_COMMAND(ShaderSource, context, shader, count, string, length);
+    ANGLE_PROFILE_ENTRY_POINT(ShaderSource);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ShaderSource, context, shader, count, string, length);
+    context->shaderSource(shader, count, string, length);
+}
+
+void NoErrorSignalSemaphoreEXT(Context *context,
+                               GLuint semaphore,
+                               GLuint numBufferBarriers,
+                               const GLuint *buffers,
+                               GLuint numTextureBarriers,
+                               const GLuint *textures,
+                               const GLenum *dstLayouts)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(SignalSemaphoreEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(SignalSemaphoreEXT, context, semaphore, numBufferBarriers, buffers,
+                       numTextureBarriers, textures, dstLayouts);
+    context->signalSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers, textures,
+                             dstLayouts);
+}
+
+void NoErrorStencilFillPathCHROMIUM(Context *context, GLuint path, GLenum fillMode, GLuint mask)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilFillPathCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilFillPathCHROMIUM, context, path, fillMode, mask);
+    context->stencilFillPath(path, fillMode, mask);
+}
+
+void NoErrorStencilFillPathInstancedCHROMIUM(Context *context,
+                                             GLsizei numPaths,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum fillMode,
+                                             GLuint mask,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilFillPathInstancedCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilFillPathInstancedCHROMIUM, context, numPaths, pathNameType, paths,
+                       pathBase, fillMode, mask, transformType, transformValues);
+    context->stencilFillPathInstanced(numPaths, pathNameType, paths, pathBase, fillMode, mask,
+                                      transformType, transformValues);
+}
+
+void NoErrorStencilFunc(Context *context, GLenum func, GLint ref, GLuint mask)
+{
+    ANGLE_DEFER_COMMAND(StencilFunc, context, func, ref, mask);
+    ANGLE_PROFILE_ENTRY_POINT(StencilFunc);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilFunc, context, func, ref, mask);
+    context->stencilFunc(func, ref, mask);
+}
+
+void NoErrorStencilFuncSeparate(Context *context, GLenum face, GLenum func, GLint ref, GLuint mask)
+{
+    ANGLE_DEFER_COMMAND(StencilFuncSeparate, context, face, func, ref, mask);
+    ANGLE_PROFILE_ENTRY_POINT(StencilFuncSeparate);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilFuncSeparate, context, face, func, ref, mask);
+    context->stencilFuncSeparate(face, func, ref, mask);
+}
+
+void NoErrorStencilMask(Context *context, GLuint mask)
+{
+    ANGLE_DEFER_COMMAND(StencilMask, context, mask);
+    ANGLE_PROFILE_ENTRY_POINT(StencilMask);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilMask, context, mask);
+    context->stencilMask(mask);
+}
+
+void NoErrorStencilMaskSeparate(Context *context, GLenum face, GLuint mask)
+{
+    ANGLE_DEFER_COMMAND(StencilMaskSeparate, context, face, mask);
+    ANGLE_PROFILE_ENTRY_POINT(StencilMaskSeparate);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilMaskSeparate, context, face, mask);
+    context->stencilMaskSeparate(face, mask);
+}
+
+void NoErrorStencilOp(Context *context, GLenum fail, GLenum zfail, GLenum zpass)
+{
+    ANGLE_DEFER_COMMAND(StencilOp, context, fail, zfail, zpass);
+    ANGLE_PROFILE_ENTRY_POINT(StencilOp);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilOp, context, fail, zfail, zpass);
+    context->stencilOp(fail, zfail, zpass);
+}
+
+void NoErrorStencilOpSeparate(Context *context,
+                              GLenum face,
+                              GLenum sfail,
+                              GLenum dpfail,
+                              GLenum dppass)
+{
+    ANGLE_DEFER_COMMAND(StencilOpSeparate, context, face, sfail, dpfail, dppass);
+    ANGLE_PROFILE_ENTRY_POINT(StencilOpSeparate);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilOpSeparate, context, face, sfail, dpfail, dppass);
+    context->stencilOpSeparate(face, sfail, dpfail, dppass);
+}
+
+void NoErrorStencilStrokePathCHROMIUM(Context *context, GLuint path, GLint reference, GLuint mask)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilStrokePathCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilStrokePathCHROMIUM, context, path, reference, mask);
+    context->stencilStrokePath(path, reference, mask);
+}
+
+void NoErrorStencilStrokePathInstancedCHROMIUM(Context *context,
+                                               GLsizei numPath,
+                                               GLenum pathNameType,
+                                               const void *paths,
+                                               GLuint pathBase,
+                                               GLint reference,
+                                               GLuint mask,
+                                               GLenum transformType,
+                                               const GLfloat *transformValues)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilStrokePathInstancedCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilStrokePathInstancedCHROMIUM, context, numPath, pathNameType, paths,
+                       pathBase, reference, mask, transformType, transformValues);
+    context->stencilStrokePathInstanced(numPath, pathNameType, paths, pathBase, reference, mask,
+                                        transformType, transformValues);
+}
+
+void NoErrorStencilThenCoverFillPathCHROMIUM(Context *context,
+                                             GLuint path,
+                                             GLenum fillMode,
+                                             GLuint mask,
+                                             GLenum coverMode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilThenCoverFillPathCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilThenCoverFillPathCHROMIUM, context, path, fillMode, mask, coverMode);
+    context->stencilThenCoverFillPath(path, fillMode, mask, coverMode);
+}
+
+void NoErrorStencilThenCoverFillPathInstancedCHROMIUM(Context *context,
+                                                      GLsizei numPaths,
+                                                      GLenum pathNameType,
+                                                      const void *paths,
+                                                      GLuint pathBase,
+                                                      GLenum fillMode,
+                                                      GLuint mask,
+                                                      GLenum coverMode,
+                                                      GLenum transformType,
+                                                      const GLfloat *transformValues)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilThenCoverFillPathInstancedCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilThenCoverFillPathInstancedCHROMIUM, context, numPaths, pathNameType,
+                       paths, pathBase, fillMode, mask, coverMode, transformType, transformValues);
+    context->stencilThenCoverFillPathInstanced(numPaths, pathNameType, paths, pathBase, fillMode,
+                                               mask, coverMode, transformType, transformValues);
+}
+
+void NoErrorStencilThenCoverStrokePathCHROMIUM(Context *context,
+                                               GLuint path,
+                                               GLint reference,
+                                               GLuint mask,
+                                               GLenum coverMode)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilThenCoverStrokePathCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilThenCoverStrokePathCHROMIUM, context, path, reference, mask,
+                       coverMode);
+    context->stencilThenCoverStrokePath(path, reference, mask, coverMode);
+}
+
+void NoErrorStencilThenCoverStrokePathInstancedCHROMIUM(Context *context,
+                                                        GLsizei numPaths,
+                                                        GLenum pathNameType,
+                                                        const void *paths,
+                                                        GLuint pathBase,
+                                                        GLint reference,
+                                                        GLuint mask,
+                                                        GLenum coverMode,
+                                                        GLenum transformType,
+                                                        const GLfloat *transformValues)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(StencilThenCoverStrokePathInstancedCHROMIUM);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(StencilThenCoverStrokePathInstancedCHROMIUM, context, numPaths, pathNameType,
+                       paths, pathBase, reference, mask, coverMode, transformType, transformValues);
+    context->stencilThenCoverStrokePathInstanced(numPaths, pathNameType, paths, pathBase, reference,
+                                                 mask, coverMode, transformType, transformValues);
+}
+
+GLboolean NoErrorTestFenceNV(Context *context, GLuint fence)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TestFenceNV);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TestFenceNV, context, fence);
+    return context->testFenceNV(fence);
+}
+
+void NoErrorTexCoordPointer(Context *context,
+                            GLint size,
+                            GLenum type,
+                            GLsizei stride,
+                            const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexCoordPointer);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexCoordPointer, context, size, type, stride, pointer);
+    context->texCoordPointer(size, typePacked, stride, pointer);
+}
+
+void NoErrorTexEnvf(Context *context, GLenum target, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexEnvf);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexEnvf, context, target, pname, param);
+    context->texEnvf(targetPacked, pnamePacked, param);
+}
+
+void NoErrorTexEnvfv(Context *context, GLenum target, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexEnvfv);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexEnvfv, context, target, pname, params);
+    context->texEnvfv(targetPacked, pnamePacked, params);
+}
+
+void NoErrorTexEnvi(Context *context, GLenum target, GLenum pname, GLint param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexEnvi);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexEnvi, context, target, pname, param);
+    context->texEnvi(targetPacked, pnamePacked, param);
+}
+
+void NoErrorTexEnviv(Context *context, GLenum target, GLenum pname, const GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexEnviv);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexEnviv, context, target, pname, params);
+    context->texEnviv(targetPacked, pnamePacked, params);
+}
+
+void NoErrorTexEnvx(Context *context, GLenum target, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexEnvx);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexEnvx, context, target, pname, param);
+    context->texEnvx(targetPacked, pnamePacked, param);
+}
+
+void NoErrorTexEnvxv(Context *context, GLenum target, GLenum pname, const GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexEnvxv);
+    TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+    TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexEnvxv, context, target, pname, params);
+    context->texEnvxv(targetPacked, pnamePacked, params);
+}
+
+void NoErrorTexGenfOES(Context *context, GLenum coord, GLenum pname, GLfloat param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexGenfOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexGenfOES, context, coord, pname, param);
+    context->texGenf(coord, pname, param);
+}
+
+void NoErrorTexGenfvOES(Context *context, GLenum coord, GLenum pname, const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexGenfvOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexGenfvOES, context, coord, pname, params);
+    context->texGenfv(coord, pname, params);
+}
+
+void NoErrorTexGeniOES(Context *context, GLenum coord, GLenum pname, GLint param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexGeniOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexGeniOES, context, coord, pname, param);
+    context->texGeni(coord, pname, param);
+}
+
+void NoErrorTexGenivOES(Context *context, GLenum coord, GLenum pname, const GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexGenivOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexGenivOES, context, coord, pname, params);
+    context->texGeniv(coord, pname, params);
+}
+
+void NoErrorTexGenxOES(Context *context, GLenum coord, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexGenxOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexGenxOES, context, coord, pname, param);
+    context->texGenx(coord, pname, param);
+}
+
+void NoErrorTexGenxvOES(Context *context, GLenum coord, GLenum pname, const GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexGenxvOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexGenxvOES, context, coord, pname, params);
+    context->texGenxv(coord, pname, params);
+}
+
+void NoErrorTexImage2D(Context *context,
+                       GLenum target,
+                       GLint level,
+                       GLint internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLint border,
+                       GLenum format,
+                       GLenum type,
+                       const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexImage2D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexImage2D, context, target, level, internalformat, width, height, border,
+                       format, type, pixels);
+    context->texImage2D(targetPacked, level, internalformat, width, height, border, format, type,
+                        pixels);
+}
+
+void NoErrorTexImage2DRobustANGLE(Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLint border,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexImage2DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexImage2DRobustANGLE, context, target, level, internalformat, width, height,
+                       border, format, type, bufSize, pixels);
+    context->texImage2DRobust(targetPacked, level, internalformat, width, height, border, format,
+                              type, bufSize, pixels);
+}
+
+void NoErrorTexImage3D(Context *context,
+                       GLenum target,
+                       GLint level,
+                       GLint internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLsizei depth,
+                       GLint border,
+                       GLenum format,
+                       GLenum type,
+                       const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexImage3D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexImage3D, context, target, level, internalformat, width, height, depth,
+                       border, format, type, pixels);
+    context->texImage3D(targetPacked, level, internalformat, width, height, depth, border, format,
+                        type, pixels);
+}
+
+void NoErrorTexImage3DRobustANGLE(Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLsizei depth,
+                                  GLint border,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexImage3DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexImage3DRobustANGLE, context, target, level, internalformat, width, height,
+                       depth, border, format, type, bufSize, pixels);
+    context->texImage3DRobust(targetPacked, level, internalformat, width, height, depth, border,
+                              format, type, bufSize, pixels);
+}
+
+void NoErrorTexParameterIivOES(Context *context, GLenum target, GLenum pname, const GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterIivOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexParameterIivOES, context, target, pname, params);
+    context->texParameterIiv(targetPacked, pname, params);
+}
+
+void NoErrorTexParameterIivRobustANGLE(Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLsizei bufSize,
+                                       const GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterIivRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexParameterIivRobustANGLE, context, target, pname, bufSize, params);
+    context->texParameterIivRobust(targetPacked, pname, bufSize, params);
+}
+
+void NoErrorTexParameterIuivOES(Context *context, GLenum target, GLenum pname, const GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterIuivOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexParameterIuivOES, context, target, pname, params);
+    context->texParameterIuiv(targetPacked, pname, params);
+}
+
+void NoErrorTexParameterIuivRobustANGLE(Context *context,
+                                        GLenum target,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        const GLuint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterIuivRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexParameterIuivRobustANGLE, context, target, pname, bufSize, params);
+    context->texParameterIuivRobust(targetPacked, pname, bufSize, params);
+}
+
+void NoErrorTexParameterf(Context *context, GLenum target, GLenum pname, GLfloat param)
+{
+    ANGLE_DEFER_COMMAND(TexParameterf, context, target, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterf);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexParameterf, context, target, pname, param);
+    context->texParameterf(targetPacked, pname, param);
+}
+
+void NoErrorTexParameterfv(Context *context, GLenum target, GLenum pname, const GLfloat *params)
+{
+    ANGLE_DEFER_COMMAND(TexParameterfv, context, target, pname, params);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterfv);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexParameterfv, context, target, pname, params);
+    context->texParameterfv(targetPacked, pname, params);
+}
+
+void NoErrorTexParameterfvRobustANGLE(Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      const GLfloat *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterfvRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexParameterfvRobustANGLE, context, target, pname, bufSize, params);
+    context->texParameterfvRobust(targetPacked, pname, bufSize, params);
+}
+
+void NoErrorTexParameteri(Context *context, GLenum target, GLenum pname, GLint param)
+{
+    ANGLE_DEFER_COMMAND(TexParameteri, context, target, pname, param);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameteri);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexParameteri, context, target, pname, param);
+    context->texParameteri(targetPacked, pname, param);
+}
+
+void NoErrorTexParameteriv(Context *context, GLenum target, GLenum pname, const GLint *params)
+{
+    ANGLE_DEFER_COMMAND(TexParameteriv, context, target, pname, params);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameteriv);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexParameteriv, context, target, pname, params);
+    context->texParameteriv(targetPacked, pname, params);
+}
+
+void NoErrorTexParameterivRobustANGLE(Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      const GLint *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterivRobustANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexParameterivRobustANGLE, context, target, pname, bufSize, params);
+    context->texParameterivRobust(targetPacked, pname, bufSize, params);
+}
+
+void NoErrorTexParameterx(Context *context, GLenum target, GLenum pname, GLfixed param)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterx);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexParameterx, context, target, pname, param);
+    context->texParameterx(targetPacked, pname, param);
+}
+
+void NoErrorTexParameterxv(Context *context, GLenum target, GLenum pname, const GLfixed *params)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexParameterxv);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexParameterxv, context, target, pname, params);
+    context->texParameterxv(targetPacked, pname, params);
+}
+
+void NoErrorTexStorage1DEXT(Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage1DEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexStorage1DEXT, context, target, levels, internalformat, width);
+    context->texStorage1D(target, levels, internalformat, width);
+}
+
+void NoErrorTexStorage2D(Context *context,
+                         GLenum target,
+                         GLsizei levels,
+                         GLenum internalformat,
+                         GLsizei width,
+                         GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(TexStorage2D, context, target, levels, internalformat, width, height);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage2D);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexStorage2D, context, target, levels, internalformat, width, height);
+    context->texStorage2D(targetPacked, levels, internalformat, width, height);
+}
+
+void NoErrorTexStorage2DEXT(Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width,
+                            GLsizei height)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage2DEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexStorage2DEXT, context, target, levels, internalformat, width, height);
+    context->texStorage2D(targetPacked, levels, internalformat, width, height);
+}
+
+void NoErrorTexStorage2DMultisample(Context *context,
+                                    GLenum target,
+                                    GLsizei samples,
+                                    GLenum internalformat,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLboolean fixedsamplelocations)
+{
+    ANGLE_DEFER_COMMAND(TexStorage2DMultisample, context, target, samples, internalformat, width,
+                        height, fixedsamplelocations);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage2DMultisample);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexStorage2DMultisample, context, target, samples, internalformat, width,
+                       height, fixedsamplelocations);
+    context->texStorage2DMultisample(targetPacked, samples, internalformat, width, height,
+                                     fixedsamplelocations);
+}
+
+void NoErrorTexStorage2DMultisampleANGLE(Context *context,
+                                         GLenum target,
+                                         GLsizei samples,
+                                         GLenum internalformat,
+                                         GLsizei width,
+                                         GLsizei height,
+                                         GLboolean fixedsamplelocations)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage2DMultisampleANGLE);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexStorage2DMultisampleANGLE, context, target, samples, internalformat,
+                       width, height, fixedsamplelocations);
+    context->texStorage2DMultisample(targetPacked, samples, internalformat, width, height,
+                                     fixedsamplelocations);
+}
+
+void NoErrorTexStorage3D(Context *context,
+                         GLenum target,
+                         GLsizei levels,
+                         GLenum internalformat,
+                         GLsizei width,
+                         GLsizei height,
+                         GLsizei depth)
+{
+    ANGLE_DEFER_COMMAND(TexStorage3D, context, target, levels, internalformat, width, height,
+                        depth);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage3D);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexStorage3D, context, target, levels, internalformat, width, height, depth);
+    context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
+}
+
+void NoErrorTexStorage3DEXT(Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width,
+                            GLsizei height,
+                            GLsizei depth)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage3DEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexStorage3DEXT, context, target, levels, internalformat, width, height,
+                       depth);
+    context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
+}
+
+void NoErrorTexStorage3DMultisampleOES(Context *context,
+                                       GLenum target,
+                                       GLsizei samples,
+                                       GLenum internalformat,
+                                       GLsizei width,
+                                       GLsizei height,
+                                       GLsizei depth,
+                                       GLboolean fixedsamplelocations)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorage3DMultisampleOES);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexStorage3DMultisampleOES, context, target, samples, internalformat, width,
+                       height, depth, fixedsamplelocations);
+    context->texStorage3DMultisample(targetPacked, samples, internalformat, width, height, depth,
+                                     fixedsamplelocations);
+}
+
+void NoErrorTexStorageMem2DEXT(Context *context,
+                               GLenum target,
+                               GLsizei levels,
+                               GLenum internalFormat,
+                               GLsizei width,
+                               GLsizei height,
+                               GLuint memory,
+                               GLuint64 offset)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorageMem2DEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexStorageMem2DEXT, context, target, levels, internalFormat, width, height,
+                       memory, offset);
+    context->texStorageMem2D(targetPacked, levels, internalFormat, width, height, memory, offset);
+}
+
+void NoErrorTexStorageMem2DMultisampleEXT(Context *context,
+                                          GLenum target,
+                                          GLsizei samples,
+                                          GLenum internalFormat,
+                                          GLsizei width,
+                                          GLsizei height,
+                                          GLboolean fixedSampleLocations,
+                                          GLuint memory,
+                                          GLuint64 offset)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorageMem2DMultisampleEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexStorageMem2DMultisampleEXT, context, target, samples, internalFormat,
+                       width, height, fixedSampleLocations, memory, offset);
+    context->texStorageMem2DMultisample(targetPacked, samples, internalFormat, width, height,
+                                        fixedSampleLocations, memory, offset);
+}
+
+void NoErrorTexStorageMem3DEXT(Context *context,
+                               GLenum target,
+                               GLsizei levels,
+                               GLenum internalFormat,
+                               GLsizei width,
+                               GLsizei height,
+                               GLsizei depth,
+                               GLuint memory,
+                               GLuint64 offset)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorageMem3DEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexStorageMem3DEXT, context, target, levels, internalFormat, width, height,
+                       depth, memory, offset);
+    context->texStorageMem3D(targetPacked, levels, internalFormat, width, height, depth, memory,
+                             offset);
+}
+
+void NoErrorTexStorageMem3DMultisampleEXT(Context *context,
+                                          GLenum target,
+                                          GLsizei samples,
+                                          GLenum internalFormat,
+                                          GLsizei width,
+                                          GLsizei height,
+                                          GLsizei depth,
+                                          GLboolean fixedSampleLocations,
+                                          GLuint memory,
+                                          GLuint64 offset)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexStorageMem3DMultisampleEXT);
+    TextureType targetPacked = FromGLenum<TextureType>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexStorageMem3DMultisampleEXT, context, target, samples, internalFormat,
+                       width, height, depth, fixedSampleLocations, memory, offset);
+    context->texStorageMem3DMultisample(targetPacked, samples, internalFormat, width, height, depth,
+                                        fixedSampleLocations, memory, offset);
+}
+
+void NoErrorTexSubImage2D(Context *context,
+                          GLenum target,
+                          GLint level,
+                          GLint xoffset,
+                          GLint yoffset,
+                          GLsizei width,
+                          GLsizei height,
+                          GLenum format,
+                          GLenum type,
+                          const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexSubImage2D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexSubImage2D, context, target, level, xoffset, yoffset, width, height,
+                       format, type, pixels);
+    context->texSubImage2D(targetPacked, level, xoffset, yoffset, width, height, format, type,
+                           pixels);
+}
+
+void NoErrorTexSubImage2DRobustANGLE(Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexSubImage2DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexSubImage2DRobustANGLE, context, target, level, xoffset, yoffset, width,
+                       height, format, type, bufSize, pixels);
+    context->texSubImage2DRobust(targetPacked, level, xoffset, yoffset, width, height, format, type,
+                                 bufSize, pixels);
+}
+
+void NoErrorTexSubImage3D(Context *context,
+                          GLenum target,
+                          GLint level,
+                          GLint xoffset,
+                          GLint yoffset,
+                          GLint zoffset,
+                          GLsizei width,
+                          GLsizei height,
+                          GLsizei depth,
+                          GLenum format,
+                          GLenum type,
+                          const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexSubImage3D);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexSubImage3D, context, target, level, xoffset, yoffset, zoffset, width,
+                       height, depth, format, type, pixels);
+    context->texSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width, height, depth,
+                           format, type, pixels);
+}
+
+void NoErrorTexSubImage3DRobustANGLE(Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLint zoffset,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLsizei depth,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     const void *pixels)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(TexSubImage3DRobustANGLE);
+    TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TexSubImage3DRobustANGLE, context, target, level, xoffset, yoffset, zoffset,
+                       width, height, depth, format, type, bufSize, pixels);
+    context->texSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset, width, height,
+                                 depth, format, type, bufSize, pixels);
+}
+
+void NoErrorTransformFeedbackVaryings(Context *context,
+                                      GLuint program,
+                                      GLsizei count,
+                                      const GLchar *const *varyings,
+                                      GLenum bufferMode)
+{
+    ANGLE_DEFER_COMMAND(TransformFeedbackVaryings, context, program, count, varyings, bufferMode);
+    ANGLE_PROFILE_ENTRY_POINT(TransformFeedbackVaryings);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(TransformFeedbackVaryings, context, program, count, varyings, bufferMode);
+    context->transformFeedbackVaryings(program, count, varyings, bufferMode);
+}
+
+void NoErrorTranslatef(Context *context, GLfloat x, GLfloat y, GLfloat z)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_UNLOCKED(context);
+    ANGLE_PROFILE_ENTRY_POINT(Translatef);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Translatef, context, x, y, z);
+    context->translatef(x, y, z);
+}
+
+void NoErrorTranslatex(Context *context, GLfixed x, GLfixed y, GLfixed z)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(Translatex);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Translatex, context, x, y, z);
+    context->translatex(x, y, z);
+}
+
+void NoErrorUniform1f(Context *context, GLint location, GLfloat v0)
+{
+    ANGLE_DEFER_COMMAND(Uniform1f, context, location, v0);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform1f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform1f, context, location, v0);
+    context->uniform1f(location, v0);
+}
+
+void NoErrorUniform1fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform1fv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform1fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform1fv, context, location, count, value);
+    context->uniform1fv(location, count, value);
+}
+
+void NoErrorUniform1i(Context *context, GLint location, GLint v0)
+{
+    ANGLE_DEFER_COMMAND(Uniform1i, context, location, v0);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform1i);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform1i, context, location, v0);
+    context->uniform1i(location, v0);
+}
+
+void NoErrorUniform1iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform1iv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform1iv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform1iv, context, location, count, value);
+    context->uniform1iv(location, count, value);
+}
+
+void NoErrorUniform1ui(Context *context, GLint location, GLuint v0)
+{
+    ANGLE_DEFER_COMMAND(Uniform1ui, context, location, v0);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform1ui);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform1ui, context, location, v0);
+    context->uniform1ui(location, v0);
+}
+
+void NoErrorUniform1uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform1uiv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform1uiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform1uiv, context, location, count, value);
+    context->uniform1uiv(location, count, value);
+}
+
+void NoErrorUniform2f(Context *context, GLint location, GLfloat v0, GLfloat v1)
+{
+    ANGLE_DEFER_COMMAND(Uniform2f, context, location, v0, v1);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform2f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform2f, context, location, v0, v1);
+    context->uniform2f(location, v0, v1);
+}
+
+void NoErrorUniform2fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform2fv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform2fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform2fv, context, location, count, value);
+    context->uniform2fv(location, count, value);
+}
+
+void NoErrorUniform2i(Context *context, GLint location, GLint v0, GLint v1)
+{
+    ANGLE_DEFER_COMMAND(Uniform2i, context, location, v0, v1);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform2i);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform2i, context, location, v0, v1);
+    context->uniform2i(location, v0, v1);
+}
+
+void NoErrorUniform2iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform2iv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform2iv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform2iv, context, location, count, value);
+    context->uniform2iv(location, count, value);
+}
+
+void NoErrorUniform2ui(Context *context, GLint location, GLuint v0, GLuint v1)
+{
+    ANGLE_DEFER_COMMAND(Uniform2ui, context, location, v0, v1);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform2ui);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform2ui, context, location, v0, v1);
+    context->uniform2ui(location, v0, v1);
+}
+
+void NoErrorUniform2uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform2uiv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform2uiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform2uiv, context, location, count, value);
+    context->uniform2uiv(location, count, value);
+}
+
+void NoErrorUniform3f(Context *context, GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
+{
+    ANGLE_DEFER_COMMAND(Uniform3f, context, location, v0, v1, v2);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform3f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform3f, context, location, v0, v1, v2);
+    context->uniform3f(location, v0, v1, v2);
+}
+
+void NoErrorUniform3fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform3fv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform3fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform3fv, context, location, count, value);
+    context->uniform3fv(location, count, value);
+}
+
+void NoErrorUniform3i(Context *context, GLint location, GLint v0, GLint v1, GLint v2)
+{
+    ANGLE_DEFER_COMMAND(Uniform3i, context, location, v0, v1, v2);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform3i);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform3i, context, location, v0, v1, v2);
+    context->uniform3i(location, v0, v1, v2);
+}
+
+void NoErrorUniform3iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform3iv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform3iv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform3iv, context, location, count, value);
+    context->uniform3iv(location, count, value);
+}
+
+void NoErrorUniform3ui(Context *context, GLint location, GLuint v0, GLuint v1, GLuint v2)
+{
+    ANGLE_DEFER_COMMAND(Uniform3ui, context, location, v0, v1, v2);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform3ui);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform3ui, context, location, v0, v1, v2);
+    context->uniform3ui(location, v0, v1, v2);
+}
+
+void NoErrorUniform3uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform3uiv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform3uiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform3uiv, context, location, count, value);
+    context->uniform3uiv(location, count, value);
+}
+
+void NoErrorUniform4f(Context *context,
+                      GLint location,
+                      GLfloat v0,
+                      GLfloat v1,
+                      GLfloat v2,
+                      GLfloat v3)
+{
+    ANGLE_DEFER_COMMAND(Uniform4f, context, location, v0, v1, v2, v3);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform4f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform4f, context, location, v0, v1, v2, v3);
+    context->uniform4f(location, v0, v1, v2, v3);
+}
+
+void NoErrorUniform4fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform4fv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform4fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform4fv, context, location, count, value);
+    context->uniform4fv(location, count, value);
+}
+
+void NoErrorUniform4i(Context *context, GLint location, GLint v0, GLint v1, GLint v2, GLint v3)
+{
+    ANGLE_DEFER_COMMAND(Uniform4i, context, location, v0, v1, v2, v3);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform4i);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform4i, context, location, v0, v1, v2, v3);
+    context->uniform4i(location, v0, v1, v2, v3);
+}
+
+void NoErrorUniform4iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform4iv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform4iv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform4iv, context, location, count, value);
+    context->uniform4iv(location, count, value);
+}
+
+void NoErrorUniform4ui(Context *context, GLint location, GLuint v0, GLuint v1, GLuint v2, GLuint v3)
+{
+    ANGLE_DEFER_COMMAND(Uniform4ui, context, location, v0, v1, v2, v3);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform4ui);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform4ui, context, location, v0, v1, v2, v3);
+    context->uniform4ui(location, v0, v1, v2, v3);
+}
+
+void NoErrorUniform4uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    ANGLE_DEFER_COMMAND(Uniform4uiv, context, location, count, value);
+    ANGLE_PROFILE_ENTRY_POINT(Uniform4uiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Uniform4uiv, context, location, count, value);
+    context->uniform4uiv(location, count, value);
+}
+
+void NoErrorUniformBlockBinding(Context *context,
+                                GLuint program,
+                                GLuint uniformBlockIndex,
+                                GLuint uniformBlockBinding)
+{
+    ANGLE_DEFER_COMMAND(UniformBlockBinding, context, program, uniformBlockIndex,
+                        uniformBlockBinding);
+    ANGLE_PROFILE_ENTRY_POINT(UniformBlockBinding);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UniformBlockBinding, context, program, uniformBlockIndex,
+                       uniformBlockBinding);
+    context->uniformBlockBinding(program, uniformBlockIndex, uniformBlockBinding);
+}
+
+void NoErrorUniformMatrix2fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix2fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix2fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UniformMatrix2fv, context, location, count, transpose, value);
+    context->uniformMatrix2fv(location, count, transpose, value);
+}
+
+void NoErrorUniformMatrix2x3fv(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix2x3fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix2x3fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UniformMatrix2x3fv, context, location, count, transpose, value);
+    context->uniformMatrix2x3fv(location, count, transpose, value);
+}
+
+void NoErrorUniformMatrix2x4fv(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix2x4fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix2x4fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UniformMatrix2x4fv, context, location, count, transpose, value);
+    context->uniformMatrix2x4fv(location, count, transpose, value);
+}
+
+void NoErrorUniformMatrix3fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix3fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix3fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UniformMatrix3fv, context, location, count, transpose, value);
+    context->uniformMatrix3fv(location, count, transpose, value);
+}
+
+void NoErrorUniformMatrix3x2fv(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix3x2fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix3x2fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UniformMatrix3x2fv, context, location, count, transpose, value);
+    context->uniformMatrix3x2fv(location, count, transpose, value);
+}
+
+void NoErrorUniformMatrix3x4fv(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix3x4fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix3x4fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UniformMatrix3x4fv, context, location, count, transpose, value);
+    context->uniformMatrix3x4fv(location, count, transpose, value);
+}
+
+void NoErrorUniformMatrix4fv(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix4fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix4fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UniformMatrix4fv, context, location, count, transpose, value);
+    context->uniformMatrix4fv(location, count, transpose, value);
+}
+
+void NoErrorUniformMatrix4x2fv(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix4x2fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix4x2fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UniformMatrix4x2fv, context, location, count, transpose, value);
+    context->uniformMatrix4x2fv(location, count, transpose, value);
+}
+
+void NoErrorUniformMatrix4x3fv(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    ANGLE_DEFER_COMMAND(UniformMatrix4x3fv, context, location, count, transpose, value);
+    ANGLE_PROFILE_ENTRY_POINT(UniformMatrix4x3fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UniformMatrix4x3fv, context, location, count, transpose, value);
+    context->uniformMatrix4x3fv(location, count, transpose, value);
+}
+
+GLboolean NoErrorUnmapBuffer(Context *context, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(UnmapBuffer);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UnmapBuffer, context, target);
+    return context->unmapBuffer(targetPacked);
+}
+
+GLboolean NoErrorUnmapBufferOES(Context *context, GLenum target)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(UnmapBufferOES);
+    BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UnmapBufferOES, context, target);
+    return context->unmapBuffer(targetPacked);
+}
+
+void NoErrorUseProgram(Context *context, GLuint program)
+{
+    ANGLE_DEFER_COMMAND(UseProgram, context, program);
+    ANGLE_PROFILE_ENTRY_POINT(UseProgram);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UseProgram, context, program);
+    context->useProgram(program);
+}
+
+void NoErrorUseProgramStages(Context *context, GLuint pipeline, GLbitfield stages, GLuint program)
+{
+    ANGLE_DEFER_COMMAND(UseProgramStages, context, pipeline, stages, program);
+    ANGLE_PROFILE_ENTRY_POINT(UseProgramStages);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(UseProgramStages, context, pipeline, stages, program);
+    context->useProgramStages(pipeline, stages, program);
+}
+
+void NoErrorValidateProgram(Context *context, GLuint program)
+{
+    ANGLE_DEFER_COMMAND(ValidateProgram, context, program);
+    ANGLE_PROFILE_ENTRY_POINT(ValidateProgram);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ValidateProgram, context, program);
+    context->validateProgram(program);
+}
+
+void NoErrorValidateProgramPipeline(Context *context, GLuint pipeline)
+{
+    ANGLE_DEFER_COMMAND(ValidateProgramPipeline, context, pipeline);
+    ANGLE_PROFILE_ENTRY_POINT(ValidateProgramPipeline);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(ValidateProgramPipeline, context, pipeline);
+    context->validateProgramPipeline(pipeline);
+}
+
+void NoErrorVertexAttrib1f(Context *context, GLuint index, GLfloat x)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib1f, context, index, x);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib1f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttrib1f, context, index, x);
+    context->vertexAttrib1f(index, x);
+}
+
+void NoErrorVertexAttrib1fv(Context *context, GLuint index, const GLfloat *v)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib1fv, context, index, v);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib1fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttrib1fv, context, index, v);
+    context->vertexAttrib1fv(index, v);
+}
+
+void NoErrorVertexAttrib2f(Context *context, GLuint index, GLfloat x, GLfloat y)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib2f, context, index, x, y);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib2f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttrib2f, context, index, x, y);
+    context->vertexAttrib2f(index, x, y);
+}
+
+void NoErrorVertexAttrib2fv(Context *context, GLuint index, const GLfloat *v)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib2fv, context, index, v);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib2fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttrib2fv, context, index, v);
+    context->vertexAttrib2fv(index, v);
+}
+
+void NoErrorVertexAttrib3f(Context *context, GLuint index, GLfloat x, GLfloat y, GLfloat z)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib3f, context, index, x, y, z);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib3f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttrib3f, context, index, x, y, z);
+    context->vertexAttrib3f(index, x, y, z);
+}
+
+void NoErrorVertexAttrib3fv(Context *context, GLuint index, const GLfloat *v)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib3fv, context, index, v);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib3fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttrib3fv, context, index, v);
+    context->vertexAttrib3fv(index, v);
+}
+
+void NoErrorVertexAttrib4f(Context *context,
+                           GLuint index,
+                           GLfloat x,
+                           GLfloat y,
+                           GLfloat z,
+                           GLfloat w)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib4f, context, index, x, y, z, w);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib4f);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttrib4f, context, index, x, y, z, w);
+    context->vertexAttrib4f(index, x, y, z, w);
+}
+
+void NoErrorVertexAttrib4fv(Context *context, GLuint index, const GLfloat *v)
+{
+    ANGLE_DEFER_COMMAND(VertexAttrib4fv, context, index, v);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttrib4fv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttrib4fv, context, index, v);
+    context->vertexAttrib4fv(index, v);
+}
+
+void NoErrorVertexAttribBinding(Context *context, GLuint attribindex, GLuint bindingindex)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribBinding, context, attribindex, bindingindex);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribBinding);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttribBinding, context, attribindex, bindingindex);
+    context->vertexAttribBinding(attribindex, bindingindex);
+}
+
+void NoErrorVertexAttribDivisor(Context *context, GLuint index, GLuint divisor)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribDivisor, context, index, divisor);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribDivisor);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttribDivisor, context, index, divisor);
+    context->vertexAttribDivisor(index, divisor);
+}
+
+void NoErrorVertexAttribDivisorANGLE(Context *context, GLuint index, GLuint divisor)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribDivisorANGLE);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttribDivisorANGLE, context, index, divisor);
+    context->vertexAttribDivisor(index, divisor);
+}
+
+void NoErrorVertexAttribDivisorEXT(Context *context, GLuint index, GLuint divisor)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribDivisorEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttribDivisorEXT, context, index, divisor);
+    context->vertexAttribDivisor(index, divisor);
+}
+
+void NoErrorVertexAttribFormat(Context *context,
+                               GLuint attribindex,
+                               GLint size,
+                               GLenum type,
+                               GLboolean normalized,
+                               GLuint relativeoffset)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribFormat, context, attribindex, size, type, normalized,
+                        relativeoffset);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribFormat);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttribFormat, context, attribindex, size, type, normalized,
+                       relativeoffset);
+    context->vertexAttribFormat(attribindex, size, typePacked, normalized, relativeoffset);
+}
+
+void NoErrorVertexAttribI4i(Context *context, GLuint index, GLint x, GLint y, GLint z, GLint w)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribI4i, context, index, x, y, z, w);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribI4i);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttribI4i, context, index, x, y, z, w);
+    context->vertexAttribI4i(index, x, y, z, w);
+}
+
+void NoErrorVertexAttribI4iv(Context *context, GLuint index, const GLint *v)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribI4iv, context, index, v);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribI4iv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttribI4iv, context, index, v);
+    context->vertexAttribI4iv(index, v);
+}
+
+void NoErrorVertexAttribI4ui(Context *context, GLuint index, GLuint x, GLuint y, GLuint z, GLuint w)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribI4ui, context, index, x, y, z, w);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribI4ui);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttribI4ui, context, index, x, y, z, w);
+    context->vertexAttribI4ui(index, x, y, z, w);
+}
+
+void NoErrorVertexAttribI4uiv(Context *context, GLuint index, const GLuint *v)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribI4uiv, context, index, v);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribI4uiv);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttribI4uiv, context, index, v);
+    context->vertexAttribI4uiv(index, v);
+}
+
+void NoErrorVertexAttribIFormat(Context *context,
+                                GLuint attribindex,
+                                GLint size,
+                                GLenum type,
+                                GLuint relativeoffset)
+{
+    ANGLE_DEFER_COMMAND(VertexAttribIFormat, context, attribindex, size, type, relativeoffset);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribIFormat);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttribIFormat, context, attribindex, size, type, relativeoffset);
+    context->vertexAttribIFormat(attribindex, size, typePacked, relativeoffset);
+}
+
+void NoErrorVertexAttribIPointer(Context *context,
+                                 GLuint index,
+                                 GLint size,
+                                 GLenum type,
+                                 GLsizei stride,
+                                 const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_FOR_CLIENT_ARRAY(context, pointer);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribIPointer);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttribIPointer, context, index, size, type, stride, pointer);
+    context->vertexAttribIPointer(index, size, typePacked, stride, pointer);
+}
+
+void NoErrorVertexAttribPointer(Context *context,
+                                GLuint index,
+                                GLint size,
+                                GLenum type,
+                                GLboolean normalized,
+                                GLsizei stride,
+                                const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS_FOR_CLIENT_ARRAY(context, pointer);
+    ANGLE_PROFILE_ENTRY_POINT(VertexAttribPointer);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexAttribPointer, context, index, size, type, normalized, stride,
+                       pointer);
+    context->vertexAttribPointer(index, size, typePacked, normalized, stride, pointer);
+}
+
+void NoErrorVertexBindingDivisor(Context *context, GLuint bindingindex, GLuint divisor)
+{
+    ANGLE_DEFER_COMMAND(VertexBindingDivisor, context, bindingindex, divisor);
+    ANGLE_PROFILE_ENTRY_POINT(VertexBindingDivisor);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexBindingDivisor, context, bindingindex, divisor);
+    context->vertexBindingDivisor(bindingindex, divisor);
+}
+
+void NoErrorVertexPointer(Context *context,
+                          GLint size,
+                          GLenum type,
+                          GLsizei stride,
+                          const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(VertexPointer);
+    VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(VertexPointer, context, size, type, stride, pointer);
+    context->vertexPointer(size, typePacked, stride, pointer);
+}
+
+void NoErrorViewport(Context *context, GLint x, GLint y, GLsizei width, GLsizei height)
+{
+    ANGLE_DEFER_COMMAND(Viewport, context, x, y, width, height);
+    ANGLE_PROFILE_ENTRY_POINT(Viewport);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(Viewport, context, x, y, width, height);
+    context->viewport(x, y, width, height);
+}
+
+void NoErrorWaitSemaphoreEXT(Context *context,
+                             GLuint semaphore,
+                             GLuint numBufferBarriers,
+                             const GLuint *buffers,
+                             GLuint numTextureBarriers,
+                             const GLuint *textures,
+                             const GLenum *srcLayouts)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(WaitSemaphoreEXT);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(WaitSemaphoreEXT, context, semaphore, numBufferBarriers, buffers,
+                       numTextureBarriers, textures, srcLayouts);
+    context->waitSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers, textures,
+                           srcLayouts);
+}
+
+void NoErrorWaitSync(Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout)
+{
+    ANGLE_DEFER_COMMAND(WaitSync, context, sync, flags, timeout);
+    ANGLE_PROFILE_ENTRY_POINT(WaitSync);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(WaitSync, context, sync, flags, timeout);
+    context->waitSync(sync, flags, timeout);
+}
+
+void NoErrorWeightPointerOES(Context *context,
+                             GLint size,
+                             GLenum type,
+                             GLsizei stride,
+                             const void *pointer)
+{
+    ANGLE_SYNC_DEFERRED_COMMANDS(context);
+    ANGLE_PROFILE_ENTRY_POINT(WeightPointerOES);
+    ANGLE_PROFILE_ENTRY_POINT_DISPATCH();
+    ANGLE_CAPTURE_CALL(WeightPointerOES, context, size, type, stride, pointer);
+    context->weightPointer(size, type, stride, pointer);
+}
+
+void ContextLostActiveShaderProgram(Context *context, GLuint pipeline, GLuint program)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostActiveTexture(Context *context, GLenum texture)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostAlphaFunc(Context *context, GLenum func, GLfloat ref)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostAlphaFuncx(Context *context, GLenum func, GLfixed ref)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostAttachShader(Context *context, GLuint program, GLuint shader)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBeginQuery(Context *context, GLenum target, GLuint id)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBeginQueryEXT(Context *context, GLenum target, GLuint id)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBeginTransformFeedback(Context *context, GLenum primitiveMode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindAttribLocation(Context *context,
+                                   GLuint program,
+                                   GLuint index,
+                                   const GLchar *name)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindBuffer(Context *context, GLenum target, GLuint buffer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindBufferBase(Context *context, GLenum target, GLuint index, GLuint buffer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindBufferRange(Context *context,
+                                GLenum target,
+                                GLuint index,
+                                GLuint buffer,
+                                GLintptr offset,
+                                GLsizeiptr size)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindFragDataLocationEXT(Context *context,
+                                        GLuint program,
+                                        GLuint color,
+                                        const GLchar *name)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindFragDataLocationIndexedEXT(Context *context,
+                                               GLuint program,
+                                               GLuint colorNumber,
+                                               GLuint index,
+                                               const GLchar *name)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindFragmentInputLocationCHROMIUM(Context *context,
+                                                  GLuint programs,
+                                                  GLint location,
+                                                  const GLchar *name)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindFramebuffer(Context *context, GLenum target, GLuint framebuffer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindFramebufferOES(Context *context, GLenum target, GLuint framebuffer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindImageTexture(Context *context,
+                                 GLuint unit,
+                                 GLuint texture,
+                                 GLint level,
+                                 GLboolean layered,
+                                 GLint layer,
+                                 GLenum access,
+                                 GLenum format)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindProgramPipeline(Context *context, GLuint pipeline)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindRenderbuffer(Context *context, GLenum target, GLuint renderbuffer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindRenderbufferOES(Context *context, GLenum target, GLuint renderbuffer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindSampler(Context *context, GLuint unit, GLuint sampler)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindTexture(Context *context, GLenum target, GLuint texture)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindTransformFeedback(Context *context, GLenum target, GLuint id)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindUniformLocationCHROMIUM(Context *context,
+                                            GLuint program,
+                                            GLint location,
+                                            const GLchar *name)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindVertexArray(Context *context, GLuint array)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindVertexArrayOES(Context *context, GLuint array)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBindVertexBuffer(Context *context,
+                                 GLuint bindingindex,
+                                 GLuint buffer,
+                                 GLintptr offset,
+                                 GLsizei stride)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBlendColor(Context *context,
+                           GLfloat red,
+                           GLfloat green,
+                           GLfloat blue,
+                           GLfloat alpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBlendEquation(Context *context, GLenum mode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBlendEquationSeparate(Context *context, GLenum modeRGB, GLenum modeAlpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBlendFunc(Context *context, GLenum sfactor, GLenum dfactor)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBlendFuncSeparate(Context *context,
+                                  GLenum sfactorRGB,
+                                  GLenum dfactorRGB,
+                                  GLenum sfactorAlpha,
+                                  GLenum dfactorAlpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBlitFramebuffer(Context *context,
+                                GLint srcX0,
+                                GLint srcY0,
+                                GLint srcX1,
+                                GLint srcY1,
+                                GLint dstX0,
+                                GLint dstY0,
+                                GLint dstX1,
+                                GLint dstY1,
+                                GLbitfield mask,
+                                GLenum filter)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBlitFramebufferANGLE(Context *context,
+                                     GLint srcX0,
+                                     GLint srcY0,
+                                     GLint srcX1,
+                                     GLint srcY1,
+                                     GLint dstX0,
+                                     GLint dstY0,
+                                     GLint dstX1,
+                                     GLint dstY1,
+                                     GLbitfield mask,
+                                     GLenum filter)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBufferData(Context *context,
+                           GLenum target,
+                           GLsizeiptr size,
+                           const void *data,
+                           GLenum usage)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBufferStorageMemEXT(Context *context,
+                                    GLenum target,
+                                    GLsizeiptr size,
+                                    GLuint memory,
+                                    GLuint64 offset)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostBufferSubData(Context *context,
+                              GLenum target,
+                              GLintptr offset,
+                              GLsizeiptr size,
+                              const void *data)
+{
+    GenerateContextLostError(context);
+}
+
+GLenum ContextLostCheckFramebufferStatus(Context *context, GLenum target)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::CheckFramebufferStatus, GLenum>();
+}
+
+GLenum ContextLostCheckFramebufferStatusOES(Context *context, GLenum target)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::CheckFramebufferStatusOES, GLenum>();
+}
+
+void ContextLostClear(Context *context, GLbitfield mask)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostClearBufferfi(Context *context,
+                              GLenum buffer,
+                              GLint drawbuffer,
+                              GLfloat depth,
+                              GLint stencil)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostClearBufferfv(Context *context,
+                              GLenum buffer,
+                              GLint drawbuffer,
+                              const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostClearBufferiv(Context *context, GLenum buffer, GLint drawbuffer, const GLint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostClearBufferuiv(Context *context,
+                               GLenum buffer,
+                               GLint drawbuffer,
+                               const GLuint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostClearColor(Context *context,
+                           GLfloat red,
+                           GLfloat green,
+                           GLfloat blue,
+                           GLfloat alpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostClearColorx(Context *context,
+                            GLfixed red,
+                            GLfixed green,
+                            GLfixed blue,
+                            GLfixed alpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostClearDepthf(Context *context, GLfloat d)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostClearDepthx(Context *context, GLfixed depth)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostClearStencil(Context *context, GLint s)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostClientActiveTexture(Context *context, GLenum texture)
+{
+    GenerateContextLostError(context);
+}
+
+GLenum ContextLostClientWaitSync(Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::ClientWaitSync, GLenum>();
+}
+
+void ContextLostClipPlanef(Context *context, GLenum p, const GLfloat *eqn)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostClipPlanex(Context *context, GLenum plane, const GLfixed *equation)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostColor4f(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostColor4ub(Context *context, GLubyte red, GLubyte green, GLubyte blue, GLubyte alpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostColor4x(Context *context, GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostColorMask(Context *context,
+                          GLboolean red,
+                          GLboolean green,
+                          GLboolean blue,
+                          GLboolean alpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostColorPointer(Context *context,
+                             GLint size,
+                             GLenum type,
+                             GLsizei stride,
+                             const void *pointer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCompileShader(Context *context, GLuint shader)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCompressedCopyTextureCHROMIUM(Context *context, GLuint sourceId, GLuint destId)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCompressedTexImage2D(Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLenum internalformat,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLint border,
+                                     GLsizei imageSize,
+                                     const void *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCompressedTexImage2DRobustANGLE(Context *context,
+                                                GLenum target,
+                                                GLint level,
+                                                GLenum internalformat,
+                                                GLsizei width,
+                                                GLsizei height,
+                                                GLint border,
+                                                GLsizei imageSize,
+                                                GLsizei dataSize,
+                                                const GLvoid *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCompressedTexImage3D(Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLenum internalformat,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLsizei depth,
+                                     GLint border,
+                                     GLsizei imageSize,
+                                     const void *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCompressedTexImage3DRobustANGLE(Context *context,
+                                                GLenum target,
+                                                GLint level,
+                                                GLenum internalformat,
+                                                GLsizei width,
+                                                GLsizei height,
+                                                GLsizei depth,
+                                                GLint border,
+                                                GLsizei imageSize,
+                                                GLsizei dataSize,
+                                                const GLvoid *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCompressedTexSubImage2D(Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLint xoffset,
+                                        GLint yoffset,
+                                        GLsizei width,
+                                        GLsizei height,
+                                        GLenum format,
+                                        GLsizei imageSize,
+                                        const void *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCompressedTexSubImage2DRobustANGLE(Context *context,
+                                                   GLenum target,
+                                                   GLint level,
+                                                   GLsizei xoffset,
+                                                   GLsizei yoffset,
+                                                   GLsizei width,
+                                                   GLsizei height,
+                                                   GLenum format,
+                                                   GLsizei imageSize,
+                                                   GLsizei dataSize,
+                                                   const GLvoid *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCompressedTexSubImage3D(Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLint xoffset,
+                                        GLint yoffset,
+                                        GLint zoffset,
+                                        GLsizei width,
+                                        GLsizei height,
+                                        GLsizei depth,
+                                        GLenum format,
+                                        GLsizei imageSize,
+                                        const void *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCompressedTexSubImage3DRobustANGLE(Context *context,
+                                                   GLenum target,
+                                                   GLint level,
+                                                   GLint xoffset,
+                                                   GLint yoffset,
+                                                   GLint zoffset,
+                                                   GLsizei width,
+                                                   GLsizei height,
+                                                   GLsizei depth,
+                                                   GLenum format,
+                                                   GLsizei imageSize,
+                                                   GLsizei dataSize,
+                                                   const GLvoid *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCopyBufferSubData(Context *context,
+                                  GLenum readTarget,
+                                  GLenum writeTarget,
+                                  GLintptr readOffset,
+                                  GLintptr writeOffset,
+                                  GLsizeiptr size)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCopySubTexture3DANGLE(Context *context,
+                                      GLuint sourceId,
+                                      GLint sourceLevel,
+                                      GLenum destTarget,
+                                      GLuint destId,
+                                      GLint destLevel,
+                                      GLint xoffset,
+                                      GLint yoffset,
+                                      GLint zoffset,
+                                      GLint x,
+                                      GLint y,
+                                      GLint z,
+                                      GLint width,
+                                      GLint height,
+                                      GLint depth,
+                                      GLboolean unpackFlipY,
+                                      GLboolean unpackPremultiplyAlpha,
+                                      GLboolean unpackUnmultiplyAlpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCopySubTextureCHROMIUM(Context *context,
+                                       GLuint sourceId,
+                                       GLint sourceLevel,
+                                       GLenum destTarget,
+                                       GLuint destId,
+                                       GLint destLevel,
+                                       GLint xoffset,
+                                       GLint yoffset,
+                                       GLint x,
+                                       GLint y,
+                                       GLint width,
+                                       GLint height,
+                                       GLboolean unpackFlipY,
+                                       GLboolean unpackPremultiplyAlpha,
+                                       GLboolean unpackUnmultiplyAlpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCopyTexImage2D(Context *context,
+                               GLenum target,
+                               GLint level,
+                               GLenum internalformat,
+                               GLint x,
+                               GLint y,
+                               GLsizei width,
+                               GLsizei height,
+                               GLint border)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCopyTexSubImage2D(Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint xoffset,
+                                  GLint yoffset,
+                                  GLint x,
+                                  GLint y,
+                                  GLsizei width,
+                                  GLsizei height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCopyTexSubImage3D(Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint xoffset,
+                                  GLint yoffset,
+                                  GLint zoffset,
+                                  GLint x,
+                                  GLint y,
+                                  GLsizei width,
+                                  GLsizei height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCopyTexture3DANGLE(Context *context,
+                                   GLuint sourceId,
+                                   GLint sourceLevel,
+                                   GLenum destTarget,
+                                   GLuint destId,
+                                   GLint destLevel,
+                                   GLint internalFormat,
+                                   GLenum destType,
+                                   GLboolean unpackFlipY,
+                                   GLboolean unpackPremultiplyAlpha,
+                                   GLboolean unpackUnmultiplyAlpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCopyTextureCHROMIUM(Context *context,
+                                    GLuint sourceId,
+                                    GLint sourceLevel,
+                                    GLenum destTarget,
+                                    GLuint destId,
+                                    GLint destLevel,
+                                    GLint internalFormat,
+                                    GLenum destType,
+                                    GLboolean unpackFlipY,
+                                    GLboolean unpackPremultiplyAlpha,
+                                    GLboolean unpackUnmultiplyAlpha)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCoverFillPathCHROMIUM(Context *context, GLuint path, GLenum coverMode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCoverFillPathInstancedCHROMIUM(Context *context,
+                                               GLsizei numPath,
+                                               GLenum pathNameType,
+                                               const void *paths,
+                                               GLuint pathBase,
+                                               GLenum coverMode,
+                                               GLenum transformType,
+                                               const GLfloat *transformValues)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCoverStrokePathCHROMIUM(Context *context, GLuint path, GLenum coverMode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCoverStrokePathInstancedCHROMIUM(Context *context,
+                                                 GLsizei numPath,
+                                                 GLenum pathNameType,
+                                                 const void *paths,
+                                                 GLuint pathBase,
+                                                 GLenum coverMode,
+                                                 GLenum transformType,
+                                                 const GLfloat *transformValues)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCoverageModulationCHROMIUM(Context *context, GLenum components)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCreateMemoryObjectsEXT(Context *context, GLsizei n, GLuint *memoryObjects)
+{
+    GenerateContextLostError(context);
+}
+
+GLuint ContextLostCreateProgram(Context *context)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::CreateProgram, GLuint>();
+}
+
+GLuint ContextLostCreateShader(Context *context, GLenum type)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::CreateShader, GLuint>();
+}
+
+GLuint ContextLostCreateShaderProgramv(Context *context,
+                                       GLenum type,
+                                       GLsizei count,
+                                       const GLchar *const *strings)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::CreateShaderProgramv, GLuint>();
+}
+
+void ContextLostCullFace(Context *context, GLenum mode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostCurrentPaletteMatrixOES(Context *context, GLuint matrixpaletteindex)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDebugMessageCallbackKHR(Context *context,
+                                        GLDEBUGPROCKHR callback,
+                                        const void *userParam)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDebugMessageControlKHR(Context *context,
+                                       GLenum source,
+                                       GLenum type,
+                                       GLenum severity,
+                                       GLsizei count,
+                                       const GLuint *ids,
+                                       GLboolean enabled)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDebugMessageInsertKHR(Context *context,
+                                      GLenum source,
+                                      GLenum type,
+                                      GLuint id,
+                                      GLenum severity,
+                                      GLsizei length,
+                                      const GLchar *buf)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteBuffers(Context *context, GLsizei n, const GLuint *buffers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteFencesNV(Context *context, GLsizei n, const GLuint *fences)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteFramebuffers(Context *context, GLsizei n, const GLuint *framebuffers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteFramebuffersOES(Context *context, GLsizei n, const GLuint *framebuffers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteMemoryObjectsEXT(Context *context, GLsizei n, const GLuint *memoryObjects)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeletePathsCHROMIUM(Context *context, GLuint first, GLsizei range)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteProgram(Context *context, GLuint program)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteProgramPipelines(Context *context, GLsizei n, const GLuint *pipelines)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteQueries(Context *context, GLsizei n, const GLuint *ids)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteQueriesEXT(Context *context, GLsizei n, const GLuint *ids)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteRenderbuffers(Context *context, GLsizei n, const GLuint *renderbuffers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteRenderbuffersOES(Context *context, GLsizei n, const GLuint *renderbuffers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteSamplers(Context *context, GLsizei count, const GLuint *samplers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteSemaphoresEXT(Context *context, GLsizei n, const GLuint *semaphores)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteShader(Context *context, GLuint shader)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteSync(Context *context, GLsync sync)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteTextures(Context *context, GLsizei n, const GLuint *textures)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteTransformFeedbacks(Context *context, GLsizei n, const GLuint *ids)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteVertexArrays(Context *context, GLsizei n, const GLuint *arrays)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDeleteVertexArraysOES(Context *context, GLsizei n, const GLuint *arrays)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDepthFunc(Context *context, GLenum func)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDepthMask(Context *context, GLboolean flag)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDepthRangef(Context *context, GLfloat n, GLfloat f)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDepthRangex(Context *context, GLfixed n, GLfixed f)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDetachShader(Context *context, GLuint program, GLuint shader)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDisable(Context *context, GLenum cap)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDisableClientState(Context *context, GLenum array)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDisableVertexAttribArray(Context *context, GLuint index)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDiscardFramebufferEXT(Context *context,
+                                      GLenum target,
+                                      GLsizei numAttachments,
+                                      const GLenum *attachments)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDispatchCompute(Context *context,
+                                GLuint num_groups_x,
+                                GLuint num_groups_y,
+                                GLuint num_groups_z)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDispatchComputeIndirect(Context *context, GLintptr indirect)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawArrays(Context *context, GLenum mode, GLint first, GLsizei count)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawArraysIndirect(Context *context, GLenum mode, const void *indirect)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawArraysInstanced(Context *context,
+                                    GLenum mode,
+                                    GLint first,
+                                    GLsizei count,
+                                    GLsizei instancecount)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawArraysInstancedANGLE(Context *context,
+                                         GLenum mode,
+                                         GLint first,
+                                         GLsizei count,
+                                         GLsizei primcount)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawArraysInstancedEXT(Context *context,
+                                       GLenum mode,
+                                       GLint start,
+                                       GLsizei count,
+                                       GLsizei primcount)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawBuffers(Context *context, GLsizei n, const GLenum *bufs)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawBuffersEXT(Context *context, GLsizei n, const GLenum *bufs)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawElements(Context *context,
+                             GLenum mode,
+                             GLsizei count,
+                             GLenum type,
+                             const void *indices)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawElementsIndirect(Context *context,
+                                     GLenum mode,
+                                     GLenum type,
+                                     const void *indirect)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawElementsInstanced(Context *context,
+                                      GLenum mode,
+                                      GLsizei count,
+                                      GLenum type,
+                                      const void *indices,
+                                      GLsizei instancecount)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawElementsInstancedANGLE(Context *context,
+                                           GLenum mode,
+                                           GLsizei count,
+                                           GLenum type,
+                                           const void *indices,
+                                           GLsizei primcount)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawElementsInstancedEXT(Context *context,
+                                         GLenum mode,
+                                         GLsizei count,
+                                         GLenum type,
+                                         const void *indices,
+                                         GLsizei primcount)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawRangeElements(Context *context,
+                                  GLenum mode,
+                                  GLuint start,
+                                  GLuint end,
+                                  GLsizei count,
+                                  GLenum type,
+                                  const void *indices)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawTexfOES(Context *context,
+                            GLfloat x,
+                            GLfloat y,
+                            GLfloat z,
+                            GLfloat width,
+                            GLfloat height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawTexfvOES(Context *context, const GLfloat *coords)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawTexiOES(Context *context, GLint x, GLint y, GLint z, GLint width, GLint height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawTexivOES(Context *context, const GLint *coords)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawTexsOES(Context *context,
+                            GLshort x,
+                            GLshort y,
+                            GLshort z,
+                            GLshort width,
+                            GLshort height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawTexsvOES(Context *context, const GLshort *coords)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawTexxOES(Context *context,
+                            GLfixed x,
+                            GLfixed y,
+                            GLfixed z,
+                            GLfixed width,
+                            GLfixed height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostDrawTexxvOES(Context *context, const GLfixed *coords)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostEGLImageTargetRenderbufferStorageOES(Context *context,
+                                                     GLenum target,
+                                                     GLeglImageOES image)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostEGLImageTargetTexture2DOES(Context *context, GLenum target, GLeglImageOES image)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostEnable(Context *context, GLenum cap)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostEnableClientState(Context *context, GLenum array)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostEnableVertexAttribArray(Context *context, GLuint index)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostEndQuery(Context *context, GLenum target)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostEndQueryEXT(Context *context, GLenum target)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostEndTransformFeedback(Context *context)
+{
+    GenerateContextLostError(context);
+}
+
+GLsync ContextLostFenceSync(Context *context, GLenum condition, GLbitfield flags)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::FenceSync, GLsync>();
+}
+
+void ContextLostFinish(Context *context)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFinishFenceNV(Context *context, GLuint fence)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFlush(Context *context)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFlushMappedBufferRange(Context *context,
+                                       GLenum target,
+                                       GLintptr offset,
+                                       GLsizeiptr length)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFlushMappedBufferRangeEXT(Context *context,
+                                          GLenum target,
+                                          GLintptr offset,
+                                          GLsizeiptr length)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFogf(Context *context, GLenum pname, GLfloat param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFogfv(Context *context, GLenum pname, const GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFogx(Context *context, GLenum pname, GLfixed param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFogxv(Context *context, GLenum pname, const GLfixed *param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFramebufferParameteri(Context *context, GLenum target, GLenum pname, GLint param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFramebufferRenderbuffer(Context *context,
+                                        GLenum target,
+                                        GLenum attachment,
+                                        GLenum renderbuffertarget,
+                                        GLuint renderbuffer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFramebufferRenderbufferOES(Context *context,
+                                           GLenum target,
+                                           GLenum attachment,
+                                           GLenum renderbuffertarget,
+                                           GLuint renderbuffer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFramebufferTexture2D(Context *context,
+                                     GLenum target,
+                                     GLenum attachment,
+                                     GLenum textarget,
+                                     GLuint texture,
+                                     GLint level)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFramebufferTexture2DOES(Context *context,
+                                        GLenum target,
+                                        GLenum attachment,
+                                        GLenum textarget,
+                                        GLuint texture,
+                                        GLint level)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFramebufferTextureEXT(Context *context,
+                                      GLenum target,
+                                      GLenum attachment,
+                                      GLuint texture,
+                                      GLint level)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFramebufferTextureLayer(Context *context,
+                                        GLenum target,
+                                        GLenum attachment,
+                                        GLuint texture,
+                                        GLint level,
+                                        GLint layer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFramebufferTextureMultiviewOVR(Context *context,
+                                               GLenum target,
+                                               GLenum attachment,
+                                               GLuint texture,
+                                               GLint level,
+                                               GLint baseViewIndex,
+                                               GLsizei numViews)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFrontFace(Context *context, GLenum mode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFrustumf(Context *context,
+                         GLfloat l,
+                         GLfloat r,
+                         GLfloat b,
+                         GLfloat t,
+                         GLfloat n,
+                         GLfloat f)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostFrustumx(Context *context,
+                         GLfixed l,
+                         GLfixed r,
+                         GLfixed b,
+                         GLfixed t,
+                         GLfixed n,
+                         GLfixed f)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenBuffers(Context *context, GLsizei n, GLuint *buffers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenFencesNV(Context *context, GLsizei n, GLuint *fences)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenFramebuffers(Context *context, GLsizei n, GLuint *framebuffers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenFramebuffersOES(Context *context, GLsizei n, GLuint *framebuffers)
+{
+    GenerateContextLostError(context);
+}
+
+GLuint ContextLostGenPathsCHROMIUM(Context *context, GLsizei range)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GenPathsCHROMIUM, GLuint>();
+}
+
+void ContextLostGenProgramPipelines(Context *context, GLsizei n, GLuint *pipelines)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenQueries(Context *context, GLsizei n, GLuint *ids)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenQueriesEXT(Context *context, GLsizei n, GLuint *ids)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenRenderbuffers(Context *context, GLsizei n, GLuint *renderbuffers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenRenderbuffersOES(Context *context, GLsizei n, GLuint *renderbuffers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenSamplers(Context *context, GLsizei count, GLuint *samplers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenSemaphoresEXT(Context *context, GLsizei n, GLuint *semaphores)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenTextures(Context *context, GLsizei n, GLuint *textures)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenTransformFeedbacks(Context *context, GLsizei n, GLuint *ids)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenVertexArrays(Context *context, GLsizei n, GLuint *arrays)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenVertexArraysOES(Context *context, GLsizei n, GLuint *arrays)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenerateMipmap(Context *context, GLenum target)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGenerateMipmapOES(Context *context, GLenum target)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetActiveAttrib(Context *context,
+                                GLuint program,
+                                GLuint index,
+                                GLsizei bufSize,
+                                GLsizei *length,
+                                GLint *size,
+                                GLenum *type,
+                                GLchar *name)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetActiveUniform(Context *context,
+                                 GLuint program,
+                                 GLuint index,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLint *size,
+                                 GLenum *type,
+                                 GLchar *name)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetActiveUniformBlockName(Context *context,
+                                          GLuint program,
+                                          GLuint uniformBlockIndex,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLchar *uniformBlockName)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetActiveUniformBlockiv(Context *context,
+                                        GLuint program,
+                                        GLuint uniformBlockIndex,
+                                        GLenum pname,
+                                        GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetActiveUniformBlockivRobustANGLE(Context *context,
+                                                   GLuint program,
+                                                   GLuint uniformBlockIndex,
+                                                   GLenum pname,
+                                                   GLsizei bufSize,
+                                                   GLsizei *length,
+                                                   GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetActiveUniformsiv(Context *context,
+                                    GLuint program,
+                                    GLsizei uniformCount,
+                                    const GLuint *uniformIndices,
+                                    GLenum pname,
+                                    GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetAttachedShaders(Context *context,
+                                   GLuint program,
+                                   GLsizei maxCount,
+                                   GLsizei *count,
+                                   GLuint *shaders)
+{
+    GenerateContextLostError(context);
+}
+
+GLint ContextLostGetAttribLocation(Context *context, GLuint program, const GLchar *name)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetAttribLocation, GLint>();
+}
+
+void ContextLostGetBooleani_v(Context *context, GLenum target, GLuint index, GLboolean *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetBooleani_vRobustANGLE(Context *context,
+                                         GLenum target,
+                                         GLuint index,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLboolean *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetBooleanv(Context *context, GLenum pname, GLboolean *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetBooleanvRobustANGLE(Context *context,
+                                       GLenum pname,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLboolean *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetBufferParameteri64v(Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLint64 *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetBufferParameteri64vRobustANGLE(Context *context,
+                                                  GLenum target,
+                                                  GLenum pname,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  GLint64 *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetBufferParameteriv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetBufferParameterivRobustANGLE(Context *context,
+                                                GLenum target,
+                                                GLenum pname,
+                                                GLsizei bufSize,
+                                                GLsizei *length,
+                                                GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetBufferPointerv(Context *context, GLenum target, GLenum pname, void **params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetBufferPointervOES(Context *context, GLenum target, GLenum pname, void **params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetBufferPointervRobustANGLE(Context *context,
+                                             GLenum target,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             void **params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetClipPlanef(Context *context, GLenum plane, GLfloat *equation)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetClipPlanex(Context *context, GLenum plane, GLfixed *equation)
+{
+    GenerateContextLostError(context);
+}
+
+GLuint ContextLostGetDebugMessageLogKHR(Context *context,
+                                        GLuint count,
+                                        GLsizei bufSize,
+                                        GLenum *sources,
+                                        GLenum *types,
+                                        GLuint *ids,
+                                        GLenum *severities,
+                                        GLsizei *lengths,
+                                        GLchar *messageLog)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetDebugMessageLogKHR, GLuint>();
+}
+
+GLenum ContextLostGetError(Context *context)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetError, GLenum>();
+}
+
+void ContextLostGetFenceivNV(Context *context, GLuint fence, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetFixedv(Context *context, GLenum pname, GLfixed *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetFloatv(Context *context, GLenum pname, GLfloat *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetFloatvRobustANGLE(Context *context,
+                                     GLenum pname,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+GLint ContextLostGetFragDataIndexEXT(Context *context, GLuint program, const GLchar *name)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetFragDataIndexEXT, GLint>();
+}
+
+GLint ContextLostGetFragDataLocation(Context *context, GLuint program, const GLchar *name)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetFragDataLocation, GLint>();
+}
+
+void ContextLostGetFramebufferAttachmentParameteriv(Context *context,
+                                                    GLenum target,
+                                                    GLenum attachment,
+                                                    GLenum pname,
+                                                    GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetFramebufferAttachmentParameterivOES(Context *context,
+                                                       GLenum target,
+                                                       GLenum attachment,
+                                                       GLenum pname,
+                                                       GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetFramebufferAttachmentParameterivRobustANGLE(Context *context,
+                                                               GLenum target,
+                                                               GLenum attachment,
+                                                               GLenum pname,
+                                                               GLsizei bufSize,
+                                                               GLsizei *length,
+                                                               GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetFramebufferParameteriv(Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetFramebufferParameterivRobustANGLE(Context *context,
+                                                     GLuint sampler,
+                                                     GLenum pname,
+                                                     GLsizei bufSize,
+                                                     GLsizei *length,
+                                                     GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+GLenum ContextLostGetGraphicsResetStatusEXT(Context *context)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetGraphicsResetStatusEXT, GLenum>();
+}
+
+void ContextLostGetInteger64i_v(Context *context, GLenum target, GLuint index, GLint64 *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetInteger64i_vRobustANGLE(Context *context,
+                                           GLenum target,
+                                           GLuint index,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLint64 *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetInteger64v(Context *context, GLenum pname, GLint64 *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetInteger64vRobustANGLE(Context *context,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint64 *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetIntegeri_v(Context *context, GLenum target, GLuint index, GLint *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetIntegeri_vRobustANGLE(Context *context,
+                                         GLenum target,
+                                         GLuint index,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetIntegerv(Context *context, GLenum pname, GLint *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetIntegervRobustANGLE(Context *context,
+                                       GLenum pname,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLint *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetInternalformativ(Context *context,
+                                    GLenum target,
+                                    GLenum internalformat,
+                                    GLenum pname,
+                                    GLsizei bufSize,
+                                    GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetInternalformativRobustANGLE(Context *context,
+                                               GLenum target,
+                                               GLenum internalformat,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetLightfv(Context *context, GLenum light, GLenum pname, GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetLightxv(Context *context, GLenum light, GLenum pname, GLfixed *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetMaterialfv(Context *context, GLenum face, GLenum pname, GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetMaterialxv(Context *context, GLenum face, GLenum pname, GLfixed *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetMemoryObjectParameterivEXT(Context *context,
+                                              GLuint memoryObject,
+                                              GLenum pname,
+                                              GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetMultisamplefv(Context *context, GLenum pname, GLuint index, GLfloat *val)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetMultisamplefvANGLE(Context *context, GLenum pname, GLuint index, GLfloat *val)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetMultisamplefvRobustANGLE(Context *context,
+                                            GLenum pname,
+                                            GLuint index,
+                                            GLsizei bufSize,
+                                            GLsizei *length,
+                                            GLfloat *val)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetObjectLabelKHR(Context *context,
+                                  GLenum identifier,
+                                  GLuint name,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLchar *label)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetObjectPtrLabelKHR(Context *context,
+                                     const void *ptr,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLchar *label)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetPathParameterfvCHROMIUM(Context *context,
+                                           GLuint path,
+                                           GLenum pname,
+                                           GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetPathParameterivCHROMIUM(Context *context,
+                                           GLuint path,
+                                           GLenum pname,
+                                           GLint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetPointerv(Context *context, GLenum pname, void **params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetPointervKHR(Context *context, GLenum pname, void **params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetPointervRobustANGLERobustANGLE(Context *context,
+                                                  GLenum pname,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  void **params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetProgramBinary(Context *context,
+                                 GLuint program,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLenum *binaryFormat,
+                                 void *binary)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetProgramBinaryOES(Context *context,
+                                    GLuint program,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLenum *binaryFormat,
+                                    void *binary)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetProgramInfoLog(Context *context,
+                                  GLuint program,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLchar *infoLog)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetProgramInterfaceiv(Context *context,
+                                      GLuint program,
+                                      GLenum programInterface,
+                                      GLenum pname,
+                                      GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetProgramInterfaceivRobustANGLE(Context *context,
+                                                 GLuint program,
+                                                 GLenum programInterface,
+                                                 GLenum pname,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetProgramPipelineInfoLog(Context *context,
+                                          GLuint pipeline,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLchar *infoLog)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetProgramPipelineiv(Context *context, GLuint pipeline, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+GLuint ContextLostGetProgramResourceIndex(Context *context,
+                                          GLuint program,
+                                          GLenum programInterface,
+                                          const GLchar *name)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetProgramResourceIndex, GLuint>();
+}
+
+GLint ContextLostGetProgramResourceLocation(Context *context,
+                                            GLuint program,
+                                            GLenum programInterface,
+                                            const GLchar *name)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetProgramResourceLocation, GLint>();
+}
+
+GLint ContextLostGetProgramResourceLocationIndexEXT(Context *context,
+                                                    GLuint program,
+                                                    GLenum programInterface,
+                                                    const GLchar *name)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetProgramResourceLocationIndexEXT, GLint>();
+}
+
+void ContextLostGetProgramResourceName(Context *context,
+                                       GLuint program,
+                                       GLenum programInterface,
+                                       GLuint index,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLchar *name)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetProgramResourceiv(Context *context,
+                                     GLuint program,
+                                     GLenum programInterface,
+                                     GLuint index,
+                                     GLsizei propCount,
+                                     const GLenum *props,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetProgramiv(Context *context, GLuint program, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetProgramivRobustANGLE(Context *context,
+                                        GLuint program,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetQueryObjecti64vEXT(Context *context, GLuint id, GLenum pname, GLint64 *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetQueryObjecti64vRobustANGLE(Context *context,
+                                              GLuint id,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint64 *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetQueryObjectivEXT(Context *context, GLuint id, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetQueryObjectivRobustANGLE(Context *context,
+                                            GLuint id,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            GLsizei *length,
+                                            GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetQueryObjectui64vEXT(Context *context, GLuint id, GLenum pname, GLuint64 *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetQueryObjectui64vRobustANGLE(Context *context,
+                                               GLuint id,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLuint64 *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetQueryObjectuiv(Context *context, GLuint id, GLenum pname, GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetQueryObjectuivEXT(Context *context, GLuint id, GLenum pname, GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetQueryObjectuivRobustANGLE(Context *context,
+                                             GLuint id,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetQueryiv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetQueryivEXT(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetQueryivRobustANGLE(Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetRenderbufferParameteriv(Context *context,
+                                           GLenum target,
+                                           GLenum pname,
+                                           GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetRenderbufferParameterivOES(Context *context,
+                                              GLenum target,
+                                              GLenum pname,
+                                              GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetRenderbufferParameterivRobustANGLE(Context *context,
+                                                      GLenum target,
+                                                      GLenum pname,
+                                                      GLsizei bufSize,
+                                                      GLsizei *length,
+                                                      GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetSamplerParameterIivOES(Context *context,
+                                          GLuint sampler,
+                                          GLenum pname,
+                                          GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetSamplerParameterIivRobustANGLE(Context *context,
+                                                  GLuint sampler,
+                                                  GLenum pname,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetSamplerParameterIuivOES(Context *context,
+                                           GLuint sampler,
+                                           GLenum pname,
+                                           GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetSamplerParameterIuivRobustANGLE(Context *context,
+                                                   GLuint sampler,
+                                                   GLenum pname,
+                                                   GLsizei bufSize,
+                                                   GLsizei *length,
+                                                   GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetSamplerParameterfv(Context *context,
+                                      GLuint sampler,
+                                      GLenum pname,
+                                      GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetSamplerParameterfvRobustANGLE(Context *context,
+                                                 GLuint sampler,
+                                                 GLenum pname,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetSamplerParameteriv(Context *context, GLuint sampler, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetSamplerParameterivRobustANGLE(Context *context,
+                                                 GLuint sampler,
+                                                 GLenum pname,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetSemaphoreParameterui64vEXT(Context *context,
+                                              GLuint semaphore,
+                                              GLenum pname,
+                                              GLuint64 *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetShaderInfoLog(Context *context,
+                                 GLuint shader,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLchar *infoLog)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetShaderPrecisionFormat(Context *context,
+                                         GLenum shadertype,
+                                         GLenum precisiontype,
+                                         GLint *range,
+                                         GLint *precision)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetShaderSource(Context *context,
+                                GLuint shader,
+                                GLsizei bufSize,
+                                GLsizei *length,
+                                GLchar *source)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetShaderiv(Context *context, GLuint shader, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetShaderivRobustANGLE(Context *context,
+                                       GLuint shader,
+                                       GLenum pname,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+const GLubyte *ContextLostGetString(Context *context, GLenum name)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetString, const GLubyte *>();
+}
+
+const GLubyte *ContextLostGetStringi(Context *context, GLenum name, GLuint index)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetStringi, const GLubyte *>();
+}
+
+void ContextLostGetSynciv(Context *context,
+                          GLsync sync,
+                          GLenum pname,
+                          GLsizei bufSize,
+                          GLsizei *length,
+                          GLint *values)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexEnvfv(Context *context, GLenum target, GLenum pname, GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexEnviv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexEnvxv(Context *context, GLenum target, GLenum pname, GLfixed *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexGenfvOES(Context *context, GLenum coord, GLenum pname, GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexGenivOES(Context *context, GLenum coord, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexGenxvOES(Context *context, GLenum coord, GLenum pname, GLfixed *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexLevelParameterfv(Context *context,
+                                       GLenum target,
+                                       GLint level,
+                                       GLenum pname,
+                                       GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexLevelParameterfvANGLE(Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum pname,
+                                            GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexLevelParameterfvRobustANGLE(Context *context,
+                                                  GLenum target,
+                                                  GLint level,
+                                                  GLenum pname,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexLevelParameteriv(Context *context,
+                                       GLenum target,
+                                       GLint level,
+                                       GLenum pname,
+                                       GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexLevelParameterivANGLE(Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum pname,
+                                            GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexLevelParameterivRobustANGLE(Context *context,
+                                                  GLenum target,
+                                                  GLint level,
+                                                  GLenum pname,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexParameterIivOES(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexParameterIivRobustANGLE(Context *context,
+                                              GLenum target,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexParameterIuivOES(Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexParameterIuivRobustANGLE(Context *context,
+                                               GLenum target,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexParameterfv(Context *context, GLenum target, GLenum pname, GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexParameterfvRobustANGLE(Context *context,
+                                             GLenum target,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexParameteriv(Context *context, GLenum target, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexParameterivRobustANGLE(Context *context,
+                                             GLenum target,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTexParameterxv(Context *context, GLenum target, GLenum pname, GLfixed *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTransformFeedbackVarying(Context *context,
+                                            GLuint program,
+                                            GLuint index,
+                                            GLsizei bufSize,
+                                            GLsizei *length,
+                                            GLsizei *size,
+                                            GLenum *type,
+                                            GLchar *name)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetTranslatedShaderSourceANGLE(Context *context,
+                                               GLuint shader,
+                                               GLsizei bufsize,
+                                               GLsizei *length,
+                                               GLchar *source)
+{
+    GenerateContextLostError(context);
+}
+
+GLuint ContextLostGetUniformBlockIndex(Context *context,
+                                       GLuint program,
+                                       const GLchar *uniformBlockName)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetUniformBlockIndex, GLuint>();
+}
+
+void ContextLostGetUniformIndices(Context *context,
+                                  GLuint program,
+                                  GLsizei uniformCount,
+                                  const GLchar *const *uniformNames,
+                                  GLuint *uniformIndices)
+{
+    GenerateContextLostError(context);
+}
+
+GLint ContextLostGetUniformLocation(Context *context, GLuint program, const GLchar *name)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::GetUniformLocation, GLint>();
+}
+
+void ContextLostGetUniformfv(Context *context, GLuint program, GLint location, GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetUniformfvRobustANGLE(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetUniformiv(Context *context, GLuint program, GLint location, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetUniformivRobustANGLE(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetUniformuiv(Context *context, GLuint program, GLint location, GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetUniformuivRobustANGLE(Context *context,
+                                         GLuint program,
+                                         GLint location,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetUnsignedBytei_vEXT(Context *context, GLenum target, GLuint index, GLubyte *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetUnsignedBytevEXT(Context *context, GLenum pname, GLubyte *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetVertexAttribIiv(Context *context, GLuint index, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetVertexAttribIivRobustANGLE(Context *context,
+                                              GLuint index,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetVertexAttribIuiv(Context *context, GLuint index, GLenum pname, GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetVertexAttribIuivRobustANGLE(Context *context,
+                                               GLuint index,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetVertexAttribPointerv(Context *context,
+                                        GLuint index,
+                                        GLenum pname,
+                                        void **pointer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetVertexAttribPointervRobustANGLE(Context *context,
+                                                   GLuint index,
+                                                   GLenum pname,
+                                                   GLsizei bufSize,
+                                                   GLsizei *length,
+                                                   void **pointer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetVertexAttribfv(Context *context, GLuint index, GLenum pname, GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetVertexAttribfvRobustANGLE(Context *context,
+                                             GLuint index,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetVertexAttribiv(Context *context, GLuint index, GLenum pname, GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetVertexAttribivRobustANGLE(Context *context,
+                                             GLuint index,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetnUniformfvEXT(Context *context,
+                                 GLuint program,
+                                 GLint location,
+                                 GLsizei bufSize,
+                                 GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetnUniformfvRobustANGLE(Context *context,
+                                         GLuint program,
+                                         GLint location,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetnUniformivEXT(Context *context,
+                                 GLuint program,
+                                 GLint location,
+                                 GLsizei bufSize,
+                                 GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetnUniformivRobustANGLE(Context *context,
+                                         GLuint program,
+                                         GLint location,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostGetnUniformuivRobustANGLE(Context *context,
+                                          GLuint program,
+                                          GLint location,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostHint(Context *context, GLenum target, GLenum mode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostImportMemoryFdEXT(Context *context,
+                                  GLuint memory,
+                                  GLuint64 size,
+                                  GLenum handleType,
+                                  GLint fd)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostImportSemaphoreFdEXT(Context *context,
+                                     GLuint semaphore,
+                                     GLenum handleType,
+                                     GLint fd)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostInsertEventMarkerEXT(Context *context, GLsizei length, const GLchar *marker)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostInvalidateFramebuffer(Context *context,
+                                      GLenum target,
+                                      GLsizei numAttachments,
+                                      const GLenum *attachments)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostInvalidateSubFramebuffer(Context *context,
+                                         GLenum target,
+                                         GLsizei numAttachments,
+                                         const GLenum *attachments,
+                                         GLint x,
+                                         GLint y,
+                                         GLsizei width,
+                                         GLsizei height)
+{
+    GenerateContextLostError(context);
+}
+
+GLboolean ContextLostIsBuffer(Context *context, GLuint buffer)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsBuffer, GLboolean>();
+}
+
+GLboolean ContextLostIsEnabled(Context *context, GLenum cap)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsEnabled, GLboolean>();
+}
+
+GLboolean ContextLostIsFenceNV(Context *context, GLuint fence)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsFenceNV, GLboolean>();
+}
+
+GLboolean ContextLostIsFramebuffer(Context *context, GLuint framebuffer)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsFramebuffer, GLboolean>();
+}
+
+GLboolean ContextLostIsFramebufferOES(Context *context, GLuint framebuffer)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsFramebufferOES, GLboolean>();
+}
+
+GLboolean ContextLostIsMemoryObjectEXT(Context *context, GLuint memoryObject)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsMemoryObjectEXT, GLboolean>();
+}
+
+GLboolean ContextLostIsPathCHROMIUM(Context *context, GLuint path)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsPathCHROMIUM, GLboolean>();
+}
+
+GLboolean ContextLostIsProgram(Context *context, GLuint program)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsProgram, GLboolean>();
+}
+
+GLboolean ContextLostIsProgramPipeline(Context *context, GLuint pipeline)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsProgramPipeline, GLboolean>();
+}
+
+GLboolean ContextLostIsQuery(Context *context, GLuint id)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsQuery, GLboolean>();
+}
+
+GLboolean ContextLostIsQueryEXT(Context *context, GLuint id)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsQueryEXT, GLboolean>();
+}
+
+GLboolean ContextLostIsRenderbuffer(Context *context, GLuint renderbuffer)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsRenderbuffer, GLboolean>();
+}
+
+GLboolean ContextLostIsRenderbufferOES(Context *context, GLuint renderbuffer)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsRenderbufferOES, GLboolean>();
+}
+
+GLboolean ContextLostIsSampler(Context *context, GLuint sampler)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsSampler, GLboolean>();
+}
+
+GLboolean ContextLostIsSemaphoreEXT(Context *context, GLuint semaphore)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsSemaphoreEXT, GLboolean>();
+}
+
+GLboolean ContextLostIsShader(Context *context, GLuint shader)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsShader, GLboolean>();
+}
+
+GLboolean ContextLostIsSync(Context *context, GLsync sync)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsSync, GLboolean>();
+}
+
+GLboolean ContextLostIsTexture(Context *context, GLuint texture)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsTexture, GLboolean>();
+}
+
+GLboolean ContextLostIsTransformFeedback(Context *context, GLuint id)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsTransformFeedback, GLboolean>();
+}
+
+GLboolean ContextLostIsVertexArray(Context *context, GLuint array)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsVertexArray, GLboolean>();
+}
+
+GLboolean ContextLostIsVertexArrayOES(Context *context, GLuint array)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::IsVertexArrayOES, GLboolean>();
+}
+
+void ContextLostLightModelf(Context *context, GLenum pname, GLfloat param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLightModelfv(Context *context, GLenum pname, const GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLightModelx(Context *context, GLenum pname, GLfixed param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLightModelxv(Context *context, GLenum pname, const GLfixed *param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLightf(Context *context, GLenum light, GLenum pname, GLfloat param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLightfv(Context *context, GLenum light, GLenum pname, const GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLightx(Context *context, GLenum light, GLenum pname, GLfixed param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLightxv(Context *context, GLenum light, GLenum pname, const GLfixed *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLineWidth(Context *context, GLfloat width)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLineWidthx(Context *context, GLfixed width)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLinkProgram(Context *context, GLuint program)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLoadIdentity(Context *context)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLoadMatrixf(Context *context, const GLfloat *m)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLoadMatrixx(Context *context, const GLfixed *m)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLoadPaletteFromModelViewMatrixOES(Context *context)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLogicOp(Context *context, GLenum opcode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostLoseContextCHROMIUM(Context *context, GLenum current, GLenum other)
+{
+    GenerateContextLostError(context);
+}
+
+void *ContextLostMapBufferOES(Context *context, GLenum target, GLenum access)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::MapBufferOES, void *>();
+}
+
+void *ContextLostMapBufferRange(Context *context,
+                                GLenum target,
+                                GLintptr offset,
+                                GLsizeiptr length,
+                                GLbitfield access)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::MapBufferRange, void *>();
+}
+
+void *ContextLostMapBufferRangeEXT(Context *context,
+                                   GLenum target,
+                                   GLintptr offset,
+                                   GLsizeiptr length,
+                                   GLbitfield access)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::MapBufferRangeEXT, void *>();
+}
+
+void ContextLostMaterialf(Context *context, GLenum face, GLenum pname, GLfloat param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMaterialfv(Context *context, GLenum face, GLenum pname, const GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMaterialx(Context *context, GLenum face, GLenum pname, GLfixed param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMaterialxv(Context *context, GLenum face, GLenum pname, const GLfixed *param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMatrixIndexPointerOES(Context *context,
+                                      GLint size,
+                                      GLenum type,
+                                      GLsizei stride,
+                                      const void *pointer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMatrixLoadIdentityCHROMIUM(Context *context, GLenum matrixMode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMatrixLoadfCHROMIUM(Context *context, GLenum matrixMode, const GLfloat *matrix)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMatrixMode(Context *context, GLenum mode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMaxShaderCompilerThreadsKHR(Context *context, GLuint count)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMemoryBarrier(Context *context, GLbitfield barriers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMemoryBarrierByRegion(Context *context, GLbitfield barriers)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMemoryObjectParameterivEXT(Context *context,
+                                           GLuint memoryObject,
+                                           GLenum pname,
+                                           const GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMultMatrixf(Context *context, const GLfloat *m)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMultMatrixx(Context *context, const GLfixed *m)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMultiDrawArraysANGLE(Context *context,
+                                     GLenum mode,
+                                     const GLint *firsts,
+                                     const GLsizei *counts,
+                                     GLsizei drawcount)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMultiDrawArraysInstancedANGLE(Context *context,
+                                              GLenum mode,
+                                              const GLint *firsts,
+                                              const GLsizei *counts,
+                                              const GLsizei *instanceCounts,
+                                              GLsizei drawcount)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMultiDrawElementsANGLE(Context *context,
+                                       GLenum mode,
+                                       const GLsizei *counts,
+                                       GLenum type,
+                                       const GLvoid *const *indices,
+                                       GLsizei drawcount)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMultiDrawElementsInstancedANGLE(Context *context,
+                                                GLenum mode,
+                                                const GLsizei *counts,
+                                                GLenum type,
+                                                const GLvoid *const *indices,
+                                                const GLsizei *instanceCounts,
+                                                GLsizei drawcount)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMultiTexCoord4f(Context *context,
+                                GLenum target,
+                                GLfloat s,
+                                GLfloat t,
+                                GLfloat r,
+                                GLfloat q)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostMultiTexCoord4x(Context *context,
+                                GLenum texture,
+                                GLfixed s,
+                                GLfixed t,
+                                GLfixed r,
+                                GLfixed q)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostNormal3f(Context *context, GLfloat nx, GLfloat ny, GLfloat nz)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostNormal3x(Context *context, GLfixed nx, GLfixed ny, GLfixed nz)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostNormalPointer(Context *context, GLenum type, GLsizei stride, const void *pointer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostObjectLabelKHR(Context *context,
+                               GLenum identifier,
+                               GLuint name,
+                               GLsizei length,
+                               const GLchar *label)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostObjectPtrLabelKHR(Context *context,
+                                  const void *ptr,
+                                  GLsizei length,
+                                  const GLchar *label)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostOrthof(Context *context,
+                       GLfloat l,
+                       GLfloat r,
+                       GLfloat b,
+                       GLfloat t,
+                       GLfloat n,
+                       GLfloat f)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostOrthox(Context *context,
+                       GLfixed l,
+                       GLfixed r,
+                       GLfixed b,
+                       GLfixed t,
+                       GLfixed n,
+                       GLfixed f)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPathCommandsCHROMIUM(Context *context,
+                                     GLuint path,
+                                     GLsizei numCommands,
+                                     const GLubyte *commands,
+                                     GLsizei numCoords,
+                                     GLenum coordType,
+                                     const void *coords)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPathParameterfCHROMIUM(Context *context, GLuint path, GLenum pname, GLfloat value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPathParameteriCHROMIUM(Context *context, GLuint path, GLenum pname, GLint value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPathStencilFuncCHROMIUM(Context *context, GLenum func, GLint ref, GLuint mask)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPauseTransformFeedback(Context *context)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPixelStorei(Context *context, GLenum pname, GLint param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPointParameterf(Context *context, GLenum pname, GLfloat param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPointParameterfv(Context *context, GLenum pname, const GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPointParameterx(Context *context, GLenum pname, GLfixed param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPointParameterxv(Context *context, GLenum pname, const GLfixed *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPointSize(Context *context, GLfloat size)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPointSizePointerOES(Context *context,
+                                    GLenum type,
+                                    GLsizei stride,
+                                    const void *pointer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPointSizex(Context *context, GLfixed size)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPolygonOffset(Context *context, GLfloat factor, GLfloat units)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPolygonOffsetx(Context *context, GLfixed factor, GLfixed units)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPopDebugGroupKHR(Context *context)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPopGroupMarkerEXT(Context *context)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPopMatrix(Context *context)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramBinary(Context *context,
+                              GLuint program,
+                              GLenum binaryFormat,
+                              const void *binary,
+                              GLsizei length)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramBinaryOES(Context *context,
+                                 GLuint program,
+                                 GLenum binaryFormat,
+                                 const void *binary,
+                                 GLint length)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramParameteri(Context *context, GLuint program, GLenum pname, GLint value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramPathFragmentInputGenCHROMIUM(Context *context,
+                                                    GLuint program,
+                                                    GLint location,
+                                                    GLenum genMode,
+                                                    GLint components,
+                                                    const GLfloat *coeffs)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform1f(Context *context, GLuint program, GLint location, GLfloat v0)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform1fv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform1i(Context *context, GLuint program, GLint location, GLint v0)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform1iv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  const GLint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform1ui(Context *context, GLuint program, GLint location, GLuint v0)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform1uiv(Context *context,
+                                   GLuint program,
+                                   GLint location,
+                                   GLsizei count,
+                                   const GLuint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform2f(Context *context,
+                                 GLuint program,
+                                 GLint location,
+                                 GLfloat v0,
+                                 GLfloat v1)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform2fv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform2i(Context *context,
+                                 GLuint program,
+                                 GLint location,
+                                 GLint v0,
+                                 GLint v1)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform2iv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  const GLint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform2ui(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLuint v0,
+                                  GLuint v1)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform2uiv(Context *context,
+                                   GLuint program,
+                                   GLint location,
+                                   GLsizei count,
+                                   const GLuint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform3f(Context *context,
+                                 GLuint program,
+                                 GLint location,
+                                 GLfloat v0,
+                                 GLfloat v1,
+                                 GLfloat v2)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform3fv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform3i(Context *context,
+                                 GLuint program,
+                                 GLint location,
+                                 GLint v0,
+                                 GLint v1,
+                                 GLint v2)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform3iv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  const GLint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform3ui(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLuint v0,
+                                  GLuint v1,
+                                  GLuint v2)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform3uiv(Context *context,
+                                   GLuint program,
+                                   GLint location,
+                                   GLsizei count,
+                                   const GLuint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform4f(Context *context,
+                                 GLuint program,
+                                 GLint location,
+                                 GLfloat v0,
+                                 GLfloat v1,
+                                 GLfloat v2,
+                                 GLfloat v3)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform4fv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform4i(Context *context,
+                                 GLuint program,
+                                 GLint location,
+                                 GLint v0,
+                                 GLint v1,
+                                 GLint v2,
+                                 GLint v3)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform4iv(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLsizei count,
+                                  const GLint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform4ui(Context *context,
+                                  GLuint program,
+                                  GLint location,
+                                  GLuint v0,
+                                  GLuint v1,
+                                  GLuint v2,
+                                  GLuint v3)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniform4uiv(Context *context,
+                                   GLuint program,
+                                   GLint location,
+                                   GLsizei count,
+                                   const GLuint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniformMatrix2fv(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        GLsizei count,
+                                        GLboolean transpose,
+                                        const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniformMatrix2x3fv(Context *context,
+                                          GLuint program,
+                                          GLint location,
+                                          GLsizei count,
+                                          GLboolean transpose,
+                                          const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniformMatrix2x4fv(Context *context,
+                                          GLuint program,
+                                          GLint location,
+                                          GLsizei count,
+                                          GLboolean transpose,
+                                          const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniformMatrix3fv(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        GLsizei count,
+                                        GLboolean transpose,
+                                        const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniformMatrix3x2fv(Context *context,
+                                          GLuint program,
+                                          GLint location,
+                                          GLsizei count,
+                                          GLboolean transpose,
+                                          const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniformMatrix3x4fv(Context *context,
+                                          GLuint program,
+                                          GLint location,
+                                          GLsizei count,
+                                          GLboolean transpose,
+                                          const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniformMatrix4fv(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        GLsizei count,
+                                        GLboolean transpose,
+                                        const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniformMatrix4x2fv(Context *context,
+                                          GLuint program,
+                                          GLint location,
+                                          GLsizei count,
+                                          GLboolean transpose,
+                                          const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProgramUniformMatrix4x3fv(Context *context,
+                                          GLuint program,
+                                          GLint location,
+                                          GLsizei count,
+                                          GLboolean transpose,
+                                          const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostProvokingVertexANGLE(Context *context, GLenum mode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPushDebugGroupKHR(Context *context,
+                                  GLenum source,
+                                  GLuint id,
+                                  GLsizei length,
+                                  const GLchar *message)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPushGroupMarkerEXT(Context *context, GLsizei length, const GLchar *marker)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostPushMatrix(Context *context)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostQueryCounterEXT(Context *context, GLuint id, GLenum target)
+{
+    GenerateContextLostError(context);
+}
+
+GLbitfield ContextLostQueryMatrixxOES(Context *context, GLfixed *mantissa, GLint *exponent)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::QueryMatrixxOES, GLbitfield>();
+}
+
+void ContextLostReadBuffer(Context *context, GLenum src)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostReadPixels(Context *context,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLenum format,
+                           GLenum type,
+                           void *pixels)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostReadPixelsRobustANGLE(Context *context,
+                                      GLint x,
+                                      GLint y,
+                                      GLsizei width,
+                                      GLsizei height,
+                                      GLenum format,
+                                      GLenum type,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLsizei *columns,
+                                      GLsizei *rows,
+                                      void *pixels)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostReadnPixelsEXT(Context *context,
+                               GLint x,
+                               GLint y,
+                               GLsizei width,
+                               GLsizei height,
+                               GLenum format,
+                               GLenum type,
+                               GLsizei bufSize,
+                               void *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostReadnPixelsRobustANGLE(Context *context,
+                                       GLint x,
+                                       GLint y,
+                                       GLsizei width,
+                                       GLsizei height,
+                                       GLenum format,
+                                       GLenum type,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLsizei *columns,
+                                       GLsizei *rows,
+                                       void *data)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostReleaseShaderCompiler(Context *context)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostRenderbufferStorage(Context *context,
+                                    GLenum target,
+                                    GLenum internalformat,
+                                    GLsizei width,
+                                    GLsizei height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostRenderbufferStorageMultisample(Context *context,
+                                               GLenum target,
+                                               GLsizei samples,
+                                               GLenum internalformat,
+                                               GLsizei width,
+                                               GLsizei height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostRenderbufferStorageMultisampleANGLE(Context *context,
+                                                    GLenum target,
+                                                    GLsizei samples,
+                                                    GLenum internalformat,
+                                                    GLsizei width,
+                                                    GLsizei height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostRenderbufferStorageOES(Context *context,
+                                       GLenum target,
+                                       GLenum internalformat,
+                                       GLsizei width,
+                                       GLsizei height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostRequestExtensionANGLE(Context *context, const GLchar *name)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostResumeTransformFeedback(Context *context)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostRotatef(Context *context, GLfloat angle, GLfloat x, GLfloat y, GLfloat z)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostRotatex(Context *context, GLfixed angle, GLfixed x, GLfixed y, GLfixed z)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSampleCoverage(Context *context, GLfloat value, GLboolean invert)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSampleCoveragex(Context *context, GLclampx value, GLboolean invert)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSampleMaski(Context *context, GLuint maskNumber, GLbitfield mask)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSampleMaskiANGLE(Context *context, GLuint maskNumber, GLbitfield mask)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSamplerParameterIivOES(Context *context,
+                                       GLuint sampler,
+                                       GLenum pname,
+                                       const GLint *param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSamplerParameterIivRobustANGLE(Context *context,
+                                               GLuint sampler,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               const GLint *param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSamplerParameterIuivOES(Context *context,
+                                        GLuint sampler,
+                                        GLenum pname,
+                                        const GLuint *param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSamplerParameterIuivRobustANGLE(Context *context,
+                                                GLuint sampler,
+                                                GLenum pname,
+                                                GLsizei bufSize,
+                                                const GLuint *param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSamplerParameterf(Context *context, GLuint sampler, GLenum pname, GLfloat param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSamplerParameterfv(Context *context,
+                                   GLuint sampler,
+                                   GLenum pname,
+                                   const GLfloat *param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSamplerParameterfvRobustANGLE(Context *context,
+                                              GLuint sampler,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              const GLfloat *param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSamplerParameteri(Context *context, GLuint sampler, GLenum pname, GLint param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSamplerParameteriv(Context *context,
+                                   GLuint sampler,
+                                   GLenum pname,
+                                   const GLint *param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSamplerParameterivRobustANGLE(Context *context,
+                                              GLuint sampler,
+                                              GLuint pname,
+                                              GLsizei bufSize,
+                                              const GLint *param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostScalef(Context *context, GLfloat x, GLfloat y, GLfloat z)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostScalex(Context *context, GLfixed x, GLfixed y, GLfixed z)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostScissor(Context *context, GLint x, GLint y, GLsizei width, GLsizei height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSemaphoreParameterui64vEXT(Context *context,
+                                           GLuint semaphore,
+                                           GLenum pname,
+                                           const GLuint64 *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSetFenceNV(Context *context, GLuint fence, GLenum condition)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostShadeModel(Context *context, GLenum mode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostShaderBinary(Context *context,
+                             GLsizei count,
+                             const GLuint *shaders,
+                             GLenum binaryformat,
+                             const void *binary,
+                             GLsizei length)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostShaderSource(Context *context,
+                             GLuint shader,
+                             GLsizei count,
+                             const GLchar *const *string,
+                             const GLint *length)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostSignalSemaphoreEXT(Context *context,
+                                   GLuint semaphore,
+                                   GLuint numBufferBarriers,
+                                   const GLuint *buffers,
+                                   GLuint numTextureBarriers,
+                                   const GLuint *textures,
+                                   const GLenum *dstLayouts)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilFillPathCHROMIUM(Context *context, GLuint path, GLenum fillMode, GLuint mask)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilFillPathInstancedCHROMIUM(Context *context,
+                                                 GLsizei numPaths,
+                                                 GLenum pathNameType,
+                                                 const void *paths,
+                                                 GLuint pathBase,
+                                                 GLenum fillMode,
+                                                 GLuint mask,
+                                                 GLenum transformType,
+                                                 const GLfloat *transformValues)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilFunc(Context *context, GLenum func, GLint ref, GLuint mask)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilFuncSeparate(Context *context,
+                                    GLenum face,
+                                    GLenum func,
+                                    GLint ref,
+                                    GLuint mask)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilMask(Context *context, GLuint mask)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilMaskSeparate(Context *context, GLenum face, GLuint mask)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilOp(Context *context, GLenum fail, GLenum zfail, GLenum zpass)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilOpSeparate(Context *context,
+                                  GLenum face,
+                                  GLenum sfail,
+                                  GLenum dpfail,
+                                  GLenum dppass)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilStrokePathCHROMIUM(Context *context,
+                                          GLuint path,
+                                          GLint reference,
+                                          GLuint mask)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilStrokePathInstancedCHROMIUM(Context *context,
+                                                   GLsizei numPath,
+                                                   GLenum pathNameType,
+                                                   const void *paths,
+                                                   GLuint pathBase,
+                                                   GLint reference,
+                                                   GLuint mask,
+                                                   GLenum transformType,
+                                                   const GLfloat *transformValues)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilThenCoverFillPathCHROMIUM(Context *context,
+                                                 GLuint path,
+                                                 GLenum fillMode,
+                                                 GLuint mask,
+                                                 GLenum coverMode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilThenCoverFillPathInstancedCHROMIUM(Context *context,
+                                                          GLsizei numPaths,
+                                                          GLenum pathNameType,
+                                                          const void *paths,
+                                                          GLuint pathBase,
+                                                          GLenum fillMode,
+                                                          GLuint mask,
+                                                          GLenum coverMode,
+                                                          GLenum transformType,
+                                                          const GLfloat *transformValues)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilThenCoverStrokePathCHROMIUM(Context *context,
+                                                   GLuint path,
+                                                   GLint reference,
+                                                   GLuint mask,
+                                                   GLenum coverMode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostStencilThenCoverStrokePathInstancedCHROMIUM(Context *context,
+                                                            GLsizei numPaths,
+                                                            GLenum pathNameType,
+                                                            const void *paths,
+                                                            GLuint pathBase,
+                                                            GLint reference,
+                                                            GLuint mask,
+                                                            GLenum coverMode,
+                                                            GLenum transformType,
+                                                            const GLfloat *transformValues)
+{
+    GenerateContextLostError(context);
+}
+
+GLboolean ContextLostTestFenceNV(Context *context, GLuint fence)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::TestFenceNV, GLboolean>();
+}
+
+void ContextLostTexCoordPointer(Context *context,
+                                GLint size,
+                                GLenum type,
+                                GLsizei stride,
+                                const void *pointer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexEnvf(Context *context, GLenum target, GLenum pname, GLfloat param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexEnvfv(Context *context, GLenum target, GLenum pname, const GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexEnvi(Context *context, GLenum target, GLenum pname, GLint param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexEnviv(Context *context, GLenum target, GLenum pname, const GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexEnvx(Context *context, GLenum target, GLenum pname, GLfixed param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexEnvxv(Context *context, GLenum target, GLenum pname, const GLfixed *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexGenfOES(Context *context, GLenum coord, GLenum pname, GLfloat param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexGenfvOES(Context *context, GLenum coord, GLenum pname, const GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexGeniOES(Context *context, GLenum coord, GLenum pname, GLint param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexGenivOES(Context *context, GLenum coord, GLenum pname, const GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexGenxOES(Context *context, GLenum coord, GLenum pname, GLfixed param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexGenxvOES(Context *context, GLenum coord, GLenum pname, const GLfixed *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexImage2D(Context *context,
+                           GLenum target,
+                           GLint level,
+                           GLint internalformat,
+                           GLsizei width,
+                           GLsizei height,
+                           GLint border,
+                           GLenum format,
+                           GLenum type,
+                           const void *pixels)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexImage2DRobustANGLE(Context *context,
+                                      GLenum target,
+                                      GLint level,
+                                      GLint internalformat,
+                                      GLsizei width,
+                                      GLsizei height,
+                                      GLint border,
+                                      GLenum format,
+                                      GLenum type,
+                                      GLsizei bufSize,
+                                      const void *pixels)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexImage3D(Context *context,
+                           GLenum target,
+                           GLint level,
+                           GLint internalformat,
+                           GLsizei width,
+                           GLsizei height,
+                           GLsizei depth,
+                           GLint border,
+                           GLenum format,
+                           GLenum type,
+                           const void *pixels)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexImage3DRobustANGLE(Context *context,
+                                      GLenum target,
+                                      GLint level,
+                                      GLint internalformat,
+                                      GLsizei width,
+                                      GLsizei height,
+                                      GLsizei depth,
+                                      GLint border,
+                                      GLenum format,
+                                      GLenum type,
+                                      GLsizei bufSize,
+                                      const void *pixels)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexParameterIivOES(Context *context,
+                                   GLenum target,
+                                   GLenum pname,
+                                   const GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexParameterIivRobustANGLE(Context *context,
+                                           GLenum target,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           const GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexParameterIuivOES(Context *context,
+                                    GLenum target,
+                                    GLenum pname,
+                                    const GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexParameterIuivRobustANGLE(Context *context,
+                                            GLenum target,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            const GLuint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexParameterf(Context *context, GLenum target, GLenum pname, GLfloat param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexParameterfv(Context *context, GLenum target, GLenum pname, const GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexParameterfvRobustANGLE(Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          const GLfloat *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexParameteri(Context *context, GLenum target, GLenum pname, GLint param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexParameteriv(Context *context, GLenum target, GLenum pname, const GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexParameterivRobustANGLE(Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          const GLint *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexParameterx(Context *context, GLenum target, GLenum pname, GLfixed param)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexParameterxv(Context *context, GLenum target, GLenum pname, const GLfixed *params)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexStorage1DEXT(Context *context,
+                                GLenum target,
+                                GLsizei levels,
+                                GLenum internalformat,
+                                GLsizei width)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexStorage2D(Context *context,
+                             GLenum target,
+                             GLsizei levels,
+                             GLenum internalformat,
+                             GLsizei width,
+                             GLsizei height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexStorage2DEXT(Context *context,
+                                GLenum target,
+                                GLsizei levels,
+                                GLenum internalformat,
+                                GLsizei width,
+                                GLsizei height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexStorage2DMultisample(Context *context,
+                                        GLenum target,
+                                        GLsizei samples,
+                                        GLenum internalformat,
+                                        GLsizei width,
+                                        GLsizei height,
+                                        GLboolean fixedsamplelocations)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexStorage2DMultisampleANGLE(Context *context,
+                                             GLenum target,
+                                             GLsizei samples,
+                                             GLenum internalformat,
+                                             GLsizei width,
+                                             GLsizei height,
+                                             GLboolean fixedsamplelocations)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexStorage3D(Context *context,
+                             GLenum target,
+                             GLsizei levels,
+                             GLenum internalformat,
+                             GLsizei width,
+                             GLsizei height,
+                             GLsizei depth)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexStorage3DEXT(Context *context,
+                                GLenum target,
+                                GLsizei levels,
+                                GLenum internalformat,
+                                GLsizei width,
+                                GLsizei height,
+                                GLsizei depth)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexStorage3DMultisampleOES(Context *context,
+                                           GLenum target,
+                                           GLsizei samples,
+                                           GLenum internalformat,
+                                           GLsizei width,
+                                           GLsizei height,
+                                           GLsizei depth,
+                                           GLboolean fixedsamplelocations)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexStorageMem2DEXT(Context *context,
+                                   GLenum target,
+                                   GLsizei levels,
+                                   GLenum internalFormat,
+                                   GLsizei width,
+                                   GLsizei height,
+                                   GLuint memory,
+                                   GLuint64 offset)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexStorageMem2DMultisampleEXT(Context *context,
+                                              GLenum target,
+                                              GLsizei samples,
+                                              GLenum internalFormat,
+                                              GLsizei width,
+                                              GLsizei height,
+                                              GLboolean fixedSampleLocations,
+                                              GLuint memory,
+                                              GLuint64 offset)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexStorageMem3DEXT(Context *context,
+                                   GLenum target,
+                                   GLsizei levels,
+                                   GLenum internalFormat,
+                                   GLsizei width,
+                                   GLsizei height,
+                                   GLsizei depth,
+                                   GLuint memory,
+                                   GLuint64 offset)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexStorageMem3DMultisampleEXT(Context *context,
+                                              GLenum target,
+                                              GLsizei samples,
+                                              GLenum internalFormat,
+                                              GLsizei width,
+                                              GLsizei height,
+                                              GLsizei depth,
+                                              GLboolean fixedSampleLocations,
+                                              GLuint memory,
+                                              GLuint64 offset)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexSubImage2D(Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLsizei width,
+                              GLsizei height,
+                              GLenum format,
+                              GLenum type,
+                              const void *pixels)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexSubImage2DRobustANGLE(Context *context,
+                                         GLenum target,
+                                         GLint level,
+                                         GLint xoffset,
+                                         GLint yoffset,
+                                         GLsizei width,
+                                         GLsizei height,
+                                         GLenum format,
+                                         GLenum type,
+                                         GLsizei bufSize,
+                                         const void *pixels)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexSubImage3D(Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint zoffset,
+                              GLsizei width,
+                              GLsizei height,
+                              GLsizei depth,
+                              GLenum format,
+                              GLenum type,
+                              const void *pixels)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTexSubImage3DRobustANGLE(Context *context,
+                                         GLenum target,
+                                         GLint level,
+                                         GLint xoffset,
+                                         GLint yoffset,
+                                         GLint zoffset,
+                                         GLsizei width,
+                                         GLsizei height,
+                                         GLsizei depth,
+                                         GLenum format,
+                                         GLenum type,
+                                         GLsizei bufSize,
+                                         const void *pixels)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTransformFeedbackVaryings(Context *context,
+                                          GLuint program,
+                                          GLsizei count,
+                                          const GLchar *const *varyings,
+                                          GLenum bufferMode)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTranslatef(Context *context, GLfloat x, GLfloat y, GLfloat z)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostTranslatex(Context *context, GLfixed x, GLfixed y, GLfixed z)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform1f(Context *context, GLint location, GLfloat v0)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform1fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform1i(Context *context, GLint location, GLint v0)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform1iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform1ui(Context *context, GLint location, GLuint v0)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform1uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform2f(Context *context, GLint location, GLfloat v0, GLfloat v1)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform2fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform2i(Context *context, GLint location, GLint v0, GLint v1)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform2iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform2ui(Context *context, GLint location, GLuint v0, GLuint v1)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform2uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform3f(Context *context, GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform3fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform3i(Context *context, GLint location, GLint v0, GLint v1, GLint v2)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform3iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform3ui(Context *context, GLint location, GLuint v0, GLuint v1, GLuint v2)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform3uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform4f(Context *context,
+                          GLint location,
+                          GLfloat v0,
+                          GLfloat v1,
+                          GLfloat v2,
+                          GLfloat v3)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform4fv(Context *context, GLint location, GLsizei count, const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform4i(Context *context, GLint location, GLint v0, GLint v1, GLint v2, GLint v3)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform4iv(Context *context, GLint location, GLsizei count, const GLint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform4ui(Context *context,
+                           GLint location,
+                           GLuint v0,
+                           GLuint v1,
+                           GLuint v2,
+                           GLuint v3)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniform4uiv(Context *context, GLint location, GLsizei count, const GLuint *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniformBlockBinding(Context *context,
+                                    GLuint program,
+                                    GLuint uniformBlockIndex,
+                                    GLuint uniformBlockBinding)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniformMatrix2fv(Context *context,
+                                 GLint location,
+                                 GLsizei count,
+                                 GLboolean transpose,
+                                 const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniformMatrix2x3fv(Context *context,
+                                   GLint location,
+                                   GLsizei count,
+                                   GLboolean transpose,
+                                   const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniformMatrix2x4fv(Context *context,
+                                   GLint location,
+                                   GLsizei count,
+                                   GLboolean transpose,
+                                   const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniformMatrix3fv(Context *context,
+                                 GLint location,
+                                 GLsizei count,
+                                 GLboolean transpose,
+                                 const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniformMatrix3x2fv(Context *context,
+                                   GLint location,
+                                   GLsizei count,
+                                   GLboolean transpose,
+                                   const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniformMatrix3x4fv(Context *context,
+                                   GLint location,
+                                   GLsizei count,
+                                   GLboolean transpose,
+                                   const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniformMatrix4fv(Context *context,
+                                 GLint location,
+                                 GLsizei count,
+                                 GLboolean transpose,
+                                 const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniformMatrix4x2fv(Context *context,
+                                   GLint location,
+                                   GLsizei count,
+                                   GLboolean transpose,
+                                   const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUniformMatrix4x3fv(Context *context,
+                                   GLint location,
+                                   GLsizei count,
+                                   GLboolean transpose,
+                                   const GLfloat *value)
+{
+    GenerateContextLostError(context);
+}
+
+GLboolean ContextLostUnmapBuffer(Context *context, GLenum target)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::UnmapBuffer, GLboolean>();
+}
+
+GLboolean ContextLostUnmapBufferOES(Context *context, GLenum target)
+{
+    GenerateContextLostError(context);
+    return GetDefaultReturnValue<EntryPoint::UnmapBufferOES, GLboolean>();
+}
+
+void ContextLostUseProgram(Context *context, GLuint program)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostUseProgramStages(Context *context,
+                                 GLuint pipeline,
+                                 GLbitfield stages,
+                                 GLuint program)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostValidateProgram(Context *context, GLuint program)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostValidateProgramPipeline(Context *context, GLuint pipeline)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttrib1f(Context *context, GLuint index, GLfloat x)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttrib1fv(Context *context, GLuint index, const GLfloat *v)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttrib2f(Context *context, GLuint index, GLfloat x, GLfloat y)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttrib2fv(Context *context, GLuint index, const GLfloat *v)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttrib3f(Context *context, GLuint index, GLfloat x, GLfloat y, GLfloat z)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttrib3fv(Context *context, GLuint index, const GLfloat *v)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttrib4f(Context *context,
+                               GLuint index,
+                               GLfloat x,
+                               GLfloat y,
+                               GLfloat z,
+                               GLfloat w)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttrib4fv(Context *context, GLuint index, const GLfloat *v)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttribBinding(Context *context, GLuint attribindex, GLuint bindingindex)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttribDivisor(Context *context, GLuint index, GLuint divisor)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttribDivisorANGLE(Context *context, GLuint index, GLuint divisor)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttribDivisorEXT(Context *context, GLuint index, GLuint divisor)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttribFormat(Context *context,
+                                   GLuint attribindex,
+                                   GLint size,
+                                   GLenum type,
+                                   GLboolean normalized,
+                                   GLuint relativeoffset)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttribI4i(Context *context, GLuint index, GLint x, GLint y, GLint z, GLint w)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttribI4iv(Context *context, GLuint index, const GLint *v)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttribI4ui(Context *context,
+                                 GLuint index,
+                                 GLuint x,
+                                 GLuint y,
+                                 GLuint z,
+                                 GLuint w)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttribI4uiv(Context *context, GLuint index, const GLuint *v)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttribIFormat(Context *context,
+                                    GLuint attribindex,
+                                    GLint size,
+                                    GLenum type,
+                                    GLuint relativeoffset)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttribIPointer(Context *context,
+                                     GLuint index,
+                                     GLint size,
+                                     GLenum type,
+                                     GLsizei stride,
+                                     const void *pointer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexAttribPointer(Context *context,
+                                    GLuint index,
+                                    GLint size,
+                                    GLenum type,
+                                    GLboolean normalized,
+                                    GLsizei stride,
+                                    const void *pointer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexBindingDivisor(Context *context, GLuint bindingindex, GLuint divisor)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostVertexPointer(Context *context,
+                              GLint size,
+                              GLenum type,
+                              GLsizei stride,
+                              const void *pointer)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostViewport(Context *context, GLint x, GLint y, GLsizei width, GLsizei height)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostWaitSemaphoreEXT(Context *context,
+                                 GLuint semaphore,
+                                 GLuint numBufferBarriers,
+                                 const GLuint *buffers,
+                                 GLuint numTextureBarriers,
+                                 const GLuint *textures,
+                                 const GLenum *srcLayouts)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostWaitSync(Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout)
+{
+    GenerateContextLostError(context);
+}
+
+void ContextLostWeightPointerOES(Context *context,
+                                 GLint size,
+                                 GLenum type,
+                                 GLsizei stride,
+                                 const void *pointer)
+{
+    GenerateContextLostError(context);
+}
+
+}  // anonymous namespace
+
+const DispatchTable kValidatedDispatchTable = {
+    ValidatedActiveShaderProgram,
+    ValidatedActiveTexture,
+    ValidatedAlphaFunc,
+    ValidatedAlphaFuncx,
+    ValidatedAttachShader,
+    ValidatedBeginQuery,
+    ValidatedBeginQueryEXT,
+    ValidatedBeginTransformFeedback,
+    ValidatedBindAttribLocation,
+    ValidatedBindBuffer,
+    ValidatedBindBufferBase,
+    ValidatedBindBufferRange,
+    ValidatedBindFragDataLocationEXT,
+    ValidatedBindFragDataLocationIndexedEXT,
+    ValidatedBindFragmentInputLocationCHROMIUM,
+    ValidatedBindFramebuffer,
+    ValidatedBindFramebufferOES,
+    ValidatedBindImageTexture,
+    ValidatedBindProgramPipeline,
+    ValidatedBindRenderbuffer,
+    ValidatedBindRenderbufferOES,
+    ValidatedBindSampler,
+    ValidatedBindTexture,
+    ValidatedBindTransformFeedback,
+    ValidatedBindUniformLocationCHROMIUM,
+    ValidatedBindVertexArray,
+    ValidatedBindVertexArrayOES,
+    ValidatedBindVertexBuffer,
+    ValidatedBlendColor,
+    ValidatedBlendEquation,
+    ValidatedBlendEquationSeparate,
+    ValidatedBlendFunc,
+    ValidatedBlendFuncSeparate,
+    ValidatedBlitFramebuffer,
+    ValidatedBlitFramebufferANGLE,
+    ValidatedBufferData,
+    ValidatedBufferStorageMemEXT,
+    ValidatedBufferSubData,
+    ValidatedCheckFramebufferStatus,
+    ValidatedCheckFramebufferStatusOES,
+    ValidatedClear,
+    ValidatedClearBufferfi,
+    ValidatedClearBufferfv,
+    ValidatedClearBufferiv,
+    ValidatedClearBufferuiv,
+    ValidatedClearColor,
+    ValidatedClearColorx,
+    ValidatedClearDepthf,
+    ValidatedClearDepthx,
+    ValidatedClearStencil,
+    ValidatedClientActiveTexture,
+    ValidatedClientWaitSync,
+    ValidatedClipPlanef,
+    ValidatedClipPlanex,
+    ValidatedColor4f,
+    ValidatedColor4ub,
+    ValidatedColor4x,
+    ValidatedColorMask,
+    ValidatedColorPointer,
+    ValidatedCompileShader,
+    ValidatedCompressedCopyTextureCHROMIUM,
+    ValidatedCompressedTexImage2D,
+    ValidatedCompressedTexImage2DRobustANGLE,
+    ValidatedCompressedTexImage3D,
+    ValidatedCompressedTexImage3DRobustANGLE,
+    ValidatedCompressedTexSubImage2D,
+    ValidatedCompressedTexSubImage2DRobustANGLE,
+    ValidatedCompressedTexSubImage3D,
+    ValidatedCompressedTexSubImage3DRobustANGLE,
+    ValidatedCopyBufferSubData,
+    ValidatedCopySubTexture3DANGLE,
+    ValidatedCopySubTextureCHROMIUM,
+    ValidatedCopyTexImage2D,
+    ValidatedCopyTexSubImage2D,
+    ValidatedCopyTexSubImage3D,
+    ValidatedCopyTexture3DANGLE,
+    ValidatedCopyTextureCHROMIUM,
+    ValidatedCoverFillPathCHROMIUM,
+    ValidatedCoverFillPathInstancedCHROMIUM,
+    ValidatedCoverStrokePathCHROMIUM,
+    ValidatedCoverStrokePathInstancedCHROMIUM,
+    ValidatedCoverageModulationCHROMIUM,
+    ValidatedCreateMemoryObjectsEXT,
+    ValidatedCreateProgram,
+    ValidatedCreateShader,
+    ValidatedCreateShaderProgramv,
+    ValidatedCullFace,
+    ValidatedCurrentPaletteMatrixOES,
+    ValidatedDebugMessageCallbackKHR,
+    ValidatedDebugMessageControlKHR,
+    ValidatedDebugMessageInsertKHR,
+    ValidatedDeleteBuffers,
+    ValidatedDeleteFencesNV,
+    ValidatedDeleteFramebuffers,
+    ValidatedDeleteFramebuffersOES,
+    ValidatedDeleteMemoryObjectsEXT,
+    ValidatedDeletePathsCHROMIUM,
+    ValidatedDeleteProgram,
+    ValidatedDeleteProgramPipelines,
+    ValidatedDeleteQueries,
+    ValidatedDeleteQueriesEXT,
+    ValidatedDeleteRenderbuffers,
+    ValidatedDeleteRenderbuffersOES,
+    ValidatedDeleteSamplers,
+    ValidatedDeleteSemaphoresEXT,
+    ValidatedDeleteShader,
+    ValidatedDeleteSync,
+    ValidatedDeleteTextures,
+    ValidatedDeleteTransformFeedbacks,
+    ValidatedDeleteVertexArrays,
+    ValidatedDeleteVertexArraysOES,
+    ValidatedDepthFunc,
+    ValidatedDepthMask,
+    ValidatedDepthRangef,
+    ValidatedDepthRangex,
+    ValidatedDetachShader,
+    ValidatedDisable,
+    ValidatedDisableClientState,
+    ValidatedDisableVertexAttribArray,
+    ValidatedDiscardFramebufferEXT,
+    ValidatedDispatchCompute,
+    ValidatedDispatchComputeIndirect,
+    ValidatedDrawArrays,
+    ValidatedDrawArraysIndirect,
+    ValidatedDrawArraysInstanced,
+    ValidatedDrawArraysInstancedANGLE,
+    ValidatedDrawArraysInstancedEXT,
+    ValidatedDrawBuffers,
+    ValidatedDrawBuffersEXT,
+    ValidatedDrawElements,
+    ValidatedDrawElementsIndirect,
+    ValidatedDrawElementsInstanced,
+    ValidatedDrawElementsInstancedANGLE,
+    ValidatedDrawElementsInstancedEXT,
+    ValidatedDrawRangeElements,
+    ValidatedDrawTexfOES,
+    ValidatedDrawTexfvOES,
+    ValidatedDrawTexiOES,
+    ValidatedDrawTexivOES,
+    ValidatedDrawTexsOES,
+    ValidatedDrawTexsvOES,
+    ValidatedDrawTexxOES,
+    ValidatedDrawTexxvOES,
+    ValidatedEGLImageTargetRenderbufferStorageOES,
+    ValidatedEGLImageTargetTexture2DOES,
+    ValidatedEnable,
+    ValidatedEnableClientState,
+    ValidatedEnableVertexAttribArray,
+    ValidatedEndQuery,
+    ValidatedEndQueryEXT,
+    ValidatedEndTransformFeedback,
+    ValidatedFenceSync,
+    ValidatedFinish,
+    ValidatedFinishFenceNV,
+    ValidatedFlush,
+    ValidatedFlushMappedBufferRange,
+    ValidatedFlushMappedBufferRangeEXT,
+    ValidatedFogf,
+    ValidatedFogfv,
+    ValidatedFogx,
+    ValidatedFogxv,
+    ValidatedFramebufferParameteri,
+    ValidatedFramebufferRenderbuffer,
+    ValidatedFramebufferRenderbufferOES,
+    ValidatedFramebufferTexture2D,
+    ValidatedFramebufferTexture2DOES,
+    ValidatedFramebufferTextureEXT,
+    ValidatedFramebufferTextureLayer,
+    ValidatedFramebufferTextureMultiviewOVR,
+    ValidatedFrontFace,
+    ValidatedFrustumf,
+    ValidatedFrustumx,
+    ValidatedGenBuffers,
+    ValidatedGenFencesNV,
+    ValidatedGenFramebuffers,
+    ValidatedGenFramebuffersOES,
+    ValidatedGenPathsCHROMIUM,
+    ValidatedGenProgramPipelines,
+    ValidatedGenQueries,
+    ValidatedGenQueriesEXT,
+    ValidatedGenRenderbuffers,
+    ValidatedGenRenderbuffersOES,
+    ValidatedGenSamplers,
+    ValidatedGenSemaphoresEXT,
+    ValidatedGenTextures,
+    ValidatedGenTransformFeedbacks,
+    ValidatedGenVertexArrays,
+    ValidatedGenVertexArraysOES,
+    ValidatedGenerateMipmap,
+    ValidatedGenerateMipmapOES,
+    ValidatedGetActiveAttrib,
+    ValidatedGetActiveUniform,
+    ValidatedGetActiveUniformBlockName,
+    ValidatedGetActiveUniformBlockiv,
+    ValidatedGetActiveUniformBlockivRobustANGLE,
+    ValidatedGetActiveUniformsiv,
+    ValidatedGetAttachedShaders,
+    ValidatedGetAttribLocation,
+    ValidatedGetBooleani_v,
+    ValidatedGetBooleani_vRobustANGLE,
+    ValidatedGetBooleanv,
+    ValidatedGetBooleanvRobustANGLE,
+    ValidatedGetBufferParameteri64v,
+    ValidatedGetBufferParameteri64vRobustANGLE,
+    ValidatedGetBufferParameteriv,
+    ValidatedGetBufferParameterivRobustANGLE,
+    ValidatedGetBufferPointerv,
+    ValidatedGetBufferPointervOES,
+    ValidatedGetBufferPointervRobustANGLE,
+    ValidatedGetClipPlanef,
+    ValidatedGetClipPlanex,
+    ValidatedGetDebugMessageLogKHR,
+    ValidatedGetError,
+    ValidatedGetFenceivNV,
+    ValidatedGetFixedv,
+    ValidatedGetFloatv,
+    ValidatedGetFloatvRobustANGLE,
+    ValidatedGetFragDataIndexEXT,
+    ValidatedGetFragDataLocation,
+    ValidatedGetFramebufferAttachmentParameteriv,
+    ValidatedGetFramebufferAttachmentParameterivOES,
+    ValidatedGetFramebufferAttachmentParameterivRobustANGLE,
+    ValidatedGetFramebufferParameteriv,
+    ValidatedGetFramebufferParameterivRobustANGLE,
+    ValidatedGetGraphicsResetStatusEXT,
+    ValidatedGetInteger64i_v,
+    ValidatedGetInteger64i_vRobustANGLE,
+    ValidatedGetInteger64v,
+    ValidatedGetInteger64vRobustANGLE,
+    ValidatedGetIntegeri_v,
+    ValidatedGetIntegeri_vRobustANGLE,
+    ValidatedGetIntegerv,
+    ValidatedGetIntegervRobustANGLE,
+    ValidatedGetInternalformativ,
+    ValidatedGetInternalformativRobustANGLE,
+    ValidatedGetLightfv,
+    ValidatedGetLightxv,
+    ValidatedGetMaterialfv,
+    ValidatedGetMaterialxv,
+    ValidatedGetMemoryObjectParameterivEXT,
+    ValidatedGetMultisamplefv,
+    ValidatedGetMultisamplefvANGLE,
+    ValidatedGetMultisamplefvRobustANGLE,
+    ValidatedGetObjectLabelKHR,
+    ValidatedGetObjectPtrLabelKHR,
+    ValidatedGetPathParameterfvCHROMIUM,
+    ValidatedGetPathParameterivCHROMIUM,
+    ValidatedGetPointerv,
+    ValidatedGetPointervKHR,
+    ValidatedGetPointervRobustANGLERobustANGLE,
+    ValidatedGetProgramBinary,
+    ValidatedGetProgramBinaryOES,
+    ValidatedGetProgramInfoLog,
+    ValidatedGetProgramInterfaceiv,
+    ValidatedGetProgramInterfaceivRobustANGLE,
+    ValidatedGetProgramPipelineInfoLog,
+    ValidatedGetProgramPipelineiv,
+    ValidatedGetProgramResourceIndex,
+    ValidatedGetProgramResourceLocation,
+    ValidatedGetProgramResourceLocationIndexEXT,
+    ValidatedGetProgramResourceName,
+    ValidatedGetProgramResourceiv,
+    ValidatedGetProgramiv,
+    ValidatedGetProgramivRobustANGLE,
+    ValidatedGetQueryObjecti64vEXT,
+    ValidatedGetQueryObjecti64vRobustANGLE,
+    ValidatedGetQueryObjectivEXT,
+    ValidatedGetQueryObjectivRobustANGLE,
+    ValidatedGetQueryObjectui64vEXT,
+    ValidatedGetQueryObjectui64vRobustANGLE,
+    ValidatedGetQueryObjectuiv,
+    ValidatedGetQueryObjectuivEXT,
+    ValidatedGetQueryObjectuivRobustANGLE,
+    ValidatedGetQueryiv,
+    ValidatedGetQueryivEXT,
+    ValidatedGetQueryivRobustANGLE,
+    ValidatedGetRenderbufferParameteriv,
+    ValidatedGetRenderbufferParameterivOES,
+    ValidatedGetRenderbufferParameterivRobustANGLE,
+    ValidatedGetSamplerParameterIivOES,
+    ValidatedGetSamplerParameterIivRobustANGLE,
+    ValidatedGetSamplerParameterIuivOES,
+    ValidatedGetSamplerParameterIuivRobustANGLE,
+    ValidatedGetSamplerParameterfv,
+    ValidatedGetSamplerParameterfvRobustANGLE,
+    ValidatedGetSamplerParameteriv,
+    ValidatedGetSamplerParameterivRobustANGLE,
+    ValidatedGetSemaphoreParameterui64vEXT,
+    ValidatedGetShaderInfoLog,
+    ValidatedGetShaderPrecisionFormat,
+    ValidatedGetShaderSource,
+    ValidatedGetShaderiv,
+    ValidatedGetShaderivRobustANGLE,
+    ValidatedGetString,
+    ValidatedGetStringi,
+    ValidatedGetSynciv,
+    ValidatedGetTexEnvfv,
+    ValidatedGetTexEnviv,
+    ValidatedGetTexEnvxv,
+    ValidatedGetTexGenfvOES,
+    ValidatedGetTexGenivOES,
+    ValidatedGetTexGenxvOES,
+    ValidatedGetTexLevelParameterfv,
+    ValidatedGetTexLevelParameterfvANGLE,
+    ValidatedGetTexLevelParameterfvRobustANGLE,
+    ValidatedGetTexLevelParameteriv,
+    ValidatedGetTexLevelParameterivANGLE,
+    ValidatedGetTexLevelParameterivRobustANGLE,
+    ValidatedGetTexParameterIivOES,
+    ValidatedGetTexParameterIivRobustANGLE,
+    ValidatedGetTexParameterIuivOES,
+    ValidatedGetTexParameterIuivRobustANGLE,
+    ValidatedGetTexParameterfv,
+    ValidatedGetTexParameterfvRobustANGLE,
+    ValidatedGetTexParameteriv,
+    ValidatedGetTexParameterivRobustANGLE,
+    ValidatedGetTexParameterxv,
+    ValidatedGetTransformFeedbackVarying,
+    ValidatedGetTranslatedShaderSourceANGLE,
+    ValidatedGetUniformBlockIndex,
+    ValidatedGetUniformIndices,
+    ValidatedGetUniformLocation,
+    ValidatedGetUniformfv,
+    ValidatedGetUniformfvRobustANGLE,
+    ValidatedGetUniformiv,
+    ValidatedGetUniformivRobustANGLE,
+    ValidatedGetUniformuiv,
+    ValidatedGetUniformuivRobustANGLE,
+    ValidatedGetUnsignedBytei_vEXT,
+    ValidatedGetUnsignedBytevEXT,
+    ValidatedGetVertexAttribIiv,
+    ValidatedGetVertexAttribIivRobustANGLE,
+    ValidatedGetVertexAttribIuiv,
+    ValidatedGetVertexAttribIuivRobustANGLE,
+    ValidatedGetVertexAttribPointerv,
+    ValidatedGetVertexAttribPointervRobustANGLE,
+    ValidatedGetVertexAttribfv,
+    ValidatedGetVertexAttribfvRobustANGLE,
+    ValidatedGetVertexAttribiv,
+    ValidatedGetVertexAttribivRobustANGLE,
+    ValidatedGetnUniformfvEXT,
+    ValidatedGetnUniformfvRobustANGLE,
+    ValidatedGetnUniformivEXT,
+    ValidatedGetnUniformivRobustANGLE,
+    ValidatedGetnUniformuivRobustANGLE,
+    ValidatedHint,
+    ValidatedImportMemoryFdEXT,
+    ValidatedImportSemaphoreFdEXT,
+    ValidatedInsertEventMarkerEXT,
+    ValidatedInvalidateFramebuffer,
+    ValidatedInvalidateSubFramebuffer,
+    ValidatedIsBuffer,
+    ValidatedIsEnabled,
+    ValidatedIsFenceNV,
+    ValidatedIsFramebuffer,
+    ValidatedIsFramebufferOES,
+    ValidatedIsMemoryObjectEXT,
+    ValidatedIsPathCHROMIUM,
+    ValidatedIsProgram,
+    ValidatedIsProgramPipeline,
+    ValidatedIsQuery,
+    ValidatedIsQueryEXT,
+    ValidatedIsRenderbuffer,
+    ValidatedIsRenderbufferOES,
+    ValidatedIsSampler,
+    ValidatedIsSemaphoreEXT,
+    ValidatedIsShader,
+    ValidatedIsSync,
+    ValidatedIsTexture,
+    ValidatedIsTransformFeedback,
+    ValidatedIsVertexArray,
+    ValidatedIsVertexArrayOES,
+    ValidatedLightModelf,
+    ValidatedLightModelfv,
+    ValidatedLightModelx,
+    ValidatedLightModelxv,
+    ValidatedLightf,
+    ValidatedLightfv,
+    ValidatedLightx,
+    ValidatedLightxv,
+    ValidatedLineWidth,
+    ValidatedLineWidthx,
+    ValidatedLinkProgram,
+    ValidatedLoadIdentity,
+    ValidatedLoadMatrixf,
+    ValidatedLoadMatrixx,
+    ValidatedLoadPaletteFromModelViewMatrixOES,
+    ValidatedLogicOp,
+    ValidatedLoseContextCHROMIUM,
+    ValidatedMapBufferOES,
+    ValidatedMapBufferRange,
+    ValidatedMapBufferRangeEXT,
+    ValidatedMaterialf,
+    ValidatedMaterialfv,
+    ValidatedMaterialx,
+    ValidatedMaterialxv,
+    ValidatedMatrixIndexPointerOES,
+    ValidatedMatrixLoadIdentityCHROMIUM,
+    ValidatedMatrixLoadfCHROMIUM,
+    ValidatedMatrixMode,
+    ValidatedMaxShaderCompilerThreadsKHR,
+    ValidatedMemoryBarrier,
+    ValidatedMemoryBarrierByRegion,
+    ValidatedMemoryObjectParameterivEXT,
+    ValidatedMultMatrixf,
+    ValidatedMultMatrixx,
+    ValidatedMultiDrawArraysANGLE,
+    ValidatedMultiDrawArraysInstancedANGLE,
+    ValidatedMultiDrawElementsANGLE,
+    ValidatedMultiDrawElementsInstancedANGLE,
+    ValidatedMultiTexCoord4f,
+    ValidatedMultiTexCoord4x,
+    ValidatedNormal3f,
+    ValidatedNormal3x,
+    ValidatedNormalPointer,
+    ValidatedObjectLabelKHR,
+    ValidatedObjectPtrLabelKHR,
+    ValidatedOrthof,
+    ValidatedOrthox,
+    ValidatedPathCommandsCHROMIUM,
+    ValidatedPathParameterfCHROMIUM,
+    ValidatedPathParameteriCHROMIUM,
+    ValidatedPathStencilFuncCHROMIUM,
+    ValidatedPauseTransformFeedback,
+    ValidatedPixelStorei,
+    ValidatedPointParameterf,
+    ValidatedPointParameterfv,
+    ValidatedPointParameterx,
+    ValidatedPointParameterxv,
+    ValidatedPointSize,
+    ValidatedPointSizePointerOES,
+    ValidatedPointSizex,
+    ValidatedPolygonOffset,
+    ValidatedPolygonOffsetx,
+    ValidatedPopDebugGroupKHR,
+    ValidatedPopGroupMarkerEXT,
+    ValidatedPopMatrix,
+    ValidatedProgramBinary,
+    ValidatedProgramBinaryOES,
+    ValidatedProgramParameteri,
+    ValidatedProgramPathFragmentInputGenCHROMIUM,
+    ValidatedProgramUniform1f,
+    ValidatedProgramUniform1fv,
+    ValidatedProgramUniform1i,
+    ValidatedProgramUniform1iv,
+    ValidatedProgramUniform1ui,
+    ValidatedProgramUniform1uiv,
+    ValidatedProgramUniform2f,
+    ValidatedProgramUniform2fv,
+    ValidatedProgramUniform2i,
+    ValidatedProgramUniform2iv,
+    ValidatedProgramUniform2ui,
+    ValidatedProgramUniform2uiv,
+    ValidatedProgramUniform3f,
+    ValidatedProgramUniform3fv,
+    ValidatedProgramUniform3i,
+    ValidatedProgramUniform3iv,
+    ValidatedProgramUniform3ui,
+    ValidatedProgramUniform3uiv,
+    ValidatedProgramUniform4f,
+    ValidatedProgramUniform4fv,
+    ValidatedProgramUniform4i,
+    ValidatedProgramUniform4iv,
+    ValidatedProgramUniform4ui,
+    ValidatedProgramUniform4uiv,
+    ValidatedProgramUniformMatrix2fv,
+    ValidatedProgramUniformMatrix2x3fv,
+    ValidatedProgramUniformMatrix2x4fv,
+    ValidatedProgramUniformMatrix3fv,
+    ValidatedProgramUniformMatrix3x2fv,
+    ValidatedProgramUniformMatrix3x4fv,
+    ValidatedProgramUniformMatrix4fv,
+    ValidatedProgramUniformMatrix4x2fv,
+    ValidatedProgramUniformMatrix4x3fv,
+    ValidatedProvokingVertexANGLE,
+    ValidatedPushDebugGroupKHR,
+    ValidatedPushGroupMarkerEXT,
+    ValidatedPushMatrix,
+    ValidatedQueryCounterEXT,
+    ValidatedQueryMatrixxOES,
+    ValidatedReadBuffer,
+    ValidatedReadPixels,
+    ValidatedReadPixelsRobustANGLE,
+    ValidatedReadnPixelsEXT,
+    ValidatedReadnPixelsRobustANGLE,
+    ValidatedReleaseShaderCompiler,
+    ValidatedRenderbufferStorage,
+    ValidatedRenderbufferStorageMultisample,
+    ValidatedRenderbufferStorageMultisampleANGLE,
+    ValidatedRenderbufferStorageOES,
+    ValidatedRequestExtensionANGLE,
+    ValidatedResumeTransformFeedback,
+    ValidatedRotatef,
+    ValidatedRotatex,
+    ValidatedSampleCoverage,
+    ValidatedSampleCoveragex,
+    ValidatedSampleMaski,
+    ValidatedSampleMaskiANGLE,
+    ValidatedSamplerParameterIivOES,
+    ValidatedSamplerParameterIivRobustANGLE,
+    ValidatedSamplerParameterIuivOES,
+    ValidatedSamplerParameterIuivRobustANGLE,
+    ValidatedSamplerParameterf,
+    ValidatedSamplerParameterfv,
+    ValidatedSamplerParameterfvRobustANGLE,
+    ValidatedSamplerParameteri,
+    ValidatedSamplerParameteriv,
+    ValidatedSamplerParameterivRobustANGLE,
+    ValidatedScalef,
+    ValidatedScalex,
+    ValidatedScissor,
+    ValidatedSemaphoreParameterui64vEXT,
+    ValidatedSetFenceNV,
+    ValidatedShadeModel,
+    ValidatedShaderBinary,
+    ValidatedShaderSource,
+    ValidatedSignalSemaphoreEXT,
+    ValidatedStencilFillPathCHROMIUM,
+    ValidatedStencilFillPathInstancedCHROMIUM,
+    ValidatedStencilFunc,
+    ValidatedStencilFuncSeparate,
+    ValidatedStencilMask,
+    ValidatedStencilMaskSeparate,
+    ValidatedStencilOp,
+    ValidatedStencilOpSeparate,
+    ValidatedStencilStrokePathCHROMIUM,
+    ValidatedStencilStrokePathInstancedCHROMIUM,
+    ValidatedStencilThenCoverFillPathCHROMIUM,
+    ValidatedStencilThenCoverFillPathInstancedCHROMIUM,
+    ValidatedStencilThenCoverStrokePathCHROMIUM,
+    ValidatedStencilThenCoverStrokePathInstancedCHROMIUM,
+    ValidatedTestFenceNV,
+    ValidatedTexCoordPointer,
+    ValidatedTexEnvf,
+    ValidatedTexEnvfv,
+    ValidatedTexEnvi,
+    ValidatedTexEnviv,
+    ValidatedTexEnvx,
+    ValidatedTexEnvxv,
+    ValidatedTexGenfOES,
+    ValidatedTexGenfvOES,
+    ValidatedTexGeniOES,
+    ValidatedTexGenivOES,
+    ValidatedTexGenxOES,
+    ValidatedTexGenxvOES,
+    ValidatedTexImage2D,
+    ValidatedTexImage2DRobustANGLE,
+    ValidatedTexImage3D,
+    ValidatedTexImage3DRobustANGLE,
+    ValidatedTexParameterIivOES,
+    ValidatedTexParameterIivRobustANGLE,
+    ValidatedTexParameterIuivOES,
+    ValidatedTexParameterIuivRobustANGLE,
+    ValidatedTexParameterf,
+    ValidatedTexParameterfv,
+    ValidatedTexParameterfvRobustANGLE,
+    ValidatedTexParameteri,
+    ValidatedTexParameteriv,
+    ValidatedTexParameterivRobustANGLE,
+    ValidatedTexParameterx,
+    ValidatedTexParameterxv,
+    ValidatedTexStorage1DEXT,
+    ValidatedTexStorage2D,
+    ValidatedTexStorage2DEXT,
+    ValidatedTexStorage2DMultisample,
+    ValidatedTexStorage2DMultisampleANGLE,
+    ValidatedTexStorage3D,
+    ValidatedTexStorage3DEXT,
+    ValidatedTexStorage3DMultisampleOES,
+    ValidatedTexStorageMem2DEXT,
+    ValidatedTexStorageMem2DMultisampleEXT,
+    ValidatedTexStorageMem3DEXT,
+    ValidatedTexStorageMem3DMultisampleEXT,
+    ValidatedTexSubImage2D,
+    ValidatedTexSubImage2DRobustANGLE,
+    ValidatedTexSubImage3D,
+    ValidatedTexSubImage3DRobustANGLE,
+    ValidatedTransformFeedbackVaryings,
+    ValidatedTranslatef,
+    ValidatedTranslatex,
+    ValidatedUniform1f,
+    ValidatedUniform1fv,
+    ValidatedUniform1i,
+    ValidatedUniform1iv,
+    ValidatedUniform1ui,
+    ValidatedUniform1uiv,
+    ValidatedUniform2f,
+    ValidatedUniform2fv,
+    ValidatedUniform2i,
+    ValidatedUniform2iv,
+    ValidatedUniform2ui,
+    ValidatedUniform2uiv,
+    ValidatedUniform3f,
+    ValidatedUniform3fv,
+    ValidatedUniform3i,
+    ValidatedUniform3iv,
+    ValidatedUniform3ui,
+    ValidatedUniform3uiv,
+    ValidatedUniform4f,
+    ValidatedUniform4fv,
+    ValidatedUniform4i,
+    ValidatedUniform4iv,
+    ValidatedUniform4ui,
+    ValidatedUniform4uiv,
+    ValidatedUniformBlockBinding,
+    ValidatedUniformMatrix2fv,
+    ValidatedUniformMatrix2x3fv,
+    ValidatedUniformMatrix2x4fv,
+    ValidatedUniformMatrix3fv,
+    ValidatedUniformMatrix3x2fv,
+    ValidatedUniformMatrix3x4fv,
+    ValidatedUniformMatrix4fv,
+    ValidatedUniformMatrix4x2fv,
+    ValidatedUniformMatrix4x3fv,
+    ValidatedUnmapBuffer,
+    ValidatedUnmapBufferOES,
+    ValidatedUseProgram,
+    ValidatedUseProgramStages,
+    ValidatedValidateProgram,
+    ValidatedValidateProgramPipeline,
+    ValidatedVertexAttrib1f,
+    ValidatedVertexAttrib1fv,
+    ValidatedVertexAttrib2f,
+    ValidatedVertexAttrib2fv,
+    ValidatedVertexAttrib3f,
+    ValidatedVertexAttrib3fv,
+    ValidatedVertexAttrib4f,
+    ValidatedVertexAttrib4fv,
+    ValidatedVertexAttribBinding,
+    ValidatedVertexAttribDivisor,
+    ValidatedVertexAttribDivisorANGLE,
+    ValidatedVertexAttribDivisorEXT,
+    ValidatedVertexAttribFormat,
+    ValidatedVertexAttribI4i,
+    ValidatedVertexAttribI4iv,
+    ValidatedVertexAttribI4ui,
+    ValidatedVertexAttribI4uiv,
+    ValidatedVertexAttribIFormat,
+    ValidatedVertexAttribIPointer,
+    ValidatedVertexAttribPointer,
+    ValidatedVertexBindingDivisor,
+    ValidatedVertexPointer,
+    ValidatedViewport,
+    ValidatedWaitSemaphoreEXT,
+    ValidatedWaitSync,
+    ValidatedWeightPointerOES,
+};
+
+const DispatchTable kNoErrorDispatchTable = {
+    NoErrorActiveShaderProgram,
+    NoErrorActiveTexture,
+    NoErrorAlphaFunc,
+    NoErrorAlphaFuncx,
+    NoErrorAttachShader,
+    NoErrorBeginQuery,
+    NoErrorBeginQueryEXT,
+    NoErrorBeginTransformFeedback,
+    NoErrorBindAttribLocation,
+    NoErrorBindBuffer,
+    NoErrorBindBufferBase,
+    NoErrorBindBufferRange,
+    NoErrorBindFragDataLocationEXT,
+    NoErrorBindFragDataLocationIndexedEXT,
+    NoErrorBindFragmentInputLocationCHROMIUM,
+    NoErrorBindFramebuffer,
+    NoErrorBindFramebufferOES,
+    NoErrorBindImageTexture,
+    NoErrorBindProgramPipeline,
+    NoErrorBindRenderbuffer,
+    NoErrorBindRenderbufferOES,
+    NoErrorBindSampler,
+    NoErrorBindTexture,
+    NoErrorBindTransformFeedback,
+    NoErrorBindUniformLocationCHROMIUM,
+    NoErrorBindVertexArray,
+    NoErrorBindVertexArrayOES,
+    NoErrorBindVertexBuffer,
+    NoErrorBlendColor,
+    NoErrorBlendEquation,
+    NoErrorBlendEquationSeparate,
+    NoErrorBlendFunc,
+    NoErrorBlendFuncSeparate,
+    NoErrorBlitFramebuffer,
+    NoErrorBlitFramebufferANGLE,
+    NoErrorBufferData,
+    NoErrorBufferStorageMemEXT,
+    NoErrorBufferSubData,
+    NoErrorCheckFramebufferStatus,
+    NoErrorCheckFramebufferStatusOES,
+    NoErrorClear,
+    NoErrorClearBufferfi,
+    NoErrorClearBufferfv,
+    NoErrorClearBufferiv,
+    NoErrorClearBufferuiv,
+    NoErrorClearColor,
+    NoErrorClearColorx,
+    NoErrorClearDepthf,
+    NoErrorClearDepthx,
+    NoErrorClearStencil,
+    NoErrorClientActiveTexture,
+    NoErrorClientWaitSync,
+    NoErrorClipPlanef,
+    NoErrorClipPlanex,
+    NoErrorColor4f,
+    NoErrorColor4ub,
+    NoErrorColor4x,
+    NoErrorColorMask,
+    NoErrorColorPointer,
+    NoErrorCompileShader,
+    NoErrorCompressedCopyTextureCHROMIUM,
+    NoErrorCompressedTexImage2D,
+    NoErrorCompressedTexImage2DRobustANGLE,
+    NoErrorCompressedTexImage3D,
+    NoErrorCompressedTexImage3DRobustANGLE,
+    NoErrorCompressedTexSubImage2D,
+    NoErrorCompressedTexSubImage2DRobustANGLE,
+    NoErrorCompressedTexSubImage3D,
+    NoErrorCompressedTexSubImage3DRobustANGLE,
+    NoErrorCopyBufferSubData,
+    NoErrorCopySubTexture3DANGLE,
+    NoErrorCopySubTextureCHROMIUM,
+    NoErrorCopyTexImage2D,
+    NoErrorCopyTexSubImage2D,
+    NoErrorCopyTexSubImage3D,
+    NoErrorCopyTexture3DANGLE,
+    NoErrorCopyTextureCHROMIUM,
+    NoErrorCoverFillPathCHROMIUM,
+    NoErrorCoverFillPathInstancedCHROMIUM,
+    NoErrorCoverStrokePathCHROMIUM,
+    NoErrorCoverStrokePathInstancedCHROMIUM,
+    NoErrorCoverageModulationCHROMIUM,
+    NoErrorCreateMemoryObjectsEXT,
+    NoErrorCreateProgram,
+    NoErrorCreateShader,
+    NoErrorCreateShaderProgramv,
+    NoErrorCullFace,
+    NoErrorCurrentPaletteMatrixOES,
+    NoErrorDebugMessageCallbackKHR,
+    NoErrorDebugMessageControlKHR,
+    NoErrorDebugMessageInsertKHR,
+    NoErrorDeleteBuffers,
+    NoErrorDeleteFencesNV,
+    NoErrorDeleteFramebuffers,
+    NoErrorDeleteFramebuffersOES,
+    NoErrorDeleteMemoryObjectsEXT,
+    NoErrorDeletePathsCHROMIUM,
+    NoErrorDeleteProgram,
+    NoErrorDeleteProgramPipelines,
+    NoErrorDeleteQueries,
+    NoErrorDeleteQueriesEXT,
+    NoErrorDeleteRenderbuffers,
+    NoErrorDeleteRenderbuffersOES,
+    NoErrorDeleteSamplers,
+    NoErrorDeleteSemaphoresEXT,
+    NoErrorDeleteShader,
+    NoErrorDeleteSync,
+    NoErrorDeleteTextures,
+    NoErrorDeleteTransformFeedbacks,
+    NoErrorDeleteVertexArrays,
+    NoErrorDeleteVertexArraysOES,
+    NoErrorDepthFunc,
+    NoErrorDepthMask,
+    NoErrorDepthRangef,
+    NoErrorDepthRangex,
+    NoErrorDetachShader,
+    NoErrorDisable,
+    NoErrorDisableClientState,
+    NoErrorDisableVertexAttribArray,
+    NoErrorDiscardFramebufferEXT,
+    NoErrorDispatchCompute,
+    NoErrorDispatchComputeIndirect,
+    NoErrorDrawArrays,
+    NoErrorDrawArraysIndirect,
+    NoErrorDrawArraysInstanced,
+    NoErrorDrawArraysInstancedANGLE,
+    NoErrorDrawArraysInstancedEXT,
+    NoErrorDrawBuffers,
+    NoErrorDrawBuffersEXT,
+    NoErrorDrawElements,
+    NoErrorDrawElementsIndirect,
+    NoErrorDrawElementsInstanced,
+    NoErrorDrawElementsInstancedANGLE,
+    NoErrorDrawElementsInstancedEXT,
+    NoErrorDrawRangeElements,
+    NoErrorDrawTexfOES,
+    NoErrorDrawTexfvOES,
+    NoErrorDrawTexiOES,
+    NoErrorDrawTexivOES,
+    NoErrorDrawTexsOES,
+    NoErrorDrawTexsvOES,
+    NoErrorDrawTexxOES,
+    NoErrorDrawTexxvOES,
+    NoErrorEGLImageTargetRenderbufferStorageOES,
+    NoErrorEGLImageTargetTexture2DOES,
+    NoErrorEnable,
+    NoErrorEnableClientState,
+    NoErrorEnableVertexAttribArray,
+    NoErrorEndQuery,
+    NoErrorEndQueryEXT,
+    NoErrorEndTransformFeedback,
+    NoErrorFenceSync,
+    NoErrorFinish,
+    NoErrorFinishFenceNV,
+    NoErrorFlush,
+    NoErrorFlushMappedBufferRange,
+    NoErrorFlushMappedBufferRangeEXT,
+    NoErrorFogf,
+    NoErrorFogfv,
+    NoErrorFogx,
+    NoErrorFogxv,
+    NoErrorFramebufferParameteri,
+    NoErrorFramebufferRenderbuffer,
+    NoErrorFramebufferRenderbufferOES,
+    NoErrorFramebufferTexture2D,
+    NoErrorFramebufferTexture2DOES,
+    NoErrorFramebufferTextureEXT,
+    NoErrorFramebufferTextureLayer,
+    NoErrorFramebufferTextureMultiviewOVR,
+    NoErrorFrontFace,
+    NoErrorFrustumf,
+    NoErrorFrustumx,
+    NoErrorGenBuffers,
+    NoErrorGenFencesNV,
+    NoErrorGenFramebuffers,
+    NoErrorGenFramebuffersOES,
+    NoErrorGenPathsCHROMIUM,
+    NoErrorGenProgramPipelines,
+    NoErrorGenQueries,
+    NoErrorGenQueriesEXT,
+    NoErrorGenRenderbuffers,
+    NoErrorGenRenderbuffersOES,
+    NoErrorGenSamplers,
+    NoErrorGenSemaphoresEXT,
+    NoErrorGenTextures,
+    NoErrorGenTransformFeedbacks,
+    NoErrorGenVertexArrays,
+    NoErrorGenVertexArraysOES,
+    NoErrorGenerateMipmap,
+    NoErrorGenerateMipmapOES,
+    NoErrorGetActiveAttrib,
+    NoErrorGetActiveUniform,
+    NoErrorGetActiveUniformBlockName,
+    NoErrorGetActiveUniformBlockiv,
+    NoErrorGetActiveUniformBlockivRobustANGLE,
+    NoErrorGetActiveUniformsiv,
+    NoErrorGetAttachedShaders,
+    NoErrorGetAttribLocation,
+    NoErrorGetBooleani_v,
+    NoErrorGetBooleani_vRobustANGLE,
+    NoErrorGetBooleanv,
+    NoErrorGetBooleanvRobustANGLE,
+    NoErrorGetBufferParameteri64v,
+    NoErrorGetBufferParameteri64vRobustANGLE,
+    NoErrorGetBufferParameteriv,
+    NoErrorGetBufferParameterivRobustANGLE,
+    NoErrorGetBufferPointerv,
+    NoErrorGetBufferPointervOES,
+    NoErrorGetBufferPointervRobustANGLE,
+    NoErrorGetClipPlanef,
+    NoErrorGetClipPlanex,
+    NoErrorGetDebugMessageLogKHR,
+    NoErrorGetError,
+    NoErrorGetFenceivNV,
+    NoErrorGetFixedv,
+    NoErrorGetFloatv,
+    NoErrorGetFloatvRobustANGLE,
+    NoErrorGetFragDataIndexEXT,
+    NoErrorGetFragDataLocation,
+    NoErrorGetFramebufferAttachmentParameteriv,
+    NoErrorGetFramebufferAttachmentParameterivOES,
+    NoErrorGetFramebufferAttachmentParameterivRobustANGLE,
+    NoErrorGetFramebufferParameteriv,
+    NoErrorGetFramebufferParameterivRobustANGLE,
+    NoErrorGetGraphicsResetStatusEXT,
+    NoErrorGetInteger64i_v,
+    NoErrorGetInteger64i_vRobustANGLE,
+    NoErrorGetInteger64v,
+    NoErrorGetInteger64vRobustANGLE,
+    NoErrorGetIntegeri_v,
+    NoErrorGetIntegeri_vRobustANGLE,
+    NoErrorGetIntegerv,
+    NoErrorGetIntegervRobustANGLE,
+    NoErrorGetInternalformativ,
+    NoErrorGetInternalformativRobustANGLE,
+    NoErrorGetLightfv,
+    NoErrorGetLightxv,
+    NoErrorGetMaterialfv,
+    NoErrorGetMaterialxv,
+    NoErrorGetMemoryObjectParameterivEXT,
+    NoErrorGetMultisamplefv,
+    NoErrorGetMultisamplefvANGLE,
+    NoErrorGetMultisamplefvRobustANGLE,
+    NoErrorGetObjectLabelKHR,
+    NoErrorGetObjectPtrLabelKHR,
+    NoErrorGetPathParameterfvCHROMIUM,
+    NoErrorGetPathParameterivCHROMIUM,
+    NoErrorGetPointerv,
+    NoErrorGetPointervKHR,
+    NoErrorGetPointervRobustANGLERobustANGLE,
+    NoErrorGetProgramBinary,
+    NoErrorGetProgramBinaryOES,
+    NoErrorGetProgramInfoLog,
+    NoErrorGetProgramInterfaceiv,
+    NoErrorGetProgramInterfaceivRobustANGLE,
+    NoErrorGetProgramPipelineInfoLog,
+    NoErrorGetProgramPipelineiv,
+    NoErrorGetProgramResourceIndex,
+    NoErrorGetProgramResourceLocation,
+    NoErrorGetProgramResourceLocationIndexEXT,
+    NoErrorGetProgramResourceName,
+    NoErrorGetProgramResourceiv,
+    NoErrorGetProgramiv,
+    NoErrorGetProgramivRobustANGLE,
+    NoErrorGetQueryObjecti64vEXT,
+    NoErrorGetQueryObjecti64vRobustANGLE,
+    NoErrorGetQueryObjectivEXT,
+    NoErrorGetQueryObjectivRobustANGLE,
+    NoErrorGetQueryObjectui64vEXT,
+    NoErrorGetQueryObjectui64vRobustANGLE,
+    NoErrorGetQueryObjectuiv,
+    NoErrorGetQueryObjectuivEXT,
+    NoErrorGetQueryObjectuivRobustANGLE,
+    NoErrorGetQueryiv,
+    NoErrorGetQueryivEXT,
+    NoErrorGetQueryivRobustANGLE,
+    NoErrorGetRenderbufferParameteriv,
+    NoErrorGetRenderbufferParameterivOES,
+    NoErrorGetRenderbufferParameterivRobustANGLE,
+    NoErrorGetSamplerParameterIivOES,
+    NoErrorGetSamplerParameterIivRobustANGLE,
+    NoErrorGetSamplerParameterIuivOES,
+    NoErrorGetSamplerParameterIuivRobustANGLE,
+    NoErrorGetSamplerParameterfv,
+    NoErrorGetSamplerParameterfvRobustANGLE,
+    NoErrorGetSamplerParameteriv,
+    NoErrorGetSamplerParameterivRobustANGLE,
+    NoErrorGetSemaphoreParameterui64vEXT,
+    NoErrorGetShaderInfoLog,
+    NoErrorGetShaderPrecisionFormat,
+    NoErrorGetShaderSource,
+    NoErrorGetShaderiv,
+    NoErrorGetShaderivRobustANGLE,
+    NoErrorGetString,
+    NoErrorGetStringi,
+    NoErrorGetSynciv,
+    NoErrorGetTexEnvfv,
+    NoErrorGetTexEnviv,
+    NoErrorGetTexEnvxv,
+    NoErrorGetTexGenfvOES,
+    NoErrorGetTexGenivOES,
+    NoErrorGetTexGenxvOES,
+    NoErrorGetTexLevelParameterfv,
+    NoErrorGetTexLevelParameterfvANGLE,
+    NoErrorGetTexLevelParameterfvRobustANGLE,
+    NoErrorGetTexLevelParameteriv,
+    NoErrorGetTexLevelParameterivANGLE,
+    NoErrorGetTexLevelParameterivRobustANGLE,
+    NoErrorGetTexParameterIivOES,
+    NoErrorGetTexParameterIivRobustANGLE,
+    NoErrorGetTexParameterIuivOES,
+    NoErrorGetTexParameterIuivRobustANGLE,
+    NoErrorGetTexParameterfv,
+    NoErrorGetTexParameterfvRobustANGLE,
+    NoErrorGetTexParameteriv,
+    NoErrorGetTexParameterivRobustANGLE,
+    NoErrorGetTexParameterxv,
+    NoErrorGetTransformFeedbackVarying,
+    NoErrorGetTranslatedShaderSourceANGLE,
+    NoErrorGetUniformBlockIndex,
+    NoErrorGetUniformIndices,
+    NoErrorGetUniformLocation,
+    NoErrorGetUniformfv,
+    NoErrorGetUniformfvRobustANGLE,
+    NoErrorGetUniformiv,
+    NoErrorGetUniformivRobustANGLE,
+    NoErrorGetUniformuiv,
+    NoErrorGetUniformuivRobustANGLE,
+    NoErrorGetUnsignedBytei_vEXT,
+    NoErrorGetUnsignedBytevEXT,
+    NoErrorGetVertexAttribIiv,
+    NoErrorGetVertexAttribIivRobustANGLE,
+    NoErrorGetVertexAttribIuiv,
+    NoErrorGetVertexAttribIuivRobustANGLE,
+    NoErrorGetVertexAttribPointerv,
+    NoErrorGetVertexAttribPointervRobustANGLE,
+    NoErrorGetVertexAttribfv,
+    NoErrorGetVertexAttribfvRobustANGLE,
+    NoErrorGetVertexAttribiv,
+    NoErrorGetVertexAttribivRobustANGLE,
+    NoErrorGetnUniformfvEXT,
+    NoErrorGetnUniformfvRobustANGLE,
+    NoErrorGetnUniformivEXT,
+    NoErrorGetnUniformivRobustANGLE,
+    NoErrorGetnUniformuivRobustANGLE,
+    NoErrorHint,
+    NoErrorImportMemoryFdEXT,
+    NoErrorImportSemaphoreFdEXT,
+    NoErrorInsertEventMarkerEXT,
+    NoErrorInvalidateFramebuffer,
+    NoErrorInvalidateSubFramebuffer,
+    NoErrorIsBuffer,
+    NoErrorIsEnabled,
+    NoErrorIsFenceNV,
+    NoErrorIsFramebuffer,
+    NoErrorIsFramebufferOES,
+    NoErrorIsMemoryObjectEXT,
+    NoErrorIsPathCHROMIUM,
+    NoErrorIsProgram,
+    NoErrorIsProgramPipeline,
+    NoErrorIsQuery,
+    NoErrorIsQueryEXT,
+    NoErrorIsRenderbuffer,
+    NoErrorIsRenderbufferOES,
+    NoErrorIsSampler,
+    NoErrorIsSemaphoreEXT,
+    NoErrorIsShader,
+    NoErrorIsSync,
+    NoErrorIsTexture,
+    NoErrorIsTransformFeedback,
+    NoErrorIsVertexArray,
+    NoErrorIsVertexArrayOES,
+    NoErrorLightModelf,
+    NoErrorLightModelfv,
+    NoErrorLightModelx,
+    NoErrorLightModelxv,
+    NoErrorLightf,
+    NoErrorLightfv,
+    NoErrorLightx,
+    NoErrorLightxv,
+    NoErrorLineWidth,
+    NoErrorLineWidthx,
+    NoErrorLinkProgram,
+    NoErrorLoadIdentity,
+    NoErrorLoadMatrixf,
+    NoErrorLoadMatrixx,
+    NoErrorLoadPaletteFromModelViewMatrixOES,
+    NoErrorLogicOp,
+    NoErrorLoseContextCHROMIUM,
+    NoErrorMapBufferOES,
+    NoErrorMapBufferRange,
+    NoErrorMapBufferRangeEXT,
+    NoErrorMaterialf,
+    NoErrorMaterialfv,
+    NoErrorMaterialx,
+    NoErrorMaterialxv,
+    NoErrorMatrixIndexPointerOES,
+    NoErrorMatrixLoadIdentityCHROMIUM,
+    NoErrorMatrixLoadfCHROMIUM,
+    NoErrorMatrixMode,
+    NoErrorMaxShaderCompilerThreadsKHR,
+    NoErrorMemoryBarrier,
+    NoErrorMemoryBarrierByRegion,
+    NoErrorMemoryObjectParameterivEXT,
+    NoErrorMultMatrixf,
+    NoErrorMultMatrixx,
+    NoErrorMultiDrawArraysANGLE,
+    NoErrorMultiDrawArraysInstancedANGLE,
+    NoErrorMultiDrawElementsANGLE,
+    NoErrorMultiDrawElementsInstancedANGLE,
+    NoErrorMultiTexCoord4f,
+    NoErrorMultiTexCoord4x,
+    NoErrorNormal3f,
+    NoErrorNormal3x,
+    NoErrorNormalPointer,
+    NoErrorObjectLabelKHR,
+    NoErrorObjectPtrLabelKHR,
+    NoErrorOrthof,
+    NoErrorOrthox,
+    NoErrorPathCommandsCHROMIUM,
+    NoErrorPathParameterfCHROMIUM,
+    NoErrorPathParameteriCHROMIUM,
+    NoErrorPathStencilFuncCHROMIUM,
+    NoErrorPauseTransformFeedback,
+    NoErrorPixelStorei,
+    NoErrorPointParameterf,
+    NoErrorPointParameterfv,
+    NoErrorPointParameterx,
+    NoErrorPointParameterxv,
+    NoErrorPointSize,
+    NoErrorPointSizePointerOES,
+    NoErrorPointSizex,
+    NoErrorPolygonOffset,
+    NoErrorPolygonOffsetx,
+    NoErrorPopDebugGroupKHR,
+    NoErrorPopGroupMarkerEXT,
+    NoErrorPopMatrix,
+    NoErrorProgramBinary,
+    NoErrorProgramBinaryOES,
+    NoErrorProgramParameteri,
+    NoErrorProgramPathFragmentInputGenCHROMIUM,
+    NoErrorProgramUniform1f,
+    NoErrorProgramUniform1fv,
+    NoErrorProgramUniform1i,
+    NoErrorProgramUniform1iv,
+    NoErrorProgramUniform1ui,
+    NoErrorProgramUniform1uiv,
+    NoErrorProgramUniform2f,
+    NoErrorProgramUniform2fv,
+    NoErrorProgramUniform2i,
+    NoErrorProgramUniform2iv,
+    NoErrorProgramUniform2ui,
+    NoErrorProgramUniform2uiv,
+    NoErrorProgramUniform3f,
+    NoErrorProgramUniform3fv,
+    NoErrorProgramUniform3i,
+    NoErrorProgramUniform3iv,
+    NoErrorProgramUniform3ui,
+    NoErrorProgramUniform3uiv,
+    NoErrorProgramUniform4f,
+    NoErrorProgramUniform4fv,
+    NoErrorProgramUniform4i,
+    NoErrorProgramUniform4iv,
+    NoErrorProgramUniform4ui,
+    NoErrorProgramUniform4uiv,
+    NoErrorProgramUniformMatrix2fv,
+    NoErrorProgramUniformMatrix2x3fv,
+    NoErrorProgramUniformMatrix2x4fv,
+    NoErrorProgramUniformMatrix3fv,
+    NoErrorProgramUniformMatrix3x2fv,
+    NoErrorProgramUniformMatrix3x4fv,
+    NoErrorProgramUniformMatrix4fv,
+    NoErrorProgramUniformMatrix4x2fv,
+    NoErrorProgramUniformMatrix4x3fv,
+    NoErrorProvokingVertexANGLE,
+    NoErrorPushDebugGroupKHR,
+    NoErrorPushGroupMarkerEXT,
+    NoErrorPushMatrix,
+    NoErrorQueryCounterEXT,
+    NoErrorQueryMatrixxOES,
+    NoErrorReadBuffer,
+    NoErrorReadPixels,
+    NoErrorReadPixelsRobustANGLE,
+    NoErrorReadnPixelsEXT,
+    NoErrorReadnPixelsRobustANGLE,
+    NoErrorReleaseShaderCompiler,
+    NoErrorRenderbufferStorage,
+    NoErrorRenderbufferStorageMultisample,
+    NoErrorRenderbufferStorageMultisampleANGLE,
+    NoErrorRenderbufferStorageOES,
+    NoErrorRequestExtensionANGLE,
+    NoErrorResumeTransformFeedback,
+    NoErrorRotatef,
+    NoErrorRotatex,
+    NoErrorSampleCoverage,
+    NoErrorSampleCoveragex,
+    NoErrorSampleMaski,
+    NoErrorSampleMaskiANGLE,
+    NoErrorSamplerParameterIivOES,
+    NoErrorSamplerParameterIivRobustANGLE,
+    NoErrorSamplerParameterIuivOES,
+    NoErrorSamplerParameterIuivRobustANGLE,
+    NoErrorSamplerParameterf,
+    NoErrorSamplerParameterfv,
+    NoErrorSamplerParameterfvRobustANGLE,
+    NoErrorSamplerParameteri,
+    NoErrorSamplerParameteriv,
+    NoErrorSamplerParameterivRobustANGLE,
+    NoErrorScalef,
+    NoErrorScalex,
+    NoErrorScissor,
+    NoErrorSemaphoreParameterui64vEXT,
+    NoErrorSetFenceNV,
+    NoErrorShadeModel,
+    NoErrorShaderBinary,
+    NoErrorShaderSource,
+    NoErrorSignalSemaphoreEXT,
+    NoErrorStencilFillPathCHROMIUM,
+    NoErrorStencilFillPathInstancedCHROMIUM,
+    NoErrorStencilFunc,
+    NoErrorStencilFuncSeparate,
+    NoErrorStencilMask,
+    NoErrorStencilMaskSeparate,
+    NoErrorStencilOp,
+    NoErrorStencilOpSeparate,
+    NoErrorStencilStrokePathCHROMIUM,
+    NoErrorStencilStrokePathInstancedCHROMIUM,
+    NoErrorStencilThenCoverFillPathCHROMIUM,
+    NoErrorStencilThenCoverFillPathInstancedCHROMIUM,
+    NoErrorStencilThenCoverStrokePathCHROMIUM,
+    NoErrorStencilThenCoverStrokePathInstancedCHROMIUM,
+    NoErrorTestFenceNV,
+    NoErrorTexCoordPointer,
+    NoErrorTexEnvf,
+    NoErrorTexEnvfv,
+    NoErrorTexEnvi,
+    NoErrorTexEnviv,
+    NoErrorTexEnvx,
+    NoErrorTexEnvxv,
+    NoErrorTexGenfOES,
+    NoErrorTexGenfvOES,
+    NoErrorTexGeniOES,
+    NoErrorTexGenivOES,
+    NoErrorTexGenxOES,
+    NoErrorTexGenxvOES,
+    NoErrorTexImage2D,
+    NoErrorTexImage2DRobustANGLE,
+    NoErrorTexImage3D,
+    NoErrorTexImage3DRobustANGLE,
+    NoErrorTexParameterIivOES,
+    NoErrorTexParameterIivRobustANGLE,
+    NoErrorTexParameterIuivOES,
+    NoErrorTexParameterIuivRobustANGLE,
+    NoErrorTexParameterf,
+    NoErrorTexParameterfv,
+    NoErrorTexParameterfvRobustANGLE,
+    NoErrorTexParameteri,
+    NoErrorTexParameteriv,
+    NoErrorTexParameterivRobustANGLE,
+    NoErrorTexParameterx,
+    NoErrorTexParameterxv,
+    NoErrorTexStorage1DEXT,
+    NoErrorTexStorage2D,
+    NoErrorTexStorage2DEXT,
+    NoErrorTexStorage2DMultisample,
+    NoErrorTexStorage2DMultisampleANGLE,
+    NoErrorTexStorage3D,
+    NoErrorTexStorage3DEXT,
+    NoErrorTexStorage3DMultisampleOES,
+    NoErrorTexStorageMem2DEXT,
+    NoErrorTexStorageMem2DMultisampleEXT,
+    NoErrorTexStorageMem3DEXT,
+    NoErrorTexStorageMem3DMultisampleEXT,
+    NoErrorTexSubImage2D,
+    NoErrorTexSubImage2DRobustANGLE,
+    NoErrorTexSubImage3D,
+    NoErrorTexSubImage3DRobustANGLE,
+    NoErrorTransformFeedbackVaryings,
+    NoErrorTranslatef,
+    NoErrorTranslatex,
+    NoErrorUniform1f,
+    NoErrorUniform1fv,
+    NoErrorUniform1i,
+    NoErrorUniform1iv,
+    NoErrorUniform1ui,
+    NoErrorUniform1uiv,
+    NoErrorUniform2f,
+    NoErrorUniform2fv,
+    NoErrorUniform2i,
+    NoErrorUniform2iv,
+    NoErrorUniform2ui,
+    NoErrorUniform2uiv,
+    NoErrorUniform3f,
+    NoErrorUniform3fv,
+    NoErrorUniform3i,
+    NoErrorUniform3iv,
+    NoErrorUniform3ui,
+    NoErrorUniform3uiv,
+    NoErrorUniform4f,
+    NoErrorUniform4fv,
+    NoErrorUniform4i,
+    NoErrorUniform4iv,
+    NoErrorUniform4ui,
+    NoErrorUniform4uiv,
+    NoErrorUniformBlockBinding,
+    NoErrorUniformMatrix2fv,
+    NoErrorUniformMatrix2x3fv,
+    NoErrorUniformMatrix2x4fv,
+    NoErrorUniformMatrix3fv,
+    NoErrorUniformMatrix3x2fv,
+    NoErrorUniformMatrix3x4fv,
+    NoErrorUniformMatrix4fv,
+    NoErrorUniformMatrix4x2fv,
+    NoErrorUniformMatrix4x3fv,
+    NoErrorUnmapBuffer,
+    NoErrorUnmapBufferOES,
+    NoErrorUseProgram,
+    NoErrorUseProgramStages,
+    NoErrorValidateProgram,
+    NoErrorValidateProgramPipeline,
+    NoErrorVertexAttrib1f,
+    NoErrorVertexAttrib1fv,
+    NoErrorVertexAttrib2f,
+    NoErrorVertexAttrib2fv,
+    NoErrorVertexAttrib3f,
+    NoErrorVertexAttrib3fv,
+    NoErrorVertexAttrib4f,
+    NoErrorVertexAttrib4fv,
+    NoErrorVertexAttribBinding,
+    NoErrorVertexAttribDivisor,
+    NoErrorVertexAttribDivisorANGLE,
+    NoErrorVertexAttribDivisorEXT,
+    NoErrorVertexAttribFormat,
+    NoErrorVertexAttribI4i,
+    NoErrorVertexAttribI4iv,
+    NoErrorVertexAttribI4ui,
+    NoErrorVertexAttribI4uiv,
+    NoErrorVertexAttribIFormat,
+    NoErrorVertexAttribIPointer,
+    NoErrorVertexAttribPointer,
+    NoErrorVertexBindingDivisor,
+    NoErrorVertexPointer,
+    NoErrorViewport,
+    NoErrorWaitSemaphoreEXT,
+    NoErrorWaitSync,
+    NoErrorWeightPointerOES,
+};
+
+const DispatchTable kContextLostDispatchTable = {
+    ContextLostActiveShaderProgram,
+    ContextLostActiveTexture,
+    ContextLostAlphaFunc,
+    ContextLostAlphaFuncx,
+    ContextLostAttachShader,
+    ContextLostBeginQuery,
+    ContextLostBeginQueryEXT,
+    ContextLostBeginTransformFeedback,
+    ContextLostBindAttribLocation,
+    ContextLostBindBuffer,
+    ContextLostBindBufferBase,
+    ContextLostBindBufferRange,
+    ContextLostBindFragDataLocationEXT,
+    ContextLostBindFragDataLocationIndexedEXT,
+    ContextLostBindFragmentInputLocationCHROMIUM,
+    ContextLostBindFramebuffer,
+    ContextLostBindFramebufferOES,
+    ContextLostBindImageTexture,
+    ContextLostBindProgramPipeline,
+    ContextLostBindRenderbuffer,
+    ContextLostBindRenderbufferOES,
+    ContextLostBindSampler,
+    ContextLostBindTexture,
+    ContextLostBindTransformFeedback,
+    ContextLostBindUniformLocationCHROMIUM,
+    ContextLostBindVertexArray,
+    ContextLostBindVertexArrayOES,
+    ContextLostBindVertexBuffer,
+    ContextLostBlendColor,
+    ContextLostBlendEquation,
+    ContextLostBlendEquationSeparate,
+    ContextLostBlendFunc,
+    ContextLostBlendFuncSeparate,
+    ContextLostBlitFramebuffer,
+    ContextLostBlitFramebufferANGLE,
+    ContextLostBufferData,
+    ContextLostBufferStorageMemEXT,
+    ContextLostBufferSubData,
+    ContextLostCheckFramebufferStatus,
+    ContextLostCheckFramebufferStatusOES,
+    ContextLostClear,
+    ContextLostClearBufferfi,
+    ContextLostClearBufferfv,
+    ContextLostClearBufferiv,
+    ContextLostClearBufferuiv,
+    ContextLostClearColor,
+    ContextLostClearColorx,
+    ContextLostClearDepthf,
+    ContextLostClearDepthx,
+    ContextLostClearStencil,
+    ContextLostClientActiveTexture,
+    ContextLostClientWaitSync,
+    ContextLostClipPlanef,
+    ContextLostClipPlanex,
+    ContextLostColor4f,
+    ContextLostColor4ub,
+    ContextLostColor4x,
+    ContextLostColorMask,
+    ContextLostColorPointer,
+    ContextLostCompileShader,
+    ContextLostCompressedCopyTextureCHROMIUM,
+    ContextLostCompressedTexImage2D,
+    ContextLostCompressedTexImage2DRobustANGLE,
+    ContextLostCompressedTexImage3D,
+    ContextLostCompressedTexImage3DRobustANGLE,
+    ContextLostCompressedTexSubImage2D,
+    ContextLostCompressedTexSubImage2DRobustANGLE,
+    ContextLostCompressedTexSubImage3D,
+    ContextLostCompressedTexSubImage3DRobustANGLE,
+    ContextLostCopyBufferSubData,
+    ContextLostCopySubTexture3DANGLE,
+    ContextLostCopySubTextureCHROMIUM,
+    ContextLostCopyTexImage2D,
+    ContextLostCopyTexSubImage2D,
+    ContextLostCopyTexSubImage3D,
+    ContextLostCopyTexture3DANGLE,
+    ContextLostCopyTextureCHROMIUM,
+    ContextLostCoverFillPathCHROMIUM,
+    ContextLostCoverFillPathInstancedCHROMIUM,
+    ContextLostCoverStrokePathCHROMIUM,
+    ContextLostCoverStrokePathInstancedCHROMIUM,
+    ContextLostCoverageModulationCHROMIUM,
+    ContextLostCreateMemoryObjectsEXT,
+    ContextLostCreateProgram,
+    ContextLostCreateShader,
+    ContextLostCreateShaderProgramv,
+    ContextLostCullFace,
+    ContextLostCurrentPaletteMatrixOES,
+    ContextLostDebugMessageCallbackKHR,
+    ContextLostDebugMessageControlKHR,
+    ContextLostDebugMessageInsertKHR,
+    ContextLostDeleteBuffers,
+    ContextLostDeleteFencesNV,
+    ContextLostDeleteFramebuffers,
+    ContextLostDeleteFramebuffersOES,
+    ContextLostDeleteMemoryObjectsEXT,
+    ContextLostDeletePathsCHROMIUM,
+    ContextLostDeleteProgram,
+    ContextLostDeleteProgramPipelines,
+    ContextLostDeleteQueries,
+    ContextLostDeleteQueriesEXT,
+    ContextLostDeleteRenderbuffers,
+    ContextLostDeleteRenderbuffersOES,
+    ContextLostDeleteSamplers,
+    ContextLostDeleteSemaphoresEXT,
+    ContextLostDeleteShader,
+    ContextLostDeleteSync,
+    ContextLostDeleteTextures,
+    ContextLostDeleteTransformFeedbacks,
+    ContextLostDeleteVertexArrays,
+    ContextLostDeleteVertexArraysOES,
+    ContextLostDepthFunc,
+    ContextLostDepthMask,
+    ContextLostDepthRangef,
+    ContextLostDepthRangex,
+    ContextLostDetachShader,
+    ContextLostDisable,
+    ContextLostDisableClientState,
+    ContextLostDisableVertexAttribArray,
+    ContextLostDiscardFramebufferEXT,
+    ContextLostDispatchCompute,
+    ContextLostDispatchComputeIndirect,
+    ContextLostDrawArrays,
+    ContextLostDrawArraysIndirect,
+    ContextLostDrawArraysInstanced,
+    ContextLostDrawArraysInstancedANGLE,
+    ContextLostDrawArraysInstancedEXT,
+    ContextLostDrawBuffers,
+    ContextLostDrawBuffersEXT,
+    ContextLostDrawElements,
+    ContextLostDrawElementsIndirect,
+    ContextLostDrawElementsInstanced,
+    ContextLostDrawElementsInstancedANGLE,
+    ContextLostDrawElementsInstancedEXT,
+    ContextLostDrawRangeElements,
+    ContextLostDrawTexfOES,
+    ContextLostDrawTexfvOES,
+    ContextLostDrawTexiOES,
+    ContextLostDrawTexivOES,
+    ContextLostDrawTexsOES,
+    ContextLostDrawTexsvOES,
+    ContextLostDrawTexxOES,
+    ContextLostDrawTexxvOES,
+    ContextLostEGLImageTargetRenderbufferStorageOES,
+    ContextLostEGLImageTargetTexture2DOES,
+    ContextLostEnable,
+    ContextLostEnableClientState,
+    ContextLostEnableVertexAttribArray,
+    ContextLostEndQuery,
+    ContextLostEndQueryEXT,
+    ContextLostEndTransformFeedback,
+    ContextLostFenceSync,
+    ContextLostFinish,
+    ContextLostFinishFenceNV,
+    ContextLostFlush,
+    ContextLostFlushMappedBufferRange,
+    ContextLostFlushMappedBufferRangeEXT,
+    ContextLostFogf,
+    ContextLostFogfv,
+    ContextLostFogx,
+    ContextLostFogxv,
+    ContextLostFramebufferParameteri,
+    ContextLostFramebufferRenderbuffer,
+    ContextLostFramebufferRenderbufferOES,
+    ContextLostFramebufferTexture2D,
+    ContextLostFramebufferTexture2DOES,
+    ContextLostFramebufferTextureEXT,
+    ContextLostFramebufferTextureLayer,
+    ContextLostFramebufferTextureMultiviewOVR,
+    ContextLostFrontFace,
+    ContextLostFrustumf,
+    ContextLostFrustumx,
+    ContextLostGenBuffers,
+    ContextLostGenFencesNV,
+    ContextLostGenFramebuffers,
+    ContextLostGenFramebuffersOES,
+    ContextLostGenPathsCHROMIUM,
+    ContextLostGenProgramPipelines,
+    ContextLostGenQueries,
+    ContextLostGenQueriesEXT,
+    ContextLostGenRenderbuffers,
+    ContextLostGenRenderbuffersOES,
+    ContextLostGenSamplers,
+    ContextLostGenSemaphoresEXT,
+    ContextLostGenTextures,
+    ContextLostGenTransformFeedbacks,
+    ContextLostGenVertexArrays,
+    ContextLostGenVertexArraysOES,
+    ContextLostGenerateMipmap,
+    ContextLostGenerateMipmapOES,
+    ContextLostGetActiveAttrib,
+    ContextLostGetActiveUniform,
+    ContextLostGetActiveUniformBlockName,
+    ContextLostGetActiveUniformBlockiv,
+    ContextLostGetActiveUniformBlockivRobustANGLE,
+    ContextLostGetActiveUniformsiv,
+    ContextLostGetAttachedShaders,
+    ContextLostGetAttribLocation,
+    ContextLostGetBooleani_v,
+    ContextLostGetBooleani_vRobustANGLE,
+    ContextLostGetBooleanv,
+    ContextLostGetBooleanvRobustANGLE,
+    ContextLostGetBufferParameteri64v,
+    ContextLostGetBufferParameteri64vRobustANGLE,
+    ContextLostGetBufferParameteriv,
+    ContextLostGetBufferParameterivRobustANGLE,
+    ContextLostGetBufferPointerv,
+    ContextLostGetBufferPointervOES,
+    ContextLostGetBufferPointervRobustANGLE,
+    ContextLostGetClipPlanef,
+    ContextLostGetClipPlanex,
+    ContextLostGetDebugMessageLogKHR,
+    ValidatedGetError,
+    ContextLostGetFenceivNV,
+    ContextLostGetFixedv,
+    ContextLostGetFloatv,
+    ContextLostGetFloatvRobustANGLE,
+    ContextLostGetFragDataIndexEXT,
+    ContextLostGetFragDataLocation,
+    ContextLostGetFramebufferAttachmentParameteriv,
+    ContextLostGetFramebufferAttachmentParameterivOES,
+    ContextLostGetFramebufferAttachmentParameterivRobustANGLE,
+    ContextLostGetFramebufferParameteriv,
+    ContextLostGetFramebufferParameterivRobustANGLE,
+    ValidatedGetGraphicsResetStatusEXT,
+    ContextLostGetInteger64i_v,
+    ContextLostGetInteger64i_vRobustANGLE,
+    ContextLostGetInteger64v,
+    ContextLostGetInteger64vRobustANGLE,
+    ContextLostGetIntegeri_v,
+    ContextLostGetIntegeri_vRobustANGLE,
+    ContextLostGetIntegerv,
+    ContextLostGetIntegervRobustANGLE,
+    ContextLostGetInternalformativ,
+    ContextLostGetInternalformativRobustANGLE,
+    ContextLostGetLightfv,
+    ContextLostGetLightxv,
+    ContextLostGetMaterialfv,
+    ContextLostGetMaterialxv,
+    ContextLostGetMemoryObjectParameterivEXT,
+    ContextLostGetMultisamplefv,
+    ContextLostGetMultisamplefvANGLE,
+    ContextLostGetMultisamplefvRobustANGLE,
+    ContextLostGetObjectLabelKHR,
+    ContextLostGetObjectPtrLabelKHR,
+    ContextLostGetPathParameterfvCHROMIUM,
+    ContextLostGetPathParameterivCHROMIUM,
+    ContextLostGetPointerv,
+    ContextLostGetPointervKHR,
+    ContextLostGetPointervRobustANGLERobustANGLE,
+    ContextLostGetProgramBinary,
+    ContextLostGetProgramBinaryOES,
+    ContextLostGetProgramInfoLog,
+    ContextLostGetProgramInterfaceiv,
+    ContextLostGetProgramInterfaceivRobustANGLE,
+    ContextLostGetProgramPipelineInfoLog,
+    ContextLostGetProgramPipelineiv,
+    ContextLostGetProgramResourceIndex,
+    ContextLostGetProgramResourceLocation,
+    ContextLostGetProgramResourceLocationIndexEXT,
+    ContextLostGetProgramResourceName,
+    ContextLostGetProgramResourceiv,
+    ContextLostGetProgramiv,
+    ContextLostGetProgramivRobustANGLE,
+    ContextLostGetQueryObjecti64vEXT,
+    ContextLostGetQueryObjecti64vRobustANGLE,
+    ContextLostGetQueryObjectivEXT,
+    ContextLostGetQueryObjectivRobustANGLE,
+    ContextLostGetQueryObjectui64vEXT,
+    ContextLostGetQueryObjectui64vRobustANGLE,
+    ContextLostGetQueryObjectuiv,
+    ContextLostGetQueryObjectuivEXT,
+    ContextLostGetQueryObjectuivRobustANGLE,
+    ContextLostGetQueryiv,
+    ContextLostGetQueryivEXT,
+    ContextLostGetQueryivRobustANGLE,
+    ContextLostGetRenderbufferParameteriv,
+    ContextLostGetRenderbufferParameterivOES,
+    ContextLostGetRenderbufferParameterivRobustANGLE,
+    ContextLostGetSamplerParameterIivOES,
+    ContextLostGetSamplerParameterIivRobustANGLE,
+    ContextLostGetSamplerParameterIuivOES,
+    ContextLostGetSamplerParameterIuivRobustANGLE,
+    ContextLostGetSamplerParameterfv,
+    ContextLostGetSamplerParameterfvRobustANGLE,
+    ContextLostGetSamplerParameteriv,
+    ContextLostGetSamplerParameterivRobustANGLE,
+    ContextLostGetSemaphoreParameterui64vEXT,
+    ContextLostGetShaderInfoLog,
+    ContextLostGetShaderPrecisionFormat,
+    ContextLostGetShaderSource,
+    ContextLostGetShaderiv,
+    ContextLostGetShaderivRobustANGLE,
+    ContextLostGetString,
+    ContextLostGetStringi,
+    ContextLostGetSynciv,
+    ContextLostGetTexEnvfv,
+    ContextLostGetTexEnviv,
+    ContextLostGetTexEnvxv,
+    ContextLostGetTexGenfvOES,
+    ContextLostGetTexGenivOES,
+    ContextLostGetTexGenxvOES,
+    ContextLostGetTexLevelParameterfv,
+    ContextLostGetTexLevelParameterfvANGLE,
+    ContextLostGetTexLevelParameterfvRobustANGLE,
+    ContextLostGetTexLevelParameteriv,
+    ContextLostGetTexLevelParameterivANGLE,
+    ContextLostGetTexLevelParameterivRobustANGLE,
+    ContextLostGetTexParameterIivOES,
+    ContextLostGetTexParameterIivRobustANGLE,
+    ContextLostGetTexParameterIuivOES,
+    ContextLostGetTexParameterIuivRobustANGLE,
+    ContextLostGetTexParameterfv,
+    ContextLostGetTexParameterfvRobustANGLE,
+    ContextLostGetTexParameteriv,
+    ContextLostGetTexParameterivRobustANGLE,
+    ContextLostGetTexParameterxv,
+    ContextLostGetTransformFeedbackVarying,
+    ContextLostGetTranslatedShaderSourceANGLE,
+    ContextLostGetUniformBlockIndex,
+    ContextLostGetUniformIndices,
+    ContextLostGetUniformLocation,
+    ContextLostGetUniformfv,
+    ContextLostGetUniformfvRobustANGLE,
+    ContextLostGetUniformiv,
+    ContextLostGetUniformivRobustANGLE,
+    ContextLostGetUniformuiv,
+    ContextLostGetUniformuivRobustANGLE,
+    ContextLostGetUnsignedBytei_vEXT,
+    ContextLostGetUnsignedBytevEXT,
+    ContextLostGetVertexAttribIiv,
+    ContextLostGetVertexAttribIivRobustANGLE,
+    ContextLostGetVertexAttribIuiv,
+    ContextLostGetVertexAttribIuivRobustANGLE,
+    ContextLostGetVertexAttribPointerv,
+    ContextLostGetVertexAttribPointervRobustANGLE,
+    ContextLostGetVertexAttribfv,
+    ContextLostGetVertexAttribfvRobustANGLE,
+    ContextLostGetVertexAttribiv,
+    ContextLostGetVertexAttribivRobustANGLE,
+    ContextLostGetnUniformfvEXT,
+    ContextLostGetnUniformfvRobustANGLE,
+    ContextLostGetnUniformivEXT,
+    ContextLostGetnUniformivRobustANGLE,
+    ContextLostGetnUniformuivRobustANGLE,
+    ContextLostHint,
+    ContextLostImportMemoryFdEXT,
+    ContextLostImportSemaphoreFdEXT,
+    ContextLostInsertEventMarkerEXT,
+    ContextLostInvalidateFramebuffer,
+    ContextLostInvalidateSubFramebuffer,
+    ContextLostIsBuffer,
+    ContextLostIsEnabled,
+    ContextLostIsFenceNV,
+    ContextLostIsFramebuffer,
+    ContextLostIsFramebufferOES,
+    ContextLostIsMemoryObjectEXT,
+    ContextLostIsPathCHROMIUM,
+    ContextLostIsProgram,
+    ContextLostIsProgramPipeline,
+    ContextLostIsQuery,
+    ContextLostIsQueryEXT,
+    ContextLostIsRenderbuffer,
+    ContextLostIsRenderbufferOES,
+    ContextLostIsSampler,
+    ContextLostIsSemaphoreEXT,
+    ContextLostIsShader,
+    ContextLostIsSync,
+    ContextLostIsTexture,
+    ContextLostIsTransformFeedback,
+    ContextLostIsVertexArray,
+    ContextLostIsVertexArrayOES,
+    ContextLostLightModelf,
+    ContextLostLightModelfv,
+    ContextLostLightModelx,
+    ContextLostLightModelxv,
+    ContextLostLightf,
+    ContextLostLightfv,
+    ContextLostLightx,
+    ContextLostLightxv,
+    ContextLostLineWidth,
+    ContextLostLineWidthx,
+    ContextLostLinkProgram,
+    ContextLostLoadIdentity,
+    ContextLostLoadMatrixf,
+    ContextLostLoadMatrixx,
+    ContextLostLoadPaletteFromModelViewMatrixOES,
+    ContextLostLogicOp,
+    ContextLostLoseContextCHROMIUM,
+    ContextLostMapBufferOES,
+    ContextLostMapBufferRange,
+    ContextLostMapBufferRangeEXT,
+    ContextLostMaterialf,
+    ContextLostMaterialfv,
+    ContextLostMaterialx,
+    ContextLostMaterialxv,
+    ContextLostMatrixIndexPointerOES,
+    ContextLostMatrixLoadIdentityCHROMIUM,
+    ContextLostMatrixLoadfCHROMIUM,
+    ContextLostMatrixMode,
+    ContextLostMaxShaderCompilerThreadsKHR,
+    ContextLostMemoryBarrier,
+    ContextLostMemoryBarrierByRegion,
+    ContextLostMemoryObjectParameterivEXT,
+    ContextLostMultMatrixf,
+    ContextLostMultMatrixx,
+    ContextLostMultiDrawArraysANGLE,
+    ContextLostMultiDrawArraysInstancedANGLE,
+    ContextLostMultiDrawElementsANGLE,
+    ContextLostMultiDrawElementsInstancedANGLE,
+    ContextLostMultiTexCoord4f,
+    ContextLostMultiTexCoord4x,
+    ContextLostNormal3f,
+    ContextLostNormal3x,
+    ContextLostNormalPointer,
+    ContextLostObjectLabelKHR,
+    ContextLostObjectPtrLabelKHR,
+    ContextLostOrthof,
+    ContextLostOrthox,
+    ContextLostPathCommandsCHROMIUM,
+    ContextLostPathParameterfCHROMIUM,
+    ContextLostPathParameteriCHROMIUM,
+    ContextLostPathStencilFuncCHROMIUM,
+    ContextLostPauseTransformFeedback,
+    ContextLostPixelStorei,
+    ContextLostPointParameterf,
+    ContextLostPointParameterfv,
+    ContextLostPointParameterx,
+    ContextLostPointParameterxv,
+    ContextLostPointSize,
+    ContextLostPointSizePointerOES,
+    ContextLostPointSizex,
+    ContextLostPolygonOffset,
+    ContextLostPolygonOffsetx,
+    ContextLostPopDebugGroupKHR,
+    ContextLostPopGroupMarkerEXT,
+    ContextLostPopMatrix,
+    ContextLostProgramBinary,
+    ContextLostProgramBinaryOES,
+    ContextLostProgramParameteri,
+    ContextLostProgramPathFragmentInputGenCHROMIUM,
+    ContextLostProgramUniform1f,
+    ContextLostProgramUniform1fv,
+    ContextLostProgramUniform1i,
+    ContextLostProgramUniform1iv,
+    ContextLostProgramUniform1ui,
+    ContextLostProgramUniform1uiv,
+    ContextLostProgramUniform2f,
+    ContextLostProgramUniform2fv,
+    ContextLostProgramUniform2i,
+    ContextLostProgramUniform2iv,
+    ContextLostProgramUniform2ui,
+    ContextLostProgramUniform2uiv,
+    ContextLostProgramUniform3f,
+    ContextLostProgramUniform3fv,
+    ContextLostProgramUniform3i,
+    ContextLostProgramUniform3iv,
+    ContextLostProgramUniform3ui,
+    ContextLostProgramUniform3uiv,
+    ContextLostProgramUniform4f,
+    ContextLostProgramUniform4fv,
+    ContextLostProgramUniform4i,
+    ContextLostProgramUniform4iv,
+    ContextLostProgramUniform4ui,
+    ContextLostProgramUniform4uiv,
+    ContextLostProgramUniformMatrix2fv,
+    ContextLostProgramUniformMatrix2x3fv,
+    ContextLostProgramUniformMatrix2x4fv,
+    ContextLostProgramUniformMatrix3fv,
+    ContextLostProgramUniformMatrix3x2fv,
+    ContextLostProgramUniformMatrix3x4fv,
+    ContextLostProgramUniformMatrix4fv,
+    ContextLostProgramUniformMatrix4x2fv,
+    ContextLostProgramUniformMatrix4x3fv,
+    ContextLostProvokingVertexANGLE,
+    ContextLostPushDebugGroupKHR,
+    ContextLostPushGroupMarkerEXT,
+    ContextLostPushMatrix,
+    ContextLostQueryCounterEXT,
+    ContextLostQueryMatrixxOES,
+    ContextLostReadBuffer,
+    ContextLostReadPixels,
+    ContextLostReadPixelsRobustANGLE,
+    ContextLostReadnPixelsEXT,
+    ContextLostReadnPixelsRobustANGLE,
+    ContextLostReleaseShaderCompiler,
+    ContextLostRenderbufferStorage,
+    ContextLostRenderbufferStorageMultisample,
+    ContextLostRenderbufferStorageMultisampleANGLE,
+    ContextLostRenderbufferStorageOES,
+    ContextLostRequestExtensionANGLE,
+    ContextLostResumeTransformFeedback,
+    ContextLostRotatef,
+    ContextLostRotatex,
+    ContextLostSampleCoverage,
+    ContextLostSampleCoveragex,
+    ContextLostSampleMaski,
+    ContextLostSampleMaskiANGLE,
+    ContextLostSamplerParameterIivOES,
+    ContextLostSamplerParameterIivRobustANGLE,
+    ContextLostSamplerParameterIuivOES,
+    ContextLostSamplerParameterIuivRobustANGLE,
+    ContextLostSamplerParameterf,
+    ContextLostSamplerParameterfv,
+    ContextLostSamplerParameterfvRobustANGLE,
+    ContextLostSamplerParameteri,
+    ContextLostSamplerParameteriv,
+    ContextLostSamplerParameterivRobustANGLE,
+    ContextLostScalef,
+    ContextLostScalex,
+    ContextLostScissor,
+    ContextLostSemaphoreParameterui64vEXT,
+    ContextLostSetFenceNV,
+    ContextLostShadeModel,
+    ContextLostShaderBinary,
+    ContextLostShaderSource,
+    ContextLostSignalSemaphoreEXT,
+    ContextLostStencilFillPathCHROMIUM,
+    ContextLostStencilFillPathInstancedCHROMIUM,
+    ContextLostStencilFunc,
+    ContextLostStencilFuncSeparate,
+    ContextLostStencilMask,
+    ContextLostStencilMaskSeparate,
+    ContextLostStencilOp,
+    ContextLostStencilOpSeparate,
+    ContextLostStencilStrokePathCHROMIUM,
+    ContextLostStencilStrokePathInstancedCHROMIUM,
+    ContextLostStencilThenCoverFillPathCHROMIUM,
+    ContextLostStencilThenCoverFillPathInstancedCHROMIUM,
+    ContextLostStencilThenCoverStrokePathCHROMIUM,
+    ContextLostStencilThenCoverStrokePathInstancedCHROMIUM,
+    ContextLostTestFenceNV,
+    ContextLostTexCoordPointer,
+    ContextLostTexEnvf,
+    ContextLostTexEnvfv,
+    ContextLostTexEnvi,
+    ContextLostTexEnviv,
+    ContextLostTexEnvx,
+    ContextLostTexEnvxv,
+    ContextLostTexGenfOES,
+    ContextLostTexGenfvOES,
+    ContextLostTexGeniOES,
+    ContextLostTexGenivOES,
+    ContextLostTexGenxOES,
+    ContextLostTexGenxvOES,
+    ContextLostTexImage2D,
+    ContextLostTexImage2DRobustANGLE,
+    ContextLostTexImage3D,
+    ContextLostTexImage3DRobustANGLE,
+    ContextLostTexParameterIivOES,
+    ContextLostTexParameterIivRobustANGLE,
+    ContextLostTexParameterIuivOES,
+    ContextLostTexParameterIuivRobustANGLE,
+    ContextLostTexParameterf,
+    ContextLostTexParameterfv,
+    ContextLostTexParameterfvRobustANGLE,
+    ContextLostTexParameteri,
+    ContextLostTexParameteriv,
+    ContextLostTexParameterivRobustANGLE,
+    ContextLostTexParameterx,
+    ContextLostTexParameterxv,
+    ContextLostTexStorage1DEXT,
+    ContextLostTexStorage2D,
+    ContextLostTexStorage2DEXT,
+    ContextLostTexStorage2DMultisample,
+    ContextLostTexStorage2DMultisampleANGLE,
+    ContextLostTexStorage3D,
+    ContextLostTexStorage3DEXT,
+    ContextLostTexStorage3DMultisampleOES,
+    ContextLostTexStorageMem2DEXT,
+    ContextLostTexStorageMem2DMultisampleEXT,
+    ContextLostTexStorageMem3DEXT,
+    ContextLostTexStorageMem3DMultisampleEXT,
+    ContextLostTexSubImage2D,
+    ContextLostTexSubImage2DRobustANGLE,
+    ContextLostTexSubImage3D,
+    ContextLostTexSubImage3DRobustANGLE,
+    ContextLostTransformFeedbackVaryings,
+    ContextLostTranslatef,
+    ContextLostTranslatex,
+    ContextLostUniform1f,
+    ContextLostUniform1fv,
+    ContextLostUniform1i,
+    ContextLostUniform1iv,
+    ContextLostUniform1ui,
+    ContextLostUniform1uiv,
+    ContextLostUniform2f,
+    ContextLostUniform2fv,
+    ContextLostUniform2i,
+    ContextLostUniform2iv,
+    ContextLostUniform2ui,
+    ContextLostUniform2uiv,
+    ContextLostUniform3f,
+    ContextLostUniform3fv,
+    ContextLostUniform3i,
+    ContextLostUniform3iv,
+    ContextLostUniform3ui,
+    ContextLostUniform3uiv,
+    ContextLostUniform4f,
+    ContextLostUniform4fv,
+    ContextLostUniform4i,
+    ContextLostUniform4iv,
+    ContextLostUniform4ui,
+    ContextLostUniform4uiv,
+    ContextLostUniformBlockBinding,
+    ContextLostUniformMatrix2fv,
+    ContextLostUniformMatrix2x3fv,
+    ContextLostUniformMatrix2x4fv,
+    ContextLostUniformMatrix3fv,
+    ContextLostUniformMatrix3x2fv,
+    ContextLostUniformMatrix3x4fv,
+    ContextLostUniformMatrix4fv,
+    ContextLostUniformMatrix4x2fv,
+    ContextLostUniformMatrix4x3fv,
+    ContextLostUnmapBuffer,
+    ContextLostUnmapBufferOES,
+    ContextLostUseProgram,
+    ContextLostUseProgramStages,
+    ContextLostValidateProgram,
+    ContextLostValidateProgramPipeline,
+    ContextLostVertexAttrib1f,
+    ContextLostVertexAttrib1fv,
+    ContextLostVertexAttrib2f,
+    ContextLostVertexAttrib2fv,
+    ContextLostVertexAttrib3f,
+    ContextLostVertexAttrib3fv,
+    ContextLostVertexAttrib4f,
+    ContextLostVertexAttrib4fv,
+    ContextLostVertexAttribBinding,
+    ContextLostVertexAttribDivisor,
+    ContextLostVertexAttribDivisorANGLE,
+    ContextLostVertexAttribDivisorEXT,
+    ContextLostVertexAttribFormat,
+    ContextLostVertexAttribI4i,
+    ContextLostVertexAttribI4iv,
+    ContextLostVertexAttribI4ui,
+    ContextLostVertexAttribI4uiv,
+    ContextLostVertexAttribIFormat,
+    ContextLostVertexAttribIPointer,
+    ContextLostVertexAttribPointer,
+    ContextLostVertexBindingDivisor,
+    ContextLostVertexPointer,
+    ContextLostViewport,
+    ContextLostWaitSemaphoreEXT,
+    ContextLostWaitSync,
+    ContextLostWeightPointerOES,
+};
+}  // namespace gl
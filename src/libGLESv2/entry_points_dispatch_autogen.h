@@ -0,0 +1,2122 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_dispatch_autogen.h:
+//   Tables of the functions the GLES entry points call with the current context. The context
+//   selects its table when it is made current, depending on whether it skips validation, and
+//   switches to the context lost table when it is lost.
+
+#ifndef LIBGLESV2_ENTRY_POINTS_DISPATCH_AUTOGEN_H_
+#define LIBGLESV2_ENTRY_POINTS_DISPATCH_AUTOGEN_H_
+
+#include "angle_gl.h"
+
+namespace gl
+{
+class Context;
+
+struct DispatchTable
+{
+    void (*ActiveShaderProgram)(Context *context, GLuint pipeline, GLuint program);
+    void (*ActiveTexture)(Context *context, GLenum texture);
+    void (*AlphaFunc)(Context *context, GLenum func, GLfloat ref);
+    void (*AlphaFuncx)(Context *context, GLenum func, GLfixed ref);
+    void (*AttachShader)(Context *context, GLuint program, GLuint shader);
+    void (*BeginQuery)(Context *context, GLenum target, GLuint id);
+    void (*BeginQueryEXT)(Context *context, GLenum target, GLuint id);
+    void (*BeginTransformFeedback)(Context *context, GLenum primitiveMode);
+    void (*BindAttribLocation)(Context *context, GLuint program, GLuint index, const GLchar *name);
+    void (*BindBuffer)(Context *context, GLenum target, GLuint buffer);
+    void (*BindBufferBase)(Context *context, GLenum target, GLuint index, GLuint buffer);
+    void (*BindBufferRange)(Context *context,
+                            GLenum target,
+                            GLuint index,
+                            GLuint buffer,
+                            GLintptr offset,
+                            GLsizeiptr size);
+    void (*BindFragDataLocationEXT)(Context *context,
+                                    GLuint program,
+                                    GLuint color,
+                                    const GLchar *name);
+    void (*BindFragDataLocationIndexedEXT)(Context *context,
+                                           GLuint program,
+                                           GLuint colorNumber,
+                                           GLuint index,
+                                           const GLchar *name);
+    void (*BindFragmentInputLocationCHROMIUM)(Context *context,
+                                              GLuint programs,
+                                              GLint location,
+                                              const GLchar *name);
+    void (*BindFramebuffer)(Context *context, GLenum target, GLuint framebuffer);
+    void (*BindFramebufferOES)(Context *context, GLenum target, GLuint framebuffer);
+    void (*BindImageTexture)(Context *context,
+                             GLuint unit,
+                             GLuint texture,
+                             GLint level,
+                             GLboolean layered,
+                             GLint layer,
+                             GLenum access,
+                             GLenum format);
+    void (*BindProgramPipeline)(Context *context, GLuint pipeline);
+    void (*BindRenderbuffer)(Context *context, GLenum target, GLuint renderbuffer);
+    void (*BindRenderbufferOES)(Context *context, GLenum target, GLuint renderbuffer);
+    void (*BindSampler)(Context *context, GLuint unit, GLuint sampler);
+    void (*BindTexture)(Context *context, GLenum target, GLuint texture);
+    void (*BindTransformFeedback)(Context *context, GLenum target, GLuint id);
+    void (*BindUniformLocationCHROMIUM)(Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        const GLchar *name);
+    void (*BindVertexArray)(Context *context, GLuint array);
+    void (*BindVertexArrayOES)(Context *context, GLuint array);
+    void (*BindVertexBuffer)(Context *context,
+                             GLuint bindingindex,
+                             GLuint buffer,
+                             GLintptr offset,
+                             GLsizei stride);
+    void (*BlendColor)(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha);
+    void (*BlendEquation)(Context *context, GLenum mode);
+    void (*BlendEquationSeparate)(Context *context, GLenum modeRGB, GLenum modeAlpha);
+    void (*BlendFunc)(Context *context, GLenum sfactor, GLenum dfactor);
+    void (*BlendFuncSeparate)(Context *context,
+                              GLenum sfactorRGB,
+                              GLenum dfactorRGB,
+                              GLenum sfactorAlpha,
+                              GLenum dfactorAlpha);
+    void (*BlitFramebuffer)(Context *context,
+                            GLint srcX0,
+                            GLint srcY0,
+                            GLint srcX1,
+                            GLint srcY1,
+                            GLint dstX0,
+                            GLint dstY0,
+                            GLint dstX1,
+                            GLint dstY1,
+                            GLbitfield mask,
+                            GLenum filter);
+    void (*BlitFramebufferANGLE)(Context *context,
+                                 GLint srcX0,
+                                 GLint srcY0,
+                                 GLint srcX1,
+                                 GLint srcY1,
+                                 GLint dstX0,
+                                 GLint dstY0,
+                                 GLint dstX1,
+                                 GLint dstY1,
+                                 GLbitfield mask,
+                                 GLenum filter);
+    void (*BufferData)(Context *context,
+                       GLenum target,
+                       GLsizeiptr size,
+                       const void *data,
+                       GLenum usage);
+    void (*BufferStorageMemEXT)(Context *context,
+                                GLenum target,
+                                GLsizeiptr size,
+                                GLuint memory,
+                                GLuint64 offset);
+    void (*BufferSubData)(Context *context,
+                          GLenum target,
+                          GLintptr offset,
+                          GLsizeiptr size,
+                          const void *data);
+    GLenum (*CheckFramebufferStatus)(Context *context, GLenum target);
+    GLenum (*CheckFramebufferStatusOES)(Context *context, GLenum target);
+    void (*Clear)(Context *context, GLbitfield mask);
+    void (*ClearBufferfi)(Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          GLfloat depth,
+                          GLint stencil);
+    void (*ClearBufferfv)(Context *context, GLenum buffer, GLint drawbuffer, const GLfloat *value);
+    void (*ClearBufferiv)(Context *context, GLenum buffer, GLint drawbuffer, const GLint *value);
+    void (*ClearBufferuiv)(Context *context, GLenum buffer, GLint drawbuffer, const GLuint *value);
+    void (*ClearColor)(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha);
+    void (*ClearColorx)(Context *context, GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha);
+    void (*ClearDepthf)(Context *context, GLfloat d);
+    void (*ClearDepthx)(Context *context, GLfixed depth);
+    void (*ClearStencil)(Context *context, GLint s);
+    void (*ClientActiveTexture)(Context *context, GLenum texture);
+    GLenum (*ClientWaitSync)(Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout);
+    void (*ClipPlanef)(Context *context, GLenum p, const GLfloat *eqn);
+    void (*ClipPlanex)(Context *context, GLenum plane, const GLfixed *equation);
+    void (*Color4f)(Context *context, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha);
+    void (*Color4ub)(Context *context, GLubyte red, GLubyte green, GLubyte blue, GLubyte alpha);
+    void (*Color4x)(Context *context, GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha);
+    void (*ColorMask)(Context *context,
+                      GLboolean red,
+                      GLboolean green,
+                      GLboolean blue,
+                      GLboolean alpha);
+    void (*ColorPointer)(Context *context,
+                         GLint size,
+                         GLenum type,
+                         GLsizei stride,
+                         const void *pointer);
+    void (*CompileShader)(Context *context, GLuint shader);
+    void (*CompressedCopyTextureCHROMIUM)(Context *context, GLuint sourceId, GLuint destId);
+    void (*CompressedTexImage2D)(Context *context,
+                                 GLenum target,
+                                 GLint level,
+                                 GLenum internalformat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLint border,
+                                 GLsizei imageSize,
+                                 const void *data);
+    void (*CompressedTexImage2DRobustANGLE)(Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum internalformat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLint border,
+                                            GLsizei imageSize,
+                                            GLsizei dataSize,
+                                            const GLvoid *data);
+    void (*CompressedTexImage3D)(Context *context,
+                                 GLenum target,
+                                 GLint level,
+                                 GLenum internalformat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLsizei depth,
+                                 GLint border,
+                                 GLsizei imageSize,
+                                 const void *data);
+    void (*CompressedTexImage3DRobustANGLE)(Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum internalformat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLsizei depth,
+                                            GLint border,
+                                            GLsizei imageSize,
+                                            GLsizei dataSize,
+                                            const GLvoid *data);
+    void (*CompressedTexSubImage2D)(Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLenum format,
+                                    GLsizei imageSize,
+                                    const void *data);
+    void (*CompressedTexSubImage2DRobustANGLE)(Context *context,
+                                               GLenum target,
+                                               GLint level,
+                                               GLsizei xoffset,
+                                               GLsizei yoffset,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLenum format,
+                                               GLsizei imageSize,
+                                               GLsizei dataSize,
+                                               const GLvoid *data);
+    void (*CompressedTexSubImage3D)(Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLint zoffset,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLsizei depth,
+                                    GLenum format,
+                                    GLsizei imageSize,
+                                    const void *data);
+    void (*CompressedTexSubImage3DRobustANGLE)(Context *context,
+                                               GLenum target,
+                                               GLint level,
+                                               GLint xoffset,
+                                               GLint yoffset,
+                                               GLint zoffset,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLsizei depth,
+                                               GLenum format,
+                                               GLsizei imageSize,
+                                               GLsizei dataSize,
+                                               const GLvoid *data);
+    void (*CopyBufferSubData)(Context *context,
+                              GLenum readTarget,
+                              GLenum writeTarget,
+                              GLintptr readOffset,
+                              GLintptr writeOffset,
+                              GLsizeiptr size);
+    void (*CopySubTexture3DANGLE)(Context *context,
+                                  GLuint sourceId,
+                                  GLint sourceLevel,
+                                  GLenum destTarget,
+                                  GLuint destId,
+                                  GLint destLevel,
+                                  GLint xoffset,
+                                  GLint yoffset,
+                                  GLint zoffset,
+                                  GLint x,
+                                  GLint y,
+                                  GLint z,
+                                  GLint width,
+                                  GLint height,
+                                  GLint depth,
+                                  GLboolean unpackFlipY,
+                                  GLboolean unpackPremultiplyAlpha,
+                                  GLboolean unpackUnmultiplyAlpha);
+    void (*CopySubTextureCHROMIUM)(Context *context,
+                                   GLuint sourceId,
+                                   GLint sourceLevel,
+                                   GLenum destTarget,
+                                   GLuint destId,
+                                   GLint destLevel,
+                                   GLint xoffset,
+                                   GLint yoffset,
+                                   GLint x,
+                                   GLint y,
+                                   GLint width,
+                                   GLint height,
+                                   GLboolean unpackFlipY,
+                                   GLboolean unpackPremultiplyAlpha,
+                                   GLboolean unpackUnmultiplyAlpha);
+    void (*CopyTexImage2D)(Context *context,
+                           GLenum target,
+                           GLint level,
+                           GLenum internalformat,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLint border);
+    void (*CopyTexSubImage2D)(Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint x,
+                              GLint y,
+                              GLsizei width,
+                              GLsizei height);
+    void (*CopyTexSubImage3D)(Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint zoffset,
+                              GLint x,
+                              GLint y,
+                              GLsizei width,
+                              GLsizei height);
+    void (*CopyTexture3DANGLE)(Context *context,
+                               GLuint sourceId,
+                               GLint sourceLevel,
+                               GLenum destTarget,
+                               GLuint destId,
+                               GLint destLevel,
+                               GLint internalFormat,
+                               GLenum destType,
+                               GLboolean unpackFlipY,
+                               GLboolean unpackPremultiplyAlpha,
+                               GLboolean unpackUnmultiplyAlpha);
+    void (*CopyTextureCHROMIUM)(Context *context,
+                                GLuint sourceId,
+                                GLint sourceLevel,
+                                GLenum destTarget,
+                                GLuint destId,
+                                GLint destLevel,
+                                GLint internalFormat,
+                                GLenum destType,
+                                GLboolean unpackFlipY,
+                                GLboolean unpackPremultiplyAlpha,
+                                GLboolean unpackUnmultiplyAlpha);
+    void (*CoverFillPathCHROMIUM)(Context *context, GLuint path, GLenum coverMode);
+    void (*CoverFillPathInstancedCHROMIUM)(Context *context,
+                                           GLsizei numPath,
+                                           GLenum pathNameType,
+                                           const void *paths,
+                                           GLuint pathBase,
+                                           GLenum coverMode,
+                                           GLenum transformType,
+                                           const GLfloat *transformValues);
+    void (*CoverStrokePathCHROMIUM)(Context *context, GLuint path, GLenum coverMode);
+    void (*CoverStrokePathInstancedCHROMIUM)(Context *context,
+                                             GLsizei numPath,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum coverMode,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues);
+    void (*CoverageModulationCHROMIUM)(Context *context, GLenum components);
+    void (*CreateMemoryObjectsEXT)(Context *context, GLsizei n, GLuint *memoryObjects);
+    GLuint (*CreateProgram)(Context *context);
+    GLuint (*CreateShader)(Context *context, GLenum type);
+    GLuint (*CreateShaderProgramv)(Context *context,
+                                   GLenum type,
+                                   GLsizei count,
+                                   const GLchar *const *strings);
+    void (*CullFace)(Context *context, GLenum mode);
+    void (*CurrentPaletteMatrixOES)(Context *context, GLuint matrixpaletteindex);
+    void (*DebugMessageCallbackKHR)(Context *context,
+                                    GLDEBUGPROCKHR callback,
+                                    const void *userParam);
+    void (*DebugMessageControlKHR)(Context *context,
+                                   GLenum source,
+                                   GLenum type,
+                                   GLenum severity,
+                                   GLsizei count,
+                                   const GLuint *ids,
+                                   GLboolean enabled);
+    void (*DebugMessageInsertKHR)(Context *context,
+                                  GLenum source,
+                                  GLenum type,
+                                  GLuint id,
+                                  GLenum severity,
+                                  GLsizei length,
+                                  const GLchar *buf);
+    void (*DeleteBuffers)(Context *context, GLsizei n, const GLuint *buffers);
+    void (*DeleteFencesNV)(Context *context, GLsizei n, const GLuint *fences);
+    void (*DeleteFramebuffers)(Context *context, GLsizei n, const GLuint *framebuffers);
+    void (*DeleteFramebuffersOES)(Context *context, GLsizei n, const GLuint *framebuffers);
+    void (*DeleteMemoryObjectsEXT)(Context *context, GLsizei n, const GLuint *memoryObjects);
+    void (*DeletePathsCHROMIUM)(Context *context, GLuint first, GLsizei range);
+    void (*DeleteProgram)(Context *context, GLuint program);
+    void (*DeleteProgramPipelines)(Context *context, GLsizei n, const GLuint *pipelines);
+    void (*DeleteQueries)(Context *context, GLsizei n, const GLuint *ids);
+    void (*DeleteQueriesEXT)(Context *context, GLsizei n, const GLuint *ids);
+    void (*DeleteRenderbuffers)(Context *context, GLsizei n, const GLuint *renderbuffers);
+    void (*DeleteRenderbuffersOES)(Context *context, GLsizei n, const GLuint *renderbuffers);
+    void (*DeleteSamplers)(Context *context, GLsizei count, const GLuint *samplers);
+    void (*DeleteSemaphoresEXT)(Context *context, GLsizei n, const GLuint *semaphores);
+    void (*DeleteShader)(Context *context, GLuint shader);
+    void (*DeleteSync)(Context *context, GLsync sync);
+    void (*DeleteTextures)(Context *context, GLsizei n, const GLuint *textures);
+    void (*DeleteTransformFeedbacks)(Context *context, GLsizei n, const GLuint *ids);
+    void (*DeleteVertexArrays)(Context *context, GLsizei n, const GLuint *arrays);
+    void (*DeleteVertexArraysOES)(Context *context, GLsizei n, const GLuint *arrays);
+    void (*DepthFunc)(Context *context, GLenum func);
+    void (*DepthMask)(Context *context, GLboolean flag);
+    void (*DepthRangef)(Context *context, GLfloat n, GLfloat f);
+    void (*DepthRangex)(Context *context, GLfixed n, GLfixed f);
+    void (*DetachShader)(Context *context, GLuint program, GLuint shader);
+    void (*Disable)(Context *context, GLenum cap);
+    void (*DisableClientState)(Context *context, GLenum array);
+    void (*DisableVertexAttribArray)(Context *context, GLuint index);
+    void (*DiscardFramebufferEXT)(Context *context,
+                                  GLenum target,
+                                  GLsizei numAttachments,
+                                  const GLenum *attachments);
+    void (*DispatchCompute)(Context *context,
+                            GLuint num_groups_x,
+                            GLuint num_groups_y,
+                            GLuint num_groups_z);
+    void (*DispatchComputeIndirect)(Context *context, GLintptr indirect);
+    void (*DrawArrays)(Context *context, GLenum mode, GLint first, GLsizei count);
+    void (*DrawArraysIndirect)(Context *context, GLenum mode, const void *indirect);
+    void (*DrawArraysInstanced)(Context *context,
+                                GLenum mode,
+                                GLint first,
+                                GLsizei count,
+                                GLsizei instancecount);
+    void (*DrawArraysInstancedANGLE)(Context *context,
+                                     GLenum mode,
+                                     GLint first,
+                                     GLsizei count,
+                                     GLsizei primcount);
+    void (*DrawArraysInstancedEXT)(Context *context,
+                                   GLenum mode,
+                                   GLint start,
+                                   GLsizei count,
+                                   GLsizei primcount);
+    void (*DrawBuffers)(Context *context, GLsizei n, const GLenum *bufs);
+    void (*DrawBuffersEXT)(Context *context, GLsizei n, const GLenum *bufs);
+    void (*DrawElements)(Context *context,
+                         GLenum mode,
+                         GLsizei count,
+                         GLenum type,
+                         const void *indices);
+    void (*DrawElementsIndirect)(Context *context, GLenum mode, GLenum type, const void *indirect);
+    void (*DrawElementsInstanced)(Context *context,
+                                  GLenum mode,
+                                  GLsizei count,
+                                  GLenum type,
+                                  const void *indices,
+                                  GLsizei instancecount);
+    void (*DrawElementsInstancedANGLE)(Context *context,
+                                       GLenum mode,
+                                       GLsizei count,
+                                       GLenum type,
+                                       const void *indices,
+                                       GLsizei primcount);
+    void (*DrawElementsInstancedEXT)(Context *context,
+                                     GLenum mode,
+                                     GLsizei count,
+                                     GLenum type,
+                                     const void *indices,
+                                     GLsizei primcount);
+    void (*DrawRangeElements)(Context *context,
+                              GLenum mode,
+                              GLuint start,
+                              GLuint end,
+                              GLsizei count,
+                              GLenum type,
+                              const void *indices);
+    void (*DrawTexfOES)(Context *context,
+                        GLfloat x,
+                        GLfloat y,
+                        GLfloat z,
+                        GLfloat width,
+                        GLfloat height);
+    void (*DrawTexfvOES)(Context *context, const GLfloat *coords);
+    void (*DrawTexiOES)(Context *context, GLint x, GLint y, GLint z, GLint width, GLint height);
+    void (*DrawTexivOES)(Context *context, const GLint *coords);
+    void (*DrawTexsOES)(Context *context,
+                        GLshort x,
+                        GLshort y,
+                        GLshort z,
+                        GLshort width,
+                        GLshort height);
+    void (*DrawTexsvOES)(Context *context, const GLshort *coords);
+    void (*DrawTexxOES)(Context *context,
+                        GLfixed x,
+                        GLfixed y,
+                        GLfixed z,
+                        GLfixed width,
+                        GLfixed height);
+    void (*DrawTexxvOES)(Context *context, const GLfixed *coords);
+    void (*EGLImageTargetRenderbufferStorageOES)(Context *context,
+                                                 GLenum target,
+                                                 GLeglImageOES image);
+    void (*EGLImageTargetTexture2DOES)(Context *context, GLenum target, GLeglImageOES image);
+    void (*Enable)(Context *context, GLenum cap);
+    void (*EnableClientState)(Context *context, GLenum array);
+    void (*EnableVertexAttribArray)(Context *context, GLuint index);
+    void (*EndQuery)(Context *context, GLenum target);
+    void (*EndQueryEXT)(Context *context, GLenum target);
+    void (*EndTransformFeedback)(Context *context);
+    GLsync (*FenceSync)(Context *context, GLenum condition, GLbitfield flags);
+    void (*Finish)(Context *context);
+    void (*FinishFenceNV)(Context *context, GLuint fence);
+    void (*Flush)(Context *context);
+    void (*FlushMappedBufferRange)(Context *context,
+                                   GLenum target,
+                                   GLintptr offset,
+                                   GLsizeiptr length);
+    void (*FlushMappedBufferRangeEXT)(Context *context,
+                                      GLenum target,
+                                      GLintptr offset,
+                                      GLsizeiptr length);
+    void (*Fogf)(Context *context, GLenum pname, GLfloat param);
+    void (*Fogfv)(Context *context, GLenum pname, const GLfloat *params);
+    void (*Fogx)(Context *context, GLenum pname, GLfixed param);
+    void (*Fogxv)(Context *context, GLenum pname, const GLfixed *param);
+    void (*FramebufferParameteri)(Context *context, GLenum target, GLenum pname, GLint param);
+    void (*FramebufferRenderbuffer)(Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLenum renderbuffertarget,
+                                    GLuint renderbuffer);
+    void (*FramebufferRenderbufferOES)(Context *context,
+                                       GLenum target,
+                                       GLenum attachment,
+                                       GLenum renderbuffertarget,
+                                       GLuint renderbuffer);
+    void (*FramebufferTexture2D)(Context *context,
+                                 GLenum target,
+                                 GLenum attachment,
+                                 GLenum textarget,
+                                 GLuint texture,
+                                 GLint level);
+    void (*FramebufferTexture2DOES)(Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLenum textarget,
+                                    GLuint texture,
+                                    GLint level);
+    void (*FramebufferTextureEXT)(Context *context,
+                                  GLenum target,
+                                  GLenum attachment,
+                                  GLuint texture,
+                                  GLint level);
+    void (*FramebufferTextureLayer)(Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLuint texture,
+                                    GLint level,
+                                    GLint layer);
+    void (*FramebufferTextureMultiviewOVR)(Context *context,
+                                           GLenum target,
+                                           GLenum attachment,
+                                           GLuint texture,
+                                           GLint level,
+                                           GLint baseViewIndex,
+                                           GLsizei numViews);
+    void (*FrontFace)(Context *context, GLenum mode);
+    void (*Frustumf)(Context *context,
+                     GLfloat l,
+                     GLfloat r,
+                     GLfloat b,
+                     GLfloat t,
+                     GLfloat n,
+                     GLfloat f);
+    void (*Frustumx)(Context *context,
+                     GLfixed l,
+                     GLfixed r,
+                     GLfixed b,
+                     GLfixed t,
+                     GLfixed n,
+                     GLfixed f);
+    void (*GenBuffers)(Context *context, GLsizei n, GLuint *buffers);
+    void (*GenFencesNV)(Context *context, GLsizei n, GLuint *fences);
+    void (*GenFramebuffers)(Context *context, GLsizei n, GLuint *framebuffers);
+    void (*GenFramebuffersOES)(Context *context, GLsizei n, GLuint *framebuffers);
+    GLuint (*GenPathsCHROMIUM)(Context *context, GLsizei range);
+    void (*GenProgramPipelines)(Context *context, GLsizei n, GLuint *pipelines);
+    void (*GenQueries)(Context *context, GLsizei n, GLuint *ids);
+    void (*GenQueriesEXT)(Context *context, GLsizei n, GLuint *ids);
+    void (*GenRenderbuffers)(Context *context, GLsizei n, GLuint *renderbuffers);
+    void (*GenRenderbuffersOES)(Context *context, GLsizei n, GLuint *renderbuffers);
+    void (*GenSamplers)(Context *context, GLsizei count, GLuint *samplers);
+    void (*GenSemaphoresEXT)(Context *context, GLsizei n, GLuint *semaphores);
+    void (*GenTextures)(Context *context, GLsizei n, GLuint *textures);
+    void (*GenTransformFeedbacks)(Context *context, GLsizei n, GLuint *ids);
+    void (*GenVertexArrays)(Context *context, GLsizei n, GLuint *arrays);
+    void (*GenVertexArraysOES)(Context *context, GLsizei n, GLuint *arrays);
+    void (*GenerateMipmap)(Context *context, GLenum target);
+    void (*GenerateMipmapOES)(Context *context, GLenum target);
+    void (*GetActiveAttrib)(Context *context,
+                            GLuint program,
+                            GLuint index,
+                            GLsizei bufSize,
+                            GLsizei *length,
+                            GLint *size,
+                            GLenum *type,
+                            GLchar *name);
+    void (*GetActiveUniform)(Context *context,
+                             GLuint program,
+                             GLuint index,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLint *size,
+                             GLenum *type,
+                             GLchar *name);
+    void (*GetActiveUniformBlockName)(Context *context,
+                                      GLuint program,
+                                      GLuint uniformBlockIndex,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLchar *uniformBlockName);
+    void (*GetActiveUniformBlockiv)(Context *context,
+                                    GLuint program,
+                                    GLuint uniformBlockIndex,
+                                    GLenum pname,
+                                    GLint *params);
+    void (*GetActiveUniformBlockivRobustANGLE)(Context *context,
+                                               GLuint program,
+                                               GLuint uniformBlockIndex,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLint *params);
+    void (*GetActiveUniformsiv)(Context *context,
+                                GLuint program,
+                                GLsizei uniformCount,
+                                const GLuint *uniformIndices,
+                                GLenum pname,
+                                GLint *params);
+    void (*GetAttachedShaders)(Context *context,
+                               GLuint program,
+                               GLsizei maxCount,
+                               GLsizei *count,
+                               GLuint *shaders);
+    GLint (*GetAttribLocation)(Context *context, GLuint program, const GLchar *name);
+    void (*GetBooleani_v)(Context *context, GLenum target, GLuint index, GLboolean *data);
+    void (*GetBooleani_vRobustANGLE)(Context *context,
+                                     GLenum target,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLboolean *data);
+    void (*GetBooleanv)(Context *context, GLenum pname, GLboolean *data);
+    void (*GetBooleanvRobustANGLE)(Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLboolean *params);
+    void (*GetBufferParameteri64v)(Context *context, GLenum target, GLenum pname, GLint64 *params);
+    void (*GetBufferParameteri64vRobustANGLE)(Context *context,
+                                              GLenum target,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint64 *params);
+    void (*GetBufferParameteriv)(Context *context, GLenum target, GLenum pname, GLint *params);
+    void (*GetBufferParameterivRobustANGLE)(Context *context,
+                                            GLenum target,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            GLsizei *length,
+                                            GLint *params);
+    void (*GetBufferPointerv)(Context *context, GLenum target, GLenum pname, void **params);
+    void (*GetBufferPointervOES)(Context *context, GLenum target, GLenum pname, void **params);
+    void (*GetBufferPointervRobustANGLE)(Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         void **params);
+    void (*GetClipPlanef)(Context *context, GLenum plane, GLfloat *equation);
+    void (*GetClipPlanex)(Context *context, GLenum plane, GLfixed *equation);
+    GLuint (*GetDebugMessageLogKHR)(Context *context,
+                                    GLuint count,
+                                    GLsizei bufSize,
+                                    GLenum *sources,
+                                    GLenum *types,
+                                    GLuint *ids,
+                                    GLenum *severities,
+                                    GLsizei *lengths,
+                                    GLchar *messageLog);
+    GLenum (*GetError)(Context *context);
+    void (*GetFenceivNV)(Context *context, GLuint fence, GLenum pname, GLint *params);
+    void (*GetFixedv)(Context *context, GLenum pname, GLfixed *params);
+    void (*GetFloatv)(Context *context, GLenum pname, GLfloat *data);
+    void (*GetFloatvRobustANGLE)(Context *context,
+                                 GLenum pname,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLfloat *params);
+    GLint (*GetFragDataIndexEXT)(Context *context, GLuint program, const GLchar *name);
+    GLint (*GetFragDataLocation)(Context *context, GLuint program, const GLchar *name);
+    void (*GetFramebufferAttachmentParameteriv)(Context *context,
+                                                GLenum target,
+                                                GLenum attachment,
+                                                GLenum pname,
+                                                GLint *params);
+    void (*GetFramebufferAttachmentParameterivOES)(Context *context,
+                                                   GLenum target,
+                                                   GLenum attachment,
+                                                   GLenum pname,
+                                                   GLint *params);
+    void (*GetFramebufferAttachmentParameterivRobustANGLE)(Context *context,
+                                                           GLenum target,
+                                                           GLenum attachment,
+                                                           GLenum pname,
+                                                           GLsizei bufSize,
+                                                           GLsizei *length,
+                                                           GLint *params);
+    void (*GetFramebufferParameteriv)(Context *context, GLenum target, GLenum pname, GLint *params);
+    void (*GetFramebufferParameterivRobustANGLE)(Context *context,
+                                                 GLuint sampler,
+                                                 GLenum pname,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLint *params);
+    GLenum (*GetGraphicsResetStatusEXT)(Context *context);
+    void (*GetInteger64i_v)(Context *context, GLenum target, GLuint index, GLint64 *data);
+    void (*GetInteger64i_vRobustANGLE)(Context *context,
+                                       GLenum target,
+                                       GLuint index,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLint64 *data);
+    void (*GetInteger64v)(Context *context, GLenum pname, GLint64 *data);
+    void (*GetInteger64vRobustANGLE)(Context *context,
+                                     GLenum pname,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint64 *data);
+    void (*GetIntegeri_v)(Context *context, GLenum target, GLuint index, GLint *data);
+    void (*GetIntegeri_vRobustANGLE)(Context *context,
+                                     GLenum target,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *data);
+    void (*GetIntegerv)(Context *context, GLenum pname, GLint *data);
+    void (*GetIntegervRobustANGLE)(Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *data);
+    void (*GetInternalformativ)(Context *context,
+                                GLenum target,
+                                GLenum internalformat,
+                                GLenum pname,
+                                GLsizei bufSize,
+                                GLint *params);
+    void (*GetInternalformativRobustANGLE)(Context *context,
+                                           GLenum target,
+                                           GLenum internalformat,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLint *params);
+    void (*GetLightfv)(Context *context, GLenum light, GLenum pname, GLfloat *params);
+    void (*GetLightxv)(Context *context, GLenum light, GLenum pname, GLfixed *params);
+    void (*GetMaterialfv)(Context *context, GLenum face, GLenum pname, GLfloat *params);
+    void (*GetMaterialxv)(Context *context, GLenum face, GLenum pname, GLfixed *params);
+    void (*GetMemoryObjectParameterivEXT)(Context *context,
+                                          GLuint memoryObject,
+                                          GLenum pname,
+                                          GLint *params);
+    void (*GetMultisamplefv)(Context *context, GLenum pname, GLuint index, GLfloat *val);
+    void (*GetMultisamplefvANGLE)(Context *context, GLenum pname, GLuint index, GLfloat *val);
+    void (*GetMultisamplefvRobustANGLE)(Context *context,
+                                        GLenum pname,
+                                        GLuint index,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLfloat *val);
+    void (*GetObjectLabelKHR)(Context *context,
+                              GLenum identifier,
+                              GLuint name,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *label);
+    void (*GetObjectPtrLabelKHR)(Context *context,
+                                 const void *ptr,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLchar *label);
+    void (*GetPathParameterfvCHROMIUM)(Context *context, GLuint path, GLenum pname, GLfloat *value);
+    void (*GetPathParameterivCHROMIUM)(Context *context, GLuint path, GLenum pname, GLint *value);
+    void (*GetPointerv)(Context *context, GLenum pname, void **params);
+    void (*GetPointervKHR)(Context *context, GLenum pname, void **params);
+    void (*GetPointervRobustANGLERobustANGLE)(Context *context,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              void **params);
+    void (*GetProgramBinary)(Context *context,
+                             GLuint program,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLenum *binaryFormat,
+                             void *binary);
+    void (*GetProgramBinaryOES)(Context *context,
+                                GLuint program,
+                                GLsizei bufSize,
+                                GLsizei *length,
+                                GLenum *binaryFormat,
+                                void *binary);
+    void (*GetProgramInfoLog)(Context *context,
+                              GLuint program,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *infoLog);
+    void (*GetProgramInterfaceiv)(Context *context,
+                                  GLuint program,
+                                  GLenum programInterface,
+                                  GLenum pname,
+                                  GLint *params);
+    void (*GetProgramInterfaceivRobustANGLE)(Context *context,
+                                             GLuint program,
+                                             GLenum programInterface,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params);
+    void (*GetProgramPipelineInfoLog)(Context *context,
+                                      GLuint pipeline,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLchar *infoLog);
+    void (*GetProgramPipelineiv)(Context *context, GLuint pipeline, GLenum pname, GLint *params);
+    GLuint (*GetProgramResourceIndex)(Context *context,
+                                      GLuint program,
+                                      GLenum programInterface,
+                                      const GLchar *name);
+    GLint (*GetProgramResourceLocation)(Context *context,
+                                        GLuint program,
+                                        GLenum programInterface,
+                                        const GLchar *name);
+    GLint (*GetProgramResourceLocationIndexEXT)(Context *context,
+                                                GLuint program,
+                                                GLenum programInterface,
+                                                const GLchar *name);
+    void (*GetProgramResourceName)(Context *context,
+                                   GLuint program,
+                                   GLenum programInterface,
+                                   GLuint index,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLchar *name);
+    void (*GetProgramResourceiv)(Context *context,
+                                 GLuint program,
+                                 GLenum programInterface,
+                                 GLuint index,
+                                 GLsizei propCount,
+                                 const GLenum *props,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLint *params);
+    void (*GetProgramiv)(Context *context, GLuint program, GLenum pname, GLint *params);
+    void (*GetProgramivRobustANGLE)(Context *context,
+                                    GLuint program,
+                                    GLenum pname,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params);
+    void (*GetQueryObjecti64vEXT)(Context *context, GLuint id, GLenum pname, GLint64 *params);
+    void (*GetQueryObjecti64vRobustANGLE)(Context *context,
+                                          GLuint id,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint64 *params);
+    void (*GetQueryObjectivEXT)(Context *context, GLuint id, GLenum pname, GLint *params);
+    void (*GetQueryObjectivRobustANGLE)(Context *context,
+                                        GLuint id,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLint *params);
+    void (*GetQueryObjectui64vEXT)(Context *context, GLuint id, GLenum pname, GLuint64 *params);
+    void (*GetQueryObjectui64vRobustANGLE)(Context *context,
+                                           GLuint id,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint64 *params);
+    void (*GetQueryObjectuiv)(Context *context, GLuint id, GLenum pname, GLuint *params);
+    void (*GetQueryObjectuivEXT)(Context *context, GLuint id, GLenum pname, GLuint *params);
+    void (*GetQueryObjectuivRobustANGLE)(Context *context,
+                                         GLuint id,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLuint *params);
+    void (*GetQueryiv)(Context *context, GLenum target, GLenum pname, GLint *params);
+    void (*GetQueryivEXT)(Context *context, GLenum target, GLenum pname, GLint *params);
+    void (*GetQueryivRobustANGLE)(Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLint *params);
+    void (*GetRenderbufferParameteriv)(Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLint *params);
+    void (*GetRenderbufferParameterivOES)(Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLint *params);
+    void (*GetRenderbufferParameterivRobustANGLE)(Context *context,
+                                                  GLenum target,
+                                                  GLenum pname,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  GLint *params);
+    void (*GetSamplerParameterIivOES)(Context *context,
+                                      GLuint sampler,
+                                      GLenum pname,
+                                      GLint *params);
+    void (*GetSamplerParameterIivRobustANGLE)(Context *context,
+                                              GLuint sampler,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params);
+    void (*GetSamplerParameterIuivOES)(Context *context,
+                                       GLuint sampler,
+                                       GLenum pname,
+                                       GLuint *params);
+    void (*GetSamplerParameterIuivRobustANGLE)(Context *context,
+                                               GLuint sampler,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLuint *params);
+    void (*GetSamplerParameterfv)(Context *context, GLuint sampler, GLenum pname, GLfloat *params);
+    void (*GetSamplerParameterfvRobustANGLE)(Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLfloat *params);
+    void (*GetSamplerParameteriv)(Context *context, GLuint sampler, GLenum pname, GLint *params);
+    void (*GetSamplerParameterivRobustANGLE)(Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params);
+    void (*GetSemaphoreParameterui64vEXT)(Context *context,
+                                          GLuint semaphore,
+                                          GLenum pname,
+                                          GLuint64 *params);
+    void (*GetShaderInfoLog)(Context *context,
+                             GLuint shader,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLchar *infoLog);
+    void (*GetShaderPrecisionFormat)(Context *context,
+                                     GLenum shadertype,
+                                     GLenum precisiontype,
+                                     GLint *range,
+                                     GLint *precision);
+    void (*GetShaderSource)(Context *context,
+                            GLuint shader,
+                            GLsizei bufSize,
+                            GLsizei *length,
+                            GLchar *source);
+    void (*GetShaderiv)(Context *context, GLuint shader, GLenum pname, GLint *params);
+    void (*GetShaderivRobustANGLE)(Context *context,
+                                   GLuint shader,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *params);
+    const GLubyte *(*GetString)(Context *context, GLenum name);
+    const GLubyte *(*GetStringi)(Context *context, GLenum name, GLuint index);
+    void (*GetSynciv)(Context *context,
+                      GLsync sync,
+                      GLenum pname,
+                      GLsizei bufSize,
+                      GLsizei *length,
+                      GLint *values);
+    void (*GetTexEnvfv)(Context *context, GLenum target, GLenum pname, GLfloat *params);
+    void (*GetTexEnviv)(Context *context, GLenum target, GLenum pname, GLint *params);
+    void (*GetTexEnvxv)(Context *context, GLenum target, GLenum pname, GLfixed *params);
+    void (*GetTexGenfvOES)(Context *context, GLenum coord, GLenum pname, GLfloat *params);
+    void (*GetTexGenivOES)(Context *context, GLenum coord, GLenum pname, GLint *params);
+    void (*GetTexGenxvOES)(Context *context, GLenum coord, GLenum pname, GLfixed *params);
+    void (*GetTexLevelParameterfv)(Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum pname,
+                                   GLfloat *params);
+    void (*GetTexLevelParameterfvANGLE)(Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLenum pname,
+                                        GLfloat *params);
+    void (*GetTexLevelParameterfvRobustANGLE)(Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLfloat *params);
+    void (*GetTexLevelParameteriv)(Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum pname,
+                                   GLint *params);
+    void (*GetTexLevelParameterivANGLE)(Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLenum pname,
+                                        GLint *params);
+    void (*GetTexLevelParameterivRobustANGLE)(Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params);
+    void (*GetTexParameterIivOES)(Context *context, GLenum target, GLenum pname, GLint *params);
+    void (*GetTexParameterIivRobustANGLE)(Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params);
+    void (*GetTexParameterIuivOES)(Context *context, GLenum target, GLenum pname, GLuint *params);
+    void (*GetTexParameterIuivRobustANGLE)(Context *context,
+                                           GLenum target,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params);
+    void (*GetTexParameterfv)(Context *context, GLenum target, GLenum pname, GLfloat *params);
+    void (*GetTexParameterfvRobustANGLE)(Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params);
+    void (*GetTexParameteriv)(Context *context, GLenum target, GLenum pname, GLint *params);
+    void (*GetTexParameterivRobustANGLE)(Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params);
+    void (*GetTexParameterxv)(Context *context, GLenum target, GLenum pname, GLfixed *params);
+    void (*GetTransformFeedbackVarying)(Context *context,
+                                        GLuint program,
+                                        GLuint index,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLsizei *size,
+                                        GLenum *type,
+                                        GLchar *name);
+    void (*GetTranslatedShaderSourceANGLE)(Context *context,
+                                           GLuint shader,
+                                           GLsizei bufsize,
+                                           GLsizei *length,
+                                           GLchar *source);
+    GLuint (*GetUniformBlockIndex)(Context *context,
+                                   GLuint program,
+                                   const GLchar *uniformBlockName);
+    void (*GetUniformIndices)(Context *context,
+                              GLuint program,
+                              GLsizei uniformCount,
+                              const GLchar *const *uniformNames,
+                              GLuint *uniformIndices);
+    GLint (*GetUniformLocation)(Context *context, GLuint program, const GLchar *name);
+    void (*GetUniformfv)(Context *context, GLuint program, GLint location, GLfloat *params);
+    void (*GetUniformfvRobustANGLE)(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLfloat *params);
+    void (*GetUniformiv)(Context *context, GLuint program, GLint location, GLint *params);
+    void (*GetUniformivRobustANGLE)(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params);
+    void (*GetUniformuiv)(Context *context, GLuint program, GLint location, GLuint *params);
+    void (*GetUniformuivRobustANGLE)(Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLuint *params);
+    void (*GetUnsignedBytei_vEXT)(Context *context, GLenum target, GLuint index, GLubyte *data);
+    void (*GetUnsignedBytevEXT)(Context *context, GLenum pname, GLubyte *data);
+    void (*GetVertexAttribIiv)(Context *context, GLuint index, GLenum pname, GLint *params);
+    void (*GetVertexAttribIivRobustANGLE)(Context *context,
+                                          GLuint index,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params);
+    void (*GetVertexAttribIuiv)(Context *context, GLuint index, GLenum pname, GLuint *params);
+    void (*GetVertexAttribIuivRobustANGLE)(Context *context,
+                                           GLuint index,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params);
+    void (*GetVertexAttribPointerv)(Context *context, GLuint index, GLenum pname, void **pointer);
+    void (*GetVertexAttribPointervRobustANGLE)(Context *context,
+                                               GLuint index,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               void **pointer);
+    void (*GetVertexAttribfv)(Context *context, GLuint index, GLenum pname, GLfloat *params);
+    void (*GetVertexAttribfvRobustANGLE)(Context *context,
+                                         GLuint index,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params);
+    void (*GetVertexAttribiv)(Context *context, GLuint index, GLenum pname, GLint *params);
+    void (*GetVertexAttribivRobustANGLE)(Context *context,
+                                         GLuint index,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params);
+    void (*GetnUniformfvEXT)(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei bufSize,
+                             GLfloat *params);
+    void (*GetnUniformfvRobustANGLE)(Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLfloat *params);
+    void (*GetnUniformivEXT)(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei bufSize,
+                             GLint *params);
+    void (*GetnUniformivRobustANGLE)(Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *params);
+    void (*GetnUniformuivRobustANGLE)(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLuint *params);
+    void (*Hint)(Context *context, GLenum target, GLenum mode);
+    void (*ImportMemoryFdEXT)(Context *context,
+                              GLuint memory,
+                              GLuint64 size,
+                              GLenum handleType,
+                              GLint fd);
+    void (*ImportSemaphoreFdEXT)(Context *context, GLuint semaphore, GLenum handleType, GLint fd);
+    void (*InsertEventMarkerEXT)(Context *context, GLsizei length, const GLchar *marker);
+    void (*InvalidateFramebuffer)(Context *context,
+                                  GLenum target,
+                                  GLsizei numAttachments,
+                                  const GLenum *attachments);
+    void (*InvalidateSubFramebuffer)(Context *context,
+                                     GLenum target,
+                                     GLsizei numAttachments,
+                                     const GLenum *attachments,
+                                     GLint x,
+                                     GLint y,
+                                     GLsizei width,
+                                     GLsizei height);
+    GLboolean (*IsBuffer)(Context *context, GLuint buffer);
+    GLboolean (*IsEnabled)(Context *context, GLenum cap);
+    GLboolean (*IsFenceNV)(Context *context, GLuint fence);
+    GLboolean (*IsFramebuffer)(Context *context, GLuint framebuffer);
+    GLboolean (*IsFramebufferOES)(Context *context, GLuint framebuffer);
+    GLboolean (*IsMemoryObjectEXT)(Context *context, GLuint memoryObject);
+    GLboolean (*IsPathCHROMIUM)(Context *context, GLuint path);
+    GLboolean (*IsProgram)(Context *context, GLuint program);
+    GLboolean (*IsProgramPipeline)(Context *context, GLuint pipeline);
+    GLboolean (*IsQuery)(Context *context, GLuint id);
+    GLboolean (*IsQueryEXT)(Context *context, GLuint id);
+    GLboolean (*IsRenderbuffer)(Context *context, GLuint renderbuffer);
+    GLboolean (*IsRenderbufferOES)(Context *context, GLuint renderbuffer);
+    GLboolean (*IsSampler)(Context *context, GLuint sampler);
+    GLboolean (*IsSemaphoreEXT)(Context *context, GLuint semaphore);
+    GLboolean (*IsShader)(Context *context, GLuint shader);
+    GLboolean (*IsSync)(Context *context, GLsync sync);
+    GLboolean (*IsTexture)(Context *context, GLuint texture);
+    GLboolean (*IsTransformFeedback)(Context *context, GLuint id);
+    GLboolean (*IsVertexArray)(Context *context, GLuint array);
+    GLboolean (*IsVertexArrayOES)(Context *context, GLuint array);
+    void (*LightModelf)(Context *context, GLenum pname, GLfloat param);
+    void (*LightModelfv)(Context *context, GLenum pname, const GLfloat *params);
+    void (*LightModelx)(Context *context, GLenum pname, GLfixed param);
+    void (*LightModelxv)(Context *context, GLenum pname, const GLfixed *param);
+    void (*Lightf)(Context *context, GLenum light, GLenum pname, GLfloat param);
+    void (*Lightfv)(Context *context, GLenum light, GLenum pname, const GLfloat *params);
+    void (*Lightx)(Context *context, GLenum light, GLenum pname, GLfixed param);
+    void (*Lightxv)(Context *context, GLenum light, GLenum pname, const GLfixed *params);
+    void (*LineWidth)(Context *context, GLfloat width);
+    void (*LineWidthx)(Context *context, GLfixed width);
+    void (*LinkProgram)(Context *context, GLuint program);
+    void (*LoadIdentity)(Context *context);
+    void (*LoadMatrixf)(Context *context, const GLfloat *m);
+    void (*LoadMatrixx)(Context *context, const GLfixed *m);
+    void (*LoadPaletteFromModelViewMatrixOES)(Context *context);
+    void (*LogicOp)(Context *context, GLenum opcode);
+    void (*LoseContextCHROMIUM)(Context *context, GLenum current, GLenum other);
+    void *(*MapBufferOES)(Context *context, GLenum target, GLenum access);
+    void *(*MapBufferRange)(Context *context,
+                            GLenum target,
+                            GLintptr offset,
+                            GLsizeiptr length,
+                            GLbitfield access);
+    void *(*MapBufferRangeEXT)(Context *context,
+                               GLenum target,
+                               GLintptr offset,
+                               GLsizeiptr length,
+                               GLbitfield access);
+    void (*Materialf)(Context *context, GLenum face, GLenum pname, GLfloat param);
+    void (*Materialfv)(Context *context, GLenum face, GLenum pname, const GLfloat *params);
+    void (*Materialx)(Context *context, GLenum face, GLenum pname, GLfixed param);
+    void (*Materialxv)(Context *context, GLenum face, GLenum pname, const GLfixed *param);
+    void (*MatrixIndexPointerOES)(Context *context,
+                                  GLint size,
+                                  GLenum type,
+                                  GLsizei stride,
+                                  const void *pointer);
+    void (*MatrixLoadIdentityCHROMIUM)(Context *context, GLenum matrixMode);
+    void (*MatrixLoadfCHROMIUM)(Context *context, GLenum matrixMode, const GLfloat *matrix);
+    void (*MatrixMode)(Context *context, GLenum mode);
+    void (*MaxShaderCompilerThreadsKHR)(Context *context, GLuint count);
+    void (*MemoryBarrier)(Context *context, GLbitfield barriers);
+    void (*MemoryBarrierByRegion)(Context *context, GLbitfield barriers);
+    void (*MemoryObjectParameterivEXT)(Context *context,
+                                       GLuint memoryObject,
+                                       GLenum pname,
+                                       const GLint *params);
+    void (*MultMatrixf)(Context *context, const GLfloat *m);
+    void (*MultMatrixx)(Context *context, const GLfixed *m);
+    void (*MultiDrawArraysANGLE)(Context *context,
+                                 GLenum mode,
+                                 const GLint *firsts,
+                                 const GLsizei *counts,
+                                 GLsizei drawcount);
+    void (*MultiDrawArraysInstancedANGLE)(Context *context,
+                                          GLenum mode,
+                                          const GLint *firsts,
+                                          const GLsizei *counts,
+                                          const GLsizei *instanceCounts,
+                                          GLsizei drawcount);
+    void (*MultiDrawElementsANGLE)(Context *context,
+                                   GLenum mode,
+                                   const GLsizei *counts,
+                                   GLenum type,
+                                   const GLvoid *const *indices,
+                                   GLsizei drawcount);
+    void (*MultiDrawElementsInstancedANGLE)(Context *context,
+                                            GLenum mode,
+                                            const GLsizei *counts,
+                                            GLenum type,
+                                            const GLvoid *const *indices,
+                                            const GLsizei *instanceCounts,
+                                            GLsizei drawcount);
+    void (*MultiTexCoord4f)(Context *context,
+                            GLenum target,
+                            GLfloat s,
+                            GLfloat t,
+                            GLfloat r,
+                            GLfloat q);
+    void (*MultiTexCoord4x)(Context *context,
+                            GLenum texture,
+                            GLfixed s,
+                            GLfixed t,
+                            GLfixed r,
+                            GLfixed q);
+    void (*Normal3f)(Context *context, GLfloat nx, GLfloat ny, GLfloat nz);
+    void (*Normal3x)(Context *context, GLfixed nx, GLfixed ny, GLfixed nz);
+    void (*NormalPointer)(Context *context, GLenum type, GLsizei stride, const void *pointer);
+    void (*ObjectLabelKHR)(Context *context,
+                           GLenum identifier,
+                           GLuint name,
+                           GLsizei length,
+                           const GLchar *label);
+    void (*ObjectPtrLabelKHR)(Context *context,
+                              const void *ptr,
+                              GLsizei length,
+                              const GLchar *label);
+    void (*Orthof)(Context *context,
+                   GLfloat l,
+                   GLfloat r,
+                   GLfloat b,
+                   GLfloat t,
+                   GLfloat n,
+                   GLfloat f);
+    void (*Orthox)(Context *context,
+                   GLfixed l,
+                   GLfixed r,
+                   GLfixed b,
+                   GLfixed t,
+                   GLfixed n,
+                   GLfixed f);
+    void (*PathCommandsCHROMIUM)(Context *context,
+                                 GLuint path,
+                                 GLsizei numCommands,
+                                 const GLubyte *commands,
+                                 GLsizei numCoords,
+                                 GLenum coordType,
+                                 const void *coords);
+    void (*PathParameterfCHROMIUM)(Context *context, GLuint path, GLenum pname, GLfloat value);
+    void (*PathParameteriCHROMIUM)(Context *context, GLuint path, GLenum pname, GLint value);
+    void (*PathStencilFuncCHROMIUM)(Context *context, GLenum func, GLint ref, GLuint mask);
+    void (*PauseTransformFeedback)(Context *context);
+    void (*PixelStorei)(Context *context, GLenum pname, GLint param);
+    void (*PointParameterf)(Context *context, GLenum pname, GLfloat param);
+    void (*PointParameterfv)(Context *context, GLenum pname, const GLfloat *params);
+    void (*PointParameterx)(Context *context, GLenum pname, GLfixed param);
+    void (*PointParameterxv)(Context *context, GLenum pname, const GLfixed *params);
+    void (*PointSize)(Context *context, GLfloat size);
+    void (*PointSizePointerOES)(Context *context, GLenum type, GLsizei stride, const void *pointer);
+    void (*PointSizex)(Context *context, GLfixed size);
+    void (*PolygonOffset)(Context *context, GLfloat factor, GLfloat units);
+    void (*PolygonOffsetx)(Context *context, GLfixed factor, GLfixed units);
+    void (*PopDebugGroupKHR)(Context *context);
+    void (*PopGroupMarkerEXT)(Context *context);
+    void (*PopMatrix)(Context *context);
+    void (*ProgramBinary)(Context *context,
+                          GLuint program,
+                          GLenum binaryFormat,
+                          const void *binary,
+                          GLsizei length);
+    void (*ProgramBinaryOES)(Context *context,
+                             GLuint program,
+                             GLenum binaryFormat,
+                             const void *binary,
+                             GLint length);
+    void (*ProgramParameteri)(Context *context, GLuint program, GLenum pname, GLint value);
+    void (*ProgramPathFragmentInputGenCHROMIUM)(Context *context,
+                                                GLuint program,
+                                                GLint location,
+                                                GLenum genMode,
+                                                GLint components,
+                                                const GLfloat *coeffs);
+    void (*ProgramUniform1f)(Context *context, GLuint program, GLint location, GLfloat v0);
+    void (*ProgramUniform1fv)(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value);
+    void (*ProgramUniform1i)(Context *context, GLuint program, GLint location, GLint v0);
+    void (*ProgramUniform1iv)(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value);
+    void (*ProgramUniform1ui)(Context *context, GLuint program, GLint location, GLuint v0);
+    void (*ProgramUniform1uiv)(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value);
+    void (*ProgramUniform2f)(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1);
+    void (*ProgramUniform2fv)(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value);
+    void (*ProgramUniform2i)(Context *context, GLuint program, GLint location, GLint v0, GLint v1);
+    void (*ProgramUniform2iv)(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value);
+    void (
+        *ProgramUniform2ui)(Context *context, GLuint program, GLint location, GLuint v0, GLuint v1);
+    void (*ProgramUniform2uiv)(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value);
+    void (*ProgramUniform3f)(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1,
+                             GLfloat v2);
+    void (*ProgramUniform3fv)(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value);
+    void (*ProgramUniform3i)(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1,
+                             GLint v2);
+    void (*ProgramUniform3iv)(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value);
+    void (*ProgramUniform3ui)(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1,
+                              GLuint v2);
+    void (*ProgramUniform3uiv)(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value);
+    void (*ProgramUniform4f)(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1,
+                             GLfloat v2,
+                             GLfloat v3);
+    void (*ProgramUniform4fv)(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value);
+    void (*ProgramUniform4i)(Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1,
+                             GLint v2,
+                             GLint v3);
+    void (*ProgramUniform4iv)(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value);
+    void (*ProgramUniform4ui)(Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1,
+                              GLuint v2,
+                              GLuint v3);
+    void (*ProgramUniform4uiv)(Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value);
+    void (*ProgramUniformMatrix2fv)(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+    void (*ProgramUniformMatrix2x3fv)(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+    void (*ProgramUniformMatrix2x4fv)(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+    void (*ProgramUniformMatrix3fv)(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+    void (*ProgramUniformMatrix3x2fv)(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+    void (*ProgramUniformMatrix3x4fv)(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+    void (*ProgramUniformMatrix4fv)(Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+    void (*ProgramUniformMatrix4x2fv)(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+    void (*ProgramUniformMatrix4x3fv)(Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+    void (*ProvokingVertexANGLE)(Context *context, GLenum mode);
+    void (*PushDebugGroupKHR)(Context *context,
+                              GLenum source,
+                              GLuint id,
+                              GLsizei length,
+                              const GLchar *message);
+    void (*PushGroupMarkerEXT)(Context *context, GLsizei length, const GLchar *marker);
+    void (*PushMatrix)(Context *context);
+    void (*QueryCounterEXT)(Context *context, GLuint id, GLenum target);
+    GLbitfield (*QueryMatrixxOES)(Context *context, GLfixed *mantissa, GLint *exponent);
+    void (*ReadBuffer)(Context *context, GLenum src);
+    void (*ReadPixels)(Context *context,
+                       GLint x,
+                       GLint y,
+                       GLsizei width,
+                       GLsizei height,
+                       GLenum format,
+                       GLenum type,
+                       void *pixels);
+    void (*ReadPixelsRobustANGLE)(Context *context,
+                                  GLint x,
+                                  GLint y,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLsizei *columns,
+                                  GLsizei *rows,
+                                  void *pixels);
+    void (*ReadnPixelsEXT)(Context *context,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLenum format,
+                           GLenum type,
+                           GLsizei bufSize,
+                           void *data);
+    void (*ReadnPixelsRobustANGLE)(Context *context,
+                                   GLint x,
+                                   GLint y,
+                                   GLsizei width,
+                                   GLsizei height,
+                                   GLenum format,
+                                   GLenum type,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLsizei *columns,
+                                   GLsizei *rows,
+                                   void *data);
+    void (*ReleaseShaderCompiler)(Context *context);
+    void (*RenderbufferStorage)(Context *context,
+                                GLenum target,
+                                GLenum internalformat,
+                                GLsizei width,
+                                GLsizei height);
+    void (*RenderbufferStorageMultisample)(Context *context,
+                                           GLenum target,
+                                           GLsizei samples,
+                                           GLenum internalformat,
+                                           GLsizei width,
+                                           GLsizei height);
+    void (*RenderbufferStorageMultisampleANGLE)(Context *context,
+                                                GLenum target,
+                                                GLsizei samples,
+                                                GLenum internalformat,
+                                                GLsizei width,
+                                                GLsizei height);
+    void (*RenderbufferStorageOES)(Context *context,
+                                   GLenum target,
+                                   GLenum internalformat,
+                                   GLsizei width,
+                                   GLsizei height);
+    void (*RequestExtensionANGLE)(Context *context, const GLchar *name);
+    void (*ResumeTransformFeedback)(Context *context);
+    void (*Rotatef)(Context *context, GLfloat angle, GLfloat x, GLfloat y, GLfloat z);
+    void (*Rotatex)(Context *context, GLfixed angle, GLfixed x, GLfixed y, GLfixed z);
+    void (*SampleCoverage)(Context *context, GLfloat value, GLboolean invert);
+    void (*SampleCoveragex)(Context *context, GLclampx value, GLboolean invert);
+    void (*SampleMaski)(Context *context, GLuint maskNumber, GLbitfield mask);
+    void (*SampleMaskiANGLE)(Context *context, GLuint maskNumber, GLbitfield mask);
+    void (*SamplerParameterIivOES)(Context *context,
+                                   GLuint sampler,
+                                   GLenum pname,
+                                   const GLint *param);
+    void (*SamplerParameterIivRobustANGLE)(Context *context,
+                                           GLuint sampler,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           const GLint *param);
+    void (*SamplerParameterIuivOES)(Context *context,
+                                    GLuint sampler,
+                                    GLenum pname,
+                                    const GLuint *param);
+    void (*SamplerParameterIuivRobustANGLE)(Context *context,
+                                            GLuint sampler,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            const GLuint *param);
+    void (*SamplerParameterf)(Context *context, GLuint sampler, GLenum pname, GLfloat param);
+    void (*SamplerParameterfv)(Context *context,
+                               GLuint sampler,
+                               GLenum pname,
+                               const GLfloat *param);
+    void (*SamplerParameterfvRobustANGLE)(Context *context,
+                                          GLuint sampler,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          const GLfloat *param);
+    void (*SamplerParameteri)(Context *context, GLuint sampler, GLenum pname, GLint param);
+    void (*SamplerParameteriv)(Context *context, GLuint sampler, GLenum pname, const GLint *param);
+    void (*SamplerParameterivRobustANGLE)(Context *context,
+                                          GLuint sampler,
+                                          GLuint pname,
+                                          GLsizei bufSize,
+                                          const GLint *param);
+    void (*Scalef)(Context *context, GLfloat x, GLfloat y, GLfloat z);
+    void (*Scalex)(Context *context, GLfixed x, GLfixed y, GLfixed z);
+    void (*Scissor)(Context *context, GLint x, GLint y, GLsizei width, GLsizei height);
+    void (*SemaphoreParameterui64vEXT)(Context *context,
+                                       GLuint semaphore,
+                                       GLenum pname,
+                                       const GLuint64 *params);
+    void (*SetFenceNV)(Context *context, GLuint fence, GLenum condition);
+    void (*ShadeModel)(Context *context, GLenum mode);
+    void (*ShaderBinary)(Context *context,
+                         GLsizei count,
+                         const GLuint *shaders,
+                         GLenum binaryformat,
+                         const void *binary,
+                         GLsizei length);
+    void (*ShaderSource)(Context *context,
+                         GLuint shader,
+                         GLsizei count,
+                         const GLchar *const *string,
+                         const GLint *length);
+    void (*SignalSemaphoreEXT)(Context *context,
+                               GLuint semaphore,
+                               GLuint numBufferBarriers,
+                               const GLuint *buffers,
+                               GLuint numTextureBarriers,
+                               const GLuint *textures,
+                               const GLenum *dstLayouts);
+    void (*StencilFillPathCHROMIUM)(Context *context, GLuint path, GLenum fillMode, GLuint mask);
+    void (*StencilFillPathInstancedCHROMIUM)(Context *context,
+                                             GLsizei numPaths,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum fillMode,
+                                             GLuint mask,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues);
+    void (*StencilFunc)(Context *context, GLenum func, GLint ref, GLuint mask);
+    void (*StencilFuncSeparate)(Context *context, GLenum face, GLenum func, GLint ref, GLuint mask);
+    void (*StencilMask)(Context *context, GLuint mask);
+    void (*StencilMaskSeparate)(Context *context, GLenum face, GLuint mask);
+    void (*StencilOp)(Context *context, GLenum fail, GLenum zfail, GLenum zpass);
+    void (*StencilOpSeparate)(Context *context,
+                              GLenum face,
+                              GLenum sfail,
+                              GLenum dpfail,
+                              GLenum dppass);
+    void (*StencilStrokePathCHROMIUM)(Context *context, GLuint path, GLint reference, GLuint mask);
+    void (*StencilStrokePathInstancedCHROMIUM)(Context *context,
+                                               GLsizei numPath,
+                                               GLenum pathNameType,
+                                               const void *paths,
+                                               GLuint pathBase,
+                                               GLint reference,
+                                               GLuint mask,
+                                               GLenum transformType,
+                                               const GLfloat *transformValues);
+    void (*StencilThenCoverFillPathCHROMIUM)(Context *context,
+                                             GLuint path,
+                                             GLenum fillMode,
+                                             GLuint mask,
+                                             GLenum coverMode);
+    void (*StencilThenCoverFillPathInstancedCHROMIUM)(Context *context,
+                                                      GLsizei numPaths,
+                                                      GLenum pathNameType,
+                                                      const void *paths,
+                                                      GLuint pathBase,
+                                                      GLenum fillMode,
+                                                      GLuint mask,
+                                                      GLenum coverMode,
+                                                      GLenum transformType,
+                                                      const GLfloat *transformValues);
+    void (*StencilThenCoverStrokePathCHROMIUM)(Context *context,
+                                               GLuint path,
+                                               GLint reference,
+                                               GLuint mask,
+                                               GLenum coverMode);
+    void (*StencilThenCoverStrokePathInstancedCHROMIUM)(Context *context,
+                                                        GLsizei numPaths,
+                                                        GLenum pathNameType,
+                                                        const void *paths,
+                                                        GLuint pathBase,
+                                                        GLint reference,
+                                                        GLuint mask,
+                                                        GLenum coverMode,
+                                                        GLenum transformType,
+                                                        const GLfloat *transformValues);
+    GLboolean (*TestFenceNV)(Context *context, GLuint fence);
+    void (*TexCoordPointer)(Context *context,
+                            GLint size,
+                            GLenum type,
+                            GLsizei stride,
+                            const void *pointer);
+    void (*TexEnvf)(Context *context, GLenum target, GLenum pname, GLfloat param);
+    void (*TexEnvfv)(Context *context, GLenum target, GLenum pname, const GLfloat *params);
+    void (*TexEnvi)(Context *context, GLenum target, GLenum pname, GLint param);
+    void (*TexEnviv)(Context *context, GLenum target, GLenum pname, const GLint *params);
+    void (*TexEnvx)(Context *context, GLenum target, GLenum pname, GLfixed param);
+    void (*TexEnvxv)(Context *context, GLenum target, GLenum pname, const GLfixed *params);
+    void (*TexGenfOES)(Context *context, GLenum coord, GLenum pname, GLfloat param);
+    void (*TexGenfvOES)(Context *context, GLenum coord, GLenum pname, const GLfloat *params);
+    void (*TexGeniOES)(Context *context, GLenum coord, GLenum pname, GLint param);
+    void (*TexGenivOES)(Context *context, GLenum coord, GLenum pname, const GLint *params);
+    void (*TexGenxOES)(Context *context, GLenum coord, GLenum pname, GLfixed param);
+    void (*TexGenxvOES)(Context *context, GLenum coord, GLenum pname, const GLfixed *params);
+    void (*TexImage2D)(Context *context,
+                       GLenum target,
+                       GLint level,
+                       GLint internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLint border,
+                       GLenum format,
+                       GLenum type,
+                       const void *pixels);
+    void (*TexImage2DRobustANGLE)(Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLint border,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  const void *pixels);
+    void (*TexImage3D)(Context *context,
+                       GLenum target,
+                       GLint level,
+                       GLint internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLsizei depth,
+                       GLint border,
+                       GLenum format,
+                       GLenum type,
+                       const void *pixels);
+    void (*TexImage3DRobustANGLE)(Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLsizei depth,
+                                  GLint border,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  const void *pixels);
+    void (*TexParameterIivOES)(Context *context, GLenum target, GLenum pname, const GLint *params);
+    void (*TexParameterIivRobustANGLE)(Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLsizei bufSize,
+                                       const GLint *params);
+    void (*TexParameterIuivOES)(Context *context,
+                                GLenum target,
+                                GLenum pname,
+                                const GLuint *params);
+    void (*TexParameterIuivRobustANGLE)(Context *context,
+                                        GLenum target,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        const GLuint *params);
+    void (*TexParameterf)(Context *context, GLenum target, GLenum pname, GLfloat param);
+    void (*TexParameterfv)(Context *context, GLenum target, GLenum pname, const GLfloat *params);
+    void (*TexParameterfvRobustANGLE)(Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      const GLfloat *params);
+    void (*TexParameteri)(Context *context, GLenum target, GLenum pname, GLint param);
+    void (*TexParameteriv)(Context *context, GLenum target, GLenum pname, const GLint *params);
+    void (*TexParameterivRobustANGLE)(Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      const GLint *params);
+    void (*TexParameterx)(Context *context, GLenum target, GLenum pname, GLfixed param);
+    void (*TexParameterxv)(Context *context, GLenum target, GLenum pname, const GLfixed *params);
+    void (*TexStorage1DEXT)(Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width);
+    void (*TexStorage2D)(Context *context,
+                         GLenum target,
+                         GLsizei levels,
+                         GLenum internalformat,
+                         GLsizei width,
+                         GLsizei height);
+    void (*TexStorage2DEXT)(Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width,
+                            GLsizei height);
+    void (*TexStorage2DMultisample)(Context *context,
+                                    GLenum target,
+                                    GLsizei samples,
+                                    GLenum internalformat,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLboolean fixedsamplelocations);
+    void (*TexStorage2DMultisampleANGLE)(Context *context,
+                                         GLenum target,
+                                         GLsizei samples,
+                                         GLenum internalformat,
+                                         GLsizei width,
+                                         GLsizei height,
+                                         GLboolean fixedsamplelocations);
+    void (*TexStorage3D)(Context *context,
+                         GLenum target,
+                         GLsizei levels,
+                         GLenum internalformat,
+                         GLsizei width,
+                         GLsizei height,
+                         GLsizei depth);
+    void (*TexStorage3DEXT)(Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width,
+                            GLsizei height,
+                            GLsizei depth);
+    void (*TexStorage3DMultisampleOES)(Context *context,
+                                       GLenum target,
+                                       GLsizei samples,
+                                       GLenum internalformat,
+                                       GLsizei width,
+                                       GLsizei height,
+                                       GLsizei depth,
+                                       GLboolean fixedsamplelocations);
+    void (*TexStorageMem2DEXT)(Context *context,
+                               GLenum target,
+                               GLsizei levels,
+                               GLenum internalFormat,
+                               GLsizei width,
+                               GLsizei height,
+                               GLuint memory,
+                               GLuint64 offset);
+    void (*TexStorageMem2DMultisampleEXT)(Context *context,
+                                          GLenum target,
+                                          GLsizei samples,
+                                          GLenum internalFormat,
+                                          GLsizei width,
+                                          GLsizei height,
+                                          GLboolean fixedSampleLocations,
+                                          GLuint memory,
+                                          GLuint64 offset);
+    void (*TexStorageMem3DEXT)(Context *context,
+                               GLenum target,
+                               GLsizei levels,
+                               GLenum internalFormat,
+                               GLsizei width,
+                               GLsizei height,
+                               GLsizei depth,
+                               GLuint memory,
+                               GLuint64 offset);
+    void (*TexStorageMem3DMultisampleEXT)(Context *context,
+                                          GLenum target,
+                                          GLsizei samples,
+                                          GLenum internalFormat,
+                                          GLsizei width,
+                                          GLsizei height,
+                                          GLsizei depth,
+                                          GLboolean fixedSampleLocations,
+                                          GLuint memory,
+                                          GLuint64 offset);
+    void (*TexSubImage2D)(Context *context,
+                          GLenum target,
+                          GLint level,
+                          GLint xoffset,
+                          GLint yoffset,
+                          GLsizei width,
+                          GLsizei height,
+                          GLenum format,
+                          GLenum type,
+                          const void *pixels);
+    void (*TexSubImage2DRobustANGLE)(Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     const void *pixels);
+    void (*TexSubImage3D)(Context *context,
+                          GLenum target,
+                          GLint level,
+                          GLint xoffset,
+                          GLint yoffset,
+                          GLint zoffset,
+                          GLsizei width,
+                          GLsizei height,
+                          GLsizei depth,
+                          GLenum format,
+                          GLenum type,
+                          const void *pixels);
+    void (*TexSubImage3DRobustANGLE)(Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLint zoffset,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLsizei depth,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     const void *pixels);
+    void (*TransformFeedbackVaryings)(Context *context,
+                                      GLuint program,
+                                      GLsizei count,
+                                      const GLchar *const *varyings,
+                                      GLenum bufferMode);
+    void (*Translatef)(Context *context, GLfloat x, GLfloat y, GLfloat z);
+    void (*Translatex)(Context *context, GLfixed x, GLfixed y, GLfixed z);
+    void (*Uniform1f)(Context *context, GLint location, GLfloat v0);
+    void (*Uniform1fv)(Context *context, GLint location, GLsizei count, const GLfloat *value);
+    void (*Uniform1i)(Context *context, GLint location, GLint v0);
+    void (*Uniform1iv)(Context *context, GLint location, GLsizei count, const GLint *value);
+    void (*Uniform1ui)(Context *context, GLint location, GLuint v0);
+    void (*Uniform1uiv)(Context *context, GLint location, GLsizei count, const GLuint *value);
+    void (*Uniform2f)(Context *context, GLint location, GLfloat v0, GLfloat v1);
+    void (*Uniform2fv)(Context *context, GLint location, GLsizei count, const GLfloat *value);
+    void (*Uniform2i)(Context *context, GLint location, GLint v0, GLint v1);
+    void (*Uniform2iv)(Context *context, GLint location, GLsizei count, const GLint *value);
+    void (*Uniform2ui)(Context *context, GLint location, GLuint v0, GLuint v1);
+    void (*Uniform2uiv)(Context *context, GLint location, GLsizei count, const GLuint *value);
+    void (*Uniform3f)(Context *context, GLint location, GLfloat v0, GLfloat v1, GLfloat v2);
+    void (*Uniform3fv)(Context *context, GLint location, GLsizei count, const GLfloat *value);
+    void (*Uniform3i)(Context *context, GLint location, GLint v0, GLint v1, GLint v2);
+    void (*Uniform3iv)(Context *context, GLint location, GLsizei count, const GLint *value);
+    void (*Uniform3ui)(Context *context, GLint location, GLuint v0, GLuint v1, GLuint v2);
+    void (*Uniform3uiv)(Context *context, GLint location, GLsizei count, const GLuint *value);
+    void (*Uniform4f)(Context *context,
+                      GLint location,
+                      GLfloat v0,
+                      GLfloat v1,
+                      GLfloat v2,
+                      GLfloat v3);
+    void (*Uniform4fv)(Context *context, GLint location, GLsizei count, const GLfloat *value);
+    void (*Uniform4i)(Context *context, GLint location, GLint v0, GLint v1, GLint v2, GLint v3);
+    void (*Uniform4iv)(Context *context, GLint location, GLsizei count, const GLint *value);
+    void (
+        *Uniform4ui)(Context *context, GLint location, GLuint v0, GLuint v1, GLuint v2, GLuint v3);
+    void (*Uniform4uiv)(Context *context, GLint location, GLsizei count, const GLuint *value);
+    void (*UniformBlockBinding)(Context *context,
+                                GLuint program,
+                                GLuint uniformBlockIndex,
+                                GLuint uniformBlockBinding);
+    void (*UniformMatrix2fv)(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+    void (*UniformMatrix2x3fv)(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+    void (*UniformMatrix2x4fv)(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+    void (*UniformMatrix3fv)(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+    void (*UniformMatrix3x2fv)(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+    void (*UniformMatrix3x4fv)(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+    void (*UniformMatrix4fv)(Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+    void (*UniformMatrix4x2fv)(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+    void (*UniformMatrix4x3fv)(Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+    GLboolean (*UnmapBuffer)(Context *context, GLenum target);
+    GLboolean (*UnmapBufferOES)(Context *context, GLenum target);
+    void (*UseProgram)(Context *context, GLuint program);
+    void (*UseProgramStages)(Context *context, GLuint pipeline, GLbitfield stages, GLuint program);
+    void (*ValidateProgram)(Context *context, GLuint program);
+    void (*ValidateProgramPipeline)(Context *context, GLuint pipeline);
+    void (*VertexAttrib1f)(Context *context, GLuint index, GLfloat x);
+    void (*VertexAttrib1fv)(Context *context, GLuint index, const GLfloat *v);
+    void (*VertexAttrib2f)(Context *context, GLuint index, GLfloat x, GLfloat y);
+    void (*VertexAttrib2fv)(Context *context, GLuint index, const GLfloat *v);
+    void (*VertexAttrib3f)(Context *context, GLuint index, GLfloat x, GLfloat y, GLfloat z);
+    void (*VertexAttrib3fv)(Context *context, GLuint index, const GLfloat *v);
+    void (*VertexAttrib4f)(Context *context,
+                           GLuint index,
+                           GLfloat x,
+                           GLfloat y,
+                           GLfloat z,
+                           GLfloat w);
+    void (*VertexAttrib4fv)(Context *context, GLuint index, const GLfloat *v);
+    void (*VertexAttribBinding)(Context *context, GLuint attribindex, GLuint bindingindex);
+    void (*VertexAttribDivisor)(Context *context, GLuint index, GLuint divisor);
+    void (*VertexAttribDivisorANGLE)(Context *context, GLuint index, GLuint divisor);
+    void (*VertexAttribDivisorEXT)(Context *context, GLuint index, GLuint divisor);
+    void (*VertexAttribFormat)(Context *context,
+                               GLuint attribindex,
+                               GLint size,
+                               GLenum type,
+                               GLboolean normalized,
+                               GLuint relativeoffset);
+    void (*VertexAttribI4i)(Context *context, GLuint index, GLint x, GLint y, GLint z, GLint w);
+    void (*VertexAttribI4iv)(Context *context, GLuint index, const GLint *v);
+    void (
+        *VertexAttribI4ui)(Context *context, GLuint index, GLuint x, GLuint y, GLuint z, GLuint w);
+    void (*VertexAttribI4uiv)(Context *context, GLuint index, const GLuint *v);
+    void (*VertexAttribIFormat)(Context *context,
+                                GLuint attribindex,
+                                GLint size,
+                                GLenum type,
+                                GLuint relativeoffset);
+    void (*VertexAttribIPointer)(Context *context,
+                                 GLuint index,
+                                 GLint size,
+                                 GLenum type,
+                                 GLsizei stride,
+                                 const void *pointer);
+    void (*VertexAttribPointer)(Context *context,
+                                GLuint index,
+                                GLint size,
+                                GLenum type,
+                                GLboolean normalized,
+                                GLsizei stride,
+                                const void *pointer);
+    void (*VertexBindingDivisor)(Context *context, GLuint bindingindex, GLuint divisor);
+    void (*VertexPointer)(Context *context,
+                          GLint size,
+                          GLenum type,
+                          GLsizei stride,
+                          const void *pointer);
+    void (*Viewport)(Context *context, GLint x, GLint y, GLsizei width, GLsizei height);
+    void (*WaitSemaphoreEXT)(Context *context,
+                             GLuint semaphore,
+                             GLuint numBufferBarriers,
+                             const GLuint *buffers,
+                             GLuint numTextureBarriers,
+                             const GLuint *textures,
+                             const GLenum *srcLayouts);
+    void (*WaitSync)(Context *context, GLsync sync, GLbitfield flags, GLuint64 timeout);
+    void (*WeightPointerOES)(Context *context,
+                             GLint size,
+                             GLenum type,
+                             GLsizei stride,
+                             const void *pointer);
+};
+
+// Validates the calls before executing them.
+extern const DispatchTable kValidatedDispatchTable;
+
+// Executes the calls without validation, for the contexts created with KHR_no_error.
+extern const DispatchTable kNoErrorDispatchTable;
+
+// Generates an error and returns the default value. glGetError and glGetGraphicsResetStatusEXT
+// are executed.
+extern const DispatchTable kContextLostDispatchTable;
+}  // namespace gl
+
+#endif  // LIBGLESV2_ENTRY_POINTS_DISPATCH_AUTOGEN_H_
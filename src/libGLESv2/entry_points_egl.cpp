@@ -19,6 +19,10 @@
 #include "libANGLE/Thread.h"
 #include "libANGLE/queryutils.h"
 #include "libANGLE/validationEGL.h"
+#include "libGLESv2/entry_points_binary_event.h"
+#include "libGLESv2/entry_points_capture.h"
+#include "libGLESv2/entry_points_deferred.h"
+#include "libGLESv2/entry_points_profiler.h"
 #include "libGLESv2/global_state.h"
 #include "libGLESv2/proc_table.h"
 
@@ -113,6 +117,12 @@ EGLBoolean EGLAPIENTRY EGL_Terminate(EGLDisplay dpy)
     ANGLE_EGL_TRY_RETURN(thread, display->terminate(thread), "eglTerminate",
                          GetDisplayIfValid(display), EGL_FALSE);
 
+#if ANGLE_ENTRY_POINT_PROFILING == ANGLE_ENABLED
+    // The counters are shared by all the contexts, so they are only dumped once the contexts of
+    // the display are gone.
+    gl::DumpEntryPointProfile();
+#endif
+
     thread->setSuccess();
     return EGL_TRUE;
 }
@@ -329,6 +339,8 @@ EGLBoolean EGLAPIENTRY EGL_DestroySurface(EGLDisplay dpy, EGLSurface surface)
     ANGLE_EGL_TRY_RETURN(thread, ValidateDestroySurface(display, eglSurface, surface),
                          "eglDestroySurface", GetSurfaceIfValid(display, eglSurface), EGL_FALSE);
 
+    ANGLE_SYNC_DEFERRED_COMMANDS_FOR_EGL(thread->getContext());
+
     ANGLE_EGL_TRY_RETURN(thread, display->destroySurface(eglSurface), "eglDestroySurface",
                          GetSurfaceIfValid(display, eglSurface), EGL_FALSE);
 
@@ -415,6 +427,10 @@ EGLBoolean EGLAPIENTRY EGL_DestroyContext(EGLDisplay dpy, EGLContext ctx)
         SetContextCurrent(thread, nullptr);
     }
 
+#if ANGLE_ENTRY_POINT_BINARY_EVENTS == ANGLE_ENABLED
+    gl::DumpBinaryEvents();
+#endif
+
     thread->setSuccess();
     return EGL_TRUE;
 }
@@ -447,6 +463,9 @@ EGLBoolean EGLAPIENTRY EGL_MakeCurrent(EGLDisplay dpy,
     // Only call makeCurrent if the context or surfaces have changed.
     if (previousDraw != drawSurface || previousRead != readSurface || previousContext != context)
     {
+        // The pending calls draw to the previous surfaces.
+        ANGLE_SYNC_DEFERRED_COMMANDS_FOR_EGL(previousContext);
+
         // Release the surface from the previously-current context, to allow
         // destroyed surfaces to delete themselves.
         if (previousContext != nullptr && context != previousContext)
@@ -459,6 +478,10 @@ EGLBoolean EGLAPIENTRY EGL_MakeCurrent(EGLDisplay dpy,
                              "eglMakeCurrent", GetContextIfValid(display, context), EGL_FALSE);
 
         SetContextCurrent(thread, context);
+
+#if ANGLE_DEFERRED_COMMANDS == ANGLE_ENABLED
+        gl::OnDeferredCommandsContextCurrent(context);
+#endif
     }
 
     thread->setSuccess();
@@ -577,9 +600,15 @@ EGLBoolean EGLAPIENTRY EGL_SwapBuffers(EGLDisplay dpy, EGLSurface surface)
     ANGLE_EGL_TRY_RETURN(thread, ValidateSwapBuffers(thread, display, eglSurface), "eglSwapBuffers",
                          GetSurfaceIfValid(display, eglSurface), EGL_FALSE);
 
+    ANGLE_SYNC_DEFERRED_COMMANDS_FOR_EGL(thread->getContext());
+
     ANGLE_EGL_TRY_RETURN(thread, eglSurface->swap(thread->getContext()), "eglSwapBuffers",
                          GetSurfaceIfValid(display, eglSurface), EGL_FALSE);
 
+#if ANGLE_CAPTURE == ANGLE_ENABLED
+    gl::CaptureFrameEnd();
+#endif
+
     thread->setSuccess();
     return EGL_TRUE;
 }
@@ -625,6 +654,8 @@ EGLBoolean EGLAPIENTRY EGL_BindTexImage(EGLDisplay dpy, EGLSurface surface, EGLi
         thread, ValidateBindTexImage(display, eglSurface, surface, buffer, context, &textureObject),
         "eglBindTexImage", GetSurfaceIfValid(display, eglSurface), EGL_FALSE);
 
+    ANGLE_SYNC_DEFERRED_COMMANDS_FOR_EGL(context);
+
     if (context)
     {
         ANGLE_EGL_TRY_RETURN(thread, eglSurface->bindTexImage(context, textureObject, buffer),
@@ -673,6 +704,8 @@ EGLBoolean EGLAPIENTRY EGL_ReleaseTexImage(EGLDisplay dpy, EGLSurface surface, E
     ANGLE_EGL_TRY_RETURN(thread, ValidateReleaseTexImage(display, eglSurface, surface, buffer),
                          "eglReleaseTexImage", GetSurfaceIfValid(display, eglSurface), EGL_FALSE);
 
+    ANGLE_SYNC_DEFERRED_COMMANDS_FOR_EGL(thread->getContext());
+
     gl::Texture *texture = eglSurface->getBoundTexture();
 
     if (texture)
@@ -785,6 +818,8 @@ EGLBoolean EGLAPIENTRY EGL_ReleaseThread(void)
     if (previousDraw != EGL_NO_SURFACE || previousRead != EGL_NO_SURFACE ||
         previousContext != EGL_NO_CONTEXT)
     {
+        ANGLE_SYNC_DEFERRED_COMMANDS_FOR_EGL(previousContext);
+
         // Release the surface from the previously-current context, to allow
         // destroyed surfaces to delete themselves.
         if (previousContext != nullptr && previousDisplay != EGL_NO_DISPLAY)
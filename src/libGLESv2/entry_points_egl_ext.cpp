@@ -18,6 +18,8 @@
 #include "libANGLE/Thread.h"
 #include "libANGLE/queryutils.h"
 #include "libANGLE/validationEGL.h"
+#include "libGLESv2/entry_points_capture.h"
+#include "libGLESv2/entry_points_deferred.h"
 #include "libGLESv2/global_state.h"
 
 using namespace egl;
@@ -1062,6 +1064,8 @@ EGLBoolean EGLAPIENTRY EGL_SwapBuffersWithDamageKHR(EGLDisplay dpy,
         return EGL_FALSE;
     }
 
+    ANGLE_SYNC_DEFERRED_COMMANDS_FOR_EGL(thread->getContext());
+
     error = eglSurface->swapWithDamage(thread->getContext(), rects, n_rects);
     if (error.isError())
     {
@@ -1070,6 +1074,10 @@ EGLBoolean EGLAPIENTRY EGL_SwapBuffersWithDamageKHR(EGLDisplay dpy,
         return EGL_FALSE;
     }
 
+#if ANGLE_CAPTURE == ANGLE_ENABLED
+    gl::CaptureFrameEnd();
+#endif
+
     thread->setSuccess();
     return EGL_TRUE;
 }
@@ -0,0 +1,675 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_enum_autogen.cpp:
+//   Defines the names of the GLES entry points.
+
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+#include "common/debug.h"
+
+namespace gl
+{
+namespace
+{
+constexpr const char *kEntryPointNames[] = {
+    "Invalid",
+    "ActiveShaderProgram",
+    "ActiveTexture",
+    "AlphaFunc",
+    "AlphaFuncx",
+    "AttachShader",
+    "BeginQuery",
+    "BeginQueryEXT",
+    "BeginTransformFeedback",
+    "BindAttribLocation",
+    "BindBuffer",
+    "BindBufferBase",
+    "BindBufferRange",
+    "BindFragDataLocationEXT",
+    "BindFragDataLocationIndexedEXT",
+    "BindFragmentInputLocationCHROMIUM",
+    "BindFramebuffer",
+    "BindFramebufferOES",
+    "BindImageTexture",
+    "BindProgramPipeline",
+    "BindRenderbuffer",
+    "BindRenderbufferOES",
+    "BindSampler",
+    "BindTexture",
+    "BindTransformFeedback",
+    "BindUniformLocationCHROMIUM",
+    "BindVertexArray",
+    "BindVertexArrayOES",
+    "BindVertexBuffer",
+    "BlendColor",
+    "BlendEquation",
+    "BlendEquationSeparate",
+    "BlendFunc",
+    "BlendFuncSeparate",
+    "BlitFramebuffer",
+    "BlitFramebufferANGLE",
+    "BufferData",
+    "BufferStorageMemEXT",
+    "BufferSubData",
+    "CheckFramebufferStatus",
+    "CheckFramebufferStatusOES",
+    "Clear",
+    "ClearBufferfi",
+    "ClearBufferfv",
+    "ClearBufferiv",
+    "ClearBufferuiv",
+    "ClearColor",
+    "ClearColorx",
+    "ClearDepthf",
+    "ClearDepthx",
+    "ClearStencil",
+    "ClientActiveTexture",
+    "ClientWaitSync",
+    "ClipPlanef",
+    "ClipPlanex",
+    "Color4f",
+    "Color4ub",
+    "Color4x",
+    "ColorMask",
+    "ColorPointer",
+    "CompileShader",
+    "CompressedCopyTextureCHROMIUM",
+    "CompressedTexImage2D",
+    "CompressedTexImage2DRobustANGLE",
+    "CompressedTexImage3D",
+    "CompressedTexImage3DRobustANGLE",
+    "CompressedTexSubImage2D",
+    "CompressedTexSubImage2DRobustANGLE",
+    "CompressedTexSubImage3D",
+    "CompressedTexSubImage3DRobustANGLE",
+    "CopyBufferSubData",
+    "CopySubTexture3DANGLE",
+    "CopySubTextureCHROMIUM",
+    "CopyTexImage2D",
+    "CopyTexSubImage2D",
+    "CopyTexSubImage3D",
+    "CopyTexture3DANGLE",
+    "CopyTextureCHROMIUM",
+    "CoverFillPathCHROMIUM",
+    "CoverFillPathInstancedCHROMIUM",
+    "CoverStrokePathCHROMIUM",
+    "CoverStrokePathInstancedCHROMIUM",
+    "CoverageModulationCHROMIUM",
+    "CreateMemoryObjectsEXT",
+    "CreateProgram",
+    "CreateShader",
+    "CreateShaderProgramv",
+    "CullFace",
+    "CurrentPaletteMatrixOES",
+    "DebugMessageCallbackKHR",
+    "DebugMessageControlKHR",
+    "DebugMessageInsertKHR",
+    "DeleteBuffers",
+    "DeleteFencesNV",
+    "DeleteFramebuffers",
+    "DeleteFramebuffersOES",
+    "DeleteMemoryObjectsEXT",
+    "DeletePathsCHROMIUM",
+    "DeleteProgram",
+    "DeleteProgramPipelines",
+    "DeleteQueries",
+    "DeleteQueriesEXT",
+    "DeleteRenderbuffers",
+    "DeleteRenderbuffersOES",
+    "DeleteSamplers",
+    "DeleteSemaphoresEXT",
+    "DeleteShader",
+    "DeleteSync",
+    "DeleteTextures",
+    "DeleteTransformFeedbacks",
+    "DeleteVertexArrays",
+    "DeleteVertexArraysOES",
+    "DepthFunc",
+    "DepthMask",
+    "DepthRangef",
+    "DepthRangex",
+    "DetachShader",
+    "Disable",
+    "DisableClientState",
+    "DisableVertexAttribArray",
+    "DiscardFramebufferEXT",
+    "DispatchCompute",
+    "DispatchComputeIndirect",
+    "DrawArrays",
+    "DrawArraysIndirect",
+    "DrawArraysInstanced",
+    "DrawArraysInstancedANGLE",
+    "DrawArraysInstancedEXT",
+    "DrawBuffers",
+    "DrawBuffersEXT",
+    "DrawElements",
+    "DrawElementsIndirect",
+    "DrawElementsInstanced",
+    "DrawElementsInstancedANGLE",
+    "DrawElementsInstancedEXT",
+    "DrawRangeElements",
+    "DrawTexfOES",
+    "DrawTexfvOES",
+    "DrawTexiOES",
+    "DrawTexivOES",
+    "DrawTexsOES",
+    "DrawTexsvOES",
+    "DrawTexxOES",
+    "DrawTexxvOES",
+    "EGLImageTargetRenderbufferStorageOES",
+    "EGLImageTargetTexture2DOES",
+    "Enable",
+    "EnableClientState",
+    "EnableVertexAttribArray",
+    "EndQuery",
+    "EndQueryEXT",
+    "EndTransformFeedback",
+    "FenceSync",
+    "Finish",
+    "FinishFenceNV",
+    "Flush",
+    "FlushMappedBufferRange",
+    "FlushMappedBufferRangeEXT",
+    "Fogf",
+    "Fogfv",
+    "Fogx",
+    "Fogxv",
+    "FramebufferParameteri",
+    "FramebufferRenderbuffer",
+    "FramebufferRenderbufferOES",
+    "FramebufferTexture2D",
+    "FramebufferTexture2DOES",
+    "FramebufferTextureEXT",
+    "FramebufferTextureLayer",
+    "FramebufferTextureMultiviewOVR",
+    "FrontFace",
+    "Frustumf",
+    "Frustumx",
+    "GenBuffers",
+    "GenFencesNV",
+    "GenFramebuffers",
+    "GenFramebuffersOES",
+    "GenPathsCHROMIUM",
+    "GenProgramPipelines",
+    "GenQueries",
+    "GenQueriesEXT",
+    "GenRenderbuffers",
+    "GenRenderbuffersOES",
+    "GenSamplers",
+    "GenSemaphoresEXT",
+    "GenTextures",
+    "GenTransformFeedbacks",
+    "GenVertexArrays",
+    "GenVertexArraysOES",
+    "GenerateMipmap",
+    "GenerateMipmapOES",
+    "GetActiveAttrib",
+    "GetActiveUniform",
+    "GetActiveUniformBlockName",
+    "GetActiveUniformBlockiv",
+    "GetActiveUniformBlockivRobustANGLE",
+    "GetActiveUniformsiv",
+    "GetAttachedShaders",
+    "GetAttribLocation",
+    "GetBooleani_v",
+    "GetBooleani_vRobustANGLE",
+    "GetBooleanv",
+    "GetBooleanvRobustANGLE",
+    "GetBufferParameteri64v",
+    "GetBufferParameteri64vRobustANGLE",
+    "GetBufferParameteriv",
+    "GetBufferParameterivRobustANGLE",
+    "GetBufferPointerv",
+    "GetBufferPointervOES",
+    "GetBufferPointervRobustANGLE",
+    "GetClipPlanef",
+    "GetClipPlanex",
+    "GetDebugMessageLogKHR",
+    "GetError",
+    "GetFenceivNV",
+    "GetFixedv",
+    "GetFloatv",
+    "GetFloatvRobustANGLE",
+    "GetFragDataIndexEXT",
+    "GetFragDataLocation",
+    "GetFramebufferAttachmentParameteriv",
+    "GetFramebufferAttachmentParameterivOES",
+    "GetFramebufferAttachmentParameterivRobustANGLE",
+    "GetFramebufferParameteriv",
+    "GetFramebufferParameterivRobustANGLE",
+    "GetGraphicsResetStatusEXT",
+    "GetInteger64i_v",
+    "GetInteger64i_vRobustANGLE",
+    "GetInteger64v",
+    "GetInteger64vRobustANGLE",
+    "GetIntegeri_v",
+    "GetIntegeri_vRobustANGLE",
+    "GetIntegerv",
+    "GetIntegervRobustANGLE",
+    "GetInternalformativ",
+    "GetInternalformativRobustANGLE",
+    "GetLightfv",
+    "GetLightxv",
+    "GetMaterialfv",
+    "GetMaterialxv",
+    "GetMemoryObjectParameterivEXT",
+    "GetMultisamplefv",
+    "GetMultisamplefvANGLE",
+    "GetMultisamplefvRobustANGLE",
+    "GetObjectLabelKHR",
+    "GetObjectPtrLabelKHR",
+    "GetPathParameterfvCHROMIUM",
+    "GetPathParameterivCHROMIUM",
+    "GetPointerv",
+    "GetPointervKHR",
+    "GetPointervRobustANGLERobustANGLE",
+    "GetProgramBinary",
+    "GetProgramBinaryOES",
+    "GetProgramInfoLog",
+    "GetProgramInterfaceiv",
+    "GetProgramInterfaceivRobustANGLE",
+    "GetProgramPipelineInfoLog",
+    "GetProgramPipelineiv",
+    "GetProgramResourceIndex",
+    "GetProgramResourceLocation",
+    "GetProgramResourceLocationIndexEXT",
+    "GetProgramResourceName",
+    "GetProgramResourceiv",
+    "GetProgramiv",
+    "GetProgramivRobustANGLE",
+    "GetQueryObjecti64vEXT",
+    "GetQueryObjecti64vRobustANGLE",
+    "GetQueryObjectivEXT",
+    "GetQueryObjectivRobustANGLE",
+    "GetQueryObjectui64vEXT",
+    "GetQueryObjectui64vRobustANGLE",
+    "GetQueryObjectuiv",
+    "GetQueryObjectuivEXT",
+    "GetQueryObjectuivRobustANGLE",
+    "GetQueryiv",
+    "GetQueryivEXT",
+    "GetQueryivRobustANGLE",
+    "GetRenderbufferParameteriv",
+    "GetRenderbufferParameterivOES",
+    "GetRenderbufferParameterivRobustANGLE",
+    "GetSamplerParameterIivOES",
+    "GetSamplerParameterIivRobustANGLE",
+    "GetSamplerParameterIuivOES",
+    "GetSamplerParameterIuivRobustANGLE",
+    "GetSamplerParameterfv",
+    "GetSamplerParameterfvRobustANGLE",
+    "GetSamplerParameteriv",
+    "GetSamplerParameterivRobustANGLE",
+    "GetSemaphoreParameterui64vEXT",
+    "GetShaderInfoLog",
+    "GetShaderPrecisionFormat",
+    "GetShaderSource",
+    "GetShaderiv",
+    "GetShaderivRobustANGLE",
+    "GetString",
+    "GetStringi",
+    "GetSynciv",
+    "GetTexEnvfv",
+    "GetTexEnviv",
+    "GetTexEnvxv",
+    "GetTexGenfvOES",
+    "GetTexGenivOES",
+    "GetTexGenxvOES",
+    "GetTexLevelParameterfv",
+    "GetTexLevelParameterfvANGLE",
+    "GetTexLevelParameterfvRobustANGLE",
+    "GetTexLevelParameteriv",
+    "GetTexLevelParameterivANGLE",
+    "GetTexLevelParameterivRobustANGLE",
+    "GetTexParameterIivOES",
+    "GetTexParameterIivRobustANGLE",
+    "GetTexParameterIuivOES",
+    "GetTexParameterIuivRobustANGLE",
+    "GetTexParameterfv",
+    "GetTexParameterfvRobustANGLE",
+    "GetTexParameteriv",
+    "GetTexParameterivRobustANGLE",
+    "GetTexParameterxv",
+    "GetTransformFeedbackVarying",
+    "GetTranslatedShaderSourceANGLE",
+    "GetUniformBlockIndex",
+    "GetUniformIndices",
+    "GetUniformLocation",
+    "GetUniformfv",
+    "GetUniformfvRobustANGLE",
+    "GetUniformiv",
+    "GetUniformivRobustANGLE",
+    "GetUniformuiv",
+    "GetUniformuivRobustANGLE",
+    "GetUnsignedBytei_vEXT",
+    "GetUnsignedBytevEXT",
+    "GetVertexAttribIiv",
+    "GetVertexAttribIivRobustANGLE",
+    "GetVertexAttribIuiv",
+    "GetVertexAttribIuivRobustANGLE",
+    "GetVertexAttribPointerv",
+    "GetVertexAttribPointervRobustANGLE",
+    "GetVertexAttribfv",
+    "GetVertexAttribfvRobustANGLE",
+    "GetVertexAttribiv",
+    "GetVertexAttribivRobustANGLE",
+    "GetnUniformfvEXT",
+    "GetnUniformfvRobustANGLE",
+    "GetnUniformivEXT",
+    "GetnUniformivRobustANGLE",
+    "GetnUniformuivRobustANGLE",
+    "Hint",
+    "ImportMemoryFdEXT",
+    "ImportSemaphoreFdEXT",
+    "InsertEventMarkerEXT",
+    "InvalidateFramebuffer",
+    "InvalidateSubFramebuffer",
+    "IsBuffer",
+    "IsEnabled",
+    "IsFenceNV",
+    "IsFramebuffer",
+    "IsFramebufferOES",
+    "IsMemoryObjectEXT",
+    "IsPathCHROMIUM",
+    "IsProgram",
+    "IsProgramPipeline",
+    "IsQuery",
+    "IsQueryEXT",
+    "IsRenderbuffer",
+    "IsRenderbufferOES",
+    "IsSampler",
+    "IsSemaphoreEXT",
+    "IsShader",
+    "IsSync",
+    "IsTexture",
+    "IsTransformFeedback",
+    "IsVertexArray",
+    "IsVertexArrayOES",
+    "LightModelf",
+    "LightModelfv",
+    "LightModelx",
+    "LightModelxv",
+    "Lightf",
+    "Lightfv",
+    "Lightx",
+    "Lightxv",
+    "LineWidth",
+    "LineWidthx",
+    "LinkProgram",
+    "LoadIdentity",
+    "LoadMatrixf",
+    "LoadMatrixx",
+    "LoadPaletteFromModelViewMatrixOES",
+    "LogicOp",
+    "LoseContextCHROMIUM",
+    "MapBufferOES",
+    "MapBufferRange",
+    "MapBufferRangeEXT",
+    "Materialf",
+    "Materialfv",
+    "Materialx",
+    "Materialxv",
+    "MatrixIndexPointerOES",
+    "MatrixLoadIdentityCHROMIUM",
+    "MatrixLoadfCHROMIUM",
+    "MatrixMode",
+    "MaxShaderCompilerThreadsKHR",
+    "MemoryBarrier",
+    "MemoryBarrierByRegion",
+    "MemoryObjectParameterivEXT",
+    "MultMatrixf",
+    "MultMatrixx",
+    "MultiDrawArraysANGLE",
+    "MultiDrawArraysInstancedANGLE",
+    "MultiDrawElementsANGLE",
+    "MultiDrawElementsInstancedANGLE",
+    "MultiTexCoord4f",
+    "MultiTexCoord4x",
+    "Normal3f",
+    "Normal3x",
+    "NormalPointer",
+    "ObjectLabelKHR",
+    "ObjectPtrLabelKHR",
+    "Orthof",
+    "Orthox",
+    "PathCommandsCHROMIUM",
+    "PathParameterfCHROMIUM",
+    "PathParameteriCHROMIUM",
+    "PathStencilFuncCHROMIUM",
+    "PauseTransformFeedback",
+    "PixelStorei",
+    "PointParameterf",
+    "PointParameterfv",
+    "PointParameterx",
+    "PointParameterxv",
+    "PointSize",
+    "PointSizePointerOES",
+    "PointSizex",
+    "PolygonOffset",
+    "PolygonOffsetx",
+    "PopDebugGroupKHR",
+    "PopGroupMarkerEXT",
+    "PopMatrix",
+    "ProgramBinary",
+    "ProgramBinaryOES",
+    "ProgramParameteri",
+    "ProgramPathFragmentInputGenCHROMIUM",
+    "ProgramUniform1f",
+    "ProgramUniform1fv",
+    "ProgramUniform1i",
+    "ProgramUniform1iv",
+    "ProgramUniform1ui",
+    "ProgramUniform1uiv",
+    "ProgramUniform2f",
+    "ProgramUniform2fv",
+    "ProgramUniform2i",
+    "ProgramUniform2iv",
+    "ProgramUniform2ui",
+    "ProgramUniform2uiv",
+    "ProgramUniform3f",
+    "ProgramUniform3fv",
+    "ProgramUniform3i",
+    "ProgramUniform3iv",
+    "ProgramUniform3ui",
+    "ProgramUniform3uiv",
+    "ProgramUniform4f",
+    "ProgramUniform4fv",
+    "ProgramUniform4i",
+    "ProgramUniform4iv",
+    "ProgramUniform4ui",
+    "ProgramUniform4uiv",
+    "ProgramUniformMatrix2fv",
+    "ProgramUniformMatrix2x3fv",
+    "ProgramUniformMatrix2x4fv",
+    "ProgramUniformMatrix3fv",
+    "ProgramUniformMatrix3x2fv",
+    "ProgramUniformMatrix3x4fv",
+    "ProgramUniformMatrix4fv",
+    "ProgramUniformMatrix4x2fv",
+    "ProgramUniformMatrix4x3fv",
+    "ProvokingVertexANGLE",
+    "PushDebugGroupKHR",
+    "PushGroupMarkerEXT",
+    "PushMatrix",
+    "QueryCounterEXT",
+    "QueryMatrixxOES",
+    "ReadBuffer",
+    "ReadPixels",
+    "ReadPixelsRobustANGLE",
+    "ReadnPixelsEXT",
+    "ReadnPixelsRobustANGLE",
+    "ReleaseShaderCompiler",
+    "RenderbufferStorage",
+    "RenderbufferStorageMultisample",
+    "RenderbufferStorageMultisampleANGLE",
+    "RenderbufferStorageOES",
+    "RequestExtensionANGLE",
+    "ResumeTransformFeedback",
+    "Rotatef",
+    "Rotatex",
+    "SampleCoverage",
+    "SampleCoveragex",
+    "SampleMaski",
+    "SampleMaskiANGLE",
+    "SamplerParameterIivOES",
+    "SamplerParameterIivRobustANGLE",
+    "SamplerParameterIuivOES",
+    "SamplerParameterIuivRobustANGLE",
+    "SamplerParameterf",
+    "SamplerParameterfv",
+    "SamplerParameterfvRobustANGLE",
+    "SamplerParameteri",
+    "SamplerParameteriv",
+    "SamplerParameterivRobustANGLE",
+    "Scalef",
+    "Scalex",
+    "Scissor",
+    "SemaphoreParameterui64vEXT",
+    "SetFenceNV",
+    "ShadeModel",
+    "ShaderBinary",
+    "ShaderSource",
+    "SignalSemaphoreEXT",
+    "StencilFillPathCHROMIUM",
+    "StencilFillPathInstancedCHROMIUM",
+    "StencilFunc",
+    "StencilFuncSeparate",
+    "StencilMask",
+    "StencilMaskSeparate",
+    "StencilOp",
+    "StencilOpSeparate",
+    "StencilStrokePathCHROMIUM",
+    "StencilStrokePathInstancedCHROMIUM",
+    "StencilThenCoverFillPathCHROMIUM",
+    "StencilThenCoverFillPathInstancedCHROMIUM",
+    "StencilThenCoverStrokePathCHROMIUM",
+    "StencilThenCoverStrokePathInstancedCHROMIUM",
+    "TestFenceNV",
+    "TexCoordPointer",
+    "TexEnvf",
+    "TexEnvfv",
+    "TexEnvi",
+    "TexEnviv",
+    "TexEnvx",
+    "TexEnvxv",
+    "TexGenfOES",
+    "TexGenfvOES",
+    "TexGeniOES",
+    "TexGenivOES",
+    "TexGenxOES",
+    "TexGenxvOES",
+    "TexImage2D",
+    "TexImage2DRobustANGLE",
+    "TexImage3D",
+    "TexImage3DRobustANGLE",
+    "TexParameterIivOES",
+    "TexParameterIivRobustANGLE",
+    "TexParameterIuivOES",
+    "TexParameterIuivRobustANGLE",
+    "TexParameterf",
+    "TexParameterfv",
+    "TexParameterfvRobustANGLE",
+    "TexParameteri",
+    "TexParameteriv",
+    "TexParameterivRobustANGLE",
+    "TexParameterx",
+    "TexParameterxv",
+    "TexStorage1DEXT",
+    "TexStorage2D",
+    "TexStorage2DEXT",
+    "TexStorage2DMultisample",
+    "TexStorage2DMultisampleANGLE",
+    "TexStorage3D",
+    "TexStorage3DEXT",
+    "TexStorage3DMultisampleOES",
+    "TexStorageMem2DEXT",
+    "TexStorageMem2DMultisampleEXT",
+    "TexStorageMem3DEXT",
+    "TexStorageMem3DMultisampleEXT",
+    "TexSubImage2D",
+    "TexSubImage2DRobustANGLE",
+    "TexSubImage3D",
+    "TexSubImage3DRobustANGLE",
+    "TransformFeedbackVaryings",
+    "Translatef",
+    "Translatex",
+    "Uniform1f",
+    "Uniform1fv",
+    "Uniform1i",
+    "Uniform1iv",
+    "Uniform1ui",
+    "Uniform1uiv",
+    "Uniform2f",
+    "Uniform2fv",
+    "Uniform2i",
+    "Uniform2iv",
+    "Uniform2ui",
+    "Uniform2uiv",
+    "Uniform3f",
+    "Uniform3fv",
+    "Uniform3i",
+    "Uniform3iv",
+    "Uniform3ui",
+    "Uniform3uiv",
+    "Uniform4f",
+    "Uniform4fv",
+    "Uniform4i",
+    "Uniform4iv",
+    "Uniform4ui",
+    "Uniform4uiv",
+    "UniformBlockBinding",
+    "UniformMatrix2fv",
+    "UniformMatrix2x3fv",
+    "UniformMatrix2x4fv",
+    "UniformMatrix3fv",
+    "UniformMatrix3x2fv",
+    "UniformMatrix3x4fv",
+    "UniformMatrix4fv",
+    "UniformMatrix4x2fv",
+    "UniformMatrix4x3fv",
+    "UnmapBuffer",
+    "UnmapBufferOES",
+    "UseProgram",
+    "UseProgramStages",
+    "ValidateProgram",
+    "ValidateProgramPipeline",
+    "VertexAttrib1f",
+    "VertexAttrib1fv",
+    "VertexAttrib2f",
+    "VertexAttrib2fv",
+    "VertexAttrib3f",
+    "VertexAttrib3fv",
+    "VertexAttrib4f",
+    "VertexAttrib4fv",
+    "VertexAttribBinding",
+    "VertexAttribDivisor",
+    "VertexAttribDivisorANGLE",
+    "VertexAttribDivisorEXT",
+    "VertexAttribFormat",
+    "VertexAttribI4i",
+    "VertexAttribI4iv",
+    "VertexAttribI4ui",
+    "VertexAttribI4uiv",
+    "VertexAttribIFormat",
+    "VertexAttribIPointer",
+    "VertexAttribPointer",
+    "VertexBindingDivisor",
+    "VertexPointer",
+    "Viewport",
+    "WaitSemaphoreEXT",
+    "WaitSync",
+    "WeightPointerOES",
+};
+}  // anonymous namespace
+
+const char *GetEntryPointName(EntryPoint entryPoint)
+{
+    ASSERT(entryPoint < EntryPoint::EnumCount);
+    return kEntryPointNames[static_cast<size_t>(entryPoint)];
+}
+}  // namespace gl
@@ -11,8 +11,13 @@
 #ifndef LIBGLESV2_ENTRYPOINTSENUM_AUTOGEN_H_
 #define LIBGLESV2_ENTRYPOINTSENUM_AUTOGEN_H_
 
+#include <stddef.h>
+
 namespace gl
 {
+// The largest number of parameters of any entry point.
+constexpr size_t kMaxEntryPointParamCount = 17;
+
 enum class EntryPoint
 {
     Invalid,
@@ -661,7 +666,11 @@ enum class EntryPoint
     Viewport,
     WaitSemaphoreEXT,
     WaitSync,
-    WeightPointerOES
+    WeightPointerOES,
+    EnumCount
 };
+
+// Returns the name of the entry point without the "gl" prefix.
+const char *GetEntryPointName(EntryPoint entryPoint);
 }  // namespace gl
 #endif  // LIBGLESV2_ENTRY_POINTS_ENUM_AUTOGEN_H_
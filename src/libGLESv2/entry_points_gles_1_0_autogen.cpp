@@ -11,8 +11,8 @@
 #include "libGLESv2/entry_points_gles_1_0_autogen.h"
 
 #include "libANGLE/Context.h"
-#include "libANGLE/Context.inl.h"
-#include "libANGLE/validationES1.h"
+#include "libGLESv2/entry_points_binary_event.h"
+#include "libGLESv2/entry_points_dispatch_autogen.h"
 #include "libGLESv2/entry_points_utils.h"
 #include "libGLESv2/global_state.h"
 
@@ -20,17 +20,13 @@ namespace gl
 {
 void GL_APIENTRY AlphaFunc(GLenum func, GLfloat ref)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLfloat ref = %f)", func, ref);
+    ANGLE_BINARY_EVENT(AlphaFunc, func, ref);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        AlphaTestFunc funcPacked = FromGLenum<AlphaTestFunc>(func);
-        if (context->skipValidation() || ValidateAlphaFunc(context, funcPacked, ref))
-        {
-            context->alphaFunc(funcPacked, ref);
-        }
+        context->getDispatchTable()->AlphaFunc(context, func, ref);
     }
 }
 
@@ -38,15 +34,12 @@ void GL_APIENTRY AlphaFuncx(GLenum func, GLfixed ref)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLfixed ref = 0x%X)", func, ref);
+    ANGLE_BINARY_EVENT(AlphaFuncx, func, ref);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        AlphaTestFunc funcPacked = FromGLenum<AlphaTestFunc>(func);
-        if (context->skipValidation() || ValidateAlphaFuncx(context, funcPacked, ref))
-        {
-            context->alphaFuncx(funcPacked, ref);
-        }
+        context->getDispatchTable()->AlphaFuncx(context, func, ref);
     }
 }
 
@@ -55,14 +48,12 @@ void GL_APIENTRY ClearColorx(GLfixed red, GLfixed green, GLfixed blue, GLfixed a
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed red = 0x%X, GLfixed green = 0x%X, GLfixed blue = 0x%X, GLfixed alpha = 0x%X)",
           red, green, blue, alpha);
+    ANGLE_BINARY_EVENT(ClearColorx, red, green, blue, alpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClearColorx(context, red, green, blue, alpha))
-        {
-            context->clearColorx(red, green, blue, alpha);
-        }
+        context->getDispatchTable()->ClearColorx(context, red, green, blue, alpha);
     }
 }
 
@@ -70,29 +61,24 @@ void GL_APIENTRY ClearDepthx(GLfixed depth)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed depth = 0x%X)", depth);
+    ANGLE_BINARY_EVENT(ClearDepthx, depth);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClearDepthx(context, depth))
-        {
-            context->clearDepthx(depth);
-        }
+        context->getDispatchTable()->ClearDepthx(context, depth);
     }
 }
 
 void GL_APIENTRY ClientActiveTexture(GLenum texture)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum texture = 0x%X)", texture);
+    ANGLE_BINARY_EVENT(ClientActiveTexture, texture);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClientActiveTexture(context, texture))
-        {
-            context->clientActiveTexture(texture);
-        }
+        context->getDispatchTable()->ClientActiveTexture(context, texture);
     }
 }
 
@@ -100,14 +86,12 @@ void GL_APIENTRY ClipPlanef(GLenum p, const GLfloat *eqn)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum p = 0x%X, const GLfloat *eqn = 0x%016" PRIxPTR ")", p, (uintptr_t)eqn);
+    ANGLE_BINARY_EVENT(ClipPlanef, p, eqn);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClipPlanef(context, p, eqn))
-        {
-            context->clipPlanef(p, eqn);
-        }
+        context->getDispatchTable()->ClipPlanef(context, p, eqn);
     }
 }
 
@@ -116,46 +100,38 @@ void GL_APIENTRY ClipPlanex(GLenum plane, const GLfixed *equation)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum plane = 0x%X, const GLfixed *equation = 0x%016" PRIxPTR ")", plane,
           (uintptr_t)equation);
+    ANGLE_BINARY_EVENT(ClipPlanex, plane, equation);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClipPlanex(context, plane, equation))
-        {
-            context->clipPlanex(plane, equation);
-        }
+        context->getDispatchTable()->ClipPlanex(context, plane, equation);
     }
 }
 
 void GL_APIENTRY Color4f(GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, GLfloat alpha = %f)", red,
           green, blue, alpha);
+    ANGLE_BINARY_EVENT(Color4f, red, green, blue, alpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateColor4f(context, red, green, blue, alpha))
-        {
-            context->color4f(red, green, blue, alpha);
-        }
+        context->getDispatchTable()->Color4f(context, red, green, blue, alpha);
     }
 }
 
 void GL_APIENTRY Color4ub(GLubyte red, GLubyte green, GLubyte blue, GLubyte alpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLubyte red = %d, GLubyte green = %d, GLubyte blue = %d, GLubyte alpha = %d)", red,
           green, blue, alpha);
+    ANGLE_BINARY_EVENT(Color4ub, red, green, blue, alpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateColor4ub(context, red, green, blue, alpha))
-        {
-            context->color4ub(red, green, blue, alpha);
-        }
+        context->getDispatchTable()->Color4ub(context, red, green, blue, alpha);
     }
 }
 
@@ -164,14 +140,12 @@ void GL_APIENTRY Color4x(GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed red = 0x%X, GLfixed green = 0x%X, GLfixed blue = 0x%X, GLfixed alpha = 0x%X)",
           red, green, blue, alpha);
+    ANGLE_BINARY_EVENT(Color4x, red, green, blue, alpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateColor4x(context, red, green, blue, alpha))
-        {
-            context->color4x(red, green, blue, alpha);
-        }
+        context->getDispatchTable()->Color4x(context, red, green, blue, alpha);
     }
 }
 
@@ -182,16 +156,12 @@ void GL_APIENTRY ColorPointer(GLint size, GLenum type, GLsizei stride, const voi
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(ColorPointer, size, type, stride, pointer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateColorPointer(context, size, typePacked, stride, pointer))
-        {
-            context->colorPointer(size, typePacked, stride, pointer);
-        }
+        context->getDispatchTable()->ColorPointer(context, size, type, stride, pointer);
     }
 }
 
@@ -199,14 +169,12 @@ void GL_APIENTRY DepthRangex(GLfixed n, GLfixed f)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed n = 0x%X, GLfixed f = 0x%X)", n, f);
+    ANGLE_BINARY_EVENT(DepthRangex, n, f);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDepthRangex(context, n, f))
-        {
-            context->depthRangex(n, f);
-        }
+        context->getDispatchTable()->DepthRangex(context, n, f);
     }
 }
 
@@ -214,15 +182,12 @@ void GL_APIENTRY DisableClientState(GLenum array)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum array = 0x%X)", array);
+    ANGLE_BINARY_EVENT(DisableClientState, array);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        ClientVertexArrayType arrayPacked = FromGLenum<ClientVertexArrayType>(array);
-        if (context->skipValidation() || ValidateDisableClientState(context, arrayPacked))
-        {
-            context->disableClientState(arrayPacked);
-        }
+        context->getDispatchTable()->DisableClientState(context, array);
     }
 }
 
@@ -230,15 +195,12 @@ void GL_APIENTRY EnableClientState(GLenum array)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum array = 0x%X)", array);
+    ANGLE_BINARY_EVENT(EnableClientState, array);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        ClientVertexArrayType arrayPacked = FromGLenum<ClientVertexArrayType>(array);
-        if (context->skipValidation() || ValidateEnableClientState(context, arrayPacked))
-        {
-            context->enableClientState(arrayPacked);
-        }
+        context->getDispatchTable()->EnableClientState(context, array);
     }
 }
 
@@ -246,14 +208,12 @@ void GL_APIENTRY Fogf(GLenum pname, GLfloat param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat param = %f)", pname, param);
+    ANGLE_BINARY_EVENT(Fogf, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateFogf(context, pname, param))
-        {
-            context->fogf(pname, param);
-        }
+        context->getDispatchTable()->Fogf(context, pname, param);
     }
 }
 
@@ -262,14 +222,12 @@ void GL_APIENTRY Fogfv(GLenum pname, const GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(Fogfv, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateFogfv(context, pname, params))
-        {
-            context->fogfv(pname, params);
-        }
+        context->getDispatchTable()->Fogfv(context, pname, params);
     }
 }
 
@@ -277,14 +235,12 @@ void GL_APIENTRY Fogx(GLenum pname, GLfixed param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed param = 0x%X)", pname, param);
+    ANGLE_BINARY_EVENT(Fogx, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateFogx(context, pname, param))
-        {
-            context->fogx(pname, param);
-        }
+        context->getDispatchTable()->Fogx(context, pname, param);
     }
 }
 
@@ -293,14 +249,12 @@ void GL_APIENTRY Fogxv(GLenum pname, const GLfixed *param)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)param);
+    ANGLE_BINARY_EVENT(Fogxv, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateFogxv(context, pname, param))
-        {
-            context->fogxv(pname, param);
-        }
+        context->getDispatchTable()->Fogxv(context, pname, param);
     }
 }
 
@@ -311,14 +265,12 @@ void GL_APIENTRY Frustumf(GLfloat l, GLfloat r, GLfloat b, GLfloat t, GLfloat n,
         "(GLfloat l = %f, GLfloat r = %f, GLfloat b = %f, GLfloat t = %f, GLfloat n = %f, GLfloat "
         "f = %f)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_EVENT(Frustumf, l, r, b, t, n, f);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateFrustumf(context, l, r, b, t, n, f))
-        {
-            context->frustumf(l, r, b, t, n, f);
-        }
+        context->getDispatchTable()->Frustumf(context, l, r, b, t, n, f);
     }
 }
 
@@ -329,14 +281,12 @@ void GL_APIENTRY Frustumx(GLfixed l, GLfixed r, GLfixed b, GLfixed t, GLfixed n,
         "(GLfixed l = 0x%X, GLfixed r = 0x%X, GLfixed b = 0x%X, GLfixed t = 0x%X, GLfixed n = "
         "0x%X, GLfixed f = 0x%X)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_EVENT(Frustumx, l, r, b, t, n, f);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateFrustumx(context, l, r, b, t, n, f))
-        {
-            context->frustumx(l, r, b, t, n, f);
-        }
+        context->getDispatchTable()->Frustumx(context, l, r, b, t, n, f);
     }
 }
 
@@ -345,14 +295,12 @@ void GL_APIENTRY GetClipPlanef(GLenum plane, GLfloat *equation)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum plane = 0x%X, GLfloat *equation = 0x%016" PRIxPTR ")", plane,
           (uintptr_t)equation);
+    ANGLE_BINARY_EVENT(GetClipPlanef, plane, equation);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetClipPlanef(context, plane, equation))
-        {
-            context->getClipPlanef(plane, equation);
-        }
+        context->getDispatchTable()->GetClipPlanef(context, plane, equation);
     }
 }
 
@@ -361,14 +309,12 @@ void GL_APIENTRY GetClipPlanex(GLenum plane, GLfixed *equation)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum plane = 0x%X, GLfixed *equation = 0x%016" PRIxPTR ")", plane,
           (uintptr_t)equation);
+    ANGLE_BINARY_EVENT(GetClipPlanex, plane, equation);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetClipPlanex(context, plane, equation))
-        {
-            context->getClipPlanex(plane, equation);
-        }
+        context->getDispatchTable()->GetClipPlanex(context, plane, equation);
     }
 }
 
@@ -376,14 +322,12 @@ void GL_APIENTRY GetFixedv(GLenum pname, GLfixed *params)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFixedv, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetFixedv(context, pname, params))
-        {
-            context->getFixedv(pname, params);
-        }
+        context->getDispatchTable()->GetFixedv(context, pname, params);
     }
 }
 
@@ -392,15 +336,12 @@ void GL_APIENTRY GetLightfv(GLenum light, GLenum pname, GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", light,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetLightfv, light, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
-        if (context->skipValidation() || ValidateGetLightfv(context, light, pnamePacked, params))
-        {
-            context->getLightfv(light, pnamePacked, params);
-        }
+        context->getDispatchTable()->GetLightfv(context, light, pname, params);
     }
 }
 
@@ -409,15 +350,12 @@ void GL_APIENTRY GetLightxv(GLenum light, GLenum pname, GLfixed *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", light,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetLightxv, light, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
-        if (context->skipValidation() || ValidateGetLightxv(context, light, pnamePacked, params))
-        {
-            context->getLightxv(light, pnamePacked, params);
-        }
+        context->getDispatchTable()->GetLightxv(context, light, pname, params);
     }
 }
 
@@ -426,15 +364,12 @@ void GL_APIENTRY GetMaterialfv(GLenum face, GLenum pname, GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", face,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetMaterialfv, face, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
-        if (context->skipValidation() || ValidateGetMaterialfv(context, face, pnamePacked, params))
-        {
-            context->getMaterialfv(face, pnamePacked, params);
-        }
+        context->getDispatchTable()->GetMaterialfv(context, face, pname, params);
     }
 }
 
@@ -443,15 +378,12 @@ void GL_APIENTRY GetMaterialxv(GLenum face, GLenum pname, GLfixed *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", face,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetMaterialxv, face, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
-        if (context->skipValidation() || ValidateGetMaterialxv(context, face, pnamePacked, params))
-        {
-            context->getMaterialxv(face, pnamePacked, params);
-        }
+        context->getDispatchTable()->GetMaterialxv(context, face, pname, params);
     }
 }
 
@@ -459,14 +391,12 @@ void GL_APIENTRY GetPointerv(GLenum pname, void **params)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetPointerv, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetPointerv(context, pname, params))
-        {
-            context->getPointerv(pname, params);
-        }
+        context->getDispatchTable()->GetPointerv(context, pname, params);
     }
 }
 
@@ -475,17 +405,12 @@ void GL_APIENTRY GetTexEnvfv(GLenum target, GLenum pname, GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexEnvfv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() ||
-            ValidateGetTexEnvfv(context, targetPacked, pnamePacked, params))
-        {
-            context->getTexEnvfv(targetPacked, pnamePacked, params);
-        }
+        context->getDispatchTable()->GetTexEnvfv(context, target, pname, params);
     }
 }
 
@@ -494,17 +419,12 @@ void GL_APIENTRY GetTexEnviv(GLenum target, GLenum pname, GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexEnviv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() ||
-            ValidateGetTexEnviv(context, targetPacked, pnamePacked, params))
-        {
-            context->getTexEnviv(targetPacked, pnamePacked, params);
-        }
+        context->getDispatchTable()->GetTexEnviv(context, target, pname, params);
     }
 }
 
@@ -513,17 +433,12 @@ void GL_APIENTRY GetTexEnvxv(GLenum target, GLenum pname, GLfixed *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexEnvxv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() ||
-            ValidateGetTexEnvxv(context, targetPacked, pnamePacked, params))
-        {
-            context->getTexEnvxv(targetPacked, pnamePacked, params);
-        }
+        context->getDispatchTable()->GetTexEnvxv(context, target, pname, params);
     }
 }
 
@@ -532,16 +447,12 @@ void GL_APIENTRY GetTexParameterxv(GLenum target, GLenum pname, GLfixed *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterxv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexParameterxv(context, targetPacked, pname, params))
-        {
-            context->getTexParameterxv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->GetTexParameterxv(context, target, pname, params);
     }
 }
 
@@ -549,14 +460,12 @@ void GL_APIENTRY LightModelf(GLenum pname, GLfloat param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat param = %f)", pname, param);
+    ANGLE_BINARY_EVENT(LightModelf, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateLightModelf(context, pname, param))
-        {
-            context->lightModelf(pname, param);
-        }
+        context->getDispatchTable()->LightModelf(context, pname, param);
     }
 }
 
@@ -565,14 +474,12 @@ void GL_APIENTRY LightModelfv(GLenum pname, const GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(LightModelfv, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateLightModelfv(context, pname, params))
-        {
-            context->lightModelfv(pname, params);
-        }
+        context->getDispatchTable()->LightModelfv(context, pname, params);
     }
 }
 
@@ -580,14 +487,12 @@ void GL_APIENTRY LightModelx(GLenum pname, GLfixed param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed param = 0x%X)", pname, param);
+    ANGLE_BINARY_EVENT(LightModelx, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateLightModelx(context, pname, param))
-        {
-            context->lightModelx(pname, param);
-        }
+        context->getDispatchTable()->LightModelx(context, pname, param);
     }
 }
 
@@ -596,14 +501,12 @@ void GL_APIENTRY LightModelxv(GLenum pname, const GLfixed *param)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)param);
+    ANGLE_BINARY_EVENT(LightModelxv, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateLightModelxv(context, pname, param))
-        {
-            context->lightModelxv(pname, param);
-        }
+        context->getDispatchTable()->LightModelxv(context, pname, param);
     }
 }
 
@@ -611,15 +514,12 @@ void GL_APIENTRY Lightf(GLenum light, GLenum pname, GLfloat param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", light, pname, param);
+    ANGLE_BINARY_EVENT(Lightf, light, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
-        if (context->skipValidation() || ValidateLightf(context, light, pnamePacked, param))
-        {
-            context->lightf(light, pnamePacked, param);
-        }
+        context->getDispatchTable()->Lightf(context, light, pname, param);
     }
 }
 
@@ -628,15 +528,12 @@ void GL_APIENTRY Lightfv(GLenum light, GLenum pname, const GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           light, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(Lightfv, light, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
-        if (context->skipValidation() || ValidateLightfv(context, light, pnamePacked, params))
-        {
-            context->lightfv(light, pnamePacked, params);
-        }
+        context->getDispatchTable()->Lightfv(context, light, pname, params);
     }
 }
 
@@ -644,15 +541,12 @@ void GL_APIENTRY Lightx(GLenum light, GLenum pname, GLfixed param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", light, pname, param);
+    ANGLE_BINARY_EVENT(Lightx, light, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
-        if (context->skipValidation() || ValidateLightx(context, light, pnamePacked, param))
-        {
-            context->lightx(light, pnamePacked, param);
-        }
+        context->getDispatchTable()->Lightx(context, light, pname, param);
     }
 }
 
@@ -661,15 +555,12 @@ void GL_APIENTRY Lightxv(GLenum light, GLenum pname, const GLfixed *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           light, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(Lightxv, light, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
-        if (context->skipValidation() || ValidateLightxv(context, light, pnamePacked, params))
-        {
-            context->lightxv(light, pnamePacked, params);
-        }
+        context->getDispatchTable()->Lightxv(context, light, pname, params);
     }
 }
 
@@ -677,44 +568,36 @@ void GL_APIENTRY LineWidthx(GLfixed width)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed width = 0x%X)", width);
+    ANGLE_BINARY_EVENT(LineWidthx, width);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateLineWidthx(context, width))
-        {
-            context->lineWidthx(width);
-        }
+        context->getDispatchTable()->LineWidthx(context, width);
     }
 }
 
 void GL_APIENTRY LoadIdentity()
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(LoadIdentity);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateLoadIdentity(context))
-        {
-            context->loadIdentity();
-        }
+        context->getDispatchTable()->LoadIdentity(context);
     }
 }
 
 void GL_APIENTRY LoadMatrixf(const GLfloat *m)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfloat *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_EVENT(LoadMatrixf, m);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateLoadMatrixf(context, m))
-        {
-            context->loadMatrixf(m);
-        }
+        context->getDispatchTable()->LoadMatrixf(context, m);
     }
 }
 
@@ -722,14 +605,12 @@ void GL_APIENTRY LoadMatrixx(const GLfixed *m)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfixed *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_EVENT(LoadMatrixx, m);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateLoadMatrixx(context, m))
-        {
-            context->loadMatrixx(m);
-        }
+        context->getDispatchTable()->LoadMatrixx(context, m);
     }
 }
 
@@ -737,15 +618,12 @@ void GL_APIENTRY LogicOp(GLenum opcode)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum opcode = 0x%X)", opcode);
+    ANGLE_BINARY_EVENT(LogicOp, opcode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        LogicalOperation opcodePacked = FromGLenum<LogicalOperation>(opcode);
-        if (context->skipValidation() || ValidateLogicOp(context, opcodePacked))
-        {
-            context->logicOp(opcodePacked);
-        }
+        context->getDispatchTable()->LogicOp(context, opcode);
     }
 }
 
@@ -753,15 +631,12 @@ void GL_APIENTRY Materialf(GLenum face, GLenum pname, GLfloat param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", face, pname, param);
+    ANGLE_BINARY_EVENT(Materialf, face, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
-        if (context->skipValidation() || ValidateMaterialf(context, face, pnamePacked, param))
-        {
-            context->materialf(face, pnamePacked, param);
-        }
+        context->getDispatchTable()->Materialf(context, face, pname, param);
     }
 }
 
@@ -770,15 +645,12 @@ void GL_APIENTRY Materialfv(GLenum face, GLenum pname, const GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           face, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(Materialfv, face, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
-        if (context->skipValidation() || ValidateMaterialfv(context, face, pnamePacked, params))
-        {
-            context->materialfv(face, pnamePacked, params);
-        }
+        context->getDispatchTable()->Materialfv(context, face, pname, params);
     }
 }
 
@@ -786,15 +658,12 @@ void GL_APIENTRY Materialx(GLenum face, GLenum pname, GLfixed param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", face, pname, param);
+    ANGLE_BINARY_EVENT(Materialx, face, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
-        if (context->skipValidation() || ValidateMaterialx(context, face, pnamePacked, param))
-        {
-            context->materialx(face, pnamePacked, param);
-        }
+        context->getDispatchTable()->Materialx(context, face, pname, param);
     }
 }
 
@@ -803,46 +672,36 @@ void GL_APIENTRY Materialxv(GLenum face, GLenum pname, const GLfixed *param)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")",
           face, pname, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(Materialxv, face, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
-        if (context->skipValidation() || ValidateMaterialxv(context, face, pnamePacked, param))
-        {
-            context->materialxv(face, pnamePacked, param);
-        }
+        context->getDispatchTable()->Materialxv(context, face, pname, param);
     }
 }
 
 void GL_APIENTRY MatrixMode(GLenum mode)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_EVENT(MatrixMode, mode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        MatrixType modePacked = FromGLenum<MatrixType>(mode);
-        if (context->skipValidation() || ValidateMatrixMode(context, modePacked))
-        {
-            context->matrixMode(modePacked);
-        }
+        context->getDispatchTable()->MatrixMode(context, mode);
     }
 }
 
 void GL_APIENTRY MultMatrixf(const GLfloat *m)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfloat *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_EVENT(MultMatrixf, m);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateMultMatrixf(context, m))
-        {
-            context->multMatrixf(m);
-        }
+        context->getDispatchTable()->MultMatrixf(context, m);
     }
 }
 
@@ -850,14 +709,12 @@ void GL_APIENTRY MultMatrixx(const GLfixed *m)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfixed *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_EVENT(MultMatrixx, m);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateMultMatrixx(context, m))
-        {
-            context->multMatrixx(m);
-        }
+        context->getDispatchTable()->MultMatrixx(context, m);
     }
 }
 
@@ -866,14 +723,12 @@ void GL_APIENTRY MultiTexCoord4f(GLenum target, GLfloat s, GLfloat t, GLfloat r,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLfloat s = %f, GLfloat t = %f, GLfloat r = %f, GLfloat q = %f)",
           target, s, t, r, q);
+    ANGLE_BINARY_EVENT(MultiTexCoord4f, target, s, t, r, q);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateMultiTexCoord4f(context, target, s, t, r, q))
-        {
-            context->multiTexCoord4f(target, s, t, r, q);
-        }
+        context->getDispatchTable()->MultiTexCoord4f(context, target, s, t, r, q);
     }
 }
 
@@ -884,29 +739,24 @@ void GL_APIENTRY MultiTexCoord4x(GLenum texture, GLfixed s, GLfixed t, GLfixed r
         "(GLenum texture = 0x%X, GLfixed s = 0x%X, GLfixed t = 0x%X, GLfixed r = 0x%X, GLfixed q = "
         "0x%X)",
         texture, s, t, r, q);
+    ANGLE_BINARY_EVENT(MultiTexCoord4x, texture, s, t, r, q);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateMultiTexCoord4x(context, texture, s, t, r, q))
-        {
-            context->multiTexCoord4x(texture, s, t, r, q);
-        }
+        context->getDispatchTable()->MultiTexCoord4x(context, texture, s, t, r, q);
     }
 }
 
 void GL_APIENTRY Normal3f(GLfloat nx, GLfloat ny, GLfloat nz)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat nx = %f, GLfloat ny = %f, GLfloat nz = %f)", nx, ny, nz);
+    ANGLE_BINARY_EVENT(Normal3f, nx, ny, nz);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateNormal3f(context, nx, ny, nz))
-        {
-            context->normal3f(nx, ny, nz);
-        }
+        context->getDispatchTable()->Normal3f(context, nx, ny, nz);
     }
 }
 
@@ -914,14 +764,12 @@ void GL_APIENTRY Normal3x(GLfixed nx, GLfixed ny, GLfixed nz)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed nx = 0x%X, GLfixed ny = 0x%X, GLfixed nz = 0x%X)", nx, ny, nz);
+    ANGLE_BINARY_EVENT(Normal3x, nx, ny, nz);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateNormal3x(context, nx, ny, nz))
-        {
-            context->normal3x(nx, ny, nz);
-        }
+        context->getDispatchTable()->Normal3x(context, nx, ny, nz);
     }
 }
 
@@ -930,16 +778,12 @@ void GL_APIENTRY NormalPointer(GLenum type, GLsizei stride, const void *pointer)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
           type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(NormalPointer, type, stride, pointer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateNormalPointer(context, typePacked, stride, pointer))
-        {
-            context->normalPointer(typePacked, stride, pointer);
-        }
+        context->getDispatchTable()->NormalPointer(context, type, stride, pointer);
     }
 }
 
@@ -950,14 +794,12 @@ void GL_APIENTRY Orthof(GLfloat l, GLfloat r, GLfloat b, GLfloat t, GLfloat n, G
         "(GLfloat l = %f, GLfloat r = %f, GLfloat b = %f, GLfloat t = %f, GLfloat n = %f, GLfloat "
         "f = %f)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_EVENT(Orthof, l, r, b, t, n, f);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateOrthof(context, l, r, b, t, n, f))
-        {
-            context->orthof(l, r, b, t, n, f);
-        }
+        context->getDispatchTable()->Orthof(context, l, r, b, t, n, f);
     }
 }
 
@@ -968,14 +810,12 @@ void GL_APIENTRY Orthox(GLfixed l, GLfixed r, GLfixed b, GLfixed t, GLfixed n, G
         "(GLfixed l = 0x%X, GLfixed r = 0x%X, GLfixed b = 0x%X, GLfixed t = 0x%X, GLfixed n = "
         "0x%X, GLfixed f = 0x%X)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_EVENT(Orthox, l, r, b, t, n, f);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateOrthox(context, l, r, b, t, n, f))
-        {
-            context->orthox(l, r, b, t, n, f);
-        }
+        context->getDispatchTable()->Orthox(context, l, r, b, t, n, f);
     }
 }
 
@@ -983,15 +823,12 @@ void GL_APIENTRY PointParameterf(GLenum pname, GLfloat param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat param = %f)", pname, param);
+    ANGLE_BINARY_EVENT(PointParameterf, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
-        if (context->skipValidation() || ValidatePointParameterf(context, pnamePacked, param))
-        {
-            context->pointParameterf(pnamePacked, param);
-        }
+        context->getDispatchTable()->PointParameterf(context, pname, param);
     }
 }
 
@@ -1000,15 +837,12 @@ void GL_APIENTRY PointParameterfv(GLenum pname, const GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(PointParameterfv, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
-        if (context->skipValidation() || ValidatePointParameterfv(context, pnamePacked, params))
-        {
-            context->pointParameterfv(pnamePacked, params);
-        }
+        context->getDispatchTable()->PointParameterfv(context, pname, params);
     }
 }
 
@@ -1016,15 +850,12 @@ void GL_APIENTRY PointParameterx(GLenum pname, GLfixed param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed param = 0x%X)", pname, param);
+    ANGLE_BINARY_EVENT(PointParameterx, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
-        if (context->skipValidation() || ValidatePointParameterx(context, pnamePacked, param))
-        {
-            context->pointParameterx(pnamePacked, param);
-        }
+        context->getDispatchTable()->PointParameterx(context, pname, param);
     }
 }
 
@@ -1033,15 +864,12 @@ void GL_APIENTRY PointParameterxv(GLenum pname, const GLfixed *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(PointParameterxv, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
-        if (context->skipValidation() || ValidatePointParameterxv(context, pnamePacked, params))
-        {
-            context->pointParameterxv(pnamePacked, params);
-        }
+        context->getDispatchTable()->PointParameterxv(context, pname, params);
     }
 }
 
@@ -1049,14 +877,12 @@ void GL_APIENTRY PointSize(GLfloat size)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat size = %f)", size);
+    ANGLE_BINARY_EVENT(PointSize, size);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidatePointSize(context, size))
-        {
-            context->pointSize(size);
-        }
+        context->getDispatchTable()->PointSize(context, size);
     }
 }
 
@@ -1064,14 +890,12 @@ void GL_APIENTRY PointSizex(GLfixed size)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed size = 0x%X)", size);
+    ANGLE_BINARY_EVENT(PointSizex, size);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidatePointSizex(context, size))
-        {
-            context->pointSizex(size);
-        }
+        context->getDispatchTable()->PointSizex(context, size);
     }
 }
 
@@ -1079,59 +903,48 @@ void GL_APIENTRY PolygonOffsetx(GLfixed factor, GLfixed units)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed factor = 0x%X, GLfixed units = 0x%X)", factor, units);
+    ANGLE_BINARY_EVENT(PolygonOffsetx, factor, units);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidatePolygonOffsetx(context, factor, units))
-        {
-            context->polygonOffsetx(factor, units);
-        }
+        context->getDispatchTable()->PolygonOffsetx(context, factor, units);
     }
 }
 
 void GL_APIENTRY PopMatrix()
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(PopMatrix);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidatePopMatrix(context))
-        {
-            context->popMatrix();
-        }
+        context->getDispatchTable()->PopMatrix(context);
     }
 }
 
 void GL_APIENTRY PushMatrix()
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(PushMatrix);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidatePushMatrix(context))
-        {
-            context->pushMatrix();
-        }
+        context->getDispatchTable()->PushMatrix(context);
     }
 }
 
 void GL_APIENTRY Rotatef(GLfloat angle, GLfloat x, GLfloat y, GLfloat z)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat angle = %f, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", angle, x, y, z);
+    ANGLE_BINARY_EVENT(Rotatef, angle, x, y, z);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateRotatef(context, angle, x, y, z))
-        {
-            context->rotatef(angle, x, y, z);
-        }
+        context->getDispatchTable()->Rotatef(context, angle, x, y, z);
     }
 }
 
@@ -1140,14 +953,12 @@ void GL_APIENTRY Rotatex(GLfixed angle, GLfixed x, GLfixed y, GLfixed z)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed angle = 0x%X, GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)", angle, x,
           y, z);
+    ANGLE_BINARY_EVENT(Rotatex, angle, x, y, z);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateRotatex(context, angle, x, y, z))
-        {
-            context->rotatex(angle, x, y, z);
-        }
+        context->getDispatchTable()->Rotatex(context, angle, x, y, z);
     }
 }
 
@@ -1155,29 +966,24 @@ void GL_APIENTRY SampleCoveragex(GLclampx value, GLboolean invert)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLclampx value = 0x%X, GLboolean invert = %u)", value, invert);
+    ANGLE_BINARY_EVENT(SampleCoveragex, value, invert);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateSampleCoveragex(context, value, invert))
-        {
-            context->sampleCoveragex(value, invert);
-        }
+        context->getDispatchTable()->SampleCoveragex(context, value, invert);
     }
 }
 
 void GL_APIENTRY Scalef(GLfloat x, GLfloat y, GLfloat z)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", x, y, z);
+    ANGLE_BINARY_EVENT(Scalef, x, y, z);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateScalef(context, x, y, z))
-        {
-            context->scalef(x, y, z);
-        }
+        context->getDispatchTable()->Scalef(context, x, y, z);
     }
 }
 
@@ -1185,30 +991,24 @@ void GL_APIENTRY Scalex(GLfixed x, GLfixed y, GLfixed z)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)", x, y, z);
+    ANGLE_BINARY_EVENT(Scalex, x, y, z);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateScalex(context, x, y, z))
-        {
-            context->scalex(x, y, z);
-        }
+        context->getDispatchTable()->Scalex(context, x, y, z);
     }
 }
 
 void GL_APIENTRY ShadeModel(GLenum mode)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_EVENT(ShadeModel, mode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        ShadingModel modePacked = FromGLenum<ShadingModel>(mode);
-        if (context->skipValidation() || ValidateShadeModel(context, modePacked))
-        {
-            context->shadeModel(modePacked);
-        }
+        context->getDispatchTable()->ShadeModel(context, mode);
     }
 }
 
@@ -1219,16 +1019,12 @@ void GL_APIENTRY TexCoordPointer(GLint size, GLenum type, GLsizei stride, const
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(TexCoordPointer, size, type, stride, pointer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateTexCoordPointer(context, size, typePacked, stride, pointer))
-        {
-            context->texCoordPointer(size, typePacked, stride, pointer);
-        }
+        context->getDispatchTable()->TexCoordPointer(context, size, type, stride, pointer);
     }
 }
 
@@ -1236,16 +1032,12 @@ void GL_APIENTRY TexEnvf(GLenum target, GLenum pname, GLfloat param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", target, pname, param);
+    ANGLE_BINARY_EVENT(TexEnvf, target, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() || ValidateTexEnvf(context, targetPacked, pnamePacked, param))
-        {
-            context->texEnvf(targetPacked, pnamePacked, param);
-        }
+        context->getDispatchTable()->TexEnvf(context, target, pname, param);
     }
 }
 
@@ -1254,17 +1046,12 @@ void GL_APIENTRY TexEnvfv(GLenum target, GLenum pname, const GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexEnvfv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() ||
-            ValidateTexEnvfv(context, targetPacked, pnamePacked, params))
-        {
-            context->texEnvfv(targetPacked, pnamePacked, params);
-        }
+        context->getDispatchTable()->TexEnvfv(context, target, pname, params);
     }
 }
 
@@ -1272,16 +1059,12 @@ void GL_APIENTRY TexEnvi(GLenum target, GLenum pname, GLint param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)", target, pname, param);
+    ANGLE_BINARY_EVENT(TexEnvi, target, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() || ValidateTexEnvi(context, targetPacked, pnamePacked, param))
-        {
-            context->texEnvi(targetPacked, pnamePacked, param);
-        }
+        context->getDispatchTable()->TexEnvi(context, target, pname, param);
     }
 }
 
@@ -1290,17 +1073,12 @@ void GL_APIENTRY TexEnviv(GLenum target, GLenum pname, const GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexEnviv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() ||
-            ValidateTexEnviv(context, targetPacked, pnamePacked, params))
-        {
-            context->texEnviv(targetPacked, pnamePacked, params);
-        }
+        context->getDispatchTable()->TexEnviv(context, target, pname, params);
     }
 }
 
@@ -1309,16 +1087,12 @@ void GL_APIENTRY TexEnvx(GLenum target, GLenum pname, GLfixed param)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", target, pname,
           param);
+    ANGLE_BINARY_EVENT(TexEnvx, target, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() || ValidateTexEnvx(context, targetPacked, pnamePacked, param))
-        {
-            context->texEnvx(targetPacked, pnamePacked, param);
-        }
+        context->getDispatchTable()->TexEnvx(context, target, pname, param);
     }
 }
 
@@ -1327,17 +1101,12 @@ void GL_APIENTRY TexEnvxv(GLenum target, GLenum pname, const GLfixed *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexEnvxv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() ||
-            ValidateTexEnvxv(context, targetPacked, pnamePacked, params))
-        {
-            context->texEnvxv(targetPacked, pnamePacked, params);
-        }
+        context->getDispatchTable()->TexEnvxv(context, target, pname, params);
     }
 }
 
@@ -1346,15 +1115,12 @@ void GL_APIENTRY TexParameterx(GLenum target, GLenum pname, GLfixed param)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", target, pname,
           param);
+    ANGLE_BINARY_EVENT(TexParameterx, target, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateTexParameterx(context, targetPacked, pname, param))
-        {
-            context->texParameterx(targetPacked, pname, param);
-        }
+        context->getDispatchTable()->TexParameterx(context, target, pname, param);
     }
 }
 
@@ -1363,31 +1129,24 @@ void GL_APIENTRY TexParameterxv(GLenum target, GLenum pname, const GLfixed *para
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterxv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterxv(context, targetPacked, pname, params))
-        {
-            context->texParameterxv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->TexParameterxv(context, target, pname, params);
     }
 }
 
 void GL_APIENTRY Translatef(GLfloat x, GLfloat y, GLfloat z)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", x, y, z);
+    ANGLE_BINARY_EVENT(Translatef, x, y, z);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateTranslatef(context, x, y, z))
-        {
-            context->translatef(x, y, z);
-        }
+        context->getDispatchTable()->Translatef(context, x, y, z);
     }
 }
 
@@ -1395,14 +1154,12 @@ void GL_APIENTRY Translatex(GLfixed x, GLfixed y, GLfixed z)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)", x, y, z);
+    ANGLE_BINARY_EVENT(Translatex, x, y, z);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateTranslatex(context, x, y, z))
-        {
-            context->translatex(x, y, z);
-        }
+        context->getDispatchTable()->Translatex(context, x, y, z);
     }
 }
 
@@ -1413,16 +1170,12 @@ void GL_APIENTRY VertexPointer(GLint size, GLenum type, GLsizei stride, const vo
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(VertexPointer, size, type, stride, pointer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateVertexPointer(context, size, typePacked, stride, pointer))
-        {
-            context->vertexPointer(size, typePacked, stride, pointer);
-        }
+        context->getDispatchTable()->VertexPointer(context, size, type, stride, pointer);
     }
 }
 }  // namespace gl
@@ -11,8 +11,8 @@
 #include "libGLESv2/entry_points_gles_2_0_autogen.h"
 
 #include "libANGLE/Context.h"
-#include "libANGLE/Context.inl.h"
-#include "libANGLE/validationES2.h"
+#include "libGLESv2/entry_points_binary_event.h"
+#include "libGLESv2/entry_points_dispatch_autogen.h"
 #include "libGLESv2/entry_points_utils.h"
 #include "libGLESv2/global_state.h"
 
@@ -20,16 +20,13 @@ namespace gl
 {
 void GL_APIENTRY ActiveTexture(GLenum texture)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum texture = 0x%X)", texture);
+    ANGLE_BINARY_EVENT(ActiveTexture, texture);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateActiveTexture(context, texture))
-        {
-            context->activeTexture(texture);
-        }
+        context->getDispatchTable()->ActiveTexture(context, texture);
     }
 }
 
@@ -37,14 +34,12 @@ void GL_APIENTRY AttachShader(GLuint program, GLuint shader)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint shader = %u)", program, shader);
+    ANGLE_BINARY_EVENT(AttachShader, program, shader);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateAttachShader(context, program, shader))
-        {
-            context->attachShader(program, shader);
-        }
+        context->getDispatchTable()->AttachShader(context, program, shader);
     }
 }
 
@@ -53,14 +48,12 @@ void GL_APIENTRY BindAttribLocation(GLuint program, GLuint index, const GLchar *
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint index = %u, const GLchar *name = 0x%016" PRIxPTR ")",
           program, index, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(BindAttribLocation, program, index, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBindAttribLocation(context, program, index, name))
-        {
-            context->bindAttribLocation(program, index, name);
-        }
+        context->getDispatchTable()->BindAttribLocation(context, program, index, name);
     }
 }
 
@@ -68,15 +61,12 @@ void GL_APIENTRY BindBuffer(GLenum target, GLuint buffer)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint buffer = %u)", target, buffer);
+    ANGLE_BINARY_EVENT(BindBuffer, target, buffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateBindBuffer(context, targetPacked, buffer))
-        {
-            context->bindBuffer(targetPacked, buffer);
-        }
+        context->getDispatchTable()->BindBuffer(context, target, buffer);
     }
 }
 
@@ -84,14 +74,12 @@ void GL_APIENTRY BindFramebuffer(GLenum target, GLuint framebuffer)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint framebuffer = %u)", target, framebuffer);
+    ANGLE_BINARY_EVENT(BindFramebuffer, target, framebuffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBindFramebuffer(context, target, framebuffer))
-        {
-            context->bindFramebuffer(target, framebuffer);
-        }
+        context->getDispatchTable()->BindFramebuffer(context, target, framebuffer);
     }
 }
 
@@ -99,14 +87,12 @@ void GL_APIENTRY BindRenderbuffer(GLenum target, GLuint renderbuffer)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint renderbuffer = %u)", target, renderbuffer);
+    ANGLE_BINARY_EVENT(BindRenderbuffer, target, renderbuffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBindRenderbuffer(context, target, renderbuffer))
-        {
-            context->bindRenderbuffer(target, renderbuffer);
-        }
+        context->getDispatchTable()->BindRenderbuffer(context, target, renderbuffer);
     }
 }
 
@@ -114,76 +100,61 @@ void GL_APIENTRY BindTexture(GLenum target, GLuint texture)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint texture = %u)", target, texture);
+    ANGLE_BINARY_EVENT(BindTexture, target, texture);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateBindTexture(context, targetPacked, texture))
-        {
-            context->bindTexture(targetPacked, texture);
-        }
+        context->getDispatchTable()->BindTexture(context, target, texture);
     }
 }
 
 void GL_APIENTRY BlendColor(GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, GLfloat alpha = %f)", red,
           green, blue, alpha);
+    ANGLE_BINARY_EVENT(BlendColor, red, green, blue, alpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBlendColor(context, red, green, blue, alpha))
-        {
-            context->blendColor(red, green, blue, alpha);
-        }
+        context->getDispatchTable()->BlendColor(context, red, green, blue, alpha);
     }
 }
 
 void GL_APIENTRY BlendEquation(GLenum mode)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_EVENT(BlendEquation, mode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBlendEquation(context, mode))
-        {
-            context->blendEquation(mode);
-        }
+        context->getDispatchTable()->BlendEquation(context, mode);
     }
 }
 
 void GL_APIENTRY BlendEquationSeparate(GLenum modeRGB, GLenum modeAlpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum modeRGB = 0x%X, GLenum modeAlpha = 0x%X)", modeRGB, modeAlpha);
+    ANGLE_BINARY_EVENT(BlendEquationSeparate, modeRGB, modeAlpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBlendEquationSeparate(context, modeRGB, modeAlpha))
-        {
-            context->blendEquationSeparate(modeRGB, modeAlpha);
-        }
+        context->getDispatchTable()->BlendEquationSeparate(context, modeRGB, modeAlpha);
     }
 }
 
 void GL_APIENTRY BlendFunc(GLenum sfactor, GLenum dfactor)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum sfactor = 0x%X, GLenum dfactor = 0x%X)", sfactor, dfactor);
+    ANGLE_BINARY_EVENT(BlendFunc, sfactor, dfactor);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBlendFunc(context, sfactor, dfactor))
-        {
-            context->blendFunc(sfactor, dfactor);
-        }
+        context->getDispatchTable()->BlendFunc(context, sfactor, dfactor);
     }
 }
 
@@ -192,20 +163,17 @@ void GL_APIENTRY BlendFuncSeparate(GLenum sfactorRGB,
                                    GLenum sfactorAlpha,
                                    GLenum dfactorAlpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum sfactorRGB = 0x%X, GLenum dfactorRGB = 0x%X, GLenum sfactorAlpha = 0x%X, GLenum "
         "dfactorAlpha = 0x%X)",
         sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
+    ANGLE_BINARY_EVENT(BlendFuncSeparate, sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateBlendFuncSeparate(context, sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha))
-        {
-            context->blendFuncSeparate(sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
-        }
+        context->getDispatchTable()->BlendFuncSeparate(context, sfactorRGB, dfactorRGB,
+                                                       sfactorAlpha, dfactorAlpha);
     }
 }
 
@@ -215,17 +183,12 @@ void GL_APIENTRY BufferData(GLenum target, GLsizeiptr size, const void *data, GL
     EVENT("(GLenum target = 0x%X, GLsizeiptr size = %llu, const void *data = 0x%016" PRIxPTR
           ", GLenum usage = 0x%X)",
           target, static_cast<unsigned long long>(size), (uintptr_t)data, usage);
+    ANGLE_BINARY_EVENT(BufferData, target, size, data, usage);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        BufferUsage usagePacked    = FromGLenum<BufferUsage>(usage);
-        if (context->skipValidation() ||
-            ValidateBufferData(context, targetPacked, size, data, usagePacked))
-        {
-            context->bufferData(targetPacked, size, data, usagePacked);
-        }
+        context->getDispatchTable()->BufferData(context, target, size, data, usage);
     }
 }
 
@@ -237,16 +200,12 @@ void GL_APIENTRY BufferSubData(GLenum target, GLintptr offset, GLsizeiptr size,
         "0x%016" PRIxPTR ")",
         target, static_cast<unsigned long long>(offset), static_cast<unsigned long long>(size),
         (uintptr_t)data);
+    ANGLE_BINARY_EVENT(BufferSubData, target, offset, size, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateBufferSubData(context, targetPacked, offset, size, data))
-        {
-            context->bufferSubData(targetPacked, offset, size, data);
-        }
+        context->getDispatchTable()->BufferSubData(context, target, offset, size, data);
     }
 }
 
@@ -254,14 +213,12 @@ GLenum GL_APIENTRY CheckFramebufferStatus(GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(CheckFramebufferStatus, target);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateCheckFramebufferStatus(context, target))
-        {
-            return context->checkFramebufferStatus(target);
-        }
+        return context->getDispatchTable()->CheckFramebufferStatus(context, target);
     }
 
     return GetDefaultReturnValue<EntryPoint::CheckFramebufferStatus, GLenum>();
@@ -271,76 +228,62 @@ void GL_APIENTRY Clear(GLbitfield mask)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLbitfield mask = 0x%X)", mask);
+    ANGLE_BINARY_EVENT(Clear, mask);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClear(context, mask))
-        {
-            context->clear(mask);
-        }
+        context->getDispatchTable()->Clear(context, mask);
     }
 }
 
 void GL_APIENTRY ClearColor(GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, GLfloat alpha = %f)", red,
           green, blue, alpha);
+    ANGLE_BINARY_EVENT(ClearColor, red, green, blue, alpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClearColor(context, red, green, blue, alpha))
-        {
-            context->clearColor(red, green, blue, alpha);
-        }
+        context->getDispatchTable()->ClearColor(context, red, green, blue, alpha);
     }
 }
 
 void GL_APIENTRY ClearDepthf(GLfloat d)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat d = %f)", d);
+    ANGLE_BINARY_EVENT(ClearDepthf, d);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClearDepthf(context, d))
-        {
-            context->clearDepthf(d);
-        }
+        context->getDispatchTable()->ClearDepthf(context, d);
     }
 }
 
 void GL_APIENTRY ClearStencil(GLint s)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint s = %d)", s);
+    ANGLE_BINARY_EVENT(ClearStencil, s);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClearStencil(context, s))
-        {
-            context->clearStencil(s);
-        }
+        context->getDispatchTable()->ClearStencil(context, s);
     }
 }
 
 void GL_APIENTRY ColorMask(GLboolean red, GLboolean green, GLboolean blue, GLboolean alpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLboolean red = %u, GLboolean green = %u, GLboolean blue = %u, GLboolean alpha = %u)",
           red, green, blue, alpha);
+    ANGLE_BINARY_EVENT(ColorMask, red, green, blue, alpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateColorMask(context, red, green, blue, alpha))
-        {
-            context->colorMask(red, green, blue, alpha);
-        }
+        context->getDispatchTable()->ColorMask(context, red, green, blue, alpha);
     }
 }
 
@@ -348,14 +291,12 @@ void GL_APIENTRY CompileShader(GLuint shader)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u)", shader);
+    ANGLE_BINARY_EVENT(CompileShader, shader);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateCompileShader(context, shader))
-        {
-            context->compileShader(shader);
-        }
+        context->getDispatchTable()->CompileShader(context, shader);
     }
 }
 
@@ -374,18 +315,14 @@ void GL_APIENTRY CompressedTexImage2D(GLenum target,
         "%d, GLsizei height = %d, GLint border = %d, GLsizei imageSize = %d, const void *data = "
         "0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, imageSize, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexImage2D, target, level, internalformat, width, height, border,
+                       imageSize, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCompressedTexImage2D(context, targetPacked, level, internalformat, width,
-                                         height, border, imageSize, data))
-        {
-            context->compressedTexImage2D(targetPacked, level, internalformat, width, height,
-                                          border, imageSize, data);
-        }
+        context->getDispatchTable()->CompressedTexImage2D(context, target, level, internalformat,
+                                                          width, height, border, imageSize, data);
     }
 }
 
@@ -405,18 +342,14 @@ void GL_APIENTRY CompressedTexSubImage2D(GLenum target,
         "width = %d, GLsizei height = %d, GLenum format = 0x%X, GLsizei imageSize = %d, const void "
         "*data = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, imageSize, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexSubImage2D, target, level, xoffset, yoffset, width, height,
+                       format, imageSize, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCompressedTexSubImage2D(context, targetPacked, level, xoffset, yoffset, width,
-                                            height, format, imageSize, data))
-        {
-            context->compressedTexSubImage2D(targetPacked, level, xoffset, yoffset, width, height,
-                                             format, imageSize, data);
-        }
+        context->getDispatchTable()->CompressedTexSubImage2D(
+            context, target, level, xoffset, yoffset, width, height, format, imageSize, data);
     }
 }
 
@@ -434,18 +367,13 @@ void GL_APIENTRY CopyTexImage2D(GLenum target,
         "(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = 0x%X, GLint x = %d, "
         "GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLint border = %d)",
         target, level, internalformat, x, y, width, height, border);
+    ANGLE_BINARY_EVENT(CopyTexImage2D, target, level, internalformat, x, y, width, height, border);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCopyTexImage2D(context, targetPacked, level, internalformat, x, y, width,
-                                   height, border))
-        {
-            context->copyTexImage2D(targetPacked, level, internalformat, x, y, width, height,
-                                    border);
-        }
+        context->getDispatchTable()->CopyTexImage2D(context, target, level, internalformat, x, y,
+                                                    width, height, border);
     }
 }
 
@@ -463,17 +391,13 @@ void GL_APIENTRY CopyTexSubImage2D(GLenum target,
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint x "
         "= %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
         target, level, xoffset, yoffset, x, y, width, height);
+    ANGLE_BINARY_EVENT(CopyTexSubImage2D, target, level, xoffset, yoffset, x, y, width, height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCopyTexSubImage2D(context, targetPacked, level, xoffset, yoffset, x, y, width,
-                                      height))
-        {
-            context->copyTexSubImage2D(targetPacked, level, xoffset, yoffset, x, y, width, height);
-        }
+        context->getDispatchTable()->CopyTexSubImage2D(context, target, level, xoffset, yoffset, x,
+                                                       y, width, height);
     }
 }
 
@@ -481,14 +405,12 @@ GLuint GL_APIENTRY CreateProgram()
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(CreateProgram);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateCreateProgram(context))
-        {
-            return context->createProgram();
-        }
+        return context->getDispatchTable()->CreateProgram(context);
     }
 
     return GetDefaultReturnValue<EntryPoint::CreateProgram, GLuint>();
@@ -498,15 +420,12 @@ GLuint GL_APIENTRY CreateShader(GLenum type)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X)", type);
+    ANGLE_BINARY_EVENT(CreateShader, type);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        ShaderType typePacked = FromGLenum<ShaderType>(type);
-        if (context->skipValidation() || ValidateCreateShader(context, typePacked))
-        {
-            return context->createShader(typePacked);
-        }
+        return context->getDispatchTable()->CreateShader(context, type);
     }
 
     return GetDefaultReturnValue<EntryPoint::CreateShader, GLuint>();
@@ -514,17 +433,13 @@ GLuint GL_APIENTRY CreateShader(GLenum type)
 
 void GL_APIENTRY CullFace(GLenum mode)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_EVENT(CullFace, mode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        CullFaceMode modePacked = FromGLenum<CullFaceMode>(mode);
-        if (context->skipValidation() || ValidateCullFace(context, modePacked))
-        {
-            context->cullFace(modePacked);
-        }
+        context->getDispatchTable()->CullFace(context, mode);
     }
 }
 
@@ -532,14 +447,12 @@ void GL_APIENTRY DeleteBuffers(GLsizei n, const GLuint *buffers)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *buffers = 0x%016" PRIxPTR ")", n, (uintptr_t)buffers);
+    ANGLE_BINARY_EVENT(DeleteBuffers, n, buffers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteBuffers(context, n, buffers))
-        {
-            context->deleteBuffers(n, buffers);
-        }
+        context->getDispatchTable()->DeleteBuffers(context, n, buffers);
     }
 }
 
@@ -548,14 +461,12 @@ void GL_APIENTRY DeleteFramebuffers(GLsizei n, const GLuint *framebuffers)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *framebuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)framebuffers);
+    ANGLE_BINARY_EVENT(DeleteFramebuffers, n, framebuffers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteFramebuffers(context, n, framebuffers))
-        {
-            context->deleteFramebuffers(n, framebuffers);
-        }
+        context->getDispatchTable()->DeleteFramebuffers(context, n, framebuffers);
     }
 }
 
@@ -563,14 +474,12 @@ void GL_APIENTRY DeleteProgram(GLuint program)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_EVENT(DeleteProgram, program);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteProgram(context, program))
-        {
-            context->deleteProgram(program);
-        }
+        context->getDispatchTable()->DeleteProgram(context, program);
     }
 }
 
@@ -579,14 +488,12 @@ void GL_APIENTRY DeleteRenderbuffers(GLsizei n, const GLuint *renderbuffers)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_EVENT(DeleteRenderbuffers, n, renderbuffers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteRenderbuffers(context, n, renderbuffers))
-        {
-            context->deleteRenderbuffers(n, renderbuffers);
-        }
+        context->getDispatchTable()->DeleteRenderbuffers(context, n, renderbuffers);
     }
 }
 
@@ -594,14 +501,12 @@ void GL_APIENTRY DeleteShader(GLuint shader)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u)", shader);
+    ANGLE_BINARY_EVENT(DeleteShader, shader);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteShader(context, shader))
-        {
-            context->deleteShader(shader);
-        }
+        context->getDispatchTable()->DeleteShader(context, shader);
     }
 }
 
@@ -609,59 +514,48 @@ void GL_APIENTRY DeleteTextures(GLsizei n, const GLuint *textures)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *textures = 0x%016" PRIxPTR ")", n, (uintptr_t)textures);
+    ANGLE_BINARY_EVENT(DeleteTextures, n, textures);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteTextures(context, n, textures))
-        {
-            context->deleteTextures(n, textures);
-        }
+        context->getDispatchTable()->DeleteTextures(context, n, textures);
     }
 }
 
 void GL_APIENTRY DepthFunc(GLenum func)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X)", func);
+    ANGLE_BINARY_EVENT(DepthFunc, func);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDepthFunc(context, func))
-        {
-            context->depthFunc(func);
-        }
+        context->getDispatchTable()->DepthFunc(context, func);
     }
 }
 
 void GL_APIENTRY DepthMask(GLboolean flag)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLboolean flag = %u)", flag);
+    ANGLE_BINARY_EVENT(DepthMask, flag);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDepthMask(context, flag))
-        {
-            context->depthMask(flag);
-        }
+        context->getDispatchTable()->DepthMask(context, flag);
     }
 }
 
 void GL_APIENTRY DepthRangef(GLfloat n, GLfloat f)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat n = %f, GLfloat f = %f)", n, f);
+    ANGLE_BINARY_EVENT(DepthRangef, n, f);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDepthRangef(context, n, f))
-        {
-            context->depthRangef(n, f);
-        }
+        context->getDispatchTable()->DepthRangef(context, n, f);
     }
 }
 
@@ -669,44 +563,36 @@ void GL_APIENTRY DetachShader(GLuint program, GLuint shader)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint shader = %u)", program, shader);
+    ANGLE_BINARY_EVENT(DetachShader, program, shader);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDetachShader(context, program, shader))
-        {
-            context->detachShader(program, shader);
-        }
+        context->getDispatchTable()->DetachShader(context, program, shader);
     }
 }
 
 void GL_APIENTRY Disable(GLenum cap)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum cap = 0x%X)", cap);
+    ANGLE_BINARY_EVENT(Disable, cap);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDisable(context, cap))
-        {
-            context->disable(cap);
-        }
+        context->getDispatchTable()->Disable(context, cap);
     }
 }
 
 void GL_APIENTRY DisableVertexAttribArray(GLuint index)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u)", index);
+    ANGLE_BINARY_EVENT(DisableVertexAttribArray, index);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDisableVertexAttribArray(context, index))
-        {
-            context->disableVertexAttribArray(index);
-        }
+        context->getDispatchTable()->DisableVertexAttribArray(context, index);
     }
 }
 
@@ -714,15 +600,12 @@ void GL_APIENTRY DrawArrays(GLenum mode, GLint first, GLsizei count)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d)", mode, first, count);
+    ANGLE_BINARY_EVENT(DrawArrays, mode, first, count);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() || ValidateDrawArrays(context, modePacked, first, count))
-        {
-            context->drawArrays(modePacked, first, count);
-        }
+        context->getDispatchTable()->DrawArrays(context, mode, first, count);
     }
 }
 
@@ -733,47 +616,36 @@ void GL_APIENTRY DrawElements(GLenum mode, GLsizei count, GLenum type, const voi
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ")",
         mode, count, type, (uintptr_t)indices);
+    ANGLE_BINARY_EVENT(DrawElements, mode, count, type, indices);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateDrawElements(context, modePacked, count, typePacked, indices))
-        {
-            context->drawElements(modePacked, count, typePacked, indices);
-        }
+        context->getDispatchTable()->DrawElements(context, mode, count, type, indices);
     }
 }
 
 void GL_APIENTRY Enable(GLenum cap)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum cap = 0x%X)", cap);
+    ANGLE_BINARY_EVENT(Enable, cap);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateEnable(context, cap))
-        {
-            context->enable(cap);
-        }
+        context->getDispatchTable()->Enable(context, cap);
     }
 }
 
 void GL_APIENTRY EnableVertexAttribArray(GLuint index)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u)", index);
+    ANGLE_BINARY_EVENT(EnableVertexAttribArray, index);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateEnableVertexAttribArray(context, index))
-        {
-            context->enableVertexAttribArray(index);
-        }
+        context->getDispatchTable()->EnableVertexAttribArray(context, index);
     }
 }
 
@@ -781,14 +653,12 @@ void GL_APIENTRY Finish()
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(Finish);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateFinish(context))
-        {
-            context->finish();
-        }
+        context->getDispatchTable()->Finish(context);
     }
 }
 
@@ -796,14 +666,12 @@ void GL_APIENTRY Flush()
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(Flush);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateFlush(context))
-        {
-            context->flush();
-        }
+        context->getDispatchTable()->Flush(context);
     }
 }
 
@@ -817,16 +685,14 @@ void GL_APIENTRY FramebufferRenderbuffer(GLenum target,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum renderbuffertarget = 0x%X, GLuint "
         "renderbuffer = %u)",
         target, attachment, renderbuffertarget, renderbuffer);
+    ANGLE_BINARY_EVENT(FramebufferRenderbuffer, target, attachment, renderbuffertarget,
+                       renderbuffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateFramebufferRenderbuffer(context, target, attachment, renderbuffertarget,
-                                            renderbuffer))
-        {
-            context->framebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
-        }
+        context->getDispatchTable()->FramebufferRenderbuffer(context, target, attachment,
+                                                             renderbuffertarget, renderbuffer);
     }
 }
 
@@ -841,32 +707,25 @@ void GL_APIENTRY FramebufferTexture2D(GLenum target,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum textarget = 0x%X, GLuint texture "
         "= %u, GLint level = %d)",
         target, attachment, textarget, texture, level);
+    ANGLE_BINARY_EVENT(FramebufferTexture2D, target, attachment, textarget, texture, level);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget textargetPacked = FromGLenum<TextureTarget>(textarget);
-        if (context->skipValidation() ||
-            ValidateFramebufferTexture2D(context, target, attachment, textargetPacked, texture,
-                                         level))
-        {
-            context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
-        }
+        context->getDispatchTable()->FramebufferTexture2D(context, target, attachment, textarget,
+                                                          texture, level);
     }
 }
 
 void GL_APIENTRY FrontFace(GLenum mode)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_EVENT(FrontFace, mode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateFrontFace(context, mode))
-        {
-            context->frontFace(mode);
-        }
+        context->getDispatchTable()->FrontFace(context, mode);
     }
 }
 
@@ -874,14 +733,12 @@ void GL_APIENTRY GenBuffers(GLsizei n, GLuint *buffers)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *buffers = 0x%016" PRIxPTR ")", n, (uintptr_t)buffers);
+    ANGLE_BINARY_EVENT(GenBuffers, n, buffers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenBuffers(context, n, buffers))
-        {
-            context->genBuffers(n, buffers);
-        }
+        context->getDispatchTable()->GenBuffers(context, n, buffers);
     }
 }
 
@@ -889,14 +746,12 @@ void GL_APIENTRY GenFramebuffers(GLsizei n, GLuint *framebuffers)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *framebuffers = 0x%016" PRIxPTR ")", n, (uintptr_t)framebuffers);
+    ANGLE_BINARY_EVENT(GenFramebuffers, n, framebuffers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenFramebuffers(context, n, framebuffers))
-        {
-            context->genFramebuffers(n, framebuffers);
-        }
+        context->getDispatchTable()->GenFramebuffers(context, n, framebuffers);
     }
 }
 
@@ -905,14 +760,12 @@ void GL_APIENTRY GenRenderbuffers(GLsizei n, GLuint *renderbuffers)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_EVENT(GenRenderbuffers, n, renderbuffers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenRenderbuffers(context, n, renderbuffers))
-        {
-            context->genRenderbuffers(n, renderbuffers);
-        }
+        context->getDispatchTable()->GenRenderbuffers(context, n, renderbuffers);
     }
 }
 
@@ -920,14 +773,12 @@ void GL_APIENTRY GenTextures(GLsizei n, GLuint *textures)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *textures = 0x%016" PRIxPTR ")", n, (uintptr_t)textures);
+    ANGLE_BINARY_EVENT(GenTextures, n, textures);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenTextures(context, n, textures))
-        {
-            context->genTextures(n, textures);
-        }
+        context->getDispatchTable()->GenTextures(context, n, textures);
     }
 }
 
@@ -935,15 +786,12 @@ void GL_APIENTRY GenerateMipmap(GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(GenerateMipmap, target);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateGenerateMipmap(context, targetPacked))
-        {
-            context->generateMipmap(targetPacked);
-        }
+        context->getDispatchTable()->GenerateMipmap(context, target);
     }
 }
 
@@ -962,15 +810,13 @@ void GL_APIENTRY GetActiveAttrib(GLuint program,
         ", GLchar *name = 0x%016" PRIxPTR ")",
         program, index, bufSize, (uintptr_t)length, (uintptr_t)size, (uintptr_t)type,
         (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetActiveAttrib, program, index, bufSize, length, size, type, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetActiveAttrib(context, program, index, bufSize, length, size, type, name))
-        {
-            context->getActiveAttrib(program, index, bufSize, length, size, type, name);
-        }
+        context->getDispatchTable()->GetActiveAttrib(context, program, index, bufSize, length, size,
+                                                     type, name);
     }
 }
 
@@ -989,15 +835,13 @@ void GL_APIENTRY GetActiveUniform(GLuint program,
         ", GLchar *name = 0x%016" PRIxPTR ")",
         program, index, bufSize, (uintptr_t)length, (uintptr_t)size, (uintptr_t)type,
         (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetActiveUniform, program, index, bufSize, length, size, type, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetActiveUniform(context, program, index, bufSize, length, size, type, name))
-        {
-            context->getActiveUniform(program, index, bufSize, length, size, type, name);
-        }
+        context->getDispatchTable()->GetActiveUniform(context, program, index, bufSize, length,
+                                                      size, type, name);
     }
 }
 
@@ -1010,31 +854,26 @@ void GL_APIENTRY GetAttachedShaders(GLuint program,
     EVENT("(GLuint program = %u, GLsizei maxCount = %d, GLsizei *count = 0x%016" PRIxPTR
           ", GLuint *shaders = 0x%016" PRIxPTR ")",
           program, maxCount, (uintptr_t)count, (uintptr_t)shaders);
+    ANGLE_BINARY_EVENT(GetAttachedShaders, program, maxCount, count, shaders);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetAttachedShaders(context, program, maxCount, count, shaders))
-        {
-            context->getAttachedShaders(program, maxCount, count, shaders);
-        }
+        context->getDispatchTable()->GetAttachedShaders(context, program, maxCount, count, shaders);
     }
 }
 
 GLint GL_APIENTRY GetAttribLocation(GLuint program, const GLchar *name)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetAttribLocation, program, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetAttribLocation(context, program, name))
-        {
-            return context->getAttribLocation(program, name);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        return context->getDispatchTable()->GetAttribLocation(context, program, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetAttribLocation, GLint>();
@@ -1044,14 +883,12 @@ void GL_APIENTRY GetBooleanv(GLenum pname, GLboolean *data)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLboolean *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetBooleanv, pname, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetBooleanv(context, pname, data))
-        {
-            context->getBooleanv(pname, data);
-        }
+        context->getDispatchTable()->GetBooleanv(context, pname, data);
     }
 }
 
@@ -1060,31 +897,24 @@ void GL_APIENTRY GetBufferParameteriv(GLenum target, GLenum pname, GLint *params
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferParameteriv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateGetBufferParameteriv(context, targetPacked, pname, params))
-        {
-            context->getBufferParameteriv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->GetBufferParameteriv(context, target, pname, params);
     }
 }
 
 GLenum GL_APIENTRY GetError()
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(GetError);
 
     Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetError(context))
-        {
-            return context->getError();
-        }
+        return context->getDispatchTable()->GetError(context);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetError, GLenum>();
@@ -1094,14 +924,12 @@ void GL_APIENTRY GetFloatv(GLenum pname, GLfloat *data)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetFloatv, pname, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetFloatv(context, pname, data))
-        {
-            context->getFloatv(pname, data);
-        }
+        context->getDispatchTable()->GetFloatv(context, pname, data);
     }
 }
 
@@ -1115,15 +943,13 @@ void GL_APIENTRY GetFramebufferAttachmentParameteriv(GLenum target,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         target, attachment, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFramebufferAttachmentParameteriv, target, attachment, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetFramebufferAttachmentParameteriv(context, target, attachment, pname, params))
-        {
-            context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
-        }
+        context->getDispatchTable()->GetFramebufferAttachmentParameteriv(context, target,
+                                                                         attachment, pname, params);
     }
 }
 
@@ -1131,14 +957,12 @@ void GL_APIENTRY GetIntegerv(GLenum pname, GLint *data)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLint *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetIntegerv, pname, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetIntegerv(context, pname, data))
-        {
-            context->getIntegerv(pname, data);
-        }
+        context->getDispatchTable()->GetIntegerv(context, pname, data);
     }
 }
 
@@ -1151,15 +975,12 @@ void GL_APIENTRY GetProgramInfoLog(GLuint program,
     EVENT("(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *infoLog = 0x%016" PRIxPTR ")",
           program, bufSize, (uintptr_t)length, (uintptr_t)infoLog);
+    ANGLE_BINARY_EVENT(GetProgramInfoLog, program, bufSize, length, infoLog);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramInfoLog(context, program, bufSize, length, infoLog))
-        {
-            context->getProgramInfoLog(program, bufSize, length, infoLog);
-        }
+        context->getDispatchTable()->GetProgramInfoLog(context, program, bufSize, length, infoLog);
     }
 }
 
@@ -1168,14 +989,12 @@ void GL_APIENTRY GetProgramiv(GLuint program, GLenum pname, GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", program,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetProgramiv, program, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetProgramiv(context, program, pname, params))
-        {
-            context->getProgramiv(program, pname, params);
-        }
+        context->getDispatchTable()->GetProgramiv(context, program, pname, params);
     }
 }
 
@@ -1184,15 +1003,12 @@ void GL_APIENTRY GetRenderbufferParameteriv(GLenum target, GLenum pname, GLint *
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetRenderbufferParameteriv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetRenderbufferParameteriv(context, target, pname, params))
-        {
-            context->getRenderbufferParameteriv(target, pname, params);
-        }
+        context->getDispatchTable()->GetRenderbufferParameteriv(context, target, pname, params);
     }
 }
 
@@ -1202,15 +1018,12 @@ void GL_APIENTRY GetShaderInfoLog(GLuint shader, GLsizei bufSize, GLsizei *lengt
     EVENT("(GLuint shader = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *infoLog = 0x%016" PRIxPTR ")",
           shader, bufSize, (uintptr_t)length, (uintptr_t)infoLog);
+    ANGLE_BINARY_EVENT(GetShaderInfoLog, shader, bufSize, length, infoLog);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetShaderInfoLog(context, shader, bufSize, length, infoLog))
-        {
-            context->getShaderInfoLog(shader, bufSize, length, infoLog);
-        }
+        context->getDispatchTable()->GetShaderInfoLog(context, shader, bufSize, length, infoLog);
     }
 }
 
@@ -1223,15 +1036,13 @@ void GL_APIENTRY GetShaderPrecisionFormat(GLenum shadertype,
     EVENT("(GLenum shadertype = 0x%X, GLenum precisiontype = 0x%X, GLint *range = 0x%016" PRIxPTR
           ", GLint *precision = 0x%016" PRIxPTR ")",
           shadertype, precisiontype, (uintptr_t)range, (uintptr_t)precision);
+    ANGLE_BINARY_EVENT(GetShaderPrecisionFormat, shadertype, precisiontype, range, precision);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetShaderPrecisionFormat(context, shadertype, precisiontype, range, precision))
-        {
-            context->getShaderPrecisionFormat(shadertype, precisiontype, range, precision);
-        }
+        context->getDispatchTable()->GetShaderPrecisionFormat(context, shadertype, precisiontype,
+                                                              range, precision);
     }
 }
 
@@ -1241,15 +1052,12 @@ void GL_APIENTRY GetShaderSource(GLuint shader, GLsizei bufSize, GLsizei *length
     EVENT("(GLuint shader = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *source = 0x%016" PRIxPTR ")",
           shader, bufSize, (uintptr_t)length, (uintptr_t)source);
+    ANGLE_BINARY_EVENT(GetShaderSource, shader, bufSize, length, source);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetShaderSource(context, shader, bufSize, length, source))
-        {
-            context->getShaderSource(shader, bufSize, length, source);
-        }
+        context->getDispatchTable()->GetShaderSource(context, shader, bufSize, length, source);
     }
 }
 
@@ -1258,14 +1066,12 @@ void GL_APIENTRY GetShaderiv(GLuint shader, GLenum pname, GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", shader,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetShaderiv, shader, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetShaderiv(context, shader, pname, params))
-        {
-            context->getShaderiv(shader, pname, params);
-        }
+        context->getDispatchTable()->GetShaderiv(context, shader, pname, params);
     }
 }
 
@@ -1273,14 +1079,12 @@ const GLubyte *GL_APIENTRY GetString(GLenum name)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum name = 0x%X)", name);
+    ANGLE_BINARY_EVENT(GetString, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetString(context, name))
-        {
-            return context->getString(name);
-        }
+        return context->getDispatchTable()->GetString(context, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetString, const GLubyte *>();
@@ -1291,16 +1095,12 @@ void GL_APIENTRY GetTexParameterfv(GLenum target, GLenum pname, GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterfv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexParameterfv(context, targetPacked, pname, params))
-        {
-            context->getTexParameterfv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->GetTexParameterfv(context, target, pname, params);
     }
 }
 
@@ -1309,32 +1109,26 @@ void GL_APIENTRY GetTexParameteriv(GLenum target, GLenum pname, GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameteriv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexParameteriv(context, targetPacked, pname, params))
-        {
-            context->getTexParameteriv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->GetTexParameteriv(context, target, pname, params);
     }
 }
 
 GLint GL_APIENTRY GetUniformLocation(GLuint program, const GLchar *name)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetUniformLocation, program, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetUniformLocation(context, program, name))
-        {
-            return context->getUniformLocation(program, name);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        return context->getDispatchTable()->GetUniformLocation(context, program, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetUniformLocation, GLint>();
@@ -1342,33 +1136,29 @@ GLint GL_APIENTRY GetUniformLocation(GLuint program, const GLchar *name)
 
 void GL_APIENTRY GetUniformfv(GLuint program, GLint location, GLfloat *params)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLfloat *params = 0x%016" PRIxPTR ")",
           program, location, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetUniformfv, program, location, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetUniformfv(context, program, location, params))
-        {
-            context->getUniformfv(program, location, params);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->GetUniformfv(context, program, location, params);
     }
 }
 
 void GL_APIENTRY GetUniformiv(GLuint program, GLint location, GLint *params)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint *params = 0x%016" PRIxPTR ")", program,
           location, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetUniformiv, program, location, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetUniformiv(context, program, location, params))
-        {
-            context->getUniformiv(program, location, params);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->GetUniformiv(context, program, location, params);
     }
 }
 
@@ -1377,15 +1167,12 @@ void GL_APIENTRY GetVertexAttribPointerv(GLuint index, GLenum pname, void **poin
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, void **pointer = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(GetVertexAttribPointerv, index, pname, pointer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetVertexAttribPointerv(context, index, pname, pointer))
-        {
-            context->getVertexAttribPointerv(index, pname, pointer);
-        }
+        context->getDispatchTable()->GetVertexAttribPointerv(context, index, pname, pointer);
     }
 }
 
@@ -1394,14 +1181,12 @@ void GL_APIENTRY GetVertexAttribfv(GLuint index, GLenum pname, GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribfv, index, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetVertexAttribfv(context, index, pname, params))
-        {
-            context->getVertexAttribfv(index, pname, params);
-        }
+        context->getDispatchTable()->GetVertexAttribfv(context, index, pname, params);
     }
 }
 
@@ -1410,29 +1195,24 @@ void GL_APIENTRY GetVertexAttribiv(GLuint index, GLenum pname, GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribiv, index, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetVertexAttribiv(context, index, pname, params))
-        {
-            context->getVertexAttribiv(index, pname, params);
-        }
+        context->getDispatchTable()->GetVertexAttribiv(context, index, pname, params);
     }
 }
 
 void GL_APIENTRY Hint(GLenum target, GLenum mode)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum mode = 0x%X)", target, mode);
+    ANGLE_BINARY_EVENT(Hint, target, mode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateHint(context, target, mode))
-        {
-            context->hint(target, mode);
-        }
+        context->getDispatchTable()->Hint(context, target, mode);
     }
 }
 
@@ -1440,14 +1220,12 @@ GLboolean GL_APIENTRY IsBuffer(GLuint buffer)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint buffer = %u)", buffer);
+    ANGLE_BINARY_EVENT(IsBuffer, buffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsBuffer(context, buffer))
-        {
-            return context->isBuffer(buffer);
-        }
+        return context->getDispatchTable()->IsBuffer(context, buffer);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsBuffer, GLboolean>();
@@ -1455,16 +1233,13 @@ GLboolean GL_APIENTRY IsBuffer(GLuint buffer)
 
 GLboolean GL_APIENTRY IsEnabled(GLenum cap)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum cap = 0x%X)", cap);
+    ANGLE_BINARY_EVENT(IsEnabled, cap);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsEnabled(context, cap))
-        {
-            return context->isEnabled(cap);
-        }
+        return context->getDispatchTable()->IsEnabled(context, cap);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsEnabled, GLboolean>();
@@ -1474,14 +1249,12 @@ GLboolean GL_APIENTRY IsFramebuffer(GLuint framebuffer)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint framebuffer = %u)", framebuffer);
+    ANGLE_BINARY_EVENT(IsFramebuffer, framebuffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsFramebuffer(context, framebuffer))
-        {
-            return context->isFramebuffer(framebuffer);
-        }
+        return context->getDispatchTable()->IsFramebuffer(context, framebuffer);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsFramebuffer, GLboolean>();
@@ -1491,14 +1264,12 @@ GLboolean GL_APIENTRY IsProgram(GLuint program)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_EVENT(IsProgram, program);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsProgram(context, program))
-        {
-            return context->isProgram(program);
-        }
+        return context->getDispatchTable()->IsProgram(context, program);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsProgram, GLboolean>();
@@ -1508,14 +1279,12 @@ GLboolean GL_APIENTRY IsRenderbuffer(GLuint renderbuffer)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint renderbuffer = %u)", renderbuffer);
+    ANGLE_BINARY_EVENT(IsRenderbuffer, renderbuffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsRenderbuffer(context, renderbuffer))
-        {
-            return context->isRenderbuffer(renderbuffer);
-        }
+        return context->getDispatchTable()->IsRenderbuffer(context, renderbuffer);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsRenderbuffer, GLboolean>();
@@ -1525,14 +1294,12 @@ GLboolean GL_APIENTRY IsShader(GLuint shader)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u)", shader);
+    ANGLE_BINARY_EVENT(IsShader, shader);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsShader(context, shader))
-        {
-            return context->isShader(shader);
-        }
+        return context->getDispatchTable()->IsShader(context, shader);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsShader, GLboolean>();
@@ -1542,14 +1309,12 @@ GLboolean GL_APIENTRY IsTexture(GLuint texture)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint texture = %u)", texture);
+    ANGLE_BINARY_EVENT(IsTexture, texture);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsTexture(context, texture))
-        {
-            return context->isTexture(texture);
-        }
+        return context->getDispatchTable()->IsTexture(context, texture);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsTexture, GLboolean>();
@@ -1557,16 +1322,13 @@ GLboolean GL_APIENTRY IsTexture(GLuint texture)
 
 void GL_APIENTRY LineWidth(GLfloat width)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat width = %f)", width);
+    ANGLE_BINARY_EVENT(LineWidth, width);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateLineWidth(context, width))
-        {
-            context->lineWidth(width);
-        }
+        context->getDispatchTable()->LineWidth(context, width);
     }
 }
 
@@ -1574,44 +1336,36 @@ void GL_APIENTRY LinkProgram(GLuint program)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_EVENT(LinkProgram, program);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateLinkProgram(context, program))
-        {
-            context->linkProgram(program);
-        }
+        context->getDispatchTable()->LinkProgram(context, program);
     }
 }
 
 void GL_APIENTRY PixelStorei(GLenum pname, GLint param)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLint param = %d)", pname, param);
+    ANGLE_BINARY_EVENT(PixelStorei, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidatePixelStorei(context, pname, param))
-        {
-            context->pixelStorei(pname, param);
-        }
+        context->getDispatchTable()->PixelStorei(context, pname, param);
     }
 }
 
 void GL_APIENTRY PolygonOffset(GLfloat factor, GLfloat units)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat factor = %f, GLfloat units = %f)", factor, units);
+    ANGLE_BINARY_EVENT(PolygonOffset, factor, units);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidatePolygonOffset(context, factor, units))
-        {
-            context->polygonOffset(factor, units);
-        }
+        context->getDispatchTable()->PolygonOffset(context, factor, units);
     }
 }
 
@@ -1628,15 +1382,12 @@ void GL_APIENTRY ReadPixels(GLint x,
         "(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
         "0x%X, GLenum type = 0x%X, void *pixels = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(ReadPixels, x, y, width, height, format, type, pixels);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateReadPixels(context, x, y, width, height, format, type, pixels))
-        {
-            context->readPixels(x, y, width, height, format, type, pixels);
-        }
+        context->getDispatchTable()->ReadPixels(context, x, y, width, height, format, type, pixels);
     }
 }
 
@@ -1644,14 +1395,12 @@ void GL_APIENTRY ReleaseShaderCompiler()
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(ReleaseShaderCompiler);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateReleaseShaderCompiler(context))
-        {
-            context->releaseShaderCompiler();
-        }
+        context->getDispatchTable()->ReleaseShaderCompiler(context);
     }
 }
 
@@ -1665,46 +1414,38 @@ void GL_APIENTRY RenderbufferStorage(GLenum target,
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLsizei width = %d, GLsizei height = "
         "%d)",
         target, internalformat, width, height);
+    ANGLE_BINARY_EVENT(RenderbufferStorage, target, internalformat, width, height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateRenderbufferStorage(context, target, internalformat, width, height))
-        {
-            context->renderbufferStorage(target, internalformat, width, height);
-        }
+        context->getDispatchTable()->RenderbufferStorage(context, target, internalformat, width,
+                                                         height);
     }
 }
 
 void GL_APIENTRY SampleCoverage(GLfloat value, GLboolean invert)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat value = %f, GLboolean invert = %u)", value, invert);
+    ANGLE_BINARY_EVENT(SampleCoverage, value, invert);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateSampleCoverage(context, value, invert))
-        {
-            context->sampleCoverage(value, invert);
-        }
+        context->getDispatchTable()->SampleCoverage(context, value, invert);
     }
 }
 
 void GL_APIENTRY Scissor(GLint x, GLint y, GLsizei width, GLsizei height)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)", x, y, width,
           height);
+    ANGLE_BINARY_EVENT(Scissor, x, y, width, height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateScissor(context, x, y, width, height))
-        {
-            context->scissor(x, y, width, height);
-        }
+        context->getDispatchTable()->Scissor(context, x, y, width, height);
     }
 }
 
@@ -1719,15 +1460,13 @@ void GL_APIENTRY ShaderBinary(GLsizei count,
           ", GLenum binaryformat = 0x%X, const void *binary = 0x%016" PRIxPTR
           ", GLsizei length = %d)",
           count, (uintptr_t)shaders, binaryformat, (uintptr_t)binary, length);
+    ANGLE_BINARY_EVENT(ShaderBinary, count, shaders, binaryformat, binary, length);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateShaderBinary(context, count, shaders, binaryformat, binary, length))
-        {
-            context->shaderBinary(count, shaders, binaryformat, binary, length);
-        }
+        context->getDispatchTable()->ShaderBinary(context, count, shaders, binaryformat, binary,
+                                                  length);
     }
 }
 
@@ -1740,109 +1479,86 @@ void GL_APIENTRY ShaderSource(GLuint shader,
     EVENT("(GLuint shader = %u, GLsizei count = %d, const GLchar *const*string = 0x%016" PRIxPTR
           ", const GLint *length = 0x%016" PRIxPTR ")",
           shader, count, (uintptr_t)string, (uintptr_t)length);
+    ANGLE_BINARY_EVENT(ShaderSource, shader, count, string, length);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateShaderSource(context, shader, count, string, length))
-        {
-            context->shaderSource(shader, count, string, length);
-        }
+        context->getDispatchTable()->ShaderSource(context, shader, count, string, length);
     }
 }
 
 void GL_APIENTRY StencilFunc(GLenum func, GLint ref, GLuint mask)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)", func, ref, mask);
+    ANGLE_BINARY_EVENT(StencilFunc, func, ref, mask);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateStencilFunc(context, func, ref, mask))
-        {
-            context->stencilFunc(func, ref, mask);
-        }
+        context->getDispatchTable()->StencilFunc(context, func, ref, mask);
     }
 }
 
 void GL_APIENTRY StencilFuncSeparate(GLenum face, GLenum func, GLint ref, GLuint mask)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)", face, func,
           ref, mask);
+    ANGLE_BINARY_EVENT(StencilFuncSeparate, face, func, ref, mask);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateStencilFuncSeparate(context, face, func, ref, mask))
-        {
-            context->stencilFuncSeparate(face, func, ref, mask);
-        }
+        context->getDispatchTable()->StencilFuncSeparate(context, face, func, ref, mask);
     }
 }
 
 void GL_APIENTRY StencilMask(GLuint mask)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint mask = %u)", mask);
+    ANGLE_BINARY_EVENT(StencilMask, mask);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateStencilMask(context, mask))
-        {
-            context->stencilMask(mask);
-        }
+        context->getDispatchTable()->StencilMask(context, mask);
     }
 }
 
 void GL_APIENTRY StencilMaskSeparate(GLenum face, GLuint mask)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLuint mask = %u)", face, mask);
+    ANGLE_BINARY_EVENT(StencilMaskSeparate, face, mask);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateStencilMaskSeparate(context, face, mask))
-        {
-            context->stencilMaskSeparate(face, mask);
-        }
+        context->getDispatchTable()->StencilMaskSeparate(context, face, mask);
     }
 }
 
 void GL_APIENTRY StencilOp(GLenum fail, GLenum zfail, GLenum zpass)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum fail = 0x%X, GLenum zfail = 0x%X, GLenum zpass = 0x%X)", fail, zfail, zpass);
+    ANGLE_BINARY_EVENT(StencilOp, fail, zfail, zpass);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateStencilOp(context, fail, zfail, zpass))
-        {
-            context->stencilOp(fail, zfail, zpass);
-        }
+        context->getDispatchTable()->StencilOp(context, fail, zfail, zpass);
     }
 }
 
 void GL_APIENTRY StencilOpSeparate(GLenum face, GLenum sfail, GLenum dpfail, GLenum dppass)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum sfail = 0x%X, GLenum dpfail = 0x%X, GLenum dppass = 0x%X)",
           face, sfail, dpfail, dppass);
+    ANGLE_BINARY_EVENT(StencilOpSeparate, face, sfail, dpfail, dppass);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateStencilOpSeparate(context, face, sfail, dpfail, dppass))
-        {
-            context->stencilOpSeparate(face, sfail, dpfail, dppass);
-        }
+        context->getDispatchTable()->StencilOpSeparate(context, face, sfail, dpfail, dppass);
     }
 }
 
@@ -1862,18 +1578,14 @@ void GL_APIENTRY TexImage2D(GLenum target,
         "GLsizei height = %d, GLint border = %d, GLenum format = 0x%X, GLenum type = 0x%X, const "
         "void *pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, format, type, (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexImage2D, target, level, internalformat, width, height, border, format,
+                       type, pixels);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexImage2D(context, targetPacked, level, internalformat, width, height, border,
-                               format, type, pixels))
-        {
-            context->texImage2D(targetPacked, level, internalformat, width, height, border, format,
-                                type, pixels);
-        }
+        context->getDispatchTable()->TexImage2D(context, target, level, internalformat, width,
+                                                height, border, format, type, pixels);
     }
 }
 
@@ -1881,15 +1593,12 @@ void GL_APIENTRY TexParameterf(GLenum target, GLenum pname, GLfloat param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", target, pname, param);
+    ANGLE_BINARY_EVENT(TexParameterf, target, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateTexParameterf(context, targetPacked, pname, param))
-        {
-            context->texParameterf(targetPacked, pname, param);
-        }
+        context->getDispatchTable()->TexParameterf(context, target, pname, param);
     }
 }
 
@@ -1898,16 +1607,12 @@ void GL_APIENTRY TexParameterfv(GLenum target, GLenum pname, const GLfloat *para
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterfv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterfv(context, targetPacked, pname, params))
-        {
-            context->texParameterfv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->TexParameterfv(context, target, pname, params);
     }
 }
 
@@ -1915,15 +1620,12 @@ void GL_APIENTRY TexParameteri(GLenum target, GLenum pname, GLint param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)", target, pname, param);
+    ANGLE_BINARY_EVENT(TexParameteri, target, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateTexParameteri(context, targetPacked, pname, param))
-        {
-            context->texParameteri(targetPacked, pname, param);
-        }
+        context->getDispatchTable()->TexParameteri(context, target, pname, param);
     }
 }
 
@@ -1932,16 +1634,12 @@ void GL_APIENTRY TexParameteriv(GLenum target, GLenum pname, const GLint *params
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameteriv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameteriv(context, targetPacked, pname, params))
-        {
-            context->texParameteriv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->TexParameteriv(context, target, pname, params);
     }
 }
 
@@ -1961,271 +1659,235 @@ void GL_APIENTRY TexSubImage2D(GLenum target,
         "width = %d, GLsizei height = %d, GLenum format = 0x%X, GLenum type = 0x%X, const void "
         "*pixels = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, type, (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexSubImage2D, target, level, xoffset, yoffset, width, height, format, type,
+                       pixels);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexSubImage2D(context, targetPacked, level, xoffset, yoffset, width, height,
-                                  format, type, pixels))
-        {
-            context->texSubImage2D(targetPacked, level, xoffset, yoffset, width, height, format,
-                                   type, pixels);
-        }
+        context->getDispatchTable()->TexSubImage2D(context, target, level, xoffset, yoffset, width,
+                                                   height, format, type, pixels);
     }
 }
 
 void GL_APIENTRY Uniform1f(GLint location, GLfloat v0)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLfloat v0 = %f)", location, v0);
+    ANGLE_BINARY_EVENT(Uniform1f, location, v0);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform1f(context, location, v0))
-        {
-            context->uniform1f(location, v0);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform1f(context, location, v0);
     }
 }
 
 void GL_APIENTRY Uniform1fv(GLint location, GLsizei count, const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform1fv, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform1fv(context, location, count, value))
-        {
-            context->uniform1fv(location, count, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform1fv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform1i(GLint location, GLint v0)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d)", location, v0);
+    ANGLE_BINARY_EVENT(Uniform1i, location, v0);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform1i(context, location, v0))
-        {
-            context->uniform1i(location, v0);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform1i(context, location, v0);
     }
 }
 
 void GL_APIENTRY Uniform1iv(GLint location, GLsizei count, const GLint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform1iv, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform1iv(context, location, count, value))
-        {
-            context->uniform1iv(location, count, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform1iv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform2f(GLint location, GLfloat v0, GLfloat v1)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f)", location, v0, v1);
+    ANGLE_BINARY_EVENT(Uniform2f, location, v0, v1);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform2f(context, location, v0, v1))
-        {
-            context->uniform2f(location, v0, v1);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform2f(context, location, v0, v1);
     }
 }
 
 void GL_APIENTRY Uniform2fv(GLint location, GLsizei count, const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform2fv, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform2fv(context, location, count, value))
-        {
-            context->uniform2fv(location, count, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform2fv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform2i(GLint location, GLint v0, GLint v1)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d, GLint v1 = %d)", location, v0, v1);
+    ANGLE_BINARY_EVENT(Uniform2i, location, v0, v1);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform2i(context, location, v0, v1))
-        {
-            context->uniform2i(location, v0, v1);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform2i(context, location, v0, v1);
     }
 }
 
 void GL_APIENTRY Uniform2iv(GLint location, GLsizei count, const GLint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform2iv, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform2iv(context, location, count, value))
-        {
-            context->uniform2iv(location, count, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform2iv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform3f(GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = %f)", location, v0,
           v1, v2);
+    ANGLE_BINARY_EVENT(Uniform3f, location, v0, v1, v2);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform3f(context, location, v0, v1, v2))
-        {
-            context->uniform3f(location, v0, v1, v2);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform3f(context, location, v0, v1, v2);
     }
 }
 
 void GL_APIENTRY Uniform3fv(GLint location, GLsizei count, const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform3fv, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform3fv(context, location, count, value))
-        {
-            context->uniform3fv(location, count, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform3fv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform3i(GLint location, GLint v0, GLint v1, GLint v2)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d)", location, v0, v1,
           v2);
+    ANGLE_BINARY_EVENT(Uniform3i, location, v0, v1, v2);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform3i(context, location, v0, v1, v2))
-        {
-            context->uniform3i(location, v0, v1, v2);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform3i(context, location, v0, v1, v2);
     }
 }
 
 void GL_APIENTRY Uniform3iv(GLint location, GLsizei count, const GLint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform3iv, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform3iv(context, location, count, value))
-        {
-            context->uniform3iv(location, count, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform3iv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform4f(GLint location, GLfloat v0, GLfloat v1, GLfloat v2, GLfloat v3)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = %f, GLfloat v3 = %f)",
         location, v0, v1, v2, v3);
+    ANGLE_BINARY_EVENT(Uniform4f, location, v0, v1, v2, v3);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform4f(context, location, v0, v1, v2, v3))
-        {
-            context->uniform4f(location, v0, v1, v2, v3);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform4f(context, location, v0, v1, v2, v3);
     }
 }
 
 void GL_APIENTRY Uniform4fv(GLint location, GLsizei count, const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform4fv, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform4fv(context, location, count, value))
-        {
-            context->uniform4fv(location, count, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform4fv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform4i(GLint location, GLint v0, GLint v1, GLint v2, GLint v3)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d, GLint v3 = %d)",
           location, v0, v1, v2, v3);
+    ANGLE_BINARY_EVENT(Uniform4i, location, v0, v1, v2, v3);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform4i(context, location, v0, v1, v2, v3))
-        {
-            context->uniform4i(location, v0, v1, v2, v3);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform4i(context, location, v0, v1, v2, v3);
     }
 }
 
 void GL_APIENTRY Uniform4iv(GLint location, GLsizei count, const GLint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform4iv, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform4iv(context, location, count, value))
-        {
-            context->uniform4iv(location, count, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform4iv(context, location, count, value);
     }
 }
 
@@ -2234,20 +1896,17 @@ void GL_APIENTRY UniformMatrix2fv(GLint location,
                                   GLboolean transpose,
                                   const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix2fv, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateUniformMatrix2fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix2fv(location, count, transpose, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix2fv(context, location, count, transpose, value);
     }
 }
 
@@ -2256,20 +1915,17 @@ void GL_APIENTRY UniformMatrix3fv(GLint location,
                                   GLboolean transpose,
                                   const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix3fv, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateUniformMatrix3fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix3fv(location, count, transpose, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix3fv(context, location, count, transpose, value);
     }
 }
 
@@ -2278,20 +1934,17 @@ void GL_APIENTRY UniformMatrix4fv(GLint location,
                                   GLboolean transpose,
                                   const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix4fv, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateUniformMatrix4fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix4fv(location, count, transpose, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix4fv(context, location, count, transpose, value);
     }
 }
 
@@ -2299,14 +1952,12 @@ void GL_APIENTRY UseProgram(GLuint program)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_EVENT(UseProgram, program);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUseProgram(context, program))
-        {
-            context->useProgram(program);
-        }
+        context->getDispatchTable()->UseProgram(context, program);
     }
 }
 
@@ -2314,135 +1965,109 @@ void GL_APIENTRY ValidateProgram(GLuint program)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_EVENT(ValidateProgram, program);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateValidateProgram(context, program))
-        {
-            context->validateProgram(program);
-        }
+        context->getDispatchTable()->ValidateProgram(context, program);
     }
 }
 
 void GL_APIENTRY VertexAttrib1f(GLuint index, GLfloat x)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f)", index, x);
+    ANGLE_BINARY_EVENT(VertexAttrib1f, index, x);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttrib1f(context, index, x))
-        {
-            context->vertexAttrib1f(index, x);
-        }
+        context->getDispatchTable()->VertexAttrib1f(context, index, x);
     }
 }
 
 void GL_APIENTRY VertexAttrib1fv(GLuint index, const GLfloat *v)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_EVENT(VertexAttrib1fv, index, v);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttrib1fv(context, index, v))
-        {
-            context->vertexAttrib1fv(index, v);
-        }
+        context->getDispatchTable()->VertexAttrib1fv(context, index, v);
     }
 }
 
 void GL_APIENTRY VertexAttrib2f(GLuint index, GLfloat x, GLfloat y)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f, GLfloat y = %f)", index, x, y);
+    ANGLE_BINARY_EVENT(VertexAttrib2f, index, x, y);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttrib2f(context, index, x, y))
-        {
-            context->vertexAttrib2f(index, x, y);
-        }
+        context->getDispatchTable()->VertexAttrib2f(context, index, x, y);
     }
 }
 
 void GL_APIENTRY VertexAttrib2fv(GLuint index, const GLfloat *v)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_EVENT(VertexAttrib2fv, index, v);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttrib2fv(context, index, v))
-        {
-            context->vertexAttrib2fv(index, v);
-        }
+        context->getDispatchTable()->VertexAttrib2fv(context, index, v);
     }
 }
 
 void GL_APIENTRY VertexAttrib3f(GLuint index, GLfloat x, GLfloat y, GLfloat z)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", index, x, y, z);
+    ANGLE_BINARY_EVENT(VertexAttrib3f, index, x, y, z);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttrib3f(context, index, x, y, z))
-        {
-            context->vertexAttrib3f(index, x, y, z);
-        }
+        context->getDispatchTable()->VertexAttrib3f(context, index, x, y, z);
     }
 }
 
 void GL_APIENTRY VertexAttrib3fv(GLuint index, const GLfloat *v)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_EVENT(VertexAttrib3fv, index, v);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttrib3fv(context, index, v))
-        {
-            context->vertexAttrib3fv(index, v);
-        }
+        context->getDispatchTable()->VertexAttrib3fv(context, index, v);
     }
 }
 
 void GL_APIENTRY VertexAttrib4f(GLuint index, GLfloat x, GLfloat y, GLfloat z, GLfloat w)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f, GLfloat w = %f)",
           index, x, y, z, w);
+    ANGLE_BINARY_EVENT(VertexAttrib4f, index, x, y, z, w);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttrib4f(context, index, x, y, z, w))
-        {
-            context->vertexAttrib4f(index, x, y, z, w);
-        }
+        context->getDispatchTable()->VertexAttrib4f(context, index, x, y, z, w);
     }
 }
 
 void GL_APIENTRY VertexAttrib4fv(GLuint index, const GLfloat *v)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_EVENT(VertexAttrib4fv, index, v);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttrib4fv(context, index, v))
-        {
-            context->vertexAttrib4fv(index, v);
-        }
+        context->getDispatchTable()->VertexAttrib4fv(context, index, v);
     }
 }
 
@@ -2458,33 +2083,26 @@ void GL_APIENTRY VertexAttribPointer(GLuint index,
         "(GLuint index = %u, GLint size = %d, GLenum type = 0x%X, GLboolean normalized = %u, "
         "GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
         index, size, type, normalized, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(VertexAttribPointer, index, size, type, normalized, stride, pointer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateVertexAttribPointer(context, index, size, typePacked, normalized, stride,
-                                        pointer))
-        {
-            context->vertexAttribPointer(index, size, typePacked, normalized, stride, pointer);
-        }
+        context->getDispatchTable()->VertexAttribPointer(context, index, size, type, normalized,
+                                                         stride, pointer);
     }
 }
 
 void GL_APIENTRY Viewport(GLint x, GLint y, GLsizei width, GLsizei height)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)", x, y, width,
           height);
+    ANGLE_BINARY_EVENT(Viewport, x, y, width, height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateViewport(context, x, y, width, height))
-        {
-            context->viewport(x, y, width, height);
-        }
+        context->getDispatchTable()->Viewport(context, x, y, width, height);
     }
 }
 }  // namespace gl
@@ -11,8 +11,8 @@
 #include "libGLESv2/entry_points_gles_3_0_autogen.h"
 
 #include "libANGLE/Context.h"
-#include "libANGLE/Context.inl.h"
-#include "libANGLE/validationES3.h"
+#include "libGLESv2/entry_points_binary_event.h"
+#include "libGLESv2/entry_points_dispatch_autogen.h"
 #include "libGLESv2/entry_points_utils.h"
 #include "libGLESv2/global_state.h"
 
@@ -22,15 +22,12 @@ void GL_APIENTRY BeginQuery(GLenum target, GLuint id)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint id = %u)", target, id);
+    ANGLE_BINARY_EVENT(BeginQuery, target, id);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() || ValidateBeginQuery(context, targetPacked, id))
-        {
-            context->beginQuery(targetPacked, id);
-        }
+        context->getDispatchTable()->BeginQuery(context, target, id);
     }
 }
 
@@ -38,16 +35,12 @@ void GL_APIENTRY BeginTransformFeedback(GLenum primitiveMode)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum primitiveMode = 0x%X)", primitiveMode);
+    ANGLE_BINARY_EVENT(BeginTransformFeedback, primitiveMode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode primitiveModePacked = FromGLenum<PrimitiveMode>(primitiveMode);
-        if (context->skipValidation() ||
-            ValidateBeginTransformFeedback(context, primitiveModePacked))
-        {
-            context->beginTransformFeedback(primitiveModePacked);
-        }
+        context->getDispatchTable()->BeginTransformFeedback(context, primitiveMode);
     }
 }
 
@@ -55,16 +48,12 @@ void GL_APIENTRY BindBufferBase(GLenum target, GLuint index, GLuint buffer)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLuint buffer = %u)", target, index, buffer);
+    ANGLE_BINARY_EVENT(BindBufferBase, target, index, buffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateBindBufferBase(context, targetPacked, index, buffer))
-        {
-            context->bindBufferBase(targetPacked, index, buffer);
-        }
+        context->getDispatchTable()->BindBufferBase(context, target, index, buffer);
     }
 }
 
@@ -77,16 +66,12 @@ BindBufferRange(GLenum target, GLuint index, GLuint buffer, GLintptr offset, GLs
         "GLsizeiptr size = %llu)",
         target, index, buffer, static_cast<unsigned long long>(offset),
         static_cast<unsigned long long>(size));
+    ANGLE_BINARY_EVENT(BindBufferRange, target, index, buffer, offset, size);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateBindBufferRange(context, targetPacked, index, buffer, offset, size))
-        {
-            context->bindBufferRange(targetPacked, index, buffer, offset, size);
-        }
+        context->getDispatchTable()->BindBufferRange(context, target, index, buffer, offset, size);
     }
 }
 
@@ -94,14 +79,12 @@ void GL_APIENTRY BindSampler(GLuint unit, GLuint sampler)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint unit = %u, GLuint sampler = %u)", unit, sampler);
+    ANGLE_BINARY_EVENT(BindSampler, unit, sampler);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBindSampler(context, unit, sampler))
-        {
-            context->bindSampler(unit, sampler);
-        }
+        context->getDispatchTable()->BindSampler(context, unit, sampler);
     }
 }
 
@@ -109,14 +92,12 @@ void GL_APIENTRY BindTransformFeedback(GLenum target, GLuint id)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint id = %u)", target, id);
+    ANGLE_BINARY_EVENT(BindTransformFeedback, target, id);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBindTransformFeedback(context, target, id))
-        {
-            context->bindTransformFeedback(target, id);
-        }
+        context->getDispatchTable()->BindTransformFeedback(context, target, id);
     }
 }
 
@@ -124,14 +105,12 @@ void GL_APIENTRY BindVertexArray(GLuint array)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_EVENT(BindVertexArray, array);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBindVertexArray(context, array))
-        {
-            context->bindVertexArray(array);
-        }
+        context->getDispatchTable()->BindVertexArray(context, array);
     }
 }
 
@@ -152,17 +131,14 @@ void GL_APIENTRY BlitFramebuffer(GLint srcX0,
         "%d, GLint dstY0 = %d, GLint dstX1 = %d, GLint dstY1 = %d, GLbitfield mask = 0x%X, GLenum "
         "filter = 0x%X)",
         srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask, filter);
+    ANGLE_BINARY_EVENT(BlitFramebuffer, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1,
+                       mask, filter);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateBlitFramebuffer(context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1,
-                                    mask, filter))
-        {
-            context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask,
-                                     filter);
-        }
+        context->getDispatchTable()->BlitFramebuffer(context, srcX0, srcY0, srcX1, srcY1, dstX0,
+                                                     dstY0, dstX1, dstY1, mask, filter);
     }
 }
 
@@ -171,15 +147,12 @@ void GL_APIENTRY ClearBufferfi(GLenum buffer, GLint drawbuffer, GLfloat depth, G
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, GLfloat depth = %f, GLint stencil = %d)",
           buffer, drawbuffer, depth, stencil);
+    ANGLE_BINARY_EVENT(ClearBufferfi, buffer, drawbuffer, depth, stencil);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateClearBufferfi(context, buffer, drawbuffer, depth, stencil))
-        {
-            context->clearBufferfi(buffer, drawbuffer, depth, stencil);
-        }
+        context->getDispatchTable()->ClearBufferfi(context, buffer, drawbuffer, depth, stencil);
     }
 }
 
@@ -188,14 +161,12 @@ void GL_APIENTRY ClearBufferfv(GLenum buffer, GLint drawbuffer, const GLfloat *v
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           buffer, drawbuffer, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ClearBufferfv, buffer, drawbuffer, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClearBufferfv(context, buffer, drawbuffer, value))
-        {
-            context->clearBufferfv(buffer, drawbuffer, value);
-        }
+        context->getDispatchTable()->ClearBufferfv(context, buffer, drawbuffer, value);
     }
 }
 
@@ -204,14 +175,12 @@ void GL_APIENTRY ClearBufferiv(GLenum buffer, GLint drawbuffer, const GLint *val
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, const GLint *value = 0x%016" PRIxPTR ")",
           buffer, drawbuffer, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ClearBufferiv, buffer, drawbuffer, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClearBufferiv(context, buffer, drawbuffer, value))
-        {
-            context->clearBufferiv(buffer, drawbuffer, value);
-        }
+        context->getDispatchTable()->ClearBufferiv(context, buffer, drawbuffer, value);
     }
 }
 
@@ -220,14 +189,12 @@ void GL_APIENTRY ClearBufferuiv(GLenum buffer, GLint drawbuffer, const GLuint *v
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           buffer, drawbuffer, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ClearBufferuiv, buffer, drawbuffer, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClearBufferuiv(context, buffer, drawbuffer, value))
-        {
-            context->clearBufferuiv(buffer, drawbuffer, value);
-        }
+        context->getDispatchTable()->ClearBufferuiv(context, buffer, drawbuffer, value);
     }
 }
 
@@ -236,14 +203,12 @@ GLenum GL_APIENTRY ClientWaitSync(GLsync sync, GLbitfield flags, GLuint64 timeou
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ", GLbitfield flags = 0x%X, GLuint64 timeout = %llu)",
           (uintptr_t)sync, flags, static_cast<unsigned long long>(timeout));
+    ANGLE_BINARY_EVENT(ClientWaitSync, sync, flags, timeout);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateClientWaitSync(context, sync, flags, timeout))
-        {
-            return context->clientWaitSync(sync, flags, timeout);
-        }
+        return context->getDispatchTable()->ClientWaitSync(context, sync, flags, timeout);
     }
 
     return GetDefaultReturnValue<EntryPoint::ClientWaitSync, GLenum>();
@@ -265,18 +230,14 @@ void GL_APIENTRY CompressedTexImage3D(GLenum target,
         "%d, GLsizei height = %d, GLsizei depth = %d, GLint border = %d, GLsizei imageSize = %d, "
         "const void *data = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, imageSize, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexImage3D, target, level, internalformat, width, height, depth,
+                       border, imageSize, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCompressedTexImage3D(context, targetPacked, level, internalformat, width,
-                                         height, depth, border, imageSize, data))
-        {
-            context->compressedTexImage3D(targetPacked, level, internalformat, width, height, depth,
-                                          border, imageSize, data);
-        }
+        context->getDispatchTable()->CompressedTexImage3D(
+            context, target, level, internalformat, width, height, depth, border, imageSize, data);
     }
 }
 
@@ -299,18 +260,15 @@ void GL_APIENTRY CompressedTexSubImage3D(GLenum target,
         "= 0x%X, GLsizei imageSize = %d, const void *data = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, imageSize,
         (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexSubImage3D, target, level, xoffset, yoffset, zoffset, width,
+                       height, depth, format, imageSize, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCompressedTexSubImage3D(context, targetPacked, level, xoffset, yoffset, zoffset,
-                                            width, height, depth, format, imageSize, data))
-        {
-            context->compressedTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width,
-                                             height, depth, format, imageSize, data);
-        }
+        context->getDispatchTable()->CompressedTexSubImage3D(context, target, level, xoffset,
+                                                             yoffset, zoffset, width, height, depth,
+                                                             format, imageSize, data);
     }
 }
 
@@ -326,19 +284,13 @@ void GL_APIENTRY CopyBufferSubData(GLenum readTarget,
         "GLintptr writeOffset = %llu, GLsizeiptr size = %llu)",
         readTarget, writeTarget, static_cast<unsigned long long>(readOffset),
         static_cast<unsigned long long>(writeOffset), static_cast<unsigned long long>(size));
+    ANGLE_BINARY_EVENT(CopyBufferSubData, readTarget, writeTarget, readOffset, writeOffset, size);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding readTargetPacked  = FromGLenum<BufferBinding>(readTarget);
-        BufferBinding writeTargetPacked = FromGLenum<BufferBinding>(writeTarget);
-        if (context->skipValidation() ||
-            ValidateCopyBufferSubData(context, readTargetPacked, writeTargetPacked, readOffset,
-                                      writeOffset, size))
-        {
-            context->copyBufferSubData(readTargetPacked, writeTargetPacked, readOffset, writeOffset,
-                                       size);
-        }
+        context->getDispatchTable()->CopyBufferSubData(context, readTarget, writeTarget, readOffset,
+                                                       writeOffset, size);
     }
 }
 
@@ -357,18 +309,14 @@ void GL_APIENTRY CopyTexSubImage3D(GLenum target,
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint "
         "zoffset = %d, GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
         target, level, xoffset, yoffset, zoffset, x, y, width, height);
+    ANGLE_BINARY_EVENT(CopyTexSubImage3D, target, level, xoffset, yoffset, zoffset, x, y, width,
+                       height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCopyTexSubImage3D(context, targetPacked, level, xoffset, yoffset, zoffset, x, y,
-                                      width, height))
-        {
-            context->copyTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, x, y, width,
-                                       height);
-        }
+        context->getDispatchTable()->CopyTexSubImage3D(context, target, level, xoffset, yoffset,
+                                                       zoffset, x, y, width, height);
     }
 }
 
@@ -376,14 +324,12 @@ void GL_APIENTRY DeleteQueries(GLsizei n, const GLuint *ids)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_EVENT(DeleteQueries, n, ids);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteQueries(context, n, ids))
-        {
-            context->deleteQueries(n, ids);
-        }
+        context->getDispatchTable()->DeleteQueries(context, n, ids);
     }
 }
 
@@ -392,14 +338,12 @@ void GL_APIENTRY DeleteSamplers(GLsizei count, const GLuint *samplers)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei count = %d, const GLuint *samplers = 0x%016" PRIxPTR ")", count,
           (uintptr_t)samplers);
+    ANGLE_BINARY_EVENT(DeleteSamplers, count, samplers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteSamplers(context, count, samplers))
-        {
-            context->deleteSamplers(count, samplers);
-        }
+        context->getDispatchTable()->DeleteSamplers(context, count, samplers);
     }
 }
 
@@ -407,14 +351,12 @@ void GL_APIENTRY DeleteSync(GLsync sync)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ")", (uintptr_t)sync);
+    ANGLE_BINARY_EVENT(DeleteSync, sync);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteSync(context, sync))
-        {
-            context->deleteSync(sync);
-        }
+        context->getDispatchTable()->DeleteSync(context, sync);
     }
 }
 
@@ -422,14 +364,12 @@ void GL_APIENTRY DeleteTransformFeedbacks(GLsizei n, const GLuint *ids)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_EVENT(DeleteTransformFeedbacks, n, ids);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteTransformFeedbacks(context, n, ids))
-        {
-            context->deleteTransformFeedbacks(n, ids);
-        }
+        context->getDispatchTable()->DeleteTransformFeedbacks(context, n, ids);
     }
 }
 
@@ -437,14 +377,12 @@ void GL_APIENTRY DeleteVertexArrays(GLsizei n, const GLuint *arrays)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_EVENT(DeleteVertexArrays, n, arrays);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteVertexArrays(context, n, arrays))
-        {
-            context->deleteVertexArrays(n, arrays);
-        }
+        context->getDispatchTable()->DeleteVertexArrays(context, n, arrays);
     }
 }
 
@@ -453,16 +391,13 @@ void GL_APIENTRY DrawArraysInstanced(GLenum mode, GLint first, GLsizei count, GL
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d, GLsizei instancecount = %d)",
           mode, first, count, instancecount);
+    ANGLE_BINARY_EVENT(DrawArraysInstanced, mode, first, count, instancecount);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() ||
-            ValidateDrawArraysInstanced(context, modePacked, first, count, instancecount))
-        {
-            context->drawArraysInstanced(modePacked, first, count, instancecount);
-        }
+        context->getDispatchTable()->DrawArraysInstanced(context, mode, first, count,
+                                                         instancecount);
     }
 }
 
@@ -470,14 +405,12 @@ void GL_APIENTRY DrawBuffers(GLsizei n, const GLenum *bufs)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLenum *bufs = 0x%016" PRIxPTR ")", n, (uintptr_t)bufs);
+    ANGLE_BINARY_EVENT(DrawBuffers, n, bufs);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDrawBuffers(context, n, bufs))
-        {
-            context->drawBuffers(n, bufs);
-        }
+        context->getDispatchTable()->DrawBuffers(context, n, bufs);
     }
 }
 
@@ -492,18 +425,13 @@ void GL_APIENTRY DrawElementsInstanced(GLenum mode,
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ", GLsizei instancecount = %d)",
         mode, count, type, (uintptr_t)indices, instancecount);
+    ANGLE_BINARY_EVENT(DrawElementsInstanced, mode, count, type, indices, instancecount);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateDrawElementsInstanced(context, modePacked, count, typePacked, indices,
-                                          instancecount))
-        {
-            context->drawElementsInstanced(modePacked, count, typePacked, indices, instancecount);
-        }
+        context->getDispatchTable()->DrawElementsInstanced(context, mode, count, type, indices,
+                                                           instancecount);
     }
 }
 
@@ -519,17 +447,13 @@ void GL_APIENTRY DrawRangeElements(GLenum mode,
         "(GLenum mode = 0x%X, GLuint start = %u, GLuint end = %u, GLsizei count = %d, GLenum type "
         "= 0x%X, const void *indices = 0x%016" PRIxPTR ")",
         mode, start, end, count, type, (uintptr_t)indices);
+    ANGLE_BINARY_EVENT(DrawRangeElements, mode, start, end, count, type, indices);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateDrawRangeElements(context, modePacked, start, end, count, typePacked, indices))
-        {
-            context->drawRangeElements(modePacked, start, end, count, typePacked, indices);
-        }
+        context->getDispatchTable()->DrawRangeElements(context, mode, start, end, count, type,
+                                                       indices);
     }
 }
 
@@ -537,15 +461,12 @@ void GL_APIENTRY EndQuery(GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(EndQuery, target);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() || ValidateEndQuery(context, targetPacked))
-        {
-            context->endQuery(targetPacked);
-        }
+        context->getDispatchTable()->EndQuery(context, target);
     }
 }
 
@@ -553,14 +474,12 @@ void GL_APIENTRY EndTransformFeedback()
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(EndTransformFeedback);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateEndTransformFeedback(context))
-        {
-            context->endTransformFeedback();
-        }
+        context->getDispatchTable()->EndTransformFeedback(context);
     }
 }
 
@@ -568,14 +487,12 @@ GLsync GL_APIENTRY FenceSync(GLenum condition, GLbitfield flags)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum condition = 0x%X, GLbitfield flags = 0x%X)", condition, flags);
+    ANGLE_BINARY_EVENT(FenceSync, condition, flags);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateFenceSync(context, condition, flags))
-        {
-            return context->fenceSync(condition, flags);
-        }
+        return context->getDispatchTable()->FenceSync(context, condition, flags);
     }
 
     return GetDefaultReturnValue<EntryPoint::FenceSync, GLsync>();
@@ -586,16 +503,12 @@ void GL_APIENTRY FlushMappedBufferRange(GLenum target, GLintptr offset, GLsizeip
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr length = %llu)", target,
           static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length));
+    ANGLE_BINARY_EVENT(FlushMappedBufferRange, target, offset, length);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateFlushMappedBufferRange(context, targetPacked, offset, length))
-        {
-            context->flushMappedBufferRange(targetPacked, offset, length);
-        }
+        context->getDispatchTable()->FlushMappedBufferRange(context, target, offset, length);
     }
 }
 
@@ -607,15 +520,13 @@ FramebufferTextureLayer(GLenum target, GLenum attachment, GLuint texture, GLint
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint texture = %u, GLint level = %d, "
         "GLint layer = %d)",
         target, attachment, texture, level, layer);
+    ANGLE_BINARY_EVENT(FramebufferTextureLayer, target, attachment, texture, level, layer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateFramebufferTextureLayer(context, target, attachment, texture, level, layer))
-        {
-            context->framebufferTextureLayer(target, attachment, texture, level, layer);
-        }
+        context->getDispatchTable()->FramebufferTextureLayer(context, target, attachment, texture,
+                                                             level, layer);
     }
 }
 
@@ -623,14 +534,12 @@ void GL_APIENTRY GenQueries(GLsizei n, GLuint *ids)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_EVENT(GenQueries, n, ids);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenQueries(context, n, ids))
-        {
-            context->genQueries(n, ids);
-        }
+        context->getDispatchTable()->GenQueries(context, n, ids);
     }
 }
 
@@ -638,14 +547,12 @@ void GL_APIENTRY GenSamplers(GLsizei count, GLuint *samplers)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei count = %d, GLuint *samplers = 0x%016" PRIxPTR ")", count, (uintptr_t)samplers);
+    ANGLE_BINARY_EVENT(GenSamplers, count, samplers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenSamplers(context, count, samplers))
-        {
-            context->genSamplers(count, samplers);
-        }
+        context->getDispatchTable()->GenSamplers(context, count, samplers);
     }
 }
 
@@ -653,14 +560,12 @@ void GL_APIENTRY GenTransformFeedbacks(GLsizei n, GLuint *ids)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_EVENT(GenTransformFeedbacks, n, ids);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenTransformFeedbacks(context, n, ids))
-        {
-            context->genTransformFeedbacks(n, ids);
-        }
+        context->getDispatchTable()->GenTransformFeedbacks(context, n, ids);
     }
 }
 
@@ -668,14 +573,12 @@ void GL_APIENTRY GenVertexArrays(GLsizei n, GLuint *arrays)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_EVENT(GenVertexArrays, n, arrays);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenVertexArrays(context, n, arrays))
-        {
-            context->genVertexArrays(n, arrays);
-        }
+        context->getDispatchTable()->GenVertexArrays(context, n, arrays);
     }
 }
 
@@ -690,17 +593,14 @@ void GL_APIENTRY GetActiveUniformBlockName(GLuint program,
         "(GLuint program = %u, GLuint uniformBlockIndex = %u, GLsizei bufSize = %d, GLsizei "
         "*length = 0x%016" PRIxPTR ", GLchar *uniformBlockName = 0x%016" PRIxPTR ")",
         program, uniformBlockIndex, bufSize, (uintptr_t)length, (uintptr_t)uniformBlockName);
+    ANGLE_BINARY_EVENT(GetActiveUniformBlockName, program, uniformBlockIndex, bufSize, length,
+                       uniformBlockName);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetActiveUniformBlockName(context, program, uniformBlockIndex, bufSize, length,
-                                              uniformBlockName))
-        {
-            context->getActiveUniformBlockName(program, uniformBlockIndex, bufSize, length,
-                                               uniformBlockName);
-        }
+        context->getDispatchTable()->GetActiveUniformBlockName(context, program, uniformBlockIndex,
+                                                               bufSize, length, uniformBlockName);
     }
 }
 
@@ -714,15 +614,13 @@ void GL_APIENTRY GetActiveUniformBlockiv(GLuint program,
         "(GLuint program = %u, GLuint uniformBlockIndex = %u, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         program, uniformBlockIndex, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetActiveUniformBlockiv, program, uniformBlockIndex, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetActiveUniformBlockiv(context, program, uniformBlockIndex, pname, params))
-        {
-            context->getActiveUniformBlockiv(program, uniformBlockIndex, pname, params);
-        }
+        context->getDispatchTable()->GetActiveUniformBlockiv(context, program, uniformBlockIndex,
+                                                             pname, params);
     }
 }
 
@@ -737,15 +635,13 @@ void GL_APIENTRY GetActiveUniformsiv(GLuint program,
         "(GLuint program = %u, GLsizei uniformCount = %d, const GLuint *uniformIndices = "
         "0x%016" PRIxPTR ", GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
         program, uniformCount, (uintptr_t)uniformIndices, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetActiveUniformsiv, program, uniformCount, uniformIndices, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetActiveUniformsiv(context, program, uniformCount,
-                                                                     uniformIndices, pname, params))
-        {
-            context->getActiveUniformsiv(program, uniformCount, uniformIndices, pname, params);
-        }
+        context->getDispatchTable()->GetActiveUniformsiv(context, program, uniformCount,
+                                                         uniformIndices, pname, params);
     }
 }
 
@@ -754,16 +650,12 @@ void GL_APIENTRY GetBufferParameteri64v(GLenum target, GLenum pname, GLint64 *pa
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint64 *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferParameteri64v, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateGetBufferParameteri64v(context, targetPacked, pname, params))
-        {
-            context->getBufferParameteri64v(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->GetBufferParameteri64v(context, target, pname, params);
     }
 }
 
@@ -772,16 +664,12 @@ void GL_APIENTRY GetBufferPointerv(GLenum target, GLenum pname, void **params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferPointerv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateGetBufferPointerv(context, targetPacked, pname, params))
-        {
-            context->getBufferPointerv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->GetBufferPointerv(context, target, pname, params);
     }
 }
 
@@ -790,14 +678,12 @@ GLint GL_APIENTRY GetFragDataLocation(GLuint program, const GLchar *name)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetFragDataLocation, program, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetFragDataLocation(context, program, name))
-        {
-            return context->getFragDataLocation(program, name);
-        }
+        return context->getDispatchTable()->GetFragDataLocation(context, program, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetFragDataLocation, GLint>();
@@ -808,14 +694,12 @@ void GL_APIENTRY GetInteger64i_v(GLenum target, GLuint index, GLint64 *data)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLint64 *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetInteger64i_v, target, index, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetInteger64i_v(context, target, index, data))
-        {
-            context->getInteger64i_v(target, index, data);
-        }
+        context->getDispatchTable()->GetInteger64i_v(context, target, index, data);
     }
 }
 
@@ -823,14 +707,12 @@ void GL_APIENTRY GetInteger64v(GLenum pname, GLint64 *data)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLint64 *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetInteger64v, pname, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetInteger64v(context, pname, data))
-        {
-            context->getInteger64v(pname, data);
-        }
+        context->getDispatchTable()->GetInteger64v(context, pname, data);
     }
 }
 
@@ -839,14 +721,12 @@ void GL_APIENTRY GetIntegeri_v(GLenum target, GLuint index, GLint *data)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLint *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetIntegeri_v, target, index, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetIntegeri_v(context, target, index, data))
-        {
-            context->getIntegeri_v(target, index, data);
-        }
+        context->getDispatchTable()->GetIntegeri_v(context, target, index, data);
     }
 }
 
@@ -861,15 +741,13 @@ void GL_APIENTRY GetInternalformativ(GLenum target,
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLenum pname = 0x%X, GLsizei bufSize "
         "= %d, GLint *params = 0x%016" PRIxPTR ")",
         target, internalformat, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetInternalformativ, target, internalformat, pname, bufSize, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetInternalformativ(context, target, internalformat, pname, bufSize, params))
-        {
-            context->getInternalformativ(target, internalformat, pname, bufSize, params);
-        }
+        context->getDispatchTable()->GetInternalformativ(context, target, internalformat, pname,
+                                                         bufSize, params);
     }
 }
 
@@ -883,15 +761,13 @@ void GL_APIENTRY GetProgramBinary(GLuint program,
     EVENT("(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLenum *binaryFormat = 0x%016" PRIxPTR ", void *binary = 0x%016" PRIxPTR ")",
           program, bufSize, (uintptr_t)length, (uintptr_t)binaryFormat, (uintptr_t)binary);
+    ANGLE_BINARY_EVENT(GetProgramBinary, program, bufSize, length, binaryFormat, binary);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramBinary(context, program, bufSize, length, binaryFormat, binary))
-        {
-            context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
-        }
+        context->getDispatchTable()->GetProgramBinary(context, program, bufSize, length,
+                                                      binaryFormat, binary);
     }
 }
 
@@ -900,14 +776,12 @@ void GL_APIENTRY GetQueryObjectuiv(GLuint id, GLenum pname, GLuint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectuiv, id, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetQueryObjectuiv(context, id, pname, params))
-        {
-            context->getQueryObjectuiv(id, pname, params);
-        }
+        context->getDispatchTable()->GetQueryObjectuiv(context, id, pname, params);
     }
 }
 
@@ -916,15 +790,12 @@ void GL_APIENTRY GetQueryiv(GLenum target, GLenum pname, GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryiv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() || ValidateGetQueryiv(context, targetPacked, pname, params))
-        {
-            context->getQueryiv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->GetQueryiv(context, target, pname, params);
     }
 }
 
@@ -933,15 +804,12 @@ void GL_APIENTRY GetSamplerParameterfv(GLuint sampler, GLenum pname, GLfloat *pa
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterfv, sampler, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetSamplerParameterfv(context, sampler, pname, params))
-        {
-            context->getSamplerParameterfv(sampler, pname, params);
-        }
+        context->getDispatchTable()->GetSamplerParameterfv(context, sampler, pname, params);
     }
 }
 
@@ -950,15 +818,12 @@ void GL_APIENTRY GetSamplerParameteriv(GLuint sampler, GLenum pname, GLint *para
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", sampler,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameteriv, sampler, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetSamplerParameteriv(context, sampler, pname, params))
-        {
-            context->getSamplerParameteriv(sampler, pname, params);
-        }
+        context->getDispatchTable()->GetSamplerParameteriv(context, sampler, pname, params);
     }
 }
 
@@ -966,14 +831,12 @@ const GLubyte *GL_APIENTRY GetStringi(GLenum name, GLuint index)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum name = 0x%X, GLuint index = %u)", name, index);
+    ANGLE_BINARY_EVENT(GetStringi, name, index);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetStringi(context, name, index))
-        {
-            return context->getStringi(name, index);
-        }
+        return context->getDispatchTable()->GetStringi(context, name, index);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetStringi, const GLubyte *>();
@@ -987,15 +850,12 @@ GetSynciv(GLsync sync, GLenum pname, GLsizei bufSize, GLsizei *length, GLint *va
           ", GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLint *values = 0x%016" PRIxPTR ")",
           (uintptr_t)sync, pname, bufSize, (uintptr_t)length, (uintptr_t)values);
+    ANGLE_BINARY_EVENT(GetSynciv, sync, pname, bufSize, length, values);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetSynciv(context, sync, pname, bufSize, length, values))
-        {
-            context->getSynciv(sync, pname, bufSize, length, values);
-        }
+        context->getDispatchTable()->GetSynciv(context, sync, pname, bufSize, length, values);
     }
 }
 
@@ -1014,33 +874,29 @@ void GL_APIENTRY GetTransformFeedbackVarying(GLuint program,
         ", GLchar *name = 0x%016" PRIxPTR ")",
         program, index, bufSize, (uintptr_t)length, (uintptr_t)size, (uintptr_t)type,
         (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetTransformFeedbackVarying, program, index, bufSize, length, size, type,
+                       name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetTransformFeedbackVarying(context, program, index, bufSize, length, size,
-                                                type, name))
-        {
-            context->getTransformFeedbackVarying(program, index, bufSize, length, size, type, name);
-        }
+        context->getDispatchTable()->GetTransformFeedbackVarying(context, program, index, bufSize,
+                                                                 length, size, type, name);
     }
 }
 
 GLuint GL_APIENTRY GetUniformBlockIndex(GLuint program, const GLchar *uniformBlockName)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *uniformBlockName = 0x%016" PRIxPTR ")", program,
           (uintptr_t)uniformBlockName);
+    ANGLE_BINARY_EVENT(GetUniformBlockIndex, program, uniformBlockName);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetUniformBlockIndex(context, program, uniformBlockName))
-        {
-            return context->getUniformBlockIndex(program, uniformBlockName);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        return context->getDispatchTable()->GetUniformBlockIndex(context, program,
+                                                                 uniformBlockName);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetUniformBlockIndex, GLuint>();
@@ -1056,31 +912,27 @@ void GL_APIENTRY GetUniformIndices(GLuint program,
         "(GLuint program = %u, GLsizei uniformCount = %d, const GLchar *const*uniformNames = "
         "0x%016" PRIxPTR ", GLuint *uniformIndices = 0x%016" PRIxPTR ")",
         program, uniformCount, (uintptr_t)uniformNames, (uintptr_t)uniformIndices);
+    ANGLE_BINARY_EVENT(GetUniformIndices, program, uniformCount, uniformNames, uniformIndices);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetUniformIndices(context, program, uniformCount, uniformNames, uniformIndices))
-        {
-            context->getUniformIndices(program, uniformCount, uniformNames, uniformIndices);
-        }
+        context->getDispatchTable()->GetUniformIndices(context, program, uniformCount, uniformNames,
+                                                       uniformIndices);
     }
 }
 
 void GL_APIENTRY GetUniformuiv(GLuint program, GLint location, GLuint *params)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLuint *params = 0x%016" PRIxPTR ")", program,
           location, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetUniformuiv, program, location, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetUniformuiv(context, program, location, params))
-        {
-            context->getUniformuiv(program, location, params);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->GetUniformuiv(context, program, location, params);
     }
 }
 
@@ -1089,14 +941,12 @@ void GL_APIENTRY GetVertexAttribIiv(GLuint index, GLenum pname, GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribIiv, index, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetVertexAttribIiv(context, index, pname, params))
-        {
-            context->getVertexAttribIiv(index, pname, params);
-        }
+        context->getDispatchTable()->GetVertexAttribIiv(context, index, pname, params);
     }
 }
 
@@ -1105,14 +955,12 @@ void GL_APIENTRY GetVertexAttribIuiv(GLuint index, GLenum pname, GLuint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribIuiv, index, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetVertexAttribIuiv(context, index, pname, params))
-        {
-            context->getVertexAttribIuiv(index, pname, params);
-        }
+        context->getDispatchTable()->GetVertexAttribIuiv(context, index, pname, params);
     }
 }
 
@@ -1125,15 +973,13 @@ void GL_APIENTRY InvalidateFramebuffer(GLenum target,
         "(GLenum target = 0x%X, GLsizei numAttachments = %d, const GLenum *attachments = "
         "0x%016" PRIxPTR ")",
         target, numAttachments, (uintptr_t)attachments);
+    ANGLE_BINARY_EVENT(InvalidateFramebuffer, target, numAttachments, attachments);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateInvalidateFramebuffer(context, target, numAttachments, attachments))
-        {
-            context->invalidateFramebuffer(target, numAttachments, attachments);
-        }
+        context->getDispatchTable()->InvalidateFramebuffer(context, target, numAttachments,
+                                                           attachments);
     }
 }
 
@@ -1150,17 +996,14 @@ void GL_APIENTRY InvalidateSubFramebuffer(GLenum target,
         "(GLenum target = 0x%X, GLsizei numAttachments = %d, const GLenum *attachments = "
         "0x%016" PRIxPTR ", GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
         target, numAttachments, (uintptr_t)attachments, x, y, width, height);
+    ANGLE_BINARY_EVENT(InvalidateSubFramebuffer, target, numAttachments, attachments, x, y, width,
+                       height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateInvalidateSubFramebuffer(context, target, numAttachments, attachments, x, y,
-                                             width, height))
-        {
-            context->invalidateSubFramebuffer(target, numAttachments, attachments, x, y, width,
-                                              height);
-        }
+        context->getDispatchTable()->InvalidateSubFramebuffer(context, target, numAttachments,
+                                                              attachments, x, y, width, height);
     }
 }
 
@@ -1168,14 +1011,12 @@ GLboolean GL_APIENTRY IsQuery(GLuint id)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u)", id);
+    ANGLE_BINARY_EVENT(IsQuery, id);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsQuery(context, id))
-        {
-            return context->isQuery(id);
-        }
+        return context->getDispatchTable()->IsQuery(context, id);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsQuery, GLboolean>();
@@ -1185,14 +1026,12 @@ GLboolean GL_APIENTRY IsSampler(GLuint sampler)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u)", sampler);
+    ANGLE_BINARY_EVENT(IsSampler, sampler);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsSampler(context, sampler))
-        {
-            return context->isSampler(sampler);
-        }
+        return context->getDispatchTable()->IsSampler(context, sampler);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsSampler, GLboolean>();
@@ -1202,14 +1041,12 @@ GLboolean GL_APIENTRY IsSync(GLsync sync)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ")", (uintptr_t)sync);
+    ANGLE_BINARY_EVENT(IsSync, sync);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsSync(context, sync))
-        {
-            return context->isSync(sync);
-        }
+        return context->getDispatchTable()->IsSync(context, sync);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsSync, GLboolean>();
@@ -1219,14 +1056,12 @@ GLboolean GL_APIENTRY IsTransformFeedback(GLuint id)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u)", id);
+    ANGLE_BINARY_EVENT(IsTransformFeedback, id);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsTransformFeedback(context, id))
-        {
-            return context->isTransformFeedback(id);
-        }
+        return context->getDispatchTable()->IsTransformFeedback(context, id);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsTransformFeedback, GLboolean>();
@@ -1236,14 +1071,12 @@ GLboolean GL_APIENTRY IsVertexArray(GLuint array)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_EVENT(IsVertexArray, array);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsVertexArray(context, array))
-        {
-            return context->isVertexArray(array);
-        }
+        return context->getDispatchTable()->IsVertexArray(context, array);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsVertexArray, GLboolean>();
@@ -1260,16 +1093,12 @@ void *GL_APIENTRY MapBufferRange(GLenum target,
         "access = 0x%X)",
         target, static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length),
         access);
+    ANGLE_BINARY_EVENT(MapBufferRange, target, offset, length, access);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateMapBufferRange(context, targetPacked, offset, length, access))
-        {
-            return context->mapBufferRange(targetPacked, offset, length, access);
-        }
+        return context->getDispatchTable()->MapBufferRange(context, target, offset, length, access);
     }
 
     return GetDefaultReturnValue<EntryPoint::MapBufferRange, void *>();
@@ -1279,14 +1108,12 @@ void GL_APIENTRY PauseTransformFeedback()
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(PauseTransformFeedback);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidatePauseTransformFeedback(context))
-        {
-            context->pauseTransformFeedback();
-        }
+        context->getDispatchTable()->PauseTransformFeedback(context);
     }
 }
 
@@ -1299,15 +1126,12 @@ void GL_APIENTRY ProgramBinary(GLuint program,
     EVENT("(GLuint program = %u, GLenum binaryFormat = 0x%X, const void *binary = 0x%016" PRIxPTR
           ", GLsizei length = %d)",
           program, binaryFormat, (uintptr_t)binary, length);
+    ANGLE_BINARY_EVENT(ProgramBinary, program, binaryFormat, binary, length);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramBinary(context, program, binaryFormat, binary, length))
-        {
-            context->programBinary(program, binaryFormat, binary, length);
-        }
+        context->getDispatchTable()->ProgramBinary(context, program, binaryFormat, binary, length);
     }
 }
 
@@ -1315,14 +1139,12 @@ void GL_APIENTRY ProgramParameteri(GLuint program, GLenum pname, GLint value)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLenum pname = 0x%X, GLint value = %d)", program, pname, value);
+    ANGLE_BINARY_EVENT(ProgramParameteri, program, pname, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateProgramParameteri(context, program, pname, value))
-        {
-            context->programParameteri(program, pname, value);
-        }
+        context->getDispatchTable()->ProgramParameteri(context, program, pname, value);
     }
 }
 
@@ -1330,14 +1152,12 @@ void GL_APIENTRY ReadBuffer(GLenum src)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum src = 0x%X)", src);
+    ANGLE_BINARY_EVENT(ReadBuffer, src);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateReadBuffer(context, src))
-        {
-            context->readBuffer(src);
-        }
+        context->getDispatchTable()->ReadBuffer(context, src);
     }
 }
 
@@ -1352,16 +1172,14 @@ void GL_APIENTRY RenderbufferStorageMultisample(GLenum target,
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d)",
         target, samples, internalformat, width, height);
+    ANGLE_BINARY_EVENT(RenderbufferStorageMultisample, target, samples, internalformat, width,
+                       height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateRenderbufferStorageMultisample(context, target, samples, internalformat, width,
-                                                   height))
-        {
-            context->renderbufferStorageMultisample(target, samples, internalformat, width, height);
-        }
+        context->getDispatchTable()->RenderbufferStorageMultisample(context, target, samples,
+                                                                    internalformat, width, height);
     }
 }
 
@@ -1369,14 +1187,12 @@ void GL_APIENTRY ResumeTransformFeedback()
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(ResumeTransformFeedback);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateResumeTransformFeedback(context))
-        {
-            context->resumeTransformFeedback();
-        }
+        context->getDispatchTable()->ResumeTransformFeedback(context);
     }
 }
 
@@ -1384,14 +1200,12 @@ void GL_APIENTRY SamplerParameterf(GLuint sampler, GLenum pname, GLfloat param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLfloat param = %f)", sampler, pname, param);
+    ANGLE_BINARY_EVENT(SamplerParameterf, sampler, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateSamplerParameterf(context, sampler, pname, param))
-        {
-            context->samplerParameterf(sampler, pname, param);
-        }
+        context->getDispatchTable()->SamplerParameterf(context, sampler, pname, param);
     }
 }
 
@@ -1400,14 +1214,12 @@ void GL_APIENTRY SamplerParameterfv(GLuint sampler, GLenum pname, const GLfloat
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLfloat *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterfv, sampler, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateSamplerParameterfv(context, sampler, pname, param))
-        {
-            context->samplerParameterfv(sampler, pname, param);
-        }
+        context->getDispatchTable()->SamplerParameterfv(context, sampler, pname, param);
     }
 }
 
@@ -1415,14 +1227,12 @@ void GL_APIENTRY SamplerParameteri(GLuint sampler, GLenum pname, GLint param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLint param = %d)", sampler, pname, param);
+    ANGLE_BINARY_EVENT(SamplerParameteri, sampler, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateSamplerParameteri(context, sampler, pname, param))
-        {
-            context->samplerParameteri(sampler, pname, param);
-        }
+        context->getDispatchTable()->SamplerParameteri(context, sampler, pname, param);
     }
 }
 
@@ -1431,14 +1241,12 @@ void GL_APIENTRY SamplerParameteriv(GLuint sampler, GLenum pname, const GLint *p
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLint *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameteriv, sampler, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateSamplerParameteriv(context, sampler, pname, param))
-        {
-            context->samplerParameteriv(sampler, pname, param);
-        }
+        context->getDispatchTable()->SamplerParameteriv(context, sampler, pname, param);
     }
 }
 
@@ -1460,18 +1268,14 @@ void GL_APIENTRY TexImage3D(GLenum target,
         "type = 0x%X, const void *pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, format, type,
         (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexImage3D, target, level, internalformat, width, height, depth, border,
+                       format, type, pixels);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexImage3D(context, targetPacked, level, internalformat, width, height, depth,
-                               border, format, type, pixels))
-        {
-            context->texImage3D(targetPacked, level, internalformat, width, height, depth, border,
-                                format, type, pixels);
-        }
+        context->getDispatchTable()->TexImage3D(context, target, level, internalformat, width,
+                                                height, depth, border, format, type, pixels);
     }
 }
 
@@ -1483,16 +1287,13 @@ TexStorage2D(GLenum target, GLsizei levels, GLenum internalformat, GLsizei width
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d)",
         target, levels, internalformat, width, height);
+    ANGLE_BINARY_EVENT(TexStorage2D, target, levels, internalformat, width, height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorage2D(context, targetPacked, levels, internalformat, width, height))
-        {
-            context->texStorage2D(targetPacked, levels, internalformat, width, height);
-        }
+        context->getDispatchTable()->TexStorage2D(context, target, levels, internalformat, width,
+                                                  height);
     }
 }
 
@@ -1508,16 +1309,13 @@ void GL_APIENTRY TexStorage3D(GLenum target,
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLsizei depth = %d)",
         target, levels, internalformat, width, height, depth);
+    ANGLE_BINARY_EVENT(TexStorage3D, target, levels, internalformat, width, height, depth);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateTexStorage3D(context, targetPacked, levels,
-                                                              internalformat, width, height, depth))
-        {
-            context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
-        }
+        context->getDispatchTable()->TexStorage3D(context, target, levels, internalformat, width,
+                                                  height, depth);
     }
 }
 
@@ -1540,18 +1338,15 @@ void GL_APIENTRY TexSubImage3D(GLenum target,
         "= 0x%X, GLenum type = 0x%X, const void *pixels = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, type,
         (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexSubImage3D, target, level, xoffset, yoffset, zoffset, width, height,
+                       depth, format, type, pixels);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexSubImage3D(context, targetPacked, level, xoffset, yoffset, zoffset, width,
-                                  height, depth, format, type, pixels))
-        {
-            context->texSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width, height,
-                                   depth, format, type, pixels);
-        }
+        context->getDispatchTable()->TexSubImage3D(context, target, level, xoffset, yoffset,
+                                                   zoffset, width, height, depth, format, type,
+                                                   pixels);
     }
 }
 
@@ -1564,141 +1359,123 @@ void GL_APIENTRY TransformFeedbackVaryings(GLuint program,
     EVENT("(GLuint program = %u, GLsizei count = %d, const GLchar *const*varyings = 0x%016" PRIxPTR
           ", GLenum bufferMode = 0x%X)",
           program, count, (uintptr_t)varyings, bufferMode);
+    ANGLE_BINARY_EVENT(TransformFeedbackVaryings, program, count, varyings, bufferMode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateTransformFeedbackVaryings(context, program, count, varyings, bufferMode))
-        {
-            context->transformFeedbackVaryings(program, count, varyings, bufferMode);
-        }
+        context->getDispatchTable()->TransformFeedbackVaryings(context, program, count, varyings,
+                                                               bufferMode);
     }
 }
 
 void GL_APIENTRY Uniform1ui(GLint location, GLuint v0)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u)", location, v0);
+    ANGLE_BINARY_EVENT(Uniform1ui, location, v0);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform1ui(context, location, v0))
-        {
-            context->uniform1ui(location, v0);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform1ui(context, location, v0);
     }
 }
 
 void GL_APIENTRY Uniform1uiv(GLint location, GLsizei count, const GLuint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform1uiv, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform1uiv(context, location, count, value))
-        {
-            context->uniform1uiv(location, count, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform1uiv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform2ui(GLint location, GLuint v0, GLuint v1)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u)", location, v0, v1);
+    ANGLE_BINARY_EVENT(Uniform2ui, location, v0, v1);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform2ui(context, location, v0, v1))
-        {
-            context->uniform2ui(location, v0, v1);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform2ui(context, location, v0, v1);
     }
 }
 
 void GL_APIENTRY Uniform2uiv(GLint location, GLsizei count, const GLuint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform2uiv, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform2uiv(context, location, count, value))
-        {
-            context->uniform2uiv(location, count, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform2uiv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform3ui(GLint location, GLuint v0, GLuint v1, GLuint v2)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = %u)", location, v0, v1,
           v2);
+    ANGLE_BINARY_EVENT(Uniform3ui, location, v0, v1, v2);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform3ui(context, location, v0, v1, v2))
-        {
-            context->uniform3ui(location, v0, v1, v2);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform3ui(context, location, v0, v1, v2);
     }
 }
 
 void GL_APIENTRY Uniform3uiv(GLint location, GLsizei count, const GLuint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform3uiv, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform3uiv(context, location, count, value))
-        {
-            context->uniform3uiv(location, count, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform3uiv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform4ui(GLint location, GLuint v0, GLuint v1, GLuint v2, GLuint v3)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = %u, GLuint v3 = %u)",
           location, v0, v1, v2, v3);
+    ANGLE_BINARY_EVENT(Uniform4ui, location, v0, v1, v2, v3);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform4ui(context, location, v0, v1, v2, v3))
-        {
-            context->uniform4ui(location, v0, v1, v2, v3);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform4ui(context, location, v0, v1, v2, v3);
     }
 }
 
 void GL_APIENTRY Uniform4uiv(GLint location, GLsizei count, const GLuint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform4uiv, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateUniform4uiv(context, location, count, value))
-        {
-            context->uniform4uiv(location, count, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform4uiv(context, location, count, value);
     }
 }
 
@@ -1706,18 +1483,16 @@ void GL_APIENTRY UniformBlockBinding(GLuint program,
                                      GLuint uniformBlockIndex,
                                      GLuint uniformBlockBinding)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint uniformBlockIndex = %u, GLuint uniformBlockBinding = %u)",
           program, uniformBlockIndex, uniformBlockBinding);
+    ANGLE_BINARY_EVENT(UniformBlockBinding, program, uniformBlockIndex, uniformBlockBinding);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateUniformBlockBinding(context, program, uniformBlockIndex, uniformBlockBinding))
-        {
-            context->uniformBlockBinding(program, uniformBlockIndex, uniformBlockBinding);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformBlockBinding(context, program, uniformBlockIndex,
+                                                         uniformBlockBinding);
     }
 }
 
@@ -1726,20 +1501,17 @@ void GL_APIENTRY UniformMatrix2x3fv(GLint location,
                                     GLboolean transpose,
                                     const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix2x3fv, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateUniformMatrix2x3fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix2x3fv(location, count, transpose, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix2x3fv(context, location, count, transpose, value);
     }
 }
 
@@ -1748,20 +1520,17 @@ void GL_APIENTRY UniformMatrix2x4fv(GLint location,
                                     GLboolean transpose,
                                     const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix2x4fv, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateUniformMatrix2x4fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix2x4fv(location, count, transpose, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix2x4fv(context, location, count, transpose, value);
     }
 }
 
@@ -1770,20 +1539,17 @@ void GL_APIENTRY UniformMatrix3x2fv(GLint location,
                                     GLboolean transpose,
                                     const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix3x2fv, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateUniformMatrix3x2fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix3x2fv(location, count, transpose, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix3x2fv(context, location, count, transpose, value);
     }
 }
 
@@ -1792,20 +1558,17 @@ void GL_APIENTRY UniformMatrix3x4fv(GLint location,
                                     GLboolean transpose,
                                     const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix3x4fv, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateUniformMatrix3x4fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix3x4fv(location, count, transpose, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix3x4fv(context, location, count, transpose, value);
     }
 }
 
@@ -1814,20 +1577,17 @@ void GL_APIENTRY UniformMatrix4x2fv(GLint location,
                                     GLboolean transpose,
                                     const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix4x2fv, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateUniformMatrix4x2fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix4x2fv(location, count, transpose, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix4x2fv(context, location, count, transpose, value);
     }
 }
 
@@ -1836,20 +1596,17 @@ void GL_APIENTRY UniformMatrix4x3fv(GLint location,
                                     GLboolean transpose,
                                     const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix4x3fv, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateUniformMatrix4x3fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix4x3fv(location, count, transpose, value);
-        }
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix4x3fv(context, location, count, transpose, value);
     }
 }
 
@@ -1857,15 +1614,12 @@ GLboolean GL_APIENTRY UnmapBuffer(GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(UnmapBuffer, target);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateUnmapBuffer(context, targetPacked))
-        {
-            return context->unmapBuffer(targetPacked);
-        }
+        return context->getDispatchTable()->UnmapBuffer(context, target);
     }
 
     return GetDefaultReturnValue<EntryPoint::UnmapBuffer, GLboolean>();
@@ -1873,78 +1627,63 @@ GLboolean GL_APIENTRY UnmapBuffer(GLenum target)
 
 void GL_APIENTRY VertexAttribDivisor(GLuint index, GLuint divisor)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint divisor = %u)", index, divisor);
+    ANGLE_BINARY_EVENT(VertexAttribDivisor, index, divisor);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttribDivisor(context, index, divisor))
-        {
-            context->vertexAttribDivisor(index, divisor);
-        }
+        context->getDispatchTable()->VertexAttribDivisor(context, index, divisor);
     }
 }
 
 void GL_APIENTRY VertexAttribI4i(GLuint index, GLint x, GLint y, GLint z, GLint w)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLint x = %d, GLint y = %d, GLint z = %d, GLint w = %d)", index, x,
           y, z, w);
+    ANGLE_BINARY_EVENT(VertexAttribI4i, index, x, y, z, w);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttribI4i(context, index, x, y, z, w))
-        {
-            context->vertexAttribI4i(index, x, y, z, w);
-        }
+        context->getDispatchTable()->VertexAttribI4i(context, index, x, y, z, w);
     }
 }
 
 void GL_APIENTRY VertexAttribI4iv(GLuint index, const GLint *v)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLint *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_EVENT(VertexAttribI4iv, index, v);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttribI4iv(context, index, v))
-        {
-            context->vertexAttribI4iv(index, v);
-        }
+        context->getDispatchTable()->VertexAttribI4iv(context, index, v);
     }
 }
 
 void GL_APIENTRY VertexAttribI4ui(GLuint index, GLuint x, GLuint y, GLuint z, GLuint w)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint x = %u, GLuint y = %u, GLuint z = %u, GLuint w = %u)", index,
           x, y, z, w);
+    ANGLE_BINARY_EVENT(VertexAttribI4ui, index, x, y, z, w);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttribI4ui(context, index, x, y, z, w))
-        {
-            context->vertexAttribI4ui(index, x, y, z, w);
-        }
+        context->getDispatchTable()->VertexAttribI4ui(context, index, x, y, z, w);
     }
 }
 
 void GL_APIENTRY VertexAttribI4uiv(GLuint index, const GLuint *v)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLuint *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_EVENT(VertexAttribI4uiv, index, v);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttribI4uiv(context, index, v))
-        {
-            context->vertexAttribI4uiv(index, v);
-        }
+        context->getDispatchTable()->VertexAttribI4uiv(context, index, v);
     }
 }
 
@@ -1956,16 +1695,13 @@ VertexAttribIPointer(GLuint index, GLint size, GLenum type, GLsizei stride, cons
         "(GLuint index = %u, GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void "
         "*pointer = 0x%016" PRIxPTR ")",
         index, size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(VertexAttribIPointer, index, size, type, stride, pointer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateVertexAttribIPointer(context, index, size, typePacked, stride, pointer))
-        {
-            context->vertexAttribIPointer(index, size, typePacked, stride, pointer);
-        }
+        context->getDispatchTable()->VertexAttribIPointer(context, index, size, type, stride,
+                                                          pointer);
     }
 }
 
@@ -1974,14 +1710,12 @@ void GL_APIENTRY WaitSync(GLsync sync, GLbitfield flags, GLuint64 timeout)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ", GLbitfield flags = 0x%X, GLuint64 timeout = %llu)",
           (uintptr_t)sync, flags, static_cast<unsigned long long>(timeout));
+    ANGLE_BINARY_EVENT(WaitSync, sync, flags, timeout);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateWaitSync(context, sync, flags, timeout))
-        {
-            context->waitSync(sync, flags, timeout);
-        }
+        context->getDispatchTable()->WaitSync(context, sync, flags, timeout);
     }
 }
 }  // namespace gl
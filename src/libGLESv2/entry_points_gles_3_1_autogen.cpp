@@ -11,8 +11,8 @@
 #include "libGLESv2/entry_points_gles_3_1_autogen.h"
 
 #include "libANGLE/Context.h"
-#include "libANGLE/Context.inl.h"
-#include "libANGLE/validationES31.h"
+#include "libGLESv2/entry_points_binary_event.h"
+#include "libGLESv2/entry_points_dispatch_autogen.h"
 #include "libGLESv2/entry_points_utils.h"
 #include "libGLESv2/global_state.h"
 
@@ -22,14 +22,12 @@ void GL_APIENTRY ActiveShaderProgram(GLuint pipeline, GLuint program)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLuint program = %u)", pipeline, program);
+    ANGLE_BINARY_EVENT(ActiveShaderProgram, pipeline, program);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateActiveShaderProgram(context, pipeline, program))
-        {
-            context->activeShaderProgram(pipeline, program);
-        }
+        context->getDispatchTable()->ActiveShaderProgram(context, pipeline, program);
     }
 }
 
@@ -46,15 +44,13 @@ void GL_APIENTRY BindImageTexture(GLuint unit,
         "(GLuint unit = %u, GLuint texture = %u, GLint level = %d, GLboolean layered = %u, GLint "
         "layer = %d, GLenum access = 0x%X, GLenum format = 0x%X)",
         unit, texture, level, layered, layer, access, format);
+    ANGLE_BINARY_EVENT(BindImageTexture, unit, texture, level, layered, layer, access, format);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateBindImageTexture(context, unit, texture, level, layered, layer, access, format))
-        {
-            context->bindImageTexture(unit, texture, level, layered, layer, access, format);
-        }
+        context->getDispatchTable()->BindImageTexture(context, unit, texture, level, layered, layer,
+                                                      access, format);
     }
 }
 
@@ -62,14 +58,12 @@ void GL_APIENTRY BindProgramPipeline(GLuint pipeline)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u)", pipeline);
+    ANGLE_BINARY_EVENT(BindProgramPipeline, pipeline);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBindProgramPipeline(context, pipeline))
-        {
-            context->bindProgramPipeline(pipeline);
-        }
+        context->getDispatchTable()->BindProgramPipeline(context, pipeline);
     }
 }
 
@@ -83,15 +77,13 @@ void GL_APIENTRY BindVertexBuffer(GLuint bindingindex,
         "(GLuint bindingindex = %u, GLuint buffer = %u, GLintptr offset = %llu, GLsizei stride = "
         "%d)",
         bindingindex, buffer, static_cast<unsigned long long>(offset), stride);
+    ANGLE_BINARY_EVENT(BindVertexBuffer, bindingindex, buffer, offset, stride);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateBindVertexBuffer(context, bindingindex, buffer, offset, stride))
-        {
-            context->bindVertexBuffer(bindingindex, buffer, offset, stride);
-        }
+        context->getDispatchTable()->BindVertexBuffer(context, bindingindex, buffer, offset,
+                                                      stride);
     }
 }
 
@@ -101,16 +93,12 @@ GLuint GL_APIENTRY CreateShaderProgramv(GLenum type, GLsizei count, const GLchar
     EVENT("(GLenum type = 0x%X, GLsizei count = %d, const GLchar *const*strings = 0x%016" PRIxPTR
           ")",
           type, count, (uintptr_t)strings);
+    ANGLE_BINARY_EVENT(CreateShaderProgramv, type, count, strings);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        ShaderType typePacked = FromGLenum<ShaderType>(type);
-        if (context->skipValidation() ||
-            ValidateCreateShaderProgramv(context, typePacked, count, strings))
-        {
-            return context->createShaderProgramv(typePacked, count, strings);
-        }
+        return context->getDispatchTable()->CreateShaderProgramv(context, type, count, strings);
     }
 
     return GetDefaultReturnValue<EntryPoint::CreateShaderProgramv, GLuint>();
@@ -120,14 +108,12 @@ void GL_APIENTRY DeleteProgramPipelines(GLsizei n, const GLuint *pipelines)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *pipelines = 0x%016" PRIxPTR ")", n, (uintptr_t)pipelines);
+    ANGLE_BINARY_EVENT(DeleteProgramPipelines, n, pipelines);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteProgramPipelines(context, n, pipelines))
-        {
-            context->deleteProgramPipelines(n, pipelines);
-        }
+        context->getDispatchTable()->DeleteProgramPipelines(context, n, pipelines);
     }
 }
 
@@ -136,15 +122,13 @@ void GL_APIENTRY DispatchCompute(GLuint num_groups_x, GLuint num_groups_y, GLuin
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint num_groups_x = %u, GLuint num_groups_y = %u, GLuint num_groups_z = %u)",
           num_groups_x, num_groups_y, num_groups_z);
+    ANGLE_BINARY_EVENT(DispatchCompute, num_groups_x, num_groups_y, num_groups_z);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateDispatchCompute(context, num_groups_x, num_groups_y, num_groups_z))
-        {
-            context->dispatchCompute(num_groups_x, num_groups_y, num_groups_z);
-        }
+        context->getDispatchTable()->DispatchCompute(context, num_groups_x, num_groups_y,
+                                                     num_groups_z);
     }
 }
 
@@ -152,14 +136,12 @@ void GL_APIENTRY DispatchComputeIndirect(GLintptr indirect)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLintptr indirect = %llu)", static_cast<unsigned long long>(indirect));
+    ANGLE_BINARY_EVENT(DispatchComputeIndirect, indirect);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDispatchComputeIndirect(context, indirect))
-        {
-            context->dispatchComputeIndirect(indirect);
-        }
+        context->getDispatchTable()->DispatchComputeIndirect(context, indirect);
     }
 }
 
@@ -168,15 +150,12 @@ void GL_APIENTRY DrawArraysIndirect(GLenum mode, const void *indirect)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, const void *indirect = 0x%016" PRIxPTR ")", mode,
           (uintptr_t)indirect);
+    ANGLE_BINARY_EVENT(DrawArraysIndirect, mode, indirect);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() || ValidateDrawArraysIndirect(context, modePacked, indirect))
-        {
-            context->drawArraysIndirect(modePacked, indirect);
-        }
+        context->getDispatchTable()->DrawArraysIndirect(context, mode, indirect);
     }
 }
 
@@ -185,17 +164,12 @@ void GL_APIENTRY DrawElementsIndirect(GLenum mode, GLenum type, const void *indi
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLenum type = 0x%X, const void *indirect = 0x%016" PRIxPTR ")",
           mode, type, (uintptr_t)indirect);
+    ANGLE_BINARY_EVENT(DrawElementsIndirect, mode, type, indirect);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateDrawElementsIndirect(context, modePacked, typePacked, indirect))
-        {
-            context->drawElementsIndirect(modePacked, typePacked, indirect);
-        }
+        context->getDispatchTable()->DrawElementsIndirect(context, mode, type, indirect);
     }
 }
 
@@ -203,15 +177,12 @@ void GL_APIENTRY FramebufferParameteri(GLenum target, GLenum pname, GLint param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)", target, pname, param);
+    ANGLE_BINARY_EVENT(FramebufferParameteri, target, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateFramebufferParameteri(context, target, pname, param))
-        {
-            context->framebufferParameteri(target, pname, param);
-        }
+        context->getDispatchTable()->FramebufferParameteri(context, target, pname, param);
     }
 }
 
@@ -219,14 +190,12 @@ void GL_APIENTRY GenProgramPipelines(GLsizei n, GLuint *pipelines)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *pipelines = 0x%016" PRIxPTR ")", n, (uintptr_t)pipelines);
+    ANGLE_BINARY_EVENT(GenProgramPipelines, n, pipelines);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenProgramPipelines(context, n, pipelines))
-        {
-            context->genProgramPipelines(n, pipelines);
-        }
+        context->getDispatchTable()->GenProgramPipelines(context, n, pipelines);
     }
 }
 
@@ -235,14 +204,12 @@ void GL_APIENTRY GetBooleani_v(GLenum target, GLuint index, GLboolean *data)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLboolean *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetBooleani_v, target, index, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetBooleani_v(context, target, index, data))
-        {
-            context->getBooleani_v(target, index, data);
-        }
+        context->getDispatchTable()->GetBooleani_v(context, target, index, data);
     }
 }
 
@@ -251,15 +218,12 @@ void GL_APIENTRY GetFramebufferParameteriv(GLenum target, GLenum pname, GLint *p
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFramebufferParameteriv, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetFramebufferParameteriv(context, target, pname, params))
-        {
-            context->getFramebufferParameteriv(target, pname, params);
-        }
+        context->getDispatchTable()->GetFramebufferParameteriv(context, target, pname, params);
     }
 }
 
@@ -268,14 +232,12 @@ void GL_APIENTRY GetMultisamplefv(GLenum pname, GLuint index, GLfloat *val)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLuint index = %u, GLfloat *val = 0x%016" PRIxPTR ")", pname,
           index, (uintptr_t)val);
+    ANGLE_BINARY_EVENT(GetMultisamplefv, pname, index, val);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetMultisamplefv(context, pname, index, val))
-        {
-            context->getMultisamplefv(pname, index, val);
-        }
+        context->getDispatchTable()->GetMultisamplefv(context, pname, index, val);
     }
 }
 
@@ -289,15 +251,13 @@ void GL_APIENTRY GetProgramInterfaceiv(GLuint program,
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLenum pname = 0x%X, GLint *params "
         "= 0x%016" PRIxPTR ")",
         program, programInterface, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetProgramInterfaceiv, program, programInterface, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramInterfaceiv(context, program, programInterface, pname, params))
-        {
-            context->getProgramInterfaceiv(program, programInterface, pname, params);
-        }
+        context->getDispatchTable()->GetProgramInterfaceiv(context, program, programInterface,
+                                                           pname, params);
     }
 }
 
@@ -310,15 +270,13 @@ void GL_APIENTRY GetProgramPipelineInfoLog(GLuint pipeline,
     EVENT("(GLuint pipeline = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *infoLog = 0x%016" PRIxPTR ")",
           pipeline, bufSize, (uintptr_t)length, (uintptr_t)infoLog);
+    ANGLE_BINARY_EVENT(GetProgramPipelineInfoLog, pipeline, bufSize, length, infoLog);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramPipelineInfoLog(context, pipeline, bufSize, length, infoLog))
-        {
-            context->getProgramPipelineInfoLog(pipeline, bufSize, length, infoLog);
-        }
+        context->getDispatchTable()->GetProgramPipelineInfoLog(context, pipeline, bufSize, length,
+                                                               infoLog);
     }
 }
 
@@ -327,15 +285,12 @@ void GL_APIENTRY GetProgramPipelineiv(GLuint pipeline, GLenum pname, GLint *para
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
           pipeline, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetProgramPipelineiv, pipeline, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramPipelineiv(context, pipeline, pname, params))
-        {
-            context->getProgramPipelineiv(pipeline, pname, params);
-        }
+        context->getDispatchTable()->GetProgramPipelineiv(context, pipeline, pname, params);
     }
 }
 
@@ -348,15 +303,13 @@ GLuint GL_APIENTRY GetProgramResourceIndex(GLuint program,
         "(GLuint program = %u, GLenum programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR
         ")",
         program, programInterface, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetProgramResourceIndex, program, programInterface, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramResourceIndex(context, program, programInterface, name))
-        {
-            return context->getProgramResourceIndex(program, programInterface, name);
-        }
+        return context->getDispatchTable()->GetProgramResourceIndex(context, program,
+                                                                    programInterface, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetProgramResourceIndex, GLuint>();
@@ -371,15 +324,13 @@ GLint GL_APIENTRY GetProgramResourceLocation(GLuint program,
         "(GLuint program = %u, GLenum programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR
         ")",
         program, programInterface, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetProgramResourceLocation, program, programInterface, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramResourceLocation(context, program, programInterface, name))
-        {
-            return context->getProgramResourceLocation(program, programInterface, name);
-        }
+        return context->getDispatchTable()->GetProgramResourceLocation(context, program,
+                                                                       programInterface, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetProgramResourceLocation, GLint>();
@@ -397,17 +348,14 @@ void GL_APIENTRY GetProgramResourceName(GLuint program,
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLuint index = %u, GLsizei bufSize "
         "= %d, GLsizei *length = 0x%016" PRIxPTR ", GLchar *name = 0x%016" PRIxPTR ")",
         program, programInterface, index, bufSize, (uintptr_t)length, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetProgramResourceName, program, programInterface, index, bufSize, length,
+                       name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramResourceName(context, program, programInterface, index, bufSize,
-                                           length, name))
-        {
-            context->getProgramResourceName(program, programInterface, index, bufSize, length,
-                                            name);
-        }
+        context->getDispatchTable()->GetProgramResourceName(context, program, programInterface,
+                                                            index, bufSize, length, name);
     }
 }
 
@@ -428,17 +376,14 @@ void GL_APIENTRY GetProgramResourceiv(GLuint program,
         ", GLint *params = 0x%016" PRIxPTR ")",
         program, programInterface, index, propCount, (uintptr_t)props, bufSize, (uintptr_t)length,
         (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetProgramResourceiv, program, programInterface, index, propCount, props,
+                       bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramResourceiv(context, program, programInterface, index, propCount,
-                                         props, bufSize, length, params))
-        {
-            context->getProgramResourceiv(program, programInterface, index, propCount, props,
-                                          bufSize, length, params);
-        }
+        context->getDispatchTable()->GetProgramResourceiv(
+            context, program, programInterface, index, propCount, props, bufSize, length, params);
     }
 }
 
@@ -449,16 +394,12 @@ void GL_APIENTRY GetTexLevelParameterfv(GLenum target, GLint level, GLenum pname
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLfloat *params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexLevelParameterfv, target, level, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexLevelParameterfv(context, targetPacked, level, pname, params))
-        {
-            context->getTexLevelParameterfv(targetPacked, level, pname, params);
-        }
+        context->getDispatchTable()->GetTexLevelParameterfv(context, target, level, pname, params);
     }
 }
 
@@ -469,16 +410,12 @@ void GL_APIENTRY GetTexLevelParameteriv(GLenum target, GLint level, GLenum pname
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexLevelParameteriv, target, level, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexLevelParameteriv(context, targetPacked, level, pname, params))
-        {
-            context->getTexLevelParameteriv(targetPacked, level, pname, params);
-        }
+        context->getDispatchTable()->GetTexLevelParameteriv(context, target, level, pname, params);
     }
 }
 
@@ -486,14 +423,12 @@ GLboolean GL_APIENTRY IsProgramPipeline(GLuint pipeline)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u)", pipeline);
+    ANGLE_BINARY_EVENT(IsProgramPipeline, pipeline);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsProgramPipeline(context, pipeline))
-        {
-            return context->isProgramPipeline(pipeline);
-        }
+        return context->getDispatchTable()->IsProgramPipeline(context, pipeline);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsProgramPipeline, GLboolean>();
@@ -503,14 +438,12 @@ void GL_APIENTRY MemoryBarrier(GLbitfield barriers)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLbitfield barriers = 0x%X)", barriers);
+    ANGLE_BINARY_EVENT(MemoryBarrier, barriers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateMemoryBarrier(context, barriers))
-        {
-            context->memoryBarrier(barriers);
-        }
+        context->getDispatchTable()->MemoryBarrier(context, barriers);
     }
 }
 
@@ -518,14 +451,12 @@ void GL_APIENTRY MemoryBarrierByRegion(GLbitfield barriers)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLbitfield barriers = 0x%X)", barriers);
+    ANGLE_BINARY_EVENT(MemoryBarrierByRegion, barriers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateMemoryBarrierByRegion(context, barriers))
-        {
-            context->memoryBarrierByRegion(barriers);
-        }
+        context->getDispatchTable()->MemoryBarrierByRegion(context, barriers);
     }
 }
 
@@ -533,14 +464,12 @@ void GL_APIENTRY ProgramUniform1f(GLuint program, GLint location, GLfloat v0)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLfloat v0 = %f)", program, location, v0);
+    ANGLE_BINARY_EVENT(ProgramUniform1f, program, location, v0);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateProgramUniform1f(context, program, location, v0))
-        {
-            context->programUniform1f(program, location, v0);
-        }
+        context->getDispatchTable()->ProgramUniform1f(context, program, location, v0);
     }
 }
 
@@ -554,15 +483,12 @@ void GL_APIENTRY ProgramUniform1fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform1fv, program, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform1fv(context, program, location, count, value))
-        {
-            context->programUniform1fv(program, location, count, value);
-        }
+        context->getDispatchTable()->ProgramUniform1fv(context, program, location, count, value);
     }
 }
 
@@ -570,14 +496,12 @@ void GL_APIENTRY ProgramUniform1i(GLuint program, GLint location, GLint v0)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint v0 = %d)", program, location, v0);
+    ANGLE_BINARY_EVENT(ProgramUniform1i, program, location, v0);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateProgramUniform1i(context, program, location, v0))
-        {
-            context->programUniform1i(program, location, v0);
-        }
+        context->getDispatchTable()->ProgramUniform1i(context, program, location, v0);
     }
 }
 
@@ -591,15 +515,12 @@ void GL_APIENTRY ProgramUniform1iv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform1iv, program, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform1iv(context, program, location, count, value))
-        {
-            context->programUniform1iv(program, location, count, value);
-        }
+        context->getDispatchTable()->ProgramUniform1iv(context, program, location, count, value);
     }
 }
 
@@ -607,14 +528,12 @@ void GL_APIENTRY ProgramUniform1ui(GLuint program, GLint location, GLuint v0)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLuint v0 = %u)", program, location, v0);
+    ANGLE_BINARY_EVENT(ProgramUniform1ui, program, location, v0);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateProgramUniform1ui(context, program, location, v0))
-        {
-            context->programUniform1ui(program, location, v0);
-        }
+        context->getDispatchTable()->ProgramUniform1ui(context, program, location, v0);
     }
 }
 
@@ -628,15 +547,12 @@ void GL_APIENTRY ProgramUniform1uiv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform1uiv, program, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform1uiv(context, program, location, count, value))
-        {
-            context->programUniform1uiv(program, location, count, value);
-        }
+        context->getDispatchTable()->ProgramUniform1uiv(context, program, location, count, value);
     }
 }
 
@@ -645,15 +561,12 @@ void GL_APIENTRY ProgramUniform2f(GLuint program, GLint location, GLfloat v0, GL
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f)", program,
           location, v0, v1);
+    ANGLE_BINARY_EVENT(ProgramUniform2f, program, location, v0, v1);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform2f(context, program, location, v0, v1))
-        {
-            context->programUniform2f(program, location, v0, v1);
-        }
+        context->getDispatchTable()->ProgramUniform2f(context, program, location, v0, v1);
     }
 }
 
@@ -667,15 +580,12 @@ void GL_APIENTRY ProgramUniform2fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform2fv, program, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform2fv(context, program, location, count, value))
-        {
-            context->programUniform2fv(program, location, count, value);
-        }
+        context->getDispatchTable()->ProgramUniform2fv(context, program, location, count, value);
     }
 }
 
@@ -684,15 +594,12 @@ void GL_APIENTRY ProgramUniform2i(GLuint program, GLint location, GLint v0, GLin
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint v1 = %d)", program,
           location, v0, v1);
+    ANGLE_BINARY_EVENT(ProgramUniform2i, program, location, v0, v1);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform2i(context, program, location, v0, v1))
-        {
-            context->programUniform2i(program, location, v0, v1);
-        }
+        context->getDispatchTable()->ProgramUniform2i(context, program, location, v0, v1);
     }
 }
 
@@ -706,15 +613,12 @@ void GL_APIENTRY ProgramUniform2iv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform2iv, program, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform2iv(context, program, location, count, value))
-        {
-            context->programUniform2iv(program, location, count, value);
-        }
+        context->getDispatchTable()->ProgramUniform2iv(context, program, location, count, value);
     }
 }
 
@@ -723,15 +627,12 @@ void GL_APIENTRY ProgramUniform2ui(GLuint program, GLint location, GLuint v0, GL
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLuint v0 = %u, GLuint v1 = %u)", program,
           location, v0, v1);
+    ANGLE_BINARY_EVENT(ProgramUniform2ui, program, location, v0, v1);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform2ui(context, program, location, v0, v1))
-        {
-            context->programUniform2ui(program, location, v0, v1);
-        }
+        context->getDispatchTable()->ProgramUniform2ui(context, program, location, v0, v1);
     }
 }
 
@@ -745,15 +646,12 @@ void GL_APIENTRY ProgramUniform2uiv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform2uiv, program, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform2uiv(context, program, location, count, value))
-        {
-            context->programUniform2uiv(program, location, count, value);
-        }
+        context->getDispatchTable()->ProgramUniform2uiv(context, program, location, count, value);
     }
 }
 
@@ -765,15 +663,12 @@ ProgramUniform3f(GLuint program, GLint location, GLfloat v0, GLfloat v1, GLfloat
         "(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = "
         "%f)",
         program, location, v0, v1, v2);
+    ANGLE_BINARY_EVENT(ProgramUniform3f, program, location, v0, v1, v2);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform3f(context, program, location, v0, v1, v2))
-        {
-            context->programUniform3f(program, location, v0, v1, v2);
-        }
+        context->getDispatchTable()->ProgramUniform3f(context, program, location, v0, v1, v2);
     }
 }
 
@@ -787,15 +682,12 @@ void GL_APIENTRY ProgramUniform3fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform3fv, program, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform3fv(context, program, location, count, value))
-        {
-            context->programUniform3fv(program, location, count, value);
-        }
+        context->getDispatchTable()->ProgramUniform3fv(context, program, location, count, value);
     }
 }
 
@@ -804,15 +696,12 @@ void GL_APIENTRY ProgramUniform3i(GLuint program, GLint location, GLint v0, GLin
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d)",
           program, location, v0, v1, v2);
+    ANGLE_BINARY_EVENT(ProgramUniform3i, program, location, v0, v1, v2);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform3i(context, program, location, v0, v1, v2))
-        {
-            context->programUniform3i(program, location, v0, v1, v2);
-        }
+        context->getDispatchTable()->ProgramUniform3i(context, program, location, v0, v1, v2);
     }
 }
 
@@ -826,15 +715,12 @@ void GL_APIENTRY ProgramUniform3iv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform3iv, program, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform3iv(context, program, location, count, value))
-        {
-            context->programUniform3iv(program, location, count, value);
-        }
+        context->getDispatchTable()->ProgramUniform3iv(context, program, location, count, value);
     }
 }
 
@@ -845,15 +731,12 @@ void GL_APIENTRY ProgramUniform3ui(GLuint program, GLint location, GLuint v0, GL
         "(GLuint program = %u, GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = "
         "%u)",
         program, location, v0, v1, v2);
+    ANGLE_BINARY_EVENT(ProgramUniform3ui, program, location, v0, v1, v2);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform3ui(context, program, location, v0, v1, v2))
-        {
-            context->programUniform3ui(program, location, v0, v1, v2);
-        }
+        context->getDispatchTable()->ProgramUniform3ui(context, program, location, v0, v1, v2);
     }
 }
 
@@ -867,15 +750,12 @@ void GL_APIENTRY ProgramUniform3uiv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform3uiv, program, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform3uiv(context, program, location, count, value))
-        {
-            context->programUniform3uiv(program, location, count, value);
-        }
+        context->getDispatchTable()->ProgramUniform3uiv(context, program, location, count, value);
     }
 }
 
@@ -887,15 +767,12 @@ ProgramUniform4f(GLuint program, GLint location, GLfloat v0, GLfloat v1, GLfloat
         "(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = "
         "%f, GLfloat v3 = %f)",
         program, location, v0, v1, v2, v3);
+    ANGLE_BINARY_EVENT(ProgramUniform4f, program, location, v0, v1, v2, v3);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform4f(context, program, location, v0, v1, v2, v3))
-        {
-            context->programUniform4f(program, location, v0, v1, v2, v3);
-        }
+        context->getDispatchTable()->ProgramUniform4f(context, program, location, v0, v1, v2, v3);
     }
 }
 
@@ -909,15 +786,12 @@ void GL_APIENTRY ProgramUniform4fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform4fv, program, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform4fv(context, program, location, count, value))
-        {
-            context->programUniform4fv(program, location, count, value);
-        }
+        context->getDispatchTable()->ProgramUniform4fv(context, program, location, count, value);
     }
 }
 
@@ -929,15 +803,12 @@ ProgramUniform4i(GLuint program, GLint location, GLint v0, GLint v1, GLint v2, G
         "(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d, "
         "GLint v3 = %d)",
         program, location, v0, v1, v2, v3);
+    ANGLE_BINARY_EVENT(ProgramUniform4i, program, location, v0, v1, v2, v3);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform4i(context, program, location, v0, v1, v2, v3))
-        {
-            context->programUniform4i(program, location, v0, v1, v2, v3);
-        }
+        context->getDispatchTable()->ProgramUniform4i(context, program, location, v0, v1, v2, v3);
     }
 }
 
@@ -951,15 +822,12 @@ void GL_APIENTRY ProgramUniform4iv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform4iv, program, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform4iv(context, program, location, count, value))
-        {
-            context->programUniform4iv(program, location, count, value);
-        }
+        context->getDispatchTable()->ProgramUniform4iv(context, program, location, count, value);
     }
 }
 
@@ -971,15 +839,12 @@ ProgramUniform4ui(GLuint program, GLint location, GLuint v0, GLuint v1, GLuint v
         "(GLuint program = %u, GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = "
         "%u, GLuint v3 = %u)",
         program, location, v0, v1, v2, v3);
+    ANGLE_BINARY_EVENT(ProgramUniform4ui, program, location, v0, v1, v2, v3);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform4ui(context, program, location, v0, v1, v2, v3))
-        {
-            context->programUniform4ui(program, location, v0, v1, v2, v3);
-        }
+        context->getDispatchTable()->ProgramUniform4ui(context, program, location, v0, v1, v2, v3);
     }
 }
 
@@ -993,15 +858,12 @@ void GL_APIENTRY ProgramUniform4uiv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform4uiv, program, location, count, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniform4uiv(context, program, location, count, value))
-        {
-            context->programUniform4uiv(program, location, count, value);
-        }
+        context->getDispatchTable()->ProgramUniform4uiv(context, program, location, count, value);
     }
 }
 
@@ -1016,15 +878,13 @@ void GL_APIENTRY ProgramUniformMatrix2fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix2fv, program, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix2fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix2fv(program, location, count, transpose, value);
-        }
+        context->getDispatchTable()->ProgramUniformMatrix2fv(context, program, location, count,
+                                                             transpose, value);
     }
 }
 
@@ -1039,15 +899,13 @@ void GL_APIENTRY ProgramUniformMatrix2x3fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix2x3fv, program, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix2x3fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix2x3fv(program, location, count, transpose, value);
-        }
+        context->getDispatchTable()->ProgramUniformMatrix2x3fv(context, program, location, count,
+                                                               transpose, value);
     }
 }
 
@@ -1062,15 +920,13 @@ void GL_APIENTRY ProgramUniformMatrix2x4fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix2x4fv, program, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix2x4fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix2x4fv(program, location, count, transpose, value);
-        }
+        context->getDispatchTable()->ProgramUniformMatrix2x4fv(context, program, location, count,
+                                                               transpose, value);
     }
 }
 
@@ -1085,15 +941,13 @@ void GL_APIENTRY ProgramUniformMatrix3fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix3fv, program, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix3fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix3fv(program, location, count, transpose, value);
-        }
+        context->getDispatchTable()->ProgramUniformMatrix3fv(context, program, location, count,
+                                                             transpose, value);
     }
 }
 
@@ -1108,15 +962,13 @@ void GL_APIENTRY ProgramUniformMatrix3x2fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix3x2fv, program, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix3x2fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix3x2fv(program, location, count, transpose, value);
-        }
+        context->getDispatchTable()->ProgramUniformMatrix3x2fv(context, program, location, count,
+                                                               transpose, value);
     }
 }
 
@@ -1131,15 +983,13 @@ void GL_APIENTRY ProgramUniformMatrix3x4fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix3x4fv, program, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix3x4fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix3x4fv(program, location, count, transpose, value);
-        }
+        context->getDispatchTable()->ProgramUniformMatrix3x4fv(context, program, location, count,
+                                                               transpose, value);
     }
 }
 
@@ -1154,15 +1004,13 @@ void GL_APIENTRY ProgramUniformMatrix4fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix4fv, program, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix4fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix4fv(program, location, count, transpose, value);
-        }
+        context->getDispatchTable()->ProgramUniformMatrix4fv(context, program, location, count,
+                                                             transpose, value);
     }
 }
 
@@ -1177,15 +1025,13 @@ void GL_APIENTRY ProgramUniformMatrix4x2fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix4x2fv, program, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix4x2fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix4x2fv(program, location, count, transpose, value);
-        }
+        context->getDispatchTable()->ProgramUniformMatrix4x2fv(context, program, location, count,
+                                                               transpose, value);
     }
 }
 
@@ -1200,15 +1046,13 @@ void GL_APIENTRY ProgramUniformMatrix4x3fv(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix4x3fv, program, location, count, transpose, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix4x3fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix4x3fv(program, location, count, transpose, value);
-        }
+        context->getDispatchTable()->ProgramUniformMatrix4x3fv(context, program, location, count,
+                                                               transpose, value);
     }
 }
 
@@ -1216,14 +1060,12 @@ void GL_APIENTRY SampleMaski(GLuint maskNumber, GLbitfield mask)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint maskNumber = %u, GLbitfield mask = 0x%X)", maskNumber, mask);
+    ANGLE_BINARY_EVENT(SampleMaski, maskNumber, mask);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateSampleMaski(context, maskNumber, mask))
-        {
-            context->sampleMaski(maskNumber, mask);
-        }
+        context->getDispatchTable()->SampleMaski(context, maskNumber, mask);
     }
 }
 
@@ -1239,18 +1081,14 @@ void GL_APIENTRY TexStorage2DMultisample(GLenum target,
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d, GLboolean fixedsamplelocations = %u)",
         target, samples, internalformat, width, height, fixedsamplelocations);
+    ANGLE_BINARY_EVENT(TexStorage2DMultisample, target, samples, internalformat, width, height,
+                       fixedsamplelocations);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorage2DMultisample(context, targetPacked, samples, internalformat, width,
-                                            height, fixedsamplelocations))
-        {
-            context->texStorage2DMultisample(targetPacked, samples, internalformat, width, height,
-                                             fixedsamplelocations);
-        }
+        context->getDispatchTable()->TexStorage2DMultisample(
+            context, target, samples, internalformat, width, height, fixedsamplelocations);
     }
 }
 
@@ -1259,15 +1097,12 @@ void GL_APIENTRY UseProgramStages(GLuint pipeline, GLbitfield stages, GLuint pro
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLbitfield stages = 0x%X, GLuint program = %u)", pipeline, stages,
           program);
+    ANGLE_BINARY_EVENT(UseProgramStages, pipeline, stages, program);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateUseProgramStages(context, pipeline, stages, program))
-        {
-            context->useProgramStages(pipeline, stages, program);
-        }
+        context->getDispatchTable()->UseProgramStages(context, pipeline, stages, program);
     }
 }
 
@@ -1275,14 +1110,12 @@ void GL_APIENTRY ValidateProgramPipeline(GLuint pipeline)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u)", pipeline);
+    ANGLE_BINARY_EVENT(ValidateProgramPipeline, pipeline);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateValidateProgramPipeline(context, pipeline))
-        {
-            context->validateProgramPipeline(pipeline);
-        }
+        context->getDispatchTable()->ValidateProgramPipeline(context, pipeline);
     }
 }
 
@@ -1290,15 +1123,12 @@ void GL_APIENTRY VertexAttribBinding(GLuint attribindex, GLuint bindingindex)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint attribindex = %u, GLuint bindingindex = %u)", attribindex, bindingindex);
+    ANGLE_BINARY_EVENT(VertexAttribBinding, attribindex, bindingindex);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateVertexAttribBinding(context, attribindex, bindingindex))
-        {
-            context->vertexAttribBinding(attribindex, bindingindex);
-        }
+        context->getDispatchTable()->VertexAttribBinding(context, attribindex, bindingindex);
     }
 }
 
@@ -1313,17 +1143,13 @@ void GL_APIENTRY VertexAttribFormat(GLuint attribindex,
         "(GLuint attribindex = %u, GLint size = %d, GLenum type = 0x%X, GLboolean normalized = %u, "
         "GLuint relativeoffset = %u)",
         attribindex, size, type, normalized, relativeoffset);
+    ANGLE_BINARY_EVENT(VertexAttribFormat, attribindex, size, type, normalized, relativeoffset);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateVertexAttribFormat(context, attribindex, size, typePacked, normalized,
-                                       relativeoffset))
-        {
-            context->vertexAttribFormat(attribindex, size, typePacked, normalized, relativeoffset);
-        }
+        context->getDispatchTable()->VertexAttribFormat(context, attribindex, size, type,
+                                                        normalized, relativeoffset);
     }
 }
 
@@ -1337,16 +1163,13 @@ void GL_APIENTRY VertexAttribIFormat(GLuint attribindex,
         "(GLuint attribindex = %u, GLint size = %d, GLenum type = 0x%X, GLuint relativeoffset = "
         "%u)",
         attribindex, size, type, relativeoffset);
+    ANGLE_BINARY_EVENT(VertexAttribIFormat, attribindex, size, type, relativeoffset);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateVertexAttribIFormat(context, attribindex, size, typePacked, relativeoffset))
-        {
-            context->vertexAttribIFormat(attribindex, size, typePacked, relativeoffset);
-        }
+        context->getDispatchTable()->VertexAttribIFormat(context, attribindex, size, type,
+                                                         relativeoffset);
     }
 }
 
@@ -1354,15 +1177,12 @@ void GL_APIENTRY VertexBindingDivisor(GLuint bindingindex, GLuint divisor)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint bindingindex = %u, GLuint divisor = %u)", bindingindex, divisor);
+    ANGLE_BINARY_EVENT(VertexBindingDivisor, bindingindex, divisor);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateVertexBindingDivisor(context, bindingindex, divisor))
-        {
-            context->vertexBindingDivisor(bindingindex, divisor);
-        }
+        context->getDispatchTable()->VertexBindingDivisor(context, bindingindex, divisor);
     }
 }
 }  // namespace gl
@@ -11,16 +11,11 @@
 #include "libGLESv2/entry_points_gles_ext_autogen.h"
 
 #include "libANGLE/Context.h"
-#include "libANGLE/Context.inl.h"
-#include "libANGLE/validationESEXT.h"
+#include "libGLESv2/entry_points_binary_event.h"
+#include "libGLESv2/entry_points_dispatch_autogen.h"
 #include "libGLESv2/entry_points_utils.h"
 #include "libGLESv2/global_state.h"
 
-#include "libANGLE/validationES1.h"
-#include "libANGLE/validationES2.h"
-#include "libANGLE/validationES3.h"
-#include "libANGLE/validationES31.h"
-
 namespace gl
 {
 
@@ -44,20 +39,16 @@ void GL_APIENTRY CopyTexture3DANGLE(GLuint sourceId,
         "= %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, internalFormat, destType, unpackFlipY,
         unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_EVENT(CopyTexture3DANGLE, sourceId, sourceLevel, destTarget, destId, destLevel,
+                       internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                       unpackUnmultiplyAlpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
-        if (context->skipValidation() ||
-            ValidateCopyTexture3DANGLE(context, sourceId, sourceLevel, destTargetPacked, destId,
-                                       destLevel, internalFormat, destType, unpackFlipY,
-                                       unpackPremultiplyAlpha, unpackUnmultiplyAlpha))
-        {
-            context->copyTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
-                                   internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
-                                   unpackUnmultiplyAlpha);
-        }
+        context->getDispatchTable()->CopyTexture3DANGLE(
+            context, sourceId, sourceLevel, destTarget, destId, destLevel, internalFormat, destType,
+            unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
     }
 }
 
@@ -88,21 +79,17 @@ void GL_APIENTRY CopySubTexture3DANGLE(GLuint sourceId,
         "unpackUnmultiplyAlpha = %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, xoffset, yoffset, zoffset, x, y, z,
         width, height, depth, unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_EVENT(CopySubTexture3DANGLE, sourceId, sourceLevel, destTarget, destId, destLevel,
+                       xoffset, yoffset, zoffset, x, y, z, width, height, depth, unpackFlipY,
+                       unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
-        if (context->skipValidation() ||
-            ValidateCopySubTexture3DANGLE(context, sourceId, sourceLevel, destTargetPacked, destId,
-                                          destLevel, xoffset, yoffset, zoffset, x, y, z, width,
-                                          height, depth, unpackFlipY, unpackPremultiplyAlpha,
-                                          unpackUnmultiplyAlpha))
-        {
-            context->copySubTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
-                                      xoffset, yoffset, zoffset, x, y, z, width, height, depth,
-                                      unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
-        }
+        context->getDispatchTable()->CopySubTexture3DANGLE(
+            context, sourceId, sourceLevel, destTarget, destId, destLevel, xoffset, yoffset,
+            zoffset, x, y, z, width, height, depth, unpackFlipY, unpackPremultiplyAlpha,
+            unpackUnmultiplyAlpha);
     }
 }
 
@@ -124,17 +111,14 @@ void GL_APIENTRY BlitFramebufferANGLE(GLint srcX0,
         "%d, GLint dstY0 = %d, GLint dstX1 = %d, GLint dstY1 = %d, GLbitfield mask = 0x%X, GLenum "
         "filter = 0x%X)",
         srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask, filter);
+    ANGLE_BINARY_EVENT(BlitFramebufferANGLE, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1,
+                       mask, filter);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateBlitFramebufferANGLE(context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
-                                         dstY1, mask, filter))
-        {
-            context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask,
-                                     filter);
-        }
+        context->getDispatchTable()->BlitFramebufferANGLE(context, srcX0, srcY0, srcX1, srcY1,
+                                                          dstX0, dstY0, dstX1, dstY1, mask, filter);
     }
 }
 
@@ -150,16 +134,14 @@ void GL_APIENTRY RenderbufferStorageMultisampleANGLE(GLenum target,
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d)",
         target, samples, internalformat, width, height);
+    ANGLE_BINARY_EVENT(RenderbufferStorageMultisampleANGLE, target, samples, internalformat, width,
+                       height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateRenderbufferStorageMultisampleANGLE(context, target, samples, internalformat,
-                                                        width, height))
-        {
-            context->renderbufferStorageMultisample(target, samples, internalformat, width, height);
-        }
+        context->getDispatchTable()->RenderbufferStorageMultisampleANGLE(
+            context, target, samples, internalformat, width, height);
     }
 }
 
@@ -172,16 +154,13 @@ void GL_APIENTRY DrawArraysInstancedANGLE(GLenum mode,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d, GLsizei primcount = %d)",
           mode, first, count, primcount);
+    ANGLE_BINARY_EVENT(DrawArraysInstancedANGLE, mode, first, count, primcount);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() ||
-            ValidateDrawArraysInstancedANGLE(context, modePacked, first, count, primcount))
-        {
-            context->drawArraysInstanced(modePacked, first, count, primcount);
-        }
+        context->getDispatchTable()->DrawArraysInstancedANGLE(context, mode, first, count,
+                                                              primcount);
     }
 }
 
@@ -196,18 +175,13 @@ void GL_APIENTRY DrawElementsInstancedANGLE(GLenum mode,
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ", GLsizei primcount = %d)",
         mode, count, type, (uintptr_t)indices, primcount);
+    ANGLE_BINARY_EVENT(DrawElementsInstancedANGLE, mode, count, type, indices, primcount);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateDrawElementsInstancedANGLE(context, modePacked, count, typePacked, indices,
-                                               primcount))
-        {
-            context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
-        }
+        context->getDispatchTable()->DrawElementsInstancedANGLE(context, mode, count, type, indices,
+                                                                primcount);
     }
 }
 
@@ -215,14 +189,12 @@ void GL_APIENTRY VertexAttribDivisorANGLE(GLuint index, GLuint divisor)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint divisor = %u)", index, divisor);
+    ANGLE_BINARY_EVENT(VertexAttribDivisorANGLE, index, divisor);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttribDivisorANGLE(context, index, divisor))
-        {
-            context->vertexAttribDivisor(index, divisor);
-        }
+        context->getDispatchTable()->VertexAttribDivisorANGLE(context, index, divisor);
     }
 }
 
@@ -236,16 +208,12 @@ void GL_APIENTRY MultiDrawArraysANGLE(GLenum mode,
     EVENT("(GLenum mode = 0x%X, const GLint *firsts = 0x%016" PRIxPTR
           ", const GLsizei *counts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
           mode, (uintptr_t)firsts, (uintptr_t)counts, drawcount);
+    ANGLE_BINARY_EVENT(MultiDrawArraysANGLE, mode, firsts, counts, drawcount);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() ||
-            ValidateMultiDrawArraysANGLE(context, modePacked, firsts, counts, drawcount))
-        {
-            context->multiDrawArrays(modePacked, firsts, counts, drawcount);
-        }
+        context->getDispatchTable()->MultiDrawArraysANGLE(context, mode, firsts, counts, drawcount);
     }
 }
 
@@ -260,18 +228,14 @@ void GL_APIENTRY MultiDrawArraysInstancedANGLE(GLenum mode,
           ", const GLsizei *counts = 0x%016" PRIxPTR
           ", const GLsizei *instanceCounts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
           mode, (uintptr_t)firsts, (uintptr_t)counts, (uintptr_t)instanceCounts, drawcount);
+    ANGLE_BINARY_EVENT(MultiDrawArraysInstancedANGLE, mode, firsts, counts, instanceCounts,
+                       drawcount);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() ||
-            ValidateMultiDrawArraysInstancedANGLE(context, modePacked, firsts, counts,
-                                                  instanceCounts, drawcount))
-        {
-            context->multiDrawArraysInstanced(modePacked, firsts, counts, instanceCounts,
-                                              drawcount);
-        }
+        context->getDispatchTable()->MultiDrawArraysInstancedANGLE(context, mode, firsts, counts,
+                                                                   instanceCounts, drawcount);
     }
 }
 
@@ -286,18 +250,13 @@ void GL_APIENTRY MultiDrawElementsANGLE(GLenum mode,
           ", GLenum type = 0x%X, const GLvoid *const*indices = 0x%016" PRIxPTR
           ", GLsizei drawcount = %d)",
           mode, (uintptr_t)counts, type, (uintptr_t)indices, drawcount);
+    ANGLE_BINARY_EVENT(MultiDrawElementsANGLE, mode, counts, type, indices, drawcount);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateMultiDrawElementsANGLE(context, modePacked, counts, typePacked, indices,
-                                           drawcount))
-        {
-            context->multiDrawElements(modePacked, counts, typePacked, indices, drawcount);
-        }
+        context->getDispatchTable()->MultiDrawElementsANGLE(context, mode, counts, type, indices,
+                                                            drawcount);
     }
 }
 
@@ -313,19 +272,14 @@ void GL_APIENTRY MultiDrawElementsInstancedANGLE(GLenum mode,
           ", GLenum type = 0x%X, const GLvoid *const*indices = 0x%016" PRIxPTR
           ", const GLsizei*instanceCounts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
           mode, (uintptr_t)counts, type, (uintptr_t)indices, (uintptr_t)instanceCounts, drawcount);
+    ANGLE_BINARY_EVENT(MultiDrawElementsInstancedANGLE, mode, counts, type, indices, instanceCounts,
+                       drawcount);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateMultiDrawElementsInstancedANGLE(context, modePacked, counts, typePacked,
-                                                    indices, instanceCounts, drawcount))
-        {
-            context->multiDrawElementsInstanced(modePacked, counts, typePacked, indices,
-                                                instanceCounts, drawcount);
-        }
+        context->getDispatchTable()->MultiDrawElementsInstancedANGLE(
+            context, mode, counts, type, indices, instanceCounts, drawcount);
     }
 }
 
@@ -334,15 +288,12 @@ void GL_APIENTRY ProvokingVertexANGLE(GLenum mode)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_EVENT(ProvokingVertexANGLE, mode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        ProvokingVertex modePacked = FromGLenum<ProvokingVertex>(mode);
-        if (context->skipValidation() || ValidateProvokingVertexANGLE(context, modePacked))
-        {
-            context->provokingVertex(modePacked);
-        }
+        context->getDispatchTable()->ProvokingVertexANGLE(context, mode);
     }
 }
 
@@ -351,14 +302,12 @@ void GL_APIENTRY RequestExtensionANGLE(const GLchar *name)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLchar * name = 0x%016" PRIxPTR ")", (uintptr_t)name);
+    ANGLE_BINARY_EVENT(RequestExtensionANGLE, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateRequestExtensionANGLE(context, name))
-        {
-            context->requestExtension(name);
-        }
+        context->getDispatchTable()->RequestExtensionANGLE(context, name);
     }
 }
 
@@ -372,15 +321,13 @@ void GL_APIENTRY GetBooleanvRobustANGLE(GLenum pname,
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLboolean * params = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBooleanvRobustANGLE, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetBooleanvRobustANGLE(context, pname, bufSize, length, params))
-        {
-            context->getBooleanvRobust(pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetBooleanvRobustANGLE(context, pname, bufSize, length,
+                                                            params);
     }
 }
 
@@ -395,16 +342,13 @@ void GL_APIENTRY GetBufferParameterivRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferParameterivRobustANGLE, target, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateGetBufferParameterivRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getBufferParameterivRobust(targetPacked, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetBufferParameterivRobustANGLE(context, target, pname,
+                                                                     bufSize, length, params);
     }
 }
 
@@ -417,15 +361,12 @@ void GL_APIENTRY GetFloatvRobustANGLE(GLenum pname,
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLfloat * params = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFloatvRobustANGLE, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetFloatvRobustANGLE(context, pname, bufSize, length, params))
-        {
-            context->getFloatvRobust(pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetFloatvRobustANGLE(context, pname, bufSize, length, params);
     }
 }
 
@@ -441,17 +382,14 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = "
         "%d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, attachment, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFramebufferAttachmentParameterivRobustANGLE, target, attachment, pname,
+                       bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetFramebufferAttachmentParameterivRobustANGLE(context, target, attachment,
-                                                                   pname, bufSize, length, params))
-        {
-            context->getFramebufferAttachmentParameterivRobust(target, attachment, pname, bufSize,
-                                                               length, params);
-        }
+        context->getDispatchTable()->GetFramebufferAttachmentParameterivRobustANGLE(
+            context, target, attachment, pname, bufSize, length, params);
     }
 }
 
@@ -461,15 +399,12 @@ void GL_APIENTRY GetIntegervRobustANGLE(GLenum pname, GLsizei bufSize, GLsizei *
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLint * data = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetIntegervRobustANGLE, pname, bufSize, length, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetIntegervRobustANGLE(context, pname, bufSize, length, data))
-        {
-            context->getIntegervRobust(pname, bufSize, length, data);
-        }
+        context->getDispatchTable()->GetIntegervRobustANGLE(context, pname, bufSize, length, data);
     }
 }
 
@@ -484,15 +419,13 @@ void GL_APIENTRY GetProgramivRobustANGLE(GLuint program,
         "(GLuint program = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetProgramivRobustANGLE, program, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramivRobustANGLE(context, program, pname, bufSize, length, params))
-        {
-            context->getProgramivRobust(program, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetProgramivRobustANGLE(context, program, pname, bufSize,
+                                                             length, params);
     }
 }
 
@@ -507,15 +440,14 @@ void GL_APIENTRY GetRenderbufferParameterivRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetRenderbufferParameterivRobustANGLE, target, pname, bufSize, length,
+                       params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetRenderbufferParameterivRobustANGLE(
-                                             context, target, pname, bufSize, length, params))
-        {
-            context->getRenderbufferParameterivRobust(target, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetRenderbufferParameterivRobustANGLE(context, target, pname,
+                                                                           bufSize, length, params);
     }
 }
 
@@ -527,15 +459,13 @@ GetShaderivRobustANGLE(GLuint shader, GLenum pname, GLsizei bufSize, GLsizei *le
         "(GLuint shader = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         shader, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetShaderivRobustANGLE, shader, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetShaderivRobustANGLE(context, shader, pname, bufSize, length, params))
-        {
-            context->getShaderivRobust(shader, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetShaderivRobustANGLE(context, shader, pname, bufSize, length,
+                                                            params);
     }
 }
 
@@ -550,16 +480,13 @@ void GL_APIENTRY GetTexParameterfvRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterfvRobustANGLE, target, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateGetTexParameterfvRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getTexParameterfvRobust(targetPacked, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetTexParameterfvRobustANGLE(context, target, pname, bufSize,
+                                                                  length, params);
     }
 }
 
@@ -574,16 +501,13 @@ void GL_APIENTRY GetTexParameterivRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterivRobustANGLE, target, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateGetTexParameterivRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getTexParameterivRobust(targetPacked, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetTexParameterivRobustANGLE(context, target, pname, bufSize,
+                                                                  length, params);
     }
 }
 
@@ -598,15 +522,13 @@ void GL_APIENTRY GetUniformfvRobustANGLE(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetUniformfvRobustANGLE, program, location, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetUniformfvRobustANGLE(context, program, location, bufSize, length, params))
-        {
-            context->getUniformfvRobust(program, location, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetUniformfvRobustANGLE(context, program, location, bufSize,
+                                                             length, params);
     }
 }
 
@@ -621,15 +543,13 @@ void GL_APIENTRY GetUniformivRobustANGLE(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetUniformivRobustANGLE, program, location, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetUniformivRobustANGLE(context, program, location, bufSize, length, params))
-        {
-            context->getUniformivRobust(program, location, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetUniformivRobustANGLE(context, program, location, bufSize,
+                                                             length, params);
     }
 }
 
@@ -644,15 +564,13 @@ void GL_APIENTRY GetVertexAttribfvRobustANGLE(GLuint index,
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribfvRobustANGLE, index, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetVertexAttribfvRobustANGLE(context, index, pname, bufSize, length, params))
-        {
-            context->getVertexAttribfvRobust(index, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetVertexAttribfvRobustANGLE(context, index, pname, bufSize,
+                                                                  length, params);
     }
 }
 
@@ -667,15 +585,13 @@ void GL_APIENTRY GetVertexAttribivRobustANGLE(GLuint index,
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribivRobustANGLE, index, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetVertexAttribivRobustANGLE(context, index, pname, bufSize, length, params))
-        {
-            context->getVertexAttribivRobust(index, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetVertexAttribivRobustANGLE(context, index, pname, bufSize,
+                                                                  length, params);
     }
 }
 
@@ -690,15 +606,13 @@ void GL_APIENTRY GetVertexAttribPointervRobustANGLE(GLuint index,
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", void ** pointer = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(GetVertexAttribPointervRobustANGLE, index, pname, bufSize, length, pointer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetVertexAttribPointervRobustANGLE(
-                                             context, index, pname, bufSize, length, pointer))
-        {
-            context->getVertexAttribPointervRobust(index, pname, bufSize, length, pointer);
-        }
+        context->getDispatchTable()->GetVertexAttribPointervRobustANGLE(context, index, pname,
+                                                                        bufSize, length, pointer);
     }
 }
 
@@ -722,17 +636,14 @@ void GL_APIENTRY ReadPixelsRobustANGLE(GLint x,
         ", void * pixels = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, bufSize, (uintptr_t)length, (uintptr_t)columns,
         (uintptr_t)rows, (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(ReadPixelsRobustANGLE, x, y, width, height, format, type, bufSize, length,
+                       columns, rows, pixels);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateReadPixelsRobustANGLE(context, x, y, width, height, format, type, bufSize,
-                                          length, columns, rows, pixels))
-        {
-            context->readPixelsRobust(x, y, width, height, format, type, bufSize, length, columns,
-                                      rows, pixels);
-        }
+        context->getDispatchTable()->ReadPixelsRobustANGLE(
+            context, x, y, width, height, format, type, bufSize, length, columns, rows, pixels);
     }
 }
 
@@ -754,18 +665,15 @@ void GL_APIENTRY TexImage2DRobustANGLE(GLenum target,
         "bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, format, type, bufSize,
         (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexImage2DRobustANGLE, target, level, internalformat, width, height, border,
+                       format, type, bufSize, pixels);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexImage2DRobustANGLE(context, targetPacked, level, internalformat, width,
-                                          height, border, format, type, bufSize, pixels))
-        {
-            context->texImage2DRobust(targetPacked, level, internalformat, width, height, border,
-                                      format, type, bufSize, pixels);
-        }
+        context->getDispatchTable()->TexImage2DRobustANGLE(context, target, level, internalformat,
+                                                           width, height, border, format, type,
+                                                           bufSize, pixels);
     }
 }
 
@@ -779,16 +687,13 @@ void GL_APIENTRY TexParameterfvRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLfloat * params "
         "= 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterfvRobustANGLE, target, pname, bufSize, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterfvRobustANGLE(context, targetPacked, pname, bufSize, params))
-        {
-            context->texParameterfvRobust(targetPacked, pname, bufSize, params);
-        }
+        context->getDispatchTable()->TexParameterfvRobustANGLE(context, target, pname, bufSize,
+                                                               params);
     }
 }
 
@@ -802,16 +707,13 @@ void GL_APIENTRY TexParameterivRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLint * params = "
         "0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterivRobustANGLE, target, pname, bufSize, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterivRobustANGLE(context, targetPacked, pname, bufSize, params))
-        {
-            context->texParameterivRobust(targetPacked, pname, bufSize, params);
-        }
+        context->getDispatchTable()->TexParameterivRobustANGLE(context, target, pname, bufSize,
+                                                               params);
     }
 }
 
@@ -832,18 +734,14 @@ void GL_APIENTRY TexSubImage2DRobustANGLE(GLenum target,
         "width = %d, GLsizei height = %d, GLenum format = 0x%X, GLenum type = 0x%X, GLsizei "
         "bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, type, bufSize, (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexSubImage2DRobustANGLE, target, level, xoffset, yoffset, width, height,
+                       format, type, bufSize, pixels);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexSubImage2DRobustANGLE(context, targetPacked, level, xoffset, yoffset, width,
-                                             height, format, type, bufSize, pixels))
-        {
-            context->texSubImage2DRobust(targetPacked, level, xoffset, yoffset, width, height,
-                                         format, type, bufSize, pixels);
-        }
+        context->getDispatchTable()->TexSubImage2DRobustANGLE(
+            context, target, level, xoffset, yoffset, width, height, format, type, bufSize, pixels);
     }
 }
 
@@ -866,18 +764,15 @@ void GL_APIENTRY TexImage3DRobustANGLE(GLenum target,
         "type = 0x%X, GLsizei bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, format, type, bufSize,
         (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexImage3DRobustANGLE, target, level, internalformat, width, height, depth,
+                       border, format, type, bufSize, pixels);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexImage3DRobustANGLE(context, targetPacked, level, internalformat, width,
-                                          height, depth, border, format, type, bufSize, pixels))
-        {
-            context->texImage3DRobust(targetPacked, level, internalformat, width, height, depth,
-                                      border, format, type, bufSize, pixels);
-        }
+        context->getDispatchTable()->TexImage3DRobustANGLE(context, target, level, internalformat,
+                                                           width, height, depth, border, format,
+                                                           type, bufSize, pixels);
     }
 }
 
@@ -902,19 +797,15 @@ void GL_APIENTRY TexSubImage3DRobustANGLE(GLenum target,
         ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, type, bufSize,
         (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexSubImage3DRobustANGLE, target, level, xoffset, yoffset, zoffset, width,
+                       height, depth, format, type, bufSize, pixels);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexSubImage3DRobustANGLE(context, targetPacked, level, xoffset, yoffset,
-                                             zoffset, width, height, depth, format, type, bufSize,
-                                             pixels))
-        {
-            context->texSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset, width,
-                                         height, depth, format, type, bufSize, pixels);
-        }
+        context->getDispatchTable()->TexSubImage3DRobustANGLE(context, target, level, xoffset,
+                                                              yoffset, zoffset, width, height,
+                                                              depth, format, type, bufSize, pixels);
     }
 }
 
@@ -934,18 +825,15 @@ void GL_APIENTRY CompressedTexImage2DRobustANGLE(GLenum target,
         "%d, GLsizei height = %d, GLint border = %d, GLsizei imageSize = %d, GLsizei dataSize = "
         "%d, const GLvoid * data = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, imageSize, dataSize, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexImage2DRobustANGLE, target, level, internalformat, width,
+                       height, border, imageSize, dataSize, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() || ValidateCompressedTexImage2DRobustANGLE(
-                                             context, targetPacked, level, internalformat, width,
-                                             height, border, imageSize, dataSize, data))
-        {
-            context->compressedTexImage2DRobust(targetPacked, level, internalformat, width, height,
-                                                border, imageSize, dataSize, data);
-        }
+        context->getDispatchTable()->CompressedTexImage2DRobustANGLE(
+            context, target, level, internalformat, width, height, border, imageSize, dataSize,
+            data);
     }
 }
 
@@ -967,18 +855,15 @@ void GL_APIENTRY CompressedTexSubImage2DRobustANGLE(GLenum target,
         "GLsizei dataSize = %d, const GLvoid * data = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, imageSize, dataSize,
         (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexSubImage2DRobustANGLE, target, level, xoffset, yoffset, width,
+                       height, format, imageSize, dataSize, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() || ValidateCompressedTexSubImage2DRobustANGLE(
-                                             context, targetPacked, level, xoffset, yoffset, width,
-                                             height, format, imageSize, dataSize, data))
-        {
-            context->compressedTexSubImage2DRobust(targetPacked, level, xoffset, yoffset, width,
-                                                   height, format, imageSize, dataSize, data);
-        }
+        context->getDispatchTable()->CompressedTexSubImage2DRobustANGLE(
+            context, target, level, xoffset, yoffset, width, height, format, imageSize, dataSize,
+            data);
     }
 }
 
@@ -1000,18 +885,15 @@ void GL_APIENTRY CompressedTexImage3DRobustANGLE(GLenum target,
         "GLsizei dataSize = %d, const GLvoid * data = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, imageSize, dataSize,
         (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexImage3DRobustANGLE, target, level, internalformat, width,
+                       height, depth, border, imageSize, dataSize, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() || ValidateCompressedTexImage3DRobustANGLE(
-                                             context, targetPacked, level, internalformat, width,
-                                             height, depth, border, imageSize, dataSize, data))
-        {
-            context->compressedTexImage3DRobust(targetPacked, level, internalformat, width, height,
-                                                depth, border, imageSize, dataSize, data);
-        }
+        context->getDispatchTable()->CompressedTexImage3DRobustANGLE(
+            context, target, level, internalformat, width, height, depth, border, imageSize,
+            dataSize, data);
     }
 }
 
@@ -1036,20 +918,15 @@ void GL_APIENTRY CompressedTexSubImage3DRobustANGLE(GLenum target,
         "0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, imageSize, dataSize,
         (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexSubImage3DRobustANGLE, target, level, xoffset, yoffset, zoffset,
+                       width, height, depth, format, imageSize, dataSize, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCompressedTexSubImage3DRobustANGLE(context, targetPacked, level, xoffset,
-                                                       yoffset, zoffset, width, height, depth,
-                                                       format, imageSize, dataSize, data))
-        {
-            context->compressedTexSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset,
-                                                   width, height, depth, format, imageSize,
-                                                   dataSize, data);
-        }
+        context->getDispatchTable()->CompressedTexSubImage3DRobustANGLE(
+            context, target, level, xoffset, yoffset, zoffset, width, height, depth, format,
+            imageSize, dataSize, data);
     }
 }
 
@@ -1061,16 +938,13 @@ GetQueryivRobustANGLE(GLenum target, GLenum pname, GLsizei bufSize, GLsizei *len
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryivRobustANGLE, target, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() ||
-            ValidateGetQueryivRobustANGLE(context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getQueryivRobust(targetPacked, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetQueryivRobustANGLE(context, target, pname, bufSize, length,
+                                                           params);
     }
 }
 
@@ -1085,15 +959,13 @@ void GL_APIENTRY GetQueryObjectuivRobustANGLE(GLuint id,
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectuivRobustANGLE, id, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetQueryObjectuivRobustANGLE(context, id, pname, bufSize, length, params))
-        {
-            context->getQueryObjectuivRobust(id, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetQueryObjectuivRobustANGLE(context, id, pname, bufSize,
+                                                                  length, params);
     }
 }
 
@@ -1108,16 +980,13 @@ void GL_APIENTRY GetBufferPointervRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", void ** params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferPointervRobustANGLE, target, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateGetBufferPointervRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getBufferPointervRobust(targetPacked, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetBufferPointervRobustANGLE(context, target, pname, bufSize,
+                                                                  length, params);
     }
 }
 
@@ -1129,15 +998,13 @@ GetIntegeri_vRobustANGLE(GLenum target, GLuint index, GLsizei bufSize, GLsizei *
         "(GLenum target = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * data = 0x%016" PRIxPTR ")",
         target, index, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetIntegeri_vRobustANGLE, target, index, bufSize, length, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetIntegeri_vRobustANGLE(context, target, index, bufSize, length, data))
-        {
-            context->getIntegeri_vRobust(target, index, bufSize, length, data);
-        }
+        context->getDispatchTable()->GetIntegeri_vRobustANGLE(context, target, index, bufSize,
+                                                              length, data);
     }
 }
 
@@ -1153,17 +1020,14 @@ void GL_APIENTRY GetInternalformativRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLenum pname = 0x%X, GLsizei bufSize "
         "= %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, internalformat, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetInternalformativRobustANGLE, target, internalformat, pname, bufSize,
+                       length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetInternalformativRobustANGLE(context, target, internalformat, pname, bufSize,
-                                                   length, params))
-        {
-            context->getInternalformativRobust(target, internalformat, pname, bufSize, length,
-                                               params);
-        }
+        context->getDispatchTable()->GetInternalformativRobustANGLE(context, target, internalformat,
+                                                                    pname, bufSize, length, params);
     }
 }
 
@@ -1178,15 +1042,13 @@ void GL_APIENTRY GetVertexAttribIivRobustANGLE(GLuint index,
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribIivRobustANGLE, index, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetVertexAttribIivRobustANGLE(context, index, pname, bufSize, length, params))
-        {
-            context->getVertexAttribIivRobust(index, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetVertexAttribIivRobustANGLE(context, index, pname, bufSize,
+                                                                   length, params);
     }
 }
 
@@ -1201,15 +1063,13 @@ void GL_APIENTRY GetVertexAttribIuivRobustANGLE(GLuint index,
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribIuivRobustANGLE, index, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetVertexAttribIuivRobustANGLE(context, index, pname, bufSize, length, params))
-        {
-            context->getVertexAttribIuivRobust(index, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetVertexAttribIuivRobustANGLE(context, index, pname, bufSize,
+                                                                    length, params);
     }
 }
 
@@ -1224,15 +1084,13 @@ void GL_APIENTRY GetUniformuivRobustANGLE(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetUniformuivRobustANGLE, program, location, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetUniformuivRobustANGLE(context, program, location, bufSize, length, params))
-        {
-            context->getUniformuivRobust(program, location, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetUniformuivRobustANGLE(context, program, location, bufSize,
+                                                              length, params);
     }
 }
 
@@ -1248,17 +1106,14 @@ void GL_APIENTRY GetActiveUniformBlockivRobustANGLE(GLuint program,
         "(GLuint program = %u, GLuint uniformBlockIndex = %u, GLenum pname = 0x%X, GLsizei bufSize "
         "= %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, uniformBlockIndex, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetActiveUniformBlockivRobustANGLE, program, uniformBlockIndex, pname,
+                       bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetActiveUniformBlockivRobustANGLE(context, program, uniformBlockIndex, pname,
-                                                       bufSize, length, params))
-        {
-            context->getActiveUniformBlockivRobust(program, uniformBlockIndex, pname, bufSize,
-                                                   length, params);
-        }
+        context->getDispatchTable()->GetActiveUniformBlockivRobustANGLE(
+            context, program, uniformBlockIndex, pname, bufSize, length, params);
     }
 }
 
@@ -1271,15 +1126,13 @@ void GL_APIENTRY GetInteger64vRobustANGLE(GLenum pname,
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLint64 * data = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetInteger64vRobustANGLE, pname, bufSize, length, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetInteger64vRobustANGLE(context, pname, bufSize, length, data))
-        {
-            context->getInteger64vRobust(pname, bufSize, length, data);
-        }
+        context->getDispatchTable()->GetInteger64vRobustANGLE(context, pname, bufSize, length,
+                                                              data);
     }
 }
 
@@ -1294,15 +1147,13 @@ void GL_APIENTRY GetInteger64i_vRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint64 * data = 0x%016" PRIxPTR ")",
         target, index, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetInteger64i_vRobustANGLE, target, index, bufSize, length, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetInteger64i_vRobustANGLE(context, target, index, bufSize, length, data))
-        {
-            context->getInteger64i_vRobust(target, index, bufSize, length, data);
-        }
+        context->getDispatchTable()->GetInteger64i_vRobustANGLE(context, target, index, bufSize,
+                                                                length, data);
     }
 }
 
@@ -1317,16 +1168,13 @@ void GL_APIENTRY GetBufferParameteri64vRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint64 * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferParameteri64vRobustANGLE, target, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateGetBufferParameteri64vRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getBufferParameteri64vRobust(targetPacked, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetBufferParameteri64vRobustANGLE(context, target, pname,
+                                                                       bufSize, length, params);
     }
 }
 
@@ -1340,15 +1188,13 @@ void GL_APIENTRY SamplerParameterivRobustANGLE(GLuint sampler,
         "(GLuint sampler = %u, GLuint pname = %u, GLsizei bufSize = %d, const GLint * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterivRobustANGLE, sampler, pname, bufSize, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateSamplerParameterivRobustANGLE(context, sampler, pname, bufSize, param))
-        {
-            context->samplerParameterivRobust(sampler, pname, bufSize, param);
-        }
+        context->getDispatchTable()->SamplerParameterivRobustANGLE(context, sampler, pname, bufSize,
+                                                                   param);
     }
 }
 
@@ -1362,15 +1208,13 @@ void GL_APIENTRY SamplerParameterfvRobustANGLE(GLuint sampler,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLfloat * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterfvRobustANGLE, sampler, pname, bufSize, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateSamplerParameterfvRobustANGLE(context, sampler, pname, bufSize, param))
-        {
-            context->samplerParameterfvRobust(sampler, pname, bufSize, param);
-        }
+        context->getDispatchTable()->SamplerParameterfvRobustANGLE(context, sampler, pname, bufSize,
+                                                                   param);
     }
 }
 
@@ -1385,15 +1229,13 @@ void GL_APIENTRY GetSamplerParameterivRobustANGLE(GLuint sampler,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterivRobustANGLE, sampler, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetSamplerParameterivRobustANGLE(
-                                             context, sampler, pname, bufSize, length, params))
-        {
-            context->getSamplerParameterivRobust(sampler, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetSamplerParameterivRobustANGLE(context, sampler, pname,
+                                                                      bufSize, length, params);
     }
 }
 
@@ -1408,15 +1250,13 @@ void GL_APIENTRY GetSamplerParameterfvRobustANGLE(GLuint sampler,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterfvRobustANGLE, sampler, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetSamplerParameterfvRobustANGLE(
-                                             context, sampler, pname, bufSize, length, params))
-        {
-            context->getSamplerParameterfvRobust(sampler, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetSamplerParameterfvRobustANGLE(context, sampler, pname,
+                                                                      bufSize, length, params);
     }
 }
 
@@ -1431,15 +1271,14 @@ void GL_APIENTRY GetFramebufferParameterivRobustANGLE(GLuint sampler,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFramebufferParameterivRobustANGLE, sampler, pname, bufSize, length,
+                       params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetFramebufferParameterivRobustANGLE(
-                                             context, sampler, pname, bufSize, length, params))
-        {
-            context->getFramebufferParameterivRobust(sampler, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetFramebufferParameterivRobustANGLE(context, sampler, pname,
+                                                                          bufSize, length, params);
     }
 }
 
@@ -1455,17 +1294,14 @@ void GL_APIENTRY GetProgramInterfaceivRobustANGLE(GLuint program,
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLenum pname = 0x%X, GLsizei "
         "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, programInterface, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetProgramInterfaceivRobustANGLE, program, programInterface, pname, bufSize,
+                       length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramInterfaceivRobustANGLE(context, program, programInterface, pname,
-                                                     bufSize, length, params))
-        {
-            context->getProgramInterfaceivRobust(program, programInterface, pname, bufSize, length,
-                                                 params);
-        }
+        context->getDispatchTable()->GetProgramInterfaceivRobustANGLE(
+            context, program, programInterface, pname, bufSize, length, params);
     }
 }
 
@@ -1480,15 +1316,13 @@ void GL_APIENTRY GetBooleani_vRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLboolean * data = 0x%016" PRIxPTR ")",
         target, index, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetBooleani_vRobustANGLE, target, index, bufSize, length, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetBooleani_vRobustANGLE(context, target, index, bufSize, length, data))
-        {
-            context->getBooleani_vRobust(target, index, bufSize, length, data);
-        }
+        context->getDispatchTable()->GetBooleani_vRobustANGLE(context, target, index, bufSize,
+                                                              length, data);
     }
 }
 
@@ -1503,15 +1337,13 @@ void GL_APIENTRY GetMultisamplefvRobustANGLE(GLenum pname,
         "(GLenum pname = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * val = 0x%016" PRIxPTR ")",
         pname, index, bufSize, (uintptr_t)length, (uintptr_t)val);
+    ANGLE_BINARY_EVENT(GetMultisamplefvRobustANGLE, pname, index, bufSize, length, val);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetMultisamplefvRobustANGLE(context, pname, index, bufSize, length, val))
-        {
-            context->getMultisamplefvRobust(pname, index, bufSize, length, val);
-        }
+        context->getDispatchTable()->GetMultisamplefvRobustANGLE(context, pname, index, bufSize,
+                                                                 length, val);
     }
 }
 
@@ -1527,18 +1359,14 @@ void GL_APIENTRY GetTexLevelParameterivRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLsizei bufSize = %d, "
         "GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, level, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexLevelParameterivRobustANGLE, target, level, pname, bufSize, length,
+                       params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexLevelParameterivRobustANGLE(context, targetPacked, level, pname, bufSize,
-                                                      length, params))
-        {
-            context->getTexLevelParameterivRobust(targetPacked, level, pname, bufSize, length,
-                                                  params);
-        }
+        context->getDispatchTable()->GetTexLevelParameterivRobustANGLE(
+            context, target, level, pname, bufSize, length, params);
     }
 }
 
@@ -1554,18 +1382,14 @@ void GL_APIENTRY GetTexLevelParameterfvRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLsizei bufSize = %d, "
         "GLsizei * length = 0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         target, level, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexLevelParameterfvRobustANGLE, target, level, pname, bufSize, length,
+                       params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexLevelParameterfvRobustANGLE(context, targetPacked, level, pname, bufSize,
-                                                      length, params))
-        {
-            context->getTexLevelParameterfvRobust(targetPacked, level, pname, bufSize, length,
-                                                  params);
-        }
+        context->getDispatchTable()->GetTexLevelParameterfvRobustANGLE(
+            context, target, level, pname, bufSize, length, params);
     }
 }
 
@@ -1578,15 +1402,13 @@ void GL_APIENTRY GetPointervRobustANGLERobustANGLE(GLenum pname,
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", void ** params = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetPointervRobustANGLERobustANGLE, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetPointervRobustANGLERobustANGLE(context, pname, bufSize, length, params))
-        {
-            context->getPointervRobustANGLERobust(pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetPointervRobustANGLERobustANGLE(context, pname, bufSize,
+                                                                       length, params);
     }
 }
 
@@ -1610,17 +1432,14 @@ void GL_APIENTRY ReadnPixelsRobustANGLE(GLint x,
         ", void * data = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, bufSize, (uintptr_t)length, (uintptr_t)columns,
         (uintptr_t)rows, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(ReadnPixelsRobustANGLE, x, y, width, height, format, type, bufSize, length,
+                       columns, rows, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateReadnPixelsRobustANGLE(context, x, y, width, height, format, type, bufSize,
-                                           length, columns, rows, data))
-        {
-            context->readnPixelsRobust(x, y, width, height, format, type, bufSize, length, columns,
-                                       rows, data);
-        }
+        context->getDispatchTable()->ReadnPixelsRobustANGLE(
+            context, x, y, width, height, format, type, bufSize, length, columns, rows, data);
     }
 }
 
@@ -1635,15 +1454,13 @@ void GL_APIENTRY GetnUniformfvRobustANGLE(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetnUniformfvRobustANGLE, program, location, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetnUniformfvRobustANGLE(context, program, location, bufSize, length, params))
-        {
-            context->getnUniformfvRobust(program, location, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetnUniformfvRobustANGLE(context, program, location, bufSize,
+                                                              length, params);
     }
 }
 
@@ -1658,15 +1475,13 @@ void GL_APIENTRY GetnUniformivRobustANGLE(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetnUniformivRobustANGLE, program, location, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetnUniformivRobustANGLE(context, program, location, bufSize, length, params))
-        {
-            context->getnUniformivRobust(program, location, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetnUniformivRobustANGLE(context, program, location, bufSize,
+                                                              length, params);
     }
 }
 
@@ -1681,15 +1496,13 @@ void GL_APIENTRY GetnUniformuivRobustANGLE(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetnUniformuivRobustANGLE, program, location, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetnUniformuivRobustANGLE(context, program, location, bufSize, length, params))
-        {
-            context->getnUniformuivRobust(program, location, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetnUniformuivRobustANGLE(context, program, location, bufSize,
+                                                               length, params);
     }
 }
 
@@ -1703,16 +1516,13 @@ void GL_APIENTRY TexParameterIivRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLint * params = "
         "0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterIivRobustANGLE, target, pname, bufSize, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterIivRobustANGLE(context, targetPacked, pname, bufSize, params))
-        {
-            context->texParameterIivRobust(targetPacked, pname, bufSize, params);
-        }
+        context->getDispatchTable()->TexParameterIivRobustANGLE(context, target, pname, bufSize,
+                                                                params);
     }
 }
 
@@ -1726,16 +1536,13 @@ void GL_APIENTRY TexParameterIuivRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLuint * params = "
         "0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterIuivRobustANGLE, target, pname, bufSize, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterIuivRobustANGLE(context, targetPacked, pname, bufSize, params))
-        {
-            context->texParameterIuivRobust(targetPacked, pname, bufSize, params);
-        }
+        context->getDispatchTable()->TexParameterIuivRobustANGLE(context, target, pname, bufSize,
+                                                                 params);
     }
 }
 
@@ -1750,16 +1557,13 @@ void GL_APIENTRY GetTexParameterIivRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterIivRobustANGLE, target, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateGetTexParameterIivRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getTexParameterIivRobust(targetPacked, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetTexParameterIivRobustANGLE(context, target, pname, bufSize,
+                                                                   length, params);
     }
 }
 
@@ -1774,16 +1578,13 @@ void GL_APIENTRY GetTexParameterIuivRobustANGLE(GLenum target,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterIuivRobustANGLE, target, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateGetTexParameterIuivRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getTexParameterIuivRobust(targetPacked, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetTexParameterIuivRobustANGLE(context, target, pname, bufSize,
+                                                                    length, params);
     }
 }
 
@@ -1797,15 +1598,13 @@ void GL_APIENTRY SamplerParameterIivRobustANGLE(GLuint sampler,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLint * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterIivRobustANGLE, sampler, pname, bufSize, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateSamplerParameterIivRobustANGLE(context, sampler, pname, bufSize, param))
-        {
-            context->samplerParameterIivRobust(sampler, pname, bufSize, param);
-        }
+        context->getDispatchTable()->SamplerParameterIivRobustANGLE(context, sampler, pname,
+                                                                    bufSize, param);
     }
 }
 
@@ -1819,15 +1618,13 @@ void GL_APIENTRY SamplerParameterIuivRobustANGLE(GLuint sampler,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLuint * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterIuivRobustANGLE, sampler, pname, bufSize, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateSamplerParameterIuivRobustANGLE(context, sampler, pname, bufSize, param))
-        {
-            context->samplerParameterIuivRobust(sampler, pname, bufSize, param);
-        }
+        context->getDispatchTable()->SamplerParameterIuivRobustANGLE(context, sampler, pname,
+                                                                     bufSize, param);
     }
 }
 
@@ -1842,15 +1639,13 @@ void GL_APIENTRY GetSamplerParameterIivRobustANGLE(GLuint sampler,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterIivRobustANGLE, sampler, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetSamplerParameterIivRobustANGLE(
-                                             context, sampler, pname, bufSize, length, params))
-        {
-            context->getSamplerParameterIivRobust(sampler, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetSamplerParameterIivRobustANGLE(context, sampler, pname,
+                                                                       bufSize, length, params);
     }
 }
 
@@ -1865,15 +1660,13 @@ void GL_APIENTRY GetSamplerParameterIuivRobustANGLE(GLuint sampler,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterIuivRobustANGLE, sampler, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetSamplerParameterIuivRobustANGLE(
-                                             context, sampler, pname, bufSize, length, params))
-        {
-            context->getSamplerParameterIuivRobust(sampler, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetSamplerParameterIuivRobustANGLE(context, sampler, pname,
+                                                                        bufSize, length, params);
     }
 }
 
@@ -1888,15 +1681,13 @@ void GL_APIENTRY GetQueryObjectivRobustANGLE(GLuint id,
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectivRobustANGLE, id, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetQueryObjectivRobustANGLE(context, id, pname, bufSize, length, params))
-        {
-            context->getQueryObjectivRobust(id, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetQueryObjectivRobustANGLE(context, id, pname, bufSize,
+                                                                 length, params);
     }
 }
 
@@ -1911,15 +1702,13 @@ void GL_APIENTRY GetQueryObjecti64vRobustANGLE(GLuint id,
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint64 * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjecti64vRobustANGLE, id, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetQueryObjecti64vRobustANGLE(context, id, pname, bufSize, length, params))
-        {
-            context->getQueryObjecti64vRobust(id, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetQueryObjecti64vRobustANGLE(context, id, pname, bufSize,
+                                                                   length, params);
     }
 }
 
@@ -1934,15 +1723,13 @@ void GL_APIENTRY GetQueryObjectui64vRobustANGLE(GLuint id,
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint64 * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectui64vRobustANGLE, id, pname, bufSize, length, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetQueryObjectui64vRobustANGLE(context, id, pname, bufSize, length, params))
-        {
-            context->getQueryObjectui64vRobust(id, pname, bufSize, length, params);
-        }
+        context->getDispatchTable()->GetQueryObjectui64vRobustANGLE(context, id, pname, bufSize,
+                                                                    length, params);
     }
 }
 
@@ -1959,18 +1746,14 @@ void GL_APIENTRY TexStorage2DMultisampleANGLE(GLenum target,
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d, GLboolean fixedsamplelocations = %u)",
         target, samples, internalformat, width, height, fixedsamplelocations);
+    ANGLE_BINARY_EVENT(TexStorage2DMultisampleANGLE, target, samples, internalformat, width, height,
+                       fixedsamplelocations);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorage2DMultisampleANGLE(context, targetPacked, samples, internalformat,
-                                                 width, height, fixedsamplelocations))
-        {
-            context->texStorage2DMultisample(targetPacked, samples, internalformat, width, height,
-                                             fixedsamplelocations);
-        }
+        context->getDispatchTable()->TexStorage2DMultisampleANGLE(
+            context, target, samples, internalformat, width, height, fixedsamplelocations);
     }
 }
 
@@ -1984,16 +1767,13 @@ void GL_APIENTRY GetTexLevelParameterivANGLE(GLenum target,
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLint * params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexLevelParameterivANGLE, target, level, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexLevelParameterivANGLE(context, targetPacked, level, pname, params))
-        {
-            context->getTexLevelParameteriv(targetPacked, level, pname, params);
-        }
+        context->getDispatchTable()->GetTexLevelParameterivANGLE(context, target, level, pname,
+                                                                 params);
     }
 }
 
@@ -2007,16 +1787,13 @@ void GL_APIENTRY GetTexLevelParameterfvANGLE(GLenum target,
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLfloat * params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexLevelParameterfvANGLE, target, level, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexLevelParameterfvANGLE(context, targetPacked, level, pname, params))
-        {
-            context->getTexLevelParameterfv(targetPacked, level, pname, params);
-        }
+        context->getDispatchTable()->GetTexLevelParameterfvANGLE(context, target, level, pname,
+                                                                 params);
     }
 }
 
@@ -2025,14 +1802,12 @@ void GL_APIENTRY GetMultisamplefvANGLE(GLenum pname, GLuint index, GLfloat *val)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLuint index = %u, GLfloat * val = 0x%016" PRIxPTR ")", pname,
           index, (uintptr_t)val);
+    ANGLE_BINARY_EVENT(GetMultisamplefvANGLE, pname, index, val);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetMultisamplefvANGLE(context, pname, index, val))
-        {
-            context->getMultisamplefv(pname, index, val);
-        }
+        context->getDispatchTable()->GetMultisamplefvANGLE(context, pname, index, val);
     }
 }
 
@@ -2040,14 +1815,12 @@ void GL_APIENTRY SampleMaskiANGLE(GLuint maskNumber, GLbitfield mask)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint maskNumber = %u, GLbitfield mask = 0x%X)", maskNumber, mask);
+    ANGLE_BINARY_EVENT(SampleMaskiANGLE, maskNumber, mask);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateSampleMaskiANGLE(context, maskNumber, mask))
-        {
-            context->sampleMaski(maskNumber, mask);
-        }
+        context->getDispatchTable()->SampleMaskiANGLE(context, maskNumber, mask);
     }
 }
 
@@ -2061,15 +1834,13 @@ void GL_APIENTRY GetTranslatedShaderSourceANGLE(GLuint shader,
     EVENT("(GLuint shader = %u, GLsizei bufsize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *source = 0x%016" PRIxPTR ")",
           shader, bufsize, (uintptr_t)length, (uintptr_t)source);
+    ANGLE_BINARY_EVENT(GetTranslatedShaderSourceANGLE, shader, bufsize, length, source);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetTranslatedShaderSourceANGLE(context, shader, bufsize, length, source))
-        {
-            context->getTranslatedShaderSource(shader, bufsize, length, source);
-        }
+        context->getDispatchTable()->GetTranslatedShaderSourceANGLE(context, shader, bufsize,
+                                                                    length, source);
     }
 }
 
@@ -2079,15 +1850,12 @@ void GL_APIENTRY BindUniformLocationCHROMIUM(GLuint program, GLint location, con
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, const GLchar* name = 0x%016" PRIxPTR ")",
           program, location, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(BindUniformLocationCHROMIUM, program, location, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateBindUniformLocationCHROMIUM(context, program, location, name))
-        {
-            context->bindUniformLocation(program, location, name);
-        }
+        context->getDispatchTable()->BindUniformLocationCHROMIUM(context, program, location, name);
     }
 }
 
@@ -2096,15 +1864,12 @@ void GL_APIENTRY CompressedCopyTextureCHROMIUM(GLuint sourceId, GLuint destId)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sourceId = %u, GLuint destId = %u)", sourceId, destId);
+    ANGLE_BINARY_EVENT(CompressedCopyTextureCHROMIUM, sourceId, destId);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateCompressedCopyTextureCHROMIUM(context, sourceId, destId))
-        {
-            context->compressedCopyTexture(sourceId, destId);
-        }
+        context->getDispatchTable()->CompressedCopyTextureCHROMIUM(context, sourceId, destId);
     }
 }
 
@@ -2128,20 +1893,16 @@ void GL_APIENTRY CopyTextureCHROMIUM(GLuint sourceId,
         "= %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, internalFormat, destType, unpackFlipY,
         unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_EVENT(CopyTextureCHROMIUM, sourceId, sourceLevel, destTarget, destId, destLevel,
+                       internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                       unpackUnmultiplyAlpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
-        if (context->skipValidation() ||
-            ValidateCopyTextureCHROMIUM(context, sourceId, sourceLevel, destTargetPacked, destId,
-                                        destLevel, internalFormat, destType, unpackFlipY,
-                                        unpackPremultiplyAlpha, unpackUnmultiplyAlpha))
-        {
-            context->copyTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
-                                 internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
-                                 unpackUnmultiplyAlpha);
-        }
+        context->getDispatchTable()->CopyTextureCHROMIUM(
+            context, sourceId, sourceLevel, destTarget, destId, destLevel, internalFormat, destType,
+            unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
     }
 }
 
@@ -2168,21 +1929,16 @@ void GL_APIENTRY CopySubTextureCHROMIUM(GLuint sourceId,
         "unpackPremultiplyAlpha = %u, GLboolean unpackUnmultiplyAlpha = %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, xoffset, yoffset, x, y, width, height,
         unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_EVENT(CopySubTextureCHROMIUM, sourceId, sourceLevel, destTarget, destId, destLevel,
+                       xoffset, yoffset, x, y, width, height, unpackFlipY, unpackPremultiplyAlpha,
+                       unpackUnmultiplyAlpha);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
-        if (context->skipValidation() ||
-            ValidateCopySubTextureCHROMIUM(context, sourceId, sourceLevel, destTargetPacked, destId,
-                                           destLevel, xoffset, yoffset, x, y, width, height,
-                                           unpackFlipY, unpackPremultiplyAlpha,
-                                           unpackUnmultiplyAlpha))
-        {
-            context->copySubTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
-                                    xoffset, yoffset, x, y, width, height, unpackFlipY,
-                                    unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
-        }
+        context->getDispatchTable()->CopySubTextureCHROMIUM(
+            context, sourceId, sourceLevel, destTarget, destId, destLevel, xoffset, yoffset, x, y,
+            width, height, unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
     }
 }
 
@@ -2191,14 +1947,12 @@ void GL_APIENTRY CoverageModulationCHROMIUM(GLenum components)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum components = 0x%X)", components);
+    ANGLE_BINARY_EVENT(CoverageModulationCHROMIUM, components);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateCoverageModulationCHROMIUM(context, components))
-        {
-            context->coverageModulation(components);
-        }
+        context->getDispatchTable()->CoverageModulationCHROMIUM(context, components);
     }
 }
 
@@ -2207,14 +1961,12 @@ void GL_APIENTRY MatrixLoadfCHROMIUM(GLenum matrixMode, const GLfloat *matrix)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum matrixMode = 0x%X, const GLfloat * matrix = 0x%016" PRIxPTR ")", matrixMode,
           (uintptr_t)matrix);
+    ANGLE_BINARY_EVENT(MatrixLoadfCHROMIUM, matrixMode, matrix);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateMatrixLoadfCHROMIUM(context, matrixMode, matrix))
-        {
-            context->matrixLoadf(matrixMode, matrix);
-        }
+        context->getDispatchTable()->MatrixLoadfCHROMIUM(context, matrixMode, matrix);
     }
 }
 
@@ -2222,14 +1974,12 @@ void GL_APIENTRY MatrixLoadIdentityCHROMIUM(GLenum matrixMode)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum matrixMode = 0x%X)", matrixMode);
+    ANGLE_BINARY_EVENT(MatrixLoadIdentityCHROMIUM, matrixMode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateMatrixLoadIdentityCHROMIUM(context, matrixMode))
-        {
-            context->matrixLoadIdentity(matrixMode);
-        }
+        context->getDispatchTable()->MatrixLoadIdentityCHROMIUM(context, matrixMode);
     }
 }
 
@@ -2238,17 +1988,12 @@ void GL_APIENTRY LoseContextCHROMIUM(GLenum current, GLenum other)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum current = 0x%X, GLenum other = 0x%X)", current, other);
+    ANGLE_BINARY_EVENT(LoseContextCHROMIUM, current, other);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        GraphicsResetStatus currentPacked = FromGLenum<GraphicsResetStatus>(current);
-        GraphicsResetStatus otherPacked   = FromGLenum<GraphicsResetStatus>(other);
-        if (context->skipValidation() ||
-            ValidateLoseContextCHROMIUM(context, currentPacked, otherPacked))
-        {
-            context->loseContext(currentPacked, otherPacked);
-        }
+        context->getDispatchTable()->LoseContextCHROMIUM(context, current, other);
     }
 }
 
@@ -2257,14 +2002,12 @@ GLuint GL_APIENTRY GenPathsCHROMIUM(GLsizei range)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei range = %d)", range);
+    ANGLE_BINARY_EVENT(GenPathsCHROMIUM, range);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenPathsCHROMIUM(context, range))
-        {
-            return context->genPaths(range);
-        }
+        return context->getDispatchTable()->GenPathsCHROMIUM(context, range);
     }
 
     return GetDefaultReturnValue<EntryPoint::GenPathsCHROMIUM, GLuint>();
@@ -2274,14 +2017,12 @@ void GL_APIENTRY DeletePathsCHROMIUM(GLuint first, GLsizei range)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint first = %u, GLsizei range = %d)", first, range);
+    ANGLE_BINARY_EVENT(DeletePathsCHROMIUM, first, range);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeletePathsCHROMIUM(context, first, range))
-        {
-            context->deletePaths(first, range);
-        }
+        context->getDispatchTable()->DeletePathsCHROMIUM(context, first, range);
     }
 }
 
@@ -2289,14 +2030,12 @@ GLboolean GL_APIENTRY IsPathCHROMIUM(GLuint path)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u)", path);
+    ANGLE_BINARY_EVENT(IsPathCHROMIUM, path);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsPathCHROMIUM(context, path))
-        {
-            return context->isPath(path);
-        }
+        return context->getDispatchTable()->IsPathCHROMIUM(context, path);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsPathCHROMIUM, GLboolean>();
@@ -2314,16 +2053,14 @@ void GL_APIENTRY PathCommandsCHROMIUM(GLuint path,
           ", GLsizei numCoords = %d, GLenum coordType = 0x%X, const void* coords = 0x%016" PRIxPTR
           ")",
           path, numCommands, (uintptr_t)commands, numCoords, coordType, (uintptr_t)coords);
+    ANGLE_BINARY_EVENT(PathCommandsCHROMIUM, path, numCommands, commands, numCoords, coordType,
+                       coords);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidatePathCommandsCHROMIUM(context, path, numCommands, commands, numCoords, coordType,
-                                         coords))
-        {
-            context->pathCommands(path, numCommands, commands, numCoords, coordType, coords);
-        }
+        context->getDispatchTable()->PathCommandsCHROMIUM(context, path, numCommands, commands,
+                                                          numCoords, coordType, coords);
     }
 }
 
@@ -2331,15 +2068,12 @@ void GL_APIENTRY PathParameterfCHROMIUM(GLuint path, GLenum pname, GLfloat value
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLfloat value = %f)", path, pname, value);
+    ANGLE_BINARY_EVENT(PathParameterfCHROMIUM, path, pname, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidatePathParameterfCHROMIUM(context, path, pname, value))
-        {
-            context->pathParameterf(path, pname, value);
-        }
+        context->getDispatchTable()->PathParameterfCHROMIUM(context, path, pname, value);
     }
 }
 
@@ -2347,15 +2081,12 @@ void GL_APIENTRY PathParameteriCHROMIUM(GLuint path, GLenum pname, GLint value)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLint value = %d)", path, pname, value);
+    ANGLE_BINARY_EVENT(PathParameteriCHROMIUM, path, pname, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidatePathParameteriCHROMIUM(context, path, pname, value))
-        {
-            context->pathParameteri(path, pname, value);
-        }
+        context->getDispatchTable()->PathParameteriCHROMIUM(context, path, pname, value);
     }
 }
 
@@ -2364,15 +2095,12 @@ void GL_APIENTRY GetPathParameterfvCHROMIUM(GLuint path, GLenum pname, GLfloat *
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLfloat * value = 0x%016" PRIxPTR ")", path,
           pname, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(GetPathParameterfvCHROMIUM, path, pname, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetPathParameterfvCHROMIUM(context, path, pname, value))
-        {
-            context->getPathParameterfv(path, pname, value);
-        }
+        context->getDispatchTable()->GetPathParameterfvCHROMIUM(context, path, pname, value);
     }
 }
 
@@ -2381,15 +2109,12 @@ void GL_APIENTRY GetPathParameterivCHROMIUM(GLuint path, GLenum pname, GLint *va
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLint * value = 0x%016" PRIxPTR ")", path, pname,
           (uintptr_t)value);
+    ANGLE_BINARY_EVENT(GetPathParameterivCHROMIUM, path, pname, value);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetPathParameterivCHROMIUM(context, path, pname, value))
-        {
-            context->getPathParameteriv(path, pname, value);
-        }
+        context->getDispatchTable()->GetPathParameterivCHROMIUM(context, path, pname, value);
     }
 }
 
@@ -2397,14 +2122,12 @@ void GL_APIENTRY PathStencilFuncCHROMIUM(GLenum func, GLint ref, GLuint mask)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)", func, ref, mask);
+    ANGLE_BINARY_EVENT(PathStencilFuncCHROMIUM, func, ref, mask);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidatePathStencilFuncCHROMIUM(context, func, ref, mask))
-        {
-            context->pathStencilFunc(func, ref, mask);
-        }
+        context->getDispatchTable()->PathStencilFuncCHROMIUM(context, func, ref, mask);
     }
 }
 
@@ -2412,15 +2135,12 @@ void GL_APIENTRY StencilFillPathCHROMIUM(GLuint path, GLenum fillMode, GLuint ma
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum fillMode = 0x%X, GLuint mask = %u)", path, fillMode, mask);
+    ANGLE_BINARY_EVENT(StencilFillPathCHROMIUM, path, fillMode, mask);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateStencilFillPathCHROMIUM(context, path, fillMode, mask))
-        {
-            context->stencilFillPath(path, fillMode, mask);
-        }
+        context->getDispatchTable()->StencilFillPathCHROMIUM(context, path, fillMode, mask);
     }
 }
 
@@ -2428,15 +2148,12 @@ void GL_APIENTRY StencilStrokePathCHROMIUM(GLuint path, GLint reference, GLuint
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLint reference = %d, GLuint mask = %u)", path, reference, mask);
+    ANGLE_BINARY_EVENT(StencilStrokePathCHROMIUM, path, reference, mask);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateStencilStrokePathCHROMIUM(context, path, reference, mask))
-        {
-            context->stencilStrokePath(path, reference, mask);
-        }
+        context->getDispatchTable()->StencilStrokePathCHROMIUM(context, path, reference, mask);
     }
 }
 
@@ -2444,14 +2161,12 @@ void GL_APIENTRY CoverFillPathCHROMIUM(GLuint path, GLenum coverMode)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum coverMode = 0x%X)", path, coverMode);
+    ANGLE_BINARY_EVENT(CoverFillPathCHROMIUM, path, coverMode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateCoverFillPathCHROMIUM(context, path, coverMode))
-        {
-            context->coverFillPath(path, coverMode);
-        }
+        context->getDispatchTable()->CoverFillPathCHROMIUM(context, path, coverMode);
     }
 }
 
@@ -2459,14 +2174,12 @@ void GL_APIENTRY CoverStrokePathCHROMIUM(GLuint path, GLenum coverMode)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum coverMode = 0x%X)", path, coverMode);
+    ANGLE_BINARY_EVENT(CoverStrokePathCHROMIUM, path, coverMode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateCoverStrokePathCHROMIUM(context, path, coverMode))
-        {
-            context->coverStrokePath(path, coverMode);
-        }
+        context->getDispatchTable()->CoverStrokePathCHROMIUM(context, path, coverMode);
     }
 }
 
@@ -2478,15 +2191,13 @@ void GL_APIENTRY StencilThenCoverFillPathCHROMIUM(GLuint path,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum fillMode = 0x%X, GLuint mask = %u, GLenum coverMode = 0x%X)",
           path, fillMode, mask, coverMode);
+    ANGLE_BINARY_EVENT(StencilThenCoverFillPathCHROMIUM, path, fillMode, mask, coverMode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateStencilThenCoverFillPathCHROMIUM(context, path, fillMode, mask, coverMode))
-        {
-            context->stencilThenCoverFillPath(path, fillMode, mask, coverMode);
-        }
+        context->getDispatchTable()->StencilThenCoverFillPathCHROMIUM(context, path, fillMode, mask,
+                                                                      coverMode);
     }
 }
 
@@ -2498,15 +2209,13 @@ void GL_APIENTRY StencilThenCoverStrokePathCHROMIUM(GLuint path,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLint reference = %d, GLuint mask = %u, GLenum coverMode = 0x%X)",
           path, reference, mask, coverMode);
+    ANGLE_BINARY_EVENT(StencilThenCoverStrokePathCHROMIUM, path, reference, mask, coverMode);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateStencilThenCoverStrokePathCHROMIUM(context, path, reference, mask, coverMode))
-        {
-            context->stencilThenCoverStrokePath(path, reference, mask, coverMode);
-        }
+        context->getDispatchTable()->StencilThenCoverStrokePathCHROMIUM(context, path, reference,
+                                                                        mask, coverMode);
     }
 }
 
@@ -2524,17 +2233,15 @@ void GL_APIENTRY CoverFillPathInstancedCHROMIUM(GLsizei numPath,
           "GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPath, pathNameType, (uintptr_t)paths, pathBase, coverMode, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_EVENT(CoverFillPathInstancedCHROMIUM, numPath, pathNameType, paths, pathBase,
+                       coverMode, transformType, transformValues);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateCoverFillPathInstancedCHROMIUM(context, numPath, pathNameType, paths, pathBase,
-                                                   coverMode, transformType, transformValues))
-        {
-            context->coverFillPathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
-                                            transformType, transformValues);
-        }
+        context->getDispatchTable()->CoverFillPathInstancedCHROMIUM(context, numPath, pathNameType,
+                                                                    paths, pathBase, coverMode,
+                                                                    transformType, transformValues);
     }
 }
 
@@ -2552,17 +2259,15 @@ void GL_APIENTRY CoverStrokePathInstancedCHROMIUM(GLsizei numPath,
           "GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPath, pathNameType, (uintptr_t)paths, pathBase, coverMode, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_EVENT(CoverStrokePathInstancedCHROMIUM, numPath, pathNameType, paths, pathBase,
+                       coverMode, transformType, transformValues);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateCoverStrokePathInstancedCHROMIUM(
-                                             context, numPath, pathNameType, paths, pathBase,
-                                             coverMode, transformType, transformValues))
-        {
-            context->coverStrokePathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
-                                              transformType, transformValues);
-        }
+        context->getDispatchTable()->CoverStrokePathInstancedCHROMIUM(
+            context, numPath, pathNameType, paths, pathBase, coverMode, transformType,
+            transformValues);
     }
 }
 
@@ -2581,17 +2286,15 @@ void GL_APIENTRY StencilStrokePathInstancedCHROMIUM(GLsizei numPath,
           "0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPath, pathNameType, (uintptr_t)paths, pathBase, reference, mask, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_EVENT(StencilStrokePathInstancedCHROMIUM, numPath, pathNameType, paths, pathBase,
+                       reference, mask, transformType, transformValues);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateStencilStrokePathInstancedCHROMIUM(
-                                             context, numPath, pathNameType, paths, pathBase,
-                                             reference, mask, transformType, transformValues))
-        {
-            context->stencilStrokePathInstanced(numPath, pathNameType, paths, pathBase, reference,
-                                                mask, transformType, transformValues);
-        }
+        context->getDispatchTable()->StencilStrokePathInstancedCHROMIUM(
+            context, numPath, pathNameType, paths, pathBase, reference, mask, transformType,
+            transformValues);
     }
 }
 
@@ -2610,17 +2313,15 @@ void GL_APIENTRY StencilFillPathInstancedCHROMIUM(GLsizei numPaths,
           "= 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPaths, pathNameType, (uintptr_t)paths, pathBase, fillMode, mask, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_EVENT(StencilFillPathInstancedCHROMIUM, numPaths, pathNameType, paths, pathBase,
+                       fillMode, mask, transformType, transformValues);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateStencilFillPathInstancedCHROMIUM(
-                                             context, numPaths, pathNameType, paths, pathBase,
-                                             fillMode, mask, transformType, transformValues))
-        {
-            context->stencilFillPathInstanced(numPaths, pathNameType, paths, pathBase, fillMode,
-                                              mask, transformType, transformValues);
-        }
+        context->getDispatchTable()->StencilFillPathInstancedCHROMIUM(
+            context, numPaths, pathNameType, paths, pathBase, fillMode, mask, transformType,
+            transformValues);
     }
 }
 
@@ -2640,19 +2341,15 @@ void GL_APIENTRY StencilThenCoverFillPathInstancedCHROMIUM(GLsizei numPaths,
           "0x%X, GLenum transformType = 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPaths, pathNameType, (uintptr_t)paths, pathBase, fillMode, mask, coverMode,
           transformType, (uintptr_t)transformValues);
+    ANGLE_BINARY_EVENT(StencilThenCoverFillPathInstancedCHROMIUM, numPaths, pathNameType, paths,
+                       pathBase, fillMode, mask, coverMode, transformType, transformValues);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateStencilThenCoverFillPathInstancedCHROMIUM(
-                context, numPaths, pathNameType, paths, pathBase, fillMode, mask, coverMode,
-                transformType, transformValues))
-        {
-            context->stencilThenCoverFillPathInstanced(numPaths, pathNameType, paths, pathBase,
-                                                       fillMode, mask, coverMode, transformType,
-                                                       transformValues);
-        }
+        context->getDispatchTable()->StencilThenCoverFillPathInstancedCHROMIUM(
+            context, numPaths, pathNameType, paths, pathBase, fillMode, mask, coverMode,
+            transformType, transformValues);
     }
 }
 
@@ -2672,19 +2369,15 @@ void GL_APIENTRY StencilThenCoverStrokePathInstancedCHROMIUM(GLsizei numPaths,
           "0x%X, GLenum transformType = 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPaths, pathNameType, (uintptr_t)paths, pathBase, reference, mask, coverMode,
           transformType, (uintptr_t)transformValues);
+    ANGLE_BINARY_EVENT(StencilThenCoverStrokePathInstancedCHROMIUM, numPaths, pathNameType, paths,
+                       pathBase, reference, mask, coverMode, transformType, transformValues);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateStencilThenCoverStrokePathInstancedCHROMIUM(
-                context, numPaths, pathNameType, paths, pathBase, reference, mask, coverMode,
-                transformType, transformValues))
-        {
-            context->stencilThenCoverStrokePathInstanced(numPaths, pathNameType, paths, pathBase,
-                                                         reference, mask, coverMode, transformType,
-                                                         transformValues);
-        }
+        context->getDispatchTable()->StencilThenCoverStrokePathInstancedCHROMIUM(
+            context, numPaths, pathNameType, paths, pathBase, reference, mask, coverMode,
+            transformType, transformValues);
     }
 }
 
@@ -2695,15 +2388,13 @@ void GL_APIENTRY BindFragmentInputLocationCHROMIUM(GLuint programs,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint programs = %u, GLint location = %d, const GLchar * name = 0x%016" PRIxPTR ")",
           programs, location, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(BindFragmentInputLocationCHROMIUM, programs, location, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateBindFragmentInputLocationCHROMIUM(context, programs, location, name))
-        {
-            context->bindFragmentInputLocation(programs, location, name);
-        }
+        context->getDispatchTable()->BindFragmentInputLocationCHROMIUM(context, programs, location,
+                                                                       name);
     }
 }
 
@@ -2718,16 +2409,14 @@ void GL_APIENTRY ProgramPathFragmentInputGenCHROMIUM(GLuint program,
         "(GLuint program = %u, GLint location = %d, GLenum genMode = 0x%X, GLint components = %d, "
         "const GLfloat * coeffs = 0x%016" PRIxPTR ")",
         program, location, genMode, components, (uintptr_t)coeffs);
+    ANGLE_BINARY_EVENT(ProgramPathFragmentInputGenCHROMIUM, program, location, genMode, components,
+                       coeffs);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramPathFragmentInputGenCHROMIUM(context, program, location, genMode,
-                                                        components, coeffs))
-        {
-            context->programPathFragmentInputGen(program, location, genMode, components, coeffs);
-        }
+        context->getDispatchTable()->ProgramPathFragmentInputGenCHROMIUM(
+            context, program, location, genMode, components, coeffs);
     }
 }
 
@@ -2737,15 +2426,12 @@ void GL_APIENTRY BindFragDataLocationEXT(GLuint program, GLuint color, const GLc
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint color = %u, const GLchar *name = 0x%016" PRIxPTR ")",
           program, color, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(BindFragDataLocationEXT, program, color, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateBindFragDataLocationEXT(context, program, color, name))
-        {
-            context->bindFragDataLocation(program, color, name);
-        }
+        context->getDispatchTable()->BindFragDataLocationEXT(context, program, color, name);
     }
 }
 
@@ -2759,15 +2445,13 @@ void GL_APIENTRY BindFragDataLocationIndexedEXT(GLuint program,
         "(GLuint program = %u, GLuint colorNumber = %u, GLuint index = %u, const GLchar *name = "
         "0x%016" PRIxPTR ")",
         program, colorNumber, index, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(BindFragDataLocationIndexedEXT, program, colorNumber, index, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateBindFragDataLocationIndexedEXT(context, program, colorNumber, index, name))
-        {
-            context->bindFragDataLocationIndexed(program, colorNumber, index, name);
-        }
+        context->getDispatchTable()->BindFragDataLocationIndexedEXT(context, program, colorNumber,
+                                                                    index, name);
     }
 }
 
@@ -2776,14 +2460,12 @@ GLint GL_APIENTRY GetFragDataIndexEXT(GLuint program, const GLchar *name)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetFragDataIndexEXT, program, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetFragDataIndexEXT(context, program, name))
-        {
-            return context->getFragDataIndex(program, name);
-        }
+        return context->getDispatchTable()->GetFragDataIndexEXT(context, program, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetFragDataIndexEXT, GLint>();
@@ -2798,15 +2480,13 @@ GLint GL_APIENTRY GetProgramResourceLocationIndexEXT(GLuint program,
         "(GLuint program = %u, GLenum programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR
         ")",
         program, programInterface, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetProgramResourceLocationIndexEXT, program, programInterface, name);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramResourceLocationIndexEXT(context, program, programInterface, name))
-        {
-            return context->getProgramResourceLocationIndex(program, programInterface, name);
-        }
+        return context->getDispatchTable()->GetProgramResourceLocationIndexEXT(
+            context, program, programInterface, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetProgramResourceLocationIndexEXT, GLint>();
@@ -2820,14 +2500,12 @@ void GL_APIENTRY InsertEventMarkerEXT(GLsizei length, const GLchar *marker)
     // It can interfere with the debug events being set by the caller.
     // EVENT("(GLsizei length = %d, const GLchar *marker = 0x%016" PRIxPTR ")", length,
     // (uintptr_t)marker);
+    ANGLE_BINARY_EVENT(InsertEventMarkerEXT, length, marker);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateInsertEventMarkerEXT(context, length, marker))
-        {
-            context->insertEventMarker(length, marker);
-        }
+        context->getDispatchTable()->InsertEventMarkerEXT(context, length, marker);
     }
 }
 
@@ -2837,14 +2515,12 @@ void GL_APIENTRY PopGroupMarkerEXT()
     // Don't run an EVENT() macro on the EXT_debug_marker entry points.
     // It can interfere with the debug events being set by the caller.
     // EVENT("()");
+    ANGLE_BINARY_EVENT(PopGroupMarkerEXT);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidatePopGroupMarkerEXT(context))
-        {
-            context->popGroupMarker();
-        }
+        context->getDispatchTable()->PopGroupMarkerEXT(context);
     }
 }
 
@@ -2855,14 +2531,12 @@ void GL_APIENTRY PushGroupMarkerEXT(GLsizei length, const GLchar *marker)
     // It can interfere with the debug events being set by the caller.
     // EVENT("(GLsizei length = %d, const GLchar *marker = 0x%016" PRIxPTR ")", length,
     // (uintptr_t)marker);
+    ANGLE_BINARY_EVENT(PushGroupMarkerEXT, length, marker);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidatePushGroupMarkerEXT(context, length, marker))
-        {
-            context->pushGroupMarker(length, marker);
-        }
+        context->getDispatchTable()->PushGroupMarkerEXT(context, length, marker);
     }
 }
 
@@ -2876,15 +2550,13 @@ void GL_APIENTRY DiscardFramebufferEXT(GLenum target,
         "(GLenum target = 0x%X, GLsizei numAttachments = %d, const GLenum *attachments = "
         "0x%016" PRIxPTR ")",
         target, numAttachments, (uintptr_t)attachments);
+    ANGLE_BINARY_EVENT(DiscardFramebufferEXT, target, numAttachments, attachments);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateDiscardFramebufferEXT(context, target, numAttachments, attachments))
-        {
-            context->discardFramebuffer(target, numAttachments, attachments);
-        }
+        context->getDispatchTable()->DiscardFramebufferEXT(context, target, numAttachments,
+                                                           attachments);
     }
 }
 
@@ -2893,15 +2565,12 @@ void GL_APIENTRY BeginQueryEXT(GLenum target, GLuint id)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint id = %u)", target, id);
+    ANGLE_BINARY_EVENT(BeginQueryEXT, target, id);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() || ValidateBeginQueryEXT(context, targetPacked, id))
-        {
-            context->beginQuery(targetPacked, id);
-        }
+        context->getDispatchTable()->BeginQueryEXT(context, target, id);
     }
 }
 
@@ -2909,14 +2578,12 @@ void GL_APIENTRY DeleteQueriesEXT(GLsizei n, const GLuint *ids)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_EVENT(DeleteQueriesEXT, n, ids);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteQueriesEXT(context, n, ids))
-        {
-            context->deleteQueries(n, ids);
-        }
+        context->getDispatchTable()->DeleteQueriesEXT(context, n, ids);
     }
 }
 
@@ -2924,15 +2591,12 @@ void GL_APIENTRY EndQueryEXT(GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(EndQueryEXT, target);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() || ValidateEndQueryEXT(context, targetPacked))
-        {
-            context->endQuery(targetPacked);
-        }
+        context->getDispatchTable()->EndQueryEXT(context, target);
     }
 }
 
@@ -2940,14 +2604,12 @@ void GL_APIENTRY GenQueriesEXT(GLsizei n, GLuint *ids)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_EVENT(GenQueriesEXT, n, ids);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenQueriesEXT(context, n, ids))
-        {
-            context->genQueries(n, ids);
-        }
+        context->getDispatchTable()->GenQueriesEXT(context, n, ids);
     }
 }
 
@@ -2956,14 +2618,12 @@ void GL_APIENTRY GetQueryObjecti64vEXT(GLuint id, GLenum pname, GLint64 *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLint64 *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjecti64vEXT, id, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetQueryObjecti64vEXT(context, id, pname, params))
-        {
-            context->getQueryObjecti64v(id, pname, params);
-        }
+        context->getDispatchTable()->GetQueryObjecti64vEXT(context, id, pname, params);
     }
 }
 
@@ -2972,14 +2632,12 @@ void GL_APIENTRY GetQueryObjectivEXT(GLuint id, GLenum pname, GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectivEXT, id, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetQueryObjectivEXT(context, id, pname, params))
-        {
-            context->getQueryObjectiv(id, pname, params);
-        }
+        context->getDispatchTable()->GetQueryObjectivEXT(context, id, pname, params);
     }
 }
 
@@ -2988,14 +2646,12 @@ void GL_APIENTRY GetQueryObjectui64vEXT(GLuint id, GLenum pname, GLuint64 *param
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLuint64 *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectui64vEXT, id, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetQueryObjectui64vEXT(context, id, pname, params))
-        {
-            context->getQueryObjectui64v(id, pname, params);
-        }
+        context->getDispatchTable()->GetQueryObjectui64vEXT(context, id, pname, params);
     }
 }
 
@@ -3004,14 +2660,12 @@ void GL_APIENTRY GetQueryObjectuivEXT(GLuint id, GLenum pname, GLuint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectuivEXT, id, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetQueryObjectuivEXT(context, id, pname, params))
-        {
-            context->getQueryObjectuiv(id, pname, params);
-        }
+        context->getDispatchTable()->GetQueryObjectuivEXT(context, id, pname, params);
     }
 }
 
@@ -3020,16 +2674,12 @@ void GL_APIENTRY GetQueryivEXT(GLenum target, GLenum pname, GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryivEXT, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() ||
-            ValidateGetQueryivEXT(context, targetPacked, pname, params))
-        {
-            context->getQueryiv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->GetQueryivEXT(context, target, pname, params);
     }
 }
 
@@ -3037,14 +2687,12 @@ GLboolean GL_APIENTRY IsQueryEXT(GLuint id)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u)", id);
+    ANGLE_BINARY_EVENT(IsQueryEXT, id);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsQueryEXT(context, id))
-        {
-            return context->isQuery(id);
-        }
+        return context->getDispatchTable()->IsQueryEXT(context, id);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsQueryEXT, GLboolean>();
@@ -3054,15 +2702,12 @@ void GL_APIENTRY QueryCounterEXT(GLuint id, GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum target = 0x%X)", id, target);
+    ANGLE_BINARY_EVENT(QueryCounterEXT, id, target);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() || ValidateQueryCounterEXT(context, id, targetPacked))
-        {
-            context->queryCounter(id, targetPacked);
-        }
+        context->getDispatchTable()->QueryCounterEXT(context, id, target);
     }
 }
 
@@ -3071,14 +2716,12 @@ void GL_APIENTRY DrawBuffersEXT(GLsizei n, const GLenum *bufs)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLenum *bufs = 0x%016" PRIxPTR ")", n, (uintptr_t)bufs);
+    ANGLE_BINARY_EVENT(DrawBuffersEXT, n, bufs);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDrawBuffersEXT(context, n, bufs))
-        {
-            context->drawBuffers(n, bufs);
-        }
+        context->getDispatchTable()->DrawBuffersEXT(context, n, bufs);
     }
 }
 
@@ -3091,15 +2734,13 @@ void GL_APIENTRY FramebufferTextureEXT(GLenum target,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint texture = %u, GLint level = %d)",
           target, attachment, texture, level);
+    ANGLE_BINARY_EVENT(FramebufferTextureEXT, target, attachment, texture, level);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateFramebufferTextureEXT(context, target, attachment, texture, level))
-        {
-            context->framebufferTexture(target, attachment, texture, level);
-        }
+        context->getDispatchTable()->FramebufferTextureEXT(context, target, attachment, texture,
+                                                           level);
     }
 }
 
@@ -3109,16 +2750,12 @@ void GL_APIENTRY DrawArraysInstancedEXT(GLenum mode, GLint start, GLsizei count,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint start = %d, GLsizei count = %d, GLsizei primcount = %d)",
           mode, start, count, primcount);
+    ANGLE_BINARY_EVENT(DrawArraysInstancedEXT, mode, start, count, primcount);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() ||
-            ValidateDrawArraysInstancedEXT(context, modePacked, start, count, primcount))
-        {
-            context->drawArraysInstanced(modePacked, start, count, primcount);
-        }
+        context->getDispatchTable()->DrawArraysInstancedEXT(context, mode, start, count, primcount);
     }
 }
 
@@ -3133,18 +2770,13 @@ void GL_APIENTRY DrawElementsInstancedEXT(GLenum mode,
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ", GLsizei primcount = %d)",
         mode, count, type, (uintptr_t)indices, primcount);
+    ANGLE_BINARY_EVENT(DrawElementsInstancedEXT, mode, count, type, indices, primcount);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateDrawElementsInstancedEXT(context, modePacked, count, typePacked, indices,
-                                             primcount))
-        {
-            context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
-        }
+        context->getDispatchTable()->DrawElementsInstancedEXT(context, mode, count, type, indices,
+                                                              primcount);
     }
 }
 
@@ -3152,14 +2784,12 @@ void GL_APIENTRY VertexAttribDivisorEXT(GLuint index, GLuint divisor)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint divisor = %u)", index, divisor);
+    ANGLE_BINARY_EVENT(VertexAttribDivisorEXT, index, divisor);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateVertexAttribDivisorEXT(context, index, divisor))
-        {
-            context->vertexAttribDivisor(index, divisor);
-        }
+        context->getDispatchTable()->VertexAttribDivisorEXT(context, index, divisor);
     }
 }
 
@@ -3169,16 +2799,12 @@ void GL_APIENTRY FlushMappedBufferRangeEXT(GLenum target, GLintptr offset, GLsiz
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr length = %llu)", target,
           static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length));
+    ANGLE_BINARY_EVENT(FlushMappedBufferRangeEXT, target, offset, length);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateFlushMappedBufferRangeEXT(context, targetPacked, offset, length))
-        {
-            context->flushMappedBufferRange(targetPacked, offset, length);
-        }
+        context->getDispatchTable()->FlushMappedBufferRangeEXT(context, target, offset, length);
     }
 }
 
@@ -3193,16 +2819,13 @@ void *GL_APIENTRY MapBufferRangeEXT(GLenum target,
         "access = 0x%X)",
         target, static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length),
         access);
+    ANGLE_BINARY_EVENT(MapBufferRangeEXT, target, offset, length, access);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateMapBufferRangeEXT(context, targetPacked, offset, length, access))
-        {
-            return context->mapBufferRange(targetPacked, offset, length, access);
-        }
+        return context->getDispatchTable()->MapBufferRangeEXT(context, target, offset, length,
+                                                              access);
     }
 
     return GetDefaultReturnValue<EntryPoint::MapBufferRangeEXT, void *>();
@@ -3217,16 +2840,12 @@ void GL_APIENTRY BufferStorageMemEXT(GLenum target, GLsizeiptr size, GLuint memo
         "%llu)",
         target, static_cast<unsigned long long>(size), memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_EVENT(BufferStorageMemEXT, target, size, memory, offset);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateBufferStorageMemEXT(context, targetPacked, size, memory, offset))
-        {
-            context->bufferStorageMem(targetPacked, size, memory, offset);
-        }
+        context->getDispatchTable()->BufferStorageMemEXT(context, target, size, memory, offset);
     }
 }
 
@@ -3235,14 +2854,12 @@ void GL_APIENTRY CreateMemoryObjectsEXT(GLsizei n, GLuint *memoryObjects)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *memoryObjects = 0x%016" PRIxPTR ")", n,
           (uintptr_t)memoryObjects);
+    ANGLE_BINARY_EVENT(CreateMemoryObjectsEXT, n, memoryObjects);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateCreateMemoryObjectsEXT(context, n, memoryObjects))
-        {
-            context->createMemoryObjects(n, memoryObjects);
-        }
+        context->getDispatchTable()->CreateMemoryObjectsEXT(context, n, memoryObjects);
     }
 }
 
@@ -3251,14 +2868,12 @@ void GL_APIENTRY DeleteMemoryObjectsEXT(GLsizei n, const GLuint *memoryObjects)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *memoryObjects = 0x%016" PRIxPTR ")", n,
           (uintptr_t)memoryObjects);
+    ANGLE_BINARY_EVENT(DeleteMemoryObjectsEXT, n, memoryObjects);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteMemoryObjectsEXT(context, n, memoryObjects))
-        {
-            context->deleteMemoryObjects(n, memoryObjects);
-        }
+        context->getDispatchTable()->DeleteMemoryObjectsEXT(context, n, memoryObjects);
     }
 }
 
@@ -3267,15 +2882,13 @@ void GL_APIENTRY GetMemoryObjectParameterivEXT(GLuint memoryObject, GLenum pname
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memoryObject = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
           memoryObject, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetMemoryObjectParameterivEXT, memoryObject, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetMemoryObjectParameterivEXT(context, memoryObject, pname, params))
-        {
-            context->getMemoryObjectParameteriv(memoryObject, pname, params);
-        }
+        context->getDispatchTable()->GetMemoryObjectParameterivEXT(context, memoryObject, pname,
+                                                                   params);
     }
 }
 
@@ -3283,14 +2896,12 @@ void GL_APIENTRY GetUnsignedBytevEXT(GLenum pname, GLubyte *data)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLubyte *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetUnsignedBytevEXT, pname, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetUnsignedBytevEXT(context, pname, data))
-        {
-            context->getUnsignedBytev(pname, data);
-        }
+        context->getDispatchTable()->GetUnsignedBytevEXT(context, pname, data);
     }
 }
 
@@ -3299,15 +2910,12 @@ void GL_APIENTRY GetUnsignedBytei_vEXT(GLenum target, GLuint index, GLubyte *dat
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLubyte *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetUnsignedBytei_vEXT, target, index, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetUnsignedBytei_vEXT(context, target, index, data))
-        {
-            context->getUnsignedBytei_v(target, index, data);
-        }
+        context->getDispatchTable()->GetUnsignedBytei_vEXT(context, target, index, data);
     }
 }
 
@@ -3315,14 +2923,12 @@ GLboolean GL_APIENTRY IsMemoryObjectEXT(GLuint memoryObject)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memoryObject = %u)", memoryObject);
+    ANGLE_BINARY_EVENT(IsMemoryObjectEXT, memoryObject);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsMemoryObjectEXT(context, memoryObject))
-        {
-            return context->isMemoryObject(memoryObject);
-        }
+        return context->getDispatchTable()->IsMemoryObjectEXT(context, memoryObject);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsMemoryObjectEXT, GLboolean>();
@@ -3334,15 +2940,13 @@ void GL_APIENTRY MemoryObjectParameterivEXT(GLuint memoryObject, GLenum pname, c
     EVENT("(GLuint memoryObject = %u, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR
           ")",
           memoryObject, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(MemoryObjectParameterivEXT, memoryObject, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateMemoryObjectParameterivEXT(context, memoryObject, pname, params))
-        {
-            context->memoryObjectParameteriv(memoryObject, pname, params);
-        }
+        context->getDispatchTable()->MemoryObjectParameterivEXT(context, memoryObject, pname,
+                                                                params);
     }
 }
 
@@ -3360,18 +2964,14 @@ void GL_APIENTRY TexStorageMem2DEXT(GLenum target,
         "%d, GLsizei height = %d, GLuint memory = %u, GLuint64 offset = %llu)",
         target, levels, internalFormat, width, height, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_EVENT(TexStorageMem2DEXT, target, levels, internalFormat, width, height, memory,
+                       offset);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorageMem2DEXT(context, targetPacked, levels, internalFormat, width, height,
-                                       memory, offset))
-        {
-            context->texStorageMem2D(targetPacked, levels, internalFormat, width, height, memory,
-                                     offset);
-        }
+        context->getDispatchTable()->TexStorageMem2DEXT(context, target, levels, internalFormat,
+                                                        width, height, memory, offset);
     }
 }
 
@@ -3391,18 +2991,15 @@ void GL_APIENTRY TexStorageMem2DMultisampleEXT(GLenum target,
         "GLuint64 offset = %llu)",
         target, samples, internalFormat, width, height, fixedSampleLocations, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_EVENT(TexStorageMem2DMultisampleEXT, target, samples, internalFormat, width,
+                       height, fixedSampleLocations, memory, offset);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateTexStorageMem2DMultisampleEXT(
-                                             context, targetPacked, samples, internalFormat, width,
-                                             height, fixedSampleLocations, memory, offset))
-        {
-            context->texStorageMem2DMultisample(targetPacked, samples, internalFormat, width,
-                                                height, fixedSampleLocations, memory, offset);
-        }
+        context->getDispatchTable()->TexStorageMem2DMultisampleEXT(
+            context, target, samples, internalFormat, width, height, fixedSampleLocations, memory,
+            offset);
     }
 }
 
@@ -3421,18 +3018,14 @@ void GL_APIENTRY TexStorageMem3DEXT(GLenum target,
         "%d, GLsizei height = %d, GLsizei depth = %d, GLuint memory = %u, GLuint64 offset = %llu)",
         target, levels, internalFormat, width, height, depth, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_EVENT(TexStorageMem3DEXT, target, levels, internalFormat, width, height, depth,
+                       memory, offset);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorageMem3DEXT(context, targetPacked, levels, internalFormat, width, height,
-                                       depth, memory, offset))
-        {
-            context->texStorageMem3D(targetPacked, levels, internalFormat, width, height, depth,
-                                     memory, offset);
-        }
+        context->getDispatchTable()->TexStorageMem3DEXT(context, target, levels, internalFormat,
+                                                        width, height, depth, memory, offset);
     }
 }
 
@@ -3453,19 +3046,15 @@ void GL_APIENTRY TexStorageMem3DMultisampleEXT(GLenum target,
         "GLuint memory = %u, GLuint64 offset = %llu)",
         target, samples, internalFormat, width, height, depth, fixedSampleLocations, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_EVENT(TexStorageMem3DMultisampleEXT, target, samples, internalFormat, width,
+                       height, depth, fixedSampleLocations, memory, offset);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateTexStorageMem3DMultisampleEXT(
-                                             context, targetPacked, samples, internalFormat, width,
-                                             height, depth, fixedSampleLocations, memory, offset))
-        {
-            context->texStorageMem3DMultisample(targetPacked, samples, internalFormat, width,
-                                                height, depth, fixedSampleLocations, memory,
-                                                offset);
-        }
+        context->getDispatchTable()->TexStorageMem3DMultisampleEXT(
+            context, target, samples, internalFormat, width, height, depth, fixedSampleLocations,
+            memory, offset);
     }
 }
 
@@ -3475,16 +3064,12 @@ void GL_APIENTRY ImportMemoryFdEXT(GLuint memory, GLuint64 size, GLenum handleTy
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memory = %u, GLuint64 size = %llu, GLenum handleType = 0x%X, GLint fd = %d)",
           memory, static_cast<unsigned long long>(size), handleType, fd);
+    ANGLE_BINARY_EVENT(ImportMemoryFdEXT, memory, size, handleType, fd);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        HandleType handleTypePacked = FromGLenum<HandleType>(handleType);
-        if (context->skipValidation() ||
-            ValidateImportMemoryFdEXT(context, memory, size, handleTypePacked, fd))
-        {
-            context->importMemoryFd(memory, size, handleTypePacked, fd);
-        }
+        context->getDispatchTable()->ImportMemoryFdEXT(context, memory, size, handleType, fd);
     }
 }
 
@@ -3508,14 +3093,12 @@ GLenum GL_APIENTRY GetGraphicsResetStatusEXT()
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(GetGraphicsResetStatusEXT);
 
     Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetGraphicsResetStatusEXT(context))
-        {
-            return context->getGraphicsResetStatus();
-        }
+        return context->getDispatchTable()->GetGraphicsResetStatusEXT(context);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetGraphicsResetStatusEXT, GLenum>();
@@ -3528,15 +3111,12 @@ void GL_APIENTRY GetnUniformfvEXT(GLuint program, GLint location, GLsizei bufSiz
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLfloat *params = "
         "0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetnUniformfvEXT, program, location, bufSize, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetnUniformfvEXT(context, program, location, bufSize, params))
-        {
-            context->getnUniformfv(program, location, bufSize, params);
-        }
+        context->getDispatchTable()->GetnUniformfvEXT(context, program, location, bufSize, params);
     }
 }
 
@@ -3547,15 +3127,12 @@ void GL_APIENTRY GetnUniformivEXT(GLuint program, GLint location, GLsizei bufSiz
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLint *params = "
         "0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetnUniformivEXT, program, location, bufSize, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetnUniformivEXT(context, program, location, bufSize, params))
-        {
-            context->getnUniformiv(program, location, bufSize, params);
-        }
+        context->getDispatchTable()->GetnUniformivEXT(context, program, location, bufSize, params);
     }
 }
 
@@ -3573,15 +3150,13 @@ void GL_APIENTRY ReadnPixelsEXT(GLint x,
         "(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
         "0x%X, GLenum type = 0x%X, GLsizei bufSize = %d, void *data = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, bufSize, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(ReadnPixelsEXT, x, y, width, height, format, type, bufSize, data);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateReadnPixelsEXT(context, x, y, width, height, format, type, bufSize, data))
-        {
-            context->readnPixels(x, y, width, height, format, type, bufSize, data);
-        }
+        context->getDispatchTable()->ReadnPixelsEXT(context, x, y, width, height, format, type,
+                                                    bufSize, data);
     }
 }
 
@@ -3591,14 +3166,12 @@ void GL_APIENTRY DeleteSemaphoresEXT(GLsizei n, const GLuint *semaphores)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *semaphores = 0x%016" PRIxPTR ")", n,
           (uintptr_t)semaphores);
+    ANGLE_BINARY_EVENT(DeleteSemaphoresEXT, n, semaphores);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteSemaphoresEXT(context, n, semaphores))
-        {
-            context->deleteSemaphores(n, semaphores);
-        }
+        context->getDispatchTable()->DeleteSemaphoresEXT(context, n, semaphores);
     }
 }
 
@@ -3606,14 +3179,12 @@ void GL_APIENTRY GenSemaphoresEXT(GLsizei n, GLuint *semaphores)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *semaphores = 0x%016" PRIxPTR ")", n, (uintptr_t)semaphores);
+    ANGLE_BINARY_EVENT(GenSemaphoresEXT, n, semaphores);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenSemaphoresEXT(context, n, semaphores))
-        {
-            context->genSemaphores(n, semaphores);
-        }
+        context->getDispatchTable()->GenSemaphoresEXT(context, n, semaphores);
     }
 }
 
@@ -3622,15 +3193,13 @@ void GL_APIENTRY GetSemaphoreParameterui64vEXT(GLuint semaphore, GLenum pname, G
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u, GLenum pname = 0x%X, GLuint64 *params = 0x%016" PRIxPTR ")",
           semaphore, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSemaphoreParameterui64vEXT, semaphore, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetSemaphoreParameterui64vEXT(context, semaphore, pname, params))
-        {
-            context->getSemaphoreParameterui64v(semaphore, pname, params);
-        }
+        context->getDispatchTable()->GetSemaphoreParameterui64vEXT(context, semaphore, pname,
+                                                                   params);
     }
 }
 
@@ -3638,14 +3207,12 @@ GLboolean GL_APIENTRY IsSemaphoreEXT(GLuint semaphore)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u)", semaphore);
+    ANGLE_BINARY_EVENT(IsSemaphoreEXT, semaphore);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsSemaphoreEXT(context, semaphore))
-        {
-            return context->isSemaphore(semaphore);
-        }
+        return context->getDispatchTable()->IsSemaphoreEXT(context, semaphore);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsSemaphoreEXT, GLboolean>();
@@ -3657,15 +3224,12 @@ void GL_APIENTRY SemaphoreParameterui64vEXT(GLuint semaphore, GLenum pname, cons
     EVENT("(GLuint semaphore = %u, GLenum pname = 0x%X, const GLuint64 *params = 0x%016" PRIxPTR
           ")",
           semaphore, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(SemaphoreParameterui64vEXT, semaphore, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateSemaphoreParameterui64vEXT(context, semaphore, pname, params))
-        {
-            context->semaphoreParameterui64v(semaphore, pname, params);
-        }
+        context->getDispatchTable()->SemaphoreParameterui64vEXT(context, semaphore, pname, params);
     }
 }
 
@@ -3683,17 +3247,15 @@ void GL_APIENTRY SignalSemaphoreEXT(GLuint semaphore,
         ", const GLenum *dstLayouts = 0x%016" PRIxPTR ")",
         semaphore, numBufferBarriers, (uintptr_t)buffers, numTextureBarriers, (uintptr_t)textures,
         (uintptr_t)dstLayouts);
+    ANGLE_BINARY_EVENT(SignalSemaphoreEXT, semaphore, numBufferBarriers, buffers,
+                       numTextureBarriers, textures, dstLayouts);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateSignalSemaphoreEXT(context, semaphore, numBufferBarriers, buffers,
-                                       numTextureBarriers, textures, dstLayouts))
-        {
-            context->signalSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers,
-                                     textures, dstLayouts);
-        }
+        context->getDispatchTable()->SignalSemaphoreEXT(context, semaphore, numBufferBarriers,
+                                                        buffers, numTextureBarriers, textures,
+                                                        dstLayouts);
     }
 }
 
@@ -3711,17 +3273,15 @@ void GL_APIENTRY WaitSemaphoreEXT(GLuint semaphore,
         ", const GLenum *srcLayouts = 0x%016" PRIxPTR ")",
         semaphore, numBufferBarriers, (uintptr_t)buffers, numTextureBarriers, (uintptr_t)textures,
         (uintptr_t)srcLayouts);
+    ANGLE_BINARY_EVENT(WaitSemaphoreEXT, semaphore, numBufferBarriers, buffers, numTextureBarriers,
+                       textures, srcLayouts);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateWaitSemaphoreEXT(context, semaphore, numBufferBarriers, buffers,
-                                     numTextureBarriers, textures, srcLayouts))
-        {
-            context->waitSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers,
-                                   textures, srcLayouts);
-        }
+        context->getDispatchTable()->WaitSemaphoreEXT(context, semaphore, numBufferBarriers,
+                                                      buffers, numTextureBarriers, textures,
+                                                      srcLayouts);
     }
 }
 
@@ -3735,16 +3295,12 @@ void GL_APIENTRY ImportSemaphoreFdEXT(GLuint semaphore, GLenum handleType, GLint
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u, GLenum handleType = 0x%X, GLint fd = %d)", semaphore, handleType,
           fd);
+    ANGLE_BINARY_EVENT(ImportSemaphoreFdEXT, semaphore, handleType, fd);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        HandleType handleTypePacked = FromGLenum<HandleType>(handleType);
-        if (context->skipValidation() ||
-            ValidateImportSemaphoreFdEXT(context, semaphore, handleTypePacked, fd))
-        {
-            context->importSemaphoreFd(semaphore, handleTypePacked, fd);
-        }
+        context->getDispatchTable()->ImportSemaphoreFdEXT(context, semaphore, handleType, fd);
     }
 }
 
@@ -3759,15 +3315,13 @@ void GL_APIENTRY TexStorage1DEXT(GLenum target,
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d)",
         target, levels, internalformat, width);
+    ANGLE_BINARY_EVENT(TexStorage1DEXT, target, levels, internalformat, width);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateTexStorage1DEXT(context, target, levels, internalformat, width))
-        {
-            context->texStorage1D(target, levels, internalformat, width);
-        }
+        context->getDispatchTable()->TexStorage1DEXT(context, target, levels, internalformat,
+                                                     width);
     }
 }
 
@@ -3779,16 +3333,13 @@ TexStorage2DEXT(GLenum target, GLsizei levels, GLenum internalformat, GLsizei wi
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d)",
         target, levels, internalformat, width, height);
+    ANGLE_BINARY_EVENT(TexStorage2DEXT, target, levels, internalformat, width, height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorage2DEXT(context, targetPacked, levels, internalformat, width, height))
-        {
-            context->texStorage2D(targetPacked, levels, internalformat, width, height);
-        }
+        context->getDispatchTable()->TexStorage2DEXT(context, target, levels, internalformat, width,
+                                                     height);
     }
 }
 
@@ -3804,17 +3355,13 @@ void GL_APIENTRY TexStorage3DEXT(GLenum target,
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLsizei depth = %d)",
         target, levels, internalformat, width, height, depth);
+    ANGLE_BINARY_EVENT(TexStorage3DEXT, target, levels, internalformat, width, height, depth);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorage3DEXT(context, targetPacked, levels, internalformat, width, height,
-                                    depth))
-        {
-            context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
-        }
+        context->getDispatchTable()->TexStorage3DEXT(context, target, levels, internalformat, width,
+                                                     height, depth);
     }
 }
 
@@ -3825,15 +3372,12 @@ void GL_APIENTRY DebugMessageCallbackKHR(GLDEBUGPROCKHR callback, const void *us
     EVENT("(GLDEBUGPROCKHR callback = 0x%016" PRIxPTR ", const void *userParam = 0x%016" PRIxPTR
           ")",
           (uintptr_t)callback, (uintptr_t)userParam);
+    ANGLE_BINARY_EVENT(DebugMessageCallbackKHR, callback, userParam);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateDebugMessageCallbackKHR(context, callback, userParam))
-        {
-            context->debugMessageCallback(callback, userParam);
-        }
+        context->getDispatchTable()->DebugMessageCallbackKHR(context, callback, userParam);
     }
 }
 
@@ -3849,15 +3393,13 @@ void GL_APIENTRY DebugMessageControlKHR(GLenum source,
         "(GLenum source = 0x%X, GLenum type = 0x%X, GLenum severity = 0x%X, GLsizei count = %d, "
         "const GLuint *ids = 0x%016" PRIxPTR ", GLboolean enabled = %u)",
         source, type, severity, count, (uintptr_t)ids, enabled);
+    ANGLE_BINARY_EVENT(DebugMessageControlKHR, source, type, severity, count, ids, enabled);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateDebugMessageControlKHR(context, source, type, severity, count, ids, enabled))
-        {
-            context->debugMessageControl(source, type, severity, count, ids, enabled);
-        }
+        context->getDispatchTable()->DebugMessageControlKHR(context, source, type, severity, count,
+                                                            ids, enabled);
     }
 }
 
@@ -3873,15 +3415,13 @@ void GL_APIENTRY DebugMessageInsertKHR(GLenum source,
         "(GLenum source = 0x%X, GLenum type = 0x%X, GLuint id = %u, GLenum severity = 0x%X, "
         "GLsizei length = %d, const GLchar *buf = 0x%016" PRIxPTR ")",
         source, type, id, severity, length, (uintptr_t)buf);
+    ANGLE_BINARY_EVENT(DebugMessageInsertKHR, source, type, id, severity, length, buf);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateDebugMessageInsertKHR(context, source, type, id, severity, length, buf))
-        {
-            context->debugMessageInsert(source, type, id, severity, length, buf);
-        }
+        context->getDispatchTable()->DebugMessageInsertKHR(context, source, type, id, severity,
+                                                           length, buf);
     }
 }
 
@@ -3901,17 +3441,14 @@ GLuint GL_APIENTRY GetDebugMessageLogKHR(GLuint count,
           ", GLchar *messageLog = 0x%016" PRIxPTR ")",
           count, bufSize, (uintptr_t)sources, (uintptr_t)types, (uintptr_t)ids,
           (uintptr_t)severities, (uintptr_t)lengths, (uintptr_t)messageLog);
+    ANGLE_BINARY_EVENT(GetDebugMessageLogKHR, count, bufSize, sources, types, ids, severities,
+                       lengths, messageLog);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetDebugMessageLogKHR(context, count, bufSize, sources, types, ids, severities,
-                                          lengths, messageLog))
-        {
-            return context->getDebugMessageLog(count, bufSize, sources, types, ids, severities,
-                                               lengths, messageLog);
-        }
+        return context->getDispatchTable()->GetDebugMessageLogKHR(
+            context, count, bufSize, sources, types, ids, severities, lengths, messageLog);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetDebugMessageLogKHR, GLuint>();
@@ -3925,15 +3462,13 @@ GetObjectLabelKHR(GLenum identifier, GLuint name, GLsizei bufSize, GLsizei *leng
         "(GLenum identifier = 0x%X, GLuint name = %u, GLsizei bufSize = %d, GLsizei *length = "
         "0x%016" PRIxPTR ", GLchar *label = 0x%016" PRIxPTR ")",
         identifier, name, bufSize, (uintptr_t)length, (uintptr_t)label);
+    ANGLE_BINARY_EVENT(GetObjectLabelKHR, identifier, name, bufSize, length, label);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetObjectLabelKHR(context, identifier, name, bufSize, length, label))
-        {
-            context->getObjectLabel(identifier, name, bufSize, length, label);
-        }
+        context->getDispatchTable()->GetObjectLabelKHR(context, identifier, name, bufSize, length,
+                                                       label);
     }
 }
 
@@ -3947,15 +3482,12 @@ void GL_APIENTRY GetObjectPtrLabelKHR(const void *ptr,
           ", GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *label = 0x%016" PRIxPTR ")",
           (uintptr_t)ptr, bufSize, (uintptr_t)length, (uintptr_t)label);
+    ANGLE_BINARY_EVENT(GetObjectPtrLabelKHR, ptr, bufSize, length, label);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetObjectPtrLabelKHR(context, ptr, bufSize, length, label))
-        {
-            context->getObjectPtrLabel(ptr, bufSize, length, label);
-        }
+        context->getDispatchTable()->GetObjectPtrLabelKHR(context, ptr, bufSize, length, label);
     }
 }
 
@@ -3963,14 +3495,12 @@ void GL_APIENTRY GetPointervKHR(GLenum pname, void **params)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetPointervKHR, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetPointervKHR(context, pname, params))
-        {
-            context->getPointerv(pname, params);
-        }
+        context->getDispatchTable()->GetPointervKHR(context, pname, params);
     }
 }
 
@@ -3981,15 +3511,12 @@ void GL_APIENTRY ObjectLabelKHR(GLenum identifier, GLuint name, GLsizei length,
         "(GLenum identifier = 0x%X, GLuint name = %u, GLsizei length = %d, const GLchar *label = "
         "0x%016" PRIxPTR ")",
         identifier, name, length, (uintptr_t)label);
+    ANGLE_BINARY_EVENT(ObjectLabelKHR, identifier, name, length, label);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateObjectLabelKHR(context, identifier, name, length, label))
-        {
-            context->objectLabel(identifier, name, length, label);
-        }
+        context->getDispatchTable()->ObjectLabelKHR(context, identifier, name, length, label);
     }
 }
 
@@ -3999,14 +3526,12 @@ void GL_APIENTRY ObjectPtrLabelKHR(const void *ptr, GLsizei length, const GLchar
     EVENT("(const void *ptr = 0x%016" PRIxPTR
           ", GLsizei length = %d, const GLchar *label = 0x%016" PRIxPTR ")",
           (uintptr_t)ptr, length, (uintptr_t)label);
+    ANGLE_BINARY_EVENT(ObjectPtrLabelKHR, ptr, length, label);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateObjectPtrLabelKHR(context, ptr, length, label))
-        {
-            context->objectPtrLabel(ptr, length, label);
-        }
+        context->getDispatchTable()->ObjectPtrLabelKHR(context, ptr, length, label);
     }
 }
 
@@ -4014,14 +3539,12 @@ void GL_APIENTRY PopDebugGroupKHR()
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(PopDebugGroupKHR);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidatePopDebugGroupKHR(context))
-        {
-            context->popDebugGroup();
-        }
+        context->getDispatchTable()->PopDebugGroupKHR(context);
     }
 }
 
@@ -4032,15 +3555,12 @@ void GL_APIENTRY PushDebugGroupKHR(GLenum source, GLuint id, GLsizei length, con
         "(GLenum source = 0x%X, GLuint id = %u, GLsizei length = %d, const GLchar *message = "
         "0x%016" PRIxPTR ")",
         source, id, length, (uintptr_t)message);
+    ANGLE_BINARY_EVENT(PushDebugGroupKHR, source, id, length, message);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidatePushDebugGroupKHR(context, source, id, length, message))
-        {
-            context->pushDebugGroup(source, id, length, message);
-        }
+        context->getDispatchTable()->PushDebugGroupKHR(context, source, id, length, message);
     }
 }
 
@@ -4049,14 +3569,12 @@ void GL_APIENTRY MaxShaderCompilerThreadsKHR(GLuint count)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint count = %u)", count);
+    ANGLE_BINARY_EVENT(MaxShaderCompilerThreadsKHR, count);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateMaxShaderCompilerThreadsKHR(context, count))
-        {
-            context->maxShaderCompilerThreads(count);
-        }
+        context->getDispatchTable()->MaxShaderCompilerThreadsKHR(context, count);
     }
 }
 
@@ -4065,14 +3583,12 @@ void GL_APIENTRY DeleteFencesNV(GLsizei n, const GLuint *fences)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *fences = 0x%016" PRIxPTR ")", n, (uintptr_t)fences);
+    ANGLE_BINARY_EVENT(DeleteFencesNV, n, fences);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteFencesNV(context, n, fences))
-        {
-            context->deleteFencesNV(n, fences);
-        }
+        context->getDispatchTable()->DeleteFencesNV(context, n, fences);
     }
 }
 
@@ -4080,14 +3596,12 @@ void GL_APIENTRY FinishFenceNV(GLuint fence)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u)", fence);
+    ANGLE_BINARY_EVENT(FinishFenceNV, fence);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateFinishFenceNV(context, fence))
-        {
-            context->finishFenceNV(fence);
-        }
+        context->getDispatchTable()->FinishFenceNV(context, fence);
     }
 }
 
@@ -4095,14 +3609,12 @@ void GL_APIENTRY GenFencesNV(GLsizei n, GLuint *fences)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *fences = 0x%016" PRIxPTR ")", n, (uintptr_t)fences);
+    ANGLE_BINARY_EVENT(GenFencesNV, n, fences);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenFencesNV(context, n, fences))
-        {
-            context->genFencesNV(n, fences);
-        }
+        context->getDispatchTable()->GenFencesNV(context, n, fences);
     }
 }
 
@@ -4111,14 +3623,12 @@ void GL_APIENTRY GetFenceivNV(GLuint fence, GLenum pname, GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", fence,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFenceivNV, fence, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetFenceivNV(context, fence, pname, params))
-        {
-            context->getFenceivNV(fence, pname, params);
-        }
+        context->getDispatchTable()->GetFenceivNV(context, fence, pname, params);
     }
 }
 
@@ -4126,14 +3636,12 @@ GLboolean GL_APIENTRY IsFenceNV(GLuint fence)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u)", fence);
+    ANGLE_BINARY_EVENT(IsFenceNV, fence);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsFenceNV(context, fence))
-        {
-            return context->isFenceNV(fence);
-        }
+        return context->getDispatchTable()->IsFenceNV(context, fence);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsFenceNV, GLboolean>();
@@ -4143,14 +3651,12 @@ void GL_APIENTRY SetFenceNV(GLuint fence, GLenum condition)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u, GLenum condition = 0x%X)", fence, condition);
+    ANGLE_BINARY_EVENT(SetFenceNV, fence, condition);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateSetFenceNV(context, fence, condition))
-        {
-            context->setFenceNV(fence, condition);
-        }
+        context->getDispatchTable()->SetFenceNV(context, fence, condition);
     }
 }
 
@@ -4158,14 +3664,12 @@ GLboolean GL_APIENTRY TestFenceNV(GLuint fence)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u)", fence);
+    ANGLE_BINARY_EVENT(TestFenceNV, fence);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateTestFenceNV(context, fence))
-        {
-            return context->testFenceNV(fence);
-        }
+        return context->getDispatchTable()->TestFenceNV(context, fence);
     }
 
     return GetDefaultReturnValue<EntryPoint::TestFenceNV, GLboolean>();
@@ -4177,15 +3681,12 @@ void GL_APIENTRY EGLImageTargetRenderbufferStorageOES(GLenum target, GLeglImageO
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLeglImageOES image = 0x%016" PRIxPTR ")", target,
           (uintptr_t)image);
+    ANGLE_BINARY_EVENT(EGLImageTargetRenderbufferStorageOES, target, image);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateEGLImageTargetRenderbufferStorageOES(context, target, image))
-        {
-            context->eGLImageTargetRenderbufferStorage(target, image);
-        }
+        context->getDispatchTable()->EGLImageTargetRenderbufferStorageOES(context, target, image);
     }
 }
 
@@ -4194,16 +3695,12 @@ void GL_APIENTRY EGLImageTargetTexture2DOES(GLenum target, GLeglImageOES image)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLeglImageOES image = 0x%016" PRIxPTR ")", target,
           (uintptr_t)image);
+    ANGLE_BINARY_EVENT(EGLImageTargetTexture2DOES, target, image);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateEGLImageTargetTexture2DOES(context, targetPacked, image))
-        {
-            context->eGLImageTargetTexture2D(targetPacked, image);
-        }
+        context->getDispatchTable()->EGLImageTargetTexture2DOES(context, target, image);
     }
 }
 
@@ -4214,14 +3711,12 @@ void GL_APIENTRY DrawTexfOES(GLfloat x, GLfloat y, GLfloat z, GLfloat width, GLf
     EVENT(
         "(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f, GLfloat width = %f, GLfloat height = %f)",
         x, y, z, width, height);
+    ANGLE_BINARY_EVENT(DrawTexfOES, x, y, z, width, height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDrawTexfOES(context, x, y, z, width, height))
-        {
-            context->drawTexf(x, y, z, width, height);
-        }
+        context->getDispatchTable()->DrawTexfOES(context, x, y, z, width, height);
     }
 }
 
@@ -4229,14 +3724,12 @@ void GL_APIENTRY DrawTexfvOES(const GLfloat *coords)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfloat *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_EVENT(DrawTexfvOES, coords);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDrawTexfvOES(context, coords))
-        {
-            context->drawTexfv(coords);
-        }
+        context->getDispatchTable()->DrawTexfvOES(context, coords);
     }
 }
 
@@ -4245,14 +3738,12 @@ void GL_APIENTRY DrawTexiOES(GLint x, GLint y, GLint z, GLint width, GLint heigh
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint x = %d, GLint y = %d, GLint z = %d, GLint width = %d, GLint height = %d)", x, y,
           z, width, height);
+    ANGLE_BINARY_EVENT(DrawTexiOES, x, y, z, width, height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDrawTexiOES(context, x, y, z, width, height))
-        {
-            context->drawTexi(x, y, z, width, height);
-        }
+        context->getDispatchTable()->DrawTexiOES(context, x, y, z, width, height);
     }
 }
 
@@ -4260,14 +3751,12 @@ void GL_APIENTRY DrawTexivOES(const GLint *coords)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLint *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_EVENT(DrawTexivOES, coords);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDrawTexivOES(context, coords))
-        {
-            context->drawTexiv(coords);
-        }
+        context->getDispatchTable()->DrawTexivOES(context, coords);
     }
 }
 
@@ -4277,14 +3766,12 @@ void GL_APIENTRY DrawTexsOES(GLshort x, GLshort y, GLshort z, GLshort width, GLs
     EVENT(
         "(GLshort x = %d, GLshort y = %d, GLshort z = %d, GLshort width = %d, GLshort height = %d)",
         x, y, z, width, height);
+    ANGLE_BINARY_EVENT(DrawTexsOES, x, y, z, width, height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDrawTexsOES(context, x, y, z, width, height))
-        {
-            context->drawTexs(x, y, z, width, height);
-        }
+        context->getDispatchTable()->DrawTexsOES(context, x, y, z, width, height);
     }
 }
 
@@ -4292,14 +3779,12 @@ void GL_APIENTRY DrawTexsvOES(const GLshort *coords)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLshort *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_EVENT(DrawTexsvOES, coords);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDrawTexsvOES(context, coords))
-        {
-            context->drawTexsv(coords);
-        }
+        context->getDispatchTable()->DrawTexsvOES(context, coords);
     }
 }
 
@@ -4310,14 +3795,12 @@ void GL_APIENTRY DrawTexxOES(GLfixed x, GLfixed y, GLfixed z, GLfixed width, GLf
         "(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X, GLfixed width = 0x%X, GLfixed "
         "height = 0x%X)",
         x, y, z, width, height);
+    ANGLE_BINARY_EVENT(DrawTexxOES, x, y, z, width, height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDrawTexxOES(context, x, y, z, width, height))
-        {
-            context->drawTexx(x, y, z, width, height);
-        }
+        context->getDispatchTable()->DrawTexxOES(context, x, y, z, width, height);
     }
 }
 
@@ -4325,14 +3808,12 @@ void GL_APIENTRY DrawTexxvOES(const GLfixed *coords)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfixed *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_EVENT(DrawTexxvOES, coords);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDrawTexxvOES(context, coords))
-        {
-            context->drawTexxv(coords);
-        }
+        context->getDispatchTable()->DrawTexxvOES(context, coords);
     }
 }
 
@@ -4341,14 +3822,12 @@ void GL_APIENTRY BindFramebufferOES(GLenum target, GLuint framebuffer)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint framebuffer = %u)", target, framebuffer);
+    ANGLE_BINARY_EVENT(BindFramebufferOES, target, framebuffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBindFramebufferOES(context, target, framebuffer))
-        {
-            context->bindFramebuffer(target, framebuffer);
-        }
+        context->getDispatchTable()->BindFramebufferOES(context, target, framebuffer);
     }
 }
 
@@ -4356,14 +3835,12 @@ void GL_APIENTRY BindRenderbufferOES(GLenum target, GLuint renderbuffer)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint renderbuffer = %u)", target, renderbuffer);
+    ANGLE_BINARY_EVENT(BindRenderbufferOES, target, renderbuffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBindRenderbufferOES(context, target, renderbuffer))
-        {
-            context->bindRenderbuffer(target, renderbuffer);
-        }
+        context->getDispatchTable()->BindRenderbufferOES(context, target, renderbuffer);
     }
 }
 
@@ -4371,14 +3848,12 @@ GLenum GL_APIENTRY CheckFramebufferStatusOES(GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(CheckFramebufferStatusOES, target);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateCheckFramebufferStatusOES(context, target))
-        {
-            return context->checkFramebufferStatus(target);
-        }
+        return context->getDispatchTable()->CheckFramebufferStatusOES(context, target);
     }
 
     return GetDefaultReturnValue<EntryPoint::CheckFramebufferStatusOES, GLenum>();
@@ -4389,14 +3864,12 @@ void GL_APIENTRY DeleteFramebuffersOES(GLsizei n, const GLuint *framebuffers)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *framebuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)framebuffers);
+    ANGLE_BINARY_EVENT(DeleteFramebuffersOES, n, framebuffers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteFramebuffersOES(context, n, framebuffers))
-        {
-            context->deleteFramebuffers(n, framebuffers);
-        }
+        context->getDispatchTable()->DeleteFramebuffersOES(context, n, framebuffers);
     }
 }
 
@@ -4405,14 +3878,12 @@ void GL_APIENTRY DeleteRenderbuffersOES(GLsizei n, const GLuint *renderbuffers)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_EVENT(DeleteRenderbuffersOES, n, renderbuffers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteRenderbuffersOES(context, n, renderbuffers))
-        {
-            context->deleteRenderbuffers(n, renderbuffers);
-        }
+        context->getDispatchTable()->DeleteRenderbuffersOES(context, n, renderbuffers);
     }
 }
 
@@ -4426,16 +3897,14 @@ void GL_APIENTRY FramebufferRenderbufferOES(GLenum target,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum renderbuffertarget = 0x%X, GLuint "
         "renderbuffer = %u)",
         target, attachment, renderbuffertarget, renderbuffer);
+    ANGLE_BINARY_EVENT(FramebufferRenderbufferOES, target, attachment, renderbuffertarget,
+                       renderbuffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateFramebufferRenderbufferOES(context, target, attachment, renderbuffertarget,
-                                               renderbuffer))
-        {
-            context->framebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
-        }
+        context->getDispatchTable()->FramebufferRenderbufferOES(context, target, attachment,
+                                                                renderbuffertarget, renderbuffer);
     }
 }
 
@@ -4450,17 +3919,13 @@ void GL_APIENTRY FramebufferTexture2DOES(GLenum target,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum textarget = 0x%X, GLuint texture "
         "= %u, GLint level = %d)",
         target, attachment, textarget, texture, level);
+    ANGLE_BINARY_EVENT(FramebufferTexture2DOES, target, attachment, textarget, texture, level);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureTarget textargetPacked = FromGLenum<TextureTarget>(textarget);
-        if (context->skipValidation() ||
-            ValidateFramebufferTexture2DOES(context, target, attachment, textargetPacked, texture,
-                                            level))
-        {
-            context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
-        }
+        context->getDispatchTable()->FramebufferTexture2DOES(context, target, attachment, textarget,
+                                                             texture, level);
     }
 }
 
@@ -4468,14 +3933,12 @@ void GL_APIENTRY GenFramebuffersOES(GLsizei n, GLuint *framebuffers)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *framebuffers = 0x%016" PRIxPTR ")", n, (uintptr_t)framebuffers);
+    ANGLE_BINARY_EVENT(GenFramebuffersOES, n, framebuffers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenFramebuffersOES(context, n, framebuffers))
-        {
-            context->genFramebuffers(n, framebuffers);
-        }
+        context->getDispatchTable()->GenFramebuffersOES(context, n, framebuffers);
     }
 }
 
@@ -4484,14 +3947,12 @@ void GL_APIENTRY GenRenderbuffersOES(GLsizei n, GLuint *renderbuffers)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_EVENT(GenRenderbuffersOES, n, renderbuffers);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenRenderbuffersOES(context, n, renderbuffers))
-        {
-            context->genRenderbuffers(n, renderbuffers);
-        }
+        context->getDispatchTable()->GenRenderbuffersOES(context, n, renderbuffers);
     }
 }
 
@@ -4499,15 +3960,12 @@ void GL_APIENTRY GenerateMipmapOES(GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(GenerateMipmapOES, target);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateGenerateMipmapOES(context, targetPacked))
-        {
-            context->generateMipmap(targetPacked);
-        }
+        context->getDispatchTable()->GenerateMipmapOES(context, target);
     }
 }
 
@@ -4521,15 +3979,13 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivOES(GLenum target,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         target, attachment, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFramebufferAttachmentParameterivOES, target, attachment, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetFramebufferAttachmentParameterivOES(
-                                             context, target, attachment, pname, params))
-        {
-            context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
-        }
+        context->getDispatchTable()->GetFramebufferAttachmentParameterivOES(
+            context, target, attachment, pname, params);
     }
 }
 
@@ -4538,15 +3994,12 @@ void GL_APIENTRY GetRenderbufferParameterivOES(GLenum target, GLenum pname, GLin
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetRenderbufferParameterivOES, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetRenderbufferParameterivOES(context, target, pname, params))
-        {
-            context->getRenderbufferParameteriv(target, pname, params);
-        }
+        context->getDispatchTable()->GetRenderbufferParameterivOES(context, target, pname, params);
     }
 }
 
@@ -4554,14 +4007,12 @@ GLboolean GL_APIENTRY IsFramebufferOES(GLuint framebuffer)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint framebuffer = %u)", framebuffer);
+    ANGLE_BINARY_EVENT(IsFramebufferOES, framebuffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsFramebufferOES(context, framebuffer))
-        {
-            return context->isFramebuffer(framebuffer);
-        }
+        return context->getDispatchTable()->IsFramebufferOES(context, framebuffer);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsFramebufferOES, GLboolean>();
@@ -4571,14 +4022,12 @@ GLboolean GL_APIENTRY IsRenderbufferOES(GLuint renderbuffer)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint renderbuffer = %u)", renderbuffer);
+    ANGLE_BINARY_EVENT(IsRenderbufferOES, renderbuffer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsRenderbufferOES(context, renderbuffer))
-        {
-            return context->isRenderbuffer(renderbuffer);
-        }
+        return context->getDispatchTable()->IsRenderbufferOES(context, renderbuffer);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsRenderbufferOES, GLboolean>();
@@ -4594,15 +4043,13 @@ void GL_APIENTRY RenderbufferStorageOES(GLenum target,
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLsizei width = %d, GLsizei height = "
         "%d)",
         target, internalformat, width, height);
+    ANGLE_BINARY_EVENT(RenderbufferStorageOES, target, internalformat, width, height);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateRenderbufferStorageOES(context, target, internalformat, width, height))
-        {
-            context->renderbufferStorage(target, internalformat, width, height);
-        }
+        context->getDispatchTable()->RenderbufferStorageOES(context, target, internalformat, width,
+                                                            height);
     }
 }
 
@@ -4617,15 +4064,13 @@ void GL_APIENTRY GetProgramBinaryOES(GLuint program,
     EVENT("(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLenum *binaryFormat = 0x%016" PRIxPTR ", void *binary = 0x%016" PRIxPTR ")",
           program, bufSize, (uintptr_t)length, (uintptr_t)binaryFormat, (uintptr_t)binary);
+    ANGLE_BINARY_EVENT(GetProgramBinaryOES, program, bufSize, length, binaryFormat, binary);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetProgramBinaryOES(context, program, bufSize, length, binaryFormat, binary))
-        {
-            context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
-        }
+        context->getDispatchTable()->GetProgramBinaryOES(context, program, bufSize, length,
+                                                         binaryFormat, binary);
     }
 }
 
@@ -4638,15 +4083,13 @@ void GL_APIENTRY ProgramBinaryOES(GLuint program,
     EVENT("(GLuint program = %u, GLenum binaryFormat = 0x%X, const void *binary = 0x%016" PRIxPTR
           ", GLint length = %d)",
           program, binaryFormat, (uintptr_t)binary, length);
+    ANGLE_BINARY_EVENT(ProgramBinaryOES, program, binaryFormat, binary, length);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateProgramBinaryOES(context, program, binaryFormat, binary, length))
-        {
-            context->programBinary(program, binaryFormat, binary, length);
-        }
+        context->getDispatchTable()->ProgramBinaryOES(context, program, binaryFormat, binary,
+                                                      length);
     }
 }
 
@@ -4656,16 +4099,12 @@ void GL_APIENTRY GetBufferPointervOES(GLenum target, GLenum pname, void **params
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferPointervOES, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateGetBufferPointervOES(context, targetPacked, pname, params))
-        {
-            context->getBufferPointerv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->GetBufferPointervOES(context, target, pname, params);
     }
 }
 
@@ -4673,15 +4112,12 @@ void *GL_APIENTRY MapBufferOES(GLenum target, GLenum access)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum access = 0x%X)", target, access);
+    ANGLE_BINARY_EVENT(MapBufferOES, target, access);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateMapBufferOES(context, targetPacked, access))
-        {
-            return context->mapBuffer(targetPacked, access);
-        }
+        return context->getDispatchTable()->MapBufferOES(context, target, access);
     }
 
     return GetDefaultReturnValue<EntryPoint::MapBufferOES, void *>();
@@ -4691,15 +4127,12 @@ GLboolean GL_APIENTRY UnmapBufferOES(GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(UnmapBufferOES, target);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateUnmapBufferOES(context, targetPacked))
-        {
-            return context->unmapBuffer(targetPacked);
-        }
+        return context->getDispatchTable()->UnmapBufferOES(context, target);
     }
 
     return GetDefaultReturnValue<EntryPoint::UnmapBufferOES, GLboolean>();
@@ -4710,15 +4143,12 @@ void GL_APIENTRY CurrentPaletteMatrixOES(GLuint matrixpaletteindex)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint matrixpaletteindex = %u)", matrixpaletteindex);
+    ANGLE_BINARY_EVENT(CurrentPaletteMatrixOES, matrixpaletteindex);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateCurrentPaletteMatrixOES(context, matrixpaletteindex))
-        {
-            context->currentPaletteMatrix(matrixpaletteindex);
-        }
+        context->getDispatchTable()->CurrentPaletteMatrixOES(context, matrixpaletteindex);
     }
 }
 
@@ -4726,14 +4156,12 @@ void GL_APIENTRY LoadPaletteFromModelViewMatrixOES()
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(LoadPaletteFromModelViewMatrixOES);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateLoadPaletteFromModelViewMatrixOES(context))
-        {
-            context->loadPaletteFromModelViewMatrix();
-        }
+        context->getDispatchTable()->LoadPaletteFromModelViewMatrixOES(context);
     }
 }
 
@@ -4744,15 +4172,12 @@ void GL_APIENTRY MatrixIndexPointerOES(GLint size, GLenum type, GLsizei stride,
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(MatrixIndexPointerOES, size, type, stride, pointer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateMatrixIndexPointerOES(context, size, type, stride, pointer))
-        {
-            context->matrixIndexPointer(size, type, stride, pointer);
-        }
+        context->getDispatchTable()->MatrixIndexPointerOES(context, size, type, stride, pointer);
     }
 }
 
@@ -4763,15 +4188,12 @@ void GL_APIENTRY WeightPointerOES(GLint size, GLenum type, GLsizei stride, const
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(WeightPointerOES, size, type, stride, pointer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateWeightPointerOES(context, size, type, stride, pointer))
-        {
-            context->weightPointer(size, type, stride, pointer);
-        }
+        context->getDispatchTable()->WeightPointerOES(context, size, type, stride, pointer);
     }
 }
 
@@ -4781,16 +4203,12 @@ void GL_APIENTRY PointSizePointerOES(GLenum type, GLsizei stride, const void *po
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
           type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(PointSizePointerOES, type, stride, pointer);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidatePointSizePointerOES(context, typePacked, stride, pointer))
-        {
-            context->pointSizePointer(typePacked, stride, pointer);
-        }
+        context->getDispatchTable()->PointSizePointerOES(context, type, stride, pointer);
     }
 }
 
@@ -4800,14 +4218,12 @@ GLbitfield GL_APIENTRY QueryMatrixxOES(GLfixed *mantissa, GLint *exponent)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed *mantissa = 0x%016" PRIxPTR ", GLint *exponent = 0x%016" PRIxPTR ")",
           (uintptr_t)mantissa, (uintptr_t)exponent);
+    ANGLE_BINARY_EVENT(QueryMatrixxOES, mantissa, exponent);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateQueryMatrixxOES(context, mantissa, exponent))
-        {
-            return context->queryMatrixx(mantissa, exponent);
-        }
+        return context->getDispatchTable()->QueryMatrixxOES(context, mantissa, exponent);
     }
 
     return GetDefaultReturnValue<EntryPoint::QueryMatrixxOES, GLbitfield>();
@@ -4819,15 +4235,12 @@ void GL_APIENTRY GetSamplerParameterIivOES(GLuint sampler, GLenum pname, GLint *
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", sampler,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterIivOES, sampler, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetSamplerParameterIivOES(context, sampler, pname, params))
-        {
-            context->getSamplerParameterIiv(sampler, pname, params);
-        }
+        context->getDispatchTable()->GetSamplerParameterIivOES(context, sampler, pname, params);
     }
 }
 
@@ -4836,15 +4249,12 @@ void GL_APIENTRY GetSamplerParameterIuivOES(GLuint sampler, GLenum pname, GLuint
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", sampler,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterIuivOES, sampler, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateGetSamplerParameterIuivOES(context, sampler, pname, params))
-        {
-            context->getSamplerParameterIuiv(sampler, pname, params);
-        }
+        context->getDispatchTable()->GetSamplerParameterIuivOES(context, sampler, pname, params);
     }
 }
 
@@ -4853,16 +4263,12 @@ void GL_APIENTRY GetTexParameterIivOES(GLenum target, GLenum pname, GLint *param
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterIivOES, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexParameterIivOES(context, targetPacked, pname, params))
-        {
-            context->getTexParameterIiv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->GetTexParameterIivOES(context, target, pname, params);
     }
 }
 
@@ -4871,16 +4277,12 @@ void GL_APIENTRY GetTexParameterIuivOES(GLenum target, GLenum pname, GLuint *par
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterIuivOES, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexParameterIuivOES(context, targetPacked, pname, params))
-        {
-            context->getTexParameterIuiv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->GetTexParameterIuivOES(context, target, pname, params);
     }
 }
 
@@ -4889,15 +4291,12 @@ void GL_APIENTRY SamplerParameterIivOES(GLuint sampler, GLenum pname, const GLin
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLint *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterIivOES, sampler, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateSamplerParameterIivOES(context, sampler, pname, param))
-        {
-            context->samplerParameterIiv(sampler, pname, param);
-        }
+        context->getDispatchTable()->SamplerParameterIivOES(context, sampler, pname, param);
     }
 }
 
@@ -4906,15 +4305,12 @@ void GL_APIENTRY SamplerParameterIuivOES(GLuint sampler, GLenum pname, const GLu
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLuint *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterIuivOES, sampler, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateSamplerParameterIuivOES(context, sampler, pname, param))
-        {
-            context->samplerParameterIuiv(sampler, pname, param);
-        }
+        context->getDispatchTable()->SamplerParameterIuivOES(context, sampler, pname, param);
     }
 }
 
@@ -4923,16 +4319,12 @@ void GL_APIENTRY TexParameterIivOES(GLenum target, GLenum pname, const GLint *pa
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterIivOES, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterIivOES(context, targetPacked, pname, params))
-        {
-            context->texParameterIiv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->TexParameterIivOES(context, target, pname, params);
     }
 }
 
@@ -4941,16 +4333,12 @@ void GL_APIENTRY TexParameterIuivOES(GLenum target, GLenum pname, const GLuint *
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLuint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterIuivOES, target, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterIuivOES(context, targetPacked, pname, params))
-        {
-            context->texParameterIuiv(targetPacked, pname, params);
-        }
+        context->getDispatchTable()->TexParameterIuivOES(context, target, pname, params);
     }
 }
 
@@ -4960,14 +4348,12 @@ void GL_APIENTRY GetTexGenfvOES(GLenum coord, GLenum pname, GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", coord,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexGenfvOES, coord, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetTexGenfvOES(context, coord, pname, params))
-        {
-            context->getTexGenfv(coord, pname, params);
-        }
+        context->getDispatchTable()->GetTexGenfvOES(context, coord, pname, params);
     }
 }
 
@@ -4976,14 +4362,12 @@ void GL_APIENTRY GetTexGenivOES(GLenum coord, GLenum pname, GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", coord,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexGenivOES, coord, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetTexGenivOES(context, coord, pname, params))
-        {
-            context->getTexGeniv(coord, pname, params);
-        }
+        context->getDispatchTable()->GetTexGenivOES(context, coord, pname, params);
     }
 }
 
@@ -4992,14 +4376,12 @@ void GL_APIENTRY GetTexGenxvOES(GLenum coord, GLenum pname, GLfixed *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", coord,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexGenxvOES, coord, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGetTexGenxvOES(context, coord, pname, params))
-        {
-            context->getTexGenxv(coord, pname, params);
-        }
+        context->getDispatchTable()->GetTexGenxvOES(context, coord, pname, params);
     }
 }
 
@@ -5007,14 +4389,12 @@ void GL_APIENTRY TexGenfOES(GLenum coord, GLenum pname, GLfloat param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", coord, pname, param);
+    ANGLE_BINARY_EVENT(TexGenfOES, coord, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateTexGenfOES(context, coord, pname, param))
-        {
-            context->texGenf(coord, pname, param);
-        }
+        context->getDispatchTable()->TexGenfOES(context, coord, pname, param);
     }
 }
 
@@ -5023,14 +4403,12 @@ void GL_APIENTRY TexGenfvOES(GLenum coord, GLenum pname, const GLfloat *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           coord, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexGenfvOES, coord, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateTexGenfvOES(context, coord, pname, params))
-        {
-            context->texGenfv(coord, pname, params);
-        }
+        context->getDispatchTable()->TexGenfvOES(context, coord, pname, params);
     }
 }
 
@@ -5038,14 +4416,12 @@ void GL_APIENTRY TexGeniOES(GLenum coord, GLenum pname, GLint param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLint param = %d)", coord, pname, param);
+    ANGLE_BINARY_EVENT(TexGeniOES, coord, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateTexGeniOES(context, coord, pname, param))
-        {
-            context->texGeni(coord, pname, param);
-        }
+        context->getDispatchTable()->TexGeniOES(context, coord, pname, param);
     }
 }
 
@@ -5054,14 +4430,12 @@ void GL_APIENTRY TexGenivOES(GLenum coord, GLenum pname, const GLint *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           coord, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexGenivOES, coord, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateTexGenivOES(context, coord, pname, params))
-        {
-            context->texGeniv(coord, pname, params);
-        }
+        context->getDispatchTable()->TexGenivOES(context, coord, pname, params);
     }
 }
 
@@ -5069,14 +4443,12 @@ void GL_APIENTRY TexGenxOES(GLenum coord, GLenum pname, GLfixed param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", coord, pname, param);
+    ANGLE_BINARY_EVENT(TexGenxOES, coord, pname, param);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateTexGenxOES(context, coord, pname, param))
-        {
-            context->texGenx(coord, pname, param);
-        }
+        context->getDispatchTable()->TexGenxOES(context, coord, pname, param);
     }
 }
 
@@ -5085,14 +4457,12 @@ void GL_APIENTRY TexGenxvOES(GLenum coord, GLenum pname, const GLfixed *params)
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           coord, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexGenxvOES, coord, pname, params);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateTexGenxvOES(context, coord, pname, params))
-        {
-            context->texGenxv(coord, pname, params);
-        }
+        context->getDispatchTable()->TexGenxvOES(context, coord, pname, params);
     }
 }
 
@@ -5110,18 +4480,14 @@ void GL_APIENTRY TexStorage3DMultisampleOES(GLenum target,
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d, GLsizei depth = %d, GLboolean fixedsamplelocations = %u)",
         target, samples, internalformat, width, height, depth, fixedsamplelocations);
+    ANGLE_BINARY_EVENT(TexStorage3DMultisampleOES, target, samples, internalformat, width, height,
+                       depth, fixedsamplelocations);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorage3DMultisampleOES(context, targetPacked, samples, internalformat,
-                                               width, height, depth, fixedsamplelocations))
-        {
-            context->texStorage3DMultisample(targetPacked, samples, internalformat, width, height,
-                                             depth, fixedsamplelocations);
-        }
+        context->getDispatchTable()->TexStorage3DMultisampleOES(
+            context, target, samples, internalformat, width, height, depth, fixedsamplelocations);
     }
 }
 
@@ -5130,14 +4496,12 @@ void GL_APIENTRY BindVertexArrayOES(GLuint array)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_EVENT(BindVertexArrayOES, array);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateBindVertexArrayOES(context, array))
-        {
-            context->bindVertexArray(array);
-        }
+        context->getDispatchTable()->BindVertexArrayOES(context, array);
     }
 }
 
@@ -5145,14 +4509,12 @@ void GL_APIENTRY DeleteVertexArraysOES(GLsizei n, const GLuint *arrays)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_EVENT(DeleteVertexArraysOES, n, arrays);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateDeleteVertexArraysOES(context, n, arrays))
-        {
-            context->deleteVertexArrays(n, arrays);
-        }
+        context->getDispatchTable()->DeleteVertexArraysOES(context, n, arrays);
     }
 }
 
@@ -5160,14 +4522,12 @@ void GL_APIENTRY GenVertexArraysOES(GLsizei n, GLuint *arrays)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_EVENT(GenVertexArraysOES, n, arrays);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateGenVertexArraysOES(context, n, arrays))
-        {
-            context->genVertexArrays(n, arrays);
-        }
+        context->getDispatchTable()->GenVertexArraysOES(context, n, arrays);
     }
 }
 
@@ -5175,14 +4535,12 @@ GLboolean GL_APIENTRY IsVertexArrayOES(GLuint array)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_EVENT(IsVertexArrayOES, array);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() || ValidateIsVertexArrayOES(context, array))
-        {
-            return context->isVertexArray(array);
-        }
+        return context->getDispatchTable()->IsVertexArrayOES(context, array);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsVertexArrayOES, GLboolean>();
@@ -5201,17 +4559,14 @@ void GL_APIENTRY FramebufferTextureMultiviewOVR(GLenum target,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint texture = %u, GLint level = %d, "
         "GLint baseViewIndex = %d, GLsizei numViews = %d)",
         target, attachment, texture, level, baseViewIndex, numViews);
+    ANGLE_BINARY_EVENT(FramebufferTextureMultiviewOVR, target, attachment, texture, level,
+                       baseViewIndex, numViews);
 
-    Context *context = GetValidGlobalContext();
+    Context *context = GetGlobalContext();
     if (context)
     {
-        if (context->skipValidation() ||
-            ValidateFramebufferTextureMultiviewOVR(context, target, attachment, texture, level,
-                                                   baseViewIndex, numViews))
-        {
-            context->framebufferTextureMultiview(target, attachment, texture, level, baseViewIndex,
-                                                 numViews);
-        }
+        context->getDispatchTable()->FramebufferTextureMultiviewOVR(
+            context, target, attachment, texture, level, baseViewIndex, numViews);
     }
 }
 
@@ -5222,48 +4577,39 @@ void GL_APIENTRY ActiveShaderProgramContextANGLE(GLeglContext ctx, GLuint pipeli
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLuint program = %u)", pipeline, program);
+    ANGLE_BINARY_EVENT(ActiveShaderProgram, pipeline, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateActiveShaderProgram(context, pipeline, program))
-        {
-            context->activeShaderProgram(pipeline, program);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ActiveShaderProgram(context, pipeline, program);
     }
 }
 
 void GL_APIENTRY ActiveTextureContextANGLE(GLeglContext ctx, GLenum texture)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum texture = 0x%X)", texture);
+    ANGLE_BINARY_EVENT(ActiveTexture, texture);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateActiveTexture(context, texture))
-        {
-            context->activeTexture(texture);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ActiveTexture(context, texture);
     }
 }
 
 void GL_APIENTRY AlphaFuncContextANGLE(GLeglContext ctx, GLenum func, GLfloat ref)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLfloat ref = %f)", func, ref);
+    ANGLE_BINARY_EVENT(AlphaFunc, func, ref);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        AlphaTestFunc funcPacked = FromGLenum<AlphaTestFunc>(func);
-        if (context->skipValidation() || ValidateAlphaFunc(context, funcPacked, ref))
-        {
-            context->alphaFunc(funcPacked, ref);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->AlphaFunc(context, func, ref);
     }
 }
 
@@ -5271,16 +4617,13 @@ void GL_APIENTRY AlphaFuncxContextANGLE(GLeglContext ctx, GLenum func, GLfixed r
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLfixed ref = 0x%X)", func, ref);
+    ANGLE_BINARY_EVENT(AlphaFuncx, func, ref);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        AlphaTestFunc funcPacked = FromGLenum<AlphaTestFunc>(func);
-        if (context->skipValidation() || ValidateAlphaFuncx(context, funcPacked, ref))
-        {
-            context->alphaFuncx(funcPacked, ref);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->AlphaFuncx(context, func, ref);
     }
 }
 
@@ -5288,15 +4631,13 @@ void GL_APIENTRY AttachShaderContextANGLE(GLeglContext ctx, GLuint program, GLui
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint shader = %u)", program, shader);
+    ANGLE_BINARY_EVENT(AttachShader, program, shader);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateAttachShader(context, program, shader))
-        {
-            context->attachShader(program, shader);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->AttachShader(context, program, shader);
     }
 }
 
@@ -5304,16 +4645,13 @@ void GL_APIENTRY BeginQueryContextANGLE(GLeglContext ctx, GLenum target, GLuint
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint id = %u)", target, id);
+    ANGLE_BINARY_EVENT(BeginQuery, target, id);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() || ValidateBeginQuery(context, targetPacked, id))
-        {
-            context->beginQuery(targetPacked, id);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BeginQuery(context, target, id);
     }
 }
 
@@ -5321,16 +4659,13 @@ void GL_APIENTRY BeginQueryEXTContextANGLE(GLeglContext ctx, GLenum target, GLui
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint id = %u)", target, id);
+    ANGLE_BINARY_EVENT(BeginQueryEXT, target, id);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() || ValidateBeginQueryEXT(context, targetPacked, id))
-        {
-            context->beginQuery(targetPacked, id);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BeginQueryEXT(context, target, id);
     }
 }
 
@@ -5338,17 +4673,13 @@ void GL_APIENTRY BeginTransformFeedbackContextANGLE(GLeglContext ctx, GLenum pri
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum primitiveMode = 0x%X)", primitiveMode);
+    ANGLE_BINARY_EVENT(BeginTransformFeedback, primitiveMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode primitiveModePacked = FromGLenum<PrimitiveMode>(primitiveMode);
-        if (context->skipValidation() ||
-            ValidateBeginTransformFeedback(context, primitiveModePacked))
-        {
-            context->beginTransformFeedback(primitiveModePacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BeginTransformFeedback(context, primitiveMode);
     }
 }
 
@@ -5360,15 +4691,13 @@ void GL_APIENTRY BindAttribLocationContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint index = %u, const GLchar *name = 0x%016" PRIxPTR ")",
           program, index, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(BindAttribLocation, program, index, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBindAttribLocation(context, program, index, name))
-        {
-            context->bindAttribLocation(program, index, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindAttribLocation(context, program, index, name);
     }
 }
 
@@ -5376,16 +4705,13 @@ void GL_APIENTRY BindBufferContextANGLE(GLeglContext ctx, GLenum target, GLuint
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint buffer = %u)", target, buffer);
+    ANGLE_BINARY_EVENT(BindBuffer, target, buffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateBindBuffer(context, targetPacked, buffer))
-        {
-            context->bindBuffer(targetPacked, buffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindBuffer(context, target, buffer);
     }
 }
 
@@ -5396,17 +4722,13 @@ void GL_APIENTRY BindBufferBaseContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLuint buffer = %u)", target, index, buffer);
+    ANGLE_BINARY_EVENT(BindBufferBase, target, index, buffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateBindBufferBase(context, targetPacked, index, buffer))
-        {
-            context->bindBufferBase(targetPacked, index, buffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindBufferBase(context, target, index, buffer);
     }
 }
 
@@ -5423,17 +4745,13 @@ void GL_APIENTRY BindBufferRangeContextANGLE(GLeglContext ctx,
         "GLsizeiptr size = %llu)",
         target, index, buffer, static_cast<unsigned long long>(offset),
         static_cast<unsigned long long>(size));
+    ANGLE_BINARY_EVENT(BindBufferRange, target, index, buffer, offset, size);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateBindBufferRange(context, targetPacked, index, buffer, offset, size))
-        {
-            context->bindBufferRange(targetPacked, index, buffer, offset, size);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindBufferRange(context, target, index, buffer, offset, size);
     }
 }
 
@@ -5445,16 +4763,13 @@ void GL_APIENTRY BindFragDataLocationEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint color = %u, const GLchar *name = 0x%016" PRIxPTR ")",
           program, color, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(BindFragDataLocationEXT, program, color, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateBindFragDataLocationEXT(context, program, color, name))
-        {
-            context->bindFragDataLocation(program, color, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindFragDataLocationEXT(context, program, color, name);
     }
 }
 
@@ -5469,16 +4784,14 @@ void GL_APIENTRY BindFragDataLocationIndexedEXTContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLuint colorNumber = %u, GLuint index = %u, const GLchar *name = "
         "0x%016" PRIxPTR ")",
         program, colorNumber, index, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(BindFragDataLocationIndexedEXT, program, colorNumber, index, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateBindFragDataLocationIndexedEXT(context, program, colorNumber, index, name))
-        {
-            context->bindFragDataLocationIndexed(program, colorNumber, index, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindFragDataLocationIndexedEXT(context, program, colorNumber,
+                                                                    index, name);
     }
 }
 
@@ -5486,15 +4799,13 @@ void GL_APIENTRY BindFramebufferContextANGLE(GLeglContext ctx, GLenum target, GL
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint framebuffer = %u)", target, framebuffer);
+    ANGLE_BINARY_EVENT(BindFramebuffer, target, framebuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBindFramebuffer(context, target, framebuffer))
-        {
-            context->bindFramebuffer(target, framebuffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindFramebuffer(context, target, framebuffer);
     }
 }
 
@@ -5502,15 +4813,13 @@ void GL_APIENTRY BindFramebufferOESContextANGLE(GLeglContext ctx, GLenum target,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint framebuffer = %u)", target, framebuffer);
+    ANGLE_BINARY_EVENT(BindFramebufferOES, target, framebuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBindFramebufferOES(context, target, framebuffer))
-        {
-            context->bindFramebuffer(target, framebuffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindFramebufferOES(context, target, framebuffer);
     }
 }
 
@@ -5528,16 +4837,14 @@ void GL_APIENTRY BindImageTextureContextANGLE(GLeglContext ctx,
         "(GLuint unit = %u, GLuint texture = %u, GLint level = %d, GLboolean layered = %u, GLint "
         "layer = %d, GLenum access = 0x%X, GLenum format = 0x%X)",
         unit, texture, level, layered, layer, access, format);
+    ANGLE_BINARY_EVENT(BindImageTexture, unit, texture, level, layered, layer, access, format);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateBindImageTexture(context, unit, texture, level, layered, layer, access, format))
-        {
-            context->bindImageTexture(unit, texture, level, layered, layer, access, format);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindImageTexture(context, unit, texture, level, layered, layer,
+                                                      access, format);
     }
 }
 
@@ -5545,15 +4852,13 @@ void GL_APIENTRY BindProgramPipelineContextANGLE(GLeglContext ctx, GLuint pipeli
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u)", pipeline);
+    ANGLE_BINARY_EVENT(BindProgramPipeline, pipeline);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBindProgramPipeline(context, pipeline))
-        {
-            context->bindProgramPipeline(pipeline);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindProgramPipeline(context, pipeline);
     }
 }
 
@@ -5561,15 +4866,13 @@ void GL_APIENTRY BindRenderbufferContextANGLE(GLeglContext ctx, GLenum target, G
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint renderbuffer = %u)", target, renderbuffer);
+    ANGLE_BINARY_EVENT(BindRenderbuffer, target, renderbuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBindRenderbuffer(context, target, renderbuffer))
-        {
-            context->bindRenderbuffer(target, renderbuffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindRenderbuffer(context, target, renderbuffer);
     }
 }
 
@@ -5579,15 +4882,13 @@ void GL_APIENTRY BindRenderbufferOESContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint renderbuffer = %u)", target, renderbuffer);
+    ANGLE_BINARY_EVENT(BindRenderbufferOES, target, renderbuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBindRenderbufferOES(context, target, renderbuffer))
-        {
-            context->bindRenderbuffer(target, renderbuffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindRenderbufferOES(context, target, renderbuffer);
     }
 }
 
@@ -5595,15 +4896,13 @@ void GL_APIENTRY BindSamplerContextANGLE(GLeglContext ctx, GLuint unit, GLuint s
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint unit = %u, GLuint sampler = %u)", unit, sampler);
+    ANGLE_BINARY_EVENT(BindSampler, unit, sampler);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBindSampler(context, unit, sampler))
-        {
-            context->bindSampler(unit, sampler);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindSampler(context, unit, sampler);
     }
 }
 
@@ -5611,16 +4910,13 @@ void GL_APIENTRY BindTextureContextANGLE(GLeglContext ctx, GLenum target, GLuint
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint texture = %u)", target, texture);
+    ANGLE_BINARY_EVENT(BindTexture, target, texture);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateBindTexture(context, targetPacked, texture))
-        {
-            context->bindTexture(targetPacked, texture);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindTexture(context, target, texture);
     }
 }
 
@@ -5628,15 +4924,13 @@ void GL_APIENTRY BindTransformFeedbackContextANGLE(GLeglContext ctx, GLenum targ
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint id = %u)", target, id);
+    ANGLE_BINARY_EVENT(BindTransformFeedback, target, id);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBindTransformFeedback(context, target, id))
-        {
-            context->bindTransformFeedback(target, id);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindTransformFeedback(context, target, id);
     }
 }
 
@@ -5644,15 +4938,13 @@ void GL_APIENTRY BindVertexArrayContextANGLE(GLeglContext ctx, GLuint array)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_EVENT(BindVertexArray, array);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBindVertexArray(context, array))
-        {
-            context->bindVertexArray(array);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindVertexArray(context, array);
     }
 }
 
@@ -5660,15 +4952,13 @@ void GL_APIENTRY BindVertexArrayOESContextANGLE(GLeglContext ctx, GLuint array)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_EVENT(BindVertexArrayOES, array);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBindVertexArrayOES(context, array))
-        {
-            context->bindVertexArray(array);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindVertexArrayOES(context, array);
     }
 }
 
@@ -5683,50 +4973,42 @@ void GL_APIENTRY BindVertexBufferContextANGLE(GLeglContext ctx,
         "(GLuint bindingindex = %u, GLuint buffer = %u, GLintptr offset = %llu, GLsizei stride = "
         "%d)",
         bindingindex, buffer, static_cast<unsigned long long>(offset), stride);
+    ANGLE_BINARY_EVENT(BindVertexBuffer, bindingindex, buffer, offset, stride);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateBindVertexBuffer(context, bindingindex, buffer, offset, stride))
-        {
-            context->bindVertexBuffer(bindingindex, buffer, offset, stride);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindVertexBuffer(context, bindingindex, buffer, offset,
+                                                      stride);
     }
 }
 
 void GL_APIENTRY
 BlendColorContextANGLE(GLeglContext ctx, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, GLfloat alpha = %f)", red,
           green, blue, alpha);
+    ANGLE_BINARY_EVENT(BlendColor, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBlendColor(context, red, green, blue, alpha))
-        {
-            context->blendColor(red, green, blue, alpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BlendColor(context, red, green, blue, alpha);
     }
 }
 
 void GL_APIENTRY BlendEquationContextANGLE(GLeglContext ctx, GLenum mode)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_EVENT(BlendEquation, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBlendEquation(context, mode))
-        {
-            context->blendEquation(mode);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BlendEquation(context, mode);
     }
 }
 
@@ -5734,33 +5016,27 @@ void GL_APIENTRY BlendEquationSeparateContextANGLE(GLeglContext ctx,
                                                    GLenum modeRGB,
                                                    GLenum modeAlpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum modeRGB = 0x%X, GLenum modeAlpha = 0x%X)", modeRGB, modeAlpha);
+    ANGLE_BINARY_EVENT(BlendEquationSeparate, modeRGB, modeAlpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBlendEquationSeparate(context, modeRGB, modeAlpha))
-        {
-            context->blendEquationSeparate(modeRGB, modeAlpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BlendEquationSeparate(context, modeRGB, modeAlpha);
     }
 }
 
 void GL_APIENTRY BlendFuncContextANGLE(GLeglContext ctx, GLenum sfactor, GLenum dfactor)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum sfactor = 0x%X, GLenum dfactor = 0x%X)", sfactor, dfactor);
+    ANGLE_BINARY_EVENT(BlendFunc, sfactor, dfactor);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateBlendFunc(context, sfactor, dfactor))
-        {
-            context->blendFunc(sfactor, dfactor);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BlendFunc(context, sfactor, dfactor);
     }
 }
 
@@ -5770,21 +5046,18 @@ void GL_APIENTRY BlendFuncSeparateContextANGLE(GLeglContext ctx,
                                                GLenum sfactorAlpha,
                                                GLenum dfactorAlpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum sfactorRGB = 0x%X, GLenum dfactorRGB = 0x%X, GLenum sfactorAlpha = 0x%X, GLenum "
         "dfactorAlpha = 0x%X)",
         sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
+    ANGLE_BINARY_EVENT(BlendFuncSeparate, sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateBlendFuncSeparate(context, sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha))
-        {
-            context->blendFuncSeparate(sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BlendFuncSeparate(context, sfactorRGB, dfactorRGB,
+                                                       sfactorAlpha, dfactorAlpha);
     }
 }
 
@@ -5806,18 +5079,15 @@ void GL_APIENTRY BlitFramebufferContextANGLE(GLeglContext ctx,
         "%d, GLint dstY0 = %d, GLint dstX1 = %d, GLint dstY1 = %d, GLbitfield mask = 0x%X, GLenum "
         "filter = 0x%X)",
         srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask, filter);
+    ANGLE_BINARY_EVENT(BlitFramebuffer, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1,
+                       mask, filter);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateBlitFramebuffer(context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1,
-                                    mask, filter))
-        {
-            context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask,
-                                     filter);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BlitFramebuffer(context, srcX0, srcY0, srcX1, srcY1, dstX0,
+                                                     dstY0, dstX1, dstY1, mask, filter);
     }
 }
 
@@ -5839,18 +5109,15 @@ void GL_APIENTRY BlitFramebufferANGLEContextANGLE(GLeglContext ctx,
         "%d, GLint dstY0 = %d, GLint dstX1 = %d, GLint dstY1 = %d, GLbitfield mask = 0x%X, GLenum "
         "filter = 0x%X)",
         srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask, filter);
+    ANGLE_BINARY_EVENT(BlitFramebufferANGLE, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1,
+                       mask, filter);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateBlitFramebufferANGLE(context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
-                                         dstY1, mask, filter))
-        {
-            context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask,
-                                     filter);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BlitFramebufferANGLE(context, srcX0, srcY0, srcX1, srcY1,
+                                                          dstX0, dstY0, dstX1, dstY1, mask, filter);
     }
 }
 
@@ -5864,18 +5131,13 @@ void GL_APIENTRY BufferDataContextANGLE(GLeglContext ctx,
     EVENT("(GLenum target = 0x%X, GLsizeiptr size = %llu, const void *data = 0x%016" PRIxPTR
           ", GLenum usage = 0x%X)",
           target, static_cast<unsigned long long>(size), (uintptr_t)data, usage);
+    ANGLE_BINARY_EVENT(BufferData, target, size, data, usage);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        BufferUsage usagePacked    = FromGLenum<BufferUsage>(usage);
-        if (context->skipValidation() ||
-            ValidateBufferData(context, targetPacked, size, data, usagePacked))
-        {
-            context->bufferData(targetPacked, size, data, usagePacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BufferData(context, target, size, data, usage);
     }
 }
 
@@ -5891,17 +5153,13 @@ void GL_APIENTRY BufferStorageMemEXTContextANGLE(GLeglContext ctx,
         "%llu)",
         target, static_cast<unsigned long long>(size), memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_EVENT(BufferStorageMemEXT, target, size, memory, offset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateBufferStorageMemEXT(context, targetPacked, size, memory, offset))
-        {
-            context->bufferStorageMem(targetPacked, size, memory, offset);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BufferStorageMemEXT(context, target, size, memory, offset);
     }
 }
 
@@ -5917,17 +5175,13 @@ void GL_APIENTRY BufferSubDataContextANGLE(GLeglContext ctx,
         "0x%016" PRIxPTR ")",
         target, static_cast<unsigned long long>(offset), static_cast<unsigned long long>(size),
         (uintptr_t)data);
+    ANGLE_BINARY_EVENT(BufferSubData, target, offset, size, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateBufferSubData(context, targetPacked, offset, size, data))
-        {
-            context->bufferSubData(targetPacked, offset, size, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BufferSubData(context, target, offset, size, data);
     }
 }
 
@@ -5935,15 +5189,13 @@ GLenum GL_APIENTRY CheckFramebufferStatusContextANGLE(GLeglContext ctx, GLenum t
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(CheckFramebufferStatus, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateCheckFramebufferStatus(context, target))
-        {
-            return context->checkFramebufferStatus(target);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->CheckFramebufferStatus(context, target);
     }
 
     return GetDefaultReturnValue<EntryPoint::CheckFramebufferStatus, GLenum>();
@@ -5953,15 +5205,13 @@ GLenum GL_APIENTRY CheckFramebufferStatusOESContextANGLE(GLeglContext ctx, GLenu
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(CheckFramebufferStatusOES, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateCheckFramebufferStatusOES(context, target))
-        {
-            return context->checkFramebufferStatus(target);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->CheckFramebufferStatusOES(context, target);
     }
 
     return GetDefaultReturnValue<EntryPoint::CheckFramebufferStatusOES, GLenum>();
@@ -5971,15 +5221,13 @@ void GL_APIENTRY ClearContextANGLE(GLeglContext ctx, GLbitfield mask)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLbitfield mask = 0x%X)", mask);
+    ANGLE_BINARY_EVENT(Clear, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClear(context, mask))
-        {
-            context->clear(mask);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Clear(context, mask);
     }
 }
 
@@ -5992,16 +5240,13 @@ void GL_APIENTRY ClearBufferfiContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, GLfloat depth = %f, GLint stencil = %d)",
           buffer, drawbuffer, depth, stencil);
+    ANGLE_BINARY_EVENT(ClearBufferfi, buffer, drawbuffer, depth, stencil);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateClearBufferfi(context, buffer, drawbuffer, depth, stencil))
-        {
-            context->clearBufferfi(buffer, drawbuffer, depth, stencil);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ClearBufferfi(context, buffer, drawbuffer, depth, stencil);
     }
 }
 
@@ -6013,15 +5258,13 @@ void GL_APIENTRY ClearBufferfvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           buffer, drawbuffer, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ClearBufferfv, buffer, drawbuffer, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClearBufferfv(context, buffer, drawbuffer, value))
-        {
-            context->clearBufferfv(buffer, drawbuffer, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ClearBufferfv(context, buffer, drawbuffer, value);
     }
 }
 
@@ -6033,15 +5276,13 @@ void GL_APIENTRY ClearBufferivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, const GLint *value = 0x%016" PRIxPTR ")",
           buffer, drawbuffer, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ClearBufferiv, buffer, drawbuffer, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClearBufferiv(context, buffer, drawbuffer, value))
-        {
-            context->clearBufferiv(buffer, drawbuffer, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ClearBufferiv(context, buffer, drawbuffer, value);
     }
 }
 
@@ -6053,33 +5294,28 @@ void GL_APIENTRY ClearBufferuivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           buffer, drawbuffer, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ClearBufferuiv, buffer, drawbuffer, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClearBufferuiv(context, buffer, drawbuffer, value))
-        {
-            context->clearBufferuiv(buffer, drawbuffer, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ClearBufferuiv(context, buffer, drawbuffer, value);
     }
 }
 
 void GL_APIENTRY
 ClearColorContextANGLE(GLeglContext ctx, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, GLfloat alpha = %f)", red,
           green, blue, alpha);
+    ANGLE_BINARY_EVENT(ClearColor, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClearColor(context, red, green, blue, alpha))
-        {
-            context->clearColor(red, green, blue, alpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ClearColor(context, red, green, blue, alpha);
     }
 }
 
@@ -6089,31 +5325,26 @@ ClearColorxContextANGLE(GLeglContext ctx, GLfixed red, GLfixed green, GLfixed bl
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed red = 0x%X, GLfixed green = 0x%X, GLfixed blue = 0x%X, GLfixed alpha = 0x%X)",
           red, green, blue, alpha);
+    ANGLE_BINARY_EVENT(ClearColorx, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClearColorx(context, red, green, blue, alpha))
-        {
-            context->clearColorx(red, green, blue, alpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ClearColorx(context, red, green, blue, alpha);
     }
 }
 
 void GL_APIENTRY ClearDepthfContextANGLE(GLeglContext ctx, GLfloat d)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat d = %f)", d);
+    ANGLE_BINARY_EVENT(ClearDepthf, d);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClearDepthf(context, d))
-        {
-            context->clearDepthf(d);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ClearDepthf(context, d);
     }
 }
 
@@ -6121,47 +5352,39 @@ void GL_APIENTRY ClearDepthxContextANGLE(GLeglContext ctx, GLfixed depth)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed depth = 0x%X)", depth);
+    ANGLE_BINARY_EVENT(ClearDepthx, depth);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClearDepthx(context, depth))
-        {
-            context->clearDepthx(depth);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ClearDepthx(context, depth);
     }
 }
 
 void GL_APIENTRY ClearStencilContextANGLE(GLeglContext ctx, GLint s)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint s = %d)", s);
+    ANGLE_BINARY_EVENT(ClearStencil, s);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClearStencil(context, s))
-        {
-            context->clearStencil(s);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ClearStencil(context, s);
     }
 }
 
 void GL_APIENTRY ClientActiveTextureContextANGLE(GLeglContext ctx, GLenum texture)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum texture = 0x%X)", texture);
+    ANGLE_BINARY_EVENT(ClientActiveTexture, texture);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClientActiveTexture(context, texture))
-        {
-            context->clientActiveTexture(texture);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ClientActiveTexture(context, texture);
     }
 }
 
@@ -6173,15 +5396,13 @@ GLenum GL_APIENTRY ClientWaitSyncContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ", GLbitfield flags = 0x%X, GLuint64 timeout = %llu)",
           (uintptr_t)sync, flags, static_cast<unsigned long long>(timeout));
+    ANGLE_BINARY_EVENT(ClientWaitSync, sync, flags, timeout);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClientWaitSync(context, sync, flags, timeout))
-        {
-            return context->clientWaitSync(sync, flags, timeout);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->ClientWaitSync(context, sync, flags, timeout);
     }
 
     return GetDefaultReturnValue<EntryPoint::ClientWaitSync, GLenum>();
@@ -6191,15 +5412,13 @@ void GL_APIENTRY ClipPlanefContextANGLE(GLeglContext ctx, GLenum p, const GLfloa
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum p = 0x%X, const GLfloat *eqn = 0x%016" PRIxPTR ")", p, (uintptr_t)eqn);
+    ANGLE_BINARY_EVENT(ClipPlanef, p, eqn);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClipPlanef(context, p, eqn))
-        {
-            context->clipPlanef(p, eqn);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ClipPlanef(context, p, eqn);
     }
 }
 
@@ -6208,51 +5427,43 @@ void GL_APIENTRY ClipPlanexContextANGLE(GLeglContext ctx, GLenum plane, const GL
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum plane = 0x%X, const GLfixed *equation = 0x%016" PRIxPTR ")", plane,
           (uintptr_t)equation);
+    ANGLE_BINARY_EVENT(ClipPlanex, plane, equation);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateClipPlanex(context, plane, equation))
-        {
-            context->clipPlanex(plane, equation);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ClipPlanex(context, plane, equation);
     }
 }
 
 void GL_APIENTRY
 Color4fContextANGLE(GLeglContext ctx, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, GLfloat alpha = %f)", red,
           green, blue, alpha);
+    ANGLE_BINARY_EVENT(Color4f, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateColor4f(context, red, green, blue, alpha))
-        {
-            context->color4f(red, green, blue, alpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Color4f(context, red, green, blue, alpha);
     }
 }
 
 void GL_APIENTRY
 Color4ubContextANGLE(GLeglContext ctx, GLubyte red, GLubyte green, GLubyte blue, GLubyte alpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLubyte red = %d, GLubyte green = %d, GLubyte blue = %d, GLubyte alpha = %d)", red,
           green, blue, alpha);
+    ANGLE_BINARY_EVENT(Color4ub, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateColor4ub(context, red, green, blue, alpha))
-        {
-            context->color4ub(red, green, blue, alpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Color4ub(context, red, green, blue, alpha);
     }
 }
 
@@ -6262,15 +5473,13 @@ Color4xContextANGLE(GLeglContext ctx, GLfixed red, GLfixed green, GLfixed blue,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed red = 0x%X, GLfixed green = 0x%X, GLfixed blue = 0x%X, GLfixed alpha = 0x%X)",
           red, green, blue, alpha);
+    ANGLE_BINARY_EVENT(Color4x, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateColor4x(context, red, green, blue, alpha))
-        {
-            context->color4x(red, green, blue, alpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Color4x(context, red, green, blue, alpha);
     }
 }
 
@@ -6280,18 +5489,15 @@ void GL_APIENTRY ColorMaskContextANGLE(GLeglContext ctx,
                                        GLboolean blue,
                                        GLboolean alpha)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLboolean red = %u, GLboolean green = %u, GLboolean blue = %u, GLboolean alpha = %u)",
           red, green, blue, alpha);
+    ANGLE_BINARY_EVENT(ColorMask, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateColorMask(context, red, green, blue, alpha))
-        {
-            context->colorMask(red, green, blue, alpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ColorMask(context, red, green, blue, alpha);
     }
 }
 
@@ -6306,17 +5512,13 @@ void GL_APIENTRY ColorPointerContextANGLE(GLeglContext ctx,
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(ColorPointer, size, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateColorPointer(context, size, typePacked, stride, pointer))
-        {
-            context->colorPointer(size, typePacked, stride, pointer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ColorPointer(context, size, type, stride, pointer);
     }
 }
 
@@ -6324,15 +5526,13 @@ void GL_APIENTRY CompileShaderContextANGLE(GLeglContext ctx, GLuint shader)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u)", shader);
+    ANGLE_BINARY_EVENT(CompileShader, shader);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateCompileShader(context, shader))
-        {
-            context->compileShader(shader);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CompileShader(context, shader);
     }
 }
 
@@ -6352,19 +5552,15 @@ void GL_APIENTRY CompressedTexImage2DContextANGLE(GLeglContext ctx,
         "%d, GLsizei height = %d, GLint border = %d, GLsizei imageSize = %d, const void *data = "
         "0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, imageSize, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexImage2D, target, level, internalformat, width, height, border,
+                       imageSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCompressedTexImage2D(context, targetPacked, level, internalformat, width,
-                                         height, border, imageSize, data))
-        {
-            context->compressedTexImage2D(targetPacked, level, internalformat, width, height,
-                                          border, imageSize, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CompressedTexImage2D(context, target, level, internalformat,
+                                                          width, height, border, imageSize, data);
     }
 }
 
@@ -6385,19 +5581,15 @@ void GL_APIENTRY CompressedTexImage3DContextANGLE(GLeglContext ctx,
         "%d, GLsizei height = %d, GLsizei depth = %d, GLint border = %d, GLsizei imageSize = %d, "
         "const void *data = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, imageSize, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexImage3D, target, level, internalformat, width, height, depth,
+                       border, imageSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCompressedTexImage3D(context, targetPacked, level, internalformat, width,
-                                         height, depth, border, imageSize, data))
-        {
-            context->compressedTexImage3D(targetPacked, level, internalformat, width, height, depth,
-                                          border, imageSize, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CompressedTexImage3D(
+            context, target, level, internalformat, width, height, depth, border, imageSize, data);
     }
 }
 
@@ -6418,19 +5610,15 @@ void GL_APIENTRY CompressedTexSubImage2DContextANGLE(GLeglContext ctx,
         "width = %d, GLsizei height = %d, GLenum format = 0x%X, GLsizei imageSize = %d, const void "
         "*data = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, imageSize, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexSubImage2D, target, level, xoffset, yoffset, width, height,
+                       format, imageSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCompressedTexSubImage2D(context, targetPacked, level, xoffset, yoffset, width,
-                                            height, format, imageSize, data))
-        {
-            context->compressedTexSubImage2D(targetPacked, level, xoffset, yoffset, width, height,
-                                             format, imageSize, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CompressedTexSubImage2D(
+            context, target, level, xoffset, yoffset, width, height, format, imageSize, data);
     }
 }
 
@@ -6454,19 +5642,16 @@ void GL_APIENTRY CompressedTexSubImage3DContextANGLE(GLeglContext ctx,
         "= 0x%X, GLsizei imageSize = %d, const void *data = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, imageSize,
         (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexSubImage3D, target, level, xoffset, yoffset, zoffset, width,
+                       height, depth, format, imageSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCompressedTexSubImage3D(context, targetPacked, level, xoffset, yoffset, zoffset,
-                                            width, height, depth, format, imageSize, data))
-        {
-            context->compressedTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width,
-                                             height, depth, format, imageSize, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CompressedTexSubImage3D(context, target, level, xoffset,
+                                                             yoffset, zoffset, width, height, depth,
+                                                             format, imageSize, data);
     }
 }
 
@@ -6483,20 +5668,14 @@ void GL_APIENTRY CopyBufferSubDataContextANGLE(GLeglContext ctx,
         "GLintptr writeOffset = %llu, GLsizeiptr size = %llu)",
         readTarget, writeTarget, static_cast<unsigned long long>(readOffset),
         static_cast<unsigned long long>(writeOffset), static_cast<unsigned long long>(size));
+    ANGLE_BINARY_EVENT(CopyBufferSubData, readTarget, writeTarget, readOffset, writeOffset, size);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding readTargetPacked  = FromGLenum<BufferBinding>(readTarget);
-        BufferBinding writeTargetPacked = FromGLenum<BufferBinding>(writeTarget);
-        if (context->skipValidation() ||
-            ValidateCopyBufferSubData(context, readTargetPacked, writeTargetPacked, readOffset,
-                                      writeOffset, size))
-        {
-            context->copyBufferSubData(readTargetPacked, writeTargetPacked, readOffset, writeOffset,
-                                       size);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CopyBufferSubData(context, readTarget, writeTarget, readOffset,
+                                                       writeOffset, size);
     }
 }
 
@@ -6515,19 +5694,14 @@ void GL_APIENTRY CopyTexImage2DContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = 0x%X, GLint x = %d, "
         "GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLint border = %d)",
         target, level, internalformat, x, y, width, height, border);
+    ANGLE_BINARY_EVENT(CopyTexImage2D, target, level, internalformat, x, y, width, height, border);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCopyTexImage2D(context, targetPacked, level, internalformat, x, y, width,
-                                   height, border))
-        {
-            context->copyTexImage2D(targetPacked, level, internalformat, x, y, width, height,
-                                    border);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CopyTexImage2D(context, target, level, internalformat, x, y,
+                                                    width, height, border);
     }
 }
 
@@ -6546,18 +5720,14 @@ void GL_APIENTRY CopyTexSubImage2DContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint x "
         "= %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
         target, level, xoffset, yoffset, x, y, width, height);
+    ANGLE_BINARY_EVENT(CopyTexSubImage2D, target, level, xoffset, yoffset, x, y, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCopyTexSubImage2D(context, targetPacked, level, xoffset, yoffset, x, y, width,
-                                      height))
-        {
-            context->copyTexSubImage2D(targetPacked, level, xoffset, yoffset, x, y, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CopyTexSubImage2D(context, target, level, xoffset, yoffset, x,
+                                                       y, width, height);
     }
 }
 
@@ -6577,19 +5747,15 @@ void GL_APIENTRY CopyTexSubImage3DContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint "
         "zoffset = %d, GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
         target, level, xoffset, yoffset, zoffset, x, y, width, height);
+    ANGLE_BINARY_EVENT(CopyTexSubImage3D, target, level, xoffset, yoffset, zoffset, x, y, width,
+                       height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCopyTexSubImage3D(context, targetPacked, level, xoffset, yoffset, zoffset, x, y,
-                                      width, height))
-        {
-            context->copyTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, x, y, width,
-                                       height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CopyTexSubImage3D(context, target, level, xoffset, yoffset,
+                                                       zoffset, x, y, width, height);
     }
 }
 
@@ -6600,15 +5766,13 @@ void GL_APIENTRY CreateMemoryObjectsEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *memoryObjects = 0x%016" PRIxPTR ")", n,
           (uintptr_t)memoryObjects);
+    ANGLE_BINARY_EVENT(CreateMemoryObjectsEXT, n, memoryObjects);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateCreateMemoryObjectsEXT(context, n, memoryObjects))
-        {
-            context->createMemoryObjects(n, memoryObjects);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CreateMemoryObjectsEXT(context, n, memoryObjects);
     }
 }
 
@@ -6616,15 +5780,13 @@ GLuint GL_APIENTRY CreateProgramContextANGLE(GLeglContext ctx)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(CreateProgram);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateCreateProgram(context))
-        {
-            return context->createProgram();
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->CreateProgram(context);
     }
 
     return GetDefaultReturnValue<EntryPoint::CreateProgram, GLuint>();
@@ -6634,16 +5796,13 @@ GLuint GL_APIENTRY CreateShaderContextANGLE(GLeglContext ctx, GLenum type)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X)", type);
+    ANGLE_BINARY_EVENT(CreateShader, type);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        ShaderType typePacked = FromGLenum<ShaderType>(type);
-        if (context->skipValidation() || ValidateCreateShader(context, typePacked))
-        {
-            return context->createShader(typePacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->CreateShader(context, type);
     }
 
     return GetDefaultReturnValue<EntryPoint::CreateShader, GLuint>();
@@ -6658,17 +5817,13 @@ GLuint GL_APIENTRY CreateShaderProgramvContextANGLE(GLeglContext ctx,
     EVENT("(GLenum type = 0x%X, GLsizei count = %d, const GLchar *const*strings = 0x%016" PRIxPTR
           ")",
           type, count, (uintptr_t)strings);
+    ANGLE_BINARY_EVENT(CreateShaderProgramv, type, count, strings);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        ShaderType typePacked = FromGLenum<ShaderType>(type);
-        if (context->skipValidation() ||
-            ValidateCreateShaderProgramv(context, typePacked, count, strings))
-        {
-            return context->createShaderProgramv(typePacked, count, strings);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->CreateShaderProgramv(context, type, count, strings);
     }
 
     return GetDefaultReturnValue<EntryPoint::CreateShaderProgramv, GLuint>();
@@ -6676,18 +5831,14 @@ GLuint GL_APIENTRY CreateShaderProgramvContextANGLE(GLeglContext ctx,
 
 void GL_APIENTRY CullFaceContextANGLE(GLeglContext ctx, GLenum mode)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_EVENT(CullFace, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        CullFaceMode modePacked = FromGLenum<CullFaceMode>(mode);
-        if (context->skipValidation() || ValidateCullFace(context, modePacked))
-        {
-            context->cullFace(modePacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CullFace(context, mode);
     }
 }
 
@@ -6695,16 +5846,13 @@ void GL_APIENTRY CurrentPaletteMatrixOESContextANGLE(GLeglContext ctx, GLuint ma
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint matrixpaletteindex = %u)", matrixpaletteindex);
+    ANGLE_BINARY_EVENT(CurrentPaletteMatrixOES, matrixpaletteindex);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateCurrentPaletteMatrixOES(context, matrixpaletteindex))
-        {
-            context->currentPaletteMatrix(matrixpaletteindex);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CurrentPaletteMatrixOES(context, matrixpaletteindex);
     }
 }
 
@@ -6716,16 +5864,13 @@ void GL_APIENTRY DebugMessageCallbackKHRContextANGLE(GLeglContext ctx,
     EVENT("(GLDEBUGPROCKHR callback = 0x%016" PRIxPTR ", const void *userParam = 0x%016" PRIxPTR
           ")",
           (uintptr_t)callback, (uintptr_t)userParam);
+    ANGLE_BINARY_EVENT(DebugMessageCallbackKHR, callback, userParam);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateDebugMessageCallbackKHR(context, callback, userParam))
-        {
-            context->debugMessageCallback(callback, userParam);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DebugMessageCallbackKHR(context, callback, userParam);
     }
 }
 
@@ -6742,16 +5887,14 @@ void GL_APIENTRY DebugMessageControlKHRContextANGLE(GLeglContext ctx,
         "(GLenum source = 0x%X, GLenum type = 0x%X, GLenum severity = 0x%X, GLsizei count = %d, "
         "const GLuint *ids = 0x%016" PRIxPTR ", GLboolean enabled = %u)",
         source, type, severity, count, (uintptr_t)ids, enabled);
+    ANGLE_BINARY_EVENT(DebugMessageControlKHR, source, type, severity, count, ids, enabled);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateDebugMessageControlKHR(context, source, type, severity, count, ids, enabled))
-        {
-            context->debugMessageControl(source, type, severity, count, ids, enabled);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DebugMessageControlKHR(context, source, type, severity, count,
+                                                            ids, enabled);
     }
 }
 
@@ -6768,16 +5911,14 @@ void GL_APIENTRY DebugMessageInsertKHRContextANGLE(GLeglContext ctx,
         "(GLenum source = 0x%X, GLenum type = 0x%X, GLuint id = %u, GLenum severity = 0x%X, "
         "GLsizei length = %d, const GLchar *buf = 0x%016" PRIxPTR ")",
         source, type, id, severity, length, (uintptr_t)buf);
+    ANGLE_BINARY_EVENT(DebugMessageInsertKHR, source, type, id, severity, length, buf);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateDebugMessageInsertKHR(context, source, type, id, severity, length, buf))
-        {
-            context->debugMessageInsert(source, type, id, severity, length, buf);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DebugMessageInsertKHR(context, source, type, id, severity,
+                                                           length, buf);
     }
 }
 
@@ -6785,15 +5926,13 @@ void GL_APIENTRY DeleteBuffersContextANGLE(GLeglContext ctx, GLsizei n, const GL
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *buffers = 0x%016" PRIxPTR ")", n, (uintptr_t)buffers);
+    ANGLE_BINARY_EVENT(DeleteBuffers, n, buffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteBuffers(context, n, buffers))
-        {
-            context->deleteBuffers(n, buffers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteBuffers(context, n, buffers);
     }
 }
 
@@ -6801,15 +5940,13 @@ void GL_APIENTRY DeleteFencesNVContextANGLE(GLeglContext ctx, GLsizei n, const G
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *fences = 0x%016" PRIxPTR ")", n, (uintptr_t)fences);
+    ANGLE_BINARY_EVENT(DeleteFencesNV, n, fences);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteFencesNV(context, n, fences))
-        {
-            context->deleteFencesNV(n, fences);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteFencesNV(context, n, fences);
     }
 }
 
@@ -6820,15 +5957,13 @@ void GL_APIENTRY DeleteFramebuffersContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *framebuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)framebuffers);
+    ANGLE_BINARY_EVENT(DeleteFramebuffers, n, framebuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteFramebuffers(context, n, framebuffers))
-        {
-            context->deleteFramebuffers(n, framebuffers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteFramebuffers(context, n, framebuffers);
     }
 }
 
@@ -6839,15 +5974,13 @@ void GL_APIENTRY DeleteFramebuffersOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *framebuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)framebuffers);
+    ANGLE_BINARY_EVENT(DeleteFramebuffersOES, n, framebuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteFramebuffersOES(context, n, framebuffers))
-        {
-            context->deleteFramebuffers(n, framebuffers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteFramebuffersOES(context, n, framebuffers);
     }
 }
 
@@ -6858,15 +5991,13 @@ void GL_APIENTRY DeleteMemoryObjectsEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *memoryObjects = 0x%016" PRIxPTR ")", n,
           (uintptr_t)memoryObjects);
+    ANGLE_BINARY_EVENT(DeleteMemoryObjectsEXT, n, memoryObjects);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteMemoryObjectsEXT(context, n, memoryObjects))
-        {
-            context->deleteMemoryObjects(n, memoryObjects);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteMemoryObjectsEXT(context, n, memoryObjects);
     }
 }
 
@@ -6874,15 +6005,13 @@ void GL_APIENTRY DeleteProgramContextANGLE(GLeglContext ctx, GLuint program)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_EVENT(DeleteProgram, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteProgram(context, program))
-        {
-            context->deleteProgram(program);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteProgram(context, program);
     }
 }
 
@@ -6892,15 +6021,13 @@ void GL_APIENTRY DeleteProgramPipelinesContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *pipelines = 0x%016" PRIxPTR ")", n, (uintptr_t)pipelines);
+    ANGLE_BINARY_EVENT(DeleteProgramPipelines, n, pipelines);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteProgramPipelines(context, n, pipelines))
-        {
-            context->deleteProgramPipelines(n, pipelines);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteProgramPipelines(context, n, pipelines);
     }
 }
 
@@ -6908,15 +6035,13 @@ void GL_APIENTRY DeleteQueriesContextANGLE(GLeglContext ctx, GLsizei n, const GL
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_EVENT(DeleteQueries, n, ids);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteQueries(context, n, ids))
-        {
-            context->deleteQueries(n, ids);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteQueries(context, n, ids);
     }
 }
 
@@ -6924,15 +6049,13 @@ void GL_APIENTRY DeleteQueriesEXTContextANGLE(GLeglContext ctx, GLsizei n, const
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_EVENT(DeleteQueriesEXT, n, ids);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteQueriesEXT(context, n, ids))
-        {
-            context->deleteQueries(n, ids);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteQueriesEXT(context, n, ids);
     }
 }
 
@@ -6943,15 +6066,13 @@ void GL_APIENTRY DeleteRenderbuffersContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_EVENT(DeleteRenderbuffers, n, renderbuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteRenderbuffers(context, n, renderbuffers))
-        {
-            context->deleteRenderbuffers(n, renderbuffers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteRenderbuffers(context, n, renderbuffers);
     }
 }
 
@@ -6962,15 +6083,13 @@ void GL_APIENTRY DeleteRenderbuffersOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_EVENT(DeleteRenderbuffersOES, n, renderbuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteRenderbuffersOES(context, n, renderbuffers))
-        {
-            context->deleteRenderbuffers(n, renderbuffers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteRenderbuffersOES(context, n, renderbuffers);
     }
 }
 
@@ -6979,15 +6098,13 @@ void GL_APIENTRY DeleteSamplersContextANGLE(GLeglContext ctx, GLsizei count, con
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei count = %d, const GLuint *samplers = 0x%016" PRIxPTR ")", count,
           (uintptr_t)samplers);
+    ANGLE_BINARY_EVENT(DeleteSamplers, count, samplers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteSamplers(context, count, samplers))
-        {
-            context->deleteSamplers(count, samplers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteSamplers(context, count, samplers);
     }
 }
 
@@ -6998,15 +6115,13 @@ void GL_APIENTRY DeleteSemaphoresEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *semaphores = 0x%016" PRIxPTR ")", n,
           (uintptr_t)semaphores);
+    ANGLE_BINARY_EVENT(DeleteSemaphoresEXT, n, semaphores);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteSemaphoresEXT(context, n, semaphores))
-        {
-            context->deleteSemaphores(n, semaphores);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteSemaphoresEXT(context, n, semaphores);
     }
 }
 
@@ -7014,15 +6129,13 @@ void GL_APIENTRY DeleteShaderContextANGLE(GLeglContext ctx, GLuint shader)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u)", shader);
+    ANGLE_BINARY_EVENT(DeleteShader, shader);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteShader(context, shader))
-        {
-            context->deleteShader(shader);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteShader(context, shader);
     }
 }
 
@@ -7030,15 +6143,13 @@ void GL_APIENTRY DeleteSyncContextANGLE(GLeglContext ctx, GLsync sync)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ")", (uintptr_t)sync);
+    ANGLE_BINARY_EVENT(DeleteSync, sync);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteSync(context, sync))
-        {
-            context->deleteSync(sync);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteSync(context, sync);
     }
 }
 
@@ -7046,15 +6157,13 @@ void GL_APIENTRY DeleteTexturesContextANGLE(GLeglContext ctx, GLsizei n, const G
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *textures = 0x%016" PRIxPTR ")", n, (uintptr_t)textures);
+    ANGLE_BINARY_EVENT(DeleteTextures, n, textures);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteTextures(context, n, textures))
-        {
-            context->deleteTextures(n, textures);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteTextures(context, n, textures);
     }
 }
 
@@ -7064,15 +6173,13 @@ void GL_APIENTRY DeleteTransformFeedbacksContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_EVENT(DeleteTransformFeedbacks, n, ids);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteTransformFeedbacks(context, n, ids))
-        {
-            context->deleteTransformFeedbacks(n, ids);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteTransformFeedbacks(context, n, ids);
     }
 }
 
@@ -7080,15 +6187,13 @@ void GL_APIENTRY DeleteVertexArraysContextANGLE(GLeglContext ctx, GLsizei n, con
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_EVENT(DeleteVertexArrays, n, arrays);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteVertexArrays(context, n, arrays))
-        {
-            context->deleteVertexArrays(n, arrays);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteVertexArrays(context, n, arrays);
     }
 }
 
@@ -7098,63 +6203,52 @@ void GL_APIENTRY DeleteVertexArraysOESContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_EVENT(DeleteVertexArraysOES, n, arrays);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeleteVertexArraysOES(context, n, arrays))
-        {
-            context->deleteVertexArrays(n, arrays);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeleteVertexArraysOES(context, n, arrays);
     }
 }
 
 void GL_APIENTRY DepthFuncContextANGLE(GLeglContext ctx, GLenum func)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X)", func);
+    ANGLE_BINARY_EVENT(DepthFunc, func);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDepthFunc(context, func))
-        {
-            context->depthFunc(func);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DepthFunc(context, func);
     }
 }
 
 void GL_APIENTRY DepthMaskContextANGLE(GLeglContext ctx, GLboolean flag)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLboolean flag = %u)", flag);
+    ANGLE_BINARY_EVENT(DepthMask, flag);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDepthMask(context, flag))
-        {
-            context->depthMask(flag);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DepthMask(context, flag);
     }
 }
 
 void GL_APIENTRY DepthRangefContextANGLE(GLeglContext ctx, GLfloat n, GLfloat f)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat n = %f, GLfloat f = %f)", n, f);
+    ANGLE_BINARY_EVENT(DepthRangef, n, f);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDepthRangef(context, n, f))
-        {
-            context->depthRangef(n, f);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DepthRangef(context, n, f);
     }
 }
 
@@ -7162,15 +6256,13 @@ void GL_APIENTRY DepthRangexContextANGLE(GLeglContext ctx, GLfixed n, GLfixed f)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed n = 0x%X, GLfixed f = 0x%X)", n, f);
+    ANGLE_BINARY_EVENT(DepthRangex, n, f);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDepthRangex(context, n, f))
-        {
-            context->depthRangex(n, f);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DepthRangex(context, n, f);
     }
 }
 
@@ -7178,31 +6270,26 @@ void GL_APIENTRY DetachShaderContextANGLE(GLeglContext ctx, GLuint program, GLui
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint shader = %u)", program, shader);
+    ANGLE_BINARY_EVENT(DetachShader, program, shader);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDetachShader(context, program, shader))
-        {
-            context->detachShader(program, shader);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DetachShader(context, program, shader);
     }
 }
 
 void GL_APIENTRY DisableContextANGLE(GLeglContext ctx, GLenum cap)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum cap = 0x%X)", cap);
+    ANGLE_BINARY_EVENT(Disable, cap);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDisable(context, cap))
-        {
-            context->disable(cap);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Disable(context, cap);
     }
 }
 
@@ -7210,32 +6297,26 @@ void GL_APIENTRY DisableClientStateContextANGLE(GLeglContext ctx, GLenum array)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum array = 0x%X)", array);
+    ANGLE_BINARY_EVENT(DisableClientState, array);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        ClientVertexArrayType arrayPacked = FromGLenum<ClientVertexArrayType>(array);
-        if (context->skipValidation() || ValidateDisableClientState(context, arrayPacked))
-        {
-            context->disableClientState(arrayPacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DisableClientState(context, array);
     }
 }
 
 void GL_APIENTRY DisableVertexAttribArrayContextANGLE(GLeglContext ctx, GLuint index)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u)", index);
+    ANGLE_BINARY_EVENT(DisableVertexAttribArray, index);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDisableVertexAttribArray(context, index))
-        {
-            context->disableVertexAttribArray(index);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DisableVertexAttribArray(context, index);
     }
 }
 
@@ -7249,16 +6330,14 @@ void GL_APIENTRY DiscardFramebufferEXTContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLsizei numAttachments = %d, const GLenum *attachments = "
         "0x%016" PRIxPTR ")",
         target, numAttachments, (uintptr_t)attachments);
+    ANGLE_BINARY_EVENT(DiscardFramebufferEXT, target, numAttachments, attachments);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateDiscardFramebufferEXT(context, target, numAttachments, attachments))
-        {
-            context->discardFramebuffer(target, numAttachments, attachments);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DiscardFramebufferEXT(context, target, numAttachments,
+                                                           attachments);
     }
 }
 
@@ -7270,16 +6349,14 @@ void GL_APIENTRY DispatchComputeContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint num_groups_x = %u, GLuint num_groups_y = %u, GLuint num_groups_z = %u)",
           num_groups_x, num_groups_y, num_groups_z);
+    ANGLE_BINARY_EVENT(DispatchCompute, num_groups_x, num_groups_y, num_groups_z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateDispatchCompute(context, num_groups_x, num_groups_y, num_groups_z))
-        {
-            context->dispatchCompute(num_groups_x, num_groups_y, num_groups_z);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DispatchCompute(context, num_groups_x, num_groups_y,
+                                                     num_groups_z);
     }
 }
 
@@ -7287,15 +6364,13 @@ void GL_APIENTRY DispatchComputeIndirectContextANGLE(GLeglContext ctx, GLintptr
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLintptr indirect = %llu)", static_cast<unsigned long long>(indirect));
+    ANGLE_BINARY_EVENT(DispatchComputeIndirect, indirect);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDispatchComputeIndirect(context, indirect))
-        {
-            context->dispatchComputeIndirect(indirect);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DispatchComputeIndirect(context, indirect);
     }
 }
 
@@ -7303,16 +6378,13 @@ void GL_APIENTRY DrawArraysContextANGLE(GLeglContext ctx, GLenum mode, GLint fir
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d)", mode, first, count);
+    ANGLE_BINARY_EVENT(DrawArrays, mode, first, count);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() || ValidateDrawArrays(context, modePacked, first, count))
-        {
-            context->drawArrays(modePacked, first, count);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawArrays(context, mode, first, count);
     }
 }
 
@@ -7321,16 +6393,13 @@ void GL_APIENTRY DrawArraysIndirectContextANGLE(GLeglContext ctx, GLenum mode, c
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, const void *indirect = 0x%016" PRIxPTR ")", mode,
           (uintptr_t)indirect);
+    ANGLE_BINARY_EVENT(DrawArraysIndirect, mode, indirect);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() || ValidateDrawArraysIndirect(context, modePacked, indirect))
-        {
-            context->drawArraysIndirect(modePacked, indirect);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawArraysIndirect(context, mode, indirect);
     }
 }
 
@@ -7343,17 +6412,14 @@ void GL_APIENTRY DrawArraysInstancedContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d, GLsizei instancecount = %d)",
           mode, first, count, instancecount);
+    ANGLE_BINARY_EVENT(DrawArraysInstanced, mode, first, count, instancecount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() ||
-            ValidateDrawArraysInstanced(context, modePacked, first, count, instancecount))
-        {
-            context->drawArraysInstanced(modePacked, first, count, instancecount);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawArraysInstanced(context, mode, first, count,
+                                                         instancecount);
     }
 }
 
@@ -7366,17 +6432,14 @@ void GL_APIENTRY DrawArraysInstancedANGLEContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d, GLsizei primcount = %d)",
           mode, first, count, primcount);
+    ANGLE_BINARY_EVENT(DrawArraysInstancedANGLE, mode, first, count, primcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() ||
-            ValidateDrawArraysInstancedANGLE(context, modePacked, first, count, primcount))
-        {
-            context->drawArraysInstanced(modePacked, first, count, primcount);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawArraysInstancedANGLE(context, mode, first, count,
+                                                              primcount);
     }
 }
 
@@ -7389,17 +6452,13 @@ void GL_APIENTRY DrawArraysInstancedEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint start = %d, GLsizei count = %d, GLsizei primcount = %d)",
           mode, start, count, primcount);
+    ANGLE_BINARY_EVENT(DrawArraysInstancedEXT, mode, start, count, primcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() ||
-            ValidateDrawArraysInstancedEXT(context, modePacked, start, count, primcount))
-        {
-            context->drawArraysInstanced(modePacked, start, count, primcount);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawArraysInstancedEXT(context, mode, start, count, primcount);
     }
 }
 
@@ -7407,15 +6466,13 @@ void GL_APIENTRY DrawBuffersContextANGLE(GLeglContext ctx, GLsizei n, const GLen
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLenum *bufs = 0x%016" PRIxPTR ")", n, (uintptr_t)bufs);
+    ANGLE_BINARY_EVENT(DrawBuffers, n, bufs);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDrawBuffers(context, n, bufs))
-        {
-            context->drawBuffers(n, bufs);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawBuffers(context, n, bufs);
     }
 }
 
@@ -7423,15 +6480,13 @@ void GL_APIENTRY DrawBuffersEXTContextANGLE(GLeglContext ctx, GLsizei n, const G
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLenum *bufs = 0x%016" PRIxPTR ")", n, (uintptr_t)bufs);
+    ANGLE_BINARY_EVENT(DrawBuffersEXT, n, bufs);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDrawBuffersEXT(context, n, bufs))
-        {
-            context->drawBuffers(n, bufs);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawBuffersEXT(context, n, bufs);
     }
 }
 
@@ -7446,18 +6501,13 @@ void GL_APIENTRY DrawElementsContextANGLE(GLeglContext ctx,
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ")",
         mode, count, type, (uintptr_t)indices);
+    ANGLE_BINARY_EVENT(DrawElements, mode, count, type, indices);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateDrawElements(context, modePacked, count, typePacked, indices))
-        {
-            context->drawElements(modePacked, count, typePacked, indices);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawElements(context, mode, count, type, indices);
     }
 }
 
@@ -7469,18 +6519,13 @@ void GL_APIENTRY DrawElementsIndirectContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLenum type = 0x%X, const void *indirect = 0x%016" PRIxPTR ")",
           mode, type, (uintptr_t)indirect);
+    ANGLE_BINARY_EVENT(DrawElementsIndirect, mode, type, indirect);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateDrawElementsIndirect(context, modePacked, typePacked, indirect))
-        {
-            context->drawElementsIndirect(modePacked, typePacked, indirect);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawElementsIndirect(context, mode, type, indirect);
     }
 }
 
@@ -7496,19 +6541,14 @@ void GL_APIENTRY DrawElementsInstancedContextANGLE(GLeglContext ctx,
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ", GLsizei instancecount = %d)",
         mode, count, type, (uintptr_t)indices, instancecount);
+    ANGLE_BINARY_EVENT(DrawElementsInstanced, mode, count, type, indices, instancecount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateDrawElementsInstanced(context, modePacked, count, typePacked, indices,
-                                          instancecount))
-        {
-            context->drawElementsInstanced(modePacked, count, typePacked, indices, instancecount);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawElementsInstanced(context, mode, count, type, indices,
+                                                           instancecount);
     }
 }
 
@@ -7524,19 +6564,14 @@ void GL_APIENTRY DrawElementsInstancedANGLEContextANGLE(GLeglContext ctx,
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ", GLsizei primcount = %d)",
         mode, count, type, (uintptr_t)indices, primcount);
+    ANGLE_BINARY_EVENT(DrawElementsInstancedANGLE, mode, count, type, indices, primcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateDrawElementsInstancedANGLE(context, modePacked, count, typePacked, indices,
-                                               primcount))
-        {
-            context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawElementsInstancedANGLE(context, mode, count, type, indices,
+                                                                primcount);
     }
 }
 
@@ -7552,19 +6587,14 @@ void GL_APIENTRY DrawElementsInstancedEXTContextANGLE(GLeglContext ctx,
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ", GLsizei primcount = %d)",
         mode, count, type, (uintptr_t)indices, primcount);
+    ANGLE_BINARY_EVENT(DrawElementsInstancedEXT, mode, count, type, indices, primcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateDrawElementsInstancedEXT(context, modePacked, count, typePacked, indices,
-                                             primcount))
-        {
-            context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawElementsInstancedEXT(context, mode, count, type, indices,
+                                                              primcount);
     }
 }
 
@@ -7581,18 +6611,14 @@ void GL_APIENTRY DrawRangeElementsContextANGLE(GLeglContext ctx,
         "(GLenum mode = 0x%X, GLuint start = %u, GLuint end = %u, GLsizei count = %d, GLenum type "
         "= 0x%X, const void *indices = 0x%016" PRIxPTR ")",
         mode, start, end, count, type, (uintptr_t)indices);
+    ANGLE_BINARY_EVENT(DrawRangeElements, mode, start, end, count, type, indices);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateDrawRangeElements(context, modePacked, start, end, count, typePacked, indices))
-        {
-            context->drawRangeElements(modePacked, start, end, count, typePacked, indices);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawRangeElements(context, mode, start, end, count, type,
+                                                       indices);
     }
 }
 
@@ -7607,15 +6633,13 @@ void GL_APIENTRY DrawTexfOESContextANGLE(GLeglContext ctx,
     EVENT(
         "(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f, GLfloat width = %f, GLfloat height = %f)",
         x, y, z, width, height);
+    ANGLE_BINARY_EVENT(DrawTexfOES, x, y, z, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDrawTexfOES(context, x, y, z, width, height))
-        {
-            context->drawTexf(x, y, z, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawTexfOES(context, x, y, z, width, height);
     }
 }
 
@@ -7623,15 +6647,13 @@ void GL_APIENTRY DrawTexfvOESContextANGLE(GLeglContext ctx, const GLfloat *coord
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfloat *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_EVENT(DrawTexfvOES, coords);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDrawTexfvOES(context, coords))
-        {
-            context->drawTexfv(coords);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawTexfvOES(context, coords);
     }
 }
 
@@ -7641,15 +6663,13 @@ DrawTexiOESContextANGLE(GLeglContext ctx, GLint x, GLint y, GLint z, GLint width
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint x = %d, GLint y = %d, GLint z = %d, GLint width = %d, GLint height = %d)", x, y,
           z, width, height);
+    ANGLE_BINARY_EVENT(DrawTexiOES, x, y, z, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDrawTexiOES(context, x, y, z, width, height))
-        {
-            context->drawTexi(x, y, z, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawTexiOES(context, x, y, z, width, height);
     }
 }
 
@@ -7657,15 +6677,13 @@ void GL_APIENTRY DrawTexivOESContextANGLE(GLeglContext ctx, const GLint *coords)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLint *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_EVENT(DrawTexivOES, coords);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDrawTexivOES(context, coords))
-        {
-            context->drawTexiv(coords);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawTexivOES(context, coords);
     }
 }
 
@@ -7680,15 +6698,13 @@ void GL_APIENTRY DrawTexsOESContextANGLE(GLeglContext ctx,
     EVENT(
         "(GLshort x = %d, GLshort y = %d, GLshort z = %d, GLshort width = %d, GLshort height = %d)",
         x, y, z, width, height);
+    ANGLE_BINARY_EVENT(DrawTexsOES, x, y, z, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDrawTexsOES(context, x, y, z, width, height))
-        {
-            context->drawTexs(x, y, z, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawTexsOES(context, x, y, z, width, height);
     }
 }
 
@@ -7696,15 +6712,13 @@ void GL_APIENTRY DrawTexsvOESContextANGLE(GLeglContext ctx, const GLshort *coord
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLshort *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_EVENT(DrawTexsvOES, coords);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDrawTexsvOES(context, coords))
-        {
-            context->drawTexsv(coords);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawTexsvOES(context, coords);
     }
 }
 
@@ -7720,15 +6734,13 @@ void GL_APIENTRY DrawTexxOESContextANGLE(GLeglContext ctx,
         "(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X, GLfixed width = 0x%X, GLfixed "
         "height = 0x%X)",
         x, y, z, width, height);
+    ANGLE_BINARY_EVENT(DrawTexxOES, x, y, z, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDrawTexxOES(context, x, y, z, width, height))
-        {
-            context->drawTexx(x, y, z, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawTexxOES(context, x, y, z, width, height);
     }
 }
 
@@ -7736,15 +6748,13 @@ void GL_APIENTRY DrawTexxvOESContextANGLE(GLeglContext ctx, const GLfixed *coord
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfixed *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_EVENT(DrawTexxvOES, coords);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDrawTexxvOES(context, coords))
-        {
-            context->drawTexxv(coords);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DrawTexxvOES(context, coords);
     }
 }
 
@@ -7755,16 +6765,13 @@ void GL_APIENTRY EGLImageTargetRenderbufferStorageOESContextANGLE(GLeglContext c
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLeglImageOES image = 0x%016" PRIxPTR ")", target,
           (uintptr_t)image);
+    ANGLE_BINARY_EVENT(EGLImageTargetRenderbufferStorageOES, target, image);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateEGLImageTargetRenderbufferStorageOES(context, target, image))
-        {
-            context->eGLImageTargetRenderbufferStorage(target, image);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->EGLImageTargetRenderbufferStorageOES(context, target, image);
     }
 }
 
@@ -7775,33 +6782,26 @@ void GL_APIENTRY EGLImageTargetTexture2DOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLeglImageOES image = 0x%016" PRIxPTR ")", target,
           (uintptr_t)image);
+    ANGLE_BINARY_EVENT(EGLImageTargetTexture2DOES, target, image);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateEGLImageTargetTexture2DOES(context, targetPacked, image))
-        {
-            context->eGLImageTargetTexture2D(targetPacked, image);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->EGLImageTargetTexture2DOES(context, target, image);
     }
 }
 
 void GL_APIENTRY EnableContextANGLE(GLeglContext ctx, GLenum cap)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum cap = 0x%X)", cap);
+    ANGLE_BINARY_EVENT(Enable, cap);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateEnable(context, cap))
-        {
-            context->enable(cap);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Enable(context, cap);
     }
 }
 
@@ -7809,32 +6809,26 @@ void GL_APIENTRY EnableClientStateContextANGLE(GLeglContext ctx, GLenum array)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum array = 0x%X)", array);
+    ANGLE_BINARY_EVENT(EnableClientState, array);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        ClientVertexArrayType arrayPacked = FromGLenum<ClientVertexArrayType>(array);
-        if (context->skipValidation() || ValidateEnableClientState(context, arrayPacked))
-        {
-            context->enableClientState(arrayPacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->EnableClientState(context, array);
     }
 }
 
 void GL_APIENTRY EnableVertexAttribArrayContextANGLE(GLeglContext ctx, GLuint index)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u)", index);
+    ANGLE_BINARY_EVENT(EnableVertexAttribArray, index);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateEnableVertexAttribArray(context, index))
-        {
-            context->enableVertexAttribArray(index);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->EnableVertexAttribArray(context, index);
     }
 }
 
@@ -7842,16 +6836,13 @@ void GL_APIENTRY EndQueryContextANGLE(GLeglContext ctx, GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(EndQuery, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() || ValidateEndQuery(context, targetPacked))
-        {
-            context->endQuery(targetPacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->EndQuery(context, target);
     }
 }
 
@@ -7859,16 +6850,13 @@ void GL_APIENTRY EndQueryEXTContextANGLE(GLeglContext ctx, GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(EndQueryEXT, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() || ValidateEndQueryEXT(context, targetPacked))
-        {
-            context->endQuery(targetPacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->EndQueryEXT(context, target);
     }
 }
 
@@ -7876,15 +6864,13 @@ void GL_APIENTRY EndTransformFeedbackContextANGLE(GLeglContext ctx)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(EndTransformFeedback);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateEndTransformFeedback(context))
-        {
-            context->endTransformFeedback();
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->EndTransformFeedback(context);
     }
 }
 
@@ -7892,15 +6878,13 @@ GLsync GL_APIENTRY FenceSyncContextANGLE(GLeglContext ctx, GLenum condition, GLb
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum condition = 0x%X, GLbitfield flags = 0x%X)", condition, flags);
+    ANGLE_BINARY_EVENT(FenceSync, condition, flags);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateFenceSync(context, condition, flags))
-        {
-            return context->fenceSync(condition, flags);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->FenceSync(context, condition, flags);
     }
 
     return GetDefaultReturnValue<EntryPoint::FenceSync, GLsync>();
@@ -7910,15 +6894,13 @@ void GL_APIENTRY FinishContextANGLE(GLeglContext ctx)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(Finish);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateFinish(context))
-        {
-            context->finish();
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Finish(context);
     }
 }
 
@@ -7926,15 +6908,13 @@ void GL_APIENTRY FinishFenceNVContextANGLE(GLeglContext ctx, GLuint fence)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u)", fence);
+    ANGLE_BINARY_EVENT(FinishFenceNV, fence);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateFinishFenceNV(context, fence))
-        {
-            context->finishFenceNV(fence);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->FinishFenceNV(context, fence);
     }
 }
 
@@ -7942,15 +6922,13 @@ void GL_APIENTRY FlushContextANGLE(GLeglContext ctx)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(Flush);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateFlush(context))
-        {
-            context->flush();
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Flush(context);
     }
 }
 
@@ -7962,17 +6940,13 @@ void GL_APIENTRY FlushMappedBufferRangeContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr length = %llu)", target,
           static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length));
+    ANGLE_BINARY_EVENT(FlushMappedBufferRange, target, offset, length);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateFlushMappedBufferRange(context, targetPacked, offset, length))
-        {
-            context->flushMappedBufferRange(targetPacked, offset, length);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->FlushMappedBufferRange(context, target, offset, length);
     }
 }
 
@@ -7984,17 +6958,13 @@ void GL_APIENTRY FlushMappedBufferRangeEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr length = %llu)", target,
           static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length));
+    ANGLE_BINARY_EVENT(FlushMappedBufferRangeEXT, target, offset, length);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateFlushMappedBufferRangeEXT(context, targetPacked, offset, length))
-        {
-            context->flushMappedBufferRange(targetPacked, offset, length);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->FlushMappedBufferRangeEXT(context, target, offset, length);
     }
 }
 
@@ -8002,15 +6972,13 @@ void GL_APIENTRY FogfContextANGLE(GLeglContext ctx, GLenum pname, GLfloat param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat param = %f)", pname, param);
+    ANGLE_BINARY_EVENT(Fogf, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateFogf(context, pname, param))
-        {
-            context->fogf(pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Fogf(context, pname, param);
     }
 }
 
@@ -8019,15 +6987,13 @@ void GL_APIENTRY FogfvContextANGLE(GLeglContext ctx, GLenum pname, const GLfloat
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(Fogfv, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateFogfv(context, pname, params))
-        {
-            context->fogfv(pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Fogfv(context, pname, params);
     }
 }
 
@@ -8035,15 +7001,13 @@ void GL_APIENTRY FogxContextANGLE(GLeglContext ctx, GLenum pname, GLfixed param)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed param = 0x%X)", pname, param);
+    ANGLE_BINARY_EVENT(Fogx, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateFogx(context, pname, param))
-        {
-            context->fogx(pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Fogx(context, pname, param);
     }
 }
 
@@ -8052,15 +7016,13 @@ void GL_APIENTRY FogxvContextANGLE(GLeglContext ctx, GLenum pname, const GLfixed
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)param);
+    ANGLE_BINARY_EVENT(Fogxv, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateFogxv(context, pname, param))
-        {
-            context->fogxv(pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Fogxv(context, pname, param);
     }
 }
 
@@ -8071,16 +7033,13 @@ void GL_APIENTRY FramebufferParameteriContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)", target, pname, param);
+    ANGLE_BINARY_EVENT(FramebufferParameteri, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateFramebufferParameteri(context, target, pname, param))
-        {
-            context->framebufferParameteri(target, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->FramebufferParameteri(context, target, pname, param);
     }
 }
 
@@ -8095,17 +7054,15 @@ void GL_APIENTRY FramebufferRenderbufferContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum renderbuffertarget = 0x%X, GLuint "
         "renderbuffer = %u)",
         target, attachment, renderbuffertarget, renderbuffer);
+    ANGLE_BINARY_EVENT(FramebufferRenderbuffer, target, attachment, renderbuffertarget,
+                       renderbuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateFramebufferRenderbuffer(context, target, attachment, renderbuffertarget,
-                                            renderbuffer))
-        {
-            context->framebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->FramebufferRenderbuffer(context, target, attachment,
+                                                             renderbuffertarget, renderbuffer);
     }
 }
 
@@ -8120,17 +7077,15 @@ void GL_APIENTRY FramebufferRenderbufferOESContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum renderbuffertarget = 0x%X, GLuint "
         "renderbuffer = %u)",
         target, attachment, renderbuffertarget, renderbuffer);
+    ANGLE_BINARY_EVENT(FramebufferRenderbufferOES, target, attachment, renderbuffertarget,
+                       renderbuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateFramebufferRenderbufferOES(context, target, attachment, renderbuffertarget,
-                                               renderbuffer))
-        {
-            context->framebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->FramebufferRenderbufferOES(context, target, attachment,
+                                                                renderbuffertarget, renderbuffer);
     }
 }
 
@@ -8146,18 +7101,14 @@ void GL_APIENTRY FramebufferTexture2DContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum textarget = 0x%X, GLuint texture "
         "= %u, GLint level = %d)",
         target, attachment, textarget, texture, level);
+    ANGLE_BINARY_EVENT(FramebufferTexture2D, target, attachment, textarget, texture, level);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget textargetPacked = FromGLenum<TextureTarget>(textarget);
-        if (context->skipValidation() ||
-            ValidateFramebufferTexture2D(context, target, attachment, textargetPacked, texture,
-                                         level))
-        {
-            context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->FramebufferTexture2D(context, target, attachment, textarget,
+                                                          texture, level);
     }
 }
 
@@ -8173,18 +7124,14 @@ void GL_APIENTRY FramebufferTexture2DOESContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum textarget = 0x%X, GLuint texture "
         "= %u, GLint level = %d)",
         target, attachment, textarget, texture, level);
+    ANGLE_BINARY_EVENT(FramebufferTexture2DOES, target, attachment, textarget, texture, level);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget textargetPacked = FromGLenum<TextureTarget>(textarget);
-        if (context->skipValidation() ||
-            ValidateFramebufferTexture2DOES(context, target, attachment, textargetPacked, texture,
-                                            level))
-        {
-            context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->FramebufferTexture2DOES(context, target, attachment, textarget,
+                                                             texture, level);
     }
 }
 
@@ -8197,16 +7144,14 @@ void GL_APIENTRY FramebufferTextureEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint texture = %u, GLint level = %d)",
           target, attachment, texture, level);
+    ANGLE_BINARY_EVENT(FramebufferTextureEXT, target, attachment, texture, level);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateFramebufferTextureEXT(context, target, attachment, texture, level))
-        {
-            context->framebufferTexture(target, attachment, texture, level);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->FramebufferTextureEXT(context, target, attachment, texture,
+                                                           level);
     }
 }
 
@@ -8222,16 +7167,14 @@ void GL_APIENTRY FramebufferTextureLayerContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint texture = %u, GLint level = %d, "
         "GLint layer = %d)",
         target, attachment, texture, level, layer);
+    ANGLE_BINARY_EVENT(FramebufferTextureLayer, target, attachment, texture, level, layer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateFramebufferTextureLayer(context, target, attachment, texture, level, layer))
-        {
-            context->framebufferTextureLayer(target, attachment, texture, level, layer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->FramebufferTextureLayer(context, target, attachment, texture,
+                                                             level, layer);
     }
 }
 
@@ -8248,34 +7191,28 @@ void GL_APIENTRY FramebufferTextureMultiviewOVRContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint texture = %u, GLint level = %d, "
         "GLint baseViewIndex = %d, GLsizei numViews = %d)",
         target, attachment, texture, level, baseViewIndex, numViews);
+    ANGLE_BINARY_EVENT(FramebufferTextureMultiviewOVR, target, attachment, texture, level,
+                       baseViewIndex, numViews);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateFramebufferTextureMultiviewOVR(context, target, attachment, texture, level,
-                                                   baseViewIndex, numViews))
-        {
-            context->framebufferTextureMultiview(target, attachment, texture, level, baseViewIndex,
-                                                 numViews);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->FramebufferTextureMultiviewOVR(
+            context, target, attachment, texture, level, baseViewIndex, numViews);
     }
 }
 
 void GL_APIENTRY FrontFaceContextANGLE(GLeglContext ctx, GLenum mode)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_EVENT(FrontFace, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateFrontFace(context, mode))
-        {
-            context->frontFace(mode);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->FrontFace(context, mode);
     }
 }
 
@@ -8292,15 +7229,13 @@ void GL_APIENTRY FrustumfContextANGLE(GLeglContext ctx,
         "(GLfloat l = %f, GLfloat r = %f, GLfloat b = %f, GLfloat t = %f, GLfloat n = %f, GLfloat "
         "f = %f)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_EVENT(Frustumf, l, r, b, t, n, f);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateFrustumf(context, l, r, b, t, n, f))
-        {
-            context->frustumf(l, r, b, t, n, f);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Frustumf(context, l, r, b, t, n, f);
     }
 }
 
@@ -8317,15 +7252,13 @@ void GL_APIENTRY FrustumxContextANGLE(GLeglContext ctx,
         "(GLfixed l = 0x%X, GLfixed r = 0x%X, GLfixed b = 0x%X, GLfixed t = 0x%X, GLfixed n = "
         "0x%X, GLfixed f = 0x%X)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_EVENT(Frustumx, l, r, b, t, n, f);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateFrustumx(context, l, r, b, t, n, f))
-        {
-            context->frustumx(l, r, b, t, n, f);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Frustumx(context, l, r, b, t, n, f);
     }
 }
 
@@ -8333,15 +7266,13 @@ void GL_APIENTRY GenBuffersContextANGLE(GLeglContext ctx, GLsizei n, GLuint *buf
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *buffers = 0x%016" PRIxPTR ")", n, (uintptr_t)buffers);
+    ANGLE_BINARY_EVENT(GenBuffers, n, buffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenBuffers(context, n, buffers))
-        {
-            context->genBuffers(n, buffers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenBuffers(context, n, buffers);
     }
 }
 
@@ -8349,15 +7280,13 @@ void GL_APIENTRY GenFencesNVContextANGLE(GLeglContext ctx, GLsizei n, GLuint *fe
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *fences = 0x%016" PRIxPTR ")", n, (uintptr_t)fences);
+    ANGLE_BINARY_EVENT(GenFencesNV, n, fences);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenFencesNV(context, n, fences))
-        {
-            context->genFencesNV(n, fences);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenFencesNV(context, n, fences);
     }
 }
 
@@ -8365,15 +7294,13 @@ void GL_APIENTRY GenFramebuffersContextANGLE(GLeglContext ctx, GLsizei n, GLuint
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *framebuffers = 0x%016" PRIxPTR ")", n, (uintptr_t)framebuffers);
+    ANGLE_BINARY_EVENT(GenFramebuffers, n, framebuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenFramebuffers(context, n, framebuffers))
-        {
-            context->genFramebuffers(n, framebuffers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenFramebuffers(context, n, framebuffers);
     }
 }
 
@@ -8381,15 +7308,13 @@ void GL_APIENTRY GenFramebuffersOESContextANGLE(GLeglContext ctx, GLsizei n, GLu
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *framebuffers = 0x%016" PRIxPTR ")", n, (uintptr_t)framebuffers);
+    ANGLE_BINARY_EVENT(GenFramebuffersOES, n, framebuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenFramebuffersOES(context, n, framebuffers))
-        {
-            context->genFramebuffers(n, framebuffers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenFramebuffersOES(context, n, framebuffers);
     }
 }
 
@@ -8397,15 +7322,13 @@ void GL_APIENTRY GenProgramPipelinesContextANGLE(GLeglContext ctx, GLsizei n, GL
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *pipelines = 0x%016" PRIxPTR ")", n, (uintptr_t)pipelines);
+    ANGLE_BINARY_EVENT(GenProgramPipelines, n, pipelines);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenProgramPipelines(context, n, pipelines))
-        {
-            context->genProgramPipelines(n, pipelines);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenProgramPipelines(context, n, pipelines);
     }
 }
 
@@ -8413,15 +7336,13 @@ void GL_APIENTRY GenQueriesContextANGLE(GLeglContext ctx, GLsizei n, GLuint *ids
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_EVENT(GenQueries, n, ids);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenQueries(context, n, ids))
-        {
-            context->genQueries(n, ids);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenQueries(context, n, ids);
     }
 }
 
@@ -8429,15 +7350,13 @@ void GL_APIENTRY GenQueriesEXTContextANGLE(GLeglContext ctx, GLsizei n, GLuint *
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_EVENT(GenQueriesEXT, n, ids);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenQueriesEXT(context, n, ids))
-        {
-            context->genQueries(n, ids);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenQueriesEXT(context, n, ids);
     }
 }
 
@@ -8446,15 +7365,13 @@ void GL_APIENTRY GenRenderbuffersContextANGLE(GLeglContext ctx, GLsizei n, GLuin
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_EVENT(GenRenderbuffers, n, renderbuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenRenderbuffers(context, n, renderbuffers))
-        {
-            context->genRenderbuffers(n, renderbuffers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenRenderbuffers(context, n, renderbuffers);
     }
 }
 
@@ -8463,15 +7380,13 @@ void GL_APIENTRY GenRenderbuffersOESContextANGLE(GLeglContext ctx, GLsizei n, GL
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_EVENT(GenRenderbuffersOES, n, renderbuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenRenderbuffersOES(context, n, renderbuffers))
-        {
-            context->genRenderbuffers(n, renderbuffers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenRenderbuffersOES(context, n, renderbuffers);
     }
 }
 
@@ -8479,15 +7394,13 @@ void GL_APIENTRY GenSamplersContextANGLE(GLeglContext ctx, GLsizei count, GLuint
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei count = %d, GLuint *samplers = 0x%016" PRIxPTR ")", count, (uintptr_t)samplers);
+    ANGLE_BINARY_EVENT(GenSamplers, count, samplers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenSamplers(context, count, samplers))
-        {
-            context->genSamplers(count, samplers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenSamplers(context, count, samplers);
     }
 }
 
@@ -8495,15 +7408,13 @@ void GL_APIENTRY GenSemaphoresEXTContextANGLE(GLeglContext ctx, GLsizei n, GLuin
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *semaphores = 0x%016" PRIxPTR ")", n, (uintptr_t)semaphores);
+    ANGLE_BINARY_EVENT(GenSemaphoresEXT, n, semaphores);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenSemaphoresEXT(context, n, semaphores))
-        {
-            context->genSemaphores(n, semaphores);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenSemaphoresEXT(context, n, semaphores);
     }
 }
 
@@ -8511,15 +7422,13 @@ void GL_APIENTRY GenTexturesContextANGLE(GLeglContext ctx, GLsizei n, GLuint *te
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *textures = 0x%016" PRIxPTR ")", n, (uintptr_t)textures);
+    ANGLE_BINARY_EVENT(GenTextures, n, textures);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenTextures(context, n, textures))
-        {
-            context->genTextures(n, textures);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenTextures(context, n, textures);
     }
 }
 
@@ -8527,15 +7436,13 @@ void GL_APIENTRY GenTransformFeedbacksContextANGLE(GLeglContext ctx, GLsizei n,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_EVENT(GenTransformFeedbacks, n, ids);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenTransformFeedbacks(context, n, ids))
-        {
-            context->genTransformFeedbacks(n, ids);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenTransformFeedbacks(context, n, ids);
     }
 }
 
@@ -8543,15 +7450,13 @@ void GL_APIENTRY GenVertexArraysContextANGLE(GLeglContext ctx, GLsizei n, GLuint
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_EVENT(GenVertexArrays, n, arrays);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenVertexArrays(context, n, arrays))
-        {
-            context->genVertexArrays(n, arrays);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenVertexArrays(context, n, arrays);
     }
 }
 
@@ -8559,15 +7464,13 @@ void GL_APIENTRY GenVertexArraysOESContextANGLE(GLeglContext ctx, GLsizei n, GLu
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_EVENT(GenVertexArraysOES, n, arrays);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenVertexArraysOES(context, n, arrays))
-        {
-            context->genVertexArrays(n, arrays);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenVertexArraysOES(context, n, arrays);
     }
 }
 
@@ -8575,16 +7478,13 @@ void GL_APIENTRY GenerateMipmapContextANGLE(GLeglContext ctx, GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(GenerateMipmap, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateGenerateMipmap(context, targetPacked))
-        {
-            context->generateMipmap(targetPacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenerateMipmap(context, target);
     }
 }
 
@@ -8592,16 +7492,13 @@ void GL_APIENTRY GenerateMipmapOESContextANGLE(GLeglContext ctx, GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(GenerateMipmapOES, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateGenerateMipmapOES(context, targetPacked))
-        {
-            context->generateMipmap(targetPacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GenerateMipmapOES(context, target);
     }
 }
 
@@ -8621,16 +7518,14 @@ void GL_APIENTRY GetActiveAttribContextANGLE(GLeglContext ctx,
         ", GLchar *name = 0x%016" PRIxPTR ")",
         program, index, bufSize, (uintptr_t)length, (uintptr_t)size, (uintptr_t)type,
         (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetActiveAttrib, program, index, bufSize, length, size, type, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetActiveAttrib(context, program, index, bufSize, length, size, type, name))
-        {
-            context->getActiveAttrib(program, index, bufSize, length, size, type, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetActiveAttrib(context, program, index, bufSize, length, size,
+                                                     type, name);
     }
 }
 
@@ -8650,16 +7545,14 @@ void GL_APIENTRY GetActiveUniformContextANGLE(GLeglContext ctx,
         ", GLchar *name = 0x%016" PRIxPTR ")",
         program, index, bufSize, (uintptr_t)length, (uintptr_t)size, (uintptr_t)type,
         (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetActiveUniform, program, index, bufSize, length, size, type, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetActiveUniform(context, program, index, bufSize, length, size, type, name))
-        {
-            context->getActiveUniform(program, index, bufSize, length, size, type, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetActiveUniform(context, program, index, bufSize, length,
+                                                      size, type, name);
     }
 }
 
@@ -8675,18 +7568,15 @@ void GL_APIENTRY GetActiveUniformBlockNameContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLuint uniformBlockIndex = %u, GLsizei bufSize = %d, GLsizei "
         "*length = 0x%016" PRIxPTR ", GLchar *uniformBlockName = 0x%016" PRIxPTR ")",
         program, uniformBlockIndex, bufSize, (uintptr_t)length, (uintptr_t)uniformBlockName);
+    ANGLE_BINARY_EVENT(GetActiveUniformBlockName, program, uniformBlockIndex, bufSize, length,
+                       uniformBlockName);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetActiveUniformBlockName(context, program, uniformBlockIndex, bufSize, length,
-                                              uniformBlockName))
-        {
-            context->getActiveUniformBlockName(program, uniformBlockIndex, bufSize, length,
-                                               uniformBlockName);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetActiveUniformBlockName(context, program, uniformBlockIndex,
+                                                               bufSize, length, uniformBlockName);
     }
 }
 
@@ -8701,16 +7591,14 @@ void GL_APIENTRY GetActiveUniformBlockivContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLuint uniformBlockIndex = %u, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         program, uniformBlockIndex, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetActiveUniformBlockiv, program, uniformBlockIndex, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetActiveUniformBlockiv(context, program, uniformBlockIndex, pname, params))
-        {
-            context->getActiveUniformBlockiv(program, uniformBlockIndex, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetActiveUniformBlockiv(context, program, uniformBlockIndex,
+                                                             pname, params);
     }
 }
 
@@ -8726,16 +7614,14 @@ void GL_APIENTRY GetActiveUniformsivContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLsizei uniformCount = %d, const GLuint *uniformIndices = "
         "0x%016" PRIxPTR ", GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
         program, uniformCount, (uintptr_t)uniformIndices, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetActiveUniformsiv, program, uniformCount, uniformIndices, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetActiveUniformsiv(context, program, uniformCount,
-                                                                     uniformIndices, pname, params))
-        {
-            context->getActiveUniformsiv(program, uniformCount, uniformIndices, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetActiveUniformsiv(context, program, uniformCount,
+                                                         uniformIndices, pname, params);
     }
 }
 
@@ -8749,16 +7635,13 @@ void GL_APIENTRY GetAttachedShadersContextANGLE(GLeglContext ctx,
     EVENT("(GLuint program = %u, GLsizei maxCount = %d, GLsizei *count = 0x%016" PRIxPTR
           ", GLuint *shaders = 0x%016" PRIxPTR ")",
           program, maxCount, (uintptr_t)count, (uintptr_t)shaders);
+    ANGLE_BINARY_EVENT(GetAttachedShaders, program, maxCount, count, shaders);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetAttachedShaders(context, program, maxCount, count, shaders))
-        {
-            context->getAttachedShaders(program, maxCount, count, shaders);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetAttachedShaders(context, program, maxCount, count, shaders);
     }
 }
 
@@ -8766,18 +7649,16 @@ GLint GL_APIENTRY GetAttribLocationContextANGLE(GLeglContext ctx,
                                                 GLuint program,
                                                 const GLchar *name)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetAttribLocation, program, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetAttribLocation(context, program, name))
-        {
-            return context->getAttribLocation(program, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        return context->getDispatchTable()->GetAttribLocation(context, program, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetAttribLocation, GLint>();
@@ -8791,15 +7672,13 @@ void GL_APIENTRY GetBooleani_vContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLboolean *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetBooleani_v, target, index, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetBooleani_v(context, target, index, data))
-        {
-            context->getBooleani_v(target, index, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetBooleani_v(context, target, index, data);
     }
 }
 
@@ -8807,15 +7686,13 @@ void GL_APIENTRY GetBooleanvContextANGLE(GLeglContext ctx, GLenum pname, GLboole
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLboolean *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetBooleanv, pname, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetBooleanv(context, pname, data))
-        {
-            context->getBooleanv(pname, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetBooleanv(context, pname, data);
     }
 }
 
@@ -8827,17 +7704,13 @@ void GL_APIENTRY GetBufferParameteri64vContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint64 *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferParameteri64v, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateGetBufferParameteri64v(context, targetPacked, pname, params))
-        {
-            context->getBufferParameteri64v(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetBufferParameteri64v(context, target, pname, params);
     }
 }
 
@@ -8849,17 +7722,13 @@ void GL_APIENTRY GetBufferParameterivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferParameteriv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateGetBufferParameteriv(context, targetPacked, pname, params))
-        {
-            context->getBufferParameteriv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetBufferParameteriv(context, target, pname, params);
     }
 }
 
@@ -8871,17 +7740,13 @@ void GL_APIENTRY GetBufferPointervContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferPointerv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateGetBufferPointerv(context, targetPacked, pname, params))
-        {
-            context->getBufferPointerv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetBufferPointerv(context, target, pname, params);
     }
 }
 
@@ -8893,17 +7758,13 @@ void GL_APIENTRY GetBufferPointervOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferPointervOES, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateGetBufferPointervOES(context, targetPacked, pname, params))
-        {
-            context->getBufferPointerv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetBufferPointervOES(context, target, pname, params);
     }
 }
 
@@ -8912,15 +7773,13 @@ void GL_APIENTRY GetClipPlanefContextANGLE(GLeglContext ctx, GLenum plane, GLflo
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum plane = 0x%X, GLfloat *equation = 0x%016" PRIxPTR ")", plane,
           (uintptr_t)equation);
+    ANGLE_BINARY_EVENT(GetClipPlanef, plane, equation);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetClipPlanef(context, plane, equation))
-        {
-            context->getClipPlanef(plane, equation);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetClipPlanef(context, plane, equation);
     }
 }
 
@@ -8929,15 +7788,13 @@ void GL_APIENTRY GetClipPlanexContextANGLE(GLeglContext ctx, GLenum plane, GLfix
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum plane = 0x%X, GLfixed *equation = 0x%016" PRIxPTR ")", plane,
           (uintptr_t)equation);
+    ANGLE_BINARY_EVENT(GetClipPlanex, plane, equation);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetClipPlanex(context, plane, equation))
-        {
-            context->getClipPlanex(plane, equation);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetClipPlanex(context, plane, equation);
     }
 }
 
@@ -8958,18 +7815,15 @@ GLuint GL_APIENTRY GetDebugMessageLogKHRContextANGLE(GLeglContext ctx,
           ", GLchar *messageLog = 0x%016" PRIxPTR ")",
           count, bufSize, (uintptr_t)sources, (uintptr_t)types, (uintptr_t)ids,
           (uintptr_t)severities, (uintptr_t)lengths, (uintptr_t)messageLog);
+    ANGLE_BINARY_EVENT(GetDebugMessageLogKHR, count, bufSize, sources, types, ids, severities,
+                       lengths, messageLog);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetDebugMessageLogKHR(context, count, bufSize, sources, types, ids, severities,
-                                          lengths, messageLog))
-        {
-            return context->getDebugMessageLog(count, bufSize, sources, types, ids, severities,
-                                               lengths, messageLog);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->GetDebugMessageLogKHR(
+            context, count, bufSize, sources, types, ids, severities, lengths, messageLog);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetDebugMessageLogKHR, GLuint>();
@@ -8977,17 +7831,14 @@ GLuint GL_APIENTRY GetDebugMessageLogKHRContextANGLE(GLeglContext ctx,
 
 GLenum GL_APIENTRY GetErrorContextANGLE(GLeglContext ctx)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(GetError);
 
-    Context *context = GetGlobalContext();
+    Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetError(context))
-        {
-            return context->getError();
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->GetError(context);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetError, GLenum>();
@@ -9001,15 +7852,13 @@ void GL_APIENTRY GetFenceivNVContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", fence,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFenceivNV, fence, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetFenceivNV(context, fence, pname, params))
-        {
-            context->getFenceivNV(fence, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetFenceivNV(context, fence, pname, params);
     }
 }
 
@@ -9017,15 +7866,13 @@ void GL_APIENTRY GetFixedvContextANGLE(GLeglContext ctx, GLenum pname, GLfixed *
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFixedv, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetFixedv(context, pname, params))
-        {
-            context->getFixedv(pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetFixedv(context, pname, params);
     }
 }
 
@@ -9033,15 +7880,13 @@ void GL_APIENTRY GetFloatvContextANGLE(GLeglContext ctx, GLenum pname, GLfloat *
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetFloatv, pname, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetFloatv(context, pname, data))
-        {
-            context->getFloatv(pname, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetFloatv(context, pname, data);
     }
 }
 
@@ -9052,15 +7897,13 @@ GLint GL_APIENTRY GetFragDataIndexEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetFragDataIndexEXT, program, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetFragDataIndexEXT(context, program, name))
-        {
-            return context->getFragDataIndex(program, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->GetFragDataIndexEXT(context, program, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetFragDataIndexEXT, GLint>();
@@ -9073,15 +7916,13 @@ GLint GL_APIENTRY GetFragDataLocationContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetFragDataLocation, program, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetFragDataLocation(context, program, name))
-        {
-            return context->getFragDataLocation(program, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->GetFragDataLocation(context, program, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetFragDataLocation, GLint>();
@@ -9098,16 +7939,14 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivContextANGLE(GLeglContext ct
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         target, attachment, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFramebufferAttachmentParameteriv, target, attachment, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetFramebufferAttachmentParameteriv(context, target, attachment, pname, params))
-        {
-            context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetFramebufferAttachmentParameteriv(context, target,
+                                                                         attachment, pname, params);
     }
 }
 
@@ -9122,16 +7961,14 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivOESContextANGLE(GLeglContext
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         target, attachment, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFramebufferAttachmentParameterivOES, target, attachment, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetFramebufferAttachmentParameterivOES(
-                                             context, target, attachment, pname, params))
-        {
-            context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetFramebufferAttachmentParameterivOES(
+            context, target, attachment, pname, params);
     }
 }
 
@@ -9143,16 +7980,13 @@ void GL_APIENTRY GetFramebufferParameterivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFramebufferParameteriv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetFramebufferParameteriv(context, target, pname, params))
-        {
-            context->getFramebufferParameteriv(target, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetFramebufferParameteriv(context, target, pname, params);
     }
 }
 
@@ -9160,15 +7994,13 @@ GLenum GL_APIENTRY GetGraphicsResetStatusEXTContextANGLE(GLeglContext ctx)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(GetGraphicsResetStatusEXT);
 
-    Context *context = GetGlobalContext();
+    Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetGraphicsResetStatusEXT(context))
-        {
-            return context->getGraphicsResetStatus();
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->GetGraphicsResetStatusEXT(context);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetGraphicsResetStatusEXT, GLenum>();
@@ -9182,15 +8014,13 @@ void GL_APIENTRY GetInteger64i_vContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLint64 *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetInteger64i_v, target, index, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetInteger64i_v(context, target, index, data))
-        {
-            context->getInteger64i_v(target, index, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetInteger64i_v(context, target, index, data);
     }
 }
 
@@ -9198,15 +8028,13 @@ void GL_APIENTRY GetInteger64vContextANGLE(GLeglContext ctx, GLenum pname, GLint
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLint64 *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetInteger64v, pname, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetInteger64v(context, pname, data))
-        {
-            context->getInteger64v(pname, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetInteger64v(context, pname, data);
     }
 }
 
@@ -9218,15 +8046,13 @@ void GL_APIENTRY GetIntegeri_vContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLint *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetIntegeri_v, target, index, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetIntegeri_v(context, target, index, data))
-        {
-            context->getIntegeri_v(target, index, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetIntegeri_v(context, target, index, data);
     }
 }
 
@@ -9234,15 +8060,13 @@ void GL_APIENTRY GetIntegervContextANGLE(GLeglContext ctx, GLenum pname, GLint *
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLint *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetIntegerv, pname, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetIntegerv(context, pname, data))
-        {
-            context->getIntegerv(pname, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetIntegerv(context, pname, data);
     }
 }
 
@@ -9258,16 +8082,14 @@ void GL_APIENTRY GetInternalformativContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLenum pname = 0x%X, GLsizei bufSize "
         "= %d, GLint *params = 0x%016" PRIxPTR ")",
         target, internalformat, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetInternalformativ, target, internalformat, pname, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetInternalformativ(context, target, internalformat, pname, bufSize, params))
-        {
-            context->getInternalformativ(target, internalformat, pname, bufSize, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetInternalformativ(context, target, internalformat, pname,
+                                                         bufSize, params);
     }
 }
 
@@ -9279,16 +8101,13 @@ void GL_APIENTRY GetLightfvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", light,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetLightfv, light, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
-        if (context->skipValidation() || ValidateGetLightfv(context, light, pnamePacked, params))
-        {
-            context->getLightfv(light, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetLightfv(context, light, pname, params);
     }
 }
 
@@ -9300,16 +8119,13 @@ void GL_APIENTRY GetLightxvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", light,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetLightxv, light, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
-        if (context->skipValidation() || ValidateGetLightxv(context, light, pnamePacked, params))
-        {
-            context->getLightxv(light, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetLightxv(context, light, pname, params);
     }
 }
 
@@ -9321,16 +8137,13 @@ void GL_APIENTRY GetMaterialfvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", face,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetMaterialfv, face, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
-        if (context->skipValidation() || ValidateGetMaterialfv(context, face, pnamePacked, params))
-        {
-            context->getMaterialfv(face, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetMaterialfv(context, face, pname, params);
     }
 }
 
@@ -9342,16 +8155,13 @@ void GL_APIENTRY GetMaterialxvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", face,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetMaterialxv, face, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
-        if (context->skipValidation() || ValidateGetMaterialxv(context, face, pnamePacked, params))
-        {
-            context->getMaterialxv(face, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetMaterialxv(context, face, pname, params);
     }
 }
 
@@ -9363,16 +8173,14 @@ void GL_APIENTRY GetMemoryObjectParameterivEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memoryObject = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
           memoryObject, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetMemoryObjectParameterivEXT, memoryObject, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetMemoryObjectParameterivEXT(context, memoryObject, pname, params))
-        {
-            context->getMemoryObjectParameteriv(memoryObject, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetMemoryObjectParameterivEXT(context, memoryObject, pname,
+                                                                   params);
     }
 }
 
@@ -9384,15 +8192,13 @@ void GL_APIENTRY GetMultisamplefvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLuint index = %u, GLfloat *val = 0x%016" PRIxPTR ")", pname,
           index, (uintptr_t)val);
+    ANGLE_BINARY_EVENT(GetMultisamplefv, pname, index, val);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetMultisamplefv(context, pname, index, val))
-        {
-            context->getMultisamplefv(pname, index, val);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetMultisamplefv(context, pname, index, val);
     }
 }
 
@@ -9408,16 +8214,14 @@ void GL_APIENTRY GetObjectLabelKHRContextANGLE(GLeglContext ctx,
         "(GLenum identifier = 0x%X, GLuint name = %u, GLsizei bufSize = %d, GLsizei *length = "
         "0x%016" PRIxPTR ", GLchar *label = 0x%016" PRIxPTR ")",
         identifier, name, bufSize, (uintptr_t)length, (uintptr_t)label);
+    ANGLE_BINARY_EVENT(GetObjectLabelKHR, identifier, name, bufSize, length, label);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetObjectLabelKHR(context, identifier, name, bufSize, length, label))
-        {
-            context->getObjectLabel(identifier, name, bufSize, length, label);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetObjectLabelKHR(context, identifier, name, bufSize, length,
+                                                       label);
     }
 }
 
@@ -9432,16 +8236,13 @@ void GL_APIENTRY GetObjectPtrLabelKHRContextANGLE(GLeglContext ctx,
           ", GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *label = 0x%016" PRIxPTR ")",
           (uintptr_t)ptr, bufSize, (uintptr_t)length, (uintptr_t)label);
+    ANGLE_BINARY_EVENT(GetObjectPtrLabelKHR, ptr, bufSize, length, label);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetObjectPtrLabelKHR(context, ptr, bufSize, length, label))
-        {
-            context->getObjectPtrLabel(ptr, bufSize, length, label);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetObjectPtrLabelKHR(context, ptr, bufSize, length, label);
     }
 }
 
@@ -9449,15 +8250,13 @@ void GL_APIENTRY GetPointervContextANGLE(GLeglContext ctx, GLenum pname, void **
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetPointerv, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetPointerv(context, pname, params))
-        {
-            context->getPointerv(pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetPointerv(context, pname, params);
     }
 }
 
@@ -9465,15 +8264,13 @@ void GL_APIENTRY GetPointervKHRContextANGLE(GLeglContext ctx, GLenum pname, void
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetPointervKHR, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetPointervKHR(context, pname, params))
-        {
-            context->getPointerv(pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetPointervKHR(context, pname, params);
     }
 }
 
@@ -9488,16 +8285,14 @@ void GL_APIENTRY GetProgramBinaryContextANGLE(GLeglContext ctx,
     EVENT("(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLenum *binaryFormat = 0x%016" PRIxPTR ", void *binary = 0x%016" PRIxPTR ")",
           program, bufSize, (uintptr_t)length, (uintptr_t)binaryFormat, (uintptr_t)binary);
+    ANGLE_BINARY_EVENT(GetProgramBinary, program, bufSize, length, binaryFormat, binary);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramBinary(context, program, bufSize, length, binaryFormat, binary))
-        {
-            context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetProgramBinary(context, program, bufSize, length,
+                                                      binaryFormat, binary);
     }
 }
 
@@ -9512,16 +8307,14 @@ void GL_APIENTRY GetProgramBinaryOESContextANGLE(GLeglContext ctx,
     EVENT("(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLenum *binaryFormat = 0x%016" PRIxPTR ", void *binary = 0x%016" PRIxPTR ")",
           program, bufSize, (uintptr_t)length, (uintptr_t)binaryFormat, (uintptr_t)binary);
+    ANGLE_BINARY_EVENT(GetProgramBinaryOES, program, bufSize, length, binaryFormat, binary);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramBinaryOES(context, program, bufSize, length, binaryFormat, binary))
-        {
-            context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetProgramBinaryOES(context, program, bufSize, length,
+                                                         binaryFormat, binary);
     }
 }
 
@@ -9535,16 +8328,13 @@ void GL_APIENTRY GetProgramInfoLogContextANGLE(GLeglContext ctx,
     EVENT("(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *infoLog = 0x%016" PRIxPTR ")",
           program, bufSize, (uintptr_t)length, (uintptr_t)infoLog);
+    ANGLE_BINARY_EVENT(GetProgramInfoLog, program, bufSize, length, infoLog);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramInfoLog(context, program, bufSize, length, infoLog))
-        {
-            context->getProgramInfoLog(program, bufSize, length, infoLog);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetProgramInfoLog(context, program, bufSize, length, infoLog);
     }
 }
 
@@ -9559,16 +8349,14 @@ void GL_APIENTRY GetProgramInterfaceivContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLenum pname = 0x%X, GLint *params "
         "= 0x%016" PRIxPTR ")",
         program, programInterface, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetProgramInterfaceiv, program, programInterface, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramInterfaceiv(context, program, programInterface, pname, params))
-        {
-            context->getProgramInterfaceiv(program, programInterface, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetProgramInterfaceiv(context, program, programInterface,
+                                                           pname, params);
     }
 }
 
@@ -9582,16 +8370,14 @@ void GL_APIENTRY GetProgramPipelineInfoLogContextANGLE(GLeglContext ctx,
     EVENT("(GLuint pipeline = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *infoLog = 0x%016" PRIxPTR ")",
           pipeline, bufSize, (uintptr_t)length, (uintptr_t)infoLog);
+    ANGLE_BINARY_EVENT(GetProgramPipelineInfoLog, pipeline, bufSize, length, infoLog);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramPipelineInfoLog(context, pipeline, bufSize, length, infoLog))
-        {
-            context->getProgramPipelineInfoLog(pipeline, bufSize, length, infoLog);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetProgramPipelineInfoLog(context, pipeline, bufSize, length,
+                                                               infoLog);
     }
 }
 
@@ -9603,16 +8389,13 @@ void GL_APIENTRY GetProgramPipelineivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
           pipeline, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetProgramPipelineiv, pipeline, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramPipelineiv(context, pipeline, pname, params))
-        {
-            context->getProgramPipelineiv(pipeline, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetProgramPipelineiv(context, pipeline, pname, params);
     }
 }
 
@@ -9626,16 +8409,14 @@ GLuint GL_APIENTRY GetProgramResourceIndexContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLenum programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR
         ")",
         program, programInterface, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetProgramResourceIndex, program, programInterface, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramResourceIndex(context, program, programInterface, name))
-        {
-            return context->getProgramResourceIndex(program, programInterface, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->GetProgramResourceIndex(context, program,
+                                                                    programInterface, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetProgramResourceIndex, GLuint>();
@@ -9651,16 +8432,14 @@ GLint GL_APIENTRY GetProgramResourceLocationContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLenum programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR
         ")",
         program, programInterface, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetProgramResourceLocation, program, programInterface, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramResourceLocation(context, program, programInterface, name))
-        {
-            return context->getProgramResourceLocation(program, programInterface, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->GetProgramResourceLocation(context, program,
+                                                                       programInterface, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetProgramResourceLocation, GLint>();
@@ -9676,16 +8455,14 @@ GLint GL_APIENTRY GetProgramResourceLocationIndexEXTContextANGLE(GLeglContext ct
         "(GLuint program = %u, GLenum programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR
         ")",
         program, programInterface, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetProgramResourceLocationIndexEXT, program, programInterface, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramResourceLocationIndexEXT(context, program, programInterface, name))
-        {
-            return context->getProgramResourceLocationIndex(program, programInterface, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->GetProgramResourceLocationIndexEXT(
+            context, program, programInterface, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetProgramResourceLocationIndexEXT, GLint>();
@@ -9704,18 +8481,15 @@ void GL_APIENTRY GetProgramResourceNameContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLuint index = %u, GLsizei bufSize "
         "= %d, GLsizei *length = 0x%016" PRIxPTR ", GLchar *name = 0x%016" PRIxPTR ")",
         program, programInterface, index, bufSize, (uintptr_t)length, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetProgramResourceName, program, programInterface, index, bufSize, length,
+                       name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramResourceName(context, program, programInterface, index, bufSize,
-                                           length, name))
-        {
-            context->getProgramResourceName(program, programInterface, index, bufSize, length,
-                                            name);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetProgramResourceName(context, program, programInterface,
+                                                            index, bufSize, length, name);
     }
 }
 
@@ -9737,18 +8511,15 @@ void GL_APIENTRY GetProgramResourceivContextANGLE(GLeglContext ctx,
         ", GLint *params = 0x%016" PRIxPTR ")",
         program, programInterface, index, propCount, (uintptr_t)props, bufSize, (uintptr_t)length,
         (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetProgramResourceiv, program, programInterface, index, propCount, props,
+                       bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramResourceiv(context, program, programInterface, index, propCount,
-                                         props, bufSize, length, params))
-        {
-            context->getProgramResourceiv(program, programInterface, index, propCount, props,
-                                          bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetProgramResourceiv(
+            context, program, programInterface, index, propCount, props, bufSize, length, params);
     }
 }
 
@@ -9760,15 +8531,13 @@ void GL_APIENTRY GetProgramivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", program,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetProgramiv, program, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetProgramiv(context, program, pname, params))
-        {
-            context->getProgramiv(program, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetProgramiv(context, program, pname, params);
     }
 }
 
@@ -9780,15 +8549,13 @@ void GL_APIENTRY GetQueryObjecti64vEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLint64 *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjecti64vEXT, id, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetQueryObjecti64vEXT(context, id, pname, params))
-        {
-            context->getQueryObjecti64v(id, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetQueryObjecti64vEXT(context, id, pname, params);
     }
 }
 
@@ -9800,15 +8567,13 @@ void GL_APIENTRY GetQueryObjectivEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectivEXT, id, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetQueryObjectivEXT(context, id, pname, params))
-        {
-            context->getQueryObjectiv(id, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetQueryObjectivEXT(context, id, pname, params);
     }
 }
 
@@ -9820,15 +8585,13 @@ void GL_APIENTRY GetQueryObjectui64vEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLuint64 *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectui64vEXT, id, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetQueryObjectui64vEXT(context, id, pname, params))
-        {
-            context->getQueryObjectui64v(id, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetQueryObjectui64vEXT(context, id, pname, params);
     }
 }
 
@@ -9840,15 +8603,13 @@ void GL_APIENTRY GetQueryObjectuivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectuiv, id, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetQueryObjectuiv(context, id, pname, params))
-        {
-            context->getQueryObjectuiv(id, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetQueryObjectuiv(context, id, pname, params);
     }
 }
 
@@ -9860,15 +8621,13 @@ void GL_APIENTRY GetQueryObjectuivEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectuivEXT, id, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetQueryObjectuivEXT(context, id, pname, params))
-        {
-            context->getQueryObjectuiv(id, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetQueryObjectuivEXT(context, id, pname, params);
     }
 }
 
@@ -9880,16 +8639,13 @@ void GL_APIENTRY GetQueryivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryiv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() || ValidateGetQueryiv(context, targetPacked, pname, params))
-        {
-            context->getQueryiv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetQueryiv(context, target, pname, params);
     }
 }
 
@@ -9901,17 +8657,13 @@ void GL_APIENTRY GetQueryivEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryivEXT, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() ||
-            ValidateGetQueryivEXT(context, targetPacked, pname, params))
-        {
-            context->getQueryiv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetQueryivEXT(context, target, pname, params);
     }
 }
 
@@ -9923,16 +8675,13 @@ void GL_APIENTRY GetRenderbufferParameterivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetRenderbufferParameteriv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetRenderbufferParameteriv(context, target, pname, params))
-        {
-            context->getRenderbufferParameteriv(target, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetRenderbufferParameteriv(context, target, pname, params);
     }
 }
 
@@ -9944,16 +8693,13 @@ void GL_APIENTRY GetRenderbufferParameterivOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetRenderbufferParameterivOES, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetRenderbufferParameterivOES(context, target, pname, params))
-        {
-            context->getRenderbufferParameteriv(target, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetRenderbufferParameterivOES(context, target, pname, params);
     }
 }
 
@@ -9965,16 +8711,13 @@ void GL_APIENTRY GetSamplerParameterIivOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", sampler,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterIivOES, sampler, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetSamplerParameterIivOES(context, sampler, pname, params))
-        {
-            context->getSamplerParameterIiv(sampler, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetSamplerParameterIivOES(context, sampler, pname, params);
     }
 }
 
@@ -9986,16 +8729,13 @@ void GL_APIENTRY GetSamplerParameterIuivOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", sampler,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterIuivOES, sampler, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetSamplerParameterIuivOES(context, sampler, pname, params))
-        {
-            context->getSamplerParameterIuiv(sampler, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetSamplerParameterIuivOES(context, sampler, pname, params);
     }
 }
 
@@ -10007,16 +8747,13 @@ void GL_APIENTRY GetSamplerParameterfvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterfv, sampler, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetSamplerParameterfv(context, sampler, pname, params))
-        {
-            context->getSamplerParameterfv(sampler, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetSamplerParameterfv(context, sampler, pname, params);
     }
 }
 
@@ -10028,16 +8765,13 @@ void GL_APIENTRY GetSamplerParameterivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", sampler,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameteriv, sampler, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetSamplerParameteriv(context, sampler, pname, params))
-        {
-            context->getSamplerParameteriv(sampler, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetSamplerParameteriv(context, sampler, pname, params);
     }
 }
 
@@ -10049,16 +8783,14 @@ void GL_APIENTRY GetSemaphoreParameterui64vEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u, GLenum pname = 0x%X, GLuint64 *params = 0x%016" PRIxPTR ")",
           semaphore, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSemaphoreParameterui64vEXT, semaphore, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetSemaphoreParameterui64vEXT(context, semaphore, pname, params))
-        {
-            context->getSemaphoreParameterui64v(semaphore, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetSemaphoreParameterui64vEXT(context, semaphore, pname,
+                                                                   params);
     }
 }
 
@@ -10072,16 +8804,13 @@ void GL_APIENTRY GetShaderInfoLogContextANGLE(GLeglContext ctx,
     EVENT("(GLuint shader = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *infoLog = 0x%016" PRIxPTR ")",
           shader, bufSize, (uintptr_t)length, (uintptr_t)infoLog);
+    ANGLE_BINARY_EVENT(GetShaderInfoLog, shader, bufSize, length, infoLog);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetShaderInfoLog(context, shader, bufSize, length, infoLog))
-        {
-            context->getShaderInfoLog(shader, bufSize, length, infoLog);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetShaderInfoLog(context, shader, bufSize, length, infoLog);
     }
 }
 
@@ -10095,16 +8824,14 @@ void GL_APIENTRY GetShaderPrecisionFormatContextANGLE(GLeglContext ctx,
     EVENT("(GLenum shadertype = 0x%X, GLenum precisiontype = 0x%X, GLint *range = 0x%016" PRIxPTR
           ", GLint *precision = 0x%016" PRIxPTR ")",
           shadertype, precisiontype, (uintptr_t)range, (uintptr_t)precision);
+    ANGLE_BINARY_EVENT(GetShaderPrecisionFormat, shadertype, precisiontype, range, precision);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetShaderPrecisionFormat(context, shadertype, precisiontype, range, precision))
-        {
-            context->getShaderPrecisionFormat(shadertype, precisiontype, range, precision);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetShaderPrecisionFormat(context, shadertype, precisiontype,
+                                                              range, precision);
     }
 }
 
@@ -10118,16 +8845,13 @@ void GL_APIENTRY GetShaderSourceContextANGLE(GLeglContext ctx,
     EVENT("(GLuint shader = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *source = 0x%016" PRIxPTR ")",
           shader, bufSize, (uintptr_t)length, (uintptr_t)source);
+    ANGLE_BINARY_EVENT(GetShaderSource, shader, bufSize, length, source);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetShaderSource(context, shader, bufSize, length, source))
-        {
-            context->getShaderSource(shader, bufSize, length, source);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetShaderSource(context, shader, bufSize, length, source);
     }
 }
 
@@ -10139,15 +8863,13 @@ void GL_APIENTRY GetShaderivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", shader,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetShaderiv, shader, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetShaderiv(context, shader, pname, params))
-        {
-            context->getShaderiv(shader, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetShaderiv(context, shader, pname, params);
     }
 }
 
@@ -10155,15 +8877,13 @@ const GLubyte *GL_APIENTRY GetStringContextANGLE(GLeglContext ctx, GLenum name)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum name = 0x%X)", name);
+    ANGLE_BINARY_EVENT(GetString, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetString(context, name))
-        {
-            return context->getString(name);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->GetString(context, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetString, const GLubyte *>();
@@ -10173,15 +8893,13 @@ const GLubyte *GL_APIENTRY GetStringiContextANGLE(GLeglContext ctx, GLenum name,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum name = 0x%X, GLuint index = %u)", name, index);
+    ANGLE_BINARY_EVENT(GetStringi, name, index);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetStringi(context, name, index))
-        {
-            return context->getStringi(name, index);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->GetStringi(context, name, index);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetStringi, const GLubyte *>();
@@ -10199,16 +8917,13 @@ void GL_APIENTRY GetSyncivContextANGLE(GLeglContext ctx,
           ", GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLint *values = 0x%016" PRIxPTR ")",
           (uintptr_t)sync, pname, bufSize, (uintptr_t)length, (uintptr_t)values);
+    ANGLE_BINARY_EVENT(GetSynciv, sync, pname, bufSize, length, values);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetSynciv(context, sync, pname, bufSize, length, values))
-        {
-            context->getSynciv(sync, pname, bufSize, length, values);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetSynciv(context, sync, pname, bufSize, length, values);
     }
 }
 
@@ -10220,18 +8935,13 @@ void GL_APIENTRY GetTexEnvfvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexEnvfv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() ||
-            ValidateGetTexEnvfv(context, targetPacked, pnamePacked, params))
-        {
-            context->getTexEnvfv(targetPacked, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexEnvfv(context, target, pname, params);
     }
 }
 
@@ -10243,18 +8953,13 @@ void GL_APIENTRY GetTexEnvivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexEnviv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() ||
-            ValidateGetTexEnviv(context, targetPacked, pnamePacked, params))
-        {
-            context->getTexEnviv(targetPacked, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexEnviv(context, target, pname, params);
     }
 }
 
@@ -10266,18 +8971,13 @@ void GL_APIENTRY GetTexEnvxvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexEnvxv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() ||
-            ValidateGetTexEnvxv(context, targetPacked, pnamePacked, params))
-        {
-            context->getTexEnvxv(targetPacked, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexEnvxv(context, target, pname, params);
     }
 }
 
@@ -10289,15 +8989,13 @@ void GL_APIENTRY GetTexGenfvOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", coord,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexGenfvOES, coord, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetTexGenfvOES(context, coord, pname, params))
-        {
-            context->getTexGenfv(coord, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexGenfvOES(context, coord, pname, params);
     }
 }
 
@@ -10309,15 +9007,13 @@ void GL_APIENTRY GetTexGenivOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", coord,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexGenivOES, coord, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetTexGenivOES(context, coord, pname, params))
-        {
-            context->getTexGeniv(coord, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexGenivOES(context, coord, pname, params);
     }
 }
 
@@ -10329,15 +9025,13 @@ void GL_APIENTRY GetTexGenxvOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", coord,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexGenxvOES, coord, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetTexGenxvOES(context, coord, pname, params))
-        {
-            context->getTexGenxv(coord, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexGenxvOES(context, coord, pname, params);
     }
 }
 
@@ -10352,17 +9046,13 @@ void GL_APIENTRY GetTexLevelParameterfvContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLfloat *params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexLevelParameterfv, target, level, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexLevelParameterfv(context, targetPacked, level, pname, params))
-        {
-            context->getTexLevelParameterfv(targetPacked, level, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexLevelParameterfv(context, target, level, pname, params);
     }
 }
 
@@ -10377,17 +9067,13 @@ void GL_APIENTRY GetTexLevelParameterivContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexLevelParameteriv, target, level, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexLevelParameteriv(context, targetPacked, level, pname, params))
-        {
-            context->getTexLevelParameteriv(targetPacked, level, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexLevelParameteriv(context, target, level, pname, params);
     }
 }
 
@@ -10399,17 +9085,13 @@ void GL_APIENTRY GetTexParameterIivOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterIivOES, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexParameterIivOES(context, targetPacked, pname, params))
-        {
-            context->getTexParameterIiv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexParameterIivOES(context, target, pname, params);
     }
 }
 
@@ -10421,17 +9103,13 @@ void GL_APIENTRY GetTexParameterIuivOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterIuivOES, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexParameterIuivOES(context, targetPacked, pname, params))
-        {
-            context->getTexParameterIuiv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexParameterIuivOES(context, target, pname, params);
     }
 }
 
@@ -10443,17 +9121,13 @@ void GL_APIENTRY GetTexParameterfvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterfv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexParameterfv(context, targetPacked, pname, params))
-        {
-            context->getTexParameterfv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexParameterfv(context, target, pname, params);
     }
 }
 
@@ -10465,17 +9139,13 @@ void GL_APIENTRY GetTexParameterivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameteriv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexParameteriv(context, targetPacked, pname, params))
-        {
-            context->getTexParameteriv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexParameteriv(context, target, pname, params);
     }
 }
 
@@ -10487,17 +9157,13 @@ void GL_APIENTRY GetTexParameterxvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterxv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexParameterxv(context, targetPacked, pname, params))
-        {
-            context->getTexParameterxv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexParameterxv(context, target, pname, params);
     }
 }
 
@@ -10517,17 +9183,15 @@ void GL_APIENTRY GetTransformFeedbackVaryingContextANGLE(GLeglContext ctx,
         ", GLchar *name = 0x%016" PRIxPTR ")",
         program, index, bufSize, (uintptr_t)length, (uintptr_t)size, (uintptr_t)type,
         (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetTransformFeedbackVarying, program, index, bufSize, length, size, type,
+                       name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetTransformFeedbackVarying(context, program, index, bufSize, length, size,
-                                                type, name))
-        {
-            context->getTransformFeedbackVarying(program, index, bufSize, length, size, type, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTransformFeedbackVarying(context, program, index, bufSize,
+                                                                 length, size, type, name);
     }
 }
 
@@ -10541,16 +9205,14 @@ void GL_APIENTRY GetTranslatedShaderSourceANGLEContextANGLE(GLeglContext ctx,
     EVENT("(GLuint shader = %u, GLsizei bufsize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *source = 0x%016" PRIxPTR ")",
           shader, bufsize, (uintptr_t)length, (uintptr_t)source);
+    ANGLE_BINARY_EVENT(GetTranslatedShaderSourceANGLE, shader, bufsize, length, source);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetTranslatedShaderSourceANGLE(context, shader, bufsize, length, source))
-        {
-            context->getTranslatedShaderSource(shader, bufsize, length, source);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTranslatedShaderSourceANGLE(context, shader, bufsize,
+                                                                    length, source);
     }
 }
 
@@ -10558,19 +9220,17 @@ GLuint GL_APIENTRY GetUniformBlockIndexContextANGLE(GLeglContext ctx,
                                                     GLuint program,
                                                     const GLchar *uniformBlockName)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *uniformBlockName = 0x%016" PRIxPTR ")", program,
           (uintptr_t)uniformBlockName);
+    ANGLE_BINARY_EVENT(GetUniformBlockIndex, program, uniformBlockName);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetUniformBlockIndex(context, program, uniformBlockName))
-        {
-            return context->getUniformBlockIndex(program, uniformBlockName);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        return context->getDispatchTable()->GetUniformBlockIndex(context, program,
+                                                                 uniformBlockName);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetUniformBlockIndex, GLuint>();
@@ -10587,16 +9247,14 @@ void GL_APIENTRY GetUniformIndicesContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLsizei uniformCount = %d, const GLchar *const*uniformNames = "
         "0x%016" PRIxPTR ", GLuint *uniformIndices = 0x%016" PRIxPTR ")",
         program, uniformCount, (uintptr_t)uniformNames, (uintptr_t)uniformIndices);
+    ANGLE_BINARY_EVENT(GetUniformIndices, program, uniformCount, uniformNames, uniformIndices);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetUniformIndices(context, program, uniformCount, uniformNames, uniformIndices))
-        {
-            context->getUniformIndices(program, uniformCount, uniformNames, uniformIndices);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetUniformIndices(context, program, uniformCount, uniformNames,
+                                                       uniformIndices);
     }
 }
 
@@ -10604,18 +9262,16 @@ GLint GL_APIENTRY GetUniformLocationContextANGLE(GLeglContext ctx,
                                                  GLuint program,
                                                  const GLchar *name)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_EVENT(GetUniformLocation, program, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetUniformLocation(context, program, name))
-        {
-            return context->getUniformLocation(program, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        return context->getDispatchTable()->GetUniformLocation(context, program, name);
     }
 
     return GetDefaultReturnValue<EntryPoint::GetUniformLocation, GLint>();
@@ -10626,18 +9282,16 @@ void GL_APIENTRY GetUniformfvContextANGLE(GLeglContext ctx,
                                           GLint location,
                                           GLfloat *params)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLfloat *params = 0x%016" PRIxPTR ")",
           program, location, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetUniformfv, program, location, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetUniformfv(context, program, location, params))
-        {
-            context->getUniformfv(program, location, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->GetUniformfv(context, program, location, params);
     }
 }
 
@@ -10646,18 +9300,16 @@ void GL_APIENTRY GetUniformivContextANGLE(GLeglContext ctx,
                                           GLint location,
                                           GLint *params)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint *params = 0x%016" PRIxPTR ")", program,
           location, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetUniformiv, program, location, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetUniformiv(context, program, location, params))
-        {
-            context->getUniformiv(program, location, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->GetUniformiv(context, program, location, params);
     }
 }
 
@@ -10666,18 +9318,16 @@ void GL_APIENTRY GetUniformuivContextANGLE(GLeglContext ctx,
                                            GLint location,
                                            GLuint *params)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLuint *params = 0x%016" PRIxPTR ")", program,
           location, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetUniformuiv, program, location, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetUniformuiv(context, program, location, params))
-        {
-            context->getUniformuiv(program, location, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->GetUniformuiv(context, program, location, params);
     }
 }
 
@@ -10685,15 +9335,13 @@ void GL_APIENTRY GetUnsignedBytevEXTContextANGLE(GLeglContext ctx, GLenum pname,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLubyte *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetUnsignedBytevEXT, pname, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetUnsignedBytevEXT(context, pname, data))
-        {
-            context->getUnsignedBytev(pname, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetUnsignedBytevEXT(context, pname, data);
     }
 }
 
@@ -10705,16 +9353,13 @@ void GL_APIENTRY GetUnsignedBytei_vEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLubyte *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetUnsignedBytei_vEXT, target, index, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetUnsignedBytei_vEXT(context, target, index, data))
-        {
-            context->getUnsignedBytei_v(target, index, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetUnsignedBytei_vEXT(context, target, index, data);
     }
 }
 
@@ -10726,15 +9371,13 @@ void GL_APIENTRY GetVertexAttribIivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribIiv, index, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetVertexAttribIiv(context, index, pname, params))
-        {
-            context->getVertexAttribIiv(index, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetVertexAttribIiv(context, index, pname, params);
     }
 }
 
@@ -10746,15 +9389,13 @@ void GL_APIENTRY GetVertexAttribIuivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribIuiv, index, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetVertexAttribIuiv(context, index, pname, params))
-        {
-            context->getVertexAttribIuiv(index, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetVertexAttribIuiv(context, index, pname, params);
     }
 }
 
@@ -10766,16 +9407,13 @@ void GL_APIENTRY GetVertexAttribPointervContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, void **pointer = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(GetVertexAttribPointerv, index, pname, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetVertexAttribPointerv(context, index, pname, pointer))
-        {
-            context->getVertexAttribPointerv(index, pname, pointer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetVertexAttribPointerv(context, index, pname, pointer);
     }
 }
 
@@ -10787,15 +9425,13 @@ void GL_APIENTRY GetVertexAttribfvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribfv, index, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetVertexAttribfv(context, index, pname, params))
-        {
-            context->getVertexAttribfv(index, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetVertexAttribfv(context, index, pname, params);
     }
 }
 
@@ -10807,15 +9443,13 @@ void GL_APIENTRY GetVertexAttribivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribiv, index, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetVertexAttribiv(context, index, pname, params))
-        {
-            context->getVertexAttribiv(index, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetVertexAttribiv(context, index, pname, params);
     }
 }
 
@@ -10830,16 +9464,13 @@ void GL_APIENTRY GetnUniformfvEXTContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLfloat *params = "
         "0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetnUniformfvEXT, program, location, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetnUniformfvEXT(context, program, location, bufSize, params))
-        {
-            context->getnUniformfv(program, location, bufSize, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetnUniformfvEXT(context, program, location, bufSize, params);
     }
 }
 
@@ -10854,32 +9485,26 @@ void GL_APIENTRY GetnUniformivEXTContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLint *params = "
         "0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetnUniformivEXT, program, location, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetnUniformivEXT(context, program, location, bufSize, params))
-        {
-            context->getnUniformiv(program, location, bufSize, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetnUniformivEXT(context, program, location, bufSize, params);
     }
 }
 
 void GL_APIENTRY HintContextANGLE(GLeglContext ctx, GLenum target, GLenum mode)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum mode = 0x%X)", target, mode);
+    ANGLE_BINARY_EVENT(Hint, target, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateHint(context, target, mode))
-        {
-            context->hint(target, mode);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Hint(context, target, mode);
     }
 }
 
@@ -10892,17 +9517,13 @@ void GL_APIENTRY ImportMemoryFdEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memory = %u, GLuint64 size = %llu, GLenum handleType = 0x%X, GLint fd = %d)",
           memory, static_cast<unsigned long long>(size), handleType, fd);
+    ANGLE_BINARY_EVENT(ImportMemoryFdEXT, memory, size, handleType, fd);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        HandleType handleTypePacked = FromGLenum<HandleType>(handleType);
-        if (context->skipValidation() ||
-            ValidateImportMemoryFdEXT(context, memory, size, handleTypePacked, fd))
-        {
-            context->importMemoryFd(memory, size, handleTypePacked, fd);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ImportMemoryFdEXT(context, memory, size, handleType, fd);
     }
 }
 
@@ -10914,17 +9535,13 @@ void GL_APIENTRY ImportSemaphoreFdEXTContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u, GLenum handleType = 0x%X, GLint fd = %d)", semaphore, handleType,
           fd);
+    ANGLE_BINARY_EVENT(ImportSemaphoreFdEXT, semaphore, handleType, fd);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        HandleType handleTypePacked = FromGLenum<HandleType>(handleType);
-        if (context->skipValidation() ||
-            ValidateImportSemaphoreFdEXT(context, semaphore, handleTypePacked, fd))
-        {
-            context->importSemaphoreFd(semaphore, handleTypePacked, fd);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ImportSemaphoreFdEXT(context, semaphore, handleType, fd);
     }
 }
 
@@ -10937,15 +9554,13 @@ void GL_APIENTRY InsertEventMarkerEXTContextANGLE(GLeglContext ctx,
     // It can interfere with the debug events being set by the caller.
     // EVENT("(GLsizei length = %d, const GLchar *marker = 0x%016" PRIxPTR ")", length,
     // (uintptr_t)marker);
+    ANGLE_BINARY_EVENT(InsertEventMarkerEXT, length, marker);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateInsertEventMarkerEXT(context, length, marker))
-        {
-            context->insertEventMarker(length, marker);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->InsertEventMarkerEXT(context, length, marker);
     }
 }
 
@@ -10959,16 +9574,14 @@ void GL_APIENTRY InvalidateFramebufferContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLsizei numAttachments = %d, const GLenum *attachments = "
         "0x%016" PRIxPTR ")",
         target, numAttachments, (uintptr_t)attachments);
+    ANGLE_BINARY_EVENT(InvalidateFramebuffer, target, numAttachments, attachments);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateInvalidateFramebuffer(context, target, numAttachments, attachments))
-        {
-            context->invalidateFramebuffer(target, numAttachments, attachments);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->InvalidateFramebuffer(context, target, numAttachments,
+                                                           attachments);
     }
 }
 
@@ -10986,18 +9599,15 @@ void GL_APIENTRY InvalidateSubFramebufferContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLsizei numAttachments = %d, const GLenum *attachments = "
         "0x%016" PRIxPTR ", GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
         target, numAttachments, (uintptr_t)attachments, x, y, width, height);
+    ANGLE_BINARY_EVENT(InvalidateSubFramebuffer, target, numAttachments, attachments, x, y, width,
+                       height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateInvalidateSubFramebuffer(context, target, numAttachments, attachments, x, y,
-                                             width, height))
-        {
-            context->invalidateSubFramebuffer(target, numAttachments, attachments, x, y, width,
-                                              height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->InvalidateSubFramebuffer(context, target, numAttachments,
+                                                              attachments, x, y, width, height);
     }
 }
 
@@ -11005,15 +9615,13 @@ GLboolean GL_APIENTRY IsBufferContextANGLE(GLeglContext ctx, GLuint buffer)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint buffer = %u)", buffer);
+    ANGLE_BINARY_EVENT(IsBuffer, buffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsBuffer(context, buffer))
-        {
-            return context->isBuffer(buffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsBuffer(context, buffer);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsBuffer, GLboolean>();
@@ -11021,17 +9629,14 @@ GLboolean GL_APIENTRY IsBufferContextANGLE(GLeglContext ctx, GLuint buffer)
 
 GLboolean GL_APIENTRY IsEnabledContextANGLE(GLeglContext ctx, GLenum cap)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum cap = 0x%X)", cap);
+    ANGLE_BINARY_EVENT(IsEnabled, cap);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsEnabled(context, cap))
-        {
-            return context->isEnabled(cap);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsEnabled(context, cap);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsEnabled, GLboolean>();
@@ -11041,15 +9646,13 @@ GLboolean GL_APIENTRY IsFenceNVContextANGLE(GLeglContext ctx, GLuint fence)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u)", fence);
+    ANGLE_BINARY_EVENT(IsFenceNV, fence);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsFenceNV(context, fence))
-        {
-            return context->isFenceNV(fence);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsFenceNV(context, fence);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsFenceNV, GLboolean>();
@@ -11059,15 +9662,13 @@ GLboolean GL_APIENTRY IsFramebufferContextANGLE(GLeglContext ctx, GLuint framebu
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint framebuffer = %u)", framebuffer);
+    ANGLE_BINARY_EVENT(IsFramebuffer, framebuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsFramebuffer(context, framebuffer))
-        {
-            return context->isFramebuffer(framebuffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsFramebuffer(context, framebuffer);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsFramebuffer, GLboolean>();
@@ -11077,15 +9678,13 @@ GLboolean GL_APIENTRY IsFramebufferOESContextANGLE(GLeglContext ctx, GLuint fram
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint framebuffer = %u)", framebuffer);
+    ANGLE_BINARY_EVENT(IsFramebufferOES, framebuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsFramebufferOES(context, framebuffer))
-        {
-            return context->isFramebuffer(framebuffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsFramebufferOES(context, framebuffer);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsFramebufferOES, GLboolean>();
@@ -11095,15 +9694,13 @@ GLboolean GL_APIENTRY IsMemoryObjectEXTContextANGLE(GLeglContext ctx, GLuint mem
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memoryObject = %u)", memoryObject);
+    ANGLE_BINARY_EVENT(IsMemoryObjectEXT, memoryObject);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsMemoryObjectEXT(context, memoryObject))
-        {
-            return context->isMemoryObject(memoryObject);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsMemoryObjectEXT(context, memoryObject);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsMemoryObjectEXT, GLboolean>();
@@ -11113,15 +9710,13 @@ GLboolean GL_APIENTRY IsProgramContextANGLE(GLeglContext ctx, GLuint program)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_EVENT(IsProgram, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsProgram(context, program))
-        {
-            return context->isProgram(program);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsProgram(context, program);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsProgram, GLboolean>();
@@ -11131,15 +9726,13 @@ GLboolean GL_APIENTRY IsProgramPipelineContextANGLE(GLeglContext ctx, GLuint pip
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u)", pipeline);
+    ANGLE_BINARY_EVENT(IsProgramPipeline, pipeline);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsProgramPipeline(context, pipeline))
-        {
-            return context->isProgramPipeline(pipeline);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsProgramPipeline(context, pipeline);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsProgramPipeline, GLboolean>();
@@ -11149,15 +9742,13 @@ GLboolean GL_APIENTRY IsQueryContextANGLE(GLeglContext ctx, GLuint id)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u)", id);
+    ANGLE_BINARY_EVENT(IsQuery, id);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsQuery(context, id))
-        {
-            return context->isQuery(id);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsQuery(context, id);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsQuery, GLboolean>();
@@ -11167,15 +9758,13 @@ GLboolean GL_APIENTRY IsQueryEXTContextANGLE(GLeglContext ctx, GLuint id)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u)", id);
+    ANGLE_BINARY_EVENT(IsQueryEXT, id);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsQueryEXT(context, id))
-        {
-            return context->isQuery(id);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsQueryEXT(context, id);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsQueryEXT, GLboolean>();
@@ -11185,15 +9774,13 @@ GLboolean GL_APIENTRY IsRenderbufferContextANGLE(GLeglContext ctx, GLuint render
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint renderbuffer = %u)", renderbuffer);
+    ANGLE_BINARY_EVENT(IsRenderbuffer, renderbuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsRenderbuffer(context, renderbuffer))
-        {
-            return context->isRenderbuffer(renderbuffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsRenderbuffer(context, renderbuffer);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsRenderbuffer, GLboolean>();
@@ -11203,15 +9790,13 @@ GLboolean GL_APIENTRY IsRenderbufferOESContextANGLE(GLeglContext ctx, GLuint ren
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint renderbuffer = %u)", renderbuffer);
+    ANGLE_BINARY_EVENT(IsRenderbufferOES, renderbuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsRenderbufferOES(context, renderbuffer))
-        {
-            return context->isRenderbuffer(renderbuffer);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsRenderbufferOES(context, renderbuffer);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsRenderbufferOES, GLboolean>();
@@ -11221,15 +9806,13 @@ GLboolean GL_APIENTRY IsSemaphoreEXTContextANGLE(GLeglContext ctx, GLuint semaph
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u)", semaphore);
+    ANGLE_BINARY_EVENT(IsSemaphoreEXT, semaphore);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsSemaphoreEXT(context, semaphore))
-        {
-            return context->isSemaphore(semaphore);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsSemaphoreEXT(context, semaphore);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsSemaphoreEXT, GLboolean>();
@@ -11239,15 +9822,13 @@ GLboolean GL_APIENTRY IsSamplerContextANGLE(GLeglContext ctx, GLuint sampler)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u)", sampler);
+    ANGLE_BINARY_EVENT(IsSampler, sampler);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsSampler(context, sampler))
-        {
-            return context->isSampler(sampler);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsSampler(context, sampler);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsSampler, GLboolean>();
@@ -11257,15 +9838,13 @@ GLboolean GL_APIENTRY IsShaderContextANGLE(GLeglContext ctx, GLuint shader)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u)", shader);
+    ANGLE_BINARY_EVENT(IsShader, shader);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsShader(context, shader))
-        {
-            return context->isShader(shader);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsShader(context, shader);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsShader, GLboolean>();
@@ -11275,15 +9854,13 @@ GLboolean GL_APIENTRY IsSyncContextANGLE(GLeglContext ctx, GLsync sync)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ")", (uintptr_t)sync);
+    ANGLE_BINARY_EVENT(IsSync, sync);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsSync(context, sync))
-        {
-            return context->isSync(sync);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsSync(context, sync);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsSync, GLboolean>();
@@ -11293,15 +9870,13 @@ GLboolean GL_APIENTRY IsTextureContextANGLE(GLeglContext ctx, GLuint texture)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint texture = %u)", texture);
+    ANGLE_BINARY_EVENT(IsTexture, texture);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsTexture(context, texture))
-        {
-            return context->isTexture(texture);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsTexture(context, texture);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsTexture, GLboolean>();
@@ -11311,15 +9886,13 @@ GLboolean GL_APIENTRY IsTransformFeedbackContextANGLE(GLeglContext ctx, GLuint i
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u)", id);
+    ANGLE_BINARY_EVENT(IsTransformFeedback, id);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsTransformFeedback(context, id))
-        {
-            return context->isTransformFeedback(id);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsTransformFeedback(context, id);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsTransformFeedback, GLboolean>();
@@ -11329,15 +9902,13 @@ GLboolean GL_APIENTRY IsVertexArrayContextANGLE(GLeglContext ctx, GLuint array)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_EVENT(IsVertexArray, array);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsVertexArray(context, array))
-        {
-            return context->isVertexArray(array);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsVertexArray(context, array);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsVertexArray, GLboolean>();
@@ -11347,15 +9918,13 @@ GLboolean GL_APIENTRY IsVertexArrayOESContextANGLE(GLeglContext ctx, GLuint arra
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_EVENT(IsVertexArrayOES, array);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsVertexArrayOES(context, array))
-        {
-            return context->isVertexArray(array);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsVertexArrayOES(context, array);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsVertexArrayOES, GLboolean>();
@@ -11365,15 +9934,13 @@ void GL_APIENTRY LightModelfContextANGLE(GLeglContext ctx, GLenum pname, GLfloat
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat param = %f)", pname, param);
+    ANGLE_BINARY_EVENT(LightModelf, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateLightModelf(context, pname, param))
-        {
-            context->lightModelf(pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LightModelf(context, pname, param);
     }
 }
 
@@ -11382,15 +9949,13 @@ void GL_APIENTRY LightModelfvContextANGLE(GLeglContext ctx, GLenum pname, const
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(LightModelfv, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateLightModelfv(context, pname, params))
-        {
-            context->lightModelfv(pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LightModelfv(context, pname, params);
     }
 }
 
@@ -11398,15 +9963,13 @@ void GL_APIENTRY LightModelxContextANGLE(GLeglContext ctx, GLenum pname, GLfixed
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed param = 0x%X)", pname, param);
+    ANGLE_BINARY_EVENT(LightModelx, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateLightModelx(context, pname, param))
-        {
-            context->lightModelx(pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LightModelx(context, pname, param);
     }
 }
 
@@ -11415,15 +9978,13 @@ void GL_APIENTRY LightModelxvContextANGLE(GLeglContext ctx, GLenum pname, const
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)param);
+    ANGLE_BINARY_EVENT(LightModelxv, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateLightModelxv(context, pname, param))
-        {
-            context->lightModelxv(pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LightModelxv(context, pname, param);
     }
 }
 
@@ -11431,16 +9992,13 @@ void GL_APIENTRY LightfContextANGLE(GLeglContext ctx, GLenum light, GLenum pname
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", light, pname, param);
+    ANGLE_BINARY_EVENT(Lightf, light, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
-        if (context->skipValidation() || ValidateLightf(context, light, pnamePacked, param))
-        {
-            context->lightf(light, pnamePacked, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Lightf(context, light, pname, param);
     }
 }
 
@@ -11452,16 +10010,13 @@ void GL_APIENTRY LightfvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           light, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(Lightfv, light, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
-        if (context->skipValidation() || ValidateLightfv(context, light, pnamePacked, params))
-        {
-            context->lightfv(light, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Lightfv(context, light, pname, params);
     }
 }
 
@@ -11469,16 +10024,13 @@ void GL_APIENTRY LightxContextANGLE(GLeglContext ctx, GLenum light, GLenum pname
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", light, pname, param);
+    ANGLE_BINARY_EVENT(Lightx, light, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
-        if (context->skipValidation() || ValidateLightx(context, light, pnamePacked, param))
-        {
-            context->lightx(light, pnamePacked, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Lightx(context, light, pname, param);
     }
 }
 
@@ -11490,32 +10042,26 @@ void GL_APIENTRY LightxvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           light, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(Lightxv, light, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
-        if (context->skipValidation() || ValidateLightxv(context, light, pnamePacked, params))
-        {
-            context->lightxv(light, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Lightxv(context, light, pname, params);
     }
 }
 
 void GL_APIENTRY LineWidthContextANGLE(GLeglContext ctx, GLfloat width)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat width = %f)", width);
+    ANGLE_BINARY_EVENT(LineWidth, width);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateLineWidth(context, width))
-        {
-            context->lineWidth(width);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LineWidth(context, width);
     }
 }
 
@@ -11523,15 +10069,13 @@ void GL_APIENTRY LineWidthxContextANGLE(GLeglContext ctx, GLfixed width)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed width = 0x%X)", width);
+    ANGLE_BINARY_EVENT(LineWidthx, width);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateLineWidthx(context, width))
-        {
-            context->lineWidthx(width);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LineWidthx(context, width);
     }
 }
 
@@ -11539,47 +10083,39 @@ void GL_APIENTRY LinkProgramContextANGLE(GLeglContext ctx, GLuint program)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_EVENT(LinkProgram, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateLinkProgram(context, program))
-        {
-            context->linkProgram(program);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LinkProgram(context, program);
     }
 }
 
 void GL_APIENTRY LoadIdentityContextANGLE(GLeglContext ctx)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(LoadIdentity);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateLoadIdentity(context))
-        {
-            context->loadIdentity();
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LoadIdentity(context);
     }
 }
 
 void GL_APIENTRY LoadMatrixfContextANGLE(GLeglContext ctx, const GLfloat *m)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfloat *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_EVENT(LoadMatrixf, m);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateLoadMatrixf(context, m))
-        {
-            context->loadMatrixf(m);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LoadMatrixf(context, m);
     }
 }
 
@@ -11587,15 +10123,13 @@ void GL_APIENTRY LoadMatrixxContextANGLE(GLeglContext ctx, const GLfixed *m)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfixed *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_EVENT(LoadMatrixx, m);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateLoadMatrixx(context, m))
-        {
-            context->loadMatrixx(m);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LoadMatrixx(context, m);
     }
 }
 
@@ -11603,15 +10137,13 @@ void GL_APIENTRY LoadPaletteFromModelViewMatrixOESContextANGLE(GLeglContext ctx)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(LoadPaletteFromModelViewMatrixOES);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateLoadPaletteFromModelViewMatrixOES(context))
-        {
-            context->loadPaletteFromModelViewMatrix();
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LoadPaletteFromModelViewMatrixOES(context);
     }
 }
 
@@ -11619,16 +10151,13 @@ void GL_APIENTRY LogicOpContextANGLE(GLeglContext ctx, GLenum opcode)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum opcode = 0x%X)", opcode);
+    ANGLE_BINARY_EVENT(LogicOp, opcode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        LogicalOperation opcodePacked = FromGLenum<LogicalOperation>(opcode);
-        if (context->skipValidation() || ValidateLogicOp(context, opcodePacked))
-        {
-            context->logicOp(opcodePacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LogicOp(context, opcode);
     }
 }
 
@@ -11636,16 +10165,13 @@ void *GL_APIENTRY MapBufferOESContextANGLE(GLeglContext ctx, GLenum target, GLen
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum access = 0x%X)", target, access);
+    ANGLE_BINARY_EVENT(MapBufferOES, target, access);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateMapBufferOES(context, targetPacked, access))
-        {
-            return context->mapBuffer(targetPacked, access);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->MapBufferOES(context, target, access);
     }
 
     return GetDefaultReturnValue<EntryPoint::MapBufferOES, void *>();
@@ -11663,17 +10189,13 @@ void *GL_APIENTRY MapBufferRangeContextANGLE(GLeglContext ctx,
         "access = 0x%X)",
         target, static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length),
         access);
+    ANGLE_BINARY_EVENT(MapBufferRange, target, offset, length, access);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateMapBufferRange(context, targetPacked, offset, length, access))
-        {
-            return context->mapBufferRange(targetPacked, offset, length, access);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->MapBufferRange(context, target, offset, length, access);
     }
 
     return GetDefaultReturnValue<EntryPoint::MapBufferRange, void *>();
@@ -11691,17 +10213,14 @@ void *GL_APIENTRY MapBufferRangeEXTContextANGLE(GLeglContext ctx,
         "access = 0x%X)",
         target, static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length),
         access);
+    ANGLE_BINARY_EVENT(MapBufferRangeEXT, target, offset, length, access);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() ||
-            ValidateMapBufferRangeEXT(context, targetPacked, offset, length, access))
-        {
-            return context->mapBufferRange(targetPacked, offset, length, access);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->MapBufferRangeEXT(context, target, offset, length,
+                                                              access);
     }
 
     return GetDefaultReturnValue<EntryPoint::MapBufferRangeEXT, void *>();
@@ -11711,16 +10230,13 @@ void GL_APIENTRY MaterialfContextANGLE(GLeglContext ctx, GLenum face, GLenum pna
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", face, pname, param);
+    ANGLE_BINARY_EVENT(Materialf, face, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
-        if (context->skipValidation() || ValidateMaterialf(context, face, pnamePacked, param))
-        {
-            context->materialf(face, pnamePacked, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Materialf(context, face, pname, param);
     }
 }
 
@@ -11732,16 +10248,13 @@ void GL_APIENTRY MaterialfvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           face, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(Materialfv, face, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
-        if (context->skipValidation() || ValidateMaterialfv(context, face, pnamePacked, params))
-        {
-            context->materialfv(face, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Materialfv(context, face, pname, params);
     }
 }
 
@@ -11749,16 +10262,13 @@ void GL_APIENTRY MaterialxContextANGLE(GLeglContext ctx, GLenum face, GLenum pna
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", face, pname, param);
+    ANGLE_BINARY_EVENT(Materialx, face, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
-        if (context->skipValidation() || ValidateMaterialx(context, face, pnamePacked, param))
-        {
-            context->materialx(face, pnamePacked, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Materialx(context, face, pname, param);
     }
 }
 
@@ -11770,16 +10280,13 @@ void GL_APIENTRY MaterialxvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")",
           face, pname, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(Materialxv, face, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
-        if (context->skipValidation() || ValidateMaterialxv(context, face, pnamePacked, param))
-        {
-            context->materialxv(face, pnamePacked, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Materialxv(context, face, pname, param);
     }
 }
 
@@ -11794,33 +10301,26 @@ void GL_APIENTRY MatrixIndexPointerOESContextANGLE(GLeglContext ctx,
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(MatrixIndexPointerOES, size, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateMatrixIndexPointerOES(context, size, type, stride, pointer))
-        {
-            context->matrixIndexPointer(size, type, stride, pointer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MatrixIndexPointerOES(context, size, type, stride, pointer);
     }
 }
 
 void GL_APIENTRY MatrixModeContextANGLE(GLeglContext ctx, GLenum mode)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_EVENT(MatrixMode, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        MatrixType modePacked = FromGLenum<MatrixType>(mode);
-        if (context->skipValidation() || ValidateMatrixMode(context, modePacked))
-        {
-            context->matrixMode(modePacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MatrixMode(context, mode);
     }
 }
 
@@ -11828,15 +10328,13 @@ void GL_APIENTRY MaxShaderCompilerThreadsKHRContextANGLE(GLeglContext ctx, GLuin
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint count = %u)", count);
+    ANGLE_BINARY_EVENT(MaxShaderCompilerThreadsKHR, count);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateMaxShaderCompilerThreadsKHR(context, count))
-        {
-            context->maxShaderCompilerThreads(count);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MaxShaderCompilerThreadsKHR(context, count);
     }
 }
 
@@ -11844,15 +10342,13 @@ void GL_APIENTRY MemoryBarrierContextANGLE(GLeglContext ctx, GLbitfield barriers
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLbitfield barriers = 0x%X)", barriers);
+    ANGLE_BINARY_EVENT(MemoryBarrier, barriers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateMemoryBarrier(context, barriers))
-        {
-            context->memoryBarrier(barriers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MemoryBarrier(context, barriers);
     }
 }
 
@@ -11860,15 +10356,13 @@ void GL_APIENTRY MemoryBarrierByRegionContextANGLE(GLeglContext ctx, GLbitfield
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLbitfield barriers = 0x%X)", barriers);
+    ANGLE_BINARY_EVENT(MemoryBarrierByRegion, barriers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateMemoryBarrierByRegion(context, barriers))
-        {
-            context->memoryBarrierByRegion(barriers);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MemoryBarrierByRegion(context, barriers);
     }
 }
 
@@ -11881,32 +10375,27 @@ void GL_APIENTRY MemoryObjectParameterivEXTContextANGLE(GLeglContext ctx,
     EVENT("(GLuint memoryObject = %u, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR
           ")",
           memoryObject, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(MemoryObjectParameterivEXT, memoryObject, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateMemoryObjectParameterivEXT(context, memoryObject, pname, params))
-        {
-            context->memoryObjectParameteriv(memoryObject, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MemoryObjectParameterivEXT(context, memoryObject, pname,
+                                                                params);
     }
 }
 
 void GL_APIENTRY MultMatrixfContextANGLE(GLeglContext ctx, const GLfloat *m)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfloat *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_EVENT(MultMatrixf, m);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateMultMatrixf(context, m))
-        {
-            context->multMatrixf(m);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MultMatrixf(context, m);
     }
 }
 
@@ -11914,15 +10403,13 @@ void GL_APIENTRY MultMatrixxContextANGLE(GLeglContext ctx, const GLfixed *m)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfixed *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_EVENT(MultMatrixx, m);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateMultMatrixx(context, m))
-        {
-            context->multMatrixx(m);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MultMatrixx(context, m);
     }
 }
 
@@ -11936,15 +10423,13 @@ void GL_APIENTRY MultiTexCoord4fContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLfloat s = %f, GLfloat t = %f, GLfloat r = %f, GLfloat q = %f)",
           target, s, t, r, q);
+    ANGLE_BINARY_EVENT(MultiTexCoord4f, target, s, t, r, q);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateMultiTexCoord4f(context, target, s, t, r, q))
-        {
-            context->multiTexCoord4f(target, s, t, r, q);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MultiTexCoord4f(context, target, s, t, r, q);
     }
 }
 
@@ -11960,31 +10445,26 @@ void GL_APIENTRY MultiTexCoord4xContextANGLE(GLeglContext ctx,
         "(GLenum texture = 0x%X, GLfixed s = 0x%X, GLfixed t = 0x%X, GLfixed r = 0x%X, GLfixed q = "
         "0x%X)",
         texture, s, t, r, q);
+    ANGLE_BINARY_EVENT(MultiTexCoord4x, texture, s, t, r, q);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateMultiTexCoord4x(context, texture, s, t, r, q))
-        {
-            context->multiTexCoord4x(texture, s, t, r, q);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MultiTexCoord4x(context, texture, s, t, r, q);
     }
 }
 
 void GL_APIENTRY Normal3fContextANGLE(GLeglContext ctx, GLfloat nx, GLfloat ny, GLfloat nz)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat nx = %f, GLfloat ny = %f, GLfloat nz = %f)", nx, ny, nz);
+    ANGLE_BINARY_EVENT(Normal3f, nx, ny, nz);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateNormal3f(context, nx, ny, nz))
-        {
-            context->normal3f(nx, ny, nz);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Normal3f(context, nx, ny, nz);
     }
 }
 
@@ -11992,15 +10472,13 @@ void GL_APIENTRY Normal3xContextANGLE(GLeglContext ctx, GLfixed nx, GLfixed ny,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed nx = 0x%X, GLfixed ny = 0x%X, GLfixed nz = 0x%X)", nx, ny, nz);
+    ANGLE_BINARY_EVENT(Normal3x, nx, ny, nz);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateNormal3x(context, nx, ny, nz))
-        {
-            context->normal3x(nx, ny, nz);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Normal3x(context, nx, ny, nz);
     }
 }
 
@@ -12012,17 +10490,13 @@ void GL_APIENTRY NormalPointerContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
           type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(NormalPointer, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateNormalPointer(context, typePacked, stride, pointer))
-        {
-            context->normalPointer(typePacked, stride, pointer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->NormalPointer(context, type, stride, pointer);
     }
 }
 
@@ -12037,16 +10511,13 @@ void GL_APIENTRY ObjectLabelKHRContextANGLE(GLeglContext ctx,
         "(GLenum identifier = 0x%X, GLuint name = %u, GLsizei length = %d, const GLchar *label = "
         "0x%016" PRIxPTR ")",
         identifier, name, length, (uintptr_t)label);
+    ANGLE_BINARY_EVENT(ObjectLabelKHR, identifier, name, length, label);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateObjectLabelKHR(context, identifier, name, length, label))
-        {
-            context->objectLabel(identifier, name, length, label);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ObjectLabelKHR(context, identifier, name, length, label);
     }
 }
 
@@ -12059,15 +10530,13 @@ void GL_APIENTRY ObjectPtrLabelKHRContextANGLE(GLeglContext ctx,
     EVENT("(const void *ptr = 0x%016" PRIxPTR
           ", GLsizei length = %d, const GLchar *label = 0x%016" PRIxPTR ")",
           (uintptr_t)ptr, length, (uintptr_t)label);
+    ANGLE_BINARY_EVENT(ObjectPtrLabelKHR, ptr, length, label);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateObjectPtrLabelKHR(context, ptr, length, label))
-        {
-            context->objectPtrLabel(ptr, length, label);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ObjectPtrLabelKHR(context, ptr, length, label);
     }
 }
 
@@ -12084,15 +10553,13 @@ void GL_APIENTRY OrthofContextANGLE(GLeglContext ctx,
         "(GLfloat l = %f, GLfloat r = %f, GLfloat b = %f, GLfloat t = %f, GLfloat n = %f, GLfloat "
         "f = %f)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_EVENT(Orthof, l, r, b, t, n, f);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateOrthof(context, l, r, b, t, n, f))
-        {
-            context->orthof(l, r, b, t, n, f);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Orthof(context, l, r, b, t, n, f);
     }
 }
 
@@ -12109,15 +10576,13 @@ void GL_APIENTRY OrthoxContextANGLE(GLeglContext ctx,
         "(GLfixed l = 0x%X, GLfixed r = 0x%X, GLfixed b = 0x%X, GLfixed t = 0x%X, GLfixed n = "
         "0x%X, GLfixed f = 0x%X)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_EVENT(Orthox, l, r, b, t, n, f);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateOrthox(context, l, r, b, t, n, f))
-        {
-            context->orthox(l, r, b, t, n, f);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Orthox(context, l, r, b, t, n, f);
     }
 }
 
@@ -12125,31 +10590,26 @@ void GL_APIENTRY PauseTransformFeedbackContextANGLE(GLeglContext ctx)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(PauseTransformFeedback);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidatePauseTransformFeedback(context))
-        {
-            context->pauseTransformFeedback();
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PauseTransformFeedback(context);
     }
 }
 
 void GL_APIENTRY PixelStoreiContextANGLE(GLeglContext ctx, GLenum pname, GLint param)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLint param = %d)", pname, param);
+    ANGLE_BINARY_EVENT(PixelStorei, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidatePixelStorei(context, pname, param))
-        {
-            context->pixelStorei(pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PixelStorei(context, pname, param);
     }
 }
 
@@ -12157,16 +10617,13 @@ void GL_APIENTRY PointParameterfContextANGLE(GLeglContext ctx, GLenum pname, GLf
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat param = %f)", pname, param);
+    ANGLE_BINARY_EVENT(PointParameterf, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
-        if (context->skipValidation() || ValidatePointParameterf(context, pnamePacked, param))
-        {
-            context->pointParameterf(pnamePacked, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PointParameterf(context, pname, param);
     }
 }
 
@@ -12175,16 +10632,13 @@ void GL_APIENTRY PointParameterfvContextANGLE(GLeglContext ctx, GLenum pname, co
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(PointParameterfv, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
-        if (context->skipValidation() || ValidatePointParameterfv(context, pnamePacked, params))
-        {
-            context->pointParameterfv(pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PointParameterfv(context, pname, params);
     }
 }
 
@@ -12192,16 +10646,13 @@ void GL_APIENTRY PointParameterxContextANGLE(GLeglContext ctx, GLenum pname, GLf
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed param = 0x%X)", pname, param);
+    ANGLE_BINARY_EVENT(PointParameterx, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
-        if (context->skipValidation() || ValidatePointParameterx(context, pnamePacked, param))
-        {
-            context->pointParameterx(pnamePacked, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PointParameterx(context, pname, param);
     }
 }
 
@@ -12210,16 +10661,13 @@ void GL_APIENTRY PointParameterxvContextANGLE(GLeglContext ctx, GLenum pname, co
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_EVENT(PointParameterxv, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
-        if (context->skipValidation() || ValidatePointParameterxv(context, pnamePacked, params))
-        {
-            context->pointParameterxv(pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PointParameterxv(context, pname, params);
     }
 }
 
@@ -12227,15 +10675,13 @@ void GL_APIENTRY PointSizeContextANGLE(GLeglContext ctx, GLfloat size)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat size = %f)", size);
+    ANGLE_BINARY_EVENT(PointSize, size);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidatePointSize(context, size))
-        {
-            context->pointSize(size);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PointSize(context, size);
     }
 }
 
@@ -12247,17 +10693,13 @@ void GL_APIENTRY PointSizePointerOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
           type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(PointSizePointerOES, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidatePointSizePointerOES(context, typePacked, stride, pointer))
-        {
-            context->pointSizePointer(typePacked, stride, pointer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PointSizePointerOES(context, type, stride, pointer);
     }
 }
 
@@ -12265,31 +10707,26 @@ void GL_APIENTRY PointSizexContextANGLE(GLeglContext ctx, GLfixed size)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed size = 0x%X)", size);
+    ANGLE_BINARY_EVENT(PointSizex, size);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidatePointSizex(context, size))
-        {
-            context->pointSizex(size);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PointSizex(context, size);
     }
 }
 
 void GL_APIENTRY PolygonOffsetContextANGLE(GLeglContext ctx, GLfloat factor, GLfloat units)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat factor = %f, GLfloat units = %f)", factor, units);
+    ANGLE_BINARY_EVENT(PolygonOffset, factor, units);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidatePolygonOffset(context, factor, units))
-        {
-            context->polygonOffset(factor, units);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PolygonOffset(context, factor, units);
     }
 }
 
@@ -12297,15 +10734,13 @@ void GL_APIENTRY PolygonOffsetxContextANGLE(GLeglContext ctx, GLfixed factor, GL
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed factor = 0x%X, GLfixed units = 0x%X)", factor, units);
+    ANGLE_BINARY_EVENT(PolygonOffsetx, factor, units);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidatePolygonOffsetx(context, factor, units))
-        {
-            context->polygonOffsetx(factor, units);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PolygonOffsetx(context, factor, units);
     }
 }
 
@@ -12313,15 +10748,13 @@ void GL_APIENTRY PopDebugGroupKHRContextANGLE(GLeglContext ctx)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(PopDebugGroupKHR);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidatePopDebugGroupKHR(context))
-        {
-            context->popDebugGroup();
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PopDebugGroupKHR(context);
     }
 }
 
@@ -12331,31 +10764,26 @@ void GL_APIENTRY PopGroupMarkerEXTContextANGLE(GLeglContext ctx)
     // Don't run an EVENT() macro on the EXT_debug_marker entry points.
     // It can interfere with the debug events being set by the caller.
     // EVENT("()");
+    ANGLE_BINARY_EVENT(PopGroupMarkerEXT);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidatePopGroupMarkerEXT(context))
-        {
-            context->popGroupMarker();
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PopGroupMarkerEXT(context);
     }
 }
 
 void GL_APIENTRY PopMatrixContextANGLE(GLeglContext ctx)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(PopMatrix);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidatePopMatrix(context))
-        {
-            context->popMatrix();
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PopMatrix(context);
     }
 }
 
@@ -12369,16 +10797,13 @@ void GL_APIENTRY ProgramBinaryContextANGLE(GLeglContext ctx,
     EVENT("(GLuint program = %u, GLenum binaryFormat = 0x%X, const void *binary = 0x%016" PRIxPTR
           ", GLsizei length = %d)",
           program, binaryFormat, (uintptr_t)binary, length);
+    ANGLE_BINARY_EVENT(ProgramBinary, program, binaryFormat, binary, length);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramBinary(context, program, binaryFormat, binary, length))
-        {
-            context->programBinary(program, binaryFormat, binary, length);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramBinary(context, program, binaryFormat, binary, length);
     }
 }
 
@@ -12392,16 +10817,14 @@ void GL_APIENTRY ProgramBinaryOESContextANGLE(GLeglContext ctx,
     EVENT("(GLuint program = %u, GLenum binaryFormat = 0x%X, const void *binary = 0x%016" PRIxPTR
           ", GLint length = %d)",
           program, binaryFormat, (uintptr_t)binary, length);
+    ANGLE_BINARY_EVENT(ProgramBinaryOES, program, binaryFormat, binary, length);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramBinaryOES(context, program, binaryFormat, binary, length))
-        {
-            context->programBinary(program, binaryFormat, binary, length);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramBinaryOES(context, program, binaryFormat, binary,
+                                                      length);
     }
 }
 
@@ -12412,15 +10835,13 @@ void GL_APIENTRY ProgramParameteriContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLenum pname = 0x%X, GLint value = %d)", program, pname, value);
+    ANGLE_BINARY_EVENT(ProgramParameteri, program, pname, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateProgramParameteri(context, program, pname, value))
-        {
-            context->programParameteri(program, pname, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramParameteri(context, program, pname, value);
     }
 }
 
@@ -12431,15 +10852,13 @@ void GL_APIENTRY ProgramUniform1fContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLfloat v0 = %f)", program, location, v0);
+    ANGLE_BINARY_EVENT(ProgramUniform1f, program, location, v0);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateProgramUniform1f(context, program, location, v0))
-        {
-            context->programUniform1f(program, location, v0);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform1f(context, program, location, v0);
     }
 }
 
@@ -12454,16 +10873,13 @@ void GL_APIENTRY ProgramUniform1fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform1fv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform1fv(context, program, location, count, value))
-        {
-            context->programUniform1fv(program, location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform1fv(context, program, location, count, value);
     }
 }
 
@@ -12474,15 +10890,13 @@ void GL_APIENTRY ProgramUniform1iContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint v0 = %d)", program, location, v0);
+    ANGLE_BINARY_EVENT(ProgramUniform1i, program, location, v0);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateProgramUniform1i(context, program, location, v0))
-        {
-            context->programUniform1i(program, location, v0);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform1i(context, program, location, v0);
     }
 }
 
@@ -12497,16 +10911,13 @@ void GL_APIENTRY ProgramUniform1ivContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform1iv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform1iv(context, program, location, count, value))
-        {
-            context->programUniform1iv(program, location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform1iv(context, program, location, count, value);
     }
 }
 
@@ -12517,15 +10928,13 @@ void GL_APIENTRY ProgramUniform1uiContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLuint v0 = %u)", program, location, v0);
+    ANGLE_BINARY_EVENT(ProgramUniform1ui, program, location, v0);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateProgramUniform1ui(context, program, location, v0))
-        {
-            context->programUniform1ui(program, location, v0);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform1ui(context, program, location, v0);
     }
 }
 
@@ -12540,16 +10949,13 @@ void GL_APIENTRY ProgramUniform1uivContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform1uiv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform1uiv(context, program, location, count, value))
-        {
-            context->programUniform1uiv(program, location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform1uiv(context, program, location, count, value);
     }
 }
 
@@ -12562,16 +10968,13 @@ void GL_APIENTRY ProgramUniform2fContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f)", program,
           location, v0, v1);
+    ANGLE_BINARY_EVENT(ProgramUniform2f, program, location, v0, v1);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform2f(context, program, location, v0, v1))
-        {
-            context->programUniform2f(program, location, v0, v1);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform2f(context, program, location, v0, v1);
     }
 }
 
@@ -12586,16 +10989,13 @@ void GL_APIENTRY ProgramUniform2fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform2fv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform2fv(context, program, location, count, value))
-        {
-            context->programUniform2fv(program, location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform2fv(context, program, location, count, value);
     }
 }
 
@@ -12605,16 +11005,13 @@ ProgramUniform2iContextANGLE(GLeglContext ctx, GLuint program, GLint location, G
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint v1 = %d)", program,
           location, v0, v1);
+    ANGLE_BINARY_EVENT(ProgramUniform2i, program, location, v0, v1);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform2i(context, program, location, v0, v1))
-        {
-            context->programUniform2i(program, location, v0, v1);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform2i(context, program, location, v0, v1);
     }
 }
 
@@ -12629,16 +11026,13 @@ void GL_APIENTRY ProgramUniform2ivContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform2iv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform2iv(context, program, location, count, value))
-        {
-            context->programUniform2iv(program, location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform2iv(context, program, location, count, value);
     }
 }
 
@@ -12651,16 +11045,13 @@ void GL_APIENTRY ProgramUniform2uiContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLuint v0 = %u, GLuint v1 = %u)", program,
           location, v0, v1);
+    ANGLE_BINARY_EVENT(ProgramUniform2ui, program, location, v0, v1);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform2ui(context, program, location, v0, v1))
-        {
-            context->programUniform2ui(program, location, v0, v1);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform2ui(context, program, location, v0, v1);
     }
 }
 
@@ -12675,16 +11066,13 @@ void GL_APIENTRY ProgramUniform2uivContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform2uiv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform2uiv(context, program, location, count, value))
-        {
-            context->programUniform2uiv(program, location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform2uiv(context, program, location, count, value);
     }
 }
 
@@ -12700,16 +11088,13 @@ void GL_APIENTRY ProgramUniform3fContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = "
         "%f)",
         program, location, v0, v1, v2);
+    ANGLE_BINARY_EVENT(ProgramUniform3f, program, location, v0, v1, v2);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform3f(context, program, location, v0, v1, v2))
-        {
-            context->programUniform3f(program, location, v0, v1, v2);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform3f(context, program, location, v0, v1, v2);
     }
 }
 
@@ -12724,16 +11109,13 @@ void GL_APIENTRY ProgramUniform3fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform3fv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform3fv(context, program, location, count, value))
-        {
-            context->programUniform3fv(program, location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform3fv(context, program, location, count, value);
     }
 }
 
@@ -12747,16 +11129,13 @@ void GL_APIENTRY ProgramUniform3iContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d)",
           program, location, v0, v1, v2);
+    ANGLE_BINARY_EVENT(ProgramUniform3i, program, location, v0, v1, v2);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform3i(context, program, location, v0, v1, v2))
-        {
-            context->programUniform3i(program, location, v0, v1, v2);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform3i(context, program, location, v0, v1, v2);
     }
 }
 
@@ -12771,16 +11150,13 @@ void GL_APIENTRY ProgramUniform3ivContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform3iv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform3iv(context, program, location, count, value))
-        {
-            context->programUniform3iv(program, location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform3iv(context, program, location, count, value);
     }
 }
 
@@ -12796,16 +11172,13 @@ void GL_APIENTRY ProgramUniform3uiContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = "
         "%u)",
         program, location, v0, v1, v2);
+    ANGLE_BINARY_EVENT(ProgramUniform3ui, program, location, v0, v1, v2);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform3ui(context, program, location, v0, v1, v2))
-        {
-            context->programUniform3ui(program, location, v0, v1, v2);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform3ui(context, program, location, v0, v1, v2);
     }
 }
 
@@ -12820,16 +11193,13 @@ void GL_APIENTRY ProgramUniform3uivContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform3uiv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform3uiv(context, program, location, count, value))
-        {
-            context->programUniform3uiv(program, location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform3uiv(context, program, location, count, value);
     }
 }
 
@@ -12846,16 +11216,13 @@ void GL_APIENTRY ProgramUniform4fContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = "
         "%f, GLfloat v3 = %f)",
         program, location, v0, v1, v2, v3);
+    ANGLE_BINARY_EVENT(ProgramUniform4f, program, location, v0, v1, v2, v3);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform4f(context, program, location, v0, v1, v2, v3))
-        {
-            context->programUniform4f(program, location, v0, v1, v2, v3);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform4f(context, program, location, v0, v1, v2, v3);
     }
 }
 
@@ -12870,16 +11237,13 @@ void GL_APIENTRY ProgramUniform4fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform4fv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform4fv(context, program, location, count, value))
-        {
-            context->programUniform4fv(program, location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform4fv(context, program, location, count, value);
     }
 }
 
@@ -12896,16 +11260,13 @@ void GL_APIENTRY ProgramUniform4iContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d, "
         "GLint v3 = %d)",
         program, location, v0, v1, v2, v3);
+    ANGLE_BINARY_EVENT(ProgramUniform4i, program, location, v0, v1, v2, v3);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform4i(context, program, location, v0, v1, v2, v3))
-        {
-            context->programUniform4i(program, location, v0, v1, v2, v3);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform4i(context, program, location, v0, v1, v2, v3);
     }
 }
 
@@ -12920,16 +11281,13 @@ void GL_APIENTRY ProgramUniform4ivContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform4iv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform4iv(context, program, location, count, value))
-        {
-            context->programUniform4iv(program, location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform4iv(context, program, location, count, value);
     }
 }
 
@@ -12946,16 +11304,13 @@ void GL_APIENTRY ProgramUniform4uiContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = "
         "%u, GLuint v3 = %u)",
         program, location, v0, v1, v2, v3);
+    ANGLE_BINARY_EVENT(ProgramUniform4ui, program, location, v0, v1, v2, v3);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform4ui(context, program, location, v0, v1, v2, v3))
-        {
-            context->programUniform4ui(program, location, v0, v1, v2, v3);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform4ui(context, program, location, v0, v1, v2, v3);
     }
 }
 
@@ -12970,16 +11325,13 @@ void GL_APIENTRY ProgramUniform4uivContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniform4uiv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniform4uiv(context, program, location, count, value))
-        {
-            context->programUniform4uiv(program, location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniform4uiv(context, program, location, count, value);
     }
 }
 
@@ -12995,16 +11347,14 @@ void GL_APIENTRY ProgramUniformMatrix2fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix2fv, program, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix2fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix2fv(program, location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniformMatrix2fv(context, program, location, count,
+                                                             transpose, value);
     }
 }
 
@@ -13020,16 +11370,14 @@ void GL_APIENTRY ProgramUniformMatrix2x3fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix2x3fv, program, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix2x3fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix2x3fv(program, location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniformMatrix2x3fv(context, program, location, count,
+                                                               transpose, value);
     }
 }
 
@@ -13045,16 +11393,14 @@ void GL_APIENTRY ProgramUniformMatrix2x4fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix2x4fv, program, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix2x4fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix2x4fv(program, location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniformMatrix2x4fv(context, program, location, count,
+                                                               transpose, value);
     }
 }
 
@@ -13070,16 +11416,14 @@ void GL_APIENTRY ProgramUniformMatrix3fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix3fv, program, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix3fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix3fv(program, location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniformMatrix3fv(context, program, location, count,
+                                                             transpose, value);
     }
 }
 
@@ -13095,16 +11439,14 @@ void GL_APIENTRY ProgramUniformMatrix3x2fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix3x2fv, program, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix3x2fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix3x2fv(program, location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniformMatrix3x2fv(context, program, location, count,
+                                                               transpose, value);
     }
 }
 
@@ -13120,16 +11462,14 @@ void GL_APIENTRY ProgramUniformMatrix3x4fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix3x4fv, program, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix3x4fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix3x4fv(program, location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniformMatrix3x4fv(context, program, location, count,
+                                                               transpose, value);
     }
 }
 
@@ -13145,16 +11485,14 @@ void GL_APIENTRY ProgramUniformMatrix4fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix4fv, program, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix4fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix4fv(program, location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniformMatrix4fv(context, program, location, count,
+                                                             transpose, value);
     }
 }
 
@@ -13170,16 +11508,14 @@ void GL_APIENTRY ProgramUniformMatrix4x2fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix4x2fv, program, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix4x2fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix4x2fv(program, location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniformMatrix4x2fv(context, program, location, count,
+                                                               transpose, value);
     }
 }
 
@@ -13195,16 +11531,14 @@ void GL_APIENTRY ProgramUniformMatrix4x3fvContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(ProgramUniformMatrix4x3fv, program, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramUniformMatrix4x3fv(context, program, location, count, transpose, value))
-        {
-            context->programUniformMatrix4x3fv(program, location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramUniformMatrix4x3fv(context, program, location, count,
+                                                               transpose, value);
     }
 }
 
@@ -13219,16 +11553,13 @@ void GL_APIENTRY PushDebugGroupKHRContextANGLE(GLeglContext ctx,
         "(GLenum source = 0x%X, GLuint id = %u, GLsizei length = %d, const GLchar *message = "
         "0x%016" PRIxPTR ")",
         source, id, length, (uintptr_t)message);
+    ANGLE_BINARY_EVENT(PushDebugGroupKHR, source, id, length, message);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidatePushDebugGroupKHR(context, source, id, length, message))
-        {
-            context->pushDebugGroup(source, id, length, message);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PushDebugGroupKHR(context, source, id, length, message);
     }
 }
 
@@ -13241,31 +11572,26 @@ void GL_APIENTRY PushGroupMarkerEXTContextANGLE(GLeglContext ctx,
     // It can interfere with the debug events being set by the caller.
     // EVENT("(GLsizei length = %d, const GLchar *marker = 0x%016" PRIxPTR ")", length,
     // (uintptr_t)marker);
+    ANGLE_BINARY_EVENT(PushGroupMarkerEXT, length, marker);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidatePushGroupMarkerEXT(context, length, marker))
-        {
-            context->pushGroupMarker(length, marker);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PushGroupMarkerEXT(context, length, marker);
     }
 }
 
 void GL_APIENTRY PushMatrixContextANGLE(GLeglContext ctx)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(PushMatrix);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidatePushMatrix(context))
-        {
-            context->pushMatrix();
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PushMatrix(context);
     }
 }
 
@@ -13273,16 +11599,13 @@ void GL_APIENTRY QueryCounterEXTContextANGLE(GLeglContext ctx, GLuint id, GLenum
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum target = 0x%X)", id, target);
+    ANGLE_BINARY_EVENT(QueryCounterEXT, id, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() || ValidateQueryCounterEXT(context, id, targetPacked))
-        {
-            context->queryCounter(id, targetPacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->QueryCounterEXT(context, id, target);
     }
 }
 
@@ -13293,15 +11616,13 @@ GLbitfield GL_APIENTRY QueryMatrixxOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed *mantissa = 0x%016" PRIxPTR ", GLint *exponent = 0x%016" PRIxPTR ")",
           (uintptr_t)mantissa, (uintptr_t)exponent);
+    ANGLE_BINARY_EVENT(QueryMatrixxOES, mantissa, exponent);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateQueryMatrixxOES(context, mantissa, exponent))
-        {
-            return context->queryMatrixx(mantissa, exponent);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->QueryMatrixxOES(context, mantissa, exponent);
     }
 
     return GetDefaultReturnValue<EntryPoint::QueryMatrixxOES, GLbitfield>();
@@ -13311,15 +11632,13 @@ void GL_APIENTRY ReadBufferContextANGLE(GLeglContext ctx, GLenum src)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum src = 0x%X)", src);
+    ANGLE_BINARY_EVENT(ReadBuffer, src);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateReadBuffer(context, src))
-        {
-            context->readBuffer(src);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ReadBuffer(context, src);
     }
 }
 
@@ -13337,16 +11656,13 @@ void GL_APIENTRY ReadPixelsContextANGLE(GLeglContext ctx,
         "(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
         "0x%X, GLenum type = 0x%X, void *pixels = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(ReadPixels, x, y, width, height, format, type, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateReadPixels(context, x, y, width, height, format, type, pixels))
-        {
-            context->readPixels(x, y, width, height, format, type, pixels);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ReadPixels(context, x, y, width, height, format, type, pixels);
     }
 }
 
@@ -13365,16 +11681,14 @@ void GL_APIENTRY ReadnPixelsEXTContextANGLE(GLeglContext ctx,
         "(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
         "0x%X, GLenum type = 0x%X, GLsizei bufSize = %d, void *data = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, bufSize, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(ReadnPixelsEXT, x, y, width, height, format, type, bufSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateReadnPixelsEXT(context, x, y, width, height, format, type, bufSize, data))
-        {
-            context->readnPixels(x, y, width, height, format, type, bufSize, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ReadnPixelsEXT(context, x, y, width, height, format, type,
+                                                    bufSize, data);
     }
 }
 
@@ -13382,15 +11696,13 @@ void GL_APIENTRY ReleaseShaderCompilerContextANGLE(GLeglContext ctx)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(ReleaseShaderCompiler);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateReleaseShaderCompiler(context))
-        {
-            context->releaseShaderCompiler();
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ReleaseShaderCompiler(context);
     }
 }
 
@@ -13405,16 +11717,14 @@ void GL_APIENTRY RenderbufferStorageContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLsizei width = %d, GLsizei height = "
         "%d)",
         target, internalformat, width, height);
+    ANGLE_BINARY_EVENT(RenderbufferStorage, target, internalformat, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateRenderbufferStorage(context, target, internalformat, width, height))
-        {
-            context->renderbufferStorage(target, internalformat, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->RenderbufferStorage(context, target, internalformat, width,
+                                                         height);
     }
 }
 
@@ -13430,17 +11740,15 @@ void GL_APIENTRY RenderbufferStorageMultisampleContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d)",
         target, samples, internalformat, width, height);
+    ANGLE_BINARY_EVENT(RenderbufferStorageMultisample, target, samples, internalformat, width,
+                       height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateRenderbufferStorageMultisample(context, target, samples, internalformat, width,
-                                                   height))
-        {
-            context->renderbufferStorageMultisample(target, samples, internalformat, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->RenderbufferStorageMultisample(context, target, samples,
+                                                                    internalformat, width, height);
     }
 }
 
@@ -13456,17 +11764,15 @@ void GL_APIENTRY RenderbufferStorageMultisampleANGLEContextANGLE(GLeglContext ct
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d)",
         target, samples, internalformat, width, height);
+    ANGLE_BINARY_EVENT(RenderbufferStorageMultisampleANGLE, target, samples, internalformat, width,
+                       height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateRenderbufferStorageMultisampleANGLE(context, target, samples, internalformat,
-                                                        width, height))
-        {
-            context->renderbufferStorageMultisample(target, samples, internalformat, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->RenderbufferStorageMultisampleANGLE(
+            context, target, samples, internalformat, width, height);
     }
 }
 
@@ -13481,16 +11787,14 @@ void GL_APIENTRY RenderbufferStorageOESContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLsizei width = %d, GLsizei height = "
         "%d)",
         target, internalformat, width, height);
+    ANGLE_BINARY_EVENT(RenderbufferStorageOES, target, internalformat, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateRenderbufferStorageOES(context, target, internalformat, width, height))
-        {
-            context->renderbufferStorage(target, internalformat, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->RenderbufferStorageOES(context, target, internalformat, width,
+                                                            height);
     }
 }
 
@@ -13498,32 +11802,27 @@ void GL_APIENTRY ResumeTransformFeedbackContextANGLE(GLeglContext ctx)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_EVENT(ResumeTransformFeedback);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateResumeTransformFeedback(context))
-        {
-            context->resumeTransformFeedback();
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ResumeTransformFeedback(context);
     }
 }
 
 void GL_APIENTRY
 RotatefContextANGLE(GLeglContext ctx, GLfloat angle, GLfloat x, GLfloat y, GLfloat z)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat angle = %f, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", angle, x, y, z);
+    ANGLE_BINARY_EVENT(Rotatef, angle, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateRotatef(context, angle, x, y, z))
-        {
-            context->rotatef(angle, x, y, z);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Rotatef(context, angle, x, y, z);
     }
 }
 
@@ -13533,31 +11832,26 @@ RotatexContextANGLE(GLeglContext ctx, GLfixed angle, GLfixed x, GLfixed y, GLfix
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed angle = 0x%X, GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)", angle, x,
           y, z);
+    ANGLE_BINARY_EVENT(Rotatex, angle, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateRotatex(context, angle, x, y, z))
-        {
-            context->rotatex(angle, x, y, z);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Rotatex(context, angle, x, y, z);
     }
 }
 
 void GL_APIENTRY SampleCoverageContextANGLE(GLeglContext ctx, GLfloat value, GLboolean invert)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat value = %f, GLboolean invert = %u)", value, invert);
+    ANGLE_BINARY_EVENT(SampleCoverage, value, invert);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateSampleCoverage(context, value, invert))
-        {
-            context->sampleCoverage(value, invert);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SampleCoverage(context, value, invert);
     }
 }
 
@@ -13565,15 +11859,13 @@ void GL_APIENTRY SampleCoveragexContextANGLE(GLeglContext ctx, GLclampx value, G
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLclampx value = 0x%X, GLboolean invert = %u)", value, invert);
+    ANGLE_BINARY_EVENT(SampleCoveragex, value, invert);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateSampleCoveragex(context, value, invert))
-        {
-            context->sampleCoveragex(value, invert);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SampleCoveragex(context, value, invert);
     }
 }
 
@@ -13581,15 +11873,13 @@ void GL_APIENTRY SampleMaskiContextANGLE(GLeglContext ctx, GLuint maskNumber, GL
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint maskNumber = %u, GLbitfield mask = 0x%X)", maskNumber, mask);
+    ANGLE_BINARY_EVENT(SampleMaski, maskNumber, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateSampleMaski(context, maskNumber, mask))
-        {
-            context->sampleMaski(maskNumber, mask);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SampleMaski(context, maskNumber, mask);
     }
 }
 
@@ -13601,16 +11891,13 @@ void GL_APIENTRY SamplerParameterIivOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLint *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterIivOES, sampler, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateSamplerParameterIivOES(context, sampler, pname, param))
-        {
-            context->samplerParameterIiv(sampler, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SamplerParameterIivOES(context, sampler, pname, param);
     }
 }
 
@@ -13622,16 +11909,13 @@ void GL_APIENTRY SamplerParameterIuivOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLuint *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterIuivOES, sampler, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateSamplerParameterIuivOES(context, sampler, pname, param))
-        {
-            context->samplerParameterIuiv(sampler, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SamplerParameterIuivOES(context, sampler, pname, param);
     }
 }
 
@@ -13642,15 +11926,13 @@ void GL_APIENTRY SamplerParameterfContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLfloat param = %f)", sampler, pname, param);
+    ANGLE_BINARY_EVENT(SamplerParameterf, sampler, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateSamplerParameterf(context, sampler, pname, param))
-        {
-            context->samplerParameterf(sampler, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SamplerParameterf(context, sampler, pname, param);
     }
 }
 
@@ -13662,15 +11944,13 @@ void GL_APIENTRY SamplerParameterfvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLfloat *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterfv, sampler, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateSamplerParameterfv(context, sampler, pname, param))
-        {
-            context->samplerParameterfv(sampler, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SamplerParameterfv(context, sampler, pname, param);
     }
 }
 
@@ -13681,15 +11961,13 @@ void GL_APIENTRY SamplerParameteriContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLint param = %d)", sampler, pname, param);
+    ANGLE_BINARY_EVENT(SamplerParameteri, sampler, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateSamplerParameteri(context, sampler, pname, param))
-        {
-            context->samplerParameteri(sampler, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SamplerParameteri(context, sampler, pname, param);
     }
 }
 
@@ -13701,31 +11979,26 @@ void GL_APIENTRY SamplerParameterivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLint *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameteriv, sampler, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateSamplerParameteriv(context, sampler, pname, param))
-        {
-            context->samplerParameteriv(sampler, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SamplerParameteriv(context, sampler, pname, param);
     }
 }
 
 void GL_APIENTRY ScalefContextANGLE(GLeglContext ctx, GLfloat x, GLfloat y, GLfloat z)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", x, y, z);
+    ANGLE_BINARY_EVENT(Scalef, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateScalef(context, x, y, z))
-        {
-            context->scalef(x, y, z);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Scalef(context, x, y, z);
     }
 }
 
@@ -13733,33 +12006,28 @@ void GL_APIENTRY ScalexContextANGLE(GLeglContext ctx, GLfixed x, GLfixed y, GLfi
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)", x, y, z);
+    ANGLE_BINARY_EVENT(Scalex, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateScalex(context, x, y, z))
-        {
-            context->scalex(x, y, z);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Scalex(context, x, y, z);
     }
 }
 
 void GL_APIENTRY
 ScissorContextANGLE(GLeglContext ctx, GLint x, GLint y, GLsizei width, GLsizei height)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)", x, y, width,
           height);
+    ANGLE_BINARY_EVENT(Scissor, x, y, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateScissor(context, x, y, width, height))
-        {
-            context->scissor(x, y, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Scissor(context, x, y, width, height);
     }
 }
 
@@ -13772,16 +12040,13 @@ void GL_APIENTRY SemaphoreParameterui64vEXTContextANGLE(GLeglContext ctx,
     EVENT("(GLuint semaphore = %u, GLenum pname = 0x%X, const GLuint64 *params = 0x%016" PRIxPTR
           ")",
           semaphore, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(SemaphoreParameterui64vEXT, semaphore, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateSemaphoreParameterui64vEXT(context, semaphore, pname, params))
-        {
-            context->semaphoreParameterui64v(semaphore, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SemaphoreParameterui64vEXT(context, semaphore, pname, params);
     }
 }
 
@@ -13789,32 +12054,26 @@ void GL_APIENTRY SetFenceNVContextANGLE(GLeglContext ctx, GLuint fence, GLenum c
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u, GLenum condition = 0x%X)", fence, condition);
+    ANGLE_BINARY_EVENT(SetFenceNV, fence, condition);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateSetFenceNV(context, fence, condition))
-        {
-            context->setFenceNV(fence, condition);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SetFenceNV(context, fence, condition);
     }
 }
 
 void GL_APIENTRY ShadeModelContextANGLE(GLeglContext ctx, GLenum mode)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_EVENT(ShadeModel, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        ShadingModel modePacked = FromGLenum<ShadingModel>(mode);
-        if (context->skipValidation() || ValidateShadeModel(context, modePacked))
-        {
-            context->shadeModel(modePacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ShadeModel(context, mode);
     }
 }
 
@@ -13830,16 +12089,14 @@ void GL_APIENTRY ShaderBinaryContextANGLE(GLeglContext ctx,
           ", GLenum binaryformat = 0x%X, const void *binary = 0x%016" PRIxPTR
           ", GLsizei length = %d)",
           count, (uintptr_t)shaders, binaryformat, (uintptr_t)binary, length);
+    ANGLE_BINARY_EVENT(ShaderBinary, count, shaders, binaryformat, binary, length);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateShaderBinary(context, count, shaders, binaryformat, binary, length))
-        {
-            context->shaderBinary(count, shaders, binaryformat, binary, length);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ShaderBinary(context, count, shaders, binaryformat, binary,
+                                                  length);
     }
 }
 
@@ -13853,16 +12110,13 @@ void GL_APIENTRY ShaderSourceContextANGLE(GLeglContext ctx,
     EVENT("(GLuint shader = %u, GLsizei count = %d, const GLchar *const*string = 0x%016" PRIxPTR
           ", const GLint *length = 0x%016" PRIxPTR ")",
           shader, count, (uintptr_t)string, (uintptr_t)length);
+    ANGLE_BINARY_EVENT(ShaderSource, shader, count, string, length);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateShaderSource(context, shader, count, string, length))
-        {
-            context->shaderSource(shader, count, string, length);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ShaderSource(context, shader, count, string, length);
     }
 }
 
@@ -13881,101 +12135,83 @@ void GL_APIENTRY SignalSemaphoreEXTContextANGLE(GLeglContext ctx,
         ", const GLenum *dstLayouts = 0x%016" PRIxPTR ")",
         semaphore, numBufferBarriers, (uintptr_t)buffers, numTextureBarriers, (uintptr_t)textures,
         (uintptr_t)dstLayouts);
+    ANGLE_BINARY_EVENT(SignalSemaphoreEXT, semaphore, numBufferBarriers, buffers,
+                       numTextureBarriers, textures, dstLayouts);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateSignalSemaphoreEXT(context, semaphore, numBufferBarriers, buffers,
-                                       numTextureBarriers, textures, dstLayouts))
-        {
-            context->signalSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers,
-                                     textures, dstLayouts);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SignalSemaphoreEXT(context, semaphore, numBufferBarriers,
+                                                        buffers, numTextureBarriers, textures,
+                                                        dstLayouts);
     }
 }
 
 void GL_APIENTRY StencilFuncContextANGLE(GLeglContext ctx, GLenum func, GLint ref, GLuint mask)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)", func, ref, mask);
+    ANGLE_BINARY_EVENT(StencilFunc, func, ref, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateStencilFunc(context, func, ref, mask))
-        {
-            context->stencilFunc(func, ref, mask);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilFunc(context, func, ref, mask);
     }
 }
 
 void GL_APIENTRY
 StencilFuncSeparateContextANGLE(GLeglContext ctx, GLenum face, GLenum func, GLint ref, GLuint mask)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)", face, func,
           ref, mask);
+    ANGLE_BINARY_EVENT(StencilFuncSeparate, face, func, ref, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateStencilFuncSeparate(context, face, func, ref, mask))
-        {
-            context->stencilFuncSeparate(face, func, ref, mask);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilFuncSeparate(context, face, func, ref, mask);
     }
 }
 
 void GL_APIENTRY StencilMaskContextANGLE(GLeglContext ctx, GLuint mask)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint mask = %u)", mask);
+    ANGLE_BINARY_EVENT(StencilMask, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateStencilMask(context, mask))
-        {
-            context->stencilMask(mask);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilMask(context, mask);
     }
 }
 
 void GL_APIENTRY StencilMaskSeparateContextANGLE(GLeglContext ctx, GLenum face, GLuint mask)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLuint mask = %u)", face, mask);
+    ANGLE_BINARY_EVENT(StencilMaskSeparate, face, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateStencilMaskSeparate(context, face, mask))
-        {
-            context->stencilMaskSeparate(face, mask);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilMaskSeparate(context, face, mask);
     }
 }
 
 void GL_APIENTRY StencilOpContextANGLE(GLeglContext ctx, GLenum fail, GLenum zfail, GLenum zpass)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum fail = 0x%X, GLenum zfail = 0x%X, GLenum zpass = 0x%X)", fail, zfail, zpass);
+    ANGLE_BINARY_EVENT(StencilOp, fail, zfail, zpass);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateStencilOp(context, fail, zfail, zpass))
-        {
-            context->stencilOp(fail, zfail, zpass);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilOp(context, fail, zfail, zpass);
     }
 }
 
@@ -13985,19 +12221,15 @@ void GL_APIENTRY StencilOpSeparateContextANGLE(GLeglContext ctx,
                                                GLenum dpfail,
                                                GLenum dppass)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum sfail = 0x%X, GLenum dpfail = 0x%X, GLenum dppass = 0x%X)",
           face, sfail, dpfail, dppass);
+    ANGLE_BINARY_EVENT(StencilOpSeparate, face, sfail, dpfail, dppass);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateStencilOpSeparate(context, face, sfail, dpfail, dppass))
-        {
-            context->stencilOpSeparate(face, sfail, dpfail, dppass);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilOpSeparate(context, face, sfail, dpfail, dppass);
     }
 }
 
@@ -14005,15 +12237,13 @@ GLboolean GL_APIENTRY TestFenceNVContextANGLE(GLeglContext ctx, GLuint fence)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u)", fence);
+    ANGLE_BINARY_EVENT(TestFenceNV, fence);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateTestFenceNV(context, fence))
-        {
-            return context->testFenceNV(fence);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->TestFenceNV(context, fence);
     }
 
     return GetDefaultReturnValue<EntryPoint::TestFenceNV, GLboolean>();
@@ -14030,17 +12260,13 @@ void GL_APIENTRY TexCoordPointerContextANGLE(GLeglContext ctx,
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(TexCoordPointer, size, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateTexCoordPointer(context, size, typePacked, stride, pointer))
-        {
-            context->texCoordPointer(size, typePacked, stride, pointer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexCoordPointer(context, size, type, stride, pointer);
     }
 }
 
@@ -14048,17 +12274,13 @@ void GL_APIENTRY TexEnvfContextANGLE(GLeglContext ctx, GLenum target, GLenum pna
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", target, pname, param);
+    ANGLE_BINARY_EVENT(TexEnvf, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() || ValidateTexEnvf(context, targetPacked, pnamePacked, param))
-        {
-            context->texEnvf(targetPacked, pnamePacked, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexEnvf(context, target, pname, param);
     }
 }
 
@@ -14070,18 +12292,13 @@ void GL_APIENTRY TexEnvfvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexEnvfv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() ||
-            ValidateTexEnvfv(context, targetPacked, pnamePacked, params))
-        {
-            context->texEnvfv(targetPacked, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexEnvfv(context, target, pname, params);
     }
 }
 
@@ -14089,17 +12306,13 @@ void GL_APIENTRY TexEnviContextANGLE(GLeglContext ctx, GLenum target, GLenum pna
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)", target, pname, param);
+    ANGLE_BINARY_EVENT(TexEnvi, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() || ValidateTexEnvi(context, targetPacked, pnamePacked, param))
-        {
-            context->texEnvi(targetPacked, pnamePacked, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexEnvi(context, target, pname, param);
     }
 }
 
@@ -14111,18 +12324,13 @@ void GL_APIENTRY TexEnvivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexEnviv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() ||
-            ValidateTexEnviv(context, targetPacked, pnamePacked, params))
-        {
-            context->texEnviv(targetPacked, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexEnviv(context, target, pname, params);
     }
 }
 
@@ -14131,17 +12339,13 @@ void GL_APIENTRY TexEnvxContextANGLE(GLeglContext ctx, GLenum target, GLenum pna
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", target, pname,
           param);
+    ANGLE_BINARY_EVENT(TexEnvx, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() || ValidateTexEnvx(context, targetPacked, pnamePacked, param))
-        {
-            context->texEnvx(targetPacked, pnamePacked, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexEnvx(context, target, pname, param);
     }
 }
 
@@ -14153,18 +12357,13 @@ void GL_APIENTRY TexEnvxvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexEnvxv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
-        if (context->skipValidation() ||
-            ValidateTexEnvxv(context, targetPacked, pnamePacked, params))
-        {
-            context->texEnvxv(targetPacked, pnamePacked, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexEnvxv(context, target, pname, params);
     }
 }
 
@@ -14172,15 +12371,13 @@ void GL_APIENTRY TexGenfOESContextANGLE(GLeglContext ctx, GLenum coord, GLenum p
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", coord, pname, param);
+    ANGLE_BINARY_EVENT(TexGenfOES, coord, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateTexGenfOES(context, coord, pname, param))
-        {
-            context->texGenf(coord, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexGenfOES(context, coord, pname, param);
     }
 }
 
@@ -14192,15 +12389,13 @@ void GL_APIENTRY TexGenfvOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           coord, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexGenfvOES, coord, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateTexGenfvOES(context, coord, pname, params))
-        {
-            context->texGenfv(coord, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexGenfvOES(context, coord, pname, params);
     }
 }
 
@@ -14208,15 +12403,13 @@ void GL_APIENTRY TexGeniOESContextANGLE(GLeglContext ctx, GLenum coord, GLenum p
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLint param = %d)", coord, pname, param);
+    ANGLE_BINARY_EVENT(TexGeniOES, coord, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateTexGeniOES(context, coord, pname, param))
-        {
-            context->texGeni(coord, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexGeniOES(context, coord, pname, param);
     }
 }
 
@@ -14228,15 +12421,13 @@ void GL_APIENTRY TexGenivOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           coord, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexGenivOES, coord, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateTexGenivOES(context, coord, pname, params))
-        {
-            context->texGeniv(coord, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexGenivOES(context, coord, pname, params);
     }
 }
 
@@ -14244,15 +12435,13 @@ void GL_APIENTRY TexGenxOESContextANGLE(GLeglContext ctx, GLenum coord, GLenum p
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", coord, pname, param);
+    ANGLE_BINARY_EVENT(TexGenxOES, coord, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateTexGenxOES(context, coord, pname, param))
-        {
-            context->texGenx(coord, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexGenxOES(context, coord, pname, param);
     }
 }
 
@@ -14264,15 +12453,13 @@ void GL_APIENTRY TexGenxvOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           coord, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexGenxvOES, coord, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateTexGenxvOES(context, coord, pname, params))
-        {
-            context->texGenxv(coord, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexGenxvOES(context, coord, pname, params);
     }
 }
 
@@ -14293,19 +12480,15 @@ void GL_APIENTRY TexImage2DContextANGLE(GLeglContext ctx,
         "GLsizei height = %d, GLint border = %d, GLenum format = 0x%X, GLenum type = 0x%X, const "
         "void *pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, format, type, (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexImage2D, target, level, internalformat, width, height, border, format,
+                       type, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexImage2D(context, targetPacked, level, internalformat, width, height, border,
-                               format, type, pixels))
-        {
-            context->texImage2D(targetPacked, level, internalformat, width, height, border, format,
-                                type, pixels);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexImage2D(context, target, level, internalformat, width,
+                                                height, border, format, type, pixels);
     }
 }
 
@@ -14328,19 +12511,15 @@ void GL_APIENTRY TexImage3DContextANGLE(GLeglContext ctx,
         "type = 0x%X, const void *pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, format, type,
         (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexImage3D, target, level, internalformat, width, height, depth, border,
+                       format, type, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexImage3D(context, targetPacked, level, internalformat, width, height, depth,
-                               border, format, type, pixels))
-        {
-            context->texImage3D(targetPacked, level, internalformat, width, height, depth, border,
-                                format, type, pixels);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexImage3D(context, target, level, internalformat, width,
+                                                height, depth, border, format, type, pixels);
     }
 }
 
@@ -14352,17 +12531,13 @@ void GL_APIENTRY TexParameterIivOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterIivOES, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterIivOES(context, targetPacked, pname, params))
-        {
-            context->texParameterIiv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexParameterIivOES(context, target, pname, params);
     }
 }
 
@@ -14374,17 +12549,13 @@ void GL_APIENTRY TexParameterIuivOESContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLuint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterIuivOES, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterIuivOES(context, targetPacked, pname, params))
-        {
-            context->texParameterIuiv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexParameterIuivOES(context, target, pname, params);
     }
 }
 
@@ -14395,16 +12566,13 @@ void GL_APIENTRY TexParameterfContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", target, pname, param);
+    ANGLE_BINARY_EVENT(TexParameterf, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateTexParameterf(context, targetPacked, pname, param))
-        {
-            context->texParameterf(targetPacked, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexParameterf(context, target, pname, param);
     }
 }
 
@@ -14416,17 +12584,13 @@ void GL_APIENTRY TexParameterfvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterfv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterfv(context, targetPacked, pname, params))
-        {
-            context->texParameterfv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexParameterfv(context, target, pname, params);
     }
 }
 
@@ -14437,16 +12601,13 @@ void GL_APIENTRY TexParameteriContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)", target, pname, param);
+    ANGLE_BINARY_EVENT(TexParameteri, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateTexParameteri(context, targetPacked, pname, param))
-        {
-            context->texParameteri(targetPacked, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexParameteri(context, target, pname, param);
     }
 }
 
@@ -14458,17 +12619,13 @@ void GL_APIENTRY TexParameterivContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameteriv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameteriv(context, targetPacked, pname, params))
-        {
-            context->texParameteriv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexParameteriv(context, target, pname, params);
     }
 }
 
@@ -14480,16 +12637,13 @@ void GL_APIENTRY TexParameterxContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", target, pname,
           param);
+    ANGLE_BINARY_EVENT(TexParameterx, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateTexParameterx(context, targetPacked, pname, param))
-        {
-            context->texParameterx(targetPacked, pname, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexParameterx(context, target, pname, param);
     }
 }
 
@@ -14501,17 +12655,13 @@ void GL_APIENTRY TexParameterxvContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterxv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterxv(context, targetPacked, pname, params))
-        {
-            context->texParameterxv(targetPacked, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexParameterxv(context, target, pname, params);
     }
 }
 
@@ -14526,16 +12676,14 @@ void GL_APIENTRY TexStorage1DEXTContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d)",
         target, levels, internalformat, width);
+    ANGLE_BINARY_EVENT(TexStorage1DEXT, target, levels, internalformat, width);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateTexStorage1DEXT(context, target, levels, internalformat, width))
-        {
-            context->texStorage1D(target, levels, internalformat, width);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexStorage1DEXT(context, target, levels, internalformat,
+                                                     width);
     }
 }
 
@@ -14551,17 +12699,14 @@ void GL_APIENTRY TexStorage2DContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d)",
         target, levels, internalformat, width, height);
+    ANGLE_BINARY_EVENT(TexStorage2D, target, levels, internalformat, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorage2D(context, targetPacked, levels, internalformat, width, height))
-        {
-            context->texStorage2D(targetPacked, levels, internalformat, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexStorage2D(context, target, levels, internalformat, width,
+                                                  height);
     }
 }
 
@@ -14577,17 +12722,14 @@ void GL_APIENTRY TexStorage2DEXTContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d)",
         target, levels, internalformat, width, height);
+    ANGLE_BINARY_EVENT(TexStorage2DEXT, target, levels, internalformat, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorage2DEXT(context, targetPacked, levels, internalformat, width, height))
-        {
-            context->texStorage2D(targetPacked, levels, internalformat, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexStorage2DEXT(context, target, levels, internalformat, width,
+                                                     height);
     }
 }
 
@@ -14604,19 +12746,15 @@ void GL_APIENTRY TexStorage2DMultisampleContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d, GLboolean fixedsamplelocations = %u)",
         target, samples, internalformat, width, height, fixedsamplelocations);
+    ANGLE_BINARY_EVENT(TexStorage2DMultisample, target, samples, internalformat, width, height,
+                       fixedsamplelocations);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorage2DMultisample(context, targetPacked, samples, internalformat, width,
-                                            height, fixedsamplelocations))
-        {
-            context->texStorage2DMultisample(targetPacked, samples, internalformat, width, height,
-                                             fixedsamplelocations);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexStorage2DMultisample(
+            context, target, samples, internalformat, width, height, fixedsamplelocations);
     }
 }
 
@@ -14633,17 +12771,14 @@ void GL_APIENTRY TexStorage3DContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLsizei depth = %d)",
         target, levels, internalformat, width, height, depth);
+    ANGLE_BINARY_EVENT(TexStorage3D, target, levels, internalformat, width, height, depth);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateTexStorage3D(context, targetPacked, levels,
-                                                              internalformat, width, height, depth))
-        {
-            context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexStorage3D(context, target, levels, internalformat, width,
+                                                  height, depth);
     }
 }
 
@@ -14660,18 +12795,14 @@ void GL_APIENTRY TexStorage3DEXTContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLsizei depth = %d)",
         target, levels, internalformat, width, height, depth);
+    ANGLE_BINARY_EVENT(TexStorage3DEXT, target, levels, internalformat, width, height, depth);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorage3DEXT(context, targetPacked, levels, internalformat, width, height,
-                                    depth))
-        {
-            context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexStorage3DEXT(context, target, levels, internalformat, width,
+                                                     height, depth);
     }
 }
 
@@ -14689,19 +12820,15 @@ void GL_APIENTRY TexStorage3DMultisampleOESContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d, GLsizei depth = %d, GLboolean fixedsamplelocations = %u)",
         target, samples, internalformat, width, height, depth, fixedsamplelocations);
+    ANGLE_BINARY_EVENT(TexStorage3DMultisampleOES, target, samples, internalformat, width, height,
+                       depth, fixedsamplelocations);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorage3DMultisampleOES(context, targetPacked, samples, internalformat,
-                                               width, height, depth, fixedsamplelocations))
-        {
-            context->texStorage3DMultisample(targetPacked, samples, internalformat, width, height,
-                                             depth, fixedsamplelocations);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexStorage3DMultisampleOES(
+            context, target, samples, internalformat, width, height, depth, fixedsamplelocations);
     }
 }
 
@@ -14720,19 +12847,15 @@ void GL_APIENTRY TexStorageMem2DEXTContextANGLE(GLeglContext ctx,
         "%d, GLsizei height = %d, GLuint memory = %u, GLuint64 offset = %llu)",
         target, levels, internalFormat, width, height, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_EVENT(TexStorageMem2DEXT, target, levels, internalFormat, width, height, memory,
+                       offset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorageMem2DEXT(context, targetPacked, levels, internalFormat, width, height,
-                                       memory, offset))
-        {
-            context->texStorageMem2D(targetPacked, levels, internalFormat, width, height, memory,
-                                     offset);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexStorageMem2DEXT(context, target, levels, internalFormat,
+                                                        width, height, memory, offset);
     }
 }
 
@@ -14753,19 +12876,16 @@ void GL_APIENTRY TexStorageMem2DMultisampleEXTContextANGLE(GLeglContext ctx,
         "GLuint64 offset = %llu)",
         target, samples, internalFormat, width, height, fixedSampleLocations, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_EVENT(TexStorageMem2DMultisampleEXT, target, samples, internalFormat, width,
+                       height, fixedSampleLocations, memory, offset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateTexStorageMem2DMultisampleEXT(
-                                             context, targetPacked, samples, internalFormat, width,
-                                             height, fixedSampleLocations, memory, offset))
-        {
-            context->texStorageMem2DMultisample(targetPacked, samples, internalFormat, width,
-                                                height, fixedSampleLocations, memory, offset);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexStorageMem2DMultisampleEXT(
+            context, target, samples, internalFormat, width, height, fixedSampleLocations, memory,
+            offset);
     }
 }
 
@@ -14785,19 +12905,15 @@ void GL_APIENTRY TexStorageMem3DEXTContextANGLE(GLeglContext ctx,
         "%d, GLsizei height = %d, GLsizei depth = %d, GLuint memory = %u, GLuint64 offset = %llu)",
         target, levels, internalFormat, width, height, depth, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_EVENT(TexStorageMem3DEXT, target, levels, internalFormat, width, height, depth,
+                       memory, offset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorageMem3DEXT(context, targetPacked, levels, internalFormat, width, height,
-                                       depth, memory, offset))
-        {
-            context->texStorageMem3D(targetPacked, levels, internalFormat, width, height, depth,
-                                     memory, offset);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexStorageMem3DEXT(context, target, levels, internalFormat,
+                                                        width, height, depth, memory, offset);
     }
 }
 
@@ -14819,20 +12935,16 @@ void GL_APIENTRY TexStorageMem3DMultisampleEXTContextANGLE(GLeglContext ctx,
         "GLuint memory = %u, GLuint64 offset = %llu)",
         target, samples, internalFormat, width, height, depth, fixedSampleLocations, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_EVENT(TexStorageMem3DMultisampleEXT, target, samples, internalFormat, width,
+                       height, depth, fixedSampleLocations, memory, offset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateTexStorageMem3DMultisampleEXT(
-                                             context, targetPacked, samples, internalFormat, width,
-                                             height, depth, fixedSampleLocations, memory, offset))
-        {
-            context->texStorageMem3DMultisample(targetPacked, samples, internalFormat, width,
-                                                height, depth, fixedSampleLocations, memory,
-                                                offset);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexStorageMem3DMultisampleEXT(
+            context, target, samples, internalFormat, width, height, depth, fixedSampleLocations,
+            memory, offset);
     }
 }
 
@@ -14853,19 +12965,15 @@ void GL_APIENTRY TexSubImage2DContextANGLE(GLeglContext ctx,
         "width = %d, GLsizei height = %d, GLenum format = 0x%X, GLenum type = 0x%X, const void "
         "*pixels = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, type, (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexSubImage2D, target, level, xoffset, yoffset, width, height, format, type,
+                       pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexSubImage2D(context, targetPacked, level, xoffset, yoffset, width, height,
-                                  format, type, pixels))
-        {
-            context->texSubImage2D(targetPacked, level, xoffset, yoffset, width, height, format,
-                                   type, pixels);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexSubImage2D(context, target, level, xoffset, yoffset, width,
+                                                   height, format, type, pixels);
     }
 }
 
@@ -14889,19 +12997,16 @@ void GL_APIENTRY TexSubImage3DContextANGLE(GLeglContext ctx,
         "= 0x%X, GLenum type = 0x%X, const void *pixels = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, type,
         (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexSubImage3D, target, level, xoffset, yoffset, zoffset, width, height,
+                       depth, format, type, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexSubImage3D(context, targetPacked, level, xoffset, yoffset, zoffset, width,
-                                  height, depth, format, type, pixels))
-        {
-            context->texSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width, height,
-                                   depth, format, type, pixels);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexSubImage3D(context, target, level, xoffset, yoffset,
+                                                   zoffset, width, height, depth, format, type,
+                                                   pixels);
     }
 }
 
@@ -14915,32 +13020,27 @@ void GL_APIENTRY TransformFeedbackVaryingsContextANGLE(GLeglContext ctx,
     EVENT("(GLuint program = %u, GLsizei count = %d, const GLchar *const*varyings = 0x%016" PRIxPTR
           ", GLenum bufferMode = 0x%X)",
           program, count, (uintptr_t)varyings, bufferMode);
+    ANGLE_BINARY_EVENT(TransformFeedbackVaryings, program, count, varyings, bufferMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateTransformFeedbackVaryings(context, program, count, varyings, bufferMode))
-        {
-            context->transformFeedbackVaryings(program, count, varyings, bufferMode);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TransformFeedbackVaryings(context, program, count, varyings,
+                                                               bufferMode);
     }
 }
 
 void GL_APIENTRY TranslatefContextANGLE(GLeglContext ctx, GLfloat x, GLfloat y, GLfloat z)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", x, y, z);
+    ANGLE_BINARY_EVENT(Translatef, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateTranslatef(context, x, y, z))
-        {
-            context->translatef(x, y, z);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Translatef(context, x, y, z);
     }
 }
 
@@ -14948,31 +13048,27 @@ void GL_APIENTRY TranslatexContextANGLE(GLeglContext ctx, GLfixed x, GLfixed y,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)", x, y, z);
+    ANGLE_BINARY_EVENT(Translatex, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateTranslatex(context, x, y, z))
-        {
-            context->translatex(x, y, z);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Translatex(context, x, y, z);
     }
 }
 
 void GL_APIENTRY Uniform1fContextANGLE(GLeglContext ctx, GLint location, GLfloat v0)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLfloat v0 = %f)", location, v0);
+    ANGLE_BINARY_EVENT(Uniform1f, location, v0);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform1f(context, location, v0))
-        {
-            context->uniform1f(location, v0);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform1f(context, location, v0);
     }
 }
 
@@ -14981,34 +13077,30 @@ void GL_APIENTRY Uniform1fvContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform1fv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform1fv(context, location, count, value))
-        {
-            context->uniform1fv(location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform1fv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform1iContextANGLE(GLeglContext ctx, GLint location, GLint v0)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d)", location, v0);
+    ANGLE_BINARY_EVENT(Uniform1i, location, v0);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform1i(context, location, v0))
-        {
-            context->uniform1i(location, v0);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform1i(context, location, v0);
     }
 }
 
@@ -15017,34 +13109,30 @@ void GL_APIENTRY Uniform1ivContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform1iv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform1iv(context, location, count, value))
-        {
-            context->uniform1iv(location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform1iv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform1uiContextANGLE(GLeglContext ctx, GLint location, GLuint v0)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u)", location, v0);
+    ANGLE_BINARY_EVENT(Uniform1ui, location, v0);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform1ui(context, location, v0))
-        {
-            context->uniform1ui(location, v0);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform1ui(context, location, v0);
     }
 }
 
@@ -15053,34 +13141,30 @@ void GL_APIENTRY Uniform1uivContextANGLE(GLeglContext ctx,
                                          GLsizei count,
                                          const GLuint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform1uiv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform1uiv(context, location, count, value))
-        {
-            context->uniform1uiv(location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform1uiv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform2fContextANGLE(GLeglContext ctx, GLint location, GLfloat v0, GLfloat v1)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f)", location, v0, v1);
+    ANGLE_BINARY_EVENT(Uniform2f, location, v0, v1);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform2f(context, location, v0, v1))
-        {
-            context->uniform2f(location, v0, v1);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform2f(context, location, v0, v1);
     }
 }
 
@@ -15089,34 +13173,30 @@ void GL_APIENTRY Uniform2fvContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform2fv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform2fv(context, location, count, value))
-        {
-            context->uniform2fv(location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform2fv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform2iContextANGLE(GLeglContext ctx, GLint location, GLint v0, GLint v1)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d, GLint v1 = %d)", location, v0, v1);
+    ANGLE_BINARY_EVENT(Uniform2i, location, v0, v1);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform2i(context, location, v0, v1))
-        {
-            context->uniform2i(location, v0, v1);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform2i(context, location, v0, v1);
     }
 }
 
@@ -15125,34 +13205,30 @@ void GL_APIENTRY Uniform2ivContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform2iv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform2iv(context, location, count, value))
-        {
-            context->uniform2iv(location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform2iv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY Uniform2uiContextANGLE(GLeglContext ctx, GLint location, GLuint v0, GLuint v1)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u)", location, v0, v1);
+    ANGLE_BINARY_EVENT(Uniform2ui, location, v0, v1);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform2ui(context, location, v0, v1))
-        {
-            context->uniform2ui(location, v0, v1);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform2ui(context, location, v0, v1);
     }
 }
 
@@ -15161,36 +13237,32 @@ void GL_APIENTRY Uniform2uivContextANGLE(GLeglContext ctx,
                                          GLsizei count,
                                          const GLuint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform2uiv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform2uiv(context, location, count, value))
-        {
-            context->uniform2uiv(location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform2uiv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY
 Uniform3fContextANGLE(GLeglContext ctx, GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = %f)", location, v0,
           v1, v2);
+    ANGLE_BINARY_EVENT(Uniform3f, location, v0, v1, v2);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform3f(context, location, v0, v1, v2))
-        {
-            context->uniform3f(location, v0, v1, v2);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform3f(context, location, v0, v1, v2);
     }
 }
 
@@ -15199,36 +13271,32 @@ void GL_APIENTRY Uniform3fvContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform3fv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform3fv(context, location, count, value))
-        {
-            context->uniform3fv(location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform3fv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY
 Uniform3iContextANGLE(GLeglContext ctx, GLint location, GLint v0, GLint v1, GLint v2)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d)", location, v0, v1,
           v2);
+    ANGLE_BINARY_EVENT(Uniform3i, location, v0, v1, v2);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform3i(context, location, v0, v1, v2))
-        {
-            context->uniform3i(location, v0, v1, v2);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform3i(context, location, v0, v1, v2);
     }
 }
 
@@ -15237,36 +13305,32 @@ void GL_APIENTRY Uniform3ivContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform3iv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform3iv(context, location, count, value))
-        {
-            context->uniform3iv(location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform3iv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY
 Uniform3uiContextANGLE(GLeglContext ctx, GLint location, GLuint v0, GLuint v1, GLuint v2)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = %u)", location, v0, v1,
           v2);
+    ANGLE_BINARY_EVENT(Uniform3ui, location, v0, v1, v2);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform3ui(context, location, v0, v1, v2))
-        {
-            context->uniform3ui(location, v0, v1, v2);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform3ui(context, location, v0, v1, v2);
     }
 }
 
@@ -15275,18 +13339,16 @@ void GL_APIENTRY Uniform3uivContextANGLE(GLeglContext ctx,
                                          GLsizei count,
                                          const GLuint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform3uiv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform3uiv(context, location, count, value))
-        {
-            context->uniform3uiv(location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform3uiv(context, location, count, value);
     }
 }
 
@@ -15297,19 +13359,17 @@ void GL_APIENTRY Uniform4fContextANGLE(GLeglContext ctx,
                                        GLfloat v2,
                                        GLfloat v3)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = %f, GLfloat v3 = %f)",
         location, v0, v1, v2, v3);
+    ANGLE_BINARY_EVENT(Uniform4f, location, v0, v1, v2, v3);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform4f(context, location, v0, v1, v2, v3))
-        {
-            context->uniform4f(location, v0, v1, v2, v3);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform4f(context, location, v0, v1, v2, v3);
     }
 }
 
@@ -15318,36 +13378,32 @@ void GL_APIENTRY Uniform4fvContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform4fv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform4fv(context, location, count, value))
-        {
-            context->uniform4fv(location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform4fv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY
 Uniform4iContextANGLE(GLeglContext ctx, GLint location, GLint v0, GLint v1, GLint v2, GLint v3)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d, GLint v3 = %d)",
           location, v0, v1, v2, v3);
+    ANGLE_BINARY_EVENT(Uniform4i, location, v0, v1, v2, v3);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform4i(context, location, v0, v1, v2, v3))
-        {
-            context->uniform4i(location, v0, v1, v2, v3);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform4i(context, location, v0, v1, v2, v3);
     }
 }
 
@@ -15356,36 +13412,32 @@ void GL_APIENTRY Uniform4ivContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform4iv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform4iv(context, location, count, value))
-        {
-            context->uniform4iv(location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform4iv(context, location, count, value);
     }
 }
 
 void GL_APIENTRY
 Uniform4uiContextANGLE(GLeglContext ctx, GLint location, GLuint v0, GLuint v1, GLuint v2, GLuint v3)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = %u, GLuint v3 = %u)",
           location, v0, v1, v2, v3);
+    ANGLE_BINARY_EVENT(Uniform4ui, location, v0, v1, v2, v3);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform4ui(context, location, v0, v1, v2, v3))
-        {
-            context->uniform4ui(location, v0, v1, v2, v3);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform4ui(context, location, v0, v1, v2, v3);
     }
 }
 
@@ -15394,18 +13446,16 @@ void GL_APIENTRY Uniform4uivContextANGLE(GLeglContext ctx,
                                          GLsizei count,
                                          const GLuint *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(Uniform4uiv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUniform4uiv(context, location, count, value))
-        {
-            context->uniform4uiv(location, count, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->Uniform4uiv(context, location, count, value);
     }
 }
 
@@ -15414,19 +13464,17 @@ void GL_APIENTRY UniformBlockBindingContextANGLE(GLeglContext ctx,
                                                  GLuint uniformBlockIndex,
                                                  GLuint uniformBlockBinding)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint uniformBlockIndex = %u, GLuint uniformBlockBinding = %u)",
           program, uniformBlockIndex, uniformBlockBinding);
+    ANGLE_BINARY_EVENT(UniformBlockBinding, program, uniformBlockIndex, uniformBlockBinding);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateUniformBlockBinding(context, program, uniformBlockIndex, uniformBlockBinding))
-        {
-            context->uniformBlockBinding(program, uniformBlockIndex, uniformBlockBinding);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformBlockBinding(context, program, uniformBlockIndex,
+                                                         uniformBlockBinding);
     }
 }
 
@@ -15436,21 +13484,18 @@ void GL_APIENTRY UniformMatrix2fvContextANGLE(GLeglContext ctx,
                                               GLboolean transpose,
                                               const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix2fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateUniformMatrix2fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix2fv(location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix2fv(context, location, count, transpose, value);
     }
 }
 
@@ -15460,21 +13505,18 @@ void GL_APIENTRY UniformMatrix2x3fvContextANGLE(GLeglContext ctx,
                                                 GLboolean transpose,
                                                 const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix2x3fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateUniformMatrix2x3fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix2x3fv(location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix2x3fv(context, location, count, transpose, value);
     }
 }
 
@@ -15484,21 +13526,18 @@ void GL_APIENTRY UniformMatrix2x4fvContextANGLE(GLeglContext ctx,
                                                 GLboolean transpose,
                                                 const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix2x4fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateUniformMatrix2x4fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix2x4fv(location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix2x4fv(context, location, count, transpose, value);
     }
 }
 
@@ -15508,21 +13547,18 @@ void GL_APIENTRY UniformMatrix3fvContextANGLE(GLeglContext ctx,
                                               GLboolean transpose,
                                               const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix3fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateUniformMatrix3fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix3fv(location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix3fv(context, location, count, transpose, value);
     }
 }
 
@@ -15532,21 +13568,18 @@ void GL_APIENTRY UniformMatrix3x2fvContextANGLE(GLeglContext ctx,
                                                 GLboolean transpose,
                                                 const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix3x2fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateUniformMatrix3x2fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix3x2fv(location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix3x2fv(context, location, count, transpose, value);
     }
 }
 
@@ -15556,21 +13589,18 @@ void GL_APIENTRY UniformMatrix3x4fvContextANGLE(GLeglContext ctx,
                                                 GLboolean transpose,
                                                 const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix3x4fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateUniformMatrix3x4fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix3x4fv(location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix3x4fv(context, location, count, transpose, value);
     }
 }
 
@@ -15580,21 +13610,18 @@ void GL_APIENTRY UniformMatrix4fvContextANGLE(GLeglContext ctx,
                                               GLboolean transpose,
                                               const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix4fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateUniformMatrix4fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix4fv(location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix4fv(context, location, count, transpose, value);
     }
 }
 
@@ -15604,21 +13631,18 @@ void GL_APIENTRY UniformMatrix4x2fvContextANGLE(GLeglContext ctx,
                                                 GLboolean transpose,
                                                 const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix4x2fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateUniformMatrix4x2fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix4x2fv(location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix4x2fv(context, location, count, transpose, value);
     }
 }
 
@@ -15628,21 +13652,18 @@ void GL_APIENTRY UniformMatrix4x3fvContextANGLE(GLeglContext ctx,
                                                 GLboolean transpose,
                                                 const GLfloat *value)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(UniformMatrix4x3fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateUniformMatrix4x3fv(context, location, count, transpose, value))
-        {
-            context->uniformMatrix4x3fv(location, count, transpose, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        ANGLE_SCOPED_SHARE_GROUP_LOCK(context);
+        context->getDispatchTable()->UniformMatrix4x3fv(context, location, count, transpose, value);
     }
 }
 
@@ -15650,16 +13671,13 @@ GLboolean GL_APIENTRY UnmapBufferContextANGLE(GLeglContext ctx, GLenum target)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(UnmapBuffer, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateUnmapBuffer(context, targetPacked))
-        {
-            return context->unmapBuffer(targetPacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->UnmapBuffer(context, target);
     }
 
     return GetDefaultReturnValue<EntryPoint::UnmapBuffer, GLboolean>();
@@ -15669,16 +13687,13 @@ GLboolean GL_APIENTRY UnmapBufferOESContextANGLE(GLeglContext ctx, GLenum target
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_EVENT(UnmapBufferOES, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateUnmapBufferOES(context, targetPacked))
-        {
-            return context->unmapBuffer(targetPacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->UnmapBufferOES(context, target);
     }
 
     return GetDefaultReturnValue<EntryPoint::UnmapBufferOES, GLboolean>();
@@ -15688,15 +13703,13 @@ void GL_APIENTRY UseProgramContextANGLE(GLeglContext ctx, GLuint program)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_EVENT(UseProgram, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateUseProgram(context, program))
-        {
-            context->useProgram(program);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->UseProgram(context, program);
     }
 }
 
@@ -15708,16 +13721,13 @@ void GL_APIENTRY UseProgramStagesContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLbitfield stages = 0x%X, GLuint program = %u)", pipeline, stages,
           program);
+    ANGLE_BINARY_EVENT(UseProgramStages, pipeline, stages, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateUseProgramStages(context, pipeline, stages, program))
-        {
-            context->useProgramStages(pipeline, stages, program);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->UseProgramStages(context, pipeline, stages, program);
     }
 }
 
@@ -15725,15 +13735,13 @@ void GL_APIENTRY ValidateProgramContextANGLE(GLeglContext ctx, GLuint program)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_EVENT(ValidateProgram, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateValidateProgram(context, program))
-        {
-            context->validateProgram(program);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ValidateProgram(context, program);
     }
 }
 
@@ -15741,112 +13749,92 @@ void GL_APIENTRY ValidateProgramPipelineContextANGLE(GLeglContext ctx, GLuint pi
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u)", pipeline);
+    ANGLE_BINARY_EVENT(ValidateProgramPipeline, pipeline);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateValidateProgramPipeline(context, pipeline))
-        {
-            context->validateProgramPipeline(pipeline);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ValidateProgramPipeline(context, pipeline);
     }
 }
 
 void GL_APIENTRY VertexAttrib1fContextANGLE(GLeglContext ctx, GLuint index, GLfloat x)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f)", index, x);
+    ANGLE_BINARY_EVENT(VertexAttrib1f, index, x);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttrib1f(context, index, x))
-        {
-            context->vertexAttrib1f(index, x);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttrib1f(context, index, x);
     }
 }
 
 void GL_APIENTRY VertexAttrib1fvContextANGLE(GLeglContext ctx, GLuint index, const GLfloat *v)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_EVENT(VertexAttrib1fv, index, v);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttrib1fv(context, index, v))
-        {
-            context->vertexAttrib1fv(index, v);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttrib1fv(context, index, v);
     }
 }
 
 void GL_APIENTRY VertexAttrib2fContextANGLE(GLeglContext ctx, GLuint index, GLfloat x, GLfloat y)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f, GLfloat y = %f)", index, x, y);
+    ANGLE_BINARY_EVENT(VertexAttrib2f, index, x, y);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttrib2f(context, index, x, y))
-        {
-            context->vertexAttrib2f(index, x, y);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttrib2f(context, index, x, y);
     }
 }
 
 void GL_APIENTRY VertexAttrib2fvContextANGLE(GLeglContext ctx, GLuint index, const GLfloat *v)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_EVENT(VertexAttrib2fv, index, v);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttrib2fv(context, index, v))
-        {
-            context->vertexAttrib2fv(index, v);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttrib2fv(context, index, v);
     }
 }
 
 void GL_APIENTRY
 VertexAttrib3fContextANGLE(GLeglContext ctx, GLuint index, GLfloat x, GLfloat y, GLfloat z)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", index, x, y, z);
+    ANGLE_BINARY_EVENT(VertexAttrib3f, index, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttrib3f(context, index, x, y, z))
-        {
-            context->vertexAttrib3f(index, x, y, z);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttrib3f(context, index, x, y, z);
     }
 }
 
 void GL_APIENTRY VertexAttrib3fvContextANGLE(GLeglContext ctx, GLuint index, const GLfloat *v)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_EVENT(VertexAttrib3fv, index, v);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttrib3fv(context, index, v))
-        {
-            context->vertexAttrib3fv(index, v);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttrib3fv(context, index, v);
     }
 }
 
@@ -15857,34 +13845,28 @@ void GL_APIENTRY VertexAttrib4fContextANGLE(GLeglContext ctx,
                                             GLfloat z,
                                             GLfloat w)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f, GLfloat w = %f)",
           index, x, y, z, w);
+    ANGLE_BINARY_EVENT(VertexAttrib4f, index, x, y, z, w);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttrib4f(context, index, x, y, z, w))
-        {
-            context->vertexAttrib4f(index, x, y, z, w);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttrib4f(context, index, x, y, z, w);
     }
 }
 
 void GL_APIENTRY VertexAttrib4fvContextANGLE(GLeglContext ctx, GLuint index, const GLfloat *v)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_EVENT(VertexAttrib4fv, index, v);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttrib4fv(context, index, v))
-        {
-            context->vertexAttrib4fv(index, v);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttrib4fv(context, index, v);
     }
 }
 
@@ -15894,32 +13876,26 @@ void GL_APIENTRY VertexAttribBindingContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint attribindex = %u, GLuint bindingindex = %u)", attribindex, bindingindex);
+    ANGLE_BINARY_EVENT(VertexAttribBinding, attribindex, bindingindex);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateVertexAttribBinding(context, attribindex, bindingindex))
-        {
-            context->vertexAttribBinding(attribindex, bindingindex);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttribBinding(context, attribindex, bindingindex);
     }
 }
 
 void GL_APIENTRY VertexAttribDivisorContextANGLE(GLeglContext ctx, GLuint index, GLuint divisor)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint divisor = %u)", index, divisor);
+    ANGLE_BINARY_EVENT(VertexAttribDivisor, index, divisor);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttribDivisor(context, index, divisor))
-        {
-            context->vertexAttribDivisor(index, divisor);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttribDivisor(context, index, divisor);
     }
 }
 
@@ -15929,15 +13905,13 @@ void GL_APIENTRY VertexAttribDivisorANGLEContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint divisor = %u)", index, divisor);
+    ANGLE_BINARY_EVENT(VertexAttribDivisorANGLE, index, divisor);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttribDivisorANGLE(context, index, divisor))
-        {
-            context->vertexAttribDivisor(index, divisor);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttribDivisorANGLE(context, index, divisor);
     }
 }
 
@@ -15945,15 +13919,13 @@ void GL_APIENTRY VertexAttribDivisorEXTContextANGLE(GLeglContext ctx, GLuint ind
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint divisor = %u)", index, divisor);
+    ANGLE_BINARY_EVENT(VertexAttribDivisorEXT, index, divisor);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttribDivisorEXT(context, index, divisor))
-        {
-            context->vertexAttribDivisor(index, divisor);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttribDivisorEXT(context, index, divisor);
     }
 }
 
@@ -15969,86 +13941,70 @@ void GL_APIENTRY VertexAttribFormatContextANGLE(GLeglContext ctx,
         "(GLuint attribindex = %u, GLint size = %d, GLenum type = 0x%X, GLboolean normalized = %u, "
         "GLuint relativeoffset = %u)",
         attribindex, size, type, normalized, relativeoffset);
+    ANGLE_BINARY_EVENT(VertexAttribFormat, attribindex, size, type, normalized, relativeoffset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateVertexAttribFormat(context, attribindex, size, typePacked, normalized,
-                                       relativeoffset))
-        {
-            context->vertexAttribFormat(attribindex, size, typePacked, normalized, relativeoffset);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttribFormat(context, attribindex, size, type,
+                                                        normalized, relativeoffset);
     }
 }
 
 void GL_APIENTRY
 VertexAttribI4iContextANGLE(GLeglContext ctx, GLuint index, GLint x, GLint y, GLint z, GLint w)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLint x = %d, GLint y = %d, GLint z = %d, GLint w = %d)", index, x,
           y, z, w);
+    ANGLE_BINARY_EVENT(VertexAttribI4i, index, x, y, z, w);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttribI4i(context, index, x, y, z, w))
-        {
-            context->vertexAttribI4i(index, x, y, z, w);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttribI4i(context, index, x, y, z, w);
     }
 }
 
 void GL_APIENTRY VertexAttribI4ivContextANGLE(GLeglContext ctx, GLuint index, const GLint *v)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLint *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_EVENT(VertexAttribI4iv, index, v);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttribI4iv(context, index, v))
-        {
-            context->vertexAttribI4iv(index, v);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttribI4iv(context, index, v);
     }
 }
 
 void GL_APIENTRY
 VertexAttribI4uiContextANGLE(GLeglContext ctx, GLuint index, GLuint x, GLuint y, GLuint z, GLuint w)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint x = %u, GLuint y = %u, GLuint z = %u, GLuint w = %u)", index,
           x, y, z, w);
+    ANGLE_BINARY_EVENT(VertexAttribI4ui, index, x, y, z, w);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttribI4ui(context, index, x, y, z, w))
-        {
-            context->vertexAttribI4ui(index, x, y, z, w);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttribI4ui(context, index, x, y, z, w);
     }
 }
 
 void GL_APIENTRY VertexAttribI4uivContextANGLE(GLeglContext ctx, GLuint index, const GLuint *v)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLuint *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_EVENT(VertexAttribI4uiv, index, v);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateVertexAttribI4uiv(context, index, v))
-        {
-            context->vertexAttribI4uiv(index, v);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttribI4uiv(context, index, v);
     }
 }
 
@@ -16063,17 +14019,14 @@ void GL_APIENTRY VertexAttribIFormatContextANGLE(GLeglContext ctx,
         "(GLuint attribindex = %u, GLint size = %d, GLenum type = 0x%X, GLuint relativeoffset = "
         "%u)",
         attribindex, size, type, relativeoffset);
+    ANGLE_BINARY_EVENT(VertexAttribIFormat, attribindex, size, type, relativeoffset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateVertexAttribIFormat(context, attribindex, size, typePacked, relativeoffset))
-        {
-            context->vertexAttribIFormat(attribindex, size, typePacked, relativeoffset);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttribIFormat(context, attribindex, size, type,
+                                                         relativeoffset);
     }
 }
 
@@ -16089,17 +14042,14 @@ void GL_APIENTRY VertexAttribIPointerContextANGLE(GLeglContext ctx,
         "(GLuint index = %u, GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void "
         "*pointer = 0x%016" PRIxPTR ")",
         index, size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(VertexAttribIPointer, index, size, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateVertexAttribIPointer(context, index, size, typePacked, stride, pointer))
-        {
-            context->vertexAttribIPointer(index, size, typePacked, stride, pointer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttribIPointer(context, index, size, type, stride,
+                                                          pointer);
     }
 }
 
@@ -16116,18 +14066,14 @@ void GL_APIENTRY VertexAttribPointerContextANGLE(GLeglContext ctx,
         "(GLuint index = %u, GLint size = %d, GLenum type = 0x%X, GLboolean normalized = %u, "
         "GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
         index, size, type, normalized, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(VertexAttribPointer, index, size, type, normalized, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateVertexAttribPointer(context, index, size, typePacked, normalized, stride,
-                                        pointer))
-        {
-            context->vertexAttribPointer(index, size, typePacked, normalized, stride, pointer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexAttribPointer(context, index, size, type, normalized,
+                                                         stride, pointer);
     }
 }
 
@@ -16137,16 +14083,13 @@ void GL_APIENTRY VertexBindingDivisorContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint bindingindex = %u, GLuint divisor = %u)", bindingindex, divisor);
+    ANGLE_BINARY_EVENT(VertexBindingDivisor, bindingindex, divisor);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateVertexBindingDivisor(context, bindingindex, divisor))
-        {
-            context->vertexBindingDivisor(bindingindex, divisor);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexBindingDivisor(context, bindingindex, divisor);
     }
 }
 
@@ -16161,35 +14104,28 @@ void GL_APIENTRY VertexPointerContextANGLE(GLeglContext ctx,
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(VertexPointer, size, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
-        if (context->skipValidation() ||
-            ValidateVertexPointer(context, size, typePacked, stride, pointer))
-        {
-            context->vertexPointer(size, typePacked, stride, pointer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->VertexPointer(context, size, type, stride, pointer);
     }
 }
 
 void GL_APIENTRY
 ViewportContextANGLE(GLeglContext ctx, GLint x, GLint y, GLsizei width, GLsizei height)
 {
-    ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)", x, y, width,
           height);
+    ANGLE_BINARY_EVENT(Viewport, x, y, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateViewport(context, x, y, width, height))
-        {
-            context->viewport(x, y, width, height);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->Viewport(context, x, y, width, height);
     }
 }
 
@@ -16208,18 +14144,16 @@ void GL_APIENTRY WaitSemaphoreEXTContextANGLE(GLeglContext ctx,
         ", const GLenum *srcLayouts = 0x%016" PRIxPTR ")",
         semaphore, numBufferBarriers, (uintptr_t)buffers, numTextureBarriers, (uintptr_t)textures,
         (uintptr_t)srcLayouts);
+    ANGLE_BINARY_EVENT(WaitSemaphoreEXT, semaphore, numBufferBarriers, buffers, numTextureBarriers,
+                       textures, srcLayouts);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateWaitSemaphoreEXT(context, semaphore, numBufferBarriers, buffers,
-                                     numTextureBarriers, textures, srcLayouts))
-        {
-            context->waitSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers,
-                                   textures, srcLayouts);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->WaitSemaphoreEXT(context, semaphore, numBufferBarriers,
+                                                      buffers, numTextureBarriers, textures,
+                                                      srcLayouts);
     }
 }
 
@@ -16231,15 +14165,13 @@ void GL_APIENTRY WaitSyncContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ", GLbitfield flags = 0x%X, GLuint64 timeout = %llu)",
           (uintptr_t)sync, flags, static_cast<unsigned long long>(timeout));
+    ANGLE_BINARY_EVENT(WaitSync, sync, flags, timeout);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateWaitSync(context, sync, flags, timeout))
-        {
-            context->waitSync(sync, flags, timeout);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->WaitSync(context, sync, flags, timeout);
     }
 }
 
@@ -16254,16 +14186,13 @@ void GL_APIENTRY WeightPointerOESContextANGLE(GLeglContext ctx,
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(WeightPointerOES, size, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateWeightPointerOES(context, size, type, stride, pointer))
-        {
-            context->weightPointer(size, type, stride, pointer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->WeightPointerOES(context, size, type, stride, pointer);
     }
 }
 
@@ -16275,16 +14204,13 @@ void GL_APIENTRY BindUniformLocationCHROMIUMContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, const GLchar* name = 0x%016" PRIxPTR ")",
           program, location, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(BindUniformLocationCHROMIUM, program, location, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateBindUniformLocationCHROMIUM(context, program, location, name))
-        {
-            context->bindUniformLocation(program, location, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindUniformLocationCHROMIUM(context, program, location, name);
     }
 }
 
@@ -16292,15 +14218,13 @@ void GL_APIENTRY CoverageModulationCHROMIUMContextANGLE(GLeglContext ctx, GLenum
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum components = 0x%X)", components);
+    ANGLE_BINARY_EVENT(CoverageModulationCHROMIUM, components);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateCoverageModulationCHROMIUM(context, components))
-        {
-            context->coverageModulation(components);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CoverageModulationCHROMIUM(context, components);
     }
 }
 
@@ -16311,15 +14235,13 @@ void GL_APIENTRY MatrixLoadfCHROMIUMContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum matrixMode = 0x%X, const GLfloat * matrix = 0x%016" PRIxPTR ")", matrixMode,
           (uintptr_t)matrix);
+    ANGLE_BINARY_EVENT(MatrixLoadfCHROMIUM, matrixMode, matrix);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateMatrixLoadfCHROMIUM(context, matrixMode, matrix))
-        {
-            context->matrixLoadf(matrixMode, matrix);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MatrixLoadfCHROMIUM(context, matrixMode, matrix);
     }
 }
 
@@ -16327,15 +14249,13 @@ void GL_APIENTRY MatrixLoadIdentityCHROMIUMContextANGLE(GLeglContext ctx, GLenum
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum matrixMode = 0x%X)", matrixMode);
+    ANGLE_BINARY_EVENT(MatrixLoadIdentityCHROMIUM, matrixMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateMatrixLoadIdentityCHROMIUM(context, matrixMode))
-        {
-            context->matrixLoadIdentity(matrixMode);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MatrixLoadIdentityCHROMIUM(context, matrixMode);
     }
 }
 
@@ -16343,15 +14263,13 @@ GLuint GL_APIENTRY GenPathsCHROMIUMContextANGLE(GLeglContext ctx, GLsizei range)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei range = %d)", range);
+    ANGLE_BINARY_EVENT(GenPathsCHROMIUM, range);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGenPathsCHROMIUM(context, range))
-        {
-            return context->genPaths(range);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->GenPathsCHROMIUM(context, range);
     }
 
     return GetDefaultReturnValue<EntryPoint::GenPathsCHROMIUM, GLuint>();
@@ -16361,15 +14279,13 @@ void GL_APIENTRY DeletePathsCHROMIUMContextANGLE(GLeglContext ctx, GLuint first,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint first = %u, GLsizei range = %d)", first, range);
+    ANGLE_BINARY_EVENT(DeletePathsCHROMIUM, first, range);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateDeletePathsCHROMIUM(context, first, range))
-        {
-            context->deletePaths(first, range);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->DeletePathsCHROMIUM(context, first, range);
     }
 }
 
@@ -16377,15 +14293,13 @@ GLboolean GL_APIENTRY IsPathCHROMIUMContextANGLE(GLeglContext ctx, GLuint path)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u)", path);
+    ANGLE_BINARY_EVENT(IsPathCHROMIUM, path);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateIsPathCHROMIUM(context, path))
-        {
-            return context->isPath(path);
-        }
+        ASSERT(context == GetGlobalContext());
+        return context->getDispatchTable()->IsPathCHROMIUM(context, path);
     }
 
     return GetDefaultReturnValue<EntryPoint::IsPathCHROMIUM, GLboolean>();
@@ -16404,17 +14318,15 @@ void GL_APIENTRY PathCommandsCHROMIUMContextANGLE(GLeglContext ctx,
           ", GLsizei numCoords = %d, GLenum coordType = 0x%X, const void* coords = 0x%016" PRIxPTR
           ")",
           path, numCommands, (uintptr_t)commands, numCoords, coordType, (uintptr_t)coords);
+    ANGLE_BINARY_EVENT(PathCommandsCHROMIUM, path, numCommands, commands, numCoords, coordType,
+                       coords);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidatePathCommandsCHROMIUM(context, path, numCommands, commands, numCoords, coordType,
-                                         coords))
-        {
-            context->pathCommands(path, numCommands, commands, numCoords, coordType, coords);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PathCommandsCHROMIUM(context, path, numCommands, commands,
+                                                          numCoords, coordType, coords);
     }
 }
 
@@ -16425,16 +14337,13 @@ void GL_APIENTRY PathParameterfCHROMIUMContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLfloat value = %f)", path, pname, value);
+    ANGLE_BINARY_EVENT(PathParameterfCHROMIUM, path, pname, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidatePathParameterfCHROMIUM(context, path, pname, value))
-        {
-            context->pathParameterf(path, pname, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PathParameterfCHROMIUM(context, path, pname, value);
     }
 }
 
@@ -16445,16 +14354,13 @@ void GL_APIENTRY PathParameteriCHROMIUMContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLint value = %d)", path, pname, value);
+    ANGLE_BINARY_EVENT(PathParameteriCHROMIUM, path, pname, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidatePathParameteriCHROMIUM(context, path, pname, value))
-        {
-            context->pathParameteri(path, pname, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PathParameteriCHROMIUM(context, path, pname, value);
     }
 }
 
@@ -16466,16 +14372,13 @@ void GL_APIENTRY GetPathParameterfvCHROMIUMContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLfloat * value = 0x%016" PRIxPTR ")", path,
           pname, (uintptr_t)value);
+    ANGLE_BINARY_EVENT(GetPathParameterfvCHROMIUM, path, pname, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetPathParameterfvCHROMIUM(context, path, pname, value))
-        {
-            context->getPathParameterfv(path, pname, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetPathParameterfvCHROMIUM(context, path, pname, value);
     }
 }
 
@@ -16487,16 +14390,13 @@ void GL_APIENTRY GetPathParameterivCHROMIUMContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLint * value = 0x%016" PRIxPTR ")", path, pname,
           (uintptr_t)value);
+    ANGLE_BINARY_EVENT(GetPathParameterivCHROMIUM, path, pname, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetPathParameterivCHROMIUM(context, path, pname, value))
-        {
-            context->getPathParameteriv(path, pname, value);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetPathParameterivCHROMIUM(context, path, pname, value);
     }
 }
 
@@ -16507,15 +14407,13 @@ void GL_APIENTRY PathStencilFuncCHROMIUMContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)", func, ref, mask);
+    ANGLE_BINARY_EVENT(PathStencilFuncCHROMIUM, func, ref, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidatePathStencilFuncCHROMIUM(context, func, ref, mask))
-        {
-            context->pathStencilFunc(func, ref, mask);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->PathStencilFuncCHROMIUM(context, func, ref, mask);
     }
 }
 
@@ -16526,16 +14424,13 @@ void GL_APIENTRY StencilFillPathCHROMIUMContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum fillMode = 0x%X, GLuint mask = %u)", path, fillMode, mask);
+    ANGLE_BINARY_EVENT(StencilFillPathCHROMIUM, path, fillMode, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateStencilFillPathCHROMIUM(context, path, fillMode, mask))
-        {
-            context->stencilFillPath(path, fillMode, mask);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilFillPathCHROMIUM(context, path, fillMode, mask);
     }
 }
 
@@ -16546,16 +14441,13 @@ void GL_APIENTRY StencilStrokePathCHROMIUMContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLint reference = %d, GLuint mask = %u)", path, reference, mask);
+    ANGLE_BINARY_EVENT(StencilStrokePathCHROMIUM, path, reference, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateStencilStrokePathCHROMIUM(context, path, reference, mask))
-        {
-            context->stencilStrokePath(path, reference, mask);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilStrokePathCHROMIUM(context, path, reference, mask);
     }
 }
 
@@ -16563,15 +14455,13 @@ void GL_APIENTRY CoverFillPathCHROMIUMContextANGLE(GLeglContext ctx, GLuint path
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum coverMode = 0x%X)", path, coverMode);
+    ANGLE_BINARY_EVENT(CoverFillPathCHROMIUM, path, coverMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateCoverFillPathCHROMIUM(context, path, coverMode))
-        {
-            context->coverFillPath(path, coverMode);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CoverFillPathCHROMIUM(context, path, coverMode);
     }
 }
 
@@ -16581,15 +14471,13 @@ void GL_APIENTRY CoverStrokePathCHROMIUMContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum coverMode = 0x%X)", path, coverMode);
+    ANGLE_BINARY_EVENT(CoverStrokePathCHROMIUM, path, coverMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateCoverStrokePathCHROMIUM(context, path, coverMode))
-        {
-            context->coverStrokePath(path, coverMode);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CoverStrokePathCHROMIUM(context, path, coverMode);
     }
 }
 
@@ -16602,16 +14490,14 @@ void GL_APIENTRY StencilThenCoverFillPathCHROMIUMContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum fillMode = 0x%X, GLuint mask = %u, GLenum coverMode = 0x%X)",
           path, fillMode, mask, coverMode);
+    ANGLE_BINARY_EVENT(StencilThenCoverFillPathCHROMIUM, path, fillMode, mask, coverMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateStencilThenCoverFillPathCHROMIUM(context, path, fillMode, mask, coverMode))
-        {
-            context->stencilThenCoverFillPath(path, fillMode, mask, coverMode);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilThenCoverFillPathCHROMIUM(context, path, fillMode, mask,
+                                                                      coverMode);
     }
 }
 
@@ -16624,16 +14510,14 @@ void GL_APIENTRY StencilThenCoverStrokePathCHROMIUMContextANGLE(GLeglContext ctx
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLint reference = %d, GLuint mask = %u, GLenum coverMode = 0x%X)",
           path, reference, mask, coverMode);
+    ANGLE_BINARY_EVENT(StencilThenCoverStrokePathCHROMIUM, path, reference, mask, coverMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateStencilThenCoverStrokePathCHROMIUM(context, path, reference, mask, coverMode))
-        {
-            context->stencilThenCoverStrokePath(path, reference, mask, coverMode);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilThenCoverStrokePathCHROMIUM(context, path, reference,
+                                                                        mask, coverMode);
     }
 }
 
@@ -16652,18 +14536,16 @@ void GL_APIENTRY CoverFillPathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
           "GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPath, pathNameType, (uintptr_t)paths, pathBase, coverMode, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_EVENT(CoverFillPathInstancedCHROMIUM, numPath, pathNameType, paths, pathBase,
+                       coverMode, transformType, transformValues);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateCoverFillPathInstancedCHROMIUM(context, numPath, pathNameType, paths, pathBase,
-                                                   coverMode, transformType, transformValues))
-        {
-            context->coverFillPathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
-                                            transformType, transformValues);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CoverFillPathInstancedCHROMIUM(context, numPath, pathNameType,
+                                                                    paths, pathBase, coverMode,
+                                                                    transformType, transformValues);
     }
 }
 
@@ -16682,18 +14564,16 @@ void GL_APIENTRY CoverStrokePathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
           "GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPath, pathNameType, (uintptr_t)paths, pathBase, coverMode, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_EVENT(CoverStrokePathInstancedCHROMIUM, numPath, pathNameType, paths, pathBase,
+                       coverMode, transformType, transformValues);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateCoverStrokePathInstancedCHROMIUM(
-                                             context, numPath, pathNameType, paths, pathBase,
-                                             coverMode, transformType, transformValues))
-        {
-            context->coverStrokePathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
-                                              transformType, transformValues);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CoverStrokePathInstancedCHROMIUM(
+            context, numPath, pathNameType, paths, pathBase, coverMode, transformType,
+            transformValues);
     }
 }
 
@@ -16713,18 +14593,16 @@ void GL_APIENTRY StencilStrokePathInstancedCHROMIUMContextANGLE(GLeglContext ctx
           "0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPath, pathNameType, (uintptr_t)paths, pathBase, reference, mask, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_EVENT(StencilStrokePathInstancedCHROMIUM, numPath, pathNameType, paths, pathBase,
+                       reference, mask, transformType, transformValues);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateStencilStrokePathInstancedCHROMIUM(
-                                             context, numPath, pathNameType, paths, pathBase,
-                                             reference, mask, transformType, transformValues))
-        {
-            context->stencilStrokePathInstanced(numPath, pathNameType, paths, pathBase, reference,
-                                                mask, transformType, transformValues);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilStrokePathInstancedCHROMIUM(
+            context, numPath, pathNameType, paths, pathBase, reference, mask, transformType,
+            transformValues);
     }
 }
 
@@ -16744,18 +14622,16 @@ void GL_APIENTRY StencilFillPathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
           "= 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPaths, pathNameType, (uintptr_t)paths, pathBase, fillMode, mask, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_EVENT(StencilFillPathInstancedCHROMIUM, numPaths, pathNameType, paths, pathBase,
+                       fillMode, mask, transformType, transformValues);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateStencilFillPathInstancedCHROMIUM(
-                                             context, numPaths, pathNameType, paths, pathBase,
-                                             fillMode, mask, transformType, transformValues))
-        {
-            context->stencilFillPathInstanced(numPaths, pathNameType, paths, pathBase, fillMode,
-                                              mask, transformType, transformValues);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilFillPathInstancedCHROMIUM(
+            context, numPaths, pathNameType, paths, pathBase, fillMode, mask, transformType,
+            transformValues);
     }
 }
 
@@ -16777,20 +14653,16 @@ StencilThenCoverFillPathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
           "0x%X, GLenum transformType = 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPaths, pathNameType, (uintptr_t)paths, pathBase, fillMode, mask, coverMode,
           transformType, (uintptr_t)transformValues);
+    ANGLE_BINARY_EVENT(StencilThenCoverFillPathInstancedCHROMIUM, numPaths, pathNameType, paths,
+                       pathBase, fillMode, mask, coverMode, transformType, transformValues);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateStencilThenCoverFillPathInstancedCHROMIUM(
-                context, numPaths, pathNameType, paths, pathBase, fillMode, mask, coverMode,
-                transformType, transformValues))
-        {
-            context->stencilThenCoverFillPathInstanced(numPaths, pathNameType, paths, pathBase,
-                                                       fillMode, mask, coverMode, transformType,
-                                                       transformValues);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilThenCoverFillPathInstancedCHROMIUM(
+            context, numPaths, pathNameType, paths, pathBase, fillMode, mask, coverMode,
+            transformType, transformValues);
     }
 }
 
@@ -16812,20 +14684,16 @@ StencilThenCoverStrokePathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
           "0x%X, GLenum transformType = 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPaths, pathNameType, (uintptr_t)paths, pathBase, reference, mask, coverMode,
           transformType, (uintptr_t)transformValues);
+    ANGLE_BINARY_EVENT(StencilThenCoverStrokePathInstancedCHROMIUM, numPaths, pathNameType, paths,
+                       pathBase, reference, mask, coverMode, transformType, transformValues);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateStencilThenCoverStrokePathInstancedCHROMIUM(
-                context, numPaths, pathNameType, paths, pathBase, reference, mask, coverMode,
-                transformType, transformValues))
-        {
-            context->stencilThenCoverStrokePathInstanced(numPaths, pathNameType, paths, pathBase,
-                                                         reference, mask, coverMode, transformType,
-                                                         transformValues);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->StencilThenCoverStrokePathInstancedCHROMIUM(
+            context, numPaths, pathNameType, paths, pathBase, reference, mask, coverMode,
+            transformType, transformValues);
     }
 }
 
@@ -16837,16 +14705,14 @@ void GL_APIENTRY BindFragmentInputLocationCHROMIUMContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint programs = %u, GLint location = %d, const GLchar * name = 0x%016" PRIxPTR ")",
           programs, location, (uintptr_t)name);
+    ANGLE_BINARY_EVENT(BindFragmentInputLocationCHROMIUM, programs, location, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateBindFragmentInputLocationCHROMIUM(context, programs, location, name))
-        {
-            context->bindFragmentInputLocation(programs, location, name);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->BindFragmentInputLocationCHROMIUM(context, programs, location,
+                                                                       name);
     }
 }
 
@@ -16862,17 +14728,15 @@ void GL_APIENTRY ProgramPathFragmentInputGenCHROMIUMContextANGLE(GLeglContext ct
         "(GLuint program = %u, GLint location = %d, GLenum genMode = 0x%X, GLint components = %d, "
         "const GLfloat * coeffs = 0x%016" PRIxPTR ")",
         program, location, genMode, components, (uintptr_t)coeffs);
+    ANGLE_BINARY_EVENT(ProgramPathFragmentInputGenCHROMIUM, program, location, genMode, components,
+                       coeffs);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateProgramPathFragmentInputGenCHROMIUM(context, program, location, genMode,
-                                                        components, coeffs))
-        {
-            context->programPathFragmentInputGen(program, location, genMode, components, coeffs);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProgramPathFragmentInputGenCHROMIUM(
+            context, program, location, genMode, components, coeffs);
     }
 }
 
@@ -16896,21 +14760,17 @@ void GL_APIENTRY CopyTextureCHROMIUMContextANGLE(GLeglContext ctx,
         "= %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, internalFormat, destType, unpackFlipY,
         unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_EVENT(CopyTextureCHROMIUM, sourceId, sourceLevel, destTarget, destId, destLevel,
+                       internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                       unpackUnmultiplyAlpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
-        if (context->skipValidation() ||
-            ValidateCopyTextureCHROMIUM(context, sourceId, sourceLevel, destTargetPacked, destId,
-                                        destLevel, internalFormat, destType, unpackFlipY,
-                                        unpackPremultiplyAlpha, unpackUnmultiplyAlpha))
-        {
-            context->copyTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
-                                 internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
-                                 unpackUnmultiplyAlpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CopyTextureCHROMIUM(
+            context, sourceId, sourceLevel, destTarget, destId, destLevel, internalFormat, destType,
+            unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
     }
 }
 
@@ -16938,22 +14798,17 @@ void GL_APIENTRY CopySubTextureCHROMIUMContextANGLE(GLeglContext ctx,
         "unpackPremultiplyAlpha = %u, GLboolean unpackUnmultiplyAlpha = %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, xoffset, yoffset, x, y, width, height,
         unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_EVENT(CopySubTextureCHROMIUM, sourceId, sourceLevel, destTarget, destId, destLevel,
+                       xoffset, yoffset, x, y, width, height, unpackFlipY, unpackPremultiplyAlpha,
+                       unpackUnmultiplyAlpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
-        if (context->skipValidation() ||
-            ValidateCopySubTextureCHROMIUM(context, sourceId, sourceLevel, destTargetPacked, destId,
-                                           destLevel, xoffset, yoffset, x, y, width, height,
-                                           unpackFlipY, unpackPremultiplyAlpha,
-                                           unpackUnmultiplyAlpha))
-        {
-            context->copySubTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
-                                    xoffset, yoffset, x, y, width, height, unpackFlipY,
-                                    unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CopySubTextureCHROMIUM(
+            context, sourceId, sourceLevel, destTarget, destId, destLevel, xoffset, yoffset, x, y,
+            width, height, unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
     }
 }
 
@@ -16963,16 +14818,13 @@ void GL_APIENTRY CompressedCopyTextureCHROMIUMContextANGLE(GLeglContext ctx,
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sourceId = %u, GLuint destId = %u)", sourceId, destId);
+    ANGLE_BINARY_EVENT(CompressedCopyTextureCHROMIUM, sourceId, destId);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateCompressedCopyTextureCHROMIUM(context, sourceId, destId))
-        {
-            context->compressedCopyTexture(sourceId, destId);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CompressedCopyTextureCHROMIUM(context, sourceId, destId);
     }
 }
 
@@ -16980,15 +14832,13 @@ void GL_APIENTRY RequestExtensionANGLEContextANGLE(GLeglContext ctx, const GLcha
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLchar * name = 0x%016" PRIxPTR ")", (uintptr_t)name);
+    ANGLE_BINARY_EVENT(RequestExtensionANGLE, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateRequestExtensionANGLE(context, name))
-        {
-            context->requestExtension(name);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->RequestExtensionANGLE(context, name);
     }
 }
 
@@ -17002,16 +14852,14 @@ void GL_APIENTRY GetBooleanvRobustANGLEContextANGLE(GLeglContext ctx,
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLboolean * params = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBooleanvRobustANGLE, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetBooleanvRobustANGLE(context, pname, bufSize, length, params))
-        {
-            context->getBooleanvRobust(pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetBooleanvRobustANGLE(context, pname, bufSize, length,
+                                                            params);
     }
 }
 
@@ -17027,17 +14875,14 @@ void GL_APIENTRY GetBufferParameterivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferParameterivRobustANGLE, target, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateGetBufferParameterivRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getBufferParameterivRobust(targetPacked, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetBufferParameterivRobustANGLE(context, target, pname,
+                                                                     bufSize, length, params);
     }
 }
 
@@ -17051,16 +14896,13 @@ void GL_APIENTRY GetFloatvRobustANGLEContextANGLE(GLeglContext ctx,
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLfloat * params = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFloatvRobustANGLE, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetFloatvRobustANGLE(context, pname, bufSize, length, params))
-        {
-            context->getFloatvRobust(pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetFloatvRobustANGLE(context, pname, bufSize, length, params);
     }
 }
 
@@ -17077,18 +14919,15 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivRobustANGLEContextANGLE(GLeg
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = "
         "%d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, attachment, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFramebufferAttachmentParameterivRobustANGLE, target, attachment, pname,
+                       bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetFramebufferAttachmentParameterivRobustANGLE(context, target, attachment,
-                                                                   pname, bufSize, length, params))
-        {
-            context->getFramebufferAttachmentParameterivRobust(target, attachment, pname, bufSize,
-                                                               length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetFramebufferAttachmentParameterivRobustANGLE(
+            context, target, attachment, pname, bufSize, length, params);
     }
 }
 
@@ -17102,16 +14941,13 @@ void GL_APIENTRY GetIntegervRobustANGLEContextANGLE(GLeglContext ctx,
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLint * data = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetIntegervRobustANGLE, pname, bufSize, length, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetIntegervRobustANGLE(context, pname, bufSize, length, data))
-        {
-            context->getIntegervRobust(pname, bufSize, length, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetIntegervRobustANGLE(context, pname, bufSize, length, data);
     }
 }
 
@@ -17127,16 +14963,14 @@ void GL_APIENTRY GetProgramivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetProgramivRobustANGLE, program, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramivRobustANGLE(context, program, pname, bufSize, length, params))
-        {
-            context->getProgramivRobust(program, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetProgramivRobustANGLE(context, program, pname, bufSize,
+                                                             length, params);
     }
 }
 
@@ -17152,16 +14986,15 @@ void GL_APIENTRY GetRenderbufferParameterivRobustANGLEContextANGLE(GLeglContext
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetRenderbufferParameterivRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetRenderbufferParameterivRobustANGLE(
-                                             context, target, pname, bufSize, length, params))
-        {
-            context->getRenderbufferParameterivRobust(target, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetRenderbufferParameterivRobustANGLE(context, target, pname,
+                                                                           bufSize, length, params);
     }
 }
 
@@ -17177,16 +15010,14 @@ void GL_APIENTRY GetShaderivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint shader = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         shader, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetShaderivRobustANGLE, shader, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetShaderivRobustANGLE(context, shader, pname, bufSize, length, params))
-        {
-            context->getShaderivRobust(shader, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetShaderivRobustANGLE(context, shader, pname, bufSize, length,
+                                                            params);
     }
 }
 
@@ -17202,17 +15033,14 @@ void GL_APIENTRY GetTexParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterfvRobustANGLE, target, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateGetTexParameterfvRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getTexParameterfvRobust(targetPacked, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexParameterfvRobustANGLE(context, target, pname, bufSize,
+                                                                  length, params);
     }
 }
 
@@ -17228,17 +15056,14 @@ void GL_APIENTRY GetTexParameterivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterivRobustANGLE, target, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateGetTexParameterivRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getTexParameterivRobust(targetPacked, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexParameterivRobustANGLE(context, target, pname, bufSize,
+                                                                  length, params);
     }
 }
 
@@ -17254,16 +15079,14 @@ void GL_APIENTRY GetUniformfvRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetUniformfvRobustANGLE, program, location, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetUniformfvRobustANGLE(context, program, location, bufSize, length, params))
-        {
-            context->getUniformfvRobust(program, location, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetUniformfvRobustANGLE(context, program, location, bufSize,
+                                                             length, params);
     }
 }
 
@@ -17279,16 +15102,14 @@ void GL_APIENTRY GetUniformivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetUniformivRobustANGLE, program, location, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetUniformivRobustANGLE(context, program, location, bufSize, length, params))
-        {
-            context->getUniformivRobust(program, location, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetUniformivRobustANGLE(context, program, location, bufSize,
+                                                             length, params);
     }
 }
 
@@ -17304,16 +15125,14 @@ void GL_APIENTRY GetVertexAttribfvRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribfvRobustANGLE, index, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetVertexAttribfvRobustANGLE(context, index, pname, bufSize, length, params))
-        {
-            context->getVertexAttribfvRobust(index, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetVertexAttribfvRobustANGLE(context, index, pname, bufSize,
+                                                                  length, params);
     }
 }
 
@@ -17329,16 +15148,14 @@ void GL_APIENTRY GetVertexAttribivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribivRobustANGLE, index, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetVertexAttribivRobustANGLE(context, index, pname, bufSize, length, params))
-        {
-            context->getVertexAttribivRobust(index, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetVertexAttribivRobustANGLE(context, index, pname, bufSize,
+                                                                  length, params);
     }
 }
 
@@ -17354,16 +15171,14 @@ void GL_APIENTRY GetVertexAttribPointervRobustANGLEContextANGLE(GLeglContext ctx
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", void ** pointer = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)pointer);
+    ANGLE_BINARY_EVENT(GetVertexAttribPointervRobustANGLE, index, pname, bufSize, length, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetVertexAttribPointervRobustANGLE(
-                                             context, index, pname, bufSize, length, pointer))
-        {
-            context->getVertexAttribPointervRobust(index, pname, bufSize, length, pointer);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetVertexAttribPointervRobustANGLE(context, index, pname,
+                                                                        bufSize, length, pointer);
     }
 }
 
@@ -17388,18 +15203,15 @@ void GL_APIENTRY ReadPixelsRobustANGLEContextANGLE(GLeglContext ctx,
         ", void * pixels = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, bufSize, (uintptr_t)length, (uintptr_t)columns,
         (uintptr_t)rows, (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(ReadPixelsRobustANGLE, x, y, width, height, format, type, bufSize, length,
+                       columns, rows, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateReadPixelsRobustANGLE(context, x, y, width, height, format, type, bufSize,
-                                          length, columns, rows, pixels))
-        {
-            context->readPixelsRobust(x, y, width, height, format, type, bufSize, length, columns,
-                                      rows, pixels);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ReadPixelsRobustANGLE(
+            context, x, y, width, height, format, type, bufSize, length, columns, rows, pixels);
     }
 }
 
@@ -17422,19 +15234,16 @@ void GL_APIENTRY TexImage2DRobustANGLEContextANGLE(GLeglContext ctx,
         "bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, format, type, bufSize,
         (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexImage2DRobustANGLE, target, level, internalformat, width, height, border,
+                       format, type, bufSize, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexImage2DRobustANGLE(context, targetPacked, level, internalformat, width,
-                                          height, border, format, type, bufSize, pixels))
-        {
-            context->texImage2DRobust(targetPacked, level, internalformat, width, height, border,
-                                      format, type, bufSize, pixels);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexImage2DRobustANGLE(context, target, level, internalformat,
+                                                           width, height, border, format, type,
+                                                           bufSize, pixels);
     }
 }
 
@@ -17449,17 +15258,14 @@ void GL_APIENTRY TexParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLfloat * params "
         "= 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterfvRobustANGLE, target, pname, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterfvRobustANGLE(context, targetPacked, pname, bufSize, params))
-        {
-            context->texParameterfvRobust(targetPacked, pname, bufSize, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexParameterfvRobustANGLE(context, target, pname, bufSize,
+                                                               params);
     }
 }
 
@@ -17474,17 +15280,14 @@ void GL_APIENTRY TexParameterivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLint * params = "
         "0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterivRobustANGLE, target, pname, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterivRobustANGLE(context, targetPacked, pname, bufSize, params))
-        {
-            context->texParameterivRobust(targetPacked, pname, bufSize, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexParameterivRobustANGLE(context, target, pname, bufSize,
+                                                               params);
     }
 }
 
@@ -17506,19 +15309,15 @@ void GL_APIENTRY TexSubImage2DRobustANGLEContextANGLE(GLeglContext ctx,
         "width = %d, GLsizei height = %d, GLenum format = 0x%X, GLenum type = 0x%X, GLsizei "
         "bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, type, bufSize, (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexSubImage2DRobustANGLE, target, level, xoffset, yoffset, width, height,
+                       format, type, bufSize, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexSubImage2DRobustANGLE(context, targetPacked, level, xoffset, yoffset, width,
-                                             height, format, type, bufSize, pixels))
-        {
-            context->texSubImage2DRobust(targetPacked, level, xoffset, yoffset, width, height,
-                                         format, type, bufSize, pixels);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexSubImage2DRobustANGLE(
+            context, target, level, xoffset, yoffset, width, height, format, type, bufSize, pixels);
     }
 }
 
@@ -17542,19 +15341,16 @@ void GL_APIENTRY TexImage3DRobustANGLEContextANGLE(GLeglContext ctx,
         "type = 0x%X, GLsizei bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, format, type, bufSize,
         (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexImage3DRobustANGLE, target, level, internalformat, width, height, depth,
+                       border, format, type, bufSize, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexImage3DRobustANGLE(context, targetPacked, level, internalformat, width,
-                                          height, depth, border, format, type, bufSize, pixels))
-        {
-            context->texImage3DRobust(targetPacked, level, internalformat, width, height, depth,
-                                      border, format, type, bufSize, pixels);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexImage3DRobustANGLE(context, target, level, internalformat,
+                                                           width, height, depth, border, format,
+                                                           type, bufSize, pixels);
     }
 }
 
@@ -17580,20 +15376,16 @@ void GL_APIENTRY TexSubImage3DRobustANGLEContextANGLE(GLeglContext ctx,
         ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, type, bufSize,
         (uintptr_t)pixels);
+    ANGLE_BINARY_EVENT(TexSubImage3DRobustANGLE, target, level, xoffset, yoffset, zoffset, width,
+                       height, depth, format, type, bufSize, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateTexSubImage3DRobustANGLE(context, targetPacked, level, xoffset, yoffset,
-                                             zoffset, width, height, depth, format, type, bufSize,
-                                             pixels))
-        {
-            context->texSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset, width,
-                                         height, depth, format, type, bufSize, pixels);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexSubImage3DRobustANGLE(context, target, level, xoffset,
+                                                              yoffset, zoffset, width, height,
+                                                              depth, format, type, bufSize, pixels);
     }
 }
 
@@ -17614,19 +15406,16 @@ void GL_APIENTRY CompressedTexImage2DRobustANGLEContextANGLE(GLeglContext ctx,
         "%d, GLsizei height = %d, GLint border = %d, GLsizei imageSize = %d, GLsizei dataSize = "
         "%d, const GLvoid * data = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, imageSize, dataSize, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexImage2DRobustANGLE, target, level, internalformat, width,
+                       height, border, imageSize, dataSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() || ValidateCompressedTexImage2DRobustANGLE(
-                                             context, targetPacked, level, internalformat, width,
-                                             height, border, imageSize, dataSize, data))
-        {
-            context->compressedTexImage2DRobust(targetPacked, level, internalformat, width, height,
-                                                border, imageSize, dataSize, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CompressedTexImage2DRobustANGLE(
+            context, target, level, internalformat, width, height, border, imageSize, dataSize,
+            data);
     }
 }
 
@@ -17649,19 +15438,16 @@ void GL_APIENTRY CompressedTexSubImage2DRobustANGLEContextANGLE(GLeglContext ctx
         "GLsizei dataSize = %d, const GLvoid * data = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, imageSize, dataSize,
         (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexSubImage2DRobustANGLE, target, level, xoffset, yoffset, width,
+                       height, format, imageSize, dataSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() || ValidateCompressedTexSubImage2DRobustANGLE(
-                                             context, targetPacked, level, xoffset, yoffset, width,
-                                             height, format, imageSize, dataSize, data))
-        {
-            context->compressedTexSubImage2DRobust(targetPacked, level, xoffset, yoffset, width,
-                                                   height, format, imageSize, dataSize, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CompressedTexSubImage2DRobustANGLE(
+            context, target, level, xoffset, yoffset, width, height, format, imageSize, dataSize,
+            data);
     }
 }
 
@@ -17684,19 +15470,16 @@ void GL_APIENTRY CompressedTexImage3DRobustANGLEContextANGLE(GLeglContext ctx,
         "GLsizei dataSize = %d, const GLvoid * data = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, imageSize, dataSize,
         (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexImage3DRobustANGLE, target, level, internalformat, width,
+                       height, depth, border, imageSize, dataSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() || ValidateCompressedTexImage3DRobustANGLE(
-                                             context, targetPacked, level, internalformat, width,
-                                             height, depth, border, imageSize, dataSize, data))
-        {
-            context->compressedTexImage3DRobust(targetPacked, level, internalformat, width, height,
-                                                depth, border, imageSize, dataSize, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CompressedTexImage3DRobustANGLE(
+            context, target, level, internalformat, width, height, depth, border, imageSize,
+            dataSize, data);
     }
 }
 
@@ -17722,21 +15505,16 @@ void GL_APIENTRY CompressedTexSubImage3DRobustANGLEContextANGLE(GLeglContext ctx
         "0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, imageSize, dataSize,
         (uintptr_t)data);
+    ANGLE_BINARY_EVENT(CompressedTexSubImage3DRobustANGLE, target, level, xoffset, yoffset, zoffset,
+                       width, height, depth, format, imageSize, dataSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateCompressedTexSubImage3DRobustANGLE(context, targetPacked, level, xoffset,
-                                                       yoffset, zoffset, width, height, depth,
-                                                       format, imageSize, dataSize, data))
-        {
-            context->compressedTexSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset,
-                                                   width, height, depth, format, imageSize,
-                                                   dataSize, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CompressedTexSubImage3DRobustANGLE(
+            context, target, level, xoffset, yoffset, zoffset, width, height, depth, format,
+            imageSize, dataSize, data);
     }
 }
 
@@ -17752,17 +15530,14 @@ void GL_APIENTRY GetQueryivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryivRobustANGLE, target, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        QueryType targetPacked = FromGLenum<QueryType>(target);
-        if (context->skipValidation() ||
-            ValidateGetQueryivRobustANGLE(context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getQueryivRobust(targetPacked, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetQueryivRobustANGLE(context, target, pname, bufSize, length,
+                                                           params);
     }
 }
 
@@ -17778,16 +15553,14 @@ void GL_APIENTRY GetQueryObjectuivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectuivRobustANGLE, id, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetQueryObjectuivRobustANGLE(context, id, pname, bufSize, length, params))
-        {
-            context->getQueryObjectuivRobust(id, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetQueryObjectuivRobustANGLE(context, id, pname, bufSize,
+                                                                  length, params);
     }
 }
 
@@ -17803,17 +15576,14 @@ void GL_APIENTRY GetBufferPointervRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", void ** params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferPointervRobustANGLE, target, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateGetBufferPointervRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getBufferPointervRobust(targetPacked, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetBufferPointervRobustANGLE(context, target, pname, bufSize,
+                                                                  length, params);
     }
 }
 
@@ -17829,16 +15599,14 @@ void GL_APIENTRY GetIntegeri_vRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * data = 0x%016" PRIxPTR ")",
         target, index, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetIntegeri_vRobustANGLE, target, index, bufSize, length, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetIntegeri_vRobustANGLE(context, target, index, bufSize, length, data))
-        {
-            context->getIntegeri_vRobust(target, index, bufSize, length, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetIntegeri_vRobustANGLE(context, target, index, bufSize,
+                                                              length, data);
     }
 }
 
@@ -17855,18 +15623,15 @@ void GL_APIENTRY GetInternalformativRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLenum pname = 0x%X, GLsizei bufSize "
         "= %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, internalformat, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetInternalformativRobustANGLE, target, internalformat, pname, bufSize,
+                       length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetInternalformativRobustANGLE(context, target, internalformat, pname, bufSize,
-                                                   length, params))
-        {
-            context->getInternalformativRobust(target, internalformat, pname, bufSize, length,
-                                               params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetInternalformativRobustANGLE(context, target, internalformat,
+                                                                    pname, bufSize, length, params);
     }
 }
 
@@ -17882,16 +15647,14 @@ void GL_APIENTRY GetVertexAttribIivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribIivRobustANGLE, index, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetVertexAttribIivRobustANGLE(context, index, pname, bufSize, length, params))
-        {
-            context->getVertexAttribIivRobust(index, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetVertexAttribIivRobustANGLE(context, index, pname, bufSize,
+                                                                   length, params);
     }
 }
 
@@ -17907,16 +15670,14 @@ void GL_APIENTRY GetVertexAttribIuivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetVertexAttribIuivRobustANGLE, index, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetVertexAttribIuivRobustANGLE(context, index, pname, bufSize, length, params))
-        {
-            context->getVertexAttribIuivRobust(index, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetVertexAttribIuivRobustANGLE(context, index, pname, bufSize,
+                                                                    length, params);
     }
 }
 
@@ -17932,16 +15693,14 @@ void GL_APIENTRY GetUniformuivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetUniformuivRobustANGLE, program, location, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetUniformuivRobustANGLE(context, program, location, bufSize, length, params))
-        {
-            context->getUniformuivRobust(program, location, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetUniformuivRobustANGLE(context, program, location, bufSize,
+                                                              length, params);
     }
 }
 
@@ -17958,18 +15717,15 @@ void GL_APIENTRY GetActiveUniformBlockivRobustANGLEContextANGLE(GLeglContext ctx
         "(GLuint program = %u, GLuint uniformBlockIndex = %u, GLenum pname = 0x%X, GLsizei bufSize "
         "= %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, uniformBlockIndex, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetActiveUniformBlockivRobustANGLE, program, uniformBlockIndex, pname,
+                       bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetActiveUniformBlockivRobustANGLE(context, program, uniformBlockIndex, pname,
-                                                       bufSize, length, params))
-        {
-            context->getActiveUniformBlockivRobust(program, uniformBlockIndex, pname, bufSize,
-                                                   length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetActiveUniformBlockivRobustANGLE(
+            context, program, uniformBlockIndex, pname, bufSize, length, params);
     }
 }
 
@@ -17983,16 +15739,14 @@ void GL_APIENTRY GetInteger64vRobustANGLEContextANGLE(GLeglContext ctx,
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLint64 * data = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetInteger64vRobustANGLE, pname, bufSize, length, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetInteger64vRobustANGLE(context, pname, bufSize, length, data))
-        {
-            context->getInteger64vRobust(pname, bufSize, length, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetInteger64vRobustANGLE(context, pname, bufSize, length,
+                                                              data);
     }
 }
 
@@ -18008,16 +15762,14 @@ void GL_APIENTRY GetInteger64i_vRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint64 * data = 0x%016" PRIxPTR ")",
         target, index, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetInteger64i_vRobustANGLE, target, index, bufSize, length, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetInteger64i_vRobustANGLE(context, target, index, bufSize, length, data))
-        {
-            context->getInteger64i_vRobust(target, index, bufSize, length, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetInteger64i_vRobustANGLE(context, target, index, bufSize,
+                                                                length, data);
     }
 }
 
@@ -18033,17 +15785,14 @@ void GL_APIENTRY GetBufferParameteri64vRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint64 * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetBufferParameteri64vRobustANGLE, target, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
-        if (context->skipValidation() || ValidateGetBufferParameteri64vRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getBufferParameteri64vRobust(targetPacked, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetBufferParameteri64vRobustANGLE(context, target, pname,
+                                                                       bufSize, length, params);
     }
 }
 
@@ -18058,16 +15807,14 @@ void GL_APIENTRY SamplerParameterivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint sampler = %u, GLuint pname = %u, GLsizei bufSize = %d, const GLint * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterivRobustANGLE, sampler, pname, bufSize, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateSamplerParameterivRobustANGLE(context, sampler, pname, bufSize, param))
-        {
-            context->samplerParameterivRobust(sampler, pname, bufSize, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SamplerParameterivRobustANGLE(context, sampler, pname, bufSize,
+                                                                   param);
     }
 }
 
@@ -18082,16 +15829,14 @@ void GL_APIENTRY SamplerParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLfloat * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterfvRobustANGLE, sampler, pname, bufSize, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateSamplerParameterfvRobustANGLE(context, sampler, pname, bufSize, param))
-        {
-            context->samplerParameterfvRobust(sampler, pname, bufSize, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SamplerParameterfvRobustANGLE(context, sampler, pname, bufSize,
+                                                                   param);
     }
 }
 
@@ -18107,16 +15852,14 @@ void GL_APIENTRY GetSamplerParameterivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterivRobustANGLE, sampler, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetSamplerParameterivRobustANGLE(
-                                             context, sampler, pname, bufSize, length, params))
-        {
-            context->getSamplerParameterivRobust(sampler, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetSamplerParameterivRobustANGLE(context, sampler, pname,
+                                                                      bufSize, length, params);
     }
 }
 
@@ -18132,16 +15875,14 @@ void GL_APIENTRY GetSamplerParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterfvRobustANGLE, sampler, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetSamplerParameterfvRobustANGLE(
-                                             context, sampler, pname, bufSize, length, params))
-        {
-            context->getSamplerParameterfvRobust(sampler, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetSamplerParameterfvRobustANGLE(context, sampler, pname,
+                                                                      bufSize, length, params);
     }
 }
 
@@ -18157,16 +15898,15 @@ void GL_APIENTRY GetFramebufferParameterivRobustANGLEContextANGLE(GLeglContext c
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetFramebufferParameterivRobustANGLE, sampler, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetFramebufferParameterivRobustANGLE(
-                                             context, sampler, pname, bufSize, length, params))
-        {
-            context->getFramebufferParameterivRobust(sampler, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetFramebufferParameterivRobustANGLE(context, sampler, pname,
+                                                                          bufSize, length, params);
     }
 }
 
@@ -18183,18 +15923,15 @@ void GL_APIENTRY GetProgramInterfaceivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLenum pname = 0x%X, GLsizei "
         "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, programInterface, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetProgramInterfaceivRobustANGLE, program, programInterface, pname, bufSize,
+                       length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetProgramInterfaceivRobustANGLE(context, program, programInterface, pname,
-                                                     bufSize, length, params))
-        {
-            context->getProgramInterfaceivRobust(program, programInterface, pname, bufSize, length,
-                                                 params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetProgramInterfaceivRobustANGLE(
+            context, program, programInterface, pname, bufSize, length, params);
     }
 }
 
@@ -18210,16 +15947,14 @@ void GL_APIENTRY GetBooleani_vRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLboolean * data = 0x%016" PRIxPTR ")",
         target, index, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(GetBooleani_vRobustANGLE, target, index, bufSize, length, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetBooleani_vRobustANGLE(context, target, index, bufSize, length, data))
-        {
-            context->getBooleani_vRobust(target, index, bufSize, length, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetBooleani_vRobustANGLE(context, target, index, bufSize,
+                                                              length, data);
     }
 }
 
@@ -18235,16 +15970,14 @@ void GL_APIENTRY GetMultisamplefvRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum pname = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * val = 0x%016" PRIxPTR ")",
         pname, index, bufSize, (uintptr_t)length, (uintptr_t)val);
+    ANGLE_BINARY_EVENT(GetMultisamplefvRobustANGLE, pname, index, bufSize, length, val);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetMultisamplefvRobustANGLE(context, pname, index, bufSize, length, val))
-        {
-            context->getMultisamplefvRobust(pname, index, bufSize, length, val);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetMultisamplefvRobustANGLE(context, pname, index, bufSize,
+                                                                 length, val);
     }
 }
 
@@ -18261,19 +15994,15 @@ void GL_APIENTRY GetTexLevelParameterivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLsizei bufSize = %d, "
         "GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, level, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexLevelParameterivRobustANGLE, target, level, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexLevelParameterivRobustANGLE(context, targetPacked, level, pname, bufSize,
-                                                      length, params))
-        {
-            context->getTexLevelParameterivRobust(targetPacked, level, pname, bufSize, length,
-                                                  params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexLevelParameterivRobustANGLE(
+            context, target, level, pname, bufSize, length, params);
     }
 }
 
@@ -18290,19 +16019,15 @@ void GL_APIENTRY GetTexLevelParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLsizei bufSize = %d, "
         "GLsizei * length = 0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         target, level, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexLevelParameterfvRobustANGLE, target, level, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexLevelParameterfvRobustANGLE(context, targetPacked, level, pname, bufSize,
-                                                      length, params))
-        {
-            context->getTexLevelParameterfvRobust(targetPacked, level, pname, bufSize, length,
-                                                  params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexLevelParameterfvRobustANGLE(
+            context, target, level, pname, bufSize, length, params);
     }
 }
 
@@ -18316,16 +16041,14 @@ void GL_APIENTRY GetPointervRobustANGLERobustANGLEContextANGLE(GLeglContext ctx,
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", void ** params = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetPointervRobustANGLERobustANGLE, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetPointervRobustANGLERobustANGLE(context, pname, bufSize, length, params))
-        {
-            context->getPointervRobustANGLERobust(pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetPointervRobustANGLERobustANGLE(context, pname, bufSize,
+                                                                       length, params);
     }
 }
 
@@ -18350,18 +16073,15 @@ void GL_APIENTRY ReadnPixelsRobustANGLEContextANGLE(GLeglContext ctx,
         ", void * data = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, bufSize, (uintptr_t)length, (uintptr_t)columns,
         (uintptr_t)rows, (uintptr_t)data);
+    ANGLE_BINARY_EVENT(ReadnPixelsRobustANGLE, x, y, width, height, format, type, bufSize, length,
+                       columns, rows, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateReadnPixelsRobustANGLE(context, x, y, width, height, format, type, bufSize,
-                                           length, columns, rows, data))
-        {
-            context->readnPixelsRobust(x, y, width, height, format, type, bufSize, length, columns,
-                                       rows, data);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ReadnPixelsRobustANGLE(
+            context, x, y, width, height, format, type, bufSize, length, columns, rows, data);
     }
 }
 
@@ -18377,16 +16097,14 @@ void GL_APIENTRY GetnUniformfvRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetnUniformfvRobustANGLE, program, location, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetnUniformfvRobustANGLE(context, program, location, bufSize, length, params))
-        {
-            context->getnUniformfvRobust(program, location, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetnUniformfvRobustANGLE(context, program, location, bufSize,
+                                                              length, params);
     }
 }
 
@@ -18402,16 +16120,14 @@ void GL_APIENTRY GetnUniformivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetnUniformivRobustANGLE, program, location, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetnUniformivRobustANGLE(context, program, location, bufSize, length, params))
-        {
-            context->getnUniformivRobust(program, location, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetnUniformivRobustANGLE(context, program, location, bufSize,
+                                                              length, params);
     }
 }
 
@@ -18427,16 +16143,14 @@ void GL_APIENTRY GetnUniformuivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetnUniformuivRobustANGLE, program, location, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetnUniformuivRobustANGLE(context, program, location, bufSize, length, params))
-        {
-            context->getnUniformuivRobust(program, location, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetnUniformuivRobustANGLE(context, program, location, bufSize,
+                                                               length, params);
     }
 }
 
@@ -18451,17 +16165,14 @@ void GL_APIENTRY TexParameterIivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLint * params = "
         "0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterIivRobustANGLE, target, pname, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterIivRobustANGLE(context, targetPacked, pname, bufSize, params))
-        {
-            context->texParameterIivRobust(targetPacked, pname, bufSize, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexParameterIivRobustANGLE(context, target, pname, bufSize,
+                                                                params);
     }
 }
 
@@ -18476,17 +16187,14 @@ void GL_APIENTRY TexParameterIuivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLuint * params = "
         "0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(TexParameterIuivRobustANGLE, target, pname, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexParameterIuivRobustANGLE(context, targetPacked, pname, bufSize, params))
-        {
-            context->texParameterIuivRobust(targetPacked, pname, bufSize, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexParameterIuivRobustANGLE(context, target, pname, bufSize,
+                                                                 params);
     }
 }
 
@@ -18502,17 +16210,14 @@ void GL_APIENTRY GetTexParameterIivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterIivRobustANGLE, target, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateGetTexParameterIivRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getTexParameterIivRobust(targetPacked, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexParameterIivRobustANGLE(context, target, pname, bufSize,
+                                                                   length, params);
     }
 }
 
@@ -18528,17 +16233,14 @@ void GL_APIENTRY GetTexParameterIuivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexParameterIuivRobustANGLE, target, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() || ValidateGetTexParameterIuivRobustANGLE(
-                                             context, targetPacked, pname, bufSize, length, params))
-        {
-            context->getTexParameterIuivRobust(targetPacked, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexParameterIuivRobustANGLE(context, target, pname, bufSize,
+                                                                    length, params);
     }
 }
 
@@ -18553,16 +16255,14 @@ void GL_APIENTRY SamplerParameterIivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLint * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterIivRobustANGLE, sampler, pname, bufSize, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateSamplerParameterIivRobustANGLE(context, sampler, pname, bufSize, param))
-        {
-            context->samplerParameterIivRobust(sampler, pname, bufSize, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SamplerParameterIivRobustANGLE(context, sampler, pname,
+                                                                    bufSize, param);
     }
 }
 
@@ -18577,16 +16277,14 @@ void GL_APIENTRY SamplerParameterIuivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLuint * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_EVENT(SamplerParameterIuivRobustANGLE, sampler, pname, bufSize, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateSamplerParameterIuivRobustANGLE(context, sampler, pname, bufSize, param))
-        {
-            context->samplerParameterIuivRobust(sampler, pname, bufSize, param);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SamplerParameterIuivRobustANGLE(context, sampler, pname,
+                                                                     bufSize, param);
     }
 }
 
@@ -18602,16 +16300,14 @@ void GL_APIENTRY GetSamplerParameterIivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterIivRobustANGLE, sampler, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetSamplerParameterIivRobustANGLE(
-                                             context, sampler, pname, bufSize, length, params))
-        {
-            context->getSamplerParameterIivRobust(sampler, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetSamplerParameterIivRobustANGLE(context, sampler, pname,
+                                                                       bufSize, length, params);
     }
 }
 
@@ -18627,16 +16323,14 @@ void GL_APIENTRY GetSamplerParameterIuivRobustANGLEContextANGLE(GLeglContext ctx
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetSamplerParameterIuivRobustANGLE, sampler, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetSamplerParameterIuivRobustANGLE(
-                                             context, sampler, pname, bufSize, length, params))
-        {
-            context->getSamplerParameterIuivRobust(sampler, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetSamplerParameterIuivRobustANGLE(context, sampler, pname,
+                                                                        bufSize, length, params);
     }
 }
 
@@ -18652,16 +16346,14 @@ void GL_APIENTRY GetQueryObjectivRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectivRobustANGLE, id, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetQueryObjectivRobustANGLE(context, id, pname, bufSize, length, params))
-        {
-            context->getQueryObjectivRobust(id, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetQueryObjectivRobustANGLE(context, id, pname, bufSize,
+                                                                 length, params);
     }
 }
 
@@ -18677,16 +16369,14 @@ void GL_APIENTRY GetQueryObjecti64vRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint64 * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjecti64vRobustANGLE, id, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetQueryObjecti64vRobustANGLE(context, id, pname, bufSize, length, params))
-        {
-            context->getQueryObjecti64vRobust(id, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetQueryObjecti64vRobustANGLE(context, id, pname, bufSize,
+                                                                   length, params);
     }
 }
 
@@ -18702,16 +16392,14 @@ void GL_APIENTRY GetQueryObjectui64vRobustANGLEContextANGLE(GLeglContext ctx,
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint64 * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetQueryObjectui64vRobustANGLE, id, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() ||
-            ValidateGetQueryObjectui64vRobustANGLE(context, id, pname, bufSize, length, params))
-        {
-            context->getQueryObjectui64vRobust(id, pname, bufSize, length, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetQueryObjectui64vRobustANGLE(context, id, pname, bufSize,
+                                                                    length, params);
     }
 }
 
@@ -18735,21 +16423,17 @@ void GL_APIENTRY CopyTexture3DANGLEContextANGLE(GLeglContext ctx,
         "= %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, internalFormat, destType, unpackFlipY,
         unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_EVENT(CopyTexture3DANGLE, sourceId, sourceLevel, destTarget, destId, destLevel,
+                       internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                       unpackUnmultiplyAlpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
-        if (context->skipValidation() ||
-            ValidateCopyTexture3DANGLE(context, sourceId, sourceLevel, destTargetPacked, destId,
-                                       destLevel, internalFormat, destType, unpackFlipY,
-                                       unpackPremultiplyAlpha, unpackUnmultiplyAlpha))
-        {
-            context->copyTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
-                                   internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
-                                   unpackUnmultiplyAlpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CopyTexture3DANGLE(
+            context, sourceId, sourceLevel, destTarget, destId, destLevel, internalFormat, destType,
+            unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
     }
 }
 
@@ -18781,22 +16465,18 @@ void GL_APIENTRY CopySubTexture3DANGLEContextANGLE(GLeglContext ctx,
         "unpackUnmultiplyAlpha = %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, xoffset, yoffset, zoffset, x, y, z,
         width, height, depth, unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_EVENT(CopySubTexture3DANGLE, sourceId, sourceLevel, destTarget, destId, destLevel,
+                       xoffset, yoffset, zoffset, x, y, z, width, height, depth, unpackFlipY,
+                       unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget destTargetPacked = FromGLenum<TextureTarget>(destTarget);
-        if (context->skipValidation() ||
-            ValidateCopySubTexture3DANGLE(context, sourceId, sourceLevel, destTargetPacked, destId,
-                                          destLevel, xoffset, yoffset, zoffset, x, y, z, width,
-                                          height, depth, unpackFlipY, unpackPremultiplyAlpha,
-                                          unpackUnmultiplyAlpha))
-        {
-            context->copySubTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
-                                      xoffset, yoffset, zoffset, x, y, z, width, height, depth,
-                                      unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->CopySubTexture3DANGLE(
+            context, sourceId, sourceLevel, destTarget, destId, destLevel, xoffset, yoffset,
+            zoffset, x, y, z, width, height, depth, unpackFlipY, unpackPremultiplyAlpha,
+            unpackUnmultiplyAlpha);
     }
 }
 
@@ -18813,19 +16493,15 @@ void GL_APIENTRY TexStorage2DMultisampleANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d, GLboolean fixedsamplelocations = %u)",
         target, samples, internalformat, width, height, fixedsamplelocations);
+    ANGLE_BINARY_EVENT(TexStorage2DMultisampleANGLE, target, samples, internalformat, width, height,
+                       fixedsamplelocations);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureType targetPacked = FromGLenum<TextureType>(target);
-        if (context->skipValidation() ||
-            ValidateTexStorage2DMultisampleANGLE(context, targetPacked, samples, internalformat,
-                                                 width, height, fixedsamplelocations))
-        {
-            context->texStorage2DMultisample(targetPacked, samples, internalformat, width, height,
-                                             fixedsamplelocations);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->TexStorage2DMultisampleANGLE(
+            context, target, samples, internalformat, width, height, fixedsamplelocations);
     }
 }
 
@@ -18840,17 +16516,14 @@ void GL_APIENTRY GetTexLevelParameterivANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLint * params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexLevelParameterivANGLE, target, level, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexLevelParameterivANGLE(context, targetPacked, level, pname, params))
-        {
-            context->getTexLevelParameteriv(targetPacked, level, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexLevelParameterivANGLE(context, target, level, pname,
+                                                                 params);
     }
 }
 
@@ -18865,17 +16538,14 @@ void GL_APIENTRY GetTexLevelParameterfvANGLEContextANGLE(GLeglContext ctx,
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLfloat * params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_EVENT(GetTexLevelParameterfvANGLE, target, level, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
-        if (context->skipValidation() ||
-            ValidateGetTexLevelParameterfvANGLE(context, targetPacked, level, pname, params))
-        {
-            context->getTexLevelParameterfv(targetPacked, level, pname, params);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetTexLevelParameterfvANGLE(context, target, level, pname,
+                                                                 params);
     }
 }
 
@@ -18889,17 +16559,13 @@ void GL_APIENTRY MultiDrawArraysANGLEContextANGLE(GLeglContext ctx,
     EVENT("(GLenum mode = 0x%X, const GLint *firsts = 0x%016" PRIxPTR
           ", const GLsizei *counts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
           mode, (uintptr_t)firsts, (uintptr_t)counts, drawcount);
+    ANGLE_BINARY_EVENT(MultiDrawArraysANGLE, mode, firsts, counts, drawcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() ||
-            ValidateMultiDrawArraysANGLE(context, modePacked, firsts, counts, drawcount))
-        {
-            context->multiDrawArrays(modePacked, firsts, counts, drawcount);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MultiDrawArraysANGLE(context, mode, firsts, counts, drawcount);
     }
 }
 
@@ -18915,19 +16581,15 @@ void GL_APIENTRY MultiDrawArraysInstancedANGLEContextANGLE(GLeglContext ctx,
           ", const GLsizei *counts = 0x%016" PRIxPTR
           ", const GLsizei *instanceCounts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
           mode, (uintptr_t)firsts, (uintptr_t)counts, (uintptr_t)instanceCounts, drawcount);
+    ANGLE_BINARY_EVENT(MultiDrawArraysInstancedANGLE, mode, firsts, counts, instanceCounts,
+                       drawcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
-        if (context->skipValidation() ||
-            ValidateMultiDrawArraysInstancedANGLE(context, modePacked, firsts, counts,
-                                                  instanceCounts, drawcount))
-        {
-            context->multiDrawArraysInstanced(modePacked, firsts, counts, instanceCounts,
-                                              drawcount);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MultiDrawArraysInstancedANGLE(context, mode, firsts, counts,
+                                                                   instanceCounts, drawcount);
     }
 }
 
@@ -18943,19 +16605,14 @@ void GL_APIENTRY MultiDrawElementsANGLEContextANGLE(GLeglContext ctx,
           ", GLenum type = 0x%X, const GLvoid *const*indices = 0x%016" PRIxPTR
           ", GLsizei drawcount = %d)",
           mode, (uintptr_t)counts, type, (uintptr_t)indices, drawcount);
+    ANGLE_BINARY_EVENT(MultiDrawElementsANGLE, mode, counts, type, indices, drawcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateMultiDrawElementsANGLE(context, modePacked, counts, typePacked, indices,
-                                           drawcount))
-        {
-            context->multiDrawElements(modePacked, counts, typePacked, indices, drawcount);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MultiDrawElementsANGLE(context, mode, counts, type, indices,
+                                                            drawcount);
     }
 }
 
@@ -18972,20 +16629,15 @@ void GL_APIENTRY MultiDrawElementsInstancedANGLEContextANGLE(GLeglContext ctx,
           ", GLenum type = 0x%X, const GLvoid *const*indices = 0x%016" PRIxPTR
           ", const GLsizei*instanceCounts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
           mode, (uintptr_t)counts, type, (uintptr_t)indices, (uintptr_t)instanceCounts, drawcount);
+    ANGLE_BINARY_EVENT(MultiDrawElementsInstancedANGLE, mode, counts, type, indices, instanceCounts,
+                       drawcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
-        DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
-        if (context->skipValidation() ||
-            ValidateMultiDrawElementsInstancedANGLE(context, modePacked, counts, typePacked,
-                                                    indices, instanceCounts, drawcount))
-        {
-            context->multiDrawElementsInstanced(modePacked, counts, typePacked, indices,
-                                                instanceCounts, drawcount);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->MultiDrawElementsInstancedANGLE(
+            context, mode, counts, type, indices, instanceCounts, drawcount);
     }
 }
 
@@ -18997,15 +16649,13 @@ void GL_APIENTRY GetMultisamplefvANGLEContextANGLE(GLeglContext ctx,
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLuint index = %u, GLfloat * val = 0x%016" PRIxPTR ")", pname,
           index, (uintptr_t)val);
+    ANGLE_BINARY_EVENT(GetMultisamplefvANGLE, pname, index, val);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateGetMultisamplefvANGLE(context, pname, index, val))
-        {
-            context->getMultisamplefv(pname, index, val);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->GetMultisamplefvANGLE(context, pname, index, val);
     }
 }
 
@@ -19013,15 +16663,13 @@ void GL_APIENTRY SampleMaskiANGLEContextANGLE(GLeglContext ctx, GLuint maskNumbe
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint maskNumber = %u, GLbitfield mask = 0x%X)", maskNumber, mask);
+    ANGLE_BINARY_EVENT(SampleMaskiANGLE, maskNumber, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        if (context->skipValidation() || ValidateSampleMaskiANGLE(context, maskNumber, mask))
-        {
-            context->sampleMaski(maskNumber, mask);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->SampleMaskiANGLE(context, maskNumber, mask);
     }
 }
 
@@ -19029,16 +16677,13 @@ void GL_APIENTRY ProvokingVertexANGLEContextANGLE(GLeglContext ctx, GLenum mode)
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_EVENT(ProvokingVertexANGLE, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        ProvokingVertex modePacked = FromGLenum<ProvokingVertex>(mode);
-        if (context->skipValidation() || ValidateProvokingVertexANGLE(context, modePacked))
-        {
-            context->provokingVertex(modePacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->ProvokingVertexANGLE(context, mode);
     }
 }
 
@@ -19046,18 +16691,13 @@ void GL_APIENTRY LoseContextCHROMIUMContextANGLE(GLeglContext ctx, GLenum curren
 {
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum current = 0x%X, GLenum other = 0x%X)", current, other);
+    ANGLE_BINARY_EVENT(LoseContextCHROMIUM, current, other);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
     {
-        ASSERT(context == GetValidGlobalContext());
-        GraphicsResetStatus currentPacked = FromGLenum<GraphicsResetStatus>(current);
-        GraphicsResetStatus otherPacked   = FromGLenum<GraphicsResetStatus>(other);
-        if (context->skipValidation() ||
-            ValidateLoseContextCHROMIUM(context, currentPacked, otherPacked))
-        {
-            context->loseContext(currentPacked, otherPacked);
-        }
+        ASSERT(context == GetGlobalContext());
+        context->getDispatchTable()->LoseContextCHROMIUM(context, current, other);
     }
 }
 }  // namespace gl
@@ -0,0 +1,111 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_profiler.cpp:
+//   Implements the per entry point call counters and timers.
+
+#include "libGLESv2/entry_points_profiler.h"
+
+#if ANGLE_ENTRY_POINT_PROFILING == ANGLE_ENABLED
+
+#    include <stdio.h>
+#    include <algorithm>
+#    include <array>
+#    include <string>
+#    include <vector>
+
+#    include "common/system_utils.h"
+
+namespace gl
+{
+namespace
+{
+constexpr size_t kEntryPointCount = static_cast<size_t>(EntryPoint::EnumCount);
+
+std::array<EntryPointProfile, kEntryPointCount> gEntryPointProfiles;
+
+struct ProfileRow
+{
+    EntryPoint entryPoint;
+    uint64_t calls;
+    uint64_t validationNs;
+    uint64_t dispatchNs;
+};
+}  // anonymous namespace
+
+EntryPointProfile &GetEntryPointProfile(EntryPoint entryPoint)
+{
+    return gEntryPointProfiles[static_cast<size_t>(entryPoint)];
+}
+
+void ResetEntryPointProfile()
+{
+    for (EntryPointProfile &profile : gEntryPointProfiles)
+    {
+        profile.calls.store(0, std::memory_order_relaxed);
+        profile.validationNs.store(0, std::memory_order_relaxed);
+        profile.dispatchNs.store(0, std::memory_order_relaxed);
+    }
+}
+
+void DumpEntryPointProfile()
+{
+    std::string path = angle::GetEnvironmentVar("ANGLE_ENTRY_POINT_PROFILE");
+    if (path.empty())
+    {
+        return;
+    }
+
+    std::vector<ProfileRow> rows;
+    for (size_t index = 0; index < kEntryPointCount; ++index)
+    {
+        const EntryPointProfile &profile = gEntryPointProfiles[index];
+        ProfileRow row                   = {static_cast<EntryPoint>(index),
+                          profile.calls.load(std::memory_order_relaxed),
+                          profile.validationNs.load(std::memory_order_relaxed),
+                          profile.dispatchNs.load(std::memory_order_relaxed)};
+        if (row.calls > 0)
+        {
+            rows.push_back(row);
+        }
+    }
+
+    // Hottest entry points first.
+    std::sort(rows.begin(), rows.end(), [](const ProfileRow &a, const ProfileRow &b) {
+        return a.validationNs + a.dispatchNs > b.validationNs + b.dispatchNs;
+    });
+
+    bool toStderr = path == "stderr";
+    FILE *file    = toStderr ? stderr : fopen(path.c_str(), "a");
+    if (!file)
+    {
+        return;
+    }
+
+    // Later dumps append their rows to the same table.
+    bool writeHeader = toStderr || (fseek(file, 0, SEEK_END) == 0 && ftell(file) == 0);
+    if (writeHeader)
+    {
+        fprintf(file, "entry_point,calls,validation_ns,dispatch_ns,total_ns\n");
+    }
+    for (const ProfileRow &row : rows)
+    {
+        fprintf(file, "gl%s,%llu,%llu,%llu,%llu\n", GetEntryPointName(row.entryPoint),
+                static_cast<unsigned long long>(row.calls),
+                static_cast<unsigned long long>(row.validationNs),
+                static_cast<unsigned long long>(row.dispatchNs),
+                static_cast<unsigned long long>(row.validationNs + row.dispatchNs));
+    }
+
+    if (!toStderr)
+    {
+        fclose(file);
+    }
+
+    ResetEntryPointProfile();
+}
+}  // namespace gl
+
+#endif  // ANGLE_ENTRY_POINT_PROFILING == ANGLE_ENABLED
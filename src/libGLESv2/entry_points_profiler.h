@@ -0,0 +1,102 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_profiler.h:
+//   Per entry point call counters and timers. Enabled with the
+//   angle_enable_entry_point_profiling build flag. Every generated GLES entry
+//   point counts its calls and accumulates the time spent in validation and in
+//   the Context dispatch. The counters are shared by all the contexts of the
+//   process. The profile is written out when a display is terminated if
+//   ANGLE_ENTRY_POINT_PROFILE is set in the environment.
+
+#ifndef LIBGLESV2_ENTRY_POINTS_PROFILER_H_
+#define LIBGLESV2_ENTRY_POINTS_PROFILER_H_
+
+#include "libANGLE/features.h"
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+#if ANGLE_ENTRY_POINT_PROFILING == ANGLE_ENABLED
+
+#    include <atomic>
+#    include <chrono>
+#    include <cstdint>
+
+#    include "common/angleutils.h"
+
+namespace gl
+{
+struct EntryPointProfile
+{
+    std::atomic<uint64_t> calls;
+    std::atomic<uint64_t> validationNs;
+    std::atomic<uint64_t> dispatchNs;
+};
+
+EntryPointProfile &GetEntryPointProfile(EntryPoint entryPoint);
+
+// Appends the profile to the file named by ANGLE_ENTRY_POINT_PROFILE, or writes it to stderr if the
+// variable is set to "stderr", and resets the counters. The CSV header is only written to new
+// files. Does nothing if the variable is not set.
+void DumpEntryPointProfile();
+void ResetEntryPointProfile();
+
+// Times the validation and the dispatch of one entry point call. The validation time runs from
+// construction to beginDispatch(), the dispatch time from beginDispatch() to destruction. Calls
+// that fail validation only account validation time.
+class ScopedEntryPointProfile final : angle::NonCopyable
+{
+  public:
+    explicit ScopedEntryPointProfile(EntryPoint entryPoint)
+        : mProfile(GetEntryPointProfile(entryPoint)), mStart(Clock::now()), mDispatchStarted(false)
+    {}
+
+    ~ScopedEntryPointProfile()
+    {
+        Clock::time_point end = Clock::now();
+        mProfile.calls.fetch_add(1, std::memory_order_relaxed);
+        if (mDispatchStarted)
+        {
+            mProfile.validationNs.fetch_add(ToNanoseconds(mDispatchStart - mStart),
+                                            std::memory_order_relaxed);
+            mProfile.dispatchNs.fetch_add(ToNanoseconds(end - mDispatchStart),
+                                          std::memory_order_relaxed);
+        }
+        else
+        {
+            mProfile.validationNs.fetch_add(ToNanoseconds(end - mStart), std::memory_order_relaxed);
+        }
+    }
+
+    void beginDispatch()
+    {
+        mDispatchStart   = Clock::now();
+        mDispatchStarted = true;
+    }
+
+  private:
+    using Clock = std::chrono::steady_clock;
+
+    static uint64_t ToNanoseconds(Clock::duration duration)
+    {
+        return static_cast<uint64_t>(
+            std::chrono::duration_cast<std::chrono::nanoseconds>(duration).count());
+    }
+
+    EntryPointProfile &mProfile;
+    Clock::time_point mStart;
+    Clock::time_point mDispatchStart;
+    bool mDispatchStarted;
+};
+}  // namespace gl
+
+#    define ANGLE_PROFILE_ENTRY_POINT(EP) \
+        gl::ScopedEntryPointProfile entryPointProfile(gl::EntryPoint::EP)
+#    define ANGLE_PROFILE_ENTRY_POINT_DISPATCH() entryPointProfile.beginDispatch()
+#else
+#    define ANGLE_PROFILE_ENTRY_POINT(EP)
+#    define ANGLE_PROFILE_ENTRY_POINT_DISPATCH()
+#endif  // ANGLE_ENTRY_POINT_PROFILING == ANGLE_ENABLED
+
+#endif  // LIBGLESV2_ENTRY_POINTS_PROFILER_H_
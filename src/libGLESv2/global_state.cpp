@@ -11,6 +11,7 @@
 #include "common/debug.h"
 #include "common/platform.h"
 #include "common/tls.h"
+#include "libGLESv2/entry_points_dispatch_autogen.h"
 
 namespace gl
 {
@@ -27,6 +28,9 @@ namespace gl
 // Implementation-wise we can use a pointer and a boolean to represent the three modes.
 Context *gSingleThreadedContext = nullptr;
 bool gIsMultiThreadedContext    = false;
+
+// The pointer is trivially destructible, so the thread_local adds no work at thread exit.
+thread_local Context *gCurrentContext = nullptr;
 }  // namespace gl
 
 namespace egl
@@ -106,6 +110,14 @@ void SetContextCurrent(Thread *thread, gl::Context *context)
         }
     }
     thread->setCurrent(context);
+    gl::gCurrentContext = context;
+
+    if (context)
+    {
+        context->setDispatchTables(context->skipValidation() ? &gl::kNoErrorDispatchTable
+                                                             : &gl::kValidatedDispatchTable,
+                                   &gl::kContextLostDispatchTable);
+    }
 }
 }  // namespace egl
 
@@ -114,10 +126,10 @@ namespace angle
 {
 namespace
 {
-std::mutex g_Mutex;
+GlobalMutex g_Mutex;
 }  // anonymous namespace
 
-std::mutex &GetGlobalMutex()
+GlobalMutex &GetGlobalMutex()
 {
     return g_Mutex;
 }
@@ -15,6 +15,11 @@
 #include "libANGLE/features.h"
 
 #include <mutex>
+#include <shared_mutex>
+
+#if !defined(ANGLE_PLATFORM_WINDOWS)
+#    include <pthread.h>
+#endif
 
 namespace egl
 {
@@ -30,6 +35,10 @@ namespace gl
 {
 extern Context *gSingleThreadedContext;
 
+// The context of the current egl::Thread, cached by SetContextCurrent so the entry points don't
+// look up the egl::Thread in multi-threaded mode.
+extern thread_local Context *gCurrentContext;
+
 ANGLE_INLINE Context *GetGlobalContext()
 {
     if (gSingleThreadedContext)
@@ -37,19 +46,20 @@ ANGLE_INLINE Context *GetGlobalContext()
         return gSingleThreadedContext;
     }
 
-    egl::Thread *thread = egl::GetCurrentThread();
-    return thread->getContext();
+    return gCurrentContext;
 }
 
 ANGLE_INLINE Context *GetValidGlobalContext()
 {
-    if (gSingleThreadedContext && !gSingleThreadedContext->isContextLost())
+    Context *context = GetGlobalContext();
+    if (context && context->isContextLost())
     {
-        return gSingleThreadedContext;
+        context->handleError(GL_OUT_OF_MEMORY, "Context has been lost.", __FILE__, ANGLE_FUNCTION,
+                             __LINE__);
+        return nullptr;
     }
 
-    egl::Thread *thread = egl::GetCurrentThread();
-    return thread->getValidContext();
+    return context;
 }
 
 }  // namespace gl
@@ -57,13 +67,81 @@ ANGLE_INLINE Context *GetValidGlobalContext()
 #if ANGLE_FORCE_THREAD_SAFETY == ANGLE_ENABLED
 namespace angle
 {
-std::mutex &GetGlobalMutex();
+// Entry points that touch display-global state lock the global mutex exclusively. Entry points
+// that only touch objects of the share group hold it shared while they lock the share group
+// mutex, so they run concurrently with entry points of other share groups. Backends that don't
+// support this, like the GL backend that issues the calls of every share group through one native
+// context, lock the global mutex exclusively instead. Entry points that only touch the current
+// context take no lock at all. The classification lives in scripts/entry_point_lock_classes.json.
+//
+// std::shared_timed_mutex is built on a mutex and a condition variable by some standard
+// libraries, which makes the exclusive lock taken by most entry points slower than a std::mutex.
+// This wraps the native reader-writer lock instead.
+class GlobalMutex final : angle::NonCopyable
+{
+  public:
+#    if defined(ANGLE_PLATFORM_WINDOWS)
+    GlobalMutex() { InitializeSRWLock(&mLock); }
+    ~GlobalMutex() {}
+
+    void lock() { AcquireSRWLockExclusive(&mLock); }
+    bool try_lock() { return TryAcquireSRWLockExclusive(&mLock) != 0; }
+    void unlock() { ReleaseSRWLockExclusive(&mLock); }
+
+    void lock_shared() { AcquireSRWLockShared(&mLock); }
+    void unlock_shared() { ReleaseSRWLockShared(&mLock); }
+
+  private:
+    SRWLOCK mLock;
+#    else
+    GlobalMutex() { pthread_rwlock_init(&mLock, nullptr); }
+    ~GlobalMutex() { pthread_rwlock_destroy(&mLock); }
+
+    void lock() { pthread_rwlock_wrlock(&mLock); }
+    bool try_lock() { return pthread_rwlock_trywrlock(&mLock) == 0; }
+    void unlock() { pthread_rwlock_unlock(&mLock); }
+
+    void lock_shared() { pthread_rwlock_rdlock(&mLock); }
+    void unlock_shared() { pthread_rwlock_unlock(&mLock); }
+
+  private:
+    pthread_rwlock_t mLock;
+#    endif  // defined(ANGLE_PLATFORM_WINDOWS)
+};
+
+GlobalMutex &GetGlobalMutex();
+
+class ScopedShareGroupLock final : angle::NonCopyable
+{
+  public:
+    explicit ScopedShareGroupLock(const gl::Context *context)
+    {
+        if (context->supportsConcurrentShareGroupCalls())
+        {
+            mGlobalSharedLock = std::shared_lock<GlobalMutex>(GetGlobalMutex());
+            mShareGroupLock =
+                std::unique_lock<std::mutex>(context->getState().getShareGroupMutex());
+        }
+        else
+        {
+            mGlobalLock = std::unique_lock<GlobalMutex>(GetGlobalMutex());
+        }
+    }
+
+  private:
+    std::unique_lock<GlobalMutex> mGlobalLock;
+    std::shared_lock<GlobalMutex> mGlobalSharedLock;
+    std::unique_lock<std::mutex> mShareGroupLock;
+};
 }  // namespace angle
 
 #    define ANGLE_SCOPED_GLOBAL_LOCK() \
-        std::lock_guard<std::mutex> globalMutexLock(angle::GetGlobalMutex())
+        std::lock_guard<angle::GlobalMutex> globalMutexLock(angle::GetGlobalMutex())
+#    define ANGLE_SCOPED_SHARE_GROUP_LOCK(context) \
+        angle::ScopedShareGroupLock shareGroupLock(context)
 #else
 #    define ANGLE_SCOPED_GLOBAL_LOCK()
+#    define ANGLE_SCOPED_SHARE_GROUP_LOCK(context)
 #endif
 
 #endif  // LIBGLESV2_GLOBALSTATE_H_
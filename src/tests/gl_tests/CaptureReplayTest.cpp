@@ -0,0 +1,221 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// CaptureReplayTest:
+//   Captures GLES calls with angle_enable_capture and replays them with the replay of the
+//   capture_replay sample.
+//
+
+#include "test_utils/ANGLETest.h"
+#include "test_utils/gl_raii.h"
+
+#include "samples/capture_replay/capture_replay.h"
+
+using namespace angle;
+
+namespace
+{
+constexpr GLsizei kBlockSize = 4;
+
+// One ETC2 RGB8 block. Its first half is brighter than the second one.
+constexpr uint8_t kBlock[8] = {0xF0, 0x80, 0x20, 0x00, 0xFF, 0xFF, 0x00, 0x00};
+
+class CaptureReplayTest : public ANGLETest
+{
+  protected:
+    CaptureReplayTest()
+    {
+        setWindowWidth(kBlockSize);
+        setWindowHeight(kBlockSize);
+        setConfigRedBits(8);
+        setConfigGreenBits(8);
+        setConfigBlueBits(8);
+        setConfigAlphaBits(8);
+    }
+
+    void SetUp() override
+    {
+        ANGLETest::SetUp();
+
+        constexpr char kVS[] = R"(attribute vec4 position;
+varying vec2 texcoord;
+void main()
+{
+    gl_Position = position;
+    texcoord = position.xy * 0.5 + 0.5;
+})";
+
+        constexpr char kFS[] = R"(precision mediump float;
+uniform sampler2D tex;
+varying vec2 texcoord;
+void main()
+{
+    gl_FragColor = texture2D(tex, texcoord);
+})";
+
+        mProgram = CompileProgram(kVS, kFS);
+        ASSERT_NE(0u, mProgram);
+    }
+
+    void TearDown() override
+    {
+        glDeleteProgram(mProgram);
+        ANGLETest::TearDown();
+    }
+
+    // Returns the calls made by calls while the capture writes to a temporary file.
+    template <typename CallsT>
+    std::vector<CapturedCall> capture(CallsT &&calls)
+    {
+        FILE *file = tmpfile();
+        EXPECT_NE(nullptr, file);
+        if (!file)
+        {
+            return {};
+        }
+
+        gl::SetCaptureFile(file);
+        calls();
+        gl::SetCaptureFile(nullptr);
+
+        std::vector<CapturedFrame> frames;
+        rewind(file);
+        EXPECT_TRUE(ReadCapture(file, &frames));
+        fclose(file);
+
+        std::vector<CapturedCall> capturedCalls;
+        for (CapturedFrame &frame : frames)
+        {
+            for (CapturedCall &call : frame)
+            {
+                capturedCalls.push_back(std::move(call));
+            }
+        }
+        return capturedCalls;
+    }
+
+    // Draws the texture over the whole window and reads the window back.
+    std::vector<GLColor> drawTexture(GLuint texture)
+    {
+        glBindTexture(GL_TEXTURE_2D, texture);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST);
+        drawQuad(mProgram, "position", 0.5f);
+
+        std::vector<GLColor> pixels(kBlockSize * kBlockSize);
+        glReadPixels(0, 0, kBlockSize, kBlockSize, GL_RGBA, GL_UNSIGNED_BYTE, pixels.data());
+        EXPECT_GL_NO_ERROR();
+        return pixels;
+    }
+
+    GLuint mProgram = 0;
+};
+
+// Tests that a compressed upload from client memory captures the data, that one from a pixel
+// unpack buffer captures the offset, and that both replay to the same texture as the original
+// calls.
+TEST_P(CaptureReplayTest, CompressedTexImage2D)
+{
+    GLTexture clientTexture;
+    GLTexture bufferTexture;
+    GLBuffer unpackBuffer;
+
+    // The block is at a non-zero offset, so a replay that reads from the buffer start differs.
+    constexpr GLintptr kOffset                   = sizeof(kBlock);
+    uint8_t bufferData[kOffset + sizeof(kBlock)] = {};
+    memcpy(bufferData + kOffset, kBlock, sizeof(kBlock));
+    glBindBuffer(GL_PIXEL_UNPACK_BUFFER, unpackBuffer);
+    glBufferData(GL_PIXEL_UNPACK_BUFFER, sizeof(bufferData), bufferData, GL_STATIC_DRAW);
+    glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0);
+
+    std::vector<CapturedCall> calls = capture([&]() {
+        glBindTexture(GL_TEXTURE_2D, clientTexture);
+        glCompressedTexImage2D(GL_TEXTURE_2D, 0, GL_COMPRESSED_RGB8_ETC2, kBlockSize, kBlockSize, 0,
+                               sizeof(kBlock), kBlock);
+
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, unpackBuffer);
+        glBindTexture(GL_TEXTURE_2D, bufferTexture);
+        glCompressedTexImage2D(GL_TEXTURE_2D, 0, GL_COMPRESSED_RGB8_ETC2, kBlockSize, kBlockSize, 0,
+                               sizeof(kBlock), reinterpret_cast<const void *>(kOffset));
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0);
+    });
+    ASSERT_GL_NO_ERROR();
+
+    std::vector<const CapturedCall *> uploads;
+    for (const CapturedCall &call : calls)
+    {
+        if (call.entryPoint == gl::EntryPoint::CompressedTexImage2D)
+        {
+            uploads.push_back(&call);
+        }
+    }
+    ASSERT_EQ(2u, uploads.size());
+
+    // The data parameter is the eighth one.
+    constexpr size_t kDataParam = 7;
+
+    const CapturedCall &clientUpload = *uploads[0];
+    ASSERT_EQ(1u, clientUpload.blobs.size());
+    EXPECT_EQ(kDataParam, clientUpload.blobs[0].paramIndex);
+    EXPECT_EQ(std::vector<uint8_t>(kBlock, kBlock + sizeof(kBlock)), clientUpload.blobs[0].data);
+
+    const CapturedCall &bufferUpload = *uploads[1];
+    EXPECT_TRUE(bufferUpload.blobs.empty());
+    EXPECT_EQ(static_cast<uint64_t>(kOffset), bufferUpload.params[kDataParam]);
+
+    // Replay the uploads into new textures, with the buffer bound like during the capture.
+    ReplayState state;
+    GLTexture replayedClientTexture;
+    GLTexture replayedBufferTexture;
+
+    glBindTexture(GL_TEXTURE_2D, replayedClientTexture);
+    EXPECT_TRUE(ReplayCall(clientUpload, &state));
+
+    glBindBuffer(GL_PIXEL_UNPACK_BUFFER, unpackBuffer);
+    glBindTexture(GL_TEXTURE_2D, replayedBufferTexture);
+    EXPECT_TRUE(ReplayCall(bufferUpload, &state));
+    glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0);
+    ASSERT_GL_NO_ERROR();
+
+    std::vector<GLColor> expected = drawTexture(clientTexture);
+    EXPECT_EQ(expected, drawTexture(bufferTexture));
+    EXPECT_EQ(expected, drawTexture(replayedClientTexture));
+    EXPECT_EQ(expected, drawTexture(replayedBufferTexture));
+}
+
+// Tests that the robust compressed upload captures the dataSize bytes it may read.
+TEST_P(CaptureReplayTest, CompressedTexImage2DRobust)
+{
+    ANGLE_SKIP_TEST_IF(!extensionEnabled("GL_ANGLE_robust_client_memory"));
+
+    uint8_t data[2 * sizeof(kBlock)] = {};
+    memcpy(data, kBlock, sizeof(kBlock));
+
+    GLTexture texture;
+    std::vector<CapturedCall> calls = capture([&]() {
+        glBindTexture(GL_TEXTURE_2D, texture);
+        glCompressedTexImage2DRobustANGLE(GL_TEXTURE_2D, 0, GL_COMPRESSED_RGB8_ETC2, kBlockSize,
+                                          kBlockSize, 0, sizeof(kBlock), sizeof(data), data);
+    });
+    ASSERT_GL_NO_ERROR();
+
+    const CapturedCall *upload = nullptr;
+    for (const CapturedCall &call : calls)
+    {
+        if (call.entryPoint == gl::EntryPoint::CompressedTexImage2DRobustANGLE)
+        {
+            upload = &call;
+        }
+    }
+    ASSERT_NE(nullptr, upload);
+
+    // The data parameter is the ninth one.
+    ASSERT_EQ(1u, upload->blobs.size());
+    EXPECT_EQ(8u, upload->blobs[0].paramIndex);
+    EXPECT_EQ(std::vector<uint8_t>(data, data + sizeof(data)), upload->blobs[0].data);
+}
+
+ANGLE_INSTANTIATE_TEST(CaptureReplayTest, ES3_NULL(), ES3_OPENGL(), ES3_VULKAN());
+}  // anonymous namespace
@@ -0,0 +1,167 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// DeferredCommandsTest:
+//   Tests the off-thread execution of the GLES calls of angle_enable_deferred_commands, with
+//   ANGLE_DEFERRED_COMMANDS=1 set in the environment while the contexts are created.
+//
+
+#include "test_utils/ANGLETest.h"
+#include "test_utils/gl_raii.h"
+
+#include "common/system_utils.h"
+#include "libANGLE/Context.h"
+#include "libANGLE/DeferredCommandStream.h"
+
+using namespace angle;
+
+namespace
+{
+constexpr char kDeferredCommandsEnvVar[] = "ANGLE_DEFERRED_COMMANDS";
+
+class DeferredCommandsTest : public ANGLETest
+{
+  protected:
+    DeferredCommandsTest()
+    {
+        setWindowWidth(16);
+        setWindowHeight(16);
+        setConfigRedBits(8);
+        setConfigGreenBits(8);
+        setConfigBlueBits(8);
+        setConfigAlphaBits(8);
+    }
+
+    void SetUp() override
+    {
+        SetEnvironmentVar(kDeferredCommandsEnvVar, "1");
+        ANGLETest::SetUp();
+
+        ASSERT_NE(nullptr, getStream());
+    }
+
+    void TearDown() override
+    {
+        ANGLETest::TearDown();
+        UnsetEnvironmentVar(kDeferredCommandsEnvVar);
+    }
+
+    gl::DeferredCommandStream *getStream()
+    {
+        gl::Context *context = static_cast<gl::Context *>(getEGLWindow()->getContext());
+        return context->getDeferredCommandStream();
+    }
+
+    static GLint GetStencilClearValue()
+    {
+        GLint value = 0;
+        glGetIntegerv(GL_STENCIL_CLEAR_VALUE, &value);
+        return value;
+    }
+};
+
+// Tests that the calls execute in order, including the ones submitted to the worker thread, before
+// the calls returning data.
+TEST_P(DeferredCommandsTest, ExecutesCallsInOrder)
+{
+    // Enough calls to fill several submissions.
+    constexpr GLint kCalls = 1000;
+    for (GLint call = 0; call < kCalls; ++call)
+    {
+        glClearStencil(call);
+        if (call % 2 == 0)
+        {
+            glEnable(GL_BLEND);
+        }
+        else
+        {
+            glDisable(GL_BLEND);
+        }
+    }
+    EXPECT_TRUE(getStream()->hasPendingCommands());
+
+    EXPECT_GL_FALSE(glIsEnabled(GL_BLEND));
+    EXPECT_FALSE(getStream()->hasPendingCommands());
+    EXPECT_EQ(kCalls - 1, GetStencilClearValue());
+    EXPECT_GL_NO_ERROR();
+}
+
+// Tests that the error of a deferred call is generated when it executes, so the next glGetError
+// returns it, and that the calls after it still execute.
+TEST_P(DeferredCommandsTest, ReportsErrorOfDeferredCall)
+{
+    glDepthFunc(GL_TRIANGLES);
+    glClearStencil(1);
+    EXPECT_TRUE(getStream()->hasPendingCommands());
+
+    EXPECT_GL_ERROR(GL_INVALID_ENUM);
+    EXPECT_GL_NO_ERROR();
+    EXPECT_EQ(1, GetStencilClearValue());
+}
+
+// Tests that the draws execute synchronously once a client vertex array was specified, so they
+// read the client memory before it is modified.
+TEST_P(DeferredCommandsTest, DrawsWithClientVertexArrayExecuteSynchronously)
+{
+    ANGLE_GL_PROGRAM(program, essl1_shaders::vs::Simple(), essl1_shaders::fs::Red());
+    GLint positionLocation = glGetAttribLocation(program, essl1_shaders::PositionAttrib());
+    ASSERT_NE(-1, positionLocation);
+
+    glUseProgram(program);
+    glClearColor(0.0f, 1.0f, 0.0f, 1.0f);
+    glClear(GL_COLOR_BUFFER_BIT);
+    EXPECT_FALSE(getStream()->usesClientVertexArrays());
+
+    std::array<Vector3, 6> positions = GetQuadVertices();
+    glBindBuffer(GL_ARRAY_BUFFER, 0);
+    glVertexAttribPointer(positionLocation, 3, GL_FLOAT, GL_FALSE, 0, positions.data());
+    glEnableVertexAttribArray(positionLocation);
+    EXPECT_TRUE(getStream()->usesClientVertexArrays());
+
+    glDrawArrays(GL_TRIANGLES, 0, static_cast<GLsizei>(positions.size()));
+    EXPECT_FALSE(getStream()->hasPendingCommands());
+
+    // A draw executing after this would draw nothing.
+    std::fill(positions.begin(), positions.end(), Vector3());
+    ASSERT_GL_NO_ERROR();
+
+    if (!IsNULL())
+    {
+        EXPECT_PIXEL_COLOR_EQ(getWindowWidth() / 2, getWindowHeight() / 2, GLColor::red);
+    }
+}
+
+// Tests that eglSwapBuffers executes the pending calls.
+TEST_P(DeferredCommandsTest, SwapBuffersExecutesPendingCalls)
+{
+    glClearStencil(2);
+    EXPECT_TRUE(getStream()->hasPendingCommands());
+
+    swapBuffers();
+    EXPECT_FALSE(getStream()->hasPendingCommands());
+    EXPECT_EQ(2, GetStencilClearValue());
+}
+
+// Tests that eglMakeCurrent executes the pending calls of the context it releases.
+TEST_P(DeferredCommandsTest, MakeCurrentExecutesPendingCalls)
+{
+    EGLWindow *window  = getEGLWindow();
+    EGLDisplay display = window->getDisplay();
+    EGLSurface surface = window->getSurface();
+    EGLContext context = window->getContext();
+
+    glClearStencil(3);
+    EXPECT_TRUE(getStream()->hasPendingCommands());
+
+    ASSERT_EGL_TRUE(eglMakeCurrent(display, EGL_NO_SURFACE, EGL_NO_SURFACE, EGL_NO_CONTEXT));
+    EXPECT_FALSE(getStream()->hasPendingCommands());
+
+    ASSERT_EGL_TRUE(eglMakeCurrent(display, surface, surface, context));
+    EXPECT_EQ(3, GetStencilClearValue());
+    EXPECT_GL_NO_ERROR();
+}
+
+ANGLE_INSTANTIATE_TEST(DeferredCommandsTest, ES3_NULL(), ES3_VULKAN());
+}  // anonymous namespace
@@ -0,0 +1,693 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// DispatchTableTest_autogen.cpp:
+//   Checks that the dispatch tables of the GLES entry points have every entry.
+
+#include <gtest/gtest.h>
+
+#include "libGLESv2/entry_points_dispatch_autogen.h"
+
+namespace
+{
+void ExpectCompleteDispatchTable(const gl::DispatchTable &table)
+{
+    EXPECT_NE(nullptr, table.ActiveShaderProgram);
+    EXPECT_NE(nullptr, table.ActiveTexture);
+    EXPECT_NE(nullptr, table.AlphaFunc);
+    EXPECT_NE(nullptr, table.AlphaFuncx);
+    EXPECT_NE(nullptr, table.AttachShader);
+    EXPECT_NE(nullptr, table.BeginQuery);
+    EXPECT_NE(nullptr, table.BeginQueryEXT);
+    EXPECT_NE(nullptr, table.BeginTransformFeedback);
+    EXPECT_NE(nullptr, table.BindAttribLocation);
+    EXPECT_NE(nullptr, table.BindBuffer);
+    EXPECT_NE(nullptr, table.BindBufferBase);
+    EXPECT_NE(nullptr, table.BindBufferRange);
+    EXPECT_NE(nullptr, table.BindFragDataLocationEXT);
+    EXPECT_NE(nullptr, table.BindFragDataLocationIndexedEXT);
+    EXPECT_NE(nullptr, table.BindFragmentInputLocationCHROMIUM);
+    EXPECT_NE(nullptr, table.BindFramebuffer);
+    EXPECT_NE(nullptr, table.BindFramebufferOES);
+    EXPECT_NE(nullptr, table.BindImageTexture);
+    EXPECT_NE(nullptr, table.BindProgramPipeline);
+    EXPECT_NE(nullptr, table.BindRenderbuffer);
+    EXPECT_NE(nullptr, table.BindRenderbufferOES);
+    EXPECT_NE(nullptr, table.BindSampler);
+    EXPECT_NE(nullptr, table.BindTexture);
+    EXPECT_NE(nullptr, table.BindTransformFeedback);
+    EXPECT_NE(nullptr, table.BindUniformLocationCHROMIUM);
+    EXPECT_NE(nullptr, table.BindVertexArray);
+    EXPECT_NE(nullptr, table.BindVertexArrayOES);
+    EXPECT_NE(nullptr, table.BindVertexBuffer);
+    EXPECT_NE(nullptr, table.BlendColor);
+    EXPECT_NE(nullptr, table.BlendEquation);
+    EXPECT_NE(nullptr, table.BlendEquationSeparate);
+    EXPECT_NE(nullptr, table.BlendFunc);
+    EXPECT_NE(nullptr, table.BlendFuncSeparate);
+    EXPECT_NE(nullptr, table.BlitFramebuffer);
+    EXPECT_NE(nullptr, table.BlitFramebufferANGLE);
+    EXPECT_NE(nullptr, table.BufferData);
+    EXPECT_NE(nullptr, table.BufferStorageMemEXT);
+    EXPECT_NE(nullptr, table.BufferSubData);
+    EXPECT_NE(nullptr, table.CheckFramebufferStatus);
+    EXPECT_NE(nullptr, table.CheckFramebufferStatusOES);
+    EXPECT_NE(nullptr, table.Clear);
+    EXPECT_NE(nullptr, table.ClearBufferfi);
+    EXPECT_NE(nullptr, table.ClearBufferfv);
+    EXPECT_NE(nullptr, table.ClearBufferiv);
+    EXPECT_NE(nullptr, table.ClearBufferuiv);
+    EXPECT_NE(nullptr, table.ClearColor);
+    EXPECT_NE(nullptr, table.ClearColorx);
+    EXPECT_NE(nullptr, table.ClearDepthf);
+    EXPECT_NE(nullptr, table.ClearDepthx);
+    EXPECT_NE(nullptr, table.ClearStencil);
+    EXPECT_NE(nullptr, table.ClientActiveTexture);
+    EXPECT_NE(nullptr, table.ClientWaitSync);
+    EXPECT_NE(nullptr, table.ClipPlanef);
+    EXPECT_NE(nullptr, table.ClipPlanex);
+    EXPECT_NE(nullptr, table.Color4f);
+    EXPECT_NE(nullptr, table.Color4ub);
+    EXPECT_NE(nullptr, table.Color4x);
+    EXPECT_NE(nullptr, table.ColorMask);
+    EXPECT_NE(nullptr, table.ColorPointer);
+    EXPECT_NE(nullptr, table.CompileShader);
+    EXPECT_NE(nullptr, table.CompressedCopyTextureCHROMIUM);
+    EXPECT_NE(nullptr, table.CompressedTexImage2D);
+    EXPECT_NE(nullptr, table.CompressedTexImage2DRobustANGLE);
+    EXPECT_NE(nullptr, table.CompressedTexImage3D);
+    EXPECT_NE(nullptr, table.CompressedTexImage3DRobustANGLE);
+    EXPECT_NE(nullptr, table.CompressedTexSubImage2D);
+    EXPECT_NE(nullptr, table.CompressedTexSubImage2DRobustANGLE);
+    EXPECT_NE(nullptr, table.CompressedTexSubImage3D);
+    EXPECT_NE(nullptr, table.CompressedTexSubImage3DRobustANGLE);
+    EXPECT_NE(nullptr, table.CopyBufferSubData);
+    EXPECT_NE(nullptr, table.CopySubTexture3DANGLE);
+    EXPECT_NE(nullptr, table.CopySubTextureCHROMIUM);
+    EXPECT_NE(nullptr, table.CopyTexImage2D);
+    EXPECT_NE(nullptr, table.CopyTexSubImage2D);
+    EXPECT_NE(nullptr, table.CopyTexSubImage3D);
+    EXPECT_NE(nullptr, table.CopyTexture3DANGLE);
+    EXPECT_NE(nullptr, table.CopyTextureCHROMIUM);
+    EXPECT_NE(nullptr, table.CoverFillPathCHROMIUM);
+    EXPECT_NE(nullptr, table.CoverFillPathInstancedCHROMIUM);
+    EXPECT_NE(nullptr, table.CoverStrokePathCHROMIUM);
+    EXPECT_NE(nullptr, table.CoverStrokePathInstancedCHROMIUM);
+    EXPECT_NE(nullptr, table.CoverageModulationCHROMIUM);
+    EXPECT_NE(nullptr, table.CreateMemoryObjectsEXT);
+    EXPECT_NE(nullptr, table.CreateProgram);
+    EXPECT_NE(nullptr, table.CreateShader);
+    EXPECT_NE(nullptr, table.CreateShaderProgramv);
+    EXPECT_NE(nullptr, table.CullFace);
+    EXPECT_NE(nullptr, table.CurrentPaletteMatrixOES);
+    EXPECT_NE(nullptr, table.DebugMessageCallbackKHR);
+    EXPECT_NE(nullptr, table.DebugMessageControlKHR);
+    EXPECT_NE(nullptr, table.DebugMessageInsertKHR);
+    EXPECT_NE(nullptr, table.DeleteBuffers);
+    EXPECT_NE(nullptr, table.DeleteFencesNV);
+    EXPECT_NE(nullptr, table.DeleteFramebuffers);
+    EXPECT_NE(nullptr, table.DeleteFramebuffersOES);
+    EXPECT_NE(nullptr, table.DeleteMemoryObjectsEXT);
+    EXPECT_NE(nullptr, table.DeletePathsCHROMIUM);
+    EXPECT_NE(nullptr, table.DeleteProgram);
+    EXPECT_NE(nullptr, table.DeleteProgramPipelines);
+    EXPECT_NE(nullptr, table.DeleteQueries);
+    EXPECT_NE(nullptr, table.DeleteQueriesEXT);
+    EXPECT_NE(nullptr, table.DeleteRenderbuffers);
+    EXPECT_NE(nullptr, table.DeleteRenderbuffersOES);
+    EXPECT_NE(nullptr, table.DeleteSamplers);
+    EXPECT_NE(nullptr, table.DeleteSemaphoresEXT);
+    EXPECT_NE(nullptr, table.DeleteShader);
+    EXPECT_NE(nullptr, table.DeleteSync);
+    EXPECT_NE(nullptr, table.DeleteTextures);
+    EXPECT_NE(nullptr, table.DeleteTransformFeedbacks);
+    EXPECT_NE(nullptr, table.DeleteVertexArrays);
+    EXPECT_NE(nullptr, table.DeleteVertexArraysOES);
+    EXPECT_NE(nullptr, table.DepthFunc);
+    EXPECT_NE(nullptr, table.DepthMask);
+    EXPECT_NE(nullptr, table.DepthRangef);
+    EXPECT_NE(nullptr, table.DepthRangex);
+    EXPECT_NE(nullptr, table.DetachShader);
+    EXPECT_NE(nullptr, table.Disable);
+    EXPECT_NE(nullptr, table.DisableClientState);
+    EXPECT_NE(nullptr, table.DisableVertexAttribArray);
+    EXPECT_NE(nullptr, table.DiscardFramebufferEXT);
+    EXPECT_NE(nullptr, table.DispatchCompute);
+    EXPECT_NE(nullptr, table.DispatchComputeIndirect);
+    EXPECT_NE(nullptr, table.DrawArrays);
+    EXPECT_NE(nullptr, table.DrawArraysIndirect);
+    EXPECT_NE(nullptr, table.DrawArraysInstanced);
+    EXPECT_NE(nullptr, table.DrawArraysInstancedANGLE);
+    EXPECT_NE(nullptr, table.DrawArraysInstancedEXT);
+    EXPECT_NE(nullptr, table.DrawBuffers);
+    EXPECT_NE(nullptr, table.DrawBuffersEXT);
+    EXPECT_NE(nullptr, table.DrawElements);
+    EXPECT_NE(nullptr, table.DrawElementsIndirect);
+    EXPECT_NE(nullptr, table.DrawElementsInstanced);
+    EXPECT_NE(nullptr, table.DrawElementsInstancedANGLE);
+    EXPECT_NE(nullptr, table.DrawElementsInstancedEXT);
+    EXPECT_NE(nullptr, table.DrawRangeElements);
+    EXPECT_NE(nullptr, table.DrawTexfOES);
+    EXPECT_NE(nullptr, table.DrawTexfvOES);
+    EXPECT_NE(nullptr, table.DrawTexiOES);
+    EXPECT_NE(nullptr, table.DrawTexivOES);
+    EXPECT_NE(nullptr, table.DrawTexsOES);
+    EXPECT_NE(nullptr, table.DrawTexsvOES);
+    EXPECT_NE(nullptr, table.DrawTexxOES);
+    EXPECT_NE(nullptr, table.DrawTexxvOES);
+    EXPECT_NE(nullptr, table.EGLImageTargetRenderbufferStorageOES);
+    EXPECT_NE(nullptr, table.EGLImageTargetTexture2DOES);
+    EXPECT_NE(nullptr, table.Enable);
+    EXPECT_NE(nullptr, table.EnableClientState);
+    EXPECT_NE(nullptr, table.EnableVertexAttribArray);
+    EXPECT_NE(nullptr, table.EndQuery);
+    EXPECT_NE(nullptr, table.EndQueryEXT);
+    EXPECT_NE(nullptr, table.EndTransformFeedback);
+    EXPECT_NE(nullptr, table.FenceSync);
+    EXPECT_NE(nullptr, table.Finish);
+    EXPECT_NE(nullptr, table.FinishFenceNV);
+    EXPECT_NE(nullptr, table.Flush);
+    EXPECT_NE(nullptr, table.FlushMappedBufferRange);
+    EXPECT_NE(nullptr, table.FlushMappedBufferRangeEXT);
+    EXPECT_NE(nullptr, table.Fogf);
+    EXPECT_NE(nullptr, table.Fogfv);
+    EXPECT_NE(nullptr, table.Fogx);
+    EXPECT_NE(nullptr, table.Fogxv);
+    EXPECT_NE(nullptr, table.FramebufferParameteri);
+    EXPECT_NE(nullptr, table.FramebufferRenderbuffer);
+    EXPECT_NE(nullptr, table.FramebufferRenderbufferOES);
+    EXPECT_NE(nullptr, table.FramebufferTexture2D);
+    EXPECT_NE(nullptr, table.FramebufferTexture2DOES);
+    EXPECT_NE(nullptr, table.FramebufferTextureEXT);
+    EXPECT_NE(nullptr, table.FramebufferTextureLayer);
+    EXPECT_NE(nullptr, table.FramebufferTextureMultiviewOVR);
+    EXPECT_NE(nullptr, table.FrontFace);
+    EXPECT_NE(nullptr, table.Frustumf);
+    EXPECT_NE(nullptr, table.Frustumx);
+    EXPECT_NE(nullptr, table.GenBuffers);
+    EXPECT_NE(nullptr, table.GenFencesNV);
+    EXPECT_NE(nullptr, table.GenFramebuffers);
+    EXPECT_NE(nullptr, table.GenFramebuffersOES);
+    EXPECT_NE(nullptr, table.GenPathsCHROMIUM);
+    EXPECT_NE(nullptr, table.GenProgramPipelines);
+    EXPECT_NE(nullptr, table.GenQueries);
+    EXPECT_NE(nullptr, table.GenQueriesEXT);
+    EXPECT_NE(nullptr, table.GenRenderbuffers);
+    EXPECT_NE(nullptr, table.GenRenderbuffersOES);
+    EXPECT_NE(nullptr, table.GenSamplers);
+    EXPECT_NE(nullptr, table.GenSemaphoresEXT);
+    EXPECT_NE(nullptr, table.GenTextures);
+    EXPECT_NE(nullptr, table.GenTransformFeedbacks);
+    EXPECT_NE(nullptr, table.GenVertexArrays);
+    EXPECT_NE(nullptr, table.GenVertexArraysOES);
+    EXPECT_NE(nullptr, table.GenerateMipmap);
+    EXPECT_NE(nullptr, table.GenerateMipmapOES);
+    EXPECT_NE(nullptr, table.GetActiveAttrib);
+    EXPECT_NE(nullptr, table.GetActiveUniform);
+    EXPECT_NE(nullptr, table.GetActiveUniformBlockName);
+    EXPECT_NE(nullptr, table.GetActiveUniformBlockiv);
+    EXPECT_NE(nullptr, table.GetActiveUniformBlockivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetActiveUniformsiv);
+    EXPECT_NE(nullptr, table.GetAttachedShaders);
+    EXPECT_NE(nullptr, table.GetAttribLocation);
+    EXPECT_NE(nullptr, table.GetBooleani_v);
+    EXPECT_NE(nullptr, table.GetBooleani_vRobustANGLE);
+    EXPECT_NE(nullptr, table.GetBooleanv);
+    EXPECT_NE(nullptr, table.GetBooleanvRobustANGLE);
+    EXPECT_NE(nullptr, table.GetBufferParameteri64v);
+    EXPECT_NE(nullptr, table.GetBufferParameteri64vRobustANGLE);
+    EXPECT_NE(nullptr, table.GetBufferParameteriv);
+    EXPECT_NE(nullptr, table.GetBufferParameterivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetBufferPointerv);
+    EXPECT_NE(nullptr, table.GetBufferPointervOES);
+    EXPECT_NE(nullptr, table.GetBufferPointervRobustANGLE);
+    EXPECT_NE(nullptr, table.GetClipPlanef);
+    EXPECT_NE(nullptr, table.GetClipPlanex);
+    EXPECT_NE(nullptr, table.GetDebugMessageLogKHR);
+    EXPECT_NE(nullptr, table.GetError);
+    EXPECT_NE(nullptr, table.GetFenceivNV);
+    EXPECT_NE(nullptr, table.GetFixedv);
+    EXPECT_NE(nullptr, table.GetFloatv);
+    EXPECT_NE(nullptr, table.GetFloatvRobustANGLE);
+    EXPECT_NE(nullptr, table.GetFragDataIndexEXT);
+    EXPECT_NE(nullptr, table.GetFragDataLocation);
+    EXPECT_NE(nullptr, table.GetFramebufferAttachmentParameteriv);
+    EXPECT_NE(nullptr, table.GetFramebufferAttachmentParameterivOES);
+    EXPECT_NE(nullptr, table.GetFramebufferAttachmentParameterivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetFramebufferParameteriv);
+    EXPECT_NE(nullptr, table.GetFramebufferParameterivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetGraphicsResetStatusEXT);
+    EXPECT_NE(nullptr, table.GetInteger64i_v);
+    EXPECT_NE(nullptr, table.GetInteger64i_vRobustANGLE);
+    EXPECT_NE(nullptr, table.GetInteger64v);
+    EXPECT_NE(nullptr, table.GetInteger64vRobustANGLE);
+    EXPECT_NE(nullptr, table.GetIntegeri_v);
+    EXPECT_NE(nullptr, table.GetIntegeri_vRobustANGLE);
+    EXPECT_NE(nullptr, table.GetIntegerv);
+    EXPECT_NE(nullptr, table.GetIntegervRobustANGLE);
+    EXPECT_NE(nullptr, table.GetInternalformativ);
+    EXPECT_NE(nullptr, table.GetInternalformativRobustANGLE);
+    EXPECT_NE(nullptr, table.GetLightfv);
+    EXPECT_NE(nullptr, table.GetLightxv);
+    EXPECT_NE(nullptr, table.GetMaterialfv);
+    EXPECT_NE(nullptr, table.GetMaterialxv);
+    EXPECT_NE(nullptr, table.GetMemoryObjectParameterivEXT);
+    EXPECT_NE(nullptr, table.GetMultisamplefv);
+    EXPECT_NE(nullptr, table.GetMultisamplefvANGLE);
+    EXPECT_NE(nullptr, table.GetMultisamplefvRobustANGLE);
+    EXPECT_NE(nullptr, table.GetObjectLabelKHR);
+    EXPECT_NE(nullptr, table.GetObjectPtrLabelKHR);
+    EXPECT_NE(nullptr, table.GetPathParameterfvCHROMIUM);
+    EXPECT_NE(nullptr, table.GetPathParameterivCHROMIUM);
+    EXPECT_NE(nullptr, table.GetPointerv);
+    EXPECT_NE(nullptr, table.GetPointervKHR);
+    EXPECT_NE(nullptr, table.GetPointervRobustANGLERobustANGLE);
+    EXPECT_NE(nullptr, table.GetProgramBinary);
+    EXPECT_NE(nullptr, table.GetProgramBinaryOES);
+    EXPECT_NE(nullptr, table.GetProgramInfoLog);
+    EXPECT_NE(nullptr, table.GetProgramInterfaceiv);
+    EXPECT_NE(nullptr, table.GetProgramInterfaceivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetProgramPipelineInfoLog);
+    EXPECT_NE(nullptr, table.GetProgramPipelineiv);
+    EXPECT_NE(nullptr, table.GetProgramResourceIndex);
+    EXPECT_NE(nullptr, table.GetProgramResourceLocation);
+    EXPECT_NE(nullptr, table.GetProgramResourceLocationIndexEXT);
+    EXPECT_NE(nullptr, table.GetProgramResourceName);
+    EXPECT_NE(nullptr, table.GetProgramResourceiv);
+    EXPECT_NE(nullptr, table.GetProgramiv);
+    EXPECT_NE(nullptr, table.GetProgramivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetQueryObjecti64vEXT);
+    EXPECT_NE(nullptr, table.GetQueryObjecti64vRobustANGLE);
+    EXPECT_NE(nullptr, table.GetQueryObjectivEXT);
+    EXPECT_NE(nullptr, table.GetQueryObjectivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetQueryObjectui64vEXT);
+    EXPECT_NE(nullptr, table.GetQueryObjectui64vRobustANGLE);
+    EXPECT_NE(nullptr, table.GetQueryObjectuiv);
+    EXPECT_NE(nullptr, table.GetQueryObjectuivEXT);
+    EXPECT_NE(nullptr, table.GetQueryObjectuivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetQueryiv);
+    EXPECT_NE(nullptr, table.GetQueryivEXT);
+    EXPECT_NE(nullptr, table.GetQueryivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetRenderbufferParameteriv);
+    EXPECT_NE(nullptr, table.GetRenderbufferParameterivOES);
+    EXPECT_NE(nullptr, table.GetRenderbufferParameterivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetSamplerParameterIivOES);
+    EXPECT_NE(nullptr, table.GetSamplerParameterIivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetSamplerParameterIuivOES);
+    EXPECT_NE(nullptr, table.GetSamplerParameterIuivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetSamplerParameterfv);
+    EXPECT_NE(nullptr, table.GetSamplerParameterfvRobustANGLE);
+    EXPECT_NE(nullptr, table.GetSamplerParameteriv);
+    EXPECT_NE(nullptr, table.GetSamplerParameterivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetSemaphoreParameterui64vEXT);
+    EXPECT_NE(nullptr, table.GetShaderInfoLog);
+    EXPECT_NE(nullptr, table.GetShaderPrecisionFormat);
+    EXPECT_NE(nullptr, table.GetShaderSource);
+    EXPECT_NE(nullptr, table.GetShaderiv);
+    EXPECT_NE(nullptr, table.GetShaderivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetString);
+    EXPECT_NE(nullptr, table.GetStringi);
+    EXPECT_NE(nullptr, table.GetSynciv);
+    EXPECT_NE(nullptr, table.GetTexEnvfv);
+    EXPECT_NE(nullptr, table.GetTexEnviv);
+    EXPECT_NE(nullptr, table.GetTexEnvxv);
+    EXPECT_NE(nullptr, table.GetTexGenfvOES);
+    EXPECT_NE(nullptr, table.GetTexGenivOES);
+    EXPECT_NE(nullptr, table.GetTexGenxvOES);
+    EXPECT_NE(nullptr, table.GetTexLevelParameterfv);
+    EXPECT_NE(nullptr, table.GetTexLevelParameterfvANGLE);
+    EXPECT_NE(nullptr, table.GetTexLevelParameterfvRobustANGLE);
+    EXPECT_NE(nullptr, table.GetTexLevelParameteriv);
+    EXPECT_NE(nullptr, table.GetTexLevelParameterivANGLE);
+    EXPECT_NE(nullptr, table.GetTexLevelParameterivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetTexParameterIivOES);
+    EXPECT_NE(nullptr, table.GetTexParameterIivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetTexParameterIuivOES);
+    EXPECT_NE(nullptr, table.GetTexParameterIuivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetTexParameterfv);
+    EXPECT_NE(nullptr, table.GetTexParameterfvRobustANGLE);
+    EXPECT_NE(nullptr, table.GetTexParameteriv);
+    EXPECT_NE(nullptr, table.GetTexParameterivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetTexParameterxv);
+    EXPECT_NE(nullptr, table.GetTransformFeedbackVarying);
+    EXPECT_NE(nullptr, table.GetTranslatedShaderSourceANGLE);
+    EXPECT_NE(nullptr, table.GetUniformBlockIndex);
+    EXPECT_NE(nullptr, table.GetUniformIndices);
+    EXPECT_NE(nullptr, table.GetUniformLocation);
+    EXPECT_NE(nullptr, table.GetUniformfv);
+    EXPECT_NE(nullptr, table.GetUniformfvRobustANGLE);
+    EXPECT_NE(nullptr, table.GetUniformiv);
+    EXPECT_NE(nullptr, table.GetUniformivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetUniformuiv);
+    EXPECT_NE(nullptr, table.GetUniformuivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetUnsignedBytei_vEXT);
+    EXPECT_NE(nullptr, table.GetUnsignedBytevEXT);
+    EXPECT_NE(nullptr, table.GetVertexAttribIiv);
+    EXPECT_NE(nullptr, table.GetVertexAttribIivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetVertexAttribIuiv);
+    EXPECT_NE(nullptr, table.GetVertexAttribIuivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetVertexAttribPointerv);
+    EXPECT_NE(nullptr, table.GetVertexAttribPointervRobustANGLE);
+    EXPECT_NE(nullptr, table.GetVertexAttribfv);
+    EXPECT_NE(nullptr, table.GetVertexAttribfvRobustANGLE);
+    EXPECT_NE(nullptr, table.GetVertexAttribiv);
+    EXPECT_NE(nullptr, table.GetVertexAttribivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetnUniformfvEXT);
+    EXPECT_NE(nullptr, table.GetnUniformfvRobustANGLE);
+    EXPECT_NE(nullptr, table.GetnUniformivEXT);
+    EXPECT_NE(nullptr, table.GetnUniformivRobustANGLE);
+    EXPECT_NE(nullptr, table.GetnUniformuivRobustANGLE);
+    EXPECT_NE(nullptr, table.Hint);
+    EXPECT_NE(nullptr, table.ImportMemoryFdEXT);
+    EXPECT_NE(nullptr, table.ImportSemaphoreFdEXT);
+    EXPECT_NE(nullptr, table.InsertEventMarkerEXT);
+    EXPECT_NE(nullptr, table.InvalidateFramebuffer);
+    EXPECT_NE(nullptr, table.InvalidateSubFramebuffer);
+    EXPECT_NE(nullptr, table.IsBuffer);
+    EXPECT_NE(nullptr, table.IsEnabled);
+    EXPECT_NE(nullptr, table.IsFenceNV);
+    EXPECT_NE(nullptr, table.IsFramebuffer);
+    EXPECT_NE(nullptr, table.IsFramebufferOES);
+    EXPECT_NE(nullptr, table.IsMemoryObjectEXT);
+    EXPECT_NE(nullptr, table.IsPathCHROMIUM);
+    EXPECT_NE(nullptr, table.IsProgram);
+    EXPECT_NE(nullptr, table.IsProgramPipeline);
+    EXPECT_NE(nullptr, table.IsQuery);
+    EXPECT_NE(nullptr, table.IsQueryEXT);
+    EXPECT_NE(nullptr, table.IsRenderbuffer);
+    EXPECT_NE(nullptr, table.IsRenderbufferOES);
+    EXPECT_NE(nullptr, table.IsSampler);
+    EXPECT_NE(nullptr, table.IsSemaphoreEXT);
+    EXPECT_NE(nullptr, table.IsShader);
+    EXPECT_NE(nullptr, table.IsSync);
+    EXPECT_NE(nullptr, table.IsTexture);
+    EXPECT_NE(nullptr, table.IsTransformFeedback);
+    EXPECT_NE(nullptr, table.IsVertexArray);
+    EXPECT_NE(nullptr, table.IsVertexArrayOES);
+    EXPECT_NE(nullptr, table.LightModelf);
+    EXPECT_NE(nullptr, table.LightModelfv);
+    EXPECT_NE(nullptr, table.LightModelx);
+    EXPECT_NE(nullptr, table.LightModelxv);
+    EXPECT_NE(nullptr, table.Lightf);
+    EXPECT_NE(nullptr, table.Lightfv);
+    EXPECT_NE(nullptr, table.Lightx);
+    EXPECT_NE(nullptr, table.Lightxv);
+    EXPECT_NE(nullptr, table.LineWidth);
+    EXPECT_NE(nullptr, table.LineWidthx);
+    EXPECT_NE(nullptr, table.LinkProgram);
+    EXPECT_NE(nullptr, table.LoadIdentity);
+    EXPECT_NE(nullptr, table.LoadMatrixf);
+    EXPECT_NE(nullptr, table.LoadMatrixx);
+    EXPECT_NE(nullptr, table.LoadPaletteFromModelViewMatrixOES);
+    EXPECT_NE(nullptr, table.LogicOp);
+    EXPECT_NE(nullptr, table.LoseContextCHROMIUM);
+    EXPECT_NE(nullptr, table.MapBufferOES);
+    EXPECT_NE(nullptr, table.MapBufferRange);
+    EXPECT_NE(nullptr, table.MapBufferRangeEXT);
+    EXPECT_NE(nullptr, table.Materialf);
+    EXPECT_NE(nullptr, table.Materialfv);
+    EXPECT_NE(nullptr, table.Materialx);
+    EXPECT_NE(nullptr, table.Materialxv);
+    EXPECT_NE(nullptr, table.MatrixIndexPointerOES);
+    EXPECT_NE(nullptr, table.MatrixLoadIdentityCHROMIUM);
+    EXPECT_NE(nullptr, table.MatrixLoadfCHROMIUM);
+    EXPECT_NE(nullptr, table.MatrixMode);
+    EXPECT_NE(nullptr, table.MaxShaderCompilerThreadsKHR);
+    EXPECT_NE(nullptr, table.MemoryBarrier);
+    EXPECT_NE(nullptr, table.MemoryBarrierByRegion);
+    EXPECT_NE(nullptr, table.MemoryObjectParameterivEXT);
+    EXPECT_NE(nullptr, table.MultMatrixf);
+    EXPECT_NE(nullptr, table.MultMatrixx);
+    EXPECT_NE(nullptr, table.MultiDrawArraysANGLE);
+    EXPECT_NE(nullptr, table.MultiDrawArraysInstancedANGLE);
+    EXPECT_NE(nullptr, table.MultiDrawElementsANGLE);
+    EXPECT_NE(nullptr, table.MultiDrawElementsInstancedANGLE);
+    EXPECT_NE(nullptr, table.MultiTexCoord4f);
+    EXPECT_NE(nullptr, table.MultiTexCoord4x);
+    EXPECT_NE(nullptr, table.Normal3f);
+    EXPECT_NE(nullptr, table.Normal3x);
+    EXPECT_NE(nullptr, table.NormalPointer);
+    EXPECT_NE(nullptr, table.ObjectLabelKHR);
+    EXPECT_NE(nullptr, table.ObjectPtrLabelKHR);
+    EXPECT_NE(nullptr, table.Orthof);
+    EXPECT_NE(nullptr, table.Orthox);
+    EXPECT_NE(nullptr, table.PathCommandsCHROMIUM);
+    EXPECT_NE(nullptr, table.PathParameterfCHROMIUM);
+    EXPECT_NE(nullptr, table.PathParameteriCHROMIUM);
+    EXPECT_NE(nullptr, table.PathStencilFuncCHROMIUM);
+    EXPECT_NE(nullptr, table.PauseTransformFeedback);
+    EXPECT_NE(nullptr, table.PixelStorei);
+    EXPECT_NE(nullptr, table.PointParameterf);
+    EXPECT_NE(nullptr, table.PointParameterfv);
+    EXPECT_NE(nullptr, table.PointParameterx);
+    EXPECT_NE(nullptr, table.PointParameterxv);
+    EXPECT_NE(nullptr, table.PointSize);
+    EXPECT_NE(nullptr, table.PointSizePointerOES);
+    EXPECT_NE(nullptr, table.PointSizex);
+    EXPECT_NE(nullptr, table.PolygonOffset);
+    EXPECT_NE(nullptr, table.PolygonOffsetx);
+    EXPECT_NE(nullptr, table.PopDebugGroupKHR);
+    EXPECT_NE(nullptr, table.PopGroupMarkerEXT);
+    EXPECT_NE(nullptr, table.PopMatrix);
+    EXPECT_NE(nullptr, table.ProgramBinary);
+    EXPECT_NE(nullptr, table.ProgramBinaryOES);
+    EXPECT_NE(nullptr, table.ProgramParameteri);
+    EXPECT_NE(nullptr, table.ProgramPathFragmentInputGenCHROMIUM);
+    EXPECT_NE(nullptr, table.ProgramUniform1f);
+    EXPECT_NE(nullptr, table.ProgramUniform1fv);
+    EXPECT_NE(nullptr, table.ProgramUniform1i);
+    EXPECT_NE(nullptr, table.ProgramUniform1iv);
+    EXPECT_NE(nullptr, table.ProgramUniform1ui);
+    EXPECT_NE(nullptr, table.ProgramUniform1uiv);
+    EXPECT_NE(nullptr, table.ProgramUniform2f);
+    EXPECT_NE(nullptr, table.ProgramUniform2fv);
+    EXPECT_NE(nullptr, table.ProgramUniform2i);
+    EXPECT_NE(nullptr, table.ProgramUniform2iv);
+    EXPECT_NE(nullptr, table.ProgramUniform2ui);
+    EXPECT_NE(nullptr, table.ProgramUniform2uiv);
+    EXPECT_NE(nullptr, table.ProgramUniform3f);
+    EXPECT_NE(nullptr, table.ProgramUniform3fv);
+    EXPECT_NE(nullptr, table.ProgramUniform3i);
+    EXPECT_NE(nullptr, table.ProgramUniform3iv);
+    EXPECT_NE(nullptr, table.ProgramUniform3ui);
+    EXPECT_NE(nullptr, table.ProgramUniform3uiv);
+    EXPECT_NE(nullptr, table.ProgramUniform4f);
+    EXPECT_NE(nullptr, table.ProgramUniform4fv);
+    EXPECT_NE(nullptr, table.ProgramUniform4i);
+    EXPECT_NE(nullptr, table.ProgramUniform4iv);
+    EXPECT_NE(nullptr, table.ProgramUniform4ui);
+    EXPECT_NE(nullptr, table.ProgramUniform4uiv);
+    EXPECT_NE(nullptr, table.ProgramUniformMatrix2fv);
+    EXPECT_NE(nullptr, table.ProgramUniformMatrix2x3fv);
+    EXPECT_NE(nullptr, table.ProgramUniformMatrix2x4fv);
+    EXPECT_NE(nullptr, table.ProgramUniformMatrix3fv);
+    EXPECT_NE(nullptr, table.ProgramUniformMatrix3x2fv);
+    EXPECT_NE(nullptr, table.ProgramUniformMatrix3x4fv);
+    EXPECT_NE(nullptr, table.ProgramUniformMatrix4fv);
+    EXPECT_NE(nullptr, table.ProgramUniformMatrix4x2fv);
+    EXPECT_NE(nullptr, table.ProgramUniformMatrix4x3fv);
+    EXPECT_NE(nullptr, table.ProvokingVertexANGLE);
+    EXPECT_NE(nullptr, table.PushDebugGroupKHR);
+    EXPECT_NE(nullptr, table.PushGroupMarkerEXT);
+    EXPECT_NE(nullptr, table.PushMatrix);
+    EXPECT_NE(nullptr, table.QueryCounterEXT);
+    EXPECT_NE(nullptr, table.QueryMatrixxOES);
+    EXPECT_NE(nullptr, table.ReadBuffer);
+    EXPECT_NE(nullptr, table.ReadPixels);
+    EXPECT_NE(nullptr, table.ReadPixelsRobustANGLE);
+    EXPECT_NE(nullptr, table.ReadnPixelsEXT);
+    EXPECT_NE(nullptr, table.ReadnPixelsRobustANGLE);
+    EXPECT_NE(nullptr, table.ReleaseShaderCompiler);
+    EXPECT_NE(nullptr, table.RenderbufferStorage);
+    EXPECT_NE(nullptr, table.RenderbufferStorageMultisample);
+    EXPECT_NE(nullptr, table.RenderbufferStorageMultisampleANGLE);
+    EXPECT_NE(nullptr, table.RenderbufferStorageOES);
+    EXPECT_NE(nullptr, table.RequestExtensionANGLE);
+    EXPECT_NE(nullptr, table.ResumeTransformFeedback);
+    EXPECT_NE(nullptr, table.Rotatef);
+    EXPECT_NE(nullptr, table.Rotatex);
+    EXPECT_NE(nullptr, table.SampleCoverage);
+    EXPECT_NE(nullptr, table.SampleCoveragex);
+    EXPECT_NE(nullptr, table.SampleMaski);
+    EXPECT_NE(nullptr, table.SampleMaskiANGLE);
+    EXPECT_NE(nullptr, table.SamplerParameterIivOES);
+    EXPECT_NE(nullptr, table.SamplerParameterIivRobustANGLE);
+    EXPECT_NE(nullptr, table.SamplerParameterIuivOES);
+    EXPECT_NE(nullptr, table.SamplerParameterIuivRobustANGLE);
+    EXPECT_NE(nullptr, table.SamplerParameterf);
+    EXPECT_NE(nullptr, table.SamplerParameterfv);
+    EXPECT_NE(nullptr, table.SamplerParameterfvRobustANGLE);
+    EXPECT_NE(nullptr, table.SamplerParameteri);
+    EXPECT_NE(nullptr, table.SamplerParameteriv);
+    EXPECT_NE(nullptr, table.SamplerParameterivRobustANGLE);
+    EXPECT_NE(nullptr, table.Scalef);
+    EXPECT_NE(nullptr, table.Scalex);
+    EXPECT_NE(nullptr, table.Scissor);
+    EXPECT_NE(nullptr, table.SemaphoreParameterui64vEXT);
+    EXPECT_NE(nullptr, table.SetFenceNV);
+    EXPECT_NE(nullptr, table.ShadeModel);
+    EXPECT_NE(nullptr, table.ShaderBinary);
+    EXPECT_NE(nullptr, table.ShaderSource);
+    EXPECT_NE(nullptr, table.SignalSemaphoreEXT);
+    EXPECT_NE(nullptr, table.StencilFillPathCHROMIUM);
+    EXPECT_NE(nullptr, table.StencilFillPathInstancedCHROMIUM);
+    EXPECT_NE(nullptr, table.StencilFunc);
+    EXPECT_NE(nullptr, table.StencilFuncSeparate);
+    EXPECT_NE(nullptr, table.StencilMask);
+    EXPECT_NE(nullptr, table.StencilMaskSeparate);
+    EXPECT_NE(nullptr, table.StencilOp);
+    EXPECT_NE(nullptr, table.StencilOpSeparate);
+    EXPECT_NE(nullptr, table.StencilStrokePathCHROMIUM);
+    EXPECT_NE(nullptr, table.StencilStrokePathInstancedCHROMIUM);
+    EXPECT_NE(nullptr, table.StencilThenCoverFillPathCHROMIUM);
+    EXPECT_NE(nullptr, table.StencilThenCoverFillPathInstancedCHROMIUM);
+    EXPECT_NE(nullptr, table.StencilThenCoverStrokePathCHROMIUM);
+    EXPECT_NE(nullptr, table.StencilThenCoverStrokePathInstancedCHROMIUM);
+    EXPECT_NE(nullptr, table.TestFenceNV);
+    EXPECT_NE(nullptr, table.TexCoordPointer);
+    EXPECT_NE(nullptr, table.TexEnvf);
+    EXPECT_NE(nullptr, table.TexEnvfv);
+    EXPECT_NE(nullptr, table.TexEnvi);
+    EXPECT_NE(nullptr, table.TexEnviv);
+    EXPECT_NE(nullptr, table.TexEnvx);
+    EXPECT_NE(nullptr, table.TexEnvxv);
+    EXPECT_NE(nullptr, table.TexGenfOES);
+    EXPECT_NE(nullptr, table.TexGenfvOES);
+    EXPECT_NE(nullptr, table.TexGeniOES);
+    EXPECT_NE(nullptr, table.TexGenivOES);
+    EXPECT_NE(nullptr, table.TexGenxOES);
+    EXPECT_NE(nullptr, table.TexGenxvOES);
+    EXPECT_NE(nullptr, table.TexImage2D);
+    EXPECT_NE(nullptr, table.TexImage2DRobustANGLE);
+    EXPECT_NE(nullptr, table.TexImage3D);
+    EXPECT_NE(nullptr, table.TexImage3DRobustANGLE);
+    EXPECT_NE(nullptr, table.TexParameterIivOES);
+    EXPECT_NE(nullptr, table.TexParameterIivRobustANGLE);
+    EXPECT_NE(nullptr, table.TexParameterIuivOES);
+    EXPECT_NE(nullptr, table.TexParameterIuivRobustANGLE);
+    EXPECT_NE(nullptr, table.TexParameterf);
+    EXPECT_NE(nullptr, table.TexParameterfv);
+    EXPECT_NE(nullptr, table.TexParameterfvRobustANGLE);
+    EXPECT_NE(nullptr, table.TexParameteri);
+    EXPECT_NE(nullptr, table.TexParameteriv);
+    EXPECT_NE(nullptr, table.TexParameterivRobustANGLE);
+    EXPECT_NE(nullptr, table.TexParameterx);
+    EXPECT_NE(nullptr, table.TexParameterxv);
+    EXPECT_NE(nullptr, table.TexStorage1DEXT);
+    EXPECT_NE(nullptr, table.TexStorage2D);
+    EXPECT_NE(nullptr, table.TexStorage2DEXT);
+    EXPECT_NE(nullptr, table.TexStorage2DMultisample);
+    EXPECT_NE(nullptr, table.TexStorage2DMultisampleANGLE);
+    EXPECT_NE(nullptr, table.TexStorage3D);
+    EXPECT_NE(nullptr, table.TexStorage3DEXT);
+    EXPECT_NE(nullptr, table.TexStorage3DMultisampleOES);
+    EXPECT_NE(nullptr, table.TexStorageMem2DEXT);
+    EXPECT_NE(nullptr, table.TexStorageMem2DMultisampleEXT);
+    EXPECT_NE(nullptr, table.TexStorageMem3DEXT);
+    EXPECT_NE(nullptr, table.TexStorageMem3DMultisampleEXT);
+    EXPECT_NE(nullptr, table.TexSubImage2D);
+    EXPECT_NE(nullptr, table.TexSubImage2DRobustANGLE);
+    EXPECT_NE(nullptr, table.TexSubImage3D);
+    EXPECT_NE(nullptr, table.TexSubImage3DRobustANGLE);
+    EXPECT_NE(nullptr, table.TransformFeedbackVaryings);
+    EXPECT_NE(nullptr, table.Translatef);
+    EXPECT_NE(nullptr, table.Translatex);
+    EXPECT_NE(nullptr, table.Uniform1f);
+    EXPECT_NE(nullptr, table.Uniform1fv);
+    EXPECT_NE(nullptr, table.Uniform1i);
+    EXPECT_NE(nullptr, table.Uniform1iv);
+    EXPECT_NE(nullptr, table.Uniform1ui);
+    EXPECT_NE(nullptr, table.Uniform1uiv);
+    EXPECT_NE(nullptr, table.Uniform2f);
+    EXPECT_NE(nullptr, table.Uniform2fv);
+    EXPECT_NE(nullptr, table.Uniform2i);
+    EXPECT_NE(nullptr, table.Uniform2iv);
+    EXPECT_NE(nullptr, table.Uniform2ui);
+    EXPECT_NE(nullptr, table.Uniform2uiv);
+    EXPECT_NE(nullptr, table.Uniform3f);
+    EXPECT_NE(nullptr, table.Uniform3fv);
+    EXPECT_NE(nullptr, table.Uniform3i);
+    EXPECT_NE(nullptr, table.Uniform3iv);
+    EXPECT_NE(nullptr, table.Uniform3ui);
+    EXPECT_NE(nullptr, table.Uniform3uiv);
+    EXPECT_NE(nullptr, table.Uniform4f);
+    EXPECT_NE(nullptr, table.Uniform4fv);
+    EXPECT_NE(nullptr, table.Uniform4i);
+    EXPECT_NE(nullptr, table.Uniform4iv);
+    EXPECT_NE(nullptr, table.Uniform4ui);
+    EXPECT_NE(nullptr, table.Uniform4uiv);
+    EXPECT_NE(nullptr, table.UniformBlockBinding);
+    EXPECT_NE(nullptr, table.UniformMatrix2fv);
+    EXPECT_NE(nullptr, table.UniformMatrix2x3fv);
+    EXPECT_NE(nullptr, table.UniformMatrix2x4fv);
+    EXPECT_NE(nullptr, table.UniformMatrix3fv);
+    EXPECT_NE(nullptr, table.UniformMatrix3x2fv);
+    EXPECT_NE(nullptr, table.UniformMatrix3x4fv);
+    EXPECT_NE(nullptr, table.UniformMatrix4fv);
+    EXPECT_NE(nullptr, table.UniformMatrix4x2fv);
+    EXPECT_NE(nullptr, table.UniformMatrix4x3fv);
+    EXPECT_NE(nullptr, table.UnmapBuffer);
+    EXPECT_NE(nullptr, table.UnmapBufferOES);
+    EXPECT_NE(nullptr, table.UseProgram);
+    EXPECT_NE(nullptr, table.UseProgramStages);
+    EXPECT_NE(nullptr, table.ValidateProgram);
+    EXPECT_NE(nullptr, table.ValidateProgramPipeline);
+    EXPECT_NE(nullptr, table.VertexAttrib1f);
+    EXPECT_NE(nullptr, table.VertexAttrib1fv);
+    EXPECT_NE(nullptr, table.VertexAttrib2f);
+    EXPECT_NE(nullptr, table.VertexAttrib2fv);
+    EXPECT_NE(nullptr, table.VertexAttrib3f);
+    EXPECT_NE(nullptr, table.VertexAttrib3fv);
+    EXPECT_NE(nullptr, table.VertexAttrib4f);
+    EXPECT_NE(nullptr, table.VertexAttrib4fv);
+    EXPECT_NE(nullptr, table.VertexAttribBinding);
+    EXPECT_NE(nullptr, table.VertexAttribDivisor);
+    EXPECT_NE(nullptr, table.VertexAttribDivisorANGLE);
+    EXPECT_NE(nullptr, table.VertexAttribDivisorEXT);
+    EXPECT_NE(nullptr, table.VertexAttribFormat);
+    EXPECT_NE(nullptr, table.VertexAttribI4i);
+    EXPECT_NE(nullptr, table.VertexAttribI4iv);
+    EXPECT_NE(nullptr, table.VertexAttribI4ui);
+    EXPECT_NE(nullptr, table.VertexAttribI4uiv);
+    EXPECT_NE(nullptr, table.VertexAttribIFormat);
+    EXPECT_NE(nullptr, table.VertexAttribIPointer);
+    EXPECT_NE(nullptr, table.VertexAttribPointer);
+    EXPECT_NE(nullptr, table.VertexBindingDivisor);
+    EXPECT_NE(nullptr, table.VertexPointer);
+    EXPECT_NE(nullptr, table.Viewport);
+    EXPECT_NE(nullptr, table.WaitSemaphoreEXT);
+    EXPECT_NE(nullptr, table.WaitSync);
+    EXPECT_NE(nullptr, table.WeightPointerOES);
+}
+
+// Tests that the table of the contexts that validate the calls has every entry.
+TEST(DispatchTableTest, ValidatedTableIsComplete)
+{
+    ExpectCompleteDispatchTable(gl::kValidatedDispatchTable);
+}
+
+// Tests that the table of the KHR_no_error contexts has every entry.
+TEST(DispatchTableTest, NoErrorTableIsComplete)
+{
+    ExpectCompleteDispatchTable(gl::kNoErrorDispatchTable);
+}
+
+// Tests that the table of the lost contexts has every entry.
+TEST(DispatchTableTest, ContextLostTableIsComplete)
+{
+    ExpectCompleteDispatchTable(gl::kContextLostDispatchTable);
+}
+
+// Tests that the errors and the reset status can be queried from lost contexts.
+TEST(DispatchTableTest, ContextLostTableQueriesErrors)
+{
+    EXPECT_EQ(gl::kValidatedDispatchTable.GetError, gl::kContextLostDispatchTable.GetError);
+    EXPECT_EQ(gl::kValidatedDispatchTable.GetGraphicsResetStatusEXT,
+              gl::kContextLostDispatchTable.GetGraphicsResetStatusEXT);
+    EXPECT_NE(gl::kValidatedDispatchTable.Clear, gl::kContextLostDispatchTable.Clear);
+}
+}  // anonymous namespace
@@ -0,0 +1,227 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and entry_point_lock_classes.json.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// EntryPointLockStressTest_autogen.cpp:
+//   Calls the GLES entry points that don't take the global lock from many threads at once.
+
+#include "test_utils/ANGLETest.h"
+
+#include "util/EGLWindow.h"
+
+#include <array>
+#include <thread>
+
+namespace angle
+{
+namespace
+{
+constexpr size_t kThreadCount         = 16;
+constexpr size_t kIterationsPerThread = 64;
+
+// The arguments are all zero, so many of the calls only run validation. That is enough to race
+// the entry points of different contexts against each other.
+void CallContextEntryPoints()
+{
+    std::array<GLuint64, 64> scratch = {};
+    glActiveTexture(0);
+    glBlendColor(0, 0, 0, 0);
+    glBlendEquation(0);
+    glBlendEquationSeparate(0, 0);
+    glBlendFunc(0, 0);
+    glBlendFuncSeparate(0, 0, 0, 0);
+    glClearColor(0, 0, 0, 0);
+    glClearDepthf(0);
+    glClearStencil(0);
+    glColorMask(0, 0, 0, 0);
+    glCullFace(0);
+    glDepthFunc(0);
+    glDepthMask(0);
+    glDepthRangef(0, 0);
+    glDisable(0);
+    glDisableVertexAttribArray(0);
+    glEnable(0);
+    glEnableVertexAttribArray(0);
+    glFrontFace(0);
+    glGetError();
+    glHint(0, 0);
+    glIsEnabled(0);
+    glLineWidth(0);
+    glPixelStorei(0, 0);
+    glPolygonOffset(0, 0);
+    glSampleCoverage(0, 0);
+    glScissor(0, 0, 0, 0);
+    glStencilFunc(0, 0, 0);
+    glStencilFuncSeparate(0, 0, 0, 0);
+    glStencilMask(0);
+    glStencilMaskSeparate(0, 0);
+    glStencilOp(0, 0, 0);
+    glStencilOpSeparate(0, 0, 0, 0);
+    glVertexAttrib1f(0, 0);
+    glVertexAttrib1fv(0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glVertexAttrib2f(0, 0, 0);
+    glVertexAttrib2fv(0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glVertexAttrib3f(0, 0, 0, 0);
+    glVertexAttrib3fv(0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glVertexAttrib4f(0, 0, 0, 0, 0);
+    glVertexAttrib4fv(0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glVertexAttribDivisor(0, 0);
+    glVertexAttribI4i(0, 0, 0, 0, 0);
+    glVertexAttribI4iv(0, reinterpret_cast<const GLint *>(scratch.data()));
+    glVertexAttribI4ui(0, 0, 0, 0, 0);
+    glVertexAttribI4uiv(0, reinterpret_cast<const GLuint *>(scratch.data()));
+    glViewport(0, 0, 0, 0);
+}
+
+void CallShareGroupEntryPoints()
+{
+    std::array<GLuint64, 64> scratch = {};
+    glGetAttribLocation(0, reinterpret_cast<const GLchar *>(scratch.data()));
+    glGetUniformBlockIndex(0, reinterpret_cast<const GLchar *>(scratch.data()));
+    glGetUniformLocation(0, reinterpret_cast<const GLchar *>(scratch.data()));
+    glGetUniformfv(0, 0, reinterpret_cast<GLfloat *>(scratch.data()));
+    glGetUniformiv(0, 0, reinterpret_cast<GLint *>(scratch.data()));
+    glGetUniformuiv(0, 0, reinterpret_cast<GLuint *>(scratch.data()));
+    glUniform1f(0, 0);
+    glUniform1fv(0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glUniform1i(0, 0);
+    glUniform1iv(0, 0, reinterpret_cast<const GLint *>(scratch.data()));
+    glUniform1ui(0, 0);
+    glUniform1uiv(0, 0, reinterpret_cast<const GLuint *>(scratch.data()));
+    glUniform2f(0, 0, 0);
+    glUniform2fv(0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glUniform2i(0, 0, 0);
+    glUniform2iv(0, 0, reinterpret_cast<const GLint *>(scratch.data()));
+    glUniform2ui(0, 0, 0);
+    glUniform2uiv(0, 0, reinterpret_cast<const GLuint *>(scratch.data()));
+    glUniform3f(0, 0, 0, 0);
+    glUniform3fv(0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glUniform3i(0, 0, 0, 0);
+    glUniform3iv(0, 0, reinterpret_cast<const GLint *>(scratch.data()));
+    glUniform3ui(0, 0, 0, 0);
+    glUniform3uiv(0, 0, reinterpret_cast<const GLuint *>(scratch.data()));
+    glUniform4f(0, 0, 0, 0, 0);
+    glUniform4fv(0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glUniform4i(0, 0, 0, 0, 0);
+    glUniform4iv(0, 0, reinterpret_cast<const GLint *>(scratch.data()));
+    glUniform4ui(0, 0, 0, 0, 0);
+    glUniform4uiv(0, 0, reinterpret_cast<const GLuint *>(scratch.data()));
+    glUniformBlockBinding(0, 0, 0);
+    glUniformMatrix2fv(0, 0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glUniformMatrix2x3fv(0, 0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glUniformMatrix2x4fv(0, 0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glUniformMatrix3fv(0, 0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glUniformMatrix3x2fv(0, 0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glUniformMatrix3x4fv(0, 0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glUniformMatrix4fv(0, 0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glUniformMatrix4x2fv(0, 0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+    glUniformMatrix4x3fv(0, 0, 0, reinterpret_cast<const GLfloat *>(scratch.data()));
+}
+}  // anonymous namespace
+
+class EntryPointLockStressTest : public ANGLETest
+{
+  protected:
+    EntryPointLockStressTest()
+    {
+        setWindowWidth(16);
+        setWindowHeight(16);
+        setConfigRedBits(8);
+        setConfigGreenBits(8);
+        setConfigBlueBits(8);
+        setConfigAlphaBits(8);
+        setContextVirtualization(false);
+    }
+
+    bool platformSupportsMultithreading() const
+    {
+#if defined(ANGLE_FORCE_THREAD_SAFETY)
+        return true;
+#else
+        return (IsOpenGLES() && IsAndroid());
+#endif  // defined(ANGLE_FORCE_THREAD_SAFETY)
+    }
+
+    // Runs callEntryPoints on kThreadCount threads, each with its own context. The contexts are in
+    // the share group of the test window's context if shareContexts is set, otherwise each one is
+    // in its own share group.
+    void runOnContexts(void (*callEntryPoints)(), bool shareContexts)
+    {
+        EGLWindow *window       = getEGLWindow();
+        EGLDisplay dpy          = window->getDisplay();
+        EGLConfig config        = window->getConfig();
+        EGLContext shareContext = shareContexts ? window->getContext() : EGL_NO_CONTEXT;
+
+        std::array<std::thread, kThreadCount> threads;
+        for (std::thread &thread : threads)
+        {
+            thread = std::thread([&]() {
+                EGLint pbufferAttributes[] = {EGL_WIDTH, 1, EGL_HEIGHT, 1, EGL_NONE};
+                EGLSurface pbuffer = eglCreatePbufferSurface(dpy, config, pbufferAttributes);
+                EXPECT_EGL_SUCCESS();
+
+                EGLContext ctx = window->createContext(shareContext);
+                EXPECT_NE(EGL_NO_CONTEXT, ctx);
+
+                EXPECT_EGL_TRUE(eglMakeCurrent(dpy, pbuffer, pbuffer, ctx));
+                EXPECT_EGL_SUCCESS();
+
+                for (size_t iteration = 0; iteration < kIterationsPerThread; iteration++)
+                {
+                    callEntryPoints();
+                }
+
+                // The calls are expected to generate errors; only crashes and races matter.
+                while (glGetError() != GL_NO_ERROR)
+                {
+                }
+
+                EXPECT_EGL_TRUE(
+                    eglMakeCurrent(dpy, EGL_NO_SURFACE, EGL_NO_SURFACE, EGL_NO_CONTEXT));
+                EXPECT_EGL_SUCCESS();
+
+                eglDestroySurface(dpy, pbuffer);
+                eglDestroyContext(dpy, ctx);
+            });
+        }
+
+        for (std::thread &thread : threads)
+        {
+            thread.join();
+        }
+    }
+};
+
+// Calls the entry points that only touch the current context from many threads.
+TEST_P(EntryPointLockStressTest, ContextEntryPoints)
+{
+    ANGLE_SKIP_TEST_IF(!platformSupportsMultithreading());
+    runOnContexts(CallContextEntryPoints, true);
+}
+
+// Calls the entry points that only touch the share group from many threads sharing it.
+TEST_P(EntryPointLockStressTest, ShareGroupEntryPoints)
+{
+    ANGLE_SKIP_TEST_IF(!platformSupportsMultithreading());
+    runOnContexts(CallShareGroupEntryPoints, true);
+}
+
+// Calls the entry points that only touch the share group from many threads with a share group
+// each. Backends that can't run these calls concurrently serialize them on the global lock.
+TEST_P(EntryPointLockStressTest, ShareGroupEntryPointsAcrossShareGroups)
+{
+    ANGLE_SKIP_TEST_IF(!platformSupportsMultithreading());
+    runOnContexts(CallShareGroupEntryPoints, false);
+}
+
+ANGLE_INSTANTIATE_TEST(EntryPointLockStressTest,
+                       ES3_D3D11(),
+                       ES3_OPENGL(),
+                       ES3_OPENGLES(),
+                       ES3_VULKAN(),
+                       ES3_NULL());
+
+}  // namespace angle
@@ -0,0 +1,58 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// EntryPointProfilerTest:
+//   Tests the per entry point call counters and timers of angle_enable_entry_point_profiling.
+//
+
+#include "test_utils/ANGLETest.h"
+
+#include "libGLESv2/entry_points_profiler.h"
+
+using namespace angle;
+
+namespace
+{
+#if ANGLE_ENTRY_POINT_PROFILING == ANGLE_ENABLED
+class EntryPointProfilerTest : public ANGLETest
+{};
+
+// Tests that the calls of an entry point are counted, and that the calls failing validation only
+// account validation time.
+TEST_P(EntryPointProfilerTest, CountsCallsAndSplitsValidationFromDispatch)
+{
+    const gl::EntryPointProfile &profile = gl::GetEntryPointProfile(gl::EntryPoint::Viewport);
+    gl::ResetEntryPointProfile();
+
+    constexpr uint64_t kValidCalls = 1000;
+    for (uint64_t call = 0; call < kValidCalls; ++call)
+    {
+        glViewport(0, 0, 1, 1);
+    }
+    EXPECT_GL_NO_ERROR();
+
+    EXPECT_EQ(kValidCalls, profile.calls.load());
+    uint64_t validationNs = profile.validationNs.load();
+    uint64_t dispatchNs   = profile.dispatchNs.load();
+    EXPECT_GT(dispatchNs, 0u);
+
+    constexpr uint64_t kInvalidCalls = 100;
+    for (uint64_t call = 0; call < kInvalidCalls; ++call)
+    {
+        glViewport(0, 0, -1, -1);
+    }
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+
+    EXPECT_EQ(kValidCalls + kInvalidCalls, profile.calls.load());
+    EXPECT_GT(profile.validationNs.load(), validationNs);
+    EXPECT_EQ(dispatchNs, profile.dispatchNs.load());
+
+    gl::ResetEntryPointProfile();
+    EXPECT_EQ(0u, profile.calls.load());
+}
+
+ANGLE_INSTANTIATE_TEST(EntryPointProfilerTest, ES2_NULL());
+#endif  // ANGLE_ENTRY_POINT_PROFILING == ANGLE_ENABLED
+}  // anonymous namespace
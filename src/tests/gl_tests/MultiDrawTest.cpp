@@ -470,6 +470,47 @@ TEST_P(MultiDrawTest, MultiDrawElements)
     CheckDrawResult();
 }
 
+// Check that a negative drawcount results in GL_INVALID_VALUE, and that an invalid draw in the
+// middle of the batch results in an error
+TEST_P(MultiDrawTest, InvalidDrawcountAndDraws)
+{
+    ANGLE_SKIP_TEST_IF(!requestExtensions());
+    SetupBuffers();
+    SetupProgram();
+
+    GLint firsts[]      = {0, 0, 0};
+    GLsizei counts[]    = {3, -1, 3};
+    GLvoid *indices[]   = {0, 0, 0};
+    GLsizei instances[] = {1, 1, 1};
+
+    glBindBuffer(GL_ARRAY_BUFFER, mNonIndexedVertexBuffer);
+    glEnableVertexAttribArray(mPositionLoc);
+    glVertexAttribPointer(mPositionLoc, 3, GL_FLOAT, GL_FALSE, 0, 0);
+    glMultiDrawArraysANGLE(GL_TRIANGLES, firsts, counts, -1);
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+    glMultiDrawArraysANGLE(GL_TRIANGLES, firsts, counts, 3);
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+    if (IsInstancedTest())
+    {
+        glMultiDrawArraysInstancedANGLE(GL_TRIANGLES, firsts, counts, instances, -1);
+        EXPECT_GL_ERROR(GL_INVALID_VALUE);
+    }
+
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, mIndexBuffer);
+    glBindBuffer(GL_ARRAY_BUFFER, mVertexBuffer);
+    glVertexAttribPointer(mPositionLoc, 3, GL_FLOAT, GL_FALSE, 0, 0);
+    glMultiDrawElementsANGLE(GL_TRIANGLES, counts, GL_UNSIGNED_SHORT, indices, -1);
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+    glMultiDrawElementsANGLE(GL_TRIANGLES, counts, GL_UNSIGNED_SHORT, indices, 3);
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+    if (IsInstancedTest())
+    {
+        glMultiDrawElementsInstancedANGLE(GL_TRIANGLES, counts, GL_UNSIGNED_SHORT, indices,
+                                          instances, -1);
+        EXPECT_GL_ERROR(GL_INVALID_VALUE);
+    }
+}
+
 // Check that glMultiDraw*Instanced without instancing support results in GL_INVALID_OPERATION
 TEST_P(MultiDrawNoInstancingSupportTest, InvalidOperation)
 {
@@ -112,6 +112,40 @@ TEST_P(VulkanFormatTablesTest, TestFormatSupport)
     }
 }
 
+// Checks that initializing the format table didn't query the device for every format it looked
+// up. Formats like VK_FORMAT_R8G8B8A8_UNORM only need features the Vulkan spec guarantees.
+TEST_P(VulkanFormatTablesTest, MandatoryFormatSupportAvoidsQueries)
+{
+    ASSERT_TRUE(IsVulkan());
+
+    const gl::Context *context = static_cast<gl::Context *>(getEGLWindow()->getContext());
+    auto *contextVk            = rx::GetImplAs<rx::ContextVk>(context);
+    rx::RendererVk *renderer   = contextVk->getRenderer();
+
+    EXPECT_GT(renderer->getAvoidedFormatPropertiesQueryCount(), 0u);
+}
+
+// Checks that a format whose first VkFormat has guaranteed support uses that VkFormat, and reports
+// the texture caps the Vulkan spec guarantees for it.
+TEST_P(VulkanFormatTablesTest, GuaranteedSupportUsesFirstFormat)
+{
+    ASSERT_TRUE(IsVulkan());
+
+    const gl::Context *context = static_cast<gl::Context *>(getEGLWindow()->getContext());
+    auto *contextVk            = rx::GetImplAs<rx::ContextVk>(context);
+    rx::RendererVk *renderer   = contextVk->getRenderer();
+
+    const rx::vk::Format &format = renderer->getFormat(angle::FormatID::R8G8B8A8_UNORM);
+    EXPECT_NE(0, format.guaranteedSupport & rx::vk::kImageSupportGuaranteed);
+    EXPECT_EQ(VK_FORMAT_R8G8B8A8_UNORM, format.vkImageFormat);
+
+    const gl::TextureCaps &textureCaps =
+        renderer->getNativeTextureCaps().get(angle::FormatID::R8G8B8A8_UNORM);
+    EXPECT_TRUE(textureCaps.texturable);
+    EXPECT_TRUE(textureCaps.filterable);
+    EXPECT_TRUE(textureCaps.renderbuffer);
+}
+
 ANGLE_INSTANTIATE_TEST(VulkanFormatTablesTest, ES2_VULKAN());
 
 }  // anonymous namespace
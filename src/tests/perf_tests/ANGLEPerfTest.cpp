@@ -338,6 +338,8 @@ std::string RenderTestParams::suffix() const
             return "_default";
         case EGL_PLATFORM_ANGLE_TYPE_VULKAN_ANGLE:
             return "_vulkan";
+        case EGL_PLATFORM_ANGLE_TYPE_NULL_ANGLE:
+            return "_null";
         default:
             assert(0);
             return "_unk";
@@ -598,6 +600,11 @@ void ANGLERenderTest::setRobustResourceInit(bool enabled)
     mConfigParams.robustResourceInit = enabled;
 }
 
+void ANGLERenderTest::setNoErrorEnabled(bool enabled)
+{
+    mConfigParams.noError = enabled;
+}
+
 std::vector<TraceEvent> &ANGLERenderTest::getTraceEventBuffer()
 {
     return mTraceEventBuffer;
@@ -143,6 +143,7 @@ class ANGLERenderTest : public ANGLEPerfTest
 
     void setWebGLCompatibilityEnabled(bool webglCompatibility);
     void setRobustResourceInit(bool enabled);
+    void setNoErrorEnabled(bool enabled);
 
     void startGpuTimer();
     void stopGpuTimer();
@@ -0,0 +1,210 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// CurrentContextPerf:
+//   Performance test for the lookup of the current context by the GLES entry points when several
+//   threads make contexts current. Compares the thread_local context cached by
+//   egl::SetContextCurrent with the context of the current egl::Thread the entry points read
+//   before, and times a GLES entry point that does little more than the lookup.
+//
+
+#include "ANGLEPerfTest.h"
+
+#include <condition_variable>
+#include <mutex>
+#include <sstream>
+#include <thread>
+
+#include "libGLESv2/global_state.h"
+
+namespace
+{
+constexpr unsigned int kIterationsPerStep = 1000;
+
+enum class LookupType
+{
+    EGLThread,
+    CachedContext,
+    EntryPoint,
+};
+
+// The lookups are called through a volatile function pointer so the compiler can't inline them
+// and hoist the read of the current context out of the loop.
+using LookupFunc = gl::Context *(*)();
+
+gl::Context *LookupEGLThreadContext()
+{
+    return egl::GetCurrentThread()->getContext();
+}
+
+gl::Context *LookupCachedContext()
+{
+    return gl::GetGlobalContext();
+}
+
+LookupFunc volatile gLookupFunc    = nullptr;
+gl::Context *volatile gContextSink = nullptr;
+GLenum volatile gErrorSink         = GL_NO_ERROR;
+
+struct CurrentContextParams final : public RenderTestParams
+{
+    CurrentContextParams(LookupType lookupTypeIn) : lookupType(lookupTypeIn)
+    {
+        majorVersion      = 2;
+        minorVersion      = 0;
+        windowWidth       = 16;
+        windowHeight      = 16;
+        iterationsPerStep = kIterationsPerStep;
+        eglParameters     = EGLPlatformParameters(EGL_PLATFORM_ANGLE_TYPE_NULL_ANGLE);
+    }
+
+    std::string suffix() const override;
+
+    LookupType lookupType;
+};
+
+std::ostream &operator<<(std::ostream &os, const CurrentContextParams &params)
+{
+    os << params.suffix().substr(1);
+    return os;
+}
+
+std::string CurrentContextParams::suffix() const
+{
+    std::stringstream strstr;
+    strstr << RenderTestParams::suffix();
+    switch (lookupType)
+    {
+        case LookupType::EGLThread:
+            strstr << "_egl_thread";
+            break;
+        case LookupType::CachedContext:
+            strstr << "_cached_context";
+            break;
+        case LookupType::EntryPoint:
+            strstr << "_entry_point";
+            break;
+    }
+    return strstr.str();
+}
+
+class CurrentContextPerfTest : public ANGLERenderTest,
+                               public ::testing::WithParamInterface<CurrentContextParams>
+{
+  public:
+    CurrentContextPerfTest();
+
+    void initializeBenchmark() override;
+    void destroyBenchmark() override;
+    void drawBenchmark() override;
+
+  private:
+    // Keeps a context current on a second thread for the duration of the test, so the entry
+    // points can't use the single-threaded context.
+    void otherThreadMain(EGLDisplay display, EGLConfig config, EGLContext shareContext);
+
+    std::thread mOtherThread;
+    std::mutex mMutex;
+    std::condition_variable mCondition;
+    bool mOtherThreadReady = false;
+    bool mOtherThreadExit  = false;
+};
+
+CurrentContextPerfTest::CurrentContextPerfTest() : ANGLERenderTest("CurrentContextPerf", GetParam())
+{}
+
+void CurrentContextPerfTest::initializeBenchmark()
+{
+    EGLDisplay display = eglGetCurrentDisplay();
+    EGLContext context = eglGetCurrentContext();
+
+    EGLint configID = 0;
+    ASSERT_TRUE(eglQueryContext(display, context, EGL_CONFIG_ID, &configID));
+    EGLint configAttributes[] = {EGL_CONFIG_ID, configID, EGL_NONE};
+    EGLConfig config          = nullptr;
+    EGLint configCount        = 0;
+    ASSERT_TRUE(eglChooseConfig(display, configAttributes, &config, 1, &configCount));
+    ASSERT_EQ(1, configCount);
+
+    mOtherThread =
+        std::thread(&CurrentContextPerfTest::otherThreadMain, this, display, config, context);
+
+    std::unique_lock<std::mutex> lock(mMutex);
+    mCondition.wait(lock, [this] { return mOtherThreadReady; });
+
+    switch (GetParam().lookupType)
+    {
+        case LookupType::EGLThread:
+            gLookupFunc = LookupEGLThreadContext;
+            break;
+        case LookupType::CachedContext:
+            gLookupFunc = LookupCachedContext;
+            break;
+        case LookupType::EntryPoint:
+            break;
+    }
+}
+
+void CurrentContextPerfTest::destroyBenchmark()
+{
+    {
+        std::lock_guard<std::mutex> lock(mMutex);
+        mOtherThreadExit = true;
+    }
+    mCondition.notify_all();
+    mOtherThread.join();
+}
+
+void CurrentContextPerfTest::otherThreadMain(EGLDisplay display,
+                                             EGLConfig config,
+                                             EGLContext shareContext)
+{
+    EGLint pbufferAttributes[] = {EGL_WIDTH, 1, EGL_HEIGHT, 1, EGL_NONE};
+    EGLSurface pbuffer         = eglCreatePbufferSurface(display, config, pbufferAttributes);
+
+    EGLint contextAttributes[] = {EGL_CONTEXT_CLIENT_VERSION, 2, EGL_NONE};
+    EGLContext context         = eglCreateContext(display, config, shareContext, contextAttributes);
+    eglMakeCurrent(display, pbuffer, pbuffer, context);
+
+    {
+        std::unique_lock<std::mutex> lock(mMutex);
+        mOtherThreadReady = true;
+        mCondition.notify_all();
+        mCondition.wait(lock, [this] { return mOtherThreadExit; });
+    }
+
+    eglMakeCurrent(display, EGL_NO_SURFACE, EGL_NO_SURFACE, EGL_NO_CONTEXT);
+    eglDestroyContext(display, context);
+    eglDestroySurface(display, pbuffer);
+}
+
+void CurrentContextPerfTest::drawBenchmark()
+{
+    if (GetParam().lookupType == LookupType::EntryPoint)
+    {
+        for (unsigned int iteration = 0; iteration < kIterationsPerStep; ++iteration)
+        {
+            gErrorSink = glGetError();
+        }
+    }
+    else
+    {
+        for (unsigned int iteration = 0; iteration < kIterationsPerStep; ++iteration)
+        {
+            gContextSink = gLookupFunc();
+        }
+    }
+}
+
+TEST_P(CurrentContextPerfTest, Run)
+{
+    run();
+}
+
+ANGLE_INSTANTIATE_TEST(CurrentContextPerfTest,
+                       CurrentContextParams(LookupType::EGLThread),
+                       CurrentContextParams(LookupType::CachedContext),
+                       CurrentContextParams(LookupType::EntryPoint));
+}  // anonymous namespace
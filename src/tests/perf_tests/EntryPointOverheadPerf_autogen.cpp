@@ -0,0 +1,698 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and
+// entry_point_overhead_perf_calls.json.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// EntryPointOverheadPerf_autogen.cpp:
+//   Measures the overhead of the GLES entry points by calling cheap commands in a loop on the
+//   null backend, with and without validation. Prints the time per call of every entry point,
+//   most expensive first.
+
+#include "ANGLEPerfTest.h"
+
+#include <algorithm>
+#include <memory>
+#include <sstream>
+#include <vector>
+
+namespace angle
+{
+namespace
+{
+constexpr unsigned int kIterationsPerStep = 64;
+
+GLboolean gBooleans[16] = {};
+GLfloat gFloats[16]     = {};
+GLint gInts[16]         = {};
+GLuint gUints[16]       = {};
+
+void LoopActiveTexture(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glActiveTexture(GL_TEXTURE0);
+    }
+}
+
+void LoopBindBuffer(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glBindBuffer(GL_ARRAY_BUFFER, 0);
+    }
+}
+
+void LoopBindFramebuffer(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glBindFramebuffer(GL_FRAMEBUFFER, 0);
+    }
+}
+
+void LoopBindRenderbuffer(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glBindRenderbuffer(GL_RENDERBUFFER, 0);
+    }
+}
+
+void LoopBindSampler(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glBindSampler(0, 0);
+    }
+}
+
+void LoopBindTexture(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glBindTexture(GL_TEXTURE_2D, 0);
+    }
+}
+
+void LoopBindTransformFeedback(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glBindTransformFeedback(GL_TRANSFORM_FEEDBACK, 0);
+    }
+}
+
+void LoopBindVertexArray(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glBindVertexArray(0);
+    }
+}
+
+void LoopBlendColor(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glBlendColor(0.0f, 0.0f, 0.0f, 0.0f);
+    }
+}
+
+void LoopBlendEquation(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glBlendEquation(GL_FUNC_ADD);
+    }
+}
+
+void LoopBlendEquationSeparate(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glBlendEquationSeparate(GL_FUNC_ADD, GL_FUNC_ADD);
+    }
+}
+
+void LoopBlendFunc(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glBlendFunc(GL_ONE, GL_ZERO);
+    }
+}
+
+void LoopBlendFuncSeparate(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glBlendFuncSeparate(GL_ONE, GL_ZERO, GL_ONE, GL_ZERO);
+    }
+}
+
+void LoopClearColor(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glClearColor(0.0f, 0.0f, 0.0f, 0.0f);
+    }
+}
+
+void LoopClearDepthf(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glClearDepthf(1.0f);
+    }
+}
+
+void LoopClearStencil(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glClearStencil(0);
+    }
+}
+
+void LoopColorMask(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glColorMask(GL_TRUE, GL_TRUE, GL_TRUE, GL_TRUE);
+    }
+}
+
+void LoopCullFace(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glCullFace(GL_BACK);
+    }
+}
+
+void LoopDepthFunc(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glDepthFunc(GL_LESS);
+    }
+}
+
+void LoopDepthMask(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glDepthMask(GL_TRUE);
+    }
+}
+
+void LoopDepthRangef(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glDepthRangef(0.0f, 1.0f);
+    }
+}
+
+void LoopDisable(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glDisable(GL_BLEND);
+    }
+}
+
+void LoopDisableVertexAttribArray(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glDisableVertexAttribArray(0);
+    }
+}
+
+void LoopEnable(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glEnable(GL_BLEND);
+    }
+}
+
+void LoopEnableVertexAttribArray(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glEnableVertexAttribArray(0);
+    }
+}
+
+void LoopFrontFace(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glFrontFace(GL_CCW);
+    }
+}
+
+void LoopGetBooleanv(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glGetBooleanv(GL_BLEND, gBooleans);
+    }
+}
+
+void LoopGetError(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glGetError();
+    }
+}
+
+void LoopGetFloatv(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glGetFloatv(GL_DEPTH_RANGE, gFloats);
+    }
+}
+
+void LoopGetIntegerv(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glGetIntegerv(GL_VIEWPORT, gInts);
+    }
+}
+
+void LoopHint(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glHint(GL_GENERATE_MIPMAP_HINT, GL_DONT_CARE);
+    }
+}
+
+void LoopIsEnabled(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glIsEnabled(GL_BLEND);
+    }
+}
+
+void LoopLineWidth(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glLineWidth(1.0f);
+    }
+}
+
+void LoopPixelStorei(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 4);
+    }
+}
+
+void LoopPolygonOffset(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glPolygonOffset(0.0f, 0.0f);
+    }
+}
+
+void LoopReadBuffer(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glReadBuffer(GL_BACK);
+    }
+}
+
+void LoopSampleCoverage(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glSampleCoverage(1.0f, GL_FALSE);
+    }
+}
+
+void LoopScissor(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glScissor(0, 0, 1, 1);
+    }
+}
+
+void LoopStencilFunc(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glStencilFunc(GL_ALWAYS, 0, 0xFF);
+    }
+}
+
+void LoopStencilFuncSeparate(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glStencilFuncSeparate(GL_FRONT_AND_BACK, GL_ALWAYS, 0, 0xFF);
+    }
+}
+
+void LoopStencilMask(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glStencilMask(0xFF);
+    }
+}
+
+void LoopStencilMaskSeparate(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glStencilMaskSeparate(GL_FRONT_AND_BACK, 0xFF);
+    }
+}
+
+void LoopStencilOp(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glStencilOp(GL_KEEP, GL_KEEP, GL_KEEP);
+    }
+}
+
+void LoopStencilOpSeparate(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glStencilOpSeparate(GL_FRONT_AND_BACK, GL_KEEP, GL_KEEP, GL_KEEP);
+    }
+}
+
+void LoopUseProgram(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glUseProgram(0);
+    }
+}
+
+void LoopVertexAttrib1f(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttrib1f(0, 0.0f);
+    }
+}
+
+void LoopVertexAttrib1fv(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttrib1fv(0, gFloats);
+    }
+}
+
+void LoopVertexAttrib2f(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttrib2f(0, 0.0f, 0.0f);
+    }
+}
+
+void LoopVertexAttrib2fv(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttrib2fv(0, gFloats);
+    }
+}
+
+void LoopVertexAttrib3f(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttrib3f(0, 0.0f, 0.0f, 0.0f);
+    }
+}
+
+void LoopVertexAttrib3fv(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttrib3fv(0, gFloats);
+    }
+}
+
+void LoopVertexAttrib4f(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttrib4f(0, 0.0f, 0.0f, 0.0f, 0.0f);
+    }
+}
+
+void LoopVertexAttrib4fv(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttrib4fv(0, gFloats);
+    }
+}
+
+void LoopVertexAttribDivisor(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttribDivisor(0, 0);
+    }
+}
+
+void LoopVertexAttribI4i(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttribI4i(0, 0, 0, 0, 0);
+    }
+}
+
+void LoopVertexAttribI4iv(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttribI4iv(0, gInts);
+    }
+}
+
+void LoopVertexAttribI4ui(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttribI4ui(0, 0u, 0u, 0u, 0u);
+    }
+}
+
+void LoopVertexAttribI4uiv(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttribI4uiv(0, gUints);
+    }
+}
+
+void LoopVertexAttribIPointer(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttribIPointer(0, 4, GL_INT, 0, gInts);
+    }
+}
+
+void LoopVertexAttribPointer(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glVertexAttribPointer(0, 4, GL_FLOAT, GL_FALSE, 0, gFloats);
+    }
+}
+
+void LoopViewport(unsigned int iterations)
+{
+    for (unsigned int iteration = 0; iteration < iterations; ++iteration)
+    {
+        glViewport(0, 0, 1, 1);
+    }
+}
+
+struct OverheadEntryPoint
+{
+    const char *name;
+    void (*loop)(unsigned int iterations);
+};
+
+constexpr OverheadEntryPoint kEntryPoints[] = {
+    {"glActiveTexture", LoopActiveTexture},
+    {"glBindBuffer", LoopBindBuffer},
+    {"glBindFramebuffer", LoopBindFramebuffer},
+    {"glBindRenderbuffer", LoopBindRenderbuffer},
+    {"glBindSampler", LoopBindSampler},
+    {"glBindTexture", LoopBindTexture},
+    {"glBindTransformFeedback", LoopBindTransformFeedback},
+    {"glBindVertexArray", LoopBindVertexArray},
+    {"glBlendColor", LoopBlendColor},
+    {"glBlendEquation", LoopBlendEquation},
+    {"glBlendEquationSeparate", LoopBlendEquationSeparate},
+    {"glBlendFunc", LoopBlendFunc},
+    {"glBlendFuncSeparate", LoopBlendFuncSeparate},
+    {"glClearColor", LoopClearColor},
+    {"glClearDepthf", LoopClearDepthf},
+    {"glClearStencil", LoopClearStencil},
+    {"glColorMask", LoopColorMask},
+    {"glCullFace", LoopCullFace},
+    {"glDepthFunc", LoopDepthFunc},
+    {"glDepthMask", LoopDepthMask},
+    {"glDepthRangef", LoopDepthRangef},
+    {"glDisable", LoopDisable},
+    {"glDisableVertexAttribArray", LoopDisableVertexAttribArray},
+    {"glEnable", LoopEnable},
+    {"glEnableVertexAttribArray", LoopEnableVertexAttribArray},
+    {"glFrontFace", LoopFrontFace},
+    {"glGetBooleanv", LoopGetBooleanv},
+    {"glGetError", LoopGetError},
+    {"glGetFloatv", LoopGetFloatv},
+    {"glGetIntegerv", LoopGetIntegerv},
+    {"glHint", LoopHint},
+    {"glIsEnabled", LoopIsEnabled},
+    {"glLineWidth", LoopLineWidth},
+    {"glPixelStorei", LoopPixelStorei},
+    {"glPolygonOffset", LoopPolygonOffset},
+    {"glReadBuffer", LoopReadBuffer},
+    {"glSampleCoverage", LoopSampleCoverage},
+    {"glScissor", LoopScissor},
+    {"glStencilFunc", LoopStencilFunc},
+    {"glStencilFuncSeparate", LoopStencilFuncSeparate},
+    {"glStencilMask", LoopStencilMask},
+    {"glStencilMaskSeparate", LoopStencilMaskSeparate},
+    {"glStencilOp", LoopStencilOp},
+    {"glStencilOpSeparate", LoopStencilOpSeparate},
+    {"glUseProgram", LoopUseProgram},
+    {"glVertexAttrib1f", LoopVertexAttrib1f},
+    {"glVertexAttrib1fv", LoopVertexAttrib1fv},
+    {"glVertexAttrib2f", LoopVertexAttrib2f},
+    {"glVertexAttrib2fv", LoopVertexAttrib2fv},
+    {"glVertexAttrib3f", LoopVertexAttrib3f},
+    {"glVertexAttrib3fv", LoopVertexAttrib3fv},
+    {"glVertexAttrib4f", LoopVertexAttrib4f},
+    {"glVertexAttrib4fv", LoopVertexAttrib4fv},
+    {"glVertexAttribDivisor", LoopVertexAttribDivisor},
+    {"glVertexAttribI4i", LoopVertexAttribI4i},
+    {"glVertexAttribI4iv", LoopVertexAttribI4iv},
+    {"glVertexAttribI4ui", LoopVertexAttribI4ui},
+    {"glVertexAttribI4uiv", LoopVertexAttribI4uiv},
+    {"glVertexAttribIPointer", LoopVertexAttribIPointer},
+    {"glVertexAttribPointer", LoopVertexAttribPointer},
+    {"glViewport", LoopViewport},
+};
+
+constexpr size_t kEntryPointCount = ArraySize(kEntryPoints);
+
+struct EntryPointOverheadParams final : public RenderTestParams
+{
+    EntryPointOverheadParams()
+    {
+        majorVersion      = 3;
+        minorVersion      = 0;
+        windowWidth       = 16;
+        windowHeight      = 16;
+        iterationsPerStep = kIterationsPerStep;
+        eglParameters     = EGLPlatformParameters(EGL_PLATFORM_ANGLE_TYPE_NULL_ANGLE);
+    }
+
+    std::string suffix() const override;
+
+    bool noError = false;
+};
+
+std::ostream &operator<<(std::ostream &os, const EntryPointOverheadParams &params)
+{
+    os << params.suffix().substr(1);
+    return os;
+}
+
+std::string EntryPointOverheadParams::suffix() const
+{
+    std::stringstream strstr;
+    strstr << RenderTestParams::suffix();
+    strstr << (noError ? "_no_validation" : "_validation");
+    return strstr.str();
+}
+
+class EntryPointOverheadBenchmark : public ANGLERenderTest,
+                                    public ::testing::WithParamInterface<EntryPointOverheadParams>
+{
+  public:
+    EntryPointOverheadBenchmark();
+
+    void destroyBenchmark() override;
+    void drawBenchmark() override;
+
+  private:
+    std::unique_ptr<Timer> mEntryPointTimer;
+    std::vector<double> mEntryPointSeconds;
+    size_t mEntryPointLoops;
+};
+
+EntryPointOverheadBenchmark::EntryPointOverheadBenchmark()
+    : ANGLERenderTest("EntryPointOverhead", GetParam()),
+      mEntryPointTimer(CreateTimer()),
+      mEntryPointSeconds(kEntryPointCount, 0.0),
+      mEntryPointLoops(0)
+{
+    setNoErrorEnabled(GetParam().noError);
+}
+
+void EntryPointOverheadBenchmark::destroyBenchmark()
+{
+    if (mEntryPointLoops == 0)
+    {
+        return;
+    }
+
+    std::vector<size_t> ranking(kEntryPointCount);
+    for (size_t index = 0; index < kEntryPointCount; ++index)
+    {
+        ranking[index] = index;
+    }
+    std::sort(ranking.begin(), ranking.end(),
+              [this](size_t a, size_t b) { return mEntryPointSeconds[a] > mEntryPointSeconds[b]; });
+
+    double calls = static_cast<double>(mEntryPointLoops) * GetParam().iterationsPerStep;
+    for (size_t index : ranking)
+    {
+        printResult(kEntryPoints[index].name, mEntryPointSeconds[index] * 1e9 / calls, "ns", false);
+    }
+}
+
+void EntryPointOverheadBenchmark::drawBenchmark()
+{
+    const unsigned int iterations = GetParam().iterationsPerStep;
+    for (size_t index = 0; index < kEntryPointCount; ++index)
+    {
+        double start = mEntryPointTimer->getAbsoluteTime();
+        kEntryPoints[index].loop(iterations);
+        mEntryPointSeconds[index] += mEntryPointTimer->getAbsoluteTime() - start;
+    }
+    mEntryPointLoops++;
+
+    ASSERT_GL_NO_ERROR();
+}
+
+EntryPointOverheadParams NullParams(bool noError)
+{
+    EntryPointOverheadParams params;
+    params.noError = noError;
+    return params;
+}
+}  // anonymous namespace
+
+TEST_P(EntryPointOverheadBenchmark, Run)
+{
+    run();
+}
+
+ANGLE_INSTANTIATE_TEST(EntryPointOverheadBenchmark, NullParams(false), NullParams(true));
+
+}  // namespace angle
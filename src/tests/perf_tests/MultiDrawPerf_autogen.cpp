@@ -0,0 +1,247 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// MultiDrawPerf_autogen.cpp:
+//   Compares kDrawCount separate draws with one GL_ANGLE_multi_draw call issuing the same draws,
+//   for every multi-draw command, on the null backend.
+
+#include "ANGLEPerfTest.h"
+#include "test_utils/draw_call_perf_utils.h"
+
+#include <sstream>
+#include <vector>
+
+namespace angle
+{
+namespace
+{
+constexpr unsigned int kIterationsPerStep = 16;
+constexpr GLsizei kDrawCount              = 64;
+
+// The parameters of the multi-draw calls. Every draw covers its own triangle.
+struct MultiDrawData
+{
+    GLenum mode;
+    GLenum type;
+    GLsizei drawcount;
+    std::vector<GLint> firsts;
+    std::vector<GLsizei> counts;
+    std::vector<const GLvoid *> indices;
+    std::vector<GLsizei> instanceCounts;
+};
+
+void SeparateDrawArrays(const MultiDrawData &data)
+{
+    for (GLsizei drawID = 0; drawID < data.drawcount; ++drawID)
+    {
+        glDrawArrays(data.mode, data.firsts[drawID], data.counts[drawID]);
+    }
+}
+
+void BatchedDrawArrays(const MultiDrawData &data)
+{
+    glMultiDrawArraysANGLE(data.mode, data.firsts.data(), data.counts.data(), data.drawcount);
+}
+
+void SeparateDrawArraysInstanced(const MultiDrawData &data)
+{
+    for (GLsizei drawID = 0; drawID < data.drawcount; ++drawID)
+    {
+        glDrawArraysInstanced(data.mode, data.firsts[drawID], data.counts[drawID],
+                              data.instanceCounts[drawID]);
+    }
+}
+
+void BatchedDrawArraysInstanced(const MultiDrawData &data)
+{
+    glMultiDrawArraysInstancedANGLE(data.mode, data.firsts.data(), data.counts.data(),
+                                    data.instanceCounts.data(), data.drawcount);
+}
+
+void SeparateDrawElements(const MultiDrawData &data)
+{
+    for (GLsizei drawID = 0; drawID < data.drawcount; ++drawID)
+    {
+        glDrawElements(data.mode, data.counts[drawID], data.type, data.indices[drawID]);
+    }
+}
+
+void BatchedDrawElements(const MultiDrawData &data)
+{
+    glMultiDrawElementsANGLE(data.mode, data.counts.data(), data.type, data.indices.data(),
+                             data.drawcount);
+}
+
+void SeparateDrawElementsInstanced(const MultiDrawData &data)
+{
+    for (GLsizei drawID = 0; drawID < data.drawcount; ++drawID)
+    {
+        glDrawElementsInstanced(data.mode, data.counts[drawID], data.type, data.indices[drawID],
+                                data.instanceCounts[drawID]);
+    }
+}
+
+void BatchedDrawElementsInstanced(const MultiDrawData &data)
+{
+    glMultiDrawElementsInstancedANGLE(data.mode, data.counts.data(), data.type, data.indices.data(),
+                                      data.instanceCounts.data(), data.drawcount);
+}
+
+struct MultiDrawCommand
+{
+    const char *name;
+    void (*separate)(const MultiDrawData &data);
+    void (*multi)(const MultiDrawData &data);
+};
+
+constexpr MultiDrawCommand kCommands[] = {
+    {"draw_arrays", SeparateDrawArrays, BatchedDrawArrays},
+    {"draw_arrays_instanced", SeparateDrawArraysInstanced, BatchedDrawArraysInstanced},
+    {"draw_elements", SeparateDrawElements, BatchedDrawElements},
+    {"draw_elements_instanced", SeparateDrawElementsInstanced, BatchedDrawElementsInstanced},
+};
+
+struct MultiDrawParams final : public RenderTestParams
+{
+    MultiDrawParams()
+    {
+        majorVersion      = 3;
+        minorVersion      = 0;
+        windowWidth       = 64;
+        windowHeight      = 64;
+        iterationsPerStep = kIterationsPerStep;
+        eglParameters     = EGLPlatformParameters(EGL_PLATFORM_ANGLE_TYPE_NULL_ANGLE);
+    }
+
+    std::string suffix() const override;
+
+    size_t command = 0;
+    bool multi     = false;
+};
+
+std::ostream &operator<<(std::ostream &os, const MultiDrawParams &params)
+{
+    os << params.suffix().substr(1);
+    return os;
+}
+
+std::string MultiDrawParams::suffix() const
+{
+    std::stringstream strstr;
+    strstr << RenderTestParams::suffix();
+    strstr << "_" << kCommands[command].name << (multi ? "_multi" : "_separate");
+    return strstr.str();
+}
+
+class MultiDrawBenchmark : public ANGLERenderTest,
+                           public ::testing::WithParamInterface<MultiDrawParams>
+{
+  public:
+    MultiDrawBenchmark();
+
+    void initializeBenchmark() override;
+    void destroyBenchmark() override;
+    void drawBenchmark() override;
+
+  private:
+    GLuint mProgram     = 0;
+    GLuint mBuffer      = 0;
+    GLuint mIndexBuffer = 0;
+    MultiDrawData mData;
+};
+
+MultiDrawBenchmark::MultiDrawBenchmark() : ANGLERenderTest("MultiDraw", GetParam())
+{
+    addExtensionPrerequisite("GL_ANGLE_multi_draw");
+}
+
+void MultiDrawBenchmark::initializeBenchmark()
+{
+    mProgram = SetupSimpleDrawProgram();
+    ASSERT_NE(0u, mProgram);
+
+    mBuffer = Create2DTriangleBuffer(kDrawCount, GL_STATIC_DRAW);
+    glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, 0);
+    glEnableVertexAttribArray(0);
+
+    std::vector<GLushort> indexData(kDrawCount * 3);
+    for (size_t index = 0; index < indexData.size(); ++index)
+    {
+        indexData[index] = static_cast<GLushort>(index);
+    }
+    glGenBuffers(1, &mIndexBuffer);
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, mIndexBuffer);
+    glBufferData(GL_ELEMENT_ARRAY_BUFFER, indexData.size() * sizeof(GLushort), indexData.data(),
+                 GL_STATIC_DRAW);
+
+    mData.mode      = GL_TRIANGLES;
+    mData.type      = GL_UNSIGNED_SHORT;
+    mData.drawcount = kDrawCount;
+    for (GLsizei drawID = 0; drawID < kDrawCount; ++drawID)
+    {
+        mData.firsts.push_back(drawID * 3);
+        mData.counts.push_back(3);
+        mData.indices.push_back(reinterpret_cast<const GLvoid *>(drawID * 3 * sizeof(GLushort)));
+        mData.instanceCounts.push_back(1);
+    }
+
+    glViewport(0, 0, getWindow()->getWidth(), getWindow()->getHeight());
+
+    ASSERT_GL_NO_ERROR();
+}
+
+void MultiDrawBenchmark::destroyBenchmark()
+{
+    glDeleteProgram(mProgram);
+    glDeleteBuffers(1, &mBuffer);
+    glDeleteBuffers(1, &mIndexBuffer);
+}
+
+void MultiDrawBenchmark::drawBenchmark()
+{
+    const MultiDrawParams &params   = GetParam();
+    const MultiDrawCommand &command = kCommands[params.command];
+    for (unsigned int iteration = 0; iteration < params.iterationsPerStep; ++iteration)
+    {
+        if (params.multi)
+        {
+            command.multi(mData);
+        }
+        else
+        {
+            command.separate(mData);
+        }
+    }
+
+    ASSERT_GL_NO_ERROR();
+}
+
+MultiDrawParams NullParams(size_t command, bool multi)
+{
+    MultiDrawParams params;
+    params.command = command;
+    params.multi   = multi;
+    return params;
+}
+}  // anonymous namespace
+
+TEST_P(MultiDrawBenchmark, Run)
+{
+    run();
+}
+
+ANGLE_INSTANTIATE_TEST(MultiDrawBenchmark,
+                       NullParams(0, false),
+                       NullParams(0, true),
+                       NullParams(1, false),
+                       NullParams(1, true),
+                       NullParams(2, false),
+                       NullParams(2, true),
+                       NullParams(3, false),
+                       NullParams(3, true));
+
+}  // namespace angle